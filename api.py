@@ -0,0 +1,289 @@
+import io
+import json
+import os
+import queue
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+from urllib.parse import parse_qs
+
+from dotenv import load_dotenv
+
+# Stateless HTTP API over the synthesis pipeline, for machine clients and
+# serverless hosting (no Streamlit session, no script reruns). Plain WSGI, so it
+# runs under Vercel's Python runtime, gunicorn/uwsgi, or `python api.py`.
+#
+#   GET  /api/health
+#   POST /api/synthesize        JSON {prompt, language, dataset_context?, user?, model?, stream?}
+#                               or multipart/form-data with the same fields plus a
+#                               `dataset` file (CSV/Excel/Parquet/Arrow/JSONL) and optional `budget`/`sheet`/
+#                               `sampling` (head, head_tail, random, stratified, outliers)/`stratify_by`
+#   GET  /api/history           ?search=&language=&user=&before_id=&limit=
+#   POST /api/datasets/profile  multipart `dataset` file (or raw body with ?name=)
+#
+# With stream=true, /api/synthesize answers with Server-Sent Events: one
+# `token` event per content delta, then a `done` event carrying the result
+# (or an `error` event). Everything else is JSON.
+#
+# The Groq client, scheduler, DB pool and caches are module singletons, so
+# warm invocations reuse the pooled upstream connection. If CODIFY_API_KEY is
+# set, requests must send `Authorization: Bearer <key>`. Set it in any
+# deployment: the key is the only access control, `user` is whatever the caller
+# puts in the request, and /api/history (every user's queries and code) answers
+# 403 while no key is configured.
+load_dotenv()
+
+API_KEY = os.getenv("CODIFY_API_KEY")
+MAX_UPLOAD_BYTES = int(os.getenv("CODIFY_API_MAX_UPLOAD_MB", 200)) * 1024 * 1024
+MAX_PAGE = 100
+# Longest a response waits for its own history row to be committed
+HISTORY_WAIT = 2.0
+DATASET_EXTENSIONS = (".csv", ".xls", ".xlsx", ".parquet", ".feather", ".arrow", ".jsonl", ".ndjson")
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+_REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 403: "Forbidden", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error", 502: "Bad Gateway"}
+
+
+def _status(code):
+    return f"{code} {_REASONS.get(code, '')}".strip()
+
+
+def _json_response(start_response, status, payload):
+    body = json.dumps(payload, default=str).encode("utf-8")
+    start_response(_status(status), [("Content-Type", "application/json"), ("Content-Length", str(len(body)))])
+    return [body]
+
+
+def _read_body(environ):
+    try:
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        length = 0
+    if length > MAX_UPLOAD_BYTES:
+        raise HTTPError(413, f"request body over {MAX_UPLOAD_BYTES // 2 ** 20} MB")
+    return environ["wsgi.input"].read(length) if length else b""
+
+
+def _read_form(environ):
+    # Returns (fields, files) where files maps name -> (filename, bytes)
+    content_type = environ.get("CONTENT_TYPE", "")
+    body = _read_body(environ)
+    if content_type.startswith("multipart/form-data"):
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + body)
+        fields, files = {}, {}
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            if not name:
+                continue
+            filename = part.get_filename()
+            if filename is not None:
+                files[name] = (filename, part.get_payload(decode=True) or b"")
+            else:
+                fields[name] = (part.get_payload(decode=True) or b"").decode("utf-8").strip()
+        return fields, files
+    if not body:
+        return {}, {}
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPError(400, "body must be JSON or multipart/form-data")
+    if not isinstance(payload, dict):
+        raise HTTPError(400, "JSON body must be an object")
+    return payload, {}
+
+
+def _int(fields, name, default=None):
+    try:
+        return int(fields[name]) if fields.get(name) not in (None, "") else default
+    except (TypeError, ValueError):
+        raise HTTPError(400, f"{name} must be an integer")
+
+
+def _truthy(value):
+    return value is True or str(value).lower() in ("1", "true", "yes")
+
+
+def _profile(filename, data, fields):
+    from ingest import cached_ingest, prompt_context
+    from sampling import STRATEGIES
+    if not filename.lower().endswith(DATASET_EXTENSIONS):
+        raise HTTPError(400, f"dataset must be one of: {', '.join(DATASET_EXTENSIONS)}")
+    sampling = fields.get("sampling") or "head"
+    if sampling not in STRATEGIES:
+        raise HTTPError(400, f"sampling must be one of {list(STRATEGIES)}")
+    dataset = cached_ingest(io.BytesIO(data), filename, sheet=fields.get("sheet") or None)
+    column = fields.get("stratify_by") or None
+    if sampling == "stratified" and column not in dataset['columns']:
+        raise HTTPError(400, "stratified sampling needs `stratify_by` set to a dataset column")
+    return dataset, prompt_context(dataset, _int(fields, "budget"), sampling, column)
+
+
+def _usage(usage):
+    if usage is None:
+        return None
+    return {'prompt_tokens': getattr(usage, 'prompt_tokens', None),
+            'completion_tokens': getattr(usage, 'completion_tokens', None)}
+
+
+def synthesize_request(environ, start_response):
+    from inference import LANGUAGES, synthesize
+    from router import MODELS
+    fields, files = _read_form(environ)
+    prompt = str(fields.get("prompt") or "").strip()
+    language = fields.get("language") or "Python"
+    if language not in LANGUAGES:
+        raise HTTPError(400, f"language must be one of {LANGUAGES}")
+    context, meta, label = str(fields.get("dataset_context") or ""), {}, prompt
+    if "dataset" in files:
+        filename, data = files["dataset"]
+        dataset, context = _profile(filename, data, fields)
+        meta = {'dataset_bytes': len(data), 'parse_ms': dataset.get('parse_ms')}
+        label = prompt or f"Dataset analysis: {filename}"
+    if not prompt and not context:
+        raise HTTPError(400, "prompt or dataset is required")
+    model = fields.get("model") or None
+    if model == "auto":
+        model = None
+    if model is not None and model not in MODELS:
+        raise HTTPError(400, f"model must be \"auto\" or one of {MODELS}")
+    kwargs = dict(label=label, user=fields.get("user") or None, model=model, **meta)
+
+    def result_payload(result):
+        return {'language': result['language'], 'text': result['text'], 'cached': result['cached'],
+                'coalesced': result['coalesced'], 'model': result['model'], 'route': result['route'],
+                'latency_ms': round(result['latency_ms'], 1), 'usage': _usage(result['usage'])}
+
+    if not _truthy(fields.get("stream")):
+        try:
+            result = synthesize(prompt, language, context, **kwargs)
+        except Exception as e:
+            raise HTTPError(502, f"inference failed: {e}")
+        # History is written behind; a follow-up /api/history call should see this run
+        result['saved'].wait(HISTORY_WAIT)
+        return _json_response(start_response, 200, result_payload(result))
+
+    # The pipeline reports tokens through a callback on the worker thread; the
+    # response generator relays them to the client as they arrive.
+    events = queue.Queue()
+
+    def work():
+        try:
+            result = synthesize(prompt, language, context,
+                                on_token=lambda token: events.put(("token", {'token': token})), **kwargs)
+            result['saved'].wait(HISTORY_WAIT)
+            events.put(("done", result_payload(result)))
+        except Exception as e:
+            events.put(("error", {'error': f"inference failed: {e}"}))
+
+    threading.Thread(target=work, daemon=True).start()
+
+    def stream():
+        while True:
+            event, payload = events.get()
+            yield f"event: {event}\ndata: {json.dumps(payload)}\n\n".encode("utf-8")
+            if event != "token":
+                return
+
+    start_response(_status(200), [("Content-Type", "text/event-stream"), ("Cache-Control", "no-cache"),
+                                  ("X-Accel-Buffering", "no")])
+    return stream()
+
+
+def history_request(environ, start_response):
+    from db import history_page
+    if not API_KEY:
+        raise HTTPError(403, "history is disabled until CODIFY_API_KEY is set")
+    params = {k: v[-1] for k, v in parse_qs(environ.get("QUERY_STRING", "")).items()}
+    before_id = _int(params, "before_id")
+    limit = max(min(_int(params, "limit", 20), MAX_PAGE), 1)
+    rows = history_page(search=params.get("search", ""), language=params.get("language") or None,
+                        user=params.get("user") or None, before_id=before_id, limit=limit)
+    columns = ("id", "language", "query", "code", "created_at", "user", "model", "latency_ms")
+    items = [dict(zip(columns, row)) for row in rows]
+    return _json_response(start_response, 200, {
+        'items': items,
+        'next_before_id': items[-1]['id'] if len(items) == limit else None,
+    })
+
+
+def profile_request(environ, start_response):
+    if environ.get("CONTENT_TYPE", "").startswith("multipart/form-data"):
+        fields, files = _read_form(environ)
+        if "dataset" not in files:
+            raise HTTPError(400, "multipart field `dataset` is required")
+        filename, data = files["dataset"]
+    else:
+        fields = {k: v[-1] for k, v in parse_qs(environ.get("QUERY_STRING", "")).items()}
+        filename, data = fields.get("name") or "", _read_body(environ)
+        if not data:
+            raise HTTPError(400, "upload a `dataset` file or send the file as the body with ?name=")
+    from ingest import sheet_names
+    dataset, context = _profile(filename, data, fields)
+    stats = json.loads(dataset['stats'].to_json(orient="index"))
+    return _json_response(start_response, 200, {
+        'name': dataset['name'],
+        'sheet': dataset.get('sheet'),
+        'sheets': [{'name': sheet, 'rows': rows} for sheet, rows in sheet_names(io.BytesIO(data), filename)],
+        'rows': dataset['rows'],
+        'columns': list(dataset['columns']),
+        'stats': stats,
+        'top_values': dataset.get('top_values', {}),
+        'preview': json.loads(dataset['preview'].to_json(orient="records", date_format="iso")),
+        'context': context,
+        'parse_ms': round(dataset.get('parse_ms') or 0, 1),
+    })
+
+
+ROUTES = {
+    ("GET", "/api/health"): lambda environ, start_response: _json_response(start_response, 200, {'status': 'ok'}),
+    ("POST", "/api/synthesize"): synthesize_request,
+    ("GET", "/api/history"): history_request,
+    ("POST", "/api/datasets/profile"): profile_request,
+}
+
+
+def app(environ, start_response):
+    path = environ.get("PATH_INFO", "").rstrip("/") or "/"
+    method = environ.get("REQUEST_METHOD", "GET")
+    try:
+        handler = ROUTES.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in ROUTES):
+                raise HTTPError(405, f"{method} not allowed on {path}")
+            raise HTTPError(404, f"no route for {path}")
+        if API_KEY and environ.get("HTTP_AUTHORIZATION") != f"Bearer {API_KEY}":
+            raise HTTPError(401, "missing or invalid API key")
+        return handler(environ, start_response)
+    except HTTPError as e:
+        return _json_response(start_response, e.status, {'error': str(e)})
+    except Exception as e:
+        return _json_response(start_response, 500, {'error': f"{type(e).__name__}: {e}"})
+
+
+if __name__ == "__main__":
+    import argparse
+    from socketserver import ThreadingMixIn
+    from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+    class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+        daemon_threads = True
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    parser = argparse.ArgumentParser(description="Serve the Codify HTTP API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    server = make_server(args.host, args.port, app, server_class=ThreadingWSGIServer, handler_class=QuietHandler)
+    print(f"Codify API on http://{args.host}:{args.port}/api")
+    server.serve_forever()
@@ -1,14 +1,22 @@
 import streamlit as st
-import sqlite3
-import os
+import queue
 import time
-import pandas as pd
-from groq import Groq
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import startup
+from startup import timed
+
+# Heavy dependencies (groq, pandas/openpyxl) are imported on first use, not here
+with timed("import app modules"):
+    from dotenv import load_dotenv
+    from db import recent_history, history_page
+    from inference import LANGUAGES, synthesize
+    from router import MODELS
+    import prewarm
+    from static_assets import stylesheet_html
+    from response_cache import cache_stats
 
 # --- 1. CORE CONFIGURATION ---
 load_dotenv()
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
 
 st.set_page_config(
     page_title="CODIFY AI | DEEKSHITH", 
@@ -18,138 +26,11 @@ st.set_page_config(
 )
 
 # --- 2. ADVANCED UI & LOGO ANIMATIONS (CSS) ---
-st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&family=Inter:wght@300;400;500;600&family=Fira+Code:wght@400;500&display=swap');
-    
-    .stApp {
-        background: radial-gradient(circle at top right, #1a1a1a, #000000);
-        color: #e2e8f0;
-        font-family: 'Inter', sans-serif;
-    }
-
-    /* Logo Branding Styling */
-    .logo-container {
-        font-family: 'Space Grotesk', sans-serif;
-        color: #f3f4f6;
-        font-weight: 600;
-        letter-spacing: 2px;
-        display: flex;
-        align-items: center;
-        gap: 12px;
-    }
-    
-    .logo-highlight {
-        color: #ffffff;
-        text-shadow: 0 0 15px rgba(255, 255, 255, 0.5);
-    }
-
-    /* Scroll Reveal Animation */
-    .reveal {
-        opacity: 0;
-        transform: translateY(20px);
-        animation: reveal-in 0.8s forwards cubic-bezier(0.16, 1, 0.3, 1);
-    }
-    @keyframes reveal-in {
-        to { opacity: 1; transform: translateY(0); }
-    }
-
-    /* Manifesto High-Density Cards */
-    .manifesto-card {
-        background: rgba(255, 255, 255, 0.02);
-        backdrop-filter: blur(10px);
-        -webkit-backdrop-filter: blur(10px);
-        padding: 35px;
-        border-radius: 16px;
-        border: 1px solid rgba(255, 255, 255, 0.05);
-        margin-bottom: 25px;
-        line-height: 1.7;
-        transition: all 0.3s ease;
-    }
-    .manifesto-card:hover {
-        border-color: rgba(255, 255, 255, 0.3);
-        background: rgba(255, 255, 255, 0.05);
-        box-shadow: 0 8px 30px rgba(0, 0, 0, 0.4);
-    }
-    
-    .manifesto-card h3 {
-        font-family: 'Space Grotesk', sans-serif;
-        color: #e2e8f0;
-        font-weight: 500;
-        letter-spacing: 1px;
-        margin-bottom: 15px;
-    }
-
-    /* Floating Developer Signature */
-    @keyframes subtle-float {
-        0% { transform: translateY(0px); opacity: 0.6; }
-        50% { transform: translateY(-4px); opacity: 0.9; }
-        100% { transform: translateY(0px); opacity: 0.6; }
-    }
-    .dev-signature {
-        font-family: 'Space Grotesk', sans-serif;
-        font-size: 0.9rem;
-        text-align: center;
-        margin-top: 50px;
-        padding-bottom: 30px;
-        color: #94a3b8;
-        animation: subtle-float 5s ease-in-out infinite;
-        letter-spacing: 3px;
-    }
-
-    /* Inputs and Buttons styling */
-    .stTextInput>div>div>input, .stTextArea>div>div>textarea {
-        background-color: rgba(255, 255, 255, 0.02) !important;
-        border: 1px solid rgba(255, 255, 255, 0.06) !important;
-        color: #f8fafc !important;
-        border-radius: 12px !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .stTextInput>div>div>input:focus, .stTextArea>div>div>textarea:focus {
-        border-color: rgba(220, 20, 60, 0.5) !important;
-        box-shadow: 0 0 20px rgba(220, 20, 60, 0.15) !important;
-        background-color: rgba(255, 255, 255, 0.05) !important;
-    }
-
-    .stButton>button {
-        background: linear-gradient(135deg, rgba(220, 20, 60, 0.8), rgba(147, 51, 234, 0.7)) !important;
-        border: 1px solid rgba(255, 255, 255, 0.1) !important;
-        color: #ffffff !important;
-        border-radius: 12px !important;
-        font-family: 'Space Grotesk', sans-serif !important;
-        letter-spacing: 2px !important;
-        font-weight: 600 !important;
-        padding: 12px 24px !important;
-        transition: all 0.4s cubic-bezier(0.16, 1, 0.3, 1) !important;
-        text-transform: uppercase !important;
-    }
-    
-    .stButton>button:hover {
-        background: linear-gradient(135deg, rgba(220, 20, 60, 1), rgba(147, 51, 234, 0.9)) !important;
-        border-color: rgba(255, 255, 255, 0.8) !important;
-        box-shadow: 0 8px 30px rgba(220, 20, 60, 0.4), inset 0 0 10px rgba(255,255,255,0.2) !important;
-        transform: translateY(-2px) !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+# Minified, content-hashed bundle built by encode_yuji.py and served from ./static
+st.markdown(stylesheet_html(), unsafe_allow_html=True)
 
 # --- 3. DATABASE SETUP ---
-def init_db():
-    conn = sqlite3.connect('codify_pro.db', check_same_thread=False)
-    c = conn.cursor()
-    c.execute('CREATE TABLE IF NOT EXISTS history (query TEXT, code TEXT, language TEXT)')
-    conn.commit()
-    conn.close()
-
-def save_to_history(query, code, language):
-    conn = sqlite3.connect('codify_pro.db', check_same_thread=False)
-    c = conn.cursor()
-    c.execute("INSERT INTO history (query, code, language) VALUES (?, ?, ?)", (query, code, language))
-    conn.commit()
-    conn.close()
-
-init_db()
+# Schema migrations and the response cache tables are created on first use (see db.py)
 
 # --- 4. SESSION MANAGEMENT ---
 if 'logged_in' not in st.session_state: st.session_state['logged_in'] = False
@@ -158,92 +39,8 @@ if 'page' not in st.session_state: st.session_state['page'] = 'generator'
 
 # --- 5. LOGIN PAGE WITH LOGO ---
 def login_page():
-    st.markdown("""
-        <style>
-        [data-testid="stAppViewContainer"] {
-            background: radial-gradient(circle at top right, #1a1a1a, #000000) !important;
-        }
-        [data-testid="stHeader"] {
-            background-color: rgba(255, 255, 255, 0.0) !important;
-        }
-        
-        body::before {
-            content: '';
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 10px;
-            background: linear-gradient(90deg, #8b0000, #dc143c, #4b0082, #1a1a1a, #4b0082, #dc143c);
-            z-index: 999999;
-        }
-
-        .wombat-paws {
-            transform: translateY(120px);
-            transition: transform 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        }
-        
-        .wombat-eyes {
-            transition: transform 0.1s ease-out;
-        }
-
-        body:has(input[type="password"]:focus) .wombat-paws {
-            transform: translateY(0px) !important;
-        }
-
-        body:has(input[type="text"]:focus) .wombat-eyes {
-            transform: translateX(4px) translateY(2px) !important;
-        }
-
-        [data-testid="column"]:nth-of-type(2) {
-            background: rgba(255, 255, 255, 0.02) !important;
-            backdrop-filter: blur(10px) !important;
-            -webkit-backdrop-filter: blur(10px) !important;
-            padding: 40px !important;
-            border-radius: 16px !important;
-            border: 1px solid rgba(255, 255, 255, 0.05) !important;
-            box-shadow: 0 8px 30px rgba(0, 0, 0, 0.4) !important;
-        }
-        .stTextInput>div>div>input {
-            background-color: rgba(255, 255, 255, 0.03) !important;
-            border: 1px solid rgba(255, 255, 255, 0.08) !important;
-            color: #f8fafc !important;
-            border-radius: 8px !important;
-            padding: 10px !important;
-        }
-        .stTextInput>div>div>input:focus {
-            border-color: #ffffff !important;
-            box-shadow: 0 0 0 1px rgba(255, 255, 255, 0.3) !important;
-        }
-        .stTextInput label {
-            color: #e2e8f0 !important;
-            font-weight: 500 !important;
-            font-family: 'Space Grotesk', sans-serif !important;
-            font-size: 14px !important;
-            margin-bottom: 4px !important;
-            letter-spacing: 1px;
-        }
-        .stButton>button {
-            background: rgba(255, 255, 255, 0.03) !important;
-            border: 1px solid rgba(255, 255, 255, 0.2) !important;
-            color: #e2e8f0 !important;
-            border-radius: 8px !important;
-            font-family: 'Space Grotesk', sans-serif !important;
-            font-weight: 600 !important;
-            letter-spacing: 1px;
-            padding: 10px !important;
-            margin-top: 20px !important;
-            width: 100% !important;
-            transition: all 0.2s ease !important;
-        }
-        .stButton>button:hover {
-            background: rgba(255, 255, 255, 0.1) !important;
-            border-color: #ffffff !important;
-            color: #ffffff !important;
-            box-shadow: 0 8px 30px rgba(0, 0, 0, 0.4) !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    # Marker that scopes the login-only rules in the CSS bundle
+    st.markdown("<div class='codify-login'></div>", unsafe_allow_html=True)
     
     st.markdown("<br><br>", unsafe_allow_html=True)
     _, mid_col, _ = st.columns([1, 1.2, 1])
@@ -292,19 +89,14 @@ def login_page():
                        animation: neon-pulse 1.5s infinite alternate;'>
                 SIGN IN
             </h1>
-            <style>
-                @keyframes neon-pulse {
-                    0% { opacity: 0.8; text-shadow: 0 0 5px #fff, 0 0 10px #fff, 0 0 15px #dc143c, 0 0 20px #dc143c; filter: brightness(0.9); }
-                    100% { opacity: 1; text-shadow: 0 0 10px #fff, 0 0 20px #fff, 0 0 30px #dc143c, 0 0 40px #dc143c, 0 0 60px #dc143c; filter: brightness(1.1); }
-                }
-            </style>
         """, unsafe_allow_html=True)
         
-        st.text_input("Username")
+        username = st.text_input("Username")
         st.text_input("Password", type="password")
         
         if st.button("Sign In", use_container_width=True):
             st.session_state['logged_in'] = True
+            st.session_state['user'] = username or None
             st.session_state['booting'] = True
             st.rerun()
             
@@ -317,67 +109,204 @@ def login_page():
         """, unsafe_allow_html=True)
 
 # --- 6. BOOT SEQUENCE ---
+BOOT_STEP = 0.8   # seconds each HUD line is shown
+BOOT_HOLD = 0.5   # extra time on the last line before the overlay fades
+
 def boot_sequence():
-    boot_placeholder = st.empty()
+    # The HUD plays entirely in the browser (CSS animation delays), so the script
+    # thread returns at once and the app renders underneath the overlay. The intro
+    # time is spent warming the DB pool, the user's history and the Groq connection.
+    st.session_state['history_prefetch'] = prewarm.start(st.session_state.get('user'))
     sequence = [
         "INITIALIZING CORE SYSTEMS...",
         "CALIBRATING NEURAL INTERFACE...",
         "ENGAGING PRIMARY DRIVES...",
         "HUD ONLINE. WELCOME, BUDDY ."
     ]
-    hud_css = """
+    total = BOOT_STEP * len(sequence) + BOOT_HOLD
+    lines = ""
+    for i, text in enumerate(sequence):
+        # Every line but the last hides itself again when its step is over
+        step = "hud-last" if i == len(sequence) - 1 else "hud-step"
+        lines += f"<div class='hud-text' style='animation: {step} {BOOT_STEP}s {i * BOOT_STEP}s forwards, pulse 1s infinite alternate;'>{text}</div>"
+    st.markdown(f"""
     <style>
-    .hud-text {
+    .hud-text {{
         font-family: 'Space Grotesk', monospace;
         color: #ffffff;
         font-size: 2rem;
         text-align: center;
-        margin-top: 40vh;
+        position: absolute;
+        top: 40vh; left: 0; right: 0;
         text-shadow: 0 0 15px rgba(255, 255, 255, 0.7);
-        animation: pulse 1s infinite alternate;
-    }
-    @keyframes pulse {
-        0% { opacity: 0.7; }
-        100% { opacity: 1; }
-    }
-    .hud-overlay {
+        visibility: hidden;
+    }}
+    @keyframes pulse {{
+        0% {{ opacity: 0.7; }}
+        100% {{ opacity: 1; }}
+    }}
+    @keyframes hud-step {{
+        0% {{ visibility: visible; transform: translateY(20px); }}
+        15% {{ transform: translateY(0); }}
+        100% {{ visibility: hidden; transform: translateY(0); }}
+    }}
+    @keyframes hud-last {{
+        0% {{ visibility: visible; transform: translateY(20px); }}
+        15%, 100% {{ visibility: visible; transform: translateY(0); }}
+    }}
+    @keyframes hud-exit {{
+        to {{ opacity: 0; visibility: hidden; }}
+    }}
+    .hud-overlay {{
         position: fixed;
         top: 0; left: 0; width: 100vw; height: 100vh;
-        background: radial-gradient(circle, transparent 20%, #000000 80%), repeating-linear-gradient(0deg, transparent, transparent 2px, rgba(255, 255, 255, 0.02) 2px, rgba(255, 255, 255, 0.02) 4px);
-        pointer-events: none;
+        background: radial-gradient(circle, transparent 20%, #000000 80%), repeating-linear-gradient(0deg, transparent, transparent 2px, rgba(255, 255, 255, 0.02) 2px, rgba(255, 255, 255, 0.02) 4px), #000000;
         z-index: 9999;
-    }
+        animation: hud-exit 0.4s ease {total}s forwards;
+    }}
     </style>
-    <div class='hud-overlay'></div>
-    """
-    for text in sequence:
-        boot_placeholder.markdown(hud_css + f"<div class='hud-text reveal'>{text}</div>", unsafe_allow_html=True)
-        time.sleep(0.8)
-    time.sleep(0.5)
-    boot_placeholder.empty()
+    <div class='hud-overlay'>{lines}</div>
+    """, unsafe_allow_html=True)
+
+def output_panel(target=None):
+    title = f"SYSTEM OUTPUT · {target.upper()}" if target else "SYSTEM OUTPUT"
+    st.markdown("<div style='margin-top: 40px; padding: 25px; border-radius: 12px; background: rgba(255, 255, 255, 0.02); border: 1px solid rgba(255, 255, 255, 0.05); box-shadow: 0 10px 30px rgba(0,0,0,0.2);'>", unsafe_allow_html=True)
+    st.markdown(f"<h3 style='font-family: \"Space Grotesk\", sans-serif; font-size: 1.1rem; font-weight: 500; color: #f8fafc; margin-bottom: 20px; letter-spacing: 1px;'>{title}</h3>", unsafe_allow_html=True)
+    return st.empty()
+
+@st.fragment(run_every=1.0)
+def wait_for_profile(future):
+    # Polls a background dataset profile and reruns the page once it is ready
+    if future.done():
+        st.rerun()
+
+def show_result(placeholder, text, served=None):
+    with placeholder.container():
+        st.markdown(text)
+        if served:
+            st.caption(f"Model: {served}")
+
+def dry_run_panel(code, source):
+    # One run per (code, dataset); "Run again" re-runs it on the warm workers
+    from sandbox import dry_run, stage_dataset
+    key = (code, source[2:] if source else None)
+    runs = st.session_state.setdefault('dry_runs', {})
+    title_col, again_col = st.columns([5, 1])
+    title_col.markdown("<p style='font-size:0.8rem; color:#94a3b8; margin:16px 0 4px; letter-spacing:1px;'>▶ DRY RUN</p>", unsafe_allow_html=True)
+    again = again_col.button("Run again", key="dry_run_again", use_container_width=True)
+    if key not in runs or again:
+        with st.spinner("Running the generated code against the dataset..."):
+            result = dry_run(code, stage_dataset(*source) if source else None)
+        runs.clear()
+        runs[key] = result
+    result = runs[key]
+    output = result['output']
+    cols = st.columns(4)
+    cols[0].metric("Result", "✅ Ran" if result['ok'] else "❌ Failed")
+    cols[1].metric("Runtime", f"{result['runtime_ms']:,.0f} ms" if result['runtime_ms'] is not None else "—")
+    cols[2].metric("Peak memory", f"{result['peak_mb']:,.0f} MB" if result['peak_mb'] is not None else "—")
+    cols[3].metric("Output shape", " × ".join(f"{n:,}" for n in output['shape']) if output else "—",
+                   help=f"`{output['name']}` ({output['type']})" if output else None)
+    details = [f"CPU {result['cpu_ms']:,.0f} ms"] if result['cpu_ms'] is not None else []
+    if result['input_shape']:
+        details.append(f"input df {result['input_shape'][0]:,} × {result['input_shape'][1]}")
+    if result['load_ms']:
+        details.append(f"dataset loaded into the worker in {result['load_ms']:,.0f} ms")
+    if details:
+        st.caption(" · ".join(details))
+    if result['error']:
+        st.code(result['error'], language="text")
+    if result['stdout']:
+        with st.expander("Captured output"):
+            st.code(result['stdout'], language="text")
+
+def run_synthesis(q, targets, dataset_context, label, stream_tokens, loader_placeholder, dataset_meta=None, model=None):
+    # Each target runs on its own worker thread, so wall-clock time is close to the
+    # slowest single request. Workers only push tokens onto a queue; this (script)
+    # thread owns every Streamlit element and renders panels as output arrives.
+    events = queue.Queue()
+    outputs = st.session_state['res_all'] = {target: "" for target in targets}
+    served = st.session_state['res_models'] = {}
+    panels, errors = {}, {}
+    user = st.session_state.get('user')
+
+    def panel(target):
+        if target not in panels:
+            loader_placeholder.empty()
+            panels[target] = output_panel(target if len(targets) > 1 else None)
+        return panels[target]
+
+    def on_token_for(target):
+        return (lambda token: events.put(('token', target, token))) if stream_tokens else None
+
+    def on_wait_for(target):
+        return lambda position: events.put(('queued', target, position))
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+        pending = {
+            pool.submit(synthesize, q, target, dataset_context, label=label, user=user, model=model,
+                        on_token=on_token_for(target), on_wait=on_wait_for(target),
+                        **(dataset_meta or {})): target
+            for target in targets
+        }
+        while pending:
+            done, _ = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+            touched = set()
+            while not events.empty():
+                kind, target, value = events.get_nowait()
+                if kind == 'queued':
+                    # Provider is busy: show the queue position instead of failing
+                    if target not in panels:
+                        loader_placeholder.markdown(f"<p style='text-align: center; font-family: \"Space Grotesk\", monospace; color: #e2e8f0; letter-spacing: 3px; margin: 40px 0;'>⏳ QUEUED · {target.upper()} · POSITION {value}</p>", unsafe_allow_html=True)
+                    continue
+                outputs[target] += value
+                touched.add(target)
+            for target in touched:
+                panel(target).markdown(outputs[target] + "▌")
+            for future in done:
+                target = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors[target] = e
+                    if not outputs[target]:
+                        del outputs[target]
+                    continue
+                outputs[target] = result['text']
+                served[target] = f"{result['model']} · {result['route']['reason']}"
+                show_result(panel(target), result['text'], served[target])
+                if result['cached']:
+                    st.toast(f"⚡ {target} served from response cache")
+    return panels, errors
 
 # --- 7. MAIN APPLICATION ---
 if not st.session_state['logged_in']:
     login_page()
-elif st.session_state.get('booting', False):
-    boot_sequence()
-    st.session_state['booting'] = False
-    st.rerun()
 else:
+    if st.session_state.get('booting', False):
+        boot_sequence()
+        st.session_state['booting'] = False
     with st.sidebar:
         st.markdown("<h2 class='logo-container' style='font-size: 1.1rem; justify-content: center;'><span style='font-size: 1.3rem'>✨</span> CODIFY <span class='logo-highlight'>AI</span></h2>", unsafe_allow_html=True)
         st.divider()
         if st.button("⚡ NEURAL GENERATOR", use_container_width=True): st.session_state['page'] = 'generator'
+        if st.button("🗂️ HISTORY BROWSER", use_container_width=True): st.session_state['page'] = 'history'
+        if st.button("📈 PERFORMANCE", use_container_width=True): st.session_state['page'] = 'metrics'
         if st.button("📖 TECH MANIFESTO", use_container_width=True): st.session_state['page'] = 'docs'
         
         st.divider()
         st.subheader("📜 RECENT LOGS")
-        conn = sqlite3.connect('codify_pro.db', check_same_thread=False)
-        hist = conn.execute("SELECT language, query, code FROM history ORDER BY rowid DESC LIMIT 3").fetchall()
-        conn.close()
+        prefetch = st.session_state.pop('history_prefetch', None)
+        hist = prefetch.result() if prefetch else recent_history(3, user=st.session_state.get('user'))
         for item in hist:
             with st.expander(f"{item[0]}: {item[1][:10]}..."):
                 st.code(item[2], language=item[0].lower())
+        stats = cache_stats()
+        st.caption(f"⚡ CACHE: {stats['hits']} hits / {stats['misses']} misses · {stats['entries']} entries")
+        if startup.ENABLED:
+            with st.expander("⏱️ STARTUP PROFILE"):
+                for label, seconds in startup.timings.items():
+                    st.caption(f"{label}: {seconds * 1000:.1f} ms")
         
         if st.button("🚪 TERMINATE SESSION", use_container_width=True):
             st.session_state['logged_in'] = False
@@ -392,37 +321,79 @@ else:
             # --- File Upload Section ---
             uploaded_file = st.file_uploader(
                 "Attach context dataset (Optional)",
-                type=["csv", "xls", "xlsx"],
-                help="Upload a CSV, Excel (.xlsx/.xls), or exported Google Sheet file for AI analysis."
+                type=["csv", "xls", "xlsx", "parquet", "feather", "arrow", "jsonl", "ndjson"],
+                help="Upload a CSV, Excel (.xlsx/.xls), exported Google Sheet, Parquet, Feather/Arrow or JSON Lines file for AI analysis."
             )
             
             dataset_context = ""
+            dataset_meta = None
+            sandbox_source = None
             if uploaded_file is not None:
                 try:
-                    import io
-                    ext = uploaded_file.name.split('.')[-1].lower()
-                    raw_bytes = uploaded_file.read()
-                    if ext == 'csv':
-                        df = pd.read_csv(io.BytesIO(raw_bytes))
-                    else:
-                        df = pd.read_excel(io.BytesIO(raw_bytes))
-                        
-                    st.markdown(f"<p style='font-size:0.8rem; color:#94a3b8; margin-top:8px;'>✅ Loaded <b>{uploaded_file.name}</b> — {df.shape[0]} rows × {df.shape[1]} columns</p>", unsafe_allow_html=True)
+                    with timed("import dataset stack (pandas)"):
+                        from ingest import content_hash, load, prompt_context, sheet_names
+                        from sampling import STRATEGIES
+                        from summarizer import CONTEXT_TOKENS, estimate_tokens
+                    # Hash the upload and read its sheet list once per file; reruns with
+                    # the same file hit the parsed-dataset cache
+                    if st.session_state.get('upload_id') != uploaded_file.file_id:
+                        st.session_state['upload_id'] = uploaded_file.file_id
+                        st.session_state['upload_hash'] = content_hash(uploaded_file)
+                        st.session_state['upload_sheets'] = sheet_names(uploaded_file, uploaded_file.name)
+                    sheets = st.session_state['upload_sheets']
+                    sheet = None
+                    if len(sheets) > 1:
+                        rows_by_sheet = dict(sheets)
+                        sheet = st.selectbox("Sheet", list(rows_by_sheet), format_func=lambda s: f"{s} (~{rows_by_sheet[s]:,} rows)" if rows_by_sheet[s] is not None else s)
+                    dataset, full_profile = load(uploaded_file, uploaded_file.name, key=st.session_state['upload_hash'], sheet=sheet, size=uploaded_file.size)
+                    n_rows, n_cols = dataset['rows'], len(dataset['columns'])
+                    dataset_meta = {'dataset_bytes': uploaded_file.size, 'parse_ms': dataset.get('parse_ms')}
+                    sandbox_source = (uploaded_file, uploaded_file.name, st.session_state['upload_hash'], sheet)
+
+                    shown_rows = f"first {n_rows:,} rows" if dataset.get('partial') else f"{n_rows:,} rows"
+                    st.markdown(f"<p style='font-size:0.8rem; color:#94a3b8; margin-top:8px;'>✅ Loaded <b>{uploaded_file.name}</b> — {shown_rows} × {n_cols} columns</p>", unsafe_allow_html=True)
+                    if full_profile is not None:
+                        st.caption("⏳ Profiling the full file in the background; the summary updates when it finishes.")
+                        wait_for_profile(full_profile)
                     with st.expander("📊 DATASET PREVIEW", expanded=False):
-                        st.dataframe(df.head(10), use_container_width=True)
-                        
-                    # Build dataset context string for the AI
-                    dataset_context = (
-                        f"\n\nREFERENCE DATASET: {uploaded_file.name}\n"
-                        f"Shape: {df.shape[0]} rows × {df.shape[1]} columns\n"
-                        f"Columns: {', '.join(df.columns.tolist())}\n"
-                        f"First 50 rows (CSV format):\n{df.head(50).to_csv(index=False)}"
-                    )
+                        st.dataframe(dataset['preview'], use_container_width=True)
+                        st.dataframe(dataset['stats'], use_container_width=True)
+                        budget = st.select_slider("Context token budget", options=[500, 1000, 1500, 3000, 6000], value=CONTEXT_TOKENS)
+                        strategy = st.selectbox("Sample rows", list(STRATEGIES), format_func=STRATEGIES.get, help="Which rows of the file the summary shows the model.")
+                        column = None
+                        if strategy == "stratified":
+                            column = st.selectbox("Stratify by", list(dataset['columns']))
+                        dataset_context = prompt_context(dataset, budget, strategy, column)
+                        st.caption(f"Dataset summary ≈ {estimate_tokens(dataset_context)} tokens")
                 except Exception as e:
                     st.warning(f"⚠️ Could not read file: {e}")
-            lang = st.selectbox("Target Language", ["Python", "Excel Formula", "Google Sheets Formula"])
+            lang = st.selectbox("Target Language", LANGUAGES)
+            all_targets = st.toggle("Generate all targets", value=False, help="Generate the Python, Excel and Google Sheets versions concurrently in one request.")
             
+            stream_tokens = st.toggle("Stream output", value=True, help="Render tokens into the output panel as they arrive.")
+            # Executes model-written code, so only offered when the server opts in (CODIFY_ENABLE_DRY_RUN)
+            import sandbox
+            dry_run_enabled = sandbox.ENABLED and st.toggle("Dry run", value=False, help="Run the generated Python against the uploaded dataset in an isolated sandbox (no network, CPU, memory and time limits) and report runtime, peak memory and output shape.")
+            if dry_run_enabled:
+                sandbox.pool.warm()
+            model_choice = st.selectbox("Model", ["Auto"] + MODELS, help="Auto sends simple requests to the fast model and complex ones to the large model.")
+
+            # Paraphrases of earlier prompts: reuse a past generation instead of calling the model
+            with timed("import similar-prompt index (numpy)"):
+                from similar import similar_generations
+            matches = similar_generations(q, lang) if q.strip() else []
+            if matches:
+                st.markdown("<p style='font-size:0.8rem; color:#94a3b8; margin:16px 0 4px; letter-spacing:1px;'>↺ SIMILAR PAST GENERATIONS</p>", unsafe_allow_html=True)
+                for match in matches:
+                    text_col, reuse_col = st.columns([5, 1])
+                    text_col.caption(f"{match['similarity']:.0%} match · #{match['id']} · {match['query'][:80]}")
+                    if reuse_col.button("Reuse", key=f"reuse_{match['id']}", use_container_width=True):
+                        st.session_state['res_all'] = {lang: match['code']}
+                        st.session_state['res_models'] = {lang: f"reused generation #{match['id']}"}
+                        st.session_state['res'] = match['code']
+
             st.markdown("<br>", unsafe_allow_html=True)
+            live_panels = {}
             if st.button("Synthesize", use_container_width=True):
                 if q or dataset_context:
                     loader_placeholder = st.empty()
@@ -465,30 +436,125 @@ else:
                     """
                     loader_placeholder.markdown(loader_html, unsafe_allow_html=True)
                     
+                    targets = LANGUAGES if all_targets else [lang]
+                    history_label = q if q else f"Dataset analysis: {uploaded_file.name}"
+                    # A new run replaces the previous result even if every target fails
+                    st.session_state.pop('res', None)
                     try:
-                        if "Formula" in lang:
-                            base_prompt = f"Write a professional {lang} for the following request: {q}" if q else f"Analyze the provided dataset and write helpful {lang}s to process it."
-                        else:
-                            base_prompt = f"Write professional {lang} code for: {q}" if q else f"Analyse the provided dataset and write professional {lang} code to process it."
-                        
-                        full_prompt = base_prompt + dataset_context
-                        chat = client.chat.completions.create(
-                            messages=[{"role": "user", "content": full_prompt}],
-                            model="llama-3.3-70b-versatile"
-                        )
-                        st.session_state['res'] = chat.choices[0].message.content
-                        history_label = q if q else f"Dataset analysis: {uploaded_file.name}"
-                        save_to_history(history_label, st.session_state['res'], lang)
-                    except Exception as e:
-                        st.error(f"Inference Failure: {e}")
+                        live_panels, errors = run_synthesis(q, targets, dataset_context, history_label, stream_tokens, loader_placeholder, dataset_meta, None if model_choice == "Auto" else model_choice)
+                        for target, error in errors.items():
+                            st.error(f"Inference Failure ({target}): {error}" if all_targets else f"Inference Failure: {error}")
+                        outputs = st.session_state['res_all']
+                        # Partial text of a target that failed mid-stream is shown, but never becomes 'res'
+                        completed = {target: text for target, text in outputs.items() if target not in errors}
+                        if completed:
+                            st.session_state['res'] = completed.get(lang) or next(iter(completed.values()))
+                        if not outputs:
+                            del st.session_state['res_all']
                     finally:
                         loader_placeholder.empty()
             
-            if 'res' in st.session_state:
-                st.markdown("<div style='margin-top: 40px; padding: 25px; border-radius: 12px; background: rgba(255, 255, 255, 0.02); border: 1px solid rgba(255, 255, 255, 0.05); box-shadow: 0 10px 30px rgba(0,0,0,0.2);'>", unsafe_allow_html=True)
-                st.markdown("<h3 style='font-family: \"Space Grotesk\", sans-serif; font-size: 1.1rem; font-weight: 500; color: #f8fafc; margin-bottom: 20px; letter-spacing: 1px;'>SYSTEM OUTPUT</h3>", unsafe_allow_html=True)
-                st.markdown(st.session_state['res'])
-                st.markdown("</div>", unsafe_allow_html=True)
+            if 'res_all' in st.session_state and not live_panels:
+                outputs = st.session_state['res_all']
+                served = st.session_state.get('res_models', {})
+                for target, text in outputs.items():
+                    show_result(output_panel(target if len(outputs) > 1 else None), text, served.get(target))
+
+            if dry_run_enabled and st.session_state.get('res'):
+                code = sandbox.extract_python(st.session_state['res'])
+                if code:
+                    dry_run_panel(code, sandbox_source)
+                else:
+                    st.caption("Dry run: the output has no Python code block to run.")
+
+    elif st.session_state['page'] == 'history':
+        st.markdown("<h1 style='font-family: \"Space Grotesk\", sans-serif; font-weight: 500; color: #f8fafc; font-size: 2.2rem; margin-bottom: 30px;' class='reveal'>HISTORY <span style='color: #ffffff; opacity: 0.6;'>BROWSER</span></h1>", unsafe_allow_html=True)
+        search_col, lang_col, mine_col = st.columns([3, 1.2, 0.8])
+        search = search_col.text_input("Search queries and code", placeholder="e.g. duplicate rows")
+        lang_filter = lang_col.selectbox("Language", ["All", "Python", "Excel Formula", "Google Sheets Formula"])
+        only_mine = mine_col.toggle("Only mine", value=False)
+
+        # Keyset cursors: one `before_id` per page visited, reset when filters change
+        filters = (search, lang_filter, only_mine)
+        if st.session_state.get('history_filters') != filters:
+            st.session_state['history_filters'] = filters
+            st.session_state['history_cursors'] = [None]
+        cursors = st.session_state['history_cursors']
+
+        page_size = 20
+        rows = history_page(
+            search=search,
+            language=None if lang_filter == "All" else lang_filter,
+            user=st.session_state.get('user') if only_mine else None,
+            before_id=cursors[-1],
+            limit=page_size
+        )
+        if not rows:
+            st.info("No matching generations.")
+        for row_id, language, query_text, code, created_at, user, model, latency_ms in rows:
+            when = time.strftime('%Y-%m-%d %H:%M', time.localtime(created_at)) if created_at else "—"
+            with st.expander(f"#{row_id} · {language} · {when} · {query_text[:60]}"):
+                meta = [f"user: {user}" if user else None, f"model: {model}" if model else None,
+                        f"latency: {latency_ms:.0f} ms" if latency_ms else None]
+                st.caption(" · ".join(m for m in meta if m))
+                st.code(code, language=language.lower())
+
+        prev_col, _, next_col = st.columns([1, 3, 1])
+        if prev_col.button("← NEWER", use_container_width=True, disabled=len(cursors) == 1):
+            cursors.pop()
+            st.rerun()
+        if next_col.button("OLDER →", use_container_width=True, disabled=len(rows) < page_size):
+            cursors.append(rows[-1][0])
+            st.rerun()
+
+    elif st.session_state['page'] == 'metrics':
+        st.markdown("<h1 style='font-family: \"Space Grotesk\", sans-serif; font-weight: 500; color: #f8fafc; font-size: 2.2rem; margin-bottom: 30px;' class='reveal'>PERFORMANCE <span style='color: #ffffff; opacity: 0.6;'>DASHBOARD</span></h1>", unsafe_allow_html=True)
+        with timed("import dataset stack (pandas)"):
+            import pandas as pd
+        import metrics
+        windows = {"Last hour": (3600, "1min"), "Last 24 hours": (86400, "15min"), "Last 7 days": (7 * 86400, "2h"), "Last 30 days": (30 * 86400, "6h")}
+        window = st.selectbox("Window", list(windows), index=1)
+        seconds, bucket = windows[window]
+        df = pd.DataFrame(metrics.since(time.time() - seconds))
+        if df.empty:
+            st.info("No requests recorded in this window yet.")
+        else:
+            ok = df[df['error'].isna()]
+            latency, ttft = ok['latency_ms'], ok['ttft_ms']
+            def pct(series, q):
+                return f"{series.quantile(q):,.0f} ms" if len(series) else "—"
+            cols = st.columns(3)
+            cols[0].metric("Latency p50", pct(latency, 0.5))
+            cols[1].metric("Latency p95", pct(latency, 0.95))
+            cols[2].metric("Latency p99", pct(latency, 0.99))
+            cols = st.columns(3)
+            cols[0].metric("TTFT p50", pct(ttft, 0.5))
+            cols[1].metric("TTFT p95", pct(ttft, 0.95))
+            cols[2].metric("TTFT p99", pct(ttft, 0.99))
+            cols = st.columns(4)
+            cols[0].metric("Requests", f"{len(df):,}", f"{len(df) / (seconds / 3600):.1f}/h", delta_color="off")
+            cols[1].metric("Error rate", f"{df['error'].notna().mean():.1%}")
+            cols[2].metric("Cache hit rate", f"{(df['cache_status'] != 'miss').mean():.1%}")
+            cols[3].metric("Tokens", f"{int(df['prompt_tokens'].sum() + df['completion_tokens'].sum()):,}",
+                           f"{int(df['completion_tokens'].sum()):,} completion", delta_color="off")
+
+            # Bucketed time series; percentiles are per bucket
+            df['created_at'] = pd.to_datetime(df['created_at'], unit='s')
+            series = df.set_index('created_at').resample(bucket)
+            st.subheader("Latency (ms)")
+            st.line_chart(pd.DataFrame({
+                'p50': series['latency_ms'].quantile(0.5), 'p95': series['latency_ms'].quantile(0.95),
+                'ttft p50': series['ttft_ms'].quantile(0.5), 'queue p50': series['queue_ms'].quantile(0.5),
+            }))
+            st.subheader("Throughput")
+            st.line_chart(pd.DataFrame({
+                'requests': series.size(), 'errors': series['error'].count(),
+                'cache hits': series['cache_status'].apply(lambda s: int((s != 'miss').sum())),
+            }))
+            st.subheader("Tokens")
+            st.line_chart(series[['prompt_tokens', 'completion_tokens']].sum())
+            with st.expander("Slowest requests"):
+                st.dataframe(df.sort_values('latency_ms', ascending=False).head(20), use_container_width=True)
 
     elif st.session_state['page'] == 'docs':
         st.markdown("<h1 style='font-family: \"Space Grotesk\", sans-serif; font-weight: 500; color: #f8fafc; font-size: 2.2rem; margin-bottom: 30px;' class='reveal'>TECHNICAL <span style='color: #ffffff; opacity: 0.6;'>MANIFESTO</span></h1>", unsafe_allow_html=True)
@@ -508,7 +574,7 @@ else:
             <p>The system is engineered using a robust, decoupled infrastructure:</p>
             <ul>
                 <li><b>Presentation Layer (Frontend):</b> Built on Streamlit, utilizing custom CSS injection for advanced Glassmorphism and Neon-Cyberpunk UI elements.</li>
-                <li><b>Logic Layer (Inference Engine):</b> Secured API handshake with Groq Cloud, utilizing the <b>Llama-3.3-70B</b> transformer model.</li>
+                <li><b>Logic Layer (Inference Engine):</b> Secured API handshake with Groq Cloud, routing each request by complexity between a fast <b>Llama-3.1-8B</b> model and the <b>Llama-3.3-70B</b> transformer model.</li>
                 <li><b>Data Layer (Persistence):</b> Relational <b>SQLite 3</b> database for ACID-compliant session history and auditing.</li>
             </ul>
         </div>
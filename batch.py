@@ -0,0 +1,181 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+from dotenv import load_dotenv
+
+# Headless bulk synthesis.
+# Reads a manifest of jobs and runs them through the same pipeline as the app
+# (inference.synthesize: prompt building, response cache, coalescing, the
+# rate-limit scheduler, history and metrics).
+#
+#   python batch.py jobs.jsonl --output results.jsonl --concurrency 16
+#
+# Manifest rows (JSONL objects or CSV columns):
+#   prompt    what to build; may be empty when a dataset is given
+#   language  Python / Excel Formula / Google Sheets Formula, or "all" (default Python)
+#   dataset   optional CSV/Excel/Parquet/Arrow/JSONL path, relative to the manifest
+#   id        optional stable job id (default: the row number)
+#   sheet     optional worksheet name for Excel datasets (default: the first)
+#   budget    optional dataset context token budget
+#   sampling  optional row sampling strategy (see sampling.STRATEGIES; default head)
+#   stratify_by  column for the stratified strategy
+#   model     optional model override (default: routed by request complexity)
+#
+# The output file doubles as the checkpoint: one JSON line per finished job,
+# appended as soon as it completes. Re-running with the same --output skips
+# jobs that already succeeded (add --retry-failed to redo failures too).
+# Provider rate limits are the only throttle: the scheduler's in-flight limit
+# (--max-in-flight) defaults to --concurrency, so every worker can have a
+# request upstream and the rate-limit headers decide the pace.
+DEFAULT_CONCURRENCY = 16
+
+
+def read_manifest(path):
+    from inference import LANGUAGES
+    from router import MODELS
+    from sampling import STRATEGIES
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".csv"):
+            rows = list(csv.DictReader(f))
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]
+    base = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    for n, row in enumerate(rows, 1):
+        prompt = (row.get("prompt") or "").strip()
+        dataset = (row.get("dataset") or "").strip()
+        if not prompt and not dataset:
+            raise ValueError(f"{path} row {n}: needs a prompt or a dataset")
+        language = (row.get("language") or "Python").strip()
+        sampling = (row.get("sampling") or "").strip() or "head"
+        if sampling not in STRATEGIES:
+            raise ValueError(f"{path} row {n}: unknown sampling strategy {sampling!r}")
+        model = (row.get("model") or "").strip() or None
+        if model not in (None, "auto", *MODELS):
+            raise ValueError(f"{path} row {n}: unknown model {model!r}")
+        targets = LANGUAGES if language.lower() == "all" else [language]
+        for target in targets:
+            if target not in LANGUAGES:
+                raise ValueError(f"{path} row {n}: unknown language {target!r}")
+            jobs.append({
+                'id': str(row.get("id") or n),
+                'language': target,
+                'prompt': prompt,
+                'dataset': os.path.join(base, dataset) if dataset else None,
+                'sheet': (row.get("sheet") or "").strip() or None,
+                'budget': int(row["budget"]) if row.get("budget") else None,
+                'sampling': (sampling, (row.get("stratify_by") or "").strip() or None),
+                'model': None if model == "auto" else model,
+            })
+    return jobs
+
+
+def read_checkpoint(path, retry_failed=False):
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                continue  # a line cut short by an interrupted run
+            if result.get('status') == 'ok' or not retry_failed:
+                done.add((result['id'], result['language']))
+    return done
+
+
+# Datasets shared by many jobs are parsed once. The first job to need one parses
+# it; jobs that want the same dataset meanwhile wait on its future. The lock only
+# guards the table, so different datasets are parsed in parallel.
+_contexts = {}
+_contexts_lock = threading.Lock()
+
+
+def dataset_context(path, sheet, budget, sampling=("head", None)):
+    key = (path, sheet, budget, sampling)
+    with _contexts_lock:
+        future = _contexts.get(key)
+        owner = future is None
+        if owner:
+            future = _contexts[key] = Future()
+    if owner:
+        try:
+            from ingest import cached_ingest, content_hash, prompt_context
+            with open(path, "rb") as f:
+                dataset = cached_ingest(f, os.path.basename(path), key=content_hash(f), sheet=sheet)
+            future.set_result((prompt_context(dataset, budget, *sampling), os.path.getsize(path), dataset.get('parse_ms')))
+        except BaseException as e:
+            # Not cached: the next job for this dataset tries again
+            with _contexts_lock:
+                del _contexts[key]
+            future.set_exception(e)
+    return future.result()
+
+
+def run_job(job, user):
+    from inference import synthesize
+    context, meta = "", {}
+    if job['dataset']:
+        context, size, parse_ms = dataset_context(job['dataset'], job['sheet'], job['budget'], job['sampling'])
+        meta = {'dataset_bytes': size, 'parse_ms': parse_ms}
+    label = job['prompt'] or f"Dataset analysis: {os.path.basename(job['dataset'])}"
+    return synthesize(job['prompt'], job['language'], context, label=label, user=user, model=job['model'], **meta)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a manifest of synthesis jobs without the UI")
+    parser.add_argument("manifest", help="JSONL or CSV manifest")
+    parser.add_argument("--output", help="results JSONL, also the resume checkpoint (default: <manifest>.results.jsonl)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="jobs in progress at once")
+    parser.add_argument("--max-in-flight", type=int,
+                        help="scheduler's concurrent request limit (default: --concurrency)")
+    parser.add_argument("--user", default="batch", help="user recorded in history")
+    parser.add_argument("--retry-failed", action="store_true", help="re-run jobs that failed in a previous run")
+    args = parser.parse_args(argv)
+
+    load_dotenv()
+    from db import flush
+    from scheduler import scheduler
+    scheduler.max_in_flight = max(args.max_in_flight or args.concurrency, 1)
+
+    output = args.output or os.path.splitext(args.manifest)[0] + ".results.jsonl"
+    jobs = read_manifest(args.manifest)
+    done = read_checkpoint(output, args.retry_failed)
+    pending = [job for job in jobs if (job['id'], job['language']) not in done]
+    print(f"[batch] {len(jobs)} jobs, {len(jobs) - len(pending)} already done, {len(pending)} to run", file=sys.stderr)
+
+    started = time.perf_counter()
+    counts = {'ok': 0, 'error': 0}
+    with open(output, "a", encoding="utf-8") as out, ThreadPoolExecutor(max(args.concurrency, 1)) as pool:
+        futures = {pool.submit(run_job, job, args.user): job for job in pending}
+        for future in as_completed(futures):
+            job = futures[future]
+            record = {'id': job['id'], 'language': job['language'], 'prompt': job['prompt'], 'dataset': job['dataset']}
+            try:
+                result = future.result()
+                record.update(status='ok', text=result['text'], cached=result['cached'],
+                              model=result['model'], latency_ms=round(result['latency_ms'], 1))
+            except Exception as e:
+                record.update(status='error', error=f"{type(e).__name__}: {e}")
+            counts[record['status']] += 1
+            # Results are written from this thread only, as each job completes
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            finished = counts['ok'] + counts['error']
+            if finished % 25 == 0 or finished == len(pending):
+                rate = finished / (time.perf_counter() - started)
+                print(f"[batch] {finished}/{len(pending)} done ({counts['error']} failed, {rate:.1f} jobs/s)", file=sys.stderr)
+    flush()
+    print(f"[batch] finished: {counts['ok']} ok, {counts['error']} failed -> {output}", file=sys.stderr)
+    return 1 if counts['error'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Offline micro-benchmarks for the hot paths. Nothing here needs an API key or
+# network access: completions are served by mock_groq.py on localhost and the
+# database is a throwaway file.
+#
+#   python bench.py --quick                         # 1 MB dataset only, fewer repeats
+#   python bench.py --output results.json           # full run (1 MB, 100 MB, 1 GB)
+#   python bench.py --quick --save-baseline bench_baseline.json
+#   python bench.py --quick --baseline bench_baseline.json --tolerance 0.25
+#
+# Results are JSON: {"meta": {...}, "results": {name: {"value", "unit", "better"}}}.
+# With --baseline, any result that is worse than the stored value by more than
+# the tolerance is reported and the exit status is 1, so CI can fail the build.
+# Baselines are machine-specific; record them on the machine that compares.
+SIZES_MB = [1, 100, 1000]
+QUICK_SIZES_MB = [1]
+HISTORY_ROWS = 20000
+E2E_REQUESTS = 30
+E2E_CONCURRENCY = 8
+MOCK = {"latency": 0.05, "tokens_per_sec": 2000, "tokens": 120}
+
+
+def _median(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def _percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def _result(value, unit, better):
+    return {"value": round(value, 4), "unit": unit, "better": better}
+
+
+def make_csv(path, size_mb):
+    # Mixed-type synthetic data (ints, floats, low-cardinality text, dates, nulls)
+    import numpy as np
+    import pandas as pd
+    rng = np.random.default_rng(0)
+    rows = 20000
+    block = pd.DataFrame({
+        "id": np.arange(rows),
+        "amount": rng.normal(100, 25, rows).round(2),
+        "quantity": rng.integers(1, 50, rows),
+        "region": rng.choice(["north", "south", "east", "west"], rows),
+        "product": rng.choice([f"SKU-{i:04d}" for i in range(500)], rows),
+        "date": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365, rows), unit="D"),
+        "note": np.where(rng.random(rows) < 0.2, None, "ok"),
+    })
+    target = size_mb * 1024 * 1024
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        block.to_csv(f, index=False)
+        body = block.to_csv(index=False, header=False)
+        while f.tell() < target:
+            f.write(body)
+    return os.path.getsize(path)
+
+
+def bench_parsing(workdir, sizes, repeat):
+    from ingest import content_hash, ingest
+    results, datasets = {}, {}
+    for size_mb in sizes:
+        path = os.path.join(workdir, f"data_{size_mb}mb.csv")
+        size = make_csv(path, size_mb)
+        runs = repeat if size_mb <= 1 else 1
+        with open(path, "rb") as f:
+            def parse():
+                f.seek(0)
+                datasets[size_mb] = ingest(f, os.path.basename(path))
+            seconds = _median(parse, runs)
+            hash_seconds = _median(lambda: content_hash(f), runs)
+        results[f"parse_csv_{size_mb}mb_s"] = _result(seconds, "s", "lower")
+        results[f"parse_csv_{size_mb}mb_throughput"] = _result(size / seconds / 1e6, "MB/s", "higher")
+        results[f"hash_{size_mb}mb_throughput"] = _result(size / hash_seconds / 1e6, "MB/s", "higher")
+        os.remove(path)
+    return results, datasets[sizes[0]]
+
+
+def bench_prompt(dataset, repeat):
+    from inference import build_prompt
+    from response_cache import cache_key
+    from summarizer import summarize
+    results = {}
+    for budget in (500, 1500, 6000):
+        seconds = _median(lambda: summarize(dataset, budget), repeat * 10)
+        results[f"summarize_{budget}tok_ms"] = _result(seconds * 1000, "ms", "lower")
+    context = summarize(dataset, 1500)
+
+    def build():
+        prompt = build_prompt("remove duplicate rows and plot sales by region", "Python")
+        cache_key(prompt, "Python", context, "llama-3.3-70b-versatile")
+    seconds = _median(lambda: [build() for _ in range(1000)], repeat)
+    results["build_prompt_ops"] = _result(1000 / seconds, "ops/s", "higher")
+    return results
+
+
+def bench_history(repeat):
+    from db import flush, history_page, recent_history, save_to_history
+    results = {}
+    started = time.perf_counter()
+    for i in range(HISTORY_ROWS):
+        save_to_history(f"query {i} remove duplicate rows", f"print({i})", "Python",
+                        user=f"user{i % 20}", model="bench", latency_ms=1.0)
+    flush()
+    results["history_insert_rows"] = _result(HISTORY_ROWS / (time.perf_counter() - started), "rows/s", "higher")
+
+    seconds = _median(lambda: [recent_history(3, user="user7") for _ in range(200)], repeat)
+    results["history_recent_ops"] = _result(200 / seconds, "ops/s", "higher")
+    seconds = _median(lambda: history_page(search="duplicate", limit=20), repeat * 5)
+    results["history_search_ms"] = _result(seconds * 1000, "ms", "lower")
+    seconds = _median(lambda: history_page(language="Python", before_id=HISTORY_ROWS // 2, limit=20), repeat * 5)
+    results["history_page_ms"] = _result(seconds * 1000, "ms", "lower")
+
+    # Near-duplicate index: cold build over the rows above, then lookups (every
+    # bench row shares most shingles, so this is close to the worst case)
+    from similar import index
+    started = time.perf_counter()
+    index.start()
+    while index.state == "loading":
+        time.sleep(0.005)
+    results["similar_build_s"] = _result(time.perf_counter() - started, "s", "lower")
+    seconds = _median(lambda: index.lookup("drop the duplicated rows", "Python"), repeat * 5)
+    results["similar_lookup_ms"] = _result(seconds * 1000, "ms", "lower")
+    return results
+
+
+def bench_sandbox(workdir, repeat):
+    # Dry runs: the first one starts a worker (interpreter, pandas) and loads the
+    # dataset into it; later ones fork from the warm worker
+    from ingest import content_hash
+    from sandbox import SandboxPool, stage_dataset
+    path = os.path.join(workdir, "sandbox.csv")
+    make_csv(path, 1)
+    with open(path, "rb") as f:
+        dataset = stage_dataset(f, "sandbox.csv", content_hash(f))
+    code = "result = df.describe()"
+    pool = SandboxPool(1)
+    results = {}
+    started = time.perf_counter()
+    pool.run(code, dataset)
+    results["dry_run_cold_ms"] = _result((time.perf_counter() - started) * 1000, "ms", "lower")
+    seconds = _median(lambda: pool.run(code, dataset), repeat * 3)
+    results["dry_run_warm_ms"] = _result(seconds * 1000, "ms", "lower")
+    pool.close()
+    os.remove(dataset['path'])
+    return results
+
+
+def bench_synthesize(server):
+    from inference import MODEL, synthesize
+    results = {}
+    nominal = MOCK["latency"] + MOCK["tokens"] / MOCK["tokens_per_sec"]
+    # Pinned to the large model so these stay comparable with the router in place
+
+    latencies, ttfts = [], []
+    for i in range(E2E_REQUESTS):
+        first = []
+        started = time.perf_counter()
+        synthesize(f"benchmark request {i}", "Python", model=MODEL,
+                   on_token=lambda token: first or first.append(time.perf_counter()))
+        latencies.append(time.perf_counter() - started)
+        ttfts.append(first[0] - started)
+    results["synthesize_p50_ms"] = _result(_percentile(latencies, 0.5) * 1000, "ms", "lower")
+    results["synthesize_p95_ms"] = _result(_percentile(latencies, 0.95) * 1000, "ms", "lower")
+    results["synthesize_ttft_p50_ms"] = _result(_percentile(ttfts, 0.5) * 1000, "ms", "lower")
+    # Time spent in our own code on top of what the (mock) model takes
+    results["synthesize_overhead_ms"] = _result((_percentile(latencies, 0.5) - nominal) * 1000, "ms", "lower")
+
+    started = time.perf_counter()
+    for i in range(E2E_REQUESTS):
+        synthesize(f"benchmark request {i}", "Python", model=MODEL)
+    results["synthesize_cache_hit_ms"] = _result((time.perf_counter() - started) / E2E_REQUESTS * 1000, "ms", "lower")
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(E2E_CONCURRENCY) as pool:
+        list(pool.map(lambda i: synthesize(f"concurrent request {i}", "Python", model=MODEL), range(E2E_REQUESTS)))
+    results["synthesize_concurrent_rps"] = _result(E2E_REQUESTS / (time.perf_counter() - started), "req/s", "higher")
+
+    # Routed: simple requests go to the fast model (which the mock serves faster)
+    latencies = []
+    for i in range(E2E_REQUESTS):
+        started = time.perf_counter()
+        synthesize(f"sum column {i}", "Excel Formula")
+        latencies.append(time.perf_counter() - started)
+    results["synthesize_routed_simple_p50_ms"] = _result(_percentile(latencies, 0.5) * 1000, "ms", "lower")
+    results["mock_upstream_requests"] = _result(server.requests, "requests", "lower")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, base in baseline.get("results", {}).items():
+        current = results.get(name)
+        if current is None or not base["value"]:
+            continue
+        change = (current["value"] - base["value"]) / abs(base["value"])
+        worse = change > tolerance if base["better"] == "lower" else change < -tolerance
+        if worse:
+            regressions.append(f"{name}: {base['value']} -> {current['value']} {current['unit']} ({change:+.0%})")
+    return regressions
+
+
+def run(sizes, repeat, workdir):
+    # The app reads these at import/first use, so set them before importing it
+    os.environ["CODIFY_DB_PATH"] = os.path.join(workdir, "bench.db")
+    import mock_groq
+    server = mock_groq.serve(**MOCK)
+    os.environ["GROQ_BASE_URL"] = server.url
+    os.environ.setdefault("GROQ_API_KEY", "offline-benchmark")
+
+    results = {}
+    started = time.perf_counter()
+    parsed, dataset = bench_parsing(workdir, sizes, repeat)
+    results.update(parsed)
+    for phase, fn in (("prompt", lambda: bench_prompt(dataset, repeat)),
+                      ("history", lambda: bench_history(repeat)),
+                      ("sandbox", lambda: bench_sandbox(workdir, repeat)),
+                      ("synthesize", lambda: bench_synthesize(server))):
+        print(f"[bench] {time.perf_counter() - started:.1f}s elapsed, running {phase}", file=sys.stderr)
+        results.update(fn())
+    server.shutdown()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline performance benchmarks")
+    parser.add_argument("--quick", action="store_true", help="1 MB dataset only and fewer repeats")
+    parser.add_argument("--sizes", help="comma-separated dataset sizes in MB (default 1,100,1000)")
+    parser.add_argument("--repeat", type=int, help="repeats per micro-benchmark (median is reported)")
+    parser.add_argument("--output", help="write results JSON here instead of stdout")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative slowdown (default 0.2)")
+    parser.add_argument("--save-baseline", help="also write the results to this path as the new baseline")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")] if args.sizes else QUICK_SIZES_MB if args.quick else SIZES_MB
+    repeat = args.repeat or (3 if args.quick else 5)
+    with tempfile.TemporaryDirectory(prefix="codify-bench-") as workdir:
+        results = run(sizes, repeat, workdir)
+    report = {
+        "meta": {"timestamp": time.time(), "python": platform.python_version(), "platform": platform.platform(),
+                 "cpus": os.cpu_count(), "sizes_mb": sizes, "repeat": repeat, "mock": MOCK},
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"[bench] REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"[bench] no regressions against {args.baseline}", file=sys.stderr)
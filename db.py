@@ -0,0 +1,364 @@
+import atexit
+import logging
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from startup import timed
+
+# Shared data-access layer for codify_pro.db.
+# Connections are opened once per process and handed out from a pool instead of
+# being opened and closed on every Streamlit rerun. Each connection runs in WAL
+# mode so readers never block the writer, and keeps a per-connection cache of
+# compiled statements so repeated queries skip the SQL parser.
+DB_PATH = os.getenv("CODIFY_DB_PATH", 'codify_pro.db')
+POOL_SIZE = int(os.getenv("CODIFY_DB_POOL_SIZE", 8))
+WRITE_QUEUE_SIZE = int(os.getenv("CODIFY_WRITE_QUEUE_SIZE", 1000))
+WRITE_BATCH_SIZE = 200
+WRITE_PUT_TIMEOUT = 2.0
+STATEMENT_CACHE_SIZE = 256
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",      # ~20 MB page cache per connection
+    "PRAGMA mmap_size=268435456",    # 256 MB memory-mapped I/O
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+_pool = queue.LifoQueue(maxsize=POOL_SIZE)
+_pool_pid = os.getpid()
+_pool_lock = threading.Lock()
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+
+def _connect():
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, timeout=5.0,
+                           cached_statements=STATEMENT_CACHE_SIZE)
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _reset_after_fork():
+    # SQLite handles must not cross a fork; start a fresh pool in the child.
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool_pid != os.getpid():
+            _pool = queue.LifoQueue(maxsize=POOL_SIZE)
+            _pool_pid = os.getpid()
+
+
+@contextmanager
+def connection():
+    if _pool_pid != os.getpid():
+        _reset_after_fork()
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = _connect()
+    try:
+        if not _schema_ready:
+            _ensure_schema(conn)
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            _pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+@contextmanager
+def transaction():
+    with connection() as conn:
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+
+def query(sql, params=()):
+    with connection() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+def execute(sql, params=()):
+    with transaction() as conn:
+        return conn.execute(sql, params).rowcount
+
+
+def close_all():
+    while True:
+        try:
+            _pool.get_nowait().close()
+        except queue.Empty:
+            break
+
+
+# --- Write-behind queue ---
+# Fire-and-forget writes (history, metrics) are queued here and committed by a
+# background thread in batches, so the Streamlit script thread never waits on an
+# fsync. When the queue is full, producers block for up to WRITE_PUT_TIMEOUT
+# seconds and then fall back to writing synchronously, so nothing is dropped.
+log = logging.getLogger(__name__)
+_writes = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def _committed(on_commit, rowid):
+    try:
+        on_commit(rowid)
+    except Exception:
+        log.exception("Write-behind commit callback failed")
+
+
+def _commit_batch(batch):
+    committed = []
+    with transaction() as conn:
+        for sql, params, on_commit in batch:
+            rowid = conn.execute(sql, params).lastrowid
+            if on_commit is not None:
+                committed.append((on_commit, rowid))
+    for on_commit, rowid in committed:
+        _committed(on_commit, rowid)
+
+
+def _writer_loop():
+    while True:
+        batch = [_writes.get()]
+        while len(batch) < WRITE_BATCH_SIZE:
+            try:
+                batch.append(_writes.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _commit_batch(batch)
+        except Exception:
+            # One bad statement must not take the rest of the batch (other users'
+            # rows) with it: replay them one per transaction
+            log.warning("Write-behind batch of %d statements failed; retrying one at a time", len(batch))
+            for write in batch:
+                try:
+                    _commit_batch([write])
+                except Exception:
+                    log.exception("Write-behind statement failed: %s", write[0])
+        finally:
+            for _ in batch:
+                _writes.task_done()
+
+
+def _ensure_writer():
+    global _writer, _writes
+    with _writer_lock:
+        if _writer is not None and _writer.is_alive():
+            return
+        if _writer is not None:
+            # Forked child: the parent's thread and queued items don't carry over.
+            _writes = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        _writer = threading.Thread(target=_writer_loop, name="codify-db-writer", daemon=True)
+        _writer.start()
+
+
+def execute_async(sql, params=(), on_commit=None):
+    # on_commit(lastrowid) runs on the writer thread once the statement is committed
+    _ensure_writer()
+    try:
+        _writes.put((sql, params, on_commit), timeout=WRITE_PUT_TIMEOUT)
+    except queue.Full:
+        with transaction() as conn:
+            rowid = conn.execute(sql, params).lastrowid
+        if on_commit is not None:
+            _committed(on_commit, rowid)
+
+
+def flush():
+    if _writer is not None and _writer.is_alive():
+        _writes.join()
+
+
+atexit.register(flush)
+
+
+# --- History ---
+# Schema versions are tracked with PRAGMA user_version. Each migration runs once,
+# in order, inside its own transaction.
+def _migrate_v1(c):
+    # Give history a stable INTEGER PRIMARY KEY (plain rowids may be renumbered by
+    # VACUUM, which would break the FTS index and pagination cursors) and the
+    # columns needed to browse and audit generations.
+    c.execute('CREATE TABLE IF NOT EXISTS history (query TEXT, code TEXT, language TEXT)')
+    c.execute('''CREATE TABLE history_v1 (
+                    id INTEGER PRIMARY KEY,
+                    query TEXT,
+                    code TEXT,
+                    language TEXT,
+                    created_at REAL,
+                    user TEXT,
+                    model TEXT,
+                    latency_ms REAL,
+                    prompt_tokens INTEGER,
+                    completion_tokens INTEGER)''')
+    c.execute("INSERT INTO history_v1 (id, query, code, language) SELECT rowid, query, code, language FROM history")
+    c.execute("DROP TABLE history")
+    c.execute("ALTER TABLE history_v1 RENAME TO history")
+    c.execute("CREATE INDEX idx_history_created_at ON history (created_at)")
+    c.execute("CREATE INDEX idx_history_user_id ON history (user, id)")
+    c.execute("CREATE INDEX idx_history_language_id ON history (language, id)")
+
+
+def _migrate_v2(c):
+    # External-content FTS5 index over query and code, kept in sync by triggers.
+    c.execute("CREATE VIRTUAL TABLE history_fts USING fts5(query, code, content='history', content_rowid='id')")
+    c.execute('''CREATE TRIGGER history_ai AFTER INSERT ON history BEGIN
+                    INSERT INTO history_fts (rowid, query, code) VALUES (new.id, new.query, new.code);
+                 END''')
+    c.execute('''CREATE TRIGGER history_ad AFTER DELETE ON history BEGIN
+                    INSERT INTO history_fts (history_fts, rowid, query, code) VALUES ('delete', old.id, old.query, old.code);
+                 END''')
+    c.execute('''CREATE TRIGGER history_au AFTER UPDATE ON history BEGIN
+                    INSERT INTO history_fts (history_fts, rowid, query, code) VALUES ('delete', old.id, old.query, old.code);
+                    INSERT INTO history_fts (rowid, query, code) VALUES (new.id, new.query, new.code);
+                 END''')
+    c.execute("INSERT INTO history_fts (history_fts) VALUES ('rebuild')")
+
+
+def _migrate_v3(c):
+    # Per-request performance metrics (see metrics.py)
+    c.execute('''CREATE TABLE metrics (
+                    id INTEGER PRIMARY KEY,
+                    created_at REAL,
+                    user TEXT,
+                    language TEXT,
+                    model TEXT,
+                    prompt_chars INTEGER,
+                    dataset_bytes INTEGER,
+                    parse_ms REAL,
+                    queue_ms REAL,
+                    ttft_ms REAL,
+                    latency_ms REAL,
+                    prompt_tokens INTEGER,
+                    completion_tokens INTEGER,
+                    cache_status TEXT,
+                    error TEXT)''')
+    c.execute("CREATE INDEX idx_metrics_created_at ON metrics (created_at)")
+
+
+def _migrate_v4(c):
+    # Completed-response cache (see response_cache.py). Databases from before this
+    # migration may already have the tables, which were created on first use.
+    c.execute('''CREATE TABLE IF NOT EXISTS response_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT,
+                    model TEXT,
+                    created_at REAL,
+                    last_access REAL,
+                    size INTEGER,
+                    hits INTEGER DEFAULT 0)''')
+    c.execute("CREATE INDEX IF NOT EXISTS idx_response_cache_last_access ON response_cache (last_access)")
+    c.execute("CREATE TABLE IF NOT EXISTS cache_stats (name TEXT PRIMARY KEY, value INTEGER)")
+
+
+MIGRATIONS = [_migrate_v1, _migrate_v2, _migrate_v3, _migrate_v4]
+
+
+def _ensure_schema(conn):
+    # Runs pending migrations the first time this process checks out a connection.
+    global _schema_ready
+    with _schema_lock:
+        if _schema_ready:
+            return
+        with timed("database schema"):
+            try:
+                # IMMEDIATE takes the write lock up front so concurrent processes can't
+                # both run the same migration, and keeps the DDL inside the transaction.
+                conn.execute("BEGIN IMMEDIATE")
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                for number, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+                    migration(conn)
+                    conn.execute(f"PRAGMA user_version = {number}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        _schema_ready = True
+
+
+def init_db():
+    # Schema setup happens lazily on first use; this just forces it eagerly.
+    with connection():
+        pass
+
+
+# Called as listener(id, query, language) after each history row is committed
+# (the similar-prompt index keeps itself current this way).
+history_listeners = []
+
+
+def save_to_history(query_text, code, language, user=None, model=None,
+                    latency_ms=None, prompt_tokens=None, completion_tokens=None):
+    # Returns an Event that is set once this row is committed
+    saved = threading.Event()
+
+    def committed(rowid):
+        saved.set()
+        for listener in history_listeners:
+            listener(rowid, query_text, language)
+    execute_async("INSERT INTO history (query, code, language, created_at, user, model, latency_ms, "
+            "prompt_tokens, completion_tokens) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (query_text, code, language, time.time(), user, model, latency_ms,
+             prompt_tokens, completion_tokens), on_commit=committed)
+    return saved
+
+
+def recent_history(limit=3, user=None):
+    if user:
+        return query("SELECT language, query, code FROM history WHERE user = ? ORDER BY id DESC LIMIT ?", (user, limit))
+    return query("SELECT language, query, code FROM history ORDER BY id DESC LIMIT ?", (limit,))
+
+
+def _fts_query(text):
+    # Quote each word so user input can't inject FTS5 syntax; prefix-match the terms.
+    terms = re.findall(r"\w+", text)
+    return " ".join(f'"{t}"*' for t in terms)
+
+
+# Keyset pagination, newest first: pass the smallest id of the previous page as
+# `before_id` to fetch the next one. Each page is an index range scan (or an FTS
+# rowid-ordered scan when searching), so cost doesn't grow with table size.
+def history_page(search="", language=None, user=None, before_id=None, limit=20):
+    columns = "h.id, h.language, h.query, h.code, h.created_at, h.user, h.model, h.latency_ms"
+    where, params = [], []
+    match = _fts_query(search) if search else ""
+    if match:
+        sql = f"SELECT {columns} FROM history_fts f JOIN history h ON h.id = f.rowid"
+        where.append("history_fts MATCH ?")
+        params.append(match)
+        id_column = "f.rowid"
+    else:
+        sql = f"SELECT {columns} FROM history h"
+        id_column = "h.id"
+    if language:
+        where.append("h.language = ?")
+        params.append(language)
+    if user:
+        where.append("h.user = ?")
+        params.append(user)
+    if before_id is not None:
+        where.append(f"{id_column} < ?")
+        params.append(before_id)
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += f" ORDER BY {id_column} DESC LIMIT ?"
+    params.append(limit)
+    return query(sql, params)
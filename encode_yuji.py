@@ -1,76 +1,86 @@
-import base64
+import hashlib
+import io
+import json
 import os
+import re
 
-normal_path = r"C:\Users\AD\.gemini\antigravity\brain\47326433-7a50-49c7-b2d5-078cf81bc0ca\yuji_normal_1772869709396.png"
-covered_path = r"C:\Users\AD\.gemini\antigravity\brain\47326433-7a50-49c7-b2d5-078cf81bc0ca\yuji_covering_eyes_1772869724683.png"
+from PIL import Image
 
-with open(normal_path, "rb") as f:
-    normal_b64 = base64.b64encode(f.read()).decode()
-    
-with open(covered_path, "rb") as f:
-    covered_b64 = base64.b64encode(f.read()).decode()
+# Static asset build step.
+# Turns the sources in assets/ into content-hashed files under static/, which
+# Streamlit serves at app/static/ (see .streamlit/config.toml):
+#   - each image in IMAGES is resized for 2x displays and encoded as WebP and AVIF
+#   - the stylesheets in CSS_SOURCES are minified into one codify.<hash>.css bundle
+# static/manifest.json maps logical names to the hashed files. Because a file's
+# name changes whenever its content does, it can be cached forever.
+#
+# Run after editing anything in assets/:  python encode_yuji.py
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(ROOT, "assets")
+STATIC_DIR = os.path.join(ROOT, "static")
+MANIFEST_PATH = os.path.join(STATIC_DIR, "manifest.json")
 
-html_content = f'''
-wombat_html = """
-<style>
-  .yuji-container {{
-    width: 160px; 
-    height: 160px; 
-    border-radius: 50%; 
-    margin: 0 auto; 
-    position: relative; 
-    overflow: hidden; 
-    box-shadow: inset 0 2px 5px rgba(0,0,0,0.5), 0 0 20px rgba(220, 20, 60, 0.4);
-    border: 2px solid #dc143c;
-  }}
-  .yuji-img {{
-    position: absolute;
-    top: 0;
-    left: 0;
-    width: 100%;
-    height: 100%;
-    object-fit: cover;
-    transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-  }}
-  
-  .yuji-normal {{
-    z-index: 1;
-    transform-origin: center;
-  }}
-  
-  /* Use clip-path to crop the facial features of the 'covered' image 
-     and animate it sliding up from the bottom */
-  .yuji-covered {{
-    z-index: 2;
-    transform: translateY(100%);
-    clip-path: inset(30% 0 0 0); 
-  }}
-  
-  /* Password field focus animation */
-  body:has(input[type="password"]:focus) .yuji-normal {{
-    filter: brightness(0.6);
-    transform: scale(0.95);
-  }}
-  body:has(input[type="password"]:focus) .yuji-covered {{
-    transform: translateY(0);
-    clip-path: inset(0 0 0 0);
-  }}
-  
-  /* Username field focus animation (Leaning in effect) */
-  body:has(input[type="text"]:focus) .yuji-normal {{
-    transform: scale(1.1) translate(2px, 2px);
-  }}
-</style>
+CSS_SOURCES = ["app.css", "login.css", "avatar.css"]
+CSS_BUNDLE = "codify.css"
+IMAGES = {"yuji.png": 320}  # source file -> output width in px (rendered at 160px)
+IMAGE_FORMATS = {"webp": {"quality": 80, "method": 6}, "avif": {"quality": 60}}
 
-<div style="text-align: center; margin-bottom: 20px;">
-  <div class="yuji-container">
-    <img class="yuji-img yuji-normal" src="data:image/png;base64,{normal_b64}" alt="Yuji Normal">
-    <img class="yuji-img yuji-covered" src="data:image/png;base64,{covered_b64}" alt="Yuji Covered">
-  </div>
-  <h2 style="font-family: 'Space Grotesk', sans-serif; color: #e2e8f0; font-weight: 600; margin-top: 25px; letter-spacing: 2px;">Sign In</h2>
-</div>
-"""
-'''
 
-with open(r"c:\Users\AD\OneDrive\Deekshith\Codify_Project\yuji_avatar.py", "w") as f:
-    f.write(html_content)
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+def _write_hashed(data, stem, ext):
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    filename = f"{stem}.{digest}.{ext}"
+    with open(os.path.join(STATIC_DIR, filename), "wb") as f:
+        f.write(data)
+    return filename
+
+
+def build_css():
+    parts = []
+    for name in CSS_SOURCES:
+        with open(os.path.join(ASSETS_DIR, "css", name), encoding="utf-8") as f:
+            parts.append(minify_css(f.read()))
+    stem, ext = CSS_BUNDLE.rsplit(".", 1)
+    return {CSS_BUNDLE: _write_hashed("".join(parts).encode("utf-8"), stem, ext)}
+
+
+def build_images():
+    outputs = {}
+    for source, width in IMAGES.items():
+        stem = source.rsplit(".", 1)[0]
+        with Image.open(os.path.join(ASSETS_DIR, "img", source)) as image:
+            image = image.convert("RGB")
+            if image.width > width:
+                image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+            for fmt, options in IMAGE_FORMATS.items():
+                buffer = io.BytesIO()
+                image.save(buffer, format=fmt.upper(), **options)
+                outputs[f"{stem}.{fmt}"] = _write_hashed(buffer.getvalue(), stem, fmt)
+    return outputs
+
+
+def build():
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    manifest = {**build_css(), **build_images()}
+    # Drop outputs of previous builds
+    keep = set(manifest.values()) | {os.path.basename(MANIFEST_PATH)}
+    for filename in os.listdir(STATIC_DIR):
+        if filename not in keep:
+            os.remove(os.path.join(STATIC_DIR, filename))
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return manifest
+
+
+if __name__ == "__main__":
+    for logical, filename in build().items():
+        size = os.path.getsize(os.path.join(STATIC_DIR, filename))
+        print(f"{logical:<12} -> static/{filename} ({size / 1024:.1f} KB)")
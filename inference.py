@@ -0,0 +1,171 @@
+import hashlib
+import os
+import threading
+import time
+
+import metrics
+from db import save_to_history
+from response_cache import cache_key, get_cached, put_cached
+from router import LARGE_MODEL, route, timeout_for
+from scheduler import scheduler
+from singleflight import flights
+from startup import timed
+
+MODEL = LARGE_MODEL
+LANGUAGES = ["Python", "Excel Formula", "Google Sheets Formula"]
+
+# One Groq client per process, created on first use so that pages which never
+# call the model (login, history, docs) don't pay for importing the SDK.
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                with timed("groq client"):
+                    from groq import Groq
+                    # Retries are owned by the scheduler, which also honours rate-limit headers
+                    _client = Groq(api_key=os.getenv("GROQ_API_KEY"), max_retries=0)
+    return _client
+
+
+def warm_up():
+    # A cheap authenticated GET opens the pooled HTTPS connection (DNS, TCP, TLS)
+    # so the first completion request doesn't pay the handshake.
+    with timed("groq connection warm-up"):
+        get_client().models.list()
+
+
+# --- Synthesis pipeline ---
+# Shared by every entry point. All functions here are thread-safe so several
+# targets can be generated concurrently.
+def build_prompt(q, lang):
+    if "Formula" in lang:
+        return f"Write a professional {lang} for the following request: {q}" if q else f"Analyze the provided dataset and write helpful {lang}s to process it."
+    return f"Write professional {lang} code for: {q}" if q else f"Analyse the provided dataset and write professional {lang} code to process it."
+
+
+def complete(prompt, model=MODEL, on_token=None, on_wait=None, timings=None, timeout=None, max_retries=None):
+    # Returns (text, usage). With on_token the response is streamed and every
+    # content delta is passed to it as it arrives. Calls go through the shared
+    # scheduler; on_wait(position) is called while the request is queued.
+    messages = [{"role": "user", "content": prompt}]
+    text, usage = "", None
+
+    def request():
+        nonlocal text, usage
+        raw = get_client().chat.completions.with_raw_response.create(
+            messages=messages, model=model, stream=on_token is not None, timeout=timeout or timeout_for(model))
+        scheduler.record(raw.headers, bucket=model)
+        if on_token is None:
+            chat = raw.parse()
+            return chat.choices[0].message.content, chat.usage
+        for chunk in raw.parse():
+            # Groq reports token usage on the final chunk
+            usage = getattr(getattr(chunk, 'x_groq', None), 'usage', None) or usage
+            token = chunk.choices[0].delta.content if chunk.choices else None
+            if token:
+                text += token
+                on_token(token)
+        return text, usage
+
+    # Rough prompt size for the token budget; ~4 characters per token
+    return scheduler.run(request, tokens=len(prompt) // 4, on_wait=on_wait,
+                         can_retry=lambda: not text, timings=timings, bucket=model, max_retries=max_retries)
+
+
+def synthesize(q, lang, dataset_context="", label=None, user=None, model=None, on_token=None, on_wait=None,
+               dataset_bytes=None, parse_ms=None):
+    # Without an explicit model the router picks one (see router.py)
+    base_prompt = build_prompt(q, lang)
+    full_prompt = base_prompt + dataset_context
+    started = time.perf_counter()
+    timings = {}
+    decision = route(q, lang, dataset_context, dataset_bytes, model)
+    model = decision['model']
+
+    def on_first_token(token):
+        timings.setdefault('ttft_ms', (time.perf_counter() - started) * 1000)
+        if on_token is not None:
+            on_token(token)
+
+    def record_metrics(cache_status, usage=None, error=None):
+        latency_ms = (time.perf_counter() - started) * 1000
+        metrics.record(
+            user=user, language=lang, model=model,
+            prompt_chars=len(full_prompt), dataset_bytes=dataset_bytes, parse_ms=parse_ms,
+            queue_ms=timings.get('queue_ms'), ttft_ms=timings.get('ttft_ms', latency_ms),
+            latency_ms=latency_ms,
+            prompt_tokens=getattr(usage, 'prompt_tokens', None),
+            completion_tokens=getattr(usage, 'completion_tokens', None),
+            cache_status=cache_status, error=error
+        )
+        return latency_ms
+
+    key = cache_key(base_prompt, lang, dataset_context, model)
+    cached = get_cached(key)
+    coalesced = False
+    if cached is not None:
+        (text, served), usage = cached, None
+    else:
+        # Identical requests already in flight share one upstream call. The leader
+        # always streams so attached callers can render tokens as they arrive.
+        flight_key = hashlib.sha256("\x1f".join([full_prompt, lang, model]).encode("utf-8")).hexdigest()
+
+        def call(publish):
+            # Returns (text, usage, model that served it)
+            streamed = []
+
+            def relay(token):
+                streamed.append(token)
+                publish(token)
+            # With a fallback, errors on the fast model escalate instead of being retried,
+            # and a fast model that is rate limited right now is skipped altogether
+            retries = 0 if decision['fallback'] else None
+            if decision['fallback'] and scheduler.blocked(model, len(full_prompt) // 4):
+                return (*complete(full_prompt, decision['fallback'], publish, on_wait, timings), decision['fallback'])
+            try:
+                return (*complete(full_prompt, model, relay, on_wait, timings, decision['timeout'], retries), model)
+            except Exception:
+                if decision['fallback'] is None or streamed:
+                    raise
+                # The fast model failed or timed out before any output: escalate
+                return (*complete(full_prompt, decision['fallback'], publish, on_wait, timings), decision['fallback'])
+
+        try:
+            (text, usage, served), leader = flights.do(flight_key, call, on_token=on_first_token)
+        except Exception as e:
+            record_metrics('miss', error=f"{type(e).__name__}: {e}"[:500])
+            raise
+        coalesced = not leader
+        if leader:
+            put_cached(key, text, served)
+        else:
+            usage = None  # tokens were spent (and recorded) by the leader
+    # The key holds the routed model; the fast model may have escalated to the fallback
+    decision['fallback_used'] = bool(served) and served != model
+    model = served or model
+    latency_ms = record_metrics('hit' if cached is not None else 'coalesced' if coalesced else 'miss', usage)
+    saved = save_to_history(
+        label or q, text, lang,
+        user=user,
+        model=model,
+        latency_ms=latency_ms,
+        prompt_tokens=getattr(usage, 'prompt_tokens', None),
+        completion_tokens=getattr(usage, 'completion_tokens', None)
+    )
+    return {
+        'language': lang,
+        'text': text,
+        'cached': cached is not None,
+        'coalesced': coalesced,
+        'model': model,
+        'route': {'score': decision['score'], 'reason': decision['reason'],
+                  'fallback_used': decision.get('fallback_used', False)},
+        'latency_ms': latency_ms,
+        'usage': usage,
+        'saved': saved,
+    }
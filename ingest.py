@@ -0,0 +1,634 @@
+import hashlib
+import io
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from sampling import POOL_ROWS, RESERVOIR_ROWS, finish_pools, fold_pools, new_pools
+from summarizer import CONTEXT_TOKENS, summarize
+
+# Streaming ingestion for uploaded datasets.
+# Files are parsed CHUNK_ROWS rows at a time straight from the upload buffer
+# (no second copy of the bytes). Row counts and per-column stats are folded in
+# chunk by chunk and only the preview/sample rows are kept, so peak memory is
+# roughly 2-3x one parsed chunk (the chunk, its null mask and the reduction
+# temporaries) regardless of how large the file is.
+#
+# Excel workbooks are read with the calamine engine when python-calamine is
+# installed (Rust; reads .xlsx/.xls/.ods several times faster than openpyxl),
+# and with openpyxl's read-only streaming mode otherwise. CODIFY_EXCEL_ENGINE
+# pins one ("calamine" or "openpyxl"). .xls needs calamine or xlrd.
+#
+# Large uploads are first read only as far as the preview and sample need
+# (QUICK_ROWS rows); the exact full-file profile is then computed in the
+# background by profile_async().
+CHUNK_ROWS = int(os.getenv("CODIFY_CHUNK_ROWS", 50_000))
+PREVIEW_ROWS = 10
+SAMPLE_ROWS = 50
+DISTINCT_CAP = 5000
+TOP_VALUES = 3
+CACHE_MAX_BYTES = int(os.getenv("CODIFY_DATASET_CACHE_MB", 256)) * 1024 * 1024
+EXCEL_ENGINE = os.getenv("CODIFY_EXCEL_ENGINE", "auto")
+QUICK_ROWS = int(os.getenv("CODIFY_QUICK_ROWS", 5000))
+QUICK_THRESHOLD_BYTES = int(os.getenv("CODIFY_QUICK_THRESHOLD_MB", 5)) * 1024 * 1024
+EXCEL_EXTENSIONS = ("xlsx", "xlsm", "xls", "ods")
+
+
+def _extension(name):
+    return name.rsplit('.', 1)[-1].lower()
+
+
+def _excel_engine(name):
+    if EXCEL_ENGINE != "auto":
+        return EXCEL_ENGINE
+    import importlib.util
+    if importlib.util.find_spec("python_calamine") is not None:
+        return "calamine"
+    return "openpyxl" if _extension(name) in ("xlsx", "xlsm") else "pandas"
+
+
+def _header(row):
+    # Column labels the way pandas.read_excel makes them: blanks become
+    # "Unnamed: <n>" and repeats "Name.1", "Name.2"..., skipping labels the
+    # header already has, so labels stay unique
+    names = [str(c) if c not in (None, "") else f"Unnamed: {i}" for i, c in enumerate(row)]
+    unnamed = [i for i, c in enumerate(row) if c in (None, "")]
+    existing, counts = set(names), {}
+    for i in [i for i in range(len(names)) if i not in unnamed] + unnamed:
+        base = name = names[i]
+        count = counts.get(name, 0)
+        while count:
+            counts[base] = count + 1
+            name = f"{base}.{count}"
+            count = count + 1 if name in existing else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+
+def _frames(rows, chunk_rows):
+    header = next(rows, None)
+    if header is None:
+        return
+    columns, batch = _header(header), []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == chunk_rows:
+            yield pd.DataFrame(batch, columns=columns).infer_objects()
+            batch = []
+    if batch:
+        yield pd.DataFrame(batch, columns=columns).infer_objects()
+
+
+def _iter_csv(buffer, chunk_rows, max_rows):
+    yield from pd.read_csv(buffer, chunksize=min(chunk_rows, max_rows or chunk_rows), nrows=max_rows)
+
+
+def _iter_jsonl(buffer, chunk_rows, max_rows):
+    yield from pd.read_json(buffer, lines=True, chunksize=min(chunk_rows, max_rows or chunk_rows), nrows=max_rows)
+
+
+def _iter_openpyxl(buffer, chunk_rows, sheet, max_rows):
+    # Read-only mode streams rows from the sheet XML instead of building every
+    # cell object (and style) up front, and stops reading after max_rows.
+    from openpyxl import load_workbook
+    workbook = load_workbook(buffer, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.worksheets[0]
+        yield from _frames(worksheet.iter_rows(values_only=True, max_row=max_rows + 1 if max_rows else None),
+                           chunk_rows)
+    finally:
+        workbook.close()
+
+
+def _iter_calamine(buffer, chunk_rows, sheet, max_rows):
+    from python_calamine import CalamineWorkbook
+    workbook = CalamineWorkbook.from_filelike(buffer)
+    worksheet = workbook.get_sheet_by_name(sheet or workbook.sheet_names[0])
+    yield from _frames(iter(worksheet.to_python(nrows=max_rows + 1 if max_rows else None)), chunk_rows)
+
+
+def _iter_pandas_excel(buffer, chunk_rows, sheet, max_rows):
+    # Fallback (.xls/.ods without calamine): pandas' default engine reads the
+    # whole sheet in one go.
+    frame = pd.read_excel(buffer, sheet_name=sheet or 0, nrows=max_rows)
+    for start in range(0, len(frame), chunk_rows):
+        yield frame.iloc[start:start + chunk_rows]
+
+
+def iter_chunks(buffer, name, chunk_rows=CHUNK_ROWS, sheet=None, max_rows=None):
+    buffer.seek(0)
+    if _extension(name) == 'csv':
+        return _iter_csv(buffer, chunk_rows, max_rows)
+    if _extension(name) in ('jsonl', 'ndjson'):
+        return _iter_jsonl(buffer, chunk_rows, max_rows)
+    engine = _excel_engine(name)
+    if engine == "calamine":
+        return _iter_calamine(buffer, chunk_rows, sheet, max_rows)
+    if engine == "openpyxl":
+        return _iter_openpyxl(buffer, chunk_rows, sheet, max_rows)
+    return _iter_pandas_excel(buffer, chunk_rows, sheet, max_rows)
+
+
+_DIMENSION_RE = re.compile(rb'<(?:\w+:)?dimension\s+ref="[A-Z]+\d+:[A-Z]+(\d+)"')
+_NS = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+       "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+       "rel": "http://schemas.openxmlformats.org/package/2006/relationships"}
+
+
+def _xlsx_sheets(buffer):
+    # Reads only xl/workbook.xml, its relationships and the first few KB of each
+    # sheet (where the <dimension> record lives). Opening the workbook with
+    # openpyxl, even read-only, would load the whole shared-strings table.
+    import posixpath
+    import zipfile
+    from xml.etree import ElementTree
+    with zipfile.ZipFile(buffer) as archive:
+        workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+        rels = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+        targets = {rel.get("Id"): rel.get("Target") for rel in rels.findall("rel:Relationship", _NS)}
+        sheets = []
+        for sheet in workbook.findall("m:sheets/m:sheet", _NS):
+            target = targets.get(sheet.get(f"{{{_NS['r']}}}id"), "")
+            path = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join("xl", target))
+            rows = None
+            try:
+                with archive.open(path) as f:
+                    match = _DIMENSION_RE.search(f.read(4096))
+                if match:
+                    rows = max(int(match.group(1)) - 1, 0)
+            except KeyError:
+                pass
+            sheets.append((sheet.get("name"), rows))
+    return sheets
+
+
+def sheet_names(buffer, name):
+    # [(sheet, approx_rows or None)] from workbook metadata only; no cell data
+    # is parsed. Returns [] for CSV.
+    ext = _extension(name)
+    if ext not in EXCEL_EXTENSIONS:
+        return []
+    buffer.seek(0)
+    if ext in ("xlsx", "xlsm"):
+        return _xlsx_sheets(buffer)
+    if _excel_engine(name) == "calamine":
+        from python_calamine import CalamineWorkbook
+        return [(sheet, None) for sheet in CalamineWorkbook.from_filelike(buffer).sheet_names]
+    return [(sheet, None) for sheet in pd.ExcelFile(buffer).sheet_names]
+
+
+def _new_stats():
+    return {'rows': 0, 'head': None, 'non_null': None, 'nulls': None,
+            'min': None, 'max': None, 'counts': {}, 'pools': new_pools()}
+
+
+def _fold(acc, chunk):
+    # Index rows by their position in the file so sampled rows keep it
+    chunk.index = pd.RangeIndex(acc['rows'], acc['rows'] + len(chunk))
+    acc['rows'] += len(chunk)
+    missing = chunk.isna()
+    if acc['head'] is None:
+        acc['head'] = chunk.head(SAMPLE_ROWS).copy()
+        acc['non_null'] = chunk.count()
+        acc['nulls'] = missing.sum()
+        acc['counts'] = {col: pd.Series(dtype="int64") for col in chunk.columns}
+    else:
+        acc['non_null'] = acc['non_null'].add(chunk.count(), fill_value=0)
+        acc['nulls'] = acc['nulls'].add(missing.sum(), fill_value=0)
+    fold_pools(acc['pools'], chunk, missing.sum(axis=1))
+    numeric = chunk.select_dtypes("number")
+    if not numeric.empty:
+        chunk_min, chunk_max = numeric.min(), numeric.max()
+        acc['min'] = chunk_min if acc['min'] is None else pd.concat([acc['min'], chunk_min], axis=1).min(axis=1)
+        acc['max'] = chunk_max if acc['max'] is None else pd.concat([acc['max'], chunk_max], axis=1).max(axis=1)
+    # Exact value counts per column until a column passes DISTINCT_CAP distinct
+    # values; after that it is reported as high-cardinality and no longer tracked.
+    counts = acc['counts']
+    for col, seen in counts.items():
+        if seen is None or col not in chunk:
+            continue
+        merged = seen.add(chunk[col].value_counts(), fill_value=0)
+        counts[col] = merged if len(merged) <= DISTINCT_CAP else None
+
+
+def _finish(acc, name):
+    head = acc['head']
+    if head is None:
+        head = pd.DataFrame()
+        acc['non_null'] = acc['nulls'] = pd.Series(dtype="int64")
+    stats = pd.DataFrame({
+        "dtype": head.dtypes.astype(str),
+        "non_null": acc['non_null'].astype("int64"),
+        "nulls": acc['nulls'].astype("int64"),
+        "distinct": pd.Series({col: (f"{DISTINCT_CAP}+" if seen is None else str(len(seen)))
+                               for col, seen in acc['counts'].items()}, dtype="object"),
+    })
+    if acc['min'] is not None:
+        stats["min"] = acc['min']
+        stats["max"] = acc['max']
+    top_values = {col: list(seen.nlargest(TOP_VALUES).items())
+                  for col, seen in acc['counts'].items() if seen is not None and len(seen)}
+    return {
+        'name': name,
+        'rows': acc['rows'],
+        'columns': head.columns.tolist(),
+        'preview': head.head(PREVIEW_ROWS),
+        'sample': head,
+        'stats': stats,
+        'top_values': top_values,
+        'pools': finish_pools(acc['pools']),
+    }
+
+
+# --- Columnar formats (Parquet, Feather/Arrow IPC) ---
+# Parquet footers already hold the row count, schema and per-row-group
+# null counts and min/max, so profiling reads the footer plus one small batch
+# for the preview, whatever the file size. Arrow IPC has no statistics but is
+# read without copying: straight from the upload's memory, or memory-mapped
+# when it's a file on disk. Stats are then computed by Arrow's vectorized
+# kernels.
+COLUMNAR_EXTENSIONS = ("parquet", "pq", "feather", "arrow", "arrows", "ipc")
+RANDOM_GROUPS = 4
+POOL_COLUMNS = 100
+DECODE_ROWS = 65536
+
+
+def _arrow_source(buffer):
+    import pyarrow as pa
+    if hasattr(buffer, "getbuffer"):
+        return pa.BufferReader(pa.py_buffer(buffer.getbuffer()))
+    path = getattr(buffer, "name", None)
+    if isinstance(path, str) and os.path.isfile(path):
+        return pa.memory_map(path)
+    buffer.seek(0)
+    return pa.BufferReader(buffer.read())
+
+
+def _is_numeric(arrow_type):
+    import pyarrow as pa
+    return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+
+
+def _columnar_dataset(name, rows, sample, entries, top_values, pools):
+    stats = pd.DataFrame({
+        "dtype": sample.dtypes.astype(str),
+        "non_null": pd.Series({col: e['non_null'] for col, e in entries.items()}, dtype="int64"),
+        "nulls": pd.Series({col: e['nulls'] for col, e in entries.items()}, dtype="int64"),
+        "distinct": pd.Series({col: e['distinct'] for col, e in entries.items()}, dtype="object"),
+    })
+    if any('min' in e for e in entries.values()):
+        stats["min"] = pd.Series({col: e.get('min') for col, e in entries.items()}, dtype="float64")
+        stats["max"] = pd.Series({col: e.get('max') for col, e in entries.items()}, dtype="float64")
+    return {
+        'name': name,
+        'rows': rows,
+        'columns': sample.columns.tolist(),
+        'preview': sample.head(PREVIEW_ROWS),
+        'sample': sample,
+        'stats': stats,
+        'top_values': top_values,
+        'pools': pools,
+    }
+
+
+def _frame(table, index):
+    frame = table.to_pandas()
+    frame.index = index
+    return frame
+
+
+def _parquet_pool_loader(parquet, columns):
+    # Sampling pools are only needed for non-head strategies, so they are read
+    # on first request rather than at ingest. The tail is sliced from the last
+    # row group; random rows are runs of consecutive rows at random positions
+    # in up to RANDOM_GROUPS random row groups (a cluster sample: uniform rows
+    # would mean decoding every group). Groups are decoded DECODE_ROWS at a
+    # time and only up to the batch holding the run. Only the first
+    # POOL_COLUMNS columns are read.
+    metadata = parquet.metadata
+    sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    offsets = np.cumsum([0] + sizes)
+    filled = [group for group, size in enumerate(sizes) if size]
+    names = columns[:POOL_COLUMNS]
+
+    def frame(table, start):
+        return _frame(table, pd.RangeIndex(start, start + table.num_rows)).reindex(columns=columns)
+
+    def tail():
+        group = filled[-1]
+        last = parquet.read_row_group(group, columns=names)
+        start = max(last.num_rows - POOL_ROWS, 0)
+        return frame(last.slice(start), offsets[group] + start)
+
+    def random():
+        rng = np.random.default_rng()
+        groups = rng.choice(filled, min(RANDOM_GROUPS, len(filled)), replace=False)
+        run = -(-RESERVOIR_ROWS // len(groups))
+        frames = []
+        for group in map(int, groups):
+            stop = rng.integers(-(-sizes[group] // DECODE_ROWS))
+            for i, batch in enumerate(parquet.iter_batches(batch_size=DECODE_ROWS, row_groups=[group], columns=names)):
+                if i == stop:
+                    break
+            start = int(rng.integers(max(batch.num_rows - run, 0) + 1))
+            frames.append(frame(batch.slice(start, run), offsets[group] + i * DECODE_ROWS + start))
+        rows = pd.concat(frames)
+        return rows.iloc[rng.permutation(len(rows))]
+
+    builders, pools, lock = {'tail': tail, 'random': random}, {}, threading.Lock()
+
+    def load(wanted):
+        with lock:
+            for name in wanted:
+                if name not in pools and name in builders:
+                    pools[name] = builders[name]()
+            return {name: pools[name] for name in wanted if name in pools}
+    return load
+
+
+def _parquet_entries(parquet):
+    # Column stats from the footer, or None when the writer left any out (or
+    # the schema is nested) and the file has to be scanned instead.
+    metadata, schema = parquet.metadata, parquet.schema_arrow
+    if metadata.num_columns != len(schema):
+        return None
+    entries = {}
+    for i, field in enumerate(schema):
+        nulls, low, high = 0, None, None
+        for group in range(metadata.num_row_groups):
+            column = metadata.row_group(group).column(i)
+            stats = column.statistics
+            if stats is None or not stats.has_null_count:
+                return None
+            nulls += stats.null_count
+            if _is_numeric(field.type) and column.num_values > stats.null_count:
+                if not stats.has_min_max:
+                    return None
+                low = stats.min if low is None else min(low, stats.min)
+                high = stats.max if high is None else max(high, stats.max)
+        entries[field.name] = {'nulls': nulls, 'non_null': metadata.num_rows - nulls}
+        if _is_numeric(field.type):
+            entries[field.name].update(min=low, max=high)
+    return entries
+
+
+def _ingest_parquet(buffer, name, chunk_rows):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    source = _arrow_source(buffer)
+    parquet = pq.ParquetFile(source)
+    entries = _parquet_entries(parquet)
+    if entries is None:
+        acc = _new_stats()
+        for batch in parquet.iter_batches(batch_size=chunk_rows):
+            _fold(acc, batch.to_pandas())
+        return _finish(acc, name)
+    first = next(parquet.iter_batches(batch_size=SAMPLE_ROWS), None)
+    sample = first.to_pandas() if first is not None else parquet.schema_arrow.empty_table().to_pandas()
+    rows = parquet.metadata.num_rows
+    for col, entry in entries.items():
+        # Footers carry no distinct counts; the sample gives a lower bound
+        seen = sample[col].nunique() if len(sample) else 0
+        entry['distinct'] = str(seen) if len(sample) == rows else f"≥{seen}"
+    dataset = _columnar_dataset(name, rows, sample, entries, {}, {})
+    if rows > len(sample):
+        dataset['load_pools'] = _parquet_pool_loader(parquet, sample.columns.tolist())
+        # The loader keeps the file open; count it against the cache unless it is memory-mapped
+        dataset['source_bytes'] = 0 if isinstance(source, pa.MemoryMappedFile) else source.size()
+    return dataset
+
+
+def _read_ipc(buffer):
+    import pyarrow as pa
+    from pyarrow import feather
+    source = _arrow_source(buffer)
+    try:
+        return feather.read_table(source)
+    except pa.ArrowInvalid:
+        # Arrow IPC *stream* format (.arrows)
+        source.seek(0)
+        return pa.ipc.open_stream(source).read_all()
+
+
+def _ingest_ipc(buffer, name):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    table = _read_ipc(buffer)
+    entries, top_values = {}, {}
+    for field, column in zip(table.schema, table.columns):
+        entry = entries[field.name] = {'nulls': column.null_count, 'non_null': len(column) - column.null_count}
+        if _is_numeric(field.type) and entry['non_null']:
+            low_high = pc.min_max(column)
+            entry.update(min=low_high['min'].as_py(), max=low_high['max'].as_py())
+        if pa.types.is_nested(field.type):
+            entry['distinct'] = "?"
+            continue
+        # A prefix probe spots high-cardinality columns (ids, measurements)
+        # without hashing every value
+        if len(pc.value_counts(column.slice(0, DISTINCT_CAP * 4))) > DISTINCT_CAP:
+            entry['distinct'] = f"{DISTINCT_CAP}+"
+            continue
+        counts = pc.value_counts(column)
+        counts = counts.filter(pc.is_valid(counts.field("values")))
+        if len(counts) > DISTINCT_CAP:
+            entry['distinct'] = f"{DISTINCT_CAP}+"
+            continue
+        entry['distinct'] = str(len(counts))
+        top = counts.take(pc.array_sort_indices(counts.field("counts"), order="descending")[:TOP_VALUES])
+        top_values[field.name] = list(zip(top.field("values").to_pylist(), top.field("counts").to_pylist()))
+    sample = table.slice(0, SAMPLE_ROWS).to_pandas()
+    rows, pools = table.num_rows, {}
+    if rows > len(sample):
+        # Random access into the in-memory table is cheap, so these pools are exact
+        rng = np.random.default_rng()
+        start = max(rows - POOL_ROWS, 0)
+        picks = rng.choice(rows, min(RESERVOIR_ROWS, rows), replace=False)
+        extremes = [pc.index(table[col], value).as_py() for col, e in entries.items()
+                    for value in (e.get('min'), e.get('max')) if value is not None]
+        extremes = np.array(list(dict.fromkeys(extremes)), dtype="int64")
+        pools = {'tail': _frame(table.slice(start), pd.RangeIndex(start, rows)),
+                 'random': _frame(table.take(picks), picks),
+                 'extremes': _frame(table.take(extremes), extremes)}
+    return _columnar_dataset(name, rows, sample, entries, top_values, pools)
+
+
+def ingest(buffer, name, chunk_rows=CHUNK_ROWS, sheet=None, max_rows=None):
+    # With max_rows only the first rows are read; the result is marked partial
+    # and its row count and stats cover just those rows. Columnar files are
+    # always profiled in full (it's cheap) and ignore max_rows.
+    started = time.perf_counter()
+    ext = _extension(name)
+    if ext in ("parquet", "pq"):
+        dataset, partial = _ingest_parquet(buffer, name, chunk_rows), False
+    elif ext in COLUMNAR_EXTENSIONS:
+        dataset, partial = _ingest_ipc(buffer, name), False
+    else:
+        acc = _new_stats()
+        for chunk in iter_chunks(buffer, name, chunk_rows, sheet, max_rows):
+            _fold(acc, chunk)
+        dataset = _finish(acc, name)
+        partial = bool(max_rows) and acc['rows'] >= max_rows
+    dataset['sheet'] = sheet
+    dataset['partial'] = partial
+    dataset['parse_ms'] = (time.perf_counter() - started) * 1000
+    return dataset
+
+
+def read_frame(buffer, name, sheet=None, max_rows=None):
+    # The whole file (or its first max_rows rows) as one DataFrame, for running
+    # generated code against it. Unlike ingest() this keeps every row in memory.
+    ext = _extension(name)
+    if ext in ("parquet", "pq"):
+        import pyarrow.parquet as pq
+        table = pq.read_table(_arrow_source(buffer))
+    elif ext in COLUMNAR_EXTENSIONS:
+        table = _read_ipc(buffer)
+    else:
+        chunks = list(iter_chunks(buffer, name, sheet=sheet, max_rows=max_rows))
+        return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+    if max_rows:
+        table = table.slice(0, max_rows)
+    return table.to_pandas()
+
+
+def prompt_context(dataset, budget=None, strategy="head", column=None):
+    # Summaries are memoized per budget and sampling strategy on the (cached) dataset itself.
+    budget = budget or CONTEXT_TOKENS
+    contexts = dataset.setdefault('contexts', {})
+    key = (budget, strategy, column if strategy == "stratified" else None)
+    if key not in contexts:
+        contexts[key] = summarize(dataset, budget, strategy, key[2])
+    return contexts[key]
+
+
+# --- Parsed dataset cache ---
+# Streamlit reruns the whole script on every widget interaction. Parsed datasets
+# (preview, sample, stats and prompt context) are kept in a process-wide LRU
+# keyed by a hash of the upload bytes, so a rerun with the same file attached
+# skips parsing entirely. Total size is capped at CACHE_MAX_BYTES.
+_cache = OrderedDict()
+_cache_bytes = 0
+_cache_lock = threading.Lock()
+
+
+def content_hash(buffer):
+    digest = hashlib.blake2b(digest_size=20)
+    if hasattr(buffer, "getbuffer"):
+        digest.update(buffer.getbuffer())
+    else:
+        buffer.seek(0)
+        for block in iter(lambda: buffer.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _footprint(dataset):
+    frames = (dataset['preview'], dataset['sample'], dataset['stats'], *dataset.get('pools', {}).values())
+    return sum(int(f.memory_usage(deep=True).sum()) for f in frames) + dataset.get('source_bytes', 0)
+
+
+def cached_ingest(buffer, name, key=None, sheet=None, max_rows=None):
+    global _cache_bytes
+    # The file name is part of the key: it picks the parser and appears in the context.
+    key = (key or content_hash(buffer), name, sheet, max_rows)
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    dataset = ingest(buffer, name, sheet=sheet, max_rows=max_rows)
+    prompt_context(dataset)
+    size = _footprint(dataset)
+    with _cache_lock:
+        if key not in _cache and size <= CACHE_MAX_BYTES:
+            _cache[key] = dict(dataset, size=size)
+            _cache_bytes += size
+            while _cache_bytes > CACHE_MAX_BYTES:
+                _, evicted = _cache.popitem(last=False)
+                _cache_bytes -= evicted['size']
+    return dataset
+
+
+# --- Background full profiles ---
+# For large uploads the UI shows a quick profile of the first QUICK_ROWS rows
+# right away and swaps in the full one when this finishes. One job per file and
+# sheet; finished jobs are kept (most recent PROFILE_JOBS) so a rerun picks up
+# the result, or the failure, instead of starting over.
+PROFILE_JOBS = 16
+_profiler = None
+_profiles = OrderedDict()
+_profiles_lock = threading.Lock()
+
+
+class _MemoryReader(io.RawIOBase):
+    # A read-only file over an upload's memory with a position of its own, so a
+    # background job can read the upload while the caller keeps using it,
+    # without a second copy of the bytes.
+    def __init__(self, data):
+        self._view = memoryview(data).cast("B")
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        n = max(min(len(b), len(self._view) - self._pos), 0)
+        b[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}[whence]
+        self._pos = max(base + offset, 0)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def getbuffer(self):
+        return self._view
+
+
+def profile_async(buffer, name, key, sheet=None):
+    # The job reads `buffer`'s memory through its own reader: it must not share
+    # a file position with the caller.
+    global _profiler
+    with _profiles_lock:
+        future = _profiles.get((key, name, sheet))
+        if future is None:
+            if _profiler is None:
+                from concurrent.futures import ThreadPoolExecutor
+                _profiler = ThreadPoolExecutor(max_workers=2, thread_name_prefix="profile")
+            future = _profiler.submit(cached_ingest, _MemoryReader(buffer.getbuffer()), name, key, sheet)
+            _profiles[key, name, sheet] = future
+            for old_key, old in list(_profiles.items())[:-PROFILE_JOBS]:
+                if old.done():
+                    del _profiles[old_key]
+        return future
+
+
+def load(buffer, name, key=None, sheet=None, size=None):
+    # Returns (dataset, pending). Small files are parsed fully right away.
+    # Large ones return the full profile if it is ready, otherwise the quick
+    # profile plus the pending future of the full one.
+    key = key or content_hash(buffer)
+    size = size if size is not None else len(buffer.getbuffer())
+    if size <= QUICK_THRESHOLD_BYTES or _extension(name) in COLUMNAR_EXTENSIONS:
+        return cached_ingest(buffer, name, key, sheet), None
+    quick = cached_ingest(buffer, name, key, sheet, max_rows=QUICK_ROWS)
+    if not quick['partial']:
+        return quick, None
+    future = profile_async(buffer, name, key, sheet)
+    if not future.done():
+        return quick, future
+    # A failed full pass leaves the quick profile in place
+    return (quick if future.exception() else future.result()), None
@@ -0,0 +1,232 @@
+import argparse
+import json
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Concurrent-session load generator for app.py.
+# Every simulated user is a Streamlit AppTest session running in its own thread
+# inside this one process, so they share everything a real server process
+# shares: the Groq client, the scheduler, the SQLite pool and writer thread,
+# and the response/dataset caches. Completions come from mock_groq.py.
+#
+# Each session walks the real UI flow, timing every step:
+#   login      - first render of the login page
+#   boot       - sign in, boot sequence and first render of the generator
+#   upload     - attach a CSV and render the preview
+#   synthesize - type a (unique) prompt and click Synthesize
+#   rerun      - an idle rerun of the generator page
+# For each concurrency level the report has per-step latency percentiles,
+# error rate, rendered payload size, process CPU and RSS. That is the scaling
+# curve for one deployment size; tag runs with --label and append them to the
+# same --report file to compare deployments.
+#
+#   python loadtest.py --levels 1,2,4,8,16 --label "1 vCPU / 1 GB" --report SCALING.md
+#
+# What AppTest does not cover: websocket framing and browser rendering. The
+# "payload" column is the serialized size of the elements each step renders,
+# which is what the server has to push over the websocket.
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+LEVELS = [1, 2, 4, 8, 16]
+STEPS = ["login", "boot", "upload", "synthesize", "rerun"]
+MOCK = {"latency": 0.3, "tokens_per_sec": 500, "tokens": 120}
+
+
+def _rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # No procfs (macOS): peak RSS is the best available figure
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def _cpu_seconds():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _payload_bytes(node):
+    proto = getattr(node, "proto", None)
+    total = proto.ByteSize() if proto is not None and hasattr(proto, "ByteSize") else 0
+    return total + sum(_payload_bytes(child) for child in getattr(node, "children", {}).values())
+
+
+def _percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)] if ordered else None
+
+
+def make_csv(rows):
+    lines = ["id,region,amount,quantity,date"]
+    regions = ["north", "south", "east", "west"]
+    for i in range(rows):
+        lines.append(f"{i},{regions[i % 4]},{(i * 37) % 1000 / 10},{i % 50},2024-01-{i % 28 + 1:02d}")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class Session:
+    def __init__(self, index, csv_bytes, timeout):
+        from streamlit.testing.v1 import AppTest
+        self.index = index
+        self.csv_bytes = csv_bytes
+        self.at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.samples = []  # (step, seconds, payload_bytes, error)
+
+    def _step(self, name, action):
+        started = time.perf_counter()
+        error = None
+        try:
+            action()
+            if self.at.exception:
+                error = self.at.exception[0].message
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        self.samples.append((name, time.perf_counter() - started, _payload_bytes(self.at._tree), error))
+        return error is None
+
+    def _button(self, label):
+        return next(b for b in self.at.button if label in b.label)
+
+    def run(self, iterations):
+        at = self.at
+        if not self._step("login", at.run):
+            return self.samples
+
+        def sign_in():
+            at.text_input[0].input(f"load{self.index}")
+            self._button("Sign In").click().run()
+        if not self._step("boot", sign_in):
+            return self.samples
+
+        def upload():
+            at.file_uploader[0].set_value((f"load{self.index}.csv", self.csv_bytes, "text/csv")).run()
+        self._step("upload", upload)
+
+        for i in range(iterations):
+            def synthesize():
+                at.text_area[0].input(f"session {self.index} iteration {i}: total amount by region")
+                self._button("Synthesize").click().run()
+            self._step("synthesize", synthesize)
+            self._step("rerun", at.run)
+        return self.samples
+
+
+def run_level(sessions, iterations, csv_bytes, timeout):
+    peak_rss = _rss_bytes()
+    done = threading.Event()
+
+    def sample_rss():
+        nonlocal peak_rss
+        while not done.wait(0.1):
+            peak_rss = max(peak_rss, _rss_bytes())
+    sampler = threading.Thread(target=sample_rss, daemon=True)
+    sampler.start()
+
+    cpu_started, started = _cpu_seconds(), time.perf_counter()
+    with ThreadPoolExecutor(sessions) as pool:
+        results = list(pool.map(lambda i: Session(i, csv_bytes, timeout).run(iterations), range(sessions)))
+    wall = time.perf_counter() - started
+    cpu = _cpu_seconds() - cpu_started
+    done.set()
+    sampler.join()
+
+    samples = [s for session in results for s in session]
+    steps = {}
+    for step in STEPS:
+        rows = [s for s in samples if s[0] == step]
+        if not rows:
+            continue
+        ok = [seconds for _, seconds, _, error in rows if error is None]
+        steps[step] = {
+            "count": len(rows),
+            "errors": len(rows) - len(ok),
+            "error_rate": round((len(rows) - len(ok)) / len(rows), 4),
+            "p50_ms": round(_percentile(ok, 0.5) * 1000, 1) if ok else None,
+            "p95_ms": round(_percentile(ok, 0.95) * 1000, 1) if ok else None,
+            "p99_ms": round(_percentile(ok, 0.99) * 1000, 1) if ok else None,
+            "payload_kb": round(statistics.mean(s[2] for s in rows) / 1024, 1),
+            "sample_errors": sorted({error for *_, error in rows if error})[:3],
+        }
+    return {
+        "sessions": sessions,
+        "wall_s": round(wall, 2),
+        "cpu_percent": round(cpu / wall * 100, 1),
+        "peak_rss_mb": round(peak_rss / 2 ** 20, 1),
+        "synthesize_per_s": round(steps.get("synthesize", {}).get("count", 0) / wall, 2),
+        "steps": steps,
+    }
+
+
+def markdown(report):
+    meta = report["meta"]
+    lines = [
+        f"### {meta['label']}",
+        "",
+        f"{meta['cpus']} CPUs · max in flight {meta['max_in_flight']} · DB pool {meta['db_pool_size']} · "
+        f"mock TTFT {MOCK['latency']}s at {MOCK['tokens_per_sec']} tok/s · {meta['iterations']} syntheses per session",
+        "",
+        "| sessions | step | p50 ms | p95 ms | p99 ms | errors | payload KB | CPU % | peak RSS MB | synth/s |",
+        "|---:|---|---:|---:|---:|---:|---:|---:|---:|---:|",
+    ]
+    for level in report["levels"]:
+        for step, s in level["steps"].items():
+            lines.append(
+                f"| {level['sessions']} | {step} | {s['p50_ms']} | {s['p95_ms']} | {s['p99_ms']} | "
+                f"{s['error_rate']:.1%} | {s['payload_kb']} | {level['cpu_percent']} | "
+                f"{level['peak_rss_mb']} | {level['synthesize_per_s']} |"
+            )
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for app.py")
+    parser.add_argument("--levels", default=",".join(map(str, LEVELS)), help="comma-separated session counts")
+    parser.add_argument("--iterations", type=int, default=3, help="syntheses per session")
+    parser.add_argument("--rows", type=int, default=5000, help="rows in the uploaded CSV")
+    parser.add_argument("--timeout", type=float, default=120, help="per-step script timeout (s)")
+    parser.add_argument("--label", default="local", help="deployment size label for the report")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--report", help="append a markdown scaling table to this file")
+    args = parser.parse_args()
+
+    # The app reads these at import/first use, so set them before the first session
+    workdir = tempfile.mkdtemp(prefix="codify-load-")
+    os.environ["CODIFY_DB_PATH"] = os.path.join(workdir, "load.db")
+    import mock_groq
+    server = mock_groq.serve(**MOCK)
+    os.environ["GROQ_BASE_URL"] = server.url
+    os.environ.setdefault("GROQ_API_KEY", "offline-load-test")
+    from db import POOL_SIZE
+    from scheduler import MAX_IN_FLIGHT
+
+    csv_bytes = make_csv(args.rows)
+    report = {
+        "meta": {"label": args.label, "cpus": os.cpu_count(), "iterations": args.iterations,
+                 "rows": args.rows, "max_in_flight": MAX_IN_FLIGHT, "db_pool_size": POOL_SIZE, "mock": MOCK},
+        "levels": [],
+    }
+    for sessions in (int(n) for n in args.levels.split(",")):
+        level = run_level(sessions, args.iterations, csv_bytes, args.timeout)
+        report["levels"].append(level)
+        synth = level["steps"].get("synthesize", {})
+        print(f"[load] {sessions:>3} sessions: synthesize p95 {synth.get('p95_ms')} ms, "
+              f"errors {synth.get('error_rate', 0):.1%}, CPU {level['cpu_percent']}%, "
+              f"RSS {level['peak_rss_mb']} MB", file=sys.stderr)
+    server.shutdown()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.report:
+        with open(args.report, "a", encoding="utf-8") as f:
+            f.write(markdown(report) + "\n")
@@ -0,0 +1,22 @@
+import time
+
+from db import execute_async, query
+
+# Per-request performance metrics.
+# One row per synthesis (including failures), written through the write-behind
+# queue so recording costs the request path only an enqueue.
+FIELDS = ("user", "language", "model", "prompt_chars", "dataset_bytes", "parse_ms", "queue_ms",
+          "ttft_ms", "latency_ms", "prompt_tokens", "completion_tokens", "cache_status", "error")
+_INSERT = (f"INSERT INTO metrics (created_at, {', '.join(FIELDS)}) "
+           f"VALUES ({', '.join('?' * (len(FIELDS) + 1))})")
+
+
+def record(**fields):
+    execute_async(_INSERT, (time.time(), *(fields.get(name) for name in FIELDS)))
+
+
+def since(start):
+    # Rows newer than `start` (a unix timestamp), oldest first, as dicts
+    columns = ("created_at",) + FIELDS
+    rows = query(f"SELECT {', '.join(columns)} FROM metrics WHERE created_at >= ? ORDER BY created_at", (start,))
+    return [dict(zip(columns, row)) for row in rows]
@@ -0,0 +1,146 @@
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local stand-in for the Groq chat-completions API, for benchmarks and offline
+# development. Point the app at it with GROQ_BASE_URL=http://127.0.0.1:<port>.
+# Responses are canned code; latency is shaped by two knobs:
+#   - latency: seconds before the first token (or before the whole response
+#     when not streaming)
+#   - tokens_per_sec: decode rate once tokens start flowing
+# Rate-limit headers are sent on every response so the scheduler sees the same
+# shape of traffic as in production. Models listed in SPEEDUP answer that many
+# times faster (both knobs), roughly like Groq's small models against the 70b.
+DEFAULT_LATENCY = 0.2
+DEFAULT_TOKENS_PER_SEC = 500
+DEFAULT_TOKENS = 120
+SPEEDUP = {"llama-3.1-8b-instant": 3.0}
+
+_CODE = [
+    "```python\n", "import", " pandas", " as", " pd", "\n\n", "df", " =", " pd", ".read", "_csv",
+    "(\"", "data", ".csv", "\")", "\n", "df", " =", " df", ".drop", "_duplicates", "()", "\n",
+    "print", "(df", ".head", "())", "\n",
+]
+
+
+class MockGroq(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency=DEFAULT_LATENCY, tokens_per_sec=DEFAULT_TOKENS_PER_SEC,
+                 tokens=DEFAULT_TOKENS):
+        super().__init__(address, _Handler)
+        self.latency = latency
+        self.tokens_per_sec = tokens_per_sec
+        self.tokens = tokens
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self):
+        with self._lock:
+            self.requests += 1
+
+    def completion_tokens(self):
+        body = [_CODE[i % len(_CODE)] for i in range(max(self.tokens - 1, 0))]
+        return body + ["```"]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _headers(self, status, content_type, length=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("x-ratelimit-remaining-requests", "14399")
+        self.send_header("x-ratelimit-reset-requests", "6s")
+        self.send_header("x-ratelimit-remaining-tokens", "5999")
+        self.send_header("x-ratelimit-reset-tokens", "10ms")
+        if length is not None:
+            self.send_header("Content-Length", str(length))
+        self.end_headers()
+
+    def _json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self._headers(status, "application/json", len(data))
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/openai/v1/models":
+            return self._json(200, {"object": "list", "data": [
+                {"id": model, "object": "model", "created": 0, "owned_by": "mock"}
+                for model in ("llama-3.3-70b-versatile", *SPEEDUP)]})
+        self._json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path.rstrip("/") != "/openai/v1/chat/completions":
+            return self._json(404, {"error": {"message": "not found"}})
+        request = json.loads(body or b"{}")
+        server = self.server
+        server.count()
+        prompt_tokens = sum(len(m.get("content", "")) for m in request.get("messages", [])) // 4
+        tokens = server.completion_tokens()
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": len(tokens),
+                 "total_tokens": prompt_tokens + len(tokens)}
+        base = {"id": f"chatcmpl-{uuid.uuid4().hex}", "created": int(time.time()),
+                "model": request.get("model", "mock")}
+        speedup = SPEEDUP.get(request.get("model"), 1.0)
+        tokens_per_sec = server.tokens_per_sec * speedup
+        time.sleep(server.latency / speedup)
+        if not request.get("stream"):
+            time.sleep(len(tokens) / tokens_per_sec)
+            return self._json(200, {**base, "object": "chat.completion", "usage": usage, "choices": [
+                {"index": 0, "finish_reason": "stop",
+                 "message": {"role": "assistant", "content": "".join(tokens)}}]})
+
+        self._headers(200, "text/event-stream")
+        self.close_connection = True
+        interval = 1 / tokens_per_sec
+        next_at = time.perf_counter()
+        for token in tokens:
+            self._event({**base, "object": "chat.completion.chunk", "choices": [
+                {"index": 0, "delta": {"content": token}, "finish_reason": None}]})
+            next_at += interval
+            time.sleep(max(next_at - time.perf_counter(), 0))
+        # Groq reports usage on the final chunk
+        self._event({**base, "object": "chat.completion.chunk", "x_groq": {"usage": usage}, "choices": [
+            {"index": 0, "delta": {}, "finish_reason": "stop"}]})
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _event(self, payload):
+        self.wfile.write(b"data: " + json.dumps(payload).encode("utf-8") + b"\n\n")
+        self.wfile.flush()
+
+
+def serve(port=0, **options):
+    # Starts the server on a daemon thread; returns it (see .url and .shutdown())
+    server = MockGroq(("127.0.0.1", port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local mock of the Groq chat-completions API")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY, help="seconds to first token")
+    parser.add_argument("--tokens-per-sec", type=float, default=DEFAULT_TOKENS_PER_SEC)
+    parser.add_argument("--tokens", type=int, default=DEFAULT_TOKENS, help="completion length")
+    args = parser.parse_args()
+    server = MockGroq(("127.0.0.1", args.port), latency=args.latency,
+                      tokens_per_sec=args.tokens_per_sec, tokens=args.tokens)
+    print(f"Mock Groq listening on {server.url} (GROQ_BASE_URL={server.url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,27 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from db import recent_history
+from inference import warm_up
+
+# Background work kicked off during the login boot sequence.
+log = logging.getLogger(__name__)
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="codify-prewarm")
+
+
+def _warm_network():
+    try:
+        warm_up()
+    except Exception:
+        # Not fatal: the first Synthesize just pays the connection setup itself.
+        log.warning("Groq connection warm-up failed", exc_info=True)
+
+
+def start(user=None):
+    # Returns a future for the user's recent history, which also opens the DB pool
+    # (and runs any pending migrations). The network warm-up and the similar-prompt
+    # index load run alongside it.
+    _executor.submit(_warm_network)
+    from similar import index
+    index.start()
+    return _executor.submit(recent_history, 3, user)
@@ -0,0 +1,74 @@
+import hashlib
+import os
+import re
+import time
+
+from db import connection, execute_async, query, transaction
+
+# Completed-response cache stored next to the `history` table in codify_pro.db
+# (tables created by db.py's migrations).
+# Entries expire after CACHE_TTL seconds; once the table grows past
+# CACHE_MAX_ENTRIES rows or CACHE_MAX_BYTES of response text, the least recently
+# used entries are evicted first.
+CACHE_TTL = int(os.getenv("CODIFY_CACHE_TTL", 24 * 3600))
+CACHE_MAX_ENTRIES = int(os.getenv("CODIFY_CACHE_MAX_ENTRIES", 1000))
+CACHE_MAX_BYTES = int(os.getenv("CODIFY_CACHE_MAX_BYTES", 50 * 1024 * 1024))
+
+
+def normalize_prompt(prompt):
+    return re.sub(r"\s+", " ", prompt).strip()
+
+
+def cache_key(prompt, language, dataset_context, model):
+    dataset_fingerprint = hashlib.sha256(dataset_context.encode("utf-8")).hexdigest()
+    raw = "\x1f".join([normalize_prompt(prompt), language, dataset_fingerprint, model])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+_BUMP = "INSERT INTO cache_stats (name, value) VALUES (?, 1) ON CONFLICT(name) DO UPDATE SET value = value + 1"
+
+
+def get_cached(key):
+    # A read only: the access time and the hit/miss counters go through the
+    # write-behind queue, off the request's critical path
+    now = time.time()
+    rows = query("SELECT response, model FROM response_cache WHERE key = ? AND created_at > ?", (key, now - CACHE_TTL))
+    if rows:
+        execute_async("UPDATE response_cache SET last_access = ?, hits = hits + 1 WHERE key = ?", (now, key))
+    execute_async(_BUMP, ('hits' if rows else 'misses',))
+    # (response, model that generated it) or None
+    return tuple(rows[0]) if rows else None
+
+
+def put_cached(key, response, model):
+    now = time.time()
+    with transaction() as c:
+        c.execute("INSERT OR REPLACE INTO response_cache (key, response, model, created_at, last_access, size, hits) "
+                  "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                  (key, response, model, now, now, len(response.encode("utf-8"))))
+        _evict(c, now)
+
+
+def _evict(c, now):
+    c.execute("DELETE FROM response_cache WHERE created_at <= ?", (now - CACHE_TTL,))
+    # LRU by entry count
+    c.execute("DELETE FROM response_cache WHERE key IN ("
+              "SELECT key FROM response_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+              (CACHE_MAX_ENTRIES,))
+    # LRU by total response size
+    c.execute("DELETE FROM response_cache WHERE key IN ("
+              "SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY last_access DESC) AS running "
+              "FROM response_cache) WHERE running > ?)",
+              (CACHE_MAX_BYTES,))
+
+
+def cache_stats():
+    with connection() as conn:
+        counters = dict(conn.execute("SELECT name, value FROM cache_stats").fetchall())
+        entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM response_cache").fetchone()
+    return {
+        'hits': counters.get('hits', 0),
+        'misses': counters.get('misses', 0),
+        'entries': entries,
+        'bytes': size,
+    }
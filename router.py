@@ -0,0 +1,84 @@
+import math
+import os
+import re
+
+# Model routing: every request goes to the small, fast model unless it looks
+# hard enough to need the large one. The complexity score (0..1) adds up:
+#   language   Python code is harder than a single formula
+#   length     words in the prompt
+#   steps      sequencing words, list items, several clauses
+#   terms      vocabulary that usually means non-trivial logic (joins, regex,
+#              forecasting, array formulas...)
+#   dataset    size of the dataset summary and of the file itself
+# At or above ROUTE_THRESHOLD the large model is used. A prompt-less dataset
+# analysis is open-ended and always goes to the large model.
+#
+# Overrides, strongest first: an explicit model from the caller (UI selector,
+# API `model` field, batch manifest column), then CODIFY_MODEL for every request.
+# When the fast model was picked by the router and fails before producing any
+# output (including hitting its timeout), the request is retried on the large
+# model. Timeouts are per model: CODIFY_MODEL_TIMEOUTS="model=seconds,...".
+FAST_MODEL = os.getenv("CODIFY_FAST_MODEL", "llama-3.1-8b-instant")
+LARGE_MODEL = os.getenv("CODIFY_LARGE_MODEL", "llama-3.3-70b-versatile")
+MODELS = list(dict.fromkeys([FAST_MODEL, LARGE_MODEL]))
+MODEL_OVERRIDE = os.getenv("CODIFY_MODEL") or None
+ROUTE_THRESHOLD = float(os.getenv("CODIFY_ROUTE_THRESHOLD", 0.35))
+DEFAULT_TIMEOUT = 60.0
+MODEL_TIMEOUTS = {FAST_MODEL: 20.0, LARGE_MODEL: 60.0}
+for _item in filter(None, os.getenv("CODIFY_MODEL_TIMEOUTS", "").split(",")):
+    _name, _, _seconds = _item.partition("=")
+    MODEL_TIMEOUTS[_name.strip()] = float(_seconds)
+
+WEIGHTS = {'language': 0.15, 'length': 0.2, 'steps': 0.2, 'terms': 0.35, 'dataset': 0.2}
+LONG_PROMPT_WORDS = 60
+HARD_TERMS = re.compile(
+    r"\b(regex|regular expressions?|merge|join|pivot|unpivot|melt|reshape|transpose|group ?by|rolling|window|"
+    r"cumulative|forecast\w*|predict\w*|regression|cluster\w*|classif\w*|machine learning|optimi[sz]\w*|"
+    r"recurs\w*|async\w*|class|api|scrap\w*|pars\w*|validat\w*|fuzzy|dedup\w*|normali[sz]\w*|lambda|let|"
+    r"arrayformula|array formula|query|xlookup|index match|sumproduct|importrange|dynamic|nested|"
+    r"multiple|conditional|time ?zones?|pipeline|plot\w*|chart)\b")
+STEP_MARKERS = re.compile(r"\b(then|after that|afterwards|also|finally|next|and also|as well as)\b|[;\n]|\b\d+[.)]\s")
+
+
+def _clip(value):
+    return max(0.0, min(value, 1.0))
+
+
+def complexity(q, lang, dataset_context="", dataset_bytes=None):
+    # (score, {feature: weighted contribution})
+    text = q or ""
+    features = {
+        'language': 0.0 if "Formula" in lang else 1.0,
+        'length': _clip(len(text.split()) / LONG_PROMPT_WORDS),
+        'steps': _clip(len(STEP_MARKERS.findall(text.lower())) / 3),
+        'terms': _clip(len(HARD_TERMS.findall(text.lower())) / 3),
+        # ~4 characters per token; files over ~100 MB count fully
+        'dataset': _clip(len(dataset_context) / 4 / 3000) * 0.5
+                   + (_clip(math.log10(dataset_bytes) / 8) * 0.5 if dataset_bytes else 0.0),
+    }
+    parts = {name: WEIGHTS[name] * value for name, value in features.items()}
+    return _clip(sum(parts.values())), parts
+
+
+def route(q, lang, dataset_context="", dataset_bytes=None, model=None):
+    # {'model', 'score', 'reason', 'timeout', 'fallback'}
+    score, parts = complexity(q, lang, dataset_context, dataset_bytes)
+    fallback = None
+    if model:
+        reason = "requested"
+    elif MODEL_OVERRIDE:
+        model, reason = MODEL_OVERRIDE, "CODIFY_MODEL"
+    elif not (q or "").strip() and dataset_context:
+        model, reason = LARGE_MODEL, "open-ended dataset analysis"
+    elif score >= ROUTE_THRESHOLD:
+        top = max(parts, key=parts.get)
+        model, reason = LARGE_MODEL, f"complex request (score {score:.2f}, mostly {top})"
+    else:
+        model, reason = FAST_MODEL, f"simple request (score {score:.2f})"
+        fallback = LARGE_MODEL if LARGE_MODEL != FAST_MODEL else None
+    return {'model': model, 'score': round(score, 3), 'reason': reason,
+            'timeout': timeout_for(model), 'fallback': fallback}
+
+
+def timeout_for(model):
+    return MODEL_TIMEOUTS.get(model, DEFAULT_TIMEOUT)
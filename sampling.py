@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+
+# Row sampling for the prompt context.
+# While a file is parsed, small row pools are kept up to date chunk by chunk
+# (vectorized, in the same single pass as the column stats):
+#   tail      the last POOL_ROWS rows
+#   random    a uniform sample of RESERVOIR_ROWS rows. This is reservoir
+#             sampling with random keys: every row draws a uniform key and the
+#             rows with the smallest keys are kept. Stored in key order, so any
+#             prefix is itself a uniform sample.
+#   extremes  the rows holding each numeric column's min and max
+#   nulls     the NULL_ROWS rows with the most missing values
+# The first rows are the dataset's `sample`. Pool frames are indexed by row
+# number in the file. sample_rows() draws the context rows for a strategy.
+# Datasets whose pools are cheaper to read on demand (Parquet) carry a
+# `load_pools(names)` callable instead, called only for non-head strategies.
+MAX_ROWS = 12
+POOL_ROWS = 50
+RESERVOIR_ROWS = 500
+NULL_ROWS = 20
+STRATA_BINS = 4
+
+# The pools each strategy draws from
+_POOLS = {
+    "head_tail": ("tail",),
+    "random": ("random",),
+    "stratified": ("random", "tail"),
+    "outliers": ("tail", "random", "extremes", "nulls"),
+}
+
+STRATEGIES = {
+    "head": "First rows",
+    "head_tail": "Head + tail",
+    "random": "Uniform random",
+    "stratified": "Stratified by column",
+    "outliers": "Outliers & null-rich",
+}
+
+_rng = np.random.default_rng()
+
+
+def new_pools():
+    return {'tail': None, 'random': None, 'keys': None, 'extremes': {}, 'nulls': None, 'null_counts': None}
+
+
+def fold_pools(pools, chunk, row_nulls):
+    # `chunk` is indexed by row number; `row_nulls` is its per-row null count.
+    tail = chunk.tail(POOL_ROWS)
+    pools['tail'] = tail if pools['tail'] is None else pd.concat([pools['tail'], tail]).tail(POOL_ROWS)
+
+    keys = _rng.random(len(chunk))
+    if pools['random'] is not None and len(pools['random']) >= RESERVOIR_ROWS:
+        # Only rows that beat the current worst key can enter the reservoir
+        keep = keys < pools['keys'][-1]
+        candidates, keys = chunk[keep], keys[keep]
+        merged = pd.concat([pools['random'], candidates])
+        keys = np.concatenate([pools['keys'], keys])
+    else:
+        merged = chunk if pools['random'] is None else pd.concat([pools['random'], chunk])
+        keys = keys if pools['keys'] is None else np.concatenate([pools['keys'], keys])
+    order = np.argsort(keys, kind="stable")[:RESERVOIR_ROWS]
+    pools['random'], pools['keys'] = merged.iloc[order], keys[order]
+
+    numeric = chunk.select_dtypes("number")
+    for col in numeric.columns[numeric.notna().any().to_numpy()]:
+        values = numeric[col]
+        for kind, idx in (("min", values.idxmin()), ("max", values.idxmax())):
+            best = pools['extremes'].get((col, kind))
+            value = values[idx]
+            if best is None or (value < best[0] if kind == "min" else value > best[0]):
+                pools['extremes'][col, kind] = (value, chunk.loc[[idx]])
+
+    nullish = row_nulls[row_nulls > 0]
+    if len(nullish):
+        top = nullish.nlargest(NULL_ROWS)
+        counts = top if pools['null_counts'] is None else pd.concat([pools['null_counts'], top]).nlargest(NULL_ROWS)
+        rows = chunk.loc[top.index] if pools['nulls'] is None else pd.concat([pools['nulls'], chunk.loc[top.index]])
+        pools['nulls'], pools['null_counts'] = rows.loc[counts.index], counts
+
+
+def finish_pools(pools):
+    finished = {name: pools[name] for name in ('tail', 'random', 'nulls') if pools[name] is not None}
+    if pools['extremes']:
+        rows = pd.concat([row for _, row in pools['extremes'].values()])
+        finished['extremes'] = rows[~rows.index.duplicated()]
+    return finished
+
+
+def _union(*frames):
+    frames = [f for f in frames if f is not None and len(f)]
+    if not frames:
+        return None
+    rows = pd.concat(frames)
+    return rows[~rows.index.duplicated()]
+
+
+def _strata(values):
+    # Numeric columns with many values are split into quantile bins
+    if pd.api.types.is_numeric_dtype(values) and values.nunique() > STRATA_BINS * 2:
+        return pd.qcut(values, STRATA_BINS, duplicates="drop")
+    return values
+
+
+def _extremes(rows):
+    numeric = rows.select_dtypes("number")
+    picks = []
+    for col in numeric.columns[numeric.notna().any().to_numpy()]:
+        picks += [numeric[col].idxmin(), numeric[col].idxmax()]
+    return rows.loc[list(dict.fromkeys(picks))]
+
+
+def representative_rows(sample, limit=MAX_ROWS):
+    # Deduplicated rows ordered so the first few cover the most ground: the
+    # fullest row, the row with the most nulls, then evenly spaced picks.
+    if sample.empty:
+        return sample
+    rows = sample.drop_duplicates()
+    if len(rows) <= limit:
+        return rows
+    nulls = rows.isna().sum(axis=1).to_numpy()
+    picks = [int(nulls.argmin()), int(nulls.argmax())]
+    step = max(len(rows) // limit, 1)
+    picks += range(0, len(rows), step)
+    order = list(dict.fromkeys(picks))[:limit]
+    return rows.iloc[order]
+
+
+def sample_rows(dataset, strategy="head", column=None, limit=MAX_ROWS):
+    # Rows for the prompt context, most informative first. Strategies whose
+    # pools are missing (e.g. datasets parsed before pools existed) fall back
+    # to the first rows.
+    head, pools = dataset['sample'], dataset.get('pools') or {}
+    if strategy in _POOLS and 'load_pools' in dataset:
+        pools = dataset['load_pools'](_POOLS[strategy])
+    rows = None
+    if strategy == "head_tail" and 'tail' in pools:
+        tail = pools['tail'].tail(limit // 2)
+        rows = _union(head.head(limit - len(tail)), tail)
+    elif strategy == "random" and 'random' in pools:
+        rows = pools['random'].iloc[:limit].sort_index()
+    elif strategy == "stratified" and column in head.columns and 'random' in pools:
+        pool = _union(pools['random'], head, pools.get('tail'))
+        # Round-robin over strata: the first row of every stratum, then the second...
+        rank = pool.groupby(_strata(pool[column]), dropna=False, observed=True).cumcount()
+        rows = pool.iloc[np.argsort(rank.to_numpy(), kind="stable")[:limit]]
+    elif strategy == "outliers":
+        pool = _union(head, *pools.values())
+        extremes = pools.get('extremes')
+        if extremes is None and pool is not None:
+            extremes = _extremes(pool)
+        nulls = pool.isna().sum(axis=1) if pool is not None else pd.Series(dtype="int64")
+        null_rich = pool.loc[nulls[nulls > 0].sort_values(ascending=False, kind="stable").index] if pool is not None else None
+        rows = _union(extremes, null_rich)
+        rows = rows.head(limit) if rows is not None else None
+    if rows is None or rows.empty:
+        return representative_rows(head, limit)
+    return rows.drop_duplicates()
@@ -0,0 +1,520 @@
+import json
+import os
+import pickle
+import queue
+import re
+import select
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from collections import OrderedDict
+
+# Dry runs of generated Python against the uploaded dataset.
+# Off unless the server sets CODIFY_ENABLE_DRY_RUN=1: it executes model-written
+# code, which users steer through their prompts.
+#
+# Code runs in a pool of WORKERS warm worker processes. Each worker has pandas
+# and numpy imported and keeps the last few datasets it was sent parsed in
+# memory. A run forks a fresh child from the worker, which inherits all of that
+# for free (copy-on-write), so repeated runs pay neither the interpreter and
+# pandas start-up nor the file parse. The child is isolated before any
+# generated code runs (see _isolate):
+#   filesystem  a private tmpfs root (chroot) with read-only Python and system
+#               libraries and the staged dataset under /data; not the app
+#               directory, .env or the history database
+#   network     a new network namespace with no interfaces up
+#   processes   a new PID namespace; the code runs as its PID 1, so nothing it
+#               starts outlives the run or can see the server's processes
+#   privileges  SANDBOX_UID when the worker runs as root (otherwise a user
+#               namespace mapping the worker's own uid), no capabilities,
+#               no_new_privs
+# and limited:
+#   CPU time    RLIMIT_CPU
+#   memory      RLIMIT_AS, on top of what the worker already has mapped
+#   wall clock  the worker kills the run after WALL_SECONDS
+#   files       writes capped at MAX_FILE_MB
+# A host without root or unprivileged user namespaces can't isolate runs, and
+# they fail instead of running unconfined. The dataset is bound to `df`, and
+# pandas' read_* functions return a copy of it whatever path they are given, so
+# code that starts with pd.read_csv("data.csv") runs against the real upload.
+# Linux only.
+ENABLED = os.getenv("CODIFY_ENABLE_DRY_RUN", "") not in ("", "0")
+SANDBOX_UID = int(os.getenv("CODIFY_SANDBOX_UID", 65534))
+WORKERS = int(os.getenv("CODIFY_SANDBOX_WORKERS", 2))
+CPU_SECONDS = int(os.getenv("CODIFY_SANDBOX_CPU_SECONDS", 10))
+MEMORY_MB = int(os.getenv("CODIFY_SANDBOX_MEMORY_MB", 1024))
+WALL_SECONDS = float(os.getenv("CODIFY_SANDBOX_WALL_SECONDS", 20))
+MAX_ROWS = int(os.getenv("CODIFY_SANDBOX_MAX_ROWS", 1_000_000))
+MAX_FILE_MB = 16
+MAX_OUTPUT_CHARS = 4000
+DATASETS_PER_WORKER = 2
+# Loading a large dataset into a worker for the first time comes on top of the run
+LOAD_SECONDS = 120
+STAGING_DIR = os.path.join(tempfile.gettempdir(), "codify-sandbox")
+
+READERS = ("read_csv", "read_table", "read_excel", "read_parquet", "read_feather", "read_json", "read_pickle")
+RESULT_NAMES = ("result", "output", "out", "res")
+_SECRET_RE = re.compile(r"KEY|TOKEN|SECRET|PASSWORD|CREDENTIAL", re.I)
+_CODE_BLOCK_RE = re.compile(r"```[ \t]*([\w+-]*)[^\n]*\n(.*?)```", re.S)
+
+
+def extract_python(markdown):
+    # Fenced blocks tagged python (or untagged), joined in order: answers often
+    # split one script across several blocks.
+    blocks = [body.strip("\n") for tag, body in _CODE_BLOCK_RE.findall(markdown or "")
+              if tag.lower() in ("", "python", "py", "python3")]
+    return "\n\n".join(block for block in blocks if block.strip())
+
+
+def stage_dataset(buffer, name, key, sheet=None):
+    # Writes the upload to a file the workers can open (once per content hash)
+    # and returns the dataset reference for dry_run().
+    os.makedirs(STAGING_DIR, exist_ok=True)
+    path = os.path.join(STAGING_DIR, key + os.path.splitext(name)[1].lower())
+    if not os.path.exists(path):
+        partial = path + f".{os.getpid()}.part"
+        buffer.seek(0)
+        with open(partial, "wb") as f:
+            shutil.copyfileobj(buffer, f, 1 << 20)
+        os.replace(partial, path)
+    return {'path': path, 'name': name, 'sheet': sheet, 'key': f"{key}:{sheet}"}
+
+
+# --- Parent side ---
+
+class _Worker:
+    def __init__(self):
+        env = {k: v for k, v in os.environ.items() if not _SECRET_RE.search(k)}
+        env.update(MPLBACKEND="Agg", PYTHONDONTWRITEBYTECODE="1")
+        self.proc = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--worker"],
+                                     stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     stderr=subprocess.DEVNULL, env=env, cwd=tempfile.gettempdir())
+
+    def alive(self):
+        return self.proc.poll() is None
+
+    def call(self, job, timeout):
+        pickle.dump(job, self.proc.stdin)
+        self.proc.stdin.flush()
+        ready, _, _ = select.select([self.proc.stdout], [], [], timeout)
+        if not ready:
+            raise TimeoutError("sandbox worker did not answer")
+        return pickle.load(self.proc.stdout)
+
+    def stop(self):
+        if self.alive():
+            self.proc.kill()
+        self.proc.wait()
+
+
+class SandboxPool:
+    # Workers start lazily (or all at once with warm()) and are handed out one
+    # run at a time. A worker that dies or stops answering is replaced.
+    def __init__(self, size=WORKERS):
+        self.size = max(size, 1)
+        self._idle = queue.LifoQueue()
+        self._started = 0
+        self._lock = threading.Lock()
+
+    def _spawn(self):
+        with self._lock:
+            if self._started >= self.size:
+                return None
+            self._started += 1
+        try:
+            return _Worker()
+        except Exception:
+            with self._lock:
+                self._started -= 1
+            raise
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._spawn() or self._idle.get()
+
+    def _retire(self, worker):
+        worker.stop()
+        with self._lock:
+            self._started -= 1
+
+    def warm(self):
+        # Starts the remaining workers; they import pandas while the user reads
+        while (worker := self._spawn()) is not None:
+            self._idle.put(worker)
+
+    def run(self, code, dataset=None, cpu_seconds=CPU_SECONDS, memory_mb=MEMORY_MB, wall_seconds=WALL_SECONDS):
+        job = {'code': code, 'dataset': dataset, 'cpu_seconds': cpu_seconds,
+               'memory_mb': memory_mb, 'wall_seconds': wall_seconds}
+        worker = self._acquire()
+        started = time.perf_counter()
+        try:
+            result = worker.call(job, wall_seconds + LOAD_SECONDS)
+        except Exception as e:
+            self._retire(worker)
+            return _failure(f"Sandbox worker failed: {type(e).__name__}: {e}")
+        if worker.alive():
+            self._idle.put(worker)
+        else:
+            self._retire(worker)
+        result['total_ms'] = (time.perf_counter() - started) * 1000
+        return result
+
+    def close(self):
+        while True:
+            try:
+                self._retire(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+    def stats(self):
+        return {'workers': self._started, 'idle': self._idle.qsize()}
+
+
+pool = SandboxPool()
+
+
+def dry_run(code, dataset=None, **limits):
+    # {'ok', 'error', 'killed', 'runtime_ms', 'cpu_ms', 'peak_mb', 'output',
+    #  'input_shape', 'stdout', 'load_ms', 'total_ms'}
+    if not ENABLED:
+        return _failure("Dry runs are disabled on this server (set CODIFY_ENABLE_DRY_RUN=1 to enable them)")
+    return pool.run(code, dataset, **limits)
+
+
+def _failure(error, killed=None):
+    return {'ok': False, 'error': error, 'killed': killed, 'runtime_ms': None, 'cpu_ms': None,
+            'peak_mb': None, 'output': None, 'input_shape': None, 'stdout': "", 'load_ms': 0.0}
+
+
+# --- Worker side ---
+
+CLONE_NEWNS, CLONE_NEWIPC, CLONE_NEWUSER, CLONE_NEWPID, CLONE_NEWNET = 0x20000, 0x8000000, 0x10000000, 0x20000000, 0x40000000
+MS_RDONLY, MS_NOSUID, MS_NODEV, MS_REMOUNT, MS_BIND, MS_REC, MS_PRIVATE, MS_RELATIME = 1, 2, 4, 32, 4096, 16384, 1 << 18, 1 << 21
+PR_SET_PDEATHSIG, PR_SET_NO_NEW_PRIVS = 1, 38
+_LINUX_CAPABILITY_VERSION_3 = 0x20080522
+_LOCKED_FLAGS = os.ST_NOSUID | os.ST_NODEV | os.ST_NOEXEC | os.ST_NOATIME | os.ST_NODIRATIME
+
+
+def _libc():
+    import ctypes
+    return ctypes.CDLL(None, use_errno=True)
+
+
+def _check(result):
+    if result != 0:
+        import ctypes
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+
+
+def _vm_bytes():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _library_paths():
+    # What a run may import lazily: the interpreter's stdlib and site-packages
+    # and the system library directories. Never the app directory (.env, the
+    # history database) or anything that contains it.
+    import sysconfig
+    candidates = {sysconfig.get_paths()[k] for k in ("stdlib", "platstdlib", "purelib", "platlib")}
+    candidates.update(p for p in sys.path if os.path.isabs(p))
+    candidates.update(("/lib", "/lib64", "/usr/lib", "/usr/lib64", "/usr/local/lib", "/usr/share/zoneinfo"))
+    app = os.path.dirname(os.path.abspath(__file__))
+    paths = []
+    for path in sorted(p for p in candidates if os.path.exists(p)):
+        if os.path.commonpath([os.path.realpath(path), app]) == os.path.realpath(path):
+            continue
+        if not any(os.path.commonpath([path, kept]) == kept for kept in paths):
+            paths.append(path)
+    return paths
+
+
+def _bind(libc, source, target, readonly=True):
+    if os.path.islink(source):
+        # e.g. /lib -> usr/lib on merged-/usr systems
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.symlink(os.readlink(source), target)
+        return
+    if os.path.isdir(source):
+        os.makedirs(target, exist_ok=True)
+    else:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        open(target, "a").close()
+    _check(libc.mount(source.encode(), target.encode(), None, MS_BIND | MS_REC, None))
+    if readonly:
+        # A remount must keep the flags the source mount was locked with
+        flags = os.statvfs(source).f_flag
+        locked = (flags & _LOCKED_FLAGS) | (MS_RELATIME if flags & os.ST_RELATIME else 0)
+        _check(libc.mount(None, target.encode(), None, MS_BIND | MS_REMOUNT | MS_RDONLY | MS_NOSUID | locked, None))
+
+
+def _isolate(root, dataset):
+    # New mount, network, IPC and PID namespaces (plus a user namespace when the
+    # worker isn't root). The run sees a tmpfs root with read-only binds of the
+    # Python and system libraries and of the staged dataset under /data, no
+    # network interfaces but a down loopback, and no other processes. Then chroot,
+    # drop to SANDBOX_UID (as root) and give up every capability.
+    libc = _libc()
+    uid, gid = os.getuid(), os.getgid()
+    flags = CLONE_NEWNS | CLONE_NEWNET | CLONE_NEWIPC | CLONE_NEWPID
+    _check(libc.unshare(flags | (CLONE_NEWUSER if uid != 0 else 0)))
+    if uid != 0:
+        for name, value in (("setgroups", "deny"), ("uid_map", f"{uid} {uid} 1"), ("gid_map", f"{gid} {gid} 1")):
+            with open(f"/proc/self/{name}", "w") as f:
+                f.write(value)
+    _check(libc.mount(b"none", b"/", None, MS_REC | MS_PRIVATE, None))
+    _check(libc.mount(b"tmpfs", root.encode(), b"tmpfs", MS_NOSUID | MS_NODEV, f"size={MAX_FILE_MB * 2}m,mode=755".encode()))
+    for path in _library_paths():
+        _bind(libc, path, root + path)
+    for device in ("/dev/null", "/dev/zero", "/dev/urandom"):
+        _bind(libc, device, root + device, readonly=False)
+    if dataset:
+        _bind(libc, dataset['path'], f"{root}/data/{os.path.basename(dataset['name'])}")
+    os.mkdir(root + "/work", 0o700)
+    if uid == 0:
+        os.chown(root + "/work", SANDBOX_UID, SANDBOX_UID)
+    os.chroot(root)
+    os.chdir("/work")
+    if uid == 0:
+        os.setgroups([])
+        os.setresgid(SANDBOX_UID, SANDBOX_UID, SANDBOX_UID)
+        os.setresuid(SANDBOX_UID, SANDBOX_UID, SANDBOX_UID)
+    _check(libc.prctl(PR_SET_NO_NEW_PRIVS, 1, 0, 0, 0))
+    import ctypes
+    header = (ctypes.c_uint32 * 2)(_LINUX_CAPABILITY_VERSION_3, 0)
+    _check(libc.capset(header, (ctypes.c_uint32 * 6)()))
+
+
+def _load(dataset, frames):
+    # (DataFrame or None, load ms); the last DATASETS_PER_WORKER stay parsed
+    if not dataset:
+        return None, 0.0
+    if dataset['key'] in frames:
+        frames.move_to_end(dataset['key'])
+        return frames[dataset['key']], 0.0
+    from ingest import read_frame
+    started = time.perf_counter()
+    with open(dataset['path'], "rb") as f:
+        frame = read_frame(f, dataset['name'], dataset.get('sheet'), MAX_ROWS)
+    frames[dataset['key']] = frame
+    while len(frames) > DATASETS_PER_WORKER:
+        frames.popitem(last=False)
+    return frame, (time.perf_counter() - started) * 1000
+
+
+def _describe(value, name):
+    import pandas as pd
+    described = {'name': name, 'type': type(value).__name__, 'shape': list(value.shape)}
+    if isinstance(value, pd.DataFrame):
+        described['columns'] = [str(c) for c in value.columns[:20]]
+    return described
+
+
+def _output(namespace):
+    # The run's result: a DataFrame/Series named like a result, else the last one
+    # assigned (`df` itself when the code only transforms it in place)
+    import pandas as pd
+    frames = {name: value for name, value in namespace.items()
+              if not name.startswith("_") and isinstance(value, (pd.DataFrame, pd.Series))}
+    for name in RESULT_NAMES:
+        if name in frames:
+            return _describe(frames[name], name)
+    if frames:
+        name = next(reversed(frames))
+        return _describe(frames[name], name)
+    return None
+
+
+def _child(job, frame, ceiling):
+    # Runs as PID 1 of the run's namespace, already isolated; returns the result
+    # fields it can observe itself
+    import resource
+    import pandas as pd
+    # PID 1 ignores signals it has no handler for, SIGXCPU included
+    signal.signal(signal.SIGXCPU, lambda *_: os._exit(128 + signal.SIGXCPU))
+    limit = job['cpu_seconds']
+    resource.setrlimit(resource.RLIMIT_CPU, (limit, limit + 1))
+    resource.setrlimit(resource.RLIMIT_AS, (ceiling, ceiling))
+    resource.setrlimit(resource.RLIMIT_FSIZE, (MAX_FILE_MB * 2**20, MAX_FILE_MB * 2**20))
+
+    captured = tempfile.TemporaryFile(dir=".")
+    devnull = os.open("/dev/null", os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(captured.fileno(), 1)
+    os.dup2(captured.fileno(), 2)
+
+    namespace = {'__name__': "__main__", '__builtins__': __builtins__, 'pd': pd}
+    if frame is not None:
+        namespace['df'] = frame.copy()
+        for reader in READERS:
+            setattr(pd, reader, lambda *args, **kwargs: frame.copy())
+
+    ok, error = True, None
+    try:
+        exec(compile(job['code'], "<generated>", "exec"), namespace)
+    except SystemExit as e:
+        ok = e.code in (None, 0)
+        error = None if ok else f"SystemExit: {e.code}"
+    except MemoryError:
+        ok, error = False, f"MemoryError: the code needed more than {job['memory_mb']} MB"
+    except BaseException:
+        ok = False
+        kind, value, tb = sys.exc_info()
+        # Only the frames inside the generated code
+        frames = [f for f in traceback.extract_tb(tb) if f.filename == "<generated>"]
+        lines = job['code'].splitlines()
+        where = "".join(f"  line {f.lineno}: {lines[f.lineno - 1].strip()}\n" for f in frames[-3:]
+                        if 0 < f.lineno <= len(lines))
+        error = where + "".join(traceback.format_exception_only(kind, value)).strip()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        output = _output(namespace)
+    except BaseException:
+        output = None
+    captured.seek(0)
+    stdout = captured.read(MAX_OUTPUT_CHARS + 1).decode("utf-8", "replace")
+    if len(stdout) > MAX_OUTPUT_CHARS:
+        stdout = stdout[:MAX_OUTPUT_CHARS] + "\n… (truncated)"
+    return {'ok': ok, 'error': error, 'output': output, 'stdout': stdout}
+
+
+def _report(fd, result):
+    # JSON, not pickle: the worker must not unpickle what a run wrote
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(result, f, default=str)
+
+
+def _isolated_run(job, frame, workdir, write_end):
+    # The forked child: isolates itself, then runs the code in a grandchild that
+    # is PID 1 of the new PID namespace (so everything the code starts dies with
+    # it) and exits with the grandchild's status, signals as 128 + signal.
+    import resource
+    os.closerange(3, write_end)
+    os.closerange(write_end + 1, resource.getrlimit(resource.RLIMIT_NOFILE)[0])
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+    ceiling = _vm_bytes() + job['memory_mb'] * 2**20
+    try:
+        _isolate(workdir, job['dataset'])
+    except OSError as e:
+        _report(write_end, {'ok': False, 'error': f"Sandbox isolation is not available on this host ({e}); "
+                            "it needs root or unprivileged user namespaces", 'output': None, 'stdout': ""})
+        os._exit(0)
+    runner = os.fork()
+    if runner == 0:
+        _check(_libc().prctl(PR_SET_PDEATHSIG, signal.SIGKILL, 0, 0, 0))
+        try:
+            result = _child(job, frame, ceiling)
+        except BaseException as e:
+            result = {'ok': False, 'error': f"{type(e).__name__}: {e}", 'output': None, 'stdout': ""}
+        _report(write_end, result)
+        os._exit(0)
+    os.close(write_end)
+    _, status = os.waitpid(runner, 0)
+    os._exit(128 + os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status))
+
+
+def _execute(job, frames):
+    try:
+        frame, load_ms = _load(job['dataset'], frames)
+    except Exception as e:
+        return _failure(f"Could not load the dataset: {type(e).__name__}: {e}")
+    workdir = tempfile.mkdtemp(prefix="codify-run-")
+    read_end, write_end = os.pipe()
+    started = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        try:
+            _isolated_run(job, frame, workdir, write_end)
+        finally:
+            os._exit(1)
+
+    os.close(write_end)
+    deadline = started + job['wall_seconds']
+    chunks, timed_out = [], False
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            # The run's PID 1 gets SIGKILL when the child dies (PR_SET_PDEATHSIG)
+            os.kill(pid, signal.SIGKILL)
+            timed_out = True
+            break
+        ready, _, _ = select.select([read_end], [], [], remaining)
+        if ready:
+            data = os.read(read_end, 1 << 16)
+            if not data:
+                break
+            chunks.append(data)
+    os.close(read_end)
+    # wait4 counts the reaped grandchild too (CPU time and peak RSS)
+    _, status, usage = os.wait4(pid, 0)
+    runtime_ms = (time.perf_counter() - started) * 1000
+    shutil.rmtree(workdir, ignore_errors=True)
+
+    result = _failure(None)
+    if chunks and not timed_out:
+        try:
+            result.update(json.loads(b"".join(chunks)))
+        except ValueError:
+            pass
+    code = os.WEXITSTATUS(status) if os.WIFEXITED(status) else 0
+    sig = code - 128 if code > 128 else None
+    if timed_out:
+        result.update(ok=False, killed="wall", error=f"Stopped after {job['wall_seconds']:g} s (wall-clock limit)")
+    elif sig == signal.SIGXCPU:
+        result.update(ok=False, killed="cpu", error=f"Stopped after {job['cpu_seconds']} s of CPU time (CPU limit)")
+    elif sig == signal.SIGKILL and result['error'] is None:
+        # The hard CPU limit (one second past the soft one)
+        result.update(ok=False, killed="cpu", error=f"Stopped after {job['cpu_seconds']} s of CPU time (CPU limit)")
+    elif sig == signal.SIGXFSZ:
+        result.update(ok=False, killed="file", error=f"Stopped writing a file past {MAX_FILE_MB} MB (file size limit)")
+    elif sig is not None:
+        # Usually an allocation failing outside Python under the memory limit
+        result.update(ok=False, killed="signal",
+                      error=f"Crashed with {signal.Signals(sig).name} (memory limit is {job['memory_mb']} MB)")
+    elif result['error'] is None and not result['ok'] and not chunks:
+        result['error'] = "The run exited without reporting a result"
+    result.update(
+        runtime_ms=runtime_ms,
+        cpu_ms=(usage.ru_utime + usage.ru_stime) * 1000,
+        # Peak resident size of the run's process, including the worker pages
+        # (pandas, the dataset) it touched
+        peak_mb=usage.ru_maxrss / 1024,
+        input_shape=list(frame.shape) if frame is not None and result['ok'] else None,
+        load_ms=load_ms,
+    )
+    if not result['ok']:
+        # Whatever the namespace held when the run failed isn't its result
+        result['output'] = None
+    return result
+
+
+def _serve():
+    import numpy  # noqa: F401  (the warm part: inherited by every run)
+    import pandas  # noqa: F401
+    import ingest  # noqa: F401
+    # fd 1 carries the protocol; anything else printing to stdout goes nowhere
+    protocol = os.fdopen(os.dup(1), "wb")
+    os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+    requests = sys.stdin.buffer
+    frames = OrderedDict()
+    while True:
+        try:
+            job = pickle.load(requests)
+        except EOFError:
+            return
+        pickle.dump(_execute(job, frames), protocol)
+        protocol.flush()
+
+
+if __name__ == "__main__" and sys.argv[1:] == ["--worker"]:
+    _serve()
@@ -0,0 +1,184 @@
+import os
+import random
+import re
+import threading
+import time
+from collections import deque
+
+# Process-wide scheduler in front of every Groq completion call.
+# - At most MAX_IN_FLIGHT requests run at once; the rest wait in FIFO order and
+#   are told their queue position.
+# - Request/token budgets are read from the x-ratelimit-* response headers.
+#   Dispatch is held back when a budget is exhausted until it resets.
+#   Providers limit each model separately, so budgets are tracked per model
+#   (the `bucket`); a request waiting on an exhausted model doesn't hold up
+#   queued requests for another one.
+# - 429s, timeouts, connection errors and 5xx responses are retried with
+#   jittered exponential backoff. A 429 pauses every caller of that model, not
+#   just the one that hit it.
+MAX_IN_FLIGHT = int(os.getenv("CODIFY_MAX_IN_FLIGHT", 4))
+MAX_RETRIES = int(os.getenv("CODIFY_MAX_RETRIES", 5))
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_duration(value):
+    # Groq reset headers look like "2m59.56s", "7.66s" or "120ms".
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_RE.findall(value)
+    return sum(float(n) * _UNITS[unit] for n, unit in parts) if parts else None
+
+
+def _retryable(error):
+    import groq
+    if isinstance(error, (groq.RateLimitError, groq.APITimeoutError, groq.APIConnectionError,
+                          groq.InternalServerError)):
+        return True
+    return isinstance(error, groq.APIStatusError) and error.status_code >= 500
+
+
+def _retry_after(error):
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    return parse_duration(response.headers.get("retry-after"))
+
+
+class Scheduler:
+    def __init__(self, max_in_flight=MAX_IN_FLIGHT, max_retries=MAX_RETRIES):
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self._cond = threading.Condition()
+        self._waiting = deque()
+        self._in_flight = 0
+        self._budgets = {}
+
+    def _budget(self, bucket):
+        if bucket not in self._budgets:
+            self._budgets[bucket] = {'paused_until': 0.0, 'remaining_requests': None, 'remaining_tokens': None,
+                                     'requests_reset_at': 0.0, 'tokens_reset_at': 0.0}
+        return self._budgets[bucket]
+
+    def _blocked_until(self, tokens, bucket):
+        # Returns the monotonic time dispatch may resume, or 0 if a slot is free now.
+        now = time.monotonic()
+        budget = self._budget(bucket)
+        until = budget['paused_until'] if budget['paused_until'] > now else 0.0
+        if budget['remaining_requests'] is not None and budget['remaining_requests'] <= 0 and budget['requests_reset_at'] > now:
+            until = max(until, budget['requests_reset_at'])
+        if budget['remaining_tokens'] is not None and budget['remaining_tokens'] < tokens and budget['tokens_reset_at'] > now:
+            until = max(until, budget['tokens_reset_at'])
+        return until
+
+    def _acquire(self, tokens, on_wait, bucket):
+        # FIFO, except that requests for a model whose budget is exhausted are skipped over
+        ticket = (object(), tokens, bucket)
+        with self._cond:
+            self._waiting.append(ticket)
+            last_position = None
+            try:
+                while True:
+                    position = self._waiting.index(ticket) + 1
+                    blocked = self._blocked_until(tokens, bucket)
+                    ahead = list(self._waiting)[:position - 1]
+                    if (self._in_flight < self.max_in_flight and not blocked
+                            and all(self._blocked_until(t, b) for _, t, b in ahead)):
+                        break
+                    if on_wait and position != last_position:
+                        on_wait(position)
+                        last_position = position
+                    timeout = max(blocked - time.monotonic(), 0.05) if blocked else 0.25
+                    self._cond.wait(min(timeout, 1.0))
+            finally:
+                self._waiting.remove(ticket)
+                self._cond.notify_all()
+            self._in_flight += 1
+            # Spend the budget optimistically so concurrent dispatches don't overshoot
+            budget = self._budget(bucket)
+            if budget['remaining_requests'] is not None:
+                budget['remaining_requests'] -= 1
+            if budget['remaining_tokens'] is not None:
+                budget['remaining_tokens'] -= tokens
+
+    def blocked(self, bucket=None, tokens=0):
+        # True while dispatch for this model is held back by a 429 pause or an
+        # exhausted budget
+        with self._cond:
+            return bool(self._blocked_until(tokens, bucket))
+
+    def _release(self):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def record(self, headers, bucket=None):
+        now = time.monotonic()
+        with self._cond:
+            budget = self._budget(bucket)
+            remaining = headers.get("x-ratelimit-remaining-requests")
+            if remaining is not None:
+                budget['remaining_requests'] = int(remaining)
+                budget['requests_reset_at'] = now + (parse_duration(headers.get("x-ratelimit-reset-requests")) or 0)
+            remaining = headers.get("x-ratelimit-remaining-tokens")
+            if remaining is not None:
+                budget['remaining_tokens'] = int(remaining)
+                budget['tokens_reset_at'] = now + (parse_duration(headers.get("x-ratelimit-reset-tokens")) or 0)
+            self._cond.notify_all()
+
+    def _pause(self, seconds, bucket):
+        with self._cond:
+            budget = self._budget(bucket)
+            budget['paused_until'] = max(budget['paused_until'], time.monotonic() + seconds)
+
+    def run(self, request, tokens=0, on_wait=None, can_retry=lambda: True, timings=None, bucket=None,
+            max_retries=None):
+        # `request` performs one raw API call (returning an object with .headers)
+        # and consumes the result while the slot is held. Time spent queued or
+        # backing off is added to timings['queue_ms'] when a dict is passed.
+        attempt = 0
+        while True:
+            waited = time.perf_counter()
+            self._acquire(tokens, on_wait, bucket)
+            if timings is not None:
+                timings['queue_ms'] = timings.get('queue_ms', 0.0) + (time.perf_counter() - waited) * 1000
+            try:
+                return request()
+            except Exception as e:
+                retryable = _retryable(e)
+                retry_after = _retry_after(e) if retryable else None
+                # Pause the model even when this caller gives up (or escalates), so
+                # later requests don't walk into the same 429
+                if retry_after:
+                    self._pause(retry_after, bucket)
+                limit = self.max_retries if max_retries is None else max_retries
+                if attempt >= limit or not retryable or not can_retry():
+                    raise
+                delay = min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+                if retry_after:
+                    delay = max(delay, retry_after)
+            finally:
+                self._release()
+            attempt += 1
+            time.sleep(delay)
+            if timings is not None:
+                timings['queue_ms'] += delay * 1000
+
+    def stats(self):
+        with self._cond:
+            return {
+                'in_flight': self._in_flight,
+                'waiting': len(self._waiting),
+                'remaining': {bucket: {'requests': budget['remaining_requests'], 'tokens': budget['remaining_tokens']}
+                              for bucket, budget in self._budgets.items()},
+            }
+
+
+scheduler = Scheduler()
@@ -0,0 +1,335 @@
+import atexit
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+import db
+
+# Near-duplicate index over history prompts, so paraphrases of an earlier
+# request ("remove duplicate rows" / "drop dupes from the sheet") can reuse its
+# generation instead of calling the model. The exact-match response cache
+# misses these.
+#
+# Each prompt is normalized (stop words dropped, a few synonyms and suffixes
+# folded) and turned into a set of shingles: its words plus the character
+# trigrams of each word. A MinHash signature of NUM_HASHES values estimates the
+# Jaccard similarity between two sets. For lookups the signature is cut into
+# BANDS bands (LSH); prompts sharing any band are candidates, and only those are
+# scored. Bands are kept as sorted arrays, so finding candidates is a binary
+# search per band. Lookups stay around a millisecond at 100k+ entries.
+#
+# Signatures are persisted next to the database. On start the index loads that
+# file and catches up on history rows written since; after that every
+# save_to_history commit is added as it lands (db.history_listeners), and rows
+# written by other processes are picked up every REFRESH_SECONDS.
+INDEX_PATH = os.getenv("CODIFY_SIMILAR_PATH", os.path.splitext(db.DB_PATH)[0] + ".similar.npz")
+THRESHOLD = float(os.getenv("CODIFY_SIMILAR_THRESHOLD", 0.5))
+MAX_MATCHES = 3
+NUM_HASHES = 64
+BANDS = 16
+MERGE_ROWS = 4096        # unsorted new rows scanned linearly until re-sorted
+SAVE_EVERY = 500         # added rows between saves
+REFRESH_SECONDS = 30
+BUILD_CHUNK = 1000       # prompts hashed per vectorized step while building
+SEED = 20240501
+SKIP_PREFIX = "Dataset analysis:"  # labels of prompt-less dataset runs
+
+STOP_WORDS = frozenset("""a an the of in on to for from and or with by into as at per be is are it this that
+these those my me i we you please can could would how do does make create write give get show want need
+using use all each""".split())
+SYNONYMS = {
+    "drop": "remove", "delete": "remove", "eliminate": "remove", "strip": "remove",
+    "dupe": "duplicate", "dup": "duplicate", "duplicat": "duplicate",
+    "sheet": "table", "spreadsheet": "table", "dataframe": "table", "df": "table", "worksheet": "table",
+    "col": "column", "field": "column", "record": "row",
+    "total": "sum", "average": "mean", "avg": "mean",
+}
+SUFFIXES = ("ing", "ed", "es", "s")
+
+log = logging.getLogger(__name__)
+_A, _B = np.random.default_rng(SEED).integers(1, 1 << 64, size=(2, NUM_HASHES), dtype=np.uint64, endpoint=False)
+_A |= np.uint64(1)
+_SHIFT = np.uint64(32)
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _word(word):
+    word = SYNONYMS.get(word, word)
+    for suffix in SUFFIXES:
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            word = word[:-len(suffix)]
+            break
+    return SYNONYMS.get(word, word)
+
+
+@lru_cache(maxsize=65536)
+def _word_shingles(word):
+    # Hashes of a (raw) word's shingles: the normalized word and its trigrams
+    word = _word(word)
+    padded = f"^{word}$"
+    grams = {word, *(padded[i:i + 3] for i in range(len(padded) - 2))}
+    return tuple(zlib.crc32(g.encode("utf-8")) for g in grams)
+
+
+def shingles(text):
+    hashes = {h for w in re.findall(r"\w+", text.lower()) if w not in STOP_WORDS for h in _word_shingles(w)}
+    return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+
+def signatures(shingle_sets):
+    # MinHash with multiply-shift hashes: the top 32 bits of (a*x + b) mod 2**64
+    sigs = np.empty((len(shingle_sets), NUM_HASHES), dtype=np.uint32)
+    for start in range(0, len(shingle_sets), BUILD_CHUNK):
+        chunk = shingle_sets[start:start + BUILD_CHUNK]
+        flat = np.concatenate(chunk)
+        offsets = np.cumsum([0] + [len(s) for s in chunk[:-1]])
+        # (hashes x shingles) layout: reduceat then runs along contiguous rows
+        hashed = (_A[:, None] * flat + _B[:, None]) >> _SHIFT
+        sigs[start:start + len(chunk)] = np.minimum.reduceat(hashed, offsets, axis=1).T
+    return sigs
+
+
+def band_keys(sigs):
+    # One 64-bit key per band of NUM_HASHES // BANDS signature values
+    pairs = np.ascontiguousarray(sigs).reshape(len(sigs), BANDS, -1).view(np.uint64)
+    keys = pairs[..., 0]
+    for i in range(1, pairs.shape[-1]):
+        keys = keys * _MIX ^ pairs[..., i]
+    return keys
+
+
+class SimilarIndex:
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.state = "idle"  # idle -> loading -> ready (or failed)
+        self.languages = []
+        self.n = 0
+        self.ids = np.empty(0, dtype=np.int64)
+        self.langs = np.empty(0, dtype=np.int16)
+        self.sigs = np.empty((0, NUM_HASHES), dtype=np.uint32)
+        self.keys = np.empty((0, BANDS), dtype=np.uint64)
+        self.sorted_n = 0
+        self.order = np.empty((BANDS, 0), dtype=np.int64)
+        self.sorted_keys = np.empty((BANDS, 0), dtype=np.uint64)
+        self.last_id = 0       # every history row up to here has been scanned
+        self.seen = set()      # ids above last_id already scanned (added out of order)
+        self.early = []        # rows committed while loading
+        self.unsaved = 0
+        self.saving = False
+        self.refreshed = 0.0
+
+    # --- building ---
+    def start(self):
+        # Loads in a background thread; lookups return nothing until it is ready
+        with self.lock:
+            if self.state != "idle":
+                return
+            self.state = "loading"
+            db.history_listeners.append(self.add)
+        threading.Thread(target=self._load, name="codify-similar", daemon=True).start()
+
+    def _load(self):
+        try:
+            started = time.perf_counter()
+            self._read()
+            self.refresh()
+            with self.lock:
+                early, self.early = self.early, []
+                self.state = "ready"
+            self._add_rows(early)
+            if self.unsaved:
+                self.save()
+            log.info("Similar-prompt index: %d entries in %.0f ms", self.n, (time.perf_counter() - started) * 1000)
+        except Exception:
+            self.state = "failed"
+            log.exception("Could not build the similar-prompt index")
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path) as saved:
+                if tuple(saved['config']) != (NUM_HASHES, BANDS, SEED):
+                    return
+                ids, langs, sigs = saved['ids'], saved['langs'], saved['sigs']
+                languages, last_id = list(saved['languages']), int(saved['last_id'])
+        except Exception:
+            log.warning("Ignoring unreadable similar-prompt index %s", self.path, exc_info=True)
+            return
+        max_id = db.query("SELECT MAX(id) FROM history")[0][0] or 0
+        if max_id < last_id:
+            return  # history was reset; rebuild from scratch
+        with self.lock:
+            self.languages, self.last_id = [str(lang) for lang in languages], last_id
+            self._append(ids, langs, sigs)
+            self._sort()
+
+    def refresh(self):
+        # Rows this process hasn't seen: the initial catch-up, then other processes' writes
+        self.refreshed = time.monotonic()
+        rows = db.query("SELECT id, query, language FROM history WHERE id > ? ORDER BY id", (self.last_id,))
+        if rows:
+            self._add_rows(rows, scanned_to=rows[-1][0])
+
+    def add(self, row_id, text, language):
+        if self.state == "loading":
+            with self.lock:
+                if self.state == "loading":
+                    self.early.append((row_id, text, language))
+                    return
+        if self.state == "ready":
+            self._add_rows([(row_id, text, language)])
+            if self.unsaved >= SAVE_EVERY:
+                # This is the DB writer thread: queued writes must not wait on the disk
+                self._save_in_background()
+
+    def _add_rows(self, rows, scanned_to=None):
+        # Hashing happens outside the lock; checking which rows are new and
+        # inserting them happen under it, so a row that reaches both refresh()
+        # and the commit listener is indexed once. `scanned_to`: every history
+        # id up to it has been read.
+        usable = [(i, t, lang) for i, t, lang in rows if t and not t.startswith(SKIP_PREFIX)]
+        sets = [shingles(text) for _, text, _ in usable]
+        usable = [row for row, s in zip(usable, sets) if len(s)]
+        sigs = signatures([s for s in sets if len(s)]) if usable else None
+        with self.lock:
+            new = [k for k, row in enumerate(usable) if row[0] > self.last_id and row[0] not in self.seen]
+            if new:
+                usable = [usable[k] for k in new]
+                for _, _, language in usable:
+                    if language not in self.languages:
+                        self.languages.append(language)
+                langs = np.array([self.languages.index(lang) for _, _, lang in usable], dtype=np.int16)
+                self._append(np.array([row[0] for row in usable], dtype=np.int64), langs, sigs[new])
+                self.unsaved += len(usable)
+                if self.n - self.sorted_n > MERGE_ROWS:
+                    self._sort()
+            self.seen.update(row[0] for row in rows if row[0] > self.last_id)
+            if scanned_to is not None and scanned_to > self.last_id:
+                self.last_id = scanned_to
+                self.seen = {i for i in self.seen if i > scanned_to}
+            while self.last_id + 1 in self.seen:
+                self.last_id += 1
+                self.seen.discard(self.last_id)
+
+    def _append(self, ids, langs, sigs):
+        # Capacity doubling, so adding one row doesn't copy the whole index
+        needed = self.n + len(ids)
+        if needed > len(self.ids):
+            capacity = max(needed, 2 * len(self.ids), 1024)
+            self.ids = np.resize(self.ids, capacity)
+            self.langs = np.resize(self.langs, capacity)
+            self.sigs = np.resize(self.sigs, (capacity, NUM_HASHES))
+            self.keys = np.resize(self.keys, (capacity, BANDS))
+        self.ids[self.n:needed] = ids
+        self.langs[self.n:needed] = langs
+        self.sigs[self.n:needed] = sigs
+        self.keys[self.n:needed] = band_keys(sigs)
+        self.n = needed
+
+    def _sort(self):
+        keys = self.keys[:self.n].T
+        self.order = np.argsort(keys, axis=1, kind="stable")
+        self.sorted_keys = np.take_along_axis(keys, self.order, axis=1)
+        self.sorted_n = self.n
+
+    def _save_in_background(self):
+        with self.lock:
+            if self.saving:
+                return
+            self.saving = True
+
+        def run():
+            try:
+                self.save()
+            finally:
+                self.saving = False
+        threading.Thread(target=run, name="codify-similar-save", daemon=True).start()
+
+    def save(self):
+        with self.lock:
+            arrays = dict(ids=self.ids[:self.n].copy(), langs=self.langs[:self.n].copy(),
+                          sigs=self.sigs[:self.n].copy(), languages=np.array(self.languages, dtype=str),
+                          last_id=np.int64(self.last_id), config=np.array([NUM_HASHES, BANDS, SEED]))
+            self.unsaved = 0
+        # Written to a temp file and swapped in, so readers never see half a file
+        tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, self.path)
+        except OSError:
+            log.warning("Could not save the similar-prompt index to %s", self.path, exc_info=True)
+
+    # --- lookups ---
+    def lookup(self, text, language, limit=MAX_MATCHES, threshold=THRESHOLD):
+        # [(history id, estimated similarity)], best first
+        if self.state != "ready":
+            return []
+        if time.monotonic() - self.refreshed > REFRESH_SECONDS:
+            self.refresh()
+        query_set = shingles(text)
+        if not len(query_set) or language not in self.languages:
+            return []
+        sig = signatures([query_set])
+        keys = band_keys(sig)[0]
+        code = self.languages.index(language)
+        with self.lock:
+            # Candidates are marked in a bitmap rather than deduplicated with a sort:
+            # a common prompt can share a bucket with a large part of the history
+            marked = np.zeros(self.n, dtype=bool)
+            for b in range(BANDS):
+                lo = np.searchsorted(self.sorted_keys[b], keys[b], "left")
+                hi = np.searchsorted(self.sorted_keys[b], keys[b], "right")
+                marked[self.order[b][lo:hi]] = True
+            marked[self.sorted_n:] = (self.keys[self.sorted_n:self.n] == keys).any(axis=1)
+            candidates = np.flatnonzero(marked & (self.langs[:self.n] == code))
+            scores = (self.sigs[candidates] == sig).sum(axis=1) / NUM_HASHES
+            ids = self.ids[candidates]
+        keep = scores >= threshold
+        ids, scores = ids[keep], scores[keep]
+        if len(ids) > limit:
+            # Only rows scoring at least the limit-th best need ordering (ties go to the newest)
+            cut = scores >= np.partition(scores, -limit)[-limit]
+            ids, scores = ids[cut], scores[cut]
+        best = np.lexsort((-ids, -scores))[:limit]
+        return list(zip(ids[best].tolist(), scores[best].tolist()))
+
+
+index = SimilarIndex()
+
+
+@atexit.register
+def _save_at_exit():
+    # Skipped when the directory has gone away (temporary databases in tests and benchmarks)
+    if index.unsaved and os.path.isdir(os.path.dirname(os.path.abspath(index.path))):
+        index.save()
+
+
+def similar_generations(text, language, limit=MAX_MATCHES):
+    # Past generations for prompts close to `text`, one per distinct prompt:
+    # [{id, query, code, created_at, similarity}]
+    index.start()
+    hits = index.lookup(text, language, limit * 4)
+    if not hits:
+        return []
+    scores = dict(hits)
+    marks = ",".join("?" * len(scores))
+    rows = db.query(f"SELECT id, query, code, created_at FROM history WHERE id IN ({marks})", list(scores))
+    rows.sort(key=lambda row: (-scores[row[0]], -row[0]))
+    matches, seen = [], set()
+    for row_id, query_text, code, created_at in rows:
+        prompt = " ".join(query_text.lower().split())
+        if prompt in seen:
+            continue
+        seen.add(prompt)
+        matches.append({'id': row_id, 'query': query_text, 'code': code, 'created_at': created_at,
+                        'similarity': scores[row_id]})
+    return matches[:limit]
@@ -0,0 +1,74 @@
+import threading
+
+# In-flight request coalescing ("single flight").
+# The first caller for a key becomes the leader and runs the upstream call; any
+# caller that arrives with the same key before it finishes attaches to it
+# instead of issuing its own. Followers get every streamed token (those already
+# emitted are replayed on attach) and the same final result or exception.
+# This complements the response cache, which only helps once a call completes.
+
+
+class _Call:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tokens = []
+        self.subscribers = []
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+    def subscribe(self, on_token):
+        with self.lock:
+            for token in self.tokens:
+                on_token(token)
+            self.subscribers.append(on_token)
+
+    def publish(self, token):
+        with self.lock:
+            self.tokens.append(token)
+            for on_token in self.subscribers:
+                on_token(token)
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, on_token=None):
+        # fn(publish) performs the upstream call, passing each streamed token to
+        # publish. Returns (result, leader) where leader is False for callers
+        # that were coalesced onto someone else's request.
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.followers += 1
+        if on_token is not None:
+            call.subscribe(on_token)
+
+        if leader:
+            try:
+                call.result = fn(call.publish)
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return call.result, leader
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+
+flights = SingleFlight()
@@ -0,0 +1,27 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+# Cold-start profiling. Set CODIFY_PROFILE_STARTUP=1 to time module imports and
+# first-use initialization (client, database, dataset parsing stack). Each label
+# is recorded once per process, logged to stderr and listed in the sidebar.
+# For a per-module breakdown of third-party imports, combine with
+# `python -X importtime`.
+ENABLED = os.getenv("CODIFY_PROFILE_STARTUP", "") not in ("", "0")
+PROCESS_START = time.perf_counter()
+timings = {}
+
+
+@contextmanager
+def timed(label):
+    if not ENABLED or label in timings:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[label] = time.perf_counter() - start
+        print(f"[startup] {label}: {timings[label] * 1000:.1f} ms "
+              f"(t+{(time.perf_counter() - PROCESS_START) * 1000:.0f} ms)", file=sys.stderr)
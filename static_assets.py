@@ -0,0 +1,39 @@
+import json
+import os
+from functools import lru_cache
+
+# Resolves logical asset names to the content-hashed files produced by
+# encode_yuji.py. Streamlit serves ./static at app/static/.
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(ROOT, "static", "manifest.json")
+FONTS_URL = ("https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700"
+             "&family=Inter:wght@300;400;500;600&family=Fira+Code:wght@400;500&display=swap")
+
+
+@lru_cache(maxsize=1)
+def manifest():
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def asset_url(name):
+    return f"app/static/{manifest()[name]}"
+
+
+def stylesheet_html():
+    fonts = (
+        '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+        f'<link rel="stylesheet" href="{FONTS_URL}">'
+    )
+    if "codify.css" in manifest():
+        return fonts + f'<link rel="stylesheet" href="{asset_url("codify.css")}">'
+    # Assets not built yet: inline the sources so local development still works
+    from encode_yuji import ASSETS_DIR, CSS_SOURCES
+    css = ""
+    for name in CSS_SOURCES:
+        with open(os.path.join(ASSETS_DIR, "css", name), encoding="utf-8") as f:
+            css += f.read()
+    return fonts + f"<style>{css}</style>"
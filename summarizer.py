@@ -0,0 +1,95 @@
+import os
+import re
+
+import pandas as pd
+
+from sampling import STRATEGIES, sample_rows
+
+# Token-budgeted dataset summaries for the prompt.
+# Instead of pasting raw rows, the context describes each column (dtype, null
+# rate, cardinality, range, top values) and then adds representative rows until
+# the budget is spent. Token counts are a local estimate, no tokenizer needed.
+CONTEXT_TOKENS = int(os.getenv("CODIFY_CONTEXT_TOKENS", 1500))
+MAX_CELL_CHARS = 40
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text):
+    # Word pieces plus punctuation tracks BPE counts closely for code and CSV.
+    return len(_TOKEN_RE.findall(text))
+
+
+def _short(value):
+    text = str(value)
+    return text if len(text) <= MAX_CELL_CHARS else text[:MAX_CELL_CHARS - 1] + "…"
+
+
+def _number(value):
+    return f"{value:.6g}" if isinstance(value, float) else _short(value)
+
+
+def _column_line(col, row, rows, top_values):
+    parts = [f"{row['dtype']}"]
+    if rows:
+        parts.append(f"{row['nulls'] / rows:.0%} null")
+    parts.append(f"{row['distinct']} distinct")
+    top = top_values.get(col)
+    if 'min' in row and pd.notna(row['min']):
+        parts.append(f"range {_number(row['min'])}..{_number(row['max'])}")
+        top = None  # the range says more than top values for numeric columns
+    if top and row['non_null']:
+        parts.append("top " + ", ".join(f"{_short(v)} ({n / row['non_null']:.0%})" for v, n in top))
+    return f"- {_short(col)}: " + "; ".join(parts)
+
+
+def summarize(dataset, budget=CONTEXT_TOKENS, strategy="head", column=None):
+    rows, columns = dataset['rows'], dataset['columns']
+    name = f"{dataset['name']} (sheet {dataset['sheet']})" if dataset.get('sheet') else dataset['name']
+    shape = f"first {rows} rows (more not yet profiled)" if dataset.get('partial') else f"{rows} rows"
+    header = (
+        f"\n\nREFERENCE DATASET: {name}\n"
+        f"Shape: {shape} × {len(columns)} columns\n"
+        "Column profile:\n"
+    )
+    parts = [header]
+    used = estimate_tokens(header)
+
+    stats, top_values = dataset['stats'], dataset.get('top_values', {})
+    for i, col in enumerate(columns):
+        line = _column_line(col, stats.loc[col], rows, top_values) + "\n"
+        cost = estimate_tokens(line)
+        if used + cost > budget:
+            names = list(map(_short, columns[i:i + 50]))
+            rest = f"- … {len(columns) - i} more columns: {', '.join(names)}\n"
+            while names and used + estimate_tokens(rest) > budget:
+                names = names[:len(names) // 2]
+                rest = f"- … {len(columns) - i} more columns: {', '.join(names)}\n"
+            parts.append(rest)
+            return "".join(parts)
+        parts.append(line)
+        used += cost
+
+    if strategy == "stratified" and column not in columns:
+        strategy = "head"
+    sample = sample_rows(dataset, strategy, column)
+    if sample.empty:
+        return "".join(parts)
+    clipped = sample.map(lambda v: _short(v) if isinstance(v, str) else v)
+    lines = clipped.to_csv(index=False, float_format="%.6g").splitlines()
+    if strategy == "head":
+        label = "Representative rows"
+    else:
+        label = f"Sample rows, {STRATEGIES[strategy].lower()}" + (f" {_short(column)}" if strategy == "stratified" else "")
+    row_header = f"{label} (CSV format):\n" + lines[0] + "\n"
+    used += estimate_tokens(row_header)
+    kept = []
+    for line in lines[1:]:
+        cost = estimate_tokens(line) + 1
+        if used + cost > budget:
+            break
+        kept.append(line)
+        used += cost
+    if kept:
+        parts.append(row_header + "\n".join(kept) + "\n")
+    return "".join(parts)
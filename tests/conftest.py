@@ -0,0 +1,35 @@
+import os
+import sys
+import tempfile
+import time
+
+import pytest
+
+# The app is a set of top-level modules run from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Modules read their paths at import time; keep them away from the real database
+os.environ.setdefault("CODIFY_DB_PATH", os.path.join(tempfile.mkdtemp(prefix="codify-tests-"), "codify_pro.db"))
+
+
+@pytest.fixture
+def fresh_db(tmp_path, monkeypatch):
+    # db.py pointed at an empty database file; migrations run on first use
+    import db
+    db.flush()
+    db.close_all()
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "codify_pro.db"))
+    monkeypatch.setattr(db, "_schema_ready", False)
+    yield db
+    db.flush()
+    db.close_all()
+
+
+@pytest.fixture
+def wait_until():
+    # Polls predicate() until it holds; a regression fails the test instead of hanging the suite
+    def wait(predicate, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            assert time.monotonic() < deadline, "timed out waiting for another thread"
+            time.sleep(0.001)
+    return wait
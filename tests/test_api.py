@@ -0,0 +1,56 @@
+import io
+import json
+import threading
+
+import pytest
+
+import api
+
+
+def _call(method, path, body=None, key=None):
+    data = json.dumps(body).encode() if body is not None else b""
+    environ = {"REQUEST_METHOD": method, "PATH_INFO": path, "QUERY_STRING": "", "CONTENT_TYPE": "application/json",
+               "CONTENT_LENGTH": str(len(data)), "wsgi.input": io.BytesIO(data)}
+    if key:
+        environ["HTTP_AUTHORIZATION"] = f"Bearer {key}"
+    status = []
+    body = b"".join(api.app(environ, lambda s, headers: status.append(s)))
+    return status[0], body.decode()
+
+
+@pytest.fixture
+def fake_synthesize(fresh_db, monkeypatch):
+    import inference
+
+    def synthesize(prompt, language, context, on_token=None, **kwargs):
+        saved = fresh_db.save_to_history(prompt, "print(1)", language, user=kwargs.get("user"))
+        if on_token:
+            on_token("print(1)")
+        return {'language': language, 'text': "print(1)", 'cached': False, 'coalesced': False,
+                'model': "m", 'route': "fast", 'latency_ms': 1.0, 'usage': None, 'saved': saved}
+    monkeypatch.setattr(inference, "synthesize", synthesize)
+    monkeypatch.setattr(api, "API_KEY", "k")
+
+
+def test_history_needs_a_configured_key(fresh_db, monkeypatch):
+    monkeypatch.setattr(api, "API_KEY", None)
+    assert _call("GET", "/api/history")[0].startswith("403")
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_history_sees_the_run_once_it_returns(fake_synthesize, stream):
+    status, body = _call("POST", "/api/synthesize", {'prompt': "print one", 'stream': stream}, key="k")
+    assert status.startswith("200")
+    if stream:
+        assert "event: done" in body
+    status, body = _call("GET", "/api/history", key="k")
+    assert [item['query'] for item in json.loads(body)['items']] == ["print one"]
+
+
+def test_response_does_not_hang_on_a_lost_history_write(fresh_db, monkeypatch):
+    import inference
+    monkeypatch.setattr(api, "HISTORY_WAIT", 0.05)
+    monkeypatch.setattr(inference, "synthesize", lambda *args, **kwargs: {
+        'language': "Python", 'text': "", 'cached': False, 'coalesced': False, 'model': "m", 'route': "fast",
+        'latency_ms': 1.0, 'usage': None, 'saved': threading.Event()})
+    assert _call("POST", "/api/synthesize", {'prompt': "p"})[0].startswith("200")
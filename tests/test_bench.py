@@ -0,0 +1,36 @@
+import groq
+import pytest
+
+import bench
+import mock_groq
+
+
+def _results(**values):
+    return {name: bench._result(value, "ms", "higher" if name.endswith("rps") else "lower")
+            for name, value in values.items()}
+
+
+def test_compare_flags_only_regressions_past_tolerance():
+    baseline = {'results': _results(parse_ms=100.0, prompt_ms=100.0, concurrent_rps=10.0, gone_ms=5.0)}
+    current = _results(parse_ms=119.0, prompt_ms=125.0, concurrent_rps=7.0)
+    regressions = bench.compare(current, baseline, 0.2)
+    assert [line.split(":")[0] for line in regressions] == ["prompt_ms", "concurrent_rps"]
+
+
+@pytest.fixture
+def server():
+    server = mock_groq.serve(latency=0.0, tokens_per_sec=10_000, tokens=40)
+    yield server
+    server.shutdown()
+
+
+def test_mock_streams_like_groq(server):
+    client = groq.Groq(api_key="offline", base_url=server.url)
+    raw = client.chat.completions.with_raw_response.create(
+        model="llama-3.3-70b-versatile", messages=[{"role": "user", "content": "dedupe"}], stream=True)
+    assert raw.headers["x-ratelimit-remaining-requests"] == "14399"
+    chunks = list(raw.parse())
+    text = "".join(c.choices[0].delta.content or "" for c in chunks)
+    assert text.startswith("```python\n") and text.endswith("```")
+    assert chunks[-1].x_groq.usage.completion_tokens == 40
+    assert server.requests == 1
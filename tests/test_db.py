@@ -0,0 +1,83 @@
+import sqlite3
+
+
+def _baseline(path):
+    # The schema the app shipped with before migrations existed
+    c = sqlite3.connect(path)
+    c.execute("CREATE TABLE history (query TEXT, code TEXT, language TEXT)")
+    c.executemany("INSERT INTO history VALUES (?, ?, ?)", [
+        ("drop duplicate rows", "df.drop_duplicates()", "Python"),
+        ("scratch", "", "Python"),
+        ("total sales per region", "=SUMIF(A:A, \"East\", B:B)", "Excel"),
+    ])
+    c.execute("DELETE FROM history WHERE query = 'scratch'")
+    c.commit()
+    c.close()
+
+
+def test_migrates_baseline_history(fresh_db):
+    _baseline(fresh_db.DB_PATH)
+    assert fresh_db.query("PRAGMA user_version") == [(len(fresh_db.MIGRATIONS),)]
+    # Old rowids survive the table rebuild, gaps included
+    assert fresh_db.query("SELECT id, query, language FROM history ORDER BY id") == [
+        (1, "drop duplicate rows", "Python"), (3, "total sales per region", "Excel")]
+    assert [row[0] for row in fresh_db.history_page(search="duplicate")] == [1]
+    assert [row[0] for row in fresh_db.history_page(language="Excel")] == [3]
+
+
+def test_fts_triggers_follow_history(fresh_db):
+    fresh_db.save_to_history("pivot by month", "df.pivot_table(index='month')", "Python", user="ana")
+    fresh_db.flush()
+    (row_id,), = fresh_db.query("SELECT id FROM history")
+    assert [row[0] for row in fresh_db.history_page(search="pivot")] == [row_id]
+    fresh_db.execute("UPDATE history SET query = 'melt wide table', code = 'df.melt()' WHERE id = ?", (row_id,))
+    assert fresh_db.history_page(search="pivot") == []
+    assert [row[0] for row in fresh_db.history_page(search="melt")] == [row_id]
+    fresh_db.execute("DELETE FROM history WHERE id = ?", (row_id,))
+    assert fresh_db.history_page(search="melt") == []
+
+
+def test_keyset_pages_cover_history_once(fresh_db):
+    for i in range(7):
+        fresh_db.save_to_history(f"query {i}", f"print({i})", "Python")
+    fresh_db.flush()
+    seen, before_id = [], None
+    while True:
+        page = fresh_db.history_page(before_id=before_id, limit=3)
+        seen += [row[0] for row in page]
+        if len(page) < 3:
+            break
+        before_id = page[-1][0]
+    assert seen == sorted(seen, reverse=True) and len(set(seen)) == 7
+
+
+def test_failed_migration_returns_the_connection(fresh_db, monkeypatch):
+    def broken(c):
+        raise RuntimeError("bad migration")
+    monkeypatch.setattr(fresh_db, "MIGRATIONS", [*fresh_db.MIGRATIONS, broken])
+    for _ in range(fresh_db.POOL_SIZE + 1):
+        try:
+            fresh_db.query("SELECT 1")
+        except RuntimeError:
+            pass
+    # Every attempt handed its connection back instead of leaking it
+    assert fresh_db._pool.qsize() == 1
+    monkeypatch.setattr(fresh_db, "MIGRATIONS", fresh_db.MIGRATIONS[:-1])
+    assert fresh_db.query("SELECT 1") == [(1,)]
+
+
+def test_bad_write_only_loses_itself(fresh_db):
+    fresh_db.init_db()
+    committed = []
+    # Holding the write lock stalls the writer, so these pile up into one batch
+    with fresh_db.transaction() as conn:
+        conn.execute("INSERT INTO history (query) VALUES ('lock')")
+        for i in range(5):
+            fresh_db.execute_async("INSERT INTO history (query) VALUES (?)", (f"good {i}",), on_commit=committed.append)
+        fresh_db.execute_async("INSERT INTO no_such_table VALUES (1)")
+        for i in range(5, 10):
+            fresh_db.execute_async("INSERT INTO history (query) VALUES (?)", (f"good {i}",), on_commit=committed.append)
+    fresh_db.flush()
+    rows = [row[0] for row in fresh_db.query("SELECT query FROM history WHERE query LIKE 'good%' ORDER BY id")]
+    assert rows == [f"good {i}" for i in range(10)]
+    assert len(committed) == 10
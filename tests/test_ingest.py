@@ -0,0 +1,61 @@
+import io
+
+import pandas as pd
+
+import ingest
+from sampling import sample_rows
+
+
+def _xlsx(rows):
+    from openpyxl import Workbook
+    workbook = Workbook()
+    for row in rows:
+        workbook.active.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def test_header_matches_read_excel():
+    header = ["Name", "Name", "x", None, "Name", "Name.1", ""]
+    buffer = _xlsx([header, list(range(len(header)))])
+    assert ingest._header(header) == list(pd.read_excel(buffer).columns)
+
+
+def test_ingest_xlsx_with_repeated_headers(monkeypatch):
+    monkeypatch.setattr(ingest, "EXCEL_ENGINE", "openpyxl")
+    buffer = _xlsx([["Name", "Name", "x"], ["a", "b", 1], ["c", "d", 2], ["e", None, 3]])
+    dataset = ingest.ingest(buffer, "dup.xlsx")
+    assert list(dataset['columns']) == ["Name", "Name.1", "x"]
+    assert dataset['rows'] == 3
+    assert "Name.1" in ingest.prompt_context(dataset)
+    for strategy in ("head_tail", "random", "outliers"):
+        ingest.prompt_context(dataset, strategy=strategy)
+
+
+
+def _parquet(rows, row_group_size):
+    frame = pd.DataFrame({'row': range(rows), 'region': ["East", "West"] * (rows // 2)})
+    buffer = io.BytesIO()
+    frame.to_parquet(buffer, row_group_size=row_group_size)
+    buffer.seek(0)
+    return buffer
+
+
+def test_parquet_pools_are_read_on_demand(monkeypatch):
+    monkeypatch.setattr(ingest, "DECODE_ROWS", 1000)
+    decoded = []
+    frame = ingest._frame
+    monkeypatch.setattr(ingest, "_frame", lambda table, index: decoded.append(len(table)) or frame(table, index))
+    dataset = ingest.ingest(_parquet(20_000, 4000), "rows.parquet")
+    ingest.prompt_context(dataset)
+    # The default strategy decodes nothing past the first batch
+    assert dataset['pools'] == {} and decoded == []
+    for strategy in ("head_tail", "random", "stratified", "outliers"):
+        rows = sample_rows(dataset, strategy, column="region")
+        # Pool rows keep their row numbers in the file
+        assert (rows.index == rows['row']).all()
+    assert sample_rows(dataset, "head_tail").index.max() == 19_999
+    random = dataset['load_pools'](("random",))['random']
+    assert len(random) == ingest.RESERVOIR_ROWS and random.index.max() >= ingest.SAMPLE_ROWS
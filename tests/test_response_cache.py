@@ -0,0 +1,17 @@
+import response_cache
+
+
+def test_cache_tables_come_from_migrations(fresh_db):
+    names = {r[0] for r in fresh_db.query("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert {"response_cache", "cache_stats"} <= names
+
+
+def test_counters_are_written_behind(fresh_db):
+    key = response_cache.cache_key("sum sales by region", "Python", "", "m")
+    response_cache.put_cached(key, "df.groupby('region')['sales'].sum()", "m")
+    assert response_cache.get_cached(key) == ("df.groupby('region')['sales'].sum()", "m")
+    assert response_cache.get_cached(response_cache.cache_key("other", "Python", "", "m")) is None
+    fresh_db.flush()
+    stats = response_cache.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert fresh_db.query("SELECT hits FROM response_cache WHERE key = ?", (key,)) == [(1,)]
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import sampling
+from sampling import MAX_ROWS, STRATEGIES, sample_rows
+
+
+def _dataset(frame, chunk_rows=250):
+    # Folds the frame in chunks the way ingest does
+    pools = sampling.new_pools()
+    for start in range(0, len(frame), chunk_rows):
+        chunk = frame.iloc[start:start + chunk_rows]
+        sampling.fold_pools(pools, chunk, chunk.isna().sum(axis=1))
+    return {'sample': frame.head(sampling.POOL_ROWS), 'pools': sampling.finish_pools(pools)}
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(7)
+    n = 2000
+    frame = pd.DataFrame({
+        'region': np.where(np.arange(n) < 1900, "East", rng.choice(["West", "North", "South"], n)),
+        'sales': rng.normal(100, 10, n),
+        'units': rng.integers(1, 50, n).astype(float),
+    })
+    frame.loc[1234, 'sales'] = 10_000.0
+    frame.loc[1500, ['sales', 'units']] = np.nan
+    return frame
+
+
+def test_head_tail_spans_the_file(frame):
+    rows = sample_rows(_dataset(frame), "head_tail")
+    assert len(rows) == MAX_ROWS
+    assert rows.index.min() == 0 and rows.index.max() == len(frame) - 1
+
+
+def test_random_draws_from_the_whole_file(frame):
+    dataset = _dataset(frame)
+    assert len(dataset['pools']['random']) == sampling.RESERVOIR_ROWS
+    assert dataset['pools']['random'].index.is_unique
+    rows = sample_rows(dataset, "random")
+    assert len(rows) == MAX_ROWS and rows.index.is_monotonic_increasing
+    assert rows.index.max() >= sampling.POOL_ROWS
+
+
+def test_stratified_covers_rare_values(frame):
+    rows = sample_rows(_dataset(frame), "stratified", column="region")
+    # The head is all "East"; the other regions are only in the last 100 rows
+    assert set(rows['region']) == {"East", "West", "North", "South"}
+    assert len(rows) == MAX_ROWS
+
+
+def test_outliers_picks_extremes_and_null_rows(frame):
+    rows = sample_rows(_dataset(frame), "outliers")
+    assert 1234 in rows.index and 1500 in rows.index
+    assert frame['units'].idxmin() in rows.index
+
+
+@pytest.mark.parametrize("strategy", list(STRATEGIES))
+def test_missing_pools_fall_back_to_the_first_rows(frame, strategy):
+    dataset = {'sample': frame.head(sampling.POOL_ROWS)}
+    rows = sample_rows(dataset, strategy, column="region")
+    assert 0 < len(rows) <= MAX_ROWS
+    assert rows.index.max() < sampling.POOL_ROWS
+
+
+def test_unknown_stratify_column_falls_back(frame):
+    rows = sample_rows(_dataset(frame), "stratified", column="missing")
+    assert rows.equals(sampling.representative_rows(frame.head(sampling.POOL_ROWS)))
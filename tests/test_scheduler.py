@@ -0,0 +1,128 @@
+import threading
+
+import groq
+import httpx
+import pytest
+
+import scheduler
+from scheduler import Scheduler, parse_duration
+
+
+def _status_error(cls, status, headers=None):
+    request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+    return cls("upstream said no", response=httpx.Response(status, headers=headers or {}, request=request), body=None)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    # Record backoff delays instead of sleeping through them, without jitter
+    slept = []
+    monkeypatch.setattr(scheduler.time, "sleep", slept.append)
+    monkeypatch.setattr(scheduler.random, "uniform", lambda low, high: 1.0)
+    return slept
+
+
+def _failing(*errors, result="ok"):
+    errors = list(errors)
+
+    def request():
+        if errors:
+            raise errors.pop(0)
+        return result
+    return request
+
+
+def test_parse_duration():
+    assert parse_duration("2m59.56s") == pytest.approx(179.56)
+    assert parse_duration("120ms") == pytest.approx(0.12)
+    assert parse_duration("7") == 7.0
+    assert parse_duration("") is None and parse_duration("soon") is None
+
+
+def test_retry_after_sets_the_delay_and_pauses_the_bucket(monkeypatch):
+    s = Scheduler()
+    blocked = []
+    monkeypatch.setattr(scheduler, "BACKOFF_BASE", 0.01)
+    monkeypatch.setattr(scheduler.random, "uniform", lambda low, high: 1.0)
+    # Other callers of the same model are held back while the caller sleeps; other models are not
+    monkeypatch.setattr(scheduler.time, "sleep", lambda delay: blocked.append(
+        (delay, s._blocked_until(0, "large") > 0, s._blocked_until(0, "fast") > 0)))
+    error = _status_error(groq.RateLimitError, 429, {"retry-after": "0.2"})
+    timings = {}
+    assert s.run(_failing(error), timings=timings, bucket="large") == "ok"
+    assert blocked == [(0.2, True, False)]
+    # The retry itself waits out the pause: 200 ms slept plus ~200 ms held at dispatch
+    assert timings['queue_ms'] >= 350
+
+
+def test_retry_after_pauses_the_bucket_without_retries(sleeps):
+    # Fast-model calls run with max_retries=0 and escalate; the 429 must still hold that model back
+    s = Scheduler()
+    with pytest.raises(groq.RateLimitError):
+        s.run(_failing(_status_error(groq.RateLimitError, 429, {"retry-after": "30"})), bucket="fast",
+              max_retries=0)
+    assert sleeps == []
+    assert s.blocked("fast") and s._blocked_until(0, "fast") > scheduler.time.monotonic() + 25
+    assert not s.blocked("large")
+
+
+def test_backoff_wins_over_a_shorter_retry_after(sleeps):
+    s = Scheduler()
+    errors = [_status_error(groq.RateLimitError, 429, {"retry-after": "0.1"}) for _ in range(3)]
+    assert s.run(_failing(*errors)) == "ok"
+    assert sleeps == [scheduler.BACKOFF_BASE, scheduler.BACKOFF_BASE * 2, scheduler.BACKOFF_BASE * 4]
+
+
+def test_retries_5xx_without_retry_after(sleeps):
+    s = Scheduler()
+    assert s.run(_failing(_status_error(groq.InternalServerError, 503))) == "ok"
+    assert sleeps == [scheduler.BACKOFF_BASE]
+    assert s._blocked_until(0, None) == 0
+
+
+def test_gives_up_after_max_retries(sleeps):
+    s = Scheduler(max_retries=2)
+    errors = [_status_error(groq.RateLimitError, 429) for _ in range(3)]
+    with pytest.raises(groq.RateLimitError):
+        s.run(_failing(*errors))
+    assert len(sleeps) == 2
+    assert s.stats()['in_flight'] == 0
+
+
+def test_client_errors_and_cancelled_callers_are_not_retried(sleeps):
+    s = Scheduler()
+    with pytest.raises(groq.BadRequestError):
+        s.run(_failing(_status_error(groq.BadRequestError, 400)))
+    with pytest.raises(groq.RateLimitError):
+        s.run(_failing(_status_error(groq.RateLimitError, 429)), can_retry=lambda: False)
+    assert sleeps == []
+
+
+def test_exhausted_request_budget_holds_dispatch_until_reset():
+    s = Scheduler()
+    s.record({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "150ms"}, bucket="large")
+    timings = {}
+    assert s.run(lambda: "ok", timings=timings, bucket="large") == "ok"
+    assert timings['queue_ms'] >= 100
+    # A different model's budget is independent
+    timings = {}
+    s.record({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "10s"}, bucket="large")
+    s.run(lambda: "ok", timings=timings, bucket="fast")
+    assert timings['queue_ms'] < 100
+
+
+def test_in_flight_limit_queues_callers(wait_until):
+    s = Scheduler(max_in_flight=1)
+    release, positions = threading.Event(), []
+    holder = threading.Thread(target=s.run, args=(lambda: release.wait(5),), daemon=True)
+    holder.start()
+    wait_until(lambda: s.stats()['in_flight'] == 1)
+    waiter = threading.Thread(target=s.run, args=(lambda: None,), kwargs={'on_wait': positions.append}, daemon=True)
+    waiter.start()
+    wait_until(lambda: positions)
+    assert s.stats() == {'in_flight': 1, 'waiting': 1, 'remaining': {None: {'requests': None, 'tokens': None}}}
+    release.set()
+    for thread in (holder, waiter):
+        thread.join(5)
+        assert not thread.is_alive()
+    assert positions == [1]
@@ -0,0 +1,75 @@
+import threading
+import time
+
+import similar
+from similar import SimilarIndex
+
+
+def _index(tmp_path):
+    index = SimilarIndex(path=str(tmp_path / "similar.npz"))
+    index.state = "ready"
+    return index
+
+
+def _insert(db, rows):
+    with db.transaction() as conn:
+        conn.executemany("INSERT INTO history (query, code, language) VALUES (?, '', 'Python')", [(q,) for q in rows])
+
+
+def test_row_from_refresh_and_listener_is_indexed_once(fresh_db, tmp_path):
+    index = _index(tmp_path)
+    _insert(fresh_db, ["remove duplicate rows", "sum of sales by region"])
+    index.refresh()
+    index.add(2, "sum of sales by region", "Python")
+    assert index.n == 2 and index.last_id == 2
+    # A commit seen by the listener first advances last_id, so refresh skips it
+    _insert(fresh_db, ["average price per category"])
+    index.add(3, "average price per category", "Python")
+    assert index.last_id == 3
+    index.refresh()
+    assert sorted(index.ids[:index.n].tolist()) == [1, 2, 3]
+
+
+def test_concurrent_refresh_and_add(fresh_db, tmp_path):
+    index = _index(tmp_path)
+    prompts = [f"group orders by customer {i} and total them" for i in range(300)]
+    _insert(fresh_db, prompts)
+    start = threading.Barrier(2)
+
+    def listener():
+        start.wait(5)
+        for row_id, text in enumerate(prompts, 1):
+            index.add(row_id, text, "Python")
+
+    def refresher():
+        start.wait(5)
+        index.refresh()
+    threads = [threading.Thread(target=listener, daemon=True), threading.Thread(target=refresher, daemon=True)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+        assert not thread.is_alive(), "index update deadlocked"
+    ids = index.ids[:index.n].tolist()
+    assert sorted(ids) == list(range(1, 301))
+    assert index.last_id == 300 and not index.seen
+
+
+def test_add_saves_off_the_calling_thread(fresh_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(similar, "SAVE_EVERY", 1)
+    index = _index(tmp_path)
+    release, saved = threading.Event(), []
+
+    def slow_save():
+        release.wait(5)
+        saved.append(threading.current_thread().name)
+    index.save = slow_save
+    started = time.perf_counter()
+    index.add(1, "pivot the sales table", "Python")
+    assert time.perf_counter() - started < 1
+    release.set()
+    for _ in range(100):
+        if saved:
+            break
+        time.sleep(0.01)
+    assert saved == ["codify-similar-save"]
@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from singleflight import SingleFlight
+
+TIMEOUT = 5.0
+
+
+def _start(target):
+    # Daemon threads, so a stuck call can't keep the test run alive
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread
+
+
+def _join(*threads):
+    for thread in threads:
+        thread.join(TIMEOUT)
+        assert not thread.is_alive(), "call did not finish"
+
+
+def _leader(flights, key, fn, tokens, wait_until):
+    # Starts a leader call on a thread and returns once it is in flight
+    out = {}
+
+    def run():
+        try:
+            out['result'] = flights.do(key, fn, on_token=tokens.append)
+        except Exception as e:
+            out['error'] = e
+    thread = _start(run)
+    wait_until(flights.in_flight)
+    return thread, out
+
+
+def test_follower_gets_replayed_and_live_tokens(wait_until):
+    flights, attached, finish = SingleFlight(), threading.Event(), threading.Event()
+
+    def fn(publish):
+        publish("df")
+        publish(".head()")
+        attached.wait(TIMEOUT)
+        publish("\n")
+        finish.wait(TIMEOUT)
+        return "df.head()\n"
+
+    leader_tokens, follower_tokens = [], []
+    thread, out = _leader(flights, "k", fn, leader_tokens, wait_until)
+    wait_until(lambda: len(leader_tokens) == 2)
+    follower = {}
+
+    def follow():
+        follower['result'] = flights.do("k", lambda publish: "unused", on_token=follower_tokens.append)
+    follower_thread = _start(follow)
+    wait_until(lambda: len(follower_tokens) == 2)
+    attached.set()
+    finish.set()
+    _join(thread, follower_thread)
+    assert out['result'] == ("df.head()\n", True)
+    assert follower['result'] == ("df.head()\n", False)
+    assert follower_tokens == leader_tokens == ["df", ".head()", "\n"]
+    assert flights.in_flight() == 0
+
+
+def test_leader_error_reaches_followers(wait_until):
+    flights, release = SingleFlight(), threading.Event()
+
+    def fn(publish):
+        release.wait(TIMEOUT)
+        raise RuntimeError("upstream down")
+
+    thread, out = _leader(flights, "k", fn, [], wait_until)
+    errors = []
+
+    def follow():
+        try:
+            flights.do("k", lambda publish: "unused")
+        except RuntimeError as e:
+            errors.append(e)
+    followers = [_start(follow) for _ in range(3)]
+    wait_until(lambda: flights._calls["k"].followers == 3)
+    release.set()
+    _join(thread, *followers)
+    assert isinstance(out['error'], RuntimeError)
+    assert [str(e) for e in errors] == ["upstream down"] * 3
+    # The failed call is forgotten, so the next caller retries upstream
+    assert flights.do("k", lambda publish: "ok") == ("ok", True)
+
+
+def test_different_keys_do_not_coalesce():
+    flights = SingleFlight()
+    assert flights.do("a", lambda publish: 1) == (1, True)
+    assert flights.do("b", lambda publish: 2) == (2, True)
+    with pytest.raises(ValueError):
+        flights.do("c", lambda publish: int("x"))
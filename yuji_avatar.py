@@ -1,150 +1,20 @@
-wombat_html = """
-<style>
-  .yuji-wrapper {
-    perspective: 800px;
-    display: inline-block;
-  }
-  .yuji-container {
-    width: 160px; 
-    height: 160px; 
-    border-radius: 50%; 
-    margin: 0 auto; 
-    position: relative; 
-    overflow: hidden; 
-    box-shadow: inset 0 2px 5px rgba(0,0,0,0.5), 0 0 20px rgba(220, 20, 60, 0.4);
-    border: 2px solid #dc143c;
-    /* 3D tilt variables (updated by JS) */
-    --rx: 0deg;
-    --ry: 0deg;
-    transform: rotateX(var(--rx)) rotateY(var(--ry));
-    transition: transform 0.1s ease-out;
-  }
-  .yuji-img {
-    position: absolute;
-    top: 0;
-    left: 0;
-    width: 100%;
-    height: 100%;
-    object-fit: cover;
-    transition: transform 0.6s cubic-bezier(0.4, 0, 0.2, 1), filter 0.6s ease;
-    animation: yuji-breathe 4s ease-in-out infinite;
-  }
-  
-  @keyframes yuji-breathe {
-    0%, 100% { transform: scale(1) translateY(0); }
-    50% { transform: scale(1.04) translateY(-3px); }
-  }
-
-  /* Eyelids */
-  .yuji-eyelid {
-    position: absolute;
-    top: 55px; /* Aligned with coordinate grid from prior checks */
-    width: 40px;
-    height: 25px;
-    background: #eebd9f; /* Match Yuji's skin tone closely */
-    border-radius: 5px 5px 20px 20px;
-    z-index: 5;
-    transform: scaleY(0);
-    transform-origin: top;
-    transition: transform 0.15s ease-in-out;
-    box-shadow: inset 0 -2px 3px rgba(0,0,0,0.3); /* Add subtle shadow to eyelid */
-  }
-  .eyelid-left { left: 32px; transform-origin: top center; }
-  .eyelid-right { right: 36px; transform-origin: top center; }
-
-  /* Username field focus animation: Yuji leans in */
-  body:has(input[aria-label="Username"]:focus) .yuji-img {
-    transform: scale(1.15) translate(3px, 5px) !important;
-    animation: none;
-  }
-  
-  /* Password field focus animation: Eyes close FIRST, then blindfold drops */
-  body:has(input[aria-label="Password"]:focus) .yuji-eyelid {
-    transform: scaleY(1);
-    transition-delay: 0s;
-  }
-
-  body:has(input[aria-label="Password"]:focus) .yuji-img {
-    transform: scale(0.95) translateY(10px) !important;
-    filter: brightness(0.6) blur(2px);
-    animation: none;
-    transition-delay: 0.1s;
-  }
-  
-  /* Blindfold block */
-  .yuji-blindfold {
-    position: absolute;
-    top: -85px;
-    left: 0;
-    width: 100%;
-    height: 80px;
-    background: rgba(26, 26, 26, 0.95);
-    backdrop-filter: blur(8px);
-    transition: top 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-    z-index: 10;
-    box-shadow: 0 5px 15px rgba(0,0,0,0.8);
-    border-bottom: 2px solid #dc143c;
-    display: flex;
-    justify-content: center;
-    align-items: flex-end;
-    padding-bottom: 5px;
-    color: #dc143c;
-    font-family: 'Space Grotesk', sans-serif;
-    font-size: 10px;
-    letter-spacing: 2px;
-    font-weight: 600;
-  }
-  
-  body:has(input[aria-label="Password"]:focus) .yuji-blindfold {
-    top: 0;
-    transition-delay: 0.2s; /* Drops slightly after eyes close */
-  }
-</style>
+from static_assets import asset_url
 
+# Login avatar markup. Styles live in assets/css/avatar.css and the image is the
+# hashed WebP/AVIF pair produced by encode_yuji.py, so browsers cache both.
+# The cursor tilt is driven by the components.html script in login_page().
+wombat_html = f"""
 <div style="display: flex; justify-content: center; align-items: center; margin-bottom: 20px; width: 100%;">
   <div class="yuji-wrapper">
     <div class="yuji-container" id="yuji-3d-container">
       <div class="yuji-eyelid eyelid-left"></div>
       <div class="yuji-eyelid eyelid-right"></div>
       <div class="yuji-blindfold">SECRET</div>
-      <img class="yuji-img" src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAoAAAAKACAIAAACDr150AACAAElEQVR4nGy9CZckyXEmZmYekXdlVfXdPQeIQ0vxEdTq6f//BUlP2l1SS4AACcz09N115Rnhbnpul0c12JgZdFVlZUZ4uNvx2WefdbP1dULgkgERmBgyAjAAICIQl8IISICMwIkhE1IpzAiUiMeChIAMzAzEnLH+f/0OMjEiQCGE+uoC9Q3q+zJh/RISQEEkBqi/xJhR/gIIWKD+IeLCAIyYCmeERMiMXD8KExW5CkJ5o8z1E1GuG0q93vpFYUT5HUTGepEgF8mpvgSZ6qu4lHpZ9dYBmeTv9UOZqb65/BLKW9Yb4xEwyXfqRRYs9V7qAsnn1qurl4t6MXLf9dPrx9b7qBdbrwoQSD5FVq5+U36/vhoR689R1wbqxUG90ML1nuplyt3ZYtb/cH2JXFXRS5GfkLxArkefpFyQLHWpj1XukepllLoeKM9cFl/+y/KoiOttl/rpJMsp91ZfIXtDvyN3L7eBBfWuQHdP/ZW6oET2VOqbFv2R7iDUK+L6UJBKV3+9fqheOeq+YChUrxhRVwuxFE519RMQJK7vmJOsWKkvKXLzsqh1beTm7QrqkhFilh8SMhYc5e8od16XluoV6ZMEqkua6nOs75iAs66NLld9MPJQ6kfWLUtkexCpEKE9HtkR8hFFnpGsfq47llA/2JatvinK067PtD4d+c26deQVdfXronH9MLYbk8dE9QrqESBMUO8O9dTW39X9h/oesjqyLetS1ffJsgvrF6UQU9Hv6ylD2bB6ZhGprnh9JLnecT2S9Qekmwrq74LsErnlelFUX6H35Y+jvikAy0ome2P/iTwO0kNaL5frHdVFw3rK6rbXO6nrUuTxiBVhSFhNFhbZlHJ8OddHBpiRdT/KTtCrAD2umOTiRtl9sl3rL6jh00tA2YGgzw/lOerRYF0g0DMOdin6MfWy5Zblh7LJ1aClQvUOiFEOgO7rukzyQIu8Va5/ZbJzyPag6m+g2CW5cllbs0ByEhihE0OV7WSyvhSRk9oAqI+ubm1552xbuP5bN3s9irYCcktie2Xz5fp45dzLJ2d92mLOEtaf6iPQg8xm7Oo3qxORFzOYZZDlFEslFj+rITFjIW4F9NGzPUPfeET1VBUu5iq4ZIIkDyczpvqM2Iy/mg6kXN+hvpyKvV6fenKzqdspqc3VLSlrlEk+thTxUPUDWI+x2jixpUVMSJI1Lqg7pr5FEsNYWH+u+xrBPV7sID0K6mPs13GxvrKDj2JoZd3VaogvLXaC6xFBXVnZGFCtojwcEqdRL4j0OaCeIU5x7mzvsZo4vSrdtvLJ8tesZ7WYFxEnCeqKE3N1/HY64g/blgOI92Mwj4O2uNXMiSeWr+uOl4t1R1NfWBjc/9Sf+psD+2G14xeHsugWsVNvp5Uxfs99cnhh5Lhduz62+zCTYWuGbhzFnMV9Udyq/EddY8F4QXW46p4lUOC2EKBmAv0bur3BTaL5Wgsb2ult4QCIHxFLrhbOlxp9O9mdSLSii1fU3cvhkOsVL6XGENUQ1lusnlKN5jQSIdAzbRsVEsi5S3oo7DkUDxPqA1PzrT9LEtZpYFavpujZR3VfqJECW3gpVl8igrZtmArpSotFFqeC4serty1uZdCepK0Hy4lXh6g2Rr1mvT5Wr28PQqOPambZ9wNkkGMllrCo4ZU3BNuB6uRKNRz1LBQJ4VBjp/qucuBrrGb7XiKCusCkcYG6CYlD/CNlNWVl5XsSFBS9Yog9gCwfAnK4LRZVc2Kfq8tZ1xDVoCSNxNU3gIQtwHU3S9wbGzjCUtu+1VoW9MdgwUZ7p7oaudpCuWNZUpgcfPBngHab7kQikGzmIf5mATuAf0wR+0lgT1/fXY462YXbU6+unEAfVNuRur39pEucLctquUy9cjPKZnjV+JqJcGPj3/MnAZPX2TFBuxq3Q/WlZAbB71BPU4upkdz8mzeAliqArTIwN9MqRlI3GftLNWSUL8xY6BWLXbB1Nev4+Mk0S1csFeBcT2iN0IpH9GK4xBC7yYy8pJkjyWMyiO9k5skPwYyU+Qt87A70expAk59ScSuatNS7RbX8vryav6nLI2xuzO1nWHoLnT3XsY2ImqO0fd5+ifWUlroh6sd2EuFo2uEG1qITdUl6znXxi76ZODWogabnVbpE5rLFkMuDtz0if1fz45F8kZjDYi3dB2RpcxHXRerdSM2ROkaM5EoXQ6MDWxe1CBIn2fq6F5R8AjDJMSi+RO6d0B66BjhFUk3xBGQ3we785Ejqboy9UrdbTVnA0iJ9InG83SzX2N7Ccfda/krQjVlXWBM+shOipg79C3940Bwo2J6sqTJY2FPaPpTjY1+4GbIni24LPTmy/coefkr2ZIkqo7p3tiBffYlZPNmjdutqICRfV0jEzoLfOEgyqwhBwTiluq4tSZYkl6or1U0oEQrp0VePqgZPLH8xm4vuIdCOrryp5cLFgic5ZpK2sqbHst3qGuk2D/OjD1mzbvJ4yX0OaE4ikWjRuLym+ghE8vKINUqGsZ60wiOWrLutaN6sd5y6hJSIKM2o77vU1X/6PtX/dUn+Qx11Xd+lRFRDeKKa9lM1X2q56l/Vp+a6Ork+zFLGPNasYeBchnHIw3Cq6d55GPKYx3EYz3kYxzHzOOacMxcuuZ4TDUVBLRFiqh/TaQiAioKp1yGJYlpQQ5YbFkVGau6gR8WtISsQUoo9atRnYoZBQz0AHO0RSLYuMJZnAsliAhBUyCwieFhNmsOom1FviY64sQZ9pEdc8wezC2Ks9DIxIm8zm2gXwvHE1eyDJRmyVYvGbJbwmHEmCymLbFrQ1K9Un83N2Wk4pgCJhZa6DHo7LRe3Y27Hmj1ujvxBdoOcN70ZASq4ZQ1ooY+7ECDzMOy2zGKuyELMqQBGqGLBIkyyBrsKNoSj6LpQMx+GO9YrJwz4BjX5U/xM30TDKkSzH6DekMPMS9qJBjQaJKDLoHGgXbD4NLQLkb0j+8TMXb2gbI+JEaZ5nDoQf7LQQhhEzC22YnTfZSG1QJPgMTcr2GUBsGdUukq6qKSJleGr4NkGd5Ywto9WgIMmgI3ht+H93VRZcM+2YamUYlEQBkpXrXfxyNZ/1U5XZBOWNphfcrDYYge9EIpIyraxBop2mtuJAZ6GXeaM0Xd08uRcV6Wa8MwOhVAkmeSQj4c6BTFFvlpDSnL7IeAVB9jiuVRc5+RftV++joab6KPgCBYl1hGrYQGF7oriGSkbZA/uQ1nQfElB1JO797CAXa5Xd6YlHfgoOPUsl8M/C/SDmkR5aKJwBOpzIXP2DstBywbsmLqxqCFSjbXQHr0B0+LKMIJD9qczsWBo8EvWn6JkFEiIEUS2c8CGMslhptgABbQ+QooSe6BOmDWo62pcVDpfkuQIG5CdUjdBmkR4rkTVEpM9GmLB4urhznkcuYgbrIeCMKVuNuuo7xb9vJ/N5v2in88Xq+VsPpvN5ov5Yj6bd7M+9X3fdanvKHW2LLY4BsL5s6oe3UIQK9TUD9EAUnaSAgOEzaBKMKRnrv6/5NCFc40GuOSx+uIhn8/n6qKPx/Op/u902J2H4/Fc/4z1n7GItwYeq4OvBxqr2xf3bHGe1nzUJhfP0FgRb4LYtYHRuyWR2IyS1zIIG5Rlj6xYJFRD8KLRkW80PxueeSjgAIaMqrfWADr8BFKcNFZDaDgFUPGAWr1UUbQ5ajea08IE52Lz/ohu3HThi4KQahjFy3t0aDvXkCEOkJv5ESwdZk+BNS82AUBgWeZy7OhIOUmLJzxx2hpK1tcUxSrDjbFC3eFluW12DCMHJY5moD0NGgBPqe2N2OtjmkpJnUuDe/TsBAPIYwgsisltUiFdGgVTdRvLsmNYYoy0ahJrx+2il9ss7tLsCNxuG+DnqJ9VMCSztIjTc2YOU+HFBHfzAeCoKeCGDWHAii2x0Fyequ9v4QeZq3ZfjPPVpSSaVi5o8KwFqsX3erGPJyn+gdTf9PGVLNlbMl8XsQRa6iy73HBlcwjmPs0/TpBRQ9rFBxYHYAONs41s66PbWUFre7a67WQ/lyKXavkmW2aaJCS00MbqxxrlAKmpkPRQkOBiYX8xs5682s2GATF5ZchrQpHkWtyoiI0HrTXKsLDZMSXE5qJRU2vSXNBrq4ppxwmBdlCg7SYFBot4Rzsx4r8sC31ssTy2nBg7CUpLUesf4N/Utwb8QLYbGppWgBPb4fcnwlYfBMc/0IJ8O8gYEL+tHVk5wgprgWphXfYimLUVcLW+pO5bXXugTvbbrNUQcUGo8KjWNoXioFGjFhWTXmDdQtUBF56G3p7wWhRieGmpqWKRHQQJElKX+n4xW8yXy9Vqs96sNpvlar1cruar5Xw+72Zd189T6iWDlSCx1OQzj9Vjj2UYxjEPNREdS85jLvV/8idn+askt8XSU4FoGLOBj8BSBsPMhsfrguij04QZU/1XliLJnxoYaKqdqF5UzbW7mmtD6roaXjhKlJnH43k4V198PB3Pu/3huN/d3x9294f698PpdB7zUK2BIEuJupRqbE3kTy+heTTJF9mKyiU2sFSDyPOMXPyRqokqUo4XbgZaEAXklRCPPzGzVmOMcGL5Oyg8IHVgKUXo3lLPaomC5xBaocdmpzVyMKS81YI8RSJjrThKWixrFnKLlUf0CKAiZY63q+nQjEkuhiPGd4aDRebQ0IPJcQGPWR28Lg2znf6xnF3rt8kLeQTtrTyb9MqkrhvBNIUAx44suvXaYfPJ8XFeSGq/7cFDUfsghRy/DCwNLzH0BIzYYBmmpXBS4bSqmhePUIvBAoSIj6ihGRVNCthKLmymLyuHw4MHqXWwmsjIfNpXZiS17GB71BLcwP4d9bHlNZyGJfkWlFg3dXVgKJch5U90GlHg2GaRCXCxvhQ4WMvRyQhCgoxaZUv2vrI/FFSNEhGIIZOAp3jMK2ix1jAmOABMUi+cBCSTjYZRBWm+y8Mcq4I42K6sMCvHuHeRRSrTirABquqKrL4ViK76AmrMLfVzWlIxco0eMUnd7LmGp29/DG52vtO0vhVUEYpa8CQONBAnXu1BBUnUN7lUjcWyJ4sFoKt7yzAbrxB7EZsfoVeT4wFOfmrplQe6aPAoYSHqqkkzryzlu4apF0P1PcCqx1wOtkPuzbV6GhQAuZGq9NlSeHUU0pGEmShsKw8n9QR7VduxFUFnWgWL1CzzCF7t1RogQYM01HPJsSMWPgwaF8PBB48jsG0R5WxRqc4vSyrDBDVZnS8Wy/Vqc3F1sd1utpv1ZrtcriSvXSRxsZlLGUGg3uE8nofhPNQMMw/jeRjP+SwwMHPORbxT5qKwoccvxrFBT3b0Mv2oW3XJVlITCLIsTes1o5BEKOAfskKQBJqakCi1RAIII5lUpymuOBHVu+z7ru9n83mf+q6jWd+Jv06EysrhMZ+H8263u3+43z887O53e/XK+93pfByGseRRMuRUvVLSUj06J8oLRwRKIpL1J7V07O7BeTeWfhR1Bhx1TdkB9U7NnRtNSgvJbgy12i4sKMuLHCaQvyJNzqDySI3B0U6N5hoBKDkDQJ2+FUYELyK1uep31X4aGkRePmM3oVYzLJJ7o5NYrRpq6KMX7/gb7IpbQG32QqMaq4uIsc9s0T5rIsMWmUdYzI8cdlg0bG/9KB5wyshkZcT96AKo61amoIFtkyKsPcApIostk3gUYhhrRx5HVhqExvxiIJzKK/flmUuRRadSw/KaExbIZMgKWjVAzZXmgmicGGdUBMpRLEGDQLkRH9WS1XArwkpt0RrPx/kMtk7EkXU1e+7PVwhpRulbrK68VIr1rJj7LI0rp9fF8qPJxYCVfOMKrawwcSj8yEkx+g4m+M9iPIc/jWaIDq+EWzMMgZ20O6mUmOkE5Qgqf03gT2H1MNf0o8hZIsjF+TJsEShGkGCwdhRfGWnqctHX3KCMyG09xuLJ5rWnZXihA9B282oZ2ZFqmq4retmFIz1VPCCeo8NU4cSdzQFuuBWBtYCcCBpDOThhbPZdad6OXgMG2NQA5yn8T2aV2ht68YP9OBdfG+MPeVXEAGd1hSRuUWv+HPCaVFUlsiNswLE4Q0he8Lf0KZ6MYyH1IBJGoIbYSlnZShDCCKWoCfhd1OvPEovkXEpGTER9zWyXy/X64vLqcnu1Xa02q4vNar1Ks76jHgHGkodzPh5P9X+n8+l8GOqf6nzHcZQwJrM9bYUOUOrNySCTGm8kNVpa9ZJdok4k6eZUHFU5rqBEZUSDL7gdtjC9bBwMdABDy6LceLUWCZER4eTzhBIieySb+WQDA+ojUldKHXWpq555PpvPasrf99183nfdvKNUU5IaYpwOx+Nud3/79ebu5u7h/u542A+HwzgOINzk6jNRcAOqoUOxDKymp0WrqlrNhKjHKR2RPdFEhtFRsTj95P6JiqW1tkBFF9DOuSw6FQYj1QWWrTyM+lKpeBTFu43qoWGa5ZtqWYu1MISBrjvPjw8LHlQE1CFbWYyU3OIAqcIQe+7scJKxmpzG0Yp04XT/Nqx+7D7NGXqgy8gT5kxk655jAU4qYG5sIBAf5EnuN/EnbpQnCYT/1MHfCX/V8E7FQhUvmyT14aD8OdRXkOD3xYrISBGfTa7V8zSznWV6TYaRYdDb/H6m9DY7N2i/jo0a68FBBB9R1pbKiNHTHOCGrIijAfScG0ktCurs2IpmV+w8MxYIOsBfq45rsQOjJcBWt3iG6pVL0mqXV548WkC/1lZD9Zs0IosHRQ2/bd5hgphGzIUtisKWG7vb5lLDoOK1XbAmJ3SIy7NqxeWc16MtGi1PMJY1R33FDZ1zFmxrOjzVzj4DcmP+NV/imSUYJdRO54RZDnbIvRSLDV8ujSnGsb7K1VNaNzlb83Fk6tc2AQK8HsIKCiqJmhX1lX1TFD4xLB+M466JklLiHJW3So8gyn4usa2jELcao9kOiFJaydsBBODJ4oCJG/uE/AgK01EcjYIdWIMpgYW0ahIs0hqP5mQYCEp7nDNA1HphPCsreBU3L8qDysAl5zwahpTSYrm+2F5uN9vt9dXl1eVmu12vt/PFnIgy8+l0PByrt93vD6fD4XQ8nnMuAhpbNmrlD1JmDWFvB1cWygoYqHwyifNKoCzBIIOg8qL/zCmyzeVo44cxPqcchymjQvvrvKxq7FpoUS0oOEDsCDAUKqmQ5nXstaciMJZW49WQFnbDSZgodV0/m/X9Yr5YzBer9XKxnNeMOaUaDpXhdNjd3d3f393d3N7dfr27u93f78+nI3PWLL/m3KjP1SPHRqizSq439CiQlQFxUuu0cAQiWDHEKRh80jYZ0CQZRbw+JgeKMc6qMKiZWu4Q9URZ0cdIL3ifhrEZxTyThoC6qhRlJGWIkRtPthio2oUCFqqKwyGzsEFsmCRh0dvTKPRxvPXI2hGun1a0Qq/2AiXUg8ABvdMq2B8TqjU8clHNu1pYgO2FbmQ8rQDr/fT0BClI0vwIkXNswLJAFiqDZO2ZtQEqWBDWoYF+j04O8MBZX0Po8KxWaaRrVGBCY4+AoM/FILvA4ihcSztMUR1TREkDKSsGwmOsQJF1JozbiwqgQlatmUYygmKtQ153qP/OllvSGpFFT1HEVvOllUlQm+JZGludUs23cyPBIAvd2SUC1eaCJ0U1gEnKFBApfxPnCZYewCVAq6DHAbT/Fs1upPwXVEcSXxXNCGR9x1aZlfq1pdLUCA7gyaVXHixUaESvFmlRaxKw9sASOS47Ug6BcrYwseXO4ISaRysV5yAaORlaj15ELbF3jP6PEG0vrbHXbK99Frs/sk9sJyoMBSEZFhoPoiZfZlb0G9n6eybX7KA2BLBnBUmrzFn8VKgEn6G1wLrjRM0lgrkS1HyjrtmaeIDujajJt4bDdd5hpkwsYx5I3zTzMJZSCiHNZvOLzebyydXV06dPnj3fXlzNV+supQzlNByPp/Npf9wfHo6H0/k45Hwec1ZAOul9kaW1wXTXYA9LtFFgbEbSzumWWhA002aMPfLoyXkSgK07BSwocySXKfqnODi9SgTQDnuPqLQ4Zu5NfUJB4wMZa1FWNDvkx47AoTNvZdsHnd6qW7qoUrFmxSiEn9inRF2f5vPFfLlcLGbVJS9mXUp110iO/HB3d3Pz5cvnT/e3t7uHh+F0qmFZh5RSsgusdhRaq5JXlLhROcVCUplE697pBBBMGvGQxcsm3IjNYqaIG9jLFvWyFaAIvB3LW5+8L0nRXXA8S7tDW2u/7uxgnTmjgY1EE1hX4ca3RkfFeMI29VzTsS1jvLZSq7d9kp/uZM2b3Iq+k9Ql+MCTkm4whnhiPdzufGOm/AwGkyWMmVvLx5ZrYuHBGprZ42M3hkbUAqMCWBOiewH9JPYE0x9ucdwBfbtDDektvMlGSqw3mAn9LOrpI60YaHGUrZzMGJQZaGAeOchgGZilZVaqau0/8gNvfNM0w7QZIiUEB3ejiuCLLhnwFpEcvyANP6Js2yhGjd71KE0Hb+oQP0HeVRt0M4MQ5ZtpWost4bHVx1EDCzyqe+yxiCdIBTQmEHspBJzsaiZQNwahNFn6HadJ9Kxup4iKhbdhcRRCHoP7gA3RQK8WeEdPVLcYLVBpSYbXCYojZY6gQxQHDDcITMVxl+LL6H4/Mhma5MoNCika0kURONq/jdhQJkFu9RwELRvWg6BbCF3mQZJjZfg3CBm8HqKnRZvE4lna043ELBQ/TAdj0ummxRrKUn6WiJUyeWsCWBuVo6fqTo3Q4KQ7JyiQlc1KaxkicXhgvNbqN3O9qtR3UsC9un7y/PrZk+3l1Wa96RbdCHA8nvf3u/3+cDjuz4f9+TyO+ewkBhLXov28NTRJBQJZjBCGHNXQHJcsREbdjFqTmhQMsBVgjKYBiY2CorIJarNUuwOic+cRVAbNAGKGLBoFUdr2bFcTiWItbkYhKY446mkthnKl1nOpdWkJGpx7otiCX5ncczHfpUodpRTF6TK7m0DEmiTP+kX1yMvVYiUE8DkSjefzw93t/e3X/e39p0/vv379fD4cSh6FbJ5SDQOTHh6p5XpGVIS6oeUL4Urq+Stmr7xZn1Wgph0454JhKUZ7FvRfxAykisswYcxKpSRbZFhXLIlXLg6ZRq9d2FPfpdSwByvrC26gKaEashLUSuHdAOZA2jWLVAp3sHspnDBEkhZZannUA4u+Eq7soJFaS37LNMENnNuTYmjprf9/NPBG4WoK1FGU3lqyLn3Dyux0dNc4wdLQoE0w8VnMo/xOp67U0QqViCgOjPO0X0PcRPIeS60nTODpkGhgT+wiCjGbK3kjJq23arkOrWdLizrK4kY1m/IvO3tWibmOPoH2FrDKqDizyTIdTYZbNBVxjHfJ4Hy9VckM1fCZ9DJbSwFO0N5JrKQFJM+TzG2TRWAOZLaeA55kWhq5GFBe+D+xKPGR4A4YwHU4olRh+KiRfVuTrdPCPYeVtN4g6GIZBFtFiVr4NqlKRPN93EBLvoMCV4L/5PtYQXp3yxNiHTz6srkwhil9EacBo0cj0KgB8WsTNxjkL8+LZKuARjdFVZSK2+K2/BjMabSim3ddaRenqiApn86Ni0mEJCAFN7yT0AIP685tQHr1IcWD7RKtGKhNTkqad84DIk7LFXLodYMovENCG219IAbUKFcJM3InXxYKvIQ5Fy5Sgetn8836YrO9evL82bPnz7eXl/PFApBOw3DYH3b73f3D/fF4PAt1iCBpW7Dyp5GU2yq5jO0uK2Zp0EiTHELLBMm53ui4JmGSDe/trdrfYNpplqdRYFWGkQn+T8YXTQ0kc3xF2S4cHa7O5hVZMcVxLVGTpE3cDCVt9eKMCKOy3NzC+8MhVXRj05sx4kkBlb4q3rZjhzpbhikF/eyCN6alRVrsL4xjyRYJCBaciGb9crVerpbz5WKxWM5Tl7iU0+l0//Xuy5dPN18+3339unu4G4ezNj0Jk4uIemmFYo072WoJdjHsWKdZUu3W0A49sJYHrX5mC/IUMK23kORejGuJ7NmyASzsNSyO0+eCQfrRSVrRWjqBXu9lV0LR7UGQFV81vTWNSBuNO+SSBMtQdTCza1rLJ2cwB2geCBRb1qw1AzaGGjazCzBlbCocmCEIjfXXqFlfnpA8nGYahpSbb/ZUqTUPBF83jDJHtvvI97sZjMPhJlGzUNGWkbhUoGwpHmOxXFZ9AGk/Q0ScSflo0dbtgl8apSQ1bjBR5ol+dKsUEVrTOn5raJtPqpeQNQo0Z6OdcpL3FmyuINR8MMoEZVJQ1ZrKbH2pNy89lNIvbiQV7XhWMKVEtD8BoqeBnz9rCKMQVG7mVlTxim7UJx38iWRPM8rSnlbkkuhkbEXYNVM0wRYF7IswJ0lbDqqLyGjwfcTALrLoxEllklk4YIzMEI1yPa7J6gek7JGYZSXGpYo4x7wwTPyKNGI7rK96g56jILeFiU4753CZE8bialXlUVu0bnRDFp2obZVXdGwA7VwYVhaYPJv6BWvx0gTjgpraGseqgan7AyfYCColCJzAoxgIemODaWg4CA2h7ecIYCAtWg41ui+oGqcoFsKjBfRcEy3QZGvpJy/lS39QHgVbXiw3F9fPnlw9fX55db3erLuuZ4bD8bR7eNjt9ofT8XweSj5Lp3rqpL0OiMjbLYKFTm7ASGUvgtIqtlH71sUPFH0PdUnkpBJBFDoPQg1I0QTH8BY9OY27qM1vRjPVbY4TsxVnjLVdglwg0AhN5C5DK4tZub3G/JAuXi5Z/GhS5Ni0pZiju05lBrPpsGgXtoltZHESKqmoAdgYXQLS883exqTSE/rmARwVlQzVbi4wqRpKXd/3i9Vivd6slqv5vE+I59Nxt9/dfv786f3725ub3cPd+XQS8RJpdkoUTLQguKCtCHp3qesTEWVLOYo3NqBL9khrkiqPSb+b1S48yQe1ZMXUW2NDl0Zp8wfD0frvugoNxHSoGUMJQVXDiqIItjW8+ym2vCObAN6vgZ5CtFgcg+SjG9UaOAVCm5S2wDRDJqU2tz5TmpXzPsykNSrw44JbSwYAHtnEaFaZcMQCw52kVUF5kDZWRYkUj6MS8asmuNYeCwgdB07A9gZooawKroHR9D1CdY6MSSKyU2zdtESbmEeH9igpMFMMEmkzRhFalGhcRINgOVsHrVWeoS2NBdhOvFPiA+NstdXuI6PC1hcme/rsRCZ4xLH17RZ5IlgU96g4q/tYm0xsscm9UuSVKjsxwUQeNSdNu9Mb9856SDzPdu51YaslTBNN7cLQM1GsfizFTItPlThqsQwVIya50pbtQffJdlIk2OFobrIOU11ywkjdvH4bsaDj0O1QQayFw/CKjRA/plPrx5amSdmCbw96yI6ut7Zj7GIP/m15KXqLySRlnEEbeRB5V4eXvVsqb4Ig5kGsFESIwZdEbOqxCgsb+d/qZ9aYC57IskHTuilVxEDJTEV655Ba16g30AQQJ0esnHMWvY40n19sN9dPnjx9/uLJ0xebzQV2dB7Gw+H4sH/Y7R6Ou+P5fBZJkprIU0rS8kDK1rQIBKrf8A4lo1M7si2/haYTklS5zH6qvwponWEu4UDmyuoqkTW6IAaaVnNBCrm4SDnAGnPAKlFkgozsrr+x/gxxRK80mq1TorMThM04m0UtxdspzKfK75HjQuzsy4ymDubq7JI7g5ObjBXMhjlrziKYZ+GmRaetZFk4Xpb7sQCySEpC0i5iqSLrccWuZserzWaz3qxW80WXUhmG+7ubT58+fvn06eunT/uHh3E4Czih0mAYdAi/M8xaPSc7wRJGljLNe8ylFfImzCwskvAmbHCtPspUpA9QNiWhE40EIuRQwNCwy96gWHGGdXGjpqiFFGsfKVr/L1agRAw9aVEWN510eRbhD1zQBCb2XU1N8XJNiYDeeYdilDT8INffd4QPmSdlP6t2f5PrtuQfJ0nGlGXtXkH7kYqRfqe6SVHEit4dcFNFBnNJctEIiQrG23qIUKx9iOVSEzYRRnRkBe7iGpPQ6A0uZ12MButNxzwVlbQbIZxw5C0nbneqXtn5gpK9gncGTRo0nMLhrpKDuqOZYym4WF0qfI1oTfAqIVScPRac0m8S32YquOkUgAhkG4nX6xWTDHgSt6Erq2GAGR7TRCPBNPAPXTq7fDWMASWxt5wondaspEEw0UAGxnQ3rN2xV5iwNxxBbD3aUaqbOESeoL7T+MAuLbRI4sUet1i1j4z/gpEEwwTmhhZIThY8ljN+zd64KGs4GduboRWYKOo1qqicFSoTm25y+R4Dk0l6eWjgt+BMqxbvs7cnBQVXZPylTla84KnmwNr02OTSRF5YCdfmsL0TzG24YBdGMmMC8h2I7ojE/JcyDrkwp362Wq+ePn329OWr66fPNtsNpf48DrvdbvewP+z3x+NxPI9FpyAgqUiE1repuHKH5UREyqsyPR4/ORJ4deLOfGyFWVPpIxJtl9JkDkhKrca7Fh/WsRHWTCOO7Ykr4Ygs4rRhHZaXkRbpHeFwhXf06J+s08ELJY0rIMiVLrWJTkxUiFBrs2jl0lKsX5bZT7k0zkhImo2iaJz4DDlbL4juMCn3Ws8HjrIppPRb1ymDdVOVYmgXx4wLucWsfQg1dUmq2a0SCOKPIctLiaDv5suaGS9Xm9V6tU6QhtNpd3fz8f27z18+3Xz9ut/tSs6EkLqUKOD/osr/ARmy4cHhrpQFraw8NcuTAJe5dQNrkYpV6JJVsdskERV0oRDx0HyaogrI3KppZmk0KkLnxEX3npEZjEkEE+xY90rxvFqZOh44S8dAo8mznxWOvtMIB9z9TLOyiaq2k80gxH/C6LlTxilqCf+ZFwhXHXZvSqz17LFpD2l90GTPuR0sE+eF6Jk2FBBU7avAtB3GhyVEdh691Ibd2Q2V5lwgMhOvl1s5mR6beofCmx8KhILBVZUdvnaZewx0VwNAY5l9s2Iuh1Bwub4qXja2Z6KAE+N0xZvzNRuoHU3WXAbh9Fp0k+RCpv1VnrRN3FrzPO1BmtmPog4WNF03xx/k4jSpY2kaK+DKXlbHaOUE8LkhaqoS8xjQp8+8YcPwybFNgEm5ohEDJySkR2VrV8LysB+brw23/JjE0IItb95r+lrWrR3NU0GGDY2YRwxnG+AALgcaSrjADTFy1XP/iejjSYLD0TEYoQZr40/obmi9t6h8hocJcn8JfGc7J8oXUEimolllvR32wOThKA/G34mmoIVIRWhhlKzbGK2kJGqPJdfcc9Evr66fPHv18umLlxdXV/PF4pyH3X7/cFs97+FwGIeTtuJL9TgZH1soKbo6ZIC5PbLknGQ9zXIjRMb5YzKISeATU1E13leyfEHU8DNTIkqcqo1U/lUIsRr3IIkcqsZgduPagN/gOSO3ap1YUwzr0UIfBsQRoHv6EvCgbo4aELnGkBGxlGwqlCo/iMwGlxdTCq2BVGYLEEbyyEv8UOaSLcWCXFR1SqydGCjxCqVY34Zic1rcMwunJCPNB4uTM7I1KdSfjJrEqjNT581ZkWphXEM/Xy4Xy+3l5mK5ni/nkPC8O9x9/Xrz8dOHD29vb76ez6fCMEt9l4i1JTqKn9o9FyU7Uc0umLp6tVlqQ1QCwrOSDDd2E0sOakwv3Y+jDz6LtYyPC+clGWyxbLWYhDYyNEYR+Hwz8LkgPLWCjr156hJ+SWtj1OoGoU7v4WpkqROqODm1CZvxasYuiMxGSCDHBL2Rf4qXW6wHU3JLKMTYpC9uLCjDar2JI7q3zEY61GyK41MDnKVw32rc4LCjtfsAOipGlsi5hrTLYHmtwoE6ZsM1zHKLLEcr/FnHj/WmydIpvZyQc7E4oExgas3mJM9GwxhdQQK8YmYlVZv+wm7SoeBifSkqvMpzTdrEbWFMAyBCGgL8AWr3vOWAjovKYCl7HqYBhrF9DDo1uJHbQttm9GE+xTuZyARnHl2NgWHSgEzgQKmqkBNARD8+GA4Zs4YaEJXbyC0njXDeyOYoSxB+rHSrOAMExdTYzuGA2aYJuhYKtFosxgumKALH5BD0yCKYOAEMoe/ECLAchoL4FEF9sp6cBI+IbzyRbTFGFyl23MYXYNBVyd1g8Wo2audxYzKgU32MvuDtinqZVqkxjx/ayg6Wg3Nv5UqSXriRsIRMYZi3Kg8i2VYuZYRcMhJeXF49e/HqyYuXz58/X2xWgHQ4HO/u7u8e7vf73XgeZRczJZkjABOuiOwPXYkUzw0NOULrHqheULWNkhRzdRRjqotBer5T7BAhhOi2IzSYhdj097tiMDq1HUWkg0eEmiR9f4GQqJRVUKR1AGVsHQ4WtHItdRCSBXpNNbQNyFB6qox1gqyUMYQcxVIxOZmNwWtpbvW8Mj6SFSGpUcOofR3aEaTqSgbRwKiHSsRLskG+xnmqblXFsZ10koWvWHx6Ezs6VgpkicNQsmnPwMUrQ5sLoZ3+hTUzLjJ+L81Ej+xivbm4WM/6HjkfHvbv659fbj9/3t3fS+1Digyi3Q1OF2F3WsVDC25NnFq/IUsv2HWT0Rn8Cq4aQ7pMGEY67MgGaUaWGWxXju44ZdVooQqMDFnAtbKo8T44OgMfBfuqNGiDBUibPUyBq0wR1GnG5F81fq6hcliD2QjVQ32owdAUyHYgcxCV30gCJpg0tMoG/G2yPAkpGp5pEY45XobHZAdX6pPwjp3YxDbug4JebWLtaKLxap+dHWpQheSj+kMNGjUIz6FUTPoCIwoQt8aNSUNmFKZqgpB9hFGQZcCGtTFTwzY9MlEsxDiDbHMg5usrnMDacuBV5HmS13LjbjEH7t2Yzj4zKABm8GI3No2mJtzDUaMknFSrQ+KqIW/h9LWFWSCflGw1NWEyBrTWE9m0ML3UipPQLtLMR2iAXiIxTB2cXaVvNpyUSlrt5FGAohy3KKZYyOA5K/gplNtmbl2yhvaGXIP1Qz1C7Kdk6Ud7XD9IO0F0hTHZrtU1TBqBeHoniFXBSQFIM62Y9sBBOXMExR6D044p8HHnIZOH984DDSoIeTN98V52nVhszkZjSRMLYKsNGwMSM2csY+Zcum6+urx8+vLlyzevr6+vl6vtMAz3D/dfb78+7HfH05lHUT2UnlyddBSKKkmHKhuz2PZEcsFrJX1TjVrYOwchEaF31CnO2pG+HqSUTmoASYYyJLHWZF3kRvxNSteSJEpLOqLvav00iDJhUdal8/K5VtS1j05NTNTeyRSVG1NED7y6Xx03yIUdfiRt+UIjZJp2KZNaLN1uyo0CRz9qaiuRKgajSavxI2vvjDKpLVrNRn8hhdUyluwhnOIpRZyu/iN+V6Q7RN6oaDm4QEko8HUZvWRSXHlL5yoyaxcL+/BjNusr8zOK9JWJ0hilvlsul9v1xXa7Xa6WKcFht/v88eOH9+9vPnzYPdzlYaAuCXGr1eSUSA1USvQbyjEoNgDCPJajYVY01VwoG9O3mNuyKCsX4OhL4UCCPfPw7ErHVoeXngJlmhA5tdnpW0YMYZMcwolau8XpxpHP6OL8gYW08s4jQxj2r0CjGFqqUU+BjQmctMN4Hssl4kIwcJJ9zG7o8qGOHyCIQjQ3JDo4WK183XLo4t6CpiGM1gA0+pDbDGEIAGs21FSb0H86wQC9B7wUp9na8WYOh+WZVzF55SmgINWA5HlZC1fcLRS/HiaiCY8rFJrE/Jbow4aJKImknfP1NVpyB75HJ0iIb52JaSandDps6iVxpwH78Fi3cjwNxtBRHJ6WeDkIrt4pFPvW5uVZx110pqgdJMVhrGbQukzNb9l5QJ7KlcejbZS0QEJURFvETYILgKHFYQy7CUUQIoCbRIGxswAfDy4SMMIBXYrZYI2OYI+cJ+OpgrTeGAfFWZAAntiWyW23d1F5Cl1fUuRCVBb8WYVokAebxubxSf2O1k4G8tl2tTsi71ClnPTEUhsCYz4eJ8G3Dc6WqoGWiFFFEdVHInIu41hy4W42u7y6fvXq9YvXby6fXFM/O5yO93f3d7cP+4f7YRhYmkQSqZBSnLei9VfHh52Fr4IZ1X6qBHTdpzpEm9BMRdISmTD0UsEETk6uSXD1tQmMA66vr7mVKM+ROHVtm60OGM0Bg2h2K/yGCToTAysdGEU6OVecXGVO7YvJI4H3eWEGVazUVSTOVigHZ7qxzRAxWrt2RMQzUg6UInTJ6dearStD1FpXmKT0W0oGHCXLsFKxmITiBNWi0wzkQ0eVWq8pKlVnrHqZyFmVJxXlFiBaPHd128XHyBUSr6UtmToQUYvCEsmUqMWK+816qQIkc1G535pqK4ErZ6aU5rP5arvabrfbi4tZ6sbz8fOH9x9/+eXjhw8PD3eQB0RMMnJKG7ikB92eGzf1Vy4O/JYSZ9LpbKr1Yi0irKqK9VbQO2NQ+m6raycTh7PZlz7co427Ni+IRhnB8LkWh0t1hk0zFzyVC1GKEhktW/NTgibYpCPDbZq1EM2Ki+IqW1OqFK7GK/UWz8zsnkskD+gyGOgRNpeJJ43h5ZF7NZXUCRRgQY1pvAVlqt2tI9xNBImCsOxRkuFuUXw1ZMhP8GjTgrVBGXSn6NlklaBqql51G4urN1kV6cMvOjzA+4HR5Ww932qfykGLcZU6h6AcABeoDb1sw1PJx4Im7FxwsblqfczWxl+8+Eo61tJCc1eta9wAv/2m5ub2PhpPbO2LP0KeBj7cEuYWubS6jcfH6l2shUdofDrO2K7G02bCUGehyU6aJpNo/PTCLpPjfQVepYdvkfdGRuBJ1owBRUxi2GnE2Apy/qEc3TV6jB3onXTToQdzgfZ4aaJFAz5dBqFQhGK22QlzKWStoghe+HWIG9s2snSjRSW2h3haD4qmU2oqIuAziGRSDUYshg2dNtzDKIJUjK/l/UOi2ExW2laZqmphxzzksZ/Nt9snL16/fvXdd9vLJ9ilw/l4d3d3f3d/eNifh6FmkJruolOXPXUiu12b7+suB/xBQycSz8k1ezt9jdR/ElVv7eQB6lDcsyA1KgaRUMu99a2STNlSTU2RnBQgT8IKddW96UYImlHUlGdgHHmMXcup/ip1XafDfvtZ6ntM9Ruz+aKbzSlRN6/fZM6Jeuw60nCDKM1m1nIu+KpOnBWIFrhmpJCHsQYy4yhzf8fzeC7DgDIOogzncRhKyUVmAZdSxnEEHmFkZWXrZiDTOUsiy21C5AIag9SANRXmjDa1rgjcXbTPtR73ojxkVV4uwAPq0Kx6irMWUV1/ISvYh4KsGvAnSbB0UWSZwqhmr0hMUKy+CqMTmqXuB7lwljJW33fr9aomxRebWdcPx+Pd1y8f3r798PHdw8MDD2dZ9GRyHajzq1E1eqyBBLW8DR7emr+QPAdcrcF5KtxYET6Y2/TmTF8OjGrh2WBU0uy8lCaib8U4ttAIVTy29dCbjBlDVEt94q8jYwTN5EwPvlpvcjKAEgriuqwE9602gRuyaLp6hHJP4fHGo7UbCGKRdVQ24bZiGWoTC2yKClY9Ld7FaQMlvsG4G0Ru5VfWDvzcumEx2nEx5qUVD2M8jGBDqbzvZQLi6r5OOCUFxapYUo5ck0ClbhkjyjgaPh1rSif2AoVHXxoGLjeX9WA4EmiLoDPYpxRgaJOTbYLiBJ6YALeeLiuMPkVT3cnFvGJuWRgFRbG1TIWAE1t5GL3AL1X0uD0SnFVRTRODiuQRAB8L/kzL0t4yziEk9hghmLpEbD2+QblrSeFUMgvcUUbm14ZpETGnalK0+IkNyee4TqljsCM48O0fVKqlmLVAl3VEjfFo0W2DRSQqIcVKaACaQCv24cS2cZyV4FXf5NRCL4PYbC1JgkSU3sNEq6vqXAGPJ3T9yYp7XvSCjAWTX2rmcRwLQXexvXr28vXL776/fvYMOzocj3d3D/f3d/v9IZ/P6nBTbHYlZhhPWGFXTkZTEXcoDa/1UNbUyGroSZpmSfBWEiFCQYlrBN+R+mx1w0TEikuTNkWBuu2SADo5Wal65ZJk83VWSSq5gAhu1QgDgedd1/Vz7FI/n8+Wi+V60y2X8/VqvrnoL9b95qJbLrrVMi3mWL1vx51cbN+jzAamWQcyPFAn/FHqao4jqhTO/yCrwzp113ItFWuqiaGo35axlIxjhuqPBx6H6pjHEYdShmE8nsb9fjjux91xeNiNu93x4eH0cH/e7c/H06CjCM+noYwAxqRKqVMyufgsyUGxph5ZjqqEASUrmsI1IMxyuEcTBayHdwTrgawLJjmZ+OmSxW9knbFs7lahQ5l5KJXTItiJ/kr28XXZHBtpxTrr6xlmfb/arDebzfZis5jNz8Ppy4cPH3/56dOHD4f9jnkkGQElODyLmIbmXAW5K2Q1YtXEAFdiE6YnehpVZHKDFdSA1DlqjA+ecIpCmHf+BNfaDGs29Aoi9gWIqqgV/RWiRGetcLQcJ3366stKm3ek6GpyEQg7xqEfwNFEb3VwwSVsJHIksFF7pCawwa25kVomSC0JV6ukXO+G3dmQMysOtr7aSUnaE9OQ3rUOLTS6vDCZUozFavCp1jWsS9SJCOaCOw8nStFGb/Z6e5jvokOiE5tsdDFwCjQaVAKB+1aBjSYpk7cATuwk2CCMZMEPq52EyVq3PK5e6WJ9FZVWjJx/2nbWCGgue8HTlrHWjDPhY3k/UvRHtF7vSe4bAv8YfN9AM4RTZTxxVeHWnlB2+lRSfEuGtUjpSCsXUzFV8H6NqV9syW3x+kNEcOq0lH07GSGoDq20RNfjwECMWvwIk04lHxQwyb3tGRNDC8XAQRQbxOWi5+Y8wSU4TOTA/GpwaqbZdwHn6zIHdBTRavGS0uQr1wa2J1ddu+uwwPSRqjONQcImXlVc8kCgMiqE5L0AXoAiR571uWrmKqNvq9NarddPn715/f2P1y+e9fPF8XS8vXu4f3g4HA7jeJasklJr5tKeGJ3s6pJRjEmCZEhFs20yaTd1qIrD1xxX+ixZfh0ko6VOHTBSEg1x0hZeyftIs2TZQAkMwpacTjK0nCEXqXZKAp1Sv17NL7fd5Wb15GqxfbK4vFhfXvXbFa1Wy812drHuZvNu3vd9D6mvt9V11ZF1CSlVn5ZI6GEqsmg6a6WIOyk2ITiXXFPpXGRIImuKprP/ldmD1NUYRWYX9dWHd9jpJCNhXFtIaL2Uav25vt0I9T+5nId8HobhPJ7O4+l0Ph7zYX+4uz/e3u7vbk+398ebm/3N1+Hm/vD17rx7GIZzXQcx2rkuU+LUac2nuAETf6wq+5x9GvYgE7llhqrZv3pLJH5UTzLp0CLhjmn+XTQDljzbT5EKlCm8IAOaTXpCCTpZCHxCtKaun61Xq6vtZr1e93133u++fPj0/t3brx/eH047ufZZ3QVKWRDKtOqSe7YdaKyRugUiibnCzJG7CTTtQ+eVOqwDiRObPCc1za4AKKPzcJKros9ksm4aFJEH1lkfMnIgJseyqfCyRyQ1X/EJNWVCm2rw7+PgvoGIDrRzE6WNnIQmwCs04+nGvDl6xm/gw/jCFpG0Ev74Kkw7w0hugN+kHw0cD2fiArX6AyHyGRtLgAwZS+VcfjtX0JIsbT0qLVsxAXDr3LHeuJAcjqqoFUNVhpOAxxKKQqrQ1oawGp0pAFmn+dhEsvq4lutL1kFvrekUYzI8wyRQaUV8zyJVaSuK/G3JqT0Wg6GLydHHAMBvvaLzxczGl5AQQ46KsY9QMIUizft1xR0mcGGPGKQFoTEBf0Nliq/g22/wY/6B+9Pod9aOvyjNeHTziLI4kd0wkRkn5nlhFB7R/iZrbaFnQC82QiORN4FNQSFsZH+OTF51+S1Ow5ghwdrWhZMBXypHUG0/qVI9GVUhGpjs9w3z9cYbfeA6n0SjKVIJ1VBHCQq22gUpSOVxLGPpZsvtk2evf3jz4uWr5eryeDrd3d/cPdztD4cyMCWsjgmSDnQLGFyNoNKSfcowdFK3JR+NbeRkFe3DmqNJaxZ2kjUmCawScIfCGGfunA2ZFMaSk5gkfSAunRRFc66JOtTkr0/zGSxns81mcXm5efrs4sn16vpqdXW13G5nFxe4mPezWTefp/mcZz30RF2H1S1Vt1ggj+MwjnCs3u10OB4Ou/pnfzgcjoeH3cNut3t4ODzsdofd4XA6HE/H42kcax6a8zjkkms2y2PO2rhbnGJfVztR9ec2X4hSTb/7ft738/l8Np/N58v1arlcLpbL1Wa92mxWm812vdlcrFfrzWa1Wi8Xi/m87zsZBJwSJelHGHMZznDOwzDCaSyH4/l0GA7H0/54fLg93d/vvtw8fP10/+nj7suX09eH890uH/Y8DnU3dD12CbqO1ZsiDAhy5Zgl41LMpiCO9VZqMDNiFmQ76cyKQU6HOlelNdVv1g1RQ6ksiiKim2q0aZd0UTFVcEwRleGVx+oau75brddXl9v1ejVLaXdz9+Hj+/dv3+5ubobxhKmGMMa4YqdYqTKnji5ywR/W7gDVtwNvRtL5OUpB0uKjSU5KnmxWLhUoTVV1yknxsN6VSb81R2xTNiCaUzmE+xRdTMEHCCkhQxuVNcAm/RvhhFdom7Sspb3YxCRxQhR7lE60dNvy/0nbEX+DGn/r8idk6XAAiI9gPwwV/WnW2JKiSQWUjU7eWWDG0VmD1uvts8KjdQCCVaxZZcs7OcD8RxcTVCQLZEMoQlldAumV4lGFsbJNbcr1QKCR0ZwQtqwZ8IT2bNY8Kg5RhfSIbsJuCi+rxVrEGDaiWmvFRKx1MyKGRri1k2GLP+Axyg5NS8qlVHXMDzlCygFy6utDI4MgKjP0bUM5cuulm1TTpwMjGeNmIfZSqK5EdYFdxMxJ7MW72iQyZaHBqBKg6/Q97niGyOpExZ/JYmubn+X1HrsxAzFUSlgjPXTnrtxBirt3aWDRKDKCf/H2Vj3HrsEJUweetGfCJ57ZMFqlmWPB4kQwFasShWBvVi3UytUeLdcdoAyb6hzHoaZaCHhxdfX6ux9ffvfm4vJ65HJ3/3B7c7u7ux/zuS5cSp0JOoLwh1vbISluwAojy08lZE0ucZHkFoRIpHxmrWGaD06EnbheQkuLSbrCk+xF9bhJKcJZEk/JbWmx7Nab1fXV9ctXl0+fbJ8+3Tx5Mr/c9Ffb2XqD8znO5jCbQd9h18mMhprcD8Ow39/f3u1ub2+/fPn85fPX+u/Nzdev9T/3t/f397uH3WF/Oo7nU85jljYbbQ1Kqp+hDQZa8gXTuBSdTJPiIlNKsog6igzKHimuAM1GPilCOsjFSzlah0vV36S+6xfz+XK1vLjYXG0vr66urp5cPbl+cn19/eTZ0+fyt8vLp9vtdr1cSA29fmgeh3I+83nA4ZyPp7zfDzcPu69f7z99uf348cu7tzcfP9x/+Tzc3fN57HLNkDkRdAmoG6VynCUPzjI0ThwSjVhE/5KEWV0kS5aWJ6V3iWcbuSbdWWxpziDC1mCtyUaEwRFdfMFOsrKpKHO2XibA2bzfXmyuL5+slqvCeffl87t3bz++e7e7u2EugrIn7w2wlE17N7RyWSynUkChxgGEKn/bKBfW4ucFZamalVDJ0VlJ1iMApuKu2pQQ4g0S1RpKYITGSFfdEmpQ7o1MZqQldc/YOGQ2s2viFkOIw5JWSyfDzvKE5RWmy3yeF9aw0WOdEjNlljzKengyyd45XA2d9qn1/jFmX53+NKHATGN6ByA8LZcKrAmHqvMlZ7CZdETRcUkWD5ACHs7ktXzLEYikSlyh1N54yuBy+F4BtAZrpyv6GHpwQKFr3Wpu0fRWcbm+liIaYz2fGEOHYrDh1GHYSiI0J8cJggLmDoJDvhMihImBkcwxP8LJAD4cVW1LjvGOWjBwPblHTxWdLazlWY+AaLoBnLMHwBPQJfpoHgdkQW9zdeUpqs6TOc742Fs3BsEkC7XbfuRM4yywB3fcwg/xFJIFELjDJ1EJFAajVc2ttv43RRotMWlPgLO5cRJiRDMdErTRjgVpMlVJSUNqBdg2v0rjCvewJOHgkXXEyRfex62MX7K4z46RjR3gmq/lAvPF8tmLF9//+Hfbq6f9fL47He6+3tzd3R1PJ2Jxlsl5eMYzsGcZUq2d2AcRHswkghgiUIVKniIBkJP8lqa5JPqBCama/SK+GUrCmuMmxA7qP71A7jkPkleOuUC/XKwuLy+fPL18/vzq9cuL16/66+t0scLNRVqt02Ke5l3q+tTPuJThPBxOx4e7h89fv3748PHdu19+efv27btfPnz6dPP1y/5hvz+eh/O55vwy1bijlJKAzqlLXUfmW03SDy2lUDkCMAUHhcaUUisFxyhdFPTxDZFzRGbgnUqGjRp8XmLumI3QsxZfkdDOJbOwssacuWShG3dE/axbLGar5Xp7efnsxbPXr159//rNd2++e/Xy5ZOn15eX2/VqM5/NMaUyjOM45PNQzmPZPZSH+3x3f/ry5e7tu68///L1w6ebL59297fnw74Mwyx1fV0JKkCFaAQeSvW4GYPnVWOozDyKi80iZSnE7OqPx8KDGJmMPMqNj0ahwmL4Y93zo4Q1bvXBoWBWYleNNlM3W8y324ur7dViPj/ud3efP77/+edPnz6cjoeOqKNOyxKmCgam1lQ8OS76E/LOEy8l2TSIgoyTnMuVxCVGUi1M9XGSpRSy5h+bFW3olLa/6ngATbHQcSawNn1oAyS5IXdak7VJZm7egtHT6ov4bf7jRbsJzGzGK0qMYV5hKpvB/C39xYvIbc6dkzV5mvJ4Lm6mWS62WMOBw474DWoAnr5IAySqco9WVrRMx1aWNGIXoJH9kVwk2EcoWUJYvH2EPKUvE6GUGGElkzsiODB6bdOFCP9qHXve2Ka5Ckc7kTqW5eaKJ+okPrYcoieojWBqvDQjEjttDJT65OM0dYydHXtuQVO04Rr9QDhmxTdmRh8y75NEWslVwwGqUXMR+8lep0gTekE8m2Lr8pjYNdmZGHx2j34mqI/zrr7Ri3G/GWRi4G9wlZCLKc5caBmovd2jVmhbSuF0OKnGnL0dQ8FFjYYGKuACRilC2x+O7AfhAk2XistE2M2QaHY5Np0ez6JSUhIGQq4KSiFcjbZbVNxI8AjrEqPoCzOBOAIY0UABrXvlMY9I3eXV9evvfnz+5s1yezGM4+3N3d3t3WG/53wW7UDhY3muIsw9Qm8NEl6N4OXISXo1tW2XuHTSL0aMCbCTOrH8FBNkSYK5EwUsYugFmUrVhVNnerJS8hxrWjZfzper9fr6+urN6/Xr1+tXLxbPnqfLi7Rapn6W5ot+MU99x4TH83B///Duw7u//vWnn376608//fWXX95/+vT5S40k7ofTIE3q2HWzvptX59JJ/ympdIbObJS6FAQ5wuR2LZQnm6ET4txeV7LJEGgmSHgPoj+u6r4Y+vJsxE8mq4n4zgzEI+CzYrUp7XI1kCwOTnEsEkZWBD6fx3EYh1HSdSyl69L2Ynt9tX3+4sXLVy/efP/mV9//+MMPP7559fr6cjvv+yRlsLHmx+fxfBqOh+Hm9vjly/7Dh9u//OXzX9/evX+3v7s9j4MkCDWsQaFTnmvWy8Kpxsw4chkNScYs7ZxZiVqSomXkQcjP2UYiotSb81h/QjWB1rlJ5vNMtNbaqwhLqTcIDF03W69X2+3FZrvugPZ3dx/e/fL+7c/3N19rktEhQa/lNkMWtFWcZaYX6nQl1RjB1mmgwbKWRNkmsTM4UDGZaVSsO9BTCW461dkmnjqUjA0Wa+VYjBm53jWkbfesHclR99VsJrr7AWKnwTdJDmDIVzLElPOJ93TTj9OKmI+mNcjPu34Vgmtp3yNTHEqYGFRymvSkQFMkMbUiCHZLnnjoEBISop4upIu4qTKjqNGQr6JQiCQbNuDJS9Itd7FUxs+g9gSpew5nYSRyG3Eji0ZT9QeJoKnkETAAW9d+08VfihKWyslNBZ+dRA7BnoqK5qPfF4iEbUxSiIiNYjQS/CclDYx0OT4JJsSoePo+toejMdlqzWQsfdA2TlJpseT9WtSeJEw7hZTdgBFhgTerP1bxc0hhwlibqjJzHAbbPez6gN7VBFMAu91hFKI9FLO+Kp4MUTJURc6jJqcBTlGIZWjcRZEdmvKUsoI19pfM1be7Ipo6uEsy4xRlcp+OQYY/gDVkoHGNUfsQzfQXQX2VyGodpOpbICSd5eZrGjViv1w8ffHi1Q/fP33+vO9nu/3+683t3d39OZ+ocCeqUziZt5hMHANVw119LaGWfgU0xpJE6iupdJRM20mIPdVcFovAyDW1ZX19L+BzT9SDjDKUNA9GETVcLC6ePn3y/feX37+++O7V6uXL+WabFvNusehWC5zPCtK5lNv7+w8fP759++7Pf/r3P/3pz//x018/fnx/c3N3PByrU0DUgumsn89qOpu87UkGJELAPhyVeLRpFRiOlXw76oAeT4+8htiUx6a+lAmSlzy8IcUIAWRcDtIuVfJ5EAataZXAC3U+Yd/CNW/5swRGiRigIikgcLH2aKmxHUsueRiGUf45i1w99N18u7188erZr3741W9+89tf/+bvfvjuzeuXr66vruZJ6P/Dedifh+N+OJ4Ot7f373+5+fnt/U8/3f7l5/sPH8/7fV3CPpUkZf2aGcPAZRRedBZvlLUbSrqYsnTEj8yjlYrpLOuSgQdWXq+IFXmmU7jkogVUke4yyo2IQknxgAnny+V2c7G92CxWi3webz5+evf2r18+vj8dDjWcSqqwa7AmuFsUTQKSmcxRs3L6BiSbqKAhNDhSBVykO1crUDLSVZueQsDDBfDQJAq8DosTfSxvLvYBHWzoJNvEKjOuMZJDU0vrQZhMZNO6BjNMFQ1cQZqnHBAjM0/4SGrryLtsQnXBX4LTRuFwcBjC1YZ/uoNo7TeeTEUdmWEqIWdjK8AjWf8AQ1QBJ+BAfeYdmSKS+35trUWY9DwFBsrug00Oxza/ST1ONKKgzQiMzjLUhJa83dlRTR2FLEp42Rjui82lRsKA4bF8/eOmG/iA9gSnaH8T6ZiMk0Scank46CCTvSDK0DrDWKe3FRUzKMUiPiO6OhnMiUlgFC2Vc+AWEtiy0Dee9D9jAIRfbYShmI4BLVbgb5Fo7d2hAI4McZl0lgEY5y0I9aEK4hb1b2LNqZPmqKbg5FpdAbp4vDsJX7XiAy2SYQ3z0JWlVCwMMDrLpRJSlOMvb6Vy8p7Ry6Ap725qgRJZhGi6Aaq6FEdDen7KOGZAWm2v33z/w4vXr7YX29OYv97cPtzd7g97LkDafWkzQJVWZqoU+giknkEi4khCRc7aMatV2w4xCRrQod4I90id0bLqk++1Ybemv9Arz2wYuRSirluvV8+fXb958+THH7ZvXq+uruabdVovcb3g2RxSGvJ4e3v/7t37P/37n//wb//2H//+l59//vnjp88Pu30ppU/dYj7r+z51Xa+j4tFZo8zR+6Ddd4pTYeiENePi3dWm9m+jGWx2r48AANPCUklilPG9Me5M3wEx25xr9Zul8UODlzGZb8KTMBJ1mBiZxjKYAQmngUFI1OkIXDgSG9PBgJgyPjEZIiidyzmPp9PpfDoPeUTCi9XyyZNnr1+//vWPf/e73/3mN7/79Y8//HC1uVjM+po8jmM5Dvlhf7y7ffjy9dPbv3z805/vf3p7/PB5uL+vC9gn7pPAzjQyD6WG9oMMVspSrCpFm6Bo4OqJ1bNKX7NoTUtgkb3zXfUsi7ygeEGssOEIChplttk3q9XyYnt9ebHpEz3c3X345e3Ht293D7f14aTkSrFy167mxx4QWbxi51HH0CI3UXwb6M6mUBejFiA3UxXKUUANKkXz1RHrT7o4iqr3qvSzomqOZugTduKn1JQnzRMuC+BNJ7Z3wnm6AUafjQ/4aNxve6OmWjAxuhbeScBcAFvJcJruhKuYTG+YGlmYQrvgaZNAwSl4/Za2GbrQ5Dyt/KLjVJyYwl7DBM8+OCoVDWVAv3a7HAnVzGyyDcAj1Tk1ZhyGjBe7rVdEQp2HAObRwgPGgna3H0jCJGG1MZUNQSUPPSAiibDS4QgsqeKYN6g34GLZjTAFdovo/skMDuvUKPLBrAIU26BkWcHkIb57LmwNTz6CCYxLEF7Za2A4GX/atGnsGbfptsZsLI8iEl0VZVuQOz+FUlwL30eTPN6NU7fexOJszoQIEWHR0e1NnN07m0hnGZghDBFlqXclawXDViiAFg5q95DsnuR8NpsxYGC69eZjUe4FUhRHWjlYkG8VLmefKIzBweIxF0rdk+fP3vzqV89evOr62e6wv/l6e39/N5zP2q+aup4zo9XMjSahRWMCToK/YJJSrvKcCyXpxxUiVT06iUX9kbBH88edvDjJ2vUIsyLbYhxLzjkhrdfb589e/OrXL3784eLly+WTa9hsynJJyzn2PSDt9g/v3n3405///V//5//8wx/+8G//8ecvX76eTmeZOzubd/1cnW5KNrOINQGVVEE6idGMjkH85H3UCu56YGb18MiEDWcU9lRRJWY2jSKMAF0hB33ron3jJhHkMtehbaprJ/4S0CcbOUyh3VVkIXJR+eu6kOFBLW5oAnRmAS2bio4aG9GvmZw8+6IppRxVVZNwVMgc3ngez8P5eD6PpfrB1KWry4tf/fDjP/z9f/mHv//73/72tz989+PV9VVCzOdTPpzodDp/vXn45f3Xn3/58NO/f/jLX+4+vIf9oWfqiLBLZ6ITlpNKQ4vHHbhkwKFmwPVECrGrjCC6HNKgPOr8Y6nbuJNWC4ZZC3WCOmWfHKWkrcy5FBKu1vby6mq9WOTj8eOHd2/f/nT7+VMp5z7VDVjU1ZJBzRzNnMq+BgjhY3DitPhnimqsPEP/aGNqia8SiEkOu40495ZhdsKnK7mzKfpkBSiCa9JaMP2QG/qmw/pQyZltDp3+XuvVCPKTte8I6gtWOtTefgvq1LCTbz3iqeNW11Eig20zfCgMgRthnhR4G+EJJ0bUN5iK6XlbLHuUiY6bYozq8om60cTj6X7xsQgx3MTqn47GWt+wlURBx47YZDKPbKgTjEYHimPdizI+CEJXDFvBHiAI7GgBwHJ95dhT6Cpr6SLKGTZEygpFPMGtYIpUdFFChhBpmq6oxTaxEK2ZyXR0XYzUwBEMPWdx+U6/tkEbVm6N0mv4NeCpv0NvLwve1mPshicpaJDqGjAdlKpp5zi3WrwPGY0sNjCAEkN4G5TRPscpxexMBcgmnuxvpgJ3TmkGdNHgEviOJd3RdBytw0p/J5s6ajpF6t2sEqbsK2F2MsXMhIIebWkLhc9Oq3eqLCHJyLIFTsLNwjHn2bx//vK7N3/3q+3VVQG4v3/4+uXmcNjlwl0SHQw1JhIAoNefVBZDtDISUXWuApTXm+6kSZeYkksrJ+CZ7PAk+6wj7RHiGaUOuCuAJY9lzAX75fLy2dNn371+8uOvVt9/P39yTdsLWC671aKbz07n4fbu7ue37/7nH//wP/75f/zpX//47uOn3W5Xcpn3/XKxSH2XEnXOWtLJqyqsIYum4ifoz8i8YqfDDJouG7Qqr967YODAWTqYpYaN2GFKyD2lnqp36VH+SalH7BLNEHvRyJJGZOiN/8ydiG+RDfwKZe8a4RdV3SJxOTUJK+eSpXup5nznIQ+cc+FBVDrGUsbCI5QByiiDfKtdJmV2JZsHQeiAj3PuW5JcpPaK0RobZfxiDlzZXpZJZWVnM5/HXB3ycAaE9XL17Nmz3/3m7/7pH//xn37/j7/64Yerq+t+Pivn8bQ/5P2O7+6P7z/c/PkvH/78759+/un+88fxdJx1PXbEKWWAIZcza8qLo6S2WWjswuSioRThcGmFuP5UBLZYR5foi9nxr+z5sbY0ZHSOFdfgcr1cbreXm80GID98+fL2p//4/OnTeDx2dYuTIp0mb8UR15putHJx1HaIqkEC71QNbbsSaR4CZInIyMjTLh1tUKSxNyGIVRwNguwyCEVADnWFosYisZoH5yXU9kx2hOCRuIabZ7P8ZOwTSxZV4zWk+ktYtvalk4wcwoWmycHNqnJrn7WoD/Hb9PkxRBj0VusZcc3ZKO49qmlCKwTApCHV67Jq1osb17ovNJm0eeSe0zkW7aNRJlpg6kJdetljrVLc+Pqt2CgQIuPQBdmMARerK5lBXmxSW2v/duoOBMgbmDq4/UHv1ALADu3oIbTBQVo310SKvPE5XBpx83wqnB+MKql5kI2GBCtz6CMgjUomHUXgpUSRfC/JpIJ81V00Y5rDeu49UQMJqNcl3qIJznYZlYYSglOC9SEVbVW1XulovvMVQOuys2vx4EwfPBqwDV4nsWqDxaNaY7bp3ha7UKNiY9SFPPyTqE0ejUHPZNihzj6gGKckPBUhLkl8bL9kfA6CFhXGsC6y6SU4jplLXm0uX7357vl3b9aXl6fxXBPem7vz8Vh9eeIOE0wYFpoHa6s8Fui0NwDEAaNLKAN3iD1AQpIRCyD13ZLEyfUofGbkmTiklHMZa0rT94vVev3kuzdPf/eb5es3sxfP0+Wa58tutZotV4D45f72j3/+0z//y7/88z//jz/+8U8fPnwcz7mjtFj0/WzWddRZ/VZFrHSdpJNYISWTL+Lo23LJFyJtyVIXJLpT0qmsCpcgDpUWqZsDLDta9f26S0vCBaUV9T3BHGFJOMOuR+xF90NEsOpJ6KSh12ZZy5hZGyesXdho3Sc2RoAD8DA5Ay0KZoXHUVyUUECLOOMBYCg1azxzPuTxwHA4lwPkfc67YTyWsjsPh+q/eZCB+aPIS+lEBJTigG6+oosEHEhscP/Z+INGItHEtFpzkzLHEUUu8zyeD/vTOPbz+avXz3/7m9/8/h/+4Z9+//v/5de/eXL9ZE4pH4fz8TTsd6cvnw/v3t/825/f//GPn395u98/cM59Sin1mWhgPom7HapnFTEs7jLzgPWbRczKIDodwtjibA4YixGdWJGDLPQM5TZrBMpUyijV49T1i9n2Yn252c5ns4e7+89vf/7w7ufd/qFGSF1iTGIBMzMF3mETpZQ/ag4maYgiBAeRyC7oQ5KIaQwCKEIawbDKluG5GCXwdI5ni/BZNXYMyFTumQb7Ni/fmUmgcEixAYswoTMH6KETe1styiWNI1dsl+BCEa1SyxPr2wp12mNkxtZTIlJpW5wINwWuaTJI3nlBzrhCQ48N9LGxpWSDMkzQXifsytha7asoyqMw6264QFLBGL8NlHkSCayip9wuLXOpDAwWk73/BhpVDTfyoexGhtQvCTspmBRjYKjo83x1aYr8NscwUastmLKvx7gTNpRBrk1kxRMx9HCoWNBHkwCFPZZo0IP2whlQBw5Oq8Sklek1DCGvvptNJ56M+4toxFFXsCaflhFrEhzy3lP0WcNgz3rgccG47e9wpX6JplFRJoM2bS3AyYDafm9UdJwWk5GwGEZoE6hQZfgZUkFOOm1MugVDOAdCsaUAelRk4/hFBN7E/F1PI4p07syFjuXHiRSHFPPo5WpKWqn3srWyC6ionlQ9i9KlwheX1y/ffPfy+zfL9WZ3PCm3eRiPMiUIyXN9tKqzlUaVPyVZoIDJ8s1OnoqQmatzleYikctg7KTSkLTdCHCOnGpWWiBnGHLf99cvX17/9tdXv/vt5rvvZpfbbrmi1TKtNtzj3e7h559/+W///V/+z//r//7Xf/3XT5+/nI6n1MFiuZj3sz51uvWUR9DroF+5V3JqDbjItU1vJ0juWWxagmgPV0fLuERYdd0mdRc9blN/0feb1K0orVJadrREWnR9L6S2RNCJqiZD7lPXu8HTpl8lpCjArG5ApiBgrisvNShpZq1mlLzpXq9axCw6i11ELwx0Ih8qe9cDaiPsZGmSkCm/kg6y5MSiJTByOXE5AZwL7sfhwOe78/CQ4W4YH8Z8P4778XwY8wl40E4YnYSJwi4RASaxalI81rypWGGmAEeNb/RCh/4z5PF4Oh9Ox5LH2Xzx4tmz//Xv//7/+K//2z/+/h9+/au/e7a96nIZj8fz7nDa7XefP334tz9++uMfv/7xzw+fPjMX6gi7nqsnhoHZ0nqhg2bp0z1LQpoF9TdoWqjU1lJcUEvF1vLE1mBfJObOYqdKgSyA86ybbzary+3lajE7nw6ffnn3/ue/3t/eAEKXOlHUGrMqwYAOkADXyKvuVqbVaJrkjYNaqVVRaAN2bZAkuzxgcQUljbprluQD2DBoSNi0+mFSZlNEV6dYGDSNNiG5eI6qcbd2iXOkYBBwtHG73b8KlayEO/YIEFu5mCZJD/vVkBX28FHQCNO0uwkmuK6XWV1ZULKSH3nmWyQaNIfL0aDbWDLyXSl8a0gYaU70VmUt5raWVS83e3hhCiqGZVjKptmEIpLUpu6LZY+UWZHIYr1oPgeEG0KNi/VWZKw1FfTO42kN2LU3on3L4dOQV/TApDTak9jqYGdxw0u0rl+KTnMXxqLCmVJOt2HYWIJUD6aDFWIlELIWE7rJ4+EHTXwyuNUTDbagssd9ehbtdwiR+TbOqBWbS5tc/zdZdXS2O8GPvvXk3jhrd4ZmkUxWfdLyLXV7XVgtJ3DA3/pRzpvzWIJ8iIuxNhSZcMXXEBGR7iV7xFaYJAsb61PIrPNxnUYuQZ4qHjOXcRiB0sXV9Zsffnjx5k3qZ/cPD19vvjwc9mUUdUWdwhsFy5gAKH5cG3BFk5kTJmkNGkWRCokVXi69yCzLzKhS00HGXjqEq2/Omc/njnG2Wa2/e/n8d7978Xe/2bx6RRdS1t2sqe/Pw/j23bv//s//8v/8v//tX//wh59//vlhd5j3s8VysZjNO0qigJeVDS/yz9Y0bN+hxiOhAJWEZo9jNaQdlx5gAbAiXKe07fptP1/33abrVl1ad31H2APPGHuiGdKMoad6C0qTHphH4pHoAOWQyxH5mLkmoOPwcK4ubT+W43jan8+ncTyN5TSMQ6nxzlh4yMM5SwqrQljWoqgjHTU050Ta14VdV/87o67ru1lKfaI59Yu+X3RpntJ61i+7btn3NSmntOq6BaVFSvMaSfBMYh3N/msGWdPUckIcCp25nBkG5POY93nc5fwwnu/Op5vT6e48PpRyYD4DDixTj2uoReTkWCBzhLrlLOVEcXsSdFQbmbTFtRTGYRyPh8PpfJ4v5m/evP7H//Jf/vf/+l9//0+/f/Xy5Wa2gGFMx+N4/3D4fPvpl19++v/++eOf/nh8/6EcztUT932pnrgM4lCH6mV5rI6ZRrFS55KlDgqj6HJk9PIwq6i1qK9JXiZy2kpdLkoNqR5a1FpSwsVyeXl1tV2tIQ8f3334+a//sbu9gZLTLIFPaC7muzRbKxF0m+9BgmnNQuYtmrqE5bMGTPpgRwpH6EYFXajIlfiwkTjAFbBkqSVxcxEj87lGCFMsOlkOYj9Hn8FiZqalyKzzoEO/Av4WO/Y24+gMZu/qL64dwCH294iSFVLR7v2g9Vs9suv8+EWiUK9gfvQfROIY7aNohDyhMMQy2JbXp22Zk3OSWEVOtfso5glYpytxzKENh2Chm8kqmI60AhjBzfMAY7m8MtfpjOmoLoC2h8T3sT1vbWIpjbhbTVmBqZI0anBiuRppWVWGKxGUMqKZuKheRtn3EahcNwVNFEi1/MjOBQy2ekRZyk1lJ/AXjSiJedIGqWXmmMsJ3ArHto5oH8UT38yheRY0gjY6MOQ4IZo40HuOsMngqGpjp6idXHAikupDsVGgGoKKLCT4DfsMcHDAxEYoGlXL+sr96UJJqoVsZwOx6XWIRqyLORgj3VQkG21BqsWCP2srWIFhHIC6q6dPv//xV09fvWbE27u725ub4/FYuBhUqk1E/z9Zf9YkyXXlieH3nHvdY8+lsiprXwECKALNZoPNBvcmu6en//b/AHqaBz3pVV9opBnZSDKTjcwkM43GehkOySEBks0mCQJcAGKpQu1VWblnZES430V2z3LdCw2DwVBZmZERHh73nPM7vyVK6DkPc1bGeqq+TGamG6Ciu8ClSFbI+ddVVOlIvEsbXwM1GJcMtiH4NlrjpuPtazeuvPrq2StXRhfOhek0DIepHhqEg6Ojjz7+5N333//1u+/evfvZ4nRhAAaD0Xg4rCsnR13iDjqyiYctXmwqv2ZTDIEeY3IxQfRVSkOTps7moXY4WK+Ha1U1qdzY5tI1TDCiiuuMqRztKCw2FoN1yxjnIZ624XC5mK/ak9XiZLU8Wp4erZb5X/riyoelb5cpEmoKuT5xaC6yqzCDkihR/eyGbrqIFc3AoqvOSvbIjv2RM8fpxBUPR1o+os1TcmSvbJJHp0Gu03aEOK7r6bCeVIPpcLA2HK8Px9PBYGM02hiPxlU1ddXEuoEBF71tg4vk2pGgMaYBs4zmxKTj0J624ahpDprlUdser9qj1p+GuELw+UVZWu9bdqlgRW5UAQg78BqMUUhk5BpDuPvKt8vVarVchhjHo9GNa1f//M0/+8qX33zl1q2zZ7byCL9cwump3987fPj48SefPPzko70HD+F0VQOkCiPaBhMzqFtkjrRpE0uVgidlCLlg5tmW9E4QTPSJfffB62orSvAXD8qs9Eo+eQAcDIdr6+ub0w1IYW/36eP79/Z2dsBEWyFn6EoeYcG0pVEWjybB+DQsiDBKoCci7glFHmO6qEQj4RBKhIkFuO1476JWKINdZAPiYvioNlYFYU7i1KWID3s5meLZWE7CEgBcMAKmeoKG1/UM8ZPuHgsDC1N6kdZaJqOuHpjUj4KEz9We7gzs23NoGFUhafcUJy9OTeJswTZjfMqKT38XriAxwHxFc2suqxNyrdKGomN9AfRmeF0mCz050pKXUejO0plOmsQ6YF04mhftxMrWXBb0LK3jdT7p2emUxl75KtVU9Tyom3kdp2Pn+NUhxlFVFoIQi6ZaZ0ZQ8gEollkmQtGycSQJW2rpA5TVRNcjQa+CdhuPQhdUO2eVAPSWEDITd2wq3iIoe60so8usW4pnN8pb8cKQ/W75B9kgheYzmWc7DiO1xJr7al7Q36HpN0CI6iUTIVmErnMFVSY5EiyLfJ0+1Vac/xMWJZhskHmqDr4NCe2Zc+eu3Xhp89zZYNL+4dHhweFyuTImOKhAFIyI+hEkiwLgUZu/WCVwdP0c5qGWVUMOTf462Fx3ITmIFXWhgzw4JhtikyfuNFlf37p8+cqrXzhz84Y5s2lma248rurB8XLx+NnT3/3hg3/+1a8++uPHT3d2Gh9H9WA0GtWVBYlX5PsaMUXOUeIMR7b5Qo7s5E1MCjZE4/0A4hBxYt1GNViv643haLO2G2inAGN0IyrRWLvkbLA2j1kmLrw/9f64We2dnu7MT/ZOTvYWi+cn8/22mcd4EvJcm2dfQq3oZnXorE2EOKOYalsBJNWdLEEhG9J7YRl1ljuatPcWXbEsEjZYEO8BdZWXuzik1Hn2ifqI4PPkg+Td+xTFNCoPhDHaZGowQwQakXHd1WeGw3PjyVn699x4PBsNp/Vw4ga1zd0SRm/aQOyv0KS4QDhJ5iSGwxB3l6vd5fJg1Ry3ywVxplqLBl1Un00y5YmSQ0SjCecpky8odUx6ongflqvVYrmsKjy3vX371Ve/8Rdv/clrX7y0vV07165Wq5Njv7/fPH2288dPHn/86dOH99vF6QDBuipYQqdNahIztqBJwRP1MJg8BxObOnmD3nCeMfVDbOQJuRJHRaLoeYoyP0IKMUaTRvV4bW19bW1aWTx4/vzR/c/2dp6l6KkFRGaOJ7HrNanDfo3pEvUULlabDQFU5UiRjCU1oZCGIAUZQtTPJoIq81EOnKhHCRS9k6obUkl6i1LI+6yP7vDSkqBcPKP+mnyESp416F5Xx1Xh+Bjt8zvMTtk/5UtyDimBpufjwbp4rvWogjldeOt4IXW8/DqdIQvRNWltlkfu5U6WZ9llR5YJrMhWyk6Wak0w/XHVlBSETuyiOC7SrcT6pqLiKp5ZSfKA2fMMu1KkrQY/bpfmoEA5cEYnglpG9n20BHbv2XeUK6Z4dSfCYvxPuJbAjSaaPjahM6j4JYkbed87Azq+kr7Dck9RodLLUxq/bmJ9YWYX0VTv3ejpgHuvwvRWHtARp2m0B9ZgSYWX/pNfse0VXWZ8xc49FMsqm5phUY8XiL14qxsNfi/aYma/m24mEnyCQ0Hk1qRrZmXJ0H2MNBOeSD1sXK2Ra20IiHbr3PblGzfXz56LKR4cHBztH62aNg/oVkqssPDIxNhyWLkynDECCXZzoXCJYOQ8daEjjMKBqUyygI7Eu0NjBmBsjL5pYozDyeTM5SsXbr+y9YUv2LNbdjqrxkNb1wsfPv707i9+8Ytf/ebXH378yfHxHC2OxqNBVTtkqRRHMrHwMZJOjZ2UBXYij2j6thBN9BX1B2PnNmt3ZjDcHtRbVb3u3Mzi0CBaMo8k0+QYwad41DZ7y9Nni5NHx8dP56fP8v+fHiyaI+9pLRoxV1UnPs7W0BIWkVyXZXQi4xBaSgH0lAbcRfFsiMKKENtI4q0DEaG4gLNCV46fJLFWlPZgApMtbW4ViEjSj6WRsNXEyT8heAH7mOEdhZFA1tQcwBQIECaFd2DFc7BgKsBJZTerems0OjcYnJ8MLk2mF0fT7fFkrR6MamKRR6RJ0gcfV8acpnQQ/L5vd5v22bLZXS6PV+2K2Mt51szX2YY8cSbpHkTPxymEnK1LW2vqmVpKqFgsVt7Hc2fPvPLqK2999StvvfnmjSvXKwO0Jz5pDg9Onz7d/+iTJ3/4YO/J49VqiZS/nBBXKbUJGoxe8hOhNak17DWd/4eVxCQHYtY0ROpjODA4aVpsBKaB25B8oNSnelCtra+vrc8s4NHe7tMHD3Z3nvjga1cBOyHSljcKS0t5I/nBi8N7MWkkM/1kKQYqcE+rESuRM8WNZEPICZHEJpCyoyKLB5n0IUeoruq0b0tlnhNOXSl5XGuE3ZmPUCIgcBQ7iM+j6kiKO1IZPDuf6S57qUdDFsKrGMG9YHoI3QJXBiUhfpfDW4izWCyDdTLG3ojMI3qScb2EOhQ/pGL/1S3SBZFgnoxo4Jkawv4brOKUa6MoOsaymVUKEBfqIHwi0n91/kupKH9ksUlxhEmSarRvke6r6wIUtRDr767DKU5VXQhsZ5mJ+lTzQ1ox2wH2VOflARZOHFfMkAJyoqt0H2LyafSeE4vpF+MQUt9rSpjapkgcU7fiL/JfEIaTKe+VUaMDHZyK3ZW6XL0QqFR2ONBdfyjL0x79KwmSz87uokWI0I25IikQy4YksfVGulzgOPRIwl+KrhXls/qAm2is9E3KemJPBLWeEW1viuUlowi8+A7g+H5OhKYwoxh96+t6uHX+wvbly2e2zoaUnu/vHx8eNqtlrrJOQ3jzoWDYDMuqMtGSJxcmMs3gUGEaeWuDFdlUSRkGUyUkKY4ZcLZuG2LbDMeTjWuXN166sfHSS5MLF+vZtBoPzXB4NF98fOfOL37xy5///Bd37t1brJqqsuPxeFDVIGC5sBkZYc7HP4/jKaFVkzYatWyKVYxjgK263hrU5weDrcFgrcKRdUNbkSjIDnK9BI/muGmfrZZPmubBycln+/tPjo6fnsyPm9Vp8G2M0l1Zh65Gh6S4ovA/8tNEKJZqiaqyDcHT1bZiH8vVk+ldPNSCC4HtFLkZtDG/kCg9OrPE8tkdyomF0gjRXR8SkPd1/kVU9alicGIgiseZUXoCe/VY6LgaerKaDhRNQRzXU+AAxBhi9MmbPOgGnyt0CEhJrQOLs6o+Mxpemq5dXp9dns6uTCbn68FmVQ9ZqBOJHhXDKsa5b4+932+ax6vVs1W7v/LHPq5Y7OXQgLo4lXx+PizzgReibj1pC26WTXN6Og8hTMezl195+Ztf//pX33zzxvXLE6yak3mb/z05ePhw75OPdj/65PDho7ZtoXLG2gCpNRAitCk1wPRpbAxvgslgKyZPZpac5O7z18mHkyfgCL2nJ+1uTCEaU1XDXIZns8rCydHBo3v39p89jb6lKGWam4VBx15XwIq3GItZX9LwEfLOIqU/uftaND7XezmSgOt40mQGznFPRYoTe0u6ro/XGa1MqPI9mgdPJ18wPWaT0fFZJq1CZSlQHgVAJSymCqJ9BjW8VwhTRxbpHpPpxdl2iGSEEqUqp3rStXdn/qE2u3TyIbtdAkvqU0/3ZNQgrqsPMuSkTgTahSfEUstVrlUsHiQ5Q6xzwfItmcpymT9fnPIFwqKR39RdeVma53eS7mOCoBNRcEGdvTSasDwKlL19Krg+UKhMVIcdsfWRW1GwM45R7oh4CnSLC4fSkdnemSsVo62gTLeUOqvuMm7G8j+pPz2YAlWpdLrotkyPcWVekCXJN6l9CrvExe71pB6EDp8jp8Ue2UDXD0xNV+pTEs9MLDiO5PeBwOb0yNgBE6V7UYNCxoPAFIdwXrTwLUQ2d5FvG7aPpGsTOJ4BujtHrNGU2KwfQKq+tuBEKbXe26re2j5/8dr1s1tn25D2D3b3Dw4aisSvAJWjFHWdQ6dlYkl0skSiFtMMAxWteyzPg8bUgDYmh6Y2UCFU9BUXfGpWCXB28dKFL7629dL18fZ5O1vD2RRHw/lq+dHHn7zzs5//6le/uXvvXtM0o+FoOKorrFASnUXgBOpFxzM9cLiDCP4jeD9KcYp4pqrODwfnRqPNejB1bkzMoyGYgbPGuiXACcBO2z44OnhwcHj/4ODp8fHe/PioaRcmBrBY1URwsg4rUj3k4m5StOIUS5mDILYKREZmqwrGl2kWRwi0OLRiXsFcsMDh4SkEbWkITKYOjD6qoUNApHCaEAJZbVKrGxOZROUTKFf66PmeC3QPlY8QLeYpSzay2iE3wfki+kArcEuar0CnOEiYACRrHfCohS7lvyVAldtoSnFoaXPo25Bim1of29ZFXxszQbc+Gm1NxpfX1y7N1q9ubFwaj89YnKZUBeNjXKU4T2kJeBLD7mL1dDHfWa32mvYwmhXxwjncirVYRva1lO0kUyPJrKjdScm0bXu8OF2ulrPJ5KVbt976yp+/9bW/uHn16tC5uFiGo6P24Ojo8ZMHH37w/OOP251dEzwMao+VN6kxsaElMa2BU/5/sfiI7N1B+iWkVbGkETNKSl83RnbDkSEhT/Zarqpns+nm+pqt4Gj/4PH9B4e7O7FdWWcL9UcjFAVjj1KdovKlOiyRgY6IUY0+Uh6OOa2Tfy8fgSUqnt8yPUiE8CmCVWqT6RMTum1ZMr2wIWGCGYw9ERGHgLJDm9o3AkiTBv2Noa7zZJfHQ6yuNBF63OdynhZezIudAj9iLOMOOztBWUjqMjr1zRl7O+4eMpxU+hJVvQJQgH5xmwLJayC0X5WfCUw3YyruylhFZOPc3pZVxTViAqBXpniSgW7ZeYfMELRUBmbskcWIiqIT2xIz0lIkftBZbxe3Ep1MUxEBRXULFoti0bAxIR4tscNZc8kQA1sTIxEmixFLN+5qPeVQNSyBSkUI3plQmi7GDzoExHQltf/mpx6I0Sc9l2zH/rahp2dLUJwfI3YCc6EdSK3lx2WmZ6H28/Avi3BT8CZTNip6z/K8nMcUAXTo8lo24FK6EyddYT5ZWS2TNBZXWTlyq9riZCaBCoXdbdo2ILrN8+eu3by1ce7cslkdH50cHBw0qwVRha3SrCyDFoxAiwdkMo7ytBxRhSqCOR3mIbiKxto8BFf0FZtiDXZo7CCF2DQB0mBj/fxLL1185dXJ1StxfWam0+Fs1vj2k0/u/NM//dPbP33nzmcPWt+OBqPReOIqi/lIJIENNTCogBryqlShnDzTR1+FOIG0VdcXptOz4+HWaLSGMElmYsDlEo2+rudod5vlw6OjRweH9/ee3z842DmZH6S4MujRgqts5Sg7H0Q7lCIIxa24tYgtjsgmEVR6CXrPIqXvGGet0XET0fgUra0I4uXWkU7FBEqx4oNMmHSohnKQP4UoBh+J19gQvHcMXycOQ4NAu0F0EKNap4ooTE4D4FwYwJbCDtRqjX3TEokz8rdZLJbRVMAtDV4xEUHK8ixOAmYmW+bn5WNIwYcQmxC898G3GPwgxpFJZwfVhdns6vqZaxtnLm9snJtMzlgcem9D8jGepnhi7EHwu83q2enpzunpbuuPY2rQRmf5BIl5/lccNU+oNDhyt5F4M2pXbXu6nK9Wq8Ggfu3lV775ta997S++euv6jejb1fFxOpmHg4ODe/cffPCH3Tv34tHcoTG18xZXwTQmtMa0yTTE2fZg2ki+JQRTR5pb2Js6ipU09QRGVote8qvzLcm5h85Wk/XJ5vp67ezRwf7jPA3vpNRSFcaoSWWQKP1flA+S66BBPOyzERUJYGS2BCuBqB04hCOKyILHV5Fx8hmGSrM0MsGW2LqoJ1t3JKp1ZdQnIWs8cSlQ/9NuKSeGy9B5eZR1WJ/NLWBhBM1HkhVysZw2XVIOoqyFTVDGcW/gUlw6leIPRads+udlqc7F+klfHm9n1RwZuJURc/9+1iColldaJVC3qKQZuX2qkbQsXHbEUQKKvqnYgXA1HE42ZOHKEf+lJHUYfaE9CzVfTRpNt+JWa4fUzYd8c3KdEa9JtXlM4oCqWialYzHEbZP0WIUpBd2Mlv6l/qd75VJaNBC3X2RVMQVshQplEO7t0br3sdeZmY6M1xH7zAtbiiLH7pHkOZREPC1Y1MvfhZKKhqbvqC7ajNSz0jLS6Ug8kfY34kMaxfME0dqYCy93rCzGhI7MLUBOpDMSkuYF0tNk2MGHfPxvbW1fvnlzffusD+Hg8PDw4KBdNAajBUm5sOJInicmTuElXS8nDiVHexLiUgE5RKJjTVH+LckZMwAcANYmGp/PZDsYnL969eLtVyc3roe19TidjNbXoaqfPHr6zs/f+fHb79y9e3e5WIxH49FoQhLTEr8vMD4KJQGB5US5CkWI0fp2bHCtcluj+uJoenE8OuvsmsWKVtOxHnrEuff7p8tHR4ef7D67s3f4cDl/vmrmuW2x1lWVraxDK2wosPTrkdlqhhOIBObgOxJzHxIlkYQw/PwV4GY6lwe0knNhRQVpESObKiN9eFOUQdVI/kUg6Cj3p1bKITI6S/BrQnQhBtYh0uvW9g0dVaj8JNs8quaBlSL6nfecFhCYn84TOW9aiR5NAxCb8ZCRloom2c9H4mKtrWLhYaSWBePOAnUXhGbLcQkUcISecPoUUpuH5OS9z0/Mt8nHoTHrzm7Xg5uz6UtbZ29unr24NptU1cgANKuUvykeGdhN5sly+XS+eL48PWqbeYiNxVTVxoIiwDIfUjKSYReMIMgT+hhOT5fL5WoyG3/xtde+951vv/Xmn589s7VcLJcnRzA/TTvP9z78+OGHHz5//DD5prZVtDagXca0SuQ4zSqmaFoqrqG4bpG0KUWpDCwgJgPLSNMw2UtSDQkh/+DAVmtr07XN9drYw/3dpw/u7e3umBQr6wjQDlrhOliP4E32EQAhLxseYpMpRF7OWdIKE9X/QuJSFEpMqYhk1YsABNelOwij2FOQxa2AlqUU86ZUDGSjFDaOulA+SVlaYjl7hdNqCke4G05LyeBvYg9E0xlrlY6hHI9KADJlzdZzANEUukKEKdbGhekVy7DTo/MAAe3Qc+wi8jktjFJRfpq++okR0oIWFGRSHsd06lPNfJBdTpTmpOATRZkymm703DYKEwzEdh9QUojEjfSFzIqOetbZSqZukcRLME4Akc2mrLaAowW7aoNiiq2DLO+7UgGFtQDq8MkUADWvNMoEk+/Twi9XJ30e71CCU6cHT6ZH5taw4iI1K76a0PVZxqjWHLrH6e7aKL6OekHIz4qKJOcWYWSXkiQ8gJ7OXU041X3MCMGL+wO6w4N+uGjryuzaJNH59DyCuKkgagQ4k225igqTMAYfImxunbv80s2tc+dbY/b2d48OjpfLJSuF+KUgSPiSBbCJfdxzLUFjKmLv2JSruyVErLbggKjOpCitINUIdS7JMTR5Pplszq689tqZ116D89vtcITj8Wi2Pl+tfv3ur3/847ff/fW7hweHg/FoPBnVzvK+iRxocmmyJJhD45k+LDElKaAPdTITi1uD4YXx6NJwuD2o1h1Mbe1cZZwNACetfzo//vTg4KOD/U8P9h4dL/baNuai4gDR1c46a6ByvC0FvegxWY3S5vEwRrZziqRfxhi6tiwZLq0JoLSUsu5Ay6mL6mSkHb+8pclTb5ZLqWWxXrE4oOrORim5tSGaWn4fUiSdF4ZIXkninWdJG0hUHd3BsTlwFGcfhihZHGpSiIQkaW4mWW1HE0KKBK7nF8tBy7R3TBbp14FYltISSum2tMaM0VuiqgTu15MAMOLCL0HEgXbHeToOrY8+pOgnzl4Yj15aW3t1c+uljY0rs9lmNXSUzeJb35h4EsKz0D5aLB8tlo+Xy5O2bWMyrooWk4AgpCpmw8tcKaUIR8wHTduG08XCr5oL5y/8+Ve/8t1vf+tPbt8euWo1XzTz0zQ/Xj169OS99x9++Mf50ZGBVFVVALuKqSF0OiQIYFbknOWTeIoFBPb6oKSmRAolMpGObAAJkgNh0LO7SvSuZorWmgM8er775P7dw+c7xkRbVXxks++OkoOAx7HY9eO0LYti7qGFD8VJk3r6IJClDGhqymfEpoyPLFY8GNVjgMKHRC/4nKUj8xU4gVEPEtOjRumQ2aGJpe53FVexy06taUqkPnSbQcWzqLijgIj0eWPPRCZMveB/KfRiWfGkvuK3U04VnFn7FUrV4uLBldyWbDCjjkox3/D8Eebv1bZC/DMTvwegYQfMdNU5tGTGo3p6RdbHCi+9dEIUxmChI1/3+MaGpx3uN4rFSMc+lisAqcub6pzY+cVwGCMZiROAqRE85LllXOy0zryuNlHp0T2St14Y2acKlVDxhtQz45LWoYzm5cY1vb5B7kB5bPHuMJ2p1r9UFGHhYCm8kqjtQUmURH6BwEm0jEqqn1RS4QCjMFg8VUEtuk3qMiJ0vNcUS74Q0gpJP0OUV101JPZE5+UAcgPIb7thy0d23NFNEI2MBBCGOFtfv3jt5vbFS8m5g4PDg739xeoUgXi77A2v/pFcUCj2ACUdgTe7KYpTlUTcm4q4zRWV/trAIN9D3qwaV9Vnb908+/oXp9evu821UFV2shYrd//Bg3fe+emPf/LTBw8fRZPWJtNBVYFSU5ARVnaKZhNYFjsR4wjaUKe0WVWXRvWl8fjCcLhe12NbDywOra0rt0zhweL0j4eHv3u++9Hz57vz07kPqxSNRVvXtqoMOIesxrYs11EQjS44O1LyXtbyp5xjnCKn4ejqBkREaPmG5eGcHLsooo5IDkkiX8XI0hauk3LQXQzBWsoRzDcVluZWbWFBuDGk/gs0QpOFGhZHN8LijQ8kLqcM1GhCDMnygAuWF+fkPIFsx1ZZ8LncIkYkQyD1VMv/9Xlatxh8LmnWucSjNvKZgEztCvlq5IaAXFwQZekcEGyMgfHE1jcppmE9DPkr6PLzQR98jMHnEtx4H0LTYtu6lIfF7cnkpc2N21tnX1tfuz6ezVyVQlx6v0pxGcNR9E+Wy/vz04enq922XVHnANYapALMMiH6DAcCGTkxIlLo+HLRLBcLV7lr1258+1vf+ObX37p55aqNoT06aRfL1f7h7scfPX3//Z1P77S+sRyTlVJrTGOSZ5sOykj2wHMwcLaSp3MvGNMaWQMwD9LzUG5EtehNbnmH9WBtfX19NjUxHjx79uje3fnxIVq0iFGdfGLPh56pepE+iyIB1yABGrwthwdLQJAexIm/uQgqC3hcsgCwMHVk7qJliQwxpi/cURAklgEKNJCj4NciihTfNaX48EpDwD+1RCocpVQ4vdB5VprSWchczD0AYpF6JmVGpfQ5GVLsIZFRwFrG+NlPUhwPefTvNregIL8pcmTgj2FXdEsgrNz8PUxZCbya2Ci8I927l09y6syTJcafnLDW6efRvEAmLgRupSqBOtaYkquBvXxAEBSBew1uCgq1uMDDoAYoXLpIN9KJ34qpZMf6kvZKpm/oq69LSdWxVFu0rk5+HqvW7X7p7Uy/UzMlzyGZF6gAndap44DpLdDBIMwM5qefKzJJJ8SWNMml0iWIGG6hmPvn/jqiwADCAYTiaQW5s0ZupVC+ns83bgmTzCMgNF8Ose+L72XwFa1ANN6HwXhy8fqNy1evoav39w/2D/YXqwWSiyEzD5C6JjI65tEZUAotVqnEE3EeUaow2fw/UKWUvwFMzTyspgXfVrPphduvXXr99eGli340MpPJYDo9ms9/8ctf/+CH/+33v/v96WIxnk5Gg5FVQT5D3JJDTm0Ngi5HiC89iuGMxUuj0eW16bnRZObc2JgxKYZWaPdivHd89MHTp588f37v8GC/WTbooK7RkiEVG2LLx4SZH+QPqcY6Fm3M4w2WRbw0jUy4ikmTWaPw8Al6TdE4ZyNvYIkcRL8CCSsmV/OQ5+AQPWKd628QvRCrjfIsGzwiEhYJDk3gPjNGzFO6C9EryoKcbVZkKwJ8EZE6hGito2EnKK2Vf8jpS02IQiCiDa5VnDDE/PY5pp+wfS7tlfklGwYdkuQXUGiGzy+ZT0AfA1pL0I/P9551eRgPHiDxuJticM75ECw65xz9Qg/kfMofq6YNkXKGV6FJMZjVauDDGroLa2u3trZeO7/9hY31C9ZNY2p9OIlE3QpxZ7V4fHrycH66E/w8QeusEOPoxUaR6nLIICbxm4U2pPlicbqYr01nr99+7bvf+dafv/mV6WTaHB3DYuGWzeHDh3fe+83zP3602t8j2XfdEArSRN+SUUYLqSFaWkiGRuRcZUlSTPaWkjaX2NUy8hRCe6ZIctZgjKvd+my2Odsw0T95+ODJ/c+Wy2VFBuhizpyC+isxckZMaLV4jbxBADn02a1J4tsEwcZUuMzG9HQZHTTYPx67NWLRQ0oUOQ3i3EXIQ2Aq6cOduIRdIkG8F+VsDMpblkGuY+H06Vb6l1yXTNEwla91e1/TjUJFX6dMnWILnHogbYpdYkOpCNDJews3zHRiWyNrv8S+2oVQK9F8si3SXSpAGZ6UsaF7af6WkOSKlhlRn0g0MJxuqC1zcRdOPa8Kk7o6qASr1KeVdWg8CvtKIf9i2i3AfUTJSirXypY7AHp4u3inMi6cusSHfvRCj09mSkuj6wUNSCzvmu4CJEoPUi/e2pjPxQC/OPyqC4hC7yYWlRMU2RW3GCnK4p0RZ74LlQAl7o+dJVsRFavIjdfskQn1PIQYKDd7Rz4HEfOTfJ9qU9esoDzX8jTkPuZhuPUtuPrC1euXb9wcjMZHx8f7eweL00VK3pJFUaJphm8fonGJXXOuiClVlAFQR7AQnYEaLBOeK0Pb35RH3tpCFUNarbxJk+3t67dvX3j1Fbd9djEa2+nEWHfnzt0f/+Ttt3/2zrNnu87Vs8mkqiruHyE/Mv8TCtDNjjImBNs04xTP1IML48nlyejieLSOOEaonW3q+sTY+8dHd3Z2P919endn9/FqMQcMLo+5VeWQDBtRCPZMdmBVZsHLyBjfOm4z80DIfy3e6EA4arCMGKNLoWXQNt9IzvK3ggq6SXbGCHN+RQYgBM9apMDMZtS5l0PreAkcoxQkI47NdJtYPi5C9NY6pllhLjIYSEUeku8YkElIOrnJ4Ght1EjEVOT9CR0qJMZ7IIwhssW48bTKlV45sZFknj3A5gGdwHlPSY8sQ6NNuaygoefuxK63+TLGNqTk8gjrU4o+0JO3lrjWjOeD+FSEkFsH6uDZbTOEsPIxtA3kt96fr+uXz5x5dfviK9vnr0zX1nysmlUbw0mC/ZSe+dXj05PHJ/OdVXsMJji2EgeOxhUPX9RyCGxKlVEbzIkAAIAASURBVO/T49OTENvt7XPf/sa3v/utb928di2G1s+Xg+XK7+ze//B3d95/f/74aZUA66rFtIzR544Z1ccDibQVPIdA0KgaDfpofK5cpFuSSdMo5QojtSwJzKAebWysTycTvzx9dP/+zqMH0a9c5Qwp0KSB0oVYlKRVLgWWWYBRMtQtQgzQdVyMgQY26A5yOyX16u1sDzu2jIBqikRGhXTJcwCjUAuJCR1LejoU+lWRtqnKtwiWkq5B2Vi3AL29tWDRuZSNIQi73xSDYH3eOs8XEo60N9Avr6ZUKt72RN7QFUA8KRxaiFupV6IL9hglCjY3c7EjKIJRs0mhbhVB/wv8HVmL0ukQg4TRqNiHn4c6YZWrKT8Nn7s+XQRGeXFqdSW0vJJAz4uffH8HHrSZ9kGaOijnnVgF63xbDFykKVKtDPS4TzoJC/su9eflFwvt58Zabb1iz0K1W9qmfvnviahMn4mmILgp77LuVRix5700xRXrqEaDfhQvEoAXNiMv0LyEAwdlUyBEPuRFTSz3E9Geo4INoo42JcqMSVi8rpCjVk5549s2GNi+cOHqrS9M1taOF6u93b3Tk2OitlsGvVxktpHE/bKrMA27yQFNvSYRu4pMrEwut+TnbPLIa7AGU/nYNstqMrpw/dq5l25Nrt8M6+uJgtyOTk9/9evf/OCHP/jgww8Xy2Y6mwyHQxC4l0wkpOmivH20jOpCDNi2oxjP1PWF8eTqdLJdVRsORtbiYLBy1WHT3j/c+3Dn2QfPnt09me/7kBDdoLbsnWFUHmiBz3pryX4jxFyEJCjGMLeZRl4C39V5h28Xq+FCJNrIjxVMYLqBpnujzJQpoSXtR74wbFQQK4TA8W00zubx2kS2AyTbp6SBHin/VYyIjmIR8iAbIqO7KaWAFkOIKOQw+lixbtFSNUDw0dv8ZiYfiG8VeayX0SeSrYphCnEu3qGiP8Y8H9jAFK1cU/Mgm3+R2AijerPlYh1CgqqicT/QQGyJrRt4dRfVk47bfKqvgZfjPpnKupAHYu4tGViJpKQq2U0RlQUZQ6hcRT1QCsGH1icDjW/aVeNiOOfszdHki+fOvXHx0pX1jZmtXNuGZrmK4TCapz48WK4enZ7srRbzZLyrkkVJjKADKyYTkM008juWbwcTl6v2+ORkPB6/8fqr3/vOd77yJ1+ejseL+SKeLuzJ0fEndz579zdP799LzaKuhx7sKkYagqOnFS+FHhoyvAwp/xEFrybuMTl4kIm00cBc9hgxxlPFG02GG2vro9FoeXx4/+6nBztPwYBzDogIBsX7UGRLXNwYFIuGV6vkMiCbMNlhEf7Aawm1Ly32U+rcUUYptTsoULCG8gtPuhtI8qUMKN6V3cFcoGvBroSUZfoalu7sK4Oryo8KaUKOdnZB6lk6iye+Sg803afnX9kf5bpfAsVqs1QC1EyA1FGielOXtiJlAEsaOdyfoyWkriig9DpBwfw75m4f3RVsH1lrxDKkYhVdcvkYVgCre0ZBJ0ATlsoWGTqYV7DzZIi6SVF31MozBJC7a+LxFOeMF0RLvbdYrqK6X0BvDH1BP6RoRJ8A0OUhdDg7bwCKO2apXXL4Fa4c2c50QQ/CRyxUPl1v0xqbJQEpYlfemUfKEKrEXwtjr6AOSexiBLRMqbRkIFsfwwvdiNEqc19WCd0lNpRVUNLGEkMLbNjOMbGFi4+khfAhTNc3r956+ezF7cb7vef7B0dHIUSXj+BISUrAW21OKGIPZyIwG8kjSsblPjBVBp1JNX3RAVQJhgaq3Gn74Nu1yeTSyy+d/9KfuMuXVoPaTWZuNL7/6MGP337nJ2+//fjR06p24/GorgY8fHLwlmDOie2rmNATwbdVTOsVXh2Pb4wmlweDtcrW1kFlg3UHq/bjvefvPnvywd7eveOTxgA6ZyuX/wsMinJ8L73PkX0dmUysNmrQpTKSewdzpWRy5DGcB0zN/CIFTqCNAK38TNFM5I6kCvmOp5yqFKgA80ALTIOmvGdLDv5SfCk0Bakm5drnQxQCV65cyPaAJLgytMX01llasgKJf8SPN5LziEkmhMCJzyg8VkM2IWzKEYU9n6wleNnlSu95TpaDmzIqovIh6QVba5KPAfPwGhK5h8QEMYKrqN3g77YQYnSQOwx+wXRZAlmc5blfyF7C3I7OIv8ehQaSiZivJ5sSJ67H1BUZ4pYLlxSpdEWTgvchtE1sQwzt0Jjrs7UvbW392flzL29srbmBialdLpsQTiA+8f7ecvVgPt9brlZgQuUSxUQl8tPgguQJjPXAWEhaNWExP229v3T18re+9fXvffs7V85dbBan7WphTheLu589+c27jz76ZLk8rZwDWzcpNSa2sh4Gj0LRyl/J9wmSt2UKdBSSAZZEPjCtnzhWFNlE49FkOjuzuT6sqsOdZw8+u3N0cOCcQesKy1QkarS7pVEekiklj0afJN7wfJ4FavYM0eP4QNdGXw0Yi4dE4ObdqEejspU79wapJNCjn2p5xiDVhdUdZSjqH9VlCFJdcd/IUbar2Nv19awrU8fD7WYtIebTfihJ5eusK0XJpFVdidifLzWgliedHUlMGnenFlE88AhAyb9PswaMkMIgwefWndphRLHf5xdIb15UIjn3UqPpRnHdSEnEYuX/QdkAUN7pXuOghK9ShzlWL3K7AKhvc+HidRR0oyZ5EeBFo+yOzNXZqvQXyaVpSd0mAQoLRZ5TbyIuDJYkmjgsOLVRKbP5l3OwKb0dFLdvopvb7hupAOutpf5sBQImTr5RWVlpf+TH0fSShWnD04VySrg76PqHFfhs/wxGoDSKlOYcuCSkRvnosWcSpHxa+Wo4vnj9+qVrN8Da/b3D/f0937bE4LUQLRVvcuImvJrWwPkIrighkyIZ8oDrkuiLKlr6UkwCDJCC69sWmma6Mdu+/dq5128Pti/44bBeW4+Iv/vwg//6gx/88p9/eXw8H01Hk+EIhKrBdKVcZxjLZHAY82EcbQgzMFfH46vTyYXhYLOqx1gNXS6HT9vVB4eHv3r65IOnz3cW8zYZHNRY5Xk3KVZibdcIQd+ckzpHBLZNKGotsAyEIpT9AEHQ0GEgKaJF8iqOpPGNmhpiCjQta2Wpdgze5zk4z53WWGu9DwVV4yaAiidvnyR3WT75VPHzpB5awSA4HE9uTB7ck/Lk8x08pl7mJE+TlpbD3lqagEkZzLaUdGYS8YLNbAlY87GhWQmV18+6hUCGdI4aRQU0CajOB7kE5CXHcms+BwoWpyvGPDpHz0tubozzjO498gPxZ4fbgVS0jMn7kIyvqgEP8VEGcZ6iyWHN5C4kkr+lSdH71i8b9M0A4dJ4+sXz23+6vX17ff28HQQf5z6sTDhNcadt7p7O782b3eBj7qswIQYxZ87PzgMfDeSwbExIYb5Yni5ONqbrX/3qn//VX3339hdexpRWRyewauZPnjx7790nv/tgcXSCgwosEkuL7LSo7npynG5pBvG5iQEvKbLUuCVWKyXxuyZRE5uMUeJwvbm2vr4xhZSePnzw+P69Zjln5gLR7nK/zLKSsmKNwn5nexzuLEjmXbRC+TJTf4YoEzWg2E9zu07B4KkPJ+pMqyVHe3pOD9JlZiRomu4MsZKSBYzkKPU5OxA7NyQoxsXp83Nndw5rxSl0oILQajkgpg1EOUylamNfsgqdiW9vWu5TvHtVPRBzlIEcOqFZAcQsSvH+lS03tVv06WXUR+yXQLfBhVBtCmgelT5lisqf96Yj8YJ+YUrW8i2vF/TN6jOUXyxzUfXFcjJIRJDYRAg7l8LuiGFP6JiQSPRs0fU724r20fZegU6CRsTOmkwkFKmYg5gXMV7oDCZB+XHq3GiUB/+51qUjn5riatYlMXB8F6t2A5LHs/i2qaZMWzbBBAo6o3txicVX7ltkti/N4IlJqMLcIzU+869QkBjg8V0zD9iDn1ENVm/mS5dPfHQXLl2+fPNGPRofz493n++uFi35T0DRRHPUjlVnMmZXVeQNyfG9FVlIsnEVOUqaysCAIGhsG/BhsLl++Y03tr94GzbWmno43NxcNO2vf/Pu97//gw8/+EMb2tlsNnBDOqYDzTX5JLD05lvCKfNd6wMGv2bS5UF9bTY5Pxhv1vUYzdhW0VY7KXx4tPvew8d/fL7zZH6yBEjDoasGDsXCGMVCWWxehA2c64nocVOSVg/ZZQaZUsFJ91KrkNOjErkoR9mEiUSSxgrLWwETQ6C1UJIBN6kGEBGZZMQYNZhcclzlyCiDvbEEhaaezIb8zMl5igysqOG1TFG21raxRdLksqlkTCEPlsjmYvln88tBA0370mQ89+FB29IKOcYYqCMRCIxkHPQy84npTUiOMoJTNN4E1CJLc3CwnG4S8+Rfkcq7DcFhxfCnjwnz9EwNk6Wjjl7CfLV0VeWoZIowOr/SYNHm2c6QhjzExeJ0MBg6WzFRmgynqW1Rz7/81KN3POJbCneSSB9KLTa81baCVoAJRA+LMTXkp4arxdDEC5PZq+cu/OmlS69trJ9JCRu/iHHh3HHCp8v5Z0dHD5fLw2SCdYkg+kgUKhLyMrVYnCaTSau2PTo+qRy+9uoXvvfd737lz/5sPBytjk/q5bLZO3j0u98+ee93q719qG2snE/QpLgiEloAaIxpiUlHozBLlQz5S+cPuWf5oYEQ2eZM7BFINZ3qut7cWF9bW2sWi6cPHuw8vp98Y12tK37ag/BVoDMzGo1HE+2R7rwZk8kFWBswLaYhsbsPH5tq8atWTUKLFlOFF4sJfcKiRhnyGRc62pGMQD2qrA6mZToyPU5UITmX8bt3FAsEnEomgT5S0rR30JMXJHy/d1wb0z3ii5u/F3aXSaNz1U5St8qmuF1Rz6rOnUnMOJOj566ZGmVP2XlhKBDLoEJM/BlPmpzCNy+zoG1B5XujZc/BUbOU2dy+o58lyYxVHxg100AwXQYStw9ipMkVjM7/oKt1LNaSXVtU9OCmMOdKoCBXJNFxdVdaTbZAJTmQuuxnwaSZv4b6/abX8BUQQt5maSBQbw/OIsGSHMEibiO102ggNuXZgyqqsLyThXsFnY5YfjuyxYWRBF+azJHFUmy+J/G6ApBIg2cZRSX+LEj6lWEE1QezvnXm6s2XNrbOzZeLvb3dk5PjlA/uii8ass8JlSgkwJRWvxxPlKzJY65FcFSMOW7P0qJ3CDAAgKYJMYzObF57443zr73WzmbNaDTYWDudL37yzjvf//5/vX/vXjVws+nM5fk8sIiX0ILIFhCWV9MhYWhHIZxx7up0dnU2O2ftOpixw1gP9hA+2T/47aNHv3304OFqcYoOBgNX1czMEnwlEl+RChtrnnvGPOxyoR8vbmrYmCZ17SKB0+z9GA0pjwW3IVaxzBpi1EyM0CjVggqNQtEcJwWmGGBF/UTHEFnjZAT0lk+ltaZpvbPOiAs+/QrHZnhUmSyGFCEkpm4A2ykTEdaSEUfuz5rmxmj0+oWLP/vjh3ujSdSBtRxodPoK3EKfG8t7NCu5KshiX2qPyIIPnclVNo9oSD+oA6qwTDisweYJks1QE9tEa2PKDs1cgjFqD0DlNra+qQdDyGO0p8uFxI7mDDR6NjZ3KlIkIrUjTLo2bBcmbysH2hEKmyy43BOk6EMbYht8aoM3TTuL7dXh+PULl/7k8tVbmxsbMdnVqknpCO3z6B+cnNw9Pnq+ak/RBYeqLuPc9vxuBjoCcpeD2PpwcjxftMub1678q+/99Te//s2N9bXF8ZFbLO3h0YP3f3v3t79t9vecdcm5JbGxgoGVMW1RLpEfN0c+BFrFCTE7F2B2tM73mRfVEHgC0kaT8ZmNM7Px+Ohg78GdT4729/Jnk+mBQnCCMgExAyGBWpaKS1dhGjEel1JH0hJ+vwYd6oFoOohOWhKR/YG6GMt+UHQdXYQio0Ag8IxsOjsPBuhVVj6eI2j0ebHjMOqYpPwp2Vvz2pej4lVxlwx0vhDiFaMHPTKvsaMPR5mhoKhkdTgrAcnR9GzCaAYp1oX8gqKisUE5VqkL01C6iVLMGRXX1aEQ0CQHuz/0w2i6npLtehPpaaIy1WPqSMJJ4jUK3atYLcnPBa2hPNoSeV2rqMhppXERK1xZrjP/t8dw6shUvXCH3gZY/6Raud4evgy6oEGKgoRQ9UVxilbXyBcbpvRirmDS8Ero1vv8nxRRojW7OA5tHpmDUDxp9FIbU8Sd3TpGf6l6tLEYSW4sXfUxscWIuZgpqly+POzPaplJ6pu2Hkyu3Lp14coVb8ze3v7h/qGPrcVODIwq7XPA5oqU/qtVtkrGGVMjkLcGVJj/6FIYQTXMTbH3Ia6dP3/zT9+Y3bx5MhybyWyysb6/v/9ff/TDH/23//b02bPJcDwZj6SF0GvNsqLcauUBHNB759sZ4vnR8Pp0cnkwOkNu/nY0Xtnq0cnB+48e/urx4zsnp0cAtqqco3AhwBJUhppEqb1sZMco2yU1J+ccVTeqQSypMakj34oWjmWkyDpIE0k1azF4ttfNt7B1lmpM/vwHH6hnxMB3f55ZI/DDspwpMFMErKvz1O9bgl2B8FjlGZE4lT2BU56nI1jX+jalaG0NguqA9zSh2jwr5bnTWa5EfFErNNXx/L//xtd3Dw7+n/febzbPND7QWAwh5MMcrUPl45FXpeUVKwD66Csq8BKYT3cYuauR3XcKlv7WRGOdo2gH4JAJkjlJhkTkfblJztY+eSJmB7Q28kSHLvhgabMYY+lLcrPoiUdb5VuP4HRaGVAfQMM9BTERrSG3HoFSmQxi9IE9vBIX4Cg4mbVsF6UjQYg++hBD24bYtOuIL0/Gb166+GdXrl2arg2aNixOGxP3AR407Z2j40fz+XEMvqoSWoYOyb5MfbVk5LQ++cViuVgszp09+5ff+c7ffO+7ZzY2jo+P3GpVH53sffjhx79+/3DnaV1XBqtV8mRdGUMuq+CJmNoY04TgSawciBQQ6cpw8hLnOlBbgZxu5kN+99fX1zc2N61Je08eP7j7abtc1M4mSk8iPophY+ckmLYaSdHNLHoyzA9LBMsUUzHJxwidzXPUYiGLytS3bCymCiAnZCzygVTO46IAMf0IJOXKJuhFy3WQZt8bX9S+em6ChAPo5jTxtNmjbuiY2uUtGXgRl9WNqUw+3IkkjcHppmySZ0Lx4Oe/xLKlNeZfCmQEIOYenvd9pQ5AYe+ajr6k5YE35SAlFkgHTFhjB7uriw87b0TVTCtdCMRpik8zfia8QqMgL1FNcNaxjHHyoBGK7Euce3rLZ5YkaZKv0KRTlyJFbgE9bXEqxs6yXOCdQKfKZowb+9S1XuPUvUOmMxUDNVntcIqCl/RRkIQyeMm8zjcXRwPJOktujahrwsQLT210DIUDopp1SASFCI2SgHJC0aL3SpB6ZBUeouIqKEeq8SEkxK0Ll6/dfHk4GR8cHezu7TerpeUMaEFnyFBQghN4xQuWh92UbAJHULNLMLDGkcMz73prE7HxkOLm+XNX//RPx1/4wnI6geFwMtt4svP8H37wX37yox/v7u9Pp+PRYIjSZBiK46OlJzVcJADyEEKdzBlbXZ+Nr4+G55wbOzuohuDcvl+9//TZz588/MPu7iEd/a6qDJkAo4raTBctos5gCgIn0SsDUYgFyyXojboTFHoCKvePBzxjkSXrSK6PhCRDYJCL4fpAthuRffBZFMv2r5GdsX0MSPgzRVEQTwkEBYopMsRNTU4QwyIOGQymqmyIQQlh5LdJcpHcoYAjiysefR3FGoXE+H3ITa21Np0cfefG9f/hu3/1v/3d3//w4aPFdJpK+gc16cVsngM7xJeDDDcFp3HUYJBCwyK0bB8NKO76GK2IOsUjnjh9XAUxRLGySySnIZmwCZ5UyKlYayWu69QnYq7HpLHOhYeoYdQVYchjb7QW21y2clNI0cQENgeJ+UksiabPYxADL4rrMxzJhapfRWqZog+ei2eMoW2WxofNavClc2e+efHKl86eW3Mutt77dm7SsxDunC7uHB89Wy3bZI1zQUKx+fzKYytpORm1SvPFYj6fb5zZ+Mtvf+df//X3Lpw5u5rP42KFh4fPf/f7z379m8ODPWutq2sOgfYJxcoDjI+xofhhH2JLh2TE/MmlgTjPyrnnoRszsLw2pGBCVQ831tZm01mzWj757M7ek8e56aksKZBCRIpMpk4mH8RRXIuT2N+yIhry42IgeIsyfKJlYwyqxRCjxBrSA2iYPZOXeRlAZP9EibwiS06iKTXqDc23nzKYdJIpQiWZgdRb2XAdLMURyimL6txcvvw5SLdH1emUteWE6K2eO4dC4LSqAqkLm6Zk6vFTjQLad7aIScBKAU4lqJ+rZyo5URpfRC/dKiNJVGQAJD6kxKGYOs0S8/0Vgi4TcWTdHw9bVBQxdEkZ6iSs5KmSA8xAc1Q1c691QnK8A1k8S/1SJpX+Q4ui/szKmQGpM6zoKNBCoE4FREgdRQt6JqmmPwqbjmYmeUJGSMdRbKqj6RmZRlXPMvFUWP7ANRVFVJIvMqdhYzGtBiSghgmKpAPUPTXQzwsigzEFa6zEr+fPKRUJ4aTyKQh6V7GnkuRzsoUX6sIeiVbkQzvd2Lhy8+WNCxdXq+b5s2fH8yNa93JRIT0SX3PiCOXiSrbRnBXIBbg26CBVxlJSb6wN1Ghqg+gbaJu17bOX3vzy2suv+PHEjMeD9Y0nO0/+yz98/4c/+tHR/Hg2mY4GQ7ZgJd8MzksAHq/pEgQIfhTNldHo5nhyflDNrB3XblzXDcInR8dvP3r4m8dPni0WLaIbDqxz7H5MiXh0+KtjPJOpYogO0CfmfhPbiNE0GfokDFBxX1YXGUfgfiBMyBKcaZHPEap6+enaSIxirrFccBHZ1EAhi8Tll92VJblX+QEG1UHeGHXxSFAsq6OYDAabLzmhdWhNrrUyOiiRKqJowK0QPQRFFIgu+uaqw//xb//Vxcn0P/z9f3n76c7JZMyTBJOlCUYFtklSzbO1bO7AkK7QpjqnV0RHQ3CgJ4GssojRuwohWUa3TORG2CjKEJErLuPoVo5v5ppHYoBTSDay3NnYPPFbg8T1Bh985IjzpIObATF2TKqfBlnw0WtKTAYzxZ9dPQZ4/8kvJ5AEGelSAC3mKRKiNe1qHO3F2fgrFy9848Kll6dTF9LS+2VKRyk8Wi4+OZp/dnp6HJNxDiyEVGKAKezIEIUpoTdmvjw9PT1dm86+/a1v/M1f//WV8xdWRydpuUyHhzt/+ODBb35zvLuLVQWV8ymtUqQxl6FpaMmw2pNsKYJpJF4pH5MCuOcCHOmOxcDapWTG4+nW1tlB7Q6f7Ty+++n85MDZiotVEXgEIYy8sIdICqXlEhxF4kOFwybBkxmXpNxj7AGxEUqFNSouigJseRlak6wP8k+rZ66QBl+gzJrU8x9MJaugN4Ya6bUIx+ZDGjWowvTKLBbvQz4PumWlKfpQbda12oO6lIDuJiU4QGMWC4RZwF8ifxSemPBIeP6TgyhJVU6SRkfaADXul7A7JXKqFxjfxIVwFlMuwLw91IreGxjF3xt6dDF+TmJhLKg9D3ZE1ZUwAfEl1tIYuavXBCnyo2c4XJbSIqnB8mz7C4NOrJU0uTiZrr8p2QJanFO3dX+Re10g9qSCpY5WF7tH68UDp35YJZVG8UOTn1ZtOTMQVLObdPNY1g1y5Yt0jh4QhbKXUNZrSkXlwmN0CYHs/GqZsiXOJgSdEge5BVtdvHrj6q1bCXF3b3/vYM+E5BxpW0lhIzg23XRO7CRzXaxo6cZMq5rCARFjnfJcVKEZgKm9N82q2li/8pUvn7v9xeWwjqPpeHPz/qOHf/93//jOz3++PDlZW1urBxXtUMTnkvsyNKZiz0IfKu/PoLk2nVyeTM9YNzM4rS0O6p2U3n3+7Ff37n26u3towAyGSPIOCfdF6KSKElQurpz58xRSwU6NmEEmkhQhRSBE66xccGAdpKTTAwHOIYTc/xA9ycgONADl5ocQnWM2k7xPsunMU5plZysu0s65wGm7Sd3JWcjEjQ7aENrIX+YII+bzyieCNjq5erFbpNPhkryYaR+cJBItP6/gPU2ukRvT0eL0v/vqm3/12ivNcvEff/j2T5/tLmeTxpMfpLU0l0ae+SlzCS05KRTMnCdOZhoSd8xbsJEcMKzNP0/8bVIeWzSyJ7a1q0K7QoterLFSaAnEJnG6p7tO1NWkQ4oxKL0t5eG4sj564R9Q5krwba7f9OYYyE+JWUgVOh/bVbOsq5odS1rfWudiiDGEfGVpcCRagyO7MW85aJc+yIHefYouToSFcKpnHvXzl7zHxWIdzBfObb91/dqXz25vA4Tl6tjHubXPfXPv+PDuyfx5CK2tOQ8x8ngXKRuYmpBATNLFanl0dDgZj996662/+Vd/c+PqtfZkjotTODp+9Iff33/3vdX+PjrnnfUQ2xjYvbKhgaMF06boI+U90DnrIztI52vNoYcJNG+WtOFg3XRtfWt9A4N/dO/us0ePYlzVjpTZ1KNzy0PaDJGJiYsFbz3Y/VTYRRBkywiRk/9L3kHHYzWy9QKanbkAl9NUVz1qlCEDEheJqPYFJMJL7BkkCchGU/LRiMWhUpg7MVGP+cVwqHx4ijdjJ2HtOSGbLrD+X7oKM1SddNNodHw1KuzBvtOTdphGww2KNAhMiSHjIymJjINF2LQ8l3i2FEw3/hsNIi5uNfSrBpMNw/QsrVjENSrYOkEZkfPunFR7OUoidDHwSMmUGgtZgACjZuGcAqQbU9TtvJFhWmL/Bd4X1xfoboKOYNdbuiblNGv+H1/mLsZJImIL9U9NNnSQj6ZzmpS+TDXaIMnYwvRKQhUuv0nAbrpyvGzpFMEsmC/XgWP/2BzQMJdNRnyxD2XutBDVefGV2HY8zwC8/oBIml1xgyXXiGSa4KcbZ2584ZW1zbPH88XO86fNYmmscfkwZfsq0VFxZhECOEnIxzzmRuMwOTB1gppOa2dNbWAI6EKbmqWbTK6+/vrFL72+WFtrRpPJ2trjp0//89//3Ts//flyvlxbXx/WlUzkHOlMIzAbAuez3rdD7885d226dnky3gQzNaYaDlaD4d2Tk3cf3H//4cMH7aJxg6oe8c9w38ydNVk9oI8tE/+kQRNTVRo081kMSiNApQsmrsF8k1M2AJHu86GH2rlZUF4BsWlBkh1ZMKxKccGyoHjpJiwOfRR7QyFC3fJK8Ca0ppeTlpgpZpGDE4QJkZCERmSOweJfkmEyu5MGBTXVQXCW1USRAYx8P6z8V8+f/Tff/uaYyPH/+z/88KdPn6/WZk0+fyMKe57AHRNbYhoDBStFpRvKjM4OJIzEcbo7cb4oNjH66IFZ4qRpSSoKKgxZNKZtQ4q+HgwMkM0xKxcZsJOhgzB/hOBzFUZasMfYUj4Fet/KZ59dF2X9lFsj79tVsxrUA5qt8w8ycT0m4j7TH1gokssxQBta367qekhTOu8gWCtruSWODHvSJ9WnmGfi1Wrcrq4Mh29eufqVq9evT2fjVdMsl8cp7QLcPz29c3j0tGkWrkpOPFdIQSTqnRC4GsXFqjmanwyHo6//xdf/f3/7r69dvdwcH8F8YQ+OHvz+d5+9977fP3QD5x02+aomD6nJ1TdP0k2Mbb4BjTcYKHZJN9AQWNhj0POtnHuO3HYOh+PNM5vTwej0aP/B3TsnB8+dBVFgs1Mo85ujJPxFGYWZ9UiGc4AY8jic5Hi2tA+WnUwpXMryUTdCDbARKFRASCIaiq6TbDTVK0MGjiR+wzKZJ9WeaDln3ZAojpRu21OmmvIhLKOTLBpLkoN88mmKFPlv6uhU6QXNU9lSm8LNSSpJ7GJ7BMol5Q67f5UYKqMzVnqBuVyWqalDvWUWFMZUlNWy0Y6D64x4QRfBVV9+xJcfHPP1pCSoj5dAxGovzxYv2JfegBhSJ/Gp0CjUzk8Kk74aYQF3Q2pnw6GNg1EBc7dlNyWVX1VOJfKymFCX6dl0VHjQjqvnGS3NRBDdtwSrpc4UVO446QD1qVpBMpKaWqfCWFAHEaFaKXZuDIvzUH1DQLzTWbDFjVWg6CTGjblI876bKFSY2jbkwffa9Wu3Xgpgnu/sHR4cJpNnCJOijcxQNC4J5uJoC0v2GmAhEbfZOJMqwpldggrMAKE2to6xXS0Ha6Mbt2+fee3VxfpmGI9Hs7Vnu7v/8P1/fOcnb88Xy9lsfeAc036thqXxXpmm6AjNapLi9mB4Yza77OpZSoPa4Wx27P2HO0//+cH9PxwcHCa0g7qylDXMfl4Se1xqj5AqaS9kpVcThrnp3eLUX9PNwRYWLHUNITDEgs6hTHtCGkqkQHXULXq2j+DaS84befKLtN9lcRMbOhpJ5zIEnFoiQEOurDaoMWmM0TlHazLOn4TgQ57b2A4mRgsUoiA9F6HE+ddWpCVmz0vDjGt6LS6pUk8EIXImtOcN/Jtvff2NSxdC0yKk/+Mff/SzZ8+PxmPF/6g1ocWJNYjWRc6rFdsviDGw905EZkRzTiHLHOiOJgs3jilkNCv3bMmH6J2rAs3WBmPyyXtvK4s83VB2TCCPa96hc1SmlBFiOLu6zs9NEcimbZkcSFJsDBQjkSCPe/mJEYaRYqDfW3vvwaS2aShQNL83thqwx4G1uGwW+QoRj9ywkbK4EIIPAocUhUK+vUJkBdDKt7FZbiG+sbnxtas3bp+/tAYQT0+W3h+g+6z1nx4dPj2dnxoTqiqp5XoggxU2tCCkOrbeHx3NB+PB19566///t//6yoVL8+NjczqvDg533v/dp++/vzw+HA0GHnBpQkOxRStQpjTtgBvycIkSNkxkaZpO2L4gsOcOpBDyTb+2traxue4SPHt478mDz5Jva+siN/8CxeWXGYw6tohSmKWgRiZe4A7J0e8NelaB7ruJhcvdVipZB6gc0kKEhWBSpyYR00iQSDjJ0gRpXLXadXyfPgSpfosFGwYJcID+Iric5d1aGDTuqAzD/W8vlNhuMoSuze2XBfXv6qBXLfpGslSM6HEEtqfutZhQ8ApAu5TCuCxIN7WjQcjn9DxtVY+Ad0ViuMy/t3SxRj0mTF/JwTJW6Dl6GCa6Qrk0HIsCmo6S5GGE9I5lFwu65tWqijo8akyi9iuggQaK6xpI3UP2vClN51JqXvC0LsGD3UXvbfaZhMB7VtrYosRhg6ifWTUrnH36MoJ4EAj4oB0ZmQ8XLEXcUKEoVWityCwzNFQcCE+2bJNF3QSXAwDx2EKODqPOsmnDbGPrlTf+ZPvKleOT00ePH89PTtAim0qyjJiKLpCS01R58CVg2UCFaQhQmzRAO8jVF+qEQ4CxgWFKpmlqh9dvv3LrL7/tvnj7dG1jtHXueLX6T//5//0P/+F//f0HfxwPB7PJ1BKnGMmsCCm0iz2zIEbbNrMUbo3Gb25ufGk2ueTsdDAYzKbPYvjRvc/+zw8/+P79B/ebNgyGg+HQopQiIxFsyniQKF6JpGCkuFxdGuiIwExXjQBV3hZz/YIUc023lpJdsMRCJg3EAOafgOVxCKxzspino8eK4ldiGxHQoWMOcyopqrkoO/Hq45MLoQPucu9gJaJGXpYkCidhpxlR66nJALlgmxA8P0QInHPAHyRLeU1MC42Dtv3atcvfeO1VQwJitPjhZw8+OzpuBxXtd2nPy6YARgIbY/RomXxPC1qqlFGstvMFzNMoYWO88iwUTZ6VGQhLpCxyQjmWD6SzeVyOpGvicE2hROXTN5Bqi3i9hMzzx46VVAQTMCeM+xvGQmNSXV8SHqghCzIUY16OQGdpVp76HCdEECsNa1uz5Ap0ELN8WZV5R2RXU4YtkJBj56rBCu2nJ/OfP3783tOHy9CcXVvbGE8myZwFc2M6Pj8Zg4HFcuGJEE6UNaIiYFLXdoPohqNhivHDD/74k3d+tnuwf/2lW1vnLyydG1y6cPH6tTrB0fPnvmmHSNpwZKEIN0B60HKCpMIvqBHlSV2w2OAIjFksTpeLUzcYbJ67sLa5vlos5/NjzL2PZQakeh8lw++9KVGU+okT5woEJTkSyBcLdwqkYVHfCKOnLygBVUFbWQPpgFEigBS4irEcsQW5LOYeTNhTDQ6IvVaPewWlGqKOaLqz6+lmDZRvVtGcKdyfMgdB+TH9uILaLPf4WrwKFx96BcsYY2OKZMnVAR1dEwrVVUqS7dLlWdQkE3bUtkXaEOvqYYHv9BUSITSxh1bx3NL9LHCoO+qUBWproddDXnnUqigxKkJrAui1KFKjoKifyp5epk140SRDVhqF8iI0liSHHvTwe9TlhxF7NCOs2TL2olwqYReISIjFbiC4i9R/ZlDp2gN6JNwXZnoV+oBC8UbtO1HeFxTXsdJdqGUNEXZlPUJjCIsTWYRKl8wiovcB0F25cevWF2/b4ejZs52d3ec+pIpHP8bJgQ2tgF2ahdtMsiVn8pg7oIDeOpqhMUMDA8CBBesbF8P2y7dufPfbkzfeWG2eqbfOrmL8u3/8h3//7//db3/727qu1qdTJA9lCrfNA5qlVV/+N0TXtmeMeXUy/srGxu3J+KytptXAjoZ3lov/dPfOf/zDH379/NlhMnY0wsqhQ7nikjBEXCQjUiWG6bndC6kj7AGHNVCVLh4BcrvQCY/qiU6OGQRVWf28ctOXiy6fQ/kuRyYOMpeNpDIWOWpXel8Ei2zcmCJgZS3fNRgpNlWLh9EuleVMdBPGwKcb22vkY1Hoo9xs5U8sNUxGEnmlzwCGVLmYEbMYBPqJwQEOIF1w9m/ffPPS5nq7ampXuaq+9+TZxzs77bCW+H46chWl4g4Eo7L2iDVMtbdQrOnB6W6zzoqbuUUg2w96YXyu051FWffgjKVNJZn8U86F5z15IsY5G0xLl6H8EEmhFuc7YGESFvI6syGRIWtLsHJkc0wU2T5yDLNDdE76UmsqFFtsFm6SsCcIzmSY00RPkTxCEwVLsb4j6vaHwIZ8K0BVJev2V6v3nj772cNHj1eL2WS0PZmMI6wBXByPLo/HtYFF27ahJRIZarPLOFP+b4V2NB6nGP7wwQdvv/3OyWJx4+WX1rY2W1etXb2+deVyXCzmu7sQDQVQy6yFhvVU5Ikq9mIg6ZaQQNHZAgnSm4Jt8Kcn8+DDZG1jc3u7stXx0UEMPj8MWWVAR+wh8jJbHOmZRxdUdRkRhKyXyoFZiC+onh6dr1xZ/Ea5QUS+rmewJOWm7nw0hYWkI09R6hjofcJNqfVy82jd7BUBnaCgqw8oml/9u1T0KZhA43l7xF/V7KOOwF3t0LM76bawkNCYBIup6zUEn5XPr/C6utlOuVOyYsy/zhp16OPrQAU4Sfel8HhxnhBMADrWmvY6UKydxGABOpy00IxAjRSjWih3yIGuwRF6PYtugsv3QU+erEhu1xfxeVa6L+xVaFD1WjGH1+m4cOe6LwmAX9oMzmeBsn6XSZZVa/JWl7uEV14F7gB2ISlxxXyo0sPY0kPqmpF39yB7YwD1PReZEEg+NZOBV22YzDa+8HoefE9OTh8/fXo8P3bgHN1FSNYsQCu9KmFF4XAunwgy+9ZghoA14iAPu5BLL8IY7SAG06w2Lm6//JffOfNnXz6dzart88FVP/zRj/7nf/e//PKX/1xZO5utV1ixYWYeLgmxqLgpiKby/rxJr0/HXz575qXxZMvArK78ePib+fH/9eGHf/fRHz88OlwO6mo0qlwVycbBCYeBy57l1bfo94HNmXTJQ1eQMglYTsO+PxztR1oK+jarEf2cZWTUL6JHrSDSGxJMzYJdxVmSqk5z3RLtDMH1HNosqicZ4mJHXjDOOQrht8ixk+TTpKLARKZanKGbmDFmHaqfhimyAGCDIs62sqIF4A8VGVvmx7QGbYKhxWHbvLF97s2Xb9kY68q2wZuYnu3tffDokR+NQxKiDUrWKVtgWSIgB5tLO0PqibhnyBBOpHhomuvkWAhiSc0ffbDMA8zPJ1CbgSFR7nuyzrpAUp/cHOUnL6ImBi0ImXBUetVWl3OI0LStZ9k0Y6A0GQcRE9FnKMaQ1KbHguXLzoEN6FxIMcSY518CYshrrOVbKwn9jXykga1W+Ahmtwix5xG77eKDSydUbiurOg0GJyl98vz5L+/f++joCMajc7PpNMZhMOdG48uzPA6vls2S4qisPorAY3QwVRYn44kP/v333vvZz3+6apsrN64N19d8XW/duDHd3l4cHfqDQ4KmLHKCPr1lRV6odEYjzA8QRFimFUYhDQRIi9PV4nRpq+rsuQvT9Y3FYrE4nTsrEdaMFZi+IkctWUCE7KBuM2QrKaGNXPkBX6h6VLBNZ1AotU/KHZTCorW7OB51TCfZInYLRlATkP6cVQqAUpRBlSqCSQpruhBDoKMwGfVmLntNBSHLgV8Wf0yn6vjY2C/zUDBZMMUnGDTVQQsQK0itWGwLpVbXzaWca9J8gVr572IEW9VDfnlahEw/3q6UYFOOR+WykV2bRiiK1lR4V/q6+dOqlRuMeQEJSAlKPK+mEkgbUF5hl+enrZ/pz7lQ+hP+3Wi6tzN1dwc3A50OScF7JdFBzwKEuxwZYRnH42mXICfqVdnMqVh+yrUFq3dt5woiLVQ0rI+Wp5U4qxMkFIavepRGUuYBo7832Xy4+Ih45fqNl29/sRqOn+3u7u7u+dA4xz6CwjqmERI4rcgJz9nU+Y9Qox2BGSIOAKpkRgATNIMYYrOs1qa3vvbVa1//+urcOb+xOdrc/OWv3v23//Z/+tGPf4Jg1mczZ/MxiQi8SkVr8hBCmte6bS6ieX199qWtrRvDwbmUJqPhyWj0y93d//v3v//Hjz/6ZLlaDcfVYAhMX+ekAS1hkcUo6q2WC4/tPmk8Wli+LFw1KRBBLgyNIGysoYilwdLO8UmDQhJEtCpJQwWAxHQArdM2Vh1VaRczAXzpzMbR/CS6SqUOFBeozHpg1Jv4QPmZOzTqSSrNwP9H1n8/WXJdd4L4demeN+WrTbUDugECBCh6kZzhaCYU31+++9NG7O+7/9PuzgxFUZqQ4YxW4ow0churEIcUBcEQ7dAAGmiY9l2uq57PzHvvRh5zM5sLMVoNdHXVey8z7znncz6GzJhhz4LuH/Rko6EIGCZTTwZyfngVYJkCrTHzJZFU1VKqa0y0WvzrV67tbW+iDtALaSKd5/nNz+7NTWwxBCcMErRRcZL8y2kIgVU3BLQp2PzBdRFOcm4/Nb2KDMLZGkASLGFB3Fz9Ec2sZFSjGG4TlFtDeXZg/2mBGMUHDFCwwGSqwLcLWYcE9Aki88JgCBfUse8e0tkdDou07K9+bOEKjLrCWoDiPqUwhtny1fCBwgfJItgxEcQLNxKq/xAYkCZLF0p/MZneeHD/s+MD12qNh8OREJ2iWEta2/1uS/lisVxizhSyBCjyEnERaYxqt7LVYvnu++9fv349y7K9y1d8qyU77Z0LF7JB7/joqJxOEr6TYZ5WGm4jrIQ1VspWhPXDwTwmYMjn88U8L1yn11vf3FRKTSdT70poidg7mKt8mBfxaMWugQY0xxZK7HkpGbFpbDN9ffaiykCRno2OfYX2CDKUUYY5akw5WPsFCQODh4K3A8ziEewwLqRsAAGByOMbhVs2/Zr4K329RZVh9eBlXfl5vVp3DiwM5hIua9KyaNAz4UtU8MiAiqhCdgVO0KGKCuYYhk4Da782SRqc/7nOeQYDQm4BvylKpOVvQp5EilWzLrxLwc4nUgbqJLU/NRCAuWQE6pM/C8uR6EX52i4Mq5cKPLbG5167ewWWHaUaB+SGnRpq/h7DFLJuEWGZhMhbuOB1O8ZKZh+ETmGlzdbNki6Rp/OfmOgaTbPo9oOFLmGXBAYo1srgWYF/hjhoXtq007109dXNM2dmq9X+02ensxnOi4q2nh4LuQKjZg0V13gRSwEFWCZSxd4nXqSqqsdV9ZXC50tt4t3XXr30r3/gz5+fd/ut8fje/S9//OMf//V//+95ng/6wyjSQNqqzjFULhkcKq01+WpNilcGgzeGgz2jel4knc5JnLz99PGf37zx919++cA6kbXiOIZTl2JSyKk/MJ6x01esS1TKWrAjhvPMQ0CQIscZON904GkAfZeZx5BlK4krgRx1jURvMqHCmF60jAYbSJLqSk5RAJkNEqMwQqjciqM3tzbvHxzMMRBYAY2Z4CUH4x5GE6nqBDYysOAR3JV1NgiUUqoYgubPaqY3Ak9qRU+Lgp2mCOIOFPpgA+tsN9JZme/2+99//SuJqSbCalYTyN5St+99NvWi1BqwfAMKIUwBVdJZMJ0mt03OEq5eM+7qAF9WdFYqeoTAKZgQS9oLqarscUojIQawEAPSGUGMkNiA0iNPw0BRFML7COhp4YB0EAxFOAFK5CRw3xS4TKPpPzjoku+JBLwbPxRczhmUEaBSQ5g4wtEWEiedwnEebociz/GsCcewQ/MQCELGD5jI+3QyOnQxNVLpKCrj+MF8/uuHDz/ffybTaDAcdXXUWy0343ir142lLFbLHHIw8TsQ6oKKTSEjbdrt9mw2/5d/efuDjz5c29g4e2Fvro0ZDs5cOB8ZfXJ07JZ5pIDFASmFBicu2gji0eGpXAJkRO6SNKASf3O5XCyWKxWZ0dp6rzeYTaeL5cIgW1CEAwidOGp8FJtZIWr5KuPGzaNPMqVVkHRJYix/U+gpZVjeIRDFL4/xTeDmMUxc46lNUPqF4zyc2AEUrb0mKQaIj2hifTXNiwMUWlcuqsaCs4G4v+FNI8XmSC4JJM4JLo41fMvaRKb5iHrmFNxDhN1X4HF76NCC4SfugnScYksqRYOExkeba4D5IriGgl6aEFoc23gpLUJdIEEHRyRSxhgvgOmGUmEU4cLO832DQyWY2FQz1rgChnnHN2d9yWTs37iP6iaDewJGCpg5JeuXXgvIGh1YuNu4lNJ5QmB82C3gGpKydWGJgiGuiphYnmZfj6IGABgV/1yFj5qQtrTOic0z5y9deyVpt/cPj/YP9ouyAFkntquo6K0OD6BcCeNFBNvZGPISEglmGlKmQoKNc1V9TVkKW27sXbj6O/82ff3VWbfb2dg6nk7/5Kc//elP/+T48Ljf6yVxJOk9acAAKSxXOavzfKTkq4Pu1weDC5HpKpm1uwujf/XowZ/euf0PDx8ceGFaLTysMUQCjw5NNwOVFsV6QMFVVAU5uGRnBhL+o38lqr9wNxk+5prAqNA9g0kGnldgnDgLV0qTmoKoUIJoEZi0gw7eQgpT5K+Oh69vbV+//2ARRXC/aE/Obvg0QicCXoDYFvBSSyhlNDFXsVABF4yMqQUQwLRH8zgBuQhEmwwtPxRX2BaBZWb1YSTeb2aZmc9fv7j38t5ZW5bV9Alukb70SRR99uDh08msiAwYnxjyBgaypgYoGJfkGjPqqzonPCnHoAMCcJbdZwwZT2HYMS2ZSEeBWQsIuSukyKKvB+yEYeC2CFnj7hZV/mB5hZsW2hRQNw1TKrZCNIl6H7iaConnDTl4uH8CdQtXACjno4wpJTE4CHl9GijWtpp6a689MHwGpSM6FDhO9HMhWFQSUxj+II5iEUWPl8t3Hz++e/BUGbU+HHRMlpXlbhSd7XUjrRarZZEX8ByDwRjYygaunTEmztJnB4e/+MUv7z98ePny5e3dnamU2fbu9rlzvsgnB0fSlgYYgAoBMwYm2RgATy1eiKmawou+ZVKLsizn83nhyk5/MF7bkt5NJqewmOdp0CtaioEWg10pcIHoBRHAHPx8IXm49Y3zDv6uw2smeNPG1OTAdrJ1ia+TGV7waGqQrEQIzAksLIrSkzVm+uKgG961aIDMaCInwqkguRwrVj7JUPnDpPybCLgMPhihHgmCxZTn+MZAXeIwBjwT8KsUPXphqq/XoqSTVMGzUgodgXIOv3/NYcQDy0kOyBAM4womOHCSODl91+aZAWpuwoEAUJjwHhUlr/NyoAHBN7hvsvYUaXLW6hajuYegixb+sm+MuHz7BGxC+rrhCr0UHBssw/X1t/DIbpNOEblHyEDVlqyQY1YLoWhKsflU0CCDoB/5NxodtRp+jbwZEUJaRLmLvNBpdv6lq1t7e6uiePb02WQyUTg5eQvSXq2IWwuwc9Wwe1PNuBLj8WOlYikToWH7K1IlY2/9ctkeDS7/qx+Mv/XNxWBghkOVJH/3d3/3ez/69598fLfb7bSSDDFEpZQR6BQtDEw0oihGwn2l0/6t4eBCnHWF7KTpMop++fTZH9+6/ctHD4+lNGlLAqhLzs3VAFa7ieP4pWt2Bt1VaCoC3B3JTjXoVVd9rsBFAgIOUDg1A1wKCp0SQZhEKJGiPkdYDDkGR0mkN6FNiGLmgRQqUpH3zkqMCkH/KxHlq++e2X1j7/yvPvnkBElT3tF2mSqWpegZ3KeSJh9naAeO+EAkgvmDh3xPe1mOGUdLQOeAjqUMkQBw6YupHsooaZRwI61GJja2+PrlS8NuqxpGIyOZQdbOssOj518+eSrSVi4wkFigIAeMhzU+m8Ahtg6Bf4kNH1C7ATyLFPimeFy1e2mrN6BgvEVzQ0yZA7esUiti9aPfHszVSoNuCoy/NRC5S++dMRF6nVjgZsNY61Sj3CqtrbekzoJh3IHrlNJg6SUhTB+8SdA1RVYfr6WlgKIqhInKEjcWGL+IpC1oGrSWsYmscyWYjmqo+xpyriRZlOJTjzcHrM2VdNIqXmHhxkMbI+Nof7l8//HjGwf7LlLb/cHAREnpNqPobDvLlJrn+cIWXmqD+23Fe6XqfzqJkiiOPvv83q9++atlXrz8lVfSbmcmZP/8+fHG+ur5yeL4BLoVjXxvnE8MZ8/TiMEQIcF9xAP3wRZstapm4ShKhpsbWdaaTqZFnmtF7uzBCasebvlgx2pLebRgMIcHJIA91HIhfuf4dMYGo96LUmmimwM1olzlnOCfgqVc8WnKU6nQLsw4zEkKs1Bja8gsHppXwzAfqEc1NklWPKzzbUxVPL2z0FQwgxvZso29cl2nZWMvTfzCAJZyzWd5bN08cHyeRbia3KyxbHkkYalGf+HCEqcBBXOPTwO3Z8UHEKQl4VZszUVPK/uR8SdABE0hSc9YfxIiIPwieJTUnAF+Lw38XwSeGW0yfO0ZRvU2gBEM08gXbFG4C8LlBJ7pErhiyot66SXJdpl3/VzxsdfgUUxAfD1fCwjM95TBjLJKav5rvQFz3KFfUgFtgYAE4UVeut54/fIrr7YHg6Pnz5892y+LItKGqO8K8TJa/UIwPgYFVtU3kh6GXZVIcLMSLhaiLZXOl0bLnTfe2Pudf1NubhWtLBuNbt64+X/8n//7P//yl2kc97p97No0GnEJaTTGFglV5n1rX2lnvzUe77WyvvfdJJ1lyS/2n/705s1/enj/VCnZygBnVeQzqxiVhXsa5jA8+WmNpHglqMKjT/MyA0yqBkAUnthkfAXHqAERDdyAWkl2vXCKGdEkfoQgVZCsVHMbhu0T2CrJHxFsocjDHFhUqpUvv721+dUrV248ePhoMlVRFHgQ3nsN+iUBCLlk6g0olKUxBr7OQBW2yIVSgTsAGDv4ghgBwRGKogIpvkZqjfexQ+mOhpuvLM4maZznw3b2xpWLcZyqqihXo7Ytq3+MNnlh7356T8fpvDojoXQKTNYjmh8Ki8GOAyU0+Pg4ev1KorLZA7iOXSO8EaD/WAc8bo0wIsAJGA2FQLcMOcZFWYKJmAiQPrgUW8ZSNQQ2a2iMFDLDKaZSaiIlKulKq7QKDlaSCfH0r1UXBRcTH+Oq3INTtisLa4FUJpA+UHqLFP1qAIYbR2uDLZEDWyxR32a8W4abr6rwjiwQMboDRxaNF8tEIk6Pi/z2w4e3nj6ZRXpzNBgpFa/KcZpsd9ot5xarfOWc0CYY73hR47RZK7NCvv/+9ffee6/TH5y7dCn3wqfZzqWLJk2mz/b9chXrCC+TaizpFA+FOOoF+ikVwDBEKFUU1SjsvO8PxsPBeJUv59M5aiPpmPSMPhKyTEBVgEwVTaQq7PEQsmA7pMZh6GmfTNKBgBTWMFaohRKDgtDfj0StDPhJj5CDCKRUUXMPGtWgQQALiQ+Nelf/qWzMY4S8+poH22BpcfnxDHkHExxaQjfW3sH5kqJfBZuceL6NOBtbvlCvQKDNO/UwcFfnWJTy4hJWCdAkKsU7aRkGWWy0XCAkhY+Ziim/ERqkaVNARqQh95cmTMG5BSKsw+nqhWUvBVeIsN4PfGRiqAfQAN+dYr0uf7fGSMzfkeCQmjGG7YAnvCV0SoRjY22kFUJYG4RCrII3DOKjSKX16NiLU50iElA1sFJuhpKQpCSqLl3BXKXpcwTpqi1LJ3fOXdi7cs1L+ezw8PTkWAinMdpWOA42kKjbM0JFEphWQsZgr1HNvoA2V/8TQLwqS5vn/XNnr/zwh51rr0yyVjwcPTl49p/+8A9+9rOfFUU+6A80jK1Qh6pzFmhW1XvVZdHJi8tp+uZo7aVWe835LEsmWfZPz579Xzff/8XDhwfKqLSlDY568HerRkGwy400WlEVkNzJBOA4pHV6svPwzmskp0lFZBZcJUJLR+H5nlQrZGyG3mAMy9VOOHjr4r4ZB1QrJHol4iaLLLUEui1KUspUF3Ndy+9fPH9ua/vpbHHr889Nuw2E5MZ6jL8BPtJYOyXhYrWbGgQZehyAPVNBSG+nydWUoR56sFk3gZvS6kW3vNxNk2iVXzy7e/nsLtn4Qo0Hlqsobdnv9e7d/TS3blbdXiDIgacd1+1wUYAqXI365DoH1pxV3QXbTkPpfgpfcPU2Y+8K6wQq1hXyPB3lrOBJ4pgqAuE8UOK1K8vquhlppMHIe60oX0+hUydZ1ZKhUgkZR6j4gowGSxJZJqHgZtdUr9CjZBm8J8ltSXIvDHZYqrQlcu6ctUVZ6OqqoEQGkWpARCCxSvHK34eRhfshQVeHlnEY5cR8FMRWvDJGxPFBWXzw+PGdx4+KOF5bHw+F6izL9TRb73SMt8vlonTeKyMJ36WaXg21WrXb7ZPT03/61a8+/+zzCxcvbpw5e1IUnbW17fNnV8vF7PAosj4yCg0AeE8rSMsWdI7MieWKpNgzSDpvl4vVMl8lrdbaxoYx+vT5ifdEdsPixgmPhI+iFRwe1koGpTCHzpCbMPNaHdetEJxQr1p9GJAxlISjCymdp0HgEeR972utb5NqRaO+DJvUF38jOLJQBdpt+FsBFA+cnJp4JUJnx4m7eMRgPA4BvJJLaBin+Xn1DVicrTHoZytaHLiglmZLDsl59WFnAOhClKQ1+sASVno46lqHNU01ShCbRwaNGi54ZcAy+JiloornruaNb7NjEaKBwNMgHAhUNfgv69G2UfHrP/KhGKsaU6n5c+SnBshUaAcEx9pDwAJTvUKGPq3hXWOjEOZnBm+4WtTjf911+RBCFAAkh0aSmtaWBIbALCBXRWGy1sWXr27s7E6X82f7+8vlAp32JDc1EJkujBARtKPaV1XWwK+JkrGSqVSJl7H0mdSpFyJfxu32xW99Y/Rbb06Gw2g0slL+1V//1R//0R89fvxoOBgkcYJ++NhrV/M01GFly1aZn4uiN4fDa632mpBxms3S6J39J39+6+Y/Pnh0oLTJ0gj8f3nVIgmEFDLAMrjqc5AfB8e9MBIxYAn/ESk2pNLElhuOVeU890REbgLKDAZVwGTgPFEuvXVSacf3ObowahPRukvBLAH2SYrWtLr6VrDOlGxe70MuZFlsGv3bVy61Wi0Vx7++e7eIYkc+8dWls95SGw8DI9qukDIEYqmodIDKtmacwVOlUf6BK1bUBBFVAqa6ajCrHmF21DKiLDeTeDvJ5GJxZe/coN9TkTI6UgrYyEaBHFcmkTk6fP708DhuJSf5UkSG7MPAfhAxB2Ae0QzjeI4nsws038CtMMLizl1e3xoqfXLyXCaxQK0RrgSI+iI9mF5RtIkCHD3YrFc3EkgeiVYmKeYP7FM8VFpY1pYAXgMBTUpM3cc+DHfGYOlV/c76MObQGOAc0Z1ZdlXdIR7YXtUF0io2MfnjK1WWpUYGjEfXLXSL8FSDq+tCGwBYrlMYH2iaoQajRy2k9ysmBUvvtTEqTg6sf//xo3uPn5g4GY/WOlK18/l2mq2126K0q9WyBAmaDEtdoCII4ZM4TrPk0cNH//Srf16sVi9dfVll6amQW3vnhsPh6eFhMZ3FSkVaS2cFBLZQB8BotELmJ9n+0f5G8sQFPPN8uVooZQbjtU6vN5tMi9WqapHpiaN9SIANJddINOfzXON9A3VUwWdQMfWHJ0oRGPS85VQYdhIkqPDvBEaT335jsmVGtZAvbg59ICIJGb61ZKyyxkfr0Vio+tvy0lKwwoZG+rDmDfN1zdD9zeJXV1sRVDPcuKBZIWl18d6SYbbmXsFht6i4otOF0yZKsH+QrHhqUI40xhHySlnVoZGQxYZb+0CippaMQRfItlBwNwcqXPDTFg2OWI18vMiGE0wuDmFVPDqJGlSQzS5JNgEHGd6Ib0QG1j8WQRaQM6LnBZpv8FqJexm0pWJZtucJOTDgmOBHZsv84uDbkpgGV7+4sfCKZOt0F4Det+r9V6XtrW1evPpKq9s7Pj4+Ojx2rtQAuOHrRFgY9mRVmYx9Ne9G3kcw8vLUK2PvUylbSmlbisJuXjp35vs/yHfPuH5vsLF2/eaNH/3oP77/3rutVtZpt8EnhVCOqvRCgJIuy7QotrV5s99/rdPdUCqLU9duXT88+Omdm//P/ftHQuksM0YrXxMVPZJZUE0D8RsuKL/AXiqscmQNW2C0UNjikm0337SYwwiPGkwhDvsExVdB0XY+jJYQsiPRr1+yNtEHlJuMABDI9hA/AMJg9LvzNKcn1p5L069f3NM66rayB0cnnx0d9TvdvCjAtQws88npTCLjGrenArFZQXahaNsPyDfwcqmTwNpcDanAU1PVtAjeFZ4wo1qgIaUyZXkxS9pC9iKzt70VZ1kcRVKrvCyFEJGJbPWPS7QWWn/w8Sfnx+Nni/lS44eqIOfUkh4CJzmNwHBYaZG5Eh9aZHovvFhNpr979drYmC/2n8goVhAsqRDRRWN8NOoh0YSCKF6L22AFlh1OWOZ2OpIt4aq46r2UpoxnQ+eFRKPRqpR7CxFA1gJJSxANgysYnkVEtUWKFuipYN0LhidOGKWR+wZJ/hilTNJzh/Qy6bEzUaw7R2YZLrylCI69PGUgAGw0XmhfH8RVwyois18U7z1+/Mnx03aWbA9HqdDtIt9pJ6O0VVq7LHKYGIMrAFnOCiHTNBFS3Lp58/qNW+P19UuXL82d873e9oULsRSTgwNR2MRoFcyX2WCBksNJgie4kcI1LR/NkAI5XyxL6zr93nh9oyzd5PQENVdBaUK9LtGpGggpndqSyd20+JRh8SnZ+JeQH6wOivWpwaC/Pp0dly7OkeebHgfPIBQOk5lkmlWg//zmXFbvFjFEiQ2pfC28lS9MbHWx+v9sLQOfi0LVfFNFK8M3YeAzkNGp5+Y9avC8bk6Sko2gWBUnlDZx1hhBfUM/XKt++KVRIRa8pmNyV4BXHF8zanslMdVVWASEkNtGFfV121HjCkLUWG9gw7ka3ld1r8OfqOK/LDyrNANVizfMPqT8vfBZkkIO3zV3lS+4fdOlUYRpkEEY2/GzrRULygDa9kY17jx0qpSkFxLEIwSADpZU2+cunH/pivN+/+nBZDLBD0865UO0H2IIwkdSGuEjnHqBoxHDxjcVPhUyA49JkS/avf757303++obs3a7v7V1Mpv90R/94X/72X911vZ7PQgd0poo2dVUGoFhminKLSm+0mm/1u9tKNPWOmpnH8ymf3rn9t9//umh86bdkuDdyBYnkjOvq+pDWYy0ZgVRCrhLONDnEB4o2R9Vq/pYrbWGWFqZOhlQLkT4kVgQIAUpsXJi6BDYUHggD1W1TRvoEJyX7JGAHaYHWQ53rALKBvUAXriOs1eHvTf29nxV4XR7OHrr+vW18bi0Li9yifnEUoXKISinzBGdTmKCpKQSiOZqVROnqVEhHjyBukjgrWZlch9kex2wZozL4lqnG+Wr3c210bCbZm0TRRDVDi0iLEpBmCt6/cEnd+/uZp0yy55MZ3EUW/AtkdogtxeyeGlepWBp/uSB1YS6ZIcuJkqreb6Ui/n/+u9+1z3bv3ewL5JUMiW2eu/V+a2dY/tyhs3wEgSSB3YigBBrimpwJSw7BI25DksnXE4NnrhQrRV+hUBLbt+gyXj2yqZbhFqusHeqZypAnuFOi0wEQY0W/Xx1w5yPOZjoS+rZWENChCK/ERhf0AFGK41Wn/QgVz2OqzoBY0Rkni0W7z56+PHJaafb2u3349J1nDrTznpKrfJikVtPGVw4QwkFBupaqayVnk5O33rrnSdPnu1dujTeXJtZ2z1zdrSzvXp+vHz+3EgdVZ+hU9x5AJ27pPYEfWsaxlCK6cdwZLnFYrFalXGSjjc3TRRNJ5OyLGT1IfPY56mjEkKGaHTcKktgR+EgARfVhTPa8zAnm/hlIETVMeQBnJYOODeK63ujjRCsrGzoQwVTo+ULBZQuNi9fm8tKIYLDJT7xJKwPf/hC9W1Ocy92DLWHNBdAjF5U9TgseZQOy2NOC5TBE5uYSEAfdOGHhqR/sqKsMQjh6sQTqrJCETceM70lJwco2cAl2FWtiQh45lRJFSRY1QMmGwtw3/hVhJnXsQkjgQCh8gd/SG62ZKNB4HWiCjTnmttet7UIN9YdAd6/yBFT9TjFEAUYXfEQWmvTBa2q6INARjoKD4C51YAyqNoI7tu95jtLKVGUNko7ey+/tLazczqdPXv2rMjzwAlS7CuJU6+BXyPhTTX4+kSJRCja9UqfStVSOioLJcXGK69uf/c7+dqaGAxag8H/+MUv/uAnP/nyy/uD/jCOE/CDEugeoKWIwDZQl+XIldfara+OB9s66kqZdlqfO/sXH3/0t3fvPs4L0W7pyEhyhcEWhcBFqHia1EGo9MPpUOkaq+AHAi6yY00mZ+1j3DdROgTk3nsTGTQa1MbAPtFC3gkPXuy/DIYDhBkCmBuhBxTmoHiqGXSTQLp+dV5i2q/GBaQ2aLCunNuQ6qVO+8LurkmiVVGsDYdPDva/PDh8+dy5J/v7Mklg0NfOWyTQssGyJrls1cZQCbEoXcUzAFg/ymCEMGb8Wa2qgqSA6w1RNw5Z4hbzBsp8zZjLnU7m7JmtDa9UkqWRUVhOnXettG2dNUbnZdlttafPj548evzaq1/56P4XRRTDral5ewhJfGjvX53deAYCBxvGx+rm0igklKiykrF5cnQ0dvZ/+91/9/jep0+m01JHDrdN8MED0kte0MhnxixhZLqB/NqhUxygcg7stGDRoDRufIUQ88XMOR8ZQ+UQ0HKjjbUWnRlxm02uuPB9UIFMQf/oqEiOnrBRAnUW7fMBn7BhYADGFgItEBtVPZdGI2sFDMhwCNPKAl0bJkgNyRyUSeUhpddo7BIwaEgopCrCP1GUuCh5Mptcf/DgwWzSGw63Wq1oueoIs9PttZRfLvOcffrx/GZEx6dxlibpZ5/fe/e9d61ze5ev+CQpIzM6fz6KksXBgc5XBiTnZKjqyKWTgVgCQAWLPYM0FsAzVdp8vpg7IXqDUafXXy1X+XKh0VGAKLKysVpj6Qak8yqmrIZ5NAyjnonJDWUKU9so+oJZsPSfhPaBZSWawpewQAwAYcA8eWEZzt+mK1MIISBfkEYMTwBFBRGHG2NeXazJfF6FkU+IWixDflGqOf/KGpCmFWMztpfTA+p35Xkpid9OEzVSeW0g8EvUkDcbnnmeEDgARMmAkQWfTL68MkyZIfRHBloJ9xaiiRWET7TGlPk1ND7RAA/gK1D15jZ8F+Znh/ItELQNoDoHRnB2IPtl4QqFQs3Ag8YTjukRxneKxVKkuxaKpNqYDKwlh+RgpUTxHvPWmNOFWiPyjBUE2SMO7VeFG6xvXr52LWv3nh0eHh0eeghqRbIVMllBMgGcZFENqRHYayRCRcKzzFfESmTKZN77YpmurV/6/vfTl1+edLvD3Z2nTx7/6Me/9/Of/2MSx512F6Ee4JwC7UsJo6Uqi06eX47jr45Hl7JsUPpWOztI9N9/du+/3r59dzZ3rUxHsUfAnNopxW4AtALHQcXhmR8oGOT/qriDrDcPircmgVlv0VGSeXvAC3OYRsTzLi12wPBBIDXIc+YdCsGQWg5UXwqcVLQ9Z4DHueAmq9gbgMiNSiZendH6ta3Nna1NK621PtV6a3fnl+/8enc8arU7T4+OdBxbYM8BtSeMXg7bs0j4vhRuuXJSo+pSBXiPl1/CC8j3VYT7KAUJRV7rqKph7FmVlvbacLgRmbVIra+PZ64cDgYaioF1Thnd7rQcpgcDOWDc7731/o1vXrq0yJefTifGRMT6RvtLb7Wi25CoIDSdaOTJwB1sBGEJQMMx0dGjhz985doPX/vqh7duHuflCly8gTru6WtQ2giSE0VlSIWNmsWeClP6MbsAbRYpMdCWZTWWKQxGhN6lYfcj6FrB3BTARCZAE2BVDfpaewhmhtYKqe9VuWd/0iBVhT2ub/jcEfBVr/acF+wmQRZ7gSCraZ3GKX0OTxShqwERewDsv4WKoyKOv5yc3P7yyxNXrm1trSVxNl8M42it3da2XKyWRW2CwMa/MACkrbQoixu3bn700UdbOzs758+fWpuOxhu7u7PZtDg6jiVORDCve9nQzSNZiqqxIymlo7eOSj/h5/OFdbbV6a9trDvnp5OJImIMo5Fkh4SJPZzvRtMOVyvHhJ8gQa3lwp7Vl9Vn6kINEGSLw5WeyVx4hEtWH8p6QSllsNfiFYkUsqkHr79QNOHpsMTi4TAsyupBjbuEUErpKW3+RRkw9fD3mOVLyCSVJsU/hdzJRKi4XOodBg9R/HHtUaGjJEPQj/W4SIILhE/F5GHJsLNvvMi6UWDnjXoJG7hjkgUlzJFp/C163UoERbFkWEgykZkfjtBC0WcdiPjNahxI8iKg2jJslqVgCxBcGBJPSjGwpjjjsYF5kAFqY2HPqmxOl8X7VVO9kWT6RLQ6XtUEygLqLy14B+ycu3Dm0iUr5eMnT6fTU5T9SEEaAIg6EEYqsHRWuhp8XUx736r6Vv+rirFsyWrwlVptvXpt+7d/ezoaquEwzrK//pu//k9/+Icnz0/6w0EE20j0XIEIIxVBpm6yWu0a9fpw9Gq7PXQ+SbNVK3vr8cOf3rz+7vOjImvFSSIQU208RnxPVx+Kc8LQcWkxwE4j9wk+9xJCzwLFHMd6EVzT2Q7DCjxG0VtVwpBhvaVMOkEmSqAjRgWXqo5e8mjGuFzIeBcwHflA4wSjJdD1wOxFFCgYMR1qbavzDPP7pPOpc3tJ8tJ4uLY2tMLp6nMtRqNhkRfv3frgW6+/fnR4OCltFBkwssY9tUNfM3DY1aLMzw36L4/Xo/l8NZt5JUgsTMG16GVtoc0CiQsu4YGCjpZVQKnWQookL14bDbpeXF4bSqNmQvZ6fZhpVVlCoFSWeCvK0ppIF6vleDB69OSpODh882tf+6cP77jq0SaWlXPWgK8WQmgeGVVKG1mN6RKVZ/gZV0M5Iflaq9ViKZeL/9/Xv7Y3Gt28eXsp1VKDOteLSBnCmyRRXdHqq7Sl0cYj/dsx61BFqCMCC+NqCrdVzyEjkwbjPrSwRhqGkrIsS5YyYY/iBE2dHsVbhBjySU5O7KhNcF4ZU110h1mpXrANBG4WpJdI8YZLgNovb0F7LZzDfCa8vsQNJuUylGEZoDfqP3DvhgZbiJRpcNFaGvPh4eGHD+9LYzY3NlrStFfL7Va7k6b5apkXhcO1fB0lU90eRutWKz05Pn7r7ben0/nLV6/KVmuq1Oa5c1manh4cuFWR0Q1Ep5LGHXVD6CuDQWuY++h4Vfkqz/OViaPheM0kyenpqXclEK6lCuxVROhqjyMqb5L0r5qKALlvEsQk2VafMFuyOsCDU4XQ/WYJlb7mNIl6td3YczYmNq6nfEUak1vgLDcG1UaRrsshtXdhZAtWxbWmpxm3QFCbbM6JItTEAJDL5uurmdaNIV0EIQQlxKPnvIlS4rVJx4NzvUnwRMtC/LnBThPgkuNVA+qFXjA0E76xlH2hq6kh/prSxFy2mntNVJzGyFzLvoL9F0A5TAKRPnhPSi7wsvZLEb7Z/+Dd5MMQQDZpjRuC1ichzlk1tv0UOy+FYzwdB2kXoHheCQMoymR4TR+0KmwZJcnelVc3zpyZLuZPnjzNV4tIR0ADcdrTzAj0EKll1edq77X3MXg7xwLqblV9ZSpF4r0qyu54dP63vx298uokTfobG59/8cXv/eg/vvfOu612u5Wmks43iaOnhrBZVawGQrzW774x6G9J2Ypi0+3cfn70px/c/PnjJzNj4izTqLoNXF4yEPGiVu0gxw25TDVpGeui1BRuBRdDIxjAewnCV0qY4DS4TmDksVbS+hJPD88LDK1xJS8tEK3Z2MKHbbQjZyPPhG7K4qLcG7p0xKDCnYEiO4eIqHRS9KW/lEavbG/1e90SfraJ43KVXzx3/sa9z+1s+vXXXv3oiy+twtQE8k+W7AgEtDp5MpmOhPzG7vaZdrtcrqpzVjihNHrQIR/bKAPv2wUyKM/BCsm9ToiWLV4f9PvSvHr2zPPFbGbidhvE1rDNjeMozlLpZVmUuEyN46STpW+9/c5333hjOZ/dPjg0cVpaG6QmTmAeEVQRVMZV7VNJqA1grAj2whhZzcGl0qbIL2bxd7/z3b73H354Zx6bUiF5WUOCggTKlYf2BhNyhKn6UWmF9WAIBQUClWRahegTZO5UV9xKDVWfW1iB6Qu+9JhvAY+zIoUQ9HZsjOw9uokJ3gupxmgOkxrI1BSyLeHOMFJBDCKKs/HrFLOHleKVPrk3gveEJpEqdJmCfkPGk+FIxkh6z6E0PN2ZOJ06cePp00+PnnW72fZwFJdi6P2ZTjsxZrZa5c4KfENARVeMacZRbLT66KO7tz+4s72zdebcmYkt9dr69u6un03nh0eR1Ebxu5NEE0G4AQC5WigaAKugHSqLYrlceqG6o2Gn1VtMZ6vlUhtURIKzShCThm2c580tmkVQE42xyABJCVELXRUJ+AOlmXW/guPDaUIi9iLJCEXDOauGORveklQkalJUGNVwbkK7xQYqK8KYyDWjkXUYqplorDGFYOUUO0zIRgFqdA8+jO8cXVjjyIIXm7iQw2EwBF0o5rIpbeKkAfc6BpYd0YcoLaJemYZfpdAv1HceYBuAPaE5ojHqSqapcZlkNlcwPmHzbdUEoWXYIsoX8rBEoyVQIaVKsVtKPbwjBqCCk1joxSRJDrmsMFediz0G9eDbgXEKPN94uA/2HEqSITNzIiQZJOEDwQVcCZmXtjUY7V19pTsaHR0fHe0f+NIaFQkKJ1EoajFCaakMpPlqMHmOpUwgTSFYS2ZSmqKMhN99/bWdf/WDxWisuj2TpX/1l3/5X/70p8vlot/vGnBKjCD6DNbJwkipStcqy5ey1jdGg/NR2nYyy1qPbPlf7n70N/c+3XcuyjKtIwyPq80v8Jh2aEAhFQvTDAcIgHkwBhM1TfyVFA3aiVTVIytcuKNQ4owKdPJp06SpVgQfg58ynKFOgrAFQ28ggcexoyU6XWiQWBB8X3WJ1fcwqJahwxt9pAWupz0NiUCUKt2uUa922q/tnklaycSWHqZA4Xyn1d7aWPuHf3778tmz58ajWw8e6DjGVbTWBt+X0ZoAgkjvL+aPj49e2dr6xtp6p1jZfLVyZQ5CLFDcYP6RA+sSIzVKUPHoCJxqN9bqtW57p9W6dObM5weHyyge9Qews5TeWm1M1mppY0pn0eYqL8vNtfG9B4/k85MfvPnmP9y+XUTaRAYUXNZbixHDgnYuxORFFjzVHEzgR7gc4yK0Wk1O97qdUZZ8+zvfPn346MH9+4skLSSlsiN9CTsiTCaPTQSaLQ9eYFSXUUvsXAm8d3B7VjDjgj+18EoTcAdLR+9Amae0MLA793gkoqcmReug0ADIdMGyg70I8YdCqKorKf8ENr9oF2tJxuZIBQOO7eiCphUmu+EXIuPZUZuEJY7y4ZHxJwIJR5DRl4eQIjr8MMaxusXj6HC1uv7w4ZezyeZosNluxSs3iqOdduqtm65WFntWGrUJGFJSJa3sdHr67rvvzhbLK6+8EqXJxLm1i3txHE8ePbZlEaERNyt1peAYU57UuN0MvFw4GrX3zi4Wc+9EpzvoD9dWq+VyPtUUVO7IfKseFon2W7WysNwho82A0kpGI3C+oyx4ArKRC6dQ8oafJan4md0eHGGIJe2bcyWpdGoBr6yrkG/Mup71YUQ7EDX+6gVnh3IjIcMUy7N0bV6tiA7ZVJ/yj/WKy6qq6zdNGWSJKpk6HgjLoY1xdX2GTkabJBOiNseXNSQg64rNSH/zjTeGSl7ehxGSf6gM82/DfDCMCuLF6Zbv+ICR+yA6FmGRr+otcUhWlqJR44NwzGNoMWK/TtEgT8Ze4Wtr5jT1yPyNFC1DJHEM2ceFaW+4DfU1tRa8Vavigv525J8J+HU1B6JOqXR+sLW7d+VlHaf7+/vPTw4R66vOYojlgwV0dUhHgPNpLyMvwV0Ssnth75sIkSlVXbZ82V0b7/2rH2RXr53GUToafv7lFz/5/R/fun6j2+0kSYpgBOTlSQ2Hi/I+LsodKb827F/rdPvOt6J4ksZ///CLP//g9iezmWx3YHdokWULeQDVgch5Egj9BdQNPRrJ+hiMbBG8cKn0LaDSoEUC7Qp48sEbCRW9ADJ4dK2iX6HWo3QHv7lWGrwXEBJCJqlCh2dcPFdVTRNs5FAa5EWjDxBMhqtqHr5motDA0hrtPrx3F5Pkart1ZXtTJWrinYpib32SJEW+2hyPrdTvvP32t15/PZPq0ydPdJx4H2iT1a+2+isww8TRzPsvHj86Nx7+4PLltShObeGKVe58Af4V2MOguFRFxijjbOmFN8oIotyKLR1dbWdn+53+oH/v8MCnWb/T0aS7FlEcZa1WNb6DsZOQsigLE0X93uDmO+985/XXjfDv3X+g2i1vXUebrSSbzuceEyXJ1RnVYg4gZbyiBrWzwHPSOE2U88Vmu7uRRP1u65vf/PrHN27tn54so8hjiaweBHzOhEZCFoAeEWygQdgDtqkgXKZ9PSqLgCWH9CrQbRtBBnzAfPZkRi0IK9eC7gdhYTGB0yfYPoODDSQVot+Hp3WPJ8PPqkhLTIxA+EGgRg5nFi1JAE2EL2zmOV9SksyJVn6Q4yuIeVfd2qWD4R8dY3DuDvxsPitR/Wy0cXH88PT0xoP7J85vr62NlUrycr3VGsbxYrWcs2MXdqwYlS+9j6PERObuJx9/+MGd9c3N7bNnJ0WZro0HW9vzo+P89NQYXX0IntDvhpJWsftHTfPl0xgBBblYLYsij9NsuDZ21s8nUzgndchBFyiUVs3zmlhCNeCHpt0BlyQvC0F5/8RylkHgwIc9YceO98khBtcHdJoII+Ep9iHevbni5VktoJfixV1wXbOED6A1W0IyUTvofzk5T4bfywDa8jUNe9OGUA13c8iFJoxVNgur9/VKl6B0r6MoC65aIoT8iOAjGTbGxBav6yWSgnmi98Gem4BkPCxVw3i5LnyyXt43LwW9G54j64W8aFZw6etUSN79o5U14QJeBHIX5tRTQ6ACVo62V6J2qRTBeT38CLz7Qnod+vhg0y8kGdkjrCBko4XBFAbC+j2tfpFv4oTZPn9pc+9cYf3+/rPZbILm+JCPRvInJYQBKB9GVWG8hHwFEUuRaBk7l0jZUiaB9NPta9fOf/97s9Eo73TjrPV3f/vXf/af/2w5n/Z7fbJjxfg+sE+oRmBrB7Z8pdN+fTTaUaqtpO913z99/mc33393f3+ZZiaOISFA4UJL1o0hOdYFAgvrZHi9QZtluPucU85vtFuDJJ0XRQ69hSUFONmZoT0/AhpOOiyVEkWgZAoY7nLjFQLHuHISji3oCaAR3HRj0CGJHhwOQxiFhGUZfw92i5gsIFlDobBL8cXqSpZcTpPXLl+y0h8sliZOgdoaSelt4V66eOHhs6cPHj784ZtvLJfL+/sHKomZiAHTMD7iHuqBMXkU3Xv0cLPX/8behTP9fluJ2NlylS9t6Y3BvSaaD6MxsggtjhSyLHfT7NV+7+r2poijz46PfRJ3q5FXRlEMRUlnGYReeL9YLqQSxpjlKl9fGx4cHM0Ojv6n7333159++mS2UEns82Kt1bo6Gk2PjmfOCjiy0foOixSt83lbT4eVgzAs6yJnL29sRkVx5sqlvZ3d99/6l4U2S62FVtZaml9qoIPMbNmPkkqhInBdkuUkRUlSzgYhFgy5eGtBvaTJpBNeDV5o9KHkjRCIjykQsB5AHHDicOtS1TXU74aVk6fNrgvpeiE6QynoZpjTggmaaIpPHQS6X/NCM9jlwVNglMEWwUh0QnBIkkfzFe+FiZKFNp/uP/3w0X3T6eysr7VXedfJjW5PezdbLAqAcbg2ASMH3K3TND05PX3nnbcXy+VLV6+JNMsjs3XunPDi5Ol+4tjjhZe2hGeShpcEtqTXIZd6FHPLVZ4vl0tt4tH6epTEp6ensAVXLKZxDADzs49dikKKF0hN8bPHYx9l2TI4/Tr5Al2Ya49j/keoOTWNSoZp07Nrr5Q1zYh6Kt+sIM1lMe8va4yUPhIfpGzBKZM2E1TQKMaHEVw2QKqDIb3izAQftr1sLvcCMZvaBR+m6oC6MiqPl0ObOKvXrr6m/fH/4aGnGAAPb5N/wypk4UONbEy/MvxkPsQdW43VwHZA8JnXGFKHRWOj31itM/BT/z/pQ4ijYmKcJHmcCDI0J4J7HR4CNNOTJzjlp9Tu0TADw3qNLehq+zXplQPjMjhsENuAdt6j01bgQVd9sbVORsm5yy/3Nzdm8/nhwf4qX2htgG+F2b14iFV/MQI3SDRhTyWEK0ifCVUNwVKBq3Med9pXvved1rVrR0naWVt7+nT/D3784+vv/brT7SZJjBOkII8NESmhrMuK4ozRb45Hl5O0653u9B45+98+vPU39z491DrKMtOI9yNLRaaPho0BemZZcgQUGG/n0L2JXJbo1jDVqGdnpXVk1g7sewVsYdgBYS13LMkVZMkUNj0O52kwkFSkrgefQrxoWO9JWAxccQfEYGZKSuLtV4e4wSYNl9SoP4FJySB6UR3Q+NKL4loru5QkX33pysqWj6bzOG0ppQpbqKpealHkV69e/fiTu+Vy+eaVy5PJ9NHRkUliErFIrdEq2WO6fXV3uDj56MH9rjFnRqON/mCcJLEtvS1tbld5rmKjowi0ykDVgo/CCgs8q2Kv236p3bq6uXW8Kj9/fhK3sjRJkiSGS2DTJGl3OsJbpXRpLXRsurDW2nJjc/Pu7Ttfu3Rxb2f7l7durZLUaX00nWwa/YNXXpkeHh1NJ1Gr7bytLkrVHQLLl6BE2ciLlIjT+mW+NxqOW13l3IWvvJrmxfVbH9i0NYfZDphzYEQFxCswx5BoG4npSVBEBEMXTBrAfTH5EUj+fXXty7LQWmtjYLtsqQtGvQ6oxx3In9E0EvbHvuoXFUUoa2MgqxgpuBAv7DAVGGnRMlhYN/Q71K4p6uToZnSu9FgrkAAMDYdEi2dymMGn1tNWD+s3cQCrhk9TboUsPa7DhRZeJ+mx8DcfPXxycjQYjYetTmu52oijYbudr1bzvPBa+0BAZnw1jqIo0nc/+eTOnTtbW1sbu7vPS9ff2hqPhs/3n5XzeRwZThakloBMTsG5rWao1RWAMuuctavlUkjRHQ2zTnt6elqUhdEaNOwA4ZHzvAztEHrZCOb1Uqgm0maJhfrCwEkvyofIWJo4FS3bJTkD07hOxFeHG8twugdItMZWRb0MFqGshNUv/6mst5JhFOS/Lb0IGY1kTUrNQth08vgQCnzzRyOe42v1FBUTLv7MHZaBoguVBEpULUMSgqNKmwOlV8RzqqnGPHBL+cIwLnmV63n6a7DJGD+QjRahZoUHIIHbDB94ZnQdmmZpnrn75IvawBfqbijwzil/hrIPuDdQLKF21MPK39A40AcZuh1s4fmV1rHWIpgxQafpq+GKnBa9xTagtGXW7e+9dK3V7x2fnhwfHlvn4DinhE+NZVtIU9UEUBxJEUlHfCtAmxMhMylTJ+xytXH+7KXf+TezjfVVmvXX1v7xH//xT/74j6anp71+n40ttARZDlpXmqLoe/tqr/tGrz/2MkvTIk1+fv+L/3zn9qfzuWm1o8g4LwIAAEEDVmiKhOfFB0pKZaMzQ0ozP2bIOyFPG7Ww5czbavR2KqTMa2qrZfBiJEqdZjdDquCqvjtUCJLHf1WUFQFTQghukEbj8Kvx9IT1sPLKSUsmqYrClgW7mijyAPIa9WTOK2t/azA8Y9TLe+eEMV9OZ0mrA7bKPjImNpGCeLuLe+c//eLz2MvLW1u2LJ+dnBbeKhNJXCtiHJMi4a/XOhfqi6ePd4ejjonG47WN0TAri7YQka4K52q5hPz3qHqGbRnosKpYXex2L5jk6s7ZR7PZo9lCR1E7S9tJ6oD1rbXu9jpS6AisOWzpTGSkNtPJrNvtemGPnzz5t197c75avfvJJ76VSWMenE7Sxfx//t63Y28/efhIJpHSUYhfx1vHoUwZfoSDtUL1X215ptU+u72d54uNQfela1ef3fv8s8ePV3FsqxKoQ/+ESRJA5VUeyE4+gHYOdw0e2yoylYQ5TKNJLmZIwMAH6xxHCw54zjXYv/jaEJ5UMuCzoW1QOgZsg1eBsHTwwvGagY39HLD5DMqwgL9NOxFiK4oSpE1khqxIiimxklG+BqUjY1yDop/OtBlJ71oS8YZuP/xMpFYiir6czN57/KD05e7GeleZblGcabcio6bLZQnzkRfBagn+ktApDKnvvvdead3LV18upbDd9ubZs242mxwcxhS2IdguRtZFDTbf3rP/aABQPUHuy8W8LMtWtzsYjovlarmYgclb9RCBJ5QOgiSi53KQBTtEC+TUeWHR4pKTdIlgRg6fhE764CFBQ65nnSIrovBtk+cZBIIKtpLj4ypwbakyKF8vuqnYeNZPeRbU8kpK0uraB0UNV/igmJQMD4nGENiwlRYviIq4JfBBd9MMQcTv1mTzQjZ5nJL5onyxLNIxEOxdJSuWie3WZFvJxourrb4b6mxeP+COgpWIDNzImqhMczJh6cz8rm07arRHhVfRGFm5KOAQTUn1OszsbAEn6uE79FNk5SwULyoRvqVFMDximLwb+JtkkukoFVIJlKMgsEcGkqW1/fHm+ctXozTePzianp5iQgv0dphATHH3RkktnBEygnkgFSrxIkG+lReJllFZjQLnv/5b69/9zrHWrfF4UZZ/8JOf/Px//LydZWmWUYpGVdppzSecS4piL46+NhzuxWlbqqTTvjOd/MmtG//89KlN4ihN0McA1Bfek8MOURMRhwu5Bvgd2WCNFCKNBQEccVB8ANmTwE5yjgSE0oAjI59iqKH0BhAsODPRioiofeh/RNtSPLQQ6LfVEQcBOI5MVWSwv+O0GMnHDpgvOVsGdbYnw2/wUxDsf4Z2hlLF3r3R75/P0pf3Lpg0+eToOG61eW5SyhhbVpUujqPtrc2j4+NI6jO9Qer9ZD6fFrnUSlfTdqAvAgdbWKGjuRfzyeTC1oZdzgeD4c7OThZHmS37wre0XpYutw7YLYoOLC/UanW513+p37+4ufHZyfFhWUgpsjRtZbHDQGWpWq0OxeQJMV8srS9MdWSLyWy6vrn2+NHDcZJ966WrD588uXt46OJImfjR5FRMJv/Ld7693e1/cP9+Du7WDFEIBMNpxYAPBVwDn+dbWp/b2a6aGuHH2xuXd7befvvdmZMLyP4DBqcPJwt6XCCgrRGjpVkKKce4C0ZShUHGGdIWLY6qAMKD7giPDY0+zNSUezJ0N0JDPDRtmJTUnCNaPcqwkKacYmTpYtQE4jroywY3lHfoeCoV+ys4C+tYDY7Tpvp4Ccy13tOYbS2hynh7OxH8kmUQphKHRIQpCJfQePlwf6ONKY3++PDgzv7TrNs6N+jHuRsZvdlpl4U9Xa2EUUFDQ/igE8CPVnc+vHPv3r29SxcHa+NJUY7P77XS6PTpU5mXMUagkIyAEzOrN+9VYBsDOdSjTzjRW+VytSzKMm21++Nhad1sMtHUOECSP2GoJH8Jow+x1Rgv9V5T5BnZ93GfTGMQn9s4NhJdCj43zVlDpOXEkRE6MBp2AoU5lB9fp/oIWYtnaKPKa0of4Fge4yiCxzcn5cBWUr8BtwZPyAYnOODDTWqUwLFO0ptrVFV8aZrtD/C1KB2DExapeFTTxyrkPQcfbJZREehbj528pGmO/bgLY8sxWUMFAZ1mAxHWYknZ8L2sv6qJPod2hySlUtRdlG/M/1QOGzw0hFCUCk0fHgLhJQXxfwBbFRpaOQJJwsBMpP/6EjjA2AS7aOHtU721QsqNnbPb5/dK55/t76+WC42JsgL9sCTlK0A3XJVeLyLhIy1jqRPINUpcNfumQpo8T/vdSz/8QXT54rFUw83ND+/c+cmPf//x40fj0VhDjCHswaqWCWMLdVmse/96p3211xt40U2z57H5y88++ZuPP953Imq30GgXKTA+4EcECPMjo2jf5pAqhTF5HF7iHeIQHmc+ViUBb02hR5gKbH60EYa/iymtUEQVRrJAXA/A0YBVWqRDYxQwfqIaIEWJyh+cishx1EnOfEBqlY6MJO6/J/oIRgxQmaAAOzR0ItcquAnjsnyt3d5W+urlSzqOP3ryWCVpkiagmwVnriQRUpV5Hhu9sbN+cnKamWjcytbTVqb188k0F8JEETWRwH9D+ykVRQen00zKnX4Hsn2i0bB/ZnMjVVIul73IKFdO8twaMBrzVnoRW/fSaHSx3d7pde8dH0+AtxDHptXOEhNZeD/tXiuOIvRYLooCobQkTleLlRMuaaXlfHFmPL56/uzHn376aFGISKskeXh4tDh+/v//zjfPb27c/vTThZc6wiaVHmqHkX5wyxvIbJBFMVLywsb6aDRcLhbrg15/c0Ot8us3b5VJtoRz3Vo0w/Kk3oEsRE2hvBADDMMZMrO01rDaNNUtQeRHj2x3OLrhEqOztBDOWhxtFa1HwK0D1/l8lHhCRwU+YsDNBrE9fjv4j2C0SfAZEOMhOYMVOmR544GDBtZm3npM58RFCBhxoHGYIyY2WbGirQ50MsyFCQdWsBlA0JvwESIQo95fqyg5yfM7Dx88Xa3W18ZrkUlWxWan3TZqulitgDyv2W8SBzaldJqkz/afXb/+6zTNzl+8NC3y1nA82NycHByK6SzCfAkneXqHvFVfk3pot4oTBfsnKa3zPF8tVzqOh6OR0Go2m0kMNQpPN83OkqyyeAWLjbbyGPfGpQoaL+aNoHVyMPwQos7mEQwckrGRlwx9NmwzmskNL8LQL6CpdbAiFRMfqk8TpZahrXmBmCsJzVOizmBELXANKzdBb55IApNYENcF/tRJXzPJA2LLoDwYcfjgpcJqX/w1MIpZh85+LfLF9qDB+eO52P9G2fWioaFFM2Df9OKkHCxR06kD3C49xzR5FfYK+EZUQHsQDubOwssXchcC+6w2OsHXpIKDC71NEjEDv7lqtGtDLn5d1OLyEl7h3pdZYVqgIlY464WKds5fWDuzO1uuDg8PijLXiqAYRTQUiBQEwDmWEhL1ZaJk7CXqfRMh20qm1rsyH1zYu/zDfz0fjly3n3Xaf/7nf/Gzn/2FUrLb7QqLnFW0+ABDSO/T5fJiHL0xGp8zUUfJaDD49fHRn13/9Y3jY9npmJj0KGz440i2Cx8QGgIzXYEuJ66UsQyzg1K9EpFhkSNqMAOPJdxrOkq7ECHB23uOEBFhRiAqjmKZnHc8p+LDoWhglVz12XlGsdjAI7aIm3mHPlCetnpgfo0YZNC7e5jX4Y1bn3r/9fF4N4m3Nte7g/5nB4elkkmSoFtvWZZKR0kcO49BA240HprYxFqnUgzieJAmi9lstiq8MkDT9b6GqbyI4qPDg3Ob41TIbqcFxAO/sbGxvb7upzO/XCXazPM8h6ye6iUXxflu71K7vTsafHZ6cupcbCJjdK/b4Txu3+l2wD3Kp1kqhSzzlQONbxzHJ6enrU5XKtHLst12Z29789cf3jm2VurIxsnTk9Mon3/twvmX9y588Mm9aVlKg5OoN4qN3KVn5W3VsAy0urC+tr21OVvOelmWtdvnd3Y/vv3hs8lJEcWl8M3+E5t8LaUtHUibiC0OpBrPax5pXem8MzpiV2UUjUsHbYtWQeUvtI4Ye2NCHqiDwGg8uCk4BDpwa4D0AnxViM1IMhLySksHwcyC0WaEMDWTLJF+xPdwoJVK50Tt7kLRk54eZiKQ1ZMC3reoWJEvHtug00GqF9y3kAhZxvHnJ88/evTQtNq7o2F7tRqaZKPTdkU+W64s7gKo2pEyMo6jsiiv37hx9Pz42iuvyiwrgZm1mM+Xh4cpRZcAVYX1RfRqeKXppWOGpWdGkixdsVyspDaD8ThJ09nk1NnSaAwgQ3mJCsMUlyvkbOO7cmQQrVxD0cvLdoV69KBJEUxsFuEmClLgUEfZ8ETWI6AI4YUNhjb+JPKbahRlFqgxvVPW03BAZ0X9/TkQwje/iOty6B1q0hVDSMwBrbXMilMI8R/JxZxOPNABiwbpjB499DfQgjw7caKgGyhYnwmSVoePqf6awEYV4YvCbFm/w3pJLribqWd5Zoc3kfEQsB92kDJ8H8oEFI3OCW8y1DQr1WSSs2WLZ3qgkrIG8Tn9CWPv8KjWomZxCEihRXN5hHrgRiC/vbK0KkrPXr7SX19/fjp5fnTsnTX8mWtuwuB7ghWzIHUvVGKRYpigkB2IXPdanHvzjbVvfv0gTjrr64dHRz/60X+4/cHt4aCvoxjFgrgXhUndm9KOrX2113+l2x061+r0jo3+yzu3/v7zT5/HUZqmQIYCISaJ1SAGmKl31sGiCEiV8Ek5T0w0JI9rDwcc2mEppb0HQhaSDvB0VBjDUH2FhckU7yH2QQRTg+qHArTsKPsdYuC0dRDmD2AumgkDJk4EZm2wytOKi+RNxLZXnjIVUDpGcXVEWUV7TOKQoQWWAE/dEIZf/dJV6mvD4blOe9jrDIejp5PT48W81Rv4Ev2T5SrPTaTR2NlUY2iZJkm304niKI11XBSDNI2VXC7neVF4VlQabfChW1rrS3tlcy1fLtvdLi6MkzjbPbPbidOT/X1tfSl8bq0wRjt/tt2+0utu9ftfTE8WShpdfWbtTguxnNKWvXY/TmIBtLg4jpb5EvHTODZRHJ9Mp2DtYPtZupa1dkfDX3/yyRTcp6xSz05O+0q9vL555cL5Gx9/NLcOgvwFCJowfV+iMxcUQtfX6ky/vzEeQuivHfV6WSvrZ9nb77xrkwRJ2HC/WG7KqkvSSZPCWlxsoL9KkIRLGG210dZbXstydJ23RF0UhLZX1VZYepC1kmEHx1lOIFLSigAVco7EKEpsv2Dn4a1DvgxzPLAVBj6B9gRXC0bRJDDUSrivlJRl/ceU9g3IukPlOniMe1HLIiVyDMO8SbZrkkcCmmZeCIbRJppIdfvxg4PJydb65iBKO6vFZruTRGY2n+eYm+iVrJ9dYXSUpvEXX3x+58MPz124sLG1fVQU6+d20zg+fvZUl2UEnxe516O7M7kTcRVkpFP4OvfGe79YroTw3W6v0+lMJ1Nbllox7UPq5qICC5TyKLp0lEFGg5YCL8EApDteXTXcMjxbLzrRyPhj/DWoXesdJ+PIPLSG6dU3oyHwPQVqUSgMgUfVsIYKI/ELe1gRDLpkI8tfyhe2rfUn0PTDavCh6c9dY5cnyEFf6ijKwvTKmb41jbl2Dfd1kL9soPDCs7GW4AuiaJvKGRRkuUmoduhdePBl8lUw+0BLkWbpJV4VDfAUGBtGfXaKFoJzsTimWwTBEXk9SJLOyKakG5NVPLR1+GM1Qv5ScJoDlWUl6hqvQParmV9AtCwhC2vjVnvvpZez/uDw6PnJ82NgQmnBFRfl1Rqk8LFSYOxMDs+REGk1+/pEiraScpWnvd6l731PXbkyj5Lx9va/vPXWH/zk96ezab/fl14ipxQTCKTy2ou4KM4a843x6HycZEon/f7No4M/uXXjzvTUZFmkI8H3u+DFWdhOMd/Na6kC05GuPmPOitPLqTUJzx8eZ5DWx20Y9GjuBWwGcwhQyqEY+cetMC7XHdEp0fXEI6guG1o4nMwd5cFBr4uKzKozwAQPjEFUpEYManuFhC7wXcLE2aqn0oKZ8V6Ijrdf7fYu9vqtTtrtdGdFfu/Zfmc0NkZjtyGkL8oiTTMgrTipiWudtZLBcDgYDDMhW8L2YyOdXxWFLasTDitS9Q6j9PDgaKff6WWJlKrVbpWuFEKUZTEYDs6e2RWrfHl6Ukqxss5be7bdvtbvrfc7D6enS0WUyDSN0yQF9wkfmThJI+wLjTHC+yLPIflHxnEEUQfLeZG30qSj1dnhYGs8uvHpJxPndJxOFvlivhin8eXx+PLe+esffzy11YhP0AIOEvggKiGd7Sq1221tb6yl7XZZFFlkWlm2vbV576O795/tF0layub+CO4H5wZZKy9y2PzroBkz8Bg5imiEiuzo+NVozy09ZDeRg5N0Hh8z8AbRQAmwlFcSYuSr5hE6LhXcdcjjHbCW6j9bcEXF34PjA9E3HB2QhO4gNYGnCJpmLNRaDc+5Rj0bYrus2eRkeDTCDMy2wCxzFE8SQFyF5UZQc6vwewIHwkRfzmYfPH7UzpKd8VqUF+uRWW+ni3w1zXMXDnFkE8JRlyTJZHL6zrvvpq321WtXp0WerK+vrW3ODg6L6TQ2hiE92qMGfY0k0wnIXRM8+DvMK/eL5aL0tt3p9wajxXyRr1ZGNUwgMVcGviF+xqL2NQwrV8XG8GwTrdDyDA09JEZz8Z4KN+MBrmdqFf2e8taDQQTVCi/rNblqrDrD8cSVqN4O18gdRceEsY94p7UbpW/sT0XtTlGDyY2SzNAHS2OxqdHsIBbSagKR1WsTtUXoV9BmimLKBN2Z0D+qOsKgtsQXrCaq+9HGC/OBDU/vG+PKGoiR5G0ChzeGloEZIKIWI9GByxQwGYIC+Wupr3IUUI2WyhikQtQSegyo1yC+NVnrhKFckVmxF8LiCodM3SRxJdEuDk8nZIPBz63O56J0WW9w7qWX4la2/+xwPplgjifeDhqjk+DzqyouYM6xqGpwJIXxPpU68T5VKhVe5Kve7tmz3/vt+Xjd9PsmzX76pz/9v//2b7M0zbKMM1gRJJNGeu1cz5WvtrI3+v2eF60kmaXmZ3fv/M29T2bGpFmLEro1xpiBKJPuMNJdU5amCskHgpWQEgZ3He4dWAMrJufx9YXL42pnUEeohGIbWAIUXdW2gFG0p219WOE4zYsgOtaUFl5YT9nMGuldjgmliCcKo+hbcPawZE4qg0/MDbEeTnZBUeTVJUbYU4OVQ1eKN/rDqzvr1ecQxVmn8+H9B8mgn5rIllZoaaTRxpS2jOPUCWHBjgrgTukKF0VmfXPc7/cTpdLStp1vGelskZcOPYRNZJzy8+X86pkdt1q1u11rS5TSFIVNkujc7namo+ODg2oOLosz3e5L3dao3z0oy5UXBj6GODKtTgfC/G2SJe12Vr02L42JTBTPZzNETq21rSw1UXwymczm8/XRWC1XZ/rdzeHg1if3Jl4kjFmigAAAgABJREFUnexwMlW+3Gh1Lo5He7vb1z/9dOE8cYaFjBRZkxuox5nzO63W5njY6XXzvMyX+bDfT5K438refvfXq0jN0FDboTYMCqNzqdSxVIuydORe5cmA3ZFeBQAPoeE33jER1ssS5kUdhDRwJTUpizyH4iMMrMG4qTrALG7fAKX2KF+rWhw4KizebwZOGmeFN8KAaqrqhiUlSdRqE3DXQHsNtOtQLKHBA8ahlYrBp4FmIALaeVBg258Q4kZzmyQPOYfcQ0pMUOwJJbSWUbQQ7tbjx08Ws3Mba0NlTF6c6XYiIU+X1WQqtaKpntHFuGq83K2bN4+en7zyldeEMmVkNs6eL6aT1eGhVrqe3BCu94EqTGEXXjH1DlsIGDmKvMxzl3W7vWE/X+WrxVzz6AMYB88wYXFJ/GV0cEcFCS2DIYxAMeINX42YAWu4EIrEkYohbRyj2dpWOmY+64YZouKcXVHj0VIwtb+pwq3pTKFs0NBc746DxFWEe080V9ENJBXv9FDMfHPspaqvarI0pnDJmi1T3f9RnBDiwn7jvM8TkFnWGLkDKCzroSTIVGQAdn0d/UZfylvjAFoHGbBio2XuP3xjt02vm3xlamo0hfqFD5NHMM+HrQ/KX81cHPRhqGu78kxUo4uNdtBKyhptx/sM/lXTA+SCuQl4njv0XEUvjsK6zmh87vIVL9X+s4PFaqGROVHdX07D3sYoZcCEF20mjfeJULESsfdgdCUypeLSSWc3X/3Kxje+cZKkg53dZ8+e/ug//PuP737cH/SNMTAfKDRnrL6PF1FZbgn3em9wIWslZRF1O3eWi5/euHHn6Nh0uzgbcaCbdxD0hgHpvireigOCPHBMtLMOJ08HWa2Qpe/RIAlcYmFDDpRXrRW39ogiUz4M2DwAIKco/0TJGpPhrocQbrqhFOGGgNopTUml6HulkTZF6w5NUAsdyrAVsOTZDZomZTzKReELtdYW9UEk0FLOOqUZ2fEU56CE76mqAF9ZG5VGTFbl2e3t2/fvT0rb63TiOIGx2WGYrHOFAfqxd+Q3UVUBL4q8jJN4d3Nzc2OtB1Zkbe97UmZKglDI6bh1Op32jNnoD1xhe8NBWZZoA1IW5XK5Onf2zKjbO3j2rCiKrpRX19bG4+Gz2WxeFpHB8VR3Om3Q2brYJFk7Q/vP6sLEpho3rTVKGihLaZLEcXL4/GS6mI9H/WIyX2u3L549+/HnXxwsi6iV7h8ejTrtcRyf39jcHA5v3btX4F4UHUyVwQNJeZFKuZWmW8NBq9upZqNF3mu32+10PB5/cfful0/2V0m6IocvwYnGKlOyp+TzVS5MpMGXG1Q/wMbRynrqp5Q0sPf1lMQAP9dIRcxkjBcU6FBNslrIQXbWlaa0MsRrQyWguMmqzQISPgqUBYDg1W1p0QDVCVfd2zipQrPt8PVwZIcWFNXQmG2ASeyQdagQc8YcLCw9sJ3BZbAC5oNHxjAi596XIkBLTDhnzRIHIgvKa9baiCR+cHz04dMnaa+93eub+XKYZKMsmS8WM2tDmi+nZzujTJLGn39+76OPPjp/4WJ3bTwp8o3zZ5UQs6fPIGyB9VTkEyc4ipEXtA2FCEedqbzMF6tFkmaD8agoysVsponX5jnAKIQJ+ca0xCRX7ZQTvDiSQQRK2BeD0Oy+7WWILuR1K/s7e9+kbnnNwx6l6/CGN5RTXtHKhiuHFDXTKYySDK/64Flds6xkc9YNTor0R2EeFqIpVfai3pAjyVuJpkU1S7SF0CZO2EHK0XsWPBKFCtj02KhHXM77I5oCZf3Te2+Yh4RPhODXQAkL9Gwh6hcW8sE8p5xwpa2pWYxOEGKCT58jkELUkl523BBeEmtABEdwWTuT0IVSqOhTPLEHtJnxaDZpRc9I6kPwpxTODja2dy9dzkt7sL+fFwUogaqHT0M8ooHGh1yuPBCepUilSqVMlEiFSIRuKa2KlUzi89/6Zvby1Umajbd33nrrVz/5w5+sVster8uwqyKDLSW1de08vxDHXx0ON4VM/1+u3vPJjiy7E7s2fT5XvlCwBaDR3Wg33dPTYzjkihSXu9QXKaTYkPRB+sN2YyXGBrUrkqLohpzlklzOcLyf7gYaQDc8qgrlq55Lc81GnnNv5gM7Jibg6lW9zHz3nPM7P8N52c/+67Onf3X37hGjMo6oJz4xZ3xs/E2hXpkDW17wYW95DqS1DYLfocUgvhR3gYGEI6iI22d0q6eMtS2nNxTEbsx4YrDbbEBvJLUOiEPwjeMZWvDscqxRg+nUzJnVOamnC4LEOZwicIieXNw3a/69IeWqlSz63CTm3CgpOhTDSU2tjYx+I83fvbhpwvDus513b916fHjwcjJZXl6WUMWbikscgRAdNsG/vnnPGmcG0FPWqgzDYGVl+dLmxsZg0A9EX4i+lIFStq5rVe2fnmxvXZDapGkGpIFaKSXDUAgxm01XVpYurK89evTI1urqaKnfy0+qqgQ3CUgo4mmWorCVWJtkCacCEdAwirmQ89nU5UkzYrQOwzBO0v3T40JVKyvLk5PzfpzcvHLlyaOn+9MpTZLz09PLG+uJpVdWVnq9/p2HD20QumBB66IjiLVSm0v9fJSmg8FAQBqEJHbY7wVJnHDxs1/+ugqjWdN8OYUKF9ISEltyIU33y7kRnPmVIXOpGx54g8KF2C1p92TO4Y6ifbPBZ6iqg6pI6rpfV8u1ucqDy2lydXnZMn5czJgLTAUqgzWu3tDWl8drV3z2k6P8NcOw9bo662qqKy2eKepDxsHUlWKQtrEuTNqAP4x1kkjq0BY8a53PAIJlhjr9JDKzvCKjtRqCFo8sbnUsYTI8N+bui+dTpTbXN1KlU0NWe7nRelyUNfWgNyP+vdMwis7OTn7285/3+v1L29fGdd1v7mzvfG+PVhU8segd1M4ipMMyvdZJd3lK8FRrNZ/PuQiHS8uMscn4HINrXfJru4WkdkGpi6Zm1OP0xBGu8Vj0jB7akuDIK3MeXhPkY6K83PFefU1pJ2hHgqe0zXrvQFoXEOODiEinlPHGWK6Mdmn9HZ7bThbetLpFsX31pd0O2LYZjK+A04v/Mb81d/+WYQGOXdlCL1Mk7zkDRwQcHRDAyAJ03X6Pdvvccrw7lHhhp91FSrQaLM98o97NcpEgaRdXkBg3w7olPKOLeLXnBeDO132Q/bjbfu68u6ZzYnNBKG24HjPW9YEumNGnB9J25WyBF+SIjhxuIESY28qQla2tjatXJkV5eHhojYZwWiMclZQImLHBPrr5dUhZSGloTcRYSElEbExowpgtq2g02P7618rNdZWleb//x3/yR//5b76VZmkQhkieYk6UyjihQtUDo97Ie69naaZ1kGd71P7Z3Ts/2tvXSSLc2E6xMwesjeGYikgfo16QCXMn2lhgj4y3DchZ6FplkITsU8DcpIPCJYOSIRjJlcEOBiBnztEoH2nomCJLm+EMnmVts7p6/+qVyWQyVTW4SDHwunJ0LesM/QVq+puSiW8JSELO3wDNJb3NITIt/HHnwHDh0D6o+twpyNqgSzDi4CiTjKx9PY7eu7QlBvn3Pr3zxrXtQqsnB/tpmudxCtJw0dRaDZnNzWSgGKdBKDnnzXSstZBCgQMUMbZWlbVm0B9urK42lbiX9TgdhiKS7HQ8Pj86vry1Wc+LXtaD8HnOhDBEU0ams9kwS69fu/r8yZNeFK+vLY+ryghe1bUMhLEmCoM4iZvvqHQURZwLkFkLykSUxFVVgowLqYPNtQijgAfB/sFRqVWQZC+PTnIp371x/eRsvHNwUBByPj6/vrFBa31peUkb/fmLPZkkcLwZ6uBVGmizGYUreba6soKRUuVsOhoOBSOryytf3P9i5/CoCERJO288Tawoy+tLo92iKJsf1zKM2zS44nUBRxi374yf20EMF261YkWRGtOr600hrqXprTT/aPPi1y5fvb2xudYfzOfz/bOz/fmsBhY3xi+DwbbxCjPMHnYx7ZQJbQzxkVyWGHz4kQjCnB4N3D/Q9hIiqlxRQk2Nc1mA6g4u3FjmEZOB7BP8rWEtWmiMbA4BdOzGVDCCPi1+BesyrakvhIjYwGUxgnIrg4cnJ8+ODpdGo14UBfNyJYriQMyKWQUR3M6I2G1GSSBDQuyvf/2r2Wx28/XX59bYLF1fXZ2cnJbjcSiER1rbnD2gkBKkRDLSTYOOH43Kqdm8IJQPl5aFlJPxmV8G2kUOk20TDWhLnaG2k8RagjAyo20vDjoxX1Bak2Wvy0FooZthPTrJ2hWzZw+3ZdPzsRbGWV/xcVmNJajdB7tOjXaDoK+jLUGZ2m6bjNXIxQp1tbyt3gtWXG5oJi15m3VlEWAWnIDdm2BMeMcsa7vd9isCZNt9Oem+KfFiKOLpzwseZKSlnnVDbHuZFnbF3Zu3i6NS2xW5NqC1W6K29TxrcQa8aNioLmjMMIHCLchbUwl8Xwx8zFGfh+/EGW6g2IB6UQ0wn5lF/N5Va2OJsmTt4qW1i5fHk8nR4RHEgHNuAOtEcTlpiiVsfGHpS01ASUBsBGU4sjZmLKFMV+Xo8oVLX//aaa8XLy0VdfVv/+2/u3vn09FgiCRe7O+RuMuNFqre4Oy9wWBLNLNGMOj/8vjwjz79+FlRBknC0ZQHGNKuH3ErWNfScMpb60jWxl6j8Nb6GECIAHQppy6p1SIKCnRT5BS7FhJpoiCmb8o8wiJ4jlgXF858tJJz5V+uq9957bXjw/2XRcnC0EUFUr9gcMeDZe6Hd6oQxAkJBkCQhZ+cUuUmC+iNCVJvHFYBRvsGewx8ftDyGqP/YaVmhNZv93q3N9aSpdGP799LouDC+saDJ09qS4aDPpC0awTAofliAvYAoCUVWPiBIK2NtVwwZKjWpbLWBIHI8mR9fW1zaXklijYHw8PDs8l0kqVxFEZ5ktaqisJIWxsnURBEk8lk0MtXR6P9ly/jJFZgAWHB36s2KpAyTdOmyhobJXGUxEZrgDl4lCbW0vF4LDgRXIA1JqmUSuNYyPDlyWlhNA+CcVnGQrx75arV+vO9nbPZbG00vLK5oWaT7cuXDg4Pnp2cECmNK43EKBVTejFLh3G0srqK3hi1UlLI/qAXRDGv1c9+9auplDM/1eBUEaj65ury3ng8qRSB9gfspWFBCDJfb1Dg2l5nBF0rW1SJ0Rsy2I7jd0eD37y49fULF/7l67e/efPWSMij07PvP37897s7n8wne9ZUnNnWKRgHR7TNag8HLLaoubEaBjD2CjWIMNAMQ/PkT0venUidIKkdpaH7gye56eEYx2ASi5iS4S7Zx5GFcymzICqVVug6Yz3c6kzYfPm0nhOK0JIHNBnlXIrDqvpk94UQ/MLykqjUiPOVLClqNatqjPkkVMOIzcH+nYdB8MWjL548eXLttVtRrzehdP3CJiurydGhgLgon6MMgi4njrGevGrbQ9rtdCFBqSzn1pL+8kgG4fT8jGoF8mjHAOkEJZZ2TFdPuaFtYr3t5k+f3WDsAgHYQiokIx0Z0LYOmi7siLbcqnZIYwsK1oXEAz/muU7A4yG2XcrTLuDZTbPtY9NuhTFjz4+9dmHM7chebfml5JXUhNa6zZkFIocBYRfnBd3WPXeuuV1qy0R20GeL4nsxk/da7r7rYtyibaush3Da9e7Cz28XyAp+VvdghOdDELrwNS3Qz6jPYHQoBPN3g3XM866b8bmHvodyoDNzfGD815jpS5ivx8CZahodjsbCDlBvTnkNDgub29eX1tbPziZHJ4eOn2QMbo6bU9pSCVtTcJckktgA9r5N6WU0JCRlPNDG6Hr1rTeXPnj/SPDBxsYXnz/89//u35+cHQ/6A+8R5OgwDDIV4lptR+FbvUHfkEQGRRz+9RcP/vbJw1IGMpTGWBjR0FMPbqoxrQKRufB13Ab4/GsQ7VhqjMYIQgfSaYKJ8T7iBUNsDCbytpYo1kU0ons+Rcdyt7JDQZFPfmawd0ZkySxX1b9570tkOrtzfKK59Lov1sIqyBlDX9+WF++p6yB2UtpUNdWGAJ2YumfUdg1dazjMuOCSQxQsTPcU4nOaPwaPQgDVtXkjS9/e2uitLP/60cOT6fy1K1cOjk6O62rQ70dhqJURDoPg1miUV2qtMfuhmURhrOZQKcFwoinz8F6p1rXRKkuyUb+/3B9c3dq0ut59eXB8ep73syxPi7KglIVROBoNZRidHJ0M+nnWy8azGRVM46kEkFsgw0HeU3WtTM2FSNMcr6q2RoZBmuXFfA5SdJgD8RZTHsYh52x8NrGCG0YrrYxRN7Yu9MPg6c7e05f71zZXh3kei2B11H/8+PGZMjyQzpXCkojai728H4dLS0tIpqGUl9PZ6tKSEHI06N2989nu+WQumGVcgeVZc4eK+Wtrq3NjjiYzJjiuSL3NH7NOog8ADAV70UrTcr7G2O00//Jg+NHm+gfbV9/d3r62efHtN9/q9Xo//vXPv/Xpp3/99Mn9uppLYaWEAMrmweWwSjfGKCfXRV4Vs1p74pNo+mPOFo4Td3Zqr1T2Tw2W6s65EMXfkE3ppjJQ3MGnywWIaObWpk3D3SUdIk8MiNO10T6G02XjOTsLH7PqjJV9ZbJEU3d+YvoGV4zdO9jfn51vra7lTTum1uIkoHRclXWbZOHDrwklURgdHh58+skna5tbG1sXT4uyv7EeSjHd3WOGcN+NMjcvoqEVcGU7rzv3eaNeZFIVhda2P1qK4mg6nlitfCuP834bwcTaiQ1NBtEHpDUc6JjCC2Cm/z/LXNE01JOD2n/mpiEoVV5vw8g/Ky1+sdqpeUlLCW4HRfLq1naBNk0Xauoi3LuYw+9mzkUYemFP2pVV0449C82bA8aRhMW8127r9eVc2TvfQdJKo91PZ1oQ4NUtNe12+IS2q2kH2zhK0gLO753ECFkcj/GFFuTS7WPpsGSGLStp9zoe+vbQolsQeNAcHytGF3pabz3H2uvtQhSIg+JZa3eDV745dBhqf8FVkQh58fqN3sry8dnpydkJ5uejtwanhBsL/viMEyKYEYQISyShIWEY6BtTmzazsqaSbXzl/fD6jVPBeyur//id7/7JH/+xDHiWZp27JBrQMsqVGmrzRi/bTtNE6zTrPTb1///prz89PWVJihkJGBcD5QV0P66PtV6UA7ixcUoKOB4wGA43xc0dx40m6R4DPJ9AU8u5gUiNZmh0ay+OguB2IoVPDhOcQ6YN1GIgOsKUAHMPI1aZNaX+zbvv5pZ+/PzZmFDN0SOoRQvxGULlMVz8prfxTnOsKTgX4/SNLNvibEBsoDXTpq4KXWulFOHMTw+UYQYv+ghY5hJ80T2LCdT1Yp9/iZh3NjdXL2w82Nk5mM1XegMZx89OjhljzRAMt15p1bwLcJ+2mkZJZEzdzKNwi4JAiigwGiNRKRPweWKWMQnHr61rxQUJGN9YXl1dWip0vbOzEwTxsN+HCGjOhezlWZ7nk+mUciGknBdFGIaq0o6yRFieplIKpZtxO8syKTglTBkrAxmlMSFkNh0DG5kFQsKYprVWeZYRSudFKQJpKeGSldPi0ub6Uq/34ItHxyenb968aWs1yntMl/snpzMNQb2GWasjay73834cjZZHsvmpBKHs7PR01O9HaRKn6cn+8ScPHhSSF6Q5NXEVxIvi7Qtb2ugnR4c0ip3sGyAU2C8b3mqGlQqL+WVKvtwbfOPK5Q9v3njn5o3r29euXNpa7ve2NtYfPXny/377b7799PmvZ8WpFCQKYf2Bu1W3Mm26K9cyOnIT+qkZb3uGlj/o1gEIs3CWmUDncxJ5F5zUvLTw3l6i+aRqP4+1yhoXba5xQePpCyg0FxwiNWFSqa2ptTaO3euSoABaIrx1p7HOB8N6MsFCMBUSXNwTtnc2+Xx/P+hna2nKZ8UwDPMwmBfF3GiKMq7mnwKobmkYhlVd/PqXvySMX7lxY6J0PBz1ev3p/h6pVPP4W9wJumwzy1okgnQaXTcIOVpxWZZa6bS59dl0OjGqbhPhrGslfMYdEtBJu+mlXu8IZdM61Wp7sreLZ9T+W59miHytBUDC+mUvddEGDrn2rk/dj0/+WRou8WC0R8WdhzjpGFiIzDu3aF95ujnXQ7/ISGnDEF5dX3dDsMtjZs6E3r15PH65CCKLAejMY7W0Xba6ssd8K9G1CwtMt3YubSdk0tp9tQjEq/4lr/Qcfse7wNdaHKM9fZ+2QPRC9pTfMYCE323Nu3rDyEL8pO1gfid/842TfwCZZxUwqJquPNluwnYqXs6UMSyItm7ejPvD4+PTs/MzV/KM5ZgeRYikaO9MBMTpS0JCSgMI0g8piSlJmSCqEv3s4te/oS5sllGU9Pv/35/+6T9997u9Xg8j8DBWgbmgJBJU9SYltweDTcYzyumg98P9l39995NDQlgcw8mGvELqLG+9I/lC08GM87N1EkwN/nzdQsYnaVOXDe8/D+5a+thsD/zCJGDbWAzt6j30IHi24RPkQQ1MkKXWCmtfS5N/efP65eXV58+fH6hiYo3zmWQuJJ76GLsFyQHmpTtUMZZitd/fWFl+58aNdy5svT4Y3FoaXe31e6oOigmdz3VRGYhcNu4Mo8IZOaD1Q2tJAxig1pucvLW1cXFz8+Hei6N5WdV6uLJ0PB6XpcrzJIljrY2lVjA4wI1jDfUHQ7CrhGcQmp4wCtMsM0Yr0AIrrbXRopm2jdZG1XXzgddKSLG2vLq8NDo9PZZcJnGirQ3DyBIbxdFotDwviqqsCCFVVVvqYtiM0XESR1GslDZG93p9DIPCETxI4jhJZ9OpVooSopvaCwtN1tzrKI4E42VVWjR95ExX9fJgcO3ihTv3Pg/DYOvCBmekn+Sz8fnu+aRwohsbWnIhTZbTdHNzE4dbHgSqVsSq9bU1SlkWhD/6yU/OLJniRwgqWFBV37x5kzJyb3fPRrFrzVrzh+aTJoiqw8nkOqO/dfnyv/rSu9+8/eaNy5dWN1bSfs7DsJ5NBln+g5/89Fs/+NFPT07vlUURSuqZgMRVeqhb8GhgVDCMCAYaTevJos0U6yhHzq3fGSxAY0jQcIZR17SCsQbxoCZqpbizr/HNbBczAwiy1sbp64DuCAZz3LsRWya48Vzfln3lGdbWIQKmNUForTJcsG73MTaESTk25sHOi5qYrdX1SFep1cMkNVpP6tqiD7SDlA20AoJz/tm9u8enJ7feuK0Yp3G4sr4+PTpSk3EguAsXswvzm3UiVmLbLZ/p5ivOqrLpdLNeP+8NppOJqWvupNPe3Iow2obP4brUD13+DdJ2tHY8Zh8x6vTJjtvklhSOrtwtmH0NbEMJ/bbLI7jWF/q2+ro35NwnbMu3dpWFvJKa5OIXHXjdFVYHpPrgJDeyL0qeWs68L3medG2d1Io6C0LLZRAvYNZdWVuwtSLeIcyX1wWny64wt3xmRjwgb1tU/BVI3lL6CgxNu42DbSW3LZzfzc/elgvXAG4TwEg7BpM2pteR94BK4UNG/WTlac8U5UxezoqmMIg7e+YBoZ5tD3kJyENitdYyyrau3wyy7Pj4eDKewEaUgnDCZX9w2ArCLyyAz1Q2dZc1pdfShLCUMVurZH11/aOPTvMBz3NtyR/8wR88uPdgabTEXRAE/AdyGmFMXFdXw/CNLF+yJI6i8yD49oPP/nHnmQoTLgUlthns4BOHXCfrLOZdc+0oz63NAlxfVPsYMJttbyuERbiVMyakonoEHgqXfE5Y+2AwthBXhZXAodpAaTbGcur5zO2DYg2r6nf6+TeuXmXWrvd7958+LTgrreUgtkEUwukUnGMgBcI2CqbgyRD8rCwfnxw/PHj5eHe3nM0uDgeXB4M3Vpd+/8vv/6svv//upUtbeZZYoydjMpszrQWKOx3IDlbwHntE98ghs+9d2NjeurhzcLg3mVWUyiCghEyKklA6HAyafoVjkCXVxghJa1VZQ9c3Nxjj0+mEMiq4NFrJKBwtL4dRgtdW1bUxConZnAoZcAP3wygVSNkUUQ6Vg3LCbBiG4Pash4Nhlibz+XxeFm4pzqjRRnCZp5klWmsbBlEYhchpUroO00REMaNsen7GONGqGcaBLt68Ya3qOA4447PZ3CD+yZnRppclWxc2P7nz6drqsuAsSVI9nx2NJwfTOQukUSrj7FKWj9JkbW3VuSKaZr4/Oz2+sLLKKUkD+eDho4cvD4tA1u4AY2FV/NbNbUL0L589V1HEWssaUJpxbcT4bFPX//217f/5y+9//Y3XLmxusiSpOa2gQaFFtTpa+rt/+M6P7j/81XTyWVXSKIRNB0P5EIOOClofisAYjrndI00Bs4FYJuaaL09CJoDTu0GLEmY543B/MVu4eeaBBkjR9gSbCohZ9F9C3KMJDDMrBHNDNl2cTZBgRVrzVOs+qqjlcy0zJjm6as4ANnferdRv25wQEG2hm59QyofHR4fjs8211YzLoCyX05TR5lnV3LkTuNeDMy+KwhcvXjx8+PDate0gS6eErG9sqOm8OD0LGfMkGqA3eIqQkzN7XmsrUcJjvq6rWuk4TdO8V0znqioZ6wREnkTuxkm/tHQxjt44ABJsSCevdpg8a1MTWw2su5yeHc/8y3fbRuPdDEhblN3Wyi7Awr6qIrBHugGFLuK9vqbhH1EfbbHo8+H5YwvqIOuJ121hI6Rz4SKd0QjmZDUFQoRRBw7D2O9Ess2/4hbCpRZezEctoZTM+r7Btqovp212umPi1KXttV3UKpOufejW376vQctx2wYYt9A75kuj+Srr/sx1XG3b13IA3EVh3ZKdkbYUwIFnuPPPooQT0AWiRII6gTduFqEMN6NMkPUuXt/mSXx8dDSbzqj7ZwA7Q5gg82xnjg4bFAMVWAT5vgnlMSVG1aPta8sffuUwCAYrKwdHh3/wf/9fR0dHw8EA3AQcARz3tcB2tq9lyfUo6lEe9/KH88mf3vnk3mQaxonz40BhPlI1nc+iJzQ1LaVujjOfdrTQp1nqS2krZQe2ssYNA/F/5wVKxjf9nkqBqTCcueQD19dzUAcbTIf1Ye2+TYWGQFT1h6sr33jtxsPHT7709lu2rPf2X2rOZ7o5KEl3YBHtP4p4tgk8amGzyuE/TdnYmi/Oxr/Y2dk7P7HE6KKKLf3ozTe/euvm129c/9r17euDQV+bUFWkqnVZghkId59yR5xuvqWsy5u93rtXr56X5cPDExqG5WzGA2kJKatykPeSMARtKEdM3xIrhVBVVat6ZW09iuJiXmijmqFRaUtZPuhFcZhlSRwlMgi00lZZZUpCSMAkfMicOVAQSttM0U0BECIMIWa4mfLTpNcbUGuns6mQoilM2hBj+71+EEpTG0tNnqUwk1ld11xIGScykMV4UlWVgDjkZtIEOh5kBJooSQIZFs2J2TwPgvNaqTxLh/3B2fHJaDjinOW9fHJ6flqUp1XzdvpCbPXT9cFgeWXZG6sbIcPJ2Xk/iXpxKmUwHs9/9undeRDMoIPSxuZa/d7ttypV/fTRU5JkzNHUmbDETiYjVf/Ola3/46MPfvPdt4frq3UYlMrUVgsh0jgSym6Mlv76P//drx4/++VkdrecyziyuC1GCzOokAglWkevcb5Xnt+JGge8uYDtWOaMIEkLybh8YjTBNh6yNMhS9ripG83cAY+BQI7Y46ssNJ3a+BnXIvsB6RXtJOLGJXALgWcYwTdq7SuBANalEjDqrGs58esTBimlAWAAXAb7ZXF/b6+X5xu9ISuKpVDGQXBeFDV8Gtu9MB62YRidnZ58eufO5taF5bX1k6pe3twUxkwODzlztEzaenk3785Yr09pmZqQtmCaC8Bo1Tz6ZZxleb9XFkVVFs1Ho+kPjDfLZK5oWGeO4rwIubWOYemqlk+2aHnmDplssxi9foUsrC+xwpmuRHfsaz/zWb9PbrlWi4zltkKQLsPYz6KLECzpIh5oS8zyYbwLmhzbel563lM7ezv7cLK4kSZcitBLcrzdV7vT7QbO9sEx7TTvLhqjrwQmdqKkBdeLll/lH0S6gKx3FxSui3G+JgsxXnjUd1etpRF6lxSghBDc9Vtju4gox4hoV9iORYxnLrf+dXzX1SmPDU6xeKa5Wmip0ibq9beuX7eBPDk8KaYzfGTbOo3fByIFCackpFRaxJx5TGxoaUx51PSx9fI7b6ZvvX1A+XB97ZM7n/zH//iHRus8y4H+6J38AM2Sdb1Gye083+RBQrnI0+/u7XzrwYMTRoModjUPc9ysV0uwNsMLFtLEDgldCWJtrUJU3bYYECUtJcDRCuAqNWWOYooQ9StwT3OjDl90jq5WCAHNp3PdQ9jLeRmAnzA+R8wZWOKwQWKtvrq58cG1K48O9w0h/+L9d3cfPjyfz2piZ1ozKdws4ZMVkWbcIuek5bA6EivlgTSC706mnx+fTas6sOR0/4gRVmnTz7Pb21e/8dab71+9dCOJh7XS83I+m2mDuQmQDwkTCLP2ShK/c3HTxuFnz56JKMIARfCHaprR0WCgdQ20KyMFqJKUEpTPy8pYu7S6LIKgmJdFWRBLq6IiVkshAdVkcZZm/TxOYsGFUaaqK8JBScx5KAMDbsyU0kqpQMggCjWw+azWTLDR8hK15OzkDKKeidI6z7MwDAk1zQScJKTp9jhuAfJ+j2FG4eRMcBeyq9GyCz6GZV0ncSw4K+dF84gbxRnT2iRRlKUJ2FaQ/qBvrRlPJoeTsTJmIPn2aLTSy0ejPqS4CEKZCANd10zrldGQaiMp//5PfnJiSQEzcq31ehj9j++9f3h2+qMnz+owxgUt0zqenn/Qy/7XD977va99ZX1za2b1WVFSIUXAJfynZpP14fB7//TDX967/0ld3Z2e82b2BTdyz+7gLofSbcngeMIYLtdvW8AbkEeGVlbGducjc6cGPFqca0vant5nnVK3MXllSGhxH2BeGeukN5i6hLbqMNZabTV+l6ZPxTmYc8e+pj7c3mt92lMfDHAgpNN/LoGkhuNx88k2NCQmD0TAYPfMxdzY+3u7FbfXVlZkrVJGh0k8r9Rcaet+fu0+rZYIKcqq/PSTT/N+f+vK5dNilq+sRIGc7O0KQ9xFoq0IljpnK2Z9R+65IajmFrTWqq6qME7yfr8qy6ooGKoSnfKWgZcOcWJulBx56BndO4GhY2i3eWRe+0RfwT9pO0ez1nwPyJ+wSkbQ1fltMlciacfEcpnAbhW9GJhEXUqCKzvoZet6hgWnbrpQlbHg03YT0bGGW+zZa2dIN4kj4upch6A1Y1zIuI0dZova3UUe12KBXZBsd+1CB3ZT2r7Bdt+84AHiKz0jHSGMdHvfbkfgo0BJiwV034pSi89x++bw29qFyu5U28wtUTx5zFOuiW03B8ybRcBvkIsE0b/wNjg8e4zSWuukN9zavm44Pz46KeYF8yEG8AkzqPcVlErmanBAWUhoTFjUDMEkZizUtWF0/YP3xfb2MaGD1dXv/OM/fuuv/ioMwziOrGMMNT8jZJDSqK6vBOKNfm9gbBaGsyT41hcPfvhiRycAO6NND3M0Qcahu0TXYoM2s5xaPTDkw3z0zmCpUNV+VQIJiWutiaM2o80FOoUyxjjSO9FYA51J0NWIIBvMtV7NYQeKXjQvaGPMHeRvgbPt0F20xCeeGgNfk9bqqxsb7165tDM5fzmZjrLkN7/8/qP792qlGWdzjWMmA62Xxth8DRE2zpwYpgG0HbRoiwG3TERRzdiTo+NnJ6csjhKj8yjaPz6ZNm/cLo2Gb25f/9Kbt17fXF8VLCym9Wxeao1KzygM6tqsMPrOhY2l5eWPHz0sQc0cBRG+6XlZpmkcx5HrC42VUhqcyyWfz+eW0CTN8l4vDMNK6VrVxXzOOA/TSNfKqOb7hEE4Wh71R4Ogmed0XWlLSFNyrBJC4q6oqstABiAOdiGpRtW9/oBwOhmfRVFc14oQOxoNGWPKmqaAS0Eg0KJWtQxCKkQQBOV8XlcVphQzsOFU2nAhjK5rXUVxxIjQdU05UGy5ULUGMKOZAxUMyuenx3NtXp5Nrgzy2xe3YimyQc6YYJxxv5CeT2browGjJAvDn//64+fzecFlU+q1vp7nX796+dnJyc+fvdBRKDi14/Hlav4/vfvm//I7v3354uWpUvuTiWI0zfIwDNCtQhdlTwT3P7nz419/cs/oj8/PaJoR6xdUrN3e4+6AG22Moz81g6zGHQbgeeg7QWkL08G/N6YNQGTeghKQI2c8CT0jOKahLNifdIA0UwHLAmsgqxHExu1UgYG7GttTasALz0OKzifCOPsajB3juE5DtpfxICnzxBg3CLmPOKoVrIVYR429FMiOuBbi8cH+7mS8tbrSo1yUailJta4nZW0E81IThyIJKRkjdz79VGtz7bVb52UR93p5rz/e32da4ZBNXeajbaXJrguxrcjU2R4ySnWt5kURRFFvMCzLuiynwls1MBzmva4Xk8m67aVlhFtfDaAwM+IrgXeStAvlj3SMZ3Q04Ei7sC01ivkh1DlttxkJtpv1WpuKTiu7KM+l1NehlkFDOx7NQslr5/BuqHZ/3iIw1pKOQeXRXUI8DsO4CMNuDm23uO1refFt9wPRhRAmV0Q9su/Tw9y0TFtcnHRfYlsfE59O5x83XPwj685l/Vm/9KeGtmgwsnLwYrs2i7UqplaWSnxkl/HqMoZLcOtMs9o9MfNbTBTscGey4WLEsZtSWqWj5a3r1w0jJ0endVlxF1TdzCgCGAuw7m0+UJIYYSlW35A0pTcgJKZMKkXD4MJXPtQXNqc8SHv9v/jzP/vhD37Q6+VSBAwDg+DdckqYIUldbifx9TTr1Srr9fas/rM7H98bj3maohOm8NIg8BOg1Hb7GWsN+vUQbXuMXk9yqe3T+ezEKgszhHMV8C0J9weaNtp12ohHtbQK+J82Gqco0ERxlL64jN5WLdccT06LoMFbmPnNjfUWkpyQvK6+emnrg+3tp4cHcymPx+PLFzY+fOf2wzt3jdZC8PP53EpptBMIuoEB2VnO/5J00XlkwRDaWJEmE2LvPX9+PB6vjoavX7l2fno2sWam6/P5jEl+aX31vZs33t/eXg24nBWsKufFXCOp4Pz09ZWVqxe3Hu++PC0KJgLuFCNNI1ArPRoOKW3mRQawnZSB4wxQMpvMsjQNo0DIMMszJphWenw+tsQkacK5EJJZYpXShtJ+rz8aLiVZRhgty8pa3QxcXCDbpZyXcRIBSZWA9YeotVpZHcVxfHx8whkry2o4HARRiEXIOciBy1NRlkmeMyGFkOPzMwmkfSerY5Q3gzvH/WIYNmVeKUXB7xPKKkePbEJpL81CKWdF8fLgaCPNbl3cFFIMh0tQlJqRGiGm8el5PwyGeSbD4Onu3sdPnukkLImhVfXN7etvbmx89nLnlzs7PI7k6clXhsP/87d/68O335zV9d75WWVJfzjI89wSo2H0L6fTqNb1ePoP3//Jo0r98ORIxykgz355DwaojOMYwYxtk8BxTwp+5phxxUibYoeYDXOHGJZd6lyj0RmTu8BaP2CDi4kjuTJjO5oLHuhuCgcNEtZUby2JzAXueQwoV2raAreQ9MXVhYlRF4rqLdbbZG5MCuDgP+9MSngzImhIDLQGnHx1m2gShvuz6dOXL5dGo7U0l/NiEMeMkklZKDCC9vtKMGBiTEr2+RefH5+e3Lz1ekmYiJPR0tLkYJ9XtWgmC8PaGch4IhRcQ9Od8YwYF/JjjC3KMoii/nBJVVUxm3HmoVLm8VhXZ4xD1xa4w6SVQdO2pLlf0MWAhbYRsUD3YcTlguPt9vRc25oEEdIpXB3y0VKrPKoMRaVze2xrLHXqKtpV7QWziY5N7PfEtAsj8uw1Qmj7d37ud4+I25hwISPiBeZed0QWOwZLunTGxbpPFhKjyIILpWsAnH2jZfZVsJmQ1i2rY/thPIRd3LpzvzJ2vApnEOmB0s50w+Jqu/tz74/aokXI3oU2qSmvpmWos6aCE+ahFYRYBcHgd0z+ab6wUjodLF3Yvq6IPTo8KasKOlBGicG6i7CzAMIzJ1aSpvqC0IiFjESAPFNVs1528atfOR/0dJxYLv/oj/7T/XufDQcDmA0RWbTIVodkBX0ryy4JGVsbj5bunB7/xZ1PX1oSRBESPaAqUKPAW4rTLnyWgvqzOTI03JGm35/W1U5ZPKsrBZIMAJnagDDiTHr9yQL+jJBGjr2OIS6LG1ZXzfRsgJ5NiNIahBy+lYHZonX/8T7fzmScaMOYQGidWttX9ZfX196/fv35y90JMTRN9vYPXrt29f233/riziemLPtxOh6fayaIkGDeYaDMMJ+s0O43mEtL9EERKCBrDpEo2pvPHzx6TMvqw9tvFePpyeTcBrJQ6mwyLaoqz7PbV6/evrDRN7Y54+uqKOZFUa6k0Yfb2yfT4unxkQgiDHxEwKSqqziM0iSutZZSgAEGCeAXkOLHx+fjKI0xkV4GIslSSujsfFLVVRhKhGWaYZMLU2tFiAxlbzDIkkxrU5QVrFC05JISqrVK00RwaQhlsnlCdFVlWS8Kw5OjY2ONkHIwGFDog0CIDD8poVVVUyFkCFvnsirncw6Je5ZYIZty2zQCPMDPsQyCsgAZCSRuaq0Fl+D5ZQUTWZY9e/6MK31xNFoa9JIoyvOcQEg/BCQzTvlsNiNVubGySrk4Ojn70Sd356GcW5Jr87tvvrGa93/+7MlnuzvhvPzXt279b7/1zTTPXpyeTWrV62XDYV8KAdwmG4fR4d5+fT4eBfE//tfvPNH6Owf7ZZI4M380P/PWbmDIjG/dol9VU8+Q5O9UdgTjVxgTVmtHuzQWIwLhnZrWeZ44GR5H5JH5XRpyyzGPHoZd6hxYIYwM7747OvGYQn9mTILQxlmQe6ELYjaOXeyTTVrZDOOCWNt0wPBpMu40h9sKjD8vhAf7Vc4NJQpyQFqVvhTyVJvPd58HgdxcXuLzoidFKMW4LGsckJwVpJP0h2Gw+2Ln6ZNn12+9TqKgoHR1fa04OVXjScBdogl2JM4RD5bjHT0Wp3qX+d/8VEVZBWGUj0ZVWZbzmfCRVdSF6dsWGu7QU4NZWK7gegJRS8vxmCZ0VvhtmfXuzdQTepkfmttaTzu5kPVu0gvSIP+XjqjU7lutJ754tbebWlub6ZYY0KLCrqpaQjreWjueutG6jcB2Hk7M9wmcAwu6a+w65RNeZbbAHCOdw4ldyJ/A5C7Weou0xmAdl+zVrH1/VS3tMolaxH7B38S60tjOYBglS52hDhD0UJTSvj+8Ee5AdvewmY85MX7Yc/0Uc+tb6sXyQHX2WDkDjgFhtMbqe+26pvRo/7iuK9wYQiwB4UAi4NYC+EwkJYFFtjONCHpMsphRWxbx8nDjo68dJ7HI+5Ni/h/+8D8cvtzv9QfQa8BPwpz3E9P10NrbvXyD8ojzcDD43vMnf/vFF7MgFFLgRYYIXkwbBSkQ+EBgk4uoAncRQMxyqxk/qdUJUYozA6MP61j8zgEHdLBYywVx5o4OF7C+QaVuyGqunMJFAAYRu9aVGW3dWss4egRmqrtLivOVI/vTvqk/WN/46M03j09Od8dn0TCfE7u/f/ja9tWvfvmD5w8fVWcnF5dWpkU5KysmmiPfGAa9hYEfwaE4jLU7JYJ4FPqWWN1cTBGKGWV3X7w4fLHzL955ux8n+4dHVAaFqptXVnWlTL+f37x4cbvf34hkxPnRbHp4cPj+xUtRktx9/kJDAFsYBs33Aeuj2Xy2tLTERDMD4rDVdHZc1EoBuqvKYp73e5QJozTnLE7jJE2rSs3mUyFEGIQgGHWuBLghF4L3h8MwTuq6qsoSNdfWmqqoZBgxCU8IPtDGpHme5cnR4VFd69XVZWuM0oowKrkUgaCQsjWfF3k+MsREQXh6fMRd8EhzcbTW1moksuFcJ4OwKkvCqCBNaTbN31oGQU+cc61UMSvWlwdpGMVxyKXX6oA7jeS8rqtyVqytrERxPDmffv8XH8+DYFKrt1bWPlzfCIPgew/vH+y9/N9/4zd+++3bZ6o8nk8ZF4PBYLS0BE7jkPlP5f7+wYuHD9+6evXBnc/uvtz/3sHuQRAQIZtTkVMnU/A8Bb+2g4Qxd36ApAi6JW2tQPsYwgTcODSXwS0LbeocLDUAmpecU7eOBQ9I6iVKeIyBttiffMYHoDupHJhROrQJkGeMIOQYobjAvCIL8e605ZEx7iK8ms9983BrjqWEs7bXoBrFx8x5QsJ8AmFtyvnl4BACL8MZUZx/frA/U9XltTVZ64zQPAzGVVmgHy2C9YBcW0qDMDw9Prl//97la9ezwXBs9PLGBplMq/MzKQRGPyImCQ2Q7Qyj0ezVE6dx4NPGFFURBFF/sNw8x9Op6KZIu4Cbss5yFNPz26mznRhdSCVWeGQvWZ8TZH0ivW0FxF5S6qFy1kXV4/KXefGX98PyEhjbbfitpQsOXqSL9e++8wJ8S3w74SZuP2x0KEk7dFrbFSn3HbHUcxGEHuF278oz9rqNa6vUXUDR/SzbdgGELnhy0VdWw7RVktn24nWjftvi0LY7sostittwOl9qz1SnziCa4Wbf0FYsTLzjGbCRAdY2ruexLYhNCGvFdi6FohlhkfDvTeKoqqt0uHJx+3plzcHhsYKIBeYjCzlAXMI04y9nEC9ILLCueESwAPOYUltXvQubK1/7aJ+xcDTaO9j/T//PH86Kopdn3qwXp3TDCBW1WqfsnSwfGpIEYZ1Ef3Hv7o/3dm2aMLBhxBHZ3UnrJMIQJY7IFvoVYkou/kuD+ZKWMevljM4fCundroxBCFpzihi8fBA1gMaUBr1t8cd0LrUIBRM0znWWtp57CNFyCDxB2hreGk6dZwIuD3tKfXBx68tv3Z5Pp/f3dsM0o2FUGLO3s3d5feU3P/rK8eHJ7ovdK6NhytisKOdV6dj7FI8bJIJ4raO1wvNliANz0HSXGca0FE+PDp692PnG229tDIfPd1/KMCSimfunVXE6GRtC11fX1vuDYDYfpfF4Nh/P5lcubj07PFJg1RGAURehRHBWq1oI0ctyTQxEDzUdVL8/CAI5nc05sVVVGWPSNMO7YAyRUiZZzLisa6V17aRWloRSEsBeOZPj8TiO4+WV5SRNjDazyZRRWpu6qqo4SYWUyqjmJsL77Q0GQRC+3N3LenmeZpjTgBadnHMpRFVVTWmJ4iAIBWPTyZgLQbFaEA5mLai0bm50EEhGWTGbWwg55pwZrY01sIdmQRien52lUdjPekmaSCma+d2hfhq0T+r8/HyQpMOlJaXMj37xiwmzVFe/+847qzJQRv/TL37+P7z/pd945+2X52czVQdh2O/3RqOBC4k0RLLg8ODw6cPPL6+sRoZ+/6c//8nJyT1rbBBgzUTys110uqP4tBIfa08o+EsTZwjjPheYiu8N0ghGpCCA2aJAzYs3ryBcVbA+9tU6A0r0GsBEVVfWAZIBIoR1TuKumsC2wuhWrMqd6bSz2KAO3MacTTCtxCgD6gW/HPAMxM6NM92lPsQf3OiJ1ho+bkAUgU+3cQHaBN16rBRPjo9fjM+2VlZ6nAW1HsZRUatCKTeEetv/pgZLOZ9P7t69s7q5ubK+cVoWo60todX08Fg4uhklXsdr3XHpeDV4VoL7CYL/XGtblkUQR/3RqFJ1PZ20YTbM7/QQb8DiwjAzBW8rUsvRtcLNiq1+BuFZd1/abZur7N4skbek99Zsg/0zyNVR1xd4U6+wnJEE5iZFuhg41O1hu1HY+nKOODfzqKxHjzsTxwWE0m3K4HW4lDGWM+SBvuKBQRaWuK4hoB3u3RJkW8tJfF/m1Xq7IIjrNsstnt99I9vRt6g3DPUfto4w3hKynaSs0y+3+xX/hU23xq27hm64Z8TXCfSKIXYhcgqwHLiBgLJoZeL+8tb1G8qao6MjVdXM2SRC2QPHK2Ep2l2FIPxFznNESWxoQmlTfXWVX73Y/9L7L41NRkufP3r4p3/yx4zZNE1BDshaawtOIE4/4G9kvUzpNIkOOP2zz+58MT4XaYqDp/VYi8GcEFjOULTPoRxOQxdSDEsygWpgr2jirpWFIopXgDufVYs2QEjZR+YI+vtAajphnsCPKW+YpeuiK4jPdyAue9k49jRxNl4ACTbXXVvkYmE2et/o10f9L79xkzD2qy8eyTgL0tgIMdf62fOdXpx88zd/IyLms08/4cSsZ70+46QulVI1BKlbbaHPwPnDn6aMLoxBeGg1Z1xzQobR7snpvbt3P3z91vVLW892d4IwBI4oM9ZO5uXR+TkPwpV8FGi1vDx6djL+fHfXRhJsKIhggnPGuTDN2Urn01mSpQGQhkRTTYlWari8kmVZVVVKqelkKqTMsowYzbnUpjbGSCniJGJMaGW01pCsAKYOlnIpXuzuWGOTNJZB0OsPoiguqsJoXddKVVWW5kKGFPyltVJVWQ1HS5rY8/Pz4WigtbLaGtu8sORgl8npbDqPouY9Znk2Ph/rumZIM3A7KzjotBEyULqmnKlaW2YDERBthRBK27Koenle1fXZ+MwSm8ZxHIcykFRbWEs3l0QwUWlVzMskDDfXN6ra/PxXv9ifnt9cXX336jXO6OHB4Uqef+mtN1/s7WnGwiAejobDwaBWFeccZGzk8PDg6aPHtizff+2N+7/69Y/3dn82ndRp5iQr1IXbO+dHimaJjvHEXK4DCnsNStetcblrzGk4wXyKAMhlbcc6tqQjqbgZyM1BwGjx6f4wB6MRm2DclcdmhhampdrCKhS4jcDJ96kPFudqi7EQzb1mnCmt0TiaQa4tg9eEfTBvmSmQEEWRSomoEg77fh9H3d4Uh1FlAPhxRhVNcQ7Cw+ns6dHR0mi4HAaiqgdhqI2e1tpwR+qyznSZBPAM3L1zJ+sPNy9dPJxO+6vrAWGzw0PJ3bhLWuQZKZ/OCqDzbcJWmIITQFmVQRz1+oOqrKpyJlC3hXwVJ2C1bjD0QhenaeF2QTzTvKJxOOYiJMxajbWrlE7rZB3ZzCzaU3UGxLSbP31lo/4XzPow3QUCmGepdxOmE0y1ILUj8HmWFHLNfQSl59N3GHJXVP1YIoOwxZ79ws5tglnLWfWjqNO6U6SkO2CctVOHr/CWtHxy6jtPvKasy4ZzegD7KlZNbOs75RsODxS3/aPrQKl7ReIndi/m9l1j291Ayh2KwVhLePPCbtP6TDnbCiBQKuQ8X79eW3t4dKiqGiz7YfCFtAZuqaAw+ILJRoA2k5zB7GsTSELVuh7e2M5vv/XS0v7yyq9+9cu//Ms/j+IoiqJm0gCBFMqXmbVxXW8n0fUkSWoV9/sPi/lf3vn4pTEyTjwpBGPkmxvFEXem1C9ZKbpXt3FmzqvKpfBjrjh3eydiQe5sLEW9CWk1YxToPMR3uJ433trSebd1/1zDocMFdzfB+iHYCTWwL/TrH9uZnTdFr0/t68P+V26/kfR69x4+OpvP8+VldDquKHmxt2/n84/eeuv9N26Nj45f7r1Mw2CYpKtJOhQispbWFQHyq0ueRLcshsxp0T2zzG3/m96cieNitvPkyQev3dhcWXr6YldGEYxQHPII2bQqLRerq2vT0/MwiWeGzMuaBwKF0IGUGpTNggutdaHq4XDEnEcpU6qez4vR0mi4tBQGoVL12dlZnMRREjXDJLGSC84FsK94EEjOJRcCXE2EoYZxur9/OJ3PLmxsVnVTwtMsHQ4GBrbOutbT2SyJ4ygINKQ0c8GLslgajeq6opTEUaRUjclOqtYyDBkX1hilqiiKiRBhFJ4fHYPxlBBSYv6SEBwhPmwOgkBWZSEFWFlLmaVZURVFUTDOz8/OrLVLw6E1ilgTigD1tIzRKAqsJrOyYFZfunBRcPHdf/qOCIJvvP8lXVUyCDglGxtrB+fnCoattdWV4XBIgMRrtBEi2H2x+3J3V1XFxfX1QRB9/6c//c7R4UHQvAVHrAIukteWoAuHNX6kwH0JZG00H6qOruINxC0yHrDr9jI7zAdzknkXPmOxynb2RtajhY70Z/03dCzaZn4VwEtADBSqpjvHYHAH2rRBeR6jpMuWA2Msig0ErBUAXufee49gx+yzca0fjjAfjC+SbmHaxj7aL2X9Rz8IgnGtH73cTbN0PR+ERdkLIsrptCpr4AQ4wBaqBxeCEXL37h0ZBDduvnY8L9LRMA2j6eEBt8QlhbbmDOie7Zee3bTnBbdGm7KogjAejIZFWVbzGXdhfLQjNhHndOVnVmpdqFPrGAHXpmMru+gMy5ygh1BfMI0DTu3CctS2QeTeG9HH4NmuNlpvWGo9h4p2bFY34RLamkp54VhbvzqPR9J6YbjetmvywByf+r9qbS1gSSeCmNDFpEFKyQJ/i7RhSp1maMEwkhIP43qnSbuwMV5QFy8A0h7A9tyDBdzaWVJiFAk+rw648Mc+9aXetvw3/9bZQo+DcIZjvLtIC/gtbF/cFULlGSrJABfCIsea/jTqDza3byhGjg4PtVIgOCLosAG8AgNx+s1vA0LAZpIEOPsSklMWWaKNXXnj9eD1119aMlhe+sGPfvB3f/9fenkuhbTIOvaNGzMm1+pWml4NokiZYNj/+Pjgb+7fmwRSCtEuzDtaH3QSIA1kGDOKPZ7VBuObMNIIjO+h7lJHJ2lOAcEc7IaR9fiUOT4LM7Zt6GEod7cX6jeB0RZnW8c/dpZbQA9haGOJ4hwH5XHmECNntY97LDQtsbml20ny0Vtvhr1859mz58dHLEqSONFKs0AoSl/s7p0e7l9aXvrGe+9dWFuvJ5PJ4aEq5ikl/TAcRPEwSTIuYkqk0dKYkBCpLdUGQqucmIEZTJYkWivKiObsvCiOXzz/7778gaT02d5envdrpeHYpZax2ppSmThJVTnPsowyPi8KKZurJgNpiRGiGYJ5IOq6Joz284w4w5TmqhWzIsnTKIkHg76QwfHxSRhFopmTNG8qIj7lTevDhdBKB02Z4cQaJvju7u7J6dna2jqaJWOqUpr3esMBJWwyGU9nkySOZRg5r14Ar5Msdm7PBKIDgfoGwYghZ7a5mFyKKErSrKrKuiy0MpPpJMsSRrnWChOOBWjP0ACq1joKIwB+bZok48kU5FSKUtrPcuRZCyGpQBoEIJ5cTOZTUxQXNi+EYfTLn/9sZWV5CCleStVMivO6tMB3XFtbGQx6BmlTWssg2H+5v7u7Z4xRRfnO1WuPH3z+nUcPP6tUFSXNBWBA2+Yc6mXznIPgqPlDow2qIVyfDx8H46dRnIcBxTWoo8WzH9IaXKynKcthwAWltRO++IBK5g4SBLzwGyFuBCmKxh/tFOEQ3EZzgdsWxtAzDnc0TriMzSp+GOFAYsKAZoy40ZZ6E0oEsKG3Ni7oEAMkrLeFh6nQiV1xJY5MAmop5n2hdhnPW8ZYyfjDgz3O+cbySlDUueRS8vF8rlCmiAMlHCEcWsMHD+7XVX3rjTdOiiLqD7IoHh+8ZFaLNgPUEs0cBN2i4sR4gBZaMwLHQlmWQRj3+v1qXoA+mHtJE5yhDM1j/FISEDaiDbFtHAvWyAUP6FfKha8HxFtS+eqGnAC9YG7AyILYqO0aOs9lv0FYMPuii0NFV8NaxJUuKJUW/CARoGi9Q2n70gsYsP8NTsBxVzbdVpp0i1SvG2LtN3Y+wdbDH2234vhpbUNE2AKt3Nf1zuaDthXb+Za5DsYhHczvCLzzIEoEcAbE/K5uK+0MSzuLD0xrwYOYth0ppQvhG8Q69qD/XhScLJnWKu4PNq5tK0oPmupbY8vJLeVgJATp+oTbphIH1jbVl1HJWEBIYkjKeAjH4fq7b9Hr2wfG9peX/u4f/u57//Sd/nDYjB9eMYsfJW7UwNg38/wCl6ElfNj//s6Tv3/yWIeRgIhTvFZAGYPRt41vRFtC7MWhPdC4oHKyXJRGiKY7B+y3xZ9xcYsULfTZ4cAObZ50jiwnF/OJiIMh4FCPJEzvy9peRJcU5q48xYMP1zxIxmesw0jcsrmpizY3Zouzr9y6Fa+ujA8PH+/vF8b28l4QyOZLjZVxfFwUXzx+qmfF9ZWVj16/vn35Qpzmp7NpXWtVlLyqM2OG1Iw4H0g5knLAeUxZREjCaMJYYC23mlvDKQ0Ykdagm8bJ6dnxzu6//q1vnp4ejyfTJM2Ms1ygQgSwWoCIIa2EYGEYVLUijDaTo5Rw/DWHjWB8PhmHQRDHCVACmye5rquymMdp3LxCkqVJWhaVlAFcHw4DH6zVUDUEt9ZYbXRzhQ8ODqaTaZpmw+EAxLvSPdFC5nkvTZP5fDYZT6IoDMKQecSvqeVwzzWgQeD90EyW1JowDAijZVFKLokQSZbOJ2NO2Xg62T84EEzk/Z7gsqwqLpt5GFIUZVXVTbchmwLJKY+jZDwZyzDglEpoijljQRDAfEcCIYIg5ELMJjNdqdW1tSyJvvj8XphnhPI4CAmjFbEKntiVpdHa8nLzbonRygrGT05Pnz57rrSal/NB2r88XP7Rj3/63dOzkyAETJmjBhdJ9XhCgEebC1AChwdgZbQK4abbo6Q7jIlxzr3MlUxgEjVXbDrdioKba+uHpyfNjI9MPpew6axGUbNrWyaMd5vBOQpWcBw6UkMdkdaLXJyfg0G9p18k48viD+SZNs5tknXewUC0AnqXWeBvwfv1x5tzyaUYG9yu0NyWynagIBpcUyvkF4f7s2p+ZXU9qnVGWCaDCUjfKBewMSLU+zDIUD58+OhsMr59+/akrkWa99N0drDPIXkQpl53/DKnL+wifB0E6VF0o3VZFmEU5f1eUZR1MRfAh0PhF3GGJG3B8GioP028pxnBwuStpRxyjf7SiKL7Sd5TmzA83hKXt+PBYuevSLpwfIeJOES5rc7tvN1tiv35Rdr52doWs25dSkjnsuxTgjtNUYdh+4bFMpiALW1hRuqZ6i4VgjmRXIstd2XTthIrx3umjk5uF1gy8E2Nyz+2fr1M25+I0s5ty9diF8fk7Dq8dZh3XbfeC5NRH8vvsSbc8Bi/36XQ1TvDEnhrzDEZXT/E3WyH4HvzMpXSYW+4cW3bMHp0eGxqhdli+NFnlghQ0gjLINmXBIxHjIaMhYYkEKofKk0EX/vgHX3p0rE2vdHo29/+m1/89GdLowGjgrUEISQkKL1M6Nv93jJlIaO2l/2Xhw9+vLvH0pRzDM12WaGgAQDaB26T/GIfd58aKCGOgOCSRY2zK8BVGEicYLcLvBuOb7z5auNXGgxJy4QIztzmGHa9rV7J9VqgwtRugMawGTARg1+hLwb14TDWS399MCLh8AxwYvuUbnD64Ruv91dWy/PT+8+eFZTVqh4MB5DQTK0hMohsIF5Opvtnp8TSzeHgS1cuvXftqgzDIM+WloZJEkVhGEoZMBtxFnEWc9pjLLW2R2lqVGJ0j/GckETBucNZzoUyaufo8OTo8KO33955uc8DSZRpTj3hPnzKaBnINGumRikll7yoai5YlEQcsVAAookxqla9vMe5UERbS6QMVV0ba6I4BVsMIoMArcCMUgQE5WjRAKAl0kqpEJwx/ujRoyiOppPJyuoSczAG1Vh4IN2h1+uVZXV+dlqrKgybL8IntzYang8DuyemamWtrsqSEirDgFFeV0UYx0GSaqWq2azf63MhX+zuPnz4OM3y0fJIVaquVDPfQyWyqtIKnc8oD3hdq2I2j6JmWMdwJ41YkQCCDoyJ83Je1tVo0O+n2aNnz0rafOvmiONEA6ErC8OtC5uMc8qYUoo210M9fvy8VIowY2r91tXt+Xjy7V/84pNa1UEEiYeAS8CAxZjXOVPGIdSSeLpL8/IET0TTKiDQ7NG2yaZefsGJDahQ08lrSfZ7l69+9nL/aVlxgbZrbc4LZPkjGRmJ426fh/69uKGDgugF93DC4HSAtwtyH1wKjg/dh/K/4NmPMLrBqgYB2wqwbmfDxGir2iXwz5irUu5ghLRJhEyNdTiyQwltC1Q2X4U9TBDsnJ8dTScX19ZSbWJCe5GcVtXc4fa0/b6EsiiKdp49Ozo+ev32mzOlWJwM83y2f0BU7eTX7jy3i8aErl1H3yJg11FOFbAIwzhOe3lVlnVROtEC8dQjv1k2aBTqYirRN7T9uejCXsyBrtYzYqyxflzGywCppmgiRNpsC4JhaC5k3I1rxkO/zv3aFxNLyT9jFXsz7AXasGMnWdJaZTiBmSfU+WYJ/+P/nFAFLyXcG2k53VDLu0bOCUDdee+WxbZ1T8Py7DLvUPfu7khrjGFdcqxtNy0Qvk3bKc0H+aMDq7Okbvok61pQNGBzPYhXoTnVlQVCDpqlIaTP2h+SOSadI7EjCu/DNixzgj9YGsMisFY6zHvrV68oS84Ojk1VA3HC0cIYMCe5I1FbCcLfwILdlbERoSklkdI64Ovvv1eurZ1Yk/T7f/WXf3nv3p3l0dB2aykXVs9qvUbJrV5vYG0UsLEM//bux19MxiLPwe6YKt0K/H1QFz5azuTFuaUhCIY7LuOyoazRFmNKQRPBYGiDbUpTxsF0Hs8r6CqYQNY0ImZMW2dDRuCMYYRpgNoIXlLr6I6LygLI5mSOEYjKbaCRIBjlSIfNLK7BGAuOKBAYT6uSEDvo9ZMgmBNycnrW750Nej3C4Tk21PJI9NNpXf1q/+jRyclmlm6tLP/OO29v7O3tTuc0DGQQaK1wI17VlTbNVF/XFUbn1k05pLWuq7qUIgxCyZyyn57s7f3193+UZT0ynSVJTKyihlNQ3QgpaqKJplEvZ1VFYV6FS8Bw7Yeuv0zISukXu/tbFy+gky40Lnx8NmaMLy2vFIXmGENsm4omkJwMT7C2upndGCeG1qqOIl6W5VKeK63u33tw+/bbVTV3bCC4eGVZcc43L148Pzs7OTg40Wd5Pw/DkGta1XVzB8HfCqIJjOBMazObF4VSeZoJIWenJ0LKfLRUTaemUlmSvnbz+qPHT7//wx9eunjxjTdfTwJZzGeYJFHTGsFCoHXpfj+fz6ZGKRlFyijoM5BwQHggmsdJ0CCIJmQ6nUyPz07HtY7zVFCpdG2Mbg5/wTY3NwAxtsW8IMSEYfxs50XZ3K+miQkJ7wXhT+/efVQ1nY7gQLSA6q6U0loZQqqyMkYBkm+0MVw61zAQGjXDFji8UIwcAc80jgXQaE0dOwAcRM9Ov760/I0r25/u7Dw5P6NJbAzAy5R4Sq77cEGasqGMW/TW4oQZZmqFfpNIfUC9sQHvMEyc8wp4kMVZHNoBf+bQkoKPNxXQQzhoCo3NLSfCMISmuPYwFuiAuULFMfhTUeC7g0sp5ZYmRoeBPKu1dtm+XFtFvNmsP9Ob34uod/9sPP7k49+9cXOTs1Gl3syyzyaT/VpxwbU3uECiar/f+/zB/T8vi9/7/d+fUaKXl1fe+9L+L38elAWREmMgraeQG2oFfLGGzZ7xiQzaUkFlrdTR0fFwaTDa3Dp4+lzNzwQQ1sFV01gPoLEFy3eKltGOpNVcKScU8dm6cBoaB8ixtkK6YBXn6+fDj+DYo7SzDfckaSgCUDh060GNzYvtqFIwR+MU7iSzLmnOBUZ5QldLW1rctFLaDtP+0HYYvTu6uQhC6qLZEbVgzkjEQ7Vuo99uyom3NCPedMrlT3oOs8MUmN84W7ogI/ZT/QJS4zbrnV8YVtqW5Ez9keleyoVpeJ0482vghSQltNFyvledVps6FhFSrqzXFsD9VtoGaXrh2jXD2MnJaV3VHOFpYpmB0gtsZwaxvgFlktqAkICxyJLEkoyzQCsTyI0P358tr5xzEWe9v/iLP3/w4N5wOMR+hnden5bXaksEr/f7Pa2TND3k7K8+/fTxrJBpij2dW/PAteLtu6MemwB7fetZa22MMQbBOJKZ2zgSp1hnLjYekS3s6Bk6gFAcYTFEzaLZBS5OjPWPq0ERExwBUH2Jq9GoSgL/Qu+yh/8eaKLcdmlgTkiHA3xC2Ejr7bWVyzduhEHw9PnO3tmJlXI2m48GIzBfVBC1AAcO5TQKCkv2Ts93Tk7Kuh72B1zwcTE3Rge8OYuDIAikyOI0DoMkjqMoStIoS9MsSfq9fHnYz6M4liISIg3CmIvhcKQYOzg6jsBd0hgC1QJ+0GbKb07//0bWe//alt33Yavudvq5vb3e35s3hRyKsmjSkhMHdhRHDuIokQMkCBAgf0J+yR9iJzCCJAaCQOwUxSaJzZQoc4bkDKe8mdfr7ffUXVcJ9ve71j5nkoEAzRved++5u6xv+bQIMGlC6wEUmKtECIk9CJccTTXKqiCEdtptU/+jIR5ZFFnOqIhaET7hhlghg/qjygADoxARBJKOxhTh+w8fKq1v37713vu/3dzakkKCHJQrowDvR9aPjZIkbiVpmlHGZBAIyQNRD6nKaCGQ/c3g3yVjTJUqy1KgK9c/tNXrGGPyLMUIn5WV1X6//+FHH99/+GB7a7vTqSd+FJQbigsVAkzn+qbmaY6c4LrMCS6DkBMmuGCSBzKa59lsNoujIK/Kp0eHURxDhLMgkB27MuivDgeG2CzLrbJxHIxGk/3D41JVqtJVUW2vrg/D6K9/9c476UwniTIky1M1GrPJNE5n68ZcCOStfvd2r/tat3un19tmrFMWYZ6r+byqK7PSFIcvh6Zx5gSzxtSfkjBeVZWdTtfz7F99/gt/cO7iw4cPfjE6ORPC+hMEO3dg83B//MLhCxI/TBCJK7UaJalRxHfBxK95cRq1UIPAORwLMRA1PU3apRQ6yjRkkVGXzIDsVIwg88wwb4q4tN12/nuekhNp+0bSWW93DrKZ9g4lnDUIEQXaoDvOiTU8CEZl8fz4aHUwWA0jUZT9VqtUaqZK4gdxPz/bIAwOjw5fvHh+/eZNLWXF2MpwkJ8e87JCHlyz+WzcFJzaiHh6EGiHGWVG6aIsZRR3uoMiz3RV8MYVpHGG9CkMBHcH+C2xJ/J742ZPsUx7clgsxt05uy+0orLe97IhfRG7qGh2wT61y/wn5m0tFkzgxqVjYbZIF+6juBm3/l9clbPLq5fGiosuCX+A+yZlbP23dCH4fhnRnPboIQOfji3I1/4HOSx2geziec+bjXijR6JLpOcFN8sxsN2QBNdxsSYA4QQln9VkLdwwabPEdpHNzN0o42jDbmfPfK2qrxF3TjUoUiKYZC6SeOfyVSLk2WhcliWnaHpsm+gkASsRQUhEmSQ2pDRi4PNsSItTaZSVYvMLn5sNhlMuozj+5je//uzR436vC3M2ZwuygAkqtRfI651OolTUbr+siu98+OGRsUEcMU8+RkLykssTQn046TLs1evrysHp1brZnmGwMy4ejHXe79YHfeAtdHxEODWwNUTlJLJcMA3Nc4rRY8dCuBt8EovkL+z066OHc0B74YYApQNpMgK/rTXea9cSH8eGTacwep3TC93erbs3KaPp8ejhs5c2jvO8qLReW11jGPzHmQU4o/75nMs4pq1kovXxaFS/a1IaKBKcsaIsUCRbVapSmglWKYyEoVabqlCqrMBtUZRFqZUyqoqTmAHNqgNrZJC0asalUoYDo8eoylIi4wDowxJ7cIZLdySvMs4ky7KUENtud4zVUkqw8q4rVhiFQnJQVhN0a6rLef0IWgYsQ7TqhA0S+fT+/awo7ty+Nc/SB/cfXL9xQysFbxDs+3n91/EQYJx0uu2qrPD1g4w92ohGrdFgnqoZtAvG6rKqjKFCMCZlnLTmk4kBuyVC6vlya3eryMsf//TnURRvbW+XRY6vlNGGS6aVpoTKSJSVyvJMBoHBDSTlYRBYSoIwlDxIi6wsC63NyeisUAaeXG6MVUaFcbC3u8Uoz8ucUdpttcqifPZif5LO699NGWrJdm84mU2//8H7D9JMTSadPL/W6vzh5Sv/4gtv/9k/+oP/7itf+dPf/+KfvPH6H9+580+uXf3Kpcv/+Pr1P7p2/cs3rr59+fLVza1VzhOjeJ7yIqN5arKCKG2VIkqRqrDpXMwne1HwT2/f/l/+9E93Lf3V7z781Wz6sMqtCKFmaaRm4ilqkBnLiTNz9fENxtrzhN3e2vr07MwwR1GFUxdIXdQBdt5rikJIqUHeBnSi6B8A3kEOQnYvMSiVqcNr4J0jkH64vE12Mit8r9Gz2uqE0pvtblGWz8rc4KDGGgNnb7/rQVZ4lQ0Xck7s46PDXru13mmLLOuFobZkXlW2UUEzA3b4JIjCs9PR48dPrl6/ToIgp2R1ZTU7OrJFKYW7ON750UUrGn8yN8c/bOGYtlqpMkySVruTpXOtK8EZdXihE1jj+eWWuAu40sPeroC4M9LxezGSjLrq62cW51mLc67fBTQcIPP/aW88uddHw/k/fga8JYY0RChCl/6tKWOL/fLSP3a5znlGlrfzIoTLMFr4U7pj3TuXu+6kkQd5sVxjdOXTmhecaP//l0B5x/WmTXohWzhUN1JhoNjWxYkTH4XtbCgxa9uitsrbnnoBjkfbG+sFKMNOidxM88ytcQ1+vc/oIsio0tbyMNq+eJmF4cnJqB4CXEISODxDyRPQFddTL2UBpWB0xUJiW5a0GBdGUSk33/7cdLiSikDG4Te+/vXnz572+wNn4IX5s3V7Y4JKX4zCa0kclrrd696fjb718UdzztH0APdRLqvWreaNXXSJHsrA3n6JfufIED4pc0Hrg/0LHA1m0emgya2xnDpkwjbqLWfCDf0jXxgvO+AfuVnogosdDwBy9RhHmDPYbTh9buTniGPjOgFNpzklktANGawS8tbrtykVsqg+evgwk4IxNprM2q24E0dwikkU8ob1BAmnHadBIHkUMlnXRSmD+mcIiNVjDEKsqJBCCBGKgIFheP0HRgUTFMJd4YoZwblWRkrJiA1lICW3XgZRPyrGhZ1BUkLI6qbOBEGorS5VVX81Fy6YFiCoPMs5p+12G6VdltSj8Hw6lWEYBKElhhp3GMFjaHGPCDONoJRKIR89fjqbzC6cO797bu/Xv/mNMWZnZxtUQLS+KAS3DgbmCcWB/WTrZkdro+t3hqEBMTf1+Cswt8LAZlzULYUq8twa0u71KaV5OuNCWmJacWs8Hu/s7gyGqz/+yc/KvDx//gKlrMqL+kMK1pj4ci7m89S5VVsSBZJL4cIMhCzKIs8rZewsyy2jYRBKIYCvZjbWNtrtdp4X2pg4TgIp9w+OT8cTyAciWV4IwWSl3/n0k5/ev7/a7/+z1+/891/+0p/93u/90a0bVzdWupKLerYlVVFopTH4LJayl8Q73e6Ntc0v7p7/jy5f+aOLF75y+fKXLpy/PVw91+kNAzlgwXoUXu33v3zp0p998e3/+V/+l//qn/3xh7/45Y//wzsfFfm784kOQy8vdkixrcdl6vI9nBbAEwgZ5Vn2x9dvqOnsvfGIh5I5GyrjgVmXu4oED2xwHb3aa4El5wjmcMqNxXhrggnVzgnPk00JAsbGgLUEUFCM4YRBx4xAE5KribL6VZFP/CIUPEexYjkDLceaBkt2rQ0DlXhuzf3jwyQI9/oDlhaDIDCMzitlfGaKE/AQG0gxGo/vP3h49dqNoJXMrV1ZXatOTm1eQO/o7DKaJD43WMJL5reuULtY/dOrUketVthK0tnMGMW87y8s7IwP2VkygjDWU3NxwmpsNzzxqpnLvB8jcZ4EaJjgIgrNUmKCCz7y3c2CJOztp7w2Z+lg9YJ02uiSFkwttlyKF3ZSbKlY20W2HyPLlZIK54pVd+Ru6d3k+lJMxsXnytPtvODKEMvsUriiWZhY+Q1Akx3s/b7sQnbk+wLj2d2w63E4R7Prdh0fweUxzGvNfO87HxfcS/3iBER/AAQa8JZiflPiwngMMhUs3BOmraEi3Lx4icXRyfGozEuwv7fUwcaoyidAvKqvkCREkLoMS2tjy0LQExAZrL/95nQ4nNfnovzGV//81atX/X4fYEjWmFUxbQOlL8TR5SgKKhv3ur85Pf6bh/dVIIUM3HoEHOnwVdTgkmMUmrpziAg3BKWOGuLVgWgGLvKeVke9/TxphBiEOl9t5oKytaGQImCtVVgDKPUxwk5p5KzqDdHoP0d9ATfOe4NqwMQcVRp22AQ8MUAVSXV9rlikjCnjWlvcvHFHl8mNKkl0eHI6enU4PLc3XBusDron01TEkZDy8bPng1u3OCNaKQF77ErlQkj05DM+wAxvfl1EKQkk0VpTIQPh+0jKlBXUAN1cVvU91xZ8rJI8zcoyl5QD1BhqbSD+yTLPXazqcdOEQUiJAqdJHkdxnmdJFBFC62/CfB6Hk6azs+NRKKI4ibWtOJek/ltscjaWImAguwRjYUmoZkxqrTA5wVqjrApZyLmYTibjs7Nuv/ulf/ilv/j2d7Y2Nvr9flXkVlDILIKDURvKeKUUpTSIwqoqrTLOl0zVEycDv1JwLQWnYKJxfaK0Gh0fcUEHq8PpJDSVwvZifXXtwePHd994PU7C73//B6Pp+Pe/8Ha7leTZnIDXl63fI54kSb/fG00mGuCKXBlJEZqpj0XO65LvDNLABqpUlVY6juNup1cqraxptdqc8fF0dnB8DHbiYjKbpFlaVGJyPHp1fPzPf+8LX3zttZVex2j15Oz045fPDYBz2hgBipkojBg1XBMBnPVYhrEQIWEhY/0wWe8NBGflhVJTlhqdK8VDHoVBu9sd7OzqvPh3/+Z/+/D+w0+s+cXpsU5iZ2IAJBJ0tMGXon5HBEVEBfkKllFTlq9J+XuXL/7bv/orUCQ4CkZ9ZxewofXLN2ihjXYcaXgzOaFQ/7ixBmgWGOaiDYYTGA0bJ67qLsMAzQJeV/BhlMYwYgskaRP8nNoSWhDyMM+JFyVbSpRzstMgh+J1a1x/pa1vJeJNcJILLjRlP3ryONf6C+tbdDq7KsIwog/yLGPY8EAjAJWw027NppOvf+3/+ZN/8V9Eve4JsSuf+9zxu++Y6TSGV5IS7fXTdc0tqXGUEedliyIswqkoy3I8GveH/dXdvaNnT0ylGDJhPUTreXNWWwPSR3TN8tUEDjruZbMGHUKQzuwQWpdRQAnRFFdLtEEAmM8MBs8T4kuBpzRZshzB67N7ccpkboFdf08Y51xcsUuRo81ftI5c7SKdm7h+15k4uzMf1G65kCFdEhn5IYct89iR3Q9uScQzpSlZGG/4EupWBWjZ6nTPdLE/buZwP0e7VYJFY5Mlz1C7xFt0pYMZ0izF/SjfGPo4T3NHE4OkBPT78Q7GxMfmY0oZcP3ru2sM5ZvnLwTtzuhsWmQ5E97jkmLKAkXRkbQA/RISwv45sDamNKE8NNoGcv3zb077g7kImOTf+NpXjw8O+/0e8YRnjispYxOtr7Ti82EQKhv1e3+3//InTx7aKBZSCiDkgJeAcQ4pzVMDvypDl3nu7OcNRdt3P7VCNh8a2yKdHONdvRSN4eLLJzTW3wCdgxBVQrNb68MMrNaCCajylZfbUfe8GItyHeJ7UA87ARnb2IasjlTSuh6DehLfQYGaKQAylDYrQsbz9Nr53fWdLW7tdJo+ebVPo5BRVpRVVuarwwFyjjkkr8sgcIWNMSGlUloKjI/l9XnEiJQCzJDrJ0iGgTVEMB6IujKHIhC8novjOAmDIA5kJ2l3220uGVgrt6UQMhStdkuGIZcsisNWqxXGEeMsjqM4jju9bn/Qj1tJp9sBGTQ1Vmul6mm47gkM52IyHlNOoyjSxhilg6CeAjPo6iTYT3KQfiqjACkUuFvSpoii+OmLl/sHB3vb2+1ur9/vKq1/8bd/d/v2HUqp1hV6iGI7XrdrEAdU32JoU+tvojUz9TEvWD3Zww+q21RjNee80ibgQgiazudhEEkZFHkWCFkWBUqKnz579oU/+AdBGPzug9+9fLU/6PVacaKhzyDQFILTC83SFAkrQLEWgYiSMLbUFGk2n80Z51VZIQUeajMddLp1LU9TLoL6QjH69NnT0/FEcJmV+dl0agwt8rLd7Vy/fu3CzpYu8tPR6Gw2LYgugPCmOKu0KbUpOZ3ralaWk6qcWTsqisNsdqqrw3x+kM9PyuLlePRqcjaap6lWs7IoVHn2at9U5d75c6ej0f/+b/7t04Ojj4z++eGBxcxj6txpDIFO3e8f6/oIdqrow8oAyo7S+f90941BHH37k09m2C478gM8bmCAxTiGC6JRXZPZykD45JpFa5yBAWsgPcdtrL+XtopRn3ttrMvd0+pmEN7q9g/zrGziAHE16IxzqfVOSIgBW+/OaMAdr4mDpRh6aJFkz4zgT05OS2svrK4Fed5mXAg2LarKMgzgxznOUBMEQZ5mn37yyaVLl8N2e6b0yupadnbKy7w+EECE7KU+oFJizokTrUdwOQ6KZ6LqzswkrY4MZDabkSWSEOb5kmYLjMIxbzTp5kC/k6ZeStRYRjE/0npwFL8Sqc6MNraJeDw5vNZQryjxHiGL7CHPYnMYmi88zH0X+5lts9v1NnWQkgYLd5vwJqd+IUE2nIcxri1xvGZLxQ1rIE6+PtvfNlYQjovmRGw+IrnZkzrQ0UnCLFnIrahLU6dkQdsyvnj77YU3VUKu+NJlRdaV95T28iEkLzK3JXDTKzIikazmOO9u/42W5raydGPvfGvYH01maTpnrPFfwURCKuCzCspE3RPTkLKI0YAA55mxUCsaB1ufe2PS7acyYlJ842tfOz467PW6SJhwkQ9AFWxpc60d7woZaBMOej999ujvXj4jSUtAEKvrYbUGqJV4LS46Y1hnM08c0Q9gUddSELYwx26wC7zynLoAH6ub4xhquWDQdDshmw8IRCo1BrnVs7Bx/kH4vZ3GA88nvFALThbAvxi2jytWMPnCMCX3GerP4+TF9bfG3XqPsYE1gzi6eeea1TYR8sH9h3MBi2LKJ7NpEESrg4FSClPrXeZ/fX3qohJA3wJ32Aop6jKPCQZGB4Gkpq5w+Ghx9OpkDFJX6wskOZXAXwpkGEWhFDyJkyiOZP3nMEmSXq+ftFthknS7vaT+Jw6isNVqJ+3WYDjY3trZ2NhodzsS7LGqop7x8EcUaSaklEGotDbGCsjiLYsyCAPMWsYuUekKQ6iQjUUZPTw8fvrs6frKyurGGmPs8sVL9x/c/+STT27duaPKUoPbM3h/GYrhQchshx5NCI7OhQSTkr17IqLjQgBwy1w3OJ/NJZho1lNRfTd5u93af/kqL8ovfeXL8+nsxbNnrw4POWUrgz5YeVr41bgUoTY6z3N8mUMZgkUJY7ye6sbTuVYabxaA0vVlH/b7sJWycRxzSosif/joqTFWWXs8OqWUxVHU7/eGg56xZp5lFYSicM7ri6eVMvW8H0Vw8TvtuJ3ESTuKkzCJWRAGccSCUHNeUVoQmxmbGTPR+sV8/nI+ffHqVSsIP/fWW8dp9n/9n//uMCt/PZn88vhQt1vE4UGQZmgs0BsoUBociueU+uAvXfe+pyf/2c7W//AH/+A3L1587/FjE4ZovmZgT4z7HetzwIhtQmnQOoO4QEPjIgvZUm42sT6srX4tNLpPo3s7WmaCu5bejaKOkE/zvKQYqGuXzBzqV0B4uMQRUX1eEGqcGv9RHMfx9GUI0Qn5fHSaVcX5rc2gKluEBTyYVaVCXdUSDikDkeXZ/U8/vXzlatztpkqtra5lp8cUd9HO7oiiZTyKQP2p3IQvO8gSujTS6vaF4Ol8yrxuBeNJ3JczX4lZI4GlLqTderFOE1TqnKqa/+R0re4vYA6+V3HhLhvHZUwPXuiBm1B+L+RxFCpU+rvjsGE6YeVlTYRCg3w7kzE3kFt/Rjf5wA6+ro8mDOSnC3dtu8R+dtGVjCzbZ/jbRxp2VUO1djlaywCyXcpibOjZrhtwyLjhdsnWhC4Ys+4rHU2aNNP80i/uUn7d3h8eV2oaarRTpHNPXWd49eFvVsSu7uz1N9cn09lsNuPoUlxXEkguqMdyy53ciIbgsxFAuG9kWYvQUBsWhWtvvVlX3yAQUnz9639+enLc7ffdvA0TAIgWdbdS19vJNhehoWzQ/8mj+786PGStlqgPR9FQ3hvMwEFSEEDLkRtVT5PgwgNUC+4i9/29xNET6DwW9C0uGQ0wV3yIXGKM54o7Kz53z3yEFEJNQmhikOrgdyOoNEdny/qoYoQ1ojMOMfKAShvmtL9gq8OcXRfuNAR04lBAMUeFBlW1nbRNlr391uuM0FYQv3z16kWa8rD+hjKQo/Gs2+3GSai1EYKh8hgwSPAkAr2bkBDtZ63gEtvOIAgIJJzjmyPAggrYvC66Fao1pq3SIAg9Bd8tYVxUTH14Cg5YKwcPDjD2opB4r4jWVLBOp7u6trq+tjEY9LmUWZZVpRJCFGXJKYvCxNp60OecChgNozCk/khmggOAqFHBL4WcTOf37n0y7NXjeK83KIvi2tUrf/vLXx4eHb5257WiKJQqIQSBwv6ZcO5SOIWQRish64uAzLj6gmhYPHCEmagQLtbMQHSPVpWUIZQEbrXW2siAP7r/YHVr69btW0f7+5PJdDSaWEo319a00VhihQwZE7PpFLIIrRA8jiPKqZBhVVaz6UxrU4CurO6XKA1k2O31Kq2DEBjqnL3aPzw5GREwm8vyvNtq97ptKXENAPOO1lppKUQUhXGS9Af94XDY7XXb7VarlSRJFAVREMg4DqMwiMKwbqR44Cq+JXmlJllWwKe5sbX1T/7oyw/uP/i///wbR4T/7OWL32YzBgkZTRKURRmjGxCZ697rC8eQYFg/B2ejf3ph73/8/d/rEP4X9z55ZzKlUsCD4FB8jxE7g0wn2HApwC71HM6C+n2mzFsOQ0Kw3x473zoHE1JMPETPdkYZz7R+kWZz6LyxNYDWE9MACUoC63aP1m8ZPOPGQV+kvqRuajLaWVk1u05s1gP5ajYZzWfnN7fCsootiQM5Keoi6WuZ8+iSQpZl+en9Ty9cuhwlrZnRw5XV7PiYVJmA9QxdZhg7VRC1tEl8IoiHMUrLqrKEttpdRmg2n3Ff/JzY2+tunNVBM2Q2uhg/nTYsLV9iWMNPIovtnftPrqqwReC9c9MnrKluCz2QL5NOHL1Y9dolTc/y0L0gZnsNseN/LX1tM55bBA15IKNlewxv5emLLA7HtlEFYWVz+s9FRNJivUy8dyUyw5EV3vCklwVOzkIONVq08cKkTYYEbYZ453qCsitDmznbTdsLuSRBwxvugrzAXw3DLdyMbnC7U2kz2Noe7GzP5ulkPGFNvgKIZ1G+zYF7hXU3IDQiLCYWwn1ZYEwQBuuff2Pc7eX1AS2/+rU/Pz0+7vd7BEPK/aPEtO5qdavT3mIioIz2e3/z8N6vT05knAjGYSCDT4liHkYBHELesWkWHYwtsrHBDBa9Z3GxQjFcvVnB+AkY4UltXHQC0oWaEu9RBMDvvOQbpa7+6vtEbIdwOXcV4hUIvsVxrlna+tAFJ/+nBCLvoIHw/mNoZMjclo7Qotzq9rKz6d2rV4aDIeWyKNUnT5+yOMS1kiH69PRkdW2QxAnU4IAxSQBwwmyJenBHBw0Luz0g8EkmJJNlUR0cHfa7PaLr/rSuUjBogMYUCavolSCwB9bKpEVeliovilmWztJsNp+ls9lkMs6LsqwgRJ8xCd0Gr2dvoasKaC8sabdW11ZX19fjJFZKpfMsBfFPFEXGasxIrue/NKtHeSG0VYJJS0z9feD2WUOKUn340Uf9bjcKwq3tbSEFoeTihYs///nPJtPZzRs3VVGCilo4ZESKuts0CtYQlkHws7aKEw4Gk2gdzMCAuoSUHS7QTo0yrbTRoGQ3FRc8r8pOnMwn84Ojw1t3X19dW3/x5NEsy8aTiVZqc3PdGA1icRtImaZ5lpeEMmN0kiRhEEgqijwbjycVcJqlEAIKWLvTiuOWUkpKyRitKvXg4ePCaEpZkedRFPU6XYLBFDDJt+Ok1+4MVwaDlX5v0Gv32lEQBvB3jVH1LwdUTVjgW8kFE8wAyDpL09k8nc5maVFqrVmafvHatd//3Ft/9dc//vZPfv7Y6B8+ffqCEh4FpAFJDHHeQMxlsiDn2VJXUxnntKqCyeRPbl39b9+8e25jazxJv/ne7x5Sy4VPdHCEE+sk8pSBHUtzyrnDG41XvPyoORwRGcZzFCQJSKZY6o+599HNic0IRqe5xHlKPxPz5xwlXCqxJT4ywL+nTYovtOl1eUbGrdtPUiH3Z/PT8eTS9mZiTFjX4HBalBVrXJVxu26FlGWR37//yYUrl6NWJzN2uLJanBzTsoQ1jPUIol/DNO556NMEvDTogGhVFoTRbm9ADCnmM+F0Jy7khVq/IXVuS86ApFHYOl6V/3G02Qcz9/Pd3pZgi4NeJ8Tvm70TlzegWnLcIA0c66z6HXjLKG1SKl3SPF1W/JLGiNv6yB83VFOX5Lgo7f5/IlwEEXE+bY33CBpFGaSV1z1C89tRP6vRRV9Bm9XyItKILi3iG3dhf7i7r4fDAJcHzfhOPYe+mfObiuFdQdAFBthVTVYxaRTFrlAZhJ8NpZY7Sp9tEIJK6d7G5srOXp5Xo7MRAYoKIC6UQ92uj2lKAlbPvhJcDENKIkJDQxJGY2u5FOtvvj4ZDlMRcim/9rWvnh4d9wc932mAaAZcG7pK3+x0N5gICDXd+Af3731wdhYksahHX+4uDUC6gjucH0XA+Oxg3C6aIgEiwwCTI8SaVhAwQkrjbi1yMjGO3mivBXCGldDmaPDw49xR1prODA3tDDRkDGwpF6kiDNULvn1s8i5oo1MEkTLhGNHuVMIuZ8l71hCYmJHF6Ox5oYIyq9R2r59k6bnV/rkrV5SqOnHy4tHjKYxpuFhWWqdZtrm5xWVdt3D7KoQA/6tQ1oe9FIyBUQEVQIxQVQnCD/Ho2dN+txsHodGVIfX5XQ/BELeChGo4gzQF9VFde+sPapWqsHOBea6sQH4zm05m83k6m43Ho3mRQh5cXfcZZ9ooVSldqSAUvX57fX2z1ekaQ9LptMhLKaQIhPPTr4uWlVEgAmeNQmj9o8HFTFDO33v//ZVez1gzWFlrdxKlqigIdvfO/eBHfz2dTW/cuFbPdqqEBT9aQLi7ArOXMtZKIesybBSgsGA1XD9dRLIAdyvaKmDIcUD6JTzvuq7ixkZR+PDBp93BYGvvXCtqPX70kBBydHIspdxYX4eOkEkpKbXz2dSAIq3XaQfw2xlCJpN6ajLGKXA45ytrq0IKTGfiVIzH05cH+3W9rXSnlYC0ur7kkou1wWB9bbi2Oux0W2EkKeHo+gYfTleV4kIyy5C5xAGqzFQ1z/Tp6dnJ8ck8TQEzNVWedxn7yhtvnlvb+sZ3//Kn7334flH8/OAgiyKKdlcoZPGezLiPYA7KxQgRxsHgwmb5LjH/9Rt3/+PXbnFKLmxtv/PJve/ff3AsJYSgerzM+NUrwgnwSgOEAtwP7ZSxlnrCngMQvdrTOF6qgefQGx8tnP4sHibwyZRR+BGNBrNWd6azgAuCqkAcPhuNssdX8TzBMG6NqzOLQgvi9+5UyOA4zY4m4/Obmy1NoroGi2lWlt630SXF0XoOzvL8waNHV65elUmroGw4HBSnxyyvGBcGuE1IVMJFOwjknL2z8SMtMkWKMmdctHs9o3SRzUGd5dxADDPMw6o+/QkWcYZYP+hCSeb+IPO7WmCmWucMZsmyP0UT9uM1wIbiclr72XJpTessG+hni0vzU5omh/myBhn1ljsuPPHwM7rx26XJHFNA4bDnMgxJ4/GAOXJ02W3qsyQrJ0ZqMow/swxf/GaLnT31jg4ORfff0vrwIktYI+4lzkoRc3+94aefxUkj6XFIvCdUI26JaAoq2+GhxUQGLxi2LkpIKd0arq2dO19U1ej0rD7NoUNhHk6GAkVk/X9UEisJCykJrU3qCZglYIy+fve16XA4ZYKFwde/8dXTk+N+r4tm78TJbOqnvmfM7W5vHZyidSf+wb2P742mopWI+j9gBpJxOmpPpYeEUAh6q18qR+OC1SLGrmnqaXkR5DQo0AixxvUGXy5YzSutMYnBWoJZudBh1aeDceku6DrGnCDYyaYZhBlqDjVXG805R7sxmF9p41BLLREC2Ol1p6FRMsAFb4xMQQnqh3JYYCNky30kgyakxfmWJVKr1998rdKqFYbZ8fHTyYxGIWKZlPG8yPO8XFtfA3kxDD3Ucs7DOOKUCsmlkFEYhFIywQIeckKNViIQB0fHz1+9PLe3B28klSLwLaEzFkd7JG3cvi4Ig1YSBzJstTuQPBQIwZNWq64iMpBSgK1jpatqMh5PJ9P5dJ5nOac0DCMhmVG6KhSjNGklG1ub/cGQUFoWOWYeGEu0Ntbqqiwhkbdu47TWvL4BXNddhfzggw/CumCJKAp6/W4YxXmWd7udc+d2v/uDH56Ox7dv3CBWqVIBD8Cqqh5/6xm30gIMpOq5tr4LgmK8BLg0MingpWaVVrKem6EAU1Nm9aUVQjDC0nQehEGZFy9evbp642actEPB7z/4tN3pvnj5stfv9wc96A01IWQ0mWgwyRJStFqJkGFWZKdnY1AqUKQRxXGr3xtgIjIwG8Sr/f2z8VjbutLXvYfW7VZrd3trY2Ol3+uFQaTBNqsezo1mjGHlxqULY1SB46Yh9W99OhrvHx6cnpyoqtJG1ScGF1VR7vYGX7p7dz5O/9evfuNvHj1+vyjuzaY6jt2JRh3FB68eHB3Cm58TZJnV3XBVtLLsC8PBf/OP/uG1c7tZPj+/vtEJwx9/+MHfHR1N4b1z77mBmRyOPo1URCQSgQkiWkQh2McsgZ2DGyrQME7jhpm6jh19AAlmY6DluKXI2nN2OJj/7TyIvAG09W8WwYAoCuiMcWaM9esG8BrYxBDnFUYcItmsIuE05YE8TrPD0dne5mZirDC2FQYZCsORGIZ2EMaGUhZZdv/B/StXr/A4zgkZ9gbp8SFXFeHYnbg23jGT4WX3KtRFND2xtKxKLmSr16uqqsqyxkXEejC90T9S3FI3Ibie3+zXoGSJn9Use5ccJF3nY8GkwhGlHCsaZm5oIz9boDHs3Af1U89nWhoom9mXOItDjC91xGjmic/U2xFR+plofcuFjLAxYMvpushGW57LLWtCoeiSzrqJ4yVLJCAn/momY28q0hCynI/0oiNhS78NSpKI6wL91N30IEjtcUwyCF2wjpUFbxACvcztkPEzcL+K0VoHnd7WxYuVJWenZ0ZpJHBxagU8FRwCOYWLW6jH34iSkNLYkoSQBC7T2mt3pmtrUxEESfyNb3795OigV1dfl1WC8AQzumftrW53HZwX8yT63r0PH8wy3mo5vAq9kACToz5fl/icE/fQMS9PtFCqeQNH1F9RVkq7J9SbCzdQBF90PC7/DE05DEGWkt+fEN9yLhpmawl3S2ZGBbdI9bcNEdC5Y2KQirUafILQHZk5EyxH7kcJH0ZtEaSiNdZjaHigGQkqfa3TPz04uPvazW6vZ7UKJb3/9GXOnMCbcxFIOZ1OtdYbG+vo20DBaIJSEnBpgIPqOmzChOCBkJxRIYS25MNPPxlNp5cvXdFVaTXsUcGvS9THKHERs+CqEUZBp9/v9Xrdfr/V7va73W6v3ev3hysr/f5gMOj3et1u/T/2u91Op9OWglWVSmfpeDIdj0ZGqzCKozAGEpjWugrDqD/od3s9pXVRFGEQwzCgrSFlUWqwmwZDRwPWHypOogf376dp3u+0y6JY31gPgiAIw9HZ2bDbu3Ll8l9+/4cvX766dfMW5zzPc62U0qqqqnSe5RkkByvlvI99J1/Pn1IaGMBgA2hQRF4XLUKqskqzbDadKqXARYuHQXj//v3hcHW4udFKkiKdP3/xvNfvP3v2Yn19I4ljrbSELfR0OjPGyEB0uh1myHQ2GU9mEBpIwABErA5XoziqVFn3ZJzlRf7k2fOyUshA6rTivZ3dtZXVVhwSokDAVhdcA7eG4e0zGltJYomquw6dzrPT0dnJ8dl4Oq1bZynhpGK6UqwsPnf52s721rd/+vN//d2//O1sej8vjqllQeBaQBSvQ3gw9Rlp+PaB6YpRSjNVdYr8shT/1eff/k+/9PuBoHNVtZP2jZ3d7Ojom7/53XuzuZYBdVFgmgLNAvd41rkLOM8Gz4BmmBwMVjZOwe/XqsxN3g1oCLXHZS1BkINL/IfZlnGOmawN2ZVRplyygXUMssYMiyNjwzALGgfnbg3KB4MeEGzh6eEdK4k1LJBnRXEwPtvdWEsMDbRN4nBeFLnPTXBcHEJkINIsffz40bXrN3gUFpYOer3s5JhrRaBtgumaONIsvmzWR/RQ5yOMtO2qqmQYtzrtMi+qqhCOpesZwQubxCWuqc8htrbhvIEHSFOkvI4bEwjwQEJdjC9zzC+Klwo1a0ZKHxaBdbQZMe3Szpn5Qtfkszb5uKSxwUAeszP09yS5Zma1XNbngkv29cBrk+KLdmKs+Y0WoqOlt3zxx2We1mcmZeuCLZvUJBfbSxwnwamdKHJ6mf0M24p5uTQwYJHgvMAV0bUL9Ye0yWpCe2dL3NoEZeDGiKi1deEiYWw0GlVVCcbuTQSnrWdfQzjYXQlKIsYjRiJCY0ISxiJorFbv3Jqtr024iFqtb337WycH+51uF5K8JDqyE0a40T1jb/U6K5ZLztNIfu/jDx5nuUhaAeP1KeMj1XBp63Iv4S3ycG99LmNvjolmjBNTjwWO2V0/28DIwPccREcaEv653zDUgxFvFhS0Hr+4S+t3JZYTZ3DvZk3CwdSHW0Dp3OoBs8052uoSSEZC4SNzYRgAY4OKHIugUzSir1AzMVMgYfl0NeduSRnXebbd7ug02+h1z9+6XqazTtw6PTraH41JHBuj6+vJGBd8PptWlVpZW9VKgXdjiF4TwE2zjFOlFPxG2t/x+kkZz2cvDw7H49HVq5dNVWlVYX4ih2W7Rm0uq8s2LMQKBT1ZIAOtdaEqxqSBFbN1qa71uxLFUStKknY8GAwHw5VWu8UZy/MszbL6tsD2QjCmqqo+3wXvdLphFGZpZiG9H2huTFtdliXUSBRn1Vfn6Pjk2ctXO1vr08m0021HUZi0OiKQk/Gk045v37zxi1++88t33rl69crKcCWrx4W6xGqlZ7PZ/sH+ixcvDw8PR2dn4/GkKIpsns3nc2NJEIbUGHB6qWdvS7SQQI7ltMyLUlVFWY/pyOXN0vnx2dmNu69XSnWj8MXTp1VVz82v9vfPn7vA4IIXeTmdTGF/XvW7nTgKz8aTLCsMiKOk4ILL1dWhJVYIjqDJeDR5ebBPie23O3u7W5ub60EYcUZVfUe4DIJSFYDgY+Y49y8wVUrrSqfzNM3S05OzqqwYrwd6IaXSqixLXg/8rNvpHByf/uuvf+2Hjx+/COSIMxMEeMNguHTqkcZ12KtBtC4LUpWiKgeE3Gi1/vGVK//yi1+8sr0+yrMS0J/Y2IvrG48/+vhbn376FAJsDLpTEtQQaReyCU93/WozbxbEOdGG+gAdjhXUOoNPeK2oUzvAshUd0+CVh6RR40I/MQMYM7isX+wySrW1HhT18QO22aNpTjAbAm2P6tOAeEDSK0CxQpHGPJGjslGK0zzbPzvZWV/vWMqVaofhrKwqB3S7c90SGggxS9MnTx9fu3HdiKCkvNdp50eHXLukRRweAN1aeE85qMp/F6B5EwhsCONWu8wyo8pmvvclhRkHjDoJqSvQrjzjUprapVBCu9Crkka+4dJ+rVsA0yZQwU2vnLqof+taHT9gY4vCGraRr024mUQPfUKWs42J4+/4orpQ7NKFfAlYIGGI+YlOheJWucSNWs1fbNBfRpeQ6iU+wRIv2//DXBG2i8pPXCCF8S0jbXhkHEu0JY33J8Vi7PnfzumNIIHeNDonjhligJbD7Ga5c0ihEGnNHclMhBvnL4pWPD4b53mBrFbicxUZZBHnpoBOAACAAElEQVQyRiWhwpKQsoiw0OoYCnBcd6Jm7daNbHNrzEW7P/jGt7/16vmLXq8Hl5hTTxiGcF9zs9dZo0xyNg/F9z7+4GmuoiSW4Hnk+EeUCpQb1W8hqEsogHZAe0YgFgTueKUtPqaoK7aOAWJdqJklXpHigj1Zs4NBHxlGBbjA18MCJLc4oeGCbI4NJUzGsLxqrNLqVsFYAcfBgt+Gfn3MUeWYf1sQl/J+6CgEZ0h8dti9wZmYOyQO3KAk4RthVJ4evfnG67Arp20pHrzaL8C9D9+/unAwPhlNKbHD1aHWQNyhVulKUA60Z8ItjhjOlNpoHYXxw6dPNje337937/Rs9PqtO7ooGOUCvJwgvbHBKMAVEh6UsqiqquKSR1EMvDONSLdBDLWe25lRGpZ7rO4NpOx0Ov1BPwwjXdeEqu6HrGUCflNjjVUyCIMoMFrjrphi6Ig2tm4JNGEGnZ/nefHeRx/tbW2VRZam6WAwiKI47vc4Z9PRuBNHd+7ceX5w8L0f/CgI5JXLl6m1eZbLkLe67VYriYNYKzMbT4+OT49PTuez2WQ6G4/Gk/G0zHPEHQxE8aP5MErLtKqHP1XPz4UUQgTRw8ePz507N1zbIKpKwvCTT+4PhoPReKKq6tzuTlVWeZGPxmNLbFWUrbjVanePTo/LssKcD2JIHAW9Xg9oUxqXc6+e76fz9Pze7t7edqvVqrSi3kbHixgtko4dxASPWTor8jSrG6d61i/xRCp1pXQF/uBCSpGXxfHp6K/f+fU33n33WaVKGWqcWZA0iPEjyhJtiNFUG5XnVGthDa3KUOu1KLrY7b6xvvaHu+f/+d07b1+7UlB7UqQQpMZCrXYH/e211V/8h1/9+NX+CQX83Vm/EidecmRGCqkPkOXsiickFbgYJeuFo7Yh7EAyo/eoMajBsd6lkhhtBdhYOpgTB2HYJ2Olt9YrMPEtgYG6Lr2IdlMfM+wGc++zBc6u4BvrCwr8COv9ptFdZFTqg9OTnfW1DqVCqVYYzIuyxNQjPOigPkkhJ5Pxk2dPbty6o4XQQvTjdnF8zBD3BV4nQX2Qi+/z5vTeGhELhbaqqnQUJWHcStM51RX1yl9nHemW0mitwchCLbwopm61uvgj2Cc2BRPTK9w1c0wmR4C33p7Kxe/SRX3z9o202TbbZv3rJE7NyAslCxnszDZVly1W/U4Q3PCcLOFCRtAS4sxDHb/K+s0m+cyU6yhVvpVaeHmRz5C0mqGYLA+9C0DYoMELWxIwuVm+MdqmKBVFeQxpLC+hUqIRyeIGeD0wsuKM80p2KAkqhq2hfG1nN+51J+Npms4F9cYdcGkB+mWCWPCbpAEhEalH3hCqb5sSq9Xq9evF7t4pJf3Vte989y+ePnrUG3TB9RKtPVDpbXta3+h01ikLGJ+G/C/vffi8KKM4FkJinBnWOmBQKgyqQ6EkwzUv900uaZLwoSEyOOob4zN9sYvHp4Vz1pCkOOHQnluOdxOqnwEvIWsddoWbN58u4kKkwB7dNEtuRMm826IBAjlH3w3nsYcrLeNjVg1ee4p5ANgGOBTBelGd87V2GjgKko9K6QvtJDs62Vhd2bl2pZxnvV7v9Pj0cDzWkuPDJSXgsZRORtM0T9dWVgXjVpGQB2Bqw2wjeavPIIWXp5Ukp5Pp6dno7bc+95vfvv98f//m9RusnlZzEHGArRdH1M2VZBBeG4joqepaJbkMQt92guaKMW2UANWX1hVCCdrlNLAkDmUYAI6guQiMtjD21Me0ECKKQ1wbw+qFK1vP96pSeV0dqziMiJDv/Pa91W5XCDGaTHq9bqeVBEkSxCEXfHR6Jih9/e6dKIp+/JOfPnj86NzO7srKSlUqVVZC8FbSWhkOe/1+u5VQymazdJbOVVnleT6bpfPZtCxKo7UUkhMhOVdGMcu0UrP5tFI6z3OrabvTOT4+spZcuHZV67qUjsajo+PjlX7/8OBwZX2lFUdKqdPTUV5VSqtAyCRpHR0ewWoFIu8tGQx67XbbaPhNRWDqwTrd2d3pD7pal5VSwM0SiL5TXj8/YRByLiAvmWilS2WyLCuyzFir6n7HGGW1UkVVEsdYpnlZ7h+cvDw4fXJwPC2rTqe91ukOg6jDGVeVqLQwhpaVVCYxtqVNj7LtONqLksud3qV+58ba8M2N7bc3d/9gd/c/uXnz7WtXmRQvJqPUKsj+plpVXUL2ej1L6Hd+/u/fm80qQ9ba7VRpS9GNjiCVjxqqrUIOF4b0cpgFOHNcaOaW1Fhu64cM8SUGHHiC/jasodb6JBsYsDBU2LGpnec3ASm/pYybJhANXiy8Mt7PEQWksDAEloczEABI2I++sE5jmMPiXCmsJVLwaaWenxzvbGz0GRVVPQenRZnDZ/YL1vrLZRBMRuOXL17cun2nJJZFcS+M05Nj1kgeESNHJI0aS5bGN+ZQbEq41spoknTagQxAmKRRjgOjGZY67lwyvDoKrLYB6nauHdT/2ojF42Ka+DHLiamMizRo0GjqeVre9qIxzl8Msw1quzRmelj6s3NnMyS7a22btELXHXC0WUTNMpdh7JOO8Glq1u0uBpmwBcGbLoBeNw971rUDYhsBsKvZC0MPVLkucjrY8pLZK2caqW/TsS1+T8+FY875wS0LqJP8gNG5Re45xJM4M9O6WChth5tb7eFwNk9n0zlzi3VXwKCVJgJuWwD0q5CSyJKIsZiSVj2GquHVK+rCxWNth+sb3/vB9x88+HQw6DGkNhI06q2f447WN3qdNUYDJmaR/MHH915WhUziQEinbQAtINBwQcAnBC6WURTorHhwQcRRHujM2ZU2OCX4tseC+7G/wEDLRMMpTAvgjHm2u1lEYOKTxdzDaJCux0HzAHn+rnvBrDGIZ6vLLUHtnHAWdxz3XfVDBWxbDxhT1wEgcdsSAyxcQ9x+iArmxn+XPo1HEiNVWQ0D0RZBeXZ29/XbsOggLUufvHiRS0khlV1pFYYhmN7z6WSaF/lgZcAErSoF1U1TRgMBeRmQWCB4YIw2Vgdh/P7HH+1srF84v/fuBx+8+9EHV69eHXQ6RVnAmp4JzhVImDDIgwLqDCGzWilV5QUlNIoSBqtjsGYSzrPTUqMVQ8MkbGgYVVVliamrK+eUcmfygHsl8BqL40SKQIGRCKUciHL1PZilaZql3W7/3v1Pqrzs9/pZlhutet1OEIVBlARxxBifT2a6LC7s7d68fv3R42d//dN/P5pMN7Y2Bv1+VVZFkRFIUIqTaHVttdPvRXFc5Hk2n5Wqms/no+lknudFWaiqNEaFQuiqqowpS4UYT5aXUnBt7eHh0aXr15JWtyzLQPBHDx6FUaCVLctia2vdaHJ0fJwX6AasZcCzPKeM1XMtyJCGK0NKjVIqCCKlK6N0kiRc8CIvLLFSBKzuYzRnJAilCKRgoFNSFeiDs/l8PplMKSFa1x+QMl5W5SzLyqJklAUyIJZOZ5OyyFtJtL2xceHc9p2rF2+fP3dzb+/G7u61nY3bO9u393Zv7+7e2tp888L5N87tvHXpwu293fMrgwtbG+c21/aGg8u93pvbO3944/qNnV1lzePRyXGZkzCwkBGplA6M6TN2cXPr+fOXf3Xv3qfzrCeCzVb76XwKTobW+Rxq67zpkA5q0dyK4TRQ33iGunyMjKtfAQEOts1IrOF45H5QZtTHwzKn/0QtvQvqhz0/R/SMIOWDa4hc9Bpc2uhgUHXPOEVVI7SbAErXT6lb6mrrF/OAYQEgRdGxZ6bU/unJzuZ6j3JRVVEQpKoqESZ0S8b6cwVhcDY6OTg4uHHrzrwsedzqcJEeHyEh0xKi0czR5SmTxe6DNBArBYF7RamN2x3KaDZPWSNLohgv7/gjOJH63TJvxs9mhnPrU6ebbCwhPmOF5aDKBaXJlW8Hr/uhs+El2SXJkR87baNWdmJb5kdtSxeCHz/3ezmupY30yZGwqHMJJu4MIrSJRXIYs124WjgSlbv0xA90nulNl3Bz2/h6LTS9YMXCmCM9W9cGURe25oIGaTPPU2eeDywfL5T21lYUjVPQaYQzA0ELSBR0czqnVGvTWVkbbG6mZTEdT5iXtjKfiiEYEfCVAaGSQcwRIREliaUxpVaX/UuX+NUr+8qsb2/9+Mc/fv/93w76Q/80U45RKMZ0lL7e724QFjKeRdF3P/7wZVmIKAnA9wFmXLDLgQ8P6UKcOW4TdanR4DfpbqnB4H2I/nZuOU0AkcPzHXxt3dreu2bDK+p8Jlx2AgWBkevJrI8sdDXHbZ8tsQLVQ7gSM8RpqYhP2HYRSX7Pw1jjXsb87YYX3lnQIAnDhUu4NCQ/GrsZ2nlpWWW22+35q5drg8H2jetVmvWjKMvzl8fHhjNDqFZ1e9xKWgApsixNR+NRp9uPAllWFQNr+7pFMMj/h8wiyPPpD/oPnj2fpulKr/PazVuHZ2c/+unP2r3ezvaOAFIersaYANOUuhlhztwIuhlqaZanZZmD3kk4cwbKjNWkUVVpZ/xnoMRKKRtiiM86dYQUxrhSinIWxREhtKgg1q1+dAWhdD5LW+3Wwf7Bk+cvdrZ2lNbTybjXaQdh2BmuacuTVoszMZ9OVVWEUtx97c7a2tp7773/9++8W1mytro26HWVqqtYIINKVUyKQX+wsjIM4qhSyhJSlsVoPDk+PpnNZnXth4sfyLBurDSArVWljY3j1uHx0WB9uLaxZQHHmY3Hh4fH3U735PRkbX0jDIKD00OtXEYeY8AtA9oCJ6yVxMNB38ItqP8r5PcWlSKGSCnrx14I8CYR9WirTF4PuvnJ2dlsOh+PxvP5HGTXyihTlUpbUxZlXZpBfMM5I4ZKKYIwWOn3u61WJHgoqKA0sjQQPBCsG0f9JNkYDjYGve2V/lqvvd5t95MwieQgTtaTeCMO72ysf+HKlSs7W5M0/fTg5YvZrJSSBlJpzetyRVWZr4RBQtilnd3fvff+9588fZnlN7d28tnsZVk4ZxNDlte/WhtgVzjmjV0iz3K/VHcHLGmwRByYFilhhLn1LfN7LwJzI6KqFnldSOthQLeGHwc/lziHOeAruLHL2KaN9zxei0sj1597DpIzDUE+DfE4quDzqnp5dnpuc6NDmNB1DZ6VVekS69wrbgmNguDw8PBsNLr92t1xniftTkxoeXrC6hndi5ObFHO3srReZWuoh9WUKoUQSadrja3SObofG8/CXWyJPc2Dkqb8ORErcRlW3urYx/w5ySv122gU4LhlLvOCPjyNvcOHbToAP7IbQhc2Ck3hZ0tqYLuAvK0XD3vfaF/LXYE3lHIhQ+yUFiivZw34fYh3dyALC45G7UtdN0KabYOPnXCa4KZboMSvwzE6yrcSro9Caq5dGvkXWnPqtKfWk7t850i955VjXi+yiC2Op0qroNVZ3d2tjJmcTSH/x6V3YCoDpPxaThhELBBJSUhZaGlEaEwZU1X33G5888aLSm9s7/x9/c8vBsMBILF12YIiWk+CLa2ud1objIeMZXH0/XsfPs8LGUdREEJ11kgaw7gClF5xEPlgZoJz0jHu1tRVV9smOhDkv8yCkzvKdmEYw/hdglsvjKtjxDva+rrMnPsror/1SApbKlB3YFKL95JnXLi1tpP7u4S1JX41ZY2XnpMrUhdzxrDS4wYMWV04BXq9JHeHtVtkOPtL4NVxkVd6PZRtQianZ2+89bqIAltV3TB68vjZjHFSNxxCm/q0TuJYyvr7qkodHZ8mrVa33SaAbmqQQrkQUKNRPMkZlUH49+++e/7cOZtmb75+tztY+csf/ejRs6c7e+dXV1eRNYbZ+Bj9yzgBG+16mjHuwpo8LerCFgYYf+TkakI0jp6UQ9+D7RVIGoD4ypzdgbb1F2gAAqDI1zdKcryHRmtoTY0uK0PIbz/6aHtzS9T/vR7EO70OF0HS7RdV1e51CCHz2YwRU5XZ1urqm6+/2Wp33n3317/69bvK2PWNraTdASPqqu73wOw+CIP+sI/QeBzFhNLJdHp8cpaVlZASHwVCSVGUhPLKaCGD+XwuuNi7eJFQWhUZs/bpsxdBGFRaSyFWVgcHh4dlWYKnlYqCEAsto0xwMej3Op0WwYlQm7JyuuQojhklMgiU1uk8nUynp6PT8WiazrOsgLlcVQbDooBnD7Nv/a5rY6QQEiKuIHtJGKukFBaAa9hlMfS15zIkeN+FrMf8sqryvCoynaamKBJGtzud62ubd/bOrXXaZ+PTj549fzqbpkFAgoCBuQpq8PK86ESBzLKuEINO98e/evdnh4cRYTf2du8dHEy9dhjPKbMUUeslHgxtsPzO0oLtqN+YISOXEas1JlPi7rr+I2NOtGeNR2sQoWQepnTNcEP2heNAg8EGw3aSI7WeIM7lDGKZy0B0ylzBIPSF0OZTwR2EL15k58C7KsS0qPbPTs9vbnaJDZSNZTgtC0UoetI2XKkwCvdfvcry7MbtOyezeb8/YEWVnZ1K4XOkqTMMaYLxqMdcbSPPsbZSSgZhkiRVUVRFgVZ6TbFlrp6SxnfZNrOh+8ieaO15up6VQunS+thPi8zLnJtcIevIaf7HuIGSNQaOpCFbM9psD+gi6Rf6d2sXnYP7tg78beID63/hQsZe2OLqNQy82D4gZ5v4WAhQuDVFkPh0uyap0Pp5F/5n4w2VGqzS+k0yxi+BTRVbjP+kmdGdCYnDuRf2DwigMo4bQOJNqBn+O/UZBtbliFgjwmj9/EXLxeh0DJZsgCQY6iz+wWaSU8oJpOtbEjIWWRpZ22KCl6qzuda9+9pLbVa3tn734Yd/8zc/6g+6rD7amZvjQWvf0vpaq7PFWUiY6iTfv/fRoywPozCUIWVoBee3/G4EhdtuSYO4uy6mLs8uAsNpkJpmBuMwnGW0WaiicQTB5hrRENzmM2YXP9Vi0gMly88t8bfLum2GRfab8Wx84JhgqBm2NE6vUFduHPEMXaIruMeGLugDnjDg1kwQigxumqhzW/RzmmhTltv9YXp4lEh57uZVNc/aQViV2bOTUyIEAfWI0oozGochtUSEgSX0+PhEqaLdbUuOAXyGgfsxxAGCNLkyK/3++59+klfVxmA4Pju7cfnK599869nR4Q9/8tP9/cOVtZW19TXJA4u5NIRwsJpyj5yjsICfc1mURU4ZjYLQXSaKwzyjmEkM1wL6AO1E4R7ip7oZMAA+qBsgwyVnTKhCEbQgs6Qssna38+sPPm6HSS+OCSXj2bzX60nBeisDA0TWzmDAGJ1Px9TSsj6e6M7m+luv3221O+/85nfv/Pq303TWH/bb7a6kXOkKFihUCpm0YhkGRV5Yo4MoJJZOpvPJeEyoDcIAjLdEPQYbjUbhs8n83IWLYatVV4Oymk6no9E4iuI0ne1sbp2cns7nOU4tURhTt/Swxur1tTUhhELkth6i6kosuai0ns7mJ2cnx8cn0+msVCXsYrSL8+NO+Qoej+iz6HNwjDHUaGJBN1h3htpoDseWlDyOwlDIkEuAVhUFu2pTlUxXwugWE+ud7qXNzdsXL905f+Hc6gah5NH+q0/295/lRSY5TxJPQnfFcZbOA8Z7UZS+Onx971xall9999e/Pjr68tZeJMNfHh6QMPKYq7dnIs50wv2LG0/QoQxMKnF3BQ+VoabxxjfWJ9XButo6j2iLmJQDjj3w6AIQ3XDqYrYbNiWsHxwG7MFBWMu42QVePUudkAKBVMeJdKOjkxFat7byBdFwIcdVeTg6ubS11TE2NDYM5LgoK4o2v0gxrv9fEARPnj1Rxly7fv00zfqDIZtNi9mUcySmELukpMEFnnU4LGsquTakqqogjKKkVaSpVkpQp8FoFqLEBxMi+GudebT12iQ/WntlFqL1i7kQ52mzMI30bLDltTNtFEqLj7zwnrQLDnJDL6ZL3hMuJgMtGZuYB2cw2Oh3uAgigNkYayZ0P127PbWj1ZPlWXap3vuPsqBEOeAWyqKhTWAPBXsTv7jDiZxw/72sj32gHpx3fDnXTzLrYj9wnMfhDO2unEMmUhOAsAq/vSZcbO5dkkn7bDQui5x5yxTskXDvU7fklApjJSURZSGhkaUJ47ws415n8IW3XxrSXVt//PTJd7/7nVY7ESKAlAck9tY/N1LqatLaEzK0RHfiH3768cNZGkRo4yBg/eOMz5D10+DmeGngw6Apv/G/M3Cz3DYAXmCLmRQGTc0IJYKD3RWAvVqjDRT23My4hTRS8rl7G719GRpSuthS66yyHGfB+cpwfHyRQol/ywDtGR8ixK6cESZhzlAHnA4pQb6m+z0YKpyBRSYgNBHD3cAvBWIa4DPUo7AUWWUGId+MgucPn13YWB1sbZfZfKXfe/Xs+VlVERGAszxTSldlGUIIvGRcSpbNszRN4zgJZQicW4OVgBPUhZn6i5PWz/7ul9evXOGEzmez4XBw99bNy+fPP93f/9tf/erRs+dCBsOVYSdpY6wQdAlgo4YLbYCTkWlTQgETAYQ3A1cLpCIwh4CsEtI0kGGK1kQEvYcW3BNkk0tptA1lEIQyzQtVKtiP6FbUfnawf3p6urO1VY+AlMzTdGNzLS/U2tZ2Dhhq0mkrZfJ5KgNR10tltVbn9nbffP2NQb//6OmTd9/99av9Q4iU6NbjkbHZPNVGx1EYR0FZFGWuZBiEYVBU5eHJSWV0p9NFvKYoC0N0EsXjyXhja7O3smKsKdO5LrL9VwdxAt4gre4snZXoFsxop93ijBttqkq1WsnW5qZSFSE0AKEz52IymZ6djk9Oz6bzeVFUGnzKgLVnWd1d1Q+7YCBZqjvF+jqgqQ1xGEo9z2H+IyRqsDCMQhl2kmjY6nZ40GasTVlPyBUptzud3cHwwtrajXMXbu7tXts5v7e53k6SslDPT07uvXx1/+zkRJdVKHkk6/MCHSJQKcRoNp8xY9tRdHZ4FGXq81evfvzyxf/xzruciv/8tdfffXD/07ogoRWlwXQj69iFIOEF80AG0L9xQA8Cpo4U7ayvQO8AjnHov7DgymKss1KKECKZaFgyqDXGwQYSyWDw9YspJBkggGXcUenQIv8lHLNArNWQUEmFEA4rdR+K0YaB6dKF7GJZJcWkLI9HZxe3t1vahFRLKadFUTEXJ4gV3VIayuDJw0dBkuxdujiep4OVter4RGU58MeNN43ClEWfaOQrABozUca00pW2cdISYZTPpt7B0/kuwYYQWhe6ZLPBfP/z/0vrc8YKeN57ZqvDZREbs17ga5u9soUtoSPc4PhHl7nX2KAvMvwa14wFC9lvgBkeJsyVdeadf8GrSIYx/UxFtw212DbjeIMS2CYS0Hv6O7WU/QxD2tG6GyC6bmsY+czlIs0+3CfJL5jd1o2/1EmJsBNwkhlqGCMGeLb1I8MNllKOUfvUC8W1Zavbu3F/MJ5M83QukO2K5vXgBsUs+G9A9yEoiQFDCi2NKA2UpnG49vnPHQsZ9vuHJyff+dY3Izgs4SWFDyTq3zKq1OUk2ZNBaCnvtn744P69yTRI4jCIBOcgWfGWJKCIZUApwksMOTmA1iDiWtcnoa31Vk2kfs9xQLSYWoMdLXKakLTFvL0AjOVeBug8RD1CSyzBSF0EaA1oRSAXheFdQIEKPkvoKb90Ewg4YVkqmjhD6FoFJZ7TzZA9Ar+C9Q5l6DJgicFP5tzF0VEHaYnUXUkcPwhn2Tzd6fTiqnr88NGVKxdb3Q4tNVfV46MTIgO0DQInSqKUCsNAgqJaAgx8eHRSVlWv22XAoDHaChAJGaLLvFxfW//ok09PZ9PLFy6URZ6XRRjKfqf71ht3L1+6eDY6e/e377373geTedruJIN+L5Chz15kSlUA1jO8KYyxqiqrooJrzKQM3RuoYaNDESEm1mjJRf1hta5HDFGfqmC8aGezLAgFPuv12MyoFEGZ5WioQCnRWr3/8b29nXMc1K7z2SwIoiQKuODt3qAockJZtz8klKSTCbDTvRGQMpsba3fu3Nrd3Tk5Pfrgg4+eP9//f7n68x/JsutODL/r2+LFmpF77Vuz9242h+RIJL+a0Wg0XxuwBpgxbIx/ml/sH+cPMgwPDMOwIHEkUKJoyRRbXCUuItXd7Orq6qruWrKyconM2N96F+Odc+/LtAsUUSpWZUS8eO+ecz7nsxBr+/0uF9xojQfGaDgIhcjy3BIShiFjfDZflpUCQTMtVaWVlUJWdSWF3L9ypektyrJcrU7OzrQxHDrqZs4sCywmcRRwSqumG6m2x+O0m+IxXlbl6eRscjadzed5WVrukpoEggXWyiBozhmNV5YywZp+BDy9kiSSUiZJ1O2maSfpdOJ+t9dt/tOJwiDtdIJIUueq31TmXrcz7A+73W6SdJK0wwK5qqrJYvHs9PSL4+NHx0cHs7N5rZQQJggY2EmiZ4AMBPJfOGOr1brMsigItbHnL16+deX67sboex99+N2HD/6bu1/a2tj83oP7WRxTYCwiXGzQzA43X2gwZlqfQb/ss8hwMT5CDCviBTWItIcblgYMdXDx8xaPCHcAUzRXt9oazgQ68HCgmFDnwA7lmbqdtGNHegt9F+hiMTpCg2wJBJCweIarwDEF2G2gEMSGI5UJMc2L8/ni5t5eWNWRpVzyZVkqt3P1xY4SKeXjR4/6w8F4fzev1Gg4yk9PaV2x5oF1H8U0nYR1mhCGkyp6c6PMiAEYo+I05ZwV6zUHgqixHkj0LhcOGXYYK221OW06lDerd0aMSG8i1o+bzgW5TY5wUeLEEarRxLGljTFyKbbgQhDcco9hjqQu+shx031BZpfx33ZY5zKIW0D+Eqn6YtV7YW7B2nmcOqN3etFhWeLxGEIuU6ERGKXW8aO88RWqi1y+XitT8SmMnrMFUy4jrUUTAaTKwSxAobKOeGsdwRrFebXWg+293ubmKsuWqyXzP5ChWxYM3k3xtmA5aW0AxKu4+Q8N4JDY/fI7026Xp52iUt/+s29TSuIoQUdX6FDh+FDVrTi5EYaBVnLQf//Jo/vTGY+TZvblXGmFOwC01/CIBpo2Y1qXxQfAWA1BPQQZjdTZ6MOjo11smcskhJBqlxHsWRysXUcRv45qH2cYoP1Tiuk5iDzY1pHHKN28rOSesmm5Oyipt5dyRCowxDSce0SEej9W5wxAsI+Gz4sNkvVM9TbpCbSzoHdk/s0L1DIxlldKWP3m3m69yp8dPLv36r2QkH4nPZ/Pp1mmPMUQ7gha1iVnVEiJpiyWknWezWZzylgn6VAIkm8+nWmKXiSC4Xjj+z/5ydW9nW6aKqUY51IGRb7qp90333jzzTfejJLw0eNHv/r1bx4/O8iV6nb7nTTluJiHvsch8+DpqJWqihI8Jh2ZDhE28FKg1mqkFGID2Uy2Bh2KLJdyOV+slqs4jvG6QqclJMeUoebZ7A8Hv/n40ziJB93EWhsIOTk/29nZWa6XW9u76GZGhUy6XWrJerkM4OYBBh8xpja67naSV+7evXXjlrXq8MXh8fExF6LTSSAsAJ1GZK8Zjm2eZ0EYhjKYLRZFkcVxbMAVAan1uqr3r1yhcKLn69U6yxeLuUSmEmNVM/801ycEVnNelEKw69euxVHzQ45PTo5PjvK8rMGnzJCmoTTGMHA4R18IwVkgZRiFvV4/TZNut5fEnbSTxFEz4jLBpWwucMAD8NzWOJyBXJ40zxcsDCzjha4LVc2LfJItJ8vF6XL5cj4/Xc7PiyyjVjFuhGRRyLg02PhCG8FwoKY0EEEgw9Uqy/M8jmNt7NnpSUfpr73yytqo//X995el+k//8l/+4NMHv5zNSBRZdHLFNa23dcaQLpA3EDTK5i59izg3WZesDuiX0ehKg0IjH/zTekSh96QfPZzg1w12zKXuYYqNd9CkF7oTdzKY1vYXdbOA0QCMC0HUxPEzWbsChI9FXEgDvRBk4LgEzCQpz9br2Wp1a3dPlGUM9/68LLVTotA2oZwx9uizz/auXO+ONiqrR2m6Oj6ixFDIUHFYp1MiomcexVx45AYjbbSuKsJIknapNWW+ZpQ6+3/rC4ibMvAMcpOl5y1dLMv8dtO2jULrbOyKOI77lwyUfYCg3zL7dWC7d7bsEsPJTdJtPhMWV+Z9w3xqgyeqetvM5kJzgE69HNfvGPwbsBfwNvE+0qSlnLUEbj9xX8qFJpfKuDtt3c2EARPEV1BywQck3vWTksu8b/BM9/0V/Fs361LMIQDXSWgccQ1cK5UONzb29oqqWswXjutsm3ILkE9TwhkkaApKJbERa8bfmLKEsgAsW3fefqMcb9VhSETwZ//l20VZJEmCtsnEGVUTWdfX4+hWHIdKy2HvR08ef3B+JpJOHMqmzTTae5twyHuCts4LeFx0KHbQ2rhWzjrvcHwOmI8FxmPa9YkgmmLczamMtQug5n/SRkMGIDLdXEvb3mkY9Y+CoaZth1YX/DQYnhTcN43EpyBZ3wZabzILL2ccXs3x+CJ+T0WE4N4YE4TI4FaJtxSnbuBFriFkMeDTZxkIhwyxLAjmi+UoDL586/bTZy+evzi4ceNaRFnCxBcvXpScU4EGo82bAbC0drsqMECWgSwrdT6fVmXV6SRSCkT1QcRSj8cbx6cnn37++PXXX7VaV1WVRHGURFmWFat1INjNq9fe/fK7t+68Ulb1Z5999uFHv33+4kDVJk46QkgJK0ZrjWBC6eYmRjePssi0VhRdAxGchCAJAvZPGlg22MEqo8DNmzBBjw4Pq6LqAaOKaqNNM2TXdVnXtTWkk3Ynq+Xz5wc3dvdVWclAGK0Xi+WVK/uL+Wxrfz8vqqa/oDzp9YMwXC2WYKGsmskRRnZTo+O0vb6/c+3q1TRNJ2eTVbYKpYB2UYOkkvR6XcbFOltxsBNZrldVUYZRVIPrURQFRun+aNjpD4w22WqxzrLZdBYEoXH9IaKsrJfE2pr1Ot/d3N7c2jybTA5fvlwuV9o412NCmeSBJxsSIUUUJ91er9/vddNOJ01CGWBVBhfX2mfSId+t6dk0+Ie4lYjj1LtDTinDJLecabCbslIqTlkgm0aSSxyrpBQEWPEQ2eGS9jnjURQTYwQX2TpfLldRGBBLJpOzcr16bTx+7erVf3jx4o9/+qP//utfv9Ef/h+/+c0hRCfixhJtRH0qN4OOjzietrdPRL4eald9gGabuoesDuerSz3o5AW2zKWFMlwbQY4Iw7WxoW7SRd0/09p561hjtXF8AuKdYbF9xNHEwn4fdu3WN/0tNxup19yJs1t/AmSAgmdc8/BKebperYvsxva2KKpYSMPIvKogrhtdM0DDKITV5ovPn9y4cyuMYiNEL4rWJyeCXWTPIwaMeHC7UG+zhPCrrpteWSRpWtdVXRQCJC4GxyyC8ReuwLkLa71GmbAL6jLSNXDR5tyDPI34IgaWOiUWccQmckERh1PSdzjUyZC9dsraS+Yql9bbxBsN+omrZUeRS+ImLoIYY84v75LbZa5t52A/7lAnr3BQyaX2wBtQ43XwdZURF3xI/NjmXZgumGnUi7E9nZu2jCXuwxdbsyUIwraeJEO5b9bwlNfayKSzdf26JnQ6nSEbkBFnc0G9jQqYTVJhbcBoTFhMaEJobK2u6/Grd+n1qwvO427vO3/+Z9PZWSdNXRSYE7sSUddXguBenISVigf9n7149ouTiYzjMAyYq75I4naMSOqI9819DEE66JzjKU6O6wyqcY0LGcIdj705foC1AR5Dvh2zPtkMvKaA/UgMGB1bZ6OG4nbmzKSot6/xEBiqV8F/o3kODWJNmCfqckSx6TZO0eh33sR/Moet4dfVrteRCsuc9MJZsQOPURNlmFLS6ECrqFY9S1Kj41p3KU8YEUrFzauLs8V8Jwmvbm7f/+LpFyfHw35vd3OTCf786JgEIWqlEahnlpZVbUhzXgCeTwingRRFWZ+dTVWtojAA22TFwBjy+s2rP//gQ6PJjStXqrLMyyIMw7Tb1RB1l60zU9e9JHnt7p13337r2pUrhInDly+fHzw7OztfL1dlmQNnW2JUOcwnFCKtrDZN+yJ5gMcg+mBz5sRjaE1CCA25NMaEUZiVxenJ6TrL46Tp1/DwCaOwqmoBc1mcJP/w81/s7OwmMlC6DkS4mC8YZ0kYGWI3d/ZW63UoBeUi7vU458v5XGB6HVSCUEjYvhKrDCFmOBzsXdmP4ogaEspIa5IV5Xq1KlWdxilnbLla8aYEy+U6q2DFrpVK4ogYIsNgtDlmjGeLZbZenk3O4Q6nSOvFiTYMgjzPKOFX9vZms+nhixeVqiAwwyWJG6AnBIHspp3RcDgYj4fDYZp2BeNSShzIkBIBRypC+Aa8a5ix2jrhBmvaWa2NrfGWA+iV4F6DUeG89GE1oJQBngHnLn0POZcEXrE5o6MgCmUzCjNKq6qeny+4aJrbk8mZUXXXkq/fvNlNkv/8/vvrdfGffv9f/PVvP/r+y8MiivApxrHKIec40yCp5NJU4jgqSM2wXtyDLDxQUBrrzW5sm+sK0DjxPCnTsgZg3dRcHNuG13qOtBPTOO8iZMoQzANyViHEbUvBIEEwD42R1gPYKQw5d0aXaP1kXTyibbo9dNGEwi/l4XJRl+Xt7V2a56mUFSHLujLNdOs1roSJQBTF+umTp3dfe10JFoRRwmgxOREgLHQ8EsREndLG+SsZe0HENcTWleLAiq7yQquKMfTU1OBUYMlFsgE6Qbi+7FKgLxK4qF+VOhEz83XyEqnc/r8YxpeqrD/5PH3bn6pwwQ1p6U+XycMXxCntvy/vxOuna4Cgw9gLlS+rjOilD0YuCaFoqwZq/zJpt80XMbNuV8wx7tc1BQzvB78G9mC99d0L0mz9T2QOVHZ7e9aKpGGn7Ww0XHogp9Ybggm5df2GCKPZdFbXCiS62Gw1Z2DTfRsqCJOUSkoC2pTe0JKYkpgyU1WjW9fCV+6dGpOORn/1ve8dPHva7fd89EjTOzYjWK12JX8lbapv2uv+8uTop4cvRZxEQcgFV0aDF7uTx9qLPsO5QDkQFc3cwXADNObedso67oSCTpZegPwXPDiXwetbIeMzgzFVwGBWiks8wEJFiB9LmecKeO4BAMfOHI44bbklrX+9X2M5Fhi9TP9z9yb3ni/Eq0KxuzTMGmYt1YbXKlKqr/SeZbcofUWIeyK4J8J7YXRDyhtBsC/EHuV7XA64JbV6eXR2a3NjYzz89Oz88dkk0/WrV6/WdX04n1MhdXNDW6RhaNOcx0kUZes1EZwzQVQNqmuyzFarZUYs5YJqiIUbDkdRFP3oJ39//cb1tJOoWlVVEcVJGASq1lJKY1VVlkWWE6MGvd6dWzdf/9IrV/Z2006slV6ssuVyPZ9OlVEENMS1qjVx+dm1UXhegrkoQ00L2JtyL4S2yipIuJBhFB6fnKyX6+VsGUdhknZtrSB+wFRVpW29MRwdvDyazpfXdrfrqrbg5Hx8fLy3v1es1kmv1+0PVsslAx+CKO0yRrPVEl2NQBhHojACZgJlUtZKUUOiUMadJAwixlkz0YuwUvVsNgukpJQWZUnBE7uoK5iQSBQEcRBpbTZ3d4IgrNZZmWXns1lVq0BKAPcVMoAlF3ldRWFIrD6dnKC+jIN/OMS8iTgKesN+FEdhFFPKy6qeTueL1WI+X6yzMq8rZRTlQgoZSNlcN/BJVqZ2iJG2uN8EAZ62wDE3tvnuXZRCc+k1SuaAesi0Vq3pA1QWzjlteh0ol2EYci6MqhQ4q0ync0j0MqeTs7KuuVa34s47t2/99uWLP//BD/7D7/+rkQz+51/+4wHlmjlvXEMcCcs/TE52j0YZtg1id5518IbRKhaFDPCcCc689S4+o7iwaiWEjmfjH0yN9dzAoOsGZo6znRusPbPHW/ZSx7f23E0LeavWccWcHxD6DVhqBVxhuG4u17RdOTqojXlbCy75i8XCGH1rc8vmZT8MC6VXtSLwpbtpkdBAyvlidnx6+sprr6217qbdqNT57BzCwZC9zHxcEq4wqatOaDFgnauBUjoIoyiKyyIjWjlfW2fWZ8nFhqst/1Bq2m+hde2iHpTHnHpnjuF4xk78y9rsQHaJAU0vqFBt+DClzruzedIvRzu00DQyxdwSlbqC774a/LdchglxoLu92Fe3L0oulFP+E7p2jLYGWm68ohcDMu4m2rfh3zoal7QmBXgfWG866X3BvUi9GXONn7cuNO3OlNM6ARP3uCZlpLJktLsfDwbz2TLPCs6BO406VUz5bQZZl7QP4DOLCIubAsxtrbs7W9233jiuVW+8/cMf/fjhg/uDQQ99ZFDe1Lw9bbY5fSXtJpVOe93fnJ/96NkT2mmqbwCsK9rGD7QeycRRCzEcH3M8HWuGUUApHaxmjDFt9BZY17jsS3x6W9UBnPPAO9UoknWolGmvnHb1GJBqQlsjD4puGDAwwxSDnEDKjRt1CYpQKNA8gN7CNUbcwWfiGP8Cn9BJXIE6RPzCCpxG4HlXVVirfl7cqNXrlH4t7fze1f1v3rv9jdde+fobr37zn7/3ta+8896X3/idr7/3lXfffe+d17/63pdfu3vrS/s7d4aD7ThW66VMkplRGROH5/OD08nm7m5WFsuyIpjAD7l1hFJV1+PxaDDon03OOOyesSUJwkBbm+WZ0nWSJJbQSqmtzfHx+ez+gwd3793hTbVSRZb1er0gCoxS/hZmVV3l2boucqJNGMXDjY3tvb2rt2/uX7nSGfSTXl8EoSVUq+ZbqWuVZ3ld1nWl1qtlkedKqbqqq7LE+58xppuWkUmQpVVVBSHzAtP0JpOJMqrf73EeUGuVqi0jUgRJN/3FP/5qZ3ML0l6bLo1zfjY53dvbnZ6ej3d3RRyt1yuiNKG82x8ZbdbzOXrmwNZZW21EEEZx3FR9wYkhta4gTFcGYdDv9zY3xkEgVqtlVdY4yjc3INxOnPAkitM0zYpsOBolSVxl+Xq9ms1nWZGHMsBeHvbfzUBZGx1wXpQF59KzAAUhtDfo7+7v7e7tD0fDTrcrgshSGsSxDAIRSMJZnufrLFsuVmeT8+lssVitClUDCSumjjOCpQUoTkIEMqCMB4EEMIILARnQENfR/B8XhDWtA87WMpDwjyAeCxrNOGraAKt0VZaG2iCMZ2fTWmml9dnZOQGfHFnWX79+fXtz+L+9/4Od0ejffuN3//hHP/67s7N1IJEfhEKO5rTkzXTIXUwQyBmgq4bTzsDGAUgb1Cnu8RwHoRprni/Wzh7IRjZIvCDeFQDFjsY76vgX90oVX2wYCBCgesM5gZCVdRCt40Vbjy5airl7tnWpcyEOzYOM+3VcUFIwTbioPs2Jwf0GlTAhX0ynXIjro6HNym4YZKpegbGBW7vCGReG4eR0kmf53VdfnRdlbzCkq2W1WnHgYMMd5/2YLXKzSDs8ulrCaNPsWRt1EilEnmUX0DnOu0B0cecmwnbefaDl+LYgrZt1ISeSec5qa6fdzsE++wmp6o5PdwEw01ZW5BwuL6w58CB2gia8ez0/+yJMwYUqGmKEBo+IC0crRzf2pFWHZVrjoydQpm0c28p7Ejsqjnv3noncGjRZt/1pizkykDz13NG0XNmCEtVq1ZyeC2c36GeBReLueQetN2+n0rY73krHG1mWr7M17lA9W84yariFqEHCAkqlJSHjgSWSmJAxWtfhsDd86/VDpbub2x988MFHH/7TEIIWkMPr0R47svZOp5+WutvtfrKc/fiLL2zSkZwDrmL984CZ9sagJZPgSICA5wJ8C7WCRRQj3rKu5W7A7aMp5zBZGuBYcurcMfAbMFQwqwkyqDVo/KGPMfBs4+iBA66G7ATXF7sIXKQoYyC0D0LDRbojgTkGFndERcDxoBtAOZJymwXrvZQBzzbgNctxwsizoaqvS3lnNP7S9s6b16/dvHplvLPZGXRJkhDJMT7C7SuoJTIkeGpTTpQiRUmWa5Nl//TBB09++Ys1NWIwfFYVL+8/CIS0YOLcDEwEP7QhjD59dvCVd995/ZW7H3/yKZG800kFpxC1yzmjeV0vsiwKY6vqDuv8i9/52v/+p3/6D7/6zbf+2VfKTBlqDg5e7O3tyiCo6wrMW8DMUkhD7HK1Ypxtb+92h0MS8CjtU/DDUtqoWqmqUrWyVtVlZbSyzfReNZNuUdagGs6WC87B8wzC9pBTxAJuFdnd2VlOZ+dn58aYhw8enp9N7919pT8aGUbXy4Wu1L1bNzc3Rp8+efrul75UZCshJbN8tVw/evjZG2+9+emHv37tva+mw0GxWpZZplixubMlGD07PMDrCylvZVEUIgzB0VrwOBFa5kUhpGC2aVwYpRsbw9Fo8PjR58dHJ6KZSwzVzcOuVV0bFUaBNnVd5BpsnykzspnafIYP58aYMAgMsSCYacoDWGnXjMvBRm9zvNXt9wNQbAdRFHVSS2hTMjFmwxhtdHMZy2q1WMym58v1erGcnUxOX1Z1EsXjjVGv22lmU61UrfAxNNQ25ZRQEUaQOqCt1RQ3l1w0JREWnCQINCzXOSNVpVgQdnsDTmlZFFVVQGAGJ4JPz6fL5bqsytU6c2vtsr7WS29f2b3/6PPVZPof/+iPXh4e/d2zg6X0WJSLkcHJy0A8viX8wr0QBwKDpGfqKVWOYuW32hAwBmnCFBl8CLE7Q2e0++OuEKFXD6LISGWnfsBpnnpjLDUMXTgYA0Nz01LD4MRHwrM1FpsQC7HpyOSwHFUPEMaABCiMiMPsZ8ce8ieFdSG/aHVDSZT89PnTSMo3eiOyWL7S6ZrV4kQpKkQrPSbWdrudTz/5eDDov/Pue5PT053X3tD/9I/ZamF4oOE1nPMQ9PzCu03Vl7apjNKyLAWXaW/QKav8fMJgN8mh2F4sQy2uO9EA0+CIAMkcKNBibVQw5e5rtD6YAZPkjdPiYOlyihRXtK0j6rj2ws1QpLVKca7TbjZsvlJzoUL2DDCcz3D9Dw8S5zKirK3PpBX0Wo84tyj4BbnqUiJ/uwcknuDjBUMXqmu/23UpAk6zfxH2a/2u2q3Puds/eGGzMxh2Izw2IhzZWI6W1QxD8WA43tuvtJ7PZihM864RTV8JnhuEs6b0SspCSgNGQmJjSiJDRBxuvfvWsQyT0caz5wd/+4Pv97opQS4vEp9pM8D2rH6t1x1pG8fRgc6/9/BhHUZSsEBKEA64HlbDfzvWK8oBIRwFKP4E/CKArqzBIYpjijDsNHAdC0RBIDmBgaVfdGB/7bh1SKB1gVVo5i7gCjsTHLSschHfoGgi/m6xrTslwzJK0N4SefiCUaFKpi1rjmNtrBXwrtDzWjB3m4PPFGL7uLUyzBpeVp2qfnU0+tevv/7Pb9x658aNV+7eCwf9ohPPBJtVNWOCa8ORx9gcqUwpnZ3PVuezJ589Pvj8i6ODl/PZfJUXeV11u+l4e/vz48miyMM4UpQp5nzPaq1MM+cbIYSAbJ/p+fTendtpmpxNz3Owp5BuV2RkEFYgqG0KjNJJFCRp9x9+9Y+jwWB7Y6Oqmic9y/JumhLW/MwkTkzzuQ0SWxghRdEMtdoSIiMaRhWxVggWRSKJwzSNer1kMIhGw3Q07o43e+PN/ubWcGtztLM9GG+lw4GIYg2FQulmMLYGdvO67vV7M6ApBGGUZ/nzFwd5VQ4GwySKagieGY7Gv/j1P+1sb0Gqo6HAXp5NpyKQw0Hv6OXLnf2rAki5+WqRZ+s07QRc5NnaYloe9HhaG6NUWZYaZw1GueTGaDQMxylkPN4UMphO55Bbx5v2AuJodna28WgbDjeqolwvV4vFcp2tIYgXTn7GwAJMB0IGXChVM0Y2xps3b97e3NxMuh0IfGqqVNOR1EobU1d1XamiLLBZIU2vI+Ik2tjcGG0Mx+PR9vbOoDeo6vr05Pj05NRaEnc6oGHVSAVCfbWCWwCPUICRRDPBqeYXYQSMNbVWNRNiMNpoPqAQ6/WqLKu6rsEyIpwvZufTWV3Xy+UKOXSM0Kisvnbr5uag99c//slXX33t9v7+f/7+3/48z+e2eaMEiy7KGVBAiHxYr/+xmHrnFaVOwwFHAa4h2vMUAhGsSz4DvhNxlQ3lDs65sNWxGMwodFocT1Vql0XGtmHEblfZcpCag8UTaFvaDXwGY6kQWNAZagoNwdhE471moSi12Td+wUqpl/By/uxsMu6m46QryipJomVVFsReEMDABkAK8ezpk43xxnhnd6n1Zm+wPjmiStmmFcPqgJYR/MIA7CICxa1Ha6WEDOI4KctcVyVnzoeJUK+jcfFB1k+lOEtcGm5hFdnSr8ilLa9xF4d5pNf5T3lnwktOka4YWw/rOlsKr3K+QKCZ3+e6NKWLl2WwGAbXACljb/PLPGRu0MkREeBWFuUsn+nldSS1F8j7BUvMGZZchq+dq7j7CknrfuxnyxZOQdcQ6i1OLqdNwVrRISkM7FUJ/HdzlcN46+p1Ivl0OjNK+6RbyCUEBkTTG1MSgOFzQEnASWRtTFkEo/3222/O+gPR6a3K8i/+4s+DQDAB0amgWEJ2e6L1vTTZtLwThmeC/OWDTzIugiAMgwCBfudvzZhvrZrrJ5p7H1BfBlaF8HhiHiGGweHUbBB9ocg8NE6o7YKG8BIwt15FuMC5/FPn9koM7g6Yz+SlTobrVAbWe25APhh10DTzyeAQP+xMs1T9zs5OUlWzqhaBBOqjW12gHNAQ5z0g4PAAzoRhhgSEXuulrwyHm1H44vzsF8+e/u3jL77zwW++/fO//4u///v/66c/e/+nP//5L//xwccfnzx9kZ3PimWWT2ZffPDxR7/56PNnTw9OT1+enc9Wq8Pj48cvn312cPD54cvJckmlpDj1Qgyw1aYsK21swAM46ww+pEVZTs7P796+M+p118v1crFSRnEptDWOdwNSEEZIXeud7Z2iqn/2819c2d/tdbp1VVtr1st1GAYciNYB+jk7snpzRasKym4YhFEEKQtIFoLo/aYbQO0msoAI54IFgQjjuNeN+v3eeHOwOe4OhlEcw5Bota6N1VIGabc7PT+v6ppLIaWYnc8OD19oQvrdVFC2tbX1+dMnT569uHPjpq5LJMwKKU9PT0fjURiIs5cv+xujIO4wzlWZF7OpECLgsshzF7QNBwoESBCtlYaWyj/pwIaF3okQ0h/0hoP+YrEsq0o2f59yxre3xngHdvu9poKusuVytVituGz6HkOM5AKaRS3Bc6aXpjdu3Lhy7Uaa9ij63EZRHMdxkjQHTRQFUqA/KbUWEsm0NUZrhXRiRhjgxlEYBrt729tbm2EQnZxOTs8mTPCkE0Oz1fSMQSBRw9M8CIIb53QCI6JRiE4KLkYb462dXRmE59Oz0+MjVVfo1RVG0WK5evHiRVVU6zynguGsZsrqZr/7jbff+u3H98ui+IPf/5d/9+sP/uSj3x5wbhCkcdge8xWRosu3hUhRNx6gHXDThbuDE5KLKL1gkzoChjdlRHkF+f9QYLEI0cvGCzBCUGcqAA8mJus4nB73qQiOu8hPN7WYVnfTzLfa1NYJkVG4eKHkgbRv7bx6oLvnbhHNMCCCuXBRTiykhjOqiH12frY3Gg1kwJVKwSRLtZIhLEJAM/3880c3b99Kev2csI2kk5+8hDMStQrOo9/YdtSjnhRDMPfCElvXOojjKIqLLCNKtxpV/zLMED+G4oFoW8kNXmDm9s0+EdCvuIlLG3RmJK2rhU8OsA4O9u4WxNmU2NaBw8uwfOCCEwQjD4o6bZo3V0YZAQOn4CBibcYBRT4sA4zcV3jUtDg+FL3srmEv7kjSkqsQonYK+ZZ27f0JW7K0//iUunge7Es49YR47pyzXKY+ZvfCTWFh9kVj7+bNaEI29q+EaWc+W5R5iWsA51eGagYCiqNm9qUhJSEF4hWofrlSw1fvqd2dUsZBkv7Zf/nTsiiiMOKYYsOcTXWk9J0k2WNhwliWhN998PGZJjIMQ3QDAORCg8iVWsc9Rt5VM/i0e1gU8IEXFTOwUOXwbzE52zudYLpD8+eCoMwAirVxlEUYZymxWitskDlrnWctrJeal9JWUf9MoneqbSYISMSEGRptcSAMjllPXSaU1kZdI/Rf3f3S04PDzFRcSvD+E838TTUGHALKjSyNpqbDSUpj2LsdrpaPzs+e5+sZtWtGcsHqIKqkXHE2Ufrz1fKfTk5+9PiLn3z64NHnz2Ynx4E1g34/1/Z8nZdcVJwtqrKwxvKQBKGVQZh2BsNBv9vrpWm33+0kSSBDwYUxWpmaaCfZCoKoKMpVlo2Ho0E3NdpWzfWxnSQRQtRVhXuBvILhWIhr1689e3H04f37d2/fDLlQlTbGlEUZhTGcUAos+4C700zSze2pyipfNSWouRxB5DdQkGoFN221Xq/OJuvzs9X5eT6f5ot5sVrmK9glgyo0TrpR2gmSUErBKddKh3FkKVkuFgDnWhlIrdTsfDqZnFa1ioLwypXdn/76VxsQ71fXNQQ4NfXidDK5c/uOqcrTl4dJp5P2h4xza4wqcqMU8QmJBhTPGtUyDAnpzgQAqK1eUMFsXVdJHA97velsWtdV80Rqu7HRF7J5atNuz9R1vl6us3y5WjcXhXKkNjHKjLadTufeq6/effP1/nDYTMNBADVaAKYiVF3XVZWtV6cnp2eTs5cvD58/e/r5o8/vf/zJJ588ePDpw08/ffjJ/Y8fPHzw5IunRy9fnk5O16sVhA3Hm5sbgZTT2Ww6X1DK4yiEYRhgJIKhIxeGqE3dZYIzkaTp1s5u2u0tl6vjly+zLIPNaFO/4yiqlXr69PlytQIraQJMweYxTev6X7z1RsTI/fuffPNb35yfzf6X77//ka7nBBw1gemAbnS01RNgVAwaPEKSsYOXOFKimfUnKbrxugwk4+JlnGOzs4zwxkfQ5zYTHjIuKN5pDnY0Tg6M2l6MLzOq6ayMQ+wYQ7v4dr4xbrazqF1mKMYkxh/CljmhP760cSGdDu3ymeQUE0dMSx5mgGVbygtjjqbTaztbqbYR4WHAF2WlOE5BDujknJVVdfD8+Suvv1ETK+Ikojw/OcI6hJif8Sl9xpFEqU/C80Rvq4y2SdoVgherJWzvmG3j/tpAW+qN1FwghectM29XcWlh2yIDjvnltEXWa2C9vccFWZq7MdZ5FzLfSPm9M3J+2lh2z6v2GRJeBgxXnksZtoABuaTKxrnZ07H9aqINISbkkufGhb6JugbBwpfpgpcZbQdf0ppvApqO1CvqCG8uY8pplS5+71TODn9mzgEM0GlGamPT8XZvY7xcZ+t15iILHfgMVllg+CwpDZpSQQJLQ0Ih6JfSWvVvXAlv3j6nvD/e+O53//Lo5LCXpojlUudvYQOtbsTxVRlE1uhu5/9++OmLopJRBAmmHK3sXCjvhTOOJ3N7nRhGH0FOEdNoDMuEi8g1RGNIoYesnFQJ/g3Gi1I3thIvbkLurYUhHelTTVPOEeh2MzAnXk10QfGgtJX0Y8vjQiCA8d+cX5JNz85f3dz+cn+wmJ6vlK4oh520UxELh+E46Tv4clOQD6qsAlucIBRBwLgEwzwmeHNSUx5QwUUc0Sg0QZBR8mIxe3B4cDCfWUNubW/1x8NZUZimtokwiKIoDqOwmbSkZLQ5ccNASiGSMOoN0o1Rb3M83BqPx4N+GseUkEDKQMjVYkGM6fW7URJjYEUQhDt7u1s723GnEydJHMcBk1VZhoHc3dm+/+jx58+eX79xPYAAQmN0kRfw9gXuzjgXShtQ/UrGBX5ky6gMQ968MVBm48qJUiFFKKVW9Wo+zaazcrksl6v1Yr44P1+eTebnk8XkbD2b6rLEvYkQXKt6YzA2xs5mc+9MQHHgPp9Oj4+P024v6aS//uDDG9evcWPRPY0RUtVqMjlrarCqJ4eHRqk4TcNOypioq1IgA7lW3qxVMw69vDUY2gEYO1hSkOb/QU1zVVcykOON8WK+KOvaWJJ2Ov1+r+mxuNR1ZZRaLBbL9Rqy8EggRfMM1dXW9s7XfvdbW3s7YRDVRZmvltlyla3Xq+V8na3Pzs8fff75R7/95OOP799/8ODhp589e/rs5cvj08lktVyUZaFUTYzVVaW1Kosyz4uqKOfzRbHO5vM5TPNkMBgQRqfT2XqVhVIGMjTaCMqxUSaegiQC2en1hqNxN03Xq+zw5eF8foaHo9HNEyoDmRflo0ePl6sFqKa5Be8qwZgpqzd3t967c+vRgwc3bt8bpun/+b2/+cnZ5EnTv0swzGiaJFeB4LkCWiVD3ZT3x8DKDMRGDw5jlr7f2lDui67n8rjm18l/mFdMeICKU+Eo1j4KBYdaanzubfMp/KrYtm7IPjiJO20EbYnVwLdjME7DeGfQPp97YRIqV5GRhyvTppHQhjNhXRYdpIO7QmEpFyulZsvZ9Z0dWVcRb0rzqqq1aLebza8gCObzxeRs8qVXX5tmZTroi2JdTedcMg1vzQDXyCIJyDUtfn/qogyYUtpSmqSJ0brM15B52vpeWYwQZtgKoR07ti8uwYHj6EbJpULXblhbKTJzQLbxddmrpDyo71IRaDtR4htwNDBCLjbGbY6GN0CymEfshMiMc5lcIju3ts+XsHd3Y+Hgir4ejtZ3ATG0G2bHznfkMHshCLatcMZVJ3tBLUbbHcgnQI2WbVVPeGExmYJhzJGTozfVURkdpv2N/StFXS8Wi2b6dIthAJ8x6xc6FklowGjQTMA0sCQBR8F0c6P3xmsn2o6v7v/s73/22w8/6PV7aNhG0CaDWl7rvUDcjMJY22jY/eGTx5/OFiKK4yjgHPJzcMHTQkwQd4MoH8TBcoSMXGFGMoZpsyShbOKAYp0/KGYiWdt6SMOja9tgS4QBuI96xiaTG+iZ0bYJS7V3M3HfpsYECMcqsN4A2gny8LnFelxQWs+m/8NXvvL2lStkuciWy5oQ5ZLQmGepU+o/T+vzgk0Gc/5PFOMgkYsJpFxNVc2qOiyrrjJDxnd6aT+KdFFQQUW/W1hNhZBIj4R3pZTRsNUDwyASxXEcRWHEe51OP0m6SWfY641Hg53tnav7+1vj8bUrV+Ik5JwmaUdbWxZVWaMZCxkMBxsbGxvDcacTB4GcT+eDbrfX7z/47PGLo6PbN64RCOwjhCwXK8Flp9MxKIAEl0KjzWBjNN7bk500TDoCgHHqzL8A1QBA1FobSNmJI1C2Wms1B85BcyMZY6pClXm5zop1VuS5qgrMiuv2u3leLJcLrRUQayznPAjDuq5Pjk6H/f7kfDqbza7u7WpVI0OVU7ZcNb9u3bzFKTk9epkvl0mYhJ1EhBGRglGuta51DZFNFteTIFnW1HFeDYCoHGJ3DW0mWqqVCWTQ63bPzk6rqu7EyWg4UFpBGrRRVTmdzWfLlWCSC0e1TdL0rbfe7vb6J4eHs9PJ7OxsvVoYpZW2J2dnnz1+/ODBpy9eHlZVFQbh5sZob2/n2u7+9WvXbt68cef27evXrl27euXq/v7169f29/au7l/d3dnZbnqr0XAw6Pd6SQqYh+CdpDMajDhn62UOcmqJe18Kb50HQW8wHI5GUsjVcnU2mSyWU00UMQ7s4ZwFUbBYLD958GlW5EKirQdBFzZd1RuM/MGX3ynPJ0l3uLW3//0fvP/XT558WJRFGCAP20WFuoxbi/HZqORjLeO0VWU6RmZTsIUQ7sjDTQ4EU6I3Doi3SWsD73mWaPJn0fxHI2MRngnHwXBzFnMoH/EgqSd5oOU7zjAGCRyevUOcRhVquCvn1K/E4EM0pw34dbhgYJ9Aa3DnamFP7ajChkCSGHgOnOdZUZZ3dndJXnQkN5QuwSoH7cGwuQwCeXR0pI2+fffedL0aDcf2/FzluRUwAGBxw5hZcLfBnMIWR7XNMWmqqpaB7KRpVRS6rpkTngDIg0piF2hDaKuCpT5WHte9rVOgt6tss2mcQxm9UOQy6qot2j+ylieF/RNzSY7efLKlUnvi1MUKlbTKKHflieVBkLSyLb/K9mSd9k/dvdSm6fvy6FnM+BXCYKpJu7agzP9LH0Hn5/wLKpf3h2bksgIa8i+9gRdkt1nu2wtvLgJx9UKOr1yxgs/nc2s0ptcS2vxlLDaCUMGsoExSGjESERoaEjEqax10Ohtvvn7CRH9399HjRz/80Q97vS6khTCfBUSIVtuc3o07nUqnG6NfvHzx66NjFifNNCYlSA6sM6S17SrB4m8cTu98lQ0HKZFt3QebUZVq6Kg928KgR5W/BSyS1WFlBnmfoCa4yOFm1FnqNH0Lxm03b0XjvgeIUe5eMC4hHGkj2ApAd8ewRYMfDt8uah6kWK+WXav+/de//sqg16O0XsxJWSZg7WC1atpLZag2XnmkUXwOaxrDm9/A5zJaUCuNDaq6U+sNQsaWXOHyjeHwq3v7v3v95u/cu3f36v7+rZtsOJwWuWEsCCOs1UBAM3GSRFEcJ9FotNHvdzsxLBTDkFOBLQDmH3AqtNGcNyNdMxxFkW7m4MFiucyydRSGs+ns9Ph4cnZW6Zpz1uv1Omm6Xq7TMJBCPjs8PDw+vXf3HjgdGM54UTTTWBwlMPXikp3kWUZFMNrekmFEGMelPgQ2eF4qZUbpbL3KV2sLH4GSVphgldFCcEIMUObh/oSBRmlFOR0MBtPZeVUWUCSbAgwsbhZwoXW9vb31+ZMnMpL9breuKnCoVkEgJ5Oz8/PpzVu3kiQs1qvpyXGer2UcJ52uCIQMQ6stxEW4PHZUJRNDtHJyI62snyCZUsZC0FYUNfPlbL4MAjkcDqDBYNrUVunz6WK1XoPmhwvKpQxu3rwpOJuenpSrhSoLhO8m5+ePv3hydHpCCdkej29dvXqjKaxbW+PxoJsmcSQkE2japWrYjpiqLFVZ6VpZ8EUhxlQqx5RzyL0lAfichJHsJHHTljW9BQd7Sx0EUW8wZIzMZrPFbJqtVs0txCExEua8IJRShs+fPX/0+DEOk3jGQR6zkUyIsvy9e7euNJdXDXd2fvvrD7774Ue/Kosj6H/9ZMoM/Fg0rLJGU6BYOm2QM7cyzsaC4m7KeHSKYvuDOS5Od2C0P/YNvhkXzY7PKaifjafWYNhoy4bicC9BgcX7y3iGF/GRgmipgaQE7uSyMKBARpNzCAEYH03ifZ44wpOcCcChIWcYTxSB+kVXpQBQg7QSXPMxK8VkuSSW3NzcNFmWhGFt1FprUC6gZ3PzWaWUB88Pur3u1t7+sii3+oP1ybFXiTC068MhzoPg1HcnVLuyaJXWQRjJKCpWK2KUZyHxCxGTxwGYV/I64U8L1OKHc2paXwNdNCIWsIt6R6lXjLR5hG4w930W9WP2xSrf/7JeQHSBGPvYfzDiCNuRFznIjhXkx9x2I038wOXtR5j3frbeuN+QS7pXay/zt4CnZ1v81LP1sIdglLtwfweR+JMLByzkxXu2nGNpkZrYwc5u1Bss56u6zH2KQDMiI3FKsOacFoQEBDjPloWWBoRGILDbe/ONSbcbD0eLLPvz73wnlgEYOVB0cKPcWq37xNxL056ynV7vwez0R08PCFbfIGi3KRAS4HtdaDvhykCyGpRVhPsIMOI5Eo8dh4IR3tx4uJ+DdphCTjBx9FQwySPeZ9hdMev24qDIcL4sDO4gbM2Am+8ZB7blJDhjSAXVF5EjnFi9y5Uj7AD7l9bEnk/Pb3Xib/zeN8ahfO/q1Z04TNZZUNWRrvtS9KWMGQ8sIAoI6TPgtRnb46xHWUdVqTZ9bXa4uBXF7wyG/79rV//w3pf+/2+/+19//Wu/98++fPfWDdFNJqpcMqtAcYzuFsbaJOkMBqN+vzcY9nvdbpLEYdBcdEYth9Efhs7mF6RZc8qa88j174wrY4MgZJQNx6P1er1eZRBfQ4uiOjo+Oj2ZLJfrIAi7vW4n6gDdSDw/Pn5+eHj7xnVuqTI1l81fztZLQkkcxwRClog2xXq5nM+BjRwgViWEtGgewDjlTERhnMRcClXXebbWdY2Xvakwxikv0XQIjmcKK2ZKdNNXj0Yb88WyyAsUZiLPDubS5sse7+w8fvqkm6SdJFE1xBdowyg/nUzOT09u3ryVpAk1pspWs2Z4LaIkjTudOEpUVdW1ohgViEs12FRiyjKQ8pB2q0HDY4XkVVV0Ot3FalkVxcZoI5BSMGGNYlScT+dZUWBcfBRF169diSJZ16UF9MJYOzmbfvHs2Wy5GPT7Tc3dGQ/7A9A9o8JOgzzDgF02a0cUTMPFlgXYb7BMgadKWx9+Q2DXCZGdQRJzTE/iqCMgRZatVktV1doqzpkUIfIHg+Zv8eV69emnj46PTpgA4ryj41BYmlK1Wr6+s/mVOzdUUabDwZNHX3znZ7/4yXL+WVnYMNa4BSSO80x8vDya1aHbAh5PzhqI+WWCp816ti3CeZY751kYv8FDDZY1TsZJvFiUuQ0udQMWdAwanUmsa+WRzdPiqVjKnQWQRdahT3iwLoDIepytjSv2EaYXXiIujw33VkwYKNcAoaDKHwwEMAWwaQqQkAUCIsFfTKdpIPeHI5pnaRit6rqAiu3DdvCApJ8/eXL1+vWk180J3YzC9dEROmM6ZzBqLL0Q5djWJ9sF5lOtam1I3EkppXm2Fnh0Oi0rwShFV2aYc5duzazazbdT5Pj1NqouXSFsvwtHmW1HZufb6V7CXrLAsJeURK3bFPGe+aRdAHuJE/wpl0F0EbOAzLtL6+KWbeWXvph8hette4n/5WqnbVOdyIVnonPfJG3wFkqYefsKvCVsu0nCz8SX6eLobwkuLbB9MfFw3N/cXq/z9XrNwGYLjP7dcyBA2sYhZj8E5BlWvywglik1fuVesbNVhVGYdr/97T+t6yqKIsiQJ26cMaZjzCtpOjSsFydHdfFXDx/WYRBFYRzFaBjpdrbwFRhsXsAgog2XAKcWoJMK0RyYYI/gXCqhXBpz4UkmQH3kCzkK5F10kIvSNE7nYKz3iKbOcpT4VBPjVWrwWBloToGqzKgjUFg80qmjXsMdY4zmzHmi45RLZJCVFVstXr99Y2u8ka+Xv/9f/ZuvvfvuK6PhtVCOLY3zMi6LnqVDyvp1PdJ2ZMhIq01jdim/Rtnrvd5Xd/d/786tP3z7jX/zu7/zB9/851/78juvvv323u1b3c3xqsyeTs+fz+drYHbW2jIucTbd2BiPBsOkE0VRdOFvCqQVHB0t1QGXsqn+VGktGA0kXnYqRcACZmhTjzmjQRBtbW8v5sv5Yi6lBHSN1rWanc+fHxycTk7LukrTrtE6TpLnhy+/eP7s1u2bcRCpqg4EU8oWeVGsCgZKM3CaJHVVFuulqko4phTi/0IKhuprWNgHURR3uyKMLSFa1aosYbBuwT4fcU3RLMF1RKGUvX7/fDLN8gy1VZxLQzTeFbEM+t3e0dGJFDyQwujmmiilZSCW89XB84PNza3ReJPK5lqUebmGHSqlJIyi5rRSzWQPaREasyPxmIbWTbiYNgobIHg5zHZcLlbb2ztCQq4wsbVSB0dHWjd3Ua+T3rx+NY5jrTUF1KKuzGw2q+tyNBju725vDAZCcGAzECqa6g/dJPq0WQztQDtJXH+izq057gEbR0mMhRRCd9sbra3CH1DXuhnAOSWo9oTmO5Do/GwlbOtDLriQRpuDg4MHDz/Li6qZ6TjVRkOIALawhGq9FQV/8M4bTTcpw+OD47/6+a9+OJ3+OlvrMLVEo/jHwttCjgZ+ccTF2VNUA/gh9ALkA4USa2sthjEALmiVcV0Y+qoi6bi1Esbz0XiPDOPMmZtL4SYpXFIawKi583/F3Z6bmQyuAilGxjv1LuHtdAgvDQx555lHEcAEiT5ystwKFgBFBlCw8dwj6yA23AejLIyAsRehmrHnZ5Odfm87SXhZJ0F4XlU1mgART+vhVNXVwfODu6++aigVYSfStjydMCmg9gL/AgVQbT5gW5I8/ltrxVnQSVNdl6rMefvVUD/jeSj4YkHomh+kY3kRMW3j7jFgllAXj8FarxJyQZn2llpeoAOHrkAs2kU7kQuelPvZ9FLULyb5tD836Q5xpKSu2rfAKaphcFVwgTGjzYe9UEFBS2EQLsXv2mEfrolzVcZl+9N2HndbcXqRlGxdRDt2kIygVkYzHxvlLDUIU8awMNm6dk0RO5vPLW6OYRDk8NkxcJATE1AbERJRFlMRGBtTy2rV293pvPbaCZebe7t/+d3vfv7F4163Q8Eln6JLqzVBVd3pdK6KIGVsFQXf+e1Hp9aEYVMVCKVK1TCXCwK5bGijAasQ9H8AmTw8VtpqKQSYENXMQlo7+GY43iPadWBrrA3s4xjYqTuMSKPFlXflRgua5gJrI4V0Md+0OVtBj8Gse0yIy6P1jRqA+hZ1cQyYWwbNdxnabMGPAWs7xpjWqplIquKqNf/TO2/9j//hv/30s0+f3n/4+le+eu3OXSKDxfl0MjmfnB2dnM9mq4WFJPs4Cjtp3E+TXrfbT/tpFKXdVEahQ18gEkMrMzmfPT48fDE9Kw0RYQgxGtRylnbSIAxCUIDBoIMZG6z5LW1GGaVVU0Q1JRRSDZrzGDBVQTnltdY4BDfHoZRoBEU0DeLYUPLJRx9Pzs8kFBWtlOBSaZXleaXrgEedTpwVORPBJ589YoL+6299YxSHZVFRLrDKNmVMhp1O0u2kYRBY2Iokg36UpjLuCLglgIQlRRQbTq3SUOYsp7paZ/lskS/nqiqIUhS29TDfaiGkUcAVgeKtlRYiWK2yB598slouCEO4uHlmhBBVWVrKK13PZ7N+2o/CsCpLDVwHwfgqz3nA33nv3Zu371hj6qoZSauy1s2rCMkFZPdq2Axo4D/U6DrMONgmA2hpIGdaq0prJZnM8uLRoy9u3LgexVA4Kc9W648fPszWxcZgcPXqXggQt+S8Nqquda0qIUQUxdTaqi6RbcIFtyDV4k31JRCjJNEjWsOFtRaWf9qAVB3FX46ygqkAiMdqH6OExyZnVAbCqObOayqQMpJJY3RtFTWWC1JX2tbk6HRyfDLJ8nVT+jjH5ZKBYAOIr2+OGpln/+YrX761vW2z6vjxk5/ef/DdgxfvT8+yOKSUW6/fbYmtyjS3nfOYQrGN8WMxJGu4uZAK3AujrJAxAu6Yzve+XaA4mZ+lnEulKoDE0Y+MO6ZIMz2ibpt6sSKlHBw5LIWoS2JQEWQ0prWhuR4aEzDKFDyfAnO+gVeFALzW6DBP4efD/MeZ0Rq5OdRoAI7d8gJJXgwSX+CugUhSRpVS6PVutGGiOX0rY8pK9Yn5o9df31J1rukLYz/JspXkfvaD7tHaxXJ55dq1P/jDP8zOZruVXn74werspA5lZlRBSE5oaW1trbJEEVJbowFB1kD6MpbopjcSg/6AGz09fEGqsnmDtPmC0E/DtDkyjFu/wreXFvSauKQ5jGbFjsN4zRIGJtKL5bwnWcO3B0yq1pEFcWZz8RtXIs1F0+CMWFCi5mOcDOU8jFxt9yCB2+5Sp1Rya2OvV2hRcUtaCxDjtU4+j9ZeGF+6fsuVD35hZO28J4FaZZ2IFXF15hlnzHmnIfeqjY5vpomNK/s0CJaLedOAUze2IjotKJjwEhJQEhAiKYsIDZoyTKiq015n9Oabx4xu7O3+/Fe//OCD3/R7XUiv8QEEhHBVXo/Dm0HcsdZ0O3/z6SfPqyqI4yRJIJhFScb8Z8dQEdvq7TB42IJwjTPRdO0O/EAWJT6szYFCLiH6XlYKQjxE4RlTaGnJHDcafTMgfBd9c+glGp/rCzElA85SSOPXaC6KDrMgSqYQ6+ZYcu6mgw6at+RoPBS4FLkyZD670ku//K1vrqazH//kpwenp3leDHu93Sv7+zev37t7+6133nj7rdfffu/d115/9e7d21evX9va2+kPenGvw0CsSQkzlK2K/PnR6f3HX/z28aPj5coGYRDHllgZh0nS6Xe7YRgaqBC2NpWuwQLE1EZR3Zw6zoIAwg9wRS+4lPB7zvGTOIIpXgAkcErIrmGEXr9xgxByfHwC+8KwVgrvF86ksWadZ9Zobu3Wzs56nd9/+HA83ugl3bqqBMOLSW2tAc1eVWVl0S9Mq3y1Xs1ndZ7pPF8v59lyUWfrer2iWgnGrFZQM3hz3wShKgpdVtTJgIxjO8DoBAeS5pIabeMo3N/d1cbMZlNrcHEA/qDQqjBBwzAq8oIQIkMJ6CU1yoRNE2CfP3u2XC37w2Gnl1LKIFeXO28viqO6wEcXsgmEweOceGwVjMWs9++JwlArHcURdlGcijzPj49Pe93O9atXQimUVsBY1agnBjPWptzCXQptkeRBGAZJFMedpNeLkiTsJDwIZSAxe7/5zrTTrVqtUdqG3QBzq2mImSet0ATcoKwGkpF1WZsUfghQdQkxutYnk8nxZPL88PjlybHSRoQh5dzl06EDMHzGplFerb/1xmuv3rihZ6vnn33+qwef/vhs8reTkxyedEdh1QjBMheTQ3yAAQ4ZBBNLSLt0pSi/Qec5f9C6MxOzOMF2Fm2Z4S4UaFrJmbfRwoOcceodBrwTX7u9dts7pOMyjDtEfRMEHeIojntLJlrLO3M5npZJd762Fj0whcMq1umG4eMwFyKLq23II2POmd/4ke5SGDCC00utz2azm7t7UV0lnGtKF3WlvXsPbseCQJ6cHFlCrt++syrL8bBXn05Mrbh3IkLCk/L2y9bF6XpuL7AltNZxJ+FSZoulMxPy4Wy2HVrJpUBgJ/CBW4o5SBaNxdqMYNx0th/pgo6Mjfbl5EHCnOT3gnVH0YTZEeNJq7u11N8hqOvFYZ2LIGxNw33cgyWthUhrxnqh86Xk0piMnoYOdkForTXB9iG1+PUwrxHGYGAcwTlzFqmexwL3E+jMERLDuC6XXAEVsja2t7kd93vLdVaVdStvBwY1EZSA5waVbvXLIkpCxppKrLUUfPvtNyZBFG5uHRy9+OEP3k/TBH2jXNIotVSpHcHvxGmsdTTo/fjZ0/uzcxknSZgwTo3SPhKN4mbE6cUZYL1OnGA4PiA+bswYb2pGLCShUh9gQJ1cj7beGm4edbeFRZ0DZv26SdcCcGd9joW3kOSQbOjUQRblxU79R8D93NH7PefR24/DfQnek06t1KLflNK8rsMif3N39+arr+bL9eMXh2fL5dOnz188fzY/m+brNTFEa43tKeAmvK5rpUldqXWWn56df3FwcP/hZx999ujJy5N5rWS3G3U6QkiUJ0VRZGH4U0q5EDTrAjVhVdfUiUAKRhmIvgQXVIiAEialoIRKCXwmiLLDxBtHVwGQFm93req6rjfH443hcDafL1crAgISkIFRa2sBITCVVkzr8WBIKHv42eM0TUfDgSprZmzTuLgWgNVKrZardZ6XumKwRNS6rotSlVWdFyrPq9WqWCyy+SxfzMtFVi7X08nJcnqugTyl4W1R4Lg040UzEzc/BNFa3H0QSjY3x6PRaLlYrdeZgbSDpmMDlrLRKgjDqiqbRpBz67ySrAxkKIPVenXw/Hlelt00jaPIxZwRCnZmAGbCJlbATaissoZIISgG4jQjAeFNW8MAnbVxFAVBiCoXQsliuarK4ubN60EggRoJ3qRaM8YFzDfA9eMyCMIoCkPQyYMNR9hJMHgqjNPeoJ/2up20F0RJ2OkQIWqt3BsA4oTzPcIkcFwdg4IIRjqD7WNzq1NHv9WKVFU9nc0nk/PDo6OXR6fHR6fz1bqZtkUAznQKw+cxKQEtgCTnRNWv7++8e+vO6ZPn93/z4eH5+Y9eHPzNwfMsiuGWbJ7q5hjiHDdGzXDpYonc8gbCEzXAv4TD750zk8XHkBmi3a4BmMkEGnQkMfm/1txZ4HxhsHAiC4k1nxGdLvxs1pwq3PiuG7ECztGjzwKuzp1ngj9VQLVgseFwnrEAKYBvCUKPTjmJtwlDVqdbSwMLmjOrLaecMAtsUCO8AzyqQLnPacCIJ1CsMHT3Oy/KdVnd2922WZHyoDRqYTQqh61n6nIpD54/39jYGG3vFEqNOt31yTF3BZC4jXb7CyqL8Xc89jzNl0tpnKbWmDJbCdb6YFDbCnNxwmWGXGw0XV2lzr3EJct7trPfilhnc+WTmBnx2g+cWX3MvjNbcNLXSwE6TlDm7bA8/k/aTHeadAaXEGKgziLigvUbVVWtAIq0KidCrbaOsYUKLXhHhgM7FvWqhKPxt9t5GUfZQ6Pv5hFnUICNL+0gVoMEQkY1s8gksLjhQSBfWRN2euNr19ZFuYQY1GboRHTfWNEciIQTKi0TxISMxIzHlATWxJZapa+8+kp29UoRN4/9n/zJHxOlAhlA+XP3LjH1BiGvpd1BrTr9/q/PT/7ui89tksZBKKTUVnNLMfZVN0dnc+Ibo5rPZQjjhBOYcdEmG+KM8FZrzgu42bVWmOKhYUULz15z7AL3yLHoAHlzyZTIYsSJwHcziDNBcKF3CDfaIngFpqbwZEGeTPNgNwcWavMdwUMAuoWkEYPaBhfPQnxig/ODaSqgUm8S8x//2Xv/3b/7d7oo3v/Jz357fCT7I0l5wljIaRCKKAwFZ2EURlFitK7Lsqp0WVaZKrNmrJFMSgZOT9QFVWIiAFZMLkOJ0rNmCAbDSNdAUKtrrZWp6lLVNSJ5xtnLO+5uFISBZCJqvh1I/m3ud9U0H0ypGllZyijRTAG20+kUdf3w4aMnT54aSgIpraFal4RyY4EOCq5MURKvsurw6Hh/e+PNu7cTGWg4WBm6H1PLQd2mmWbNRC6DJIrCWHCJpqDYmTHgCBlVg+uvIAT2Cw55gPZTOwU/zEwWwBJceblEnSCKqqp+8eLw6dOnRZ5Dh0G1si7mmZIawh4icOZyUlQA5I2xylgZiO3trZ2d3UG/L5t2RFeqUsZwwq2uUfqimwKMjSAgn+g1Rt14AGxX01QdpTmTltgXLw7DUEZRrFTtFkrW+Sc13yPn2loOTs3NqO2kHeAJgCnUumkApZDN3+GSR2HcSZNO11gzOzk9ev68qnNGmNK6yDPGWNrtSiGUUlpbwZsKVAP9jFJalZUxNl9nq+Uyr5obzirrehTAlrU2WL2b6k7xZpaQh6tcPKRSiZTv7G5Nn744Oz63Rh2X618cHxdxR1s2z/OVrjNlC1AsNOc+F4QzwznhnBgIEvXMOixcBNFpr8p1sdmwTgI82QJubL2lAY7yBjxojZNhwkXXzXUygKAA4wpWvI525fxFYYDUurlhqbdCtvguXGwDiHgBx4YyQlzGBs5BujmKjbebcN8SvGv8OpEjDSpKwYGHBRnHVmuIakArNYxoxzyopoGwbrJ3lomKkNzoOlt/49rV3926ks9msyj4aLk8N0QLCHIH5IRYm1clZfSP/u2/D4Oos1yFT54cf/bQSp5ZUxCbE1JYW1NaWq0IqQlVkIZmqDEo9IMOpdvtxyKYHjzTxVo0h1/z+XQzPHNw2oK/jXk3+B5BzI00HksB1tbNcw3xbbCWb/Fd1gJE7k/gW2plnh5ToBeulORSiiT6PcNwYsEhGq6/Nq1hKOdhSL2oFGlZF1bPbsvOSDtrU2/8hRbZjkZmLwlOCe4VWgwAodJWENz6SvqwPuz7HOzuk+8I1l0EVpk1vl9pSt9476rlcjmfW228A7rl1goALDDrV1ImCQkZDYmVxoaEsaoe7e3Ru3fnTPZG4+9+9y8W02mcxBZgPedrY1Vq1Gtpd6jt/0PVezVZdl13ntsef11mVmZWZjkUCgVTMAQBeoki5diSOjSjjjExMRET8zrfY17nab7APExEj4tQj9RSyLVESiRFA5IA4QigAJTLSp/XHrtdx15rn5toRMBXZd48Zi/3X79/kmWHXfV3n35s4jSG4WTv7s6wW8zW5FWGKKq1FB2VGpfnGnDkXV+KULQSCgIHiIA2LOQFDyJfrIA+EpQQNmDgQLWKaA54cBG+E7Z3e1o7vsgMK92epcr67kloIsGcA+hNsNVE0NAQ0zRoPZAgDYOGBJe1Uq6q7wwGO9f29jY3zo+OD87ONOeKWB7FLI0aQlatmTfNeVWdLlezpimVrZzTnEVZnuYDEcW+jJXIsvC3WcTCR2Dw2DeUaq2VVkrruqraVjVVXVb1fL5YLVfVqiqbpmu7tuk6rYy1sBvsy1ptdFO3VdOuymq5Kpu2bhvV+v/uoBnglNKd7pxxAGHUVblihOzuXBkOB+VyuVguLdGcC3zWDNGIma+rRjA+GgzOpvPDk9M4TfMsQUMsCHKoz6WQKDDjY7btqnZVzpumMkYVWZ5mmWXGKs1RFWGRA+9/MUIEcd0HUS/Bdx1gLCGzBacayPDo5tZkd3eXUrZcLMq69gcsOP1aZf0HkEhZI4ILiyk67P5JoF5fnJ+fnZ5Nzy+6ThNG4jSJowSXy63zx42AR9cnZ/5yWc44rNn4hw0KC4AxWRxV8GW5apomiiOGAEbIhZIoYmgZz4NBCufrvjJsJYbxpCYatbdat61uVVOWzWJRzublcs65HO/uTLa3uZCq68DJKrHanU9n83KV5UWcJkYpBaBpCGbo5qGN1p0vVK3Vhgt/rptOGwhpmKUYp0HnJXoho/+RBWeCC9Bp8sPjU0rdC3dv37l96+Xn7/7RN7/x3Zde/Nazt79189pv7+19ZTh5Mc6eS5MtZaKmii3kLD4X1AzGtgES2K/vQg2K3VnTW7T125j+qjqoN+C/cRimsnWrObidEXRMYRSAmjw43wXAQCg2wUQcEbIcJywcTRJRXGJMX+HR4FvGcb8kLA2iszjMOC18CQ7lgw2SabBnwA+Nq1V8TWiAG88ZESAuw64kCBosp7j2wsD61gK5hTEuNBMH5+dbw3xnOOSNStLkom26nn2IBz0Toq7r05PjF196udY6GwxltermF1RIQqCBgLRdDIRwtAXaCA0NEuvvv07SNE6SqlzRgBT0McTSS7f6dTkcJE5Bq+oMW5+L5HL5hq0rTdAprv0UHEM6JiZSdg2i/gLaqJeJ9QPYXsMFvxx9bXBk6R8MLmTS//YQFxwyn/2Hp4HXEITN7BIsSXvYCqZPl8vG/YOCMjII4Ui8o73BM347fkn0XnvUhliBG6UssEvDoIfAKH68vZsMi/liqTrFAi6GYTvCPxnwZSV1weuX0tjRhLFI22hQTF6+d8bFxtWrP/7xjz766MPRaNAv8QaPoESbF7J0h4pUyDLmf/nhBwvGkizL0kRrAyJnXBKmGvpOyNAIrXFYrsCNCNIP07HdC0Ih0QObaT9H8lkUbDFagsBVmMj3mRfpZwAsLHNZ2wfRHtuKq4nY6OD4YfotBgjA6OwPjXWOpNsAj/uC7xQ2nH3IRzYep2RtBowfntHWEqUUXy5fvHVzmGW3b1wvZ/PTiwvDWNX5P6IkibOccB+QNCFUSE2cRimStWVT+cIFIlXTtcoYpXTTtAg1rOt6MZ9Xq9KXMlVT181itairum0awBd22iGC38DiI4zM/B8S2PjSX1ikeUKfH35HCz1wf2IDY4FAgNGQr3DnjOq68XC4f20vSdPFfK6glmKMOB8hnGDSlzJGM8JGg2Gj9cHRUadNmqYCBqiMs4C959RoLaCNwBiPYjkejdM0dtT41EArah2XwoZlJRmlqS+LpRQyIhzms1EEscEFyB0wPv1xY6FmYhQch5UQcmtra2fnCuOshmuEtHUo97E95NOpmCNnOQwdOWX+Z6FEdd3Zxcnp6Uk5L7u2YZTGaczBsFgbBb5Sl0QdyriFFScGW7SgeLCMirIpF/MFZ6KqSg2DYcEFiBCp0q0QnFIBS66wPio4uASBjIyw4CsNGkkY/CKNyIL+1jR1Pbs4X06nSZ5uXd0fTDYoFdbqOI2LYX4xnX786X3VdYPRMIoif9gYWAgjNo6jPEnHk0k+zCcbk/FwUBR5PizimEdA7mABLMWQyolq8yiWqIzy/0NwR9loc3N3b2c02RyON7Mk3rm6s/fMjVt3n7v76iuvfePrb3z1ja9+9UvfevPVN+889+Lm+MVE7rUqqxqjTalVi2sDjK1Rf7hXGiZ2lPbe2i7MfdFoNFjC07XgWbtQb5Bw3rF+Lkfw2LHGsl76SgM6C8FYwdQIez8O1+LBqyjAIuEJMQbSM7aeXJLeXsXfGlR6cgb3xTmOEA88FpBYAGlBwiVxRgJlWjo0qvGVJlvzqSk1YFUH1nAYuFhL6KOzsxtbWyMeSUuk5Gdtq1kPOYTjSwh5cXHedd3tu88v22YyGDYXF6xrCQ+9usAWDEdTCIAMAZbQIjTgDBrnOSWkKVdBHtNrWnp+4zrmQoHcOytC4oq92rV6Okiv6CVsiroeD/1FF/z+Rl8uDJMetOwuvRMuR9G48B0YDui4I6I0tP/XrBDXf8weZ/WFiTZnl/pqu95OC4RoKKlwDEDc5Tm/Nj/q8Ra+rF4X3WE8HB5YPPctD08jKB/wGbIuGY2HW1tl01ZVzYNVKIVdI1h/JSRs/VIqCY0pkdYlgIDmjO6++sp5nuVbOw8fP/yXH/zTcJDjZ16D30TXPpPEt+IkMY6Mh3/z8QcP2y7xxU+KV9sXDThDQrYiZF9oUACdXpRChDr+Ej+KUjZcZcP+aQ9l8XUMQkxsj3hnvWkV7rfbnhEWTPoRDufLDQKOvwZIyL2MJjwQ0CkVjNEei0rQJxgg9r2qgvcj+TXYGzozuASMU2fomfhvyaWs2kYrmzf183fuCE6fuXGjq6qT83ORxK1SVbky1spYShk5cE3A+RMTXJugj/fh11jstjkL6T/u+YNVDp7LyFnk0L0VSN2Dnza0E9ga7IdlQgDfRrGMZZTEaTEoBoNBEiVpmkroY0PjjKztawRAeTih2ijn7O6V3WvX9jhns8WiUxpchgM5lhLmg5Pq0iSVUp5dXJycnkkpRsMh41yDIY8BxgJjIs3SJPUFPr4nXCZRHKd5luZ5mhdJmueDIskzHxaSLMqLOB8WG+PxZCNNcsqIapp+zaDv/gb1B1A8GYM6r4mE3NnZ3rt6NYfNn1W5AiYiIxzMuCwMl3vsDkZPTjHY8UhIznlbt7Pp9Oz05PzsTHfKGdtAsuKslUAvhx05hoIOBPU49KekVDA+yIs0TWQkLi6mbasYpRcXF/PFfLVYVqu6blrrTJIlFLs2AqpwGzDZFEiYgRkBdQnFzW8osKRgVnXnJydludrY3LqyuyuTrFOdEHxne2djY3Jw8OQ3n9xXxo0nkySOwQkvNAo61YIij0shIimSNC3ydGM82RgOR6PBaDwc5MM0TSL/h6QcccwWtHsSWxCrsnxwePjJkye/efj4g0cPP3588ODg6dPj4/ly2TZtMcgGWxvjW9evv/TSK6+/+vV7z9+7efPWsLjK6a5/I5SuqpVuFRc+CwkuRpT3r3wfiANY4XKrFV5k/yBDh8sn4miOgqY6PRywRwwiYbFHKPbhzlpDepE2Lk/DJSXrsQKuA4dJb2/gGhZybHinUJvEUW5LWO+wGyjMeB5xkGjiSSsIiZmQUESzoH4l2AoiQW4Ka6WgRIbMjC+67nwxf3bvatypVEpFyaLrbHBoCiuGkeRPnjweb2xcuXq17MxGmrVnJ8ECmSDchGHH2IYRWTi+XK+X6VrFhMyK3HStblqOxcQXnXJ7sVkYE7O+0girwLQfJThy6QcRMNyW9ivFYQnMrRvMlKxjZr+vQtb9atZPbdfOG5eeRAiQhz3gnhEZbANDSboW14bMbE08J73JcSD4B9QDDSNqdLZCwV4wxAzQQxZeRAfbtnZt/IwfnK+l1ljcwyCUWsJxYzWON/auakpXy1W/Z+VwTsydfywEpeAz6ISjESUxsTHon6XRm88/121vqbQwzv3VX/2FT/+lgGENZmmOGbXL2Qt5HmsTj0Y/PHjwztlZnOd5lnIWVhGQs4kLDCCYWo/x+1XuoBJk+AKQfpqLi0a9nI2smaVhG8vfJbBzQXejdScKBV6MrrsNwSCv3wjDPX3cekYOrY8fAcsRHKThLXVYt7HgC2XxkEYhxuUGOA83nQWnS4dAbY4TJMZL1enp9EqS3Lh53Rpz55kbnLqnB4fQkxJlWa/KlTJaCBkJ/zm01WBVxKSQaC8KK1DcF5fUn5gWsIi4wA3fgSmrOQ7YLOIrna+ykNXlY7RPhyMZRYlM0yyOo8FwmA2KzEe6Ik7iJI7QsB36w1xKzhkqtqiQAtcKCOXGmiiSxLGuU0Kw7Z3tvf19Skm5XDZdF1zh/JkoWqOrsooE293Zee6Z26OicNZ0AHdMsmw8Ge3s7o4mk+F4XAzyvBgUw2K8sTEcj4piGKdJnOUwIo6plCyORF7ExSAbjdKioIRW5aqcz8rlHDyv8MbiFjF0uYgvr+FstWCl4Ah1WmlKyWRzY3fv6s7OThInzlnlNLHOaINqEgMyZmtMb9ZtjdY4ZNTQpx0MBpFgURxhZpckseTS9UcD8GGCERpMrxgOJ6H1K7QzILeKDg6eGmInk7HgPJKJtrqDiYBqG8ZYPhgyKay2YW+RhL4rZyKI/zGJtBahUP6uMP/y6q6Znp4RRkYbm8VoRDnvui7zj9yN4Wh88PTpe++/O18skrwYjseotgMZsC+5lNVhAMOY1h3l2N/jRZEVWZZl0WCQT8aTYeEfFUap6vxn9meRkBaGux2lrSWNdsfn88PT88Ojk88/+fST+/cfPz04evR0eX5GiMt2t0e7W3duXn/9uTuvbe0+k2b7eZYZa8tluVr5Q0HGPXoORmMBg4WQOqQFUBocUHApKFAzMO1mLiAvQ67Zd1PRrywIaSGtRCdsDEGccxfAGmgUwQzgeuBwIb05m4+Q6HCKWizsaxvUGKIXAtS7BDfjoNkNe/fQugCZaERownlkXNa2EYi5wOwNK0mLhNRQZ0FWTQg4tXB+3jZ1Wz67u8vqdhhHK6tX2gRHPKBRweHEHj18eOPWbRrHnPOUsvbsTAhug+wZttGg6U1QoLDeyuk9G7XWcZImSQriUO3rWgy0jq4tkfoyk5igS17TH3uLx37cyb5gqk/ZZZ3LyGWVi3KMwB4ma6xlKO7pWo71RfTHJV8DQN8yTkMiFLIzRr5A1SJr4XO/wkbxkQ8AiDCrXc+AWU/bYDi3/AIAGn+M4Cu9BmT2n4wHt0x/uXgwUehJi4QaQsc7OzIrVsulVooF3BTh8Fmg9nWCIPSKRaB/jilNGeedmuxsyzvPXnA53Nz867/969n5eZ5l0Gzj+GmYc2NrXigGQ22LvHh3OfuXB5/TLMuznAkBgcOiLaa/8Tb0mdeO8giuhkYUotIZTlh7cmbAbkAlzAPNjPI15MUgHQm1ejZAUHBkj+tioZOCQmsaYDYgRzLAHaF2zYjpsx2EU9IeAI5bCmvHK0RYOgeSV95Lg8InZEE2xoIyLQwaOGuN1oTS6ew52DIyxly/tj+Q0dOjw45Qy5nSdlVWq6qylgh/qkccKnlHHbyWAN9cD5/wM1hDkLXJEUmB0AMfULD25dDQhB4uz7M8jiMIt1mRFWmWQjtXxFHMWF+5hbGQ/wsow/whwAWHAiiWUYRKZgQTAAKDq05FYMywv7dfFIVxuq7Lpm3ruk4jeefmtTu3bl3ZmEi4cnGabmxt7u5dvbJ7dVAUcZTAJ+SSx0JyCe1l56AjwriIIxHHUTFIhuN0MIqyjHDSrMrF6en06LCczpzq0EgHU81ADoT5MmgXjQV3dQ6dc4fFCaVG+xM6z/PNK1v71/d3dncnk80sTeI0RV13p5XreVLYuh8Mi9F4uL27u7G1uXHlyng8zopiOBkneQJC4oD4/cJjxhDvEKo0bDVxfyIJn8zIqqmnF7NnbtzKsjTN4zRL0zSVPCoX9bJcOeI2NjazNG3bTvhqSfh6y6EA26KFKObdONBxnITJJQwSltMLZVSxsSHTNIoS66xWajwobl3fv7K1dXR28d7HHz189FApVQwGg8EoSmIuZVglCC46EDRwFGadMkj5xr6aS+J4kA8iKbHSbNuOcxmJyEc4AxpAzoWMWBwpQkvTTeeL89OzJw8fPv3oY30+tcvGLFsSyWJ3++4zN+/t73/tytaXdnZ3inxZlrPVygdIjiDlkFIHejNM/23YQmFhKogQQWwZBtFmMHUA1g8cr7bnt3B0TesZg6E32rcokSiJPeSAPWMB9uICBiRE+l43FMJw742IaLDgAAGzFg7fkzuY6HEmnEuN3bXmW5vbwrjSasKEI075F5lhp524oFECngqm4NwydjRbcMFuT0auafMkXrRgG0z7EpIwyUXd1MenJ/defKmyJk+LqFw0y4XgAofePkVgmGHSYLyIOCRcvGTcWKuNSbKMM1bXSygxOS5rObJ2bXZB0hRWmqALEQbtcGgGzEpInEKkdKHL69YS7jWK3/UN4n45CRlVNHxGFvzvUfbaQ1FCockIzQYT0DlhU7rX1K3HyOTSwyl4O/iIYylOKHvmVUCVgP98YHqT3kn40sTBYcc4bGExFwgxoO9iAY/owMkPqM6EQyBz2pF0PNnY3V02arlYomUHIyjG8AFYcn+ZubMJoQlhMXOJoQlniTWZlOOvfOUkiiZ713/61k9/8q8/2hiPCSz9oiqVWZto9WKR36A8EsmZtH/+3vszxnI40tYat7WLPQ5rGbTsSJCtYmfXofkgJpcg8XO4GtRvpkGstVDlwDEHfRrNoWIOhYL2aRlI5ALXOyQ/DPXVGmwiwOEfGlWMo3LRhflQyETD2lyounm/QYxLSqxXs+NYbm3qGAyxATVGA/QSzdPAGpJK6oRSb2TF7+9d/Z/+3Z9Gaeysk0Xx+MGjv//ZW0+7jkSxc7T1VQUTkmV5Mh4M8zzzFR60drRFZWogEK2B7xh6UOshZNgViKM0LwoKcRufby6g+hJC+nMArqCUiOSFFTBujQlXgzJQMEEkoxYilm27BpSxRFJJWJCBYj8cZsn+O80Xq08//fTg4HAwKLa3Nos0TXjUKRUnMivyASzPiEgizLGHC8GFRUsAwR1ncZbLLOdJJKOEC+EfeW3batks5vV8ptuWQHkamCcWWt/gRej/GVjRxhdz+KOA2g4XiDBv8SkFRlaflnDJIy5QCAqVn1H+x4S7qxShtFNKcM4lRUMFAobmxXAUS0mUWsynTVk7q4FDzjFSsHCycOTJgWIMTiAArEsitDIXs9n9jz/d39/fvbrdtY2QESVcaaW1ns5mF+cXUSqff+nlrStXpufnumthT4Eoo3mvS8FQ5L+yM8HYENoSsAyvRZZv7O0TKQHUacv5vJzNTNclUewoPT07/eij+/c/f3C+nGd5ur+7vb+97R+2NIWr499BpRVYaDitOkgg/eujteq0btt2tShbpebzpdFqNBhGQhBjrbFdV8M7wLEgTOJ4VOSCWkm5qpvV2bSaLYiynTVOEq10kmWxlImQjljTKc34z09O/+H0eArrXKDCQNIshyho6HoFB1X3EH8MTnFxRu3PVottZKBniOA07PNjQ8ImlcGZXo/sd3jwUgeOKetogQvmsC8ASxdhExQhuOG7o/MLWBNCRkoEgzmu4xLb2dZFoI+WlCSERIyMV9X/uH/3v339G//Hr3/650/ul0nSONtQf0orjB/Wp2n+78bfWWKdlKIxbta2UVf/6b1716O0btunhHywXNacAUeNOhMWvmfTiy+9+ZWvfvVr3cnFdlXOfvHTumtrIWtna0Jq6ipnlX+WiKFEE6tB8ODQ4B6kM4PBIEuSxdFRvZpHqO32Jy0DqBxeHWL9HQnnLrCLmO25x4hMRpvnPl6uOVYOrQlor4oOJkpwBDvbez64EDQv+c/9JJuAuwvgTYL3BM2KMdrkkDAEgIM4LGN+gWcaXLSBZUXDJnvwTrKXi0TrTelgcxvCc5+dWReMjlAFH0RtrG95gy7J/3/DCRO4Gu0ci6LJjRuWitl8ATkKGDMELCWqrgh3LqIQgCmPqY0JLXxtaK6+dG+2vc0mG2cX07/8yz/PskQwGRJvaP0I3d2S4oW0SKWu8k4AAIAASURBVLTriuw/fPT+QduBG14a1nIYg1kLxg5/bBpjOQOleuCuszDWQWiksSIWxgaaJ6w2wi4vvI2I0XdfIHhi/9pQEFmAlKDXRzsK5zJDxRqj8H25Mw68CnjoeVi0K/QZK3xFA1bOjgsBu0+99KJ35EY4pbHWV1m4mQQjIEDt8L7xFRRxoCelEg5BBq/pUKlvDAZ/8Mzt//7P/qvV8rwrq40ru6cXs7/7+S8+mc9dlmpgR/hg4mwcy2FejPIizRKoqALj16FbLdA34R+cEL5atVqLCPhXnML/JxsbkyiKBBcaYlIUxYgB8jE+iomgNNBrOSFaK4sYAH8vlEHtSd3WXVcjxwQ0ur5s1loLIS3qPLnQ2jw9Pnz06EFbdePRaLK5xcHUIoqi0XiU5+loMIii1PhDxke9frLvo37TdQB0lSyOsjyPigGPI8pEEDNqVS18Fu+MEdYRo0zXIRIatroZbECFE5Nx1unOv6KIKWBUKQUCTEMQiMb9xTEgWeVQqIWSCpI/AavPgvMoilXXNlWltYZFFOs4kVmej8b5aJQmme3a80MowQnsIICSAJEgPo91/nYosF0C4pHTnfGFfuSPVaP8u9409cMHj6uqfv311zSALnWnF8sl5oiU0ovprO3Uy6++cu3mzYvzabOYxZFU2qzrMWesjNMkS5uma5uGmM45l6QZGGloxmORpelkDLu4/uFomrpaLKv53Kg2ljETou66o6PDBw8fPHr4aDZbKmOElGmaJFlapDljLEkSIRigmvy706m2rSqrNdChxfnFBTHk2Vs3hlmu2hYeQ/+n1l0RZ3mWScmJof5anZ6cT+fzrjur2+OqPl6tyq5ttW5US4LlOksEiwjJomhwZedJ05y1NRw/YfHUn3naBtEN57gax8I2aBBncIpt1bAgqHQHDTPa84ZDTQQxlXDKYK7AGbOCcmhOoSEQ5bDKhGzasJlBKDEGXhUwb/b5FmBLiAGjzzVj2eLzAy8T6GlAnk2djShNKE2si6l7QdP/9et/dH289b+/9Y9/dfqoStKVNg21itDGaBdoChRinj+rhf9Xy7hYaTNv203O/puX78WNbgl50LUf143i3GK1DF1Fq7tVXX/ve3+ys7UdLVejw4OTDz/QnFaUVI401FXEtpYqn7xRTV3n3wD/QxokW/lKmA9HA2709PCQaXAigUto4DTzLxfroSX97qUNJSwNYdi5npwZNrPxqIU4y4P2eF2b2cu71DeZQ1URwpoLMpzwPXppHo6luZDpGhKxbomvJ8BrxRX8f4sjcbi8a5tp0iOrEJ7o1mAucjnjJSwsMdHeS5IEGVhIDBzsGmE3xjHXG4hQnx6OtrdFka9WpfYPJSXrnaUQfakAxGdCiX9QGI2cS5ngndq8eV3duNEkCYujv/rr/0iMiaPI4TAU0c1Gb1P3fDEstGXDwT98dv/j5UImSRIn6ACIcglG1511jI2s99BF10lIQqAHgwarxBJJcf8MKlB4EFFyhZcJbE8oMQGkY7GTD+wRSG+DifV/QT+F9Vm0kAuTZnwwQLzk1rdtbSlMA/Q8rA73QwzcPsSEoCe4g+oq3K2QFPR6Q4obtKg2Z5R21q1UVy9XSde8eO/F5fnp008/m2TZq7fvuLY9Oj3tQNtNmfCFG6FlXS/KZVmXRvsLJLkAuhNobOFvgnMB1kawUytgXdInF3GUHJ2efPzgoXG0XK2s8e9Zq1TTdXXTrMqqqqq6qsqqalp/gtd13XWq6xTQcUjXtlW9aqpGA4BbCCBNw40TQsRxIuOEyeh8OX/vw49+9c47h4dPJZeTrc00SRmjRZ7t7Gxfu359Mh5FsSS2x+hzgDCDfKOD7dSoKAabW5Pt3eHGJs9yFiUOk2fICJqmlZyN81wS0lSrpmmRIEH76Z0PkJQCUspyiiRRmGIAaBDeal/uIGSQEACdQsXsLvM/nyPCZN0fvnVVLZeLqlyqVvkLHUfZeLK1uz/Y3IrznHFWXkyfPnzYlSuOwJtAAUYzumA23TOO/EfEsYExFjWxuFEohWSMn5+e7+zuCsnjOALTqjSOk+ViNZ/PkzhlhH700UfWumfv3GGcl6sVTAM57XEQxhouxObOznBzEuWFY7Rpm7qqVafbpsFpSgxWgFobxnk2GMRpaohZrFblaumUGuX59b1rz7/wwu3bt/f2rhbDIWW0aZqLi4uzk5Oj4+Ojo+OTk5OT05OyKutVGUm5c2UnStJPHz4m1r12714mZdu2wQGe2iSKhvmAU9IslyfHR/efHPz0409+8ejJu8en756dvD+ffVqXR0TPOV/Fsk2zLsm6JO2yrE6SRRTPZPS0LBsQIbpgzRt8gvHEgKmLXZMbsFd4uQG6FigDDxLT+rBa5ux6IIi9yKDIQgEWOqjZoKWHOB1m7WsPAfSKwOZZP8ME5R18NmioMKh1bUgHUXUEalnuqHQuYzzrmq9v7P/xl755dnH815+8d8KIpkTBT4qcyP6H8Xl1AExBWi+szaNIU3ZRVXVT393Z51WdxFGj1NIaFxZaILYwfwg+fvr42bvPW8Zkkmaqa2dTChuMFuFkvUKU9EJoMIYIfVdQRLusKDhjXQWKaASXEVy0vuwu9i3kfuXX9kL00B1GVTvcFt6Ttl2YWpP17UBCF+nXjHpNVDDn6IPuF0DfeD4EbY8gAYsRfiEhX9Ba9ZaEcAOhQxAad2E9CpGXsCSGDOXweQhuMIVvYdGPom99r5lnwTRv/R9Z78GwVoJpa+LhMB6Pq6Zr25ZhwHPr5WMkiPkvLwkVjkXMSeck5ULpbDSIrt94StjGxuY/fv8/LeaLyXAI0Alsh1PmzMDZ54pioJ0s0l+dHb83u+BJEkURB/4LPMqGCYGsSGReOGM556iu8h9VoL7XYMfAoN4KmK00SMt9ugFx04D0yQZVly/ihDaarmXvNFwi24t8sb9BetNJQ3w1LaQEwasNyQ6AUgSX/q012h/NfalrnGWWQSuRwTZ9v+/GfU4AA9Aw+SUISHJB84/KW5wLBZd+HqxghIzOdPehbv/j229LKb7z3d/ilP7qrZ+ON3a+duf567u7//zBB0/KysQJ6CFhkORsWXbL6lSwcyliMPxlFqaBHKibWZxASOKcs061qusgqeAyS1bH7U/ffuf63lXh4zcZX9kYFEWW5lwCdwxCKqCujBC4/WJ10za2Ndb6opML6f/MBec+d6VcO1fVzez89OHjx/cffH5ycprG8c7WlWt7uxsbG5PNjc3xZDgcScGc0drYTneS+erSwvTSEGsYiZIky4okz6MsZ0LioECpDtkhtN88SOM0lVG7Wp0eHdfzKbX+ybHOWaMorPngoAz6h9xZrXXHoc+utRJsTcaBjTwBwCMDXnhBbO+4YAAS0cyXw7RarYgh2teglHCRjgajzc14OKBcGms1IVLp6dFhNZ2C/QELqvhwFDjjC1+Jb6IxKPAGKr022OayqEAF/oIzJB9mXPLZfLF99YrThkUiljwrivHGxuxidnR0qLWKhHjv7XcYIa+98YZ/ck6OiXUClkZgBkOa1eq464ZXNrPhMB2OuqZul6VTHWyTteZiaoxJioKJCJlmUV5sD4qtvbYtq9nx2cX5ede21Lk4Ete2J9d2rnBKOqWstUr57Mdo55MbYhihWZYzGb397vtv/eIXz9y8/sa9l9uq0sYEqaMlXafqqp5Oj6qLC9V1x037UVk+NWZFSEsJSWIC75F0hhJunWHBmwDlscHLgCQReq4AfQyEGo5IhtoRXxRCp8qGvV80DcXNADhbUL/KghTR4HIRHswW9sEYWzMoA77fAHvHgH4KGlim53DBZNQyixZGlmhU2F0uxhDURaIBOUWbhbWMlwcbGAnTfwFw0KEmL1/Zo1Hy3tnjo65yYFvJ0Qa8N5mGV5LRnu1krBNQbnCjNwVTSfLexfTa2dHrG5t6uXo2y5arxQzeAQJrbNaxNM7my/nP//XH3/nu756rdu/GjWQ+N8tlJIR2CHBmmBBbSoRjKCUn/diGMtJ1bV236WDY1ZVaLkBhEopAjk1UpJBDjmCwbc4swYXG0IwNreOw/GnXMucwREclTphgu96tMIRN2xcxgN3Aqa8L1lQmgKCD4Y7AESZDZ0RrQ4H8XxTZiFV3a3pav5MVuKRh1ItAJUvWsiEc6gZtHq6+kQBZNOhFG4JLGAQDEdqw0JKGnEBGg80tbUi1asIuGLbLHWXWV73CP19MUhoTIgkRFuz3qYkZHT/77KkQ443Njz/55MP3PxwPChfS+YDUjjt1M88mTMRcPtHqR48esDiOZBRJpKj705ZByBQ8+NuDzCB0I4Cfgv7LLAj5oNOFzoAKXI/QeBtqXCoIIlJYSH8uu9Co6LKwFUkooIzwIgarThhIGBLoK7CihzuFCKPBh8P0rzOm3lZiF9THIY6trF6IH0bWgRvdxwBM2AJx1pget+d/MBRGAlkcjD+i+FFdxVyKn/1SN+3vf+/33hwMf/nTX/zNP/z9i3ef/6NXX/3g5ORXj5+UAHsEXIKBlIcYbSpVwmQTZhYmkH6JsyiKds7FgidJksRxLCLlyi+98tLhyflbv/rVs8/eHmbZwZOnxighxaAYcsHjLClAqe4L0Ty3RnPGLeXKKC6EsbbrWlXptlPT+Wy+WExn81VZrsqmNSqK5O7Wzqu//dK1q9ubG+M0TZM080mZNpTYru0CbVfQVpuYR4xHMk3y8UjmmYwzJiQAvY0/1GyQ2QjOcM+KM6J1Vy6Xq4uzbrEgygCdh6HU3ziczWGmZSgVjAiAAfqbKIAk7IylguLaq4+/PmUywte+kcMJKvSxoZ9pu7quyhWwPAUVrBhOxjs7yWhIGTDrfSLCTNMcPT7Qq2UkWIDEgyyfW/8ydVaNRhPB+Wo2J7gODmNmTpCS5h8eySUQlQyxTkYR41QIUdWljPYULJ2DSQLV1k22RpPJ4Ojw5P6nn2ql3vnlLxfL2dd+69tXr986e/qk7Rrwh+DgGM21MdOT065qi8mGjGI2krotaSOFzfzxorQqSya7KMvQncV/KhFPtgfFaLJbX1ueT48PD+pyBYaRyt8/5SIpKLGSsjRmRnPw72SnF9Mf/vytp8fHv/XmG3ev77d1jb17rRRlRPt00F+bYjR89Usvnxye/Psf/+zR6UVTFNFoQJxVndb4Xji2bgnBGmyY3wF9ziF9nXN/45DPQ4NBDVoAw7/7SCmVM6gXdj5eW5/K9z7tsLDlz1OE2va4IX/pkdRLglITTXqpBk6Fdb2MD3qqFr8dI9wx419GWNzAuNx/XxYA+iGAAYELpsk2dE45oxbOI0N8/E4cffGZZ+qu+v6DzyrJHYD3Wxjla2Kwh0yRCEPXZSDOHn0QG0SSJskTY370+MHOqLiWCKbcs3nxQbmqYdkS8FT+qBkUg8/uf7q3v/f8nbvHyl65dUe/946zRhIKxQfR1GnnqySfzkBUxQoWTh0fJVarlZQb+WRr1tSAeEN1mUWrI8P8T9QvH8FvxnBKbbDZBcmFRRG1xRW6MPDCSGqCgKsvyWnvwoC4C5z60d4mOIRIGgLIF1ZHaZqPkV54+QftN6YwfiIbCVcJ/M1y6/UiSC1ZTyfH/iZHKzxg5eDDFLZ4AJYWGgA4qOZBS2AxIYcOIdaPGH5Isb2db2wulnXdVAD5RU285SjP88+HjS0VzKWEpxCDc8j0N5+55W7dXGY5SZL/9//59xQNYlnQZDNGuFI3hLyX5ZljXZH9/x+887DroijNktiB1YmAOhWF3vTSjIq5dc1AQvAKwqdA8wCnU5/tCtwPDnq5XmQR7JLAEQH8A5FrQ8DiSbteQE6D6ALvnu09rYhGesql2yNsJzMerMd6VbmvMAhSqMGVpQcbMc59tICE1/YSLQtrMASKeFwK7DeyIb23CH30Z4RgNBIS5KyEVM0rg8EzQvzenTt/+rvfJtS9/et3f/zuBzaWN2/dLrU5btqzpjaQqBv4oTp4Q3ET1BCNNFl/rOiWMBpxkadxniRSRtbZLJJb48lgUOTDwfufff73P/zRi3ef+/JLL9VlWVYLo+xssajqWikN0kfbOU0EiPlAeqLBgUcrf0gJQfMsHg+HG+PR9ub25mQ8Hg3yooiYxMGINkoZBdh6gU07MCpgTIgoTWUSyzxL04Jxn0RRzq0BI0IckVjLwoQuEI2s06qu23JpWuWUIVoZpfFVtbBnBftYFBedKWeCCV+04T60lL5iY2CEoHRTlcEpLbj1QUrFUPpFUVK+ms3KsnTOdEong2J7f2+ys8uSVCmfDHBOqaBmtTr+9AHpFOfUEAX2MLIngQtN6HBjM0+z2fmJqmpgHyKcECRC1jBBrPGJF+ycEKVNluXWql/+/K1Yxi+9ek9bhfkf5xLISEhQFmen5w8ePDo4POza9qV79775O99tunZ+caa71horpYjj1FqjVauMo4KD2VgayVh1bbVaNVXpNBh/EsIjCVJlKWCBijqimhZ21Uzd1EZ3uuu0thRRTD4PZlaZqioZlSvdvv3Bhz/95Ttb49Gf/O7vbI6Gi+m87TplDIXWBXhXwUgEZjN5xL/9pS/FSfYv//rW//3jn/zk6WGXRlQIFZgVHBn14EyE7cyAP7bO4HvDUJqBXtvOadg8Drs6DipnB4VqaABiZzj0h6EMMTD7h1ANU/4A3Arbl+BeD5IUaKHR9XaLdRYnCxpWpVEisl6MdIFO4JCVKKiEzFH3/TdGQJ+F270stGudADhwRmnG+LVO/w+vvdEuyr/+9IMqTWprW0pqR0piO+s0Q5kTejX2ngjOH0CC8piQAedpFB106uFifj1L/uzevWi57Lh4v2k+azotJGjEHbaaVNsY4/7tn/7XkZDDVSUffT797L4SUcVIY11DSO1cR0hHnCJEAUXDUJ+jGHQrcjqJsuFw0Mxn5fmJCHwrCGYGsoreawLfLxvicdghBU1a2B9B4dQXpFBBFhUIzNatV/fhgHO9sLuHcYSgjy1krI+ha4EOVCDC4uHG0gAtW8fYdTQOpTfuZa9lz+DOC+A0G1CHuMMf2mcofAczABZyirAO7p8vy/2jbPrZhhWwCYxEaGINH4wme/uN6pbLCne9mAsxGyYTTDArrYONI5JSnlKaEhIpPR4Ns9dePeBseGX7H77//QeffTIajGCFF20dnHBm05h7g9HYknw8+rvHD946OhRZmspYRJDmGwvTyqDkh+Efd8GzIEDNwIfDCjBBw80ZUFrakIVSBFogn51TVDUGGj63xKJNv+ASjOksGI87GIyhGUi/tu1wxxeyXUBSwIgZv1dYHUBQDn5Igr+YhH0Wfy4QqlGmgFJJErhRyHp14EDnP5y2KMyGnhKu6KwV+E4KWIwxWgZLXqDXVfVrW1s3tPna/rU/+6PfzzYnJ6dHP/jpT+4/OXT5iKZZ62wHU0TTG2rDRQOWK7eMCq2N5CxNYs5ZGkVR5KsAzniRpRvjUZ6lPuY5l09GDw8P/6+/+MvJZOP3v/WtFEg9MomHo0EkI21026q6rggjSvvUP4kSPKKSKIniJIrkoMiBlQYkP9Vp1YEhq0ODZNgSdqCpYjCUBeValFzZ248GOTgfaAQ4a2OEYGDvRtbrntwXviEfAmq0I9oJf4WUT1HbTmstpLS+DDEsDCAoNUo1TbVYaGUNc0lWxHGsjImzPCK0XEyrskSlOjQ4LIAvARIZ/DycapvFdK5A1aWsGW1cuf7cnWRYKOs0DFAkE5Zos1ycP3mkmyYSEcyQ8Lnl2HAjXObjcZLlqqrKxdRpf98BGY0CrMC8NdrINCW9DUKS5YTSX7/1y6osX3/zdZSJAsfN4cASTifGI2Gd/fTjzz779H5VN/deefXNb36zbqq2XNXL5ZMnBzKJd3Z28yz1P4JqG1+suEhwGSdRHEEIsVqpqqkMVt+wiMwwbwX8DQ3rsK5rGzQXNsa2TevDszZl13388MnP3v7Vqix/6803v/blL6VC1KvVbD4rVw2OFWAd3QnJwRXRCCmd1QMh3nztledu3T08Ofnzv/2b/++f//k3TctHY2ySomMqitgNCMg5I5wE/8S+pRR0l7BFBC5kWnHGTJj0EBp8AyluEtr+HEdIMsDbgecO3Wqgzto1U9YYiwmPTwRtsARGZKOPgVjKhJViSFfCWYEmjxoBykGGCnVwsC6wBDE8FAZuERXWBysVcZFRHjs7diTrlORUR1FHaGtdy2jjbGVNa4O0BzqssN9PqTb+QRKg+U79F3EDymWcfbhaPK0Wb25v/+GNm+3C16rvLBeHvjwUBOy0DCSsy3K1dWX3D//gD6rpcr9ru/d+fbGYq0jURjWU1o6CeI8qgposa6BSB3NU6PQZOxiMsjSaHR2acilxAORPWtjwYKF6ssDn8c8CzOOCVh3eclT5BPSGC6gUh/aTsMqC21bBZ9CFEO16n37cYOkjKDRVg+jWBRKmI1zEad9JDbOGMOENIDS3XkvCNagvkDh7F0Dc8+75wf1aV9hGxiqd90tNNLA+LCabgf8M+SQLcK4gDhvv7hEpVssSUkkCK7SwIgyLwhz89mPCYkoj6hL/zzQhLmFs8tKLZ3GabG3f//T+r375y0ExwE3c4DPgXN51zxWDLUuyYvBRtfyXBw9cksZCSCl8eEATjIBTdkorITiSYbQ/DdTaabG3RvBJalWWxpgoiiCDJAGUGqjc8B4gux3+BHgdC1yqHokOM1orYCiA/grgoO7C5VmDTB0JjBdodZHe0r3fBmPh9bOhYEKsKeK0EJgecNYurB0FwkpYzF77iQcGHgmbVjQWkuJODwkSMCvis8UiK4rlanX44NHNq7vbu1fu3b07yLLT46fni4VjoiOuajulTNu1nVbaWu1rGp91SSGzSOZZEkdRIqM0jjhjg6LY3toaDwtf7SQxinu7ttnYmLz++mvvf/TRj3/+83w0ypK4LJdt3cSRzIt8a2tjYzweFYOt8WQyHIyKwXg4mAyLQZoUaSQZUU1nVGeMxtoL3e44rPEwBqZ9XACDHe4YPCfW2aqpm6qqZvO2LJvZfDW7qKazcnqxuDgr54u6qYWQSZ7B1+K4JwuAaCJ5RNDymVECnnw0iqiUPE0E9Nd115Tz+fz8vC4rEcXDzQ2eZC4Sk61NYs358ZFua7puSfI1uNYXyejm0NbN7GIKS67GELp36/b+nTsiKTTWHMA05cTZujx7/NhphWbp+BIi4xfpHIPJJE4T3XVOtaptaWhdQqZCLeegm4Wnl8eSwpKcsVYmSZJlx08P67ra299D1wEgTIcagDGBOGtC6N7V3fF4eH5+8ejhw0jKG7efaQCklWfJg88fvv/e+6vFwhmTpEmWZJEQ1ui2qcvVoq7Kuq618SW7kHEUx0JE4OPkn3L0DxZCGKUBPWKrsq5WVbkqy7KqGnX/ydP/9KOf/OLX7+7tbv+7P/43X7n3ko94Wqd5nuUJobYsK5gZIXEBtU4+mAnGOq3uP3hwsVg+/+wz3/zSa288/7yoqyefft4o7aIobK8GbzfU1Lk1dbh3SreMrJnHDnuHvS1pIOWFTFcbSrlFIyzEPNngHEsDl2G9ZEr6l5S6wADubWpRKYIWjmhLTGjv5w9GTBS2OWD76ItflfTY/tBc/QI+HnBDYbMGOikQ1SKpJAe3ZdJY2zqoQR1RwQsGHjCBNA+seNaoPSIJTSgdC5nG0VR1TxbLYZZfKwa0aaIkuYDHIoiBoeMqpDw/PxOC7924saqajSJTZ+fOR3XecwLRjD5s8qKUMNSKcIprY6IkkXHcVCuKO/Yh+jlUcK0NB7H52PvbhyoRgmzQwwa04Zri2zsLXmqUA66ZWXIJxKKXFI5edtWLXx1a58goCSxIcumxT3t6JgwjCPIxelgH7b0SgzNlX65R8gWwCG4zM9w5760O8cVHlyTYDbVrQQDt2d+MMWVturmZjodlWXctKp9RKY0m51SgMI8RyUhEMQbTlDCm9NbtW6vdHZVmbaf/8fv/FAnOmUCWHvSIbaTtDSmvx0nC2SoSf/WbDypOYxkn4Efrn0GIfJgJKGvQyw8n9p3umqYRUqKnKliBERCg+gdHSkATgwlJEEESB56e/i0DVZCBPhfDrwbdKWdMEKlxdEYia6cRsPcPOFs43nsoHQLSEUPteqgqvtRBeRFuKAlISEhtEJ+JbXJ/1oDLqaXIayBc8F4v7e+hwB8OXfN8kYeossBABcEFNNCkOJ3Nkjwzqnvw/gfbmxsbV7Z2x4MXblzjzh0dHpV1Q5NYQ/buQKDotJVSDLI0T1NgZpFIyiyN0zTdHI/Go2EUS+mP2wQ57wSEy9bYTEZvvv76Sql/+P73W6v3rl51nTo+Ojo7OVmVq6bpGJI+GFedAvEzjCWhP8EYAW2dQCsE4AaC8hMgSqZfDAspDPRgfarnjG27drW0qu3KqitL09ROdRHnaZoOBoMkjn0io5XTulmt2uWyWi2rqoTeN1zawJfzIV0KyZxRZbk4Ozt7/Hg1m0oui8losLVFolhmWVHki7Oz+ckxRSIYunSQYDKN1ldQsvLVYrlcLDmAC1iaPPfyK1s3bxrO16xDmOmYrlxdPHlCreJIKoFzmfQJGaEszrI0y1TbUeK0VrptoYByOFp2SLGOYxCmOiElqMOEcU4kaZImTx4+rFbLvb1d+Hg+CsLqrcX5JALsBZdKtYPBaHd39+z09Mnjg63tna3tK13TCCH3rl5dTmdPHz9eLecPPn94fnaudMdBNpKmSQwSumDzTZlS2j+xRjdVo1RXl6v5fDG/mC+Xi7OTk4uL6WK+7Nqu6dTDg+Mf//ytX/z610ma/PEf/O73vvWNcRIbbcAhgFmnCSNpHm+Mx9SRZVnhBA1fIsYoTIWpTJLT05NPP7kfpfm9u8/93quvPr+3Pzs7PXn61D9oUUTBISjigkG+hig5bA77e2A0IgGB1odOKkCzCgx8iLRWDwjZHA5XTes4Eq84NpdxXhl0VkGuwwNLEvGe0BHsk2i6XorBv6Lxc3D7B2okkLr91YObwpHkif4yLrAsXWCJW+gVobMNPHu4QsoZhy4d8C4o6QjrqOscaZ3TsG0MCBESNvt7CzhnCTYpBHUxoQUTMSEJSGHPOn0wm93a2sopjUAINes6F/zQw8I4E/zw8One/l5c5JbyCaXVdEpxCzQsElBLg9VGX4di5QjnJxzgaZoRR7q66imQvYg5YE56FRUGMG4uFToM4x8JGKmwVXRZ7/SQKnLpNdhnYGQtfV6Xpv0MofdXgJ3KSKYBiIkjz36HiK49itZsWtJ/BxJMgFEcT1kgjiLbrOdgBsd45nDjGwMKotkpIFPQ1yKwFRm3HEAvzlqeJKOrV5Uy5bKiKIyDHx5GfE44hmMJSV1EqXQ0di6lNFammGyIu3cuqMhGw3/6wfens2mcJQzNs3AFyOhNwu4WRaEtn4z/8bNPHpWlTP3LHmy/KSCiaGCS+PeQS+RYEOeiSMZxEjw3+3TPn02+iBJgc4ASc4fJAgkTF/Bis7qvw8PmmbWobwoIIntJ9aZoroCrQ73XEcFRU094B/E3WWsuHAtY6/CcrGEtmEu54HpOMSCFSNwzK1GNzAK5NHx/QERSXMsW2HY2DjWYwCiUDuf3SXK6XFHJ8zR98NHHbjnfv3o1yfJnr159dne77ZqzZamdVcZQwvM0GebZZDCMpCDGoenQqMgHw3wwKJIkAdkyxzIc6LP+Z5AyAvgss0q/9sLzt2/d/tEvf/mrd98dTUabGxtGqdl0djE9Xyxmy8WyqmvGaZHlkYhFJIDXQi49SIPdnwt2Jj05H087gouUAs9hTuD4BB0d2j37LyOkVFpXZVnOZqvzi/nJ8fTkaHp4XM4urFZCsDiOWf/AMUgWfXnY1dV0Oj86unj6ZHZ8bJQqJpPh9na2uUlElA4GgtPpwUF5di5AgoMbU+iEJYQEdiHnvmCn52enbdVaa8um3rq6d+fVV7OtLQMzO0jtDTWWGUu1ujg40G0jJXc+n+AAguDMhRlfnGVJkqmuQyWB0QbWSXtcLVwiJqJ8Y0PIqKrKOMlAB+A/VToohJCPPvusWa6u7u8yIfqjQOCzi/4rpEeKW+dkHO9d3z89P33w6edXr+9nWd60rTVqZ2dbKz2dzaSIZrPzo6eHB0+eHh2eHJ+cnZ6dX0xnF/PFYr5YLVaz6XQGBk/np2ezi+l8Op/PZqty0datcwR8RfnB4fHPf/X2ux/+RkTyO1//xp9859s3d65wtGXtwXSQ5lLO/LtcDPLBcEQdberGERcJGcSxYPzDmWyNefD5Z2dnp+MrO/deuPvdF5+/PRycHhyenZ1HQsgowpks7lUKsJmkziLongVbTyeYwDAGRDHcgmRUmUHZ/Nbt5xZNfd5UaBSGw6t1rQVJM+ZTPNDeUTiJjsFQrkKIh8cl+K+E8x5jEaewLO4sYz0vi3L8ZXCw+McanZX8vzBqcQEfTiSODkEwbwrlC8RXsAUkDXGK0JYQDWeXdj35mAXUbTBSBKAeh5omF3wspC/4jM2zrLbmtG2mVXX36lXR1LGMSm1XFqX2/UyUMW3U2en5s8/dbZXJ0kw0lVqtmOCYP+Bmjg3FYqj/kFcFsCiujGKCJ2mu28aojuISAYq3QrsYqc7r+gbL2cAEDIJmGjjdwYCT9OtK6+ZhUDqt/2fY/AHFcL8bHMK0Wxst+WxfRClFtvWl8RFScwknl72K3gYp2PywUAcz2seZ3m94LecKomlGLv0CWDjkYJbFHLeBqMku58oOqJO7UZIsFysQU4Tcg1vCASwmCBU++lKJZkeUxpRklgjBNl584SSOssnGbz7++N33fl0UuS+1AxTB/zWz5qU8m1hWjIbvnp/++OAgylIJTq6dVWhyzAC0RFnYwkE+K8z2QnsnmG1CYoFSUbr+8ABgCjxVTnu2PiA40DUE7AsJtPV4v858uYjWtw6QnoFGSaitgOYeNERYgOBQDqkJBggUD4bmDSwwoKCNBnXzuuUBKRHHvjPEUSbCMAi7P0CkCq4psAbc+2zDLMHCxenhWQjT4b4OvqjqWauKtDg+Oj4+ONwZTvI8nS9nzrHZbFFrmxX51micxXEUAcfKkjxJtiajwSDL8yyLYgnmeFEkAAulYZHYHyoy8gdd8EakTnVqZ3PjK6++PF0u/vFff3K+XO1c2RlkmdG6rdu6ruazxfR8en56UZarrus4l0CJjhH8DVI4fz1heIZiDTSLE7iTYPH1hOTS9LYzUBZaNJDxJ5TFRqtFLZ2I4uHGxmh7e7i5lRUDAShsXBuyTd3M5oujw+XpUb1Y1PNFU1V5Phhd2cyvbPF8yH3lnzFnLh4/aaeziHNLApbfOLAQDlMqwSTnnM3Oz7H+K9v22p3nbr/yKs8KZSzpcaSwzkq4dReHB7pupGCuL3Yg37CMMUNslKZ5PkTMqhDCGMs4120HdT+28/zfk8GwGI+16tqqitMMnRsMIYPxxDrz6JNPjequXduHYaRlgFVhApmrzDh80Q1EJk6si5N0e3v76eODcrm4fuMmg94Dp3Tzyubp0clyuRgMR9pYTYx2tqyqZbWazeflYj6fLRbzeV2uytlqVVb+XjcN9RGCR3EspWy69qPPH/74rbc+uP/JcDj49je+8r3v/PbdWzfgTcPD0KHW01ojfZSlgZmtdJomo8loUAwsOIf6ZwYzWevQVkTGyfH59NHnnxOjrt249vK9e99+/vnrSbQ4PT+bzh0lkeRhSbrf/5GMCzCrZ4AuQ0IyGMMSlFDwprvatP/dl78yWy5+9uQxyRC6FxJ9NFP0TxHQaNm6sHO4KkuRbwXUCUDLGduz6AknAvMeWAfCaIFQTCwjcMHX9WZKDnIRQNnAchRHuzqsExwuzvYbqqD1gQBMfQXsrHJOo5o21KAMBoMWGt0csU6BeAQmzQXjQ8Zl6NRbGcmFtofVKmHsxuYWbdpYiHPVdbjn0U9ShZTTiykh9Nqtm6umvZKk3WxmtMKwheNs4y45GKG/TEH1BApJbWySZJKLpi4DX4PYtQWD6xm9yCOzuL1iQ/YR6l+L6l3rgoZ4LXgNPXbnenkzCYGS9Mqp0PwlPdKq33fGpRYu4rSf2bpQ0wRXjktTWOx7oDXSFzGY+OnZGuoUym0wwSJoMWt7CT3p8dS0d0bsTYGQDYvKd0fiwaDY2m78YdrwQLH0mT3HmwF6BgmWRzGlMSMp2A4m2kxu3aiuXOmiuDH6n3/wg0hGAt+k3lov1t1zaXodlkhOBPnbjz/UUcygHQl7umGtClRvRgBHQlsNHq6wuYi9RGzm8LAThjwjBqMSVB5K2BtGeQ7INCwmmGGwRoI9A5g7gK0hw83O3hcZSWk2SCf6VQEWFP3wNSGvZP3MhiHCBrp/4Y6hJXBwQQIZHli9EmxeO2QwgSZLQCOdk+BxCRRbiL4AtGI9h8QZ7M75AhiiO+XQRBdcYGJARbTS6nA176L45Ozi8ecPH5+e/sUPfvLJw4NbN2/l47GlDrdgKaGxjEaDbHMyKtIkhq1rRkmcpAipVsqISHBg4SUyljKCtgKk0jymlnS6TgT/8iuv7e/vv/XOr9/68EMh450r20kUqRb9gk3btvP57Pj45PT45Pz8vFyVbdMi1JpTlsjY16YiQhVKMCpEwD0FnxxoR8BkWMDF0LiSAVo3J6QICgku8tF4tHUlHwyJFOAE1emucU1bXpzPT44W56f1YuFUy4lbzZeq05vbO8Od7Wg4SkYTkab+9ih19uhBt5gLxkhg9ISkAP7Ko6zIBkMpxfHh06aqG9XUnX7u1Veu3b2rKdfgoh8aNnAICUqWZ6flbCqFQOqyP9CN6+n8IimKNM8dCHU5F8ZoR0mSpfV8HkDz+NYzPtjZjuK0nM27pk7zwnQN8A7taOtKW1Wff3LfKr2/v0/B75Jim5UKmLkYCg7WaCgAtgNUKZVn6faVrYOHj2UiN7e2rNZWa6P1eDw6eHpojM3S1OoOnR+pczGPImCWWa0E+OdwSuNICskd44qyg7Pzt95972dvv3N6dvrMjevf+93v/M5vf/PZZ24J8GGknAr//DiDC/eMGAOyajBIp7784NpHfJeKeLgxSNIEfIeN0xR/C/NX2MQysoweHp2cnZ1nWbK3v/vS3btv3r59K4ncfLa4mFWdJgLMP2AvCD2vrTGCUwnWlYw6gSWw1oOy/LKQ/8s3vpXm+f/5zi9UkQKwLCyQWus4uJWhKyXaoiFGO/Sde8xH8ArG1Sg0nbMhfHMuoP8MOYfBYhSxg2GpCQDtFtR8KEWxuIIBjjAsmAUbPM0CDRWNNBzlxlHtiIYxA9qmIBuD9BRrTniwF4DpG1TvNnZsRMXQXySuKW19BPXZ0dKYp4uL3fF4CzJXA15JhgsEOmJ1J4U4PH66s7uTFYW2LqfEzKYOLprF1DiwkEM56HoGFEqQjDGEuCTPXad02wbcDAl29jRY7vc9R9LXWX3z93LQG0pt1lsO9yF3bYYUWsXBuqqndbMQ7wPeyPa/OJxpSeBThd+MiQx0ARwCcYKfVj+8duE2kj40X07ZMVezLMx6MWb3nzH8NFjIh3/F2hf72PB4yfHOVcfYYrkiIaeAxSfIpiUIAQSsG0WEJoRGzmWURkrnk1F657kjSouNzR/+8IfT6UWSJrTHkXBChTbblL5UDFJr7aD4u49/81QbKX2URlVLQA4zst6ntsZYoCRSyvxRTNdTWPQbtP4lY9JoIFY762s3LtBnez29w3+mGCkDjSWwaZAi2PeKYPMIKK8obYOSorfEAF7weqbf+zHgJrDFvgm0bNn63ex72aifxCUWaOhgA5n6VEbA74fNaZS2udCuR7PIHlwrYNjFwguBpk3BvSxwaFEva7TsVNI2mSVOmUcHT+/cfu7LX//6RdtclCvCKbgM8mFRbG9MBlkKLkpSCGms9TUu53Dk0SjyoT9OExKgqYb7eoKHoAhwDR/qOjUZju698GJZNT99++3Pnz6Ns+zK1mYSSa2UMZqBB59Ruq7q07Pzo6OTxweHR4dHp+cXi+WyrButjX/8I19jEyFEFMOummACQfQUVXMwt/PHVXjEsb4llEdiON6I01xp1dVVV9VdXZf+OL6o5rOuWjqtkQQqCHt6dDifzfdv3iq2t0RR5BtbVMTaGuHc9OBJM51JwZAJ6PoX3xISpcVocysuBpzxk8OD5Xy+KsvOmBff/MrO7dvKUeM/mE8fe5sUn+XU89ny9DyRkbUa6USQclFU0ufjUZYVvo7H8T+xxumkSAlh5eychZV8qp2Li2K0vWusnp+dMUfSQd5WtTWKxtF4++r08PCzjz5OkuTqtX1/koYNgWCvieAmDv2+QPmQcTEYVk0TSVmkycnh0Wg0FDIi1hrVEWL39vfuf/oZIySJpTE2imLBRST9MwOiaMmlIFJ2hJ5XzYOjkw/uf/ard399cPhkYzL56ptv/Nt/84ff+MobO5MxJaSrW8GRWQFRB6pE7qMvcAtBWQhi6a5rFCwjCNRDcSbGw2HMpWo7pTUNwHxEcbs4iZu2OXjypFFqOBxc3Zi8/MytN+4+f2dza+KImc7qxdLHb9gsNFBka5RBakXrTlTluCpfS+I/unnrf/7t7z7/7K3/7T/8+WdAK4N5KYF4FoRdvVAH+3/wESCPJsHfh/b6SOgZEvRth7TiC6we1gcBFszsAin9cuE0WC3x0OC0oeJC8RSlPYkHQEQu6H6pDmuvOG1EsCN6t/XtyiBRtXjWAaONxJZMZDQUonOmslpR2hl/LDbULYyZzRe3dnejzuRCLrQqjUX5U5iDMqq1Pjs7e/a5u5UxwzgSq0pVlf/voFPGCtMQECiH2hLQnsHJ32mtkjSN46StKupr+EAOgfOSrRnRru+6I4ckDGKQ/9xzysL9wTH+mgcd6m/XS62I+4JoLky43BoVGXInSpnABeOA38ChNOlF0peT4ACP6PXzeDST3vK2nxQHV1oWtnAcuTSMIIxDO5uF34n2KwiWDJoxY1mxucGzbLlconzAwuI5Ra8WhGQ5aEEzBwRKH4als7Hg2e1njinJxuNPPv/s0cOHxSBHK6Cgd3AkM/qZySQxNv3PVP3nk2TZfeaHH3t9+sry1d3VZvwMBhhgMBgQP4IkwB9ILXcVG5J2iSVFRui1/hO9kvaFtIyQVtqQNlaitEEP0QEkZjAe49u76vJZlT7zuuMU93vOrZ4dEhE9E93VVZk3z/ma5/k8jfjt89MHsymPG0ClMfCZtJ4UaPtIVRUqSFAhF7IjCzIHOUFV3peSAh3KWPSMcNH6dv9qXQQOpaG1I2gpBeZICpUMAoQDuIng1gHkgoZBEJIw7gYLk65aAXtROzGR9XjYt0s7O1F1oTLlICpWA2Eoc1BMi4l2cyHXIcEzoqpPECTmwuiJOqU9PLEYTiViwcvVJ5nV+LX6OnflIiFGSVxksSbrgf9cr7dmTC+Ir13a2dndnYv888OjQVbQMOC4apeTRtyME4968P0YqVSaZp7vYw8pWSBEAt8nkB5hEcfK6sXAWuD5nn2hsjxLl8tSqmyRIox/+83vvPzsMz9774P/9x/f2ljtfe35Fy6vrYXGZMtMCAHCuICCm0VKvVhki2V2dDxAxDBMgjAIfd5oNJJWK4qiMAhYVZR5hBKPUOz5CCFW/YzVE1BqqYyQmZBKhWHA/TBbLvRsBk5WeyjBVAD4udTzQMdORJbduf+gKMtXv/V6tLLitdpelEhklCwZNpPBsZjNfE6t+BrG3jBaxKzR6XiNBDOOlDo7PpqNJst0KQ164bXXVnYuleBo8Agty9LqeGGYzMvpbD6edFZWsvkUlzA8gyewejiY3+x0Pd8rssxVzzCWEFJyP8rmSwQ9q3KCXhp2uogxsVgqUfrcBxtj9fx7QYQQmk0mshRBp0sIrZ4kqaXRnMP6gFAKAqRCFKx6dKrXRSqhMeqt9aejiZ+EvbKZzxfN9QhJwn2/LAvf8155+aX3Pviw225iTHKISc6LopCFUijL8tlynhZymaelMoSyRhTsbO+88vwzL954hjGWLuej8wGtihJs8TdVJYcpUkYKAT169TEPOBdGQqeuEWF5mk+HkyzPCCZxEiVh4jHic9pf7SzTaD6dI6MZ51JIj/E4DrFRDOGjR3vD/Sc7mztbmxtrnfZ/9to3/n9Xrzw8GXyxf3zz6PDh2fk4T6WUAgZZlOBmGKz1ete63etReNkPrm5tr2xu/fd/+edf5mnQbgkYf1GNaveRdU/YBgZJS5mvSquqVMWWKWnjOAiuvS8QJwVnFHD6IETLkregZAQnq4MXGuv7Jy620nbJMCOVUGlj66xhthE2dVIM4PKc3B1dIA80qL1cQjcAYpRNhCQYCakh0Jq6BQDFPmUYgAfSmNyY0iBhdEJ57qGDLPvg6Pj7W1vBIr0SR8v5fI6qR7Eqhau/2MRhMB6NPv/i81dfeXUo5Mrmlj+faaQCK8KCDQPg7aHMhFcFmgSsddVOKGOyNGskid9qZqMhr1rt6juTNnkQZMYO9+yYhDUWEu4ou2bU7jasaRuobiXr3GG7PHJBgfVBWd++daqSuQhsgGMW2yBI7PArdQizqeMF0Vcs1bZFJ/givOqi99Y2MBhbqllNDnBEJ0yc+Rih+i+wm+UL1FZVVWkaJkmnU4iyyAu3HjUXVy9m1kLjRtaIVZ0Z9pAhSjQu7WRJLAKfCPHBe+95Abd+X0w0xH5hKsudMOwTyj3vSMn39vZQGDFsHZzCadAhl5dKEyBV6lJDXhI859q6sespQ3XkIYQ48WAspK303+qtrB2LMCK1snr0qjPQkIlmJAWAP9xxddSGE6nQ+q03VVtmXDwFcSYzcOtCJoRxdjFrA8SO8IlgxmgQuAPhuYCLH3IAsdKGU1siOx0GgaQbbXl48HssDsZu8uyAWsFhS0EFoLUEWh+1za6q08+qLy3yCOk1xi9zr4/1bhK//rWvX798KW437x8efXT/7lgjLwqQQc1Go9FM/MCDIaDSGpVFUZYF59CnKul5DMSK2KrLlBKwLaeEUhhCYCEUMIAXQuaceaWUmFYfrWwxX0ui3/3RDx8en/7s/ff+/Kc/3Vzpf/255y+vb0YxzfJlVuQIYU4J95jEGrzXqqy6ZJ3lZbrMj0+G0KBXnzxovKgHilPGIBLG4cyrdyiOwk670223DNfFYqntnL96cZktTIFkjwhl9iSajsaP7t0NgvDlV7/e3txkzY5hVEAGkIfM9HSQDkfcApnhFVeQ3+sFYXOlTyKvehuz9Pz0dDYcTWfjUpuvv/HtzvZWIRVlHGs9GpwGcRBUXbhihJbL5WwyXlnfVCKXU0U5s0+vVBj7QX99CzGcTiYw5Hya1EJZ4AXh5OwMPosaRnaaBEHYaiFKjBS6FCSObUGudHUUIqPmk5EsyygOqhqXkv7a9nQ2yWZTn1cPjdLa97wgDBdVw2EAMawXk6HQjc7aSupzkVdvv1GK+wHDTEm1mM22tzaHw6t37t9vNVqT6awQZVaItCgpgwgKxrtRc8Nbi4Mg4JzBbGd4Onh/PFnf2AhCX5V56AXcDyCpAgsB9n1Y+LuoOYwwJ0TBFoYy5mPf53ESTafz4fn53t6B0joK/WYSx2HAPb/ZbGb50kablKb0JFtttTZWujHz8mU6Px89Gd9MksjzI4rRRre7lrR+88Xn0jwrtCGMY5ideVGj3W1FgZcenxzdvdfp9fuXrvz83V/85JNPVKtlq2pprZYuHcXBmI25QONAcK/NiIXpueU1XxD+QTtqjZzGSq4sPdG2eXA4ONuJuogcrS4oTQyr8cFufwqDSFCiVk+pC3KuB7AOP+LYx9B4SmUcRNiN5Bw1TzlyFDjXq6oFWdW4VU4JjewW2SATYBJRmgf+5yfHu93O5SBYFWoeRHeyTDMK0wSnF43j+PatL3e2LyVxslS6tbZWHu/7lEld9cESIY6xO0aro1G5YEVbgwIknHs8bLTFMtf5khKHT6oH1nU/idw82l2+lmMBEKS6HbctEIj9Sd3g2hBtZK1khjjtPkyt62K3FkQbfNESQz9pX13QtFupFqlBS5aGqO2XNjaFDYJlrP7ZjtJryZlddNaEcLcY1nbCbgEctKaIWLchJZZGaYcbiDR7HcRYOp5ouyK96I1B6MvAS8cI5sZwgziqfk2ljMMG3tqeGJI0Oj/7x5/lWdZoRm7yboflUvYxu9xoe1KgMPjZ3VsLggJGIWhWQ94ZEWWJMOJEdTF7OUxGMv+iSAukgEnsspwtjgBE/IxzppWUWBNgDdlYPWRQqUpqkxYMAbKGoQRLIxEhHua1QMBm8kIYPfQmysh6NWMg/MDhbuxtajRisLEHnAm2yBOrV8SEKFSnSqE6eRLoc05IoRHkfRkGxQIDS5N9ysC4ausbjBm3yiQGpymC+75607SxeCNyIeNSmluXodEdSjqYdpXZYPTaSvcbL7/84o0bUbOdziY//+CjX54OCghbCHy/0UySOEHVmSi0NmUhVFmCKwr5YeBVbacf+D6yQS5GMgKRVZxX3y7leZ4PR6PlYmnnckAtKO3no5AFwYRp5Bn02o1rL13dvfXg4d+9886f/MPP1lf6rzzzzNWNzSj2bS4C1hJ7ROmq5Iq8gHKMOaVVz0BsEVDKUkolS6GUVEqVsgwAjpY041aznSRxFEacc3CqVP9Xi4WpG1HB8UIZVxrlRTY7Hz9+8LC31rvx4sudzW3WaCqnoqwOsWwyWpwPmOXJGcWq6p0YRLw4irod4nMjJRLi7Og4z5bT0WiR5l9/8zudre1cSp8HYrHce/igt7YeeZEUghqsyzKbz9v91dAPzw6G1noKYwaEgqi/s00oW4xHGJobo3WRF8zjUksSBFX9pSShxG6UpTHtTtsLA22wFMJoFQQhYx4hRDEWRHG+XE5GQ210CNHaChbDK9uXZqPRcniuyhIbnSvR6K62utF4cKaUAMgYzsdTI2VvbdNos/fgQWOReo1YUuOFIU0XoixffuXlk7Oz+WzebjeKouxC/WWbMkKpUAKsglCnWN4yY0Up9vb2Njc3uq12Uf2zaDUbmFdXjihF9QetphJ81UJKrRShtOquQE5HCOl2O+1mS4ji9Ozs5OzsbG8fbMpRElV3PaBjqtLobDgeDoYHh4f9Xm9zdaW/vdnwPKwKqVEQxTxqYN/ThUBaUgDIIFkgxpCmg7Ozj99+d7p/+LUXn13f3jx9eO/f/+KdY9/HDCCRtTqnDpfFDDLTrCjD1FG7kHoGj79CjIFlEWT5WD+Vx9oFISNMKWeqIJbEBJ4GQ20kObSLIOowjsDl5sfWuWfFvcQl5kK3YH1QhCglsJtIKYqZncBaAqfV91JaXbwwqraLT2OTLikyHjas+n1aYlQgk0opYJJOkWlSlms1o+Stx4/Xn32eKrUVxJOiPJAWb6fsGccpKxH65NOPfu3Xf3OesXh9MxqfLcvCJxTgG0QjraysEo7JOqzfCmqwQma5yIJuFLd709PUZqQ7rW2tVnMZRtgduJY66jJ4LsxG2PbmdfQjMYAdRRd9ps3/d0ntT5OOauOKU2YZq0Zmtc7KPM1eqEcKdY/tFgbUQqpMHYRkajLWRcKxDSu0m3MXaezSPixJA9etNVxMmtTiL6U0b7T8uJGmmYAcU2Pj/2qYtDMRwVSh6oYhbceDcMNkZ3NIeNBuPXp078GD+0mSYLvUsHNSrUOtdzutRAnWaHw8OHk0GnlR7Hx/TnQG5SElNgY3CYNFWrVpiIKiwsVVgxudUSutcuN+DfkhyKa3QlMKjnX7a4O1tfba+DCLZ6mzbqqvyCiR0HJSoMgCjBCAmwAhhcSbC31E9aBCxLDz2oE0ilxsC2HTrOwkRENVYQV9GiEG9RKXcjOJl7PF2BgaeMRUryEMbwyDF9hNnl3dDF/Gyoyq+rH6PVDtIYZ0gFlAcFzqnpCbrcazVy9/82tf2929yv1Aj8cHh4efHRzePDmS3A9Dv9VsREmMOYNI3uqlyLNCSlVdeEjHSaPVatpMJBgWaY9CHlpVG1XN1iJdLOfZZDoWQlcnOOeMYI9zTLFHuShLPwgZ9xjUM2W6ZIS++cpL33jphU/v3v2Hd9/5h/ff/yBKrl3auX7pUjuOPIOqT70d6GNpRPUkKyx9zH2Pt1s9Hvic0igIOCWe51NOOfE8zgAvKgD3hoSUSmHOPIqo0pIyooSyFaZSZj6fV529kMPhcDoeP/vss1tXr7U2N3mcCNBtAopQ62w5OzvjNgENxECyOjhZ2GqEzY6CfAmdpbPhKJvP5vPFdDx78duv9y9dyksVhFE6HNz+7ObWlSudXr+EvFuMcSFlo9vzg2A2HIqiBOcHzdKqeV3fvSyFmA/PIeWx+gAWeV41qTzQSjM/1FKLrLQRjdUhxnjc6VaHjRD5coEpodyHzBHFo8gPw8H+/my29IMojiNMSLPTEbBP6W1uJp3W4uxsORyqspycn29eucJ3ts+OjpQoKCGcsmK2OC72Vrc313e209kiareAC07DpLGYzjgh33rtW3/zt39vAwKKIkcFWIwIllooIcGYjq1ugAKgGMjL5mD/cDqZrfb7WJvpdLricQ0R2lY6xKoiFhkBSWLUWnKr04F7tCyrussuL7c31zc21qfz+fB8OJ5OzyZDJAznLPL9wPP9MDRKzcvy7NHjL+4/9AjpJEkrDFfa7W6rzdi43Wp74MiijGKNpuPx4Hx0/8nhwclpXBQ/+PY3t9bWpoPz//CLdz6ZTXW7BeBxqzXGWmrAE0IrDBtcRKiu4e0U6mjr8jEQfG0xVhJZ7Ik9fJ3r3bjlL4YcMIBkWTSxNgyGW669rrmEEFwI54GyqabKuoGBXOigENrJcImdtdlDHlBdBAL4KUAzZXVD2CBW4qh/BkMBZIzHPM5ZIUWqdI6QgHa7RtGLBBPp+Sdp+v7J0XfWd4Isu9JsTMejeY0QgN+Jgig4OT66f//OtStXx1r31neWew8ZJhwbaIKxBJuZMoZiCx3TNhdCKV11sUIulmkj9HkYieWc1VJkDCpM5ILQoevB9SDYDQiMDToFkqDTl+GaE4scH9hlOVtFsamzgutAI0u9MHVFYDXPmNWXSy2kwrVYzkZJAjzYxV3ZGQi8M+5L41rrVSfh1UFAT/HFdo1u5xquXIM5R00ch9/DWWOlK7RO06UlnMAuwvbroBKCv5CBdIgbQhHiBLFcdtb6Ra8nfQ9r8/4HH/q+R5x+wIVPMyEvRX6fcp+ygSrf3tsjnoerr0MhdxXZgcoFpmCk5Ifj81leCFp16EqWIPthWoIvC0LLrRZJuphrDdwZaRUncMJqTriUFi0H44uq/jM25ADDhwosRgbiUWHpDp4l20ODANt9LKzZwHqWsDPzuaW0BlutM7NaNr9TyrkFBWx6INYRbPXa6DajP3ru+U/v3L4/GedhjPzAIMKpcZoiaI2FRQkoSUA3SQ3yjObGhJR4FHnK+Ep55bLtsevbG68+++wLX3txZXsTKYOKcnC0/+Do5N7h4FwI3mp1wiiJQgKdetVDUKqVzoD5YD/6rXYnCgICCb2kqs2ZR5kSIi9ltpxmQszm8zzPAbKLPeYvsux0fz/wgsDnnu9FURz5PuVeVRAx5jY+hE7HU0zxa88888K165/eefD+p5/uHR4+3HvSbbevbm9tra4kXsApVlq4Fp/iNM3SPB+NxhC8QX2PV/8wHkUBzL89zpgf+pQxzrkdHKUiV0qU1eGdl3mupZFSl1KWZRlG/ngylVK/9to32mtrjc0Nr9USouScKa1lWRKtJqfHBujTFNKIlaF+EkbNJuYMqKQyn09NXs4n4+UiPT063n3h+Z0b1wqpkjAeHR1+8ctfPvfiy73N9SxPUS0JDMKQUp6XhRTCi5LQo2eDE9psbO3u5mk6Pz/DEtiLVYVDJuPx6sZG9c57PsbVy46V9qMgLQutTWNlhSeJ1losFyrLCK0+DNVTwTkLA2TQ+Hy4TJfdVpdRNjw/V5i0VleUKGngI847G+vNbu/40SMxm43OTzd2r1PujQen6WxCjeDcL/Li7PhkY3vrUB4sZ/O41VBaxc1WkYs8y/v9/iuvvPzhhx9tb234RblIl6UQiGLOGGMclJHIMpK1M1NU14DvBWmaH+ztJzHs8ilfWVkhlBmjlJQGm6rssy5/8F44Sp0CKnL1/BgtdVGUCKE4DJJLm5fQTp7l2XK5mM3SZTbLUk6snrYqRwxRSyFm45k5PTfiAUco8njoB/1+vxWHceSnWXFyejZJ8zQrQi1/9fXXNlb7RVG+/fkX//fde2kjgR+DIruQgmNQQRqHtTaQOpL9Qm1Fkd1sarDAuvPBelFtk4thuSu1UwRD+2aUkGCGsteEu6Hrbg/bKh8jCSBn4NS4+RyuB+DVd2VtddbrhC6aLxdI7hBUyuWtWYQy/FDVi63BiWR8QjxQjBZaZkYXcOe7YgOMjjGjQiDheR+fnOx2VjY56yBzJYpuZ0vJPG0g3ZBgimgUhF9+/tnmxpbyvLK/mkxGs8mY8qp4FAZxYyR2yfs2zRi2R7VliOgsXwY+jTvdaZEj0OXUmDnoQNw0wV09qI4ucHR0aK9hqegIJnY0USMKtR1HawfsMI7ZYVxqoMtycLn6zqzELBESrEkafFW1sdjOS/WFvgp++XTrgOptAXZEL7jvKXHLB3hVjYWQEnfhK1iMW4Oq+/EIbAKiZpeH0Xy+qEpCAlcCYFvsb4b/NwwZjpCnkYeRZxATKgj8aH3zANGk3XzvvfcXy7TZbFjFtl1PU6U6FF+O48BoGUdv3/x8pnTAGbMSMXIBtwZeuqo6csHJE1kaBvYDSH8jFkEFXT3EtMFCV0n4ScA2IxXjzPbTjDOtDVy+1efEIjgs1UgqjYixo06twBdB3KNu06jsXwTyaAPx+4oyblVIYD81xJmELToDgNn2lof+zwJxqH1dYXNMQfEF97Oivv/o5PTrzP9vv/vm3en0bz77dLqYlpgZxhGrLmFYYjA7OwEBmOGUckI8rWJl6HJGRLmaxLvbOzduXHv+hWf7mxteFCIpkVKL8fTh/b1bR/uDUvIwabeaYehbSw0cV9UnLy/LooR+ERLRG+1mHIW+52Fa3W1SyTwtFul0OBply0yKqrypWhzmKQA5KaTDKFrp9cajiRCC58V0usDOYM087gH4yiqhqjZPKUUICcP4pZ2dS6v98TI9PR9+cvv2l/fJZm9lZ3O9127HQYiNMlp61etsENGQx4cWyxSm3LDM0QpVjbcHkgBQF1lArFQ1gwwJIUBHjzjzGGd7e0+6vd633/yWF8ftzc2g3S6FZJ6n4H6OOBsdnso049Whj4VWLAoarRb1fY2qZktkeTadUoPG4zEy+OHDvfXtrWdfebkUspE09u/fufXLT1/91uudtdW8LC0Ivno8OYUzWYgiZ0EQt/zDx4+CVmvtyuV0tkjPRygvMa1OjCgM9+7fm03na9uXNNE8DhnnKltibLjnGaUVpXFvBSQiKB2NVVmyIGCclWVJfT+IY63N5Oy8yItkKzYa5Wl6/9bN/nRz8+pVqTUPw2WaIowuP/fc/u3bi+lsOZ/xpNXor0E+ayqU8n0fSX16eLSyuTofz/Ky9DxflcIPQ1HkWba4fHn75u2b09lsrddhnAslF4tFkRWceaADMtD0KpDeUgJ9o9UfUYoLUQohprP56XCw0l+rulIvELIQUgmkOWME0Vzk9t0si1KDfwFGEVqBK7r6hZQYmSQKkijsdlogWzCiLLIsNRqLQpR5VjIGxOzqUA48L/QCjZCgdJhmB8PzLM8Q9ZRBgSp//dWXttfXkVR3D/b/1/feHwUBokyWUjMKBznRpt63uQYM2bANEDPbxEC3+UUuwtk2hU/zbKvaEWIYrHoXxmnGDrBtuh61ZiVk80611bpboyMFhJyS1cFUVYQKAhggCEkZCa0Xs3c8yJA0plhWBUH1YgK4A64kKy5HqPqIVK8WpnaG58Z+yKPUYJoZlEPlBOHW2pr9qvtIqQAjn7Allu/tPfrt519ii+W2F56V+ZmWCioV22F4nj+fz7/84rM3Xn/zvCw3Nzez+UTBnt+DtlTaXtNU/YOV8lqVtp0QGiOW6bLVaPmNZj4Z2SMPFC+m5lnAcahdVp92sqav6K4cJ6BGdkCwoRtUgLRPWQ8AqO8v4nyJoznXcO5aI82s59TFKLm307V51uxif3R7bds64WJr/RXwhwOK2ABTqySoeX5u8WycAcZccLUwNkpr7Plhu1cC5hHbEFz4C6nzwyDLbOQYc4Q9hDykfYw8aZqXNqZR6Ddbx4OzL+/cbsQhsBGYxdAYbXwlr7ZbscFeGH5wfHR7OvbDkGAG9RocuXBDKiQNMozapxzI5nB8u4JFGYUktbJkY+wWs+qhDdXYSKDqOF4qcL5dGkItYEDaRXTa7awB2aEy1deHyDzlFrp2x2u35M4vTd32wKJciauekJPPodoHZhNGWdV8Vw80+HSRm98jl0OlsDFlGP3D6ekmRf/0u9/9p9/55t3bt249fHI8XwwXCwFY4DTPldEe94xWrLqPiMEmZGxrpXfj0kvXr1/a2r22srmOwgAJYYRGSsuifHD/4RcPHowFMl7UTDzf4zXXzpV6pRJKISUVRUhLyT2v31kJm5GlDC6Xy5PBYDqbpmkG7zMgn7ivVQkx3wbC0owwghDZbTXCwD8/Pzdae55nECqFUsYs80yU1g5rTL0SwdosR0NKCCe4H4ZrVy7nYnOWp+PJ7JM793xOV9ud9ZVup9mIQw9bk2X1VhFG4dZnDMxgytag4PFVSEpASFdntFGGep5lY8lSEU6FFocHx9evXf36118VGLc3tpP+alZkHmiOsixtRFE2n+XzOWdclVJTEnc7jU5XQAAzp7TI0mw25ZjMh2Ml5J37DzD3Xnvzu9KwJEzufPrJvc8/ff3N73VW+4UQqOr8manJfzBsMB73WMgf37sbJ9HG7pXleLo4PaNaEYylEFHSmA7P9x8+7q2tERjpY8Yww8t0STlDcLA2V1a9uKG0VkW+nE/sawoh5xrAef50PBoNzwgmUZwoJaSSnNDJyZks1ZXnbhij4yQenw3GSu2+9NLj27eHZ4ONVtvA1QhFIdJaMu4XpZiNpo1uL0uXyiDKedJs5OlClWXgB6+++rWfv/VWr9upLhWFOu2WMeh8NJLSREFUtQ6EG6wJRgC+xkIp5uzyjhK0SIvJw0fc4+trq13I7VBSp8uS+4wHfvUGltVPiZy9WxJj4C5XYMNlcDhpJaE+NthjhGCPgY9cC41RQ6vqpIeIPwSe+apkyWaz+XKppWSUzWeT2OBfe+NbWxubWqjJbPbvfvYPn0kVNBMJBa+Czz90ahbcXLWiLvDcNUnV5961rdBIWTkVDMNgCWlDGJw4yv5ZsPvDrUYwM9U1bMEDFFILQXEjFRAzHDDZOnltAU8sP9MNMonjHgNtGVQ/xOb+Af0DktzgWqAAUlJaWpmQnWbbF04rQ7HmuKoQcymXVZ9anUcQ522DfG08IPYxTgiSnnd/ufhscPRGb1Wl+W4UL6Yz6dmQTpchGMbRgwcPLl2+utbpzKRsrK6bw0PkebLqU7Rv7B2MuD2L8dNu1raXRVEWvgxbnWK5RKJw2kNroTK2DXUcK/3UyuNyXq2Q3CZO2PLH1DwPO7a3ZCls/pM30e0xLayyDgCwlybT9aC45nVAZ3ghlkJu+WoR7eY/CQCujUqw4scWs+a4O7r+aZGzAjl1NFQCxiVkVn0hwo12h3p0Op1p7ZbtoAF2VC0CGnEKq0qOMEfIN5gqHXdadLU/9Vji8/d/+j5hFpdsPURQiEm5EQRbnAeYnGj97t4jzHzsAnph2uB8l1Y/A/+KkAI6sy0fCMSyGjhhoa+SVmDsgc3Obm0VQRwy541VANplefV02iAUGwJlzWQ2198uemGRo6XR5oLTDTJjjWqAH0ysVW3I1uCItah0CJS16hEAbkBB4Op3W3GBAAFBGDim1LhMBcYGpXx3OO5++N5/9a/+1cbr33pzNFiOzoano3Q0yZbLMhfVy8eA0OX5cbMZthudlZVWr8OSpLp3pZJpZtKCYaSKcnB8+uX9B0fjqeI8bIeOoaeEqX4+5lhgBknI31HVhaXCON7c2IiDcJYuT87Op5PJYr4QQhGGPM8HtzQIMCG7XlUHdYkQlgh6FI3ms1mj2Xz5pRdPTweD83OssUe5QhpZfBmC+GFQtGF4dyiH+wkkmUpqn7GNRnOj3c5FkebL+Ty7/XAvDPw4CluNpNdsBGFAqbWCUVulUwThSCDSgHmdgnBmVZVHtHoPKegNvCicpYvxcPTS8y+88soLy7LsXbnWWl3NReFznqd5ulg0my2CzWI8QggJo70kjntdHgWFVEhj3/Oz2bTMlsSY6Wgksvx0OH58cPjj3/s9WLsGn3/4wc1Pfvm9X/1+d321ECXE9zFliexAr5IKAYvc7N297cXR2vbO5HSQjScMDguJDA9jWZZffvrZYjZb3driYaCIHU7hxWLRiqrWFgdRb3NLVWUQng+HpigYJgy4JRpp4nGK8NnBYbpIgyiMG5FUQuqqd+LUH5+eLufT3ReeI7jf7ffHZ6NZXmw//+Kjm19MR8PO6ur0zBseHvZXVpSL2aZaiHQ6jZvtMi/AIceiZmt0dMyY3tne6nV656PJ1tpqKqUoy0ar+ezKjeOj0/F0YgyKwByMkZaw5/MogzwrB7LBBkd+YKqyMj0+Pl7rrchSYYLCOByNRng+bzSSIAqNIlJUzS0EhBCKiDZKVncEfA6rBhTiwpQWqsSGMurJsoTatmrCCa1KE2qYFGo+neSL1AhhNz7L2bQfhd9/4/WVzQ2RS5Km//6tn//dYMgbseuroGCCZRuxCG6XKQqXB4WuF7uYQAu9wrBsdNhjGAhfrGjdDpLUZ691cys7q1d2raysHLY6lygl9b1kw9mqThfX+CXisvGgIa6+DYVdCLklpFX3u+XawuEJTs7qEwESGe3MmzCFZvANE4wjxglFy1LkMHyujmcN0lpsP1PGYjtDgjNEhed9cniw3e5uMrqi0WYYPCxKyRgAd6EfoYZR8vHHH/7wBz+c+N72+mY0Gam88ChTgF7zHFWq6gClSz9wZiTbWOZZGjQ7cbO9HJ46EAWkJBGXBO9YfxbTgWy8XO3ErMOKLO0SO2WTy8h/CtOooZH2/ADTrXmKrUS15IoyPwRKk/MkmNoDjp+OwJ3j2+maoJcjdXKDFWZja4F0cUukDtYxT4M1wF1MnccRU/ucaUPDKOn3i1LkeY4dG5rYJTE1mNXgSY8gjkmATICRj0xocPPq1VEc+d3urXt37967m0RJVRTbRAFImupo9VyrnWjM4vjvHjzYz1POOKfMsr7hnlXWqK80ooQpG3FPqrLU1oyW/AgvElFKMYDKWcg/BWmD9WhXXYhFheCaSeKGGTCAhxkycuRogyiEKLiCy+HHAPQBQYEaKJHaXCDdLaS5+m6r547ZWENqX1zgdNpaDdff6sUE3nqC7fjaZpNV7zIlqVZcyOzJ/tXL26zXChuN7ubW2pXdrWdvXLp+bef61Z1nru9c3d1+5sba7pXu+lrUbCGPS6NVXhhRVB+YvNzfO/zw089uPX6yUIZGMWEe6PN09QlElrrlWLPSmKIoy7I0GHdXet1e9/x89Gjv8YMHjwYng7woIECC1lEQ7rmublRMtYApBa/uwiLPGaFr/X6/twI3V7fdaSkI8BFSUkw4dN5K2s0VVKNS2dA4iMfAjMEKTEtjFEE6CqJG0mw2YsbZYrkcjSeHJ2dHg/Pz6XSeZ1kpDdCIEGXW7lw1xPDQc+5J68nGhDOmlPLC8PD05OT49Fe+88bzN67O58uVnd3eznZWFpzxbLEs8ixuNhnj0+F5vlgwP2z0eq3VPqpaZwkcNZrNJzJdckLm41GZ50Lpv/77n/3wR7+5e/0q497H777z0Ttv/+qvfr+/viGlWiwWPAx4EBiriQdqG6GYar1/+xZjbHvn0ngwKOYzilx6HvP8wA+/+OXH5ycDzNjW1d3W2prCmHkeVWo0OOv2+mUpwu5K2O4hinSRTff3ORxL1GM08PKyDKIESfnk3t3jk1Me8NW1nijFcDSFfC3NMM2W88V00ghjIWWz013mBQ/CZrc3G0+5H8ZJNBqcZNO5H/gWj8Ths1MUBaluP64AdlEUWZGmkR8Sj9+5dTdJojAIpZZFWYZ+8NwLz/V7PQPKAlkIKQQBkAwYnapnzuMewcSHjEukDZA8aJLE7Xbr8OQ4y/O40ZhMxvPZYjqdUcaCIKCAasTaEFWV4MooSlh1zCtA6FCi3PlntBK0elqZkjKDf8ajydnZaDQ6LxepgRq9zPNyMrm6s/X//9EPgk5bGRJq/dfvvPfvPvhoCgEkUhkJSDwNNFcppYYAQJsFDhmGLsoMDBawXLBEfTijAHRFXa4DIeQrGEJjYfTYOR2AAV7DMSxSS9o8Bep8qRogQkhTt99y4EDkBEfVXVydPECLrw4casFbWCNpkfgUO1q1DbqGM4qArpohp+TFHJMYGZ+wVOklLIrczWGT/7HxmM0hJbqqTauvtlA6S9Pn1tdQkQfcmxZlauEjGNRB2lCfTWYTxr3VjU0pZINwORoi0GArC4iGp8EYF09gLlKGYMYglSCUBoFf5qUsBSUOXORWOm6Q5jAdzusLqDGrHMDuArRgyQsY5cUd6e4B13m7N+cipeEprrmq45gfOjKTO7it4stdJBaDAFGyzL5jjpBywXv+CrOFOpgaInVQIa3RTVbSjlwIO7zVBClEWv1VEvjLRaq1InVSBK2z2hn01BwjjnGIsGdQiIknZHd1RW9sLsKgNOatt97yfM6qh4q6GD6MuBDXk8YWZVEQ3pxPf7G/R8KwalYYUNEgkc7RrJyczI6CCXKmNohQBCi7tfc4LjjChFn5n2GcwaekZo0hl52qrFsXk3pD4ORwNurORVB+hXp2Qbew/04Nio1exaBdgtdWodqCbN3D2CHPrfDBJv/X3m07SAJ1QB3ySUDcTCBxgRIiiSmE8MpSn51fff5FjVG5WCyH5xxRsKNAyQTKpuod4LyqAbSmGOu0PB+c7T05+OTzL+88eZIaQ8KIwNLU4kdcTBf4jS3+ROiquyhLQZlHIVlyb+/JycmpEGUSRb1Ou9FI4ijyfQ5QuqrN9VwAjmGEhGEkKDkanI/Oz9Y6K1d2dqIwRAZLUWqjW43mar/faDYIxoUoFGibwVXMhCyVm8/U2kDknHmIYs59hElelkoqgxQzOIkaURx7QUApKYt8OB4fDc4PT05PBmeD87Pj07PhdHo+npwNh6PJ7Gw8msxmopTweOAojh89eTIYDH7nt3/r+pVL09mstbG1dvVqoUzIveoWTNNOf8VQKqUo0mXSaibdDgvDQoGLhhBdFtl0gmWJjZ5Nx0WWh0H0dz9/a31769d+8APOvU8+fP8f/+5vf+tHv9XrdbXSs9kUe7zR6UlHrSYaVU8jU/Lw9i2s1Nr6xujszJQ5iPUJg8FQ4Pt3v7j54O59ZBD1+bMvvxg0msAIZjpNF7NZZ22D+EHUaSuCfYwnh/vlbOoTtpgvSHUBB9hgz/PGp6eHDx8en5ysbay3ms0sy4fT6cHBYbvVtAYnpNXw7Jxhoglu93pCSeYHYRgul8s4iWUhzg8PpBRJs1FjAay7TVVXOKtOwiCMJsMhNqa70hlUb8F5r9uzMsPZbFYIcXVne3NtbW1jtREnoe/7vhcEXjOJWo2k3Wo34igIPZ97QRDEjbjVaga+NxyNsjTd3Nw4Oh3cuf/Aq2oXozQChfKgkMb3wgAs4BxiMRmMlzjzrD+QEMwIZYSIUi1my/FofDI4Oz09G43GaZYKIRkllFFV5mq+6Hre917/5uuvf0txbpgXUnb/s8/+9U/+5onGfugbhAojNa1aQENh+wUm8NpbYYn5pN43Wdmtu0/tYgq54FiXV2hbPeBCWrGV/VL29HajR0f/skU5df5Ye+Y4/HwdRGiHR3B6UwcVgJMPgzbauLbBEaRqmJ+hlJmnDhoNUchVXwwzOsyNaVLGKU2VymyIG4xVsXP9Ywqh2tIoqbSkAE/jdLJYJEG400hIKTDzJnmhKdVud2m7cTwYDLYvXcYsiJgXZIsizTDM3sGEQxSyaU/O3WURWYa4JlYb7QURZbRMU2oRkTC/Ja4zqpHPVoVFkLvNLai33r7X7a4zH9e5CF8JiTRP7+MLT9LFkhdyd30fYhfc1yMGfTVsySUmOkeVEwgQdOEtsr2zgwDhCwcLNtQOvF2EGqIuMg+KVTinlVF+3Eh6K8s8L4qc1gmI1gEMcdCIEcRq7HOAcYhJoHTAWPP69XPO/W7nl598cj44C4E6WR3c9unVepOSG0k7MKjwvb+4e2tBILCIMQCaaimlssNDZvmO1XPIOXVWeEtHRRbThWyeDcBp4duDrBdiM5wBnVpd3naUZ4fSwB0FFpCLq4AgQhgcQRowIdTlRcJzTyl1sBJY5Tel+HYUfbfTlVqfw2Kzztio/b/G1VL2G7eKNxey4XKcXalleTQU2xgCbT9XnNBMa6GNHE+92eLys88QYwb3H731k795sncwnS3n88VsOl8u89H56Pzk5PTo+P6dB3dv3b1378GDvf2j6ayglIch4cxYJFr1GVSYGEY8DFkCUirLKq0+TtC5L5d5dQIWReQHa/2V9X6/02pFSRREQeiHURRyznxe3b0+56EfJq2mJvTxyfFnN295jL/2yivb62vYqek1CGJ5WZQGoSRJ1jfWe71eEPga9K6MUQ/oPAiG3rYosbUdJU5FpcAw4TOOXCi5kbI6Q5PAbwZRI260260kigM/8PwAw1wLCnamFJJKtFrtZhxppDu93sHxyfnw/L/85//88ubmbLZorW+u7l6RCHuYHD1+VObF2va2tihBJT3Po9zT1X2jGcy6s9k0n80YxUbJ0XAo8iL0o9sPHtx9/Pj3/+C/jpLk/ffe/es/+7N/9k/+Sa/bEaJczmcK4/7OJQkmE3tmeh43WXpw5zYuijiOi2VqZAk+LqCCYxw3kr1Hj7785GMlFKO03e9tX79GvMA+ItOzM0pJEy5gTAmjVC4X44M9r2oB1Wg47Kz0eRhXh62Ux0+enBwfjSfT3d0rHuez+azRaqWL5aMn+73eCrFbEkzLvCDGeL4XgwaN+h4H5FYU+IvRZLlYEEqq+xjOaGMMRDKTUgqjDeVVETY8G4S+n8ThnfsPvcBPwqgoSsbYMl0abXrdjtKy0Wyurqy0Oo2Nrc31/mqn0240G2ECAvkgwJiUohCliKKkv9InhMwX87X11dl8eXB0XCo9XyyiMDHGHB6dPH706Pj0ZDyf5XmhrG7fhXebLE3TeTYYnB0fHp+cng5OTseTWV6WjHpwclTtAclznuergf/69euvXNkN4oi3m5pxrtTpo70/+pO/+Hy+wGHoETqXUhGsMVUECQBVYYsSsLmu2MXm67oJsSc9CDapcaNIdBHs7eC4T6t9gunFzY1rhCExQMLCNpMBelmnMiF2lE3c3YEdIh5iZmxEG7I4aoWACF0vKx1LqbpsNQZusx1eAv3t4ka3JGcUYNzzfG3QXIHIHhPA7wPp+qkIGUmjFSYSCJZKG0XpYDK6sd4PtPEoKY2aKXlBOdYQmZoXeVmKnd3doshbvi9HIw3TcFM3wRo9pZnUOYk2cYpY7lgQBEoIVeYuydPNekldvBtzkThoaSD4ImjQor3rgb/ThNei8PrOr5MNv6Kwq0fY9ppl2Dh0J2irHUXTLfPtutgm6yltXcsY1ZVA7U5GVqhs6oBqVMcyIxfuYZVoxArc9UXAP487XWlMmRW2xbRhTzaiHwDFhiHDMIYOWHuGeKAGbm1uLKIIN+Kz0dn9+/eiKEQI9r/YDfgjha52mg0hWbv59v6D0zzlYULt/haKWc487S5ZO8whtdCcEEQkkOoQspAsBJlDCDhsWEHPDCm/NigStsAX83hg/dt7vBYDgZm+Kg8lNkgYCVIpBXBRfBFShJ3pCHMtb3D+O71+k5DjRXYboRLudtsEE1BfYEzBg2/FYvqpDxvkGqAYx8ou7WFDoeB/nFCM7G5bY873ijxkjHz4kR+Gr/3G9y+//DKPGn/xlz9554vbzV7HMSarG4cHcUw9j3DOPcrCqOr7lTalVsTFzAH5jSkkhFFY2RKMCKXBcYuyLMuFxhiv9npREga+jwFCpBHOy8JiO1Uhqg4DExb4mLCsLB/ef3DzwQNkzDe+9vLXrj/jYVwWpWWPIGKIQgILAnv0LMuoEFHorzx7/cqVnflkNhyPx+NJnhdS6KwslFHAJanuXJu5ZdWkHmUICICmKosUCNWN0VoCWZcaTBnTBiuMPEYNqN8p4wSbMGhGvheFQX9t9ebd+0eHB7/3u/9ic7U/Gk8avdWta9ckQiJNDx4/MhhdeeEFDZ4MoyTIqq3pi3CMtSxn45EuSo/R5XyZzqfAN/WENm9/8P5/8bs/Xt/c/MXbb/3HP/4//8Xv/M5av5dlqZRSE9rfuaSAhABtCfE9lo8nR/fucKN8L1CitBJZLRH3PURxGEX7e48/+egjEA9XhysPAj9OQMiKsZLpctntr2LPQzC84QgfHx9jZfyAnw6OldZBkigNF5IoZ5Px2WgUN+IoDNM8LUpBKL+0vT2dL9/96KM3vvGqKpUXUGR0Op2ePHpIfe612kIKPwhMkXss7m6sZ9lyeHbGfS9qtjRQDGRRYqW5HyilhCrjZqPRbk8n4/XV/tXdy/fu7zWeey4MAiFFQPyj49MwDnu9jipFCQxXJaS2KHVo/qor3POCKIxFPJsszs+Hnu+vrHQ830sX86+9+Cyh5LObt+IoHo0mcRI12w2OyTLNj04He/uHBGNOsc+5jTCRSoDCojoBqv8GKajV+aVKZnTMeIf7693uZtJoRf50NDoYDi+//g1DsY/NfDj63/74P759eBwmjbVG8+F4VFKsMJV2um0vBxC5QOGOra2B2lw6Zn0kcDIZmw3q9NJWfGUluC5fnBAttVWGW4Wz1RPBOo8aomR1V8IY1SaYGVQj4murjSGkVqAgu7iEexeheiCK7AjcpQRghShlBEhVLm7KKOAGgALUHUAGlEwUbhUs6jYRJLAYdCwXoTPVT6Tc3lszOCKmZf7uwf5v7t6IJ7NLUTSaj6cIScxwvQyOwmB/79Hu7u5qpzfRqrnaL46POWMSa09jYQiobKrXARbz+OkGHaQ5eZb5nhe2WrNsCflm9gy9aFUvSI0YO0JJPT3GFyQ51+3g2kWMnMAJE3ey2wLKAHUfK9eB1wGGGFHuRzW9C9EL+PFXls3Erhgvoh1QHZ3jZtA2IskiEsFIRWygqRtg4BrzRV2eH8CpjAmazajdWaQZxF8TdzaBYcrZfKH39CGr2SO4uoC1iuIwvro75gFvNN/6xdtllvm+T5BbhVR/XJTPRMGO5yecn2jxV/fvId9jkOZWlTy66sytnYS6yATYW9SCP2ltgtiKyDAnVLvNATLEWDahbaEIxA6CfZZoSCGHcrgqrKgd2WCbOaQv+Nf2c+EiDiA4xc0uwCDPKI1K+e248d1O/yxd/mI+PQDxlbbFVs3D1EjZeDN7nlrpm1NywQdTui8P43QbIwpSAJuJRm076PFJUWrChnt7q1HU39ludFsvvPCsWMwG0ylLGiwKDGWKsZIQCbHYxhghjRRCagkxDoRgDwKBYFxnSRqgr5O6qintx9bz/VYzWem0Yt/nhGulFll1KedZWhZFkeXg96AUgmSGi8Vn9x68/fHHR4PBC1ev/cabb1zd3ERKlsCcAoWqZDZCAnpWjTXnJPCr4sAG2yWNeLXX73W7QeBRRnyPQ3lUHUyE2Moe2LAUu8AMyAzEthM0QBciiEPnByQESLghOPQDz/M9j8Vh0AjDXrt17frVW/fv37l79/d//C/X+yvz+bLR621ev2YQWpyfDR4/RgZfevZZ5HvKknx1nelpFNIqn88W0zHH2Eg5PDtLxxMkq9/R6ff/+qd/31td/yf/7D+/c/vW//Fv/5ff/uEPn71+bbGYSyWVIb1Ll3mjkZclQYQxHnC6ODs/ffTAQ4ZRbj+RVk7I/QBRGkXx6eHhh+++J/MyT/M4SZZFunVtd/3KVW2TG8aTNM1Wdi5hP9BY+9wvJpPZ8WEY+rIoD/b3k15389LuaHCGqx9tuL+3v3dwcO3qbq/bXSzS5XK5trIS+D4l+GQ4fLS/f/nKFQaJmVVfZKQsRNJuABlbQ02DmEenZ4MyLxbLvN3q2NALRniWLcsyjyJotZGOonA8HiFtup3e44ODUpTtRmJhNcroyXi0vrpKPN9oSSgry7IUOcTP2SwBKqWorkxCwiQKo2A0Hp+eDgxGQRjkWbbWW8EY7R8eEc6EEMv5UggZBEEzSVqN2Pd8iqgQQkolhLC9TXXjEsy0iTDtMr4RhbuN5Plu9+X1jefX1npRlC3Th/cf5cg888a3ko2ekkpO5//7//Mnf3Xrnu8FL21uHYxHp1gbxjSgc5y4BjKvNLh24O1jBGAA2DigrF3ZwfEGnDgYSduEBnefWIkQdKhWjI3cGA/o19T+KUdzx+gC6+fwDfaXNqaM2E7EXZMuZhh6PHB4aKv7cmkMuN4aI11vTZFG1GqK3RdglDCEQ0wDSkslZ1JA3BhGTrCrXSqPLUspEcjkRkJ6DgikOT2dzLZbrdUwwloTis/zUlkrYJ1PKoWaTqdXbzwjlOn4oZ5OtCwNsbo2eDFsRIVN1XBpDcg2lqCrJdUjp1RZLC/yYS1EiiBaD/9xHVEGonHsVrW29WHAI6mpVRfQLFwzPm0U/kXgUt2zOs0VpswL4HZ0I2N0kWxkh8z1+6NtXKWNAMC1MttlCz4dSV8kFdI6LsndbMbtsl0FwVhzdU0aBJZBY9tfGE1b61HV+HoQt8DhFz4yAaZcqd7ly7N2h7bbj57s3fryyziJqoeT2Ue0KgJXEH6l2UikQq3WT+7ePBHCY4GLRjCWq+WivlwWrHEnFzT52inPdT13qG5Zpu2YBlGppZFWgq+ojRCB3oo4MLOb3hObdwyzOPcRAn21JXJUzQTMXuD8p4CqFdYL2NL6pUYn0fiD2fjjIpsx5uIkqXPnuv0/wXUgAnxy7H+pTi3tbhlUpxfWhj+7KGB2GA3LZYPpTJSIsbMHj7bare7aKqP0+osveJScHh2W2gRhjChVSudFnmV5mZdKSZgqq6Iss7yYp2mWFWV1E6pSq0KKvBTamLKQUFq7NBYh1Hg6Hc1ms8ViNJ3Ol2meFVJJO/rnnCNCj8aTd2/e/PCLW2m6fOmZ67/xvV95/uo1jpCSErb1yOc+EAsArV21rIpxHsdJEETYyv9U1b2ly2w6mWZZjglJGnGz2ex0e51uu5EkcRxw3zOQfmp3C5QQJaofiICUVgF/kro1uvZ9P0nibqcVhUGnlSSxv7G+enVnZ73f37m0/cmtm++8//4f/vjHm6v9dJFGrfbWjWtKqMH+/mRwSinbvHGDhIGQ0k2IwDtMjc5m0/loaEThEZbOF6dHJ7osGWdSm5WV/sHJ4ec3v/z9P/zDyXD4P//Rv/nem9959ZWXZtOpVeW3NraCdifL3e3LjBkd7J/t7/kEMpGqcwOQyZ7HA19hFIXR0f6TD995r6iKnZIS0mglw+n4m7/yvbDZBCyBmg4GQdJsbGwoqIOwEGd7jzlSvucdHx5mabbzzA0ehSd7e3EQHu0f3Lx7N1fyhRs3KCKz2UJJuba+urmxXeRZFIb7J6d7R4fXLl/G1gsqNSNU5iKIq2rAOucIJTLNQHVfLuaL7mofYSKl5pwvF9UXjOLIbjEYJtPxKAojbPCtu3db7TanzEoWgSNerq2uSSUY5dWNKyQyWGklSwGEJgYuUAoBwF6n2ylFeXJ8muUl557Ren11NYmi87MhBFOSUpTL5TJN07zMZXXpIkqo3ZoRYzyNmpStB/5uo3G917u+vrrdW2nGsUbkdLa4c3T82aPHR/v7W1e2X/7eG167JQtRTmb/9o//7E8//iIOwu8//+LN0fDmcm5CXymkYC5mNSHKOAC0C3QHCVjd9cAqzm1JIJ4BJsx23YucsxHX+nx3Cbj0BW1RwYi6FHkHm4dcfAOadmX3F1ZVZHUkME6mNYcSoB8Uhska1lggIjEucqY6/ijw4QnkCVRdEGVWce3Chq3H2aAYMR+TEqPcIOWmqkRJy5UwFlWkjFKICEj7BxWQswJJY2aL6fWNTb/MA+bNpcqqFueircOM0clkHIRxb22jkKqHcT4eAWPLQrOtLAvuSOSA+7qeV1a1hFaUce5zkaZI13ebxTHUva4NQ3Apxk/5yGDKcoLz2sNby3HqXX49SHZtdC3AcjJpd38b1zzqr+pWrNPbuHrmovN2QwqX3KdRnaBUZzZXP6+qrjhM9UXpALoqi6qufos0Omq2aBAsZ3NQ+hmbZ0lqrguBsHpqDAPMLyOIE8JLmbTbZGUl5z7B6NNPPwmCAIJ4L74n7El5vZnE0sRJ45ej83uTmRcFsLkwFwhJZTS16nwbUo6A+++CJ6uWUVq7kWO9YaVE1TNZVo7WzKMw43Xhz0pVfZJ1m0tpGLO3r8NT1a+dY8jZsZFTvCtol5WEd4eAGBgLgo+F+KVefCzkWR0rDYYkO8mxUZ2w/EMu8RC5JAbIUcHE1KwOm+ePbbnnMsOMgE/dV/L02d28oH74H/70L/8gCLZefF6K4pu/8sbus9f//qc/f7x/wJtdHoaGkDIvMy3neWqqqrQ64UEVTEspZLqweD/GqAtPQ9bUX3XOVclLHEmOImBrEOb7PuXVCZdpc3//6PGTg/Pxea/ff/Obrz17ZafXiI02+XJenRecCS05QFGkkJQSpbXHeRAGXuBpbFTVHGuI25CLZQoIXAQ7ew7oR+J5zONBHIaEIkK5UFLk+Wy2sKw4WeRFURpABFPCvSCI45AyHPlhEsVhFDBS/bCMsuHwLM+LKAj9OPzw08/++m9/9t/8/o931taXs2XQSDZ3LpfL7Pz4pFwsKCG97Us8iQv4hjEmZZaKLGXY5EVWZAXRuCzTs/GxlJJVVwqTRjY7bUPJz/7x57/+6z9Iwui/+x/+9YvP3PjmN74xH08I56oUYavT6PXzUmCDfd/DUpw8frQ4Pw99ZkNU7IvsBZ7n+aVRURTe+/Lmh7/8kCCcpUtM6Prq2vl40mh3++vrparqznw+VQatrK9qgAb5jJ092TOijKNkOBiMxyM/iju9lcPDQ5/ycr589OTw8eHha9/4hodZWZT5MoURqVZGXbq0k+XFqy+8+NFnn/30nXe//903jFSlKBnnSiipxdr1q4iEBmPmB92NrfPBgCk9mU0Gxydrm5sKlcaYVqs1m4zO8rzb70stk0ZrMZ2KMn/m6uV7+48fHR6+dP16lhcEoTCKhqPxZDRqdZtFXlDM/SAQogRPHiqVwEp6nFlIlNQSEbO9sxFG0aOHj4fDUbPZ4pz4nvfM9d39w0MhRNU8surNqrpeXRIIoMTGcEpjP+wEUYPiqKpQ0LQoBtkiL8qsEAWE9st51u8kv/K939i+tFMaybUqFukf/V9//hef/3Ij6f/at7/11oO7H4/OdKsJKSR2caOBaY21svRapI2SAOPHNiUAucxP6BE0g4wjKwBmhEgrgYZ5jiXwOM02jOWMNoxSDZlrcArhi5h4y7DVNtfarousqgSaH2MNRdV5AXuiGk5gzU1WFV07jCGJwWg71rRcMmiiqA3Sdcca/LiMY0JoaREKUAEoqRxlAh7aUtsJtoTOmUmrjQYRtef7++ny89PjN9fW5SLdTeLJZCqM5SIQLKuOLQjCmze/3Ll8RXis0+nGo46cDn3uSaMlQhIhBWvUUgNnACynqNZEaWWyIm8lcZi0luORi3d1i1jnpnWY/TooCS6K6mVUT7tZU6M2kJV9Ee2GBORpwpJDTwMIsAZRaUy5F9RjYhiP1tOJWqhbe32xu3+ttBqkUrZrttxtx+WuQSH2+nd5kLDQBS0XhSuIeY3V1RKE5jD0MPZWgFdHU4zrqEHkYeRT4oEgK9Soc/3aME6CduezL754crAXxxEMD6Eyw4gIucXZ82EQIDKPg7+6+eWcMkoZYQY9nb3AwBaCBcFSb38qav+LzS8gToNgCQxO4mvVApx5FAI67DzTWrApxcpYmnedcA72emBiaGIZntVLcREh5ZTTDgtqWZUUHFEIFxgdi3JPipIzp1MnFtViKIBYXcCycfpqK6oArSO5EMbXiYpQSoMjj7m3BZR5IJdU0C4jwqZCEEwOb9+6fuVyc3OjzJeNVvP5Z643wuTo4Ml4MiHc04wKEJJJrXJRFqUspYBi1lDO4jDiNjgI8FWce5wzRrj1aAV+wKv/Wr0Xvu9jxnKtT2eTe3tPPrt96/h8sNpf/e63vvnGSy/sbq4zhIqikAIkopQ4JyLAw4jRYRAkjUYY+qRmzCOt8zxdLNOiaqqVrQNsf4A5sy+RUYpRoowu8ixdpAjhqjNuNZtJ0u/3mnGytr569fKl61eubG6sr650NtbWu9022Hw8BqEdZVlMZ1NsCA+CT+/c+dOf/OQP/uW/ePnGjXSZ+nG4tr1T5Nn50aEpS+qx7uZG3F8TWnNKkFTTwWk2PMdlLos8W8y1UuPRZDwaVoc5RkpJZFAQh0mj+c77HyBCf/NHP/o3/9P/2Eri3/6t30pBrCRlycMYIgg10iaJIrGcH9y9Jefz/4+q/36yK7vuQ/GdTr65czeABhphAsjhMIwYpBGHkkiRsiiXLfsrW6Zsf8v+a94vr+pVvXL5h1flIMmS43OUSBYphhlOxCCHGaCBBtC5++Z78g6vzlr7XIxVpakZotE3nHP2WuuzPsEXDqEEGnzKHS+MGnAWaD8IPnz3wxsfXdPa5EVeneqULC8sPNh+9NqvfWXz8hUJounZcOiEUXttTVLiu9744CA+PmmGUV4UTx89kkXeXV1bXFp4vv14dXXt8c72u9eve4H/2ssvMaMLWY7HE8HZmTNnINTUtFvd4XDQ7XZ2nu/uHe1furhlpM6z3HcFzJS03ekqHGA5n/b7WpWlVOlsaoxpNJqlqsqn4E48m6bxtNFoQhq3MxuPHddrd3v3HjwIw7ARBlpJBwRvSRwvLHQElgqGe8vqcOWCG6kw8xiIwEowrqQMAr/daZ8ORkdHp0WZTyZjWZTMJlkB0AUKQwiArbpd8K3TWukyzydxMkjT07w4SpJ+nmeMS06zPG24zje+9Plv/cbX20u90ig/iAYn/X/xp3/xkwd3rp596c03vvjj2zd+1j+h7RZ4AAjwz9QSaMxASILUQeSgWAAUHIwxCRszVapqqlD9ANbxDO2mjTX7ZwC209o4n2hwHbe6GI6AnwYIDwcrg8nHsJa1/Gf05CMgnK0N9+rcJHAV0DZdDxP2kV7CAN+uTkpcAtaMbFojc9WZ5lIaceYwnpRlShTi2RitARxqjFXTGDBcQDirYQgU17Med/qjwbnlpQ7lDqGJoeOyBJDZ+j0xLqazKTXm7LnzcVZ0HCEHp6jG0RYmtMn10qa9U2uzCYCiktp1PMd1yywnStUwJkDrNaBL5uenXQDXcb/EGnDU9PBaZjSXuIBnpAWMyTzQ3V44lCH59u1YE2orLKV1ChX+JVY3UVZsggM5ro0tPRXrWzX921RJgmmAVpWEK2KpadDtulEzns0U4hU1ra4qQ4Q6hDqUOQSmXspcalxCnEJ1lpfI2nochXGRvvOrt0MYfxn6aoCtdFOVn2u126VpdFo/29u9M+h7vketoaYpygIwJTYPmSLgjcnB6LYqmZxiiCkxBhYxuGQwjMETybklpcHtYxnq2DfU+AO3eBEtywIHX0xc5JzWtxKBlyCUQlo4nIsKcA9mkCLPxkr1dVkKpFxw60YCxZWhhBkfCjAtQWAJcGVq5VIQyFU9GDYZ00qMMRkJLz0jjFvTFghqZdUNzTkf3ru3ubHePnsmHY1oqda3Ll69cF6lyf7xcZwXjusQwBsoJcJxtCFlWQ3AsqwmHWJIXuRxmlZ1WSkKg2hR5gAXV89/WhTjNDsaDx/u7d159PDx/gGh7MrW1jde/8LrL13uNUOiTFGUEsTNxqiyLLK8ACVb9SajMIyiIAh8wYUyBSNUVsOsStO8yKVSWjj264JkBzDrB3kx5PyoWZKMp3DQB1G71fQcFxNbDKHdbi+MwlKWQGCXYHRv8ry0+lroVPrDAaO8u7R468H9//Bf/+sP/uiPvvLq1Tieup7f6fbKohidnjCjGRciilrr69zziDbxYDA+3FdZErquknI6Go+Go8l4nGepUw1nVCnpuG7UajVanSTLP7p+/ft/52//5//8n4os+ft/9w/zPEdvHsN4b+Os5g6ryqQ73N8/fPRIFDlnTFbnheGuG4SR4/qFkl7gEUV++qOf3Lt3j3Ke5VkURlKq5cXlOJ72x+Nvffe7UadrCNFFlk6nrdVV1ogc4eTD8eDpTiQc1xFPd3YmoyGl5tLnXjs6PNBJQh3nxz9/e/fo4Otf+lJTOJRwKdVkOovCYGVl2fH8siz9IGq2WienR2urq588fno6GFze2iqzRErjCJ5MZtwRXhRVI55geTxLJ9MiBZF4kXue22g0i6KgWjuOkFk+m0zDKBSeW8iyzItuu1Uode/TR2fWlqtzAnw8sixnnDSaLQJ5pgTQZDiBqMEVoMJzuGaIGsMFW15dyWU5Go4cx1VghwOh/7ingdwCID8zWFahCkhqXVbzBFdEw6jMVJHzPHvl3Nnf+o1vbL36soETw3O97Tt3/8X/86c39g+//2tvXtna/Ffvvv3BLHZbLUOIhLxSXYfB4ea1Pp/QRwHib+1JUpsdARisJEQGo0eSpnNEE7epKHScWx6iohKLHIKn3KbrWLYInIRYhqzfEWbL4BQnbNI5pMRW9dcIAlZXtUzfzg/aWt0JBm6KoLYA24N5Bi11GPEIb0NTnBCTGetvrxHKRSU0iIaq2UNrSamq5kNu7L9Y0vVUyiLNX11Z1VnuO84wj2OMJUKCLNFC0JOT49X1s9wLAkLcvCjiKbosS2IUFFMItIaBhM5tM6xdv8JcL63zLGH1eIOu9TgMmznXFTOOaC2hYzb/z5ZjZlWgUE4BIrWg9WcpVAj4W2o15w6QmMj/VnAtj3wetQCaalM7gOALYL2HV9FoIInLXmZqUNgOjjhTG5sc4PvNpeVCqjzNac2RhjcA9CvQHaH0yK3KsHGp8bVpchFeutj3A6/d/uCD9weDQRiEkPsH5YQQIdVW6G05ru8GR1T/+NNPSs+thW3gOqWqJwf3hciGgnsbjDiqC2QgFwt3yciNEFVpNlppWfUY4IGGFdoY4jDnM4KfObfcqj6QbGyn5NowzGBjDYEKjBKJHSLeqAjGIBYEWnf0FaPMQj1AXGDmhRmpDX+klp1BP6v5tuoA6Enxys6dUQgCDsCMZoDHqGrIEIrSmZKqVKcPHmyur3UvbhWTafL8me/6V65evdDrFKPR0fFJJiVzBGOO0Zpj/yW4JtUZlpcS+kWmpCxkkRdFIjNlTFbKcRoPk2TvdLBzeHg4GBBKN1fX3nj55S+99NLm6prLeJrGaZ5KpfM8T9JkMp6OJhNCSCNstDutRjMKozDwPAYHjdJSgrY4L/KilAZSm4RdfRvQajKIsIN4wbIYjUf900FZlK1WY311w/cdhcs2Tju93sramizleDTm1jyuKtpZnjvVGM+KMleaTGczJfXS8vKN+/f+4r/8l3/w9/7wa6+/nsxi7lSvpEuZTCYUGjVN2OLGhhOGxSwe7u+loz70bnQ0GJwcHk8nkyxNCdGe58ii+rBB6Pq+G0YtNwhu375z6cqlmzdv7O/u/vE/+P8Z94DZcQAAgABJREFUCRsGSFiKFpei7gJhTCXp6dMnw71dqiQHO1XHEX7YcDy/6jKIabSax0dHf/0//mr3+a4f+pNZEkWNUlW1Y3ll5db9e2c2N7/x1lsGkrWy6Yw5Tmd1lbguybL+9iNBjOcFg9OT5ztPGWXNbndhcWlne3ux2/vw+o1ffXz9yvkLV7fOyyJzhTtJZtPpzHWcpeVF7rmaGlnK7kJPKTPoD9ZWl2/e/WSWxJe2zhdFIaqmiMbxrN3pMs8DnJSMT045JbMk9VwnS5IwDLSWVUXUpXAcKWWeZ61mm1GaZQnRanV17cnOziyO11dXwZ2xeiiU1M12dcIbY+k2OBEKuPmBfi7hsNXKnpDU4XxldSXLiqOTI9d10OTLgPTcEdX9zQwRMAhbT3XGCKdVP8d4NaFpw/Nyxffe/LUvf+3Xv+G3mpnUXuDR6fTtv/7xv/v3/63ZaP3Db3/7uSz/r1/+zTOi3UZDgZxH0RebgupOBrGiXdzVxgpwzaunupoJBSoz7YBsES+bDY8rSjP3maE2WdyKH0slLRcals3WW2NukmUJQcgCta5f9fvQkH8DbBVEmJHYi+Q2FJVCnLS2cyJCrjhaGjAnIGiYXjUxxviUtYSrtJoqmYP0CCylcPur6dzIl5gSnD40xBsikjEHz5lwhuPJcruz4gdOWUouTrPCWPcFzqoyxpO8SJP0wtbFNC9arsP7/VIrcBmrJg2FlC2KKH6dCcpsJrZSpev6nucXSUwgcrGOHiQ2EQPzewlTzDYs9feFF4ORuXLXQsamdt8g9dxLX1RgYjsvGO8dH3GO+vTGL5zO52j0EbH/TV+YZrH697EaWiWY7m7qIs+oxZaBUQZxHzTsdp0wiJNUK4lEQHD9xsgjArYbzDWkmoAp8wgJKHWV6q2tZAuLeSPqj0bXrl1rNBoUOy6KEVlqgeirnXZDKqfd+p+PHu2mieu50P9WP4F6XyubAzcTzjDtXiMaA75TqHpD5a7G2x11ZA53cN/KBKccE6zsyEsZryo0hLlr5PUoBZGxAjWy+Co2qtpo9M/CGBDOQEfEUFBvOdMQSmQTUqy8rxY4oQEIs6yM2rLGiq3R0RUlfUzUq35UaINFEuyWIG4J+muuIUqs6kZhmJDEzLQqtTm6c+/c4kLv8kVZ5Ds3b8YHR2eXVj738ktLkZ+NB7MkzZUWyNRAI5vqrVXlOC9VfzpJpYzzfJwkszyfZuXe6enxZDwYT4jRq73Fy5ubF89urC8uUVIVtuFoNBiPx9PpaDyZjGbT6VQb2Wl1VlaXNzbWuwu96tyG5bE2Oi8KY0xV23MJyTYQnVa19YYyAV7KwnFd6vBSymkcHx+fjIfjslRLy8tLS712qymqcVY1oobw/cXV1d7Cwt7zZ6dHJ77vci4QBbIpDn4gS6W0SbNcSdVdWvjw5u0/+w9/+Q//3t/9za99bToeCc5gu1lKWQKkKgzRAQiaxyenk9MTpkpO+GQy3Xu2Ox4McpmpUlFjPN8fj8dK6W6vI1weNdpB1Or3T5XWBweHD+7e+yf/+E8EE0ZKvJSO73dWV42Uaf94/+HDdDz0OIVNqud6LmbAybLgVcfg3b55+4d/9UNZFI1263Q0Xuh0Hc+ZxfFityuNvPPJ9ne+97sb588rqEdZkgVLC167xaU+efTIpFkUhGmSfnL/HpAh2bkLW/F4yrR6fnjw45+/3Wg0vvnGGwQY6V7gT6bTWTxtthrLy8vc8+Bmropnt9cZnPbzJF1aXrpx5y5l4tyZtTzLwyhUpUzStNHrQYUhk8FAK3U6ODVKeY43nQ6bzSbEbxIlJRdCK52nadiKwH2OcM463fate/e7nXYUhhhrLpXkjEVhCCbT1X8TDY7GAORapR8h4PtvOKtmP6mkrsr5MqXs5PiEQMeG9cTh1STrOILDFopqgsyG6mZXisuiSchK4H/181e/+Ru/vrq+WuQ55cwldP/OnR/95f979Gjnt9/89c9/7Y2/uH3jX3/04awZ8cAHCyWqMLwVc2YhbBSd8oy1rwNbCnCFm9tAoHEGAsi4IxO4FKxKh6oxZ4MkHhsuyFAibLUbltsDvFngkVhbBhxQKa7MACAF4lE1cxDrtsSt0aKwQaXWp8JG/FgHKHSjNHPbH8gttAb0WMOM9iltu15pzKQsVG3ThybW1keCIGJnqlEVFCrGBibi/o7im5TGjGaTz62tsTwXjjsu8lmtNcb0GSGcQb/f6/UanS4rdaiKLJ6AgX9VPJXlIUPiKrHqKFbrcw0wZnzfZ8TkSTKX/JhaJmoLnJ24MBYC0xSJ1fESm79H7AA8r8hYAm22+2djh+cs6JBZlyqbtWC3+ha0RMcwarcHddDQC10xrc0roSQwK/i2ogs4PdEKE77HIIgWFgulqlHAYE5Hdbxy/EnQHbmGOoy6jHqGuIz6SjU9z790ceg4bqv1q3ffTdPMq+YhxmwdMkLJVxvhWcq8MHowG//syRMWBYxY92k70KOrGEOGgbWdQkU2zLx27Y80IngwNJo520QwqDfSSEqo4ziqvnuMMqzuiQgxL6AFyNHFko82cgRaOjoXZ9l7vvbAst5ZRKE3NTpIgqQEpt8a28EECWwVUFRjn2BcVwP7mrIXtIvaa+iFn6jdPdRqBOsIUl2DnPKJrC7Ks9t31puN1VdfbXdaTz+5d+f6jcD1Ll7a+tLF870wSEfDPE/h7mNVGapqD8h2GCkNOR6MnCBsNiNZlCovHcF77c7G8sra4mLT94ksk9msPxyNJqNZksRJKrVkxERRuLa6cv7C5taFC2vLK2EQKK3KsmpFVSHLsoTMBSKBvw26amUg8lNKRYzm1fvwKefjeHJ0dDQe9IfDgSZ0YbF39uwZz3cJMUEQamOE67phuLS2xjm/f/t2Oh03m42ahVp9RX4QuI4oyxwdoGUpWwsLH9669af/7t/98R/90Vtf/3oyHcMtw1Up4dIzIRzP9QnVZVEm01jlqeBsNpnt7DzZ392HJo0XZVkNVa5z75NPh/3hhQubYavRaLWiRiuO41mSHBwdffTBhz/4wZ9EflCWOeNUiKqT8HxPK33wdGd8eEhU6QqHceb5HjHVQ1RCuEUUhZPJ7Ic//snHH19vtVp+FD7b3W80Gu1WI05mDnM6ve79Rw+F63//+3+LOi7nPI8T6jiN9VVHuMOdZ2n/xPc8o/WTR4/iOFFSt9odL3BHw2Gp5N+8++7eSf/NN76y3GkpGK1a3YXTwSSJ416vvbCyXM9J1VknHKfXWzjY23MY63R6N+/cabbbC71OVYPDYDabOlwEzQZnrIiTdDpN0+R0MFjodIo8lYVqt7tSKqTwCCaULmVZNpqtvCyI1ksLS4qYm3fvnTt3Fnm/kG5LoqjBmFXNqrKEPJ7qTh6PRlprx/HQJQ88jDQslJiS5erqqh8ER0dHmBFswPMYKUcEMrBxr+ko0zJq1RWvLC999dVX3nj1lY3VJcOMKkqPksnuwYd/9aNnN2+/cvnyl99689PZ9P/4n//tx/v7ZrEHxw3ThsM5Yg3ttMZkXkj1tiMmp/Vuj84HHYVSIkVhRQvCo/rwRwgHyZgMBRWknl5BAkQo5UB/NtaRHmJaKIbG4xGBHGxuvZ2xCKJXghF4StoBr46EsCF6tfaF2hwgxi3eaUPuAOq2vp3GCEIizkNCS0JipSSnVhtEbYA61unqC+Fg2qwhQ6+aku3vr9FFQ4UYz2ZtzznT6fCiNIIf55l+4epFwepZjUej8xe3irJsuIKPRkppCU6iBpy8lI1OgKbCzBHf6gxWWgrH8bygyDIFRpWk1g7heo/Mhb+W40xrFbCV+hA9jyiy0LA1f7Z5DsZmIdh9Af44447rMWTKzmu2RfoNotkMx22EkS0BC+uyLT34/5aSZE2HcETGlCbc8Fc1I+ot8CCI40RLSesWjUEwBycGiFeMU+JQ4lPmMuMT4mi9uLEx7nRpu727t3f33t2oGVVt0nw/qvWKoK80G01lskb03z95MNGKMceAiWttcUFwdkdXLyEEICQ4+9Lak1njGATKcjoPnbbRl6AgQgFS9bnrfS+zC3tmWxh4otIsweAXShgkhwuKRnFkXo/nu3xob+udOjSdhjH8eV77ilIBn1cDTQzFCRQfIW3NufBvAq+n5ppZSzledw/VbQ7uXCCLxXRI+FUc9H+q+rpEyUlflorynZt3OpSdufrq2pkzRubvvfPO4fP9drN94dzZ186fa/vBeDgss5wJBxKeFH4cz/MczxuORpqYjbW1KxfOb64ud6Mw8hzXcXzP9Xy32+0sdHvLS721lZVL5zfPnztz6cKFcxtrvW7H99xq6MkLqSRGn8qytFsOaGUcANyKsgAHkuoL9zyXcac0ZPfo6N6nn+7uHaiyGg6areb6xkaj1TC6KqJhswETkmHCXTtztiyLezduCqMxQJoh79RwP/QcxymKAuIiVSlle2Hxw5u3/+1f/MWf/IM/eusbX4vHEwvka6SGGlcIwUVZlFJKDsfedDp6/mx3b+8gjmMhgNTHWRg2Do8OP751M0mSr3/1a+1uywsDP4yyLJ/NpkdHh+/96r2///f/sNNuQl0HPaaSjNAsSYdHR6QsBQI5Vcsl8zQrytzz3MWFReY4t27f/9FP/2Y0Gi8uLkmjP338pGpoVpbjeFZKHfqBCLxbd+5942tf/dxrnzOAzWRF1lxejhqt2eHhaO95UA3Q7tMnTw73Dz3XlUp1Op3ReEApvXbnzt2HD1+5/NIXXrpSJCmjVDhu1Gw/3X1OtFrodpqdtuu6hhpZlkhW8DwvDIK9p7vNRuR63r1PHi2vLPmeRwkNPC9LkqjTYo6jC5mMhpyJ5/sHjhDtKEri2Bjj+r7G0xkeMZC95W7gKeABr6+tbT99NhyNN1ZWZCkJwOmu6wghUHJQPQ0Kj1ya5fL+o+04SQ0xnuv7gUfwYaiqFJdl2Wq1e+3O8clRlqWB69tNBgYNo8OiUktC/M4rL3/98sWttZWlha5wnaoEljIdjB++/8HBnU/OLq5cfePX+pz8y5//9F+8+/4z1xHNFlDTmUKLo7qw2lnTnjY248aevIAkY3I+GkZqreerRWJPM1o7D1NIbqXWcFbX1koIcFe3s0KI2bbj9dITXKYtJwstrmASRaIICnOJYKjyASIY6mFtvAElTICJh21SCKmPLo12mBo1Mazu77kxoRBNx0mVmkhAdeCXw4uCTR1GNhGIcEUYAPBS9Kusa3WdnUfoyXT60vpqJBXj7rQsJtVpLLAUGmMch41H4ygKu0tLZak6sGcxUJoUmIrMI5RRjISIIpZkLBR+EFJGZRJb1rgttehRaawbd51NOHfgsOynzwQWknkHM48ZrHXCpMYg8M+473pocG0RDWq4wZvCaGZqG0okGeK9UpU+Zoc5beW/oPlEHBcZR7jphM0uLDWNYn7YWFgspMrSrKYXVb0fCok4IQ4hHEIXPMNcYlxKAyWbUcPbPDdyAxoFv3j7F0QbtA7G2DFCiaeKz0WNJcqdZuP6yfH7BwfC92xcgU1YBpusmkDOEW6HpwwGdqa0MphijDi0suo3/KahZWbgG0gFtyRBMPOglruPMDex5ulKqSxLVSldxwXHNf1CWA3R/ajYsji2ZYPZSRToydbhG6fbatRCjS8ma3Fm181aI6MCbdNANsch1rKWZtsgTlJvWEj99DKFuBNumcGZA1NOgA5GSsZOi8J4/v79T9hgvPXyK72LW2c21g8Ojj66fnN0ctpuRBfPnH3lzBmPmHg2zcoSOpaqKVJl6bui1WzEWfbgyZP9kyNNSLPV7C10Ou1mp9NeXOiurSytLS8t9jqdZrMRhA7EH+myGh8VwIkgjEZ2t72bGeOCU8yGIjY1zVHazNJ4NJ4+3t17+6OPnx0eNsIw9MLQD7rd9tLyEucc46WDMAo8vywLLwwvXHkpmcX3blz3GHXwRgJmoOt5QRgyXv270go8Q3R3aemdGzf/1Z/923/6g3/05le+MpuNYREAyyutYHKhrnAgKYMwLuJ4tru7+2zn2WyWIEIYhqHjOaPJ5OH244ePd3zH+fbvfGtldcn1fdf1iqJM0mz/YP/dd975W9/73trqcprH2HhRSACUWVZmBW4icUIv8kKWhecFC4tLYdQ4Ojz9m5+9ff32Xdf3m+3W8Wn/8e7zs+sbF8+dK7K0lJpq0ut0nx8dnQyHf/gH3293upTzLMt4FLZW1vLJ5GT7kUeJH4ZHh4c724+F42hiGo3Qcd08z/aPj9+7diOKot/9jTdpUcCaQzc7HeqK7e3tKPA77WYYhsJ1gb0gtAIKlTKddlsbcnhwsLSylKXZoyc76+ur1ehNBTQ2Kmy1iTbxyakqi8fPn3MhPM6jqBHPpgApN7SUEEammXCq5oYJz/OrS8PF+vr6r959txk1Oq22UtLAtj/wPXRcRx4SYlhRszlL8+d7+2mWjYajJEsd1wmDEE4eUfWOhWy0mivLi0Wap0lcFUUIKWLAXZWlZFp3qFkTwqdCallkaTIcj54fnN5/lB4cN6PO6sWLE87/7N13/s+f/+K98dhUX46jFEJuFrw0DFX61pmc1QpRZNICOcjYUmrqgCEcaO3wUjNNqroKYsNaMAolgQFnZb5cNMxOUPWZZ/0UUeoDQb7Wsb8O0bFaV4UwpIF7G2Jn7braZbzluXmhJKyjGXJtrdADSrFNEEAYzhYoDrU6IDTiYiqLhMwjgIylf6P1MECZSqMXBMcXJRpGMWSgaZt4wLmY5plnzNbqGkkyzxVHWVba5qamFRs6GAzOX9xSijWEw+KZyqpBWREtYUuo0CQQxy5EyW2wMgNJGA+CoExTLQsEJqEE1DFHrDahnkc7vFB10jqjl9RXE60zSI0FU+vdDktoG35hCHc8H80/gD01d9agNucBYG+rYbKrdmOjf+AlOJn7lOHfrroXaoMZIGQKynNJaNjrOUGUJLGRCm4hw0lV7NHuUVDigiDApxD6a4xHWaD1wtmNUasruq2H248fPXrYaDaoDcyrbgEh5ZrLX200I0OHfvDf79/J0VYJHS8MkunhLoeKBXcNcKG1EdzBgEs0CTaWCM6sVRsByTCRsA7DckvQyRm0Q5phsqm9oWAcZVUnmRcloaQaOxzPNqE2qdeiKQLaasiBgLoOdpsGIQM0LbNPV/Ulg/SPobyP4badsHkQVdVIYqoIx2RvtE2HABNe39xQvaufsPtiTeyfAPRgRbqYhYvsfy4ZHRRlwsTR3v7s+d75rQutixe3Lm11e+2dJzs3rt99vndQFFm33Wi7PpEqk0ZCzCfCYIKyXqu93O0laXZvZ+fes6fD6ayExms6jk8Hw8FkPJslszQrVGms/Is6rgMiScDCuACDFFHN6oLCIt2URg0mo9F4OhjNnh8ePNl9vnd4sntycvfx48APrlzYZNo0w3Blqed5VT3QSrlu1QV5vq/ynBC+dfVzeZo+vH1TEO26niwUJF9R3/eF41HBZFlqoogmUqr28tI7H1/7N3/25///H/zgN7705WQ6JXYvUT0/DndxEY4Z5GWpnj979vzZ8ziOKaOO43ie64X+JI73Dg739g9mk2mn03zrt765vr7GIFI4TXPOeb/f/5uf/PSbb711fvNcPJtSsMmtrmBRFFle5KUESjmpRgSpjXZdv9XpNMJgNpl+dO3mL95972Q07C4sGEY/ffpsMBm/cvnSxspyOpulea6UDlyv2W5fv3v3wuWLv/3N36TCMUQrSlsrq0Tr/uNtoXUUNWaTycP797TScFMrz/Nnk1mcJO9fu3Fyevp7v/vthXarzAtGSSbL5bW1/unp7rO9pV4vCgPXdb0g1FQ73MEuElwGdbfXGQ7H8WS8uLSwf3Q8Go3X19Y4o4KSPM2iZtsP/NloYGS5s7eX5WW70RoNht1OL0/T6uq7wpozAVAH6nzAAaVpNCO/1Xz73ffPb57nKN0g1HGqKRhIDkoTLVWJg02v3To+PoaQ+Wo86h+fTMbTUkrDjOP5kJgkXc9dXV3RUk4nU2qo6wDh3PE8zgLKfE3i/nB4dDI+GfSf7qrBhM0yQSnxvU/z9F/fvPl/v/fe26fHSSPiUVQdo8q26BpFvRj5A6crRr0aUFdoYNPC7Gmff4P8ZI4PKBQebe0dmJV64LKwTs2pTyuge0v4tjgaL2hcEOr6YMaMFAYUWTj9ObHhCzgNWpwSkECGqTSgSNKgsNHa5BJMWqkNmTcYfAfKo+qTCYz7p6Sm+8DOWgtCmo4TcpFqmZHqizF2o85qvF0jZVRhFrL1s2YQrmpsH2JnJhgzOOuPJ1srywuQcjjTZlQWmnJYLFA0AxlNJn4QLK+uzcqyq2UxGinGIYHOKEMhlNF8xpGDWYosHJRKkyDwAXmawaiviQ0/mCt5XwiJiV0g262wIf+bB9Yci7a8X7vvxo2wjaGtzg7XC+baVGZHOVrTueZm02iagjWKsDqdwbqBzcOOsOBTjQHRoEcChyljuBe2FhfzsszSFAsix58BWgIEylMHSy8hHiE+o75UUaPpbJwZ+JEW9J1f/UpwIRwh0PgKbtiGUp9vtbqUiUbjnWc794cDx3cYo59ZfnPz4gbGEZ7ZgdNuZapHALMZ0ODEEU69ptGcizrtALXEVDBulOHVo25QlAtiOExRrP43VwjXdYWwKVLY0ZRKCsS3Ta0og56AWQtNCu5U8DugT+Y2dZNjF10NgIa6jDrVbUo4xIZbnRRFkgjhdqLWNcty7hZuKD7Tlsdu0E0TZ2pWN+TYk1JOwSuAGsGGZTEhZDiaHN29u9xodi9d6qxvXHr55WYzPDo6vPPo8ePj4Vhp6roYyKPAtdYTrjamlKVL+erS4srikpTy0fPdR/uH4zQ3ojpJp7Npfzg6GQxPTwf90fh00B+Mh6PZbDSdzuIsS2WcpJPppD8aHQ8Gxyf9g4Pj57sHz/f29w4PD45PT04Hk1kClpjs+dHh8uLCpc2z6XSy0GkvLy8wkF9zxgLfc32XKE2VkZRtvfKSksXDO7epllw4KEH0PC8MQ1wuSKlQI6GM6Swu/erja3/+l3/5z37wg6+8/tpkNBbQiEpZUkIcx2FwbArHyYvi2fO9p0+f9kd9CpI83/P8qDEpitsPPtnbP2CU5XnRbIa/8+3fXltfL0rJOMnS3HO80/7wJz/5mzfffPPi1oXZdEoocavhSaVJWuSZwQUeLDUMMIOa7Xa324nj+Nbtu2+/897T3V0/DBudzsGg/+n2duA7r7/6uUYQlllWyLKsxhW2uLhwOkk+3X78d77/e2sra0y4hZRhp+373unOY5OlYRCqorh361aSpo7jGqMdz51MJkma3n/y9PYn99/6zV+/cuFClmYCYCFJydrq+v17d5M0X15cwBT4RrvFXU/p6tB0XZ9xVpYl56zZbh0eHBtDWo3G8929OEmWl3rC4Vopo02z3cyTJI/jWZK+f/vWpZdeGg4Gz3b3gkbLdR2M7HQcl9SoU55lhBDH5VLK9dX14Xh84+7dyxfOq1Jqrf3AF7BlqNFEiDKrumITNVvP9/eE64ZuoLQaDEdHJ6fHp6fD4XAymla1qywJOJEFUVjmJdrZwCaStgPv117//MUrW2GryTlPk3SW5c/S4u3B5C8ePvr3n9y/O5ukUSAaTQ3GUwa9CgEt1nUWnlY2MJzUIULVI8ntPIMCoKqA6NplHxZkc+mUoKinsH03AmPILNFkrj8iYKlrDI7v1blX21zh0YWsZrDcQF0s0GMhVEYrhI6rd6ihCYCygv0w/Hark0J7KTviGoojGciKdG2aiCtO+DTEOMZEnLuMTZVO4RwCl83qyLUeI1YWy1Q1WWur7oDYGobUY9isIfQCThIsLkpTZC+trqs0d4U4ydNyzkelllk1Gg3Pnj+vCIsIIclMF7lhTMGH1oQoKwDDX482FzjlGoyF9n1PAYoJH43UztDz0ZTSuffT3P4ZkWr8pm0QI6vrM7Vj8dyTuC7J2phqAq4X/5i+V4/MdJ7/QOvh0IKjNtmN2L4EXDZheV6vzdG/jUOtIyDDanR7ThDO4hnoB0jt1FFVBgH/dMAc1CXUI8RlxCck0KSzeb7faDrdzv1PPnn27GmjETFicQbGiJDlOde/4oeh4zwz5ocP7ivXwbvohVitBnoB0+QW/gAM1t7elMBbmrMRa906KoNQSEdo3ZsxpbQQAkmM2LRChprlVeErWmNIwEQQkaeGCMrxYuAGVjBO7FeGe3DcNKP+GGFIhtRoeyW0jlwn8txMlWBfZ/ljeFigJcVcSoZIELr/v1CQz8Mwa8ZRvaJgqA00pM5txp2O4LExU0PGWbZ953ak5dkL51kzWthYv/LSpUa7ORxPToaTSV5kWhUY70MxOEg7ggvOZZH7jK0uLK2vr1LK9o+Pnh4eDpKEuq7j+U71nJMsy6dJOp5Mq9F2POr3R/tHp/tHRyf90/5oNBiNR6PxbBZnZVFIjXiFqP7P0YI/3Hm8srR0YX19Nh4uLy4udDpKKkqI57qe7wdhUBQpSrs2L132Au/Rnds6yxwuJMghwij0PA8SVgiYmimAemlvZfUXH33wl//hP/7zf/wnr7/6cjqbwTqfaKKQkui4juO6xpCDw6Pt7SfD0UhK6QrhuU7QiGZKXr9//4OPrwvhrK6sjMejVrP53e99p91uF3kpHC5LFYbR4eHBD//XX//6b/z6pYsX4ynooKQkymR5IWUBVBkIpVaachq1mu1uV+bF/QcPfvn2rx5uPyaMhe1WItW9R5/0+6eXtjYvntukSlNNijJ3Xcdo0mq1m+3m+7furKws/f7v/Jbn+aVS3A+63W5/73kxHvieT425f/f2aDgQrgN5jq7RejgePz08fPvjDy9uXXjj9dddzpFsWhSFH0bNdufG9RtRGCx2uxkE6bc7verdUs2slQ0HqyfTbLUUJYcHh40o0IY+39ullC10FlwhsjSJmk0h+Gw4VMp8+MmDR8+fnz+3SbjYfrJDCOl026Dbty2+BF600koaWbXIUp2/cP7egwe7e/sXL25laUYM8VzPMKOV5IIzIYhNINOdbifP88OTY8qZ4wrf85Q2RVkms2Q0Hp6cno4Ho8HpYDAeq1KFUQBLKK6IMrT6yHGSht3upasvr7/66saFi6wZ7I6HHz98eJzE2vOpEKWEVS/yiazVO6gMq3ZYY/IpoicW26Lz4Bxr7PzC5R/AA2PdcurI0rnCxZpA48oH22hdD13UMoKNrj3yCC760JoHWdYUZjhszjGtqLbRx10UtfAe+oHgMWE3cYTUngeYOEotIIfEH1oLNFDsZFU8gpgGdxghcaly6PdrErC1dbRcKzSchk8MxzNSYrVlB1NS83goSh9PR6O13uJK9RCq2JBJWWqBWK8Ga38xnU4c7mycPVMUZZsYNR6V1ZhElTEStbnWmNh+VxaiJ5aWHgYBJSRPkxfkZWYRf10bYKD4yJZvhOLnHh117CCdE65eHMGmDq2zZB3uOT4k/xPGaqaVHa3tkGs5bcwy7QS1Yc6wPzVsrlBixPpU1y4gHLNojTaeF/UWylKmaYpQAmRAIhZsOKMOQ90R9SgNGPEpcZRsd7t8fW0YhpLo9997FxwBHc5sYAQlpqXV1Xa7QylvNn+0/ehZMgN/AxSba7xstBZd0ReEYGXjKImV4BqjwD3VEjjQjMQ6b1DNhDA2qLn61FmewlYZPR8o1lqNeXXcZiZw2IRbSjXl6IyqEZm3m1vb+wEdv7pxHTRSRwL53DUb9w3MMt60VkUBGUPArGU4MteuIkxwS3eeX26cvymqXhmO8hx+nqHQEKQEoMWC2F+0cUcsBZhhTPCCkqHShXCe3Lt7cP/+5rnNcGlJS7m2svTq1rmm6532+0leUCoI4yi5g8kew0TBlJ9Qn9LlbvPM6pofhMPp7Pn+/uHxUVIUFm52PeBBsfqEAdoAbDBY9b0wSHHGD2rAoJdqxh49f9puNS5vbMg8XVtaajcio0pGqpsujMIg8rMkAaWuWFrf6HTbTx9+qpIU+mjmB4EXuDBiGldUpbQoMox9bS8s/ejnP//hj374z//pP7myuRlPZxhioY0uleSO40eRIaQ/GDx+stPv95VWnNIwiNwoGuf5R3du/+z999Miv7B5bmNl5ejwaHlx8Q9+7/c835UwFEqlmlF758mTn/7kJ2+99c3zZ89maUyMUbk0sOKF5xq2mFJSxqKo2e61Sym3tx9fu3btyZNnaVG4vk+E82hv7/72o0YUfunqK0utDng10DSLV1YWNzfPj0ejXrfXn0xu3b/3+9/7zpULF6Qhmun2Qmd6ejw7OQlc3xP8k7v3jg4OXM/XWoO/ionj5NnR4c/ee+/M+uorFy+uLC15rqu1VNWNopdWVkaz2Sf3Hyx3u2EYFGUutW62227gUhD7GUq46wJiTMtSttvt0WiQJkkjakzi+KQ/iIIw8l2qFXdF1GzMJtMsSx883VWEHh8dKUN7i72j05O9g0PXc3uLi64XSPBtRN8dpXQSx6BF5Zcubr338fXRbLq1eT5PYpBxc4yjQOEOga2QknJxceHo+DjOYsBXmetygutASKdXxoC5dJlnWRzHZam00lRQh3MhvFGSf/royYPtR6XWS2fWFs+fffXKpd98/bWtdlOfnra1WfTDPE5KZozDFUyExMb5AZsL7P2Qu6fARLYmtFZPCqcMFl6IxpL5/GDBM0hKhqbGskmsEMlgQTe4G6vBOCBZIUoM8+L8YMZgPjYfTYD/DIOuhaiRGwV28TaYDqim1Q8oFIOAVT6ncw2xsfIQi4biEQmnHPwuVCa7jLYdVxMVq0IBGxn2bgzp65jOXp061XMBwPzc7oJbBwXYoWmwsLawJmc01STP08+trakkc4UY5GnGOJqbWF0Ro4N+/8zmpma8YYiIZ1lRQAgQUXVIE5ZGzWwxlvbsYUBH5Y7vyzzTssR4XFLPuAR1ctQGDtZldh6IR00thflMk1WbWNEXfBybgkEp91zf1EQ8htiJqTOUbBywsSMweSEtq2nRDF0qEZdGERM3Nk4D24eSkLDdccIoniWmTlXCVxHwbQLtmbqU+oR41HiU+doEhjY2zw7DyO31bt69c3hwEEYR+jBZvZOUF33/ou/5XvgwT3756JEJfMBX4Qw2QOyzoUDAG4C/KcCEhTFhV+caEkK4tYMjRjccHnEhlZLUKtXAXEIbYgSijswahSOSg6i/AmMKazVSBxyx+ipQShVRCu1bLWHZCrk43uYYVwQNKXIJQKlZm1fXxH9pdGlncYZZHsDqMgD2UDQGrf22a9E3wwzPGg8nNVEekySoYVRYdrf161SmrM59wpGYZ0CLKsZSD7k4HI63P/rQLYvz5y8SqXVRri0vXT67seB74+FoHMeOI6qK53iAawGPBYOIodQJSheiaGOx1222mBCDWbx7dHwwOB0ncaFVdd45DuDuiCkwBgc6UIs5GqVyzquvy2GP9/ezNP385cvc6OWFhWYQ4rdhKO102n7kJfFUMB74QbPd6nYX9na2yzhWiggu/NBnjgAprMKVeV7kBLDTRnfhP/3V//rw2rV//id/cmZ1JU8ysIkHYQfnnuczzibT2dOnz48OjspSeV7gBz7lYvfk9J2bH//y2sfjOL549szWmXXPEYeHRxfPb37nt37L4bQsSwaWpY0wuvfgwTvvvPOtb33r/PnNNJ4ZqUpZgvsmQe4rxHtw1/OiZlMrvfP4ya3rN3ee7ExnSZYWmrKT6fjO40dJXryytfXyhU0HDj4FErLLFy+89trrj3ee5VnWbLbev3W704i+/7vfgRW7CqOGzJLh4aHHues52w8+3X2243kOkKfcUsrRaLRzsP/T9947u3HmtYsXjTZnzpwhRpeyRLxn48zZu/fvnx6fnFtfN5qUspCyDMKg0WkSDiYtlDpRWE2qqsQFTRhGxweH1ZVznYPTfpymzSgMXVfKst3uFpAU8WhvN8vSrfWNZ3v7T3afN5qNIAiOj0/7g75wRavdFtXbK0x1ags0pSmL3HWcS1cu//L9D8bT2aWtLVnknFWXCY4x9INgdRQYj6Job+9AEyp19dh7VTvvMsqkVtBbVEeBW7X4Am9YAXbnRZYLRzhBkEqz83z38ZNtV/CF1RV/sbe5df7q5Qu9Unqnp+c7nVlRDPKSuy5sNYk2EnYHVkqjlEGyPWIECtftwLhGSg66yaLuFPWvOI5RNvdJosza2dXTKTA1AT+dTyXGOmqROSkItU+amjpeH05d27dTVvOiLDAKmANFAYtWinCO9k6sHl45F9gAzEPHOUqNjZ7DgsT6dRhH06g6hnVsTFHzmmvVFEIFVFOCIcF1iD2mH7J62Lf+TnYDjmg3Z6PJZLnTWQ0jIVXKaL8oCbMsFwzSiONE0+p2VXkeUiInQ43uzYBPoCclzk3aMoctOmGIllp7fsAMKZKY12AksqjQwsjSXk09n5La3RJHWbRAnBtx1LqkuZKJIDiCDvmO789lZMTWVBvI8Fklsd1Cz/1G6xBiau1XGC6pWW36wWqFsnHcZm9ZKpUWOV5qjPvFa1w9ssSA/ST1KQkIdQl1tOq1Onp9fRpGaSE/fP8913cgGI4TKxrWPa1fbbc6hNIw/B+fPjzKU1GNv7U9CJKqAONlc84RdHNVM2XvBIxLsH5sOP+6jEWuo7XOqzEOku/AphTYuRJyR7iNJUGzVZtfjZpeO9ma+Z2OoZAYwETQ95XVYWEErbI0djO0lm+jHxNjRlXzsqaGE4QnZfWT1S9iNuqRMeuCwrmpefAEqRo2IgOXQJYbz6x5BsZ5IlaBanfc96C1sloNIp3lhdKO62CqKIdRuCRkRslRKW/fuXf86afrnVa3t1AmhefwjfWV8ytLC0KUk9l0NJHgo03xVmKiOt7gyZJKZnmhpQkcvtDsrHS7rSjggk+T9HA4PBgO94aD/nQ6SZO0LLJSltVYKJXRVfsCooWilJLoo8Ho8PTkS1evhowtdnuR72lwOyKMLC70Gu0onsyoIZ12SwjH9d3pYJjGU6OrGuN5HqkGkZKiNTmc45SasNEyjvOv/+N/PDw8+Gd//MedKMzTFDCJ6jARjkOpmM3i3f2Dvf194Nz6YRQkef7p82c//fDDD27fKsvi0tkzl89uNj3faD0YDM+dPfP9732XUZrlmeMJoknohzeu37h56/Z3vv3b66ursziWUhqlSpVTYr1UGBWe5wWBVxTFo4fbt27devhoezgaD6aTrCgUMfv90/2T49XFhS9cvrjYahMJ1i5Kdbu9L3zxtSsvXRn1Bw8/ebjQWzge9G/evfd3v/+3Lp47JwE8UEUZD4ZCm8Bzd588ffjpJ+B7AKtWSuM0ffB052fXPjy3cfbXrl7NkjQMw9WVZVlKuH21H4Rhq/Huu79q+OHZ9bW8KKvLWspGs9XotQkTmAriRw2pZJnljNK8yNrtVpIkk+HIc4JpGo+TWZkVa8srRko/CIXjpPFs97S/u3e0urCw1GkFfvDs4PBo2I9aEdX6aP94Op35UdiImoZTXUhKieM4pVR5lvqe99LlS+9/fP1kOLx04ZyqumatVOG4DlAfQEpLTCmLTrtdlurw6IRzXhQlp9wVXHDqcEcj/7Aar1WhCmq0y4QuCma0qCGoqvn2RFzIR092+sPT5ZUlvxFEnebFL7zabTfHu8/WuBcX6ZEqGAYO2uRP615BLZxlHQAAy9U1D4phybacZOQro7utTSZiBksoBWdzYBxBwre1p8KunVldJCYuYIYg7NpA4GT5PdqqEPHw0EZWw7W2pyCDYERcCDaq1pOUBCPIAJpGlNrYBEEMqQXtEbJNkLAyX3BV78+jpul4hPOZLGVtt6lr3wJNjKKohoSVGcpA6mhDBOLgshCQRXCKeD4MP6VW0yR9bW2NZjlzvBEYt1rtGvKEKRsM++fOnCGeFxAaTqdpWRAGoWGAJEPpNZoazIZDYQpIY6pJzBGO63gyz40s0YpyznzGMAVrQFVTtEyd0o+rQGNdtNhnTbCIZT5r8pnABe66Aa3HIrRMMZ/xtqxRDPqC9o7FFfxOsMKDQZmxgQG1wSNF0awxfqstoijJMmOAgEaMwLxHSoVhAj6HR4nHqU+pR6gP8u3O+bODIGSd7q3bt05ODsMwAoqffddcqiuhv+n6ThA+mI7e2dnhQUjA6NXaW6DuneJeHfi0WGCwBOF6BmIEOQF7SMExXrBQMpNV9QWrSJTEgHSOGWa1V5CABMQoTOOt7dnAhg3YJQJoXIhUa6OqG0cqAzaHWlblCZa3RKEzuY0jgXWyTeImmCBtZ1PkweP3jN8u3v9IoGefWUpgvhfR9XYJtAFA4QbHNrj5wNW9zgk29b8T1MBrZVaC4I31FToZ92exIgaC66s+mHKmKEsMSRz+6OT42o2b6qS/2m5HYVjmuSB0c3V9a2VtLfTdIiOaJlpWxZZSqSTScySEsDDGClUUWVEWpWC802gttDuLrXa70eSU5mU+myXD6XQ0mR4P+iej8WA8GcdxnMRFURhNkjLfOTi4fO7cWrez0G43AtjYiaozW1xc6nRbw8GQKtVbWOBcUEayJFVlCUcEd7lQRNe2MbAcqR5s0Wq1+8nsX/7pn4au84/+8A+FMQU4LRPgZmtqJpPp/v7B0dGRVioMQuF5/en4o7v3fvHBB4+2dxphePXSlQtrG2E1UVU92mQyWVta/v53v0uILvLC8zyjjHDE+x98uPP02Xe/8+12qzmZjLSUgDlUHQpDNx+HO44zi5NPHj6+fuPGw8fb+0fH49mklEXUiEqtD46OOaOvXrq8ubYGx7amnLmeeOnypde+cLXZbiqpnu7sZLM4aLXe+eij5cXu73/3O9UdIAQjtEwTo3QQhscHh/du3UFHEc4dqVVaZLe3t39149aV81tffvkVlWVJkTebzcVuV2sphJMX+dLK2mAwun3j1vlz51rNRjKLHdctiqJQure84noBwoZuEBpOszhxGVNSGq0bUeP48Bgiz800TpMscxlb6HYoZa1mczab7J8Onzzf3VhZ4UZHQbi00M2ybOfp/mAWc9cpkvT46FDmZbPRDDwPYnWqCZIxKovM5eLqqy/fun93Z2//7JkzgltNAWdcGUkMqZ5HiCnstNqnw2GSZpwxqaXLBY6VngvmEwqdeKq/7Wlysd10pMzSxHI+wCLAgayRo9P+9s5Tx3GWVlfyslg9v3nptc8nz3eDLBvFSR997S3QqDH4z67oNKYYUG6jqS14DBGlEBFKkABcXVZdr6C0kmhahwtjwTlmTNe+/PP1KPiQgBjSzN0L4EWAHY3h+mgEbxiohIBEgowkQKo1cUDHEhm9KoJMyQLKK8ykFFfjxHKVUS8FS2g0EmZ1/FotlOWUhFwEnGdSxrL6ywT8BtBjyErrGFVoX8/AqwkJyriKM5q+8CYhICrGRTGHosPHs8liFC03mrwsNaMneWEZ2rCQ5kykWWooWz+3KfOiRVg+HUI6IanOImMPT43GRsTSs3GCJap6K07gUkLKLOPoW4lJRTYGrx5aWc1UJ3MStB2msQLX87Fl4xArQa0HNEK55/kGgRrkvte/qqYL1+JuWjsgIo+caGqFLziZE9h0WOswZtnaxnAnWlwsddWrzsdpDpeHYcA1wbx94hriEeYzJqTstNt6bT2OGpMi/+ja+57vc+bYKD74dnuEXG13uoYWQfA/P70/0JJzB40p6fwS1t7I6DZlmWSA3+OHBPNnbbV0NUuYMFpAvgZaZJh6HaKqGQxua0Nq1wsBe1tmbCHDfXD1XThCYMeKTiio4sVuCfK4IGeUI6zEMCgRLVgVPpG2A2JwGwHtjDNXOEjkACVfdZFBQsOIJVZgrg5cMG5v6Fq5RucFHvXZKHueG2jZTRKzyVbT2YRm+be/8NoXGs0VWbbylIxORZaRrNDVSavTQmaETKbxwbOdg3ufTo9Pup7fjJoYOut4Ilcm4WyUJpmSGFCmqsGVCuESRrIis2In+O7LotRKOoT43OlE4UKrtdhdWOx0lrrdpU6312r3Wq1euxX5Qeh5zBFPdve6rearW+ebnl/dJ0QBpZIvLPUazcZ4NNFadrpd4YBhNdQ3PFgdxwVPPks+ZKKaKrgQjW7v7vb2v/nzP3/t1at/+3d+J5vGhGjXcRzhmepjTk5OToejMUDQQVIUD589ffejDz/46NpJf7iytPryxUtrvQXXVE2n6/rcEaPRaKHT+Tt/8P3qlC9LLhxeXTD67rvvxdP4W299U3CapqkQQsuqKqhSYyQ7o2Q0mtz/9OG169efPNk5HQwn0xmlpNftRM32LE6zPFtbWb104VzoOkRVt4rnijNn17/4pS+un1kvtdTgHrL98IkQziCZ3bh37+/9/vfOrK4ZRl3PkXlZ5HkYhMP+4NbNW2BLzkFTQAbJ9Fc3b3185+4XXn75tUuXy1mitSqV3NjY6HZaEgoeZWx14+xHH3w0G41effllqcpkNnM9TxOaFcXyyorr+VWXprTwIBIxSWgplSqLLA99n2hyenLi+cFkMpNaZUXR7XRc0P6WpRxOJg+fPFlc6DV8Hw3hFjrdxcXFwXi8/ezpNMs0Y9NpfHp8XBR5Iwo9x83zHMSEQspSMPbaa6/tHx4+ePBgdW09DAItjdJKCA5sZE01lYV0RPVyewf7GL9ttHYd4bqCG+pwEQQ+YgmMUVXkPiVvvPJSz/eSUdUqSdB1OJCs4np+IfXO4ydpmq6vrTPB3DC4dPVVM5t6SXo6mQ20po4AsjcALZayg/xYG2APRAtTOzmYeQgRcnHqOHIL3SF/y1h72nrTiVGvYBuJywuDzr44Llk+rh3NbCo1uNOjOY9N9KnXx2ABTYTRXUPOU2fDcTNKJlVnwOgLO2OsjoYb3ahmCG1g00e1sa6IHKecajrglLrGBIyVxmTGlNDvUnQMtW6YQBEnVFbzDhLILM8LwwYtYUvT6mk1yvox1wkFUpNxEr+yse7luRDuMMsKQN2sFT4wgwfDwcbGhuN6DmFBPMuLXDOuq2YEzUGZxqwk5FpVr8+xscCbx/e8Mk2JkjZlUWPOAS56DamTKeyltYmEzAbx2o9h8yvoZ4pxXXyrf3DHC+a3AdKa65gNaqXk9XaZGot6UFqDuIQIUgOoCGrM8/IA73VbXbfRzNJUg4YbcniqT8pr40lBjMOIC7bPPiUe0Q4lvXNn+2GTdtq37tzqn55EYYSkIwJrRUfKl4LgrBcEQXh31H97d1f4LuztQcwDVHWc3dHwxVp2zJsQg3SB2qOcw+jJGASzM6DyE62VAAkQxNsJIOqrmmdoqrlWaavLxUUIF9jeAE7+QnuNKiZVsycQ9eZC2Lguzu2iAGo7Wk8QOt+2V1ez1FX7jIQrQqjCECTQ/QEzFZ1AqTayKEpwx2aopWEQtsgoe2G6YjepgKKjz7VdNsF/SfALZYw5zmmene4ffHV56dtb57//5S//1hdfu7K4sNlorLnuCmObrnslit44c+7LmxeurJ9tCXcwHD3Y2bn9ZOfa9vbt53vbw/7RbMo4b/gBLwufmFarKZyqt87LUoLQsCqLuqoYAGsxjXsn4CSashRUu5QKU/XjwhimFdOGu+7zk+r8/fJLL3WCYKHXk1ritW53O51uO05mRut2p+O6DnYVySwm84YSGGhaSfTqk0o1W20ehD/8yU9++e573/vd775x9XOz8QTUYtUFH0+nJ4P+dJZkZTlNsse7ux9+/PF7165tP39GDLtw7txLm1uLzRaFoGLhOF7gc87iNGWc/sHvfbfVCIu84FwIx02S+MP3P2wG4Ze/9EUlizSJjVJJkmVxWpYlpzwvy8FgdPfeveu37jzf3x9OJ3lRcME7zVav3eUAjUZRuLa83Ou0iAK+NqWrG2tf/OIXti5ucccpZWmIdrk3Oh2eHp1E3c47H354fvPsd976ptHK8byyKIokDxvhdDy9deuWlpYNJI0Z5tnPP/r4ye7+115//eWzZ5Oq6lNtVFmWZ85ueK6LOVGNTscw9vYvfr62snL+3LnhaKC0cl03jKLRZNrsNlsw0VbDtuNy11FpWiRxVeWkUbKMGs1+v68gKS8rcq010arbaniuayiL0/jew0+bzWYnCFCSJ8vSYXSx0253O3GaPtndH4zHszg5ODnpD4dcuH4QOmB0g/e3VvrKlctMuB99/DFlpNVqaqm00Y7AlHjNCCnywve9oiwH47Hr+mBroV0hILi+ep5cUDmWRUEEHydJoOU3v/LlpU4nnoyns5nruDZe11RPuucFB4cnT588WVpcaHc6pZLnXrrizhIzmBzGcQw12Jq4WVIVwXxoNNPHxSuz7XHNyYGJlAEPE5p7U1siG0gWgMJS5w9yRufFVRnFqf3BF1rH2gCRcmhDMAddVz2rDYWDZ4HoFyG0jlSvtFqvhy2X6LHWo1IqRmvXp7nFRFVZzrR7RZGnxsrE5obz6CnAaXWS+kL4jBaUFAgJYs2pSdoGnSrgXOcCwxmRZsUx7Q3RZoTrMY/VWMwV1m2cjeJ0KfQ3mi1SlpTS0yI33Fo8gUUUy9KEEL1x9lwhZc+QfDKGlNzqTw1GwhuiaptJ8Ke06cggBmG+HxqlZJ5RDK6gtfuVNUC0H2HO0bLW3tbd8wV13cb8wliqKTUvMEvDHddncyjD2OtgYe25Awsqfg2p2bm2QHOsvMbGajAzX/5Xn4tyJ1pYUoSmWYq3A3hsVe+IUyagM3SocSjxKPMo8RlzZdnstcnGxiyIUik/vvaB7/mCOYzbrD1mSI+QL7ZabcKSMPrhg7sjo6saiQnQNb/Mytysoab1gUUvaBxGGbGEvTocqQbrwa2R0blYdy55Y+jbSOv+ojpoOGYLw6+hxszVdWCPhzeLrroqJQgiyWrupYIyAAjzqrshKLGQTYSjqzVLI3XINoRVYzJndXvwqitErhcFcQ6M5HW7oefxkMBAA14hrdVH+FlY3cVVXxHF1hs2ka7rTI25e3Agk4QX+ZnlpTe/+tWvvfa5b1688Jub5777yktvbm5+/dzmlcVey/EkYXtx/HQ8PcmL2OhSVKWoHUYeoxGhnz93ZnN99XQyG2dpIRWothypJaUkdHxiSDW1VUXZcr+xXeDQC2hrxVMNrsJ1B1l8cHT0pVde2Vj8/6h68x/L0vO+713Pdvdabq1dVb1P9/RM9+zkDFeZoq3QtgzFseHEsWHBCGLETvK3BPkpCBAkjmFAji1ZlKihJFKkRHEbDmfrvbqra99u1d3P+m7Bed73VMsUIA4bNdX3nuV9tu/z+c40azWwGizvRavV6sy1J5Op0abVaXNOjEIe4+f9s+l0UgsiyBwd4A52GyijvN7s7J32fu8P/0AU8nf+q7/bbbWyZIop00bnQvb6/ePz872j44ebmx99fv+jL754srUttVjudq9d2lhbWIg8H0kllSKMhVHkex7CKBVZnEz/zt/+1trKapLElDDK+Mnx8eOHj7rz85cvr8VxXGS5MaBmh9Z8fzDc3H5x/+GDh4+e7B8dp6LQCDXqjZlmZ6ZVj4KyFA+joFWL2o0awUTkhZCqO9+9c/f1qzeuh7WwUAK7HQTECd/f35eFOB4Nn+9s//N//I+bUQ0zIqXM0yyMongy/ezTT7M0Jais+TSlu+e9D3/6s2mav//GvdXZmSxOPN9vtRvD0TgIwktrq3bpUGm9sn7l/hcPtp8/f+Pu3Va7NRqNhZRRFDaazfPROaVsaWUVsk1dFv0el3kRT8YI1E3Q+MHc4z0ogpM4RQhnWdpsNBqNOuNemuUPnj33w2h1blYW0pL+tUFaSp+TuUa73WgWUg2m8XAyPTg6efB48/DkBBMU1WpBEIW1GsJljbu4OL+40H367Pne3kFnpk0YI9p4UIxaUr1SotVunZ6dyUKWb5DSvu/xC7MWiMfW/Z4yOjzrI6Nu3bm9vrxcJ2xwdp6JAgOqUYtCZhlCJk6SR188kHGyND/HfW9xfcPPsyBJj8aTCUakzLY1sVZmLlBhgiigcgiYtUB9a+dj1CFObTPZdeas+N8pJ6HDWOadbmfYwq1sUxe5TSFykXK+BBdXSHzXG7PDZjuqIlUr02CjDDNqyfNWWNgX6cioHOMcWkgWdVCdEOUHywtIo3AlpK5qcgz+iMDQRz7BPuWpVpnSyNa+ztLc2iFoZb2cEHEu8oDHshSwSn2knackcdHMKYGNMzyeTuObqythXni+3yuK2NgfNdVGBRkM+iurq9wLOSY8mcosVpS4bWCov60Iq+JdgEjMVKhtXibQKknL8xwWfhSYyCFiKotfu0NlqSR2idfpq8kF9B//DTtfK1p+qbHC1PNCO851I11jPXNNFecrYrNzInRMZVT5P1QNertXRa3wEKoZxOrNoNnM8rQo03xri+TMkcBz0HgYc3AeDAkODPII4hq1Vy/1ak3aaT548OD0+CSKIitbt54bXOQ3a7XLXlALgk+HZ399sMeDwO0+gV+KdoAM+KCUUeohrGCB06YuFBgxlLgxqlUKg9uudf/UbnHL+stD5oVAwEKJwUILIJiDdIwYqaXFpCF3zYzlR0Jaoq0an5Q1NlJS5TJjlHKole04VwPNFRTMyFKbpVLSSMBjaahxKaWMIAajLLsTbO81opRii483jpUFnBdth0Mua4JHCSp5t+bstoph7cjZKjnWo0s3CVDBMFjP5JQeJGXEGO7vHT97xgyZne8ysPvDBiusMecs8JrtxtLszPpcpxtFHS8MfS8tiiyOvSL/1ntvr12+/Feff34wmhQGS9jWl0p6nC3Pd1eXFmZn2rWgFlBuvxl2whWblCtYh7DYKC6xeb6/uzg7++6t2wHDHudWwRgGwUxnJkkTpVSnM1teFRiAJGnaPz/vNGcppxaqoA0kiIRyPyyM/smvfvnzj3919+btr3/5fYyMlIp6/jhLd46OPn346Bdf3P/40eNn2zujyZQztjQ7e211ZWNppVNrcDs1UIZ5zPMD7nswHywTnXESv/PuW2+8/noWJ4x5Usr9/b3To+P19fW5hbkszTEiuSzirNg/7T3devH5o6f3n2xu7myNJ7EfBPV6rd1odmc7nUYZegOfM0I5sGe4x6UQshDU966/cv31e/ea7bZWAilZYWnLF0QWxcHhIeL8B3/1k69//avv3runpNBg1VxG32l6/9P7RZ56hCJCU6Mf7+3+8JcfhUH0wb17s7VQFDkyaOPKRiHEYDBqdWZWlpcMMoVQZZyLwj/98PtzM3P37r4mhJjGU22Q7wetVms6maZptrq2TqpFFOwxrWQyGmFjhCjK0kLJZqt5PhiKXBhtMlEorYMw6rRbUb2WK3n/6RODzCtXNuJ4Ck1oZXuqGEwoPc4iP2zW66uLC7OdmUwU2wcHnz16cv/xs8OT07zICEVhvUYJadUb165dGU/Gj548E1lhytBbFqxZUcATTjjzPM5Oe2e28NTK+EA1s81bW8YxysuMmbLz46MWY92lxfmZzmKj1j8+GccxRmamHl5ZX51ptpa6840oOjk6Pnj2NOS01mpcunyZD4ZmGu8NRrFXvn4gQLHjKutzpgzA+Jy1nD0QYJwEcmJHuLJ286iyha32XKzloi18bCFAyhgPtArI2V0bllg0h6VLa1cVQbOaAhRasbIIeumwgDACFSsBIwo60jJWRlCiMC4QaJMgQXFzTWpkWU8goGQYawQJyx+qTOepbUqYAFxlMy0Lg8A61I3X7DybUK4sUstujlmjKFQtcNqaxsJAiI242HFaobIpTwpGB3HWDvjlTksVCjHvPEsEJa4U0oYSmqQpMnh1dS0T+QxC+XCoKvoX/O3Glte29DUWkQ+9XK0VwigMQq2UyhMCL75twRPLCkfW3gob1yw2FYjDqm8dDcnNAyz/zOmt7Ti0TD0YMCqwm1Ual2UYa+VgnDTcbQXDTbVgait4djgRqwFGVW/Ffj1GvWZTal0UBbhHVrCPatwKYZhwwHzzMh8nTMig3hD1dsF9maQvtrfDMELOxwhbQ6E2YZfDiBkyYPijF88x2HnaKSqsvlj2BcKUKqWIqTwqYXYvpe1Q29FCeSsllJMMYwniP2CnleE0ICQilBOdGzyS2lB7bQynFBxnGSpfIaq0NtUcFRbwMQNburIwoqAY1EjZZQKCfOITS0RzNkxAl6QUgPIwYjCGUSqlFkawMndgFsFo9dFWSKJgVRBRtzxgeaqUYKkUtasXNp4SqkDyhm11W5a31sgBKRAAWsKL22Orlg6N02FCjwYhxPiEkZ8ORnuBfy1Xm2c/eeXR41s3ri2vrtS7LcRZFsd5Mq0FNVOoRjxdbjeRH/34yeOnOy8udxe+/e1vMj/8dx9+/yBLSOAjoeDs451Gba7d8XgZnzgmC+32YrulsBlOs17/fDgaASWvvHQM7CvKGMzpYb+PhLl3/SZHmBEmRVl6Ms5b7VaSxUSj7ty89XdBSEuRn56eUEIDnwMcGIO9CWRjhDx98eLhkycznc5/99v/gHN/MBolIts/6O0cHG4fHkzHY89nrWb9jVu3a2GYJAnR2sAABRtJaaBAxeYHfgFUrADWYzRS03h6aXnpvffeLeNKPRJ50e/3jdIbV64UQmzt7Q+Go4Pjk8Pjo/F4LAuJEanVI8/nG7Pr9Sj0GLfNoYDDsQiKNS8MlhaXKGP9fr8gdHF57vL1q61OWxVC5Jk1jgGKEiD4fDaanIdB9OuHDzud9le//KU0yxBGeZ5FtWg8jh9+9lDmOcWUcj7Kkh9/9umL7Z1bV65dX7+MpUjTFCNz4/qNVrt9cHDAKG+1WpQxXZQn5MLSyq8//XU8Gn3prbd935uOx9AI19z3DcZRo3580ovTpNFsYq3KZ09KRmEpX5dpKrBoqZTq0srqo4ePGvUoybKsMP3hcJrGLdT2fZ97XpxmhNH1jfXN51uwSquwW3AkUglKjY9wNo2XFrpvvf5qWuTHxyeHJ8eHR4ebW5t+GNTr9eWF+c7MzHxnZn19o9FonR4e9kcDrHWr2YDBRFlWiiLvzsz2Zs9OBwPOWJEXGeftWg38/qjACiHtMUoRLwyitP2LT+/Xo1p3sdvqzPzGe+/+9S8//nTn0Kx7s5SvLS+tLK3UGg2E6fj04ORof9Q7b7U7b/zG19NpMsiyPx0PsnoNG7fFg16uOWBlDyxo0ZURCAwkXEdau3VbancWABykpECEEUQZASGLdkQqbVyqjRHRsH7MbHgDwS0gpTCAQkBkCYMf6phcdu3Crpsaq6fSBve0UtmkzXyFqdYCXAwAMWRsIQNW4ogSRrSS2q55gZk/BQqCJf8zTDxKAsZCzqdaliUEsV42btMJQa6mkfvNZXkAArTyrLbRDWQ1Cinb0AZeAphJWB0UgY+hEfa8T/f2b80vhJiscLJLea6VwZWMxqgwCLZ3d65du1H3/aTe8BstORkoyolRzJiyPgOfXOjZQpUPHUpreC8LUXiSRaGecgMwVIqQHWJZW39Tqdh1FVQharrxplOFW6IkvghllRkwJBqMVMUu2D0YMApxxH/HKgFlIGjPHN9BV2ssVnlnRwRlDYPLjKJ8VrRhtRrzvSwprL7PCa2tpgkwo8xCmd0+UvkLuTK1he6Zx3mtsfnw8zxLW60mMc75gSDDhVyrR21UHn8fnZ/vxBOv3rBOggCPccEdHlqnTbYpG8A3bXtTYWQpklohMIfECEDNxCamBlBahZIcaUaIz3iATSyVu5pWwqMkBcmD84c0GhOmYSwnlIKhlM15rVq5DLoUg/rgYlCPHcJZO4dObW8iwpRzH5SMWoGJme3swB7tS9izqnbwKWYGJMawJQWL7bpi2Ti7J6yA4UrKm6IdAdp6ZYMM2I2UykwCfEGcnyi2NDhEsYjqz4viaDTaYXwryz496611WjdXVlcXltq1KMSMIRSLnPtcFPlPfvbXj/b23nj11W99+zeRz//fP/juQTxl9bqUKuA8jKJ6ve7BCBokY/CpwE+3PxrtHZ+mRUEq0aPPPYCogaeNEqfnZ3euX1/udJQQBvJ6zvjs7KxlBnU6bWOTf6j1z/sDURS+70ulMfTsYbTNpmn29NmzJC9ef+NNj/GPv3h0cHx8cnYKcGARRdHy0sqVd95pN+vTyXjQ6yeDPtgAUM/z4B4gRRQBVEGWxZ3OLOdcFIJgGsex57Ovfv0rCKPT8/Ozk96L58/jyVRIMRwO4zi2U1sv8Be687deuZknaRJn8PULBrgRTnDgB3a8l4POaPXK+uLKsi7k8clRq9WenZ+fX5jzmJflOcOWTG4FfBYFrBlWaZb2R6NnW5u/+y/+RT0KizwTqqg1GsPB4OGDx0oqQjGi3t6o/6Nf/qI/Gr/12t1Ls3MinZZvuFKvv37n9q3bX9y/L5VCBHU6LWOMlLLRahRSfPzxr69eubxxZR14cFIrlecZ40wZHdXr+f7hZDJptlpSSQ7DEWwd7MHCIYuTMKrhvFicnzuZafcGwygItNJJPD0bDuYXFyjD9Xp9kmaTyfTVV29Rzh/cf8Q5h/dJKktj1Zp7lDPdOzmVRfrq7dtLt2/dffUVrXGS50meDwaDLE+KNN0Zvdg3qFarRbWgEdaUMtv7h4vduVb5KEo7d7l2ZSN5ZBe7TJrlNd9nlJQfvvxGGFYnqCnLE9xotj/59WcffPBe0GoFjcbX3nt3Z/s/fv9HP/79n/6kVmu0wtry/OK1leWri0tXVxcalLPpBDVa7//d7yjOsy8+/YvJmNSawDl3ccHVssgqiK0WWr/EKFlwHy0vMuglygtZFghWnQBNX3zhtIKceYuxWEUg0Vimt3U8tMoS4ooqRGEXWSrFKt9xu9ZBsWXLlwlvhvG5UciUBQysFBob57VR5acyCnYjwdXN0jQNMc4ht/wToH4YBfpihqlSRmgN8zInL7V/rwGBC3bycphLUgp6SfBPhG+prcpM2/1mcCjRysC3AHMLhRHhlBxl6Rcnp1+fm9dJtlYLB6Nhzj07dMcGlYndeLz57Onbd98cJcXC3LyajHJTVn2gxkLWEEiVyTu2MAECoQAjWqYieVqvRTSsicnILnY6l4qXW76OcK0r3RuEZAw/Z0kSWFcWwtXEwLmpEY3YhVcViLaQG506xJZdI4cWgNWjVyhM4ix2XY1JK50WgdhjMInqTaRNXmTWzYLC+U6g3880yK/KT4iZwQxiOxHSb9R0u5V5HBXZ860t4OSVtewF16lN0HoYMoMTTj7Z29deeJHEwYieSq2oTRTcvYa0ADhPZVZOqMG60juU95IiVtHjtCokY1SX4VUTjMZCxQb7jBfQlMZgrWOXH2zi5tyglLIlJMPO4tAGSJemWYYYAjoP8FOMMlY8peFoY5whS8Eo/0UuQbtPbBsVYXAHohccbsuopPB6alN5/MJ45ELIZ3NQWN7TtAxUSGFJMC0rcnh2rWcqfAtFnDeL+28tpRWAg7OEsobQxijqeRJ7m0LuJPFCkc/2+x/vHs5x3mCsGQRyPLy+svDqq6/+/KNfnU3j3/zWN2/fvavC6D9894/3xhOvVpNS+ZyHfhAEISPOK1o5JAFKhTzY3z8fT2BDQBODmSrDERB0y/OJeWzv8Mhn5ObGRp6kYDBlolqtLASVpoy2Wu0yTigFQ3lyeHhYZBnBNArrTjlBUJqmj55v7Z2cWC3Esx/9xSRNtaGNerQwP3/v9dfbjUarVp7OZ73z7afPx/EULPcp5QwbJCV4coDLRxl1CLl54+bsQnfn+Yu8EHleCCHeefut2fmZ/ln/8OAgjbPO7Ey7jNA0CoKyDvB93/OCMDg76+3tHR7nQ6QFQTzwA48xz+dG6zzPue915mZWV1e7C/NBGJwcHw8HQ4JJd2Gx2WkYo8pnhlJwk0H65cJJ+c2LPM8K8dFnn3zw/vsb6+vxdEIQqtWbvaOT5083kdGezyXGnz998tNPPmk1ml+791bosWQy9nxPa3XvtTuvvXan1zsbDUZFITyfR7UQvFnZXHf+L37wQ5WLm6/cDH0/z3IhBICjCs8PKAVjCkrPz85WVlYwDFyw0oxRxmkaC0zQdBpjyiI/EEW+srLcH47qjXomMinw2WCYFoXHue9zhFSSpqe9s/WNDaXUw4dPKnJQmR8yTLXSjGJWCyfT9ONPPr15/cZMpy2KouZ73U7z8kIXszLVBWQ3FlleBguldg8P909Oh3G8ODfbnZn1CBNF5nP/yqW1x8+2cBlxzTROG/XIiS2ccZ/xPK5yMS6yy8vLm48evfb2W7oWRVHw3/zO3xv8wR99NB6eItKT6uHW5o8eP2xptFgLV2fbd69duXvj2vLK2m988L6ejnqffvpFHON6XQgAzhskTZmAgllheWphYiQcCwoG1U6oAiFZIY2tDBkTaO4aQFMZy4fD2pXQgIeDf1QWrAgsFwTucgqVRSeF36gtR7p87xTgpaoNEeevb8XMCjrGwzI1BN2isa7LBv5XeXYp5EhcQMTEFnYNfEpYraz0LCCnKAhhBsF+JiJwMFIHfzb6QrFje9uQcCC3akztkp0k5YFOYbfK2J6t5c5bGTXIjJH2/M8P9u/OzfoEr/jePmOHjkcF8UbpKAh2dndu3rgZ+lzVGl5UZ3HsszIYCGQ4sqb9YBOHrP0C7CiDEkXkhfIDUq/pLKFSIgd5wbYicppjcoE3BAc+bS6isiMUI2NetmOr+QH0opl2813ohbtNJ+ejcWHEeDHId1YL1irX9hGqHVgCYZiA8yLxQxbU8jwzSrl5q0ZVLL8ofDFFBMhGiBnkG827syNKg3rj4dPHSRq3Gg03pYSaliq5EkWziHpR7aPBYH8y4rXogltte/MMXJBA2GbsFMTRXiDCoTL7w4YSsIKgBHPb2jYKSSlgQcnu4liQBZEaSS2tVArqXW33kCvraW13yTHMvHT5f9a+xVIey9BZPo52juUGxGC1gwmD9polZhJGUPlwYkU0Lu85UU7gRgymoswSqLPN0oZzOwXWBJW/RNkxGcVA7QcZHOga3NKBcShdJ7q2WBlnBFKxa8E9xibS8FxZuRar0Kt2BlO+YJQR5AenEvUw2jLST2VdC/8wfmd+finJvvsnH84uLf7OP/lHM5evGO59+L0PHxweefWmMqhdb3ieB5OosrLiLJBKwJyNnI+GuwfHSS4s9MqjDNpNGJrG5eHDOetPp8e982++/WYEfimMUM9nzXazzJelqIeBUgJUVlwbtfn0SRwnrWZDCMkpIxQPhoOz3uDs/Hyapn4QRfWa7/PLa+vNRvlPDKNaVFNIPX2+83TvaBInQgjqsTAKrQkgJx5sh0lljJBZKszSwsKrt2+trK0+fPxYQFKWFMnalfVbt29NxnEYhXfu3Cq/GzFIljlUnmbxJCmPAakefPFwa3fHGOMHQbvVpoSIoihkgZFutJpXrl9ZXF5udjqMkWSa7G5vZ0lCCfcbYaPd8D2utTQwmnLEBmYnTwpkgMxQ9ctff1xr1L/5jW9MRkNCGeV8f3d/98WO0dgPosF48mNQcV9ZvbTR7WKtRZEbhIQU7739xs3r15XIB+f9MrgKsdjpBr4vpZqfnz85Ptl8svnqzesrS0taaSFVXqg0F5R7HgynCaVB4PfPzkGqiwAlpLShmJWJL+iK5WQ0bl9q5XnRbrW687Onp4PQDydKx5N0PBp3ZmY4IkboIheT8aQosrX1tUKqx4+eYIIZ4aqsfRT0M8r3IQg8KdXjp48vrawsLy9rrYejIVgCOylweX4qo4Qqimx+pnPS7+8eHheySJN0Y/kS8/w8LzrN5try0tb+XuD7uZSRVJyDAksJbv3YlfECb5qlZyK/MTOz/XTz5pffTbWcu3X9H/Y/OPn9P5xqNfWQX6uhmhorPVTmfu/sR/uHV37+i/fXVn/rK1/98jvvCm3+twdf7BYZ8gJgdesy3MCGgixDoi7rROh02a6d9dEnF+wGWyLYcgpT2HQsr65dKELueFMO2KHKA5ozLqWA06ystGCyDfYtzj0JOYSPcZsv+uWipjUSLkvd1BgKQlIFu+ZQe0PRQghR0IY1NkOAJnZZYkDz0LbV3LS0PJoAaW4FwJgQWhbU5UVQlrNnXJvSRZHqY2CtpUaGETfFQ8g60cGGi6UNgVcjmIMQTmkvmX5+dvbVhUU8jVfrjdPRRFomBDQaPY8lw8nz58/v3Xl9kKXtudlgOtGGFCBCKvMhjCVyRClitLowWQDxeCFELawVvq9FYWXb1ZTaAEcENkW1o2iZl8631XDdukBbJyro9Wp39Q3AnlA1SXCRzqmzXm6b2TXh8pIBSoU4qbO9dOhClgaHvCFGIRLVG5qgXOTVKpO58DWmZQpkGOyylrUvQgwbqnQtClW7Hfucqvz55qbnMWxVd/BVKVJtbNbrda50zvHP93Yk5z7Eh7JqtMohO0sHKyF4WqAtoK0rl7BtdctlpJQpKe3YUyq4aAbZYtQGJqkEoGyoZb457iMtb4iySu+LnS47YpdlnqFcP14zVlZwUmlICFQhJIZKtjwHCS+PciXAuQCaydAo1mVAJRrL8oWBdxBomJgDKtISJeF9QhdIDaGUw+poxDGTRhrbVLA5IrjOEY0prP07BICT+dsuESSwjsxdFv5Q4mG3Zw96NJi7gDGUxX7DVhcQDpgqClSo31jfmEXo0c7ul7709jd++++joIE876/++q9/+fRZ0GwGYcS5RxnhmOvyTklGqBaSMq/Q+vD45HQwgHyEKA1OwNUmOoYWA2E0R/rx9tblpcVrK6vJZFKPwkatFjXrZZ4nRKtRNwhJqQKPF3m+vbt9ftbvzi8UWQE+X/ykd14U+cLiwqXVFS/wPNDfwCgdXAVFrpAeDIbPtrd7gxFsdiDP91R50sBcnpY/K5UUWqXptNWo3Xv91as3rjLGJ+NxGauknEzGQRi8+fZbCBOlUkKY1lgYgWEJMJ9MsjQ1Upe/SKjQ9xcWFstSNUtlnhtMGq3G4mK3Oz/f6rSjeqSULPIiHqVnZ/0sTQgmvu83W03OyiQdU45hto8JgdUamPLBA8MZu//k0fbRwT/7J/9tlmSMcILJ3s7e4d5+4HuI0ofPn/3008+kNu++9lorCMvqEBuKcRD6X3rn7Y1Lq4XIRC4H54M8L7RU850ZrDQlSGPzvT/5k7nO3K2bN4PAF1pnRVnyJ3HamutgRogqT916FELnPydKX6BsGWOw9sY1Rr3zfmdujpTPHu4uLvb7w1pUS/NCFuL8bNBstjn3MMJSm8l4IvKUULK8uGCUfvT4CWb0pcFA+TPCYz6lRGm9d3CQpPH1q9cpplIIj3NgKGop8vK/NNYKaVlcWVvfPjw+PR9iTdP06RJccaP06sJCXuQnwwEiLBOizOoEEGmMYQ77arwwOB1PfUbvriztPni4cvuVVMobX3n3t/cOyOcPPpNFKm0wKE807lEZ8E2pNp9u/emL7d95/bVvv3r7n2n1v3/xRY9xgERAbk3s+UCQtR8AWZHbxLfFJfjll1WylDbbx5hqa7sOQECtZeX25uTVDGEJJ4BRhlTOsrbosnoiu6pheQPWywEiSBlfbUvbcumto4xGbkZLCC2TH8DTlpGzLAKRR6gwimJWHowGQbOtDNZQipjKK8/qekGqorTzGAAdt3VhwgzUqsbaITuPJRgBl0cTM44eaBsDVpal5cudFQNBmpSnuim498nh0VsLCwyhpTCcnUxPAO1JoY2tDamFwe6LFzeu3hB+UG+0a1GYZQkjjIEGyI5BKeQryq43u3WpMtrmeRYFtSBsTOOYAr4YI8cEJdBTtREVG7fPdUELg7pLI6swNRYTXHWNHY1aUx9IWNWuL7lY8EV/Y4+p8mVw5kK00ulZJx3sshZnXWGYF810lJZ5kRHH6LZ+eGUJSmHJhGPkYeSDHDpE2De6uTg/abRUs7W7t7v94kWtHlDCKn07xlLdDMMrfsDD6NN+72d7OywILELKCQEJUdZnycrVgfYF8MXyWtAyz3BKKXtNkNP8Or4VZdQGbCcINg4Fjsv3RBKQAGDrfKCNlAL2kYCTJRSY+sCGH4CsHE/bKv2MzmChk2EqtbSmKcRoKDFdupAXOQPaox3els8MvIEghrLgTAh8BCvtZifILQ5a/naldwY8vTYAONWGMero5lZkaFef7P+CHWjrQkjhBmkYUlDbrChvrwa+JgX9RfmS0wq9SayPpBBzUnxnfYOn2dHhwXf+0T/80m//PUE5DcJPPv/8Bz//RW1mJqrVy5zGOQ0r6PFgAfjlTKiD05P+ZCpB7GoN8IFr5FTQFC419fmLg32p1TfeegsXgjHWaTTC0GfMIxj7oQ8IX0MYm07iF8+ej8fjRrNRi2rTJJmbnUUIn52fLSx2W40mo9yo8lhW0ghRSJEhhJjvnw4Gnz96PJiMGax4WoEeMib0fQPGG5kQeV5QTl65fu3Lb715aWlBiIJQcnbW7/eHaZJkefr63dfWNi7lWWbNW8oaCp6JNImzNMZlANC5KOI4PTsfjEcjIWWzXltbWbr5yo3rN68tLyx6PsMYZ2mSZVmaJL3jU1kUhDE/CGfnu5TDgJ+yQuYIwWQBOBLWMw7U/jzO0v/0//3Hr7z/lY1La0aVp9T2ixeD/qBeq/fj+Ie/+NknD+6vdBdev3GDlbmLZNBsaNZrX/vKB+srK1laHkaj/vDkuBfnGaP08sYaY6TZbP3FX/7leDB66+7dxaUlq/uYjMbTON4+PFhaXOzOzhpV5hZpmp2f91dWVgMY7vIgQoTmcVzEsUe9wXh41j/3fD7TmVFSeoE/TeLyeVaAuGCkXm+c9Hrnw8H83JwSstGstZvNUX9Ur0W1er13fobt1p+lIhqrneR2bS9J0uFwGEVRwDwkoSelpLX9x4aVSbOUGGM/CJ5sbYPtikmSFBx/uTaq3enESSJypYwKGCegJrLmpNbAoExqORuOx2EYLi8sjM97ze48ImhpoRsfHMokPUgS+8JgYN7BEenjKEyM+Wxn+/Hh4SvLy7k2u/0+8gNnuUeIkCAWAdtTC35HbtBkWTFuL8UJdOzukNt9gRMeOd9cwNTTSpyDQPCvKySS2/bX1S6iw/+RynvVjpx1Nby0vW5o4CGKFcTminwMgj8LuYRQCabrCrh+kEjYUxf+Xguf9QmtlY+ZiaUobCFl3f20rWTgo2pLDGTWZ9FFvDJSUKA4OGUxoaQSwZSlPKUOgYGcO195gk+TaTsMllttCvLI4yLXdtEL26KFTbOJFwRz3UWUFXUl88lIl8U8BswtMo4K4kp75PRPEBW1oowx7ss8RUpUCYozWb5QS9lNXBCjWwcq7PyGbfag3XKwbYiCEBaM3gMIwK5atmIut0frVpdIZbLjLJgqSKkVXlnzSle8w7DcbzV5vZbEGeRodgMNMVCvMYSZMR423CDfYA9jTlCgdd3z6KXVEQ+QF/3qVx8ZpALmVfyJ8vGpG3O33ZlDKA6DP3zyeCQU574dFdjVKNtfwdU30+ZlYW6TBgmyI+fIqBR2EQuAFbD0XumHLXqq8vlyNfGFXxhwNZR2Sgp3f8BXBPoVnHPoZxAwujeyTKcINLUUdr5I5QNUPUsOxQ4m1gZqGpv/KusPBj9n2d/YrhLae1b+qDYvt/zs2+pm9zA4QRa5QSpEqaHVfjpIP15K9EzlFF3dUEMBu0mssq8skqjRmMJIBnivhOZiScrvXL4aH+yMk8nv/s//5vp77xQIebX6oy/u//EP/yJsd8KwDvhP6EdeEMXghRpOk8Oz83GSKqMzkSlYFYCgRbBWPuewRa0o56fj0d7x0dffensmrGGku+1O4Pu+bxc1WZ5nQgnuBb1eb297RwidC1Gv141SQshmu3V0etxsNFutFhAwTSXQs56TZYzc2d//5PPPJbz2FuBHkOGUcc8TUsRpmhY5wujy2uoH775z89pVD6M8zynYUe/u7ifxdDQczszPvvXu26qQdsHP4x6MxFSR5lmWIKllocbj6cnx6clpT0gxN9u5dvXK7ds3FxYXw3polC5EQQgWZV2cCqHOz85llgNbl87Mz3phoIzmlJUFMUWU+44TDJWTfTCZF3z3j783N9d9/913tSxr6N2dfVEUmLHPnj75/o9+lKXZm3deW2x3RJoCfJLJPLuydumb3/hGp9nIsgRWZPDRwcH5eJJkyfLywtJCN4rqXzx+8uc/+tG7b755ZX2j2W6Djo+d9XrD4ejg5PjGteudVjPPMjjr9fHp6Xx3odNugm2Ur7E2UqTjKcZ4NBpO4lhJNTc3gzFhQVkLjkYjgk1elIdz4Hmj6XQ0GrfrdYSQz/hsuy2l6A/6K8uL7Wbr/PwMNtypAi6j0khK6Xm+Mgr2J9RkPGnW69gYUJhblSi1vQ5T/qFo1+tJkT/f249qNZEX42lcSME9jxI82+4k8VRr7VHWrtdkkTl/emtagsuI7nF+fHK6sL421+5Mzs6CRp3VGyuzs2ePnkR+uB9PDAPdk7Unsnt/jKN6YyeebO4frHQXRlk+hHatHRKp6qSn1M7z8IVBGYgvbXAyrumKK8QytksVF/uf7hywtwBskG0Wae1q7Vaq9XN46cpDqvY1udgVtiJWA5EP3nRl1xuJm17ZD2tZQcR2Pi+4fvaEwfbEsIOw8jIwjXxwgUuNFq7gMC9REReTVIzdr3NDU+vR6jItt39V7bq6MZqtV5Dj78M3xsLocZq9urQSFAUN/JMkyWyD3g4o4RdOxpON9Q2kdEQIH4+lkooQZZCCGWlZvTjmmBuvl8HXfjSMue9RYyyUw1S8q2q3BwbvbuNIv2xBO0Ixcc50tofsUBA2ihsKBFf7x5i89OF3a7IW+1y5F1qba0xdCgYMNOiKWCJHefgzFs3MKIzSJK1shMEbuiy2EAc9kofBWx5jjoxPiKfN7NzssDOjG82j4+Nnzzbt7q/d1i2PSimv+f6VWhR6/v3h8K/29njog32Wsa+HnRxAzxBXzXNQFyvrwIWVVoBqM87Yr0LnYGe8XV5QTpl1eyXUAWjgxcD2yyHlMKcaVvVtU9caBsOinaUr0gsHfksyrbBKRigFdRGBBXzqkKdw5zjlluppSSuAAbKk4vIrKAQ5PywkEWp3dPWF2wRIG+z2mnMKLatzZBjjVuBgOXHEKfXAKYxgt74AItoyO6Cw+VcVoNimnwAJopakVVYbCGjQmGT5BqXfWr+y//BzFnj/4//ybxZfuVFo7YX1rc2n3/uzH9JaHbyGIIMhVCsFpk8MvMDMaJqeT6ZxkU+LvJASdDdWTFE+6vD1gA3u+8Msfbz1/IN7b2x0u0aKuU67FgZ+UMZHhEyapRAu8e7+4dHxKULkfDQ0CHfazXg8iRo1qbUQxdzcPGxzlUUJK78hk7KglFLGHz7dfPZiG1EGuMCyPvA4D3xOGZvE6Wg6NkovLsy/99Ybd1657nNWFKkzaiZsNJmenJ7GcSKK4s13356dnQHAl+HcI8DdzJJU5BnSRAt9dHzcP+tTTLvd+UuXVlZWl2bnZ+DeSfuqcsb6/fMknnDGT49ORFoQMKVuz86E9ZrBmhNa5DljhEF0d8IrkMFrqWuNxs8/+tXZ2fk3vvY1LdVwODo57SFCdo5P/vD733+4uXn96tXXrl0jQuZp5vleWXuJ4t7dux+8/yVKjMgLuwEex/Hu4cEkzZWQN69eaTaa/Wn87//gD25evXZjY2NhYdHAxlNRyOFg0OudHZ2e3Lh2rdlowLAcaa16/X69XlvozhdSEt9njMo8K9KYUDwajqeTNE1TP/Aa7TIl4p5/3u8jhEVeKK1qUZSkaX8wCsMg8HyRF925OUbZZBJLKRbm5tvt1mg8yrOMMgbTYFMoYYmwRZFDKcz7/T7jNPT8IsuhyCNKaymFJTcpSMteHB4qhELuSaUmSayEDiGla7c7osjyLGOMNWs1keWW9w7dWucQQCjf39u7cuVqwL0iSwin9WYLZykbjHEQ7g0HOPAt3xgiELPWnNQPRoQMRuOg0ejnubJQA3j7lTYOQkCo9YmxjU+3nus6+ReVsN0pdYHTun1boI9zEYb8njqDceLWJjFk/24p1XkxGdBj2ja1s+rHTsxqQVToYvPT9kmRhjIXW34nnCfUxhaQBBrwiDX05W4sWCFh5JUvDE21rHqPrlOKXDkurW2pUvZvQTALd5oy7HwV8X/Ri8WIMuYES9gOVStzBEpHSbJSry026kgYgUwvywxlVgcEjwqZxnGjUW/NzBqhOkWexFOJicZIwelkd0Q1dgsV1rYBVjnLCOLBQr7IUiS1Y1GSv2mr7lZ2deX0a02XkVspcihgG3ftZiwIdwwNvKgCSEPkx25j16qRrN6oakMg6lRZUCDB8owjbOjyJyTStNYIm60syaWUthlM4d+yvVmODMOYg+cgQ8bHKNIo8HhtebkfRKRW+/XHHxdCeF7gkNGQn0VavNFqzWKa1+rfe/LorCi47xGwRnbie/hp7faeKXGAR+ttiw0ozInbZbdL68w+ishNPNzzWq1RWxWBA9C47NCGLuR8jlwl7agdboGacwZmJkBXpoTaZBhZ04WK+KhB/+XArsg6FZZnN+YO0Grsyl6Z/wLvxvFiLRJLV11/64fqzBfcBACDkZ1mlDsvSecYad9ZjUi1lAZxzu652802+1pT5HgwZZVvFKyKUVZeJE0QLOkX2Qbz3l9Yevbofnd15X/6X//1zKVLRV54UW1v89nv/+H3kB/x0HfwaUykktqUNaVUMsmL4SQ+G03GeZZKSSgty1hLBrFKd4M4Kz95EPiJKu4/f3bv9u1bl9aQFDMzrXoYUca4z402hVKZyIej0dHJ+eC8jykbZOnh8fGNq1d1USCMWq32eDxp1JuNZh0oaVbrDfPTMiVHDx49fr63Z7BFilLOmMfLmyK0HI2mQoju/Pwbd169vrE212khGOBigijj5Uf1vF6vV+TypNdbWl56497dXBQIg9WS50sps7Q8cIxBo+H46PCIYDw3P9ddnKtHfhRFQa2uwaeWMWYLjsPDQ5mnnZnZk6NenmQYl1nRzOxMs9O2ZOA4nmJCgjDUdtvBOlwZo5QOo8azra1ff/LJt//Wb2hRDEejJM/PhsMf/OQnP/jpz+qN5tfffmux2UymEyGV5/taS0rJlz/44M5rt0WRa6EYLx9STr2z3tnxSS9OsqVu9+rldUXx//Uffk9K9aW7dzcurfq1QGhBGY2nk8lkfHh0lOXZ6tJSu9kCLwmlCnlycsY5Wb20IrRmQUAwFWlaxLHv+YPBaDpNCiGKQi4uLxFtmM+ncSyywsCuSxiERS6SJKHMa9SjJInnZjpRGAqh4jQLAr9ei2ZmZpVU02SCMWaYaw0m8JBUKq3sJO749NwYPTc7I4WwlRs0nxCC14xxRr3gydPN9kybIMwZzbJiNJkgbOqNRqfVMFoVRR5FYT0IpCiMcs5FFDEY1JoszfZ29l59843AY5gQQfDqtWvnu/t0GqcYnyQJ9b1KkwrvJiXl3aZ0rE0CPtkFHKxKO9v2iu0AKT7Dbg7oKldrWmTwhbEdqk73CzqhXWuwKh+EKPRFoJGrrT4efgGQrOC195XiqszRTRnbYPWxIjdBuWV5kFYQ7XSbDJYsKj/4KppYcY8jBSLrn+42bNz30gzjGuEMo1SrAui/qkI3Wr6dK+ndJM1+GIeSgkVLdOESVzkpaiuBRUbZ8Fg5DIHeFFOpVJGltzfWWJL6Hj/I0sKYC58aDGPKJI0vXb6ihGpjIqZjDYw0CRHfWjNJFy7dfNNec6BxES8IjJIqyxza2B6/jrKPK04Xqiabbt9GX8AZ7Z6nbS1USGjKfL+yQqzijUOCOY2cXR+2zVZqe6hGE6fQg4lgdbRrwsKZWUxZmiQWGErsgldZK2MGeisOq8cMyM8BxqFUzXYnnZ3L67XzweDhwwdRDdBXFIpmMOC+5Ae36vUa5Y+z9McvtrBHbXoLqClsocc2t2DY+mwrcyEogyIWZpC2DKe2BQtVkSHOlskaaoI+v/zCtBp3O0yVzUHK8p5aLyVipW+0YlaWRVXlwF9Gd+J699Y3SSlFCS2zUUTAFQmRikdDgVMFI+HyGII2PbW2YGBSDCIL+DNa9VKIMXGW2I+py0tqOUzOl7LMXonrOFmwt20LKOgRWeKMNQ2F2waX2RgG8C2QV2FbIXNKefmHBlbugXEt5TzCrzZaL54+vH3z5r/+N/+qMT+XTRM/jA53dv/z9z7MKPVrNWuk6jYbIGcvpFYYp0KdjibDJDaYcO4xe9MsYgyiCoPNRep54zR9sLV19/r1u1eviDxtNxqdRosywjmz13OYxIfHvcOjXppnzOOZlg+3trpzsyvzc3mWe5wrpQgltSisl9FO4Ypbwj0/z4r7jx/vHZ2ADSY8M4wJkROCwyhCBgdBsLzQfev1O4HPyz8sg5YiHDTzqnwiC1kMzgdlnOv3Pvjgg3o9ElJ63ENEF2le5KnWhmF+cHh41juf63bn52ZCPxBCMM+rt1uEEfBAI+UDoNX2s+dhEMzOzhzs7k/GMSmrXD7XnW3UmoUUQRDGk0RrFDUijZR70Sr3dN8PB6PRT3/+83feeAsbnWX5cDr55aef/cmf/zBOkrdevXP7ygaWKpkkhBDP94QSnbnOB1/76rUrV/I8EVKUYQzODJHlWzs7/eGUYvLanVv1mc5/+t6H9588+cpbb653u93uHEjAGDZ43B/FafrsxXbAg06r3mo0ytxQKkzIaDhO82x947JSinkewSSPU1lk1JDe2XmSpoaQJElmOjN+GGKMpSgGg74f+nmaEkwKIRQySspGvS6kbDWajXqkkBpNpp7n2TlFe6ZVZHk8TTgv744APBjC1Ogy9vigo9za2y+U6s7OEoSlFIxyDtw0raQQRafVOukP4qKYazaN1JRTqWQcx0kS+5w3Gg1GaRIn1KDIYzXPy7NMwk6/kAIpgymfpsnwrHfjzm1kCEgQyOLS4pOPf91mwTBNxxgxEFsh6wmH7dATE8aEUTnwCoR2w9qK08wsnta6AdjVGksAA0SrWx3UzgPYLjGWZxijzEFtK5htGUSsy2lF+QN9E3WmDVp1DX6j1Q6NOVNKOwOaCvt/EeTRBbqLKq2FllB9QLQBU0tkwYF2xw8+ETgfuqTBltUUKqiIco/SsUil9X0j9iNZEL3rtLuuoQGDZOQCFbQJcNV5r6pKAlSFyg7RdSoNemn1R8n5NFnrdFY8TxuUGDQoMsNYZeSHGOXD8WRufr4W1rHSQRrLJBGMAqXL2jOUhZ0dnaFqJclGTqVNEAacEJlO3W7yS9RG5ZqAq9VQ7FhXlX0zqmKz+zk3H0CI+l5IXMWL3TTxpds+BIHK0dA1pQ3BFSoME0MrcHT5u4IoanXyoiiKzO7+2AUn7BrXGtrOiCPCwQHJN7iGcWNx8bRWo8365198MZ5MojC0TWGoSVBNyTvNVpd6Igx++GxzN409H1gOgDWzGnVj4S9Wrlz+f2rh4nDDqFUQUEZthLLcEEbtkJ9av2WHA6sspkF3B3vlMC+0hBqrQrIgJALUD01e0m2s4S7ChDNGnNaYOA6ofaQoE0oYo6GJirQDFMObZUs0cC9HdloKwgRjp8Kuw0G1sVI7qHwJRdWNBYtgYnvmMIcARozR8IaDyRrSjIGGG6Q7SCPb7IK76eSNWMIeFjOgsLQyd8MJ9mChhmrdwvRyEI53XnzzKx/8y3/1P3iMFpNpwP2Tw9PvfvinCcZ+VLesdptbwGYzUeCCMoyz/V5vmqd+4PucaSXtcAHyA7uXWL5QzOdxnj/ZevHa9Wt3r13Lp9O52U6n1SyvFqOakNF0urO7/2L/YJpkhBHi80mWbh8dpUn62s0b1EglgbiJqOfzsB5yj9slbks26PeHDx49Ho7GlJd1n1LaaO15rNtuX7tyzfe9oihCP5jvtI1RWTyd7y7YjgRjHoI8hzI2Hk8Qxts7+wvd+Tu3b6Vp6nncIKMKCV0fkuXFkyeb573+2tpao1FXSmqjuO+3Z2YQWDBZcWCeZjsvtmdmZubnuy+2XoxHU8ZYo9GY6c75kX9+dlar1YtCJEncnmlZ0oxN7ODMKp8iIeXPf/bza5evdZqN6XT6yaOHf/Tnf76ztfOlN+595d13qVLTyURqxTkvDy1Ob92+/f7773dmm2mWwTNQPn6MEEbZYDja2TvIsuzq5cuXr278+Be/+O6f/eDr77x7aXbu8uV19+4QrKQ4PzuL0/zh0825TsejlDPeaDaMVEabOEkHg8GVq1cJIYRTLZXMMy0k4eT8vJ+mmVIqA35ytzuvpPLC8LTX45RLqShlaZ4VgNeqRZHWmhHcaTcZZXGcaKOjILD9Ic7pZDKpyM1aQovYGFT+Qs49zrgfbL7Y7Y8myyuLIfelEJwzAG+XqTBGut5uPXvxot1oUCunheIsS/Pz/jDN0jAIgjDQGMlCNsPgylK3GI/LKhncD8qIzrzTk14xmVy+ccNQrIQM2+3u4uLe5/e7nZmT6TRlVEFA1QhJo2CAx6wDuwb4ua6Gt3akp5ACZyqrkCLOxwy5nrPBTgXrthjg9WTUejZA8aBM5TJrregJcmb+zsxAwSpIGTeV7BL69sKiEvJ5mgBZyqlFnMCrTLkRNN6QWy2pkInYOY7riqh04RWhINxSo6CccH7GmkGCGULwn2opIEpo7fx27TFr130gllOrLoVWk21paFxJuK2ExbiK2bbQtUWF2+4BhaUAaAqSTEtUZLdWV02ac0ZPkjR1KYG7YqKQQonlS2tZlnekzCcDUZ7wRMINUo77BcmGcw52gig4YKnPPVkUSmSOrWzwhTGwDXTGYb/RS2PGaiyKcMVhcqEa7OR9P7ogdrvWtiNcWdpG5VYF/kVEu7zEwj6wS65gcRgTr9VmXpBkCZhgOz07LQOGobC1yFAZgH1MPIxCRHypm80mmp8f1pvTLP3i80+DIIQWv5UFEaLNIqOvNRoR48+l+OGTx8ZjsGQJHgMMqGH2gXVDfo3ANcyyeS0G1S0KQzyA+6ldaxgaDYBEdxaBF6xV25FGBl8MXXC1uZsXmSgKiill4OOhld21wKysgSlhjo2OiQDtZXn9GDPG9YcBA2XpV8aijJw8ygqmUNXQtqJowLTQKs+yxogIgZUeLM/hyqkZX4gBtH1ycPWZjbM7wu55dqZSGDFYDiDWkwpInrS8p7BUYJWf5Y3THFwbGxjPF5L2jv/rv//3//E//ScmT2WhfM8/PTj5z9//0wnGPKqR8iinwMCDFgWlAuFplp30zvrDMWak3WhwxpM8dT0DWNq2NwJr5PnBKEu2tnfv3bp1a30tS+LF7nyn0wFqDE6z/PD4dHtnbzRNmRfwIBgm8fH52SiJJ1my1l1Y7y4WScZ9rrTy/QAT2m63bTsEbhDe2dnf2twSQAmVSmKCPO4td+du37h+9fKGEMXz5y84ZQG0koeD8ytXL3PGtNHMc4N8KwqcTqdK653dvS+9947vMXAK1XmWG238IOifn3/268/TNL96eaNej5JkyjkPorDZbmPOpFaUMMa9OJm+eL51aW1tZmZm8+nT6XgSRGEb/hM165vPt4IoqtcbhwcHs91Ze6RCmmgVrYbRMqZ+9PGvNi5tzHbanz148L0f/ODpk6c3r17/B7/1d65uXHqxtTUYDcMopNB4b3Vat1+9/fq9u4SgoshBeEhgg5Fw38MY7+zs7B8edlqtN9+49/nmk//73//el99+e727MNdpLy8vWsmfRmY6jeNpfDYYbu3sri4uWofZ+blZpDTQoZPz/uDq9WtwEJfPQJFnVirROz2bxLHWRkhZFMXc7Axnnh8Gk8k4SwvPY0qaHMwuCyFrQUAxzfJsttMOw0hIkUynQAUxDLg08TQGsDOllJUhW0mMETh8kDIGE1ZvNp9u7xyenc3OdKIgAMJDWboxygpRtFrt47OTSZaD3koSZh2vuTI6y/PBcBinqUKGB0GW5z4yb95+JeSsd3qqpMaUAa/O29veqXl8+eqGBMBA69LybK128PBR6Pn706nmTFY+OU6OU6a4SkGwL/9ZW4yAY/r/F8AFy7CD+Yyxe6N21cNBEp3xzkvDI+N2LkC7bXcpnGjWYZjgP9Z8UCsVF+IwTUf4gsRnly2d1R+qqLRQuAOblrro6MDV2J6QCCnjRLgWeQvO42Vp6wZuiIIXIcc4RTjXwOmzEcNUuGIreHIoS+2O2gttqfP4waaKYK7sKY9FyC+cfz+oKq0tAimDxnA0ujTf7TJOkR4pPRTKLe8iuPyEjMfjxcVlxvyaEThLRSEUIdLOeh1xAZycK/K1cbETSAy+D77a6d/QrNu8CG4oECphOYpUkCSknfuRa3NUU01kO//U83y3hWXc6hKq2s6k8lioJgQv/Qrh+kLRZs1sCULMq3VmCqXyLCPYqcPhH8rIDYUv4hhxjD0wYPCNiTRqLC6dRRFptB5vPj07O61FkbPFgD6bL/Nb7eYy5TSKfriz83w6Ysy5/tiymsJLCLQrK+3TpDxzgWCO3T67caslxkml4ElFSpe5JwRF6IISe0nsHa0uKtxvULsoEMtKrZyWADvBvWtcw+eQ+qJiRtBSVpbYArfdPsHgjF5JLayGELA3xPorVNptSITAr9COmG1ss9YjgDpRrk1tmzbl1ygfMq0sSxbZ5rZS1vnfiQDtph30OGxbwngg58fG5tTlt+DwmFDYAPPKwFymsTOIzGf5vCj+5X//T7/5t/9WHk9MoX0v2nux+0c//MGUcR7VsdTlL4DwIpQspB4m09PBcDieIowb9XojDBkhMYifrWmjbXohjTzGg1p0eNY77p29d/fu5fk5hNDywsJMq6W1zoU6PO5t7e4NxxNNmED4fDo+Oj87H4zKy8lZksY3L601gsCKyyk4A4ZhUKvVtTHcY5NJ/GJr+7zXszOnRq1Wb9QoJZfX16+ur3FKc1FsPn+u4HzHBA3Hw0urq3Nzs1IKq2ml1DENiiTDCB8dH0eh/8r167IQRuusKBhlzPf2dnYf3n/kEXrl6uVmszkcDGpR5HlerV4jnFk/NS8ITk9Odnf3br7ySqPR3Hr2/Lx3xj0+OzfTare8WvjFgwdZmt+5c2fz2Waz0Wy3mpCQUQwWeGVCwBkh/OHDR2EY9U57H3744aNnTzc2Nr79ta+9sn6ZY/xiZ29rd7fZrBvAJly5em1xdandakBlKQm19nxGY1JrtjAtC8qHDx8qpd975+3D/vn/+f/8u1euX3//3r3e6Wl3Yb5Rq1nxCCF4NBgXQj7f3jkfDi8tLiNjkiRpNeth4FFMhFB7x8eXr1wOfb8svIzO8wzUdfj46KgoClE+qCYXIoqi2dlZUaZB9Lx36vk+WBVnnLNCSM7KojzPs+5i12NcKzkcjgI/4OAyiQyO42wax5Rx26DMi8K+Ngp2AikiHmW1RuPFweHzvb1aPVrsdpHWjDGNYBdQqrBef7q7O9NoucIF5FrOD5SSNC2G4/FgOk5FMUrS8Xj09q1bd2/eHg4nx6fHjCLECA+i7a2tTqOxsL4qlTQYdVYWfYMGL14QQo/iBEdBZX/ELJtWYyS0tD5wuIqhuqqTLnYW7CjU6AtXWRAYaw0VCawGkYsAXJYLZWCDk/nCuxCEIGUNoUFqSinVyHm2FwyfpvkIQSbhVgLcyrCplEqgWXHMAbgyqlIQuTOW4qqbTGjlD4gIdrYCFteLodBqBgHBZCykgJ6f1Y4qt9mBiBPDAAsB1p+Is3tS1lfAjU2pc/ioDl5Q51qaNIK2H3TsmK27MEqkxkq8vrgo00xz3kumAi5RVaqQNE8oY0tLS0oUdSHQaFJQBkNKAuZ19mLZHqszVYevD41SyjzuyTxDUpIKxWxQZZr/kjJamcBC5W3+Bu3K4JcesRgMea11Bq7ut7ZetMgyli6gjq7INrSSVBuCKHLsS2MMC6Ky6MkTK1qyfFIiItkpAACAAElEQVQb2J1GCMpvKLzKLAgjXYtCU69nQahkvru3HXoBctsgdtlGzzC24oWMeQcyf3J8SD0frBDA5oISKWD3A9l+DyLEKGNvBtJIgS6rIqu6doCxDFU7nrEjU2jfUouX0YCNtKBEJxcvEzZmQIGMKM0zqYyOwhqnELAptmQMZKOpNQwxzlUP8kHnNUnAHdr6sikQb2s74rb7JCAOIkBjocRanBqltTXtVFAgOvSkBkgpgY1jbZktFvXqNgdsVmINvGz2UKkIEDDvquulq813bRcEyzqu+qgwwoW5Exd6ntL68PzO3Pw//93fXbx5VZz3qEaMe08//+IHv/y4CMIgDJDQgMPUQphxPIzzLBUKgp/fbNYYDFdEoRKRG6xD7tsk2lopRrVIYfRk6xkh5De//KVurRYGfhs2XnqDYb8/GMfpOElSqZI8Px8Ph9MpY6xeq4U1n3t8EiezjVa72UiyuDxfMtHy/TzPms2G1GUKdHp0erR/VGRFWI9qjXqn3UYGnRwfz7VmZlvNrMg87u/t7Z/2B7OdGVPWQKJer62srCCpGWGWlW6LDmbAFgboWq+/9prRSkoplQAJF3/29NnW5rNaVFvb2AjC8PD4qB5FjWbTD0OPUwXLj37g7+7s9k56r752Jwr85482T456YRTNL8y1my2N8NHJyfbO9nd+6+9tb+/lWbZwY14KhSjIjBE20nh+QBj97LPPDw8PT88HvcHg5q2b37lyZWF2pn96nqb5wfHJ1u6uHwRSiMVu99LqKvd4kqWN1WXiFhW0tdsIeBC1mnkc93pno9Ho3bffG2Xp//Fv/+3a8vK33nl3MpnkUoZRCNyG8q0psmI8GEpOTgfnM4D/NEhnRT4aD5uNSBlDOSukTLO83WyWp7ajoWOhi0IIhHEuMg19yNNeb219TRpZr0ee58NoX0slKPEYIULIyA+kVJNJ2mk0gyBAhsRJFkYRxVQTAcu6unxllbZ1RZIXtTASIo/TNGh6BKN2FL2ycfnBztZffvzZaDy9+8p1RhjWknksz7Lu3Hw9DM+Gw5XZrshyZzJjVYnaEEaxoVLJ0+HoHOP9097mzsG33/3yb/2tb9zYWv31J5/0JlPt+TyM/uzDH/DA37h7R2SpYOjV7/xmeQZ++GdpLXqSZxnnpoxnCm5fGUc9wiQcFuT/p+o/ni27zvROeNntjj/Xm/TIhE8ABEkRpEiWUamMzBdVUSHp00T/TQ87etDRPelBO/VArZCiFZK6giqRXSyCIAEQPr25N/N6d/zZZtmO9b77XFQHByTAzHuP2Xuv1zzP72H4dArHhqsz9wD+ijNVGDCGnr527eNSEkXEQDyCBVQ4f7AzAzMf8MChBcBrll7e5igyhemlNs0oopxOdI29NN6ipvQSrgQh6eHH+HrtsTAcwy7PUQ+QeI+p9dzC0QtxEyCmZlRA1B9A0YxzAoZ/4cozEAkD6lHMK4CTrQZE4bbOhSIYHSGLbBiG53Z4ejlqcZvnvIOKFH7MJRgTxG7cUyHls9PTw+vXl+N4zZiVOJrVITY4vHVxnOzvvXz11m0jk6VGK4vPp84KwjQIxziB8B0a3pWrTUW+Dtz3VFcqaTRkmqlKQe/kEFa9EFoBspMtrEuM4FeAJw/5//K+ceAgUHBH6kBh6lGXhNt+JJ3hInNhKvOI0KKL4x7DkBiLG03rvIE7DbW3SMeqO2Y4zGFFEE5fSUjsSdzvTBhjjWz35W5Z5u1mG9a36IEiwtrtZrPrqUjSz/Z3hrqSoikAYYG5t0ANA5t2KCMsBgxQjnNkeplkHIpHR7kU1mvIsZCXmX2ccOcQZA9pCYzXHSKS03AFz0DBBAdkGkXhkoKO2VI4IGGyBKInZmu9ojOQ1QFjI04WrGrmvrX+WvrtFiB8YiC1Apoxh4wZ8P+g5836RecayjLjwykno9jCt4NL1lBICI4BDOipx5sU9FwEVyYQEBkKdZCqMeqsZEBwB4aHgLqb4UiDQVCV901C+s5uz6YfvHv3n/7L/3+yslSMhpGQXJt7n372yy++dlmWytgUFeW0Mm44n2lPwAPKm0ksRExDwW5UaBAsvEjWkDFQ1J2xPoplEkeD+ezo5PTG2uoPv/+9hoxBikaOz88Hk8nFZDIYT4pKX+SzvFTU+0YSbSwvJ1FinDG6gqjs8pX1VcGohlLGeu295V5ILmfTWV6UZZ73Oq3WVqvRassk9sTvPt+lhG6sr8L1zqd5+cX9h61Wi3hI+NX6xtVXJQt3mojkApUQvl8F4u3R6Lzdaq6tLhdl4YwVUhBOv773zbOnz/ud7vbWdtZsnJ+dTcbjrfVVwqmIJCRiUS7Ezs7O4GJ49713G0m0t7t3enoWpfH61nqr0VSVVs79+qPfvvP2Xc7Zixc7d99524THi6O+FmJIEStj//q//vXpyenVze3vvvfe5uZ6I02L6Xw4GDhKB5Px/cdPc1XFEX/zzlurS0vOmPl43Oy2khgnsZABzri2Pu20rXfT6fTxkyc3X7ntBP2f/rf/fWNl+c//6I/UbD4ajRkljTT13hkTWvxiNivLsjDsdHDx5s3bMJ8LV+l4PLt+JbIc7UxUaSAVOKAuEuutN6YC8YQbTXKZxDHnk8l0PsvjRiwk6/Tag7OR5DHMCamUglMipaCMDMeDrY1lKUTSyPKitMaAJZCmScKFMFZjwDYRfDAYyCgWnM8KFcVVO2s4Y1a77Vm5/vLk5POHT4aT6Y+/951Gs+WsV5US3r+yufXN0+eby+uISgqFr4fIaIgBJZ5wz6iIQEjtD4ryX//sZ99//vhP//iPb964+c0XXzx89GhU5J7Sn//n//JnUbz+1mu6zI1zb/yjP8qyRvIf/zMZ2QelVnGM0eOEMrS8w1IM4+UpdRzJ04vODyZ5SJaF6WHoF8GXSOuHKvOMGpioQ9xC3SkiyKKGb1h49oFOGL2X1lhSG8dtl/Femg5hxg5ikfCUNsYhTiFU5zZc5GQRalqHFTLPw63tILiWA+U2nKuCUMxUZkjmojU+D/LFAcoPXD1+2SnXLk3nTY1Ogm0fc8ahjYXV4iIbehJa56w7MOxhNlTtB8Ge0mOuEPYyHLtQzljE+bjSnx0e/5Nrt1w13mw0D0YjxYQjNWkjFmI6nh6cHF7dujavima3G5+fW8408ZqERzb3zMAZV6cDIx8UdrbGVMbFIsmUmHtbLaCIHtlNi7S/RVFRrxgW2UaLiHqywPiHTyqO08sIflLbkFGp9u2og/hv/xeitrBKqneqxLM0S7rdSmmtKkbqbSUGNojQ9RJBwPjLWORJTEnifZdHfG3zIo59knz91Vda6zj0RrUSmXvf9+SNTrfD6ESw//ToYc6oYDSSwi/0ZHWKPeVoiKpfIMVLFk/oS0w0mK5QM1+nPdc+ak+c0eGaowJSFoA2jAEN1ljMeKgxrY4wwQUscRncrsA0dIihcphBxHD6jrI+A+uQWuFVx5iAph+wLy5UguGEdWxBS2FQOLKasOK5I8RY6jwgYH09LQp1pRec13Z1ggC5OgELf3Z9nzPUqYWXBnY9W38o1vPw1ArXrAiNsQd4J8DYGIewH7tC6e1KvcXY/++f/tkf/ct/QSVXRZFmmZvMf/nzv/nNZ1/GUdImNDbaWzsrSmUNZVQyERpYGWPwM6KqLU6LQJuJ6jbOeJqkUorTwTCfzn7y/ve++87d+Wx+PBg8Pzp6+PLlg72Xz45PXpyenw5Gk/lccL7a7671e51mU1LmjbFWMykqpZzStzY3RLgd5TwvGCFpnArBURiVNRpLS0utVjtrtjzgPUfD4WQ8WVtZaTQy751M0t988cX+ycmV9U0Cw+SVXu/OzRugnaY4U+cLCLoxmnC+9+Ll1tpGBi2mZ0wI8ezZ7qMnT7NGY21tOW1kk/nsYO9gc311fX01ShKcCkoZ7Tzfmc7m7733Lmf05Phk5+lzQvzVG1fb7bbVWht379FDZc1Pf/Sjzz//vNvpbm1uKlMywSgV1noh5HQ2+/A3H2WN7Ic//MFrr77abbd0Uamqms1mkAE1+uR3nxPqZZSs9HrXt6+oPDdGOeeWV5db7aaxFpOoQ0cieKPX12X1/MkTVan+8sq//rf/Z7/d+os/+RPu/PloNM7nAiAkC3QAPTo5ts4/Oz299+zpWzdvIbi/Upoyem1rm3OqlN15sbe6sry83NdGheeoMpyzoiiOT860dS+Pj6O0EQmmlG62Gkv9ZaUMoXQ6GjtP8qLgLByrlPssTglhSpUb62uUU630eDxqt5qYOq8qczEYLVLOqfHk4PxMxnE7zbSyxvhWoylg+trKGhbEF6PR6OzifGm530gbqtK6qprN5uO9/TSKMimBbQfqdIJ6CAdsBr/IgXE8kjJJ9s7OHz540MnStz/4wa1br0jveTF1s3L34eNmq7W0vR160apaun5ta3lFvXhp83zqnaoz1aFWxp4BFmzWOuMWHElgCUPlvaDbhQPO1fZQv5hzgWe3zi1Cvy9sPRfJeGiAoYK4hBAJiikcrbtasEQF47lSM2tQG1yjp+rDsbY31clrSKondRqbvSQc1AM1SKSlVAjcfxrKBKSI2tpa6F1CWQuk83NnlHVU8HqIShABjahJiuZMjAEkqGGBBKaFVdLh4rbWO6NdlGF0fn0eYefOeYTkP0e8oXw2m99dX4vCs1IOyzyvF+N4wjPtbF6U165ctcZnnorRQFFqQNgFni1iocCE3H6kTdaxxCCX41wKr0pnK6yc/ELqjIEJ3zKa4Cuxi1B9pIwwnE7WSmfKozhZ5B3VAwhei9r9tykMGOAAHiQ0rqBsDrwuXhOStHsiSooiBwoarXXZjgi2OH0JwDcIBQIllc4tdzvTTn/eao5n40ePHiVpzFDlAsAH6uzNJL4Nzf5np8efHx3xKJYcWdkeA+zxdyGFA6x1ru784LC8rD8A8gPL0Tq5GAVPi/QgDoNmmPMsxjc+nBO1rN8vvmNI7BdwjgKzHA9d2Nf7+oTh9FsjG6yW4Q/4y7w/3EGCqglfHoSsYXXEwwGFYUqLI5wlRn93dW2L8uMip1Liy8BUMgp4KlQd16HlECRe53HUqc8IdasPbzAGhHIAgyC5dxK0kZjKLWEx641pKL1tzE2tf++tN/7in/3lzfffq3QpGJNcnD969Df//j+en52/+tqrb9+4dXVlyVEyLkvlXRRFPBLfOveB2w5MnwXAtKZRw3ZIyEKp47NzEcnr166NJ9NPv/7q66fPHr14uXd6ejK4mM1y53ySxv1ud21paa3XjRj31hhtoE4mSDAotWol6bX1NUrYPC/ms7zdblFGs0babGZxJKWQxhpjDQwdmLH27PQkS9PN7U2rVZKkO/t7v/rkk621zW6jkZcFE+Lu229mWayVFlLWFRvs59BVXqhqOBzeuHG9NuMy9mznxbOdXcGjlW630+4MJuPHTx4v9fo3rl9v99vYQMRR/OTJ46Is333/PW/dbDR9+OBRPi+2r20v9ZecDQf//tnJ3/zqwz/86U9VUZ2cnrz99ltIjan1kTy8+Ivhxc0bN9+4c4d6p6pKFRWoAgvj7GQ6/+ij31rjO5028f7a1mYmpTcWm6SN7U0uOSAIIeaF0rjRjLN0dHz+7OGjJEv+01/930v95b/4x/9IEjIaDmd5PhiPV5Y7165cg4RNr0p9eHwik+SX33zz6ODgu3fuIHEMOlG7sb4K7Bf6Ym9veWV5c23VWg2jHsM4DYff2YVjbOfwMM2yZKFDXFtf1UrFUTQejSb5zACKOdeF4FwyEUXRdDbbWF/DWMnBcNhqNSMApxjnLkZjcNfDHUf56WjoCVlqthwhWhkpWSSFpJwL2m5mVVkwKc9Gw8Oj45WlXjvLVFEmaTaYzsr5fKXXw10CCAdr1UVNIYRHvcCIPU9kklRWP3r0aDq4uP7KjavvvH3t+nUR8dl48vWvf5sQsnb7FU6pKcv22uqbt242ldLDUT7Ly9DrLm4D2Ia6WspUP5WdA/hcnd1ecxZp6F8tW8Sh+0UbhaA9yDviSNhFtgYGhDNKmsre6PZKq+fGUCEu0S04rlM+3IAgCWY1DGRhpV30cMjoYH6xyLoE6/4duhZ4JWCwQSiAY+osPDBWECIZbXiyniSJJ1NryzqLkdV4CvhkMasbrkoOWC278IJyhEV/SwtBHXatW4LAG4+/kNWRjA5HghRDADxjeVksp+lmt8eqSjNyVFZEcFqDOS2jfDaZrK6uRY1mbF0rn+e6MgwjFZiFESpSIWsiRx3/gMs6n8QxpcSU5WK3DAUDxak4Tv/r/INaQIaNn19MqmubEc4jFx9qTWtG9IdfWJv8QpxFFp4xGLQyUsfHhqJaxlGahWsYyl780oB+FdpyJLMxFpqtiIIUy/uEcdZrT6jnSbL76D5IttDcg0QRl3l/tdFoeD+n5IujQ0NpEso3CbHVYLDxiKQgnCPsELJvna1zmPHXw2IdKYMw0rE17AIGi7gq8agsdk5EokZ3LCK+nAVqjeTEIiLcE1vrDnCFietx5D8KJgivqWTO1CMnxjhsqixFLqh1hDMHEySISKAOjCsYmW/D49JxyPCBIhfqI2O6cUrnE6QNhTcOBUr4scayCEN/BfNEO2uskUzYS20xQtBAcgy3T7hXBQtVEZqzKeR3SvxwVJUYvcLFuuCvNju/99OfvP3jD4jkejrlguejwenO7uTk9P0f/XD95nVCyNHzvW8e3N8fjTWP0iQ1Dm5ORjTYbtBGZYizoaEJX5P1ljBeVeZ8PJzkuSOkmTbMbPr516fGeiYEFyLKknYUN+I4lQkgRakFlZMqcsK4gcW/ECIvCnwq6bLqrPUJ5ZP5dJ5XofbnwhMXJzGILL1x2nq0nFlC/HA0VMasb2x44kUki6r63Tdfc8o7jUapykpVV5bXu61WpUouIKuM0aqqZBSBiC48F8qiXFlZ4ZJZ46SMn+7sPt/Z5ZQtdXpLy/2L2fTTLz67c/NWK8tazZYqNRcyitP79+8T79959x2r9Ww8uffNw9FocuPm1fWN9bIIv9k4++tPPrl1+9b6yurHv/3kyrUrQopKVzICbQg+WyndWFtz3g0HA1DzlqDCZ9aRwfnos8+/iIRcXeqWqsqNTqPYWw31n221OrGMrHG4igo9CeP9/spsMt7f3dFa/+o3v97e2vzD3/uDiJHRaKKMLcBKuNTrc85hCUYHo2FVVTaRj/ZeFNYM8llXJg6S0suqmE7nzUaDckU4K1VF6zBNjWzkMq+cdVaweVEUlepnKaN+MpkURc5hMwLgX4uZkt5SGQPLxVtv3Xg6T7NmlMZM8HlRpFES7gIY1ZRGA+bOcy6kENZaY60Q1Fo2nkySRIjQCoa6f2N56fhiEPWWLsajX37y6Y/ef78Rx864reX+/UfnllIpJSEmlBrEQnCtizgPDxrj4ErARzETzrIoFkn25YPHxwcvf/T7v//6Bz94a3vzlfffP7j/aPfJ48m//w/v/uTHcRKrPKed5u//gz94ZevKf/7wt785Ojw1ekSJkVDuGguYXtgRQRwZzuosSo3Qb4PxDqgDxnVbPVv24ciUHCpai3DYULhDAFu4lY1tRBExtrQGkgxcHTDMuPs77hdWO4DCwwRZJdA8eooBEaGXdAKGguD3gjU0Y5enIuQ2gsQVB3oMcYAuNMTW4SyhLeM+jx01DWMnXjlINIKjPJwuFjP7SPjmYQy3sAgvJMTYwNQaWHCgYMgxrlphmbhwd8DfscRz5+s0N+cMF5+fnry5uZlRsp5m7VkxcZd1D5OhLCEv91723v3unPNutyfLuSReEQJzQTTvhD/MF2Cm8EFBpwfaDyfijIq5VwW6kKj3yA/DMBvMKXD1/OLS+evRjYazBzQbC8iqJbZOs8ccTHbJ/grXHYTuYMIjFkE1cxl7HUtllFIhqiJHvyxz9cqKUypAtCW4F2BcxfOYe9tutGdZU0XSFsXR8ZGIZD2xRjyp0WtRtBwlnPH98fjFZMIjCYGCoCUMR5BbbBoQBQVVPW4syLeYcdjlUA9kDktsfRDgu0FNHfSytdnIom0pNMqcC89qzAmHX4joA2cg0xBGyg4kBcZZIRja1JyjkgnqLRUMg/7B8sRMTfLgjhJMD2beMVfHWuF179BBS7/dtBPKVBR/Op4I4o3EgTP7Nv9VCGedUQ5waOAmEkI7U+NPHBJf6cI5QMBYGW4akPKjfyDcCJExQqmGp1tZcqfXXnf+9TffeO+P/zRZWdKj8+JiIgiJBGeObr91V/64Y8bT58+fP3/4+OTsQnnC0jSiXOvwkLYE9reMGaNDe2i5Y94t0NOM0NF0MitLwfnG8nI4I4E7EokovLBQUVkuuDXhma6cK8pC2fD4A1B9+IJizhtZmlcVWhIUIPGWW50ir2Z57j2JZCREeH9ReMyF7sEiry50y6Iq1WQ06bTbjXbTOZvE6Rf3v7gYjFf6/TiSRZGncXTjyhWjlCMukuGBNM9nxtgkiT3YDMMNqW2v07HOCSF39l4+230Ri6iVNpaWlk7H47/65S9ev307FfLK1raQoWeNZPzg/gNP3d2337GVGY+HX3755XQ6v33nztbWelGWRhvj/MdffnVyevaXf/4XL/f2GGfb25vKalqPLmrQnkPTK7GCs6osQr8IMKOLi+Hnn38pCN++tlmq6mxwkWVZo5EBA5I5S7q9bo3y8YQKao2Jmo0kir958Pjpk6dPnjx56403v/fd7whKJ6OJspZKMZnPOOedZs/Ao5l6djEYCxntnF0cjYacsaOL4dL2VacM8b5Q1WA03tragCg/rioFBlhAnjvjPdXKeOKNNta7QldQ9vuiKifjycrqkjU2ymJ/5iSPqBBuPjfOGeMiyYWQw9F4dXWZEhdFSZEXvtMCJivFfhG0E+HXyEgq54QUSmnBmKpUMS+TdpMTWHw2W1rZyXy+vrR8fHHxi48+/sn731lqdlZ73Qec5UqtZNksnzvllVae00hwZ0Hry2mdowtHciJjai21vrHUL4z+xV/97OXjJ+/8+Efrd169dfXKrR989+Dh4+nLfba1yRmxxlgptl+7/a821z745v5//eqbzy7Oj62dhfKBh8eh81opSAqnmKvviFsEq3t6aVjBPHcHu2HraycuSKOZr3FDmIPAa8sOmXoymc8KJBHY0FZ6VIfA/AM3KrYewuF2DE96BvmBzDpDF8x8X7uAQXQaGne05wI8sjbSoJ04nJVoMwL0vafORYLEjJXGUmeos4JL3HtC64IkJVdf4XBswVatnkFjSAO6nCwOHcM15RbWK7BnUpC3+cXRRdhi/BvaVyHli8nkYDx+LclaRm9l0TSvfCinwlFhHJFxdHRy8mpV8jidNztZdK7KUoXD3ktKNcYvUljMOerq8xM32JCgk2YiSUxVcJhCov0LJdNuUenUC1AMfGI1jd/jmhdyiohnAnn/CwfY4ksHvylqf1AN/HcikuoVAD7XCeUyTY0zKjwZORK1UeCKaU0MjgSUFDE0t3iXtVv7XPBme+/lroJ9zMJfzByhsSPXmlnsrG40vn7xVBMSMc4BKwcyK+YdlEWYxegWAcmMCSJ97bqykGRpINwDmeKhfSTIMgWPHfQHQOliIrRtdZ6BRbwnI6AEIeEYDY11aLRDD47jXmOsAAE1d5B3zeqAEWu0v1yZA8qSoXmxFn3xekBBBcoimODeWFBZg9HFhuKDCklCVRsuasNI4fArQ9aZrQGx8FCwzgjKBQdPMMScGWsIRSwXZJIQJ7lEZTXo4Jjw8MgySjqbOnolEa+02tdlvBLxVrN5/f33bn//u6Vzs+dPGfVJ2oo6bRJLO5meHZ8d/ubjw4PDWV54IVg4QsPFWhnrmDehz/fKWE1rjYTjkD9BwFIMYrSs1yMsdCvhtK5lJuHaLFRpnZaemUpRzrWpSgO4VUZMHQ3iBOXtLOGSXYyHDvClzulOq5FE0XQ6rqNUYebBqZdUOGNBCMecp0YbJvhwOHBad9pt6r2QycnZ+YuXLwnx3VaTeGes3Vhbb7WblS2SOMUc0MlotLSyQhD17Ymhrt/vcuDrHh2fPnr8NJFRI2u02t1xPvsvv/qwkzU3u8udVqO31LHWCC72Xj4nTr/x5hvGmvFo+Nlnn0/ns9dee23zykaRF5xSpczZcPjJF1/94d//ifD05f7+63fuSCEqU4GJOVy4YPAIxScE5Il8Pldl6cFqdjK4+N3nX6axvHn1OvA+i3Exv3r1Csebz9E4TVrNZv04w/vLuuWV5cePHv78Fz+fT6cf/OD7r965rZUpqqqsSs/oeDKdz/P19ZVGu+UxCGg4mc/nrV73y6++qBzpp/J4MHhj+4pnxNFQi0xmUxj0WMao1toZQzgBhaMDmr/hgutSRZHknJRlEceRNvrs4ry/suQc8N4Z96Hbt9ooTxKAW/o0TSbTmTXGW5fG8Wg4VFoLIiSP0FqDNGzUmzhtQEhVMU5lFOdl2et1YK4aWpmlXrfSlfRsfWl5//T4k3v3fvKd95e73XarPZ1MNrM04fjwAN2H89xY6bwBIl0cSU54uB6tiUI9KrnnUSxFHB8fHI3+/X/Yvn7llbt3V69d23rvLplMiuFYV4oTG54inEWN9J0ffXDrnbe++eb+1w8efXVy+rgsj61JpGhkzYFSE0cNPMHhNoEBYB12hymgoKAGbSe8GeEXDYYPDzFDMXE13EkMV25zu9C7+FB2Y8ibA0QErV1AlBPuKZSn4Wkv4AkDmz/YHHlvCWdkUf55UDBTi3Dj8BKtN7A197BQg42kABmVIypU+V5QqZ0rdJGIKBJawANQMLLYSzkLkTKkXidjB4RIX1joMmax10ALCUMLSE3lhYerXVTmyOv1AubXDvD4cDoQRck3Rwd33npHDgdbabJTlgZxCuCijaJ0Op0cHu7funpjquLNZisvSkmpoUjhZRqGnnjTLHBWgG8GLJr1TsSxAq/LYvKJiRR12mCt4kXRUfjXFs7D2hHsEVFJnECBNPWo2amj9OpoClZHOSzSRWo7Ul0J4KBBxjyKK61RbAJZ/wzn2DXmF8bRAtaNnBDpbBynptlWRBBGX+6/FBJTELBNpMS4XiTXoyj29NiYBxdDDkGhdQgEBkTXqkBYSocyiHIqYZbhgPsMqqgaEIN8EXwQQLStJ6Fz5Cj4pZhmTxCWAu5zTuBqAZGnxXeO8ApkwSCQzWK0P0MhQS0XByOQ4Nxo7QljkuOJCMCQ8HkJxkJdDPOfen/uDA1VEPfea2+XrekKeWJthbsDdAGCwhlqKIbfYu0vZCymEiYODsFt8JYZXoWMCwiK4Xi7YtZeeJnG3l1afj2NV4nvcpkyJ61rdDqbt6698v3vRUs9fX7h5jkNTa+o8mrv2TcvDvbOzy/yeS4kj+NYpimTUikV+hvYBRWhkifGutIqsApSYh1TJE5ixiVFjGWnczKbFZ5obYzRnnnBIu+90nWoJ6FU8KhyZloVENgTjliBHyznzTTllBVlWWmdxqkUXBdl1mgWVWFsqHaVqpKYYvADhooLImAVrZmU5TyfT6atZivLGgSgDQ+fPJmXOonTLIu1rqTgy/2lvCoiLgCmTQ+PDgXnWZoqpRc2SOgpKLsYDL++dw/+36zVbOVV/iGcrH/v7gfc2RtXr8EIgs4mE6PUa6/eYd6fHB9+9tkX1vm333pzaXlpOp5gRI9x5KOPP+5129/97nuP7z9oNBsra8vgP+aQhedx51QPrpzLZ3NVVRxsgyfnF5989nkzS69fueadG89mh6dn3rulfk8rw7g0TjUaDSaFNYZLSYhXRdldXn/65Nm/+zf/ZmN17U//4T/MsnQ2mTDKq7LiTBRlfnx+6pnv9TppMwEzuz+7OPOUjlV178VuHAkh5clwMM7nGXSIUsjxeFopJYAvZrTSDspZeFYoY/Iyp4QZ8Ny3G41JkW+kiff87GJ0C1RaQiJHASQw4CN0xFdGyzgq57O8KGIhIxlucFVpFuGoqKa1W3AlcMJ0Fb4mLoTRSkiutZ5O816nKSiHHE/XbTZGk3krjld7vaOLi6+ePP7B22+vrK7s7Dwv3XIkJRVC5aa0VhXlm2tr713ZevFi/+RiUDptoogKHsNEPouEhAwWSlnUazBKzvaPhgcnq2tr1+7c6m2sp50OscQUszKf66ri1lDveMR/8MMffO873xlOprvPnj8/OXlW5L89PzssCgOBnwgIds5Z4haBobDohY2msxjRX7M4QCzCwSIsCApBMGmoph84XB2GMw9JWOBDsnAwc3hi1CpUiqpitKdiArr1OF6EMSFOsOuJqg+1oAVtKppxbShz66BXxjkKl2DhCEQOz6Hn4BETglSaIMm5jhUgCw0Vc6DrZhzMyQgsAoPK4reDa9FBMJHliz14+Hz8JYITjdTCe+MXvTCnJIriB4PhQZFvcbHExVKUlJV2nIHUPLxRKeT+3t71K9fnnLt2W47HQiuBdCkYPkP/4CGe1uHPRMurs1YrHcuIxomt5ki34gQzFmsYCoQvQjdax2NhNCAi0hbbYIjGh7vZX1Kv0UWNMEw8grEsqTtsX/vRwtPBOJJkGWFMF3qhA6tT95G/wdFrDCuF8G8YkcZmvdY4ikiajIfD0XDYzBoU0xoQN23UlVYnI0ykyaOT4/OqisPDl0KokYFKFGR31uLVw8Lz1CHUEXbJCBqFawZ5FuFyAp0CrBmEYDBZISCM4pBnueBM1gv+cGFRJsKVBmw36yyGbwDKDi9UqhT4wDhHqrHzFv4s7Gi5hKEKddCpY5ZR+Bass6AGRGfU5eAfx+BGqR93e39857X/9pNPd71iMknDRUBz64jgBl4vZPSi6osYZznnyGxz6COCH+W8BWovEZDG5C0xoTVBgAjznB0OL3q2dWNz6063e3W5295cb7z9FhEiV2p+eupmUz8rhicnZwdH+Wiiq3ATtLhsx4mhzimjvTJ4FcD6mWsVqSpiAni5Jo6iiLE0a0bNxsF4NreWmur62tLSSv/5F2c2SRGZspBgEBDveGO0Dd+bzcsStG8EKL4M6BOskSQUPBVFpaSIJHA1maetpFGpEoKtDCE+1GzESymwBHGQOATLMzuZTrWzrV6HMipl/Oz588F4WOpqpd2LhMwr1e8uNVstpaq0nRBCLgbDi8HgtTduV+FbDhWPcZqAsasoyi+//NpZ12230zSd5fPH+y+eHx6889qrEaWrKyvNVss5b6yZTSdXrl7xzj149PT+vftRHL/9zt0kiS8uLqIomedz48zFYPzg6dN/8Zd/MZ/PL0aDu2+/JZOoqgoGAdN11Qzvgngyn+XlPHfW8Sg+H01++/HHzWb7+pUr3prhZDye5yeD4ebqcitr6KL0NlzQrU4LNczUOW1skmQnx6e/+vWHf/Ynf3r75q3B2fHg/FxGcVEWZVVwLs7Oz5XRjWaj2+uxiGlrldbj8STK0q8P9y8mk7dfv316cjzO88Pzi1e3tlRVEcqGk1GeF420gTCWGs8KHkEIddRCcGP9YD7vG+XKatUTwfhsOp3lebfdklLgpBGqLm8tZF8wImgo14aj8erSUhKHqkhZG3sEFi4UsHBoMc4NsYRT4ZkxBDNJx7NZIw3HtWDSEt9utbxjo/GkmzVnefny+HhzaWl1qf/02dPc6CaPiHdZnKoiJ0KOxpPr777z+uraYD5/cXpy78mTcqSyTjuKE8hRDc9SGcUg4vSNrO21KQ5O7+3sRY3GypXNlWtX2v1eo9k0sqiKgjKWssRWaj4YnB8cnZ4PHh4df3i0/xzk4JhlZDGtHNaHGKEPoeNYfoF2lzNYlNf0yG/tLDDmFBDmBm5YXz/wweRSh9iRWh8TDnLUviyaKEw/uwwghsOPhyc7aFGh7seE9HAuOAr8QbcID4SgOQkDNhzaI/up5hHAbskow4yRnlS0trDa+pwIvbOBH8UBHswEA+OqqwVHtSIHfCKgu4RSwDvrGeS61UTpBanQInThUhkGoaOjSj0+Orq+fSUp9ZU0Oy8HJZUodGMknNCj4fB8eLHa6o5UM2s01KCsYPwrgPjK6owFj3YkBmkIKE1TSkXQjehyDuRfvzhFagcXWodrImUd8etrxSzFUoUwysRlus4CVvEt+oosoqUWkkD/bSojqJAoEzyKdbhnXA0PW+DRFogyIlh9EgtPpGcRFXGzfcBFnCUvHz1gBMm4dVa8c6Qt6NUkjj2fMPbNwT6TgtUIY19HHNeBE6FEMnAiEnSWhQsUQbsOzNp1r4x6ZYpxhBTLMA7FMqunGhBqBmM6kE1hEodzMFTBahAV4f4SIlaXb4RK9J8xPPHDf4y3gNriYCn0kqOYC5KLrAVrr0XqDUj3oFoKlakQIKCopnNAZTlnbTeKl1vtnekkBzy4MRYWPb6+xEAjgKYqTxxCuSyx6OMyzlLGvVmg1Eg4kwgjlvNT788Goy9Ozl9Lo9eX+m+88sq7jK9trGXdTtbvmTTRSzZb6V+5/QotNa1U6EqsLYrchU+W51U5DYeHhW5bcEKajYbwlAOZK+JcUkpj+f88fKxMqImb1nzw9pt//c2XirhQJDpNmaQO+fJocPYQVOLzqgSpHHPEcChTEhk3sxTdVNq6vKoiGfoPSmi70aYOs+dr3igEKrIkSYDiQ41x2igRRVVZDUejOHS7SRzH49F4Z2en1HZWlNfXEm/Ct9lf6hqrEVNaaPXw6bNbV69KHkNhYEAcH8rfvCi//PqbeamWe904jvOy2Ds52T89azeza+sb1Nqr16/iTmw4HC0tr3hHfvvJ754/f9FpNV+5ecsZd3FxQTgtlRHAwv3Vxx8vra68cuP600dPOt1et99VRlMhsOGg2JhKwT2bT6YqHKsuktHFePLrTz6WUbKxvqrKcjydG2JzXQ3Hk/ffegMYpo5wKkXUaDZrshKAICpjxpPBP/vLP2fOn58cDc7OpJBGqSLPoyg6G4xGs1me591Wp9lq+XCcWSAkq2bW+t3TZ700+u7tG78cnM2te3l2dmvrCpags7I8HQ5uZU2jjYdBHCG+BLOn9d4AjKnQau7cpw8fX19anSslGdHKDCajXrdNOYsiWRYlk4JyiTMm4olSmno6GU9Wl/uoBlIOUhcgxgDBwuA+4AAR9NhzJVFirBWSWaXH00m308EzSZVVq5nM53NCWa/ZvJiMn+0dvHLzeiyjeWUaDUm8i6XIbKSZPVb6/uHhezeuGVPeWOu/cftPj07Pnu3sTMYTr8rKuTiWzqUKcoLjKGGMJv0OmPqIns4uXu56q5pra1zIZkNUs9nR7u7znRf3Hj16PBh+OpocRkKniY/iRd4vI66mECP1gQto1FBrDE8uCGPGM89JmG9RWOXUOg/UYeEj3IXyzXkXvj+IeHFI+bhsNOqgI+RtLWp36GpA9ERQB+oWTmLgsIb7KzzcMPwGwxcY4TD/E4KHO9rqCF526D2stcxR5zNKO5xfWF5c2mow6TdcpaHIgP5PaLiTw4tlsBtFSzSU9Qil8MjxBSydW+TLYWDFJWwXgRyUXuY3Ei7Eo6Oj721vJ9RuRdETzgvYuMJyG/TtlO7vvVx7d+WcslvNlhwNOITWQ/oq4bU/mRrQQENAAEpvuQVXBpeREYI4U3OQau0UkpBBu+7ot7nxCx8VrQOuwBFy6RImFsYdgETB+fWCREkXfyl8OKj0go+JCtmAaaSubVs1A8STenpdy6dBmB46Uul8lCQmTZ2Mqkofnx5FscRgiDruwJjVNFliNBHiwXR6MJtGWSpwg3uZqkg9NpF43YAuLpzcDAXu+DLJpf/Z1w0AcRhAADIuW48Tw5EFO5YFLhUuDBBBOXR8hyvNeSu94OG2t8Y5XEJLGVNaw5nDN8EWgDH462gNjiC8ljBqF8pzwKzCk7X2sYUyAu1TXEa/nM2/ePToggOanbCp0Xo61t7xcKASWIeEC8AAiobD9JyAUw3p5MpYvsgMRoOaDX8XNebc1dlW4W2JJC0T940xT46Of/X85dVf/M3raytvvP7K9q1bGzeudddWSBKHy0lbopTVWhAa4VyBR8Q6bTQnhvEkfHDaMCDsEKVhi8BsUf7m4cOv9vYN40tM/OSdd7vN9ouTcx5lBKsf5w3GPTno8DwtKw2CKcACeBuHLjaUGq0shTKrYjyaT2eYB+JguZ+moqhyCVRLzrnRFavZ1+Ex4cMTwGB9MpvmRumV/nLEpSfk+e4L7WxRloKLJE2U0lmcttsto03aSLiMnj17nmZpb6kfeikQj0MAWPiyHzx+dnx20e31hBRzwFxPq2o4HL335puU+PX19TRLvXez2bzZalLKf/m3H52cnna7nes3rnlGpvOpiDmeh6qsHu/vP3j67F/983+uyjIv5m+++QaPhCmNpOhi9VYrEM2x+XQ2G48d8WncHM0mv/7kd4SJzY3NWZ5rpaHe8qfDkWdsudczVcU5t941ms04S1x4G54zXijd6C69ubGhZ/PZeDQ6O3HGeirm81m4aBybTCfn43GlVL/TybIm5cK44nwwkJEcVfn9ly/+3p1rS7HY7C8dD2aH49G0KPpSeMHyqjq9uHjl+g2ohiDlgoabjMuoLDXO7mdFYZ2dlOVxPLlmqn6cWmcm47EFuzyKR413la48ST0Mray1nIvJdGqNQye5rpRLbWiVgFxXpw7AbsUaZ60Ofyx0FBaYnVGhTEP7OBNGKRjM0dXlpePT8yyO5lE0zvPhZMQlH06ny80M6a0RY5rZitNPHj987c6N5e2to8ePo6x163t3r7796nwyrea5Lspw3aVZeIdpLNNYMBEOIcmpYExEoVC2RM8mo72Ds53dw929F2cXX48m3xSzC85Upy1FRIgrAY0CJIPw35IzdAZDLriji/hQcpm4RxgIg4ir3cAELA0MwbaW1ECP0PYqg24vAtJQEFCBiCqc2dgcO+oZ8kCcC588Jh9ihAxi9SnH0w87OTzJAcUM+i/MqoHnnKUOU9iYw/GzsRAiTjtU3Gp15Hx8ptScEBXuTxzkAtvAMld3ia4+kDw02YwTi5kGDsXhoITAQHfEQ3kEg+H+V8ApiR5x3CaCdTc8rqSUh3n+dDL6TqPZrOxykp7nOeECrjdLPYvj5OTkqChyLoVKMpkksioVJZx4aCo8rMrhJvQLSkadVOWUVmkc0ygh8xw+K+trLqevkcXYCmO0fy3VWoQi4b7TE7HAVmLogkfhLMY/sHpSv+iJEU12+W8oFWkSDm6t6CK0FltmnCdz8JsKQmGY7iUjsXZytTOUPMrSg9OjIs877Tbm1wPZg0XOXmm2pAst1L0XO3PGUo9fD2ZfGNhOcyw2vCeQ9OKMUUASxQ/IoJMOc7pq/QyQ7hjnmMkBkmQeHqyWElQnuLrmQOfXgsCJ8RYwIQkXFcqzwj2PuR+G1MAtDEKCzwuH+JinhYedQ+sS0gRJjV/Fqgem4BDI68MpzMacT4FSDdt1PyVkakoU4oAMn8F+BsYM4Oy10JwykINZSyQmbUJDCQWKhf1IqEmNNaGPclAyE69hcE2Y5JmYptkjq58Pxj/7+Ydrf/PbG93urZWl6xur69vrzaWlbq8Xddu1DMA5YjUQ/CWxPLTuxuJ2AD/j6Wi4t/vyycHRy/G03WisZelbN27dfuvNX3/95WSWy2bMnGUQvMjBk+c9Nc5UVntbiwu0qYSUwPj07UYmOLE6PIWVNUrrJIpCYcIFF35e5trabpYSz6BwJwxLWg46diZLW3IRlVV1PhozIRrNTEhxdHR8dHzshRiMx0vdvhC8KMvl1SUpZKlLKcXZ+fDs9PzNN16HIxd3aVRZzXm0u7e/u3/UaLRkHE3z8uzivDLV2XTWbLa2l5apd9duXrPOlhDq7j358MOPjs/P+73etc1NSdl8XsRJ7KAWGw7PDk9OPn5wv93vvX77lf2Xu41Ws7fUs9qEv+vowqpPkySdjcfTydhYm6SN4Wzyy9/8hhBy/cqNosjLopBR5AiZKvV4d+eVmzfSNPWVAjGUabZblHOvNWWs1FrE6cr6+sXRocvn44tBNS+4kLNqWpRF1mxcXJzP8nz38OjW1mZvqSOT2Fs7GY/ms1mz1/vb331Cnb19bdtW5dX1tceHJ+N8fjoc9NbWcIV4cnYODCwCzgdwCUJ042g6Rjf8NC8JISu9zmg+PZ+O21EkuJhPZ6bSsZThSwf9bVFV4fKASSn1REbRvJjmRZGlsRDSWDjcMekXC11Sh35S7zgTgnJjVSR4BbYr4/xknscyAr0pDbVFqzOJ5ago0iguqulsVmTN9mg0Mb6G9AkpLfHa+4O8enp88p03b1+5+/rR02fmpe9dudZaTztpTGUMB74DtKLHGbilDMCSLp+X+vSs2N8/OTx8dnT8cDDcyctjYwbOqjT2ItbWWGe0d4wLh4xHQAdYCOgFrBBHMAhSsqjnKMyyAMu6zKtHqg+cT5gf48C/yhJVtZkvLC1ZqHM1/AJgJrsFaUAgLth968REAj2okZ3lxsRM5MRrjqmBHKJj7ML8ghBQQECHA1VCM1enBmKnHnMeWbcsxCvNRkr9iyof6LIOFyLUhqe0x6YcHWhwCoQ60BLmjWcY0IYQKoyEwjQd+nda3jozFkpkVkfHUvRnQdVMCReUzYX45uj43Vdfo8RsZdn+bD7j2ByGkyCSYjSdn5yfXVnfHFVVt9VN8kMleGh7UEEMUwMgjeGYHlW04aI3xvg4EVFqypKABI4AjxNVOmSx0L0kULqasAj6sYXQXVByGUKxCONBtsPlMVIr4y25lD5RoIWISCaRMToUnpigUNuFYaEL/wCUJccBxCGcTwRjreaI8yQSe3svwVyEqjgGpivXE3JdSsnksdXPL87AnoTypvCpCtzt48sAXT7BOS8UA/AmDAJjUF6/IGESoy2nzBkL8QIcaG3u2x0JrOUhAqiet0BGAgy5wiUKemnwhzkMKfSL+D8Yx2ito0jWWQ/IeIa5jXMGjX1gk/eaGOooE9CFos4AjG42nEn1n3EQFIwZg8QToIEIVHUvJPah5PXeh5NP0DpCkXoBk3MQWXhSg2YxsM1qR2qSZWiGfW1gXzj6NFS6UiSCkyjJDqweFvk3z8aN3Z2U0H4cb7TaNzfWl7vtzc2Ndr9Poog1UuT0UBoKyfzsdDYcTwbjnb2D8/EkS+XaUvfVzfUsSdO0mS0v5br6emeXRymMsyzxLoJlD4i0aWkUpFIza2zCaKfRmOnw2TWTOIul1ooxUWo9LwsghfDQLjmTZY2z4ZhJTrnA+00yCeNIKqKIMqbDZemyLL44HVaq6ve7SPx/vrvDCJsqNc3zG1tXgO3pG81GpZWQgnFxdLK3srzCIbYsjoW3QFcV/HQwfPD4aRwnWZblhTq5OFe64rE8PD753tt3jVLb25tZFBXFHL5w8cmnn56PRu1We2ttjTM6n0y5FOHqFXJnd/fFiz2byP2Dgz/7h3+slZrN86vXr0FmLSgSYLCnrU3jpCyK2WzmHImTdJbnv/zoIyrE9e2t+Xw6L4pYxoyzypiHey+OR4PfW/k+I9RQYUw4C7NmE8O9KXh3VjY3Z5ORms+r8SQfzwWTVusCBr/W+ovZ7NnJ6eHpyftvvtFoNKVkWqmz0zNGSW7t7x4+vr3R77eyajbtdptr/c75dLZ3dnprY00QKmR0fH5eqioUeeFRbWqKr/WVUsgTG84nnNo72xu/+uKb4WSSN9stGRfzYl4UaRLhxIkQlqtKW5vw8GAhhCRSKusm+TzLIil5UWoAiXgT+jBE8aGkCJ9RTHBKJQdcEcOggUKVo2LWTpOICUuMqorVlf7kxctI8DiOprN5t9dh1A6mk6U0i8ENGVFqGVcivvds5727r+lYREu9n/3sr9//8d9/5a03VVHqSsskps6B1lZT7c10WuX5ZDK5uBicDoa7R0eHk8lZPj9XakpYHnGdpgYCWlS4I0F3aWCwguIajC/0i9gUkMRaC5qPGsCBCUXhwc8BtQOcLAekeKjp4XwNbaMpPhCNf/LaW//H468eQmYZGBQc7IDrywF3cyitMs6CzJOE8x8Mr+vGftDspBH/+WT80sOszuEvr48JVnt/gMQQ7j5Tz4ApMdZKyEpAYGKv0dxs9lVVtT2RjljJNdQLQkYeN2KwsKCcIK0Z+QpousOcOkCUMLLw14IKGyIirA1VAXHcXzbtDBP60C4L/xBOMSnFwWBwovWSlMvGLEViCj/TW4KIsEhEe3svtzc3h4z1smZK+RzovNwTEX63g4A9xGM4ZIL4UAaGp5nSVRQLIqVTFUbYkUVYFKbJww6d1TK3RS5BnVznMZUOIYl1JD+5pFbiemABmiDwrTtac5ZgPhGlVHBdFK5mmTrEMGKgPAkXCjIfKPdUMsqdj5qpimIfZbPZ/OL0DIUVdWhXuOL0ejNuOyPixv3z0wuVR1mTI0GKoXCMMcYd5j0hJdTWpDJUAFLYeXAmIeLeIdjKWA1TStjygsdAMF4zUwC0CwEjDIwetXrTGsMRQoTXGeMw3QLAB6pRgZvjrVNAm0TUhyXGWyeY8AueGq1ZaoZ6GgluwsuFH7nI+fTGo74GRrIcX/9lJhJe9ACQqnnljAtcCCFezlPHGXWeQdopGn/DZeFrBgikS3hQ8dcXM5EgnsTdOOaTgJ4wdO8V9VqIikYiScbOC+uPK/OiPL93epo634zEerfby9KVdmO13UYsQCgwh4NiNp0W6nQ8e/XuO995/zvSqsnJsfW+0enEK717R0fPTs94s+1dqOBToDMqo7wPHRKobbh3NjLq2trm6XRGnW03skYaW6Od84bYoiwhUxUSKKyNuIijeJLP2t0uqtM5p9ZaDRP48NV7r3RlndPWTKdzDnLlOIl29/YuLgbNRvP85Jww3soaSlVZHLeaTettHCeD4aisqo2NjXmRL3d61jmjdSieKvfVvQeV0t12OAVPLy6MsUkjfX5ynKWN7ZVVotXm5mYJiiQuok9/9/n5YJim6fbGRhIleT4VXLrwFfmHDx8+e7nX7/ef7r9kXLxz59Xzs7Mki1dXlhbTGgasbBMlqdJmOBwqpSWX43nxt7/5SEp5dXsrnxeT6TxNEymlcebJwcG93Rdp1ry6um61hjQbkjWaaRYTE7oW7Wx7ZZnHspqMbalOT05D4ei0UkZb32zEZ4Ph6WT8yaMHS+2s3+vIKCKejCbj8XjabLY+3dk5mU3/wd/7QeKJ8pRbd2ttdXf/5PD8bFxUK1mDUTaZz8pCLbBn1IUr21eV0nkZy6g0djAZRVJsL/cbUXQ6Hl/tr7SjVKtqOpklaZ/Wg1A6yQttnUaAIrBEGOOT8Xyt34eqSEOVS5QBeR301hBujbSkUCUXxmoDK3bvhRBGmaosrRQWYKhKm+WlXrfVPBlNQqNcaeZcN81ms5kkbqXTZo5IziprozQ+Go6OB8PVjZXl26+tP3j23/x3/8Pf/8M//On33r919Up5cnR6eJRP56NpfnB+PhxPpkURPrEynxpbCJlLUUqhs8yS0CdXRitCNOMaxqogs61bBwQ+QNntEHe8GNvVz95L96cD6S9wSWk9A4Bmy9rQVYI0nKR59Y9fu/tO0vpfy5IL4RHf73GkXKOUYfAGJwqBtDywXqF6menqneWVP2h098tpjPZFTpBRRUGOyuodJ4L2UKqAI0MUYPna/xoKJaKVlZT0ZbIiooaqtAttnLbgBYEnG5Kn6qkhiELAHYwzcF9HUYB0C6ggnlxabBmuJCH+D3pih+pNTNshkLUOb1QwPjH5/bPzP9jaziq1njX2xhPL8bMIf0JGcji4mExHjSjTiY6yhBc5QCyoJEx4a/B8IjXlwjMU/YSLD2WnQsZKKUEhtgS+XQ4llUVqCZ6qrP7EXD1wrsU5YrEkpf4yr7/e6IYCi9a5TKSOj4PDFtBcXMaZ8eFOqP+aX0QXgpaN1YwuJmCAzp2PvWftzojwOMsePXlgnM5EAmcvzthdg7i1tCE9NZx+eXxkWZTSOqMElvPMoeMK45bgZLTWAUSl3sZD7cDxY8UkS28danNAsVHHDFKKafy1fh1H4BZ8dvBTqJTSGcNCj1kPVuqFMsiGBGcWTH4QwE6ljOsgMEwiQmOb9TEXlFMALSBEg4uIg9kNzewO0Ly4bAFip0PPCV4YHmlf4ZzDrwYmNjWjFTAxsLc2UBNyV5fMDjiii0BvgrtmVg9tcBjgrGAs1C3hD4fXJXkoS6kAuV195BNDmJPUxLwiyYXWkjKh9e540p1M2kd2rdHoZq1+u9GIRNxM4zSis9n3f+9HS9tXzTSv8nI0nrc3V2W/7QT//OFDxaWwjjnfyGLBmYb2XGkFgNnQttqifHV9TURyPJ/3ur0sTkOrAFsnUynOGRcCPDvEh5MyK7SezGedXhfRnlgCAc8DiSW+rKooTsaz2byomlnSbDSKSu08fwFOJ3d2MRQykpxppZvdNtTa4RFycXreabbCvQQBk5VSoSUV8sHDx4PhuN/taGtOLs6UNWmcza19trf3Jz/6sS3L9dWVOJKVqmQU37v/cDgcJzLqtVqREPPZlDNY2kn5xf0Hz/f2l1dXlLPP919+8O53MimOTifL6ytCcGgcOXFUmwr062QymShlRBTPi/LXH38Sx+nG+tpsMpvluZAS8ML2ycH+vb0X06q6emW7nYaSQgqpnUuyjFFiYLMuG81Wb2k2HLpCnR6dhOPdKcLYeDqNoiQvyv2zk53jw+Pz4bs/eL+ZREmSlGVxenxKrdeR/PDLL66v9q+sLds8T+JY6Wprpb+50n9+eLp/dr56s+m9n1dlrhXkalN0HBhrBoMLq1WWdo4m5+N8fm19uZvFm0vtZ8cXh4PBWr/vtZ/NZkv9Lq1zM/3YVLOqakQp8UTK2FkTi2g6ndrKoB/aacs4t1rXXhYP6gxaa3UjGZ+dnDhvVzpdaAR8HEdWmyLXNCFcUqVtWVSrve75aCQYKykp8mKt1z+5GFbGTvOi12wIzbIoUtbmlN57trtx7aqj/Pu//9Nf3Hvyf/3iw1/+7rP3b956c22rPDs7OD55MRyfUTqirhTSRdJnTQpsDeudgvQUC3h3zahyEOzHKNgl3aVpFdH54TFo4UnHL8mQDsJpnLeYA2iRHAB2AWcR1CwuF8WhyqbObkXZzfWNZ2dnR0aTOCLOam0IhzxTyK4AJg+uKMFFwvCJAo0mDIWHVfmZGT8oRqdaCRlDkAhdRLTCHJt4SQCdSyyvoUyEw1UOicSkjkSVYlTOJvNpI4o3s3a/KnJvHGS+OVrT9WHq7WF0ByFPFLhHPJyrFhokDPCCls8ShPhi2B2okuEAt4A3ByoTpeiOIShhgj6IcU5kcu/k5Edbm8LTlaTRHE/HxJFF2CBn3Hp3eHj82p3XxiVd7nSjeRG+MljfooKYAZcwfDrW1W8QNMwQ8exZEtGcekjBXwh02SKXsO5865kycD1xZ0cXIb+LsTZu+9GnRC6D3B1aTD1ByiMwwzzk76SxtWTR5zm0d8G6HyL6CW5/HYd+TxDXEMI0m3kUeW8PDvZlJBgVsJvGOCzTF7wrIhpne/lsbzyMZBRqNI4NOQwWGMjCwcRlAMOBsnW0yeKCGzBm1nmN8Gx82QvjOii96r0Hwi3wgyWe6NBNQv/EEYbNgf+6cH0JeLjDeoZgKxMaa5ieWK0A5GAQZApCaAd3Srgf2KKs0Ri6hkcplm2IoSHewrAChIWW1RHHuAGoRwMMJA6W4vcHVR+kGkguYOhsORShFAbRaI6rgy0tKAq9rXfP4bRi9bBPMJAq1T54DRWnoV4TbwhV3mriDCHKecelEmIaRcdR9CyKvxDxz/Lq352e/S9Pn//PDx7+j7/+6N/+7rPGzVtLd26XJnyMp8eHab/f3Nwgkdw7PnuyfyiiiBLSTGMJRL0qPAS1Q4MYpSqfXuk037h58+DoqNVqpRHH2CdCwuNSW4WIacapsSpL0jiWOlQePIsTDtRYGNZRQgAET53SobMTXE6mM1h+izSJDw8O5kXBRWglp/OikaTUEWNtkqVGa+LJdD5TZdnqtIoiT5JUO2uM4zzaPz579GwnbWaE0rPBQFmbxKlI4o+ePGp3OlfWVh2xW1sbWlfO2ee7O2dnZ1JG7U6r1WxUqoTvlxjGfvPllw93d1dXVxpp9vz4sFL6+2/fnY2njLLl5eXwmDaWeaJNhQ/T8Wg0n8yYkNM8/+i3H0eRvHZlK5/n0zznQiRxJGLxaH//8+c7g6KsrF1fXaW1A4TBXD1D74olfml1PTSVeXV6cDifjnloZvh4litj4yQajMejsnyw+6LbzHpZK44THvHxaDg6GzRbzYcHey/Oz39497VYUM+84DQOv53fvrrpKNk9PTRwyJWVLqqKC4HjQnDbu6IsiKCOsFE5V6pa7XepVTc315zzZ7PppCpELMfTaT4vwB7vPSNT6y7mUyaY0wjTspEURV7kqhKSY6PIQCULwabYTSByDm4/TngiKqsg6hq8mJxSSecqV1Yhyacoy1az3Wu3OPWJjPNCee+6zZRTmlelNlYImXIRUWaE/OrR4+lk7oRMr2z/+R/8eKOTnUfpf9p5+d9/9NHPjk8uOi232nf9Nmm3aSP2gnvBFSEV8SXxioSSyoQyKDwRPBeokIHtT3hvCA62NS6XQCFRh6EDfgBsHcjGXzwO/EIuwRb0pPCmF3RD57z6f4l60xhL0+s87F2/7d5bt/aqru6uXqenu2d6mZ6ehTPDmSGHpLjFsijbTEw7diz/iA1ByI8A+RkggZMgyJ/AgR1AQRIpTiQhiRDIIkVK4nCZfel97+qtuqtrv/u93/ZuwXvOd5vEALSpqVu3vuU95zznWYi7Puz9fP1xFoTAdyKQbgTcq/H4CN73CJPiIo8wcGQy1ioZXkzzP+3tfmp0GgTICnKYmW8wZ92Phq6KLUC0dZz56lCJhCtqVzrtL4IxtTBeCOJ5EUbOF7OQi5AKTmjgT1uHrOgqrx6ZJrhfqEirVSB3ZdxFxxZPVR575cuIyUBAuKlaiopxTC11jgfB5nD4qNejUdQkZE8UEPQCJlWiexBEG9vb1tmBlKo2WeeCOSuok1DROOYmVqYatKLF2WrX6TuhIKLARqLMskpShAcYhMvhcrZSNFVe2VVG/bMCzAHUh+BjoExajjW5sryC2QsffZgDqQgiyjjAKpiCC4MYRdMS/6+JKtfJf2YAa+laPcm5NEnY7XeG3X4gq8DqKvDB0aWkMeEcTaJLWxulNYA4UiTfcea4n6V95+FfI2I5Q/mUb28EhRhHxi34VsHilDMKJgx+euKY/OT/XxwXYlYwCdgP6IqtATEvs9r62ghYh6CCoXkH7Ea0M37eBeoxYxVcgGnHsLogfqoGkxDfBsK4mSlVWrR8A8NbwBb9FwNNHjy6vtoKJgRU+2o36zC+AkTcfjIW1SYfk19g/4JpItb56skJHy/wqWRUUqZQheKI9D0DYzAjgrwK/Krss9QTTEoQqC2Eqdc/Qcr6N8dw/82V8Y1J6VymrXJOUV44qoRQYVQmcVlPumX53N69v/97/+zs668rbaIkGoz6wUxz6sRh0qhTKa+s3O/D25QEMuQi4MI6MkjTAsB3dIysO/p3X/vKbqedOVuPQ0DQxwp8SrgMsJeyShutalHMKM+1skZJzh10L77/4IwzGgSB4KwsNKiUba/XZ5wnSaK0WtvcCKNIGT0qc01soz6hrGWCxbUEQHgyGAyCJHGMCimCUOZFZqkbqfL23buBDDjj2/3WqMjCIAyT+Pra6sPd3VdefNEWRaNejyKhtc4LtbvbIYQltXhmagb8N5lhpCTukytXVtfXl/cuNZJkmKdXHj4+efi5hXqj3+vFcRyFodOGVUJzf6OzNBt2B8aRfjr64sKFQIrDB5fTbJjlGZ7HVIo7T59eevBgN0tHZckImWtOGn9ZrDFWBCxJIsLAKjVuOMrKPE0Hw27H97WFKjOtWoOeDMUgy4aq2B70dga96YlkIo7jILLatttd/9hx/uHFS0vzMyf27VVZAb7llkvqtN6/MDM71Vjf3e1lOZf+AVNlCTIiGGIAOMvTQghJBd/u9AR189PTZVbOTU81GrXt/qDdHwkR5XnR6/eBE8EcJblSO8OBEUwj/gYevITS/mgoAinBmhQGRCIErwzKKFA7UM8Dhnjtfr/UVvm+yhldwZxZofzbSWyR59SRpdm5WAQh546TYZZOxWE9FISQwSg1cOxGQjTiOFfm+p0VEUelNafe/MqZI4dreS4bcTlRWymLD7d3rqXZ06IYEpdZkjubW5MTU1JrKPMHh+CO88IRBak4Gl3t/HuPnrBVWivii/6o4ZDzB473WIQMzBO2ylPhxFFjoGsGCQaFYZo6J8BqiEi2HrD//sbnf5m2VAB+x5yR36y7KpauQVdThx6SbuxA7Ht346ySfCSlEwLiGUnlH+EvbOXDDOokCaCbb/WM0cCWIYIKNCqWgkH8GqVMSi6ZUhOMT1PWpCz2Zx2kHzrif9BUTCckHMEEyCW6fQENBloEVpV+wAZAnUyNQZyeEcIh+dIaqiorYhjZABRhHMNt/Nhtb+5s2ygIjNoTxYG1oFe3KEYJAjEc9NvdjgnCUoq4njBChT9CqQRqHqeYG+/YM6SYAWuMcKW0n5nCEG8milL9EEtt1Yxa+gwkHltrILsKBWCkisqvaIUA7DA6vmv4H+QDW8yJ9D/Ew8hZp7TC0szG2Q0gIcM8BKDkAQbKnZWM2YmJEWEiCNfWnsC2QaCzC4ib7ASli3GccN5T+uZ2i0HMlXtm7gycHXSDxnbQYBuJfhDg003AGY9BXiVo2jQg7nA1oGqiExZCCfA7NamQBA5ebw6XKJgcUi1dqy4a5MoEqjR8ZVi/4ioFn05buYlVBHPnZ1nhCx/oFCXlCIwb/0mcCxlwIQ0ZBwQRNBb090taMiuDqSBkFUbhqyYB9r4jxMAYTTloIUG4jh6Y2pd068dF9KQEv3ODgdJg/wGLbMHgV6BJsvE3lRsCVwETIImfiTW8X44wDZlcRDCLJAJoASgHXyHk97Va7x469Pv/9J/sP3QEAZb3P/viZ599PnXkEJ2a5BON3W7/3tMnQRw1ZFCDmNNCm+3+oNSGVCnFNN3d+s75c82p5t0nq43JKYJXFhr20igIaGTgnmmyHDhHDlUmVluDjjMWvyTy3cDfQykVhmFWFGlWBFyGYbi72xmlORciLfICVixJJPMsF3CEQWBSmY/SWi0pslxKCbdFCC5X7t8fDIeNeq0/GAzTvF5vsDD69P69X9y7d3Rubv/0rCqK5uSELhWxZHNzK8tzKcVks0lAve7vnZSfXrn8ZH396MFDtSje6vd+dulSJ8vOv3CyGA6NUpONOrr4WqthMPKP+WiYDtO0Pxh+8cWXoZRHDh9Ks3Q0GlFKAiHDJLn+6NHnd+9uZCPi3PTMVF3KhckJq3wrqXUeShnK0PgTiTaaTZXnxWC0/vgJ4dTPZIxvt9uSCyZlZ9RvZ+nlO7fiMGzEtalmM5B80O93Wt2kXr+zsfFw7ekb517wd0Prer2+d99+fDBroTy6bynVZrPXAcsFUhSFUQbzFZyzg+GgyPJIBNrqR1s7M5PNRhwoo2MpDyzM5UW+3e1gXMzQ1zyDU4FxbrXbHRU5EH0kJWDkxMUwzX17DI5Rfnzy86RA83QppdY6CiQn1Ggdx8mT3d2+04bYUhVgpGgYZ6XWo6JwvjMue4P+RJJMRIlkVHBhS0NL3QjiRhArqwfZiAsRSRFxHtYal6/dHLR3fbGZqH/vt9473ojLPM+dK+IoT+IBYznnpS8cwgmuCDVcGMYNZ0bQwllFtD+/fXvBUOkLcgpmxofbOBEJQGCKAyHFGAbQZpixCx4k9Iwz82211/XHW0zJfBwmYG9QctaVfBhKRWjuyEiZEj0ioOcemzFbjGyDi8wwdh60I+MtHMMXHuoYoLUw9fhDG7sfpQ1O4eDGg6P7OCAWPoED31TlKWdsdnbh+J69Jyam9oqwyWno/H0VHGc2ir7I+AUNuH+iIGosgx0HAkEQIVj6USqrMB74/RZWVP4Xop3Ls1BCh7C8cf58l+GdVrurCsHoZBhMCg5yE46sKXiS6ObGBg/liDPamAhg4OMQmI+YIkO9G46wY8E2MHwLa7SQAUqYsQWAsu+qu4UBE2AUOk5E/I1guEI3AMOF1VzFscKC6iCgiIAPxJiMB+IAHoYQXQJEXeLGzpVQA+GCcuqEL2u+xQD/tiCv1fKQa622NjaDQLCq+8AwTLMnCCaF4GH4qNvZylIELeGB4FBDQLFDq8QF1HhR9AYDboIvtxQVupCgABkTAIpY4mggJGDC3A+g49sLjkrY2fjnEmKIfH8D5coPvKBn57RKuSfYDvrvAmIzmM6NgV6VjS1QKt8PLPMI8QOaBFp4CCgk6Dzip0+gjOL3hRcNwEND/TFs0KimIk5VbuscG0VfMBBnBus4oFNw4F9hhcZ8b9yoQSqTAA8v3LxQzhG8Yf69thjiRRRM6igSsJQqSxS8oxa8h7BCgxTCaaudYNwZurX5vRdP/st/9A+bM7N5WX5049p/9Ud//Kc/+cne48+H+/e75iQV/Pq9e/28bMbxBBc1Lvwk1OuWzlEwJ7GMt3c2jy/Of+211z66fiNFrMx/OQFNvb8gyhhV+rFBw5/SrNch7ZimRekIDQDbgKWARu0+CL4o7EFFfzQkjsRRZK1d39lxTGRFmamyOxw6YsJAWmvDIISUAjcY9AlGHPoCLIqyYIJv7uyurj5pNifTLMvStFlvOCk+uHXjs9VHgpBzh45KQEMmanVC6frW9sb2FqdsenoaaNh+8Jdx9MXVKxsb28eOHImT6MHW5l9duHCn2z26ML80PZUORwGXE/Wag9R0Z21ZFJywUT/d2toeDdMvP/8ylsHhQwdVWYxGI1RPhrXoztOnX96/t5kN+3nxzvnT0tnJRm22MYG7/7JQSVILuFR5EUUJZUQV+cN7dw2siwpdFn5icdNTk8NRagW/fPdOe5g242S63pycmCTE7Wxt+mNUsF9e+HLvwvSxxdkiS7VRs4sLp146izaE1JpjexcDRh5vbkJOOklHKWU0jmNrrVZ6OBjALsr1R8Onu1uHl5cCYPsEnC7PTXHONrud1BjKea4UHOgsL5VhdDtN22nqKC2twkUR53yUZsQRwYQjVBnljJFcIBRpnc2KopqBCamFQU7ZrY2NMIlLpY3WXAgk0w6zLCu1CIP2oEcIXZieYv4U5zUpFrigo7QehRJiK4mfqkVAaRIlw6y4fumqCESe58svnX3j7Jk9yuWlSo0urNaMaM4KPwHr3FjNmSZUO1oSW2KgrOMORAeWOkPR6dEqAMNhkKjWZyC7saiIRQkpRf8DSrlk6O3l0DD4Wdiow7hMJ4SoeLYI9cGQUFg7VErBYaUrpyQsrr53p5XpMDCaGTrZg1kCCivAyU9j2IFFwadwRlddAnxb9OcgjFXiWApgIUFeLNHav7aBCMIgiCfq81OT5/YeOFGfmCKkDk52HKwSSQWtV5pZBtlQSmlY7XMw97Yo/sFvD8In/4sFF8hRgn+HPHPE8mc4DKtg/mX95YVCIgLZLvLH7RaLopjRxTCkKGimVYR7GAbbOzuFLnMhiqRRk6iZJMgMZwT5twwxdgYiLqCa+VfJf2Ep0VGYVU0OSJd/AzaSMckZmMxAqEYjpvG/RKvqaiuy91j2WxlajCMlMZZKBoSLEnkQrsozpJWTFuGOcX9QCOmoADm2sKQWJwMmRa3eau2maRoEnFbiGmDiErc3iWNC8zC8sf7UEisq11D6jHiFSAVjTELGEVLKOOMSEnBw61TRrKrMSMAnqUHnEMlFIANOmCQ0EMIh64/jthpsWTR8Bqs2LBCLZMnYXpXhtancmwC7YBXbE282YMZE+6HDCt+PCbz3duztgVFOVW6Ihdw1bH6BTFHF1ztnOW8VZdcoBDuwmYDKZOkYyWAOYB+KeWS+IknB0VlNBJJWAfIQPogbJeEfG1OVXH/VbGUQBjIo6GxKSHAtCdhBEaYt0Y4a6E39jzGCPmF+fDdadnZ/72tf+71//I8LSn/58af/3R/+4f/wJ39yd2vrpVMvvv7O27qWiDDobWys3H/QSGoTlNZlwITY6nZyyDcF7wzZ6rbZKP3ht7+/1WrfWF0Na3UU4ZDK+9i3DllR+j6PkSwrkihEF1znXKlNEgaR4CjrdsCMQA8Wf8jD4qrX70kpozDIStXtDRgXvVGaadUZjWQQBZRb45I4YZSVpRqNMhEIcOfgcRhppYoiv31nRcjQWjscDSanm0awn1+5dGNnK2R0qVY7sLhQZFk9SUIpu53+k41Na12jXuOca6eV1jyJv7hyZfXJkxPHjyW12pWHD3964UKnyGaEOLl3b0h5Wago8oNomRf+9FJGUN5tdZ48eVyq8sbNW41a/eihQ0brdq+ntKacJc3m1UcPPrl9YzvL+ln5nfNnju5bWNvcWZpbrDHhfGWygslGvVHqnBASJkmZZuv3HxWjlAmmjaVSrG+uJbVEaSUC+Whn+/KdlbmZGU7ZVK0uCU17o8GgnzRqt9fWVp+uvfHyiwxGaRGK5cMHpmanJ2cmwfDUTNfCpbmp9Z2dVKkwjLQxWmvBJSoBszSVfmQSq1ubzuq987POKM6YVsVss9as17a7vdZwSAkrlUbDe2211doS8mhzwzGalwXlEEUghCqUKkuBcd1aY0YqIvaQGllKLh2wUiPO6/XGlUerG8NRWKtnRV6Ce7F1lgnRT9MCfELave5ko1aPYi6YzfOXDhw4UK+xvKjJMCQ8H4yEtSHjktjZyeb1a7c2HzyKHdVav/rOV99YnJvSGpxmiSauJLQkJCO2oKSgyJywmSbKMUOlBkta6GUhw5tXxnqVpyS4Slv8Qwj+WQ79lR3m8+M2EZhK/r85oQKouFA7MBF8ZPRuXoysRl0DWgpqCPBz1ShWTSzAN0QJ7zg/CFPg4DjCRRUcEq7SyRBQ3IDolkvhzzDlTwU/VjDcXBHlqvz8MXUZkF8hDFomccFCzifipanJ07PzS0GUEBvB34AyTg4KDUKchvxKDuwZpItCrALHjTcqtirAXBlcK1jEKJ0zCus+SJEsGPJUw+RYRgtA6O3NrVxKadxSEIdkDH5DoI+QIs3SVruto6AfhHGUMDBbFJCYjkmzGFePubm+L7QWGEpEaf8AsyAy48xeTMCgmH+Bgi1meTXuQp5mBTb7w9wS8ptR2d8bW8GwGElfCYqxNgHELaMIWOauCliuMITKO4ARW306QL8SpKsyaYyIpDLY2NigAIdWqyxGqTETgs8FQczYbq5WOq1AClpZzRkcETF8DJ9A9xs1lfN1TBlHHccFgbYMPXDhmguEgBnE41cenAgpw9RIqIVyY4FqT8BhCfyZKakSQCs3VA5UAbgXAGajOJ1x0A4L+GqsklBbBKCBEMVolo2MVeAQQ4UQYBwLe2r4eqDGqyAAlNExzFxk4Hw21m0TozU0wmBZ6VDqhTFkDL8LGTce1NdaDoGJlkCTCC8/SjVggc3hdXSYmkI48OBIJR2AqZdZMM52nGrnCmsNYbYq2CBcMjZqt//ld77723/3B59+duFf/et/+69//OMvBqmOk1OTzbfefDNYPqAFp848XFnhzs0E0XwYCU4ft9v9sjAGLM4pHxblaHPjR9/53r7lg7/+/IuSUS5D8DTQvlun/mgbZKO8UP4QAYyoUW9o1FAymumiUYtmkriEcGWcflA4NsxSiEE1xagALp3o9gYGlgS9NJdBNEqLKEwYxAPA9GyKvNClCoQgSodSqrwUMny0+rjXH9TqtV6nU2/URkb99YWLK93u/snmXBwuzy004tgo1Wg0lDFrG5tplsdhHEahccYqK8PgkwuX7ty7f+L5Y0EcfXzt6s+uXkvq8W+99nIzkAcXFkxZUurqtTp46hqjtHAsH2arq49Lra/fvEMIPfbcYcpcu9Mpi9JZF9ca1+/f/+zO7d28SIvi22dOfvXU82tPNy0hB5f2EGsoBB5IyaI4SNMibkxwwVprG+2NrZAHZa6E5F0/mLIkiUutCmc+uHAhCsSemclC6/mpSWZ1t9cjjpeO/PWXF44eWDq2tKCKUmm9uGdpbn7REHLw8GGEVgLGjx08OBxlvSxNosB/ntYBeKoWeZFnOVBXxa2HjxYmG81aAuHKwllbD+We6Wbu3Fa3QzjTxndZgvPSD2x2Oqk93NxKjbPaMeAjCk6tNXleiMC/TGWp0ChNG8PB5LUo8ygO4AVW3JFmnIwI+dub17oqF2GYpqlxBqkv2rrNVktZN0gza/RMs8mcHag8Z/TtF16Ih6koivlGbYIRUqQ1wWLmT2FlyEc//7UpS10WU8v73nrnjTcmJybKvAQHKYNm7kyA4x7XjGlY4hDCNAwBlgkIzwQPRUtNNdBYdFSCzY7AaUxyRN0NrrZgR8WqZEDAAbEMUdwSckz7JH7mBqqS4cIQ3xNY1KEQtA1GjJigCBPeMmO1rmQglYE8LhcdmuYiqgfHTOV+aIzV6M5LiSHmGZDKCBVYmPBARscBg0wq2836O/3OMB2xMAijoEHJtCM166cTHFEBW/a/J2BMgFsfxgpBcdVKg8ciYpm+h0J3CerPUYIZ32P3CSyQhNkq/7jyKa32ddB9cCkf9Qc7RR4y1gyCusRoQkfGe0bq7PbOphF8QCiDQGnU/oKbBQFLQfgHaciUjv1A/Anta1AUW9heU+Axw886TBDGTKdnxpnVYAuTFHsm6HrGjB5PWrCdrNTuBrAGgLiF5FJqC6R6Os5HAjdFBkc3BZEurEydr3/ahmGcRaELeFEU21sbURxg5+GfTOaENgtRmHDGA/lgd6ujSwnyNe0UgEro3DmOUCQozcb7wBg1+KCiHzSnYFkKSl0Cni+wC7WgRSZEa38dnaO6FMQScGaWjEnqR3aBOAwwY0FuBZWeQgZwlTNFcDLzVYRBDC/o/Q1gxrDw9X+3FAGSpVFTzyojbYIdK4i1UGdUJSugoheAe25xPjZGEw1TuVVgwCVASoRZubhqxlHPH1zQlNjKwN1VnS4wpRnnVHBREbMRHLGoAUZEAQXKnEOsClC6wW/HFVYr2LU4RkoYkUEu4b9oNOz9Zz/4nTPPP/ff/E//43/75//PlTzXU7Pa2j1hdGr54Il33tHUHzb9tfXHd9cmRTwfxY7xh61WezQUpZoNI4jLKXa3Nt45fvJbb79778G9G2trvqWD4FLfM0smZNjuDgajTMqQEFIq3UiSgHGNVvKUFkrVwmgmiZ6pxAw0Xlz4Gx5GSVaoQpdJHFBOer0BYbSfjhQkn3dHAxEE2moqmPH11+Z56QiSO3x1H6ajbq937+GDJI4hhyAYWfPTS5cfDAfHpybfPHfaaHt4cZE7F0oRhdHm1nar2w2DoFZPjNG+zIThF9eu3bh98/QLx4NI/vSzz351/8FzizP//O98cxJm3vmZKWJdIIN6LfHlV2lTllmWrty/Txi/8+DhYNQ/9cIJxun27m46yqy1ohZfXFn55NaNli9s5nffOv/68YPpqL/eHQSEzE9OWK2kkMSaIJJonJtE0e7axurDR4zzrCyIoIXSTx4/mV9YyLKMhcFHV69s7nROHT0UUyqZmJ2e1tqluQqS2uW7d59ubrxx7pTNC0wzPHriJOVclcWepT1REhtfy+yhfQtxyHcGA8a50TqMgqSWUM6GwyEKoja6nZWNzWPLS9zPtvaZyn1pYdYSst3ujENx/NM7GqWEkMOLcx1VbvV72uisKLHjlpypvAB3X/++cJQI+qGWpVqN8iwUklNJnaDO1uOIEbKd5T+5frVPHA+DvCipo1ZbKTmhbL3V6SvVzYrJxkQtkFawh5323PLyqeXlweaOKtSeJDq5tGeCCVYaQWw9iba2dy58+GEkhFLl8bfefPvY0bMyqGc5sFmEobjBYdqS0mAaF9X+8LCGMpiJDZorWHCUNAi2QRkFg0mLFgFoC8WgHuMpzWllVg/TF60QR1cZLDE0HEGvfG1clqGTPRQc9EqHZIIqhm/MDqYweaLy1v1GXUvQKksISzmaCBmADXBe4+jjy5kgHJ1/DW6PsZ/w87MUMNA755R1OXEDxtbyPM/Lsp9yymtBNBtFc0EYcUR+EQqobCY5sGAs2Fg5Z/zRBbxalKIAwxcB+8p7BPPv0RkJyx269ULyD5yHBGMPECu3grOOUau7be6bRLsQRxwYNRTy+rijQRRub+8qY5Rkqh6FQSRslbssCBUEV6aOAjWsCkYAo2ZjtdKWi5CJAK6wrcBmaliVekTGetfKlHjsTikwAx7WlPg3WTfG9Meu0uiAQSsnZhYElAmtlEP2/2/yChFMd2gdBiwy6g8p56Kk3gtCnkS7rd08LziINfFJsI4GxC1BcN1Iirubm4xJKLoWP6SiNlnUmfi+ieGFpeOeDoTRcEYwC2Xf11bkaoG3S+Dvq78vAfXjHvNNB5GUCULwGwZQAxkwzbGN8t8BzU05J5woo5XRkChc+XZh0CP0isTPlRDM6a8c95UA7rpGISOrLEGQhu6bXwCEGaRzWjvOxEaACCn1hDPIUDPUwfqIcN/VGo1oFV5k4AgJwTmO6s/8II0x4A7EK1d2+8yopHpgkSTgXzxtJRC7EMYATMf/Ug3YgcVjkTHQAyHzz9LR6EdvvhlH8X/+b/7nj9bW9NyMq9UzbRo6Pzcz8dK33hONhioyQdjqpetOu9lms+T05ubmTqc9o/X3nj9xdGZ6pMrBoLtI1D/6nR+Ysvz48sUyDHB3ix21JmRjt9VPR0mtjm9UYdT0ZIMAlQyaYj/61IScihPAaTi2OLCyoiovHHGD4UhyGVA5yEZZkVrG291usznRN2aoyzAQRhtBRRBEhSrzIhOSw1BHNWTZPl59pJUvyLnK8yD4+dWrG6PRiZnJ77/5cj7oGUIOzc8ZpZNaLSuLnU5HyLBWqxFLtTIijD66fPni1atnTr2oOf/zDz65ub71rTPP//Abb0w267fvrexfXEyCMPdztgxC6SwAqpY8fLCqrXv09OmDx6tnT5+Skm/v7PYGqe/U4ujy/ZVP79zaTbPJJP4P3/vKmUN7i2xEKN3sDSaTaLZeJxVKpGtJ4ghNkqTbba/eewi7E2u0CoJ45cH9KPY9DQnk3adPPr5y9fDe+WOHD+3stmYnJ+I4HhU552JozF9fuPji0f3zzUapCmX0wr59i/v36LKwStdqyeLSIqfcatMI5J756bWdXeSaskCKUBpN+unIvz6BXFl7YojZuzBX5AXB9SrjZalmJ+oJJ7u9XlaWhAqlckZJqQwl9PDCDCHkSXuXCpbnBRxxvgIprRnjRuk8TXFO8+2aYEOlcqWSMLYKxkTjphoTAo7o7VH606tXRpwKGWS5Qp/dMAgJpVud3sPtHcfoVKPBmHiy2xpR8/zh/VNTjYsPH91r77barZfPvXTm1ItNZye0mgqiW5dv3b10TXJO4+jUd7716p6Fr0RBLc9wsQocK3/iGuI0ePEZwjSIEn03aDByt0pOQzMelB3hqgsVupU0leF/xtZ1BMwL6ViKA8Odw3nz2flu9bxWvxXVFjUkw0JDCW02Q10p1CGLCp5qLquGb0awnHKQBPmJHeS8uHREWBAgsyqDx1Xu6NYZVoXywKHIwZ9IQ0gdZ4Y6zdi2K690t648ureztZWlaaYKqsuE0gDzgPzLaxBiHXNFK7ltNVbB8QdZQ7ZyC2OoDcYgfoomBwQNSeDfgDAuPPQIUokZug9SCjMGu7e9mQshKFuUQVTBvBzP3UCGaZa32i0ahm0eiiAKYYsnSCXzQm/san1eOSgj44qpUvurLSV6gThqUSaFc+649XHgQcEqhREFS49xvi+QmR155oiFVrTV0nHs5kEolUFsYOgeb28pBlOJKlIQK4QvreAFTUOIpO4xxsJga2MD3RL4OJvDGTvB+byUMZcbefaw0xJCuLFfBiZZooIKwxJQaAt2ZgQBeVZFQKBy3RhgN1TALJDwBXEBZ7435r50ScpCAGelYBJwfEYcsDidgOUFk75z5NBxWQ1+T0D38K+HQStuCme9Q4kwdI1jyzT4SmC+gQ0vMegyTTF72iK1m47DtnyXh/z0Kul5HDjoq7DkUoJ2CsxYmSBVQAQdc9odXEpflrWxlFVxFXT8+qKSfcwOqzb6MJ1T9H/lQCL0UzTwJ4BPT3H7Qn0XXIHk8FowNRh8++RJKoL/+t/9X9tx4qbnSoj2p8Pu843aqy+dXX711ULloeSdew83V59OTjVTSu+srrrh4J2Dy3/w7e8cn5+9d3+FSz7Y2vjRN765Z3nfrZU7K+ubQRhXmjkunJBPtrdHRT41OQmnEy2t3u61qWBFkaPhvNEmLxUnbiqOkPGA5wVhOMX6G5plqeCMBzzLckJpWqqsLGUUXn/ypCQkCvyFZZJZZ0ql4GCsslOMUtkofbq9E8XJMB25OPzlpctP+sMX9sz81itnmqFcW99anJqaatSd1iIIW+22MS6OIKK4LGRc+/zm7Q8vXDhz9nRKyZ/94lc7g/4Pv/nWN8+/GBg1GBbt3vDIwjynXEpeS2IMWnGOrG1sZYVqDQdfXrv6wvHjzXqj1Wr1+4MgjEwkP7l966Mbdzppfmh+5kfffufQ7GQx6EehpJxvt9vL8wuTUWKMf0SDIJxoTjMu0tFodWUlT4eCsyIrRCDXNp92Br39yweMUp00/cmHHwZSvPLiCat1qzc8uGePv9pKyyS8cOdmZzR48/RJnaYadoQnTr0AhFyNO9f5PYuYhS6IObS81B70CquooCiSSbNROhwJxnuFunL71tF9SzEXyvcrdf/3AuI8EYbzM1PtNBuUmWO4s3T9POWCLUw2ppLo8daWYiQvMz+BUcKl0AbQGGeMNpwLY0vfxjLeHqVDpfhYTWCMmZ6YiIXEtmwrTf/y6qVtU/JQKmUIOM/EQWgJ3e727j950mxOyFDu9ge76Whq757jhw88Xn/yyW772k7rkw8+mKtF3/jud158+eXFhdmJUH7xs/c3b61QQhsHl7/6D37n5bmZrwg5MRiAr01liYHwlrZWQakEULRKA8XYPopcTjhQMCSGMUFhKQa7RQZzHco7QILBxxgv7loZhtrh+4wqAB6m6Q/2HvhX7753LKkbNEcimEwD0mHnKyYKxHFAA4Sryq8jYwsLDjmmEMiLK7FnMXp+AIVPoM/kkAwdIbhD+pWv99XxT3DKNowOnF7J+l+2tm9sra2sr3aGwyRqRIILawVBgUyFLzPCsT5BxWI4JzIMSBr/pdgVIGg8LklkbJI0VstUFF2CXJPKE8R/lL/MgZBP+92NrIhoMCflZBBQV624IUHcD6Sb65tUygGXQa3G4RMF4CpwHFn8SAzwwx/Fwu8fSuJEGABxHGqndazKIaOV3QWSaaufqAIdGRlz4StiDh0bP2EYBZhGOLC29gWCSwqWPdYafwuwdap+BsdoB2GKRMLv49ZJKXUgVRCkedput4JAVgxrhFaMnUuiBucykPd3dwZOC+hG0BoUyqKlZKwKg3gfA1sMDfFVSEOwY80cbov9zYQoED4OAQ4FCzmLjJ3Waq4oYqUY+C8KyiQcJECa53BNDMPEIpizGaPWOK00B0mtNUZrRXyTiOZkMLgyYrTBKAbBwLKTcWspblvQB45Dd2lxtwEiDR6Aswdmd8EGE8sixoFR+BOAcsZZZbKBngIYYVD5d2uIWxiv8P0nSCaREIhwN0zz1ICZGiTkgmO3JQFoOOAKgwUYIVr746C0RvsrDG2F7+VBF85ZmaXHFxYiGfxv7/9yNDtrwyj3d0jkeb7ozNmlPcfe/rr/HGPYIFu9eIlynht19/7duTj4j9567Qcvn1sI5MfXrw0Cvru+9vax419/+71sc/2zG9dVEEFwMqYO0adb246y6WaTGWNKxeP48qOHXMokruVlKQMJt5Rg5FM9BC9TkN7j82R82820n/dKLvyjC3xmsdtqRRMTN5+u3dvdkYyFXODaDnbODnOrLfyUUvr+g0dK21Ge0Si4+PDh/W735NLMey+9UOOul6Xtbve5/cvMd6KyUEWe54KxKAiNMTyJL91f+dVnn7366isDXf7ff/t+EPJ/8t2vn16aTYcDIYN2r0+pWJqZZsRxyeMktuD322p1Wp2uluLjLy8c2L//yPLy1tbO9k6LCNktil9euvzlvZXM6NdfOPb33nujTk0+GvlLwVg/zQbDfHlxHizq/IMgwzAIJXF2d2Or3+4HXOiyJMQV2t68c2dpYUnlhQvEL778bLM7euvMC3P12na7zRnfNzNb5qUIxG6Rvf/5l2+cPjkRRWVZ5EW+7+Dywp6FLM9Bamq11nMLs7VGTJjTRu+ZnQqlGGV5EEahDI3WvX4HjOTYw+3NznD4woG9RishxMzcLOUcxeickj2zszkh7eGQARfBOjLIhrU4qgu5PDfTVqpTFISRUikhhX/ltbbawNvu665WFtJOWbs/KGEsAqMgXmoVc1GX4pnYo53mP758eaNIo3q9LAtrTBSGtUjGcbTd72+2WvX6REHM2tpasLT32IHlU3sXP1tb/8XG5mfr63/5s795cPfe0dOnv/bb/8HXvv+d518688VHnzy6fIWmo9kTx9743d8+Pdl4K4mXsoKWhcaXHqWeHKNHtS8FknOgSY4BeIZjCvj1cVcddBAURqtcQAfrYlsFH+ExOw5iBYtZWzFIIMKXkIDQiSC68XRjezikgld86CponWJkC4wBDkhfblxdqdGGoZcHTthV+BLSayseE4hXq7EbPs7/nZxyP7OiU5T/WIZuOdjlIz1KMdqj9LZKv+i1Lm1vbmRpaf2vDAUPgOSM1kX4qQxi1CtOLBjF469ztgoMQHAbFdDgjIBNILojVFXfWjd2VPZ3geNcgpET/p6wgXP3dneFZJEjs3EowCvJod8ItaGU7XZrWBRlEJAglIGkwLQSkAVAK9cyh+UDqeN0bCahtII0EIGhSTge02rDYiuswhHLgCFWWZhYVqX9whOBecF0jA+MXRBx5AKacRD42chUNAJaRRaz8cBZ9WdV/D4hgbay1hhyKaNot9MdZZkQQZULCd1e7PRiFIeElpzf3942pNqUUmrx2gEPjCFhmmEsK4UYA0jnQKY0ASIAGCBTVCUBYZpDMhcTBPFNGpXlNxb3/NOjR/c7IqwLqMAnngOYAIxKyHz0txaW7tBN+HMcgS3wDwKOO5NSCl+y0doDDhCOHHFDtJGMcyGcdeOkfEi0gitoUGwNgaa+msNrhum+CvP+kNcLrwOMptCcWq0hLdI6EL2B3IJxdEd2liJbsmpCEBby/QdiDORZTCV8EWAvwMNE/cxU3XDwuYYLgUYBxo3zrx1VWjeCYCKK/+L2rVGzYbnIwbhIaRMXxbmFxVdf+UptcV6N0si5rYuXOk83usPO2saTr5x87kff+vqRxXkhxO21x9c7raf9fs2af/Y7v0sDefPh6v2tbRmGQH5mltC1zU1l9GStTsBKpNaor3Va11o7x5cPAl2Baq1LVTjGhORG6ySOEiEgLhKX5xBZRWlZlsZoQTkaiQ+LItd5QdyltTVokhiwxDRELrlcFcBRBZM0rfuj0Var6y+ElDfXn15Ze3p8Yea9sy8I/++7dl7mWXF4Yd4ZG0RxqUvCaa2WWKrDJFnZ2PzpB7969bXz7eHwz3710aF9S//0O1+bT4IsSznl/rjf3Y0Cvmd6GqZ9yQMppEgHw63tXRGGn1y+bAg9/fzxjq/HHZEkm4P+33z5xeXVx4EUv/3W+XdPH7NlWirFhTTGiDjJnW92987PU2plwAwl9YkJwkmn1d7d3RX+7yRFmlnGvrx2La41ZqcmOSUX79z57Oa9c8cOHF/eW+bp9k5rcmpiptmk1oa1+P0LF4J6/NrJI3k68ldGsOMvnjRO4/aC+cdSJ/XazPysY5YRN9mozzQn4NUWUnBdqvZu2xirqbt059bi4szSzBQsa/mePQtS8DFY5ZZmpzkhvVEKjApnGOsPh9NJwi05ujDHCHnSagVBmOWp4JIzbmHLWVqnlEISBtaG7U7HcLCKg7nSWCIJ3TM1TcYxb4SSkVJ/cfnKta21xvRUGIbMumaU1EMZheHmTqdQhgl598FDlURLBw+8+tzRiJGVPP3x9tZPn278xV///Od/9L+v3747ffDQ+X/wg3d/+Ltlv7t1777qdRZeOvPuf/Ifn52aeJPzw9aJPAUNgTUEckuRVTl+PtFWAucZwB5R02Kf5bZbSL21xLjKo4NaKK9aa7BXsWN5CmKsmN6Gpks2i6I/efLov7xx8T4uKn2P4jDWEDP8EUQej2xolIdXiCMeipKTqnGvco30eLgEoNlV+QFgZQ8RNUAIQ8CSsDGNGxhSFMaDwtkhIRta3ciGN1XxxOQDPQqZkASd6jF8DrMFq3hZCEoE4NNid8KfRfnBwpkxnEV/w27G447ycQMBe3OQz1SYNYRJwI5egKvBo9a2BsB2Po5i+2zm9NdHSFkUaafXoVE08o1/PfBzGkGrQQFjNDpwgaXZM9df6oDIYSkjQtixfTfciAq6cJVQjFV9Ef1NuqBF7TT84ZUBeMXG8m0E8HswDJESHkSEcq3MuBuqJKp+3Ab2vC9HOND7/6+LOKW1Wl9KyvjWxibDJQi4XaBee4LzmSBgQbiepet9PyXAZG8F+k5YDcJWf8ENAbjUaZQjCSGJY1oBpOMqjQ1wwylGFUFMEmh4qKOGCGhTFkTw/YW9X5mcinQBXg4Kn30I0IURE9J5UXpkbcWl4wLMryAfG8YmopUxKOEzBswxoPUFTxuk44MvBKnqIrwq4EhVbXo1lOTK/RzaJ2uJBIkAR0tJUoE5jDgFaHbARMBhe+zvITIDIBgRWlGcZcEH0CiLyiurnVVWE8IDEK7DJ1vw6mXWv8/KEINuW5VHJmSLAa3UH2RFieRrX+QV55d2tvtCGCFLzGEhROfp2Sg8e+TIvvPn1WgUUZKvrFz78JPNnd1Y0u++99WXXzqrHWMs3Oq2/+zyxY83Nx9ubvzz3/37MwcP5YPexdt3WBQD/i+UcZ1hjwhai2OrC+dcWAs3R4MPVm4LSo8uLuWjjHOhjXVA/ayFkSpUFAYTSWitRkEDTLBaq9JoC1GgwrcalHcGfZkkD3Y2FdCeQ8CmOKWRDMFW11DiBMqjGd9ptRy1JBQPd3Y+ffDo+PzMb507JdEdg/GVtc3JqemFiQl4w5U2Oopr1lEZRuvdzl/94m9fOXdubWfn//viizdPHPn+G2d9OcJqYUmhzGarvTS3GCcJ5SQMAy4Dbcl2q0WEuLu++ejx2unjJ1SuWu0ui6LVVutvL1y4227tm5n6e++++cLyYlGksHAjyppBUb781bf62tZCsWduzg+mzDEuavVamamdrR2tNOMyKwsm5Wa7vdNpH9y7xAh72uv95ONP56cn3j37gi7y0rlur3fswKE4kCIQt9c3r9y5852vvCKtZcyVqjx67Mjc3LQqCmI1xGNYdEBoTE/j0RXKoFkPS10ayAJWZakLbQh90uk+3Vw/c/yIbzWNieNwYWa6Xku0Vhg4MDPRaHAyKApLiTJKEZKOsrl64ohbaNTn4uDJ1rZ1tihLC0XL+DoErzV1aDotAznSaicbjbS2khvcsXEeOLY8OzeOeav+q7TmZ7fvvH/npqwnjVpNEhoSEnIah+FgOGBSPN3Zfry2VltePnnixZP1SBV5Wa9fV/ove73/9drNP/7j/+PXf/i/bP/yV8zYI+dfmzpwuHCs2N2af+7QN/7gX5w/ffyrnJ+zIhoVTimULMI6TFTeBWA1wDhycmEpawzFBWcl3wG5u4EIGY7nqP/feNXlI0cSQGnBce2CIUAQeuaMDJ5Q95hYJUE1DBcJDhuOznlYtFBoRKuwVIsVAQbaym8AI34BB6SwFUbUGVQYKGK2Blsff3oJCbMfNhzOoC5WG8TUkWOlGBlQt+3MgzJ9XOQpYc2kmcgAUEzrD+Equx6Z3hTCRkG7avF7WLQA50RQKjmVyLhEQh+1DCwLOQHpESpLYWnIgSkC6Q9+tMDcdlDlBMHOcLiT51IGU4xN+knJVrg6HPWU0VZ7lwWiKwQNkwjsqLlzkgCsa4HfWs2lUJn8GQzDtwExUhgShu6EDmHl8T92PKRipgLCwH4KZOjhjKMvd5UvNHpso3KJVsQzHoCLpgFT8WcBhthjUIiFYpT4IZw6P7M7EgthgmgkJXem096VQYAep9Ua09i5OG4SKmR4f3u9p7IgrnHg90JUDxdUQPAA8i38bUdoGvBhfwIClMMd9IlANDCMciBtaayZdLw/BwY12+z03Ez6QnPyV63dkbOCS0Otqhjr8CjBIpDApqpy/ICeDi+YoYaCYyWYPHJIhneMS2M0rSwq0a8ULzIkD4MXFnhcEj8fGA0m5uCYQVDhoJzDhwgChoF7bK0VGDEG9qq+v3KmEgTAWcRRKkfQmcu/zUwKhL/YeNqVnFfCLU6Ntqzyj6XMWsEEZt0SQoB+yUBoYJEfCT8FdR1yWqRgOeyYBch7ABrhNhsdY+Tc3r0vvfmGAZuu4erTj//fH5dlfvr8i8+dOEm5NIVmTl++/+DfffjR9XTUHvZ/9OZb77z+hiuyKzdubPR7Ya3hCM20HuY5RPBxo3QYhUTKi+trXz542LPmxZmZ6TjeXFurllJA/Gg2m2lnR0gxXUs2U1+blcq1UtpAFC5YUUIBtrkqi7IYcfZwpzVZS+YnJ/sbmygK9H8poO08DjEIPdflbn9QUtrpdj68e+e5+elvvfyitAr3HpqSnW533+xCxIVWpjSKCxZwGoRBvyj+4uc/P/HCyXvbO9fv3fvB6+dOH9qr0qHjLA5D36FxyuKk2+6+duY5SnxrxgPfULU6rUzrbpZduH597+JSM4p73R4Lg1tP1z64cWNQFq8c3v/W2RMxp3k2CvyxQgutFLHvfPPrR46fuLXyb5ZnZ5u1mk5HgvF6oyGjcGdtQ2VZHCXKj07aMn73/oPnDz/XSOqt0ejPf/1hXhQ/+NrrkthcF93clFl+bP8+a6nh5P3PPj538rkj81NZr2cpaU5OnD1zWqncVclaBtFAa22SJFIKCpKEiShUIyWl5EIWpSrLklB3Y3W1OVE7ODul84w6s7Q4LwSZnpzY3N5FDV4c8ZlGMspzP80L3i5yzeji1KTTOmbswNz81cdrI1U2RECMZZQbaoqyKH27xY112pgwibaGg0GWdrW5eP/+14+dMFlJGCnLfDquJUKkVVQMrbI8Cfns8ZPt3uBbL546MTOrs7Td76fcMC4K/8KzO5evHDl0eM/y/u8cf/7Lzz4rtY1rSdfa0prdPL92+dreOyun9+87tri4OL84vWeORjLd6QZzc+/+6B8d/Ojzhc++ODzofdrvPtQ2lyGGvRgg53LOtRnjq+iYgVlDsMZCOyc/ccKwWXk4OIQqLWyRDOfUVIAkNNgG3mi0o6cgbYSsBledAWBlC4xi3DlW7GhSAeAgakR3Y3jlYUBD7hKFZENqif+NBBUQOK1TjAuBs83QyqqwMpUGfwHhLKRUUQYrAUj+9vMDZ0L0jAucmzBaWk3A48LiRFtZp+H4QtCaYDyV+s7VN+hOYxQ7IuGC+SMXiqodex5ZNErmUMEMSJQY42BjaaviAbZfUvBRka50ukuLi/W8mI2jteGQcgnEZd8ph1K0dnaVdYWQU0IEAKsKTrnBLYAbW1SNzdsceqfA4GgcDwLNmVUK+qLKmpKMp1pUG9mxyNqPH2hj9SzHCOnxmM8AC8cqosE6ykJJBS+LwjoDNHZauXVQizLMigHuj2MWOCKskUmcCk7DuN3t5HkWxzGrJLP+n8i5uTiKgJt0Z2fHYgkbxyoQVyUtI42+EmVzGPFeN1UAAIAASURBVDwrYlEVueR8PwhQJCiCmPC9G7GaM2GN9v2PgB1+GLQp6Vs7y+SiDJ9UlKoq/thWNjNOKSVkgGxBAIoNc+P4Qob6eQASwKK1stSuFh8oAIZgTniatLbc4lALK1ujaeU4Da+AHwzQPhuVQqYymoBHCrWAbPxgAhrl0PPN95rGMs7FOA/Yv5D+AKmMQypHfoiMDiXkHzNY2ECuiYQcX04J1FL/S4yfvAUWY40aRDr28azoZWDZiGiOs6zU89a+Mz1z5uxLE4cPm3SQbm5e+uv3Z+YXTr5+PogDP0aX+t7m1o8//PXFB/cHjYm2Ui/Oz/3+D3/IOO/u7n5x+w4NY21JqYtUFdSXNO3721r8dDS6ePPGw14XSBTkxL59SRRC/iussnhgBb+0+mg6yxhhM3HNmW0/6WLmlb/bVKtScFxF0G461Iw93tk1xH3txZOtwaj9dN232P6+GVUixZ+XSjEh28PRzrCXEfbpndt7pya/fe5UYLTzTTRRxizv3+8+vbZ3fl5yBjGFljMWBJJH4Y9/+v703sWHO7vr25v/8Jvv7Juu5aMBrgC0sWVZzsxPy3ozz/Ll+WlYutMoCkuj+/2BJuSja1cGo9H5F075GxnKqw/u/fLaNUvd18+cePn5Q1QVpnRoh1TmpaLuja+/c/bll+48fLS6vv79s2cDzmgYOuvCOOl1et1eLwhC4lyZ51ESX7n/kDG+Z34u1fqvPv/s7ubm33nt9FKj3u91onqy9XRtfn5+vtEQQfD+lWulLr7x6ks6HQopCl2+dP5cGIdZkftXyRmMisOTM0kieGZ8LxgFQSyDWpxwwoZ5lqqyJOTB6upLp45KyPOI4mhhYVZr1Zxsgg+Sf6oiTuenpjb7OVomtPt9LsRMPSHGBIwdXJi78nhto9+fmJ13vgBTMPHQhLo4jPOywHicJ+3OQPsX5+KjJ4fn9hxoThd5yiiZnKgvNpsPWi0wnXUYlwtnLH3Y6/7ZJx997fjJN48eOZAk2+12O8sKx5xg169ffeP112YX5t595fyf3rq90u1Ec3OO0jKMdsKoZ91GUays3J1bubcQ12YnJ2ph1Gw0giBImhNzk3N7DhzoPnrw2uTUrMpv9oe7Re5o5cyrjYE31w8XFZyGMWUwmqGsmYzdGEhVotHVARmbmIuG+1FIN4fdL312rls7xcRswNfLvA+WcFAODPA3K6y0ytoFroSrNExU+yecQ7ihxTR4TlBj49Bxz6J4GCwwYHzCIBn0V6xmMASIHZ5groqlh9PNjx/KIURJhpTsOs2LNBAy0MKpElIqOK9E+YwR4LeOVb1ww/yPjiloDgst9CucQgocqcjlICeBMQq8RTDYicGZDX+aAZN95ySjBeMrrdbbe/ZIR6ajJBqO8nHaI3FU8mA4GrQ7u5NJ06aDKI54XnJLMNieg36z2rnCJXE4PkOSrDJlKAMmpdO68iapdgwVbYdW6HCV38esL02VEIVhcGxFYkNlWZVr5Hs0YoUMCeXK5OSZUgnVPrSKKxLAwIL4CMIpCSh19WRAnZBia3sLKgqq1irieZPzqUBSwXbK/Emnw2TgH0OrGXIAoPoaayWkJvgnD6kB45rDGAP1p6/YkGoA7udjJyzqOycOdAOI5XNEM7ZVFPe7vQnH5ms1NuhqqyxYy1LM0wRrLG2VMRriM3HNwP3/UVmw47CoVfcVyzLsGgnh/kBHkTuiCBBCgmXYd75aCcHhbwFTWMFR/I6ALz7KhqAKFoEFlI8jmcFQ5p9r4TtP/0pIWHeh/o1j6C+rKHnOj+PI+vKPpLZ+mndVFwXyJ+MEdDaY4EZgZwpGJO6ZTyyrsj0ZmkYL+IYaaOcMPQgdbaT5NxYWTy8uPnf2rBkNW/cf9tfWzr7yysT8AgmlzYr79x58+PnnH91/uCO4WNybp6O4KP6L//RfTDQmrLYXLl/eGaYkSYZ+RqSCCaNtrV7Xgn768N6FtSe5cwGwxEJjn5+bK5VSWqFKOK7Vfv3gzq2tzdNRXOR6vtagxhmrBYxlyhgumCqU4NwRV2jTy0YDp55220enms/Pz3yw03IEMhnDgPqyWjImBGelKokTjzY2dvJ8ZWNrptn47mtnAmusUTIMW93O61953YTxqNvbO7+AbkHMkTiI44nmzz75eGR10WqrPPvRt96JqM6HI+EfCn8PSwhEOvfK+Z9+fjVJGpNRZLWJoohS1m53DKW3Vh/efvTotVNnphr1wupPb1z/9N7KZBJ9/eXT+6fq5XAgpAikf+SK0mnKvvru288df64osjv37vWH+eG9+01RWuriOKGUddu7DKIRRsMR4Xyz1dra2jpz+rRx7oOrlz+8c+e1o8snDuzv9/qEckfFxubO2eMnwzB8srv95dWrf/dbX42JyQnNldq7b3H/wf15kcNBZoDiyJGzao3mXEgp8qL0rx7nURSgsmGUpkTKz2/epE4/t29JFVmp1J6F2VoSK60bjYkkSQqQYFFnm43aWmtgrOJc7LRbjUg24qgcjZwzi1ONCcHW2u2jM7Ng7h1huQHXVZaXpeDCEPqotWvgtMms/dsb1/7+a2+G8ASHnC9PTj5otbgUTmlrMZaUgJKVDhz99zevr25sfO/c2ef2Lk22O6tb2xmju2lx9crlt99+a++h5779/LFHn35emumQCQvqCc3ZqF4fudqaNUyppLUbKRuDWb8AaDznXHOqHWGRxFqH1sWEU+YYpoxUglwGdVRwNHt2BilXjtKxtBLfxzEj1U9yMIGBeIkZAOFw/NHQxRPjS8sUF11Geyj3JxY855jRGqbtyiHOQfw5GW9JCaVaGzyp0M3RWMNhRzjmicHevzIk9N+S+8pXqY2xdUC5ioFTT1JuHLdWMQhQAisVqowmjHVUFrigngQWjXWhbkDyhBOMaxCaCFiu2bFHFez1ATW0DgnGDjhEQNkZg6lw3vuLSSoXz8p3xFnui5L/giiUYLj+k+FGr9sp8gnO6441BMsqCwXfowGdh+xs70wfm025jJO6THct85WSV8IhiqtpNTbS1H42ARcJo0kQUhFaUsAK3tnKM/o3iPWzjAP8n8DGxOLi1pKxuphW9C4gRwMeoilnIsSIRl7F3lb7AYxq4mMXaDBqItzamAsdx5mUyqiKEkJww48YqZkJwyblJEge7OwMilz4Uwl7A0iVc8+qu0Ogwv+p1hKQZVW25UhYBp0Phb0fMRUXwD/i4IBaWhOyAFGRjlL38vSADAVlgXMltKDWUGwn8XkEvbmhXOIK1iBVGGM9gejB/OtEKo477HjwcUQuoa30Bs7PB2CU4SgHrIWg5QUy4ximT1WWegRMcADgRbc1wRAOwFxJFDpj/wHSIDSfNhqMwoTvcKs8Tgb5CuAyWhmkQ8Qh+qdixoYTKBDmEoAbDQ8xNH8WOzsQYftDTTBqUd4J/h+APTPKB8N3l/acq8dHXjqly9S2+gnh86fOEclH3c6Tmw8/v3T1o/urTxglzQnJuWPs6cb6H3z9vXMvnXPOrq8//fLWHRIIpUrhbMz9CUZrwb1+6xf3V54O+ii9AHq2m2T0yOJimo38S8hlUGvc3dn69coK4ayb593hYHGqCfRSgjqxUhVxFIHzIGNMlDrLtFlttRkhLz93mCgtWWUWjzCG1ejITYIg2ux0N7qdla1txuk3z58K/e/XIhDDtH/w4P5zL5//P3/8NzETU40EGTGCy4mpqWurDy4/uKMdn2kk733tTWZya6yoTMtJludhIF599fy+/fu+/Ld/NNuYiEWYa0MYK1SZ5VknTT+4cHHv7NyJQ4dVWb5/8cIXTx4fW5z7xrkXJgRXqvB/mzGWExj+2Ntf/9rRk88PB/3JmZnrd+5PxfHM5CSMQoQLNspGhrowirNhWgAx8+b9h8v7ludmZj+7ee0nn395cHbyjdMny+GQECrDcKs3ctocP3RIcfLvP/zw/IvHju5ZGHY7lLGklpx5+YwZG7Ab7RBQBa46A1SEC4gDceCUUgtDTmhZlISxzW730srKuy+9EBGbWisZWd63F0zZTBgG9SQeDTMwlLVSCH+Swjky6PeXl5aSSOrMH8TNOF5oNjZ6Aw17R99QEku0ivyLa6w2MghHqny8s4OzBaN0YzT6+Y0r33vpvMsyW+QHZufY/fvEuVotzrLMOSfBgE8ZULZzdqXTevrLX753+Mh3z55dmpm+++Tp+qj9wSefnzl5vD41/Tuvv/7TazdudTvR/AKEq1PfdqO+nlIWxQNKekajQhUCBytkGKRlVpMqM9A4lK4i2OynJkMt9t1IPxxb+lCgQDHLIAAYkGFMC0LDZTL28DdgX87GyS9gBsUIox2rdWH71lLBrMZ0IzmWFo93jv4vB9IPfCZGmPgp188RvrZZrSkIupBVBZAvY4RBGcBkFGcqhrIDY1koFZyhabBgwjmmYYkF9FRiINqcOafB6LlnTAuo7MYYjuHnIEhmmDMIyfoaJgEctXllWMHAqsAwFsBi2H86FjdAbv35zMeRFhWVlJFKJUwqUJ0ZYqmvxFLw0ah42Omdm1+oD4ZzMtzOcv8dceSjTkrRbu9aa0dBMJnECSMK3EK4Lz6W2Somh1cwrK/HGt2wjbUQlQ/7Qs2euUtaFHOiTgc9x6BSUNTTUmQRjR2wkLRtcRBGk0bIjguEMaW1mtJxkjAGC1tWgeMU2TAwN1tbD4IiCHUcDgf9bDAIgpCMFxiUEOnIQhTH/iQTK60dRyxEiQIlDH2QaWUvXTmLwEAKAl9BIAjHOA2k62qD7pBbiVAKqXzCAO+RqA70k5bkt9Ph9X4np64mIwKWGs96OUL/f6beNMbS67zzO/u73LW2ruqq6qreSfZCNtkkm2xJpKhtpJHHY2EcC4KDDCYZeDwIkjjzYZAPCRDYXxJMggTIAgODBAgQGx47GhmWbEuiSNmiJO5LkyK72Rt7ra696q7vcrbgPM+5rZkvxkhUsere9z3nWf7/398bsOMQvN9x7h3qac8RtwZhmIiL1uDtQd+3jwRVp21tQI0C4R0Ety0SpkxmYrLHsTYcYXBIWxDUh4bVI3I1/D+4X1ECRih80yg949yBshFcZ4SBDSP8KPgyCaMaUMgUt79gHROeo3kL7GsM8uIUjEa1tjXsaWLNAvHMxMC1DlCvUDTbWOuGjycct0XxbDO/kKePnHtq9vBhUoyFShVlD65e/ckP/uZ//ZM//aO//P6f3rp9p9V009M1FUzl6/fvP7108Dv/5FumLpzRv3jz9YKHt0Rqs5Q1j3WnskS+euvan33wbrh9f81io8aabjOf73YG45EnNBXJyJufXP4V4ruGxG+Nh9PtZiMVHsTlzvta4yvgRGj92bCst0ej9V7vkYW5xVajrCvOuQ0XhgbPFIHAvdAiGO+v3L93fXu7qqqvPX22I5ipaiG51qbd7T51/klt6tvrG7PTUw0pwJbGGq3mg97uj3/x83FZnVie/4fPn+e2goU7qPWprcoiTdQzz54/fOzI/bX1ew+2Dy7MQ1iboJQU47Fx5I1LH/bL8vknn6zq6gev//ydu3cuPnL0Hz/3VIOTWtcRfsRIVWlP6AtffvH4o0eHoz4NXxP56NJHJ1YO5XlumQMQlavqUoikrMraGp4mN+7ey7PGkcOHr9y5/b2fv9ZI5TcuPCkBVx7KwUReu3N/dWFhcX7up794PVH0xfOPF72+oNx4ffrJs1Ozc3VdRxwij2sRlJlao3noelN4RVlZV51mkwsOeEv/iw8vzbTzR48tI8Sj22nPHpgBTUWoMqfaTbhEDHO+necCast+Uezt7Z84vMKjcohL6pfmZsZG94sCNfkQ7+0ZUzUm0kl1e2uzrw1olGA6SunHGxtvXL0sGokzbr7dOdjp6NqkQnQbuZIKclSIkJAGSBhXokfsv7929X/68Y+ubq4/ffzYU0eObm7svfzqL3iarJ48+a1nn86G/doYEj4TSygzD1M7va+srzzTlGsuDBeacE25FdJy5plgXFIKxCuk3MKtArmgEDaKGaswZQJwBciiYDQPEHRmMEYGw9LpQzQ/ZswjJgEGkCDIJXCaF8RtOV2T2OOCl8FG6B3+IDYBbIGdeqLkgv8exrPYV6AzCPMCYOoAS1TodWJGL4GSPCpuEY+AcUGQxgD4AwpQMB3OPQtbK147XxEyJmSnLoamShjviETC2FWwuOMDbn6o9iHN0ILExqOGkbMozQafCuY3/fqcZ4QjLQQvCyQdQflgvbcMPC0M7TXhbySOsCs7u5rzBvVzaaYmfR7SiqWU/UF/MBzoLKtU2pASsvbCDSQoEImJm4zfHX4fODe24Z7RFOKZoKnzMSUvKu8cAeKRi3m2fqI9irIhGCBTH8OPKOpiQ6MQGmwpGeMQZIsoCUrjUhzswNAzTWwwmMlPVSMvKCVK7e3tetjSERx1ho7QN5mYgjzOQV3f6fWZUBjqS8FvNqkYomrMQQhd+M0FReYUpmOCVo8KhCnDowmOUHAoMe5jNHi4uC2hxtvC+9u1XmfJpvYjb7Ccx1R/NzloUJYQHtCJt8pGYGv49SUX0HBjh0kiJsZipAOwsLgikLyJuo+iKIoqnCBonABPgo1OgckPga7XUdTNA6wDJCaOg4meEBrqL7j98cWzHvUAHKK8Y4+Cf+lEiY/ePe4JNz4U+zD4cAIs2k5bdDhQJnzsNrHsMiQ+GbjO5nFTQaLb3A9H5zj97XNPPnPxxYUjJ8a3761d/+zlv//5//jv/+pf/+Vf/pvXX395a3sty8vOVJUkpXWpUMPxwJfD/+Jbv5XnTSGS9y9dunrnjvJ+2piLiwdPrRx6b3vj/3jztZ/d+cyQiPmCxCqE8pCuTBPP9nuD8Es2sl9c+WSzGItwOtOSkPt7e02VzmdNV1VQwLJK66IqjTE4bNgrBvd7+4qQM0eWqNPEe0G8IUQbJ0HaA7EqTAi1Nxh/cu/OznBw8czJ2SwdF4VUwoCJ86nz55MkGRfFg83NAzMznFCtjVKJk+JHv/jlfr9/8cxjL5w77UO36iSLhIKyqJqtxgsvPL8wP2N0dWd9fdQbzHSnqrrksLCva31t7d67H39y8YlzWZp+/5c/v7mx8Y/On/3i2UeJLp0xkGcVTlJjrEzEl7/2xcNHVkaDAfNOcr6xs/dgbfPU4gL3xBovhAQzCa+qqtaWp2pja3s8rh45eWKzt/fdn75Sa/PN556cSqUxlUoUl1Il+d5e/9zj5z65eetXN27+xgvP+aoSnBmiF5cXDx8/VoZPNUZNM3SC4oFCADZuDJTKjgFXv9NpEUoNI7e3N26vb1w89yizNdwZdml5EfdwEijlrXYz5pB5n8AfKSXvVxX19ujCHIXij4Pu6MBUxxCyMxxoT7SpcXVGmSsrGF0l6vrmJqgmOSqH0WPxy5s337v1GU8TRflji4sUPO6SqWaaKClgb+YlZ1LA4IdRkojLvd7//Mqr/8vLL4+Y/cL5p+9dvnbj3UuyM/2tFz//3OzsaGsrnHGM+3ChwnXiGaRlg+QEelz0ErGHZOGHmzs/SWuldrIODIcbHKMkllcYgxbHxqGvjKiH2H54HDlEHgV0RpPUtYeqS/RgxBQgPPWhL+Vxr0SjNQNmewAzjo0QdzEUgcdcA1BvA3zhYXRLnDABPt2ziPrFKHoLs1dJMMXIWQ2BEEyGmy+8gqCKhbwnYmDiaBmrncspm5F8IUmnZMq8QywJ9FJIpcLLhYeKwbGJmQgaoOiSRZMNogywvUcqVvirBAeTUFxTAiYvfM0C3VfhEPCMSHZ70OtVpWSiJUQz9NP2oWuNgWJmZ3fLqbTiKktSjgJQqEqwZ8Xeb8IqmaQehY7FANpJAmhgQmrGyWc89+OLhP+liFTIycQBl8rYUiKkw+OsPUnCQwSsuEkCIZh9YXDAIN0+nO/ECeKFJQmXOs/GlFpHN7e2wgGBRRJI0Yizs0o2paBKPRj2t8ZjmSoYdXnBY0Y0ys0nYMvwvzVIW2FRUz6JdgITWHiTLSh8AcQYKhHH4k4X8SWg7KNsi3hn6sLoEcTXGZiAIZsKv2cJD6ibDOrNJMAeHkj4D4GN4WG7DMUmR8wjZUxIEREecUUeqgntnK+1yES0sUFxAGMSj/hJrOYYo4cszQm7YYyXEioPjhQwIbgzNnqeYecc1WoosIN7GaZgyHuGX5OiABJXDiSqmjFnCEbWmKWMGBMa0zQgg05ID2IxEDsTuE+IMPV0XX/h4MHfufh8q9m6XtUfv/Ly1Ruf3d7Z2jWmL2SVpHRqmoMQD4KFnQq9ptu8e+sPvv61c+efIYxuPFj7ux/+cCptnFpeOba0fGl7649/+vLPttZHBP9UzuI4AcQO8NrPdacEZ1VZZI3GB/dvvb/+QDL0EHFNyL3dLS7F4bmZG1vbiMYFUbPFvORK15v9/oPB8MTM9HKnW/T204ZK4WCrHeY7QcQbZVTyTx/cv7K///ji/KPLB6tBT0kB+VT+kccemep0tNaMy63NzeMnz7hQGPGk0Xjtow8+vXnzhWcff/LRo6YsuGDeSuMMZ2Q4GM8dmPnc888meVIUo9n21PU7G2ZczrRa1IVTuSzKvaJ49c035xcOHFlZ+d6rr+4Xw+/8gxcOtpvj0RBStbkN/1I+LorZ6c5Xvv6l6enOeDzgXBmjG2l+5ZNPCuOOLi4SYzlh4DoLnTyk8av9fm9ra+vksWM0Sf7ih3+z0R9889lzR+emh6OhUokxenF19cbdjXaeZ+3m9/78z1/6wrMzreZ4MAitjVJnn3qScWarqMYgIMWAASoMLYmvq1pIKaTgjGutx5Vu5k1bl31d//KD904/evj48kLZGzjvu53OwsF5Y6pwKlJurW23m2mWFGWNCaFgrmP3t3bn5meXZjqb1XhCSqfdVktRsjMcaor+dViVMW+NVUINquL27g6jJDxp4BGHyGlmvH/lkytKqKdWjzwyN/PBDTms6kQIIWiDqVqz2hhnDWNCSQU+R8+SpOfcj+7f/ej+3YtHT54/ePDNN365sDC3fOTkP/vHv3np//q/y34v63SMRh1m+DQctYSHW5PYCREY/TiwoHooKuYQkIq9LESXYhB7HNO5cJpzF8psw8BdiJW+NUj9YxMeFhz2HhXR6D+ERQAklXEX10OQdhpeZwh5I0i/wgkonjAOXS1g87VxDgpIKQ/sXoawao+NlYA8OQsIevLQLhHO5FBUIRTIx3BxI2DR7b2D5EcUMTOPglSUShsYXBNS6pol6VyzFdpgYrNwKDmkA8UYJwAgOeq4oN4iTMGFjshiJrqFA4zDLgQS+3FJHceecMz7CMbDVAkQ0/oYa4hGEc6lTHaL0Vp//0B3qlH6mUTsjQxinXCiKoTY2dlaXT1WMeYbTTUacbj2J1AOaiBwiOFXGzkZoRywxpKEiUTpkhPvJtBKzPgFwxGsDzxuBZ0XmHCAWjIayzfcAnjEQoBtl3IpnbPe+giLiEUWR7k8jec3DMQJkV43pCrSVHNWlKPhYMCF8HFKHdpE5f18KhXxOklv3L1liVUYR0lAK2E8Y4IySKSa1JZ48YV302CNQLW1Hp1bsTJngjOLcRM87s7CJUJJZV1odBirIDl2XI+sJyY8weHD1tYzEaVtFn1XHlgZyLHCcBLOWegmLUxruHG4KQGBPWNEcLjfo3UYsTIolE+z1BhLndNWK5mweNmTGOkECyWUh1R1eSppXlha/d9vXtmf4E2kFMY59NXh4DqSJiNvjfuJuIKxeDiClNp7Hu4igT0zhvtB8pEAgx2cpMiQIcwx60Bi5vCMC9+8sVZxgXEUXpuFTufJmel5Tr/39rufbqytDwZ7hBYqo3kTKMqY9eE1hFLgM59JsXXv7ucPLf3OV77shDKjwes/+uHpg0tPP/H42Pq/ePONP37/3VvWhioXenEG6m4Yi4UPG0+obqtVlZX3fr0cv/bJZcdw5BEq/YqQu5vb1NmV6ekEFntYfBhjZGgHWWH03d0dS8gjq0ssfBeUUSdleDJqXWtdJTxTMhGU9nX97vWrGefPPnLUFGNPiVLSaD0zM7OyvFyMhmne6I+KclzNdju21irN1na2XnvnnSdOH3vqsePlaIjbPpBzkuFwsHJ4+elnnuQMcoW5sN5fu7s+M9VtJ4lzThuniX3306vb/eGXX/z89195xXH/nX/wQlvSqio4EPAdcUyIuixOnDh68XMX0jwdVxUcecD8E/z9Dz9RlM11pk30GTuja2Tulbp68GDjwPyBpNP67iuvXNvY+PITj5xaPVgWRZIm3vpGlh46cvR7r/7iiTOnX33t54dXl04fXRn3BkKJoq4fPXWq2WlVRQEyXcc5AJxhw4HdGCRS16nKBOWcc11r50yuEuPJh9euF1p/6enHbVkTyozWy4uHpeA6FO54+pFEqVYrG41K6kmapmminLObW+snjy4qCTHuoRng2phcpd1GvluUldFeqkl0eLiAG83G9a31zdEY0iCFryq4VDAmjmjqX/nww4Sxs4cPP7J06M3PbpJGho4REEwwA4Y6TkRDpc7awujQiKTJunZ/cfPqm3dufGHxIPnxj77xtW989YUX/8X1G//D3/+9TFMiFHEE5mYOuYmeeM4F5ODCcs8xC88hAU0WzL04dpQChvhCchteFheO0/ATBMWGGqwTESCEYbuEgrkRlhnOMiKQQ4BqMuKpoDSp60VKdxnbAnozxhhAjpDjTHiDOi/o3ELfBIc1/DQ85LCPIT7i/p0FcC++9TgPhM10OFRcqHvgkKROW3hZYUYd728AdnjGpMRe28JuzhoQT8GvrcHARAkprN6v/SDUkI3BcG9UG8Gkh/lAODA56q/DZ2icZSA3guaIcOyRUPgDhQyQdMPzAKuzX98BHpfq0X8FHhkBpY1Fp1EoPoDbxW7u7Jydm0/G5QGZ3CJVFX9I+LOkUqPBqKqKOpGjLE8FH9c1xyF+OFxNuIMhTCN85j7K1Sa0UcsFJ5J7HTe/0VcURxeh5rIY5QuJCfjbx206Q6w/9rmQ1x6qLaUYF9rGvH8SawzM5kB4OEUkGexivPS+kSZrVJA0He7v1rpu5OkE3BV+g4SwGZUqRwtOwCrAERsZyh07UZwbwplwEOyEQgAIO0BEIgiHcYGBRh2KFnGY9RgT+WAQ2Wd9pG9CAYFZmKB+Qq0vfAa4/DYYU4GxQg4VTB6kdQB3IY4+vOrDdWdB8MxjBDHnsOdBP184ZiOuxdlUSvhPgDYOfYCbCOUJepdRLgXiP0UoBFWiwt0i0QvOQW6cC9eGSHEJEF8aGCJjIAjKthjwzdAPTfGFgBKYwIQAWm1SYwHuwPaPgHNY9HBogkFUiTqyUHxISmvnf3777vZ46KWglMmpGZTtE49fD5kEVEFbyUmikr3d7dly+Aff+eeNuQPW6rtvv3V+9Uh7ZvZHl97/t2+//ctejxCSce6FJBRSiYADzyjkPYP4LVzAzWZda83Ya1c+3Q3VIhD+KAEvIrm316uKcrHdbim1aXSWJABltaBV94NK393fP5BnS9Mda2sP04Rmo8EJ0XUtBNJ1fCrVZzs7twf9Z04cnWrm4/39JEkgg5YfPbyCpJU0TT/bus+lajWanHErxCtvvD7TbV48/5StCwpVPKr7R8Px8srKsxfOM0Hq0gghGRgyb9y5vTh3QBJemVpJubU/eOvy5UNHVj/44FKznX/j+XPcG6O1kJwwZ+vwgFRan3vi7IWLz3jqam2gfPIQ98uqSn98+fqRpaVEsLKqkjSptEaEmTHV2r0Hed6YOnDgr372969fv/bS6RMXTp2sR8PQA1JWu+rp5z53a3uv0GazP+jt7f3m7/xWNdoXQlR1eWBh/vgjx+u6QiJcRJZHdQzw/eE8rGvdyB0MGMloNKaetputtZ3ddz748EsvXZhtNva2tr1z053WwYX52K6F4hVY9kJ02t2d7QGnVHHWyLNeOS7r4sThVatNlmdCMGuI9zyVcjpv3NvZLbWpRM05UzLR2gDhgt9Ye0CQa8Yow7wjXOeE+4IX1v3gg0u1dU898uj1tftFUbZaOS6aYPEpDPXEWEZZk7GU892qMsRPdbqJkju9/e/eWXvj/vpb127+7le/8ru/+VtXtrf/6urN6SPHSgh8IHGM58GMiPoDG99K4MPD6QKgKAvxuHhiwDQP7KFA+jEeo6PR4/OQLRyn/LA/9pg+5IV3mAMQTZnQN+hT7fbvP3bqz25c++Hmhk8TgO/iFhP2spA/Cne29QSS/ryL1EbclIKiOoaRMgZcDIQth77EeMNgLs0Fh4iFGOTCQOw5WYHScJpBMwqMhtCLULBMYoEfA+OJ9YihdkZQMiD+ZtHPKtHTtohZcdH8AdItbq0hDzGOcMc7bN8pTjfjcBKT7AF64ZFGglIZGJ5ZZLN6dKB5GMuxCHiE9ENacXan1x94n1MyK5KMsQo2fQ725pzzcTnu9XbbM3P9Qs0qJapK4KULmjQOw3kD/JuJvtzHvDlwSTEuaF1NwFbOsV//qZhAGJPn4zAZ4oc8szDhdg+xo56Bj1omnorwuUCU0MNcJhyQMkw2BvYkhwmkJFRl2YiFVmJ/pweCBx5ZLDR8Y91EtYTIhNwaFxtFKaWUGGQEEiWGEmDobEFMAEIoh/9iCuFQQlAZLm2QzBlQUsUnC8pJ2GMTkAR7S0JLqomDlBCmCas8RieGc98glg1Wr0zCFgGeefy3CVAz4dsFeyYROlEPQRSYsOsRFQkaOdxdoUwdDQSwutFGQ24/QRse2kAli1IrAWUjpbSRZfc4eXnzfg+/W4o5Y/h3hQtcMJrKJDSylMWAEh9KRLhoHa56jPfaGXgG8D8B2pWnkhAJPB3HrDbaQxUMTn2PMx1Yk0NKC/6lksMGghLPaybuj8abxPlOhzZaJM01EzUNtYYXAj5m7igwShi3oVMSuqyq7c3f/4ffPH7ylHakd+1a6sknW1u////+P//qJz95s9dTLFy0KlHhVuChuJKEpUoKARwVTwVjKSHtLLWEfrKxfmN7OxSVAqFk1DMnpVovRvf3dtqd5sxUR1ttITzcghaTULo7GO4ac+zAbCalMS4c1Iy2EiVFuFckhEkxwamS1x6sEUrOLB/0WiuhEqWsNosLC81WVlcFiGL4g43NVCatPE+y5Pr9O/e2N1967nzKrNEG1vPhZ5Zlsby6fP7CeSFFrY0QDH5d1h+O7312Z2Fm1lnjQrtAfv6rj4Z1sb62trow882LTzFTe+04lVCmwSlAyIXnn37uC89aaqypESWOb6Tk8sHm7vUr1x8/doxYKxjTunLGhneIkfWNTUL5zNLBl996/ReXL3/hkSMvPnma6hpcQ6qsi2Mnjx86dvzvf/bLLGleuXr1W9/8qjAlo8xRp/LksbOnoJNz8DRBAwcvL8gtGOMCKk4XHn2YxIkkHY2KRtoUifrJ228vryxeeOxkVZQqFENu9fCqylMDVjrBIvmVEKKSRADwKElknmZ3N3caQhw5tFjVVSIlZ9IYA+8om+s0S2trpMyGu1OY0Cexsbe3Njej3MOEhi+RUoVDD2pPIbiSRvC//ejDT2599sSp01pr76kUkqNxxTtBmBQi5XQ1yVcsXUob3TQrxqO80Tq0fGTh0EoxPfP/rW383p/+2R/9uz87/9ijx6a6+9sbofkLryQDLYfDhS7qvwgH5q1zldVwTDMlwYJLPAOVCkdlFMKx0P1gLOKsQw2HYe4+6m8gUDLqhnCd5cNfanBQa30o8Nd08bdrd64M9qkSYHIgk2VZbKgscTp0BaGvgOkXZ0DIJxCHTuLd7MDjBIIuQNIDnspGirKLuTsRxg8BtbD85PD7aGc1lguChvrOGchihGOXMwnWEvRPwV3NuaescmRb1zu6cmABxAZRcCYllzDcAxWqYPDBABMpSsY8pcaBDGkCF4mdk2fYsINO0BmPEnSHK2WGmgVoOcBFCbtlANJuVeXGaJio8Bi0kySWEpBUB+GDbn93x3Ex5kokWRRDuNA/xecYmvsYD+wRLxma0Gi+kspGyTyobLHFRUwTm4RD4q8e18PY+mMEMEJLscuFRwliTiZpFbgTgEEBGORpDLqDwog7LxJVJkoDeH1nb0cIic0mdmPcuelUKeJZou7t7I2slZwD9gUp5gxN39GiDlNiWD84Tn0rUcxPspBhuY8tHQbweTdxckGlaOM1FWoL66mhTONdS4jxpIYni2AhCyAryJmOuwoJrjiIMDUIeUd4Kuya40AHdOegchfcW5QKUhyaW6MjgW4iGgy31MQSxkH4PwGJswmox9915sPxwAplvTf45kxixfCvwB2P8QYzmqBnDiUTaI4w1olDUAweoEDlhGWmYAySV2CCLQSBjsRjLhlItKw3+FXHfUx40rzxlonw5FghHZc+nDtRyReqICaJEBpZpjBrski2EfTB3Zu/e+rMb3zlG5TI7V99/PqlD//o1Z/+53/9g1c2twupEi4OeHJ6aqoRSv7wwwQVKrwTHOEqgjMlREJIM8936/E7t2+Z8A0IISSnLJyilAsld4bD69tblMvFblfYWlujNQCNqHCUPejve0JWDky7qnQgtnLOKMETITVAuJkHQ4Kprt+7c/TAzEwj9VpnmfLOplk2NzfjtYHVlOdK7uzstaVopPlI67c+eO/p0yeX56bL0QDvCUJ8WZYLBxeevfCMBDGwkglooUmSN3b7fef43OyMMTbN81sb6+/cuCE5f+7MyWdOP6KLoTdWhksDBkkQfv25Fz53/rlnaqvD7cKlj8Sb8OSrRP3qs7vOuJWpqWI0ttZYbdFotvZg3RjXPTD7d+++87P3P/rCqaNfff5JampCfJKKohodmJ9/7uLFDz65/Nna2qC3+0++/uXDi/NlNeaSWudOPPZIZ6pVVyXC41AlFBXGIHMJByMXZe2RcCsobzZbVVkvHDjw1rVrG9sbv/nVz9u6wCN1anZm7uCCwZhnSPWaoA6p5IJxKlKZpalS8t7W9pGVxQ4gwyhleZ55jHa3Zq7bJoQYY7B9d8Yao1Wa3Nve3i6K0CtbN6pKY41UPFWKE654eJKgwBIsET+/cvnGxlqep8W4IJSkiUoSieMfTmhV66V247eeeaZhTLeRz03PrT/Y1LpOk6zRnWouLw263b++fuv/fO31nhB7+3vDYY8LjueKgWIfR7XIEISBpxOQ7AJoYm/jcAjgUORhuio2uZFpYCACFGeAUdQB3zS+oA4og9DAIN9+Iizl7F5Zfe/27XuhjxcxjNJbpI7gVEtyKUQo9aNOEw4Q/zDEAAyKlCA4CDBHNOp/0AMMTb7jFNVtTID+F9zDKOACkRehkoKeDc5sRzHyhUNuukYPo4eyErjyeDESJwS8Nh5nAyA6g6YD1niMR/Oui3cK5KQhRB/KAok6ELgp8FpzMS+RoVMmHImeA9dBwHcwieNlnDKOiXJSirH1d3Z2vJCCkmkVOmXy0NBDqZRyd3ffOFdxrpWSPJQ5nDnoM9EL4+kkoInhfYne33BVEsqVIxi8GwMDAWSIO3kaYU4YlvHQH4OoLz/hi0RFH+OMS5ihWhJlQ4RHuzBac8L9LrBr9V54x5OkLzmVshiNx+ORVBI616hVEp5McckILxi9tb3lEHXhYFABlM3YyeM37QgMSiNhCtS5JHZ42JQCPRFZplhFgDcPxfEegTFmstKwmL8LbVYEooK7HUvPaD7DKQIE26EHzyGUFZasujYYguSBo8yVcPHxivhJCAkJ33A45bF7mBjYwQ7nUYKBmKqY+AGiaW1dIehAMI2Uc7CxOxx4wTBwEnAJtzVundiv80RBhhY+YSWkEhKdUJR4BQhJChfmQ6Qn4lxQSYGYOjxgKWg6WThd4trYhK4NlCrhY3Q1OEMBdBc+VW0d4dzSKPMzxBLF79+6+ZVDK//6n/5nTpu/eeUn//2f/Ml/+4Mf/PXaA7a00lladt5NW/MHz1548ejxWmtbVB1CUiZQbwIGv1D5O2sZIUmavvfZjfVai0Shwy1Lk1QluAUYevLJ5o6r7aFWR8FnhfI343xB3J3trdk0mW7m2tQwpbfOm0yGm76qSiCthJdwvd/f6fXOHl8NrxacOIT4Q0sHszyxzghg0xPGHmxst9Ok0cg+vnndUvvM449V4/HDDObhcDA7O3v+mfOeunBbAHwAymWa5I17D7ayNOk0m5RSTckr779fe/e1i+dPH16sx33MTXHUhf+tDfXMxRcuPnH+bKnLUFdKaUHXx3EVYZ1I1C/ffndpfn620fHGOWM4F1zyjY2N0XjcmZt968rlV9957/nTx//Bc08zoxnxKpG61s1mduHiBUfpyz/7xe5g+LUvXvz6S8/v721Jpbz3K0cOrR5dHVclCkthhkgwFgzy8TCV21PGrDWJygjhknGlkvG4yvLklbfe/o2vvDDXSOuiZJxyKY6fOM6VIIQKqXwUBEHWtBBpmqA6CdTRtjfaf/zUSUnh5eAsa6Qw0edG1+1GgxBS6ApsdQR0T9Qzce3+vRoaGliBc+tcVdaJSBoqk4wngivGEqnC9ZPJWxvr46qGLWM4HAXjeZI2GE+LUlb2xtp6zejjJ07c3drKGq2l5UUNB6i1zmhNhfRTU3t5s8dFa2auGNfGAIIQ0L7oBwFqlLPGg0gY5CC6BsIUjZh9HwXQocJAr82E+4jUOiAWeACa06h0izEqwMNAwSY4adyEJhkOASFN3nQRo0gx7N8BETGG0UdwbShrLF7siJd0OM3lxFMQhnEhFQxsLfS3ZMIyikmFoEkARc5EA+/D5R0BGCDQiwYYKNFgdxbK91AvgUw9NE0w/SEIuQ19uUcPiKfAaQ3Fu41bW2csRZgEXs7QV8F0PZxZAkbKeGNQOglmhZEhjv3go0GmCeyVoYBArgm0zxCZ44kMHyi/t7dXQDTcbKIUHvWIaiCeSzUaj0fF2CWiSHKlEuEs/CyCy1YeEVTx8yIxBIlYp63VocuW0mO8D430SkofphHGdAwxicyhUYjlSfR/QWMJ629JeGgwiDcgloHBOvEcBhpwprvwYQHWkgPgQiXJppAsUb37mwT2RhhzC0+SyySfkjzhokfc/f3dRCbQcBtGmMOWDptCZynsA8BFE55RQumwNpF0BUZ1zOB06AuDLgGbd3D3E1xW40uO/Sg+JeFnwjjNo9QeSgqA5grKCJcCFIMOQ2K5kNBWW4oDGog5YliugHIPbgvjUNIA5nrJuefcWgtzMwdTO3woJiCbKJIknBE8QYA8w0KvyyW+BjAL8rA2ZpSCeESHk91iIREaYUNwVk/C4wvCJZhCGSupCBWzIwIWP4Jx5qgSHDIYLIreLdK3QCuB9S/K2r11QkljLAPnvUFthrVUSAdVjomEbdhMAyQI6DrhF04U31t/cGp65vd/+9t/+e7b3331xx9s7wyzZn7o6IE8o5QXprTGvHj8xOn5he/+4K8OSPnUo6ceFKM3b99yQiJCHXNXlJSSkNLYD+5ihJFQKtydzvoKBbTgRHp/ba0aj+eSpJNma9YJFj4fQWm/LDd7+8cPLUnwIwrJrDeKMClYlqjSmNrp0NwJ/una/XYjWZ1uAzAoPCBpqqbbTYgIJ4kAXEddbQ+LuW53WBWXPvn48bOnwD5nUKMwHhfTc/H2BfMa8kqJkLLWlZfy1r37EthMWZ5/cPvW1bW1f/LCsyfmZ+vBkMPchSnuvK/r2hF/8cXPnzj72HBccMIcjUJ2H136ngnWG44vX7n5xPIKB6s4jHbZ5vbeYDiemj3w7tVPX33zrReefOyFJ0/7ukRZP1gC/NPPXZidn3/342tvv/PeF5+78Dvf+ubW2n1PvOBSZfLIiaNwZ8A5BRtENDmCbyHme0L4mdO6ypLcOS+UcoY6Kd77+JMzR5aef/zU7voDIWRdV+2Zbne6W2tNmXTwCqOACKlJ0IrwRCrN5O5er5vnq8uLZV1y2EQyVOlbm3DZUAknpKy1xXgyGl7oXl1cW39ACIFu1lWV5mlijRmVRSNPc5FUugqVCudpkpdVgc5b6+1gXORKCmhuUk5ePHMiLYr7272ffXR5xLxn9N7mg6X5g2meGeNh0wfR47DT9ExmTaX8Q/4jpyK8oeB5E4BYgqBfHW47462EZBcOknyUNXEujNFofRiNR5TRPE0pWEtxfwzhDTy8/tjbcBbjSn1cwMYtM4AtJRA94a4GIBRMOuPNDuQyCl0jiWlJmPnPUUkXrSNw+4JbisLsAZVTTnBmEbYP4jvAPjOQ3zomBZT+kY8Jo2iMCPSY8I+xMI5YMrlDLMxpowzKoGgLqX2OOMpBWI3zaasN4UQw7hjRYDQXlFXmP+jG4O9CISoFOj16Q3G2FyNdIUUJujHLCHckNE4ARwDeBdQQIEyjghKl+INeb1tXs5x3LWtIPoQQHWdR58W8c3t7+93F5T0p59IkGfULzzlBfi+DWTVomFG9zqKvxaM2XEjCudcusoExvQol5ujEx5CCGBGMI3TPYsK9x8zI8NM4DJAR0I8Ujzg7jUtkxyOai6K3RjEu03zMOVN8d28P5AdxawyFI+lI2SYs4WxtONzTteIM+4VQHgGNxMfWz5P49COpmTAu0JgMv2P88P0kMTI62WE8Fmobhr5iFhVV8C7BvDP8E8aE59TG3Ccfnj9Q3pr4eEEph2jUcKd6sMwSAXjvyJKEJA7oxi0+K8ZbHA4DJcMphcnMLMJgYYruJ306iRhYF8sF2MwblHyTCcAFqoHourLeUgRQxqDmKEGAWbiAC1d5KpxLCM0ozahIqUiIwBQV4MTBYQ0rdaAKckIjCgdk/Z4z2MbycBnALHoyAQHVMcRdRe8BSOnDpY25EZMaWo5GgznOnzl58o/+4t/9yz//078rtT10uLO0JJPUGKe9dYxnlEhj/+2P//bY4sE//OKXnm8079+5CzP/cLlyT5tKdRuNVCjB2N3NrVs7u4KyhIt23jLalnUN3ymM0yX/4M7trV5vSqiFVgfCGJwxLk3kflE6Qlanumgr8N5JLhTQIduNvKrLwhiYebMHGw8OLx7oJopBdjWlfm5uTirhgfAA+Y/haxtW1VSn+9HVTxMlTh1ZHQ0GDJ54reupme4zzz2rUmU1rAZEjBYHU7gUKl3f2uuopNtsas5++uYbX3zqzLnjh6vRiENofKiOiC8rXWv71NNPnTz9SFEUdEK5Q4sramecJ41m49Obn/V2dh85emQ0GhJPpUp2+4Ptvf28O/3up5++/MZbX7pw9isXniC6BstfKL3HVXn26XMHV5eN9z/42x+fPHL49/+Tb1PqRqNhEo4Jf/SR40maGWMkbB2xCIe5FNjDPGPhm4F0VQdLTBEeklaroyl/9/LVNEt/77f/UdXbR7mnSrLlIyugEQW1YqTWxVMjNo6EZGlKhNjt988eX+22muFyCrekllJwIcJxbbzgTElhQi0LOV3ONrLsXq+/V1bNRNZVrZRsNvJyXOA+uD8KNU230c5EAkwW08wbrTyb/F0AynHWWKO1Hu9sv7Sy9M+ffbrJ/Ke7293uVKfd6I+GSI9C4jyoz5jzcSwHWioKQDoP+EIg0JHoDcEjSIR3IWFcEtg6g+DJIUGbM479VaqUABUGDGxwzOURxsQoRqMYvFlx6wSHwUTlhRw9jyQepDkCDdDhXI9jmBKLd4LDToNHO47DQTRmIIDfjwIMEoVjAEREPiXwN/AYwEkjZyJGBnE2yblHlzOLvC0MoQPQFd6y8IrEGgD6bkc9BCATRIK4dpKkTIAJ2HMRUw5RVG4AFQSHkgj/RjLJMMY5PjI+w6dn0IbtnIY5o4NxkWDhyIsqVPgr0M0M0zVHnHEsnHhsz9l7/aEQIvW+yxV30biFcmHG/e7OlqdsyLhIEgWSL4Zh+9Rz2JkCe8c/1CwDK9NjcADlEhNgJ6G/HgoOCsykqMdijlqMeMf4K4djD4/xw7DTU6HMd87g/wqzfllcF8CUzcdYLeGJIl4q4ZK0ZrKuzaDXExyDqfB7IMLYaZWlkGd+c2u7IlQywj2e/ngN4IQUhdWMU4WoiXB2YiOP9C3Q8YXrwSHexCKhLe5W4Y6hjqArwON8Jo5T0FtFjYsRp4i99qETgTR/H1O/wI4OIcnQangaJwgIsRJgPwjXAOPG2tpo5wzIxRh+xh4/GUYtiC+jgZVDkJ8xDhtqyPRCHB2gqgjmZ5EY1QCln3cGUGcQOAH6ER6zyJyxThtGSEJISkiD0DblHcZahLYoWMG94YQoSoGK7TEcVMMwCPEaAGYK1wyMvzDrGqxlJIJ4OGPaGU2dwTlUaN+JcQ6eewplDABnGKnLYri9VRP6J++88/be/uzqiamFZarS0lhjrfGWMzHoDwpPrty//+z8yneWjxxtNe73e7tVBZAe307SuU5nvjvVVFIyJpNsvT8Y1qbVzLNUjUZDbW04nakTnKZJIlV+dzT+5N6akunK1LSC2FWE5Kxvb0kpZjotrWuIkHJ5moSGl7CpTqvSuqqt82yrtz8ejo8sLnDvhGTe2Uaez0x3MfQNM1EF4+OyHleGq+TKtWtPnXtceq11TSF4mHJ+7vxTzVazqkvYv0MJCbMhXJfU2q7vDjqtvNXMP7h6Je80f/OLF/t7eyoczZg1Er4R4t2Zx0+fOnuqrEpKLBCAkYNGMeHDI1hApG9cut7hfL6VG2OEkr3RaGtnr9HtvHPtk5+88/Y3PvfUi0+etUXJfKQJFrU5+ujJk4+eokK9d+mT+3fu/Mt/8c8auert79dl6RldWD44c2AWDHqQBeJAMEUFOI8YImJ8qCxDAWZsTahT4D1LGvm7lz/tDcf/9X/6nXAdwvbXart8aLHb6eBmlFHAE6LQH0EaQsZnjNHeoM8Ze+bsKQIyMeiFSJqkaZJihFsiZZ6lxoZ/Oxcs1MeKvX/jxnK3/cVTjxqth6NCJbLdyG1VN1JFCR0Ox96TVrOZK+WtraqikanZbqOTZQnsoY11RVlayT7a2PjpR1eWZ2bOH1oyjBpjO63pNG2AuAo0FEhfsFHLgd0ejUV15GCgWAkpA6H+Bgg5RsZ7yDuhuBIOjZjXzsI8n6gkTZIUQnsoqE+RKo9xOGCMhZMCSnOG+aoWXBiT3GCQTzq0mYLeyhoE+kBH4GGgZQHhKfBiBjQl/GYEiLkODwOIifPRUGJqC6AAANxiC06iwxAUAQx1MB4sCiCCgSREr0GxibcIIAfg66acGug9HbETmwZWHeHErT26MmgzVRJoRxROQoKScpz6QEIhgTtcMBmKG9wZhy4ZBDge0/XQUMJQHwa+a5yYhHvAUQ9h6mDyYkBUwd0dC0W/Iezu7h6Fdm0qS0TUdWEZxCRXvUGvNNqo1KtUSsGI48QL6vGgB+lx9AGjoQslc+jFYFxhnnEc5dNJUj/BBt0zZEqQiOyAtTCg0Shx6MgKv60AoCjsYCIuPLLRwHUKzmIRmk4CC33CsnQoqFdqMB6XZcklR20VdsEZdbOJTKioiF/b3aeEZ0yI0E8SvOPCfRw+che+fgqNX0wSi1w3WOkbgqRoGA5jQjB2mxgJCDUdcVh8s8jCht0ixy0daK4mDjP0KDMRbdMY0GsNsqqsi/+ih3RKsF16FEcb6zCtE/RZwsJoKNSncWFnkObMYrAJlsiwXsX4Kli+euK1NgYhJ9DeWRfzxbQB4CVS2CYMMmS2CckFcdIT6b20VnmTEzunZJtyBTxW6alkPIHsa+aZiJGSWLYwNO8ycI5TAoRNitGLYPPHRSzMPLFzwURpWIw7bNCtsxjwTSir62p7Z4vwZEBlduDQ1MFDhpCqrmAHBFttIjZ3Nx5s3C8IoZ3uYnvK1e7Dz9be++xmu5nNtZor0zOLU52GlEC3s3meWMk/XbuXNhrtdqcoSmtNI0s5pblKO822C5exHHryk6vXCkIWG41WhIeGVmNvf68phQrng6GhWqKddhMORTfVbjpjC10TKdb7+4LYhW43nDaCcUamptoKtJiAK3NCcHBI21TKB9vb3NkjS/OD/oAzDmhF9vhTT7Sm2lVVqfB9gNEehvm49RCca62HRTk7PTXU+t0PP/zd/+gfM1NR50IlATBChNKvHj385PknjK1h7gdmKkxJh6Mf8KSMS1UZ98Y77586dlxqp5Qqdb21tyeb2VtXr7z2/qXf+tJzzz3x2HjQ9zjY4L7SevbgwrPPX8Ty/xdvvP6db39r9dDCaDTa39kpK93odI4cPWpMOI1FzA0ABzzKOkE8hecGA3m00bVUknKmlNoblZc+eP9f/d5/fGx1qdfvQfY27Uy1Zw/OmapiMcSFWFgqecYQ4kgjR4Imad7b3X9sdWVpbqauSnAaMhSxSMHCCwhnqpRcg6hFMKZS+aC3v7G9dWx5eXV+YXVhnhE/2B8kWZLlymo91W4rlQwGY+t8p93sNJuM0t5g4LQ7MD2zfGC+laTUWuKJruu5Ttd59vIbbxcwREuTvNao+I2GTVA2OM8gRRuGqzFMyFh0/TnMLIWTVwkpMDmewqiMhqcBFoDRZQScdzgzGQVLosUbHToBFNJHGhULFwNmM2CAO1TGPnyIHO5auAcdj40VZLnDqcJ93IM6mGbTiJqEGwn/AYRRx1hhifw/mK9Qi2ea8cyB/cwBLc8LjziLSPsANgusKqEohLY+/GoAuyXxPsKICEIA4zDhVbmHocTgyLHe1SCGBTMYge1D+Oc53nwUu3iJ1i3gY3jEUHPENcKS0MdA5DjlRZ0gOpJCOxTB9iChILgE9UjqjTpzmGA82N8bh3OYt4TIEEqN2GZPmRRlUfYHAyLFmFGWJByJ+jjwiISoyb4dowTR5gaSKdBECxJFdTSGSaJuG/WIAPrCCxld9pRH5bSLoBSuGIgPJ4Jehpc9w66XwHyKeGop/GZeeguYcsql3N3vG+dAXAd9K7TADcG7QggpN8tydzTIpWxwLkmcU8A3B9nVgJqC1RduYnALxgByRAUVUXuIQUnQqsJoGE1wRhutgZpFJtn48DdR4zQFBaa1mkaQuLNWg7bZo1XXA1fSwpDzYWLJQ1MQ1vUYFCGVFFI4iPiFwY+UXAI1iaPPnXLI6MXihkdRNOwqQg+FZF2QX0T8SvyTfSywITuK4YvBCVJKAGLrSGgQnU84D92EA9+XdS3CGo4lgOmSnAgklDGqQMqMumgaUQowZQICnI+BWngRUKSO4MTI0ZiLzLmADOOImQGvVniPwDnItal7/V7abE4tLqedKUNJDTEYQIuLbx2+MEsLi0qlH21v3Ozt3R8MKm/OrKwcSRvzKssIlzBOHxcj6kkzSWtPdkbDJFHD4VBw0chy7nwqBGFid2/f4RtOyN/dv3O/vz/faM1lOZYG2tphOZ7utHEt4r3P0jxLc9C4kOl2k3hSVOHd39jrz3Ta080GFHa+kefT012OwitHhBAcwWzGZYJcv3vn8cdPOV3q2gjG6lqvrB5aPbwCzxKPgk9cl0DcKYxz2HA43tvfP3Tw4LtXPlk9unL+zKnN9fVWM+OCW+tRLXtgbubZ55/2HMGiDEQo0VmNOhhUtKssv/1g896dtccOH6aEVNr1hiOeJ69fvvzLSx/97m989ZmTx4u9fWAyhidqXFXNmanPv/RF7ayQ4tIHlw7MTL304ud0VY6Ho2F/KKQ4cuIIgaglGo95yHvjKC6I+yoqGQSyIBbaKcC0cSE++vijb3ztxS8+80Q17HEGmdOcHT66KgWPlinADzHQxCLknFjssQmC46vx8Pknz0gpcK4rhMBHM8/S0AHCcS+EBDeqtNZTIS59druTqGaWfvdnr5Wmnpma6nQ6G1tbXCVZo2G06bQa7VbTGu2da+eNuakZJdRgNBqPx800P3TgwOLMTMp4Smjbu3NHVpeWDn58646BoRZKdmH0AaxFbxkXhGCcH967pK61Q/6TQamWxVPDgl0GVqEEhIugjrCRahFaXxwDuKju5BTqeKj9ccgMRzqeAyiB5JE4CF9nXBVRrI3RS4UNiZ8sgEM/yGFLhuGoqAzCmDXsZsLXIVAvG36igFE/pgNgTC2lTOsaj+PaYlxgfLJx8Anmb5iKgLuMctyK4SdEUT/qkEGNS8mJahvPNPB0AKsr3LxE45Eyof5CyRAxnLgFg8EJ5C/BawU/DxAl0aeKT1lUphHPrLMmNC3hN7Sm9hYdSejXnuTHwsScUw6iELFXlFtlxblsetISIoJXcWIM9sL9/T3K+YhzkeXKee5R8wyBzT5CNrB4ZJPNBaR3QG8uYv2Kfwuiu0AVD/1hqNejGD6agyfJhVEmzaSI4QERsoH1j58gh7GrQ0lY+IZSxqhKx1wKKfd29/CJ8X5Cy3S+q1QbJOB3h8O+KZucJdYLwlIhYcHLfp3XACUbFgoIf4roDMYi/QGuSaSIhJ7RWBpHP/gHuIlyAaGDFFMHoqeXktrUUAqjeMsbE304zupIRUU3NP7mAH+BRiQ8CnxS/VGcq1ACNgkyGfXH+TgXFG1hNlbVBHXIBIjwnIvQdwsZmXxS0Sjkwy+OER+OJAaGBrinQdQHLh0AUjvmYOxPaWLJtGrk4SfgCAieYE6JM8w5BQFtQLZzBtHhgN8K5x1K9mEPRMH6iT4J9FMZF1p80HWBmQRszihHddHURCxs7FvtTtaZKr2vAAYbflvYlz9clXnnOq2pTrOj0myfkCt7O0eOrJ5dXJwbF8/NzTddPE76wwEhPk8V86SR5wy0bHmadps5814qZbQdDgadZivLM+dsmqaX9/ffvPVZlvClTodArTAqq1FRdJotmDGED6TVbIZiEewN7SxtNrP+aKSN2R8MDkxPCVhbSCHarVaeZoBbsjCCho6W8zTLR+OCEnfy+OHB/j4TTBvTaDSOHj9e6xohLTAaCje+xYwYkP5xxoqiGBelUMmV61e//e1vDfd3QFbMjTNC8izPW532kxeeVGmitcE8F1ziIRoFQ9JAPefSVudnb74712gvzs1XtR5WhZHs7z649M7VT//Lf/rtc0dWdnd2IgKXsqIsm93pz7/0RXDQ+aKo93d3vvn1r9RVaWq9vb3lCVk9dqTRbBij8chzuJ3iSPiHpgbZbpHyBxNLIYAuwje2NmY6ra++8LmqHDnnqqoilM0vLWTNzEJJijRTCFwTbGJfxAjO0McI7rzptrNjhxZ0VU2k+YjkoSpRFGQKgoUXICoSiNseDj+8fev04ZWZRpOmye5wNByNmlk6053Z3+95Ep6Q0XDsnW21Wt56XWtJ+dzUlJJye2d/e2+XeD/daC5NT3cYO5Q3R2sPuLdZM9fOlLrCo5nGDVs0H0cy+SQKF9K1KU6AYkAFjcOqcGfbiMOzLpT44TLwEW+EtkiI5yPeOAYngwZeHpPcEUujyQStxhSIsDTC6mH6Z7wxGsgPkHuGByWGmQlkAhOUqVvchcEv4qyGtEEBfmNoONC5Y/Hnx3MscpziiDHUFEbrOtyvKH4WGLDL8UiFSFSCSh2UtoKtHsWwgKlCwzSmECBjBFWr0NDaCK4Jl2oX+k4Hu0JMu8RxPbZVWIECe9zCtwI9N8cBP43XMKoe4XLCj91aC4kXE8RunF46QYkKP8JQ60CdyjIhR07fG4yYFLl3bcWtxwEDzmrCwb6/v2cJGTFJVZLCkgsqe+yPIpIkqokmWGqPWXXh4pAOtTtoCMY43knqEZRHoDyOMvkox8JbBz9HCSeAjetvvKoxSY/G7S9GdOGeKuHKSlUCvq7f2xVKkmgnhtGL89NJknlPOb+933eEtaVMQbuLRjZB4/AhDqvQl0qRNOEATw0mVY7SLkyf58ithF8Twv+4CI+0YFGmDMnO8SoH/b61DtaBEnVnxHMYuICykf66DoHWHp/OGPsPpEb42CmHe5HiqHjCB0P7MnA5UD5vwYaPCS8wocfEDCGlYNH2STHnC8KlofsOZaJxsZIEpTHe9cAdRWtzjE/hEEamGbEy/H+YsW6oyxLgrfg+cU8lxFiSaN102GfHSCusarEcBkUII6jqoha4AFCUo9xtMqJgMXsCAhFif8ZV4gU31uH0IPwNGNDhJ5i0UH9TUL7UeZbXhAxy2Ww2Nq999sTKkSdWDkrOLCUbO9vOuqlmW8kUuKBOMN5utDpZzmBwNxiFRmam2cqVdLUOnSgXY0L+5uOPS+cXOy1uDSd+WNdlWTXSBLf5SsgsTcJNIBNrXS7l9Ey3Nx4Ya+uqmO40QYwVTpDO9DSaKQlnEoavxhnCyKgsb23sPHPuTEMJZ8Lppq05fOxwo5lbGN4CEQXrcXx0AEAPsXf9QY8TcvXO3YMLc+fOntrZ2VYqoaHd540s45ycv/D0zMGF0hgQPxI2UXZiu4ldJ4VbWVv/1ru/emJlOeOi0Lpi7vuv/fzD2zf/8L/6vYuPHltfXxcc9ZJkWFRZu/u5l17IGqnRlWD88seXz5w+3e12KaE7W9vjUbF8+ND07JQ1Br5xGPgxmIX4GLkDfgsc3cEsjVKtNaPcg+yfWHPi+BHnLJfSUDeuytZ0d/HQMlrsiJuUsJOTlKJ1ENRkWpvpqRlK2MGDi3meOFuBcZZHOAEhkksuGJ5U4deC6jDJ8ks3rtfWnTp86Pj8bG5trlQzz0fDUa6Shbm5QX9Y13Ujz7XWw8FIJQmk7TpB2cLsbLvR6A8G23t7nvic8UOt9jzlxw4u0TTdq4p21mymDQMFbrhUwesvqbBQaeIJj0Fb8NphLlEMwAOyOAN1pqAWoqxRsU2cQyiiwyRgmDM7FyF2PkJoDWYewKnHEESK+hFk1sI/zRkKjBz8RTZOMhmqfdBo6lk0CMVJduTsQJo99n0WprEMJ2zQUmPAKPv1vC002wyMgJxzUJBF0kiEAeE3iLJXjPnB1EHwXgK5z03ARg6fK8cAOeDR0QYoXw/EC9xnuXqp0ZpJcg4Mg9gJTpYUztsJbgzmomCiRJUsjemxESYEJxv4cSFpSkCZA7I9JgiR1Oect3nSYCylNGMkA9Qw9VYxZim/2+/5cB+4lkyEw/YzGoaklKPBoLJ6LKUVMglvhOeUCITexzWwYxOKJaeTxx6TA8TESRY1dCwaTxHfCFxoFrtotHI9vM1BTEKFQMAwmM+RsI08tfBvYhPTeJSIeEpTWXNBVDIc9MqqAgIqQSWzJySlviMUJ7Qk/t7enqJkNkvz0JiEr1cQByIJD65WQMdAvWYgDZqw8Oab0PaRaH9FzZ3Thmj0I4FgVODT4zwBMXLo+oBUD/IywMYxmCMRGsUCuE6GvhqWEEJyKhKhGOelqYG/w1G5AFnuLuaKwEyJSwE6QERVc3Akk8rUla3JpIdGSIIxBl1x6DnGoQ9YpEDQAFMYKSQE74dOysMtTiNzMxxIMLkHp5QhzlrI9eSCK8all2Jsy5p4y4SmtPK8AOmTZOF/xgkXTJoISadQLDNrHMBDQFHpSGhT0A8Nx7DA0CeETEcb1QQ/A25xC8CI8CGTyeacEtBiU0R8AJIGhZ0ggohTBdbMMynEezs73//5691Gq9XM3vns5mY53u33Giqdn5nNpBKe7vcGxPv5qelMKUd8WZtRUVZV1e208kwRqKLA0Vsrxi5trH+8tb00M9NWglAyrkseitmEhzORpYlCRE6mFKcslXJherY/HO4N+pTTmZkZjMBq5k3gIIpQB8KrCwM2nii1s7uj6+rik2fKfl8miSOu3W4uLi6YugbJEiDGMIElvPER+gadG9NV7bS+vXb/61//MjFaVzqVUiqhksx4f/zUI0urK+FiA3k/FF6hDgv1J+punZNUOE8TlXx28+bGnXtnT5zQdTVy5vs/e227HP9vf/jffP6pM59euwLlMLXeFUWlssbnX/pCq5OVVSE4v/PZremZzuz8nDW+GBebWxuz83NzC/M1mE8gBgs5MpNWAas/yjG0lnhvwgOHuGsoDmBMkudpKEWlGBcFk3xpdRm7Dg7JK9461M9bAN9GTzxjxntt9OzcTFGUc9MzwJoAPJwz2mkQP7FEhc/IohAR1lhZkvXq+v3bt59aWVycmupI/sK5J/aH43GtW51mVZfU+5mpqWI8HhdFt9up63J3vxeuNUHrsvLGzk135qamjTYbWzva2CYTJw/MdJXc6PVubG9b75hMWDhaKU4JQV6E0WwW+VQccXcgC0AHBmxnWDT4epwUwvGNi0rnJYMJFvoxwAPNIO8HCU2Si4QnoLHCf4nT0OrGQDJUSloCIudJCgsDnk841KwNfSl/6G2xWDRhpY1aKkbA44qoWyqoAJGnQxnmZDHp8DeCBaqEKDLcw4Z7LPwfSx/2mFAnhVNAWz0uRtpobIJd/IfAe8Im60Yf/rFwyIDWhEPbABwiJwVREArpOd8eD0tdUUY1BGXCkDLOkAgTjmLgUpwXMs8EhwIRUxNDoRLqHoap9Ghi9l5wbjHmj9jE+y5POkK0BWsw1uIyZzyhPuMso14Qy4VY6w8q7SgT7TTJYU8engKGsBFW62o8GPhEaSGUSpmjzBFO4rSWxmQjlFnHRCkcfEKnqWg0FuAeNkYMEqyxuI8ffRT4TnoaiinJKhzL1miPEwS0CkMxRCNZ1IMDmGBaUzgn0mwcSke1s7uLAe+TqMjwTTcZbQlBpdwpit3RMOOyy2UDtCjYSeNklROMkLfoYgdgYDjXBYDSPEMSE5Z9GDMCIntQWwEywkejEph0OY+KKxJz+ZARHaXxxmtIAPOIuYj1V3iaw++dcsnDHekxfCt8KMCPBQUEwDForMWgjI0OgUylkisY/wOwzULfzOMtTia1a11qawyJciuQVftQKcRQfBJx3DCxxJmR4UwAKgMyS2AsB7IJXzo7cG7oydC5oXEVidUu9nbOWw2aMjT7gt2QCKgMKMQz0FgfO1xdQ/NmcS/oqHMkahgp5dZinUGQjWQgeihiW0CJjuEtWMCKqNNwMMwjMaoEPo0tGKUdWjpwdzD84afXeqNBJ8kOdKcVBBX3h/0sSQ7NH2xI5Z3Z7fd7ozEhdH56erbTJZ71+wMYTRJq9bcuPD27tPC3v/owbeYrrbY3blzrPEkbiUKMaCIVjE1gVCK412Zx7oBgbK/fm2q1uq2mh1z0ZqclpDRglwxdEAt9hxCh8tne3j2xuLA0O1WOS0qZMXZ1dSURXNflJGLMkYlnAyFH7D8IC90cjmYPTD9+5rHe9nY9KhAcTqiZX1o4cepUaWtMgYyLORhlgxodmiHmrTfe2SRL33v/o4Xu1OL8/Nre7vde+XHeTv743/x3z5078+mnV8ajEpWAtTZ5q/HSl19oNrNyNBaU9fb28kZ2+PDhUAE6s7W+0Wy0FhcXJ2AMDlRJEu01KA7xkdTPMBrSIUPYcRGqNEl5MR5ljUbWaNhQ3Vpd6+XV1Ua7pZ0mnMbNJoyUIyc4dktgCjCm2WgopbSp8kbmrA5doIUBLHRILvyLWCIlOnMYIXmSyFx9cP1qpc3F049xa4yuD7QbZw4t9fuDcVl3Wx0E1M/NzBljB8NiamqGUbq703OWpGlqQRXSzPKZbtc5uzscDHTd7ORPnHmEMDbynioQwTtjY3g+Regj2g1YPMiYg87YYSIMxcyVcGvCm+jQoIjaDhyPuVCJWphaIyI+VFQ61D0CChvniAbDBjWAhI02iYngCz5GnI3FJLQYX8YwW45OksxBez/hUALqDu1EoMACExc0Mw4zgGM2/yTQMP5fSzhh3jiUMhDn4WSAFao11lnOuJuE5YXSIUkZvAsEhVGYqAhKIEa8ovFWRxEwjHYgOQYhXqB4ha0sECNhXM7iQNwhk5qhCQGRi/FeItoZTzg0DCxyo2Dbh4RUYp3gksGpCewIknk6pUKPx63jxjWEYrA7k+Fi5B7Iy4LyfjHeKYeUywZhbQSAxfE5mKy83e/tMS4LAuk6HgICIJCfE1T4YIKCj+4s3LYCTx+mszhqDT8o+pQmo3USO20SgVmIvom7bcJoqGSp84ZCtmH4O6E2ppOwehLzGDCMikhKfZ4XsI3Y3d3hNEqNQUQQHoiuEDmjPEnu9nojp9syldpI5xNCJQguWVQYeLi8CZjqADQ9eSsYEwz4ZQ5zMaFtxSWBteah8Tw+sDTqFDiXjHPg74cvDZmjKLLCSzd0Kk6DGyc+lwzJnkwQSn6t/IalgrNWQIYa8fh6wbjfIwnHIywNancb0x9dRM2BntYDNjL8KYmSgPeMScYu5l5D+nToozgxVjqbOgL4n/AzAWlLwp1HQQEQahFaOT80pvBk5HzfuYKQCuZcMNIJd6/F5C4fiVbwS1L0L4pwh1nBBOJKPQ66KK2MiXGWPso+cH6NXz0HVReE6QrmJ/KxGJ2Gbw6UGlCoSfAQgq7ScU6ruqrrekDI/8/UnwVrdt3nffCa937HM3QfdDfQQHcDaBIgQIAAOEKkKJqUKemzpE+yS5YURXF84SpXOeWq6CoVJTdO5cI3uUqqXEnKFylXynYsO7ItRbEqMmkOkkmKkggRhAiImBqNHk6f6R323mtKredZ+yCWqmyaQPc577v3Wv/heX6PnDfNZHr2/r1f+vhLL1y8fNG51piU8nbbTxq7v5xZU76Aw9PT1bZrXbM7nzXWbjbbe4eHrnXWumHbf/755z506eDRhy9/5bUfvLNePXHpwOS03m7ZdpQ7Q9nGtaTaWedc03RD9/DB3u5scu/4eG+x07omJzGbzuaLRa0xy1Nose6SISepzfrs9OWPPdc6u+nWCfvFy5cved/DgpKjDzBRCEapMZ+KEBUtVNf1Zyl/+uMvzieTzeq036yM1j5E27jnX3xeGUgTuM0rR6eqwypZyxaTMbSUebUdvvbVr7/0kY/cOnzwf/zO7zz51OP/8L//zQ9ff+TO7Vt337+nIDfYbNbT5exLX/7C3t6s77ZG6X7bCaUOrlzqw2CNXp0ehRiu3bghjcbWP45Wbzka0ypXKCpKcAU7VxL0hFFS6+12m1IqB1FKRukw+MVyubu/54Mfg7lraGiWGdG/lj0ahjqq7/vlfB6HsJzPZ7M2oRkz2sAhqs5XYcaUV6A8OSHO2+Z0GL712msvPX7tyt5eDF5bN59O03q9nM66bbfdbtumseWfl/v7+/0wnK7O9i/sz+ezk5PTwXuwqWX2UWWxv7trrH7rweHX3nxrLXOXhq0QbTtBWCrL78TfnoceX0nS91TWOQgyKFJlEpfSWShRanWhLGafOeUAngZXVKDmBFnTggl7SjUOhyLSBCokxfMKmbKVDySyimgfNV8xqEPA2mNTxRNPQc03WktjiHXGjAOKBwzOOgQtpfKlSEniLLV1EXd5BhRTspvXWdVRhwQmE+prkhZkklpCttI0bbmGkY2D31RjcySGADKHQXGgKUgcQaQ47EKOQGIMoXwSekRBcP0hsMUDUVs6SGtz9VzVGT7KncgmvqbERkYXawEcLqQ3qRVyz01a0BHgO1YRUeiy/D9K52Oktrnc2F0a3ludyca1Ke1Zi2SBmj6AWkodHx9lmbbahMnEQbCObhBXUZ0qoxiqhpEKvQihdHfKNhlJULpehDCDMcUXjENyu9j6MU2fktlSSaUsYQGoLq/KQJJKVUoHcZhVPumMGazttQner1crg8OZA2peS7uumeacjHnz9CSIOLe6lXJi7ITCU/RQFiLhcvaiYUXkKBUCCaZeqDRETaePdIAjl15AHoVySmIbD2i3rMla5Y7kVnJkeJsa569HlUdtKEVN8YzEjufyNETFyREeYYOxM1QRMlTPID5NxdVZeY7xyg1DGBKM+fUBwg+dfJTI9ZS4kmumb3WSJaudMVqk1KT0UEpPNZNHrG1gK841LVLWoOLycitfqsLyv0GqdYoDAuf7gGQEPA9J5BilHMcAzHMGSD1qSOeo91HVfM61N+RYNVZY+IHJTopbYUwB4ghmxcIbLv2KWmEWIhNgGCROC9MYyOVc8/DBFS3k2+vVq+/f/qsvffxXnnvu8ca1SnVD3226+Wy+mMxjjEOM7929s+n7ncViMWm0ktuhPzo7nS/nWpn7949CTO+/e2uz6j/yyCOd07/3/e9f2t9dWL3ZrIyzzhhTDkQNH03pa13TzCZTrdW80ZcPdh+sV01jgDdW1rmmbbXOFlWLsQa5A9IY3Q9+d9o++/jD2/UZ5izy0sEF01g0bbIC05gMnTlaBKIWz4nWpu+GXSU+8dxH+vVqvV4zBy6keO3mh6Y7i8EPAPiDH8DclAp2oNiNIWGpnUy+98pr63UwRv+Tf/kv/spPff4f/IP/ajlrNuv1rbfejt43zvV9v//Q/he//JOzxXzw3hjtgzfWLnaXQ+iVkn3fn52cXX3sMd1YbOtpqgG5UPL5RhgYStraYlUBBMPGM70BUojpZC7PQ8GVXiwX6JAo06GavhQTNT2txqyVomwIQUhprO6Gbnd3B8rJrJW2xDZxAQ78JaBzOooUQ7+3u/Pd1/4iS/G5Zz6ch95Zd+ve3e9+/7UXX3pRZ5a6ue/6FKBiC8NyPs0pnpyczGftzs5ivd30fnBGBcLCfVwYe/3iQ4fH6z/49neOZB6EbGwD6AFu3YwLtNwo2RjOQutFiRUf/UnlH/chWPgOYVmlVC6R0ieoPsLrqpnpAhIuxcRReG24z6F6lX9rpPyLRom6ua2QhpoknBjCBoUjF71Yuoo4Qnyg3ZXBVyVRuZaAwOMyrHynkdzmUiXVO5U0R3zh5eiriGJG56ry+5WrtJpBJFCRkYbkmBVNuKB7KCnjEPea2VMXDywBPUYT3VXqqxy15jkLFwmO/CRyFwYK9Gh9yqVRJt6EBHySu2SNbWCfWKXXpQfhfJTMBLL6ayxQTnvWTZH3l8kMVHB1QrpshDLCwMVT/i8h5Dunq6hVI/Kea/AVJQnIfZblNFivTzs/9I2NTdtwDE+VVs0A/MDfW51qqNuQH1sugDqtFamyjcZCjNobQZE6D9CqtZKkLNpSh1fg9eiiEprmEmqKVK3iygM4MbYXNhi9RVEqxwQk/qtOil3r2qy6nG+tVlrIRuYUvNN6VhqppLKwShqhGmlJgVdU2aNI06o60WL2fFEhWzCEeNcBjcS8VnAEgXKJUKLx1kGopY3ICxJkbiBGO5cu0I7pBZyOVDSxrAv00gCmOjwonw4hyZRqY9CUFPZ25YzSpfLQXK3Qnizqj86/ERVbLDWy0dSoh3SOq2YabN4J6eX58lPGXZGywTpWQ7mFSaEMQNf0MXrG1kjhM2MZ0HuqqmT2ISQsdmOs36KtnYxCHo0WWRH7U4puoaJIve+HXF/X8MGPiuY+kUaAvIY0frOYceXxPzNP0NQRHtMpxoQl4BeUUIvZwln7x+/fuTtsp0a99f3Xc07H69X9owdN6xwWFinJBydnxtiHDw52plOjVNf7zWa7t7OjpDpdr11jrFW7Fy++c/uOGsLjTz75u3/83VPfHSwXPZ49VHKqtZZ+NWet1nI2a61xIoRHH36YpmcJbkY7aQTcdHnMupY1PbMUeRf3dy8uZ3Eol4Vz7uDyQYwegXGJzaqQMYWQqyKv/hko0UW32T59/eqVyxeDH/x20EoPw3Dh4OK1J270wyAZpVzTyxUDcwg415w9Yhmi1eTrX/9Wyvmrf/j1/+TXfvHv/xd/e1ifKSFPjo7uvn/ParPeri9eufSFcvu23gfGoGvjtLV8jFUWZ6enFy7ut7NJTIGPZtWaUuCMxPXIYX05EDQaIMGMSZU1+xudRNO0MBuUizIwBz7X6oqqMf4JZAag2fOYtWkkCIV5OwHEPzcIXcYDkkIOESQh5C+VywY6xXIrTZt2UPJPX3315WefurRcQAcSLj300Ml6/c3vfPfm4zdkSr73k3YSIEtw1lqtlovlMPjD42NtzM5iR2TRhxAxpUgpzbJ6vLV/46UXfBL/4ZVXTTvRxkhcXXo0eZBzVJ5no1ATV1pfVrWKl6JU2X7wflQmozAtHWSOSaVxjYwllISEDapMmUb7H3Y5sPnVBPaUfaSOlq0UzNflf5DKKsZ+unaTmmz48wOunIgWOwWoEmrQrGAwCwXeQldUavkZArarQtOZUfOOcmLaL2oww7skYs6HX7BcZQIUTLZ0OdZbRtXo+ayD35HoInOUEMyQng0fESzAmR6RnEQcErQ4AjLaPPLC8TuWrl/VqXuds2qVdA4SrTbv9lxpYlguaghmgBIJvsl5oZQMg8ixMm4ZXomJ8MQ6JfFIxGjQhb2/3nQpOJFn1jQMZFZ1puyM7vtus90OxvQQTitGB1UDEXFgpALD0Vv1W+e3rB4d5BJI41TDGWj+5FWePggpzOP9bUATJfSQtp96lVJgR/oVfo6kEOPUtm0vVTLu7PQUezXDESxWQHEmxcJoY/RJ3985WzfaOWM9tiMTpV0WDno6tMLlDzeQ+Y7vQ1XW0WNVyjppIB2EW4p4GvxSEdtY0i+A8AkKXmfGMaec+jCAP6IgHBhTOjXwlRUiqHWNFqSSMWttIGiE18joAQ2urlNclXM2yGmLnDsJzmcM5zt+6Nfb1agt8NDQ056KMbA0IgqEXJBXyltLGZEfVvpD7WxPGIkUhAQ9Zx25K6EMs5XKY+0x2ovQVYYUffJsV62xWlvklY4yd5QnVksLpLqiZkYxO9FUWotmPSewiJEaIUSYxstckaQZVZ2mp07XcGWyvCQ2zeUfhnUjAwdK77ygIdzo8j02zq1yuvPggZTiyrWrt9ZnUeXd5RIq0NiHfr3dNNZeuXhxigSkdee7ftjb3VE5b7dbrVXTNLPp7Ps/evOkWyspn7r22PFm8/+89vre3oKmcFgv5LRt9SgKKacD7toY/KNXr7aNi2Eo76RrJ/M5Ehh1xFxdZkURGbko+7t7k2YSUux9v39hb2d3hzoCKK140CkKmLAjRDgV0YBSqexffumjk0kT0rDZrmMo5eONm084a/COSI6tja5DfizvobzBVi+JPGmnt+4d/l9f+cbQb/7e3/3Pf/mX/n9nJ4el4gnxrb/8kUhh020eevjS57/0uXba9h7JEyJLUwo2TGqClHKz2Uwnk+l8BtkB6iUCkBTA5YyOgb+oguOr1aDmU6E11kkJxndCO5gwPTKsk5kbbLSVJEhhz4JPJBtst5WQKaSJm0glQxza1pSzXxorHc7bUP6gpEL0CeJrgyh4733buu+99aMLO7NPPnkjhwFjaW1T+IUvfm7ZNt955dWdC/vO2dV64xqz6jpfd9ViMZ8MIZycrZSUrWukEJ0PAyZjfugXQl406tpjVw67bVTKGas5Digvk8a1hIzwELDmTjTmUfuIc1+U6gETMiXFEIdYM2GTVSomEbiKAKRZjWcK+bHI4gRrkx7/hAQ2mnzwSav/D+3X5wAdKGdwCi+orEyKEe7JMwfXfYByLvFZYi3Ic0OR5h0S7wLNFzpWe0w5OWNAghzlzLhXVMI4R8AjDZRGDBhTJ5XleSRgnXCXD8drLY+C/5P79zooRRh7UNMXsQMNFa9X/kJjtVWmlWZePvysIZMB8VZxgwoFOd5HpcoxGaNMUgsjkA2Bu0EE5MYAeIAqP0sjlRNqrp1TurWmNHVgMfJ2jCmwQfCoHWng1Vodbben205rNdVmaYw891/XVWY6PT5J2nbSOGthu81onhKF0GRAi5rlIGgeq4WagcwC8ATOousxL0YMz4h3posC1BIJzoqSKQYq3itNS3AKW+40CqKJ41BItBCtHZCNd3xyxKQd5KfjccpxYXSrTbbN3fVmFbrWupjSWYyn3WZX60tmYiI6LoiccYLTx11nNFxGjoPqSFm/oKwO0nPSM8i3SvBfJ5BE0BlqNDXV1pAZ+xuyR+woI4cUuEWVQCcAWa6WuEosr/RjVEzgt5V30jrLuRBTdMgdlaVqZpphHIah6/s+9NhHKpZCqjqncznkcStAeZegjU9cnZaPMeX3lLiVfIfJCrHswKXyK5N1KS1rWCHc2prPuy0X5OBTIDa0Pv74KhplLbfopUkyHiWsNobvHooaMuoiBqtJVtodZf4SaL1SvpTGOMEfLsYdCO5jynloINEkbUIiAOdV+TWAZS5nzeXLl5YXL7zy7nvv3D1k7JSSqhuGbb+dTCfTpi3tRYpHZ6tu6PZ3lznGofRMuW2sUPK9o6Prj1z+7IvPp+AvuObpm0/+y29/dxXKKRDDIDARcHiXEKPLTbacTqdaquVkcnlnHoYBsz1lrcUsJEgprDMCSkBnnNEGuEAgeVNumuby5Uv0SRLOomjyQ5Q3oQQ11wRYiSTScj59/qmbOYU63Jfi0sOX9x8+6HxXtRZMttJEC0HCgiEdzx2RxWQ2/+1/83uLyfS/+83f+MQnnz96cD+F6Iy5/c67x3cP+2F7+dFHPvuFHzfWDH1njC0/ui3/bkiovmUpo23jmtkksHAUrPDxXOhytNGihjJPMY27gvXwf2EFiBs6GzRaimtj8uQhdOfFYBPV04jmg+9U4yovf1U/bKVKgEClEAYHg2JIQ8geFQsCWEVE+F0paEwpIPSQ8oOzswd3733+xednNP8BH3G87V97/c3//xc//9ilg/ffe79pJs7ZYfDO2X7TGXQPVpu9xWLww2q7oYaIurYhBB98A2fbj45OTnOeNK3kRBcGD62yRbytggRmnG1U0mIIIeeA4YC2phQ5SPg0zjkqSSnjMhQlKU21ZsS4CzD90gQjuxrPEZtRWHIVlmGlkK64kvKiwxAxWkRxVmsm+CHCnTc7o4SocNFZoVzgyLwKp6FLIpKImXt6ZIZkSqxHHX5SXPjJeqzUoAX02VmWR1oyqg2Z1dgOjj9PBv8yyaS0t7gMUY8oCaQBt51aeLhsdbW7CCtKz568l5UpUsOMIezCu0AXJDKdclXJRVZIMjGQHnIUwCOp2KeS1GlJCWoOUSXRlO4qlY5E6yRyHzzR3OR3WKV8ivfWZ9k1jdJLq1SOElpINva6XGoPola9krJpsULHog2PPtqpPDap0DFwpkAjIX5IaoSl+CCLX3CBlUe7Jn4Z/CmpHp7w28S6i2B/xkazWpdqaA+iBssBN1jnVSkxVifHzKAeIezl1duFLy+25u2ToySSwwa6k+Jss3r+xrUvPXWz6QP93dA3JR55VKAQypdTqKxU7H2Ip8d8hZmaudIlVZa6Er6YJR5zgHRIn5u3uQbFgYz9NPDc0Vc4HBdynJoao2lmghncI6Ko+itghgmKgYhSouwWlAVmkYzTkVxPaLOVGAVp+PtHOI4sfz5PbARAcbkRlXwnDl89e/DVs8NbKQ6yBpNRjl2JWop9RvmqCSRRdcEvsaUo9TBILnUYrCo0PstEfGb56HrfRXCpKcj2OXustVM1LXMOUy2InArgHaBQs/SLCWUp2Sa4jspZABKscBgR2IpTKNeTlspq21jdWF3utbZ9951bf/na6z/54Q89ZF3KefBDTmnStFroCOfL0dnZ4LsLu0v4F0tj2rRtyvn+g8NLy/m1C/tv/PB1rZSO4WPPPH3Ybf/Dn79qZzPEYUkUNOWdRKAI+nAtp7OpaSY5+McfueK0K6eAJdSPFVipQ6wzpAGQWmCNnkxaofR8d2dnf6+2tnWWGFnMJngR8WCl6AN1EUM/XNzfe/zaIwQy5BSds9eeuE5z9fiCilIgomHRxM2DGUJn33SyfPutd/Ow/Z/+4X/zxPWHT89OME53w3r79ht/uV6vH370sc987uWk84CMLxRM5SIgV3XMyyv3WULIC73aEiq6xPhGllwp1TCTmp4Xxxx+Sccl1lL4JVKsK6hM1V4irzpEGi9qT4+aNPE/YkkhtFIh9Lw3oA/ixB7FMUZxeJUEfAeI+JTqbNu9d3j67PVrV3d3ZM7GGSrGtXW//81v/fa//+bNJx6fTyaHDw61NaLcu0pLtd5soCfWVqkl8FgBA3EMKMtfv5wvLu/tv3Xr1qv3722EWMwmlGhrZ5vGWfwcGK6Vp1dLXvykBNSJnMabS2Mw3A2GW7yYAj6HSMxyBeyPumq6EJHcQ/4zc1ZlhWGRPWmoJsFBiw0F6VpqLLsTPyiOm0bYQGV9QBqGlo/0XLhCYkJ2ooDxtzyWIYSIxtY6l3Iahp4WTkrfmfDKiiykOHoehDKa3xG8T6ny9OqCDh02yhVV2/7yaWtj+JjTZOz9ILOMSLnOWQYfpEg7It4wZuY9DkHagzmHx82aKCCrH6E1Fk9gEPWaGpW2WLhyp5pi0oQw+EH63OLqLb1+FKV0gsoarQOEYxAdW1x2d05PkjE6p11t5ajKYe6+Mnq9PvMx9FqFtoH4VI29Lz04pbhSdRsqxwuTflEpjI15lGqdv2bku0LFJUZvTE04KP/BOrqvx4uXvA50eLkiqpRIqtT+WWXRGNM5640OfT90g2aQt6oRBlbJXWACvLK3jo+sUG35yGKC2ePBybGLYYkwGuaWYKKSmHDEFT2V/T6GiAMe9l6fY6gTO5kqaIpCFs1NviFuRYyMES5OGCsNGK/m8JCzIwrkOMHjhq92eOA/G0qBpdLGpip4Q0hqDEbVHL1ybkLPzMU18FxRl1/f5spazdXRg3YIakZ8e6TbIbUb0ExxqNQPkn9Xy2BozsrKKBp+mK8d+YfxBB9Th2OpBYURshHKascKjjFNiKRTrXGN1tBl1alH0zihxGboAw4AqkgiABNkYDFJBOuSiPWsZOA0/JBaVKBNpMNBEchSiS7RKGGldEo6pZ3KE60bpZzS83Y6aP3b3/7W177zrZ/9sc985rGrqus2XSeycM6JnIfgs1aHJ8fe+wvLpUVX3Q+DgRD65Pj0yoWDhXP3Dg8n85k2ettvF868+KGbf/SXb67xPecsHHjLZISPPp/yky3mU5nC5YcuLJfLEIJzbtI2mLFFLqpR7CvAbKECNcpYp4y69MglhFbAU4GShChgUcdqNYJUnnNbYlzMp/PZBMk8afDDhUsH5Qr3XuWkycapSQtcfcXq9MMfYIw7O13dv3f3b/9nv7y/O19tNohaKo/om2+88eDe/SefeuqlH3vZg4NI3qgclw1k1ufROkjtJE2KEMASVVbzbbB4gUlAM0E9j46q6mKvD3MOjJ3mYgrHq6zriWppgQ6Ny8k6oxeEuZZnhYZIcAqNMXwtTWlWUQtIoI5HyH65hpV64513L04nn3nmqbDdNA329MCYLyf28599+U/eevNPv/9q2zZtY49PT0Ceim3bhhjW3ZZzRy2kNYbi3vIVhCCFWK1WXc5Xnnziz96/sxLCGuu0mjetXa3c+7f3Tk93vG/BJ9BKWuc0RIwYjwlrgKyE3pNJVqKGEKCXheRqPENyiiFTcCQIYpcx17U/Qkgx5yQLB/H95c6LucZIVeeWoEQ1hqiJB8UlZakKzZy+VInomKuPPTRbLFQDwQct6ygCPzvGjDjgBKat2hjGBieMDRE7WVUdHsphXh9ce1UkoZblqeNvypjJlATm+DjNMO2IYGgKFTzOPoxkjNVsg7RUfb+9tJj/nZ/+mSd29oKPdULIMo4ELjTyBEjhdcuUVRIPmuiXSzn6UEpGlJxWKSNUOXJRVrrSAKB9g7kj4JDkwC7i+yqPHaqvO2erTgon8g6eGF6gWNWUT3Xoh77beqPXxrXaGJSPsoKKwKRE415zB2i9EyJkz20/ZK4ZI2ualcvVKUnIkCy/R3MnjFeKY+vEEII83sGVVEIUtdAVgCmNiI1xG6WFbdabzeC9Vq6+hPhRnJA71jZan8Vwd71WQjfSlNfOe+2av7j34JW3bzWNMzloBCHmGOGaQu+WKOYllr5m4DJXEExzuuQlVZRKWSTpRjXCm7AzNaCJwphV/qzAMVe12pbiXFZCNyfdUlSIKMIY0AJC+15TnfkckpNKamC5euHjkXWDjRFC4xpYSZ3UxCPX0QPGV7JWS0wvITufby+TgHOFhmMVTlhBokOJFtM6GTYK2SaBD6vIyQjRKJ1CqV6DyECQJKhzERPPBpqDVyWtsqJmtpwrA8orY0sNCDwv7/VRu8iJtLMWe4DAHwWZUHVQAhVi+cFNOZ5Vo5RJYSHCXvTzzXYZhh2jWilm7Sxq+2cPDhdXL7cy/cc//tNBiLZtDBJ/ExRvD46Pu77f31lOGqeU8j4YZ47OzrZ9t7e7s5xNc9YPTte2fDI+S+U365eeelI1zdt3bkeE3hiOTrHXRpQLSU9pNpu0jZtOmr29HSGFcxaXSnk2nG4M9Fs4lTRAoVhMGGmMWi5mQiSIOWn7rXItbIEzBy2iwlw5JSits+VsTgo3mTxy7RqmvimPeXKo/JKoK4yK7kuYsgghttvVtSeua2f74KVRKevJZP7g/uFbb/3o6eeeef4TL3ri3zBOrOGcNI9XuT8VyarKM8szYOpIJJ/LPZLkYIeQ28S2VWD+yQ1ieTitVOMfTOefGFWpMlbiWVVAZ7h4MEKvDAANWl0kIhiN/hAGbr4qzyiXCwmPvRK2/NNW6z76t+/e+/xHn2Z/al2j6kUY/bZ79tFHfvalF+4fHU9nEyGEdbbrt1LJ1WbjmhaWu0iop4GpAZ9T6QRTiNq6d05Ov/HG6+9tt9m42WSat5vjH7526fT4Jx+68NmdyfLOm/b43lwrkznrZBJY3cZpTldwEHEnXd5BBAhSKYMBKzxsBvdcSOf0fYYSKRw72PJVwnwEcQgtHBdtqQqSUZzXhWIaJaCCcEdB0pPM2WBxqEEJYFkHNRCzCQ1r5Dw+bMpUURLieJSG1kfVCxoUDvhNRCUVZxDgOUVTtfRHi1GxgarmZuosjaicagpa8cPzhCsPqTWWJpuq6RXZuOb2avOtP39t46PSJp0jmMdhHuP4mfmTcjntM5Fi5B3i2MeoOiI7opxlmhmROWsM4FG4GGV0SLHCwUQFZXPAaYSYQpH6oA9nPrRaza1pEM1X0VQyGa2SH9ars2jdWumJtYbbnCp4zedZefyCalgs3qvMJGY1gr0pvkIklMzCQAdbfoc63OFQWanS+ARk2WRBXhQopYJbHQmGlhhzDVWSjWu2QmWt1menGWp7ORYCIuSpslNlGmvvbdbH/VDqSiFKneKalPMqBKPyxLZ2MwwSINPyg5WbT2VhVNaka+Leh889sm/N/GXjOPjH4CVzqqxryR/TADh+dVgmUrU4AlIJwOZyJEmjIUmQ1WIG+mYCSglz14jzSAvDT1AS7xyiZ1qXFHKIASrJVB4C/NVt6xrnck6bbgPKTCXaK5a1WlRiAc2GQmMZhG4ev0vpjxWzrRN0xTrLFHOscRr4Pjm/1jhelTXGh6nSthTq2EUpnXi9JmQGA/pKAleP1GIhTaSj17lEVruuUU9UyYaQlNVMeER0tk60LZZ/FYYRDNKpWIMZDfJFGNpK7xvDTk6z1albHU+MO4zhlo/NQ1f2F8u7rsm+y7P5atO98Myzf/7GG3di7GNqrBVJrLZdCOFgb8dYE0Lc9p2w+sHJsRRyb3fHKW2tfff4wVOXDx65eDH2nbZWSeVE/sTTT/7rr//HQYghBqOnSEVHmr+xVJNx1rPc3VmdbRrd+6Er5T8g0phiRCDqyutgILQcuD6UxjbGKi1CORN8TKacJjLmUHrBBE8ZLxvYb8pHygBNKY1xQaTB+/lyubO3K+BqU3jvmC6XSSuI2DJIvFmcM6W8d+Fi+Vvg3slZWKuD92/96O0PP/PsEx9+svdddStWL3+uEYcZskjkvWQNFW7Cca7qXBPxj3iupIqZ+HkhCJoACQ0XdIgipGqDhxpblT9LVwmEBihKxBAycDls+iE1QSFANTvmirGed+Wg71MPkoOL0RODW+4OUx5RbSwiDTD7bZp3br93sLN84cOPn96917QNbJypKpK0TNvVl1549kfvv//WnbuPPnr17r17k7bcxNro07PTxXzm05B6ZbS22iaRujiU2tHo7Acjze6FS/fT5nDoLu4frO/cUccPfu2l5371r/30lWtX3XT67a99/R/9r//bbePEzoVN8I1UXiWVy8s/DAMkEhoicSAgMD7Wo2M1QCKgKCBXMmsG9ycvyACQmJCxJeMwnrhekZJPKSRenYLvkax7NFlBnbzA9dgOKezaEaIeOanmBASqC8VFf0QUB9sKvK10QmlKVUPKutwmsAviN8oB5ZTVMpSTjZClUD49rHBqjJxAGAMjgGXO0SKigUeWllXUopmUm6SVUoH9q7qulOfWIKpAWu0Gaf/dGz98c9jyuS+fT0hJRkK3GMGTQe4zStdgJBh5e5FHAS5Ur9KijCsvk8FiSAtoY2UK5Q6IdRCqkY+OVyb4IJVyUmlrTga97v3JenNtOpnEvDTmFGGjIHhjxivE2eosHRxslTGuFXJF1UcpwqCIKsc5MohxiwhmRXImW2oarVLI5V6ryg+ODqVeNBPJWKWKbMbrbJzCiZzL6VPLEQVsoabJDcerVdLK8rFOstpdLm9PGt+4W7fe3W42DboWVkw65SuNvTZt55PJK4cPvnf39sw1+0a3oE3qnBslp87OpfAhdkph7ZyUMqF8x+XSz1ngvFOd70WtLUz1IaNsz1hhIMCfKxluQJA+gR/C6NG1lWsWV0iBQ3ilVZUaoGHiEIkY5OrDq5Y+aN0h0+XmmDMZY3An18zjyoUztpTxNIUj5z+2ICOO71Hd/UCZVUFK2LUlChRZQiIJgNM9hXK4FIMQXaqckzW6gkRwoebyMQknxaL8PhHLAo2wL+5KpIXDg8K5SK+4NLjdZQBRMuQI6b+i7IySJYVrRqk6HoFZo+ZvKAUbNLY+SH3OAhFgClRLLdJUpKspXFkdPXf14Jd+/Vd/7ld/5fM/9qlJ9D/4wauH683+wcG9k5NwfPSZRx959969r7759qkzWSlfjqBSz83h2Q0xHJ2tkpKr1aptmr2dpUhpNpvdfu/Wtf3dv/7ZT6vgY4xGKWvNMAyL6XQT0lu3bl1/+NLBYpGlsNY669rWIu9ZGK2lqTH3681mOpvtH1yIsTfKDHHQgH6KnJ1rgkjOWInkjARoTqkXBcdC2NtCxQatgE0144UeFcFAIeIXrDEpxdBHbe18OefEhpgEHnBEwnKJLrNK1SAEySRiRXi9mXLOuDd/9KOdvd0nn/pQ5wcmfeFR1ZUKK/O5yL9UgSqfGwH5hFpVqhDAQdHSYb6CFrmqbXAbY8gso5alGKLbO/PsQsubUyT8XGg1SiJUTc5hbiErikRhcNVvEqnPjMKcky+1JrZzURhl8RLDNxjLT76K+bvfe+VjT92cauWHcOHggkCKHyMdYoz00z95/bFvv/oXSalp2/b9YI1Gnr8+PTsr9zHepIh4zZxSCCGnBACfTl33tvfvbrfDZvuoTL/xiz//Kz/7Mxf2d9rlNLfu+qc+9YjS3/nmt/J02mtV03w0gyarAi1SRkstGtOC4cqJyJosfymm+lB+RVBZsFyVTFmXFXnxgZtP1BgIhpez3UYURHmhU+VuSCGcNRK7P4O1bFte0fIfXXVuCKzPIo9tgDxVTYCg7BYTHTHuZaj9FGODhjQaXIQya10bOIqEnHI5JnSirPREqTUj8M68OlSu+zze0VHgxCtFlimFa3o8yt948ZMzo16/fxhdec10jDvWubY98sOqfLkaKx5CNJm2mKrWp7r7mNGVuJdMOXLOqpTRIBU2xlqRm5znhjtUDA6NjlIOOeKFGSmWIkaQL4wSTtltimdDd3W+fHK57GN4EPrDvs/jqEBiB6eVeujyFT2EC9121W0ozfHlf8t3GhgHJSqdi2Q5dHumfN0hiOChRh19ijD7Kcawj2tjEi8yRDOGL1vNx6z/Ss1NUlXtlGF+Ld1VtDZIHXJer1dQlWMZSBtUigurrdCDkvfOTgRmpEoJH0KMwYKEse22Vxfz569cbgPYbDAdcUtJ4AOyN+n/Bg+L4ZPUP1U3uC51PfVaMVf4O3bWxCvKirCQ1FErStMTnGwkMaY6gc6CwUcS66u60+CjwIm0IM+lPNiGiZTE9WGLLWQlVOSqS5Jy0kw4/WU9WyXqNSYoV6E+Yq4VVlxQUAfqC/j9A1QHJE3NGHj9bgAAgABJREFUTig/pDUWoRAjGB7wF4uEZ5Ekc4oMXi9TWunyK0PWXUq0RJy8UCGlIfrAdQ6IJeQAMAbnPIg45WrmkzoPQ0/TnuIMDVoDTUQ3j3KRbIpXRNw/vv+ZZz78d//b//r5v/rFiw8fWJ1/8rOf/o2/9WvXFu3p3duT/b3vHB+/sunmFy9evfJI8ghfktLCygnxWj48PjHWZBQ6s8lk6PrZZHJ4cjwR4hd/7JMuhKHrgN+DbqjUs/LFm0/MWney7WzjkFOaUwKTFnt03lhGyZ2d5XJ3qYxZLpfGGqI3XdOWM8ta3ESKMogco0yl5QUNVCpjIl4bY50cQUgY1qCfk5QRE/xUzhGPLClt1Gw6qQNGUSoezDF588kRqs/cDCDGCIrREoZbLoXs4f3788Xi+hM3Nn0noHFN4GZQo6dHLbpABO+YcYNZo648jJizj2F0DVTjDRq3SBEQw48yA0xGGgQXV+X4VTLGEAg0wNpCg1nFHB7F352/1cgoHvHykoMxUTfKsXrXMF7kfwTGBTRBZ99+592b1248ff3R5MN0NrHOZmasZxkiYraNHPrNQ9P2r738qbu370ynU6Xk4IcU06Rp95Y7Z2dnvffU2kC6jL1m+c8hOf2mCP/+rTcPt90Ti9nf+fmfee7pJ9fBH23X927fjpttWJ994hd/4cvPf7S5d3tWLry6K1Looa2xim0olLSM3cxJjFttLTMgppTnAfrE/SX9unRDnEe0U2dTg/uVUeeOk8oiw7QZPzzfZaSR6kbpiRTTLF1KU6kWxjVStko1SlqRXb2Jy8mMLakYx6PSw9iCGR6RvhArBMgIxkdOVMshFgPa1E1gLi1vCrle6pSGEVWIgR/LCwH4ez214KzAEEXnmLQ1y51lz+YQNlpjbEgx+jCx1iiNfzo5A3tQEqN3VhGjgZI1BV++SjAp0xhwAycBxV8pmSwmxsyMUzLHFLIWIdGLLLWp6KwYA7wCJsc8lGckz6wVQt5fnXotjZB7zlkG5zF8KJfPYbVag8mpo3Ol7MmVFjxqLKpYneAUYo0hVvL41sdw1HPLEmTmel666UqbUKM0WrSNsM57L/Em84lg76thV3cSA8bShyabxLRp8nJx1LSblN55+01867Y+Y0q1KTwxmz/UNN613/jRm0ddt2P0FK1qg3UEkaG2D4vp5GQY1njRYyotBQVN3CWliu9hMZfJTwa0S40orUhhOSP9pEw6a4ZU8lyqwVHlmzDkFXPheq5QEBErXsljl0KVKjCpf2QeedpMiMCB6gefcgAlA1yj0p6WIxT2uqT51qAmJTitClsY8FDjB+uVbGs/DSazFClESoe0UBwdqgr8zqM9DI0yzqZGqJ3y5BklaUpO/LUdNLWA5AFjG3PWymeB0aHqY0SDNSqZNWM6BLN+Mc0UDGBBJ6z7vltt1hPQGLDZEFohljiTMC9UjlrGPSkvn558+GDvV//Lv28u7qf16evf/s67b729CWG53Hnho8/cev/2G7duxaZ57fbtPqb3uuF+iFKbSetkyh4Lm8OTQ6Wtc3a77awzfe+bpk0i3b937+c++dK1abPddNjrRGyyLJlujdVRybv3D29efdiiM3YOZZ4uRYIxpWxoXaOUbNompbRcTqvWtVRUpajHuIVs53LBlC+x3LKo9OiWKPWZoTKAdn1q1PGMMJODDHrJy4l9iXHG4jRHCa8qpR3QvlyFrIr8WQyGcs0Fy7Wx6H1QSu5duDAEXwEzeHgipEbY21XFvqxqWJiViQ4mzD1DaEa8E2dmGG2lFI0svcBIwsT9jeVOqQAg2cMlUwPktXE0WagsYvASY6EUcD1DZ40zVn2Q2ArEL0MBUG2U415rE6riCAUxnnMfvLJuve3efPOtm09cS6GXSu4B4Dz0A/NCajgLagjfDY8+9NB794/evnf/4SuXTs/WNNJooZy1m+3WIiev3NkAPVppGmuOh+7P7907ieljly7++k987vrVy81y2ofh7Ozs7ru31/cP9w72zKVLF6T8w698bTuZRdjuqWyCEiJTtCzyuPKCDyXGVK5dqUo5KyVj1EGyxFuPaFd5DktCDUsTlzhvnOp7V0rtHJMFYRQJMdD+xWyUdEqZJGbGNkI0Qk2UbLWcdP3OgGRMKHqMtrlyyBTuP2QuITgEfkWItVMof48xEBwILsmJAtPnXrTRVwkmgOT6iWzhXDscIcHrRS8hYhCV2AU5CEoWrPBiOdnO+uEbb7zxg9WpcA3uUzEVulXSWXfSdyfRkz9cy75U9aq01vLk4+iIiey8rhJmtKhOkDuR0lTpubZt5SuXf6cPwWcRySTBDrtqE7HLhoyn/LGnXa9T+vCVKzrlIYV3Npu+vCMkV5XHtu+Hhy5faZRexiFtu2HwUWkvcpDIfRZIZRIfyLOrXioLbW1p4ryXY4zUiHtJFVMhKzCKiEorlKUHaKTk1KxbWUdUSY5MFQmbobXNBsVht15jjUSNcOYW3ik1gx90lcKD9VmjVGvoski1VUCA6HFIt45OVJT0IQiIHBgQqKW0QrXaNJCfVqpLlSdIjdMq1Q2GSlVGKmQE8HnUHFUbFj7rkXCWE530UtZkMcreqtpBUURIdDNi0RIHZahHanPIRYtGC5ZTtMa1TZsrfb5q6EGXLV8HABGakSlw3dIvVkPKFfp8WOCxc4V2lMQyMUaksD7Quh5toaZ7ihySE3kiVekiy3Em4PlRDuMn9vEZmAw+HKqiXKIEcgBqFQ3uBCdRMDcSR4ARTylaIIE1xk2nM3JqCYCrVYFE7CgUEEbICzHOu9WX/8YvNJcO4np9/623D+/ca6ZTO216ePD/1s/9zBeeefp0vXmt737/8Oi1bt1JPyTfex/xtG26rVB6Ppn6HJXRKaSJtc7oB8cn13YWTz18ab3ZQvovsCwDp9iUCyb03bOP39htm+PTVco5DMFwSa2ElYZO3QB8Z9vaprEefB/yp+IQCMQjWQNitPJdJEHkpESWbWn6IkIjAToePZOArScG1bAsR/eVUyl1LGajodydgpe0zPXpYZiJgEQWmR4qichTJsVguHQQ2Vo9WyzSSL9Mkhk00nLux8EKIj/EuKggKECLSjhQ5f8FRxg0rRBCCNLWcQYQAxdxUQuilphJQYMIjKsBtr3RBYw9JAbpaM8yyB/w/FRfjagTTA6m+STT1xqTx5tarjZVCnYrpfIxaqnvvH//Q0/eWEycSNk52zSGqp8QY1bovJMIqINKN9Otv/zpj8ftdrve7i52/DAorYYwSCXn8wVcQYl0l/IeyrjO6UfHp2cxfeTC3i98+uMHF3YnOztDjNuhP1qt+hRXJyd3/uJ1uV5dfe7Zm9evuQdHqrRQng7BKpfLZEAhCygkCEfgLEAeidGlBwjE4GKnra0m8J1DDtBzQXxOmNdx9oYdqtL4qHCvM3uNg7rSHRtlpHAyNzK5HGdSTVLakWLWdc/b5jc/95M3Z1MbgxFZJl/N+JgqQ/zLdVhE2hdHFcxshkROyaaUpKUfAQ5D+XJDR5IroC7k3ZE5a4FLwlePCXF5uJg19INJYqRYalhdIQ0oOoKzR84E6/KYVaJEbpXs1quRRYGRT529q5xVqFOaGEAsTDTD4MynXwQCdXQQqbqny4ccmVaKpB2coqJOIwTXouVwQzVtrC4Fa0oTI53WD7bdSYhWy6lSDYsYWTczGBb79WYlrN5oba21OSlZd+ScazGBWEk1wrvKE0+9ML1ZgoGKIo95CwrQjXrzVvBjNkqU1jOqEe2Rq0pIyUQOM7OfQO3ApEFbs0V24Wp9lmoCdapwYJFareblBdWHXbcOwcCLwo8BX1tyCG1ySg7BDyIZbCI1GXiytNL8MVzKi5B2Ym7BO0SZzxkvAjGUxkGZGfWD2iaJmkxa5xg1hAvHpDbn8/XyZnhsb/BngJtMKhfCW8aE0+Rz6mMYgs9YrBK4X0owAxYWbjCZ09D3MXj8t+NIghG+yKgijkABgCuqkoLAClo8kFUsFV2SzOHKFeyncgVvgFSYanJG+deFaoRcaOuE0tXxysDuhIwchB6j/R1iiCIN0SOJUEaWD6xpoedL7P2h9EbmIDMiytcR8G45bWftjE8RrmQFr2E+R28qpdssm7OTg4v7N194zg9d3m4P335HKNlDXK6sgt8t/fJPf+knnn3q2Pv3tmeidQFCUHwRER2waNt2SKHvfAYtQWsdUjo9OX3p5o02B9YRpbmhGCB5yg6MMgutnrl+zQ++1pmxXipJ0OqCX1eK1rkLe7t1MSZTygPYHXbMRhCpfGNBG6RijXIPTliV1taZRCgBeT9Ko8xOMXsC/TOphFQiIpODecNZqazJ20NweLnwDdfS3H9ZiZkCSZe5fAucWdH/zj5KC10lp1oGFG01B0FjuIxtsuHOP4N+L0e8OUapyIUrH0QqjZHJRouqHNHCmKwlyRQed4CuZM7SxwBjnhhPKTk0wBmuDQTHpRRS51Md+mvpPKbQKMusLdJokO1A7FFOuY8+5WyNPT05Wc4nu4tlDMmWh21C9E3V2Mvy8pfPM5YvVWjRdf2je8uXn/nw7Tt3XWtd49arM8xLBiVl2zRAF8tyjcQYsrhzcrQO4ZHZ7Bdf+tj+tN1/6AJ8ejmk0ohLZ33O9269d3bntjnY/eTHnl9sNlrgYOAwLSVRr16u4xKAUklVdk85tQZEX/vkt+Xh7fAB1gibjBe79wMaXF0redghU+XoSp1Lu6K1HIPWwbDLwkhhhHRZTssrlqY5XnRmFsOHkvh7n/7ii498SMeE8SSJ1USBRsqzMyN/OaMqh491rrWQODDpDyutUjwHH/qho69kGHrwp2ISARry8g34FCQUxlBlqSyiQYgp7GmJNHCwPhJIbDHkWA9TRJaCW1DOmdbamdZXm+lTuxdmwEnGnHqP2NZSt8YsIuPzKQ3l5jMGn/kD4MHKQvpYf1ctRWss8ANZa5eUYkAO5DG0mSp+DIQ58Qsx8L5Ogc3aiHh/s9VKT6SeWVu3tUzbxa23OT0V2myAYDEqSpWMUDZV7O6Is6IwuqayZ7briHqsoYRS52oRqmn34tyJSI0ve8Ty5YHyUU6rSH5UNV+jnJYMJXZYeGxB9Fqvzyp9HTQcijznxk5KyWAO15sBqLCQyk3Wle9VzttpEtHHsDOfNc4CEBWd1FZoKKmoixdGqPkQvnT50t+8cX2BiY1Gdm1Fi1R6qlAsiuHJNiDlGUiW0Nwm6HNFxY9ThYA6HqQIsuIkThfmnNRcFznCvqGsLz8/HsoKtRGjHZ3ZBfzHMD4IPJbJlyfKXJC6gIpGKenL5SGsNpwJZZIBkYMKICLzWEE3pSMQDjgCrJWsQV0oJNNMlaothoEShsRQcamsNFBnCDjufUhJ6UZo6+GJTFKNLX5dWBhjhNTxHKLNB0UL5igLI33yIXqs5nXKkiRtzow0A8JSnEmhu+6R69eyMzql0/v316dnk9kMfaSmWVWXryr+9S987lOPXrmz3R6enbbtFGZoETA4wC8rA7hFrmlC8Mqau0dHO5P2+sFDw6avgBhV/w8e0qy1to3xfjjY3710cU+obHVdTYHEgs8tCbhS5dD3GSV/CtFIbYwtl245X4NU0mrjQALOPG7pyqvzzEhcGA8atBHAOZWTAvUsjnuQUsprpJJEwDyBoajHal4mBMiJGQz486WRiEKixUBXimBd7tJBpEb0myKFeYwQiGhey9XJuNCaUBW4VMb6SFGZTWNDBCQOdKTIRDEU5RiFIe2jZjLgjaiuocx0DcaRVEo8c/ZIuYLGKtFwALYrARJ1XIZZCxa5KilT7m3mxotELFGptp1zy8WChb5ptHQiiBhkZOVK0Q0UZKZ0jpiybU+OX/7IUwtjTo5Pp+1ExNz33jQueI9EejlgB2yMOuk2x92wMPrnX3jm4qy5dHBBahlL+e29H5DLYXYf2t/dWW7ffy97f+OxR3dSkkNvuecqD3sMfogxOkCiIfVgcZwQkRK3ocfbl6wG0yOXJgimwHLK+RDGsRpyUFCkUTggq7cr1ZevPrfZaQy2Y5RBNEpZkUorIvVSm0VM17vuP/3MX3n85jPf++ErD1Yra53EhkQyR6sczoaWfXKjeCPVYoAEBV7y5XRSFMV1/ZYYfFb/Y0pGTQwpz7k2AOYyCl5yIzvGMZW/wFhDL76sA+TKCZfMM8xJc4LZDZfnu89ev9FiH6Fr8AXyaCF6JbZNcqAteRLKCpdBOB8PQF2ufYMdf/legsqbNIADo0rrDCku2qWIk7P0aGQkhcj/qpQPjTW9yHfWp4g1FnOHhAJJJjfWQFquV2dRqQ1Q/6WtTpqadcX9/kgmYZBk5hgUMbZM3EWWlKgOb/7JWtRE/vHjA4qYQIaMg5dZHJKaHZpnAUqqQSnClS7NDhgfbTZbUye6NW9LxTx3zslSRN47OY0VIwxwkNIYFPislJfizPfSGpVkY6zOSXP1iw9dlwZBQtWgT7c9A/VyjuR8GFRwmFUnxYOilNWJmRsKyz9swTL9xLLyaNLoZCwHB0p4XdmT+ChC7UFVbWKhssOHVn7tAEc/1X/4WrnrleT+u8ZVjhiuJAa8cD4C/EoNFXKY/AYQyWsECcbSSutyOELMX44qXYMU8SfAj89IQZjQlZBNEgtlHTYleJiEBXZc5lK94q+VsrqopQ+kTxLRn+VYkHBRnlJC3hQB2pUphpgwmSuKi00WNkCJCaMIT6wbI6WTaIRIw3D12mNCa9X1uvQQuR96ZZ2C5Z+Ucy3zTmt+7ae+eGMxv3N21qfg2qb+VUow9LjzQ9s20ECZwYejs7OPPHL5wmwWYohj/CGNjFXBnxUXinAcCDD9DUZOuvx3yKRJUtKUIDXvAFFtjkYzB4l6ZJy2nrcRcJrlH4fcA+o8xT4+cwBMyEq5criHxWTO+8CXiwFZ3PARsZXiCD1lfGgksctwE0JFQC2pee1SGE+SOzL8koDpgbUybKE8vJhvCGkWF82KOrK6kE2VXVQht/woUJWMD3NkhceJmJSVSIdlNoMI8CHWNPeEseEIMYbqB3hEzXUpizitGEYrySBkdIys8rNc3vdSAwX80aWEQtOfbVPeJMHdLYw0XOdEFJfoTLLHIiBGf2Ex/djjjx0fPUg5TWczPORBG937IeVyweYs+hiPN1shxE88ffOx/d3dvd3l3h5R/qzzTGPnFw7+4E9e/R//6f/5l3/y53II+5cvLZ3N3osURYxacH6bkbXKqZdKuS5JOUuzpTtyzjrK0ZpyUQPioWp+joKSmeYLBY9ZHDwMNapysbi5irE6hhH6orVyupR7E22nSs6lWvrh4c32b778hRc++uKDk8M/eP2V7JxRFqKNpDF0hFMu64ogBrYMmwJoXwJX1OVFjpwklxLMGDtxE+pptKlwp9HikatFF9gNqVVKNaky5xx8ZJvLUzQigglFGNIYVRXDKymNFE4rK8SkaW4fPfjaaz+40224PLZKW821bFWAqpr8y6EUQVtkyEWaGWg/1aWTKf9xSNEL2eU4iCQVAv2E8DnlscUE3tsnkT2Oeo9lkpJiYqwQ4v7pKR/uhWkMX+pcSXBKq+12Wzp0Y5WD4JaDJ1nqGGpnZL0iEN2DAS3pRpkTMtLkkOxKSLPKY14kQVGcSIILcO5mqlZDepBqui9m4zh0E1pxGYzrvO+7Xo+MG5baNqcZGotO5AerFWaZIuRR4ey0l3Lr0yDkST+crbetUi7nFnoeosBZWYSctsZ8/f33/92d93uEMVY6OVlhKEEhpcmUAHCkw6B8NvTwXlZLjRzZoykk9QFqNDFwj2KpmpUUk9LGWksUDjZ75b8b/ND3fchB0I6Nwh/bKUpJU66LZwrY1LguZeoxfOvWsvhCxaetZbgIVG88Hpn5n3F4SW7xPbU0ujrdldPairw0dqZVRLyJhUacg3aHoFeRo+aBWC4THRWiDCPXEsgxBcYBw8PywkUfMA+A6gRSrLH7EcHHGngp2ClGmHNsBS1FoaS2QtjSscTFckcKeXJ08vWv/9GDVa+07dar0ugLBQceIkiH/uH54ld//DOtEHePj0JVdnBrIvqhh67J8G0/Oj1uhHj+sUfyMETmM3IaC4BvLG8R70VBYjB+CWoxMLzRmW0B8to8d+v0XpNRAl2xVsBA1HoN3x1c4hovgBY0nqE4NFS/V++FhG0j8Kms/FwoRTFNSSi9pSlfOqX1RI2pKpRnFtZ5SJmoxi/C9BmxxWQ6QlHPo4t5eiosp/H2ktpEVaoaTe8VWCZ5lUrmgmcSHtBqm5rNAlx3DJVjmQKWEdxNQCevUETAXYOOH7pAXLiypi8Ifh7lgQYqJyh1jkKVRMtpY1wzQXIDF5MZ/7jhlZBlcq5huIBSxunW6IadOmojUZ5zZCrnsXpMWXSnZy/cvGGEWG+7mFPbNttt14ehXDBIUQgxnG42IaYbO4uPPfpI4+z+xQs0/uVUPtvO++yaf/zP/9Vv/dvfv3f78LVXXstdP59Npk2jS/2nQfXCTkga3q+MLpVjyFJK9B9KIZNW5ZlBRaWSEnDiSmud1iZR0gS7bEpRW5NE8iGMaX1VjqDOo1XROFi0ZRNtXM4zpac+XJfm1z/3hRee/tjq5Pi3vvJ7rw+dcE2qOawC+2OcIVF80JzRvYJpugCTMp9H5DEBFwdj+e1wZceQqh4LDYOIMLyCFiRwWmpRWvw62ZbnliqFCimH6MMQuHCD1VJxxVX+gCim2k6t6aV8t1t32MXyluU/DPMViW2qCrjxzmj+/4tRS4AZMma7wSgdhdzGdOrDNos+y3JbSrllVjyylDnny6WQzoHJs/BqBu/nAHsfbdZb6BmXxjRVAlNLAaNUOfaHbVQmAgCu0cqzHaqwm3Ns1aiLpsqJkLiaRCBH3iReGe6Gx0ghrMFr/F6NVxIVwpiZGIwgqtKSYtGYhHUuaCGs6bptCF4BwyCrUydaleamPLnHKRxvV8hn4I8mY05BKl9aYRmyWGj70GRuSktHjlWiAovlcMpym/LaqOAwqGDmEU5FCsuwXcKwA4M7xYJhnMRVGT5/UShTJIM3pEXDUT1zogJaFX13VVaOk5BvBAdNQ9enmIbSvUdJDyf5OJzOpwpHxtXFJ4WVUmV7aUghsUdi7iEk/yh6NVZiRPLjB9MgqvOZy/Acq/NcKon7pElproTInp9WhYIllL1J8DJOIg4hxCQG3G+0ctNeRqQlO+wa2F8qpICywCAPGZUx2vaqvUVeIYXjpSgPIY/+V7bbyQ9a5mYyEa595U/+9H/+rX/zP/zzf/XN77263NlbnZ2xIFBU9ysd++7jj9/44rNPr4ZhM/So8oVSJgNIaY3x3htrVt32eLW6urdz9cJFP3Slm6L8UkLYWUHuWahk0cYKkRCOjn7MGlxNpjy5jAutFkOAWg27NAWUdeIpgUAhWRfzSlbzAFIzMdNQouKfJNM+YbBJgMiVv68GSVkCk8h41rBEIWQl83GSiYWeIitHs9DNWYbqLFXpA4soFm5JIcRKsyshz4//o5WOuGBpBjaIxcEdLODAsFBdUFUpsoh99ALtpKE2BNxixCNKTcIP0cG52i5HWZmg2Krmr9bAOw5w2NaKuh7mqYSHJJEsBuqSBLUIfjBp4BbAtcrgd62qggVb+XIspCEnoqXk+aQK0mFWTHJUUPbd5mA5v/nY1QcPHqBmUm3bdL6DgR7MPyW7oTzVn3jyxp6zFy/uNxOndTmFtJDRp/ly55/97v/9jW//2Zefe+ZTVx+SIYTe42Arr58WRvHHwBAVM+ZARGNN72fZVTXrJGVn6uuYUi7GHaGsKQ8QLpVKUTdNU9f5klt4ZjKC34ay3lqDiPYkYmikbGJ+WJtf+eRnb374uaP7d//Z7//OHx/d2xob8K0FnvXCRMKRMQXPspqZx/Ua+2PBxBlwHMn643cbJWH15Cfm+j88LpgeYrRmk6IknTLM+OcjUKMaqr6VhlJ1TriuiGWdIk300poQs1GufgiY3FDURm8ks+gNrDxjBj1GuohQVTHrLKzQKeU+pVPvj8NwllMvZZdSl0WXU1++L3k+whXVVsJRCo1/dqLNVOuzbjgNUSs3V3pKNXFNe1RKWe/DdtsJrYcsjW1I0MGVNybVjAFFcjQBnsMBcHfKEaENdQf+yQSvETqFiNC40lNJtp5MTJE1UoGgyzoUY6NostDOdahON9sNGzhys8rTmGSrzFwaLe1JP6z63tKUg2GakKKL4cx30pgc/McuX/risx+xKTXCyZRarRpMKmhEg46D86tyMEIpLYZS10bNwl/V0AbsnQCrLU9KZGSiPpc545UpR1VE9SeCxhAGIWsKbg4OTBjtII0lJ72mZhsIrmIKQymuZY2upJ4YBRyaLsGugH9nIrIResiEaqv6yjNOE6T0SCmAAKIDD2qREDG1yxBjlE63wSGK60Dmcc7cSrVf+gUDL34VUEVg86oxH8qwCM83qYTlc2GiGgYdUlFICF2drKDqeg34YYge946sjhVTGjKVNfDuoD6JrIl6pLJQgnQhdcrK2kasu5O333np6uUda/+X3/39r37/h861J6crUBoCMahJJiXSl154/qBxR+tVok0P34+zTYjBGtUPw6YfQhZPPfroxFo4QetGRypBARtWsHDVgLrJ2VQ5NHGjyixj+YSjsiahf4NPzbBLCHgYynXAXA2inYWoxnOtI2J/gGBCRoGoqmEGsZFuJ3h0omIuzUJWMYqQE+lOHLhQFX+OAsafmfW54zuLkIYcBomkKTpf4eeTMQWgoyIUsXUyxv8f6LkYBm2QWgnsMQ4N+l9rcVUa+hTLF+hJ/tIYLUBdGpklAK2EwA8fK1COweks0co34yP8oBCdRvAKkxjJDucUembWa2iJZJZWlGcjS5qGSzOYYXwwGjewMc5YvgYIwTA8pJ12RFMPaUgiW+MMWPz4VyxAFvAF5OgjtNkxf+Sxh33fn603QPMLq90wDBTZxZR8jJcmzeOXLlqn93Z3jLE+lbdpszlNMn/zlde+8od/+vK1qx9aLibljSsfsNJOK5NjFCkYJSC2NKXAQ5uBdJ4w6r1F+UTLE4AcBwxVTAW+lsfNwvqYZMSeJ9MDXu8k0Fpw35TfPfkhxxDjgJ2XqnM4KPkVEQVxeP6xR2888ujdt1//37/2B394dG/lmrMUVzFuUohSlS8ph0qfF4SkUnxUnnbMX5nOaejd1Vh78rZD3lr2IVBkx6audNKjIYkFJ/QkARrpFAPyXRBCBbd3LF97jkZpR5Q9XmiQ9AH4Stli6xFzOhu6gNUMFlo0QOY0hv+gfkYWogg+g0IXyNIuNZXO0io5M26iDEvsIeVtjt7ITYqnofdSBFWutyRZM2Gvir+aU0hUhcppI0VqlJq6ZhuGB31nrJ7IPHMmVdIcRnylUIyb7VYatdUyWyOrBkPUjoa3S+1VIdtkLiSihaQmu7lGG7COUFWjm8Y7WY6I73we8jqGKGEXrauYiMLa7JSQzvVYNmzWm9EyhvoXHqOpMY0SwqrDzbYL3jBEKMNGiwF9lsYjIPb1owd/+MO/0LYxIjeVPZstOkvelqibkTpCdzIVg5X4Rn2ZOpcdYxuq8gioLOdfqOi3HAF/qUlT2PSlWC1Yki+Ds9rJ2jGAjKEQ5iho6MizyWwxX87nC9dYdONhpMuhP5Ef3IWsd6G9SXVXWscKzI6QalzwShm5qaECG3F4GvIJaNC4FkFWaKnEEOBjYp4LuadbW6foCd5obbjXwQ4qgMhDyoRAbDBUGKoKnekmKrVulWUwHo2cYimE01Zpw4AconRrESur3xQOAxJgcg36xHZd2XL8ijjMmvbm7u5PPfXkjcXsH/2L3/7jt27JrM5OVwKCOOJqY/CX55Mf/+gzm8GXF1upYRiMMf3QN7YJqRwHUYipUk9dOvB9x7qTexPNOXMmEwqWVkjZy0ETo9TlORwG33kPSb2uPBljkjQESVJBxk4fycxJW17dwpRyS/MEr8+D1owMoytJarBRUe7R+wgtS0JkxcB2TTKak447hqfgRCFBlxN+RlmQ30aCgdYuV+VLeZONxGYHj7jMhojB6q5AmxwRmY08PQFwVsScR1lJMJVKYRAVuJ/h6S9VAuLtDAqmRA28Rrg1pp5RAmCURtffeVRoDVGoWCVG2SqmRPMWYap0Tvmc6mtUJZvzea8zbLTwUmRLonrymRUGHCUVPoU3ooEGHlukcu4gwi/CB01tj0hC9V13aT5bTifD4LddR212EHmIXindge7++MHFhdbz2bxpmxS9UzoPcbvZvnXn/X/6b3/voHVXpjMnSsWgpMH2w5ZvnJ5MbUAISxSmYVwk1BjlktGd47Yrn6QtPzlSLHPEMSsDF9uQDwD6Ctku1Taqbs0wtNBIfDF4f+gnlRVogfOnD8Er/X7XfeUHr/7jP/rGK93ZqmlOYtxksRUxaZWkClwdGb65AE/GHGDNEHW+JT326PCs87jChp7+NFmDkjDMUwQjGOKRxyGi1pJvRw1fEqKOGhGvCslfjY1RWdOuMa4my/kxc02LyMyJ0iYlC98N1hxCm6o3zDn1IQzBp7HFQm4nmUN1K2zRDQgRfURdoarDMuY8ZOGVGHL0OXUxJzXCq9E/Dyng+S/V8NQ5CzO7k9qLdL/bCCVdLlc7rUuy3pjlod6sz5KUG6mFcbZcC4lEMfJ3BbyBNT8XzR9jLDLOf1mzv6B6Rq+lCHaqP1ZteCXikHMVUcuxnxUjdo2quFLRSiukNK6DnG+zWhtNRHSNicYHbRrc8XfXm4jBm0+lAk9SYhyqhhQ7PyQl39mufnj/vralaLLYecLdVU4yBy6ZD76HKAYhQN5ULAYc6jDa59qFKNAJCIZQlR+f1fkmpOanM1UDRZYUIiQfUii9E1EYmWOcHHwUWaJ4yhDwoMbR2jpHwJaqU4gKLkUvhbeQSCEaTOEbO+dcVsEG/xeNM6pqSzYIh1UULgN/T8UE/HqiUgpFyk6pNsl5LtdXee+wRRMVr68wyA1Qy5QDKEsxpOQrrF9RRgQaCRwOkHmfk3fqhidlYw2JYuRP4EGqKRJcbadxZF23O+V3SdzPR6IZJ+3OxV0d/F7OL19/9GLr/sm//p1tln3nfTdobekjg6YvfOYjT12w9nizEVK6xm22ayRWletzsVgM3XBld+fqhR3f91BRcXEgMyBcmF1wpyoGH/sszGSy2Fm2jWudddYpqUJMnjN/VZo8pvEhSRmAgpQDFKq4S9ATcCZMQge2qiLTgRJZNmVIe7RFmZYrshGGTkxTsWOraVc1WRlDunLwKYpCRs4d9waRKEhZNcyM+yxXDkhUpXWsALuUxjIufVAoY0dWB1yUbGLzGom59slvO7qkTP0xksI6lloh9J96XEPz2aSyJFOVVk4NYq5F5SUhDlZYZiJV6bQw1o5utHIgEXpUszowByrVpLWjH13yBU/Rq5xboyfWzabTneX/y9R7PFuWnVd+33bHXPP8e/kyX5rKyrIoAEVUF4iGI0h2Qy3TIWkkBSOkgSJ6oNBYf4LmCmmsgUI9aKOOjmaLaIIghAIBEkCBQHnvMiu9e/aac862ir2+fbPVkyaSYOZ7956z92fW+q3pxubWeGOjnm7EatIFmndDfqJy/SQCrL0++tyNs8IIw/dAcdI2bZW/bynIOx9LUpGIlLrcDtELly5Mm3ptffokebFfLqhu/++f/p3x6YX988NilgRNxqN21AhluC6T+VBF+CCVWHofLAeXctm+UiaFkuOOAoFWoRWRQyBlkQI8Qf5iZQN9B5iUbJbTKL9XXU9MvHjiTIcUHKWBUm/MG4eP/+WH77zr+0dKnlLqlO6E6In6EGwMBLdHEAXhwvJA53zfd4CIISxOSsIdpLTh+jrEyABIziOqkMhCq1KXow9R7wSMuzTOQ8JgiSesglZWpSLVZz0ZS7dEuaKFELXWVUojoSZajbUcq4rTaLBUTfyzrbBSuVBw3pUMvlS4J2jMUiNVLU3+ckMYKFoGu8DOxBsam/IF7LEB9Knkp/tUopukyidylZJB75lirI2JpA8XXUpkkphUlY7sYWZVIymlu+UiCt9LTVrXJY44sN5Ziyda5hUcKxXOBK0EHzx7eDI10hzmgMaFokSlokS0rJpFR1msDqQ4goFCwUDioq5JJqUGLSmFvutYjYJvEPNYogmit2MSj+cz/C75h6WUDCxiLsV8M0GlNqqqVsc2eD1Yq6TGjMF6zxPOJHXnbYLDPYZyjSVFvoDFcRRjp4JQOR2i5zujZDrwttgT79CQ6MAnTFKla44IV8AUntVdYIEQLPcx5lNDlEOOVgEMpJXyzjGQMl9UiJ4NPlChQ4gQPO9i4X4DW5RxSalEwCTPrEQ4uAEfUkpDuROwLouYUrMYJ0jOycm3IFXRb1ftBqkUHDAYETnkbAKRjG8NkvKdIikqDSI5HjqtXHBU8Jmscg1SauRAEBsSGNyOwL3cR65QJCzV4EUz416jVMr7IFWqpAohavZOCAvJtSKcVZPNzbppzbK7Omk/Oj7781/+6r/94++eHh3v7O1AQYjktpB2p83zB+d+9+XdC2InBC8kmcqczWf5LfD51d8YtSqJIfetrHFDIDGvtTgwM6S6rnyk63fuPD493d7dPn9ub3tzsjYZKyma2nCzro2OtgcOo0LbGfKBAOU7LzZxKuqkMFIDhDK/NPncD1rJWJYNeAZUmQxBQZKkUYmXSvmT1N75RN5AXQlwNMRMvdPScAIrboGCFmfvE6QBMDv5weiKcnvh8qMBxWYxhnIGCQskCq1cMkeDA+44r4uZZsyU6RZzht5wEmU+wVA1SVMrrbwfWFRgUPJ7ZMkpdpAISGqhFsyPUq6IFKLi4gqvyORSNuEU9Uf+13NTQ7n4wxiKee1aiRTD4N2TCr1tWjmaeucH72bzZefD4+PTRycn9x89evjoYb/sxnV9YW/n/O727s7W0Nvc5sRoB0ucmoyJDTYgGiNMyXLI0Wi8XCwJx4iU0npnvd8dtfsb06atmnGLslKcnp4Nzr7x6fUPbt3/s699ZRRid5gv4AqXXippP5JnbAlsa77VMSMXVWWwltZwfufTOfiQ6w2lWBIIQT4IBBBh5s4i18WcN5NvXMRk5yfQaOU8IWM78lId0EOkEbFSTJAXwqZolJoLGhKZOv8wPtECdPKOQh+CjwQKD3wgeG/5N00pVUZHUbRyGCWT1MY5B+qCYpcdkcr3qxalJRbKF3Rl7lCJo+SgyfLkeX2s4UHwJGpdsRptlbya/3G2sepcYHuOqKEISrl149G4zm0VhzokyVOTxJme+XPzkRSlShvrbYmLSCUBQKR84NRKxSD6SA6idJhIkoixVOYUbKJW6kQOBLfopazzVwD1aK43ZaPV1OgqkGZGXh9IyIeLuc8XZ2y1NiLZWHD6CZChrlsGH5zO9U3NWUSgwCq4VGRhY0jm6BSyAnb7UcmkNXkeBYiiegRyrgQ2SEn5KE1F7lvseyVxGZMkEZQoyfIc7txIFYV0SsFP1JfUzGL7i4ZohGBVS+Fomd+HYhPDjatXiZiJAPSKQTj7tcvPHOzt/ejN33Ux9iwNFXA3SmEQ8wMnNbFViCFiARJmBLlKdLSrPT7ysXGJgoBRAsEE8Zir6K1UwvUO9l5gKhVyONgARv2wsNaNxxNOKc9dKa7EiKuaZTyOQXqcCIRqi3n9mFlCyM0yUB5hUHGFsbZMqBVGNL+fOgTPyDUZJZiJWBCCa4iVIWEHSW2itSi3JY2kGnJv7iopaiRIDjEfbwvK702+TxAb7hMJZURyjoUTJSKMu3xBIp8Xgx2kVpWsI5uTIKpZfRKwmSJ7nbNE2JOcGF3pWX+bOIg7pOjydeFZYqqNcXge597Xzn3/K8/91dvvvPjUwdO720cnp+PpOAVEEAjZCHrh0sVf37jd216RHLWjk9lpVTc+v91BpDiqayS2BNbs8PrVuVjVNZCsUSLHXit69trT6fa9Nz/+9Me/eaM2ZndrbXdra2dzfWM82txYO9jfX2tqWemqzk1lLgSdLVthaIY5txKc9hIrSJySRjxi5WwgxNwjnoig6mAhaNQgmeOdAUgr5Zs4eqVQjeUHWXhnTVsTp5qyzzHkb1ww3EpKB5+3rFgczRMJjytfJDie2SakpAb/DtkXhL9hpQiCxCwfWlob5wfrhrqukWkjhZJGo8WmlGsRnA6sljC4aNHy5mrLRquEdN7imiAOnwfLQMQgWBWSWNqcQHqRFINnUyvblFT+gBFrCHUFd+hN2xpZJRKnZ6ePDk9v3314/ead+4ePD8+WDw9Pbt+7n5LY3Fh/6sLeV55/9tlLFzfWplLS6fGZ66wPceBxl09BYkjmUyqjU6ENcrvRcalKcYo2stfzN/jM7ubO+tTUFSWSKn/WQ9cdOv/vf/6rl3a2n9vbfvzg8SIK62IjVAX3GuTEIeWX2KMs9vmqyu+mKr5MQS65IvCkhAxGCe8F7CY8NZMcQV5UrCpxXjKbgbEsC4BgY3SghQpAg60i6FIIhbju4eMaSISQtKToPLC7qUdzPMRgaaW694GlQytPdi6reLeVTxgUkYnltVJ55xWWcpgFJq1zEcBxSUJLFQya+oCZNhzVkXIhhd8HPCmRSHPgI4h0yXm/Yi9zIrUsnCspNOYDjVIjUsG7ZJp56A+js/l+hFOWq43CiYJVXWgjKvyZCuhShED8A9HSOQfdY0ikUDyUgBwOaOfM9HzSCh+Dwe0jtRSuZL8LSiYfi9KIZKR0ALJKJWZdZ5NvpRhVspZpKFNrnkYr64fB5aMyJNFw9Bj2TgKxgQ4RUyI9QUBQcePnol7TKvZIcjBiirrAIriezscgBvBMOOUKOAqxEgQXQ2LZWebuwCi1ELlr6/tcfumqFit2oYzUEI2VISkX3s7QH9PKXMGayZTIhdBR0FF4VUufdnbP/ZN/9j/J/+v/+D//9m/6WoWUe1zOvKiMGkDEQBBQ/nkgxhEALGBCwJHI8HuyEZq1oFi5i+jT6s+L9QMnH2ccM5VSYNCn2LoLpRyyLBQH/qcVZ4i4qIRrUgAuIQsOPzHCuiyNOEA4QQSNbDvCa8YQNSBwMczhyRT/iUirv5yjqdm8SbJwQ0Iu7CqiPd3sN3osUkDeTmNMQ2Ki6yTlUeiPQnIkFsBlKKWClDYEW45qHBVS4v9Qse6L65ymbWJ+kz2CfgRM1jgKWJ0DHjUjmFbfY6G+YE+NlkkVraPQNSfykqmruumGgYxe2CEkOjeeXFyb/qvX/vZ//u/+m+H0pGlbzL3zgaVJXLuwv6mV9XZzurbolpz4T0I0daWkqKuK+HQr8raoSNlc2aa6Mc67/P0GpxBC/OoLT7/84rWjs9mnN259euPLtz/+bIA5smnaUdOM6mpvff3apf1nr5z/6gvP1bmawMLJWSEjeE8a5rckC56TLzcqbvjcH2GZKhVplojyfDIo3rhH4mh/52Owg9JoAdGoCW1Y+SQUgyfh38X/54P3wQcoqDwhGKPwOUrYqCxIyMgO2hgT9NyF90wa1ttyeiVZsKyxW8y1VMbU6LpiUzfQhAhdNVKbYHEr5+s7+eB5s5tbKQmRDpExBvpvj7KWOHa+aPVC4NOAUQLE0GwGGofiKS+cDuyvm7ptmvbR0dH7n3/2/qdfvP/xZ4fHs3k3nCxmp4OrldxZW//WV5577srlSxfPba5PNtfXvfNucPP5vF92HkKH5JOL3vrBIKWZMZ7pCS4xlQpTC+EQ6y6EcM5JoucOzk2bum1HDO45m53ZEF576737i+6fvviMdL4x1WDt2bLbbBsU8Pnz8zY3e3AUpQBjN/MDGfYefNSkinwS35Pj+jYFBdUNWEQBVF2WNCt2oyuIFlOAhlETW2l5k1XsR5JrTLAjlImCHOjNgZyMqRKG461iin0MLnAGoYzwa8QSY1Sk/mXNBM1soalwoYqQj1yEwTzpAzxjXCLEFVNDFoYBLMWBPXYAsUB8pJArL1MJeIWfUxsDERYVkz3mpmwP4R+rVXpSGXJDPs+VDBiOsIgJjW/UWjmYKkmoyDRKbLwkAlg1RZPb4rgAhRBnErAQ2GV5Yhw51JhCWcB6gdlKla5EFA7RilrKVimVhEqiwV4e+LrcXC1dv7CuVqZNNJLyjI3yAbJLJZONQ9c343UvldZaeM+6fRQaqxb+iU1FxFX6c+HOrtKQIv62/I0UdFZk36JSbEuRJJ9cvIkKi0Ct6MYlmjmRrJTNr6XuuyX/+SrVMH9NjRB1rqzUaT/0zkpj8kPoWdOh+d5DCAuzzoMYT9756KNrP/qLc1W7oaojHwAakSjWsXugqJXmcNFcsOCkYQ8rnqpYoM0YqOc6HfpTpXT+FhODCAWPgKBCwhQxaGaJslURfxYS5cpZkGjrpqqr4kDKRVWuH71Lta6EFg4aSCPYQMKZ6rkJYImbC14Zzcc2BT6Ri56FcONK6PVlofYl9MTEzGrepHLsNpuxJX5IFfyUxKVK76Jy9lJ3MWgp1qqGPFkiS2JmB5/LPUW88CCyyeOR1NzagoPCmgLyziklyqqfJ+eRJwdwUHAND10DKgmeOMG4SpzbHqUxbGTVyDwBsVS6mAbnKdJgXfTBmCpKXY8nYTF/9eqlf/n2Bz/5+zf/s1dePj2bbW2seVxZwdnd9fXzW5uHi+XWdF3F2I5G835Zm6qQhxNIjGX+rUKyfA2fzc421Hp+l5OURpkq3wG269rx6Onz5567+lRvv/Xo+Pj6zbs3796//ej48dnsrLJ3Hh/95r0PtJDXrl5+5cUXXnzm8vNPXdzYnnZ9H8qSlbNvVeLDBt7E4L1kuzwb0obBVEAle1IYNvCYQBVwIRnOuI3B5Oo/xnJM0LBYjNfW2KeTEI4mpIZYNBppBmsTxWHoq1HLCai5RfUe4ByRyCttAmcLoTKLPgrNEN3IYSFwA+SXwQ+dXw7j0Vhgym2MwfGUlKrrZhyRhMMBSrxs0fn49jC35sfR4+niTJvc8UvBGYvFJqB0gLgpFnscxkBMngtBSJULDZ/fyqZtpdQ37z76xes//f3b7x8dHUcSAWrhmR1qZb7z4tUXnzq4tLu9tTatlRiPRrIyvR0G55x1y9mcN182eQ6+M9IQA0I0ZJoxiMKQzT80LgZksIPGE5zdqMTlnW2RoqmMMtoObr5YfHm6+Nlb7z+7szWGUG6CT7uPXhrU0HEVa8HsivzdCZ+7aiWAd/AeSccQp3HkQEoB02uBfXkMZXNJ4sluP/gQSvAivp98uxmloPbXkig4LyL2fdw+ReEZswULtcuvtXaJhwC89xARkzPB4b5S4VUXwP2w6IT3cXgYUDBFF7TQHO5CiHvxqOQZq4BFHpU0JI5tYiQgUCsov6BPwJ6CYTGcM8artyJY4jyCyCiJUEkdS3SpavJd6KxLO+3Uezf4YPExaq0d2mgEdJTXPRcZId+ynFFhSIx0JWTqcvss2BoKIq+KZR8TmGiNJajiIQ0rmbGaFM75kJjFAFhv8ClQpVtLdOaHPrn8aQzh2NrtdlI5N5ZSWJ4iSHbUiCi6Zb+xvgWqe256OSqIWxslEo+qJEhzq+YZTBs8JwwHw2KDTczoPlg3EQqLqeTTMk+aRCw7A0zoFVjeikgGnISmGuA5XSyXtLIhK67nKDVG1RDmnhwvwmoV8eSWc6hSNcaGKHzCibfJ2n/z5//26en6tjL3nAvYkwVI6HKpGNkqx51u/h28FMz0zO28lGgtUwkPZ5aTQFiegpmE5b2y0Kxyq+rJB6dKObkqNnKvmT8w8AvQl7L2qqiteIAQpQeCLGBzDEc347dKCpuEiCe/OJwSk0QIxmiU52wXjMUbUNpwYikoj3sD1jUcz4n09PwcVZTWpXnJNF9rRxtVfdp1HdE8uBRjBZDxoR0euW4uQkwVSsD8EHCqYCgS56JVU/k4hmgbTuHE32ZhxyVtqtwMU0EwYaGFTxV8L8FJDiS0UTAQIOa7/JfJ8yo1UvT5F2ya2ph63i1PZ/N6PKq1aurRP7h88a9e//1Xnrl6vtLLYYDlMRex683o6u72rcPDyCBo7I10PkCDFoRIfaE4ciQ/TjqgKrLeHR4frU/XnbO5oo/Igqt0/sZDCN1s1FRP7W48dW7HhT+4efvOb99998Prt86imO6er0x189HJl7df+/HfqP2tjR9895t/9O0/3N7Y6LulQ84PfwslTxeDInAJ8h+YKp9og7Us6GWrpGJwZEjsUs2VZoUFGxyHeH6gXDS5ZTdVzQUXR7VrUwfnvHOJyCi9nC9MVWutYRHnVRG2huhDhZJFKwWhD6d4lNMPfMR8DUe3OD0VMfkQtI8++rquY4pKVbpuhJJu6AqhmdOpwU+COBN3Lx/iPgU+16B9V1ozt4tkCi4gIZsn7hgqeUayCmaukaDxeGJM/fnN+z/5+a9+8frvTpfLzfWtrf2Ly8EePX6ouuWr165846XnDrY2GiNHTWPamudAy76LRH6ws9MZW3G8jTKRixFAx/xbVcbgKoR/jin1iRXa/GVhwyNFcPHK5tbexrrRBreePJrNvZQ/efNd78NL5/eDp8l0bVSb9z+uut7FRBW/F1z7s60DnuAYyeJqwodWgAQsq9RKWsdXvsL0MxqjveP4Y5aSSxZOM5+Rmx9ZrJUlrL9S2kXHYv3C1yPOXQ7cPzmU9x58wMB/L+jRuN4EB3p66ASFJhklExmfwP8RcCkQrMy4JWCklMAFyS4RFHW6UGpxUAEpE8vhQHxErXg8vPTDNakAuSuiee9jZTRrl4KMELDnlgE+MhOEPHGdiuSTTEr5aCPPbnB+ExUdFvw2xbcrYjRCNFovXL+0LrL1NBajCzP9S1pwUZtG632FPJsUw0Sb2pgzt0gF7BpkUoZEqzSRmPn+eOixnSZL6ajraH1d2zTWhmxftlAMMpGi6xe5+BYiVloMJRRRlAykVOLzYBlgKXPpuVhaq5TwXqTyAWpENXIaLQez5MqXvfsraBxjcGWBHpd8RFL5IKGga/wAou+7lRiSyleY4kSpGl/vUbdMYBYWJy+8EDCgCRedFNKRckoNRDNMLf70uedfGI+Pf/OLLykuQIBTukAtAiWNIpdhoVhB0hCC1iKm1b+N/1rwQRXvA4a94FDh0dQqN/oYcTBfCG0etMciFQE4NCwJlT1P6QucKv/kRssSCBghMWXvDYc+MJuUr1WIoD0b1/Gu5nuVqTElOgZyAFAjCtgSMZP4mrQDO9YwTwPP/Mi6r042frC5c0FXfW+lqnSKQwg2yVlKJ9HfCfYMc8DA/DpU61hI5X/Qc7ot+MNo8jD7THJlF0Gn4xOTfViBV1JJGe4AVz9T4MqmHbt5RPfCVITKSipVgklCPn+xIJBz52aL5VevXZ1W+uRk9tza9P26+ve//PU/+yd/Ol9262tr3MUokZ492P/lB59Y54yU1rmmbihFDdRy4pexRN6T0jq3bc6CPO2IFtPJuHNDSKmJta4rvlQqrT0w4Mn5SonnL+1e2v3eZ7fu/83v3/3gxs2jFKcbGxv75zTJWaR/9//+6ue/+f0PvvXqP/7j721vrS8XCzd0WHSBPIxKLncbLBrAZE8A2s4VrSyIx1zj56NJ89xacqSHNtpz/6OoqVtvLQlRVQ2GUdCySaGV6ewCW4x8AC+OT9e3N1JI+fl3QZZQUChrMOAU8YmPxeukIrP7kPLlhmF+cuoHm78RNEPG1MB51Cn/OxVUKVIrHUiE4KQ2WirnHWQTOI8xNMMIlEWsoWR35rowFnAV5LSs/IdhJnBLLYUaj/Kh98Wt+z/665/9/r1PHp0u2vH0ytULIobrN6476156+vI3X3jm/PbmeNKuTSd1UylJPrdFDp9T9IPv5gtEXHFNkfpusAEQwRArrSKO0SIRZ6s3++wT89KlktKF5H14+uL5Ud2QTKZpll0XiN6/c//NT6+/tLU5Adi6qmslY1NXZ8vOxzTN1Z7sA0KBsJjL9yvrcfKpkl+wmEqiOgtqEvR9zlopI6Pq8pdO0gXPWAqAnJQoZgbBYAbN4nIiI/JrLhPVdZ2IrPdSVSRihTAuYOxSjOR5/a8VawFZdo9RLoPgZGAzSKH5wdChmIeV67wQPPbkCA0RAKnCZs6KUfyEBmnBxXHqHTAqkf3KnJ2F4xDgXhyJkTVqvLkNKRqpYF8i762BqBOi11xAK0l1/vuVT3GwDh7fOkSXfx2YiYEJUsCpJi5vYCjNp32rdaVU793S5TeQr6GSHsZnnFJsdMo/s8IHZhTUGvlE3aibmI8kNnsITrGemmpqDEl13LkuhiC0kipQOlwsIomK4ESins24kgPRhei7LqbkpPKy0pRcLNiZEspC7K0Qgl/FVJBHJR8Sr2wBgojcARcLUmByLD4sNF9FeQWsVULWhJRlF5x40GxIeKUHDEr6wXIlUqbfqNbGutIpt+THg4vFupK/Ro+ILj7XOQ7GUbLsbMqFULxxevyPLl7+h5euPbr+0bJkIIqQgoYgOF+ipTMtrrQqP/LCcaBmYnSoxcNhuE6DGgH4NI0HxiPolNmJUNagc1XQbQUWAVPS0A2oWHo+bjwi72ZQCvAtVa4ixrJjShmeuEty5YLPWJMIkqXakApD+4Pvh+mAXAVApoDVdEpeK80h2JgFpzr4Z6r629O1F0eTSprHPjQUZ1EubD+jeDQMRzLMRHBSgYYuKMDkl5hpA+EZuiLIZiHjlVwCSXA5OOclMjg9IKhSrBI3NfhcEISydYQv42ItyP2WxjEUSydMAl+os/kmh2z0cNF1fX/x3LmpkLOzZRPiK5cv/eWnn79z8/43L+8Pw1C1dRLJe3t5f29SV4vFcmdzswa2jzedjJ1j8CTu+dwJaWmMqewwRCE76/TgR7Uhki4GNzjZ8JBKARkhsOcNIca2Ml9/5tLB9voH12+9/fmt927eun58urmxWdfVuKocVX/x89/+8rdv/+l3XvnBd791bnt36Bb9YgHEuMY2nIpFBBpgLRTXBQiQ4OIlPwbRC7Z7oiCELpV5QDEoaRzMqTqf7CVUDGdvEtD+iBRzA1FV87Mz3aqqaigUv6YqvR1Wdfmd8pCuJLFK/UvFMS+PHh7bZU8pVS0YQ5KAeJRRaNM0+esKSVUtUXLOmqqB4DnX4RE2G+Zw5QtNBK7UMMRTnLLKAg5Ikbg2h2qeYvBRK9O0IyH1Fzdu/fQXv/rl7955dLacbqytbW0qIT/8+GNv3defvvIPnrt6fmttfW26vbc7mU6UFt5aZwdihAB2vfPTuR0s2zm8c70b0FkKLQ0CmvN5WSkTIT3HHUlSi+QCP6wIAhLOBy3o6f1dQDSkD/5sdtx78ePX32oEvXBw3vbL0e60ruVmVa9PxsdHpzY4JU3h0wmGCGoWbuafDYp0lWsmx/FlHssFDrNiNLIsrOyUKGhVeUZyYuOFnSjoY5iNKTCCBaWapMF8g4Chx45WcP8ciCuhwrJHCGLipGhu9hDpIbgdJp7tRU6azdcSE0B5bwQbW7HfSayti8SrmP1BtgJzjeOi9QoDF8HWFjx1ZtVGKrmSUSSmfEdkzFJEshN2NwjcCjI34TKFKPOXWyR/SpqQqLODiwGQMcx5JBp6UXKCMMXOHxRTuH2MCzcgrRoBo7nS9UKK4BIklDD7oexiliobB2IIrdKNqo67eSy85VzrtFLkFlHpk5TOYgz5K2ZciTwZ8hWrYqyVxgJA0IpDJaTsu/wcOm2C0g2JIYUyMM7HOhUMJV8LBXvFaQABJGZVJM0w0ugyf8YMPSm1ooJKJmCmMhQAFINDvbENYyyOVtpq5XR+EN0AKUdc8bZx2bZaK0pDTCe9TU/yuCJrhhEmEZiHmX/Snt0+lXbKvPbFJ4+Ojs5v75wzzdx1fTFUsRSTDDJgY7FGy1pRBTsKsED5bbH5oFWi1GgwJinFTmfCL4dikpGMoXAFkdCbCD4LuO7YBu1Zgyig74kJIsf8DjN20vp8zQOWURKTFYYlBJ0e84rZlB04UQxLg3wuUKEHC6xUCRcmCHUsg4XGkotkPm6DvyT1d7fPv7i+WSXR9YNX+sH87Ka1DykeB3/oh07EiNo7oPynwt9MkEOH4BODeUpKKFhRPqbeDUobjmc3+ZUIIUFKE8nHwNB5zzMUWXyrvLhkMYDGaCmEIMngcAZpCTlLdnAUYlM1SpnHiz7FdHl7z/WLwQ1S6vO1Ppg0P/3d716++l857yTVWOf79fW1/b3d248Phdg0lUJFRZx2CzABigCVy3woV/Kdx/l3QaRZt3Reb5ppoyo32OVyOa0m0TMXPhjObKAS6723u7m5vn5pd+eFi/vv37z9yZ2HM29rPZ0vu5Do3vHsn/8/P/nZb9/4zje+9oNXv3Hxwp4b+q5bhBhMZSj9R0Srh6YSuzkZCz8OsyYOokaRwlm/bMAwpiIlfMhlpBANe7442S6fxJqq2rjBWtuJRFVdeRuaijcRCs2Bl1GgtHcysqwSomiF6A2M74yU89lZv1hUUpNSAX23riXXEEJrrQ2MMaRMLZXUIej8I1kBf3AActyXVUniKWhu71SxyEODxVmG7PXloWM+JZvRyHvx8ec3f/nbt3739oeHZ2fVeHT+4rqW6v6jw6PDw2cu7H37hWe2x6O2rbd3dy8cnKvrKgSPwXuUSntv0TDFk5OT5bILWHU65/Ob69PgcolgjFEknPeNaSDHR5SASBrRP+QCeP7AjgsxWLs2Hh1sbUqRTFUPy14o/eYHH33y6PBbe7vrdX14+GhypSIXNrd3ttfX79554ELSTUUBbxKOPBtdSAjPQViqDcnC21varzL8yrdzW9eBVppnGCc4ATO3cVqwCZs7VIwOBKVgtDBJVUkYRdrZq1V77P1trI08D2MjIzl5cYYgmvxIy1VvUlyR2M9AMSnyZ4G9xJMgqxUnlLeQMSnebPFgWZAPNvgIJBm8UsGphIELmzhFJF6FYO2mcneiICeMnLdA+Sb0ks8uVOomn3RalH03TJeKaeC5995sxiLFebD5nuOMeVXm2wyMEwmAWYr5/VZJEflIPtf4GtrYgvMXpD3yCNmzJIVmcyBxmwnhfU20XbULu+y94124pFBLtW6ahqQX6s7saBl97peRJSOFmjnvErWCRpVupFgUJBW0S1I6P/gQBmWc0UYmBWmRTCX/l9MFqeDzU2lIC4wSs/ikij88f4yprIkDnIsrLDwvsNIqPlqskgoFG9tZkNlI2eUmWPngnLcMReLIFKJkBI2g71ukuLA940RAMiuh3ACIhNoYA3GmwwzdC2lJDBQ/OD0mZS5PNrsZPYzeC9Ejc5/pKpC3+RVzJGmjB+8FDmVG94FNJfEtwLKoFbIKEtt8AalKikFZtKLYoA3ESpxR4InFyUZWqws6klGM9cYeEnfOSqXA9GYfPEAW5KBkwZNbmn+TD7ogSs6HLO8khyhydlsxTChEFyPujdEu3m2G9OxkfKDq5OOxdcd2uBPsR93iXvBzKc6is0LYtCrCYBj30IJF+I9ZnMyIhQj1jlKMJsZvCuqRYA8xCl8+UxiAxh5TBphQjMaY/MRLZbTE18JCOGDBwUTlxK0ohXcWS8/8Shwuuq218d7G2r0Hi1prL/XsweMX9/d/+dmNX3/06fdfemHZLau6kVK1prp8buezW3c9yt7AK7bEEbM6ldOLxYUyd+psAlWSkKs/eDufz5raKKMW3UKoNF2fMn/Ney85N4MTJ92gjHn6ysGkHe1sTK7t73148+71h4/GG5vT8bjPn9zo/tHZv/nL137xmzf+8A9e+t63XrlyfldR6PseYfBCSY0HJjGwHhurmA9RsNWAgVExwF2NS0JDpRUSA/E17hU30o0nz2xMTpBUSgfpjdSzszNTGaUVkJOko4ZtRLjo0IsXjSRvD6BvSFJq1p+cHh0XbSCqpLptOGtHKq3qNnLql67r8VrwzmhLcVBRIDXIr4iSiSd64EuUfwXEMcRWh1XqiSC43KhuGu/p3Y+++OtfvP7ep9dj7mPk1u45bdTxbPbllzc32ua/+OY3ntrfMdGd216/+vwzVdvGGIZhSMU0KfLtC7vS6cnMWYeJnARYU/Z26AcHtLaEWdlpmNpzi5KPcc/fLBe3GKU5TiMeuuX57Y31UctlpBuGM+9fe/PDHaWunduxfVe37eZ0CgOa2N3eIpEG70ftWMr888CXVQIvuewH4IIqoQKRDZ6xb6jUITzyCJBUyXv83EKlSIgFlIiyZ0NwJQHzUikaIVuttIu1kaZfvqTqP3v12//ijd9+2c9J8Q6DN9wqkA8xcTaJAiWGaT/8tiqlAlv6ONmb7fogTBKgCHg8DMvFGRySP104/kUSRtcy36D5peZQFoIbHAocULjRgEqsuqX3wrvc4UjsmPJv7RW4e5hRBiWKio1VWUqBf+mTkbISQKfmDgleZ6Fzkx2GMmBNgUuKCNSutz6qxMmHNnhPuaBhgzbxFsxFbfK5WphR4CxqrSFaw2bNx/WqbpU6tD2Q6/m0rZOcSDlS+f19YJePvEtlKunzeaLVwrkhuImUVf4xOGOHY8fy7zv4wTnrlbJCrUmVnCOpkdMUZXwSIbDCAchcOpTMEMX5tkURTSiT8BoJlpRhBMt7jpIetZqj8lX3BHeJjrvR+lQkp6SzNsRY1cyILyd1JURttBKid7ZzVhotOG2PbZ+ieFFjPkbJplir3LnOvR2iaJXupJwvFi/vnltT4v2z43vRBZz+lrN9V8m7nF0fkSWpOZcxhEoKR2KIIR95YPgQg9byM6igzxRPctzyfwdXr9bAoeXHUXIuA1I0VeTQjFgQaE80OIA5ax4ulWlDydlkEzrG2lyEs+ptBWQvKT58kUPWpCHcy70kiIfR80IAwifvJ0I+M16/0q55Ozx0rovurvefdPObrp8lOYCjEdXqTCSs9UkobSLqAKSWyFw95iuC4K8SzgfeCbHiTIiE/FdcFqtFgiwBcLGgzUoYK3Kc+HHiQGYGuUCFyPk2pKTPxZXn1ZGL8fF8/vz5vUv7509mc6PUzA7Hy+Wkba5tb/7V679/+dqVRkYJ03ar9dXzu4midX5SAfscuKHnpVahRsFg4ZMQdVVZl2wIfEpVunbezefztY01meRiuWzaEVD2QQupkgwuH3tCkub4XpIXn7qwtjlZG7UHe1t3jme/fueDO3dOzl28WCt1enLsSN2bdf/hl3//mzfe/caLz/3Jd7557eolEX0/LIPzAvzfwvZmKxyrYhjruIoHJSlN9SRNKxihlTIJrATrna41PH35czbaDFC06qoKLsoUnLS2ttoYawepdCVbL0KhsysetMVVSnfus43W3XwerRUJK1Il66bSRkltInK8+ZEjomY8FikNy7nwQ3QDee9BOEegdRAlg4aNWOhxQwFb8QrGIUCwrupRM5kturc++PxXf//WG+9+eu/obDxZG48bBd/gR9evh+Xi1ReffeX5a22MW+P6ylPPTbamSaS+X3BEt48wk2F3E308PT5bzJdiFW8uhXJ+mM8XglQQQeZjXCalKyOVBs4ChsEUBRjq+TkMwIkkIV2+qd3lvd1RUyVKQ9eRoN+8++GXp7M/Oji/1TSPHj68vH9uMmrtclmZ+urly0b+ZnBOQ3QCJHvgMA0tNTSzaGVkob8wfiDmx8lwEEkZpa3C+xjbEoWIznNUqwLcRoLWLiIiy7xvpBrHsGHdf/+9P94x9Ww2MyMTKd/rHk7H4FzAvcMWdCpBpwW+bTScsoGYnhN5+iJlMVDAJRii995pnhWzOYlF2sSiUWFMHUNIinN55GrGiNAL6IQU+lsz9N+qJ//g8sWf3735brAl6p4bC9RrQpWPoJj3ArOHyJBa05VK3uQWNPBhAWODUEK5VFKlhcwXCqGuqYzm28vlulCtgmETp1uCdURY0hO7PAmKHJ6gMDqhSWLdVNbZWKh2VEs9ITmV+dw/TvHL+ZktaMLIjEut1HJwncsFXEVipNSp89iCFTBLDGEY+rad+lxJaZEcTyGkKANnUTQ9nNbBgUgr9qEsyvgEYr8m9icyQULwOCmVLA9GbvB/5EE0a/ZWTGUtpUXojF0ueR9GxS6Sf4wGUOIkqXOu84G1KlBgSjYxBlRtZ9Y2uM9tDFrQgMtLUVx4O5lufPv55+eLxfjG528dPbyT0gL7S4/ZeKWUw12nuaUOvjEaWiohwdFO3iNmk5jjw7yhMgeICSkLAH+lMFr2IoaurqluPMfVRkauiBCiAMVNCWDkyxEbmTEWMC9w1mlgV/mSQn2qYQHymJtHIctsnzlRSG4IBmJ4lJaCaYMgEBHj0cljvEs0InEg1IGpKiFmuWuhW8Pyi657RGGuVe+jhfkK7Jj8r2D7JF3IdTiHx8YSaCiAmY2mrmLwivLx7xkvQWWnhd4u1HUNrxLCmIxJ0ccQtKlghdIseYZpOTeBCbIyuISJ3Y1SJKN1VMpaR85qKZxzi767cG5/urauVOXRrEUp57PZ0+d2vvjg05/9/q3/8vvfscvT8XTqvT3Y2pqO6kXfjWvDVwjLWlEK5JLLIrstUBnvN7UZFmCUhiCUlrrubRCni8l0JIVeni5G45YoSKVtro5lZQyf0Qoh9kvbTTbWnhtP79y7Uyu1891XP7n78NfvfxwSXbhwYbDu9Oy0y4WJ/tV7n7718WcvPH3ph3/0neefvapTXM7OXApGm3yXsyGWgfeEbP7E6bbI2BMsf+WwClmgkxrQD+drA9AxlfgNNpebynSzZZCRlnprezLY3g6DNo3CZkKoVYIba/J5wZJrWrGYzThH1ucyS41NFXP9UQttlKkwGolS6xBccB25HlQZAmGMvSsl/GwVcixzQ8eJTwCOhpDbnaYdKW3u3z/88MN3fvv2ex/euH3n8XE/uI219bXpRBp9/+H9Rw8eXL1w/nvf/+b59bGR6tLBhd2dzSTD0HegVAnnen72yIuhtyGk5WK57HqWKSBEwqUku34gFIlBhArh7VrLuq5qrWJIzgEcIYVnyi3lVzLkrk4NGMNc2t9jfqdIdH+2/Lt3Ptpr6mfO7bpFH+ywMR0XfYpSlw8OxsYsl4M0Rijjnedhr0JRK6Ww+T5WuWIA/FyTDABhxtw8KVzQ2L0CZxYR7YKRGOc1Q8OQz9rAj6tO+caokCtanc1/eOWZb1x95l//5pcPoq9V0weS2oA1H6Chq5LgwgKiT8FeAAlHQ+AcJs7JEEwfo0JLU8y1RXoazL44+vA05nMDTG5WaufzWasQPA4rRTEiJT0/VgB654NrV+j/8bmXXt7cO5zP3zq8y8paDDhjtRKLsDxTKq2Ivc4pilQp2SrhhtBqtTsazZZzQDKSw8+AIKgEfX0USNfPZajOjbgLHiky2HeT4qRhPhGohCdjlIf5Rz4/sY5RRDrGrVGriOY+9yEG64mxlLt12+QmTd6bz2ZFBgvNVypJCX1wczukptEx1qus2VhMMvmj74chTNYtFjQloqJsnFMJJCzdAhXgoFxxnZ9M5GFc1VGQTvyhgdOBaQmViL8nsb4rGxuylSQVSJ3UxuIH74dBrFb5/DOImFojTP4f1dx2PiK2AV5zhDxGgx1owB7WUmJ0BSwNFIUaMPF4YJdv3f7y6b2Da9s7Q3TVMNwcuuiHhNMHMPQAl6/MlRNrUGUuzBHgxXE3cL5zJGsutPM3ilFaTMGzVbbpu//hqy+/uLv3v//iZ591nW7aPnj8CzqW3FsW20WWmYOYqqMLvEzId7OE/7VgXxLjtEo1hME1FAe57VJAtCDFD5eQA2Uk/6HwHIwVELEPmZTwYZToUtVeVqYNcWm7PoSTgb4clo9DWMAK75Hhyjo5jpAXZErIXcJ2Mt8DcRUwD5YCnnROHuXtEXAzrGkLve2NMbmeyCcLpei5nLPOGeRlMlsm99UIaYApjHHtQQvF226PvzB4TzHW47Z3ViV6+spV0TZI9YmTdjQdNSfd0PT9187v/vKdj772zLWLk7ab9eOJ3hmPN0fj+4v59nSCBUI+dOC4Fpx0L/ir5gOVqKq06tkkr0toSUyddXHejZpKeG9MvkRc8FHCMJmiqRpswvN3obXx3ldNfeWpp8bt5P79u9OrB5c2Nn718fWPv/xyNBptrq/PZotHx6dtW48q85t3P33noxvPXj3/j7/7rW+89MLUqG4+74alQnAFjED50lCcuJ5/KulxcUm2b+Fzx/Cci2qvZRMiBJh4kGpThbruF8t2bXp2eqa8yd+88wnloA8DdHKQaWAaJRnqkm8h4hy36GIlzaybpRDX1qZ10/ARY0SZ8Uil69EkpGQHy02Z9zYBOUlFEiFxSSikuIkSwl+Mwno83QyJ3vvk85/9za/u3H98fNbfPjw8nC3adrS1Pd1YX3PWXr/xhU7hP3n15a9dPG+M3NjaOLe719YGmWkW+TH5yHDQSYncT0dr7dD3gcOloOLBKpOWywFJnSqRREyCiBTy0ygFB62u4u6lUIZHfYiyJqT8+kaJvbUJQP+5jPq7dz98sOh++OzVKsXj2cnWZHxua4NCnEwmsqq2d3Y31jYW3ovKkDbOWgQrCZ66PaGBEvMo0FUZraz1ETJXhVPUk48WNzqwjEZg1sLfOEz2WsrcxaO8VSlVQio7XB2N/+tX/vDw0f2/vXV9OWlCLohyFcENT1VV3I3CF8fecOkB4SopIjDFQyPPczaBRrDcCKAeCMDcEqsPKAo4wvFRE+ulMN0A9pVltkhv8yxpIcY8+Ljejg/2L35ycvLB4WOtNat0wZPn3izmB4kRAgQodRLcVxuZovdayImsW9Khas5sn1gdnKKSAtcsg1XyueNQaoTCBGVCOpx47PnkZF8uEULA0pd7VMpVUMi/8kipidK9GwYGvkYyIq1LsaZMH4fHwZ94J1EioxuHEpV4K5dm/TKMRiKkhgVWGANHTsyXcugHUoqxNZgRULkWVyGd2NXSCutQMvYjt6n5AnK8gwUmgoMEkAKOqybyyiet8Fu0SsrhoAM2sQHxqW0UgcQw9EmGIghmYUjyjam0EEGKU4i2ZeEocbyTiKwJLFIohnyIkGAfir5GffP+8vTks/efun97XWkXKQxDFf1akoNI8+D6EIw0EATkNi7CnExsdhISvIwgktC5GGIpfFRFQl+aVQVL1lai71959pvre4+fufu/fPB2bMe11gMWzBzU5WMqqSS4uVY7UdSSMWkBWxtGU5DC6wjVX7EirdIsUCem4EOlKmSKex+owpeHkThExewKQi2mEo2S3Ff6oKrXSHmiI2dPUnjg/UmKQy5LyaMGgfwiQN2ev5V8ouVqSrHnqCBZgVaUQgLbJ5QwAYl+ouiaCxO6rhqD8KpYfufIawcQz/PfxMEynHvECREcK5ZSvlEYNBMpXzWJtLM230RSzLrlhOjKlSvJGGMqrUw7Hl/c3e1u3+lOTp46f+7To5Nf/O6tP/vhn3SLuVF6Mp0cnNu7+eEngR+mCPx+iQCJSFbMF8MTf7pWajoZH56eGtNoUag02Awl11tJZjn0lTKVqTQk4s4HFzoEF+ZPxwyeRJrPZkqqzfW16N3du/fWm/pPvvbssxd2fvX+x9dv3d3Z3p5MTT90Z50f1U0f3OvvfvbeRzeeferit199+dWvf2VnY8cNfd91g7CIYjfI21QM5Ye/TKNf4bR8npqWpE9T1x7Eea0hehGqadvlcmmMqceNggdrvliM1ifRBQpCNwawF2aaMiIm5nsyKmN03829d7nUy+efGq+tsSQX64aUvJe6qkbTfFf1S6N08rZfLnC8CirnWim+2a2S8mPrIH2qJ9Px8dnitZ//5j/84vXrX3wxXduIQt96dGit21hf21ybaKVv379/cnT04oW9P3zxmc12ZJQ6f/7c+tZmDOHk5EyQ10LHlC8o5xx+IhpgfQbmCjb6CKxEcAFpnmih9NLmIquuNYQFatSOFHBLjNogHLkpkC98R5XyAR6Wvb2wsbbWNin/GvHm8dHrH358fjq5ujGto3/m8oX18bhR2F4poUyt1tbOnT9368ZtQgKFsy6uXv8EoFUup9BfqkITzPcZ726wvRKRPBb5+Zs0iAVifyJK0ljoLpT/ZyOVEVThPF4blv/0W9+f7uz987/+i5uuS81abubzlUCl4YMqJQCHgjlH4Gki87rLBgx2Xt5HsIeYLVnE8Msichac7EYyMIsDWv18CPuUWxfEAEtwthEMjEOV7TDRJ9Lm1rD43979+3v98oPQadNi4wL3LpOeooArPnJx7pM3uUXSlfNjXckQK2Vs9MfLOZTZktPBPSI2xJPEalFoDU9yLiHuDPyf/6OOgqDyKXHmT3bfSKMRqZG024wUlscsC26i2KlHW1prKWch3lrOesn8WDadJviPlcYXdtoNId8evinM9pKFABKvGLoOUwgpQHoXK9kE86kEmC30hFDKHJeSNsZcrSKe0f+/tHqmXUfOf+VWduUpKn+VXF3uksserZADIAfrZHEZre4RohHE4EGZs6EXolC4WA+GYxOx9fhThJxLTJBABhHSl8RVeVvQ45OjcUhP7ewKrSZdfG5zpxvs7fnsHtFSKRuZ6sRbwSBIVMqk3LFZNhRBGiTBxEnszCPF2FoZQ5SSTpX+9SefXHupBQvd+BQk5icFKcbJk5hdB+wdMULntP/cMWBzFZhZL4CX1EjJhQMnCFVyaTApQDkYPImoFXtORHSQaazWiJAoBhXjVOltofaUqRHS5KQ8k3S3H05DvgMh9UcWJ6TVxMqY3H0Kn9/OQI5rXxYpAReDMbQSRiZywcKWLThQF2NSzBvhU2SaOoYXUjOAg6eRCKEzMBmXiB+mSaPQhmLcKWOiz3ej1qbrenK2bWvvwkbTbm5tFsiJSLWpL+ztmkrfuH2nO5s9t7f91o1bH96595X9LecG45uL+3vxvY8YxOEpKgThBqZAcxoP3AwCXYSPoW0qdZpvC55Wc6JvhHipFa1d2lhTb12lVDNqQ/6ofFM3utb53rPOWYv9UlyczIyu2nrUDafBDruj0Q9f+fp7X956/+ZdUVXra5MU/KIbmrbRVXXm7BufXH/nk8//7V+99sKzT/3Jt1756rNPSRGGzrnBRo18F11x/AaXpUIVX7kUurDbUBq17ahb5KrSaAa9qboZDYtlOxpba5WslsuhXZ8gLNEbqlavZnEflrNDKW/tcrE0lbZD7h/aSYuIXa2xG8slozLVaGTqqpudCds72wcPni7HfiaUg6hOedeFRC3fVq2u6ruPT376k1//+V+/dvPWnf29/Y29/YfHx4+Pz0btaH9/22h1uuwePniwpuWffvX5Z/d3Gymmdb2zv9tORsv5Ir83wXkfl84Ozi6X/WLRKQALEevJNnjDZFJQHvM/jqgPHnYkxIEJH9y4bZqqdmEQGNZJpaxzuftF9GekgtMlIZZdv3t+r1Zi6AfT1L/9+IvTwb9ycfv8xnR/a8MYE52TlAzAVbKqUmV2t3duffo5gxa9DQi4Ra3HmAsqca9Kyfy/ZWtPIYMxLwrob8kDZ2HypegZ1Zkw2FPIZtAQWAHkmKjvX94/+P5Xvv7xF5/99O5NOx7nd07r4K2LKRefWq8S/nP976FU4oAu/mup0BA54J6fDTb6JqVZoxQRc1aCX/AUMfxcRgqKzal4n0LyIPQFJOgp77Esy7+7RxyX6JT60e0vqdJi1HobwRtCaDr7ZzhUT8rkgFRnT6e3+YWRMmErKPOvU3SbKcpcflWSc0a4IVw5D5GJDoEhugUwdLHzQrog1LJk8HUHdKgKE1DgwmLcadqaqHeOlFExN9+tUtt1VaXcv921fZfPSwUpJcj4xKp2/j7FfLAB30+NbJ7EpjL0qkpIa21MyaIMUHyZUrFlYsIogijG15IuJUWRyhdNc1HUaNyAzPjBcj5wAjkbSLFDKHqcJFa3MobYUUntNHK6KAy2L2o9sYI3IG1KReEonRUKdJlPRyaGiRJbz0Bn9cTLUZmIuy7/9DIN3lUkukqFflGntD1dU0J89dz+8+f23z07evvxI0/Jwl8lQv6cE17ZqIT1gadcKKMC0C28DqHi0l0BJZam/teffPDB4cPPz46S0UqQL2Uk7D8FRxfLUmR1GxGeZzjic2eTfFyleRTjMbutMNEAtaFs6UVJOuByJnKIh2DjMc9hVEgjEttKb+YDIJJSHcWZtw+dPQHbApjNEPEI6wpLxMBz74ADHlmzWiFzBjnlqHAldzMxBAol0PrJloJFDTDXU1GGC6EQvo+qAvhlhTkcOO0YrYEUBDSSYFU9w3xQLOcSQfVdR4l03VjndjbWtva2RaX6oRs1zfra9KSbXzk42NzcvHn37jqlTx8c/t3b7zx77o9TCM4O+5sbRtBiObR4HgzGufjEVakDRVSsO2YRijFb6+t3Hx7JiTIyXzreOw7xGwabf/Khy4UBhgZJEtpNrYxRpKrKuOBgLRV2GCiXzME65yMYat6/dOHcwe72+5/fuvPgcQua/2I+10Y3dSMRc3bvbPnFL3772t++/vJLz//DV/7glRe/cmFvE+FvPavh8k8Z+MKlkGs4xYsrJA7FbnHWKjWeTLp5/u1xiqvxdMp3Bqzn1J3Nh1lrmtoHl79oQGaSUmXxg5BEUdHQ99jE627oqqZtp1Ndw98FihWyequ6aYblmZ0fgWECBiOOV54LafBKY4xD31OiUduSrG7cfvCjn/z5j3/+tw9P5vsXzr/88jfPZicfX/9SKrmzvVVX1dLZL+/dj93w0sG5bzxzZQeDlM3t7dFkEhLdf/C47+z8bG6Hfsj/r883kDaj0WhjOjHGrHQqMQ5skkHAiLW5ZZTC+yQlGYP8O0SSI1jCAT6lSnwyZgtMUU8x2gKgys/GztqUgKS9fXTy+48/32/rr1/cX6trRaLvFuOqHjcNi3tz81qZnd0dDbErcbpRvvg1F6AA7iMYBN2oRP3NeyoUN4pje1mHmZ9QQS44wRltKRitCfBKqVVZ3KIO3kjpP33lD4cY/9Xvf/1ISaeqwVkn4RM1uZZ0gTNkISfwkdsqFkaVvGWegAIWk/j9LRZUiitSd8HExqSNEr68+dBqUUwuX3moJiScr+x4Rn9MrPk3lRHIH1VC01RTyMeQ4QhhHEBaa+9D2c36XL5TSDJweqCqhYIEPGptam3W67qLcXl2AmS0CCVGHccQanQiET1j8PONAzOBBI9eC0k6idUUWiQENIm0eqeS1JHGUo8o13A2/yxRJFrTerfNL8PCxduuP3R9UiaF4AHhREYPxj3FdC0X1nqIORpGWvMek5DoJIULDg2w9MgUAqgxMTJUSAyXQyqaKbBCWB0CKrdOQkfheESpV+YJtmdwtgg30zymLYPs1S6Yjdy5OsnNn4DwJObfgXfLnEPIXqtW5zbWprQcHEuLoEUgKAhXqQaA7MQoirRcKJsLrlSknRBmByJHceEGHeKhD7fCoVNiLA1Zv1GNorfehaRkTD74/JzmFxV/P1o4GaPj66NwHxkxWqKUmCcn7o3rW7NjXSn4VVBihKTzx5TYJoQYzyg42zGRd04bE/G8K2U43RF/W+CItMSBbrwbFrIfurpqcq2uc1vEF6ZGWhngHk5FJuWQjmki5a40m1I1GMQMUszC8NjamSC78hhgoUABIzeltFa8XgfWq1zq4ERBa8csizLc43CSXBzk/04+PkI0xoAYjb+XXcna5H6ahZxScoRxwD6YBTiMdAEzK0EMFXNXzp84bvEkZb/o8sEXkgjp3O7WaDyKth8p8dTBhV7Lqq6SoFHTvPTMtajEzFQ//t27n9579MLeVrfspnU1HbdL21dGJV4T8TYLUBvOhIRF2QCAJ7x1a2vTB0cnZ4vZWlMr0YbAxu/oyfFSXOuqHbeFbA4Rr0Xk4uHJSdd1XT9YNwiiwQ6DT9pU+RaPsa4qY3RN8pvPXTs43Xnvxs3D2awZTZ0L/TCbjMeVMc4OTTPWdf3mJ3d+/eZH2+P2+//wlX/0g+8999RB8m4YehJUVbU2ynvPtk5Eb0l+CCmEfnYam5HWFfdYSI007Xg0dxY3QZIUHt+7f/7yJR+8Gk1cqaXZi5S7VCPlcn7Wz5cphr6zJOVoOq2aFto7BVuUkErVo9b2i+HshBBBmCKSe3hFBLmNg+5IKzOZbMyXw6/e+OCvfvaLt9/7+GQ5bO3tv3T+oh36G1/eeHx2Nh6Px5NR13f3Hh/Nuu7cpH316185WJuKSCd99MvFF4+OTs9OyQdl5NrGdlO1Oxsbu5ubtdaVZN5T9EOuUYrIvUQPRGQnFAhXzLevzH8iRe6cAo3H46apfLAaNjC841EbrFdz04zJKSbqg3WNlHvb224YzKj93WfXZ9Yd7Kx776KgYejauoHUI1bGNKYyTUUqTSfjkdSqbkiQ77p8ICMR2jtPsLWi1YANDFp87kg4nDGwGYm5BVJGH1L0gascIXI3TyViOeQSNpeIzrpz61t7lw7+xWs//+3yNIynQ4peShsDVPrEdBvnAt+MrC+JHpNjBLdBaymKuaNk64BgjWh/cIEgASvBozL4yDAuoZgyK1isVX6fElqbLwzPGYJQa2EtxjZfFHP5eWG1PCu/CsZWSsPZVGCC5iugEnKsdI2vSWkTU7TAGMyHgaNIKQrvcImq3MeGGBKiiolnhyXAPvLIDSYRuCWJySROFgNx/tGgBxMNya2qMiINIZ/+gtJEqt3KrOerWZ9QuG87j/k8i00D/EEKJnt4c3Mxd2pdH2NLsRZak7QMW40lVDh472xuj4IySinpHRtDkJIfOR4iYAceV3x/zgEmlmAWhBnmdVTQzxwNlAp+Er9i+Y/c2ApGRhOEXEFLZTEwYIVMcQhjP5NylaqaXKJHn1LvPYp6LmfQQPFEnLP5ct2aSyUSEY61wBe4CCJAO6oQFDUQaSEWyVdSHT64J2OqlKkq02phzGjp0wI4tUCEmRq8oZF8CloIDzgoq6IwQBAME1a5mIqo6WSVL6EYSholfNz5FRHc+RMjUiPFFBQiUfG8SqbwCdheI5s7U6lB2DmsVO75+n6p8olqEm8ES71aqDWSFWQhaBKjRJtaT6XQ4D4FpebRP3JuHoMHUDARCxJVEvk1hpEqlxe8LmWpJ9Q6XkDEiAB4X8xpWECyjI4ndDAco1qHfJ0lx4z8FaDbPJHZalJAK6r8DuPbDLCjqJKuVZRuKRUHcRLSLfvcqJlKKrk+nQplwnKpgpu0jY8WYIfau45UpaX81rWrb316/e/e+/C5H/5RcrGR4tzW5gd3H2yNp5GSR36Q4v077zngNBMhqippjV1g9HvbGw8eHzbjcfAuF7/eg9SB1MtIxgQ39FqrqqnryqyPx7o2DSzDYOrGRbfs+mG+WDw6nJ3M5qezxfHZWWcHjlIzlZlOJ9+49tSNR0efP3zsSVRadiena+PxpG1ijP1g26aaTnaH3v+71/7+R3/z+je/9ux//qffffmFF42m6B08o9i44NFJwnPMEomkvHDLWe6hcoEsGMHXtO3i7JRUfkYrU52dnNjFnIwqpFzJ6HuJW8e7QCcPD/PL4p0d3Gg6qVrDVjSF0WKMEBsHtzw6Th5ug+hZeoO6KsHKb+q2pSF8euPWm+988NZ7H779waej8drBpSsXKB7PlkenZ/1ge+/WNqfe+Vv3Hy6GYVrXf3D54GBtErrFuw8eDNZ7H0Zttb25cfng8tMH5y6c21nfXKuqGmnEKTmy/TJXxiGfUp3tbX7elB0s+1OCczCyR+AQ8MQO/XKxjINvR/Vo1ADMx8Qb8tbzg8ccDObKghlPw2BrpdYno0Tp8Wz2xidfXJiOG1P/8s3317/z6qWNNc56wqJAp1j8XI2uJk1tcusvciNKrG/nizZwshNkDyAmksQLCZYRhNCYw+azBR4zi8NCxJCMMYh8xnXlwchQMooUtHrg/f/647/89P7d5WgyAJqfFIPPSi4bwjMQPAJ7K6zvMvKgkMXDaADQY2iUlxwOkFiCy6jU/OZS6Zf5j9lvKFM+gQKHYa/cqCu2ARUac5TYBycltYwAIanyeYX8vyPWD2qlUgAClBVhSNeTMRkAD4bgtZAjpSutbQh9cLm5ilGn1EhpRTqLxarD8ep4ulWZZChKMqikY2n6IUNTPA/AFBEjS5yrsRLUSOFDvoApxkaIbWO2TaOIHid/e1h0+VzXyPTk/QL4gFRif9mU1QU/hLAmZAMzNfOtEqvxBAUfgrdRkcccV3pOuCPGcfCPIgFUYNwxu5yoIBVW96wQCC8FjQp4cTixSvwv38SiTKsLFJpJWPki1UJ2GMvmi8rlPqyEhePj04JqLCPwQSPpBcpetgHxxhLTTCz2iSxRrTm7QwVOQNXky2vlODLAo1jrcV9KLURwZnAjrS+ur48WA/VdL2RUjCMv2fGKAYDSC60c6mI+jtmm7oODcEFDzqBzLYGkF2UMa+GJH3GxYlshaTL3grKMFPiBQf+QHzg8e7wBEU86zlxSgVJaOPcAHuXygnnLniX1sRXVWIh1o6cgo/tEQ/JzZxcpdiLFXB/wsIIb7NyhA/smAYerZKLBu5AE/NbIx4khIMFHQDsaOEISLQ9iRPPvp6ACQGAchlxSBE6Uw06eJFNE2MsLk2YCmi4xyFKWHK3ooUwUOH2iRtmeu2rvKHhV14rkdG0tKTP0/bhtj+dnWohJO85XeNP2buiGcOve452m/f/I+u9Y29Lzvg9/6yq779Pb7XOnN5YZkTPspCTTsn8/SwZtSbAkpNiODUeKEgiIAQfIf04AB0aQWH8kMiwnEATbEhxaoiRaFKkR63Ry6p25/Z57et91rfW24P0+a18p8ggYUHPPPefsVd6nfZ/P98bO7s37OxeXlxMhl+b6P7q3XTknWd1Rw0IlVdeCQMv1wccsQW+W5nsno8GdnZ31tbV2o+28K8wkAMRbmqoA74lXIdZcRdHIbZs14yPdUCKEXt5Y6HTiywCBmzG2MNVwMjo4PtrbO76zubNzdHJzc8ezWIFd7HX2R+OjorSMTY2dVuVCt5Mr7a2zMTWUG2urnNk3rt18/b0PH71w7jPPPfuxJx/eWF8JFnupvlJBzTwtQHhOqJNnA2eaKY+nSWqdZGlw3pSl1KrVblZlkaqGtTAW8zzM1oyVTJwxxbRgweVpI1FJ3mh45pWCyjJgAQBWO6PTqXeVDzbmq7VIMBY6SqeNJN89OHr1e6+/9IPXr9+6P65KLeTFi+fn5uaOjk5PYiognQ8W3nDHZ4PReJqlyYVeu59moqzube4J7vrt5pVzq5fPrV25sLG4tNDtdLI0jfcoPglJZcoSfqpcsPFweDoYTqbV8eD0ZDwpSzMpK4wbZKozIURlypimBF9My/FwuDHfv7q+orGsRau3RBYBI9JXznnuQbMWvkJnlQnrfDdRCQtBJz/64IPjSfnopcWe1ndOjl9+78PlFz6eQGCaJEmaKB4/m2fOZVnabrXyVovBuZlLBXwgyV3j70N6fPCKuRSa09vhTIgXXDPGrfW0i4RBL2IahhDgLcO5HU1Ng0ZIUGKL+c2dnaTRMCEExa1nxpH1AifpDnlve/gQ+5htmUB6H0wJCeoAaAYGcBgCo1knwRhQlpmyKlKdEKeFz+zMGJZ+LHqvANpw5x2PARFICnxP6wP3lrQw8a/jUFE6vv7OOToPrXfOWtL8o1XmMT+OB4EK8d8ZdFhWWmYt3ZAQ00FFEr+lNNtod09M9c7ZqUXD38JUyqNvj/YVLL9o7EZcRmCuMANUFKVEXTG6BpNtqX3lSUumGesq3RbxUDsL4e5kdAq8EkH0ZjUtcTiYhKTGCy+kNDZU1iohMgESk695VDh0JPPWGsPytMTmEi0aipkmmtHebzw+Q02tqm2xaq3WbEs4QLESj1pB5uuc1zj52hsAKinSyJIWEIEpJgySi5JxL4Uxlfde69oqiKTYWvJUxAJx6szUG2ouQP6uySfQs/qpIYM26OuVARpK1lYuMOKHUXkMSdhkIzNUqB654/H7uhDunpytCfW5CxduHh1+WJVOKIudCYVsxnGmtaq8ZYEpoX19JRw5AyIGcQfLbUcOpkphFZqW1WNi4cn+lBDJwPrj0arz4Jj0wUCbyFmxCMYgQ0MOTTlvkuQwpLSM5JPIWeFSjGwj+FyoVnxQZM6lMQbLRXrq/ci7AtJqmNMEUM/wgHD0kAPtwYJVxIWvfZs847GKQstGkJWmcRY9c2+dF/UqYt24qUfWnCVKEyRaSVEnMThB8Leqev7gApcJpTeY03mpRLBhBvaOlSJtNiutAthkjLFWmvYXl7gSrjLNLGs0m8aYVPBxMVVQzZwNx+998OHywvzRSL964/bKfF9Zsb6wmEgRy7I0hfqeWxvrD0iaJHndkDBBy4Tq8qq0l86t3z88+e1vfdcw1m408DmJc21BkI6XKb4rMpbwOtF5mqapbufZfLe3ODc3322uLMz12/ncQi9NEo1d22lVHR4Ntnf3bt27f+3m3fu7B0XhummSp8nptDgrqt2z4agolrrtdp5TWCyKsZZ6ZXGNa3F9a+etD3733Mryx5956plHH3r60Uv9TitWfdbFqCHhhI6tMXr2DHOJ1hCb8CxrmEkVfLBVGUsc63m9hQ60iBS0VOZDsDA1l4pXDlMJpU2w4P0z5yrk5tpMC/Q7HNl3VpWRHIaJXO4eDr7xgz/9o298a2v3YGl5tdHtdQRv5Nm0KG9t3o9vTKIm06ow1Wg6PR1NGGMLrUY/TTLBm5z32s25c+31pcXLF9ZWFhfmup0sUV7EpPDwrDyZFIen472Tk82d3b2j49Oz09F4OpqW46IqjSmstTOKDWcsS6SWibOGSLiTyi1I/vlnH3/86uVmoiejETXxmMUEXDCveIy4M2kFfNjjW4m6wC4u9ltpfjwpXrtxZyFN2kr5yfjKuY3Nra23b9z69DNPxodcoTNkvLWWManSpJGnopkHpcrxxEv4yjFJVmLO+7KsuFZSygp+5OGBC2xdWcQDh/k6d0fPCmrQ+jM66v9xJSGhlAbHL8+kR7y0cHmoXO2OanEsBcsUlgCNwVAHrzbVglJIB9cp1G2aMdhlBlrVw/YjnKwSKOzJpqLeSSXYGdj16N7GIyPV2pgK80hslEAajcWceLJABhI/OtUBtT+Qr6chipywOaOOEywbY6DVM11Y8KKdZE0ttbOe+QLBXCh5Fvz47GRkXUV7pBC+K6Wx6hwP0tIZfFtBCkxn49+Kb4KFhRAs4QkFlATR0qIhY/0br6FzLSF7iW4oXUl+b3B6aMsgFArOmCJ4ax32J4m2SdvnDnm9CW5qKp5ogZ0x5ixnipHDIwtl8CamXFnF4/PPSVgZwoNxr6indLWZEakIa3dfSGToFszgUcQwJGx0jHCBxgKYLpM6F2dgqI3QcF1khThpqzIQBZma9PjBiRAafrfjoixtkKmsARnAmKIBoGpnexi/xCBBil5fI7SFo8aL9A5ZnRKV85L+xDsCLmHU7abWC+EvaJmkMceWUhruXFU648o0cQy2WjPDBIR8OKyTdelsm5tQSgyxh0sJb4r6SaV+PLGASK8E9qFEExv2Z1LBjIOpWJUx8o7BWrP0zCklRcBmOL4Pqw1VYuSR8ZbynPM2Fw3OEw4DcSHHrjImvrUT6PQorAZyqJEi3h0h6UNBoCds/OVI5cgcJDpcSCwZB/r1KmdmNq6SNmGhs2AABjmdaFkLNWKdHwJIGjB5wWaIoyVjCtQEmlZkWEqdAaVj5hist56E3sj/ZVWMXVnxtp7rdpZXFpm3zBqdpgvzS6P9PcZcmmaj0cgxf+3WPc7CfKouLC+8vrm989CFtU5/dX6uk+qyqrI8A42h3uGhNWtqohPHnAHHDasCq4P+0oufXD1//huvvfnO/V1TQ6wfKPlnQnz827K//E/GWDfXi3O9C8vL51YXN1ZXL6yvLs33Vs6vXbi4/vxHnzw6Pr2zufP2tRvvXb+5d3SWJHqumccwPC629487rbzXbmU6EV5YW42n40TrxYXlUbNzMC6/+q3v/fs/+sZDF9Y++4mPf/ypx66cX1cxrXfGGQ+/L18nzfEIjmUTHj3jjKsqiSFfFQqdYcGJihxGfgExryimxeDsbH55sSzKeMgl2laenCGCc0xJ7wzG/J6cWZUQrVbHe/bBrbtf+5M/fel7r++cTlZWls5fuuqcK6qq12nvHx4Z67JmPpxOhuNJYex4OrHG9/J0oZH3Ut1vZKvz80v93vJ8f2l+fm6+76WYWP/mvZ3tw8N7e/vbB4d7B4f7h8dnlXe44OE/uRG1l+DMDrSoHONT4hb3OfvMo1e+9PxHLyzNj09Oy7KQWsNUCi23Byu/QHmgj2OpdeeAujbBr8Y0Tr55e3trPHl+dSkTonChn+fp+rnrmzvPPvLwUqsBMIxQWilgBYM1zU4n7XaZD2fDUyfi6zvrDXLq7jgWwDsX2HWwUPfHwOAt2acRvIgpSX7ycGCGVIRWHuBezMmtFhz1+GYCYCAd47HAZH48HnMlVQx3kIA5mo97D9t40ol6sooQNWQNdiCSLALJLmPmkC8F5izEb8BcycN0BdIRKeCARO4AHPaX8MfztW9pTX2IoQ8qN/JP9RQsag8SwEIcNf/IrwNfyZPAc6kEY4XF1Cm+oSKTehx8YY0T3DI2rkzprcNrTFhNIUFAwuDPwg0vkLo9HjSU/js4rXGSCMASOEjGWlJ2pE6liAWwc5lS80mWeF8IcX8y3qsqp7UnDhCLiVGokc0+VnswgaCXkQVuvJ9WJctSjDsVNzaoWtrmsPNZVaVXfYuRpKhFtb6OxOwBih/CKmzF0DZ5eEBFxPxCzU4mTNpBvpmZ+de3F8A7Ufsr1bPgWg1ooYwxMX+t94lm3W2fiISATkVpwD5kNTiS151ZstRBz7xmCdCaMb1Ota47nrCQQXrGnAmcV6jJCGLJYUxN3n87zP7BzeuZEGnW8N6lPjy9cT4o+Wf37hpMQvGZiUleo/vI15ZkZTG6QeePVTZJUZLWRmKUlbBzwAYJdQ6stdj/JgavJ79BqTTnwTkLh2PKg+IpCck9VA/15mksQuHJGcvurk6ajOdIBoyxQukqhEkIFfMG6g1GE3sf3xNLevlYwClD9t8QJc0sj7yQCVN8VtfiJkG1AdaEAXpLcJK7Y0Ij0a/2kBICNFc7eMRDgabCqOCJk6alYNCZ4+IxDAIklIAxqNdjkloEwrwUwfiymDYSNTfXabUb8VDEEdNspErsayFNaZxzWzt7W/t7l1aWqsl4vtFsKvHmh7c6zz6Tar3c6944POnOagcYZEAGR6pBKW08apmUPiaVhmklBZdmcPrU0tzDf/VLH+zs/+DdDz7Y3DozVkjhaWxFCGycpIK2eTitcMf/K0IopmZv6+CdrQPGYsbbTJJeI1tfbF/c2LiysX5lY6W/OPdTF774uRdfuHbj9rvvX7u/s9XnyTTPTipzPJyMx9NOp9VsNhOQ4aZVVRwdKZ0y5rNmni3M39w/fvM3/+1yv/nicx/93Cefe/jS+fmFvmC8NKU1lUIggKId6RYPMrBY/qLwPzjc080mtle80ppDWSpqQxy1tbOft9qtZksniYxPYTxzOYnRnHPWkl1SmmZS69PB5JVX3/r+q29++5XXzwrTm199eCkRIQzHk0lVBs9G03GeN7wPe0fHg2JaFJWzLtd8vZctN1srne7G2vL8XL/VagmtJ0X56u3N2997+e7O7u5gejSZliR1nP0DcR5POLgzvGaqCOecrxcL/j+ROcQr//ELG3/1kx8732sKz0ZHR2geSSz30E47lmM9s5hdojMCxzaSHTESubHFTnPq7Lu37iWMtTJtqlIrJQNbW5w/GQ1u37+/9uxTNPkSDtuyppKMzS0timabF9XZYOiTlObLSOC94EJpKJ9CzNphm4iNe4C4nXfYY6Bun6yguWNBABFPBi4EOnbB2kQrIE65AACAAElEQVQnDt3gCtqoeA45g31t1GeJYrVsBTI0a8jnJ9QZPGxzEc6JaicVHL6hCadlUCot4uV2OOIQq3G5qbyGqxD81rw38VxQCiebJzQWEdTjw2YdVH6aC6+FDLFWibdQAUmGF7KeOAPCRZ4fIqCe1i4kmLBa51IW5pt5Ak1YyVkVc31prfHMa0nOTOjS+yBRyxiDgMTIWZfqJWyyKGWcwcJSrC5oGUMGpploKtUKPIynwrssTbs6zZSaOLs9ONu3pqRJKHEnabWSA1UE4TBB8mO9gTm4CX5UVdiOd5kg2AFhLsgBI7iycoGVjCsyDOe1tTP2j2jLpLYeJjwIwfZFzZekAB0U3BRDjSLGuUT2AhTr47MDOVaNUMSulWQxx5GMGSj0rDGhJokQKDl+iETomL8oWQRjWajxCDRPlXDtQ/zGiD/+TjF+wViG1OX1NeCivl4QicRECmUkTl/MZyHSRdQUpeRjFnRVpFx24+lvEu9TwafecqJuxYfFUSMer1vtRh0I++VZzYbCBtEM2BzIRYT4ZHRlZ6JBjH65VEJYgHNpshIvPzbxsfTE6y14ovIyz1QQVP/jUOwI2Qwsg3WSZXwak05bOOs490IZ4/DJccwI6WExTa/RjPjqbUxxGfy8KIbSRAOOIoKk7CH+aNSOeHMJCY0BWiAXHZVgeS7UDne192hgrqapUkYtNWOO7H6IKxAfJmTZ1qBbiFeOke8dD1bwYmpHk0meiPbcnFQJbNagUeVCp5IJNZ5WKs3vbu11G1krz6uqslW50W7e2N5/5NJgTanl3ty7O/vOB4Aa0fmA8SwWsDnOvpiwY4kzCB2PZ8zh0DUpp2uZ+JmPP7115eL3btx68/ZmzHuU7OS5qarSODuzs/9P/yHMAp0FZ1V1VlV3Twffu77FGEs4W5zrnZ+fv7q+eGF5+fnnPvLE8MrW1t7O3t7JeHKaJ7uT6fFgNBiNu41mI8+FFAyswkaaVVU1Nmdz3c5cv3cyOPudP/net19/59mrl86vLX7i4x995qkntBZQUJUSRQOToqqmtixNVQXnggsnxyfnr14FkJGpJPGxuLXGGK0SqZPReDwajFqNJj2JBmmHwrpBCKHVaFtI7+5sbv3Z91/9zstvHZ0NkqzZ6i0sNBvD8XQ0HlfGno7GTPBmnutUnwyHJ8PRtKq8823Fl/vttbnucr+93J3Ls2xSFu/eu3dv/3TrdLB1clb+5atY+zyRCYgjZRTaLiQFlUKkUsn4i8eDOk3Sypr7BzHvaUv5xcceevb8ep+z8WDUbDSTNAEBMx5fbiayZTi1Y6gIAj6FTiRB1i738bJ303Sh09k7Ptk8Pm0niS2syNIsSXDmsJX5/vbufoUViniCgkTnqyqEMLe8yJPUng2OD09cngeOORR9KCWsdWSJT1DiQPsOzMMOK1bh2N0Q9ZzAkaM/ee9KLRS8kiCIAxAB6wxOBqFkwlBrQDjtkzSFvCvA6sfOvMjIJZSjeEPb0nNakpzR99BPQBVhJbfWazgQg3aFKVoMNI5IZPE58QLTVvDFIa2FuS10CbQ2GSyhBtGC4rQy7oPBAoHF1DEwF8NEK8+stVNj4utDH986Ba0G+amkgfdlXtjx2NqzYIcOrouiRldD+KlQpcEGKRYYWAZGZ8iAwqG4xtcyWcMV4seQ2IzkgXWl7Icwb8yVheVBMd0pJ5LLsfPbZXlgS1NbdASSE8Ml5cGKjzT4JkD9q1BvebFJZRziZSIhqaoHxsT6oM09ZmN5CSZ+PbHncGbFMY0JKQ91Mxl/WDMZZw1HcC8IH1Ljnh+0hgJRpWeIGYCwuQc7XQA6IoTFelRlLG0OC3rZRJCOpXQMC1lY7EtxXtui4oFiMXtz5GMqpCRCPBZRUVNLSXxEXF8B5jmTUjmA1jxWvQi0JhXhjmMeB3U1r4I3MQ4l752eCmvzJDHOjKw15KgMOYRFc+UBdIUmvIjFApQki56MJCdlUpwrrcAlgEAV2+UAQfjALMYqnnMFYA0tTgsoVQKRSPDwweSKwRGTCxm8ZrwhdUvKBHl1GVxMCWPV6+NHiAWmCBI7P1ypGplOdwrJ9p/3pRWWBAIRuwKJPbDdNDPulQTnAvSeg8vjJFaFCaHu4MJQ60TQz6vXgDEwcLHaFhLu65rWIWx8pnQ8s5T3DoY5+GLaxIiniWUsRsOBNQcHe0upnju/ljYatZAKE/wkyyeTqfFm6/Bg9/j4ytpiWYx0kk9OBp00yZW6fm9zfX5+bX5OxTrDKpk+wL2K+JEF4jiR7mpwEyoMvFE+6EQap8xZYe1EmerzTz06ODt9/3iYc/XXPv/5lLPBZDIYjSbT6WA8GU2LqamKaVGZGMwYqPOe2iF/KUKjB7N1dLp1dPr9D29yxhby9PLaypWVhYXlpfZ4vFCU8+PxcWOyfTY6HY5OptN2nudJIoJzhU91kgh5ejZkUiz2e/Pd7uHh8SvXbl7f3H7lR9cef/jycx956tknH11ZmrfWn54cDwfD04PDuVbDVVZyORiccSaajSyWvypDgOYGWXbljFAiS7LhcKBS1fKtObdQTIutre0rDz1UFtOyNG/dv7F9ePzhjTtvv/u+yjLrWbc/R9zHcVkMJ+PhpBxPiyRRrVbuHLt3cHI6GjFIE1Z7nYsL/YVum0k2LMz3btzePDo+HZdT9GAeXBzGwl8oZIOftS4SpZbn59tp2srzTrPZbDSzRGcp5qgyJgne+CxLX/vg/fsHB4Kx5y+dX8lSM56OWVhcWeCSGVclOhWMV8HygI4O2AnIvz01JLXUAmcK4PChmE4Xu+08TTa3t1kInTQpqjLtdDXFPW4Xuu27w7PCuE4jDSEkUil4I6ssbbXaQafVzv7h3kHZ7nrmQb1hgBrH/MxgG5sjwSGREKlQqVqlzIOcaANQf5J4wFJ6ePs5qULMkCon8aqxeLpWtuKz7TIe88saMenhoAQ5F3MoRkmUE4MfdhehuK2F2jEzIxJhvA4ylkuzGST1XHUMyNyRkEbwYBmdBeQax0SAaaCkTQrEFhLOwus6kFITVRmQ5kAfUCNXxBjHeSZVjX9CGyOLOYewDIZMjE3K0rlQBDZ22Pip+U20oamBfXmAEIyvugUGmwuutcQNIOttR/g9dPOE4vFHJjx0An+Mq7/9xS8+ef6R8enR//PGn33t3t17LIycATKbSegDgNKiNi6njU44TAOo4FH6xS+0TPLS0MITT5AQm/o60gKPsNYEjNzlzByRUBZ/8T2o+658Zu0b+J/bqCCnU8TaCKSrqatLWpCpPRsgLhNhJv+qF5rQQ8WeNK+soZIaQGY8oN5nUGAFxoqyogaU4OSpAn+9GAYEFvisQM2Lw45LoYJ3ljkZwySp0LEJ451Sgt51WH4woZWLRRjwT5x64IRuFmXwx66quGylKmNiXmcJr068qSQn7XwstWcr8A8sfgQZjMOPSCoVPBFeHCpV2lcm2BYjc6S6zx8ohuFy0ZNKzKwaSW5JnBXLMi6R+sfAqgNLQ8gkT2I+zQtfuZg6BCtlEW85Pj/0F0C7EO2EvO0ddIwx+5Ra0l5UzFi0siAzkNemZ0EJZWMsESYYvC2wKGLCuArmK1bIOqwLIGW0VM65yhtB/Y6YCMcDLhHaEtqKcUNMeM+SNJUS6WJgUitu0RgABo9+UcW5UPJUylv37z/uQ3dtPV5kG+J5q7XB+28rp9LszvZWlmWNNPVVxbm0nqWKXVrs3by/fXjlcr+ZN/O8LKpmksWn2lqkoDh5FanMiPMYzyGpJJErudbOM6V1ljeMqarT4eT+2RPn128dXyvLang2XFxblZzPtRoySaTQCim2tVjCN05IcXd/5w//7Lv1MzFLSdkMVsdnosQQwsG0PLx5942bd7uJmms1lnu9VpKuziVz7ebu6fDeyeBoOAqcNzLdTDLnWSKF0Looi83t3X6nu7a2OhmPp2Wx2Om/ff326++8+/CVK5c31hc7jccee+SrX/3ac088nhg3Phu0enMf3L77zBOPFNOiGWMX954ZW1lTWbjp2rJKE3V8eLq0vDw+G5nptNvp/N//7vfab37wC3/rp1/6zrd+499+9fzK4tLauk/SgqvT0TDPMiH5qCgLWw2HIy5ku9t2zu0dnw0mpWehq+Vqq7XcbeeNxtja23fvH56NhsZ6ohLA3BCyFTLPnHmfcq45j2lH/OaFceHc6sov/czfVLAZUQJhriohI7W2LGJCbC0T8v7WFmPsSqe93GpMxpP5vJHneaq19V4LiP4Zoq9OGLkdcOlj/miVlODCWU3qX+LiBbvUahTTwlXlhVaWqFgIWljxJEnKPFOKV8ZMq6nIE+ZDkmRaKDspudLJ6grP8t33PxhNJ3ZpSYABZ4oKqaag6R1iX+3M6oIDCgEeHDGPhxgCQa4elyhJzFheG9JAvYIxMUF7GEoLjuMHBs0uhCow6hTWYpTZumAsWpwztBMg2UwT6mN4JjQQujfxhsTgF0MdvIcF0zijLF5n8rVSsaCvJKIIySexlwilLWfOWKU5914JnmDgyoW3zikutJLWWo1+qMVBHFxQMZ0KBq9SorRwNkVqbp2Lr6sUhbdC6iKUZZiRsEhq4wkhMusZxhQnHps4saF0c54iJmeSjCiYR/mLnb1UiJ7UCyF8bGXtuceeZsfjjAWtk4NiWrYaQWjs5AoiIFvyGKHpu6TBlgh/wV0qzAyHprZyUJlowlyQSIFqV8kcZq8gXWGRiRaRakF0XWvWXVUqZ0nFh8KshkbDgAHJChIqHC+kaUcspzE/sZrpp3MHAbsg+iFhY70BQZR5hUIcnjshiflaTHwKKPTqFWVwgxmcJnktEpMc7VvLqA/s6WNgEwf2CZZkY6FCm9c7PEnMY/CDNkIQJAVCui0shzw7OOdNWbmu1PNpOsfT1MtjU0x9fM89C4kWRPqucZu+tlgTikREDHuTqI2l5PHECMYY9CUF7ZwGV48kiWSN+p3VnI4QtESqVfclBP13Di1WEkRLKuVdBr5LhemG8a7ESKkA1ZnVLW4WQ2aspslrARcQHsM2EKxZ+Xp3jMVfL6a3itokxPNGRgRJOMT6GAgJ2i4EcQkUCIKnQGFMXQHrnIYkEO8EGZyBwweQf5KmZCjJQCaBWkjQxhJkETUzKDA+yJvXbt3+8uFRd3ltfHZKVjBMwnY1/uwwGU63tveWur2YiDR7R5OJcS6X+VojvbnLbm7e+9iTjy80mzuDAWklAiY9eGU9Z4r+i5BcK2lodkVQT0RJnaZZ3phOp2mWHR6dLq6uLLcad0aTe1tbj12+OB4PY5FRlEI6wVKtZTtPlVaSqzTLt/f3Ym4RQqeRSSEnReW8T7N0UpQWo/cHhTEATPHlOans6fHg7vEg46zbyPuNRqvVeqzVPjg52xsOB9NqNK3yJGlnSa4TrZVUajCZTKfTuX6/2+ltbm+fX1/d3TPfffO9t9794EsvfvzmvW0WxPJcf3/7fn9+4fW33z86HfR6vaqs2kLawthQlWUVT8nKMBcU54srCz96/b2drd282bh5486jTzz89BOP/Q//y//xZ6+++fgjjzz8yKNlUb1z/dbh2an1XClduYlnYVRMy6pKs5wJfnx2NilKzthiopa7/U674ZnfGYz2NreHYDzBkFzWuKkYE2y9MyFFPD9xqKeJ6jUbeZpwJraMMc5KJttpUzBmmYWSCM0o8ktJk9IUWurdk8OTs0GLsU88fNkOx0LJopo0mmueQRIIi2VC3+PsAcEE3yaeM45KKYfeKURYmEstdprj0Uh6dmlh4eh0oALP01za+LC7WLvG211NKtFlGoPQ+AfMKK3ThTl/dvbmy6+OtS6l9MYrpZOElTAqgJEGXIoBUUb/LsAlTMZkCLxf54GbjfVrba1GjWBO0IwYWqgeYOAQYGEUGwfECUR5jS1AmJ07W6FtH49xie4xykTuYuh2JM3lGMw4itPkjKREsE4pGSz5vtb7v5gPIupjeUJRsGCSJgYQNNWbTLFodC7B1gkzDDBRp0hgFnwiY+A3mHMnEiptErJKsoD1KXQyDjQVyVgjTUPgE2sn3ptAAHmQFwXqBuKhoqFAnta1ThuMRRNP7nqlFgNIJoH0BIKKaefWWs0FlfzwcL/8+leXG539s+Pfu/3hJE2NowUeYejM9sHCqArQULAOa4dNkvegSsT6AOOiNLBACUxLmknWE8pAyFFvHVFQxMz/glH8gkYq0HDBo3qtJ7ocyA2AftFmrO0Ia8IkI39tWvma2RHWRAnCJAFHGN81jr0g2lqJRz+nax9qXWzMc2HHw3lhzCy/YEpgKZcrhivuyU9ICSjZ6garkLGOoZ5OfBatowXzACt+eF4IevpnXqsBeL/4K0H9K2qwj1KTmJcaLniX6a6QUiaHzk6YQy7CJMyoaWriGTKkWhDN46NJiBIymOMAMEpFThUQehD7lCwqPNyGBTWsnY9ZJwhwhASnfn8QAQbJQTSlTGNmKpkPFkIKy1jFuWHBQi5HuHHU2RruWkHWEmRBDvAxb4h5q5V4LpBgQmQUC1uiMnPGndSaLEAEqlsmhPOY1sdLoWj+7qiEh6wMhi3MWqdpJoSOh/X1IAAbczzRiSDfCPhH4945rpVwHJN1gn0iKxWsaHUOjnZ2r72/+oWfcKbkIPVYH0xVKaW0VDuHh2VVzTXzVMY629oy0UoEnjB+fnnx5t2tpx97/Nxcb/v4GI2J+hkXXGDuHoSMla9U8f9XQVemoj0FKVWsixhkckIqwazghwdHT26s7F67dWd7e1oW7WYzeK+yVOErpNaQkwvBZZplmCuwhIte3gjWpnk6LitbVRhaQeQPrwtag3ZuZuiJed6YsbPx9N54mh/LpVajl2WPd5pnk+nBYHxWVYdVlSrRioVdvAIuhN2Dg2Yjk1zc3do+f+782fVbqt25s3e49eGHX/nyT2zdvbW2tvH2rbvfefmVv/YTX5pMiuW5uWpajAZDJuN9NK5+IqqqarbbUqqt+zvzK4sv//CN/uL85z/5kb/9///C//bVb7539/5ivw/pouY6N9NxWVilVGljgBRSno6G3tim5Oe7rYV2q5Xn08rdOTjaHY/palCLA93C2vg4ETxJkxjMAvZGpJxvt1ll0kTNdVpVVY5Gw0zKAbPNRnbu/DkefNbKnHdFWVZVNRwMJoOhqSrhRKvZ3Lr27ti559ZW+s38zs5u0u1keU5umFhb9EpL5xjpnJWQXCkLsjS2GTgQH6JWmcQn2ydMzreaxycnzrleo6E8M7FE5pjUOs7TeCjD7gHVsoGdoYlvX96Wjdb+Gz/84fWbZX/ewyGG4eklN0BWZ+dYiEBpSz7LDAx5KRSYskTjqmeBsMUNUkvOUELSomPtTebi35HaE0M4pg5OCOxQkNEKohSGK9wHB4sF/BuIUVHTN229W1EzrLC64pignp9SGN3ZuoWKFCDWDgrOxORVU9vP8JpZDaEbHmylkTZIJaGMZjIQdBlgEO8k4/F2oFKCitaB5SNkEA0lE4xXyW/NGct0WvrSBEcEfwWChXEOPaxACKCA2BZ/DPWiEZLg2h5gcSPR7RMkEOPMZ4GvpulikpQhvDUZfe+9N9tSTj0bZbry8WTjStE1BKLZ16pS0JDJjgIftY6EsrZ0iH9YGWOCTwLXKHtmhEga68qY87v6AJ/BwOrFMxGYY3/eL4N+vNZjPWhFUwVKZlJMBOFnBv7szzeFA585FUN+XsNFid+EmWuA3B/qc1JJ1ytFPCFt3GxCHGj+hy0bYKZjRBL49s7Ymv1BgmzPamssQmPLWLCCWk5MFjFzH485IK1RcgA4CdMZk8qaih3/WhXECQASK2mykuaJrbaqcgIOpa95rjGyspjZWcaZgq8zMiyoC7ilc1aCtEzuK0hhaK1ekFkHevfkaASOLh4gDM+xugtshA4h5bKtpBZMM+F8ZV0MukHKMgQTOPZsWG3Fyun1rt3uqX1EOw9EJsMQl5H9CJ5lDkOFypMAD50PKJM19TMEbHYm09JY22t3qJMmGFxgY3aMF5UIB4EUaTgfeO3jgP5xoA9KN8Izx2kluYZ8U3UkfLAK+iHrfaHV0PO3Xntj4ws/nrfb1kDGyblW8YKrJB1MpoyLfqdtTVWVVguZpanEg3p+vndvd3/3dHB5den127exwy3Qw8eyBPIdRwaWVHfFo0dbY1OFGReXjLNGlo/StCiL/sL8O9eufeyZZ28enb5/cHxne/u5Rx+dTKe9hbn5hcVGs6HTNEnS+FwoPTfX3y8mX/v2d6RO5nodVpWTadnK89PxZISHWUnRzvLgq0SqLM1LYwpjy8oWgRYcLPVhp87dPRtung2Xm431VnNhdWlcFCdFOSjK0XA8kbyRZY0841Kejcd5kgfO3r912zl3/cad6uTkF/7al/uZnOt13799/3e++keff+F5MSPKjcZDjrmoVxgHel5WlXdVrx0j5527W3m7qXX2v//6//k3/vpf+cpPfL7T7v/W7//Hzb2DJNVJAtN11GGG+dG0qJzTjPWzdK3XWey20kQfj6fXtvd3xmM3aykjz3QkFZEhpFI2s6yVNUpnj4dDC5mJC8FW1XK3XZWGB7m+dkEkamTs0auvn19b/sjzTw4HI4kGjAcNZjqZmrLa2tw83T9stfLbt261GPvS8x+5e/N2ksbabWF+oZFlzFvrbTz/YmZs8UTCIQSPgfOlh5QHk0EvnJcyhJiLmkzx5V7/7b2j4WjwyNpagtjGgk2yBNjNePxYxBURX3yRcGrChqTdZVLf/Pb3dyo7bXcM9d4wJqNzrLZehUQJK5G1QnbmCRgjCBq4rAbqQ+eh6LNjZYLiSswqhNBSAqZBBR/Wz8CY8rRtxz32BjkMv+slIGpFzubNgoDVgsekHC4vXMb83vOYKqBRzWakSe6I1oCiUNL4l440CY0sxFqMaxjQcC9CUGi1C19zmqCEDRyoA6IBSC51QAC11rFZvWR8ojjqA2Wss54pjLGLygSEqlQnmVRDU5DKlVIUC3Gcc4bLOvgjIAlngRqo3Qp8LFODF56QSr7h+UarLSW/dXx6GphoNMbWiVSYwGxwTMVD3uKEAglMYvsSk1LuNXkTkGqVZG0icHLdFaLCoDrjQcMrELQxR0mKjzkPRo0CbrBUk4TZRBNtBGyK1hYOtccTscmEAp4O0AVW3xKoi1HSUkWOM5+x2aYleS4TWLpe22XEtUIly2WNz0JwlpxhCTjeqco4wTlxRgTGr4RQkDFWzfyD0UzCBILFXIqaBmg2MUmI2JhAciY0FxATxZPYYvgvPE2VKWsQVUBvCfkROCms8Hbf2dzyc70+Hw6GzHjup95ik4qMbDGUV/FCwqCPLMkdLhrEsIJaBqJGJWORDxvwnEwQoEFKXKhge0LbEorH242L4YNmIVeqKbhyXgRZcazZQzNZYJhjkY+glyWxEi8tM1iGCwIiLhC/pQnB2Jh14VVUlAokKqmMsdaQrwNG78F6J2Ss7WJOQObfweVZnsCdG8HbBrwzh0cHvV5f60wGH3N3FyM3Of/JmPd6QtEIxrBehaOD4NMuFl5Jojg0DMwzC82X84A8CcGkGrVa792++8kbN7uXLtnRMM3yqrRTWyEbd5PJRKep1mlVVUrqRi7MZKy4TBPNpFRwYz231E8TVRUlRNSWZIQxERG1cb1xJvEpY7zdaZ8cnzrupcfULH4Lniba29BrNIJjJ2ejZy5e/ODg+N0Pb3ziyScYY828cfHi5aSVx0iYZASn6c8tvvCpQv2LXzfWlOU0FJXCD2rAUVIoKYMfT8fNJPHWjaszodRipyOlOhmNjoejrJk7H0bTgnrUnrGd8WR/PFlq5pfn5ubyvKyqwprTqjydlMOyFEC/Dcdl4HxqzEqz8eLjj/zYY1eW2o1Ey5fffOe1dz544WPPLrebuVadbssaI4XGpCB4EyozFYGXVYmpdu/KlQtb27sn+8dLy3OT6eTrX//TCxtrH//Ik4t/66f+4DtvvH1v+2Q4KtGrcC5m7glji3m23Gosthr9VvNoMr12f29rMEpQXqMqInN18dxTT71/8+bZaKSF6DSyRppIwYrKWQseulIlVOx5qv+7f/yPf/Kn/1a/3dV5xrT8/d/57d0bH3IXnCNaO/cuGAcKiXfldNpptzd3tm7fvf/clY2FZv7m0dHyQr+dJPP9PjH+0OmInzdW/NYLLaTQhfHGgH8VY1RMeWMVm+YxHkjpne212+1mPrcw/8Gdew+fO59qJpOgEii/wEgiD8RUKeZsmnHhmC9tyNJmr2329l5/883Q740Es7DMYcxLrqG0NLTmULMF8ZYYYMUEEE548Tn5Q0BJpODihfKW05TO0gFFRjEsRmDBPXe00qOCZZYUM4QfFNjFJYHqrBMRsAThgg/GVIH45p4rSfv5AsveXoHjOLOICHCb0LEwtpaTyYKBOx6azTjNiBrtOap9RQ1lT6eHhZdDPGQTRQdfPKNjiUuAJB6kosGxCMHnWiSMyyAqFNapFC2p5nTmXXybTopp4NZ4ag8zGmxjPhaDc6zL0ZRgTNJSKswlsVjFiBuosJHrJOcZ4wsxbZd7RbFTToyUwgqGBSpLKmumoNfxxpcg57IaK0mNYYhqGSbTFoo5DOxgrMSliaekQxjAfg+rJdjUsLbMuGAYl2iKBmkJCxTqXjVSGUcxl2Ie8rgQZo7SeAAUeRiGWvf8QC9X2xvWIEom4UZfQzhxx/DjmHQuJgIqIRepeuWJ194H3ARfgeAv6jXuGNXIqBydBUGK4toX2AcvwV6PNxa0KgfpHXnvB1jj1fJKRhxYx2jc6CVXHjFG1naHwlsQj4hap/j9qpBnR/NSt3WKTK6okNgRMYOWnh05b7ogtSLoORNwGkRzkgVmnaP5JfIZbgEeogzCM8fI0UIKApkILpWS3hrlfcpEW8pEoGkTZlauIhgWSozVHwzzyaMd3fmY1CguEimZxFSEzCJlUELFzAtgFI482cAgAUabjro9AQvTBihsoYSxljIjLpi18H7Hyo6Qut/tY+0v/s7xccf8SuIhtdahY81rdUEs/hIG+yNGyT2nCTHcDINlnmVa+3q5QAXPBml7e3h466VvfezhR7ksAuMq02JSxSo11FzuAMizdU4x0c6aIQTN9e60LItipdvMEj3XbJ2UhsYWjniY8bFRDk8A7jBzzmmlCltNyulCr6/xDjpv82YjzTNh7IXzG+/fuvXiR5682Gnd2dnd3NvdWFgaD8aT8VhlaVVMg3UxC1Hy8HBvZWnx8vnz12/dKcuqpWJ0sdY2+y0v2P7ZMJ6I6HLOLcxffeSRvd293c37PvhUZ4KFFz760Y88/thX/+OfvHv7dr3UxPl6vzMcjd/Y3Fpp5ed73X6a9Vp51TaWsViCenY6nqSp3ri0/vzjj15cnLfT6d7e4eb2/s0bt5569Opyr2NN2V/YmIxHbjhE5echHFWwQ9ZlOVWSD3xoNpL11aXt7b2dzftPXLlimXv9zbfeffeDubm55y6dv7qydHtr+/7p6WlRDMZlM8tWej3tXQpV/Jv3d++dnAnGHl5bEjr9YHOLgFkr/f6XP/fFhy5f3Nk/OBuNpBKJFE0d87+s02Y+7I/GpXOSs7V+b63fKwfHO3c+DOvnVJbdvXn9rddf+fTzz1e2SpR2XlSuireyct65s5OTspj2FxZ+8PIrKWNf/OQn3nn/WqplKuTS4mKaa+MrCY2hqSqp9ObOwdlo8PSTjzsTixNaN0IXyhFkx9dLgyI4u9zpKhEurc1/X4r7p4PHF7rMuSTVtjIKi0+T0up4jniJ3SjOrSkm2cqCyPP3v/n16wdH5vzF0tn6UMaAhlz9aXGI+F2CpkKonwRjWmnunbEWRQOzlOgrBUyb0QnJJL2QsHJBLaNmPvLI1eMpg5AjAMolJRe52iMTglwqJu2h3pdjgTRZbuZKW6d9JBSFDzyZFYaYwWDcKmfr7z7WyooEJp5o0oGRdZzSsQyOFTna4EpKiyI7jdkfPBOYNL6u8VCRW600cal1rLSEd8YxJWoBqW3rZCXLplbsTEdXs3ZrZemlm9eClrULNVYpYJgOC/cQkwysc2C4owQqoniZE83JZyXWINZmUnez/KQqb41HZQwW1ANXEJLFqt/FKxqjL6FEiOkEWW2sRD0NkxkzMd6jwq2Rv4x2WYwPKnDNmRJ1EzjEb4wWO6ACTkqLdj4HYA5jdewfcRJhyRnUgkJqTaIACTT+sWIz064ZNasmXtLwmNPuc03SYoLNdpE1dwKaf2hSaqHoTDMqBJa4WTDBGWeZxKIXBuASF4jVHgaCICa1kwXz8Umy9KuTJXFAhssUUssyeA0IIYFzMGvEpWQQ6hOsBckO9cSQvFDHRdiE35oMxkmjo7NW/ETqJL4HRFRDox14Y5UIS3IkUQvhKHmJtRdtscdCUxP5G34NaN4yH4SXSsar7z3h2An+KgOro298tTjg3wiZzFk0K0GFEI7jSYsVnqTuBw9BBp4mirbsLXwWa88qVOOBFudiSejo1llvkbb4UGNHYlLp0JRmaAvASphb50+PDrMsazTagnOZ5ZysDNHYwHBHe2eIaRaTZSZ1qkn2+oC/A/UTg+rEI4ZiSw9290qKGLfx25ZpNqqab7762kOfv969cKlQR9wwrZUEYS5NM+gZhQe0TnLeSBIYu8rdg2HWzJc6De75XKN5NDqAzbfktQaZ042DCxbcQNCdbjebr7z9zuryshuPyCq8kWXtVmt/f//c6srtrd3Tk9NPPfXYv/nuq6//6J2H//qXzwbj09OTdr/rTMw5vDTBGu/Dxrnzn33hhQ9v3ZmW9tzqvAhGq+a0LM8t9Pvt5slglOepMObnfuZn/sn/+utmdPbt7/3gt/71v/oPX/2q8yGXShrz5U99Ymm+/9JrbxAn0lT2hSceu7+1tXN8+u727mq/s9puNmMt7futFlPi/NKc936p2zm4c3ewvZUm2eb9rSRPH3vkaifVZjI5f3FDSDkcDhmHmw2KG8Z8luWFL40plWDFcKyEuHx+vSzLw+PTH/3wnVY7v3rpocOTs/2D/VDdl1LMJbK5vLg/mp5lk0zrABz6ROh3N7en1q63Gw+fWxeJ/t47H9Aa0eOXLv2Vz342ZboYTs6trNzd2Q4+ZFo10kQL4X1YvLC+Mh5PimkzTS+tLCXe/u6/+pf/5jd/49y5C8dT+7Xvv/aZZ5/4yt/4aVtVtbEpuqnBee784Pi02+zc37r/+lvvvPDk1eV281t371/aWE6FXFlZErHM0THTsT7J8mFh3vrwxude/LjCMap4rK5q2wUy5A3eWkv/SVi31G9JJlc77Y21lTs7u0+vLYQqAOMg8fSqaWlznXSSNOFKxoy7cipvLC67wfTNr3/zKG1MdGqqUmhibGHPWPDSWgfmglKqNKYylVSSnPhA83Yc/TLHLI3JEPs8GleexS9WQEybUNvuCRo4uliExXjpcOo5C1xorMmglmKxKsDaCNb6QQKgVWtwgX0N1w+SuJYSxtHEgkCTOsYTsK5NQmZxKJeUkjVuv4bWBh1/cyfAtFSeSVi3QZjNfIxqPhPKGxOPIfy28BQPJlRAmFUoBQPUbbEcJ1K0sUYF0eB8fa53//AoFO6R5aUpkxWYBnSkkOMZ+RzYCuO8eKQKzWP4JE4jxMQQ29LCZ+ApF/M6c4zdHQ8PLBy4KT1ylkKZ58wyNzUGzGFO81jcqZj7U4OHKFPADmE4yyWgU/GvV95W1sYEHIJVRqpbspVFU9sZy2QK9aGgSoCeQ3zhA9F0LVhFiPWB9DxBYJzqYQ1YW70R+S74ByxLenhiRQVhEJaf6Ddgkpl4n6CXAloCm8ikpOKKK7j6cRRkNEeEgFEqKH4C3PJqSQ0kDAA+KIWWLfUhargoXAw4+YC6EErnKsYqqHNt/JjQstMWUXwoyUcY29EhVn6UntF80utku6p2p2Mp2Pl2Z0Wn0pPUt94JVkyy4JMkUUqxmR+IVApxnbyrWXz5K2sNvEwkGWjFoEdPEiRg8ddGKygI53IuOko3pMb4JVTOmhiXY13tY30dg4cFshtVr0RhLBSXqUgSqWJRH6MLyNGcjEE4qt+Y3yZSWqzOJVoTK70WETivlMS2BpFDBNlekk+JsWY8HB4dHkwGA7oxpAiI0VdjplRvgQulVJqntN5Tb4BhPGCtYbR5Ugdp1PWO2MaIhGiyeBYMZyc6vVPad//wayy4tNvTWUaVhIJFkq/ffyGhTncQf5Xe39s/WF1a7OmMGdfPE0676NC+efTJJI/HIm1bGGsFk8PB4NzG+vGk/HBzK2k242kCEVyzmeskkd5cXlu6ubm93u88Pte9dvPWwdFRo5GeHh25qgoOZUs1Dd5xH85OTv/Oz/1st906nkzPptNGmja0mmu2GpxdmO89c+Hclbm5Zy6fv/bqK//9L/7sD/7kj1/8sef/5W/99t/9e3/3qatXH3/40cPDw9Hp2UeuPvT5j38UgFa2Mxrv7e4/dW7tY5fOLff720eDe4cnBROVC6ZyrrK+sqOz0dbe4aj0+6fD3cPjbrffbzRZNWHOLS0t5HlWTAtjvKkMFrKcKaamLKfjcTmZVOPpdDgxpSlGE1NMVpfn19eW+3M978Lo5MSNB/OdJuNs6tzU+IPD42o0bqU6uEooXkrx1r0tKdiTq4tPrS/3O+3X3r8xhUv3Rx99+G/8+I8nQRTlNEmTX/r5n+u1W6WNBVw3T1tKrPe7bc3XWtkz5889tr7Eq6KZZqvz/avrqy2tbl6/2VD6l3/5VxuNpg91AUBOlyKwk8PD8XDQSNNv/PE3E+f++pe+8MrLr/TaTR5Yf67b73ekVlprjvjGk/Q7P3xLZtnayqItp8EHU1beggmIJhatmFdlhcUIyZVsJ4mWPFPp5Y214XhyMp4qrVnwqYpvltZyNJn2O61+s6W4yoRipdNzc7Lfv/797792+7ZdnB9Bz1+WBipaDhiOkkITDJBW5XEECKV0qlMoRaDIEDxJkuBoLYI7Cx9crUTNfwC4rM6VqRsPYFZtdkYOn8FaS21SKEA5NZzrWWIN60c1HchVgTrcbLYmS30iRugMYjuT8NOgEEbJwciWHc6+sRiRLJ6ADSU7SmWBZZhVNrTOpeLeQwFtKxB7jHOTqnKxirCekTqNJyjVleCKPMtwFkE17lpJ2pB6dHLKq6onk2a7c+tor3pgHo/enDdOekULUcEHrCTQtSWoP1GfGSx5YkTS3s9LtZDnZeB7ZWlQPsKh1XseDDhROFpxnkoFQBSwh5CIUSnDySY5UL1K7egAiyf6br7yDnuzdalai4CoRkaJzhl3nBr/hCFCfRxqNeyD0vZBQCFjekabSDRxnmFyH0i8yOM7sNk+MZ9FbQw/semL5dT4tFg6Bkn6E7BFyklYK7kwnhkkA+SiRT+FGIdESxXExKrlxMTEoJTRWRMjBoObo2dEPuYcrW8vpRfcIc7ScgJFUJRHEqIlScUr4WPi7xl/h5hSDRk7sSaTyUre7AiVxHShhiiCwh08vEhxi2M0xdqJpaQHK1kS74jDzJaUUobHulXSslBMbYiZFXzGQ1MEDbcZ413pqoqHiocyfkcS0QqmYi4paaUNDx+5Wiqy2YyPgrUMa/8MCSdmQTQfMpXxzs5sMqXk8ciCvWHMemBNKJyNPz2WjNZSyyTBPzGOButY3ZugxxuxDdtYSiO2udldIw0dUn+yzgigiYEwB8ekmFGR+gkqJeUA9fEhDJQ8afWvvfbK1muvJL0uU1JLmXIhrF/q9Zh3w2IKiHV8OK0NMknGxpTWPXTuHPwi7Hy7reM1EmAIYlzGw8xChCjlkks+mU61Eg9ffeir3/iOz5pKwLOEhzxPW+2ce3txbanfae1ubv7Nv/qlXMpvvvTtPE3Ojo+O9w+qgmhTwVUxizo7Pb5y7tyv/covT4zdPDg6HI57nc5Sr7s611tsNrqJbGueSaldufvhe7/xz/7pV7702f/f5z798ne//c//+f/887/088/92CcajfZwOH766pXPfvRpwZgW/Pr+fhHCfKavzneevXLeMrZ7esqUrrBRZiuX6KRybjAZp4lOEhFM2Wo0FucW5ud7WaqqsojFXenil1vPgGByKJViKMJNqMpqUhbOuUaaLs/1n37kyiOXL/W7nVhsxzsijk6H47JgkvV6rZSLbqOVZvnO3sGlpfmPrC6v5dnC/MIPb9w5xu7+k5cv//gLn3LTwlqzcX7j01/49E9/5ad/7Vd/1YWwfXwqpOx1W414KXQr0SkPirE8Zp5svt/Xaf7ah7ffOTz5r//h33/hU58cTyexGEy01AqPppxOJvu7e8v9+XffefulH73zsz/5GTsd37p3f7HXbWi1vrGiU6WQ+zLOkjzfPRm98db7jz96VTBJgFxKKD2ZqoRYJXsWBA5ra0wzS+bajeCsMdWV9TUtxf2TUyGVFnVNyjg7PDlaW1xWNAcxMa9ura2z0+Gffu0P9hvNMk2tt0JJBiM/JPuSdj4lSE8+QHgMNBdgSkjhY2KsHAFvvTcxYlUMkRp2YrCcR7eO4d1CjYv01cIYyNOKJ6v3fvG6yZpwiBiBGGy9I78yIXltSoZ1Do+tJup+EX8DkZAAzvF/50nK0WpSQhDLIMZLGZ9PxXgSWMJ8zlnOWMq5FkwxryhmCFFZOyymhTeexePPAz7vg0ikynSaKpXAi0pzKmpjoWqdN8bH722rXAs7np5r99eWFr5//871wWkjywU5ouJ3xe/osYwkgLcigDFpvz3EpbGAIwa6Dmw+STbynHmzMxpUZCkYiO5HTCfhGHO89nBHXK5He4L0KjZQG5vTfJfT7FbMAjOZAKIzAeAneQ2TZYKf1eQ0bjOkdKf11Jr4VK+1EjarXmAiN4YwW7ESBBQMNL59gA/mda+69sjBxmcthsQqTDzyCLUKEFQMALWRsJhZGEpUijEAAzrFQ9BcxQ9ApovoXVKJjg8iyEWpnk3j3kG5z+oRBtqzUqp4OYhHzrkFxZuqbzL692ymZfMwrwTQEoGKEU8Ubepghd+vyutnZ8fTosV0l2uJUww8NY+DXkKZRTwoBYaFxJ9akvtKKRINmh3dQCZjnAPXBc8JgKjWN4VoaZnFYjr+V8ehn4vxmzm8fTg/PFkLAKkIWXLMSBT4Ps5zh8aCjCErps+SxxvsCCmLOj/Ex14RTYjDt8TDaZSQKYxUEWiUx0COzrGXSs4vLi8uLHe6XVanykzIRMAmDHw1jw2f+G01jydmvKJSUE+JsRp1aqwtirHFEhraJxDCCY5syZOyMYTgdHIo0wORv/EHfxhGQ9mbE1rnKtGcbyws9DvtcWHgfEKUEu542DkdNpS+vLHivFWC99rNRIlgXKa0mjmtgVYNEQC6I+ijyNPj0xeffXx/Wn795dezVsvHfElmSbIwN5+miWb8oXMrRyen2lf/9Ff+i2o0eP/ae+1GevfWdVOWsa6vjHWVtUYKcXi094s/95W//0t/Z39SbB7HgrWytttuL87155vNC6ur891ulqciy2/tHv3Ra29//aXv/uxX/vb5jXNFMX3mYx/9yZ/6qauXr9qievqhK5949CEVwtSH29t75zY2kuDb0j+6saoCPzg7C0CYGVdJwTRnk3LsWOg1W+vLiyvz/Xa7kSeZNfHktTaGX+55EYOxUVhpN8Z4axgPJrgKvHQmyfk1MOc0ID1MiMq5o7OBZyHL0jxJmYtZphTy6OB4o9+72G21GL+wunIwKa8fHgvOHjp/7kuf+rSZlEKIx55+4tNf+MzS+vLe7s5//ou/8A/+y//srKxeevfG/njKdAyTnXYn0yrhvNtqcyHvHJ997ZW3v3976x/80i/8o3/498bjocXGodTK+WAqMx2PdjbvN5SqTPV//c6//8ja4gs/9mO/9/t/eG51TXo33+ssrS4F8C4gBdNc6W/94FUj9MMXz5mywC57fJkYWeRiJahCBAOwyntne81GJ89UfOH4Ur+9tjS3ezriZBfMgtZ6MBzb0lw+typCzFd8WTRXltN26+1vvvTujbvF/NIYMxkDpyDMiL0xVSz40BtCDRLzXVoCE0w4Q3JQVicEsNbmvqbYopwjjQWWHml9A5k7c9B0I5tCq4ssPjHf9TQwFlSdYCpqCYtGDShOI+UAvWeN8ScttEq0jvHaOUGYoBlmNx4zFfpJAcbU8XBmyrOEsabSTaFT7CcqIRIuJVPoNdrKxwMuTdNEJeTQgHkQE7IW4sCUKWAdQ9TOxFISYkCw0JJiLmn0Vb7W6u6Px9dGxwPhy8rQKlQiFP0PQfqa2laPiiKPoxVsL1965kAXNB0hL+TNxUbzzPkjU5C2ybH4CqAFHQDpBrUHGnKsMYpQF9IxBaSyk3iXFpRNTqaRgOBBxBP/nvHo7wqAv6hKJRZH7TMWn0MLOiSNK2tgD6tJ8yLMtozJ2Xe2vFjrqUKQ/SQPjDulY2yAaAz9CcJmgMoFHHyMqYwroLMSFvI0L9J0nCbDojg5O1Vak08Ribi6QjzUbDRVsmOqd3d2WYJOMq0KCyYg/EfdTL1PIM1mLXSsoEn0WNG9k3UnnQK0p903aKSJhxwzHVjSEyGW/IhpLxkWdbXnPKkV8MGk52xsjPO+m+pOkjrnS0bkF/KYJvkZQcPif3bBBmY5pT++LlNB//EWLj3QwnDJ4rmgZbyOGRe5iHUecU0s85bFyAaWMbPOV94LpfBxPQHtqM9CUBvSzcWgIjXjwrL4RaWxeL41rQbW2ZwUZVkxwZXWeKCAZ0OhDAdfgKQ9DmIh47VNEs64VirNMuqLSJJsYacL854Y6F28Cwr2pY5GTUTaoywMcwFI7WLwl/GHSunx7ZCwKDKxpAvOA7feKq3aB3tNIZaefpZVhZlMyqIMjJ1OJpt7+4v9WAoTXM94/sHR8Xy78fzjD3tTmbIyzt3aPxoW1Xqv9cjigq1KrpX1hAfiqP3jcRNYqIpyY33l1t7hH/zgjeeffqLfaEgWL0GSpVj1NDHf19kP337785/99BNXL//uf/jaxYvnE2Cle/0554i0HqRUsaaq3E/+5F/JE/3yq69vHewPJ4UNbGpd4d3ZtNg8PL62tffDm3ev7R8/++gj/+Kf/U+fefHFg72DcloYY/JGY3FpUSk5GpzN97qJ0jv7B8ejycbSwhMXNk6Ojp0xc71+UVWB8UTFnAsaJZekuiyqbiO/tLHOg02ldN4mOhHgXWuVwDjTEvMBxjiCwMLeB610kiasXlnhlTVFUZbGcKX3TgbTynS7rRCrw6wsDWfydDic77V6WdLSeml+TjUaf/LWu6PKzOWNL37yxVaaNRuNJ59+8sqjD0mFuYaQ1lQ//oXPddvNV956+/3N3Xu7e0NjR8afFNXO2fDG/vHLH9x87d6u1vqf/Np/89/+8j+aTMbFtCABizXWGjM8Pdu7v+WLqtdr/8Zv/uvB8eH/+Cv/1R9/46WDw6OVfjcV7MrVi+1ex3qbpNq50Gy17uzu/Ls/euljzzz2qaceHY3O/P/L1H/AWnred374099y+rnn9rnTZzjkcDjsoiiSkiiJlrS2bK3Xf/sPr3fhwOsSrJMsEAObIEEWwSIBggBewN5gY+/alr2SV7KtWLJVabGIEkWJZVin97lTbj/3tLc8LXh+v/eMskVgGc7ce+77Ps+vfL+fr/VFnsP4lhmtnQ3PQqk1YlnevX6zn+X7ezMHZ2catRR2d6Q/Gl++fefI0pwCNY2q1d85e36hWX/6/uN1xmJCRaTmDx3Kb21+9b989RJhWbczNtDHwTDMwaQbu2FtnHHa08rfx4G8aIG4APRZHIMBPgK0EiDpEOiu8dQLykGZgX0SKEnh9mUYLwbbZmj7KYJNwB4xZUB5sMM6DUzMcANAfG+1ZuJTiDAj3JTwa4AGLBh3MM1mEN2B7zsHz7AAHyrcvl7BkQVBNwac1QyyEUhhrIbYJMCGViIbzHYDEyWMta0rDTAYnMdGgTmSSIXNjzV6KUrvSVor7e7mcDAYj/rUb0NqhcfUAk806Fuxw/GhdSIMUHeuUluHkgQngtyThmcrcdqTtaEpr2bjXYLaWSQvSOucZ8Sic4WD4ADExNjsofsLwblwGxvMACS4gJ1ifFBVY0tzeGZ2bxRPTHHLmG2gSoA5LHzWuiibjWar3kyLLNJFeNWYMD7cFtY7Q6dp8ZAz4O7mgOFt5y01ljvPO1HkKXdcWAh0w54ZKzMEB4vw11QwqoCbJSmNHImiNIujLFKDSbbT7yupQN9NQBHg24wdqqWNKL6WZ6fX7ohYQf40AYs61GM+FIBwT1SkUrwgUWKMcZlQKoTrDmEpaAuGnwSdBt0jD8BXuAy4fatZOg5SGbsr5PYwh6lmAjjEJD4VshNFkrHCmcJN5UWI2OMcHjAwduIMZ6oxQ8s2KtZQfEsBFgbTDiIJjRlPOQRzQ/inAeacR04PNLuFMc4ZLoQD8DWIqCvbFcYkM15RsmGTSrGwBCdiaJo5C9UR9HwVKsSEA1fgNx+6RCFQxkXgHuU4Q3NeKVUhXCk3oW3CDp457OxR0oE/d3jTwPrMSGU7wrEFg+oblHFQ63IOExROBWygcT6NgRYWhF3hvxJUe9bzrn/h/MF7702WFt1oOBoOnLP1VvuDSxcZIbUkBiYAzbw7v7H50NGjh+d7uiitNVzKG/3dtd3dPe3WffPzWhegM8FlCqOSSSmr7D7im416s9v5u1ff1OP8qYfuNzoLBZ8UcRxnk4ktrRQ8N+bVH/zol3/+57x3X//md4+fuN/kufckqdcRFghGL6D8FMUnP/HsE09+aKs/PH/lyuUbd86u3jmzeufczTtXNrbXh5NOr/cbv/qr/+v/9D+u7Fleu30bi0pYRubW2dm52SStTYbj+W63HI9Xd/q7w8Gzjz5Yk2q4O+aUxCqaZDlUuuGjj1WUwEhjPBq162ksudVWKi6VZKh5g1zk8OYIEV6rSAnBYOripZJCKWNNFWJlDQ7nJ2Wx0R9t7w7TVFGje91uYcy40HmpW83aHGA3ZlrNPXuW31tbf/PKjZUk/viDDy3OLc50OvccOzw31wOTcXh4jTVlno/Ho2eefvLnP/NcouK1/u6la6uXt3aubm7f2BnsDEZ79u/7tX/y+X/7b/7nZz/2zO7OdlGUIEQKZ9kkm4x2dzdvrXkT2twvfukv3333vX/7r/7r8+cvvfz9V++/56jPJisry/sP7/fwdIWOUgoi1Ne/98rq2vqv/Pxn5tr1STb2jhR5WWrIBUM7v/MQFsSJlG9dvd7Pi+MrS/u77TSKiPe1KBrlxcUbN44tzylCYxVvjoYXr63+wlMfWm42a1xQU3ZX9hJD33/5x9998+3R8sKAMgvAGohrCgcTWm+xgEZQK2WwqZmKY/E4wwaKVsHrDhMXSNUQYYPAwCYJmABfJZN69BgDcBHhR95VMTBIdgMOBDLnKboBwbMEzhSCmkw8/sIrEF5+QCxyhoBEz2EvKyC6IBLhlZaUSkIixhWjipIkfNCeOhtJ5QnFnOPS2RIPQNg3VXGusGxfbjSXW63hcKgrfQ+IQQSlzirPFECLOJyU1npFyIG0fjypt5rN125fP3Lv0Vs6vzkaKKXCRWUKrHIgqaUaAiNnCXSx7C4dikDdUCd8KU6bPlxJq9nojilLaMPIVP7t0PEK5klMnUWRGYaqVjniVbCkRzfZT8exBClfnGKWhDaHut39STKx+rbRO6X2GG0C/19r3Ww22/VGUpRxWeRZXjKunTckHB8WHLd4+1Y6JDT/cF7hF41mzoq73GdXDahdVQ5UXqnKtvRTgxLByHdiq0QnCLOER4NXK3XPpvFMOpReTkBWAerMKPspwQRDI6FFgUYR5q7gjoVQHo8OP1v9J5T7yo5r2VSd76ocMMcImpTgF2DmIkGSFzUVXK2a68P4JzSapXXr2YRYoxzpiEj7YgJedexsXXh3BEj3QR+LZGoYeHoG3iPY4ygVAR0ET38XMy6di6hUgFqE7QWo4UE5hTY3DUoo401elKEzI3cd7ZAzao33DAZszGEYswd9dSitQSgvuIHPk4fGj4O4QwoMuQTlAqjnqDU2PN/wXkspiReFKRl0zOPxyJS6VqtrXUoVoT5eSeFMJeTgjOdFZr2PVOShpbbGRlIyISCLCCtzFG+yagAAliYugVYAnBowN4At2Fgq2UTIC0xG2fj8d7/96G/9dtRqNQaDYnN7vlZ/+OiRN06fabYanIYzzlkjqZ9t1YGqzyVAu3rNpjM38sJoa6nn1BFrHRUctBMER1foytgdDo8szz+wOPf99888e/mBR4/uHw9H2CM3u908L4SzexcXz46zP/gPf/zbv/nraxvbf/6Fv/zlX/nF+nCwfvPG3NIycuU0N4wLrfXq9Wv3Hj74h7//f165ev3UqVNnzp3dGQwYYb1u+/h9xx8++cBct7Pb76+vDwilpS7x7IVlePgY6+3m0fvuHd5aS48f0/2dD7Z3f3T+4ucef1hQev7qdSWVNuX2aOyjiHPmtI7SxHpXa7dvb2zUVvYkQmZ5IZUSkQylnhAiEr3ZWc5lvdm4qxrNsyySqtBlNh4Pt3ZCd1MUNrw84VHa2NluNhrOTOJ6zXk/GI7TWhLHvtdoNGNRixSl1Er649Nn98fqM0cPdzhfXprrzPUkJ5PJWKnYclPmTpcl1GDsyoVRs9n6vX/5O7/967+2evP2jZu3szyP42h5YW5lcb7b7Y4m49XrNzioKJ3zpTaT0Xg02B3s9pMooUJ+4c/+9L233/03/+1vb22uf+vbz5+8715mTbPT3n9gL4R1oUGRN9udH59679yV1YN7V46sLOZ5LpgyvsA8cG+BLWg8uOwYpyLXVjsvCKlHUThz4FK04F9rxYlkIpTDUr7/xpuPHDlwcGE+FcLk+dzSIjFuuLX1yutvjlrNSRxr7TBZhCDVzlpPZWlLKsO3w6QErQ0LHzAMhiIRgwDbwUwydKwGVySQcouzRGecgCbP+albymE4G1bdxBpNp+0DNhvVtQCjUngzgWRUDfIY+vcI9p3gfqw0mKG5xBLVYfENWzRGPSQjWSOAvxXDRtVZG3HJKIM7FxoGRnLvmEUSAridOTOhwXegeXbc0zwrI0cUFw5gebjOsMDgDL0HinUJRCl43xBqVsYzUbIxHl7KR2+f+skdzNv3HsAY3FaURof4RtxSg3iIWGc4GOXDZ2hc6mxPRU3KIsHHxO6ERpNBs4tVP0XuIxzXoTKALzj01hCBHRoVNNkyvIAoXtIeftSgmsGuBu3XcKoYi4rmauRQWYamjV2V/1gNM9BCRKdsoqnoaQrEsji8Bn8Ur6K1MBaPIHBk6lCaKmPhlqnKA5g8ejcNNnQU930IdUMpgkcjEwk/DCbC88uwfCRkuoAAEQGtemz4v45At+dAYMThFiECJp9gGADMk69M6NiSAgbHVUg1WOsylNtzgfl5YMP34J2z1RdlQe41DWdkVXYxzSnZtnqWq4aUY1PkUCNg1p1BuggO8WFNKyiaXmAzAC+2c1YwTPunIvxXIiIk5jQGYDRCWSu3DHyYMP2woCHjzEvgvlqEh2G5Zx3hRABOFGCzSGijGIcC/SoXFGdSEGzrsfaEOpHj2MDBvAKqO2NRhUnyIgtnRBSh1xqVk7iF11pj9iew4RxUkuHF0MZW3z2FX+lQXIa5GEZK4aap0eASDAUSfokYhglMAIS7wErcei3YbRkvJfVLp97e/8abvYcf6gzHJis3d/uPHjt2a2vr/JXLxw4cpFlZU1GKdDNKmKDC8TzLO7WUEjIqcg01F3OcVMMPMCBrACRx7p3NJ5PFxaWnHnvog69/56++88LR/f88SWqhGxe02+taYzZurxNi7rv36Nvvnvv9P/ij3/2d35jp9f78L//ms5/86GOPPTrY2kpbzaTeCL+nL2XkBRdbm1tCyvnezOd/7md/6R9/DmVnjLi8KLNJvrZ2G+YLFHTghhGImtDaGEBHWdPrdLqlYafLf/rhR//jD1772o/efOL+ex544J4ojm7cWuu26tfWt9a2t2tKcUEjwUMh432hzc319Xv27ZsMxw4w90mj1unNylrUaLcQnc455UJZT2rhuA/PmslNHEVb6xtWay+cLt36xhb1vl1PvJGE+q3RuNaojyaTdj1d7LaoNWmqVo4e/psXXjOj/POPnDgm463JqM1tLQYNlIMUQDzSKwZdOAyHg9FoPE7ieM/y4v79+yVn4IzVuixvrt4ijHLBvXHambzQeZ7nw7H3tlVv3rl+40tf+NPBxub/9j/8q7Xbt/7qb7/58Inj3DudFYePHItTVTEKGIvTxnCY/fj1U5O8eO5jD3RarfXJxBOqNeQLAP7OY9QtTkRd+BsNCV11JQUXnHFjdUno5avX59sdRrlK5BvvvL/Qnfn4yROpkM66hcXlPC/ac7Pv/eDUhf5OuXdlYnETRCycyDAmlZ6SUO+GY8lak0OTCVngjlYVNIqJHcJKUcjKAVJEOMUM3fALTSjoOSL3BZNVjyTC5wzWIYdh5Bwpe+AyMtZyIbxFKQxwAiyRQsDSsHqXnTOC4qDbwTTIwKCTSehqoPd1jPoYbP5wXTkFP0dLmbNOwzKUM5rZUntHQycAGGPgNlR2f+jE8T7eMkW/zKMoYt7FSmrDtLaEWcG45NybIuLKwYsATFDT41F3rvfGxdMjRm5o44USWKcCHd5ic++rCOfwU0SMPlT62BlSbVtM7U2iBiEdJQvv7mT5GFPNpzRlQpEuYDzWNsw7yGpEaSU2ouCZdqTSdlWot/DZM1cBzio6MXfQwZppA87pNA0euf9wF1p48bGTxLH11C8FQTUU4lurxW+VeYtrWlwEhx9oWyWEcisV/DhdpRqrlNYELDEU/h+T1ClPBKORdXGaDlSkk2RnMByOh0pIVvEqwpfXk+JAEicyujQeX9zcUpGkXOIVjInaSJTFzA3g8vNKCI3JWqEBrpTJIICC/SyMQNDRVPWypFqPMypIhbBmpEptwu8XYufJFMKJRm6oikGYIjwn2rlU8E4cM0cmEG8BQ1aOcDHc/8PcD69RwJML6rEOZTgTYh54F4KQhPIkPILgPLZOe2uIN2DQg4xuT4WACEOg+XCBSWQcHvHKkwctPeO8KLMsz5IoJlSEchQKKEKIRsMutmmA1J9mIoWPzKG7GkpHOi2lsmyS5blUChQ5VAkRqQiI3pRTCSa4inDCgTjjiE+SWEqBn5MNRQOhfAocB6AKznMkk0gpdNOMzFC9CoGfPTgkoOpH6AxnpshbxjR2+509y1G3N9zegg2Sm+11zly7sb61MzvTZpyOsjIv8sMH95X5xEKd4YX44Oo1SukDexa9tRzJrOgLZExIzlDW6amjNo7VzOzc++9+oPPCGPvwg/fnkyGIt1kSq6Io8klBnV9amN3ZHb5x6u2f/dSnDi0tfPOFVy5dvTbX687Nz1HqhIgdlNJYp3vn8mIyHA5Gg93xMHRzw+EwG2d5NjHGauAywDXAUAVEYUHnbEmtjY0ZXDjTyPJjc/PzC70Xz17e2tl+9snHZlq1SClO6Wy3nWf51s5Oo5bW47iVJmWpc2OKMk+TqJ7WCHGdmU53diZtNuI4kUJRLrQpKay+qCfhnIVIJEJIlCjqvS61VNHt9Y3tnWEtSetJxNEoIflwkutSH1pZqEWy1WkfufdoKdRf/M03nju88szKvhaTjXZrc3ebhEaJNVvNOI4jqaCSdWh6AdOeYFx4CCnReTbORuHTyPOy1GAIsib842w0HOuygK+QFsPha99/+St//oVeI/7dX//Vy5eufOf5Fx+5/75Eynwyuu+eI3NzXc5xUESFVN25+a9/58WLl69xKf/Zr3w+pqTIchM+lhKA/d5p3LwSWF5w4/3Y6VNXbiScPXxwX6qEkEJwdmVt/dT7Z4/tXW6myfuXr3BbfvaJR+c7zVSo3twCN4ZR4WXt6//5y6v1ZD2NMySeMkqZCP0lgvFAYo0BgRXbGQpoUKFCtpzzFYCPctRMIWOYA0UrVPDhy+FgK7Lh8PEgOAB0A2p5oH9FgyFBnh0EJ+MQtQpEgnrY453jTBWvzkMVLzCvl0Fgn2BCMCaYF8QLEppdRZnwRBKrKIs5VCfQmzvOcms8pSXBgATcmln46qmBBTuu/0MryThSyUCmg14djzphSLtj4U8hXtDwr9GhJD3dq5KTM/Oqnr6zu30tz4emkFzh1BCGxtBcw1lPWOU1IhiVCDn0ALa3HcoP19IFJvZF6UKvd2nYvzoZZdQbiuNvAFuA1wYG13zax4JrAoNyaJU9hYmxoK2ueuHp2tdNo8/gb8DisbfZPNRsFFpveLtR5BbnvBC0rk2Zpmmn2YnLolZmZRFauFACwubRIyWokgTcFTLBzYbllbHMWd5RkYMdsOeQQ4EVLkxGQKzsOaGSMMFwHxza08j7OK3tCuHSaGt3MByNwYeKSezh6puT6kCcpFF8brh7cXsjFEpwu0DviSwFgpcB56zaqCJ3mjHAqcDEGRoaOk2Ew5BIinOCigWOujLo/rAv9wa3yJDJM8V44Z9VkVoZRiQ4zLWEz1JbG4Hb1zqjKRAvq1YVEgYBlY5xQBA6K8AZRXGqEx7NUNBSRbn0HsIvuQNzloYALcYjDU65yslFPejfw/WPqzEKASYgweJAmAv3MWVsNBoPBn0ZRUwqCBxgznm4RIVzTgqJOSGucljjalBBEhnBsQHuihhjaZIqFaElEQf7jBANwzEuZKlLIcRdUCnE3VQJP+HHJAUOpSEdJPyIJBj5CeWSh9u31CUH+zAITNCjDFtI8EZzlGnRylBgCedluagz39/pHD4c1etFv4+PwfzC/PsXLm8MR+1ms5HK09dWF5YWO2lSAGbTUXH65q3c2Ef27WXhM+egwoNcyHDSoEAEikAuhJRLS/NXr17LjFu9fWuhN7N3eTnPMsQARZGaTMbGaGfsytKCNe75F1+I0/gff/a54db2yy+/cvPOOmOskcbNeg3UZ7zUpTEOOhyrtXahwcUW14D3GSJwQExIqS/LIhsNt+7cunHh/LVz51pSXH7ztcHqzfler7+9vWdhvqbk379z9vih/fcd2d9qt+MoqqXJTKe5098ZjiadZiOWIhZylGWZdZFSnUYjTdOF5SWmlOBSxRGq0KGW5eGnDN2f1hqfdmssLBnp7mB8+cr1KI6VktaWUaSMd5SzwXA802kePbBy8PCBhb3L7YWFP/nil32hP3NwX4uyuYX5uBZPxsP5hdnLly+98fqbFy9cnIwntsytNqHUptW8xVXgcqDRgkIh9KbamCL8r9UG7CvElvr2jRv/8Pzzf/uVr6xfvvCPPvbkJz76zOtvvHX2/dOPnDzhtM5Ho3uPHdmzPO8pkVKGh4+JTm/u7dPnXnz19ZEh9x5c/tRHPzIY9MsyL3X4xItCU8rKogCrHQ23RLj/xOZk/N6VGwvt1om9S/U4FJGbo8m3X3il22wszcxcuXmL2fJTTzy20Go1a/WZ+fmWkDdur608+vgPv/q1dy5c3p7t7XBJpwNBQpi2FbsfJpQkNxql1OFGdVRISYHKRyr8VtVxARKA4AYWLloiOMYe0KnCBt5EGIQSi/lvvOJCIFgbyZXoUGA8HBRwcVhnYBlHIPeJwHIXBsfecexsPImliDiPYELKnY+l5N5RayJgBkUC8sooM5RkTufOGEI1UOsJTP5BcwoBstjmgegkdDkoNwvXMJS7BJy74SIXnjhwe4QqIGFMgd7TQYZNjfB7650DnZl/uHD6pc3bY0pU6De8toZyZiBNgHMBrDGgUEEwMCauegxXcb5h7eFWa49KZ5jcMzN3ZnPt7GSUMaYh3w0YiKhE46BGhEUkmERChQF0YQ/nOXySXsD/AmBVWOxvK00drVbOUAR6arU2exrNexrtwug1Z+9kmResSm0A/EAUxd12R+miqcsyzwvG9BRlaXzooHHsDF6eKgGSVJ1ieFGptbwTRYQLHxopCqo3wu7iJPEHTCBIlgKRCxrS2Ps4qe1IYZN4s9+fZBMhFXboaBGdVfGhOIqkOjPoX9rekkqF96qSRCHnGkDDVfQjrrW9CJcK4DYgbx5340h0Q68BqWS4FBK4qm4YCIUECG2wVXeISsegCbw0PdXaFBkj8ORwADp6jGHEVANamlIQqoTUsHsguK2ecpXxy/DAWYagMMtA+IApjZRAlLfzMaMScncrsVXoR2EeC2ER8O3Dawy9NLxgwJCDQD2PsjIYOvlqnxHO9ihOWbjZkXdZpV4BlZRWFypkjjIpyHSej15qVOuBUgkDjAWsRgzG5yL8DvAiUGFgUYYWeCj9kbDBpMR2R4D2Bz9iR6gQIpz7aHREvRt6qe8uMcLDHe4GSqvAQ5BzklBBMFKfjFcW5srRYO7IYW3dZDBQcaSkOHBg7+lLl6/cvjM/P6MtuXRt9cC+PdSaoii19Zc3t9b6gxPLSw0VSahxMaSRCc7CMcARKeoJjWLVaqSNVve1U+/OtVpvnXr3Q088EgmqizJ8L4y2283xZFTmxmnd63WXlpcvX750+fy54/cdO3ro4JVL519+4aV33n332rUbWZZ7YxXnClxinPJIRYIzKZUU4cNlwC4oJ9nu9tb6jesXz7z/7hs/+eDN16+cec+Xo33Li6002t68o5I4J+7OeLi6vt7ptnKjJXHPPPUEj6SKYpmoepq2G/WdzW1Yt4tWsykE3+j3jXV7FucbtaTebDDBVBTRKFQ10ClhOpbl4Aa1zgIHpcLr5ll++eKV7e3dVqMpGW02GtA6seFwYk3++OMnjx+/r9lpyVgRxvOi+NiHP7SyOEdqakBtxmja66TdZm9utjPTySbDtdVrNy5fWL1ycfXKpeHW1ri/U4yHNit0lnmtXWl0XpiycIXORqPBzs5we2dnbe3SmdM//sErz3/jmy9965v59tqHTtz33EefoZS99L0XOGOHDx0c7Gw7544cObAw3/OUxHEM6dqu2e6MLPtPX/hSq9m6ubHxq//k5xdnu+PxxNlws2dZjpe90YYSGioPnPgKvtrvn7+9fmC+d2R+TkmZGfuNl14ty/LE0SPXrl0XxH36qSdmkrhRb8zPzS/Nzl58+919Dz1iLPn2f/qTG/XaRpqWDMJToOiH9Cu4T2EDpsEbhG9cOM1DsQ/t6vREDlWdQ0cMgXhBhluvcO4AARCgAgQzwlEhCwtvXr3ffBq1UM1Uyf/XPIprIsycwL6RV0JeL+FLkZQK6hXjylEJFHsOBvRwNHEeg0gzXHWe5s5mVk+sKULXC/cumfKkveMMhBdQYuAKHxemmBbHAJHrnYHpF+j9fOXuiThLOU8Ytjs0HF+U9Tw72ew0ujMvrF6+SbVjvFFLAWUEsaVw9OFqFvP3KHpAaEXM8M43KDvUaC5wWXM8YfRmMX63vzPgrJI7OUijw25++ntQTB9iyMEGcRfWQxUCmbpqHzkVQEHWI0IOKF6AMPIsCr2n3jzW7uSmXHduLcsdg4Up+FuttlEcd1ttaYqO0eVknDNmKTXhUYGvjVZmXQdLPFflmOKCnFGjhXcCzc/VjLqSWaHhuPp+8Jqbpm1XGj3MwiXTbwn7J7h9GYTPg6gLciZwQ4JWVKCKU5yeO3cXoGhx6ILEcA+iJzLV9FHIvIRGefqVEo8zHUdCfxYKSZiOWuM4zGOhTrTo76aMCWuOq/jE3oOnbt08pwvLFO7LsVaCNZ0beyqsqRMReZITUkL2DoK3lVAWch+BEwFGIykAagFhJhRC4ImLOFOYFcwgyRhQ6XjLwoAFk024tTZ09uEeN9pYiE0jghHkiHHBcL5MqY9qaTdSnEsPKBxijJCi+rDDDzQUtdpouNe91Q71BGVRwHIqvPFlaPK8jHA+DzU7QTup5lKoKHbWckq9VCDKpChAAMkDgXA3D+Qsr7XRgB1moAJlnBlATyPZO4JAOtBvegj2D1e4hmmVdk4CKtJaqyAaQjuzLdXFjC1vrD91zz2nX3jx2OOPE2vvrN1OhZqJ9OeffeaL3/remx9cuO/o4dOXr7/2wbmnH7iXTgolWKtWK/3m9iSbixMPMWBScAuPEFTLDiQ3wkG0cX93cPzYkYNLC9lw1GjUv/DFL//Gr/2KksYUOVRdfGV56Ya/s90f+tEkjuWTDz+0MxifO3MmVvzJB44/ePz4tdtrq2c/OH/qTetsrdHudLrtTrvebMYwnFdKYQHkide6KItSECcJrcXq+IE97ZPHmvVGHEkuqBRq/749ZTERlO3sDrynSsonP/2xNEqyIo+TRKhYZUmRpuGjzrJr125HKrK6rEWqkcSD0WRtc7sWR5PxuBVHwEBn8PJhHKarUHqA/vYm/BCcs7os+v3drc3tmXYzjSRnUbvb2trekUIUeX7i+MP3HDtUbzW0NSbPIyF/6ec+q0EBREM7FArUOEqLMnfe7RP8sZP3FgVOmsvRaKitLrUhk11b5rkxfW+LvByOR6PBaDwajcfj8XDECKh5rVWRevjg/oXHH67Xo8lw9JPXfmQ8PXzkqC/19ubmTG9maWkhjUUoXdGz7nxaa4h6+4/+8P+u11vcu6XezOHDB/I8I5RqbR1gOEN/o221bIP8WuPD9707njBCWvUapaT0/uU339ns9z/0wInVG6vNNPn4Iw8kjNbSeqvRWJyfO/f6m7zRrB098tIf/+ntLOt3Z0suIEFIUG9LY8NLLqp0Ncg755C4R5EqhDYBC5ZZeEENBBPBrpQRwST0dnBee8AXQ4oYDHRLjhWkxRmsQdGJh+EtrIA9h7BwB0l/cIaE3pN7YI3wCsvBQP8IIhWLSQUyFNrMGwOOVyuogGkwbIUdK4HgaAjJrAbgAIHDhxqrKXgOjSmpDxWttRadHQ5sSw7YWdY7FdoLy0FvCTHAFCPuOA09mrSuFSkW/rnwSpDCz0TxQaoOzs/96ObVdVNKJbQjg/HYeCJA2GV9Jf7ljBujPdyEeIBwIZ01ytq9rcZSWhejrDdTc4JfvLU65NQ4YjzS96eWIVDgQpsGoBIE1kJqi3NW8BhqiHCVWGNh5AAjVYugSyi6KLOWyHCGWAx0DS8E1kqVPwhsMhiej0WfQ/8NqyROpCI3++p2B+gFLKSYZ5ZW6b5Vwi90UwKVW6h+/ikRC8fnrJJnIZhyKtcK15pjKNBFMAvuKCC1A34vNm2wpv+aUbTtktDtQcARWLTgImYo+gtfJ5zgUoD5i0HslTHwzMIAhBnIzgt/TYWFeM6KvVE92FWEsQWaOUTzGu64L/XnDh/+r46e+N7Mwr9+69UtB30nBbYNqRAs1lMN+LGU84mzBYRrQ3UH4HIYpYKmGebd02JV4C7EWUkrR1toBzWAkEHpAJH4FGsy441HipF1oDtjjjqtS0+91UzJGBA7OPitqCuUSzP111trIHaY8NDCSfD4VrXRlGYO0ZAG8vLiGM0qCDpDvZUDRii1NC9yRajnIG/2ttQ6ogpmXwROExGKISDoMUrySW6dSep1D06mSqFAQwlchRRDXnp4QMFyq7Vx3gohjHc2L53kiVSQukFR3ZpTdqfeePf8+UOPfShpt1//xt89/Lmf50reunNHCTlfq/3SJ5754j98/9yla/OL86fe+WC22VzstMpJFgleEnKjPzjS7cBRBjOzSkyP8hWAujKOGj3qzCef/vAf/smXfuaZD7/33nt/9qWv/s4//f+NIULIWZckycGD+5pb/fW1jbIsx6NRt57Onzg+yvKd7d0szw91m48c3EMo3RmOd0dZlhuSZ8wZM6CqnsateqPZ6HRmegsLaaPe6XQFI8VkHD5nY/PxyJRWTyb5OJsYa0tjiBVcEk5qtURGojSl8WUtacooiRiXsRx6vyAXV6/fbDdqjXpaai0437u48PbZC9dv3Nkz29vd6deaTYTMomMSZgoO63rQqlgQfWhrNHF+Z2snUVEUrl++9+DewWhXRZJTESXRPffdU2vUkiSJCe1rs7O5defmLRGOfA5AKZweUwbYFaEk7EskF0oI2agl1gsI/LOm1JmZFGUmPakr77op79Vhe8VsOEzDWZXl+WB3vLF259rVotDl7OyMojwbjyllBw8fnJubQaANFxKSyWicpHN79v67P/nSjVt3Hjv54GtvnvrERz/cajT6m3e0Lo0xpFJxVgB/RjmkzhvJiRVyOCk4Ic00jqLovctXz1698dDRw7euX59vtz/1+MlI0iRO6/X63pV9V06f3bl95/F/9uvD1VunXnhpPNObRJEFtad13oB5AVM1OSBdiYdRpzZUMuMMJ5JU5y6vQtZhL0ir7tULNg1hhSoNDy60TDIQmcKdRSC0wMGCEsSL4I4lCOEDI48PBQcDrxmFkLnQEkCQKK43YfIMzo8KugTaMehKuAlVmpGMh2LClWCAtADBreL/GAzLQDtCDDEUNs2l0RQN/SA8sqGMFgD9cEpI6NIpnu+hpvaCCmed5sbWuIhCfRDDQqSIiWsW5sSBA3fy8etrN4YcIxNxfW8ROuy956CxcBA4WhEgw68K/ZjUZDmKO5z7cV6PlPb6en84IlTjcHFqdUHxueACnaDwqXhkeoRTM7wsjGJvaBkOJPCHQqfCchg/wlgTIEJk6uGGGouguUZUQzeKSiXwteAoFc3KlbfIT/PY4UVwtMJfgvgK/5KigBIrDV8RmT2bWmtZlctTiZkqAdNPhcx+yqdEPTfMKgkodwitGB8Eo3OID+UDZkoTBFROjU2eOmhtLYORhgelEps2ahQNtE4wWnXN4bwHbRw2xxhgSyuMBagh0dwMkiuY+BPs54B5wq7u7Kxt73DtFEBl4PcRHml+cGQTxjLjYuq6Mmr6cO2XMN2F/x6sx6AeZlxMoUuwRwcumBBMQuQVzGw8F8I6SEnHPOPQ/XtHNKGhyNWgiWdMcsrysvSMxFHsQsVXEuCdVyonWKB61Mvjxx9OKJBaWl16x6VE2y7UzZWII9SltPL/MicASQmwEEORcEkBoBmnsWBC64JxLkSlR4RAdYGJm4AFYKAfIEoqwNdzwgQq3nGCDdWkA70J8yg1gB+OsVZyxbng1EsmICEdzddEWyMoNVwMVXKn3v3Riy/8+n//e5v9watf+crDn/jk3Oycvr2qjV7stD//9ONf+PYL/d3B7Gz3e2+++9zjD7TiWj2KfbiAd411sO0JJZE3oDWEzh30B+FQzsqibu1gd+fxR08eePGHqzdvPf3442+88+6Xv/ndX/z0x11/F6b1XnKxtLKQNmrbmzvjyWh3NGKTSRRFywtz1tjRcLC1vpnWaq04mW93YqmoYGkUMUZDjcgZFcJTl2+vM51tjoZZNi7z0lmTDXatNpPxJJtMdKmhR/GwRufhCmSECl7rtFb2H1BR7HFIb3icxhNr+oOdeiPlnKUyVkK1Op3d3dHa+vYoy5vNZDIZp+26c6BMcY5AHBvOK0EQSHW46sMZlk2y7Y2tOFa61PP752qdlojjVqN76+btJI26c7M89EpM8KjeqA8GA2/ccDByxk9GY1yAFHmprZVSCsGSJEprdakiA7aWSClIOTWm1KEEL/AAdLaEnHXtdBHuSeJJYQqk27ebtcXZmf5oNBwOqSCLy/OzszOUh6JcCikUB3urFCpqz8//0Zf/nx/95K2nHn7AeS0i9fRHHjP5OLyLjjDCtEdgKsETKxSiIOKRUmbW3dzejoToJOnWYPyT988uL/R2+v12JD/2yMnw0EvZTBt79u7d3dg4/ZO3nvlHn5GzvVf+/N9vjkZbe1Y05/CoOm2MQ+e9Dr+7NSXngoIcSEgJBmtmq2R37uDSYBR4F+EkYqyiT4AGEXRSeHiCB5Sg1iQ0HxA+iBpD7h38c4u5atRj14GeL4xVhXQCSgFpFA5/gLZX+Dl/N2MUltDgZ/UFAOIEZ5Uk0oe+0IcKHFIFobXAFDJa0RNoNYglTgGwwUEsKXofGIzKnYFDmVKtS450EVBgKSdmGG0KCVW6pdzXOE8dO9Gd69Qaf/7B63e8tqFrCh2Mx0hFAEqH31kQbdF7BbB3aKac88K6vfXmgVqdFmWNsbnZ2Qubm2cHO0PBtXFOAGwyNByWMqaYYkxorxH9IRhuxl04xzDjHjeJ7K5jiWC0IoMbAVtIZw2mEgCvu5I0OV8FNVQpRAjR8BX0ClzRCGEkEGZbsZ/BvQ3CaswmgF/MybROqhphKN/aKnaMeyFwywAyZAJ6NMqBtcspkVU0Xqj6OCGxd1Et3VGRT6L1re28KISsIgvAAeMW4mSfUlJF7+/sXO/vyggGkDhGBoYbI1UAJBMcOFYUM4OrghEwCOABqzjPsBfGytHh5JvTSjIGHTYFYBu5CwBDuRnniOeit0fD94a7L91ZveG0k6IqwSo3F1qSCECgfCIk977wukS5NKEGGZOwRAgNAZNIeUXhH/UuFUKFGsJa55Etybhw6KYG4RiATMMjz4XglAkp8DnTGLLIBeMiHIYiopWnvxotcNAWgdHRYZI5qM1C8SKEROUnQZ88fGpSSAy3mIzHg9FARUpxGQpha6BPVYDOdeEAta4sc+cs2mZkaFIx/ZriYA2+UgafKmUcHnYoIgEEgjAwVqH1IDmDEeFYJV6RwJX0gCYA47Sr2okpy8aFryZKN27VI/XoL/3/b7z91tuv/nDl0P7O3Ox4NLFaN9O0Vqu9feZco9Mp8vzm5vb+PcvWkTOrt8qyfHB5qYZ6JxhYCaUcVLJw0jEpFHKqlRRJkszM9v7+O8/3OjOHVpZOn7tw6ebNB+4/zvAIF9wZX6vVZmZnoySCrYZ31hZl7r1La2mz0eQiVCpWl0WWFXmW5ZNxNpqMR0VZFmWByDrv/KC/OxkPy7wYbO+Mh7vD3dFkMjE6/Ntwg1FRFIWGsA1rXb3dWNy/0p2bQ/4A+FqsoPzN117fWd+YaXfCT42xSEpvbaORbg0Gk9Hw4IEDjLNavaHiuHJ7gzuPof8KBvHalrjuybN87dYao15G8p777sVIFcqY1sVwNDp09Ehcb+B+iEupBOQxM26NAbh01QEYSO+VUhmti7KEjoU7Fy5eCzrkKQWCcoF2bXhlgFmapmmzUavV0notVUIJRktdUkZ6s73l5aVWuwmUNxbFcSjVJGNC1OqNZGbu3//FX3/nH37wkQdPzLTbZy5cPnL4wHPPfmQ8Gllj8yzTRTUYzia5r3ZqBpadPonj9dHg9SvXGpE8tLj4wYVLo1IrzrkuPvP0k82IU+Katcby4lLk2Svf+u7xe+/b9+wndt4/83d/+hf9dud2XDMc2VIOriGirS+t4UrghUEot/AoW2tQ70Bd9RoILsqyrHwXFUMfjgjYBQGLo9oEV+otUEiAiRm3PJizXklwebhTnQz1CGXOK05juEYEDBhD/cerTRYWX5RRHWrSKsa0tBgVFE4YKA04FQz4IYApFrwSyFA8K6caF/iSrDFc4DSTtOKEEm+quBoImHDAIQYHSyepUWBuhzuekrrzT3bnW4z2y0zAJrgjogM8Ob6y99WbV94ZbNlIYUeBDB/w1xro0wVmMUDaGw4P4LbTelaJ5ThJja9Z26ill7d3LmfjAaclWLk8LB00umMJDdUwOKlQXB3KJqvhEgsFiqDoC3GhGqFVnwgaXFD0VqwTdLdCdFGlg7KF1vNxenxmJi+LHe9vjccG3dmgULLWKhl1ujPcFN0SRP+w69UenC+ggp66eWFwA90IKrAphNhwb3g7SjxjNpTzZGpjQqMPEaD34cRzTyATkQoKLBXn4lp9W0kXRZs720WRQ/oPm9peyGIcrSgppTrd374+HCZRjOEbnLIS50hoP8cSgNMpRJKBeglhJow6PxclDc6HRmNKPqkKEUwJrOZQjFYKZ1LFLIPPCpWEhHiIPpwIcXE8WifOq3h6WwGsFYY8EPkFr4cn0hPFBeG0hFATXOJyIUAWwDne9ASmR8AxjxjjlghYEVVZJBUglOEqGgz3zCB4EwaITAgccMUqCR8buLDQkkRYFYIIeZYOZQKEVk4y6NcRRkirzTr06CDaQ1kBfCaM5kVeFEWtXuOQkS2FcsB/R+g3LhMoY0VWlGUpQagMpRNMxkiVz+is43gNQ5QSB6JnWRYcA809qLYYrfx1+DVW+xJbSbJwm23Cz0EIwStNOuK6khqjo2uXjz/44N6PPHXrnXcufXBmce9Ko9PZ3t313nebTSr4havX253O6tYOZ3RhceHcjdXtonxkaXmxXjdlERpsGF8SsFzARx66+iiS3pg4TooiP7h/7/Yo+/5rr8/Nzhzeu3L+4sWrN1ZPnDwpOLHGySjynFrqkzjqtFrtbjdOUof6N42prqH0SZI4jmLISIiiCP4nTaI04VwY7bIsK/Ncm7Is8nBvlZo4H8nwzOd5XhZlVmSO+ihWcS1dOXxg5fDBeruFytdQSRuTxsm5986cefv93kyXc5nEsSVGKSk5azcbzVZze3traWG+2ahFSVxr1VnF/cGhWeV+pNCUoghrsDvcuL3OKV3cv68zO1N9I5THSVzmeVHk80tLhANRi4laoy4jqbUVnCkllJIA2uKxjHBuAWyJcNo6+DliCA8BFYOD095aQ6wLDXWkuOBCCYi2NWhGZ5xEStRr9fB/GqmApl+ExjfikkmlOBfdXs/H9f/jD/74lVff/OhjDy3P9c5dvtof7v7L3/rnsRJa67IoJ6MxgSR/o22R5+EFsdjGhbux2+lcWN84df3Wnk4rEvLM1Wu1eq0YjT720MnlblMQV4+T+dnZbrv9+ouvtGTyoc88R5udF/6vP75we/327OyAC12hkwjAJcILQ7iwsD6DcZc31lfWyAr/VJX7Uy8whLZNMRrw2jIB1ySsbJB15e669zGkEK5Dz6ppNhWURpQqylR4rGkkBMXgb+KAcYvjTdgKwwK1pA5j4CGWPby54RZCqhKcPFBPu6nNBsVlHkRk1QQR9Tswc676QFaFsDrjqlko5DTQjlLcew2TdilCHx+OCMKksfu8eGpmXli7a0rF6IyI9ork5N79l3Y3Xrp9vVDS4+nNMRKeYfovECnC4aEBdohnHfFEOL+QxPuarZp2++vNvQvzl7e3ruTjXUYzG74AQ6hGVpbgWDbD/xA4rDwHDR0Wh6hkmi7fMTHBUc4r3PC095+KW0P3ApWNx6l+WZr5JL2/19Ol6RNyZzLRlLkp39kYK5SY6fZEWfa0KbNxTimgKL0hzACbGjI8oE9GsgH8bTUMtpo5wztRbBlznOMwm9Jp4iF++ZhuQ4gkTFImiBOEpp6oNN1R0sfR5tZWWerQe1XtU3gMF+N4bxQJqd7b2b4xGCThtRT4rQKf0CJEFdplLxifLsyRPlk1BtSTmTQl1vS1BtsRC9cDZVMxGyb5A4qD4fzZT4XSCDfhwPzEppwLITAqHzajcIh4A3QSB95rMPvCjCsGVGPpEC0OAFj8bckUw+0B9uZ9+Ew8LKfDs1pZuHDE4KAcQ6AcwT4YE/UZNdAiQwmGdxiqj2HYBDjfygiH3ircJEFtVOYFVxJApxQj2DgA50D65SpfHTxhGEHRqDdCFQeR4NbaQhfArGZlWRJKyzxXSqW1OqyQga8H6g5vQh+DK6tqSuL9nTs3jTVoHZRSwXHB4QsAdrcQUL04OLXCJwmrf+DWGozK8lC1UESmCLBZl4TXJsNktH3gU5/u9GZuf3B69eq1lYMHuRT9wa4ty3aj2R+Orm9uR7Vk9c7a/GxvMJmsjiZHOp0H9izryTB8sIxTLmQcEUyLBFUOfmaOeiW50cVDDzxw8fqtH596p9tuHTt0aHNr66133j569J5er5frgk01Cig8jKMoieNGox4pRSmJokiCxQnN46HVQ08dIdbAwtTBJ8wqzAzBnDNCy6KYTCZZnjMpWt3m/PL88oG9B+450p7tqbTGhWSgAfTe1+L42qWrr738yuLsXDiCuSDhdaRKRXB+h89YUrq0tKDi0ExGSQwGXIJojCq3BSnC2uiipJ7tbPW3tzbTJF0+sI9xBs5pQSosDCnzgjAyt7BgrEHuqYqVimPGuFQyTlSSxioKJUejVY+SKEmTabI7AG/A+oexq/gD5dORCMpPGLjXhASru5Thewl/q+Aac0JJqaSKYvwLrtT8nr23tvv/y//+7+7cWf/kk0/U0+gnb70tE/l7/92/mO00xpOxd24yGTodzg5jtCl1UeQcGM3eWWJcPVKNVuuNS5cvrm/tn+lubW2PrWNaH12aP3nkYMqp9LTbaOxbWj77xjtb11affe5nomPHbvzoJy/89dc3uzM3I4U4IUgCpxrmbKCtDd1VqDlAwMhFRNERgCGqglXcKhI+XgonEvwG1XgR+BiISHeYXQD8PsYr2TB2vWAzgYGoojymVDEahUPKV7lAULjDiExhmRvqcME0PD1SW5WXoetiHDg/BEMFUAFkPebNYyQctRWb2kF7Bs4Oh8FiuLA0SNUFYhcrISqGMqIgKLQu5FKz5b0d6VIIrm0oVxC7kXr62Mz8gbhWi6LRcNARajlpHJudm3D/vWsXtwWx0MI5UxAHxFyA4SI9txo4wxAUe21pzWJSW0rTONdzPNo/013P8/e2t4aKD40pnbMw2bXIWIZml3JkGaGrgxE0ZYBTAEatBOb8FSaq6viROV0tehmevVN6r5syZ2ip7Vya3t+dKYzue3drMtacTbXMzlojhOy1u9yartE6m0wo5CFSSOqD099hLp5DNw6dsrJASmMtd05g+gDCW3yVZuR9VdLhP8XZHmBEyBRSib8T/qcI4aw0WljNQZvNkF4B6htXfcThlQvPFZNcOm8EE+FCYUBaNaiSRxsNscytjgaQ5ohRjA4aTIa3y1QsjqmLjkwtv7AiQQ8dunUg7h4vR0qkCHUuCtFgHEE4YWjWMi70yhlxkfapEhETWbj4AakBYj34ueJKIVz2kjIJlTBMpQh+zZWwnTOo7QDiAK1D+C85M+jBpZBfxiDgE84rvEsrD4+DfFNnIfeQCoozTmedDWcZBOw7PBhotU0YDHedt/Vakwvp0U8Aui1QpijBeKlLUFA7UxgOqRnOGfAbi/C0wHAbqvjwVZiqGAxHP0jJiNZaGz3KhrUaXksc9AOOOeZQj4vITQo5kB4sxRzgwZDJA3I7ji+ZFLjJ4paTcaQGtn7m9Jljb7/Ve+zRk2trr/zVV9/+4atPfva5yWR8e31deffYfce2ssnqYJBZf/XazYV2h9zeuLmznUYJS2tr+VhIiWmTnkIUOcJWrIsiVea5jSOrbTnc/b3f+rUvf+P5r37rxeV24/H7jxVG/83Xvvmpjz99/33HJqNxURaeessEMUVoSrgHo2sUReHLdxXsPlROjnpDjCAC399wngrpHBb3EJZu7GQyyYvcapMk8cLSYnd+tj3XTWsJFVLGCZ4R1atIeKyiy5eufP/57/U6LaXQ6wf2a4HMwvCTiMOPzAjBI6VgpG+RAEpp9eJyKkJhzbyD54KEzk0wLuJ6lMTh1EaJu/Hg4JRcJPHmnfVaoz67tFSUBebFNjvNpJaOdvqT8cgZEzpi44j1SpceWruyKPNJjuJrOFSm8WW+OsNBpOiwnHQgEA2FF2cUGABMUMZByyWlihQLJYhQadydX3j5h6//4R//55l245F77zl97mzh/Gd+5uOfffYjzJbZeMyoM6bEdAFg2zhbag6OWEY985472wkPP9vo74Jnkg6Gw0ipBqcnjxxsJonQZSOKlucWbpy/+t4P3/iFz/1sc98Ktf4nX/natog249gwOQUVOUTuelfF2FF0T0KBjMnmzmvCwpnl4ecOXArmcfcUik5KiAhthrEYXOgs5s8yuDMYgz8DdgfhGLbacdi5Uu8jRhUXQHFAMJQzzsA5gN9luHUgGJVZUE77SXZPe/aB5ZWXz5+9ZsOtSZiJo9Q5neuSMUmxwYXvC9JvwiMa6gYI9hacQs6rk5UBJ1SEsBsOBbSgwjIjGPfGxTJi3m/0+5p4OF5NxCRjUIp5pzg33q+NR20pH15Ybne6nLGSkhfef2sN5MTS0xajjUZzWJbruR4LFNLh6o/x8CdAmW5J4tlCkszGik3yhbh2Ymnxer//9ubGWLCR1jCTuDtDgPqGQCuN2I0pkg+zYAnUOo54jtB4vFO0w+G/QwAonB0Ei0ZaBayhtQkX7LTiZzBX0SjwxMWo16mBqTL3IvIZZbGg6cJEuEq2Wrlepyk/SJ0Oh6HAThdNYNRPo5PolK/mkckxtYEhbx9nyFXyFoa1QwAx+qfgbrZVqBACkqprC6xKDk1HqNeF58IJSMSiwoRSUQhImPNQTk6xXtAvOmeM0+gxBSomhfaHV9NaMNhaowUgZ9D2DiWPE4Kb8NDwWClTZA6mJ5hlJhnwHUN77SxxJfEl5W1G25RNLC2rMbJDbxvMOcIfIiDfSoBMEDROFPbYhILRyAGDUEhZEV7QpMUxQxTucYHUltB00mmEU/gTWLhfmcfEhFBjaAMhZ3CzCyVQuliUOaVMRTFEDfp+fyeJoqgtUHVWaDOaTHALDs5Da6zjHDDRMONmkmZ5HkcxbHMMfF0gMfHo/a1SWbQtGbjO+4MtztnCzJKMJCAAneCKguSZEQGFlHfMC8qtR4aoqyK/8FCD+P4IAqO8dYwJAoxMIuWaSjpZeemF52eO37fniQ/vv3jpypn3b168srS4sLaxYbWJiD+5b9/umTNjwjb7O4dmOpSQW8PR7mR0eGGhf+USpcQQeC4YbFqgLgCJVPhh5VkBpDAz6e/88mc/+eC9x/7u+Rdfevv9TrO5f7H7g9deu7W+/uEPPTEz19rtb1NvZBTRKC7LwlljGDeaOmNBaeLAri0kuEpQ/iOpAAA285CLnOvCltZoy6XqtBqNVn2mN1OrN4RSpMpkhfkYBCnY8LWSNIq2bm+8+J3v7Z9baKRqOBxBsjLhShDYSeRZxpWQUhLCirJo0AZ0NxTSOPGBJ4xLJpjFVE8upIqctUmaeO9VnIQCBUjBZaFReCJV7I2px8md67eZ4LMLi5Msh5eYCSWbM10Zq/FoRLVRsFSMjCt0YbQGpj1wkpw32nqGy8vwBuKmH/GT0JNiIxYeOSkUvNRUqoiAgCu8axAIONNb0Fz+2X/52t/9/XdnOs0iL9++cPnDTzzyS5/79NJMd3t7rTQl51SXJh/nOi/DbYEzB7Cke2uBc++bqZpt1W+Mx2v9QSx5zEUrTYtSP3Tv4T1z88Qaxeny/GyZ5S9+54WnTjywZ98+2ule+v4PLl+8NJhfGMjIediTUMs516HS5dYQFMGG28Z5LiW8TAbkkFSJyIE/3VlvtSWgeBSorfXcWk8ZhSMIttSwLvPWEOIECiGJD/WV9TIcIS6iUiJSAJB5eSiweIn7QuANUE4M8dprgCuF48E4Ew5yoTZMGdoyhnVQKHjysmCVRNHCMkviHlKE4pcyjW4JD/iscPxLwq0tq1uoiurHKCHKHWXWsUp3SgrvpBAplWi/8DAki7kk1l8d7soobcTtR555inG1funSDy+dvVJObByBObJcidVv/sLnd8ryP3z1r8+UmkLafoEiWLiynHENwleajZbgvjSzUe2hvfuIdxcG/TKJrDGldRrHCoJB0CCGKoeqA3jMnHhQTsE1KDkHGJHHewFIEggPguwF5znhDhzCrOIXgN62SgyqSFgAd/FTlDDYaivpEtw86IfF1hp1V3cTIZEUfBdBWX0ZlRYZcNfsbuK+QEbxXfdRtQEkVU6/R5hNFdaPV4mn05vVV/UAZoCQKcYajG/wbxCkivRrazXxVDFR0eqhsoRpChrdQm0CChBgAIM5HSJHqj/bwnoYdT5oh63Eclwg06pK0kDBFAWsNwh+aNUvM+P8bpbDVsBBAUIFlfDLaDWKgWrGeKu4qDO+VZQGunNc4OOgxoWKTzHvJBPQN0NDDudO6D45TgTANmeRXW7DnUk52hRA+sONR5U0sc5zwfAXUwvrLJhTweCfoP04tM7agDeJYbpZFMXOelMUQkpCSVprtOp1xkQZTskqAZAQPxmP6/WGNRa0/4g6Qdubp5TkOg+FLXB/jDE8Ug4eMSGFgfhZFI/YcLuZvMwLnclYoMTGodWPMaN1+AKF4F6Eah3yH3Wo1T1MqsOBAmq+ajZJCNPOgrOLWW13hNhUyaUzZw9+cLp3//FHPv2p8c725VPvPdpu7Z9bODe5NtblbKt5fN++zTPniXdNpTpKbmTZnf7WY/uWO7V635SMM2MsxjpzGQrKUHWUVkphtC7zIqmljvjBztbRlfl//d/8i3NXbnznhe+fvnBJRuL91dd+/O6Z5559+sF776mlZDwcWaPDDaliJb13EUgzvAW+kwbBGmzXnABlfmjGCtCh29Awxc201qg3m61aPaWCod8OLHecCiGUAqwptVCyckomu4N/+Na39+9dWei0tzfW0jQutIWzm1UAJClgORKOUVMa3AmF+s5C9AkFFR6QUdDdaJylYEpVUoWrOG1yJnMz0RpCFIBVEilVgktDEnr72nWl4kanWxQ5R3IL5c32TFJrTMbjfDwuwmlOkjgNf7qP65ZOxuNQdJbG2EJw7iwGhTEAj3suAMMOQFPrLHjQSSiHZShXHAItOGk32knafOfi9f/4xa+cOXN+ttvmnHzo0cee+9THDh9cGW5vbWzcJsSGxwp0LLos0TKj9QSnWQTRGM4oSltJWouT7Tub2+OsmSYz9TQ2plavHdu/n1gjvO21WkKob/ztNw62uw8+cMJ32m6U/+Rrf7+dRv04skKaIve4PwN2AcSzg9RDKG0MBdWmAC65Bb8mV5yEVhyWijgaC90uvLmwXgovjTeehZ+VYMJRxwlFDwEHS2jMKSeOUx9FkaISV+maeO1chm+oEMbDbwvoK4P8ACTN8mrZSQRb0/na1fM8UpwKj1NV67gM1QkC6IwtFBgoKNL44DA3d8PxUPELdSRMxSn8TK0KX6ZVQsTI9fPOgK8ktL0WwZs64kJCex4JTkUsKJ9ZWIrrrfPvnDqzunp6Y01LBa70cGYNCm1yfbA3N1Or22yTSTkdnVbSs9j5PY2kJTgpzQxX863mOzdXN/N8TPzY2e08c0qG46S6lpyQXJOKto+yG5QhAYIPuKEMHk6Qx1Y0T0IZEMsF5EbAJImiQBpCAyxj3DoHzKK7FH+MJq6Gu9WlWZ3x2EBjHp2vMq8Y3pLYk1LssSFxqco/wKglME9RFOuJ6l6u5Fq46HRTGCVgJaa7cWjk8XevWMwE7ciETCfYxN/N1SfTdP4piJqHT8SDFA8zrUFAb7Ex95Wl3hG0l8CTDqsSuCtxnQqiYss8B0EUdJEQas88ZgBPSUzOa6cxoAo+mAo66gGywyoWHHwjtMohoHfX8Yxq4nNjEiVbUk1ADU1pRVGhzAvIgoiga/bea0BCMIwGIuE5YNMlAag2sBNgBqAvsLxl2kEMNbxCDlJTPGgVoQO3DNxsIKi2+HY7Yxjkz5e6wmkqQMMJFm5KwkWvN8s8MSY8WIzTUpdc8iiSu4NdqFOdMzZO0lq9Hl424oXE3sZOfTvhsTXaAJLMG5C8ATsEwVw0UWnoAirLNNSY8GNnFLOjvTMatoKh8DIQCwrweQtMbVaxpiuACFLmwx0CRh61Tsrrk8nZ7373qUMH47nZEx958gd/9benfvzmIx9+fDAz3F1dFYTsn+3duL0hBF9sNhbrtUvb/dvb287ZPfMLg6uXaaQsNApuutcnnhRlIeO69y7LMyZoUq8JKcssm+Tjo3vmT/7ub671R6/++PXX3jx19tzpV3///L2H9vzi53728QeOMZ1no5HW4DwRIF+0RCipYGJGCNFak8piqF02oZzV03oa1WSsZBLBKUd16Bu8igSlElXKXACVB4XlGPls3NtvvLl/71K30ynH47TZKPM8lQp5JtYZiCBkZTizeyIAAIAASURBVKEjmXApUAQID7ULZzhkX8LXBP5wrMuBnGA9kZFKakkc+g8XqjfOFQX+APFMUUKUdSZWEfdibfVmkqZSSW0slFwOwvNFvdWKIjUZjYosM8YKqWAx4mOfOmMQ184wDggkLZJKIJKT8PwCyDfmnCuJDprQ2xEbqShOakmzc/7K6hf/6ovffe1UjZAPP3z8ySceeebpjywu9MaD/uad28YUXEoI/zAEAoXCdQa/udPhD9HaVDh76xIp27WGJ2R1Y3PsycFaUhd0cXm+M9MLD56z7TRqtNvf+e5LamKfePSkqNVEt3fu5e9fuHB5fWFhyEWpSypYeCJN+K4o4+EZhk4L0lYE5f8vU2/6ZFly3YedPJl5l7fV2uv0bBgAM9gJmgyKtiiTXkhRdjjCoh1S+IMj/Ml/jP8Ahz9QUjgkilaEQ5Ilk0GRogmQsACCBDgACBCz9vT0Xl171Xvv3syT6cjfydswP4AzPV1Vr+7NPOtvIYG1inPeCMBTpRkzznooPqcEc3wPBVmFO6WRJMSSzAC/MqZkAsa3d0l6ZzvrHY5rzhRLXjFbkTELHOdVB0N0sl0Bp8aqAZQCrFWxMisGwvmICUQ5aSixs3raiAI8S2ZtrKNcUb5M3DibJx9HStI6p9hSEGSzLtdbLAkohsY1bPJmHFKChT6m0Pj8pRicNU2fzHIcP/fa3Xe++OVnnzz86OP7Pzw/PjOlcNiGGCkZbz8Zwv/2+7+3M5u/f37uO7+OEN3VBWCmRUr3dnYWzOP1Zq9p9xazh5fnD6+usvfi3MnmessGTjWwVc2iS8A6sjO1HIGMNYFrA45rOTfJw5oRyhSlciWVDgdgAuJNlTVUxfSTjq4VfjdNWalSczRYKvAAuUl10XOdPeiFMHUUUWfJNFknKTAo1w53UiQtCc7V3ExVzMFW9bPJvihBugob6oqgJdb9V/Wg0DitUh0TsQclRZqIsHmCPLPzCq/LEK4SlZvQro4SxdIpujzZaWKVxRCRMpliqfFB5IBWJYFiJw4KpEkNidSvMutkrGQFgvO8DuWTyVkClmfl2NlS1oaQgp18F1RvMqY8GnM6DN6YmXUu1MldXaND2YLVAApQyZgTWxNK8nOKBVNpU7y48p9B/45GS08xpXqsaG1w0DSqZUVPEBJXShVKnaj0E0JK6C79kB+221J1gFvsnfNtI6J0cKM/Aqi0eHl1MYYmxnh+cb5arZxtrq+u26bVabMSSDIWVMOwMaXRKn/ZteCdlZtMQoxiwoqk5XI1Kz1GB6l4DjExtKMpmVLdlw45KgB8s90aw53vkkCeDN/EVZPnUqqoiVED5TxFL26cf+rn93/8k7d/+tMbX/7Cnc999u2f++r3f/DD9z9479XXX3v64jiO29GYn/vsGyW8xHh3Mfvg5Ozocn1xtXnl5s37Dx5sYzJNkhBs55G6km4ch3HjXZsNbbeDa5qmgZoXucury8urq93d3X/wX/+X/82v/+r9J8+//6Of/L/f/u7/+k//xR/c2fuvfvXv/PyXvuDDEErzB8c3B9+OrNPI6BoP0WfropvNe9soAtuW4iPEpmkZAgZwZS5/rWk7Kg0VqlftFsVECR9/+PGy7/q+3aw3wNw5wFLgbhRD473KVuP6iLUmKbAhG29cZeknzMvQAkNGTW3vLVs75u1i0bfOxFj6VOdtDAlT+dK2AZEOUdyS58zjTx7ceuO1brYI44DBkmBPlqxz/WLRtO366nLYDoKRbNc12bQ5Szk5uglGfqUUIczgI+g3zrNuhY2y+E3uuLW2+fjTZ//69//Zd/7mo2Xf/0+/9ff+01/+xXc++/p81q/X10dPH+vKlbnJUlJ+6SLHcRiG0ux5e329zkl7S4EcLHGiZet3ZrNtzg+ePWOig3m3t5ztLpY6Rp3Pu729vT/699+k0+u/+5Wvzg732ju309nFd/7wGxfd/LjpB2NFgmEuFx+eQLZxAtBieVOec4oZ6svEMNcD7MtBBcBajhEgUIyuckTwgfabodx6pxg30mUZJ5vSzHHftA56C9nQEHMASDITD6AIQuw2684Kng3gruZSEqn/GVwIkxq5qLCdtuzWVf0HQgwy1Za7FH/owlU/iSzZMIwQeC8lAhE10NJyau0qMY6Y7WVZ+JnLeUw0hDFiHF46qJxdkpW1IWXP1HjXSbpjml++d/fnv/o1Q/nRxx9/stl8Oqw3VnUEtExKV43/7uUZXZ5R40MpZXiUXO5RSr2k15c7e123Ob+6M1+tuubJ5cXT7XY0NGv8s2F7IcF4B3cyy85iwSpKKVaYVRQFIGUEHMCACA6VXJKVSMQsSts3KIZiKIVmRirIwyqqSbWBpVr+VFOrPDFvdP2TTU2dinXnlwYOVUNUm5qq5G1ezpa1a05VA6sykYh0G6l9o5ncC5FQdVBtJrt7HabnXCFMCKhZYbr6lA0sEszUeathhMrjv+zKq4IbdA+Ra8v1xei4nCG0/4BRa7kAABke9uREDLyWqkJKhsqmwMwLmAj8WwIMjYERH7TNdOwhXhkUTlaaRJDlWbHQiBfVrofVjD1vTL6KYem6ObtBonGsvz3DC6Oy1EtEZGh8q661ggLSS9+lEJLm9phqUZQxIHfspGJ4JOtXT8gMyKeLI1cBcDqxc6pmVyJj650I5MshMp4jgGmJ2JbmXufks26+nC/PL86W88VqZ59Bo3LeQ0eAPHtgAiGguA3b7XoxW1pvsoVHU66cf+HEAIYZazPbpgPlV6rTCJe3BjoBSNLsvPqTd007iV2zIvAnGENVS4c7KXADWR9pjN4difv0avzLP/r3v/m5z0mmN774hcuz04efPPR9/9rd28Oz56PZ9FtGbJLbqx1Pj19cXp1er99ZrPZXi4cX575ptiUoQ7lFEZ4Vbqin3sDfOY8k3jfOliNwdXl+cXnRdu1r+8vP/cbf+a1f/5Wnz46//8O/+cFP3//o4w9/9W/9wuHBnoTYWC9GpRJKkeRyy+Wkh0TZt42aISSJxhIEqdumaWB93gB/pAvf0gJThBqpRGinxI9/8tNxsznY3y19J7TQo8S+7yXGbIQd16mSqXjGrmmrejCbNP23utwBac2wG7cx1Q2VZEpt12EVAeNVKOUYKqXdBPlWfhtnzjHGo0fP7r7e+qYJYdTFl+rulL/c+gWvQOkKMsQYBvA6jG97xnyeVJoAULXE1BCEkm2JYlWdDHfNWv/48fO//vF7X3rn7X/43/7mm2++1fXNOA5h2BxfX8BbqVRxOaOjxlbZsouleFXSXw6DMueTKxc+p/LoeHdW+vcXV1ePXhw3RLdWq8PVjioUL7vO++YP/vhb7dXwG1/92qLplvfump2dD775nfsf3z/a3x0ar05l5XDj4EPXB2xRq4yMrMoVnMlmuAeZWK1M4bIJkWcP+Bkk4p0rpTEyauNKSoSqVOqs75kbmx3I1DDxkHWMY6nrraiHT6mMLUFgwFiv8jVc2jDJag5UXi0Ij6qIWc3xCFYE0SqoCS/PwcZGrf0IJqEhjAyxfUMMT+Kkvv1QYNLhgrXQZBa4J7Vsx3HLvisVlYxciuZmTHHM4aBpP7vc/+jy1DI3o7wxW/69d7782Vdf86ud5x/ef3Z5fj9ugit1OWAF1ohqMWeyrkRn/DbOOaaQRRZibnTdvm+vz6/n1t/dWT28ujwF7WXWNi/CeByH7GCIV1opNLewhan+QlimpCSsqI8EUEBGOLZK0RC418AsUsWUmCmWWMspoxSwWO1aTKdztdDIFYNeiQ11qFvpr7ka25Y0A8qWqfmzFKQWm+dyYnL1XqgKlmB+KmWtdos6M8ZvBbQyQE/1CwCmnNQstXhQi4L6pzmbCallJtthNGJYD2SgI8xLRZA86XThuqL/TSYacRiqxQQ+bokOWWIs70yzKMNOWMdsKgbOVvCjmSZJ9DzB/JCPAbhvLJv1sE5JGnZgyyT10yt1UPn9RfF+KtCoBv0M9DVUzBylGCmPaL1XTbPepg1kFxnEKY974A08olF0RrUhMzmk6CoZQ9WJy6dvIA0RIBCDeMdRRbJKVV0Kh/LhmCSGFBLs/SGyONkzAnWZlNGXorBtyKa6PSBgG0mcV7dkanT3RunGwSEz+abpu1aBBsLp4vp6f2cn5bTeXscQvffrYQ0OTwORyIatA3gzlgZOF04gPKWgRqR1IBbxNGymUMr3ZEF25ApjKV2/KzctxWQ8Ka6hXAtvVSESC2+ooHgLKz3iddM+bOfLH/zw6bs/vPX1r7eL0zs3DrYi77//wWfefONwsRyipPnieth4717Z21kRnV1fnG/Wztq7t+88PT/NCcZQkgIFYGEohOicm/U+SFTfHoniSwkfcvmEbTldRBLC5XByfpqctSvnf+OXv/6f/dLXnj19rFMdAnUZm6VSxpgcAK20OWTvjArWl4a+66z15Iz3LQbOLIgXTduqQh1BOIlRYdEYP/nww+H6emd3FUsP6oyzaajKt05XI2qthtERG/LO97MZeNSlQIo5eZjVaHLOk7QewpEoQdR5N18uTGncs8eALhvjGpcwzXXeZkyxYyaXLXubJRw9frx388D6jrkS6FKOpvqqWuc8z5n6frv1IrA6ZqAiPGMWlsDd0+JXJzGlplSxCPyBNcT37t15+wufa9s2jsOwvT5dn4F0ZdQYTSDbKyU6oqCUhMEBxRSsNeOYxlEy4LulcAtiYuit210uLfOT47PnF+ve0Ku3byz6/nqz6To/DuEv/+bdHfL/+S981a83O/fuNDs74Xz9F3/ypydsTrpWWMVleUwRid+BtMFqmzNKiOPYNF29C4rSMpw4QQAQqMOUHBsg/jNsN0v97ku3anIKHqb3nlNvrC8tK4WU1jFfQzcjZCL4C0HiT618OEcjVQExYnodqWodV8JJ+WQOYltSBSXLM46kmHD188uVhYngAny+hlDBDj7lrApLJQBBEkhJdDFGW+KL6ay3oLhsZDuOwVrnjUM4ZWeakNKjqzNnTGf5M7b9zXe+8sW33zHzPpxfPz86+unZydPtdSxFp0sphQTvMNV1ySKYvsEgIVKSPetfXS5njjcbWbDdXfSfnp19ur6KZGZtexLDw+1lcJYq8wWMXtJKHhLLQBSHWMqgVF+QSj1HhCSQPhPFHHPl9FSLC9S3JUc69WRFOi/xv/zeIJ0YNczAxL5ClNPLTKer2WzULCC/7H/Vrp4rcPqlqYJaAFNFTBuIL7MmNd1pTnW0mlpM+9y6edAu2FRP4uqsK1Q9GnCN80utSu2RdYKNYtzoBAagRR3Tk7NWsNRkAmAV3STpEEt0HZkthiVMJWiVg6jb3Mq7yNU2WbFzGcUMun7cYjzKRJYgIBUi6E7lQ3vrQlB9ZuhQJ62jgCYUaUs2AF0NE4WYKDkn2XjKTU6jzpCMcdY4JBk0eKW0s75coRiTsVnlLBKmHxi9ll+/lMC4eJY9JDaMSHl7BHCiBPFoH7GUVU0FwobJ6h5CdJmcsqqsJ2XVZ+O8hfokZl8QkMyT8SRBm35vZx/zsnKAYgxM5X+HOFpjj46e55xvHt7cWe2SNdZxCgJaajR50hZm4DIqIkxlwHMFAaY8xsG7Vkfy6lBmyqNVdW5YRJSSvfy5+gYmMZFy53yIQSi3KAWhomeChGToyDcHV2d/8cd/8ptf/GJzeGO2f3hzDNy4R48f79+8sep8KC1WKzHstv7Wsr8ex6Oz02G7uX37dvfhB5sYyTqjFgWcHZSFUkQxwYRnXooG550jbxC8EpVXCUiLYyCph7BZX1946w+g06QYOmINytgRiLNeQ55CXgH98Ba9ptUuTzlc3hrbWoNlXqnMJahxPCd6eP+TcTMc3jwYxuC9lxC9c0GCgjLLLxEi4HJOolAyjW9TEu/Ye/VZU/F5W64Ma20NtKv62JTjZzNEfVvntJwn9KeqZMal3B8RjMpD4tYI3HCN4TgMJ8+Olzur2WoVQtBNELT7BPkmacDzrW+4KR1c1MoGvBjTZkZcGUeY7hD88i188BJ8pxkIA7PZXK/XV/hcRuEOGbdJJUVyiilGY0AyYA5hjKUjJ+P8uB4QwoSNDTJAqiruzvp511nnnp6cXIW0vzPfmc2TxLYtDfXl+cWbt2597d7r9sWpb5vl66/Savfht7/3/scfXi5mg22iGEkSJBpnJOM1EUsQ8mDGlE7KaV0D6CpGXsA1RBTULVos9V2HDQlLGDEdKoUazElp5fuW/RDDJsqlhHWKY6LSAbDLRoxTXoCF9OwkUqhceXYJjghoU6vfgEZSW5phUbYLqXaCut5hF6BoTbgWwhBCEnvGrhmPGaBOHW0ao4Y0wWJ96Ep5Ki5DbQk/PcVSF4YYvfG+RGoahwCxSu6YDkP+2++8/aXPvBWd4SGc3H/w3vGzhxRM04AKa3QMa9CdbPOgIrnGlnxgMy8y3+v7vbY5Ob/qmV+5e+fDp0/PRQyZRduckTzYXkfselDQRYkBCFAjJUUKNvQUU67pEWoQUM8U3yg1kYSqOoIlq8b53ukkv4omGdhOaNhVz/kQAiYxpY3UAeTLpIb1TYJPXxVIUp/6XCm+VdYDYyXdG9e8OCGjFYRbhTYqPFsNinMVmFbBDtXor+oPCv9KEyeJJtUWfDQxKkJL0+xam2LGHASjcdaFvoo4UdVT1NkagnuOJtZGlhRvrJsNxUjD1wE/jyqCRxWhym+iGhSV5lRlIevMiC3kait7qY7aAc5klRCf/h6SgCHb+gmthgFH+dFpK3E0Zm79wrbbGMTB4AqO/KproUUGGt4JtmpMDFEx1ZioCwprlTqwqECzTehxMMUKJS5TCKPBLoN95WcbCCpgFP9SWjTXTTvUYqsGWHkIDnR0nYKoVQcwxsZ4YDsFa0VvbYn1kALJBId8MtbapnHJqJupDONW0ZJgJFXrZZ1oWQdMP4xZkkRrbc4UQ1BCYSmtSFJK1lWbChVHNVpCpordT9lsJRiJDVup0yOTJYPlaDeufdEt//pvfvr1H/zg7i/+ws5rr794/OTO3i45Xl+u+1nbM+fGjTl1bXtnZ/fT50+Ozs/W682Nu3dv7O7ef3Fsex5jtK5NmVIQg2V2GIJtWDkYwOEnzqmxJbexs0khbbHUoQSvSvYt1kgYOWCESHDYVrFf3QyUotU1gJNl6xvbeAYfDVqPTm8lCNaWULuEEC32IznFk+OTMA7zxSxJmvezXP7YyjCUfOgbGUvUN748UJ1elZoSUcx737StAt+YLRDFBIFuyLQqlt5xqiK15QN7yA+pGKpSvWHHY9quTbpHYqPrecQvcb6E1ovz85TibL6IivJJsTxNtQZ3pfnGlLgEaHI5SXLs1cNUu0LrveJaXcNWa37nFZ74cqBmrcf/woROY0rSmFhaSQQdlaEyYYRkHBsJadgMGg2Ufk0x+Uy3ljuN9SHEx0fHW6K7Nw5nfcsSW1ce/r0bh4ftnDeDjOHG25/3ezs5pHe/+WcvJB73XXY2hvJzZNLwAc2fBxGKEUbWMPsApb2u8gDjhuN2UhC8dy6OoUQ20okJ20xNiD3TYTtvOIcwhiTrOF5luko5shUV8UPCzDGZqpuFD1EZoHWNxbqZzHX8idUPKktlKECVT5dxaPty1fhX34FJLdNru1ceSMk8m7CxZPquxY8vHwBNe9K0bTGxY0VRGHbWRfxDyqA4lKrSzSzPnfVR3lnsvnPvVZk3dt6Pj48/fHH0g+NnZ+X+MVzm4COrm0XV35g6PSO04+wb+/st0cXl9ZzM3mL+8OTFRZDG273F7Om4/ejsbNswk1V/r3LOvVXd+2xqdkzVkAPKGxMWAsgoFWitXju4+KLDmagAHeaXObGkJCUplYQtqmYPYy40EVgtqqdOlUlDqoIFkM52WLvUie9kJ5w03qUieBVjNRGMFEOtghDK3K97X6oUZqy8JvAW2lbtflK1W5r4y0pAUjs8zYVKXMPvMkmPTQYdOr1G55FKG6ENeqr6wIBvZweNGbVvxKIQtpqZJrITq450BTTbyaoJYy4oFbGem4y/13ZtP2sVlQYtF4IhnpKXM1dxMqpDP0BTdCad4Bw2JhkkmJTnrumAgXFsWmO5ik1zyiaCH6oqQFiEZVU/hjyQDGGEkaJTzy2tZkDPZ1SuCU71xjVVWA6JTc166aWqLAJDYqtjWwO5OcyRQtXD4io3nTUsohg3qhoGc4VSIzW+pVhixNXlJVu7XK6886VGMdmp17Z1ESnfWqf+vd55fin7adTtEbgbRG5wCqFby7xZr4ft1jpbGQGoWCE3VnprqI/VcUw52aXdz4KNF9C25dLElIX5uJsfh/juN79pYuoOD/Zv3hwurw4Xi/35ojW8mvVd49rW9Z5vLucx0OV6e3V9zdbevXHbjMKSoYQbjSgvkHRpXaoT3QhE3aNHhTErJSbDRwCGIbVqrTAm70sfhjAHllXjoMBpoMlb/qhrvW/7+dz7tjwryHNi1J2t8zo9sCpgY7DYy3m4vtpeXS/6GRnTtOUoRTSaAlYikDXOtV7TADrIjEdkrLe+a53zpl5ggH1QuegNszytlErnHlT3yJXKoLRaxrvqWMYMLA3GrCpILtmyb3yrIAZMis3men19cUHY6Uo5FeWgE2b3qnSH5wD9NgtFnaax3lmM3J332Eg0mAaANcW6urHq7cK4ZaDFVm0DdYUpXTrsC2Bsl0vBEIKpsLNSSkVR80ETSwnoLNHMub2dVel0N9tPX7zIRK/v7/etb3zprOfer5quy9kNY7+7s3jlbu66x++9994HH521s+umjSK6XVDPHFCXJzNsVQ8QYEUl4CNb2H5z2/qcsjPcN23nvSklSPlv3pKX2K63dxJ/ZXf/5w9uvDFb7DR9tO5EwmmWyyzZ21yrcQtBDpIEWjVlXDtTtetJF0Ao1THayljzisRq9a0RG2xjWMMZjJynTgjmd965tnxu5WxCHcXaZNLp1cXp5cUIjxCLmsmrT7DKNQk11jeNN9NqMYaxta4t9Z3NMVpOjrKPcsjucwc3d3Z2cu85yvXR8QeXJyc2DyGGBJAmbAygVFVygQcFjoi85B3rDvuWJJ2fXS+b9ouvv34+bo+urqyhRd+ep/jBxfnQeDYWNEwVM1ELVgMqWqiWWEYrp6SJsKZdx5AiqPMEq3xOzRz4SOhJqhc9+ij4xQEBpCZjgL9piZr1XUzuW1VjQ1M8Vdk3be+AAVB0dJ7QUQp/SbXyzDUHv0yhmhiNmxjCioPWGV6dQk8WGWKqTGjWsRcIAdmUdoJU96zOTuoXTrhouFoCZqbomxxNstrGWcvkUBnBegrQJ2xJ9Z6q4R0aKGuwzidb9TohaFEqfYwXtCrBtr2GTzCddZpecrPqQ1YoGng/VaAEAG+If5rKmIYhmEmVmI1HmJJ0zs0MDykSRhoqOo27kEstn6q+OCeMzJkjpVHGnHNbSq0GSo2YmhsGWED9A1l0SqMNCqPZFPWOjJbhI6hiLZVbTQ786eoSifFOSdiiUTdaSPlIjFy5fSgLCFxkazHchiIdwNVd18cYU04te6q7Ol4tl1OhJjmzwL9BK0D8c2nWRgg3emsh8GsT9ORiDH3fqR0pemwUINUWw1YpgtLwQHNUIXsQ2TY5OUUXZ4qcr5w7a5of/ehH/9FP37v5+bf23nztxZNH+Xq7s5hTHEOWLjIlNs7fXi2J6PnZxWazoRBu7h3MrT8bApsW08A6mcux5FpusUOSSN6lKNaTcapxTlwqXoCSgCUGMnDy7DIgRLJWM4ARAZ7K2cAM36HeMkZHlLUQL7fTGadMexjWghMleEbjsL2+RoVJXdshqEYLyc9yPKLLOYBjrAskS1YsNwY3IoFTUKuZrJ/I1QsOTrGSCZLy8fRaW4iWO9ZdCXhuihqW2iRVbjzOf+bGtVBltxnGY9vNdU5iVUULcxnAKIzy6JLJYhLQDra8R6R/q7UvJV2ZQ83NqHCcCszjgVEVJYbSk4r/KOArxlGfIGxGy7+O42ASScD2JKDfga1fzT1j2IXXAxs+vrh6eHzcG3Nvf8dThpJGs+pmC+O6McTtcPcLX7D7e8b5H3/jW4/C9nx3N1kvMSYYlAHtqaZhJbaAbuR0flfJnWCoWGu9t+AEQoxYnwDWNzSOXc63++7NG7dut33v3FkYnm2HR9v1scTLTKMOSGhSuystjRgMobOw+mfUVRMk9NDLmeoHizxjIXoMi7jyQDX+UMXx6FYyKT2tZBeF6RqnJvOpbvQRkI1LOW3DOGtbouz0DaDMQTVVDivgDiwpMny3dI+coFnUZFpYe8P3d9gfLJbZZG6b9OL64ZOnTy6OS4Uy5jHX7jBKGmH6OgFBpCWz65tl412iq8vNbtPu9u2D0+Ojy/W86efz7uH66v3N5VrddRkQdOXglO/oyptPkTBWFhHwiZQekHIlFwmkFzQI1bmpYhkxZ8hO+2Id4OrWVJmBUC/MEfg7Em3kCLQlU+0TKk+3IphVMl+9FRRfRWR1C4hUy7UjBjsISShPZh3pJdQZydnhLxlT5UkrdGtS4YC4luKBkr5U1biplGLFtdKkcsm5Snygp1BTTKCr0NYSA3eHmwlUVMa0ElxakBqxUMbDShHO/TCqr6Dw/DM4GXiluvYi69Fw14IIPa2qVkEVL2M6Wh+bqYULFiHQqxXsWkqyE+AdVE5Uixw2MD5j6jLNnF1j6w55CldJQQrxQw0CSo3AKyY7CyWvCJ/E0vXBKR32veovJnHI7IxxqiCu9M6QR4nRlvapAQjOhDiSSb6cVayngYjBSAfUT8dDDk21I9BFfoXHTrsi3etAMQKri87jxkjqZ30d0SPV6mIBLC9MApTZgkifUjCGJWbH5EtdMCsxNwoGFllHP/PFoiSbmGx1Cs1sXUzkEsWUvMfhRXkNU9TcQPoD8vIxogEsT6wcjvaimx9t1u9/85u3PveZbm/v4N69Z++9z33bWruV5HCw2OY7uzutt6fXV0dnZ3E7LpaLG7s7Fy+OqLHAkjLzS/F3KL0k46xXScEYyJXkFBRWgU/MsFnkKmlTujWrD5JrIhGGMCSVcrrF9CfFBIVU3CKVGY8SGIKFqQZZNUoSq1jkOCbIhLXzVscJqihakmssTbp3pZORcVR8HoNe59hJyq6kfA+2Gk2e16z1qhbHSQTO6zjz1gmAL5iIO5Wyy7rPSdD3ZqRZIJkg/m9yjlIOJOc4Nr7N3MQ4ltoFATxIUvOEKnKTFEMCTRgFi6EutcS6aMf+woQU1e1VGQtAH7rq8qFFvsGGrX4DKUFfodoQbB9DSDFJANor8bAdYww6PNQOkEK4tbPTMA9BHr44PVuPy1m/apsUpHW+YefJ2kRxOyxv3dh99Z7pZ8cfPfjxD3540c2GWY+KypZuTXdtXBHnksCiTZWpoX8I2h5LSnEoSRfkspKjjEQb44r41fnOZ2fzt1Y7u/38chw/XV/95OzkeYrnIkMp2yGVXeJ6JJtYkihZAhQBpyIHJQDaGLUox6t3LgLWaEtxjiwDxAKBclmSbBQMDxBikPFsqdGBLwEgIKaIWYAOBctRaWyDUp/KeRWUv5zHOAA7UxK7t85mzkBOsDVC1HCdhHlnVuR2Jd9r5gdNt28cBfAaiM7Pjp9cnITyGrW6LtEd25RylYxGucQd8WHX7/V9uBoWxr5+5/bFdvPJ+dkY40E/X+ysfnz24r3rq8GWGlexL4AsELDfUShiCGi0Y004luWqltsjRuUtE5VmAQTr0s84qyhQLN0o6OgtM1QNCLq58PXFDU2qMCUqWowqR98KpsoAjtRNqc1GWHsN4oz5DVcn/jqdUIDLhKOctCqrSkZ185ikLYFE16s9Qa2Tcs8qsIrq8LSmX+VFlX8DDC1xdXeqxvDVVhoiF/DxQHGO81aFCZNuYSF0ZqzuBCy+3IMWq7LCjGweUQFxXeVnCxERm8XV1gNeKCVjG9gBACQ6IcWQX0JOsaqTq98ATruURKDKKRCFQUOp8zIg/i2VMt+I5YQJTkOpMZVCYMD3w4hREf8OWSo59pzVzTuGECtMDGMl4OIdDgHjvXtgxSXFUpGR2nRY23aNIo3VZhHPRjel+iJhtKd4Vi5XCCR/k3LA9jHpylhnWkGCWjUgf1CFcRKNYVxvrvVVlw+GWgzsUWg5lE4eX0UmxLgdNhowxxgv15cKCESnJU7N/0oZGlQ3XEF8TE4hvGzKdVSXPCW8ZSpZLk9eESHJKABAYC5ayrAUT5v2fL748bvvnn36gLr2xptv+J2d1rrOc2dt4x3a0LjX94u+P71ePz46Ab4pvnLj0IqoNbHqr2HYAE2CEp+iNh0g2UtWNwtRTxolRznRXbp+iWgfDPxRTr5pYHsMaIp3Dq2odx7Ge5DGUM4ArgqrDgBsRxSSttlsNteXOYGmNVtA1sB4XaCw2jPShMc3OgaGZiHGZE7F0YxOZwBCcXqukM/yZLFtvGubtsOcKeqpSzV6ANOMe+dKRrVcjU2hesXVdy1HgbySU82d0qM7u9lsSxqGV0oVvlYhVdSRWuo74P49DN+yim3pNtSxdbDZMjpxdSo1ZeA/r6M/jQMiKQWgW41idBOwV6G6a2MKOg5juTXGxBhLMrA8d35nNo9BjLHPL863RKu+7a232TS+KUFHAsXojbv75XfMwcp03Xf/8N89G7eXfRu8U10zffUvvbvxwbBeRYZ0zN6qgCooBsbCzgV1XTnfsRd5zdCvrFb//Vuf/bXXXrvVtNvt9qOrs+9fnDzI+dzYLbvsnFAsv1Gp+aBzAN6gBaIiZ4itl2bDq6s7BjGmtODlEQnelDoPGsQJbWWzjmRYby0WSZhAlTxSTrtit3QqpTKoYPAnEs7ZZorjGMKIuUT27Hr2vS9db5SkP64aRoggf5NNsR3jFxa7v/LGW7f6edrGjuxyuXQ7yzzI+vhULM36ecqapOCRA2UDSTGiZOgM354tV87T1fbN2eLtW4frcXv/7HQM6d7O7nzR//jk6KPNtbS2amcqtFPLLYzQy0lzLuqF1iUqsGYxwUFDjYvxf5ZtjqQBVKtSHYlxRgmtFrXYnFo4MlXd32yqLctkCKhTfaspsBKQ6OVPUQP8afyjUwYdRKid40Qh4ipA+XL0Y+p0VWHNk4VJVv3CaTn7EkL90nXYTB6FZvoIakWrr0pxXHky2I2k3FyUWogQMEbIUroESD7hY2EOqQgkUHdSrFxlQyHCRz4bh+0LKyjAUMPcYRxjc/aGTQm7hL4jw84JbppYzbKxYDFZCD9HpJik6C4V8iw1NSvATtHRKhdCuoEGQFe2MhrnOtf01lXRtIkeBipUTlIaX4f1bSoVlmy2W4mxVK8laldJMZ7UtVUzBNDHbPBFEMcAqgzTgpQiaqLkXcOlNYSDslUtkNR5Dyd+A+GekFQBXKCmU35oUJanL4VhyW86IYyQxQAIzkzb5dols7GKq4Y4SfnNoPqrB7Ji5/pZ69tGxesCXBxUw53YbLdDHEZr6ilKlfNTYkdSgXq9lPKSKgNiiW4xnSu/tGsI7UXpPNr2tO0eXF3+xb/7Q+N8c3Bw6zNvhu22Zd9bu+xnbdtY5nnX7S/n55Genp0akFVu3ry5aHoK+FjwkAbpVkqARjiIIcIyvlq1Ts4jVToqZ6kLXtQllVOQVEaGREr+dqimSwyFrKQuNhprrXMqoc2AENSCQ9tfCBukECFfL+rvXQsow41vjMneKakaiEsM7bXBA1bAvlR8db6xDrLtlNV4asI9JsrknYc1TiWHlh9QjoBNVUQdcx31msE20ZJVn0qdi0mKKkCIqboCp03bdk3bhiChNOVVeE6qzkBSnWTWYGYxaVJwH4pURC6rtTqrgms19CK9JUpmDCGI0vOYJrJolu04juFn8z1jhu3wUiIxiTTW8TDuzhe7y9Ws6Ybt5uPHT7ZEt/f3Fn2nHb833GTiILt378zu3jHzxbOffvBX/+E7T1u/7TupqzYQFuB5FtXmKU8uYxNkAd7DuXHegm2KKUHykhdjvJPoa/PVr9165dfu3HtrubIxnFN+9+rs2y+e3R83azKh1HgE4CyAimhKEgbsxqn5IDw6SxQA5rocLZgAln8VhYMYqFhICtNoWtGLScWIgFwjr6YzQNCWw6mj11xbI0h4wWoe8dez3V8sO+91TIwinzxWKgAxZBRbGT6DpisHi/psb9n26/sHv/Dqa2mI5+t1TPHmcnXzlbuUSU4vKOSrYbsegJLDIU3qzAZJyy7zXtPenM1n2dy23c/fvPPqjf1riZ+eHPdt88rBwcbxu+cn72+uNlaZN0YVmI2KEdWkJ7n0njZrn1XCuEOJrPUel5Yq6X8s4U4p+HkyhlNeKFe7eSRctT7QKTEsgbHCnVbLyisStaZQw1VOFcn8UriKFJRb+ky97JpWqz7kz0gKVUpLU29VJqgiW1ULmqpiZF0RazTlCQqEKQ1pC6HqzQm556UdtO6LJ2if+mLWvUTjwJBFR+f0BQMaru47pvapChUyIWCXKkmvahZFyasLfTZYB0C0PLk6acc4Fr9zkBIRHF6hLZeL1So45Rr0tOTBFjtbxyR1MYD+Wf2Fqv9Ekqw/N0gc2QtSe0t2ayRESqXetJLUXsGIRLgK2kyjgn+7rlOEj6iXRWldVdQss7OKGpj0okuc1KawfFTVr8F7pxw5l2JZafjY+HKSWB4GhLTGCLerEHrfYWiUIMZbAiCG6voWEpAWkGpD8Jp3s1nXT2lI5XbACtASu/zgdHl5MZvPHWSVdN84htB3fcTSxaLxeql9OuvnEdThCeUn1rqKIgYngl6uYrAaRslUTqs6G6aUhjBaa7xzEDmSK++f9PO//vZ3v/y3f+XWV7+098brF0+fjOvrftaHlHp257Jholt7h+8/fPbw5MXV2cVee6ObLw93d86PjkzbCO6qQ06SLOM4tFzicgRmFSZi4L1Mjq6VLpFS5SJgNQrvbjP5WjJG0EibpV6RFKJuggVpTY0vsXMDu1L7RSndnVHxTm7H0oUnXwKfru5UwxV/j3X5IpACEN3PKsKmxEGgnlP5PFz6+RhbUxJzilFNnCVRjOI7l7JIihaSSeXkoiYoDRRaXVWqNPUaZxy9WiI0TQNwh4lhdNAHzTCYzZT72SybPA4lm/imVBsRypATQhCQA1cZUMAjlA4S6AWtvUoPx85MFm5U6RWIQdj1BoU9gppPKce43SrKUpSzLGmz3jBmqjJGLeJcjDf29wGU48168/jkzBLdWO3oNpXG2LWdi7KzWt79ypdS03G2f/ov/9XRMB6vVqN3FMH7TzEkXYwmWKgZDJGqSABoRZ5g7K2S/yZlL8lK3PPtK4vVXkp3ffv2zkFr7bOr9cPt9gcnR+8Nm2Pnks6bgWIDudaZCQwl6kBp6pALTVqu82hVdsUUCg6PzjJnFpbyTbJq5pdKyFZ9CI3qMashqZm2hrqzl5SjxAbKB2r4X3qGZPbnCwfPfdKRGWJwTEF93iAcqyYDJYR44+wYD7398p1X9pk/ffLsaLMhk+fMe8sFs10/eX76+Mmjk5M1pW0M5UZIwLXPfdOkIK6Uy01L3AvN2L65f/DG4c1v/Pjds5S72aJtm6ebq59cnJyxEe8VZwovXdhGxDoRAf6odOdZSg2UnMU/orPlEhBjUKcTeN9QpemV/AGpT+sZsrga7Q1G0+g7sSS1BKEn1nhVCQ/aESvTxEEHCWladCGbpsxNWMMpMMpU2Z+ss1bl4Kj3UUUvKPhKbe1f+lhSdsrwVRjJz8DQVMEHKkat3THqbQWYlPTmVa26pNVS61mueAHY84kif30JXSVMRBFOOp1P1jJ0hbSUgatdUo0BqgB/JE0GFxgKCDanUPppdXxNCYjOchCDwnmqHSsJ0BQYf8skuYXyO6odDWQsSyNUnr2zjaKTMAuqexS21VSn3McSYe2QZM6mM3xdhSR8neHBdQKpS+HZzoDxjZCkSAmhl0gTVn2FqB+r8nyyVq4JA62gH9iyvixIcOfktHZW7LvCxoPoQMNaR0LCAmKDtE1DxiadaBO8eEH1tuqsAbg0VDEVpa/Nvy7fGE6MUI3x1ju3vt7sH+yVBgVd4zAOAXVG6fWdG8cSIhvbKqYN03jIkEEYKJvax5WfldV1HgVOYi1jcxargjjGSECVYqx+nSGKvnvezp6s13/2L//Vf/fWZ93e3u0vvPPgL7/XkY1sm5hcIBni3Z1dJnp6enFyfLx3+xZZvnV4+OmzZyPkLhm2a5pgQ4wNpdLWWzB+S1aMKmMNo4VkrMPyXjCkiqXUgRugAUU4JQJO3FaXTuQN6+swvdSWpbXVZwx32hzhyKF8gTqQi6O0oIFBx638byJM+9Dp6gSCqskSA48L3XDYLZt6easeT9Y4kqYJF6lqdyWDWu0eqvSdulHrTNtUCl5pkihQHQyQclhZQWc+om1y1qnytzUcJFrvm67NKsCW4ZiCATa2VFjKic7tOFdUap7EejLWHDj5KgWLoSooHZGA4wNEHON/EsNmO45JpMq8ow6+vloLGuJcuz3ncm4z3do/ICLv3enF5fPzc0O01/XDdlh46xLNjWu8u/n5z/FqxYe3fvDPfvdH3/3uk66LsxkAOgSv2wSZOU7YZXLVaIOREVbjXot4QGNNDE5kz/tby52lyQuJvaSunz2/Ot9KfDRu37u+fpZlsDZ5GwRVrVF9UqRiXaxh8WzK09ctCBOs0eG8Q1h+x8ohIk4KONIwDmx2LdTEWFcKhSykGqkh4L5jXCsVlsWN1bEoqY0iIIGh1IzWSggW9u2l2cY6HyJz5X06boAOQNmXZNfwG4eHB+VkhPtX6+sYrbcr9rfnu/uHN+Ll+tGnDx6cPD/aboPhalYTStXVWdvbxnBqjGmIV7bZYXews3pxfvrR86dXmP9cpvDXL07OmNaWRZel5YXEDFyw7rkRyysUFHAHksy4ZaJXUYGHFRJkWK2pQU3BhayixBjKEWgNpEaCdsKwoX222hhTafmU1GNezo+NdxZr0FLm6nxWsc4KXjYYmMGsR1QDUnT+bKYQocxFSB7Wa2lgwZSqgFbFrmvVoGrfk25llZ/PGkm0WwfGSn1uPRrXug5MSn2uP08wrcJ+kXSmY3WuAHgfpk0y0ZAmAD0oU+ilJslITGRKMR2jY24sO0qNodZwR9wTcYhtNo011mAcjeWKqYArxVFLkpgFhxtSjbqrcwaEvZS8Kl2Wqk3tOQ3kJpOehUR5K7KJIec8d27pvLcASEgs73UM49U18FFwZtbhG4BSorYFFTtuE7IMRta6QrNRlwimml1JFKv2+1B4Kb9QqvUYdEgAOtmONlVimTOwoMu2cZ5gtNLYBhPmcnuHGKDNPoGBYooxgEBstnE8vziP44j1CdAg9VhAXFd/OWxPEX8NdIeka7ryorFIlxSc9+WipVFTnGMWiclUe0d1gcQxzZbLuwsx5cgqbAv2itPRkGQ0OKpjDhKVwgnDfPFwtfrwww+/9c//uWlm81deufXZN9fXVz7mpW2Xhn3O93ZWM7bH683z09MSK0y+dfvmsmtZkpFkdJLE5B0GKsiDEnX1aCaGV5IYcB8lhRFrEkCwoHanOMmUVMiaJ3wEYAdcx6r6sHSQi8uj/lq29NrlFQANiqcKuD4A0ojsKKXQJZMqYjhNRUnJFjwhmSt3CP8PxjMYYrNiLXWig7xFin5gwiTGatfuGMq9mDNCzQYhQUlfKp2ohr7G6RQHqBuTRWmXpfo0BIQLhaS60NY5KudRqrQOe1Nr9xJeYlL/dtbNFZk0sXqyFhOK5vRqFq7lsg5TUV9GiWEMJmUH5CWuZPmE6+sNSFxGbQ0sZR7D7ny5t7fbzLq2Xzx8dnQa48LaV/d3GjY2pt4YjuOt115bfebzvHf44b/+t7/3O79zP8jxbJ59p3rJWa0OKA/jmIwa7GdQehyXN0W+crRMDoML4abzr8/6O33X5nR5tdkGcY2/lPjD0+NvnR79xeXF45RiM4vGZeus8znncg2NgIhtnLoGZ5IQdRGiFMS6pVVtlaqrz1hJ6EZLl3WsqC0seqxKDZXvWb4iqlm1BlmBP6MzLqvz8KTeAGM+A0BWiT4laGAcbth4RqqWZIEQJQ4pR0vZB7nF/OW9nbcPDzKZ+ycn53GwbXk4O+y+dO/1zvkXz58/3lz++PzkHMaqi9m8yWbObt/3B0174P2eb+fG3rDtvfn81s5yPcrJGK8MUd/fHzbvXpw+o3ht8lj6qBQJir3IJxVra5wK7GcVuyACESWmFMqrszrFYrU81l0GStgE3JxRSLkuMliXbeDMqy6NIn8YgLFpmKto2lJo6jZEpWiUp1rH//QztY1czYjKa/A645ssBKs5IZtJOGsiYk7UItSoiow0jiZfJXgkEE3fmqaQI+VETubvSBIJDQ+wLlA80O+rGRpXK8L9EvQvVi8HySrapFvQhMKhXFqv83gIc+o0O0LRtoERG94scKmZ4G+QW6Q1m8IqxpW3pzG8gM+MYGtW/ZiBLNcPyz8rKaikyZKxGBCQbB2POYJbYSvpIJXk2WA1L6g/A2M5l0rr1OW8Jdpqfzluv7zY+fLbX/yj9/7mKdaZJWSAIBrHkb0JEpN2djCPK30zA+9qSUfFIAyUSBziICKNaZU3K7pAzdkZXzf+EVbclELKbdNl9O+lOYNmZA3VXBoR0jlE+c280qsMKiEgt0svmFJazldZZd0VzoqcEEXUVYQMtW3Xtl2E5XPjGsF2GlvnpHtQgvizwnFyFKgZc1b6AxZUKYtnl0vRXboZJep5dphLpCQBo7SSAqzzyDoEGRsASDBsPZ/v3A/B/dm3XD//pf/hH+6+/aU0yPnDTw+bxs9mZ5vtvuGD1fLk7OyTo6O/ZTgnWaxWu8udy8tzxfhwUxrcCEGr7TjOZj3E7a3QaDg7NKnlzSfdQUTNCVFXjAYsTM7WNurulRSs4FxGvaXUn1JzlIThISgRPIR2JYcSB6GYxCaP+kBI7WoSc6n8KKlwINWbrBx3phzEWScBXG8de5boW+p61+DgQ+JLcsjlMMLRK1HlFMJrTc2zCfqZ+B7KjPfq3pfqAqv8TWC1tEmwVLJRKa3Up3ocx7btSucusfS+MIfJgL4732SROJb6wghQXc6OYVSHtVQKbn1WnEz1HMEJVPE2kyPICWg/jXGgCiQt10x5+KPuojRCMPF6fT1uYXqYqDzkKA05G9PhrT3f9bb1MfMnRy+2RK/u7ux732czt7yybv/GnZvvfIVM8+3/41/837/zux+uN0/62fLg1kbKhyk9bcB+V0khKvSIwNVwo25gWqb5TJ3hG11z2M6S5PXmej2s9+erfrl7dHmxzuE4y7W1G6IIJzuZ6CNM7Lnc3yFudSxU+yHovagkuFRYT3l1zjvdGmjNBmiIUTneKi5JaroHUnIul9F7DFqieDCU1BhPLcEYCAiV1mbyFIOr89JyKDWcNLBuRtsDdWiYzdhknOQ93x20/s39fUf03uOnV+OYHM2c75gbkVe6+SsHh2fHxx+dvXj/+vTMpKUliSGEsTXcth7Mm+yIZdje2dvfnS2PT0+uxnBNdG7z0+1wvr2+SnnwPhmCzkYpMEWRgsr1ZtW4FuwfbQbtE1tvoHrR6VbIbLmE5dRJzJX7ov4/ymtAXY+BSjlzMWDx6qxkcVTyS4L1U2ltM7Ej1YyEsEzdGZRaBHVkzqpDq+kkVyeiElrZJFGt16RwizqB1kaS88+AVJjUgpGjYpFK3VdTjVKhk/3ZqFpTsCjPv1r6q+4kPhQqNFenTEpzyd5YnvwKJeeIPN9AHgmbfQP5NAPUt7Zm8H6CUjGUmUspUPojhfNBaBM04mSgM2Rz9rmkxtZQH8Pf/+w7/8U7X/zWxx/+kx9977RpM0OTteRpEkrVgdG8lHaDtp+UVg1S8dBHw2+nuBVEVZxRVX5jdT3CH1kbcp4RrZpmCDHEYLy1l5e//LlX/ud/8D/2//b//O1vfcPv7YdUpUHL1cKCtmR6LOqgMicvid4JHoJYv4riaB1V82MAm0jg1SExOOfK1xE4HpC/UcoaqRibhX1FqWKnzb9unS3YLypEBUpLdWOk3Le9KTleqc86285V5aQCL6nxrcFc2jCHGC7Oz0pK7joydbSi9hXqWj2O2+1ms7O7U8VD0IVBULrac2IryRlVh9V5qSmvOSncSd0hIeWvPmgYjHDsZ8/ygTk9ir//e5cXJ//Jb/39G1/+6qzrn7z3/gxTgt77uzurJ2dn94+eD9vB9y3PZwd3bj85OyknPoquMEGf4XE7dq0vTX+IgOaVctlUe5RUGauJSGK24NSU+mZSCmdjvTeA6sCey02MvoTI5ZJKMeNWxhDUlEMF8kMujWMayzl33seIH4ythPU2jaVnseo6goEjZUaugshGrq4KuXpnUS0LrNUxlA4hAW41ykWPEoAmA11SwjQGIkXscJ580Grix9yt9GhAosWE/tSrk3n1x1SalmXwmkpEiwEyltV2vyTiBu4mMOThKrAF9qLqn5gqBo+TESe3AOCNsKWKFr6VCtZTJbsEnRpr7Tish6s15tNqxsaeLY+xTXLj1q12uZAo5+fXHz19SkS35/NlNkv2h4vZnYObB1/66oOnz3/3f/9fvvPd714xHdvuzmtvkvVJRhTi6DWgJqKAOJ0UACMZTTV9KQXITtPd3tmhMJxeXYRsxhx9245M909fjGS2ji+wD2fryn9FzQqwVHatT+NIiZz1KZe3HEVARgJaoPyKCXqHVE2usJ2fimbUpFUMoXzLvu1Bj8JDDmImQr+SX1IslYSznLXrSCVnJOVqlr4nTkbkSEwxNor61Cn5REC1ObuUl9YdLJdzdm2i06vry2HYSHDettl4Qz3R3eXq5976TBrHo+vLn1ycfHx9zt5ebDeYx/Kiazbj6Ev1zW3m/Ru3OOWj4+MLCXE2e3B5ehSHs5gGPNyEqlBHZUlRypBuRS+QNPuoFyPOc1IOHoEUpIBjjW5GZThBrKmpSPH9dW8DXgkaSwvLV1P9f8UI61rHeZvQvekOopS9QiqjYzN1uFCRTNRdj/6AWvNmSDtZr5vfCc88gaeSNuRgosAMj1RmWt8t2EWZXBaFrVW1aW2puO6ITSqVa9KuWb95VmxJyl6RXLr0p9p+qxZHTCmUu5QtU0NmhOgMACOlFQBMUjmFGdGq7sugP0EekBMzqWpUX53SQrGz5Mm4MLze93/37S++kX37ymvf//SjPzk/z53HKheSiXhx0AFWwiSVCgtP11qGZaya1wq2JskqQzSKYhV0ddp4Z4A1GSQH8AaabJaGRzKbKE3bHT1/8fyvfkSn5yvvNgmQDaYAsw+RSeEMmwJwBNSwlerGp9zz8vrjWH5TZ91mHBXlGkOCkjgnl2KMXIsqSObDbB28z/JLaQmLYaZYYghuVF+K0gGDUFFx8SBiO6zWMLQobyJFcW2Dainpz2CtjkuZ3CgJ5OT0+Ory8vatO2r8Ut5fDk7pQKodiIUlLg3ryNR7K9GUVw/O1hiCfhK1qEg5Oe/R0ycF4bLVQo4AnWIVAtsmscvVY5Ht6bPzb37jz7/3/f/413/zF3/hF9/6ymz9+PHJ0fO1xLur5V8RPTo9vby8vLGzJOdv3rk9f++nG3hxxZgFDlnqDDBsx7ZtnCYDITXwx8ljWGg0JQNZVVvLUQT9enmD1jkIPTqaDLrVH0TnmCGIdcqegysUwG4SSt7FftTGFJVRrB5/4D4HuIwoSAM+NparrReKccuuvAtofOsCiHW1gNraGuMtplaUqlkHaFe1CJhogKzk5vJqqla7osNIZyda6E10R8OOlNYMRjFbGyM8LUBYYPDQOuimSYhN0wSJhGfCTlUQRI3FwEVIk4isBjrSgwpnBTJTvkFvExBDpVr4lMgI8IBCYCUOw7DdjKq86Ez5SI21PsX92WL3YC85b21zdvH0+cWZJ3rjzu29vYPeOzvv72/Hf/Lbv/2N7/758Wa7sUba2b033srGb0OAuFjMsLZy1oMrytiPJo+1qPXl/jsybcqH/Xy/7cN22CQZTB5gUc7WnYZBMo8lqvoNwj6QQqU0tpbDGJlpTJVD7BqfEyfJzrHAKV5HKVrNpojlO1d72pyTJRg/w6+XVfNBnc6hGypR26tUjW0QpyUloP8QwyVZ71WCTXG4iswIURzQfA35HCNcXEvG9uVIio1x5Zpl2+00jc00hHAe4pBiw84ztda2xA3RjuEvvPbqjf39jz759P2Lk/vr86uculDa99JMpNKDNWRoG/ZXq3nTDlFOwnDlzJNhe3K+fha2IzbOSUUzYL+RMlQhSj3OMamOL4pno1aWFosjdZLI0H9OaRL6Bc1EVZqrcS3cdZNO13gCtRu2yHul6TKWtR6tHUjEw4XufZraFMxYgVhP2ZFp2GaALUX7c50TQ9MX2c/C0ShXA3VMlqsCh+6qlU5amkKLWAwN28m6gfIEwuJJpcK8ZKmQOmAlNK8KI6oWiAof9ahVQUyftDqg04ezoTKlGQp+gGUmlVXEaLw8E04Q5MB+BMJQlcek/X95LQ08P1DjZTQVig8vP7Q1pvE+Z98k18ON1WLQXZqEqER6V8o8MNJVX3Ka9Cd1blfPKjFkE4ToVMsEYyIfUxoj5Y6dxfhMpGSm3FNeGTNYDnCTeD5uPv3h98PTZ51xA4M5EKEaY7T71CVeSlSH8YDSiyr+wcXNuFwK1ZglScACDgi3rCuxXKcdaFngVsRqvo6xUemK4yiuYcpxHAbrfMsNtB3KPUNDaeilWVXOjtHZqE4C5pHlFcQIPrNhX2kqqNIcqvXyOvqu79qZb1pliajEkW4roFIMeaCmdd7DdQADF8mlqwe5y7Ht2061VcE1FSAGsebKVT27Ig/1qNVWQIj4ehhmq70nOT1+9GD19MW7/+gf/5s/+INf+sKXvvyZN3Z29+j66ubuXm/o2dn5s+fPbn7mzURmtbu/O1+F7TXFkRvQuhQ/DxF5711M4sRB6wlm1K5V0nxpRbCRt6ViVDURrVu08iRRHSew9iH25DCoUGxkJFRunCB7V462g+SFVQ56BuIQPE4ppZhVS+bSmpA1odKRQYqBhoj2vgpjqp4FlT6hci+im3YVv0FjCvFtUWkq7NpVpYakojCzwveSqZpxsLlSylTpQBWexUJJVf5rbY/EialMSU51KmdsSpMcCNpxLde1r2Xw7rDr5GyiascCbQAl3VQVkqpIjgrj4GICJcS59MTqK0HbYRiHEV9RXphyMEqlFsJq/2Y/XwTHrps9fvz4erOZG/Ps5Pj/+s63T643LzbrB8+en+LdOebV7uHdO/esb662o5YEEzKipGL1zyawliE/VmKQTbnNcne+XDq3DtvzYczWRhAuDZmrkl+NkIm2lmgqgaoCIcidrAwh/Jr1dCvoQcljyu9wGAsRHEvU346rX4/KrHBdTSAUQnhJxVuysowMOBZVU1/1LVHNq/4BxtwaaAAJtRabzkjJvzTUcUaMSMdu7pudfrH0Dn4k6XQ7RgQp61zjnJPUuqbJZLfbGzvz12/cOD4/f+/o0U/Oz6+isKGuaRTGxzmbcdy1btn2y7Y/GjcPry6v2R6F7YsY1kbEAl4OYKaO38vDKZWbo8khAOxVbWUTZOVLLRnVLFEtkcwEUMUgKKmucInzai6seMZpF2kqqQmLGtitkmIb1dSzSipHZYI45omcaSZHI2dKIFHcAFKaqVL8RgtmADNIylVX06fKMcAsp6QkkHHVQVhbW4V+VX0OjKD1ZishcPrkVclSNSWRuJgrZB14dsQANMLGqggzSAVZvxMO5Yhn2kI/gWKcfBVU6qMCDn3pfrAENID2lQTButwyMJ+lJM4aWyU+6gbcev9sDN/78L1ffe2N9549+fDqSnX/Q1Yij1XtUH3+UNKPRqy1DvYYyM14VRFqXLniNxmiXVm2m8/7/te+/ov/5s+//Tw3vvQj1rAdY4yWZk27Z+2wXV/m+EJCs7f71Zx/MGzPRGWrQ/Ubxp4tZWR29egIwZSGwSnozbELpX0KCg0o2b9xIYRx3EBhQ4OaIsGCyeUzYM8qWoVZIGbKGwglebRNm2E5R+WnZ2dsEgo5GNfHmC635zuLnWnPbaRKjTvdHaqeYSWR5uxdI+rJHsubWa32QIaMjW8Egr254kVyoGSzmbV99NDRqxovFUAENgAbNRe3JClSMhhvKkMnqWFD6aRjsioToFpmIErqImgdQrezJ9l8+ugBU/7k0aP/8OjRgu1uP5t17Uh5bz5P19fPXxzlvo3bsVku924cnn66abLZQsYPiMQEnW7sR5KMMnTcWeMQ2yE5Y6waxZjM2P9FZ5znHqoUpZNXGRfsd0EuQmMahmidhf+B4iFduZMhVbsTyIJmSt74SGlMg+PGcB4x6aIoSPkkY5QRUHNV7aCqikSJQkqO2WMRGFNuG6/crf+/mLvGbCD9IXUdSwkgJjBZlSrg6h8LWRKdQRFMthWDa1UCDN/QZsXfJpNwftnUVpSsYe/tWBpHgUIDFD0tFp1S1dcI0kTKVS1VNcRAjJkUCErrp9QDbMIlmspilTyRPnW/ZmHDl6JIgNiYRO9sDIFFHGUTo01ptb9vZnPYmJlHDx4kosby9z74KGQKwOmU39r7rl8d3ry1WOxISiPMOSYVICJVHUwquhe4pFYLhmVyhudsD32/8t3ZuH6xXStesaR/bF8F87hAY8yosg0569m6EMYSarjC0gw8HZ1xcRwFc1N4RilSpKRUSBSoAVG5gHCWUedyE8oxknI1UCV434haE8IXDs8yNyrPlOCQUt3JVa4NTl00CUFkUBKjeGtBK0GKyqnNxiVZGXej7Za+McZebDdXw4CpLzn0id46l0xvG2+N3YZXlsuvfObzRugHH7/38dXFVRpXs1nj7LDZDiHutH2X0o2+v72357395Pz0WRwejNvzFLdkRkNp8uALasY7ZSGj7qoWo8tSkgRB3weFIgNQFo/Q9lHNU4yn9Xshs6rYlopKgCweo66eSMtoyRH7MtWIiskAY19a3/IYtULHSElXrhMPFsEL0mC6ZqqidYq6ipWmArSRLXUkviZL9emnOkVVaHeuQpqqXJ2nLlKnG0wwqVDQs6mVhZKV9BVqMEEZgcZRKzQ1nTWq7FWiJ6GdtYrfBMEZsJNEDia1BCmiylpOukeMXHtzAdRF0eGY5agsmBHUPTB2Nqz3PJbGq/wyG2t/98d//ccff/h0XD8hipbHXBnZShGq03LU3hgACGO29tJVSMG/SlFl47KyRyhb6063m6+98urFvaf/9MGH7XyOpbxEw6XsTeJzWlo7Gv9U4j/64Mdv7d7g2SxvLtk1YqLBTgsOlGiH4B4WwqgTQpHA5AFBiQYmq6KKfaD6GWMa1+kGV1sv5xxaarxOSY23UM2upQjyccQsgQBDKGcLApsSUtQXzkx9Ozfl0IgarmiFlSACkKIEuBtJEN/6cjuD6s+W78ZMMUY1vtDYCdN5ljGhxcUhKfVfHsettdz4jtmFCLdgA4W85IzVkgpkqiqDlcuhdi6WBtETnNt1NBLVhNdAMgwd0fUY29X+aj4/efZ0OD8zYRhzvtyszfqqs7y/nLuGHz99ouxvcnZ162b75FE0vA0ju64Kr0AFUJLj7Erf4yrsHEParPw/U7m8JQiW5lSSo6hiuniMDizD7EpTiLWIChGp/7HHCl9qlFdfEoSF8n6T2l2zmrVQ1bwBESzkMK2pKFddSfXtgPsQc4zlmlRDNsxqkS3BAppaGVY1eAhOw0RSRTnqLwjbeHiE6JdJtk59GUyqssSAi2E5XM6nawCRhPKLCCSZIIkDgIl1HGIEWA8FlBoYKMNGMfzMEhNbeP6A4ACwdTmqrNLTWLKipjf4BUsHj9+MFGKWM2FtkTfrrYBLjUebO3Ychtbw8nAfLYyL2/HTR48UwZc4s3Oebd80s/lqubPfNK3OUdQDDeQLaBmigYFabZJYwyCScqmh5on2W985Phs2L8ZtOeltI0mgh5XE2GxMRAqpqkTEmJAG9aHRYtbqo0pS1a+QLIy3MkgCNQvIFv3xBlrsZJnLfVHh5WycUygPuG0StKpjRUGT9kO23FXcVKxZMoYu3k46yU3jYYKdvHUSIyoAo71Oy26Rza35Yte3RPlyvVlLDKQatKnzbY7ije2Id7pZClsat3uue2vvYNE0Hz97fBzGsxAUo0xRdtjems9v9LNbu4eDyR88f3oq49MwfnhxfmnyaG1UaSir3sTaAJdw1zS+8iur8J+JpahxNPnH+3L7eCtjOUXAjRr4R1glsmWZXhyrinCFGarYYc4v7fkqZRcwCofpVAyBqgW17nfqIs9BLr6uCQFk88a0rLYEKWRJNZNXIoXNRtEwVjGt5meqzOalHYMOOFRtYJK/Qg9rVKXbZZ3JpsnUkHgiGOJr6ppeFw/TlATwQVcqESn1sTNDEJom33rBAgpeT9w4J+s15m8MfGNpVp32USUOWm2tTOXuKA4NsONJg0tg9C8VilaujmXz3JtPhk1gHo0JanqsfJoMswusymIAJYYx6jaUQ9TXU3oFW1lAP1skpICFGz/L8o//9P+Z+cZ6X70NQOoeSXykzrq9ttlsrs6Yv3Nx+u7Ji+wb0/gAGBum10FlLfPEvvTeKQgm4c/HYYgpLebzrMJLcNHHNFjZqNUNML+EtKi4a0IKUbNeQ6OMVJMpjDgCpCVLHIsAn5ffHSIb1HqfYAeLEr+U0pZsANZcMFerK0JJL2XAYVloVO0BPsEgXpOSd7OWLbAkFSayzrbJGzUCK32Stl5aSiYF/aqOcSlEwInOkskZKGsil1elQ/Hg6qaqU6i1kt1IsOz27r2eb96+OjsZzs/CsGlBPYginXMPnjzZrNfd4v8j6k1/bUvO876qeqtq7b3PfKe+3c0m25wnURYpiTRDS7Yph4ZoK7YT2VAC5Es+5H/JXxAgCZBBQAIBsa18CGDHsGENlCiSTaopdrPZw53nc++Z9tl7r1X1VgX1PLUvFSCJ1N33nrP3WlXv8Dy/Z1GrHl6/Pohfa3YG2BTvKTwiLcRlxzgd6wOkbgqvTtmSOCuH6K07sjq1OzhCHwAcCiHKGMCKtSH6TcqAYbUiCcoaJIKUTiTpCjimw6GggeoYZl8iyzHdUciaKaUojHaBAdcidxYrC4qDkPMxZYfUKQRptu6BgFcMGPgdFmAF6Jro2SyEu3GngJwuWthN32Bh3O4qpKFAe2gupmYA2hgwX6Tnl5oO9aRsjVBnaolBL2gnvFGzdT8afgYOz4mT7nhmD6C1bvuBwjU5Spl21I2pqG5Wa005hJCmEerSVmL4Yg8W+3tXjqqxIcanj+/ff/bUQCx2cHR99/DKsFi0OhgxZaPmWhIninjac/vcvE/akVK11sAvAAFR0diFs1fjfCb+ZFydQpTcaoJSwRqlesemVtOD+wWTaEq5OOODMJxcGVLSLuhst4JXOLtMLXCfQ32GYbbYDk2APDUTw1JaN0zsAgXAogTUMAVY8GwQrEFyBIKEDXBaWnuMIPR1tfi+RUQ/2NrlEo2ZWTl07pXdvWDtxbQZcx5bHVqC88gz1ogmL4qbI5FYqj0a5p8+uPHJG6+dnJ198PTxk80GOyvrl6srYfjNL37py5/45Pvv//yjs9N3T45vXZxcWHumKWFQzw9qi+sjjMCaHgTXLi9NCZTagqx1jOKdqcp0MSvW5XZYtYsFRITSpQbt3GCYrAOMPaT2MkKs1N/A7ogtWjxzLDB3ZGBwh5Az8qEQJ9PaZ65gwckuuCda9xgwDk9g5cImYLmDp3XDSbCKOXr5pa20vqwxgYAkNAtdE3taV3g34y71kD8QgcLdTyWmg6lAHXsppmfTMhGtJzbBbYDNkENfZrd/idYyIsNosGY+BJqqMCZXJ8Bmo5KTrt3gCIEqwMJ4B6zdnO1Ow3b+pNZM22zKWBxp5MaFXHSCQok6l1yRAIM/DekI3DQBo4vrHd2Hmm2NxABXhvnh3zXZlDBffP/5sZga44DRdPsnuZSN6sy1VmNwZse6C7U5xstQOGNL4HsndiEMWJQqEI9YLLxpziyq8/kMgGcc6hx9aHIYraDScMxnonpGcx5ksLZKq4qtJuWCz4JA4iE1roXsOuORL81kaQOXv7ehHX+ke6A2xzoWdkIUpEQOQ8rezg1x7vnxMxHZ3d+3xXjvWhWvNRs7tBYZ3wQe+tLbCJtTDsNgSk05QdzmeF54CdWZ7aCR264qQZQnCxaATN/sqbQ9z4vdBshZjDDD1H1dknWyc+PVvWvXXU56ca6r5WZa74t7enb27MmTjx99dtqsFzuL3fni4uIs4HVSmtiReZ6Set/qlaTZm6C5FbxUuRS4ALB/bU2/D97k5OOAxjm7EMk2UepF4X5Iud2I/WSk/gXxxq0RCUKBVQHDFhF8olohyML/kbkF+MF4PwLvZGxufTDnAQEJIT5EjuslegqahTPdouLbmYspf7tcKKzDh6w9PEAz8aLt1my3AJiusFB5RKsyLbD2s0xfGjx8oDcMfT++bu/xySCmM4SYUxL8kJ3lWRjpzQu/WOphFIh862prHPCD4aooqVvPCwNbKGZrLz3iciZtJ3LOaZqEFBLjStUB4vU6TgdXb4bd3Vahef/o0cPn5+fFmoOr12+++ZkpZa12yqmdsLZ6ZzPjISmYUZw5BmCjahLkjbC8VatlZuy+93viB+fWmk+1rHGSRWlfMTah7SFRg0HZVvQ+5db4tlYbwsvuujVVxIBPXMFgV84i2//Xgt9ZPQBh7cnRnKE75favquYQPDwDuaP+rPHg7cDc1RmWNIZhfuMiBM2o3ayIgYm63QROYbvgIDWXKFAmO7/w/nAWTa2PLi5WGN7YauY+hNqq1J0wiCmzIQ5GvK0LJ3NxHxv2P3PjlVz08eXyOE25lpjHgzj/6he+8ulXrp++ePHurVt/fuf2e5fnz0xeOjMWLQIXoqr1gpIDfSVSWZxATmVbr4LFCUk37a1Ew9pdixgpVRdYYNb2tDOptp3rGSPiHt7IJ4jmFcqPnPPQmLPz5vga2lUIulAquZ5ZA/hXT5yiE6M9ptkKuWxm8B4iLB1R2QL6pi/3+pZeCdtB0PoyyHfrBuRVWDhfIvKyS4+34b3gN9l+bXYeh33pTO42pm04JOZkrkf7M/KJfyE2GQFm9q75qXVsbUyrnQfIXCklQflmISPBrQBlEBYCNndvlbbCW6069QRrAJGS4E+hPK3UCqBUn9tl0/ob7PtMz8VlkDB07KXXE4wWJbP4JfYaFVY7nqowl9QZIChMGAYHOx1mY5gNoWEoHRqRF17mVU80lY5va3/LmKdMe6lYAFEQssnFHnZk0hXonfWJXbEZU+JcBaVnhXinOF6NllzA9uqTvGuDwRMLHLROHSHOjDjXHz7wcIr3rlu/kXYJ/Xm16rLNxrmkSUSCBAAmi5Daj/ZrMV9kBmqWiitBKSDEHrEv+52TMY3BMGVSp1Ryas/lPAzYQ6D5dkFahdR+KqHvy3tQ2Ah0sQx/ZefZqu0K4K3tSaIUOwjycQpuGoD91FkTZnM/m+/JG/b8ePP4zuly8+D2nTc+/7n2hAzxytUrT85OgG1Uy6kAlInM0Q1Ocs5TGr34kqjGaNWAuG2sVV8dldAeoFQzGBTITO3WDsCqMDqEyQRXiUc+MvGk7eBwrfFBUdMlNsYZMZ6UKOyOUO2b1pdDnI/RvKWShB0itnqUN/bdTAcU+6I9Sr2d4gVe5tItVajytE40NQinitb0UEsEvDs8DwVPYg9sYfyIZZhI+72wy+gHQvuKa2fTI16qlWVaugyUfETMoNvh1m7NDtSl6xg5OMWWQvlhbzl6Dkx3ysFPXgpHKAXsSdUMdDHMEXjXA1ScV27eqL49Ks65ex98mBFPtr97mJCbxPhD5K5XV53H6iTp1F87FFumaHvqoMuHuz0Nzu4be12Cd+5M0/E0FoQCWWOilYluXecYfFpK91chuam11Ir0w1pLTiUEsa1aBe69whO+HWn6Vk1ajvy1nUZCmh4OqPaNTKByYjWpIHraUjIhBSEI9fa2gwy1gLnBXkzaayi0azkrA/yE8FgVGOtyNO5omO/4kJOOOb1Yb7Ji7NBuNRtblV0GHxDiXWO1C+t2fHR52rPmWoxvHl6xqu8/ffLB+YuT5cWNg/0vf+arN4fFLMbT8+U7Tx7/7PT5h+nyzLYaOcGlTmxyNv2b1Y57xOQd7ZDaVgMxu7wVatO0X43xcQmPnkUcu3cygcaHwOgOp8FAnxpmI9bn9pdYgrxdB+QSapYhV6bDWBmkyf23WN/OI562FkwxDOowIeqGHwehRKkavRO8JBOmW7Qnc49aavESOyaybJldNIax0WWvWq1Tq8B4QYLRs4vcNp7IY0qEfqbS1P/LgN+ynWN3Sajd1nikBYGx46zx0esl3n6ccmhObcZUUWpdhIHRFtVBEgLrhBjfChFYMjhrRXdoiBfq81ItQQI9YaXoWLNxXjCrLiYT29zOuwoLPPleFtgQvHgOBicWOO32wR4Uaqw+oWvtV0nM/kPcjLaO3gQOxaKIK9bzDwXSYyppMm7hZ0brTgwH1pxtUoKVJQOgYgT/D8ZL/dhsX207uOHttCjyEJ/VoYYo/nDfJs3tRQpkqtTJ5OjjBJVye1ktePf0tyHGG927I0AS02dH1j/WGyX62Wq98dH7QFlkOyGjC+24b5+GpilJdGryan0pEsIs9ONZy87OTqtMM1HWVSTg/82g/navGK3L8TKEdvSUEc1fyoOEbKBAnzSYHLwkHDOg7Xgl4wmfSNdqWUuTFBZimM1Cfcgg/8qwPW4ptcKWxSRmcIByK2jWJe3MFskN3k0P7t0FGLTWYA+uX53dvZ2cu9TWlZvAg7j1gABSSmgHDQ1aGEQpM7WEhTdJzsF6VU05z9ysNXNAhwseAzW540SRViqttEBRVrOYbeIAixbLZDYSMFypGXhnze0XsPQdkkhYuvN+u4g1HVujOpHUjUcS/3/ei2Vig+XF4LAbAKWwle6Y/GGuBnh4ze2DVfzTdtsJlm2t/G2lSXvGxdGHBrQOuAI1FePxveBfyEqnDPXgWrPdpoqa9t9ypEvckHZIPacb1uWckE7L8w8Pp3RHY0ft219mleMc00wnKOyDVVOFnwQK23ExjzuvXGd5bTeb2++93wobH32MFaLLnCdk1znwArR9v4gCQ4JZlRAgZGh3QESJbGpZ+Hjg3KF1uz6c6fRis9rAvN76/8C8Fsk93C5QyFgKhxKIs3s54LUmxEA3M+G7HCsSTMa72/ZfvfTBe0X6rEXRUyakXgma4xJ8QAwrSVmkBnV+sYOgxjny/pn+xhgq5ymRrNUVhWWrPcs7EuYxOmdX07TcbBSpfD6IgCNlrAlZP75zUNK0wZB27lywVXI+lPD6zv5nbtzc3939+d07H5w811J+481PfebNv/XqG28e37r1N7dvvX38+KPV6YW1l9ZUCWNKyWbj20HH2XoGRhBio85GbM8QMVEsfEV0Sp9xs9//1a++dff2Hz977IaAcUsqzMvHBMYiL6E1AyKKnBkJUgxs/XkyuLIQZV0khJ7bgYdSsee3L5VNFpovQyK7I4KCslCSyvraoPtua6Sny6ET4X9jLTEK7fIZMEgv5EoXCxJw3Sao9NkLu6N2B2+DB9w2ot5y3lyJJN6ipLvhsaOi+59mtlH/+PjQAKNoxZUbRLhPdjB+QzVvRyyH2gU8zEhv6Oktmu02hYHlEAZxHT6HaDxoKoGRTO3StXUbkT7mssx5g3XKZFyyfio2M1iV3FVge5n/gTl0R3rBAca1Yu7vjkXMZu1RDFi0lnZ9GqVpx4L9hjQ1yz2rsw4ayHbuVFWfdTB08BnqKIShrbWkacKkAig5do04UjxiHklDQXXTrud2rlYfQ0B6cCb9in5vnByZkwpBWgOJhlp02oycWWHR7ALMD5BWQlUJpEaalDu8doc5gHHwTm/G1YsXx7DTSAzBc/uALwGMUkDPXb9a4B42TD5T4DQqIiiWF8vlcnmxvBCRcZqmlNpFHmJ/nHJFnQDjZ80weLtSCAIS4gcZEFu70qQ4Zz0br5xMK+ExbQCFBduiduyb/sg42iWreDPsZGfv3b9dL5etkcs57Cy8cT4lrxkD8MxzihuydgvnKU3ZGUnomzgPYUQV9gTOoPFKOZnaKpWURqSAtMqPo36OnUwxAUG/4DBmsaKVabKZQXI9LwTzjHZBiYebMLPXJm6PFmrXHrSAGyjZ3m9hQWi2+VycjUME7TEj6cH8xUHbAt5au65S5yHh9GoPmnDpVusWTUp4PMfjhigGPLRE3mv76qPjPsZyF90Oecx1DQniAt9Rak8L7Xy8junOEi395NgyCGrSER4OCkC69n4LmihMcsG0YNKcxvWqM3q6QNJgcmbsOO7E+WyxqFOSEC+fv3h+/MSK8/OFD6GAUMagEgMYt9T2MouY0B44F8QZ+NO9EPLauq+ZsVeDvyHhSoyplvOs2XnrA5kOztgQvLF8K8Vs5/gZ1lJppZJCTOqg3LE+iBPTXiiPDRQ+hejbfaA6MR63N+IVfSeqDkxQsjUM7uZ7AQJgZZg69D8KkRm+iWLUkXALupVAhWCV0fo2VBOSHjh7JPXmYvdgNjPGLKfN04vzF+NqY0sy1XlpPxPC+GqtV0r5p1/51V+5dq2mUeBtnznZte6ajZ84unr9ypX379756OH9gxi+8fkv/tY3f/tgtvPR23/9H/7mre89f/TutHzmzHkpUztYoUKvNrUzpzJICihNyRVmXFiV2Q0Xg3w2B3GoNcNsvrH+/skZYhJQslmo0tqB4WnlKU6ZaS3WIuPHQZ6XEfviOs8D/RKko7THKz/P2geFpuf/WVqcbLvmC59Xw3sdE0SXSwKyw858hHzNjIWM/W3/iSbfw4TkcXa2i4zFN5Eq3cy4vYzRZTC+n0svs2VDMw2p2w6psOCkjREtv0wpxNvmtoxjA1CpR8hikEBZh+VsBvf+mni3UhdD7NRTiGDJvEYMPf91SDywfYR4s+Bm5ALa8NMUIL67CrR7Ywsl3uDYYPgGt7VDYgy9v4ANbGMVtuHEHdhWOJ9k5rohRto6bxCT0wf0MBH3Js7U0E2WddPO09aRDN4d2WEzrkcelORSbM+4rVvaQvforXFZIXg2TF6DRw97Dh+E+RfDMKtFdUpifQVgObSjg9gEsGoZiGHrOI4pTcYuhmHGQJwKhQJXDRwfL3bmSVtnLtIHGlMuxrV7JcQwmw/raeV9HPyMiw8OXrqPDMPJ9Xi5mO3UYgIAPi/tRcaao/3DF2enm81qNputx40PwXk4wEsNMZppciCgJWTj1C3HtMeBbcXAfJRhiCTirb1yUjidMLwRApw3eF5a/UvgANfC7REIXnb38umT42fHp8fHB6+9ruM03zvY2925fPHCS0DRLSllGQI5YiXnEEMB0MyHQadsfOAjR1IKdUKqar0LnK9mLbkHyOGq2QosjU0lG8wm8eyVKK3HmuDErQAUIYmC8rZSkHrpHGbb0Hm3h9DSiVYLCJQoy5jdh2UtIFOFgrNa7A4DlrGn4DQSA69sFBO0zCizYrtuE1uMrs5B/FS/iyFA8yyO2sdb1IeBOue6fQC6RYAJM5RnVLJkbdZMhRl2cowYxFsPAKDhCULpYzshMxqRjrnukUyc1PWRjuaMSXwum3FSJFNqUgdegRUjybhcQrVHh0d+GKBcDffu379YLtuVO4/OO0ndw97Xs3z3LUaJKGCg+i6UPUk700t0dl7sgZrDIKuUXkzjJcxvPZeo/ce+wDxKxB+WgMgwdtxLYlmuFPXQQpPBHkD+rdgCI19ud1OV4GumqLkyD0pLxw85AMSB5wSWoR3qlayIjAQ9o0ZMj2vtrl/DLClMIgyLjhKKmxu7sPXG3sEQZLm63KTNZRoV8znEf0l0HGcWxy0qVkhXnFyd8pnMBmMGZ+ZWFjn/rStXP/fGm1dmsycPH11eLr/yK1/51Cc+Pp5c3Hrnbx4tzx6cn/347PhZKSvbCoMxT+C+TYpUuorhXFU8h7Ym/O2jTgZrrAxzR32ZeW6K8/7W5fJ/e+v7G2uGGCdoAiHeIX24cMxQcjZbMTG7AzzamZ0i+ukMdYVSbcyJERT6IAt2D3bXpRnpTy9Ap8D7u94WkriuNZWqixik1qmaVcpclvDvxxzESPDWVG9okrJbB3/dRimASb11//b9VkczqO2R3DRc9V63OMNwU+TidUtw4f+uHRiGLBGwKdSYWKsr4O3x7+3c5VZATplWNzOPUTD2tN4z0p3iyI4fbocJ5G3tgoR/CVQ8j6Rvj+Ma93J7g7332qqbYraccTEesiMkquJ9N9yHMeGLJg/+5ug2vIs0IHaQr0QuGmnusN2qxfR75yv6LMWeV1zJRQHGCqCn2lLm1s6dG8G9Zjh2HIJmlejQCimiWcAO0Sr9mTA1Q9WMYypn5FVgAwiqaPHbes5xY489cc5FsP5o/WHW1WrNBM+XmTvW+giTFdfA3ktKI/QmhUL10lF/VcR5E4brcbW+VJ2ijxUZgZb2cygSfQir5fnxi2evvzKz3E3jQ7LW1Qzer+pisfDiYgyqZT5bFJCtmOTvvWQSKeiIhF4MLQJwL9q+ckTwZ5QLGpi4CXto68A6NR4QH+86uA9TVpjMgZaAUNNowjbMnW3Sw4dPjt54I2ny3u/t7T09Pp47SciG8FE6va69ptsrjaVqtSWpgZSN8Yt1W7bCV2Q87q08JR/5z0GWQAh0pzq2zwSThpwK6ClBAuNwvPetGKe4wRnvXSsFxDMohFb+OMTKw7grAyvEUxaDU4e06ZDyZtqMw84C/qSAIYSDXpSKDdakltAuQAaV+P5ashWX8y8DHki3czQBwzFoEJ6KB8xWX514TlAA3QRAEW2Hh6idIkfbg2ZBbnKtQWxdse3sSbz2GOfhLoU2gxRkwA+w5GacDX+e1BrTKtVupgyeuzMMloGazCYVU+cIpbly/SohNaL14XsfrDd5E/zjZ8en6+nGjVeH+Y4YuKR4DcMy1OoHHNxVDaZECEx07aiJRa/F2RUfnchZ2pxXnaqx7dfH5qlKaT8bFLMSUYkoYXOY5agRolnawxDgqOEhhpil9qrGGNLUbUgWmxiFV4zCDPhTne3xKkBooYHTlJATCck9piQCqUgIAUDbwoys6tpBFpPulJpDNuL3wuxgNq86WtWLNK5K3WjmsMUFX6CTbx2zcM6hxrnBtmfRO79ej9bU/dlsCHG3uJtD/Nxrr9145frZ8fHixtVvfOZTYTY8f/b89OLip/fv/Pzs+LHqi1ImPFJTyqC41GyZYoC5eqlWpGoGnwDiCQx1EoQLqeRWWWpxQVyxWu1lkAtDch/lSFzZFHH4Yxh0QJsPXx27bQ4r9ezJkR5LSa3ryb186KE33MbU4VSJwbdLjakPPWOBvFQX2jsLuI1VMW4xRFrzN3BhY2b6UmxUIJF2kRiw1iYJik76AoF7YjwvxRSULbmXaYPKYRWxdnSQdxQWhCJo/rgJ7vZfXMDURTGHpdaIg0cEQTZbsAPXzGPGrE3LztBa4HGbsdePPRQbYoX8WA63ffc12r4hhXWs/cbtC8Ocp9r27dINie4JFiYIbZySx9kuL79NVsR6dzvVr5ivajt7HOprlsmd5AfRBYa+Dj8DtCrtaxawJHPO0QgLkckwetl5Wxbej9ausFtFGinnFKZT3jFNAubXEEgGJRiz6aE6BoZwm1RDIAPsA8VtpxTAKKGI749UMd7H2SyEQAEd6Hq5+jhY7AAMbbWQeyOIHSyG9rhj3FBx8hbZXexl9Mgc8MPbXlPNNJU68Qf7h9oK/Bxiu6QdyM6AHFeKSobFbrHVRwz9HKW/pRY10Wfo9/gW2S4VhHrEMLvOgXhWnUOyFrJ3qUAgzNz38H7WhR1Yz7GtWB+DmKyXL45Xz5+O52eHUY5TvnXr9pd+7SutaSrp4GCPbFvv3EaV+2WaZwu9kLmIN0WKiM0lu2JE+diWVhyopXm0/Ztgn/hohWZGsnMoE+uJgOSmFgx+oX01wji5TlTFb91p/yB+YxCgULoxp4Vnw6BJp2lTSomu1a+C4PBq63q5bFXO3g7804FjFWjBGIloeVPCoyi5YP2hiJeobsxj1dZz4Nujv8saLyCM4FyGFBEpGUyBAj0cMnVbmKxkkN/XauP2nyjdnGZLBWofcum6m/bvuq4ALeWXc3Ly43mKYBDNMQfNWmpcdUmn7W0Nr7CF8hB2RJ+Ly8U7Pz/c5/VTVqsHt+5OVk4QLrQ6O721upzNd1698ep8dw+ifVCjamcaUe4I8EA7c4AtKwsjR+K9s0/Xl6cVIDEYMwxWZ9p/IWMlwFzBo9TQB4hJG7ZP3VWnzrViy3ombGKigix3C5xLZcIwt9eFVH3rrajRfhaTmOHqNGrZpFkcwIQFS4nSTeWfBpYIDb5p/MYrr//a1Vd+9PDOKRRey3G9mlKxJoNZ2p4f43MuHa7vZQtoAqEFyQMOoV2PLs6eX154ZyRNR3Hx6dde3z88GEuaXb8yu3Z1en52/4Pb7z66e/vy8qPx8rjomHVqn5OhAkCLybakdnpotxRiZFzNFsdSSLgz7TrtPiKq0DOegYwdlzUph1xN9MzdrdZko9vUvn6q4o+lWtUQfcFofWjspZ8UJO/XHsuFZBT78gqj0xXeLVeBZa1F0UPS6VC6gS7nYOzusKCwaq2Fs1m3jSpD6E1w1QSoFV5GLxXXE32pZm7fu+sYupeXJFVHPBF8v7GZzlQ7CJvGkd45V8o9jLNbix+EM7lqwD/zPsItrBwpYNNsEj5XNWXu/UzCCOS6cBbffs88SOwgDAwjIFxT18MQECOqPBDbV6F4/gwhfGzHgJMgiIRBEQhQUEYvOI5YIEVsT/c2arF7FqHdbdVua9yULOtcWzEWALU0bLmcBeaGmD1XjA4uBHzfiN3LxruZbRVQcjYZm1DMgkqvroMocx/MI+ksmcw3EBdZIUMMbULrK2pru4Wbj1Yalgk1h3HigsxUMZsxMkQJYW8rXG8n1uDbD1VwWTjiEltXIxQKllInmDqcCWBxFI4gy5QHHwsRid7nlG0pPvqkU05mNsxnsyFNmjbZt2oVNnTviO+QGJ0xqZJcb5m/1k79lGqpESqLhHhaGiFcq106cN+4HiaPL8VE2wFu0DlZ8QLGTRIjOCshfYJCt/3tkHuuXhwvj5+uz09t1ps7u6uqL2r9xYcflPPz9v1o2T06ikMck7pA4HZuR3lovZvjAMeYnNS4HF96sqoygBbjFXXMxCz0RZecchzoFLcs6vhGeQffF5PP2nXuuaVrBWnGudsDcqEHoR67a+vbvRtmUaeMSGbvgoznp5pLkFgQmZwTPs1SVqvNMJ9lbb8CLaeoh7BAZbNOhxEceUADiTU2pSRQr/Q9at9dc9BmEByt7aTyKEAhfiPdpdbqY7QMi25XUrCmprKiabD3slD5w/bBNKHaHnDsMmoPIzcEiaAtUvj0MRqGnGvLwOG4u/2m4IhMZPyOmnCetNfD1TEaa1Na7B2EvUPoeeTixen9J4+XrlX5r+/uni4vL8fNatrcWV3s71+5cuX6zu7emPOkdGS1W1ahKqEte7Cy4+J1iQuR07R5Nm3W0l4fR76Ht2MeYaJzmVExJmmtHjz5XLK078BZbU2wWjYAcHOhwnbgFxpjUhp7miTCwjnjKKAw4kjD4gw/0haSpJNO7c60A+erQPCiXmKZB/loNAhjFf/KMHxyb+9wFuaz2UfnZytTN+1RKjEO/VaE3MK3b6/4LXwQGPcaQpBiQrXz4Bd+9nzabJzb9/PDGK/F2e7OzL963V85rKcXq4ePb926/dHZxVvPnzyZxktnAcHGqtL1h8oBrZtTbs9KcKzDsVzFKgcq75S0tG4GFZ6pth1ZHG/qrpHR1kstr4fhs0eHf3XyTGNo91+rKuDXrPDEt1rdcYWvUHMEcVWspgkqH4H+ThJTTeDoR7UFnCol0UAcYf/tsmjR9kbTpwufBUiIGbZv3HPB2Z0hur4JVQzALNFxEA+1w9AWjdw4AjrTIyXNNg6xG4DJVDa8GYmYRNZfu5kxPWZj3/vHDnj45VoY0u7uLtpmbRfQsWdo29rPIezN8AnjxGydYrvE/CAytBNuctAFZizZ2tMMb5A46XkBDBvvLgb8POJyBzOxDWJp3N5sisXzNA3zGeDOhSB4UjRx2BkvHGIIGOWtn+AKuZ2muXp8k0D1Q2WKVHsquQCnLkAo4sg2BN6aDGagoRoxwapgrEnTXNxU2v3tYZjBFM6gFlGC77ntyi57K4AKtXNF4UYO1kNVYTq+wVBe3+7r6JHpD72S1uykHWcgzfL5b//XEAZs8lRz2kyrGGbW+9oz+ZFDhbcuet86pIKIqlKY/Fmrm5BZJB2SoDRmOCfq+uBUvDND9DFMY8L3n+HtlIJwFud9axdTV/h4ccHFqmaiGdp7KI8Ajqg9E1doPkd96tlM4Ju0ZhtGjYqUnCHO8AX9ZQw+p/T8yf3x/HxcXYSkn9nb+/aXvvzrX/7S//DH//rWav3Rw0fL5yf7r93UnGSY7e7urc9Og5FgJHX1RPv6S5e38DpQYLugEeMbgaW1sy4nbU8In+qMN3VcymzAKYwrG9UVZFtQxnlJkGLh40TKDaNOvJvIZUTfCsu1qLaCHe0JbRU2DLF9hdMI+sBWpGTMOE6Qb1YJ0UuAURqpyjjGQONvDWvtmfwkr5malD92BMUwV/UxIMGNeVYO+ZgGoEtXGfwi1Ngy6Vdsz7cjPK4goA2BHUxw6d4leungzAFC0r1sOZDos7UNZktMLfVHyr8ESfCAdsC4XFPKud0fbpwm+kFrTbYWX22w1uVycHTNzRatD4nD+dOnJ+enS4CK/tmvfnUR5Of37v380f27q83J8ePl2cnu4ZXDw6uznd32WEOZKNy6Y901VLvnZMe7dUmnmjOsAtSLaM0Q6nfwrohPObU71gqNrZxXtNdAqD+vrp88VWx7j+CCRtVFcm+7kj0J3LkrckkQA2V0G06VVaV91K3AIgQeRiFcJZ2GZIzmualHPh5I2I0zV81fHx//4PGDC2NXxk0ohHlUOthvkAXQbqyUUk8bir49+a38leCqL2Zh/cHebjEmj+PV4N/YP3r9zTeufuJ1c+Vwevzkwbsfvnfv7oeXZw83mxc1rz2OaMWsFV116xBaSawEnmDw2G7MjOGR+JCmjePHDkRwxp4JJSx86qbOVL/7qc/96Omjn5690Fk4sarCSRgBFraYjHEmIioRz1tNv+qKde3XkbqVFrUWnJA5/AyZLzXvM4jMvTEp6wggg0c/Y6n/52oL+fSYPLZCvEbr5jFwOju2Tlz4UpTehVrMIFVKSdtMK0zxUMNXeo7w3ncQZRdF03rF+CvTjsEeAMHJcgflkRHWQTt2u/3lDdYVnO1VGoq28s9HpgLT5ElIXta0zqnEYR7CXvBPRroFLSvCQiV1aS+upbLGVVcYpg99VjviW/G0SilsbcylwB+ODyx6KcWmpCEGbLKSa+0jzO7eMmnPdDckHYfY2KTpU7Odjw/zv3n66PkuYC/dLNRjZDChbVdURIxqzUjJsXXKZWsrzAM9Ofhl5k6sc+s6ZeOKM4nmYSY7YlnIXVEH/7SSGmMrxr1hg0m5GRVnpcJKCEQtdBbiQRvuhM5aS1I0yy7nybfbHYTt1gqk5eXqYF/aRVUc0U6qpj0fKDa9lXYvgrVJGcksxFwzZ2XtRuEjkotlSwqghAdqlmQ7zSXVsR0WqR1JDiAIU9pHobDt9uQpMa2qwDAZswnsd/GKipM0bqzRIczpTmaxh/O/i0tqKWJMH1NDjhyHwdZ8/OTh2YtjvTiPxnx6NvzuN775D//2V6+KX46b3dnOpXn+5Pzy8eOnex97vdTqgz86Ojw5eR5sez2DmKQFaXQoATQ7dQWlT8SHo1o8cdZCTg2hgNa4zO1qK4GnSdo1lrcAfHaD7W3PmhQT4P5NKV9QSFgRZW9h64L/u8DKzKBo3aIERAZZnq90yvPZgD4ZqA0H5QRs/D7EYq0ELyFQBwYJAN0ciH9u91ZBqV2NpSKktq8sJyUDR2iIR8kMkqT3QWE+7Ks087JLtgw5p+SkGCX1CjQurzX/EneHKxsaC6i21bys38l6hu7MdU04zh/EIuEohSQqTwkbtNweKgwi0qTWmJyTUzCB22FfZi7sHxy0i0mtCeH+rbuXU17WcjRb3P7Zzz732sf+xX/2rd2rRz+79+DP3v7JW++//+zZo/Pz04PDa0eHR4v5nCN0OrCj87OsHjKv59N4wUAk7AuEGV/Ux8HEpHie8YsDD+c9wni0r9By7roE8vtwdmdV8NHaU9xqi8y4z/YX+CBK1X2rmG0Uh4WVgyPXo/eN1npNo7U2dnRd8db7Uodcrs2Gm7t7UeRidXmyWa9y2rQOrrDsgnwE/oicBt9PdQP1XvChVh3gZScYS9qvZaIxc1dlHK/s7l/dCa9eu/6xT39yuHFlc/Jiee/h3QcPfvHw4Xtnz0/EbqrZYIqNrYnNypRrLAmU4igbhmEqBTnohUS5AnmQ7Zh6cmnwEZdC3m0xNTvzwfOnJ+PG+3C8uTzZLF0MOkEdYg2GQ67zjVEDkukGWILBfAJ+pNZr00fEf6c98giGwfDBAxANIANCaVNKufXBYvLE4saRuwdUeA91RZaum8dYxymVslFu1bq+qkCC4YP3tQyaV+jlSrebdbkDm8kucIak2XTyUqdl8H/1FHZiymxIrLMdGgyUF9sSGH/L1hzMyOl20mX1vnjxXkKeNlZs6d9xK8/XSAQMxu6GWDFB4FAFxQ02yxYuSYB5uRtVZbXOh6eO04h2NXjxWZOIa/cy/oCiGkKssDNC2Ra2S8R2u3hw3SiUA+ZMQN5vV9xBqf/9r/3Gv//og//pzi/aNcshY4/0MsaqgBnUyh8MuCfqf+BtcF4sRI9e/JiTtWZ3FovmoK2QGWvx1LagpICjHquo0uVmIDUaCDhQPrfnEX15n1fTjJG9BEyzqLAq9ExNm9xazDjQYZZyq0OGQVoN5SRKjL51PIZsF8xOIYF2SKhoD9akSXzk0cEqyjtftXOqpDU7YGG2N1lC8KldzzaIqzlZB4dzwmLX9hBE6227urwT8RDFQ4pgja+MJnbiBRmlBCqDG52SKWUn0PyqnWeD2sqjoyrsrHC6zUJ0rlycHJ8+e7I5P/XVfH5//zu//uu/+7Wv3YzzF8+P33r35997970nJy/U2ud5+sWdu5/52tfaXxf83t5+MNCYAAOSIJLywcNPgiiOlE2VpBogVJ5S9WbA4Dc7sUjVLV0QgbfeVptTAhjH8F5BK+r5WxCwyJtVc4JZxyjX5YZhc9j+9tDAHgRYbQkxBB+KNcsX57BbSVWQkbzVceJiXGuddJwPeyFEMu8MFvniWysRZ4O1MrWLFRnclrgfy1xhY+q0GYdhaFUdZrq5qLN1GsdhFnGQKfzfamw7UFo9WrNzwdKNjT8KoiRrq0OWJUlMSDPDQhFmZPLKKgXPeEoM4Ru5ZGby5ExXUqEXrtJ+adrrkKYEnJ27XG9gpzTS+vgs1oZ2fqt4v3N40KXnuTy5d3dd62WprwfvZ7P37t754M6tr/7tX/lH//S/+L3vfOf7P/zR//0f/v1fffD+6tm9ZxfPD46uHhxenYUZc6d9rYezIVR7lqYLUxN0kdh4ORomBK82MLRYhvSQRyg9W1XkkybnfcUHjcNdaf7P7URqV6DDlpaOreoZYou1EHqLmtubUEHAaa9/u7AdDqiEt2YSNHY6teMuqBlqvjrfubIzxFpcLk+Xl2dpWoFX0akczC5rd3+x7Y7pit/2dDqSb2oI0VsaJFrRGYuZG7c3DFclvL4Ls++Vq4vdver9xf3HTx7evf3w0XvnJ4/LdIbbN2N4VmuZNFXvMEkyCXnUWdsJsk0YrO3rFiFEN+fEFpSDG84PCEJHGJw3mkepf3n2Agt6x8St4Pwwk/U48a2hQAYTgsAFfCuPHRBa3KUXStXaBx2czVkpw7LOsXp11gQciYgJsa5K6X0lUe6FSCbm11FXibVJ3pvP5xLUpLHkqZ3aHgIoI+3XNGLFS3RpCpV51sz363lNPe2IIPyXWb1Ms+lC/cIuzjOGUAxFPj0TkLsvQ1wdpbjoR2k3orjCaHW5r9qD99OEyH1DtnU7XlbQUMZad2axvzzIjvXe96W0ocsBF2h7LBXjtGxag1IAeEi2VJ1S9jnAkMu2HB+gbMmfQNlh4cs5PqoT6Qgg5IRT6tb++zh773L5vQ/eP0+jIyQbBWwhrxJVcrvTsnppt+2Ua2bfLsLlNkeUDqJWWGbbrTUYs6EPqWBxxhGWq94EBKwXqaJY8AtTkpT7UUdgCKbWSAn3UkDQQaQTzZjYGJaMvbOHeFSNscEHEnYEfaL1brE7dyK5aId9gWaKotOgK2tnPYjO0PSrRSA15b61IsGXewi8Me3g97CTTmWC6Lcd6CECdKXY1FrqiOFyAfwHQcvSzjIPgw0fSVavThhGs4jRqbqSiLKw7VusvVJh2AnkysG7KGF9uTx59mh18twb89n9vX/6rd/6h7/2tY+/cnM8ef7jt370Jz/58U8fPRyt9zGoMS+M+fm9O98FDlOz7u3vz4ZhncsQZcL4AWl27ahw2GkTAZdScu23CcBVZsuJdwH9BqminahisrM+5SytR6G1oVWC1oB6xM2xEgtAMYdjPyjW0qZiHSN8EV5iuuQSGHAjQ0jr8fLycvDESme1Htp5EQmKWS4KRCQBaPYOg0oDT533NgzVWm93Wn1QQrtH/MtQpor16lRKjjKHtkjJD5/Wmzyb7xwcrFdLrHrNS7oh0yNolQG6VxSwNtKl2S+CNqF9alIZzNDFz51qR+cYFmC2bIPVLMjrBROR1sGoUU3TmJOSkIU5QW8PRKxoCdDsDju7cW+vliI2pMvLp0+PT4CYOorRao2zwdT6lz95++0PPvidf/APv/X1b37981/6sx98///78Y9++P67+vzJ87OT2d7RjRuvDkMMKc+MTVVH29O4iGhtPzZE49bV6CWV3MpkA/o6RP2mYCyMUrW3U9YF6w2uB+fxr9TKWKkCAaCtxQbPV1sIOYdYxzoTvLTGI3ixoWq27TO3xJ5AtaNi6k6xR8PstZ2F5rIu5em4XhbdAB3ug68MMi899Db6APyTCdZ773LOqN0ltoY1w7zfOjipNmiZV3sUwm61r/vZF1//xNHRYdzfXT1/fn58cuvk+J1nj54VPTdl2Q6Gdl1li4V37gnx7QoqrkPMuvDYKvED1ibMYFANSHuaa3aCyFo0eNAGQ2ZvDPT+1UevUFs575JqnloDIJbrUgr68e6U6jzTaXmWK0OPTOusQIgj9xUlJsxgELtAocJgWcfHDjte13NpUR5AcGDaO44+yVqG4+7Fdt6pqRtVPNK2c65wS8bW/4obi9A51yM/2i+YmWBPa17t8XE9/2mbLNpNS6Z6w/k3i3zTkyO2ZqbO4DA9YpESMWQfVdtxpVDVhIDfrkqXUkOpfDGNinPvYL6gxQLJ0lXLhBiCriyEpqNzyl5m4GrtoP+EnZAD7qqn09eCYwEkPKwLQQWZPADTjLHO7SAGOAXyRwCjakI2w7iI//OdD1qZOkRTSjLFm65C7qeeqdHWGV6pZO2EJCCp7ZMyYqL3ARvvHvKjaeFDtiYhkWM0LreSIlc6uZh5AUoAtLEmtQu9OCslVQlC20It7Y/NgJVC6+TbcaRGDUMUKEhB/Iip3gUoQdCFYoCmNUkre1HuEnnG273+MkGnYO/e3XcMVOGOqgsODMbtlZFmpnMFW+/FWKT23XVnZ//KGCdAcGYBIdRZj9F1sa2b5XovO+b7SJO9+AAAgABJREFUAF7SOjxMfgx0jwY5aq4DHzxDU8W1o8Tk8eTJ49OnT0zNn5/N/sk3v/ndb/3912++UlbrD3/2zn/8q+99/513liWbOMAG0MqaZdU7x8/OT08OrhylcR32dxd7e5dn59m4yZqNq4B107KXkCLnOXVC2owHP0UtzF2VBFTtWDMsY2D/zLm4qZgOiCSbBX8ovYN9Zy9+ywUE+pvLPjD223dFkrwlbwGfrBNZnp8aVZlFa413PrczB95oL9NqjIv5MCyCH1ot56OhGLsmpu752SKZKl7N5ZLdLahJIj7knDUBEg+smdrUSjfr6ca9XK73r12Lw1ByLmUbfNaeUw8MnQV0B3wIg+8eZxN6YlNqIiePaCgSYLmKpnwT3j3gFUEJyv1RwUQa+nJbq7T7F3tEoMDSlA0+LnpeTS6+XSdWStm5cmhns1RKnA3P7j249/TJicI8Zm2uJYBZvbuzN02bf/Vv/tVb3//+d779nW/91t//O7/x9R/+6Ad/8ZMfvXXr1vMXz56uLw8Or7xx9ZXg/Iv1egO+vXRRj4VWXIyzSUtspVGY0pTrhIa9p6WLF0yV2pFLaP2kqbSaGum+lViNdvoH7/sHUzKCULkRLGDxSq4TVKKtXPMW5wrGmxYKE6Np1/gbs/mNYTgKcvPg+p/fu3V3XBYcA5CxoIV0lvEsEkjlzXRpg7GtNWtwEnDDzNrPzY7Nhmp21Hzu2o0rVvas+9zHP/HKG69tLjeX9x6dXJx+cH7605OnD9I6WQfjjUklZWuyrTm3X0qVDAVcIMZOKRkRNWbaTmiLsfll+K0znXiF50lEMiIZ4Lqq+GRMNQFnpQG9HA42o7i8iUxgMhKmppzpOFOFGENqnludK/2UZbQRJiuu/yeO0S+twXboB8GHh0omG4XMcwuFhEBR++6+3eG7wzy0d0DWOfMJ76RIVJA+zkkVFu78kQZEvQ9DsRFiiWF7v+fx49ge1GC2cSm+24a4BKZOpmxvZ5pD+GL2/0vtKROWO57MiR4Cf+gOL84IhstuiX2ILXlvmL1UgRKVyYQpEuy6M7D0c88HgXvHqtYgQaKjv7BC8xKIrOXzW2FNJPO20GlXwGxUaU2XzzlXCLMV6c7tfIRIe5zPQBEB6QdguYDLiTJ/Y8zMexG7TnmCp68YddVEia71shBy5hxsa0VyTbXkWOrcSDJlYkojxtBd1VG7P4P2I/Sa5HG2I78gXAUTeawf1ElwxPgbrS4Qvl6TZnE+SId8Yb5tQ/t9q6vIPlGM8WFoIJ3HiMeCWHDEe3J1uR/AZLV1eySI+3ZSa/RS2n0BC4B4zQmED20tl5XghnbZ51ys9THAb1Wo3cFTAD6UB3wPT7F0lVNxPhRTpJjQ/jkNFdZsY2zNS3EsJlhoCcv6xdPTJ4/zuP6kD9/55m//3t/7nTevXC3ny4fvf/inP/nhn/7VD09Wy7C78Cak9u7W4GQRwvGo90/Pnj56tP/KK3XcVOdme3tyeu6tDdbGVki0i8b5alJrOiG70xp8KWXcbGazeXsREgA9rD0dZjMYL4sRhV01manO2q8gtJLVjoMEjgp1sDiyirocki1iV+LbqpZAKgwjcb07yeP4/PEz4U6XYPOiwRPAYsIsMkbTgeLSvUkw9VhT42JhZ3Npjb65lBclZxwjXmIULevliufaOG1AG3XVm/7K+HixvDhcrRY7u6vluUQiUhUqAQtRCgTk0OG385IBHIgQxYwaBw0uIYhZXOuBSupeEfo4uAM2NFS3YkPZQ8ABmYHk1kT2ZPukN5vNdiCjJlcpBjzF9nzP9w5gx7F18Cf37j9dr1btl5RH58tQzdFsOBwGoPNn88OdZycn/8f/9Ydf/usfffvbv/P1b37rS5//wjs/e/vPf/LWj2/ffnbv1vri/OjKDTvf6b5M61LNpac7YQhIeS64tDi3XWvQAUgF+dX2N7Vou/occVLtzxp8wG9SKeYQPN7eB1itaivBPNjXCIBsLywQ3CUlRwlqLR6sn50qN4d4c2d3zOnW+dn7y8snaV1C1KzS/luLwtXmnHGCCdspzMO9hSjSthMs7MZBUxI4BtvVXo2b8rX5/LNHVz7m443dvVduvjrfm6flRb0cL9fjO8fPf3J+/Dits5eUybOwipuDh2wCzaAdA62vchZ+SbXtcCywuDkRTRlSX0csYUL/AxJMkeraaaCpVBVvc2aDp8R3EzHHZJiKMkxhcEWbwVyhVnBAtdiD98lVqBbXNLTXjlnStYZeT8oWMtWaGcjmQFS1wfQelIx/8ofA+7OdQVdN2V/Mpba/8CJPGBCyrDAKKEbw3tZ2qaDp6OZP3ZaleCKgf6ZVkcoq+uERVGK7/N1420mUdZs22DMZGDDA5K7Owuoe6YJ9KOJBCkIJa/Eh9laZ4SZVjHOXpaaqTt1OHAK8eH28VLo5j3ZJWD+J7msv85SmIAiqc0xxQGNlsSGwiLIBq6xjCzpElrcYqhlKiixsvl76thtFlvfA0+DFk+0WHKBdrbR5o2tlqsSYdWKUCSbqAny+b91+jd5mHMwlJyjwa3Qyr+USnSOIxi4h/YRyc5xohaJBL61C5FYZ37kl+zojMRDm9CAmsCgnSgdaVEI4jFib2Exoe9SsuNXmslozn83JxGyPN7B1iDaDqtmSbMDgVRyHWHsQukTqAnl7dKsAfEdnBCjo7SMKEFZ0FW1r86ozW2EOxwsdG0fT0Ba6hA+vBpjFvDG+PaxqTQEVtFK6hRbEwTwcdNwc37uzvji9Zsx//rXf+Oe/+3ufvflqOj55cufu2x9+8G+/9+e3jx+H2W7Y3U1cK5Dhbcv+EJ6Nmyeb6cH9e5/+6q+1z9oPB1evPL5337cTcwq+NQG6Baa3D6c1HtCpAc2FERbq6FJaFciPu9U5Sj0RuLWhlTqJWnTDTE9sOsWAVuZ9+3aAAMbRoh3cXlndIt6WfgkIAgy8n/ZitTx5/uL60WGeEuti3/qn9uBYKcEIhivt/cfdC4uUOLp2Dahm08USfxr9uwbr4VDK5XqzkvaAe7pwHaHxwMZJ8FXz8vLi8MqVzcYXTQbpLl2I2ZO5K+7+CntbxSouv1zr9GEepNjoDJTybxzFEC9oIXXPgRZGDzljH4G+am33BFawc4KIToZXwcLqqrfJm1baBB/3j67aONSUrLUP7t17rmks5dD7qZr1lNaX+Xyari4WBz4O2ezPdqvRd999596tj/7u3/8Hv/nrv/mbX/36m6+98Y37d//TT3/y9u07D+58OFy9fuX6Tef8OmMEjQ0Jnuve7DpTQwhICKPty/BXwyIVYScio6YAuSwPz5wm1RJjBJm+VW12CyHAhWupjUNmgbWtjdbgo/Ht73XYlh84d3OxyzXP/Yuz0zRd1pLtBmnF1rEmY9K50eBtvyyyBgt2N5ke1gzW7oaZg9rfeWe0zF3wtu4Nw6d3D1918rGrV1978xMuxvXJad1MF6dnH64ufnjy6HGZNlwiEB9k2ym8ybpRWJPROZLiNmHMy56fmTEpJYiie5wAYFJIucJaqjUU7S6lRAunu7g0TVpMCMEYK0Gg3jdkZsBX6jEoRV0IawfT+G0FvRypJ4y8K5q0qmvnakJMr4NBU0U8AYuG7DAP2DzKodJN9OooZ8EED3tlKLxa4VH35wvJ7ahbovEwduvsxTw1hsEXE5HZWotVDzq6ZYkF95Ht1feWCMLnodKHza+xVuO32Ah4JDgc6uSarU5rGyPOL79QPU2hTCmxGJ9LCBGNdgezU4O3Vp3aJeF3Z7PohZn5JGrSDJmhgTDtd6frGOmhWlJBhB/OdBxhSrGnakI1x9FDtnAStUoMA7KuOLWgH+P+0KSA8aHJZheCgZoahEROSnOM60voggxW0Dmc3VCvSQm7dbEdTjrYsBujr7AcECynNXqv1gzVeEXkWC4AV7ay0EH8JfB5KKiQWjIQUWgZ+Iijo3XQKIq4nDKUSZAZF4U8uV0RwXkDaYdjsBTCjlbr9bOTp7MwZ5iJZgZZDwQCoJ80qbTrh0czwGOOuXtdlQb4swTXlZ9MVbNUysCjEmG/tSaZdtOId6iNjbcdRp/xsYfASU7Zwpk6fxLyFgzKWtVWTMnYstm+BW+/CTRf3iyfPHlx786uqd/90lf+q9/9vS9+6tPr4+dPP7x9+97tf/eXf/HXD+6lEGTnABvnTqKkllIRJ+eMWRrz/r17f0+zD77Yutjbm8VQIPoXYwJqmELHQdEppSEOIPoWEUnI/W7XXrtf/XYJA0mRZfKoAMiGfUANBqBEeLfgjnNbUXcHxXZtMSlg3XzL0F9lvG2ltNg5d/zk2cXFxc2rV7OmnDW0691ko9b5nDT4EMMwzAfxrY4zxByzdo4RDP7BmPOcNghD49QvqKQp5VKsb9+dcplNwzUSIopD4Pm0bu2SC247PEZuJ6xOltE1MNZTklm3uAASzh1yQpR6KyQcMLJQQGGkHoVkqJfVPetlzRg9t2cg0bjkrJ1Swk4dmx01LtfoQqjVqS7mO8PevtoaduY6Tbdv3bqoNRkzZw5dkFTsSamXF+dHcXhlsXtoRLRe2d8vpfzpv/t/77zz7m//k9+7/uprezt7X/rs57/3o7f++E//5NajB8/Wq91rN+e7e4guJ6/f0q+YEVORK2akkPLmPsxUEGU6Exh0KlMyxKGlpjxBMFMo3C3cQbTX2XixAQMnEKhgPKUtMKWZ9ybn2aivDvPXdw+sNQ8vT09Vz3LKtnoJkR9/3UY5wMLuW99bggPcC8Q0H3zNrV9gAkuBS0Kci8YM1u05exBnR372ahw+96lPX3/jtWl1mdfLIPFss3w4rX568uxxmdalZnwIsP20Mxd45+LjQMRgbf9rxhTPIn+mkA1RwWVsdzA6qgyNDwa0jmWoRITylq7ZZpoqBoUIzuGEyVHciQQtXFUC44ntqJkM1wD+ru0zqSVPiehVNT4467j2MgSQAWjByRIFidwx4ltudUQPEEIIOylC+BOAcTX2YDZH/oNdJgLa+nNClIKPwZkcTEUQHMZ9vRbrtI2X52F379qtDmI7CCIX1r9cLmMNzMKgi7i4eO6ZvETcoSUvvBetnYoOtYqq9xGC3tpdbJgOrHOZstZQFzEsJKymdY2mm9DBbQOOxyK+LeDI7w6rLbO6+2ItHdl8pRmJ06k9pf+SLJq4OregWkEdZLhgREWL90qxZUHsQqUm7eVfAq8qhvQAn9kOKmjnkQYLj55xUNXamXd5yoIolslkUj9DcUP7pz3gtRslC+tnGFsMVdlwD0M5gLWo2NZfovppzyGgLih0Q/UEB1hjg+Fh19O2lXkcHZhoq9/eFqUgLKc7y7jt15JscZD1thu02h7PDglrFRb/RGEwoxTiVciGJEvlbjMBwVelZ7kEH0tCYpLvLqrCQGjEjEs76p3WHHyr5aVaiI+LK0WKY4YmC65g3eCDTePxh+9vzs5/+82/9V//k3/2t7/2jenFyaOfvP382dPv/+Lnf/rzd89KkfnCmgokEeYKRGP15bVZOD9zsir6/oOHq8vlfHc3j2lYzObzxeZyFYOftHqDEVa73RzWuNw1Zgt1jMu2islWbbY+eGXQr8VISfrfyfQLcR7p30Lkukg0ndWTwJ2EBQ9njzXQuBIFzzkjekyaA/loRx/PzpbKhM3isHPPrKDHNC0vL7zz891dur/Ee1FeADDEFy3TiMRB1ZQUQ3Xnfc1ZK0S2Eizo6KFVVx3n3V4BzEiNdTml9uyJ0BcOvy9HPrwKCyPzEJEEogLCOCFaJFHNkC3d6Ud8IDONJp2t6QRmPBqjrW1ndMoUscGJrda5zTSlacIsEO9kKb5Wj2RKHdPs2p4bYq5VYnj+8PGjx4+XkKTNto4OlHturPJo3Fzm9LGdnZuzhak1WLfYO3ry9PEf/S//49e+/vWv/ta3Z6n+g69/8ytf/vL/8yf/6d/+1fcfnj0/euWN/Ws3knPTlJ04RLyiDanVC8o17AscHgUa6xlPkuD5xhQelaTr8RLQThKygeQnxJCgkq5I2RLiU6Agye1znaY9rV+6du2z1288Ozt758XJg3FVvS++swIgwhCoYTIoNdUV560YujYtSsM+hkQUFgKMHawdg5MbYX41xiuz2eZiedWYz7362rWbr6yXy/HJsVjxYTjXzTunz+7m9QYtOqxBFVkIWNt0NaIp3Bk6N5VSiIvAX6/4DrhelBiqMuuKv6UleQviRzaIrquY8HR4L5D69BeoUomOTC7DUL5OPkd+Npa7riLgHFOX1kf1opLUdeHNwWmiGDD1iXkyzv7SD1Slu2rbGS9OFLd+j+zk7E91HmR3GIB2LyuYx0q/V5nl5UIIrqhHKBF3s4U+X1jLbHe/mM4gYDfMLa7F29OvWAEV04I51DvmjkfofCzUBpbCXowYOx4RP0WudTDVl9YBWy8Z7iuUtIi9LHqZJo2zeQh7s3i8WVbCWA1ZYyIYW0Law/xeIHYhMoapRZHsZ13wQMhU+hKxLsanW9Xz+sCXIBg9UCQMBIgD1U8Qj9Uu72CQo+PIucafIJjMFSQJeucgloDHCcpwaInA5WqXxzwMg2tHc6pmwEXTCoh2JLoxpejcroSlMeuaiwM8n5trototUCHI2QYh1eOvrVonml6KGkytoYHE/2hRuqemmqJEcYNnsi8MSnxeQ4xXj676EHMrxMYYIu9TZu/kPNWqMz/0HMt2tyfo/ZAvx3jXnouXuxUZGHRWIdO0UVPmswUA1sk7n8rUGnRqFNujB+lEO6Va3xNilIosd5247JfqgnUeA4gAd7YD+RkbTe+dLIKk85MnH7z3eoz/8l/8we/+439utT5460fj02cfPLz3H99++97ZaZ35wYWx6ERxdy2R9BZsVApWit6auYSTordfnN69//Dzv/KrOqaw2N29cnR6uZxJHDVPpnrIZawzacrcy3vvTWi1IKIQapgNBnB2Iaio3T2eY/tiVcS3j6IwKbBguubQDrajA299Z51KoVipgn3oQHarqK3ZT6szjI9TK/bp8xc1V02jONnO39rTV6YJYS2Tsau9vZ1SSi6jmdT7wduhMkdnM63PnjvNOiXB/l7zWHqf4YiaCngqEqItbXWZ5SV2E+dnp5rUx1neTICmlk6M7eOxsmVdsTUp5NwBkwLSgoCrA1YMapR2f2flIFFaGw81JUv8yqUxWoWUW50BFUn7n2kasTPS9oJo+4hD6+LLYKVYmR8eGe8xuogf/eKDx6vlSnU2BN/On/awY2eEYtP7Sy23Ly43U/rY3t5OtTpl6qF+8Bfff3D37jf+7rdf/djHX5nf+O/+5R98/vOf/8N//Ue3H99N69Xh9Zt7uwerPMHUopgCVJPb1+Z9SAbEBkOfRivMM/86LB/hOWwVF5IziDqt1JdiI0woQ6ntcageQWqmGB+8ycZN6WacffHGtd0Q3nv66BdnJ0vn1AtHXdF7KfXG3v7pajXW7CkHs7W6XGum1RCuE9Ctiw2VCaUmYIazUHPNyxeuXfcbzZvpxsG1N68fHe4uXty6lUqWKsbV85TefvH0F8vTJawPGdkJWWsnfHWsqEMYDEBrpRrfagj2Ufx9C36aCrVBN9/gpuA/tL7P2ypRF1hvIOKMeBM0Y9hfZG1laF9NQtWMk85NOtF9a4qd6kYA5GsXRYGw0vlCv1wpGURYL4Aj9x1l+0Uilr/txYcFpRL+hNutWuCGsLROUFtyjrUTZvMYbc4p6wrtxzafBEQuoNd9ztGWZLTDaQwz0uDp2DoLQIjcGnforLfFbkfTyANmjwsRW0/KQ5dlt35fDBqqmsq7uhjSbNtPMdW6U0rUIoNE8WMe+wAavXOxdZWmZEvwcjQMH1Wy0KxRQe+vgqgfMLiR/wrkCZkM4pxH/gGTaiAKrqwwWxdU1AZb1VmGKlhrs21PBuZt3DC3u6HqlJP44CUgiTB5xp85VzMBIO0W5FCUdmxoa6xq9fSlYjIQrN8Vh1jjjOy8msfig9jgxZj2W8PSNbT+cbQAIMAHVcm8RzQMnIJV4ASfIEkw9CGw9sOGHDUATdDGOt9aqpyzE3HWFwr4bQ+QRaZ70Ko7uwtL4G4pMYbWZ9b291J4Bt470fcOMkhfDZosuKlbtVKzF49FAUI0lfvFXOBht2pVVQSQEIRdcIKUYbmpUlWTs3YcN6VdC0NF9ovV4jlYUHXBCw4IkwsuYvplzUJCtLq8ezc/ffLdL37xD/6b//bVz37h4sNbj3/6zunzp+/c+uid23dGsYd7O6uiI4S/rYcoW1hprytNT5Wqecfb02Sebsb7d+597mtfI/R8ODjw9+9TUBXEJTxmFqvcPGmQ7huAQLd9GK2szirIbWTuaw28iZCKVmhwhjVCiwnYpHLH2We0gBywKEDv3BFyTNC2bpsL4nrkFq7Kk/PVbErL5dra6n0IQ9TU+vIo0RW3XC5zTifOHV45KJMmMGZc8NaYaZzc6qLoVDSly0uKmXPV4ON6zNOYkDHvGF+fx6lACDqlMYiPYaapnL14cXm53D86hOoPYRtQTmCx7egdYmK13c6QnWBnadoBypGj6SE1VTrwtTK2noJSxdgDuZ3KiWHCInmbJz7BRupg4mr/kgDlbnJuv34tNsju0SHeUrHG3P/ggxMdq627EpCiWF3P2ae9tlXNWs2T9Tjm/LH9vWtxqKmdhns7u48fPvo3f/R/fvmLv/K1b34rxuHv/cY3vvClL/6vf/i//8lf//h4tTx89bXhyjWpfioaRLRwxmty1UFCbnUF/f1q4CQtLFctu3xftGTNgQ5F7HqlFQ0Jszq6uTCQNUV8O3xE8241b+4efOHK1d39/T+79dEvLk7X7U50jHwDJb6Va47wUfztyGhpf/XgIwQldHdUH/0QPUyhdebE5LJn3SePrl6dh/HkvGj5xGuvvXb9+uX52YOnz3hbaK7zGH928vxvXjw9MXWlhLNLKnWitV3aj5w6LB757qUn11Zgd7VMmCH7doogfKWCO80wVUGSfU+wZwpGLj4GyBaVuhSgoeGItFTOiLp2yrS6B5nX8MwoLgVUupjoas2utIM0tTa4gGReOJ+ngt5Jtdt1kDPtJSgdcGEmnTJ8fa22gRcDI/xKa29A2vYmpap5b3cviq85jyVvYAIG5Q1oMmDLnLQWJ2QdaWvoK5ytNWg7Vq5dAcLlJ7SqCqUXhiAVkNJqtnImepnM1sFHfoJ2+y2xHphJmR6LlE1tP4QPztngwzitTR9m0sRuL8aUqllYd7Sz6IM6qMOF90mh0ig7xA3B2A2hIFhS26mWIXPPQEoIU3cRY7Bvt6TZd90IguMEeIuMqhxhRM6YkjS1Gx2eGcQubA8IUsD7f12IowNkCFRCnM+DhEHrnoQZPv9c6rWdxT/6O1//xXvvv3fvjswX7RJotxfyfY0j69aSJZ+SEQtgM/P40Nd6psErLwnArasEBiRBdcAjvifGVPqQmBCMxsOFiHE6NGe2tWjFWQGrUnvwwTbnTnPessfx7qKkYGyIJrC7IUc3ZitV66wWmlS92kw8DBUQ3rkEzTOGb0qnVas7rUubfKnnc7xgod3crWmIPgLUo0KgFC5MMXURfFmdn9z64LqX3/8vf/93vvuPTZw9+cEPLu7ef/TgwV/8+Men69Xewd7C+2ebddaaOLXDdesN8+cF9xiqTjSse+35syelPrh316YEvWXeu3JEXhglYB4mxZISlHd1mlIrPrjQhmyklTu1ikSTWi1nyG8x1rc726CeryC9G240SppaEdnNFQ7Yw071789SF0LWHvQIK10t3MpilCR+nDRfri8vN+NmPVssjFn6wf//RL35k2XXfR929nvf3q+36Vkwg8FGEgQBkCAlkhAJLibpolyWXI5KidbYiu1UJd7yS/6TrKrEZcflKDJlUSoplkJLiiSGElcMMSCAwayY6Z7e+/Xb7nK21Pl8zxuBLBIYTPf0u/ec7/pZlNS2buq2TW+qaQ8f7wslnn72qu6W1rbW1gSXb6s5qyvXthGIFAb/Zt/a2fm5lkZLOV/M2qqeN62HZhGwuAr01EpIsZxXLj0NmFU42MMIMu+TpAmVhX9EZJ4YwOS1L+EH7qHCRk41UGX1nj2xs6ESPFuM8eCcYMEF5xwtlh1j0TqXiuAUEilIgQoSowq85DI1uE3TKbpFtwO3L+Wm071796bpjvOeVLG1Mn8VyxuC7B0jgpLTEO6eny16vc2iW8ZY27Yo+z74t27++IOHDz//xhtPCb456P/3/+0/f+3/+/N//X/+1t4Hd4v5dHzxqV5Z1p5EjYBpd6l9ExTx/EqbhcfQtlwyqU1AfxzgDkv4UiiYixi8EtJjeMaxVGY+iBigQhV7rf1of/jxp67tTSbfuX/7QVP7suBARKfMHRykPblnbP/kTIK8l5pCnmpYJVN9WyojAG3jSoP+4gouCyF6XPS0Wi+KDa1V4wpTXN7a5Dw+Otz3zgltlvWChTgerT2oZjcnx0fR15y1GLd7Hy1LPW5Ktz7da9LD9BDtk1J7mLUAtOiQ6rQLMc+DveWCHHwiEdOEhDksOLGcoMYgfUi0m+QKSxA8atok1BRtKiet0SarOYoosfgAogpKQdm7FmROuPRDaMCgPbccRNWVCwTEauj2ZatBwNWUDFmDDFthlPCpUwBHP5UWwa2XhVHKtWzZtpYkQSinImNJbYQUuo3auRkgxIGc+GjbK7iPWCUyElZeIX6hFC9y65sjgsJWcBUmQLBiLHvXrWQ9MnyC0DXEsfe0WfZMWK/L9HxNaeIirNTsqCxmc+taJvo+bJY9xWTw2ZQEdj/SxaAA0gMfhZExC14n80B+MiCDUr6SjBRwo/WptyTAJeCgdPl5arIiVd8+BAFsM0QSsA1h2daUbHkwIhGkyMyx0ZaC0bpMEgENPpERE+weV0PBh9rI9COJZWtZdD/1qZ/66U999rf/j//9ew8exbK0rYXTN9kUpvzkMquYJm88B27OWSrUgRTFsIWwctjUBhmFBZVNARfugk91iVIghraMSyM0vSbvPTYiDtAq4VlsrcX2l6HcTt+HUM4S+0sIIEN6lvl0yqR01qXbAmhJOsqSA9Gd0iN2halOcm1LrnjOWiwKJY3qmZQewJN0Rmz6gbUWhnP4kaeiA5Q38BQiQYtTxNXQ/kqn2tn57sP2+PCzzz33X/ziL195+dX6dLL/139pzybvvPP2rdt3ClM8fXH7vG0+mE0nHk9BKhdStBVwyAJhR2SNMejHhMg6QhacNyy+f//e4uysHA5i9GW/W/ZKt6wKIVuIE0lGEyTS5/XOtiEqFD34MWGRBkvRII0h/ECEwz5XnGSeFMD55LCVx60KVSAE8FRK/JEoQwTPx8yWain+REYMbDwCgStt5OHubGdz01rn5nM4cASKNVJpn4U91KN7j+rl8uXXXun2us4BBqBVU9VADGAqHvJEYDmdKBbni8WDx4dtvZCcV8vahxCsDYIrUzgfjNbGqL3DQ6X1quQCbDXrdmUxbrLPEdlLjbRtc5IF1IzTJJ/Q4MF7LJ5WVaOABzac2aILwXsPnY2VPUUE+4C3znqWTnJwjhz3VIwFuPDeh+FwyHV6CNJ0jh7dffTwg0pwE7khYZ/MMs9SJ/AHYATACZEvo3owr87rdrvb60pRhlZJocrOvFr84e///quvvPrap3+azczf+sznP/Ts8//Db/6vP7x/d2pdd3unGI3aDGMWUcASOFXzwiMjwk4ramOcCxKTg2i9Rp0dSX0dADUZhE99POSbHItYASgujA/bTHzto5+43CvfvHf7Byen+yy0Kf4oMEPIxMeDH4zGUhkPhCAx2zh22x7yWzSpVqlRDZtlp8t5T6mtbr8jhLK2DH57+4JivLLtfFmlUosFXi9Z224M+if18sbkbM83MzCqPectDb4Ebx0ZTkcXmcXhpwIH90zgXYMPx5XFG0cfxR2Z58RsB0LWW+CjZl1S1PQC8nB5ryEVw6QBuJ30mNNXo8r3jogiUEGIPnLJlVLYtQvsQQmpTww/wjqlPIrfmE1FcoRn6eppoQBdj4qDGZVPO9Zk6ffJvKr2DkoxqQXf7HTTe+N81tZEICIwFenOdHUhmSyil85ZMljIjWxm0vFsy8tzUcIJ28CeyME+kcSTA10IcnIHzZCcAaiJJgtajE/hWI+AJLEwVlC2VkwMhWjLzqTTqep6Np9JpYkQRObAPRavDUcDxusQf7S/F6XqkEF8JEIWgp+QndREY/oORSpCKYWs3YWqEwNBnrlfVE3hdcjVfB3hQGBlTE5IWGcTtpmpFCMlyHncMUehSpAPH7kOcG4yNptQHZnzw33osriuVI+lzNM4K5Vczqen+4fPXXs2LGdv3r/nCwP4G7MxTJ1dYE7KSAVNrNBCkESTjCbM5CYJABRkmKjyCIE1TUNZTEhAVqLQpgCpySI9eOusBrhRSh2zLEx6PQojb6N0DLF16bqCyoJyE0dGKIEaU69UZUK6JTIbTAnFs9w0pyNNtkGQO4nRBZciAtQZyfpmuZibwoBkxwyg51pJzYXiBNViOnUwDOrsQUPwSfJYasWrxeTe7WI6+dWvfOVX/+E/Xnv6uenD3f3v/3Cy++BHP77xeO/x5qA/7HdOm/redFalHl5mFizP/Hga6vpIfuf0DECMY6z2bhFCr1p88uWXNy9fslWllHKz+WRyzrSuYDZLtu1wjCMDxpQstdBKqcgcpoQSunsAoSnJ85iEtN+pyJN4qqtLQV5axNxhZHhLGgSBPZGOzfI9BD8LBDvBrJaVRTGdzb77vR9tjjdQy4uy20vFnFJF0WlbO53OFsslFLrE2el0vlyMtza7/SE4HqvqGvh1yXm3KCZHx/sP9h4/2N198Gg5nbm25iF9kE63y6WWpvQh2Lotu51b9+71x6PPfenzy+W8bRpBcOZIpnyCWkqePVgJskbCI5G0o2keSSgsQCoJ+Jn5gTwdG+x/seHzzgWop+I/qZnz8Iat68YTIRQjNRm54dxE1uG8ZDxYd/Hq9c7mZnr0g8H73/v+n/35X+xF1lV6kHp07jn5x+XFl0TAFgS6IWkUIZYuTJrGxWgMrjj2t7LQew93D+892NnZNroYb194/XOf14vpnVvvnZ6ehBAGwyFn0mcbp+wMB5UeSU7rGBsAZRiDUal9csFSp0AUAILHk/QiljKpxNfWX5LmE/3RSxcufjCb/vnuw1NYdgBxljJroTX3wC0KmS4Ryx2elhoXPRRS43tCLhe0ih4Tl4ve06PBhbIcStUTrBP5eqe3NRwy7w7Pp/vz2ZLF06adtI0Pvq+N6XTeOT+7V81rKVsf4AQpYipqeUwfxDto6hOAH84K6bMHTqrObEVAoioyxjzOoVrfBR5WLoSk8ki0EpEFWMn2ksHNHCNDXGef9254bUixMCVDc0y2AEor7KMjmZfh8vo81EtXycXogMMSrbUh+HSjydifdAYC4VKwhQoEIUvnmVB/gtyisL9vrOPWf+rilUu9oY3s1unJXm2pzqDW1dl2MFjrD0abbTNslhPwxKHWyS1jlnEHgjnG4tR/85CtKFMeNtEJMjNFBJD9whBIDJWs8Kl0I+YR1cGEgma0a6FmUTKuUXTLGPuMh273TKnGu/PzCSg2RH1D3e7i9dFoTYigzQ/29yy88zgqVhIOg0Z/LBQvSZEDHkqOFIQDFQ0E0Pb5DeelfaRoSJUCqTaSi05YuebSYltxLYg4kWNkAHRGZOERkA4LZQx0RLVURPWDEaFK1yCwbVNuaKOAHiYMui67Dx8fvPmTH7978HgKcIHB2r+JcRFZBT9O+nQkC/6Ewu29DStZsWW1iCEWRUFFu/NxvpxXVUo6yGPgcghBVgrokVlVN2DLSKV1jE8c3NNbUSs13pCjpMTag6rHbB8J4/eYpfwhGIsdpKergMQPiz1yqw70DFkIoOWQ6DqnZ8cMfPGIRySRpVHEMI3PjMoqSsGUlCZV6KJQqst5e3Z8fOfWc93OP/+N/+pnvv7zXKjJvftnN996cPvWm2+97et6ezh0gt2Znj9aLKKSpjCOxTa1TVFJQY8ydSQYznjY5VjMzRVLLbiX/MTaIrDndy48/5EXfdOkftS508MjlEfkBSjoJtgQLJTlJZfZ4RoVHXQ3laSxLLoLQqchfUoSYmN57xgAsoyZsoMGnTabhEoHAZemquQvEWmNwIBOgvFwOtMbWxvvvHOrXlSKq/2zyb3J5K3H+w9OJ6Y0g15v2O831p2enS+rqj8YNIv6+OBkNB6PL2yhjJAwCZCF0SzEe++9/+6Nd44fHx0dnngfjFJr62u90TBo83g6Pambk9nMOtftlNP54tbDD37+7//c5Us7s9mcxNKAQyAr64xSIcgM2lbPs5Fz4Nn1CMcLkryYFUaKbgIsy2waHFe2LfA1gF64zzjKyJx1TdNgdA8x/RBSDRdjGVlHKOG8EOLSc8/xsmRKSV186/e++eO7d085XzOmw0joja3Sb7bEkUxkk28aNPBUaFrO587N2gbuilB+dU4ZvVgu9u/eH6+Net2+MsWrr7/+dL+/e+f9k9MT51y3PxRSO7RYAaAkug7Z3T1wCX4eNCiA7ZMkuwc5Nax2BAuSR6jQsEJyY90lrr/63IfWu+Vf3Lv97f0P5poLqQouC8b7Qg2ULiPrYatREvmPJr2IO+h5hPBOs1RHd6XuRDES8lJRvrh9cU0V0kfFZMnkelk8f/Wpfm94Z2/vODRHbXPcVpO2iiGMi8762uju5PTmbDLnwRF7DIKL5PmD2yGcYthU0lyYA+MF7jIims+es0Byw9aPR2V9C4UNjWtClRm6ZzBYafiI9WKUUtPeEEgqGTlE37LUhPCkgcyjkbACVEKlmiNr8zJSbUZjxkIWXCXFo1SvCCKp45dllBkCi5lqdlCU5EMMUTZA1pXISkdYu8XI69YLH16/em1s9JKzt48OziJJcGVPYe/8eLzeKTsXWttdzs9cioyOhQYwLo8OxhMbMTNEYoaGY8RtvINjHaAC8APmT/wIeY7rgmrYrAz9xMKBfBryuc+gSRuw+PTOGJP7bfyoHDP6KoZlSG+tZ8zQmHlVMR2M1D4GmworHyMrdCm9lywYUzShzovdbLAmFDncBubIbRcG7/Fv1MsCsKkcap2YboAVFzk3WnsHuCDqL3RmfIXf49Buon466shKQYJZAOBghdw6WwTelamp5MEFkAG6SjfWpu/X6xwtl1wpYUyqc2EEBgSkpwbegXacCZhE3gE3QyplrVNS9npdiDGK1lkG3JNrGyZia22nKBrXxhC7pQ6Q7dRCO2ZDOvPADUYRmU950/p09rkSBN9G9oWmbovzqkgUHsPA9FR9cDxqSQDOQJtjRZRlTo7InJKpJ+NuJoIUOkPaZcZ0weEaHToLGgLlMTgFDQ5EIEkOsVpqhVfVST2+P9vfqw/333jh+X/067+x8dTT9mxSHxzu3Xzr9q1bDx7ujvq9bmHOXHv3fDqxrS4LxvmsrrB5TAkSJBvuwKbhgnsWnQBjL0YN/VEiI2nO5zHeuvXe36mXQukQQtnva0BPCyUd5uySBOcYwXoYdtqCeStlQW0ZiZcILhx3KRNrEXxUUtH6AOokkccgU5xRsHP2MNLxJNxDNABJ6ApO21Cy+kr1SyBwFqkwYW0/7A2+/KU3/uj3/mhtOKiZ+4sbb++26a3/2dvvXd/afP2ljzy/uSm4OD0+Ozs+W99cr+eLN7/z3asnz+xce2owGkjOq9ns6Ojkg/fv7e0dRh/qZcuE6A7K0ebG49b+5V/96J0HuyeTcxnYyIg3PvJ88dRT9x/tfuJTn3jxpQ+fnB57bJohUCVkJAnAwEmHkzMPCRHyOIm0CYNiRs59WQwalV42TPU0tkrNDXeR0NUkFRRdOp+2cbh+bWtJqAuTQIwLnVOcl1KqyNu6HY6GqTZmIWWI87O7d+6cIw5pWHN6oOmp8s6bNyyb0P7CkhXdlA9AVkq1cP7udDow+spgsC6Uc02vKGdN9a3f/+bPfGn2/Guvedd+6nNfuHjpyr/6t//m+w/uHzbt6NJVVXScT7fJrxTnJZdQdE8lufUejYZkITpvZUy1poue7Nu0RE7mTsRoArvAxKvr44KHHxwevLuYeVMY+C0WQoy7hQrR1nWnMJ2iO6uamWtq77zULfaePDAlOQXDoTRF0/aVEYVe73RKG9WyctYOyu5w3PV1y0R8b+/RvPX3l/Mp903wgaVr39NFrzRHtr7bLivBHQRGnPOshU6yiFLpxtuoADgCi9yGbDXPOcmvYJXJpCcaAq13g/DcUgvLRHb8JE9y510gjdwQQRmIhD/hTJE6oMVWAt6tDsMnzj3tUD32pZJ4O2giZKRNBqgx8M4lvN/Kcii76MaC9m6RvFjJZCuQvDlmqilyAmMKoBuPrQdzTkiV96+hY3S/12U+1sLPfUuvO88yMT012qgQDAD9ON0iYlKcBZRwIgO5J61EOZAHsLPgkXwLSJRDEWGP5d9Cl4hlZm0uc1ckfczhyI2Nr5pkG4MJQblgtIYRR1wpIKUapGFh7uqolRFyrdt7OJ+jsiZoF54w4/D/kRSTSISSe9ILUQo5gxwxBByTsEgnTPjKO5E2+wpcRQC4uJI8k2VJwJrwg0xF3pU6xtjE6DEnkUjXGBULH0hYMOVhZ20hZEepoZRdLo1QypBRPNfk5eJix5RAKKRCmGf7a9z04EkAK8agtMS6zgOYLKJnqTZAlVygnbIQ7xerQg5RyLeISYXSgNcGMkIGpsyQjT9Uh1Lk8iTsyWIUIZPpMGrB1F2S9S8Y0gHLrBQ06rqKwZedEmmA+eACS70s5AAZ6bpgw05rDUEkHJJexD40utZ1ikIr1Mw2pEADrSMBdXiV2mXPfFAsas67WvG6Onz0QVzMfuGzr//Kr/yXpuy685mcTm9//7s3fnyjWix3xmOu5e5ydmcyWTKhS+M5r+sG/t7aemcDa1PwjjaQchVMbsHWVFk5MP0rrU1X66ptH+0+PDt4PLx4xVdV0e+PxuPD/ceKS8kgkAbRKCLwwQSbBaDWHSI19I+8s6l4LhUNEgNiB8Bo4F4oqEhi9uFQcmiE/lQO8qzJzkhvNjvPM0jokqgteZEx4YnK52Nd1x996cOHu/u33n730s6Fr/UGD46Pd08nd/YOf3Rw/KODv3jt8s7XX/3YzuVLx0cHB/v7g153U67fufGT++/eWVsfhRDOTyfT83MZ5bKyVZOC+PrO9pTFb/zpt2/cfbhgbF2J69ubT21tXNve2iqKqloO1vp/6ytfaNumrapAxu+MLOTww6XQifFgAMkAelgQT3Ak0+G9zw0vQmr0WQMIwAtCmHACEzAfIHoF2xIQOlPMhYww3LNAXhcS8pRRc5bOJQnQxbi+uSU7hWVc6eLBnXd3D/ennBUYLoUsJA/dG2x/SUUeMttRspCxODjByBZRKB2VOrft8vR0p9O92O1oawtge777p38Wq+r5z3w2KHXlmev/4p/+s//lN3/zT959+/xRLLd2umtrtXVSkPh/dviWWHtrIS1zIKinsoVeuyKuB9oCI4WEHsdFpn7u5ZcGSv8/t955fz7jSm2X3ZEpbFUJFscita1OaAk8asnZVre3bADglqK1zgjRkbwUSkU2VurFj728XFQnt+/3hBlvrwXm567m2pxW05P5dB7cpG0r76IuaucZd6VSMvBxp+uNevfo8DgAic6YrupLXL2wtWN63T/au3fgHFwUA2ArNLYIUssMTAqeq+w+F7IaJH+y9wROLA+Y8wggT57J4SX9VkWur5JFD88oxrO5FrRZY2CtayQDHQ8ia+niEO9NRB+sZFxRUxjy0hGsV+grwfYtkjMPIRdIp5nc+wC0l2SRIrgSmkVi5UVXW4xh4Yvn4UbnXb/s9bSJjZ07u0gHTGaCHtIz58wYo3yAX6iVGbqFcUvMEImV/S8CA7Wvgjz6V+tSVBacQQmL5IHDSiGAsicnMnUkT3/mCcOFzjqg5yCPpDqGgrkipqNjtKnrpeSG9tzAHbFpa21PaM7We33GdmlcRFkMWQkWmzwURacKrnUtiEnKgVruU0MC5TAeUfV4CYljEv0iHBvxUBjN41AwoVBj6FokyzqrnhZcLErNpcPKEG+OFbQJxXv2WQwvHfeeVH0h+1J3pI6tM2URo7OtM+AqcaVtSNV6bW1H644pFq6GaqZk3mshYhYUg0AcTiTuKHO2zR5kIoUzxplSJmb7VeZSKylb35amLEwnBq9h1ONg+c6h20xIOe+9C96HYISSqCfLqtKcT3UBnWGVo3224QB3RXBvLWNRFZpsXNuU651WWheF9d4Ik1KaTp2iwk0DgQ97LFq24WGa1NtKKICk3A5b8lSXGYjZBxeUoKk46yrRzqanjx502+Yf/O2f/blf+MUQeaiWfHr219/61ls334rObYyGXPPb55M781mUWsoUsSsfpFE8xtalA2EZC1LUriVUFGoW2QLMzHMlFkiPYCjFCWf7s/mdW7c/efnpVL0rtra9dXiwb4QsQnBMGEGpj9GWg1ZQ0aaXA5UzcgtPJ61tHWdSQy+ahKtpd+G9U0qTiqeQmtwJU8eH8xZgicV0ijSYi9JELbros84caXKhLEOAcEKKlz/xsYP9g3ZRbWq5feXyxy5d/ODSxfcPT+4cHf9gd3//bPJLb7x+8crFycHRclk/dofG6E5hF2ez1GSEUDfWhdC2tux2R5d23jub/NZf/vVJ3WwXxaeu7LxwcWujKEqJF8fj6XLxxte+tLGxNp1M+BOzcHKYIPGNKPKsK9BVzQmVwAzESoI0TnosznuClngfpOCOhJJSMxNE5N490eHi3oGdAByoS8mFQ9JEpCwOOV0tlA5RpddhlZKj9Y0oJEp5+d5bNw+X9ZLzjVThRRe4jd5BD1PCBD9r/9GWMoXC7IwGYhA8+1JVypQpXfAP5vNZU1/tDy7ogoXY1/rHf/W92dn5x776t8yF7d5g8F//xj9q/uf/8Yf379dHB76te1sXWu+hapftZmCqyx0U9RFehGKiLBQLgfSBC0zFDBfSui2uX9+5vFF2/ur+nfvVQmk1VLpr3VBprgrvmr7z211drvVni2XbtmuDUYiska4N0aLI6Ra6I2UReM+YdW2eu3w5SPVg/6zo9SvOD2dnu/PJQvC96cki+Gh07ZtU5nsnBA+eeeuGnV5ZmEdVtdfaGk5yZlG9trn9dz/+00Ol//rRvdQKM2mMIjA/AfUp2NIMEdyQ9JZJmJZwVdTuY/OY0a7ZGZncG2UWwGJgzNMUGU0I89TQEBiCeA0sWusY3FqyZCHeWsg+R5JDzDV1ZT4QIXQ1qc0af0iTAPTR6JfI2eh2yQ0bYUxEiHSGGLz3pOgHYfb0Xq1n0flxr2dSg2SndVPFXETTgs8HqAVLUVqrY2iwl16lRaIIkaNbzIUoUbFWqvDZz5WTDDn3PMpBYYhIRyfYC+64JG99tsJSYQiQugGJLauE4qgkPcIQup3CSjXXZtksq2VF+zPaqYUY1ri4NhoZoU5cfetwTwnV1wUnVqcQFunKoFGroGScvQrwBjCQIGdNxlccqSyVj8potQxm5HMGMplacbIwgeKQ7IlMkQYf1AGoRWUpOMtCCi1SgW9BMhGcl9L0pe4y1mW8FLIQUqGIw6fmJKBP8kASPlsGCJ2lDxXodFX0lpOWyd8AsMgOJTVuFPQF2UoLEmR2wWYnHeeVVFyIsuxIKV2wROSIpL8vmCDOOFZ06cs9YdOCqetfe+WVz1556vsPH7CigB1e4KlYAZsVnxz+XEEpVWgjuKrahWe2V/TSY+QhS8qLbNIBgBGHtJnQUmLlx5VQqYzlSmXx8JjPQORAXXGS91Ccd6TuGT0/Pj744N7Yu3/xn//S137+F3wbZPTN0eM/+fffuPHWTS3ERq/Hjf7JycmtxdxLjbG5DMFxrQLjtQ9VCFawIHjtKPxzF5mLvE2ZT2iQggVG34I8EgU/aNoisJ1O+crHXk4Z0Vkt5dnxcerSlLTYU0QhnkirEhgqVUKcYOko07DyAc/Baa14ZnFmPXXKqYxnDkMqVCEfwKneF+wJp4bn9oAOOw41hQaWl8orcZ5Y9rqR8d2Hu0py11rX2J5ST41H1zfG673ewbz6q/durY/Wrm5tBtd6H5d1s2ybRd0s6zaVKc5xLvuj4dr21nfuPvg33/5u5fwnLm5//rlnnl4f9hXEroCWOJ/NX/6pj7/26dfq5ZKAzTxX7AStyDrwPOsTSbJ8WbmxEYwliwGxDEGlfeBKCsuTKJ/HoMjb1mHen2l1TVNHz60NrnHEKyTItPJRp6IldIUoQox10x2MLjxzPWoty45v7Td/5xs/OTo6ZXzdFBxUMAvViCqkKpIxJjMuP2ZtNnLP4ZkaJLKiUGrrCiW1Lma2Pa3qNrh+WeJyxna5sJPz4caGGgyNKV596WMf3Lp9fHjQNk3wrj9ccy7k94qQLGgBHDwh3TVGmoojfaTKOIUkE1m/sZ8Yb764ffHGo4dvHh9IYzpCjQygN03bi3yr07lY9rtMlkYZxksmO7qM1pVGqCgUYxA+jaVUHamVC7xu68f7i4Pj86Z5WM9unh7cODu621SP6sWUh2WMFuhLYIBRNrE4lPrp9c2TZnn7/HyG6TxbLD538covf/ErHaN/98b3f/v9d0+18kKSJDe6BQ4JwvStaNxBx9UzT4rJImaYJ3jynkf0GHk8uaJnwyYisGwlgt1lIK2mTAUnRiwnOShiE3OeLVoCMUewIQbuEetR6kSJMylxdjWXUK3mEtbVCsNkQSA8Qu9D3AOo6mzqRxo+WkiFdgLycMwIsbSubqqPXLj4wvpWdPb9+fm9+VxIGDqhRHXWFp3exmh93FYjZ5eLRc15y5iFLJVLz4c7DswRWcZhPkmMU864ikF5R9EVrTCT/XSgYY0GGeTAuaOcmynXKcji9goIV0UF3A3MbeB/w9hAyqj1xBSNs7PZlJayWJine9Hz8em1calFE9nN3T0m1bDsWNt6Khliqm+M1I23NbbZkbwPVlRCgnIAm0z9T+qJNaxRBHisQLikQplm4pDBi2BqknFpEJAfpMwJjyA6VClk4nNxl7rJQNxHGflImbFWXaF0hC859DIVC5KRY/kTuRumlewoYSBmNg1+6lwrWMtZi8EbTJFoFZ/FSH0MrWuh5C4KgM9BRE+J30NUvdAdo03kEftTJiNSvMjOwQEen1ppAAvhqZJOtxVMdFr7c89/6PVnX/h/f/LWMXzDGRTwcTHSKa2bysXQMZ3ULqTn6AtjTKouBHT0wNDBW/M49BzcvhTCRFYfI215iVMIHDBGPFSHCaHhZCAxp+4Y3ddqur93/PjhBSH/5a/8+ue+8vV22ejgmr2Hf/yNb9x471a/KDZ7XVV2bp4e36uqoLTioSwKz1nDWBNiE2LlncdGonZQAQS0oWHRRq9larhT4EZ2gICaYCEIpU6aVPsPWvuZV14y/V5oG93ptPP5/OwUFQmje+JACcfs2oGYryTCjZQKEFpC1GdWK9mEKvKPinFlLCIp4woK7WKFKogklAyHFmRg7IBBSSJe0so+RORSGMB/IdaGo9293cV0qZQKLDrnXGMVFzuj/vMXtpeN/c67t4bD3qWNdeY85GXSX1qbsiw6nbI36PdGa39x+843fvTW0Og3nr32scsXO2C849UIXRTTxfzS05e/+NUvO4zawpMBYgZmK0ZWgOQtiBhGdD6aKhGKlXJwfDIKzLb1OdhAwA7qqyF1vDToQ25nrXO+bb0LUIHm9D0AVRYqRuV9yVhfGRmCX9bbl68Md3Y8l6LsHN25+zu//3sPva24XNemdXApgNgFpATZzPo6xkKlIixXA9DzoQklocnSXWKSagEhpFHKgbYwqZt+pyOin9bNqCjUbGZ0ofvDotN56YUPv//uu4vF1Num9WGwtuZBUAS3kbzdvJJSYwch0QoJILE15wXmpV3rvnD12Tc+/NF7h4c3D3aDMYWQBWfa+5E0z2xsfOqZ6z3BO4xf2djqSK09L8uOUNJaS+NAI0DQcNEI1ZUKQkSyNN1FZDcXp98/PbjXTE+jW8RgeYr+ANkz69GpphZEGO+vr60Pu/2bZ0dHrvFSstY93xv8+pf/Ngvhf/vTP/6DvQ8WnY4FjRWmaTHdFEYqDYD7EFbY4vAC/v1EA+vJ9B8izCyj4VGBCSxpGd1NZBNYfilaqVpns9YpaQSAbZC6W04AFAgHpYIEjA2qZcNKYJdnCQdc4kiJIEVpmL6kNoCkpdBncQqetPTEfDRjNeDOADumdKoVF0boad04W7926dqV/tA6+97Z6V5bI3QzGidaa4eDUb/f32pd2TTTpmqFbOGjZlNgYYTAImdG2nBl6XZ0+4pM3TFuJlcK2TWloHRJvTIXjgsaAQhCpjEucvnAYaycgoliPPfBkfc4V2V5qLVjcXJ2Rpb1WXch/ZHu6fVxX4go2M39/aUPqeeGhSWY/1ibGwN14qg0CUiJ6Gg6ITMXAtAeDDTgzUpTVrJyRxEk6PkQVBthkZw+BXTSYYEgsL+LJCzAkcUBgif7yPSESi67XPYVNzEw55XgRkrufL8ozBNEbIwkwm6EKFV25J56N42+ZaxO14BZTGdgW0j6JimaUwvKib3MhNEGsHdPjws9vYBWgut2eikNeKlSq5l9f2IWM8sCmRT6iQGiZPoo+nTy0sXLd49O3p/PRVHCu8ITGSNEZ7RRUjvvEaN4NlemHy2dY0/8PA53P1p1gDSbanxF5v/ojjTWn2RArxgrtE5/gyeuaIQoRFfx873ds4O9i0L9s1/+tc9+/st11RacT+/d+ea//6337t5b7/W2+r2gzZtHh/erJTOFZrwsTOvj3Nml96mICTb1qULUrYO5IbOM1eCyllqXkJ5XShEQp+W8to6nCsPMfKh9KG39/MULl569HrxlIbVWJ/sHLD1PaaHzZEEohptypMly5tCrFOTQzwLzZjS5KwqYYeAkQjdAZFs9rjjVriw9OoW0lQWSgBhfRR9KVnLleM1yh+wgCs4Zd65VineKzu7Dx9bZQhce1NkU6tOh8Fe3t6xrvn/r7sZ4sDHocdjIaCVLU3RNIZWQ3fLt3ce///0bTw17X/jw8xd7XeFseutg+ppOZ7lcrO9sfOXvfJUJ5pwTq3iJVskzqpoJ6R+jZDL3MIxwHQh9+TwTqdGDnIKZMxYBNtWxERYgAF56S6Q1SAqnaN3WDeeiaVqSJUifLkvDRxWF9G4AVzVb1YrLqy88rwa91HaVne9861t//taNXcYLpUbKSLiGLq2fY1+lUYjYEGbWWskLJWiOw2hFz3mWVA9MKQFxnui9E0IqoQLnc99OlstOt9t4d+/4+NqlS+0HD4XU5dq4U5SvfOzlu++8Wy/mbb0MQvWHA0+QNMRY5ACf5ahZ0MCSKA7Wu/Ndzi8y9aVnn9VCvr33qOZBeNeVcqvsdmIchLg56H/0S29c/Pir2rY7V68ujicy8NbDsc/b1raFLjpSbvYH426vUCYIftK0h02929Y/mZ29u5icMF9z5oX0QItEJrRQeZgBtTIV2LYuLozG988nj5plw5jjrN+0/+CzPzMqO//TH//H756fNt1OYDKkwOWZUi54mw2is5oVUgDGXqTslqGFKSCDJ74yoxcierojJMFAu7Z0OTyUWrN+LCJZgAIRuTySYaDI8CQyDctqUMiXiujjQOXiUMKijOyeZPCSsVJKE6NmUZFUd+oboxKE7WMR029ao2hoHIqUrbkRElCOVNxIwV0Mp1WlQ/zMtWfWTLHw9u3T45NsrkojwuitHY83uqa8ZFtVz6e2dRzUI1hIWRw5T3JVkXsec8mNkkD4aEIqZla2Dvg5e4URBAjNxTp3DBvE7NyO3IwJOhFwCU5MrgAUXbqRFd3ekdJesMlkktcFSIbpmdr2ymhtU2mj1c2jw5Oq6hcaYjHMkcGAkJAuS62WjwGsQEZFSs7/mTO0UqfGfYq0isCuirwEeLaB4Lmdz47Q2ZogXQ0X8GQouKb3K2k2kh4KK6UeSNUVXAdWyBSqOU/vVfGgWHpVhdKobaWRKUgTGSBysQj+uK6ryBoRwQNjFkAFTF3iikTIGtc66ykvquyZQIUFweljt+imx29UqpJTCBFhNeIjBjBNPKV4srEXeVDEhTT6bL68P5k8bOoJfo3m8wRPIaFKDJAzTwl9myRqPbW5REqmlVZ+7JE41VCgQcLnIFJDSzwQFxzDpnQ4AHFKz61fqJO93fnh/hYX/80v/fJnv/ClprGl0Kfvv/vv/q/fevfBvUvj8VrZDca8dXx4v6mInlkURe3czNuasTZ1pYFkqlsbhNYBCg5t6q5CR2uT+nSHaySs5PPatm3TMabU6fY1jJ20jWZhJPinXn4VCsO+0+kuJudVXQktfUxZwkYIlD1RW0TVLkSG+0UCruN5cJppeiKWk58QzAUA841EKCJoXZYRIwZkdjOhbhGjXbEa5eXfSt8QU10BAz83XltTSuzvPY6BkeKHVDylNO9U9Je3t1vX7j4+2F7fUOQXqRXwKX7etLvHJzdu3bm0Mf7089f7QMMbkPKl4IUxy7paWx9+5We/0u33LQRE4QtMqFRGhHrcI8LWEC2R7DUFQTABCIhZCA8Y49WVjKvPKNLDtqQpSxgsevxeCNk2rWuBSAyZCgoCC1Gzo4qx8KGIUYcYaru2tblz/bpjURalm89/5xu//ebp2SFjW2XRYWQByYui8DHO26aO6UIZkZ7Uok0FnNYGnEYUOWLlxsS5dU6CPBTSz8c0KChMy4Xz02U1HA2P6vonu4+ubm7HvX0eWXdru9vrfuzDH37nzbd8U7fV0vS6sugAE5mCZiB4d6q1uBZQPmfRcG4YL2McOfbTTz397MbWd26+dbxcdHod7cOaKS51epe7vUuD4bDb3XnhWTubLXf3u8rYuqqXtWe+auqYbp3gNlxYH4/XRmeLxYOz0wfN8oOmemTr9+ZnD201Z7HhZEjFg8zT3CxOngrD1CytSXOp35/a9u58eh4tE8qx0FOqq/V/vPGjHy/Obb/rPfo20lkSwvtYNY0H9hAUxJWoGSmukOEd2KCC7GCIBY46J9CkNtsWBDJ+WznqQckORCNqC32WfImUYGhiBHAu+XKRzTbkd1DDcnr12OgIxpVgOj1qUXLe4azPRQkrRsOY4VxlqQnyhEDqRuoTnJvURjBUzlyRkCL4+47Fs6oa6fL1p68XjJ/59u2jgyprYVAXlB7v+uZ2R+krrgmz6RS45zZyy1jDIxiSwoNVEleazDSQBxciKu448yxva0RgQg60weaOMhkcZ4UIZOLEczzJszNOk8ooU32R3rDkXEpRBFd0e2dSeaXOp+c+OJQbErNB7p3b6vUuFUVH69tnk4fzSc8Uivz5Bbay+IN8CK0D1cQ7ontC1IEUJBgJ4wny4lt5QkHx0CPZ5B0xdf5CiVUTLIm1hL+JK5/W9IKVkEal04oVVOhw0VeqL2RXatBpUkCCBkRKvYDapnhhQNrx1hshNTQOWxbOg51FXwEr5BhrIo0YIiCjPP9sKZdYGCZKbZRY7aeVVNSLgILGpFJaFaCppT+9sQ3RUtPHzJDvACGO7OYrATPD18a2LG4v5ifBy6JAUAzAXccYoOrFspQLhVcY8DmoCtL6L9PCKbZKsIQJ4wiHZeAMkYdkiCSVSTsAjfoMWttcSd5R4mTvUXVyPIjxH//dv/f5r36trVvDxIMbP/x3f/h7Nx7ee+7ilT5nNRdvn50+snVq4nDQ2hgr2uchOkutAmeNdVIZ550XvAbAODV6wcsQVGGilNO6XrZtodR6t1fCEsrBn3K/aVJZt5x/8rnnRpsbwVoOvNbZwSFH5eMAt/PQ8CScBBVzWHsJQgylGgzKVrA9Dpg9oG+FrTppvUCtRZD5AYjiILnFXAtSY53eIG2PcdDDqr7JIo9YpqDugUOfc5sba1Lo/cf7kroAhD+tpfdOc7aztuaZWMymnU45r5bn88XSNpP54nxenU3PN9ZGz17Y6KQCJRYpCaUaojCmruvB2vArX//yYDxo25Yg9IKv1rr4dBxyi8TcENglYF6X17TZYI0UvuH4lmUFfCSSPXZ2ATJXjkA8HFr+zlkRZYihWlYxioYoT5C6I0UFHkH/da7LRF/JULfMtteef6EcDb2Qsjt4/0ff/90/+bPbzteM7xSFiD4rnnhfctkpyzbEs7r12OyUSlcsnta1lKlQxoiSmBw0K+GNtRicMKw5gxI6VXdaL51d2nZjfe3u2dmd09MXt7frD3ZVUXTWR91O9/q1a+++9ZYU4nQ67a2NU57lkSy1WGC0/dVYghRSSefGSl8bb+xw/eLmxRjY+4f7UYmhLre7g3FRXt/a/vBzz2+trUkfqoeP4+PDsKzq83lV2zr6aVU7wab1sg6pbWydvX98/GAxf2jrh2194Oozb5dCLEPwgnkANXxWQWPZKJfERL0rXLw+HCuj787OToJrGbdoTJvgf3Jw8Cg4a5RnMgjReO9YIBKtozJRCgeyLHV+JIBFrkHwmaFDAsw5sIfOooWlvS8SjIK4I7CvqYdJV0ABQkskNgJZgyZEuvSEnyVtBsDnHRB2Anq3gU6riJGTMJmImgnDWF/poRADIftC9DgbSlUEZsjoMIK8Knj2FsmG9lFFVijFSBYm8tbR0DtazyZVvTPof/rS1Rj8Y9vcOjpySmcABKdhD9/a2Owydtk27ex8IYTjrOEp8ls8uhCEzyEVQ+asCUn+KsFgXkKyA6T1JYe6Q6xqkhfgTDgkYEJh8Jib/vT1JMQB6hJ8YYRE5WICK8ruXCmr9XQ+a5pWQKSBAOQhxLVCX+v1CqF26/r26UGpzBAcTTo3JE8fyRlUyRBz/0o1NaO3LwRtDoA8ypgxsOzyUgA28JJ8+ihZEOIbLSBWwXD65EgYKPm5Sf9Nh6gj1FBrHVwBTh4XQN8J4jCkVE0u9ZILzdM/ihVnyHl3Xtfz6BdAtbcxNj6VhY6QPiu8pIMULWmLSSFLU3KWClzQCqGxjhUg4AxECElHxeEPBbEq2+MLIVPCEty21joPdSQY8RBZFiRjsoaTGhaHUQTG0mNhGAThWSlJttQSMMegsk8I5BMEeT1AbVLwDDjPqpzZV5rTigUvzCipIQFK8ix9U04PD6ZHh53ofvVLX/v63/vPbO2M0A9+8L1v/eWf/s6dWy9sbD5limWMd+bnu23jlTSQ9XCcVSE0LDoadoIOWKezrhxgQg0SnsasQmujjZq19qypjFTbZX+slcRO18WskX9g2wVjvGovqPjSSx/1bRtjLLSenpzWTcOVjiFYIKJdzigAUWNoIUmqIb8Rlhp7UMBpIiS0oYkxBNwV4M5EOWXEPhU0jkOKEBzinWTdxODlILLGCc8FI5HtJQq2mMlLIWxubUohMExCewCfahiXOubDqN/lnM8W1fmiqp1jEWx4pdYGvVGn1JiAKyWN0QpJqG3sYDz88te+tLY5bpqGYMxEk6K0S8OvkAVGqF7kNIt+MlfM87GcdQMpQGIJCKsP0uz0hOsg4Qpow9nWWyelqZaL1trsMRxgkhQCoTQU4zoE7XyHcxNju1yuDUdPPfssjIq1YPyb3/jdbz948JCxjpIb0D2mdwVyJ9MxdLlQSk19OHcuilgo5YWYNDUXvKtJJ/mJ1EMUUtnWlaVxLlgfdcqimGgqObNWOba2tf294/2qta/sXHZHJ8NLO0HLjZ2dzdHo1s23GlcvbDta33ArWSUFHRsBfqCMQoWogh8rPWLyhbWNj1y5djg5Pa2XEpL4G0XxoaeurY/Ho51tJYVfLkLjHQrNpXWTxXJSVyfVchrcNPiztj6z7UFT7TXVnm3Oma84q1hskR5RGwmKGWQSQNFGIXulQtS5K93eZn/wcJquWysE3OdRIwnppY5KOMYb74C6gssOxAAIrpYSWCrkyNNFQXw+J2O8Xy5AWAJinoChKZQDsKyyEhHOu4+ONDRpsZUag1QUEQKLlgNonUOAJTqLZPaWGjS0CiJLG6u8KEIclryUsstFj/GxEL0QxpxvCD4WcT3GdR87UA5wsGeMHFkca2bnW7T6zJDuouceY1cWWGlUFcJ5vXxh68IrmzvO+/vL+d3JJCoN+6GU9511xqjNtY1eiJttUy/mCyFtIFgJ95mwA0ctGDD6lYk2rI7SwTBoiYCiybbSspvyAeUlIicxzynHZWNZwVYOachJBMWSSHKSkUcoK8uOU6pSet7Uy+VSKvjESrJtjl3GnhkOSiGnjL/9+KGWesOUqV/hqWqAWHeehq3U61MdLtHaZkdIvoIfppLAU1EDMWTxN7YbqSXEPBaHEvhhogVi/Qu0HhhQoKuihmAxFlyMVTGQusOViinx+OgJKSCA5PLecZn6XQNxOArPVMYsma9ibDhfhLDw3go4REG1i0sViY/GaAjJfPpzudFagAMeOJmgs4zkJWVMEZ1z6MADOTNCeI4pZWhooY0OMbTWCiEMJmg4wZKcSiEhQ70Z5BSgrZhHo+BeB4jI0PyInBwZrQBQzeCjxVz9gMcFXk3IwFi4kSuhRHo+wOVxkv5IOWZQlNXp8cnBfhnsz778yV/95V8NjZNcHb5143tvfu/fvv+uFPyVrW3Xtg+a5aO2sVxqVDLQb+NLZwMTgHukdNtisOG9Z5JbjDo06gatzSL4o7qSLO4UxYWi7GE+kUqcwGrvoBGiTpw/9b5Uoj45+8yLLw6Gg9Y5U2gm+NnRkZQSY6xU+Fu4bEXqg7Fl0lKg26VRiUxvUuDQo/4FuorwVMSyF9SnpgeDR0msRMllHtJmJRxBLpkoX4CjjjJDoaFQhpiZMyCAYHxzazMKMZ1OScQfuKgAp+j0Go0pjNEdY/q9jlGyKEujVMcYOD8KXSgFUrqR0jk3Gq+98dWfGa8PbdMy4QE2ZKSqAsdFQo6FXBLAxo0QlE9kYalKphzM2GoHGGOuDjGaZBCehC9c8C6rSCO1aO9cVVeCaw+rYwyfI3n0pZreReVDyVkZYb5TuWvPPdNbH7femrK8/877//oP/uC2sxPGNsqyx+BXDcQHnC4Bbw5MxdiVqdI9hjtNCVxnZa2PoTSar1ghFrvAIHnbtmVZ1K71MZa6sLaN6b2Lxrm1ssOk+Pbp0QUlr5W9ejpbv3rZt+2lZ55ZnJ48fPRgaX3ZH3Et4Y7OgcmKMgIiwGIR40iWfaX8YnltML44Xn/v/l3Pw/ba2ppUlzc3NtfXO4WpZ/PF2bTQxrZ2Vi1P5/OD6fnUtad1c9AsTmwz8Tb9r3OTEM6Dm0f0r5y1EGROEZ8c8VP9Kz1J52CK48AJ1EJs6PKZ8dosuDuz87PYOjJp5nn83gTnEIJcxFAHe5+VoImA+AYW21K0wZFVHe0onuAl4O8HtfhI4POse+aYJ9IAx96GMDsR64ls74FZETW4FAJRZsdAfFPy+xJKIPmylR4jsMCcSBYm8i5a3rGQG0KNZdySYiPES56/1Ol/8cozH9q6cLw4P25t0BL2bMxDqzUw7oMvtAGxgbXWUpOtsSOatG1t21evXH1mMPTev3N+tltVeYvMoDPhbKfX2RisrfswbJaL5aIS0jIJTElsAYGOQjioheRGn2cqDEwYgwyOOAZUs6aU1dVGkhlMjuaUw2mYsBq0sRzGV8DXXPRIzPQ5Y4XSqjDnUlYhzGdTcGvzIilyrry/Phx0hXFa3dx95CJbL8sI5bM8pH+yYUZVBcypCOSKtXJ2ghlDTOkQqm+pOUHE8JCXg4FrpKU79b5gxxIPJAOy6RKmpMaFCEExVjDR52okVeGihqgO0MgMzn2QWoj05INioqsN8cgbbx3nM2fnvvXSLFg4d80yxKiUjb5xnglJ2TcCFCA51ylZpsOKjhNNA4zNldQZE5b5VdmTWUuDLiJdGXRaQWmK55hOCKF0CrI0HEIKzMajRBWwqX0UIcLUjFSlaQTKITEnOdYEmookGikL9MQspI4526vH9HYVOnTqz1aPxWvcUhmZYswIWSoVq+XR7gc97z7x1PV/8mv/UAstgji/e+/9H//wPz269+3J6cv9Ucez47Z53FStUEZJIWVtHRNy0jSoflMBXsEDnBSXBGRp8aKZkcJpdVBXbdte7nav9gdDqUpsTCLyaOWdA/CbczHn7MhZLmRd1VvMvfLRF6Ek4DtlOTub1G0D07r0cB2LLTz5SauJTAO10pBFl+TWoo0mmgCJLqdwm/KnJDIGKSeT2QJqwfSKIPQSMy4hl0SrWU1g6S2kw2VpN49VcADomkStBdxj4+bGJhNsOZ9HF31wRhd5PSs4PIUY/UxawSxHQmNUeJWSc5Haaqla2/ZH3Te+8vnR+qhqWiUU8aDIO4vk7AgekbpJaqRwZkiHIdukxdy8kLxMCNFBOQh7o5WNFqRKgeaLzqVIrjizDSwjBJtN55AQg+gSF+AtQ8wEfY5woeCiw7lOb9GuDYdXn72KqldJqb/xH373W/fvPUSa31CGRCJCCFrKUquCs1FRbnT7I1OggWallFVqha2UsquUTbkjlEaR/D/nrA1ea+1d4FIardvWGWXIfLLQ2rrAvSs7vQfVcnc5//jFS935ojscmY01xuKlnYtv37w5WSymbV0M+wRzIvITj1EGXgg20mbddLTza1JfH29o62fzBedsrIpL483LV66Y0rTVspovzNqge+Vi29QfPH58vFgcVvNT707a5sQ3E+fnITZCVCzWMTYxWMa8lJZGfIrUyjws0AWSqCfBuJjur3YxFD58eHNba/H+6elRsJZWkjiNQP4DakNfjs6msZYDJB7A544iPZ6QHbyg1Zy3lnRLIoTSwRgk4jvuK0miEeAUDkXgoYRV+CBFIE6GOT7/GolLpbpZwk44SAYZFVwZkb2nODCzAlgT3pGqy2JfiCHnYx43lb4g5aUgngny45s7Lz/74s5wXRT6xuHjvbZpOW/TsQsM0EgoHLOOLgTjjU0PDUMUXsp0mY7rhnv36evPbUndMP/j06NTZ5GAqZJm1tnhcDzqdLedVdVy1tatlKAeEfQn0haSBkExL76z+DBnUUemVqE1ZJYvlwNTSLaCd4MwF7n0MluNZAwUJydXFNg8e3AqQKwwheaGia7RJ0a1Qp5NJhlguwo8wrkrg8FIp79uHR2cNs1G2eXkfyG5p/UbAa3RWkBSSjyhMaPuyrjGmKsBDAtzhCOhiCdbOZQRUNJysJbLUov4dBI7DRW54aKQfCTVkKlh6m4Fra4jOC3RWyWkNoY2eZh6kcJmsCw1u3UIi+Arxs6jPw92EVM5Z0mwioYoGHkREoQWq2B7C5o5E8VltZEGyC0bFoostJmFSkEkikwprpRUXGdAGfAZVJUwHzL/ipFUYkaiSQVWVUi/4OGGBJS1x5pTcihs8NTOkdBspFfLCGQhBUkI4calmCtlitmQAWcq9YVRc15IUaR/EB0pjx89CPXiatn/737jn2xubIQQ3On53e98++bk6LfvvV+azvPdgXX+sG0bmqpKlVKCMbO2cah1mRQLa7nSQAtzzqUj+zCluFaT4E+XyzWtnh+NL2rdiYHaPPhjp3fRANARgZW3XJy0TQOU/fzxwU996CPr6+O2aYw2RumjwyPGJHm1MJEOCeriSHKzhBiSKG4Av8yBi6X6SmNqRjJn6dEQzR8UiZiJ6gztY/CZcvhEFUfk4R14Ppz05DMnOIO3eLalArY6lVxGbW1vhcAWKYJzkjHPNL0s4A8TjnSeokRtJ7TUGgqgqc11w+Hgs198fbQ+bG0LCRfSiMzqaDGShxj9lIJ+zOyoQN5KPIMmAjapjFgfPCtEk64Cg9gulZSQKUj/l24RtieCi8Wydqle5RCkDOSdDlxslKncZiZw44PxqQ8Ozj37wgudXrdp2263//6tW//qD//vm86dRramxIYyRDIkP/yO0jIEw/moLIaFGXV7427Z5VyzGFDVec46hQqeWe+NURL9AwMFoCiKpm1Loz122KYorHWK3NgiK7VuYni7Xl5V+rWNLef84NpTwbvO+pi39vad9ydNXfZHRacHD/hgpNZSmMh6Qg6U6grWE+KK6bz63Auj8Vo9Pe8rs9nvj0fDsttJudrozuULvZ3terG4/d57u2dnE2+PbH1m25n3CxYrFpsQbYx19BYsINovggSbgruFbuhKbJvn9UDMAobc+W1tLg0Hu4vZ/eVimStFSpCsxeQhkt0KWjTwbWmanHItRCdJs/tvFAcxocn4QRIz4JnnSiAedLFaktkk3V9SSwwZirjazqxQjdQNwf2BnIDIGJ9YL0Q9D5SEaKsiYpSRaSa6SnY5Hwm2LdSm4Fcie8rx68Xo5ac/cv3as4Uq62D/+sGtH5ydTFm0qBJpnO1Z1i2HeqK3zuVRaPDjbo9LtTed9oV6/ZnnOkycB/fW0dECTSbBIQIsXDfWN/pKXrGtq5ZT74i75SK3MbaAbDqyK1mpZ+DhSSiTBpVST6CcmNXn82XMqDVKCvAbjE/oSwAvsJX8A0gxIUPJAy1u07dzbUmCpSBUklchz0Ie3Powaa1jscPidr/vYirge4UuVSZdhki3N7hgyf6CxWgUULs+sL/JVZixQqAxRI9xMyDPZHG+Ao2RMlnXuad93JhM5HxqAOVUaJkV51qmW9qLciz1mtYmMgMELw9Rpc/pdVFQDA4xOAgHI6zHmsWlS73Vubdzzs6FOPLNqbdLmC6RxZKQUivSaSQFcu6cba0lrhSCO9F2IG2hMqwWvrb00KHY5zyLXnBhtAHXEYMzYMeouybxkFQNKw33ZNGr7ahuFPNY9Mrs6U2G2FDtdc5h1LzyfIb2B7kpcS1Z9rbAkDVkaUsRWWpook9fi/20pDTFaR+cLldH6fnkzC4WY8Z/8Wtfv/TUVVu3orUffP97s+nkRyeHj2O8YIx17ty7CpwUIeSybbiWC9c69INKqUXdSBibcyi0El9MamO1eFwtZ03z3Nr4pf5wh8Uu2m4Rg+ZcoSerncUALX2U1rmCsZKxNrJzzn7S2G/+2Z8EbyWLrm2H49HGaBzqWqdIzYoY+0qrSGZrAXN46ZyFgGiA1qcIgBXFdIxTynGONKxWkCUoWaJ4iZDEYs47KRRJ0Qow90HKIUPSDPuMPlVGyMS44IE764m7gyY5iFVD8MKLL7z0iZfLXgfiAtGoVEN0y5IaXywvKMkHXaiO6WrUeVKLTr/3yc/99Hhn07lAJtzgNJDLfiCBwNxOZqsSOhgRgyBHw/B86UitFmV9Nm5D/CBIDuRJHUKMb5qGQRcaFhqiba1z5A0anLdQmSNpBdgtg3yZXoTgqQJumq3NjbX1YdvUWhZuWf2Hb/2nHy2rQ/y4JanmE0BOyCbGuW2j0I33Tap7A7eux8XTg9GHR2vPafVMv+99OKuaaGQrxXmLITPP6kCts1rwqqp16nqdB7yfeV9IWUgVqnoLS5/vPn541DbtZNKcT7mSIdhXX/nYzmjErFtOZil2C1lqXQhZMDYwaqB0l/OSsaEQz+1cHKyvWRHGg/71ixd3di6UZdEuF975cjgUUj56770f/Pm37+wd7lXL/aaaMzb1bhFcHYOXzLJQB5/yhwDQQAgbfYuWtLWWmKZAF3BSinUY/BPwfCjVznB0tqweLBazVAwyaz3ZIDRQhHE+mxpZzCRcIMRQdNbjHqR3HLKrCk2TU0xVMFqAIRlaR5LOTZkVfpxKEa03hTWZAkWGRiM0k4MvspnIMkvAORI6itItatKYUgLQXYUigCY0+lM8TEW/YkHb0ItxLMQVpZ9x/ENy+JkXXv6pT7+x9fyLrel7Fm8fPvrhwaOl4IEY+ghrAXUh92ilAF+HkYbVMa5pXYTYACW72esPlQlCTF1bNa2AFTHm8QxaqtIUhYis46OHlhsQcNhIIk9SCs1GvuR6Rxxm8BxQMcXsl79yXxCrhEsJk5MVAxnlZJpGzKq2IW/RRS6MePZ3Z5DuUyyakNJbUZgQgM6DorAI3DE+aZwLTAe2NRwxFpdto1I/ngW6ODn95+IupO4ngpQGTllc2RvS1AJzDjCrwTmL2Vw1q+gproHNC0Nr//4zz/zLT3z8ixd2SgenlJUYEGO+w9lIqB5PNycrR+J4pKcYwIPmK1d8IPCaGBohFpEtI1t4Nwv+zNtjX8/BQhtxzpZLzoha7SmPxqydkvKWMZJ8AUEZBBKBAm22NZU8++VQQcuVUPCi5ix48oaDpIsjISotIL2XboiHDF6sZ7Nf+ORr//QrX2ZNK/kKjUjbyixF+kS/KT1xlwdAwvo2kl4ddnZEEJGYxbuQ6yKxIoIzn6U9YUnJFROQwQrzs1MR3RvPv/j5L37BVY3WxfHde6d7H0y5ffvsWHGxobXlfsG8Y0xqsPhT6avqlNeZkHLeNAKimyQRQ32iKc082g9m877Rn1rfuC7VgIueMan3RUnmUnUUGpL4AlKiDukWGc66QKVVURwJ/js/vPFXb/7YFJ0AiecrT+0YxZmz/z9T//lrW3Ze+cHPjGutHU6++d6qW4nFYijGFiVSgjqo39ctQ92wLRsw2rDRbsMw7H/AgP3RHwx/MKC23Wib3c42GjK6RVGUKIlsUkWRosRYxVTFijfHc0/aYa01ozHHM3fRkiAwVN06Z++15nzCGL+hpdApmRRbqSwYYKW4gtCwNG14I3xgVybDZ8tFzFcyPsEMgkuIOYKNjJxYvOeB3ekgfeBwYY0jw294jcvXGNraxGnkmH4gp0FqqbDwwusWrzxz9WOf/Hgz6bquM+BvWKsbo61WTVMKNE2qfCqAsXP5G3P66C998uDaFeej1FaUX7S8YjCUYSoD7A7e7MhhXXmj7KYa9JsqUo8NHJynDgDq6EY8t5JJzvCtBl7rwUGApbci7z1bfkPOPtUEl3LCAH3PnwIFr5LXOUfntVTXrl7JyaeUm8n0m9//4Zd/+vp7RCP+TCt1TGEjKS39+xDimLMTajF6z+inlFUI55ruud2968Z8dD5vjX287oMgR+JkGGClKIdKhiGe7WdK6xRza4zBwwyaldg1Zlvre8HfHYfgnDs9kVanFLcunH/q6jWRo3crI6iRqtXWENksJto0ma8HecF025OZmnS2NfPdHd1Z2ZgkhU/ZGLO+//gnX/3mD7753XcOn9wPw1LkdU4rLEU5lta50r4HThOgcn4GmAWFVLG81MJAIIkhRZ2jABCUU8zCxcuzeaf1jeXpExdQ8cly6absUFIybrjUe5SQOZhhDttcC4yi4nRlqXjZgJsCJl226pUWWpUrn8A7S5Eh4QhLQ758xmQKPxvG3CpkkAYQg4fzh1HuTnDmUkwyS/xACYnmta/HLSVhg8gMuGmEakXeVuqA6KAfP751/rO/9htX/tqvyotXYtMqbW8/vP/dOzceS+mgyadylTCQhBPemI1FRiktVCPV3Cgbkyax9j5Rvri13WUZMx2PvWNTA7MIUZUao4wpX7cMIXpf0RmQBEUeJ1RMXM7vu+erXoJkZt0H7Ch1Mo1cVL5N+c2rzvVyjQHsybDN2gezSUtx6bRxqQgkGmVOq53Ichs3TZt5/4m0apIiKXM8jKWTDPHCbKchvS4VDZlME6UawVYMsLk5Pz9LFoOAC0Ix+A2FlcslVe4n9lvGyNKhXO2tAoT38hefNebLN987DO6zVy7Pc/Qhsmwgp9gleaDbXWM1SpgxJpep9DdKWa3R34E6FZNRRiEgyae8HN0qRq/UoOQgxYJyn/I6006k//Lv/N2/ee4irdalQcQNxWE4sdzeIeWohIHxXylcL5ugffaXppCdQDQS/1dC865V4GEkVi5i4qcoUPYBQT7SKsNx+uAQqIdPjpaliZTcmKWUfPAsXNM1F08oLQIsxbxhCNyXYSIjIJ01ikTEc6uFwTRYyqoPQBxpQBB70rJKtlrTln9cv7hi2n/9N39LEqIMh/7eT3+URLwV3D3ntrS1Qq+cYwIRKbkMTmq5GIZEZK0cQ8jlIU5w4lLwSYhkW/PAjYf9+IHZ7OXpdC+LqZQza8rfXyo3fjxEFMKXMkQEUHP7EEUWNtNUwxpBaU30VqLPf/lPj58ca2WT97PZ1qVLl5LzIpQaoinvoTSMA8PzE2MgJUO5bQIhZqB8iNh7YRiWMNEYfXQVWos1VkY4LV/ViRVKIpYyppyTpZVGNhfeC+ybI5v1kdgWa/41cI1gFPgUYJ9RIaXBDxeuXXjpYx/ORhirbWvxdiOSVkiplWmNwKVEwHZGoo9+4hNPPfcsE60ZFo2uQuXKli03JxZyxHHLxCcmRpTIlQcDpXIPeMUbc80TIyV07QzA2JKlhDU++NE5go0wIns/YMQHHpZHBjBlnyojspzBif0UBoutMA4XLp2bbm+NQ7C6eXj73v/5yis/TmnA9WJIGM6Bp6r8Kj+AEH3wYwwrFz1t4OtEKcQ9016dz+eUX5p259r2cN0HJbIWK+cTZ0sLNWLNHJyXlPHHAHyDrY9RslNmSzfrlJduaIwQzlcGhbaXr1yBmN2b8g4qUQqI2ErZIEPwwnz7me1z13fPbc8n42phJ9Puwl5zbiu3Su1uz86fP3z31rtvvn3z9OReDvd9f+zd0oeRhM9ZaIrRNSHs21bGKLTMUoy5VIB8GZfnCWS9EAO0KdD4KJliNtJIIa1QF9vm4mQy5PQg9A4I/1D+qJoXqXhKXPpZk6FjQHuNiYRQSVCpKEtdBHWwjJDXKHAqSqsmc01QjykaabSwUiAFQBkMJ0vxXqpHMEFUNY/nmD2DjyiTC45CViStMOWPzzDMbHIrDSkR6pKz3Jc+SkwEjTFaKp1zI+WWlttCnEvi2W72oY9/urtwzoVBpqyleHx46zt33roRxl7KKKUT5BDsxUOs8jNg+5YDyAI5WUkqxZlttJA9Yv3Ob22bcuuk48FF7nqAQ0Y7GxrbWCGa8na7gJ1XZHYYCyvZrFfHtTVEkBFxAmhiYO+q4ilv/kU5c1gUXg6DxPsfoZhsnqsFeMNWzZnNS1yR1Va7Vs8uxEmOhmLXtfW25qR8KG9Px7FP3oe4M53MbLPGzMpqqUrTXEV3uCcAIoNSHBIynnWVU99zHiG2oixBqZiv/D4FgW0TpLgJsOZGCv/sJz/7H1999VQiFhj/q1LcEepc02rndaZGGQqBEUADkpwba4CYIiV1qdm0HKIfRfYqD5TPkn/shpMY1xyMpdTd9fKdu3f+s9/8rY/v7qvSyWnogbIRVmSy0Bux9aTctSAXRlRjSupy1mWpha4ZGSyjkirEgK9NohyvcwKUAnAny1y9MjlqjHqaSff1d97+n195RVgjIT3nlW6mFDcDDl0ZtqQYpC7Ilk+8vMwhBhdKewfiB7eUFOE+qQkMUD+q6rQpfz9Cb8vrP656H+OvfPQjT734ghsGPe3OHj9YPXlklHzshoFoZqyPYeSAYil7772goTxssWka7yM0yTrnpIwIwSspk2lvLtc5xE/u7D7bNNuZtqxutELrHF0sf1MmGaUYcHYGfHIod1A/xtQpZcCEC5nWUn3j4eE//fKfSPhwx6G/eOHc1nyWyj+rPOo6ZYNZKC9VylUWEl7S8jk6V/rblKOP8CSjzaXyRIJdTvXB8jGExNtJjEFyFFAzsRCRLValvYAWFAOcDRoFiX8Vuy45EI0AUmOiUZZCOOeuP/PMRz/+sXbaaS0nk242mbSYBRgtW2uMlI01EmlWL778wRc+/IGIRyiUkyJSKXF5Byyrs0jUg2KjQkC/D8kqc0fAJKrDL49TLAOMwHkygGmUcjx4L1IKwfvg2BCH8N/kRg9xUAqBVZIih0QVLC84Jlui8ygH0OBmk8mVq9eGcdDIGv+/v/61rz14cLQ5wjQ+lJBZCwTQGAgCI9I6+xyP12vPFhBTeofk3FyZS5OpdeHZbnJtMjleD4PU2pjRY+qiRKyAvIo4EEyNxYAQQV400YyqCcJ7GlbccApN03lX/mLnKcaGlPbZZtkp1WTaVnZLqP2uvXD50vTcAU0amraiNd4HPZuapju9fffNu3dffXj/tusPg1uTXMU0lmaXfPlx/FYK/9bHPv7L159JzkXi4TBgN2jC6uCqFPkSiRSl3CsdvCzHZsyhFfT09v7g/TtnRwM3vmyO5+87ZjylKUsdWM5W6i1EqxF5GIBh6k3lMQCmiBf8PK8odw1Bz5SFhLkxIdovq/JF82CZg/U2ok2VqzpFcDsbUxj8UFqbGDkNjKfWCf+9xAi3vCueE/ST2Kg6EhYeEhNWI0SX0gXbfuSDH2kvng8x2JzGx3d/9v1vfu0n333TrQ5TXsS0jHmEQShtFtrwDctGkKakiVojO6kUmYRKbjH0E2UOtrZQgaTjfo3gUWIxDD6G2E06m9M0RheCxyCJ80lqEJLkWOUN/aNubqqVnsVnTKrlYTMb5RmdXcVNNcga7lzs6GXlL9fFsUh5I9XA1CNX3HH2lIfoZhR1jLZtanxxTQstl8o6jovgB8pbttlvWxdCKJWmkTlbxR4OQrPIaueKTeFGAUrfavzlMRsMEgh4Ks9WYBotrheeXmRG3CVtF1vz+9PpYEzt8xNtqeZaM7lomoNuOim3pd+ZdI0q51cDeWQ/OqE1yeQpuBxcCoHSEOMy5YVIj8J4mtIyJQ/5T0hxnE3+t2+/cm95/A9+9de6dR8w02P/Fm7JbLWFh7X+KuVOB/kolaaWONwNNZbgEUYEc7XcneXE9wmSTgUML1h6OJlDYAOuJE6pSrFr/XyWcB9zUESjjFGlqM6pes5TrqRJylkLJoZKBkHLehNHEtwFJqxJOLiHjNIG36liWzUH26vSNI9ujERXn7qSrfIyEcXbP/8ZxSCEOBmGQGSMYj6qBxZyCF5IOXhnrY4hIZ5R+ZSkMjmW73ilxM3VolPqY7t75ynvKL3ddgpvpCiPOI3ZS2W8j6XlhSIdyamC3Ycxh0jJgriLHH7qU3oi5f/x3R/86Xe/YyaT5INU6pnr1zVR9I5StCQMSlSKVO4tCJMDkj4DcqNc6e58zsl5SFjgJBZJhnJmlmsX+1pm3nFIVWQsAs9wEX9b/k1pXKqHrXwbPrhckdGlSIosS4Zynmc5rBjh19f58drTVz/xy5/YO78nlGi60lzNZtPptGvbdra1JYSM3r/44Q+89PJLPrqcAi/ytS23NCoBRupWblGt2SGuhOcOQrAYN9qwWgKX1r/0QZoBk6UyC2x0Tzy4DN770RO43Pjdswtjwm/tY8TzqthYn2PMPmWWO+EBl7w/DumZZ6+bpgkuNN3kGz969Z+/9sNb9Iv/seDGIYcjcwxwzNmL5AlWRpHPnF+GDHdsqtGlOe13s73JxIzj9bZ7Zj4/WfVrIUgbn7LLnB+YlIJwTWqOoIgAv3N8U6LUCJq2TfnKgHBnV+R6KA+8kaJTqhXl/zckWiF223ZOYppodz5rtmfBajOd+DDK7ZloJ4/evHn7tR+9cePdt5an9+J46Mcl0SBooDSmPOIEMD78O7/6G5/92CdXp6dJ1KOTn4CYa6WXsHEMCCArZUSOIaG4S2QTHWg1Me3DdX+3X4UsY812xyYjM3Gv/IF4IGuPxUiyXJ1DDPEgfD3MAlZU5SmSN7zQRuCLx1YC645YYxZ8FFn6FNEkKLA/tVCbUJIsHGj2ATt7SplTe/iewAKuroIle3/lJiilZuFoJRA7TVKFsDubX7h2vfziZ8d33vjJn3/vm9+6+fo7sX+Y42nOpzH2uJU8U3GEMpjuacoTYybK7NimSUJGSTEN3o+Yye8Ze9B1KSUfw0k/kNLv5+4COytN26mYpikOOHYwxqWa18fyKCE3C+CqPuNlLZyM7PulDbiCbV5Z1p0v8QR/I7LMCRSlnDeBDlnyABtfg6iXfMLoj7e4QwjNGGwi3bQKCW7vy7uEkD7TUT8EKRpKl+bzSPEMA6uJMY3UBmFeHDGJp1+yKAlQTzYEl8uk2tFqyY7nAfU6/qMEvivxYh9CoszFtgKwm0lQMoR9klcn03mihrJOeWKtxNYlOCfYPZ3TEF3W0uUwpjCE4KVc53zs3XEIy5ScLOVq5AawFMXqUOv/+g++MJ9OP/P8i3ndIz8VLCotoXEJkgSGnIC8pMxC78w6JowS0ubCQ70aAeImDprEse4EoleSjwxjMxgCGolQKUg5EVvvU/JSkFYyRuhiYp3MIRpPlPoR0yQF4EkMSZI0THhiQQ1AdDUZGkkBGptkkWTpepl4mwKPodgfXGpqouVQjmDZ2DyuF4cPCQQfpjEktFBMIRmcgxS13OgkpEu+lM/li5MhUZSmF+JWv9629qPz+U7wW03bgdnCocmUsy9lAsQjknrvx5zH8gMln9MAW6Tc7LzBri0PdqA85vyA6Hf++Kuvv3ez6brgw+7O9qWDg+QBhCp3VenGWrxykZIPIytEsYSp/lseuPjoffkERAUlQzrIE1D+EkPwbNqNyOrOIXA4NOI5IGdLVREM5ItHdHequ1d4SzMn6bKmD9pjjnxw0U1m7cc/9fJzL73QbU/JSG20NY3SyqfQTJqXP/3x5158LnjP6FAkH0M+nxOfiTVhkK/hOvhDieADH/UbvEQUuYJnY3l9oLBPPJIGlyNzOFvwpVup3TNj1rwLMI6iOC1HdWlo8BEBwBFTecdCUDHpLLVQYXCXzp/b2d7t+8Ga5q07d/7xV//V6xwaXHmY1UpKSgT8IL58dKU/80QO44KR8pkfsiIWlyfJKcVxrnWjTB6GK9Y+tTU/XC+dFElphyU8BqXltWIJeOUVYakQBR0Pw5ZSu9OpbRsenxJCbh8fHgd+74lUThNrp9ZMhNqS6trO7gtPP717sC+tzlr4HOXutjSW1n1a92/fvPnjR/ef5LDOaRX8mGMffKDsykOQXL/+5RdeevkDH75/5+6bh4epaYQSvJZwoabi86PtoKFi23WGwCpjmH/QTC5MJqdDf9/1TnFek2RhJfCCibREtKNMIiWEciLLFCAa6DHLERLL/4pMHA3G9D3Fj5HSfA1nJjUEQipDJshh+cBGYiz7N9nay7GGWShVyh1SYJNrCFksEWmmPbBVFpIrCfhtho8OVxJY6jyrgDwrxBy0XlJ+cPT45z997ZVv/tm3Xv/R6/3peyLdT/EQYs+hvNKA18KLjL46M/jOO29IqBDaLGQIrRZGqcVYPuJLk+mOspHoZOj7yD5nlnEzA0qbphExtiH2IfksouQO+xc6ZmbQVmwcK27YzsOUA9pAlRMLoTFS4VuO504JVx9tYiU8TLSSaZmiatGjyABdlGc0Yp9fOmAlfYx6HK1tlFBWN71bJ+QmsbY2Z3rcD2FXKh8vb2+nu2IZ0vlOao8xIEfZYKUVa+5oECyGqp5jzVnEEbUgNsXlp8J9Vj7iGseNAkplwW0MEhwkS2MA1hATIZ9uu50sKfoWu9qcyVGpe6MvV3hmtoSUpdPRevQeu+u0KjVw5EMS9lnJkcS80Uu2+ely+Y+++tVrl69MhDjDMEdmjdEBbYJf6somkeCEcGhYEX4Jon1Krvx7aXjjrpTm5AnBi68KIQIRU0oLczA7uGKWkVGdgnFirELLCNtPpcNGljxqK5UiE7JLq4enQaZc7WrlTsf+I5Ow8BxhVpQ0G2qw5i/fBDwoWZQrnELywXuiu08O2UxMbkjepRhMbs53k5aoDwgzkhVQzjZ8paRznqT0gIWidhS9otur/lzTfnQymae413YWGaRQpwmErydXKguenKoxB0e0RhkRYjkmXAgT04DfCWcxjqx52/bDsJLiB8v17/ze7/9X/+F/sGebYRivXbt60vdP1kvdNrK0ZZKUMEl5uBRLIxSiF6STUlqnHH2QRkNL5z2ZrnzKgVJp9p00xiqFQpi0kXxtRwWOZa5mvpw28ZQcXFj9GdxvleOuKp5IljoQvs7SZuPUQL51MvgFpRZPP3f94lOXVieLxelqcbqQQsxn7d75/en2LKZghSnHoeAuFuZiHhZRVHUqTnITdQ5FN9fraDM5SBxSQTAmy1+bIqp8wVkMUJlEPPillQk5iaSyTALTTeEGX1PnOI4c9SExTBjsHoqkSBhBjVFhvd6ddNeuXo6jlyR6Qf/0y3/y9cOjJZHNtD+bPVqueGlCKOPK+SBqFgBmzWkdnJWNFnI5jEs7blnDd0ausn6aNba0y2O4aE2azh+v1ufnMxW4uhchBs4mUYzLz5U2ehb9cQi/vrV9qWm9D94Nk9Jg6+jczTt3GF1ntc0+6pQbkWeZztvu/HS6v79t97ZjqTGc3tnVk+nJqz89e+fm4TDcCuNCySBEZOABUcRQCSTmRCHu72wfHx3+i7/8izuud6bJEYmHHAGksKhQgHcmtn2w4zYRhVIgh3AwneWcbiweP/GetGK5qcPsgYBGoSjAAIj8dcRYq1rI1zAhhahTYRWInS+FEAT7L3MSWRpYhyMlAz8xaZGRxJFqtLnywZdzDzCbiAm5YIJMeaRzYyw2rDCqgcUeMddXhGUf6LmCwxk2a9QI5WkiFVIqHa3QvQhPhPjJ8dGj734jxniaE7SxaZ3pJKZFyj2RI9HH0gGnnENkXB2ENYrnf2lirC4PvZ8qlUyz6k89xUs7OzantVSP1mvPwf51MpxTCq211ljlB+2ch56lzg9wx0cANKqSm/P5qfoJcb2mDZtRvL8g5oZfU8UDs1mxFuKyJiFxegWLnMBzkHVWyuQeCHXB1K1eQN+IbETqum61XKOe5l1hSFI+GWDNjHRhe6eVZhWiBsdjGbxWUiUV2W4osLbPHM4rObaffyOkIfGMKOESBCwJCEaq2G5YPMr5kngGslFfikTCZDow9mrT7VjjiSzCCVes1dTlMo48tUiBvHAAsQqpHcUhuBEXJiFa0uFpI5kVllMxBBfGdjb99tnR9xensdGwG2n0AK7S9mEtYRqtAa6hphuAOsR7ESU4DT4rQS4mN4RMZFvDAqjkPKdbN+VDEypFjfczlOdYhlJfILYTnSUzm2KIcIkqAZQaStEIN3DicRawKgjKVgqTU8eJvNj1Ju6FFDKR8D5ERhdhjZ6zStLaJErPFohuPXwY3KBllT4F701M15rmvFaH3iczCSGmGDnZA5ZlYj6IEQrNETkp7vSrHWs/PJ3Zco+aTtucAkSVldOEwGGelAif8pjiGLPLCFEOXpDkECrnA8WEyzsQ0YX51srYO4szIcRX7j986Sv/6j/9e38v+dC09vmnrp2+/rr35VGMSBMzSsQoA2Z6gBoLaWXCJZOcx2lVXhkXPUxkEo8pugnW14GI7MuZKDT+Y9h9ZKm+Ea6AFF1OrdMcEcPVEsTPhiHiEjLz0pVkRJMogycPjj9FGOKNQsr9i+f2z59Hpn3UBgCamBScalGIGD27odiyHMufnFT1YKYaBQFzOL4HyXxJ4ohjNscxR45YEylE+cFS4GzxBHE41nflweE5WaRhHMboCCh16PRTCKXVxu4ePDEp8d0D5hOiTvTslUtGq3E5zubT3/vmN/7l2++c4ni5ujWfdt395RLppOUHjYwoFKUQSThSrJQu5iGE1jQpxYUbplYrwBMBOsdETJBRegwuOn+hbU68v7dcXJt02HeRUCpHCjCqaO5+U3KNvb1eG6JPHpzfVeUEkNrmSKJVd2/evP3goSZqpW2lllrZHOfCXJzOrp4/2JrP1PaW3N+hHGO/tqpd/ezdo7dvvffg4c318hE5J3L5gakUZ6MPLsVNy618Y7/25hvfefPNn5ydxGmbU+n1AXcmIA0CdOeU0Bpmweo+DzIb6ZTPt9Nzk/nx2D8Ovme5DnQe9P+hpJaDArcuKnt2MgLgXR6IANsjdIZMDiwPama7eSkXsLXNlFS5rilQYBEsSeG9V9zdlTNXR6asUFYQypVLJbq6Ci6niQ7BM6kV5KjEdBoZyQQOAACAAElEQVSWr268blkhqCCV90ixXKn8fJmcTEvYNZygh5hw+pyHlFwWQ0qjoEHJPkQfk6vmHaFJtlo2ABtG760QnTGlWyCxZRsVwlrntQ+KxMXtLRVDEvnJepUIWbGJndIE73inSbUpieDAINsYc6mK1WuhCw/BRqFc98CS7b/4eWLNearq50p53GAB+LAVGEGn9+GfbGitdGlRB8WU3rcsAKuZ89rHFrb6rusSMJyZXaiw/J8Gt/JDjHG7m56bTZaud9HPjekEtVK0m5BGPoyM1FQzfuEUlox/YCYtDgQguZlEg/ebd8cxwEgjNO8dc958FOVeduNFa/faNpUXIXW2IWxfbNPI8mj68lQK2ShtrU1ghg4pek0OWs8IrVlicH9pWbTP0SevtLKqkVLlpum1dBgzlNeHAtvVdek7AEsCfkkz6j6RD66mf2QCalFoDt4K5VXQWgE2Ce48R0ZLZZXQgmzOTcydkJ2QO8rOSMyUbEVuAdbSgFSoSgDnUxuGFqCs8JpIAwc6KqqE1IHKNWMbiZJCC62ENkpro9i3mlKpcPGHKc6cr/wIXcrdWw8fHt2/L5MUbTfd3csiueB2Uv7Azt7KD+tcqoTIBmSm1CHqvYaTUamGHo3OpPzSdKq9jylqrTPL1isNh3tz4apVSQzB+0xDCLjyKaGwaLR2KY0po6CpFo2+X33w6uVtpcacj4T437/z/T/4zncmTeN7100nV86dJ+/KbyuSZJeGyAZLUwQUhdLY5UpQd84lzq7KWcSgqGajhRRGN3JZGzGCLVePc9idlcIL8awM/6gjGR4N8SmBBTD4V2KDehQRWhj4KUsTUGdXEMMBFCJlCN4nJ3U5kkMUUmmtbSqNmjJKY4IHPxkFWelFsg4VaRMsxpQAvHS5Rg+yC5R3IDWDgbPHEg/lUkrexxhIMnCNWIjhgluNKx89t9Hl6Y91bJ9YNJmhHQzZCDIw+YXF+srewfZstjpbTtr2e++++/mv/9l9GLjPKfXBy5ecG/kbhOQga6Vc+RxL7eWF6EMoJbnSyxCSFNroPkTnMezGiTUC2ZUxYWLstuvHc213FuM9H9hvw4ukvDnGShsn9SqL99brF7R++dy56IPp2si6Iql++NqPTle9JGWE6qSeat0lsSvt+encpDzf2jbzeer78OTYLsfTV19f3Lr3eLW649ZniC0KQg45eyFdAvG3/J+IJF2K0ZifHx+9dnwUurYvj5wA64BBd0JUmxXv75MPpTrXutwRFNOU5G7Trsbx1vJ0wKiclTrgx2vOV4BmFt8I5Ny8iM0VCh5ZFATXnAFYHrJhiOSBukycWq0F5xFJSKC1IiUjWWWFNFQDYbGZwlvL8FXG+zCWX4CGAeJ04Gws1K2QdcLjVO41watfnNj4W3wOWVVAzJDTkGQvzeOYbwV/P9MjoicpnVI+TXER0xpXr+OjlpKVebc129pMlW4FmcxjpSxitpkaQAhGF5Y+bJtmfzYXMQ4pPHEO9te6muPx5aSbmpxakbEEEyGTByGMyVZVfAVBWZWhUTVbExMKOC8jA3xdsVecKCXYCVxly2LjSkLqaZKVsFJOUKZxV+UV8n2hnColNJv5hxAnmaxPbdNpyQyNvGGYiSGGk6F3lDqtL87mIfvT0W1PuivWtDFZRVYxJ690BUAi8BaKG4TII/QNKJ+4ZBe1MqBaEuQNgiRXWbGs9rbyGzVEe8Yakl3TKClyCJp0IrEcXVRSaYu2O3XGUozamEBiHX0ffJbC41DltRlHmwWelEOkZCzktMi9kVL5BOQFFmal9AfKwzbKaqOQ3MmJdsywk1k0ymipfAwIKs9SK62kbeBDxwpHCmmMFilbaTqlOiFmSmz3y/P98iDEfW22hJhJ2QlhsT7Al53AiobKNgTB5PtUF0kV1ZKRNgwsnEYSPexsGU2RNFJbrdk6VbfugH1mDgCGi7Rc6FpHIR+Mw6s/+TETlPYuXg5EXqYcwwcPDlqix94jRhdY0MRuq025BxrFIqY+uufmW21ILiSmdHLOarmHkIhCMocQWbwZUh5i7AHA0ghZz1qHUjjnlR9hVybNQeFEvfONUh+5clkR9TnfEeIff/mPf/De292kyzFfv3p1f7aF7lZSjCImyWVghG4F56aHia00lyTc6CkSsjLIx+iBfc0b3xeaicRyx3JZhIBwoCBZtlh9guVQjYF3R9iNcsJkYkGW4rq65kHUsG5YKmW1yVGp1VRVTyllrS1Pi1Y+OpJK2nI84hjNzALHP5Gt/zgNMuye9WwBix25TZxeTlVm4yueE94qQp3hvcPMHaUkgG/Q1CbYgytsBJQ2Vf7zUGt0tkbyl20qyzZR8LvT7tqFC8Nq0FLfO1v891/645/13hFNiT50+fLUNutx5NuXJwOcg+JKu1N+nzHmIWaGcfXBG61iyIMPpAibE94DlTPLgHUcRHlsZlHsdbOHw+BKI1cu4KyyLNUvv8s5WX1v7Bcp/O0Ll64fnBdGueAWq0Harj8+fvWHP9jb3RGUO207IdsQd62+dm7vYDq1MC+koQ9ni+yCWPtwurhx795bR8enFEeZh0QeMG6X0wh6i1A6CeEAkAxEQdvBWFdeWVULH17lx+ok59guDykfi/1UllPdbBmbvX+8Xj8Zh8jO02qmjygfMwTdlFIo/yLxmZ6C9z76WDX9FXhYJYG0GcByeCRRObpqtGmFHiHXEZQgUV9uJCQhTQxZW7WcC4mBuhuAE/dMNaUZ8C3E225u7ppMj3WaZBkE0iHK2ykoZDHEvIx5QelM0JMQj0M8zfkshFWmIWXwJjLH4XVCbiszVdLk1BBtS7Uj9a5pdMhWyUbL4EZt9ZBTH8fzW9PtbpopL0d36rzYLN64sBBSdJPGRtcIWoNXwuUav7KRL09s2NL70e1VhMyDRtY7YptM9bXgm6SGekqqg+VKvQD3qxpvqzRhY2iq9SjPnHjmxksMMaRkg5ukaI1pmgZZgSQ2qukgxJN+7YRSMV3b3pIknnh3PIyX5vOrpmldsDiHjNEGCyi+ZJWEZCClGDbCTIwyENrKdVzmAHXJg2b8BeWpi9mAoMiCLcTpQGKTs4tJGTs6T+W6bbLI/TD4GBUpqzTUtqpU2VDtJpI+1lm8j2xfp1BqILze3NVgWcKU3RQymPiiQlAqXa1UdzXuAHB9ocgau1HylE9/cXbK5k7mA9cpf0B5ihxpRUIlsiQmUrbL5W//jc/+5//xv/e8lVsh7Co9xYa74Q8hRZWp3OLKcCwjiMqqzh/Zy6u0Bs2ecoQaKLBqo+IYQF6T7NJAyjr/SlAhinJZQywaQoK8q7y/33j1B+N6RZEOLl+T2jpgbC8q+/xk8si5gFRPU9OZa1MLaKIISjwchoPG7mg9pOQxImNuMIzg/OUC1V15pGIMAaigXLVDMcUMbBAaSiV5VcGCLFr6sFiuzk0nHzx3LhONQrzjwu988Q/unj5prFUkn7t2rRNCxmSQxqVJVWAe7ObwA/tSr/tAsCc675iB4oNnj6wEOyUyCgFO9BQzvusMEi3SOGD34z4Y1bxMlGE9RZIV+Gh4b+GVZvxrZomFqLBIJUlrUT78DIqrqjc0jOKjG7NU091dM2mzrON6oTSbQ2p+oGD1es0Nw7pN5lrYiuqCQ0UjqPr/OH87lWq/dCvlc+CdbmJmVgwo4cIYsWQRIURQvarp2YdYFSqlc4pKCiNkDsnG9OzlK9H5GErj//mvfPXPHtx30Pk8f7B3MJsqrcZYbZOKgcs5tZjsRJI9kozOnC9FuqLFOAQwNPrgR19uGM92YaGMstARElPIUgoHQMzeBexCcBB0zu+HHJ+kdGO5+LBS/79rz2jnRWOfLJbUtDSd/sUPfnB2dvrC1auR8qxpupx2lfqlj3zkheef297enu3vtbOpW/cyRB1pvVge9qvbq7OT7FYhrlPsRR5TGlmRJtDHl9uiXLQQeIsBmYABOzUQN8unnuoSn6W2CD5D7SWETDE0WWwrvds2XoojcOVwVnGyh8AcJrxvhCmvlQ+1Co81dA6nBXdJwKxq4YGYqNIoRglxOjsC/jBFI3a4Z2ShkuS4Uon5EEmtWOJAOOk8nO5QN5TXykhlNM549lUKTm5NkvVWkrMiIlhblQgFs4yiLBkqOeTYU3SSHAlHYsjUp7xK2ROG1NBsldtX6R3bzJTuSM2UsTl3Qhx03bYxnaQOU6RpN8mmOfEuUrw232qkHEk86ZdreOy4CsYIJ5bj1zbWxTb6IUXu7t5XIuPjrONZ9jLmappG05KTqtl4m912vVdZe16h0Tyu5Wu3YiQNE4n4HcwbPiV3xFVYTqxuzAgecjmrceggq+maOaVNB8+YY6WO+n6Ugly4urXTSH2a0+2xf7zqn9neuT6dTXNudX0o6twFpxArIRlKggcL4Ajg96r5t2YoZSYYS8QwaJwO9bPAjJxEWobxsF897tcn/YAhTwopGK21MeC0JCV1iGE9uj44GI8h3krsgA7Ji8GxJrG8KClC1h+xRFfQavIPkBnGucEMEW0s0QSpNnJCYKMTkCoEfGLzydwCh8kbWIqZb83KVU0A/6ZsYLY4T/TLn/nEc7/+6b/3///shRy2cm6F0EA+aAJOW4joQ8ohlVcS2CGFjRfueKj8Wb4Gsl/51CWEUBKfcaUisVqXpfSQl0v2H1eNLtT1GNfng+3ttx8+/Pb3vyd0M9va39o/vxz9mEXj/csH54YYDsdeapVTwJWOyCC2wih96MZM+VzTxtEjVhPnTt6MN2qIcWl0Rh/rZCPnQKoPQSMquDQE0Qut1ykjr4neJ3bBicR2mfDsub3n9/dcSgutvv3g8J984QsjGret6ezpC5dECKrUnaU55cGNYpYYk2ThWgksHuZvE9ZACYt6zB5GgXrVCdQEKaZfAHKYQ8dB/aUx4cGMrH85189UV2PY18b3x8XG2NY2862tnf2D3XMXtvYOJrNtYy1h6u6Hoe9Xo3Omac9dubq1u6eV6Wwzm06ns5ntWonHW2glyycjuWuusYOKMzbFZiYtq1pBsVALvmlJGMOHHKGqwSkA1kZ5ezBFo8AFUAgelrcYglQiMnAfMw+ZEGMqVTnMnM+Du3Zwfmob53y7tfW73/zW7/7otYVSLsSntubXDvYm1kitfTXB/kKOooWY4ux2OQcje+ykhTLLEF0qT68LqXc+MHmsVO2BH3TvE6dz+pSmMZ1vu7tuWONsy3XBIrOQSZm3louQ4r/77AvP7OxorY+X69tHJ9vXnhLeffHrX7/61NM7thSXrRL7TXNt92BLT7wPatJM9vdiiBrYMHd89vjB45uHh8fJDyI5IcbEpDa4s7FJyUp4MJ+jECPTZ0p/X04DFxOzw0hSYOtDzj4FGBlZCyGNko2yc2W2oZM/i2FFdbLE3WVAxcHjQHBdkiTlfel7vcODLKSWMDZKDepKOdMxbWYavYbPNfF0EY1cqdeVABNVwrJH7Hwvt4YPwfnBuzFiMOtTwEJgDNERKMX15+JrmavUiJgi0HNTNb1jz0IcLSZ5lg7MTQL4nenK5XIfYwpwGbmUolCROTJ4AaWUGlxuvnRbIkPZkCDwWnLwrYTtsLyMsk/5aBgNyae3dqX3g6RH6zXuGOL5rUDQV2NbKY1NWY9uoJTgnA4A9eNZE5HBVTVlkGda/LsAwcGMCh5Bi1T/W0yGOAJFxMrIYQQvBF1oiUXddxHDyTb5KJJZ0nzDpGqmKc9KHIa2fMSxm3SxRnDgNaZypp/6eBY8RX9hOtuezMbgl0K8vervDP2z21tXdKNHr0VmTlj9usploDRC3/gX06DeJ1B18HZDg1cuYzapUrW9IbVJloZGwwQmrTZKm9MQ1ilJa4ho0k6I8mLoYyJrrS5vQp+l0I1JmrICbiGMWURlQF2uny4uV8qhvBKh/DNTRH9JPviEUxFdpdDKWGkVaSk0Um5qkrnWohoPy8OXrTJGyu35vDGNzEoLLYVASxpxxtW0c8rZWm2k7IwJJF9/9Ufkzj7wa5/6pWevtUNvBRkQrS0+LkyHlCKIcrDJwZ4+QI0VCWp+KB6xV4iRR50MCZLI19HScGa2loaxR5gRZTSBqVxG2Babch5R27a/9olPffGPvrQ4O1G2u/rMCzlToOTdeH06faFr7479iMUCB0ur0ucJI8hlOvL+orVNohHCbIjMOVMTiBmoSHLme5R3rpEEuRRCTgBe5Wx0QL0yxGTgrOApiUU5F4jWbiivtvcfuXLx0ny+DnFtxZd+9vbv//krtuu8cxcP9i/O5nkYrZSWmEdLPFdlgsoQfQ6pkgJSDN7nlJUyCTkWuRRSQWzqzZT4JwffKmdfbivHM+lNNUr86oCmuckhAsmPKY9KN9a0tvx/42M4OT17760bP3/9reOjE6H1fGd772B/vjWfzra62Xw23zl34fLFa083bfPk/oMbP3v7nZ+++e7rP3987/6w7BXJtu3abmIaq5pGGJ0lKSvQqcAbIH6xGCYGFyCEAzvCCidBvGgODC2UiVtwjwshOEdZKKWZgVJa4gy7EScHUy5PP6ilkoQMIq2Hc9PpxYN959PW/v63fv76P/2Lb56o0v+da5uru1szYxvTeCZmcBnEOgDU+61Stjwe2fskJR2HILR2RKuEIxuCXwhCHWeZs3yal8FUKmyhUzrXtlaIo+CD1hyLjsWQvBXHu2P/q/Ptv37tutY2WPvzmzf0fGv72ef/6i//6u27Nz/zib+2hDD7/Pburm13rV0fHdK6N/PZ8uRYgFG4ODp+cvTk3vHRqRsXzg8hZaOiFGMKSYpYXspSIcdSEqhsREiOd+5Cq6w0MDXw8OEDEwgeEkIZyCOJbbspNdp0Uu6pZrfr+uBPxjFgvVr5ygnTUMGagVLneSgJpSmNHCQiNd4u5aA01fzAcogZlLAs2cO8RBr+Asp9KbIHV1QbWb5WvF8+Rx+dhz4vpOACPw9SSmGUoSydd0MYAvQBHMghgXM32CJDNVijQBKaS4zOy82sJDEPOkkRoNDOpUzSMYsgREjk8mbRgXlPFkkpaZWeNXaq5FTp0oaFoHEwpkSjG6OPVmnLKbYhDhhft9Jeme9GH9ZCPF6vcfnk+hFhRDKdzpWQ05yUG329LnEDVtVY/QJ5ocTCCV65swVIbMAcm7wCwcF8RKVW4D1Rve/zhoMjkV/IAXyyOnIZr8VQ0CwzaRLsD8b/lcJncMEIaVOaTqcM4FbQUmHFIpdjKq3nRHbaXN7Ze3j3bJ2jtOr1s5Pe+2d298Rxvh1LGeK58yZpNIxG6GWN0cF7zBnYHiGUEfDVKBDgIx9uiPrAsJcbZYzWlBDZR5GStnYcwxjC/qQdfbCJOm3WMpUeQqiua9YpLd0AWr4gFkhq5YMrV4FWOXBBrgEzVppwNIka+ich4gghlBIiozFQCLDLeQjOkDItRL+hlAfSSO+8VKpaAoRi1gTGp+W1k7p8LXzoSwRqJpSclFSebf3FK3/5oQ9dv/DJlz79tz/z1sNHw5hGqXXOjrJW2kWHtpl4gOe8kyS1MjGXjp93F0opBHyqipzEsy+NZG05KYUVbNBK80pSqPJfcTA+lzuRhd1Ey3X/m5/53H/z2o9+94+++A9/67cvXr12/o2d+4sTl6n14XMH527cvn1vvX6qbRVMLZmiyiJqtXCjIbFnG2arIo8yZkV9jK2SXRUJoqYOqfR8yMALQqy9A9shG6lGklEIEbwuRb2sWIz6mJT/GUavd3QYfBrdR65ccO+NZ84pQ5//xjcu7p/73Isvrdf99YuXT8fxyDvb2DGVZg4NgqooR8yWQvLMkIDDJgafm6bBy4I7FZmmyE0RRhqJsxJggfKscF1fZ0+ZGOuEzKsc4BYAnFhJrUJw637t1u7s9HS5WC6Xy+D88mx5tlopo+fbW3t7uxcvnJ/tbO3s7k2nMyl1P45v/PDHN95++9GDh25w3LG0TTOdTufz2e7+zs7e/vbeTtN1xlgYNBUA1ol5Osw9YOSRKi9WqbGJdWhg+AHXAGMSM2JK0xiIcByVpz8ObmRmUOTEolIbqeBY5l2ebAVPcXRurs2Vg/3g03w2/+mdO7/zpT96SDSkvGfMswcHM9M1tsk5jOgFuRFHtw5JKtRkjSrNTR98Y0rvO8UheObHS3KiyvODBo7Q5/O/wsaE+FHN5SjvSO8b89j7Sw1Z5D+SkAtBPzs7e0qIf/uZ5+faJi1ee++dh33/W3/tl7IPn//jL7146dqHrl3/ylf+RBDtNt2Wtvt7ey4FZXUYx2G5Si5Oz+8vHz9ejENu7XpYhnLvZh9S+XWwGksc3yszo/2QpqWQfh3gOiKm2peTDQDQKleOmJpINkZzXBe1OZ/rtNFmDeOdAJK6PKKSkOohYfKBxCyyeiNbY0OMGLRRTtlo7WPAAZ05dc1HlzMOsRyk1CpmaeBpy0lrGXMSUeJ7Li0pENCkSHHaUPmca2wHJOWQTnFpp0iBOYG81BzB+9GZF3Usu0K9h7Tx0oNbC0nNBp2vsLxhWz8Sh0lqGUBpwi4SGxkM8YwpZ1yr9AS/jI+h01ah9mq1Uplaa1qlJQnvg0pyEcMqxmtbO9tdl4f+LITTEIRU1WRaGcw0mUx1iK3I0Y88ca0YOd74sYd6I2rZhGgLpB9mXYqhsIlaqBdo/a8z6feD1Ko0uronkbRfL+PKZq8ROlSpHayD5uxSuNpLAbKOcSvFSQretm3TOOe0YIeDlEo4mQ/7lZtNOiGf3tt97c67vQ/GmlHJt/v14P1T+3uTZX9zeXZESRsbeG/PSApAeaVQdZIhWYybpFKZBXtaJSQHcBlP4MiVbz1GqMhSKfwwd8azmtfjIFLenUzPlgHUZa2NGWI8HQcGmJXW22jvI4T3qgYibIZzss6CVPRRaR2zJ0nG6PKUg9eNKExep8YMZRWbYaWSUUQCyb/cvugqpDaspy2fnLEQcsrERkD885AJKH1IQYgoSLa2Pxu/+v/86W8f7O5+9IXP/con7n75G2q+B8VXijGIqmzPNWcMr1+qrr3ySAHygbB9qUQNHsNhJ0oZCdvrCECs8jEgaBk/PNU8GnYm+eCYFnu0ONNC/Wt/42/9sy9/8Vc/9qkXL1177rkPPfjeN4WSvu+fm88/vrf3/aOjmTX7SqYQsf0RvZRL5863nebnqxwfLKbLgwu9Uk2jiZNbFMURUTApam1CjmM5+Fofo9Xq1HllTHa+1eb9S06SsHW4CjckmjofgtHqpauXXn3v9iqnt1387/7wDw/2dp/fPS+y/MDlp1678e7Se4uzxkHFwDJ6yjQmr31pbssXJCgizDgZ9BrliKkuWm3gxUJDoLTm30dxFhpmN4IUxx2XkkYrbQxuPzEMbnl0slgsnhwenh6f9Ms+uNJ2C1meGVXq+lmI/vTh0eGdB2/m15MS09lkd2tbKnl6ero8XRohbNtoqTLkK64Pbnl89Pj4vfduWaMns8n27s7e/sHBub2trXkznRhFgJ9F3A6sV5Tsm8Q+u85xWenB6KTA3M/ySskQgy89pOKwrMR/D94dHrHQL6gEgrfjMvirFy+32na2edivfueLX3gdaYsTki9dvDA3etq2mI8Ln3zADljXcPc6JYcUPDRKjb6clJHi4EMgKo2mLT9eKs9Wgg4gclwzLDyZGS2lBpflTDxv7APn1inOEFeaWv2z5UKk9NvPfeAjO/vK2Dce3n/z3r3nXnzpwoc//JU//7Pv3b753/79f2hzOlouDIlLs625bdfrwc67bncWTTfrJsfHT0hkH+LSudNhWKdSBUcSLvooRSRGzAJJG2Pp5NinISmrlGW5LxT2SHAZIQUOMG3MKBKnaEjJt5Kk6OemsUoc9qtFTqE8p7pco6XLZSICX1hII91EtQIImmvgLjZi8NjU1KPEGwZRM9KYmAaWBvZfCLFgFXUK/BfwVBTnlvOJktKKB8cxcIZB1sjTqdnkfFGBapkiWQTho2+KSpXvjEp9HflOLX1/qNFbGyqWQAYPeymjYCEF3DrYZ2GyQ6oRyYRSH3dah5QNJrlaCiOp1boR3JcIbWw0+vTk2JN/en/PaDnKdLhaLEHlYyAOFufRKNO2tvWjzXHg4C+cMZHX5tA0c2OQK2MOQk7sIHXODMPAFy3fB0ZTfZ9Idc1E5E1+8CancaPYKJ0+oPAbUIdkfzbHCgkl8iaZv1SbGn/LtG2SkCvbDN6tFgutNdhVjAKgJuVr27sTbUjLn927NwrRKkw4tTqNcd0PO1rttRNeWzLKGyqAqgTVxqjyj4UmR8JIxhmPkcP/kOQDwSSzLOBoK7+wkWrPNJe7Tvs4k6prjBtHhRMwGHky9G3TpZzPwhCkkNp6PKoe/iaMXCwLBESW1mp4azHn1vhQS/FKSiuOqCsFFG59rTTEOBLcHFxVDO4H9gUjIumjFxhi8qnnfLnSOM+fKwnOosk5KRJGK3ZxNCTatlufnPn7j66/9ML5C+dv3bh94/hsVMojsz+QqMCiyhYWGhMlAha1vCaYfLJelEssNgxuSGhJa8Or6wjmvkKIsWGhc/mEsWeGTuPx8ZGP4bNXn/7cR17+4+/85XsPHv7Nj31qa77z+OGDk+VpVopS3J10756dPXZu3jY2lxdGSnUY3SKGK22nN/zUjGR4o6Q1JqKK18h9CCmOWJWPpXiWJ8GdeS+UGaGA6kNg9dzEgD+L9aYQ2aW0QOE8VerS9pzjpUfnrDZNY5+croSWJ4N7fO/ux1/4wNRYrcon/+TshGDe8LysRWtIdVCLF0PJRlvYhrHIxzINxouEkW7K7x9O2LSBbJA4o4B/OK11Y8tPMY7u5Pj03p2H771z442f/PSdN96+/e7Nw4ePx+UYXcgIGy4NJqhSSDYkrXXbNFoZq2wa4+LkdHW2yoFsY8s/CApBXrERKASD8zFm5/3ydHVyeHx4/+GtGzfv3L5z/+7907MFRWqapjTecHzmWgBV4UXCogI6ssh/WgzM3Ss3txudMSonCmPg6NKQsvOciMqFX7KQLoucNam0Hq5ubV+YbbWmGYn+0e9/4Wu3by1gYP/g5Yu7XacEzaeTjHy9w3X/3pPjTNQqsYuWDeNY5HvicglCjBU6mzxlS3SxaWSKUlCjheVETqmSFI8XC5cYn868QMRaa3t3HDohdnX5LG+N65vj8Hf39v/N6y/st5Mbx0++f/e2kPo3fv1vuab5L/7Xz1+azv+j3/w3jh88/Nr3/0oq83c++ukmCzubzJ+6vFotZMrr5bJfLGWWy9XqweLk8Xp1lvPxOJaaV6tAcNBpGdCvA4ytOGElK4FYQOIkiUYIlUpZ7nESKykCDDmSyBrLoatSUKf1rHT29HDolzAagdwkpJIhRFTFnIXKANcE8wJEzGgbmMaDsl6xPhnFgTBYtEE2Lzk9M3H5iRvcg5aPPbdA161ggvWJm7KYtMILi+0kMC9Bb/w8itN30ZDEesGT0ob7GhZ1wtmSpMgwl0KhhIaiphxAh8EzvYwoPNzm7NYjRbJVqpOilXKudQMDlJXCYPRkhZxp2aDcsNqmmFwIp5TfODtdx/HXn33+fDdZR/f68dGdYaiwdObfODfpJrvbe+fcuDUOy349kODgfS8IQGIRf4Hj2OTvszap1ISpreGlbNJiwKtIm79QTWz7iwITNYus2lxWXskguenh2ohl4rmS+AQpTHcVYB8ciTtHcXFsmiTE8cmxBpMFd00uT5v3V/d2tqScNub1R4+ejMOks4IXG1IsY1x5t2MsljRV0szx8PjGavFBm59BwqqhZR228u2mKt2gPEOK1ZwYxE9IbEs5EXKnmyi8urNm6qJ/4vqTwQ2l10C8WogjuFwJeGQhlQcBimGw0CsxxRQUg5yY2cifkRIa9UkK5QsiZguVZxLoAZ/S6dlZ2zX8aWsFuCa3ZhglYLSEaQPGwpoR9kJxEAsg9ElCwUQpKspatw/uPBwfPHzugy+tfP7hm+/11ngqrzUHmyRKyFwSQGowC7jO9FC9qVwz6cp7yBm8kln5sMRnkWOpyku5jDxzMHPT+/FZxDyvs8Vi8OPL2/uf/sgnnozjv3jtr65Ptl548YNdzrdu30ilWHcTpWTbvbE463Pcta2MiZR67L2QdGA0NBoA/vOFQxiMpxxCaLS2QvU+rUMYq7BHLGLsQ3k1SapFebuELqd/bBHOkjciDkf5FOP0Tsmre3uKRRGZ+vV6Ousarc+WK2rUnaPF8vjJL3/4A+U2MjakuOh7aQxbycEmq7YDtpszU1co4JrLp6iM1iKVT5MUhvLALktWwUvhfPDlHNRaW2MaJVQ/DPfu3H/7zXdf/8mbP//ZWzffvfXk8ZO+H9k3TqUk1VkqXwpL2PyyVNpG3IXe+bF3w+ASdzaMQ8oijGEYxvK5akM4xsqhn/IQkkvJlZ9U4WGVLqTVulz892/dv3P71r27dx/ef3Bycjqu+5zJ2lZK5Xzo1z0GTTaWAxNwyVBOGHANs3M9Wnwz+sGHKJIIKXnvqRZyCdE4LDFLFFNYjltCXNveaYS2s8n/8tU/+Zev/vhEKRfSM+f2ruztiJS6roXXnNq2fbxcv3d0TEQTpba0kbxfQhiah7Auk+ix8velA85TKS41lmI2Qk2a1tSkZFrHeLRakdCCp+280klJKX0CTu3BdHqY3E9Xq0+03T944YPPTqb3+/57926fDOsXr1z/1K989n/4vd/90rtv/Se/8tc/86GPvXfjvT//8XfnW9ufufaCTWS2593edlwPi0eHYz+6EJUxS+8f9+sT71aS1ikOMXqMERwieLKQ4DhDrlwqyxRhseVJbXD+/Hz64tPX7z16GJXk9SDbwAg5u5J36oJsyB3lIzcsYibTpOrqFawi5iopImdfqHIwa65lBbPgCRFcbOyUWPqLBPIGZvfIXIcJrZxnUOEIEh7zIFknaKnaGMtnjz2z1EoqUxqE0mowoZjfh0pUzRybjfuH/zEKBwsEYAjXgTMLixqZayAsriqctJCqo3NgsB7ivdgQI4SKqdNyqrTJuRFiWg4NouRVzo3WMqW2XMDaZuyKlcIGTj4R4o2zk07p33j+BZ3FaQo/efTwhBHGiUMDhXN+e39v3s4uD4Md+2PnHCiQIUs8hzCplH+buc2spYKsyfqGyCZmSWMGnzdwBr5goRfL7NfgZl/XPFZeBgvFdjLmYVW1tExVJZ2ZqhjrhV8+9FIXDGM3SyK4rm20MTFtfJzgQq5TPBqHp7SZN9OLO7vvLs98TFaw4lxoa1YpvbdeXZ/O903bSN+EeOz9iGCgvJl3oBHXKAw4MqLUOZGxH/UErxYg2Gbwz4eCZx3jllHG6HG1HkOMaVDG5Cw62/YYtTXKjPhVfYhDChGzT6OhDc5KGX4ACbUhsi45pgR7M4o5iYCLTQCwjEsMi3oGfJKMujG8PKCE+BFkQMmsXXSY85BRip1nnPvGIcaSNPD3hLellF2DEAsMr+x09sobN9/7n/6vhymtGxuE8Il8DPyQG2Tg8JwGojqYj2VpTWAkVayLNxp9I7anCHlC3ZN4+MUfJUcCp5iE5o1NhAlBKytNZ9uT1emNRw/8OP6tT3zqS99+5Z/82Z98+Pr1q8+98MydG6+/9SNpjHfjx2ezh7u73zo+nsjhWjNBL55m1spcHSMxZw6sCInG6EHDyQs3mlb6DO5VQDppSiJmqdQQg9Zm8H6qDYDSeM/LCRv4pm3gn4hECP/IhmSgqI3KA/Wr5cF8EsLOw7NT0Zo/eOOti6+88u//9b+tfLx+7tJZv3rsRmWUJOCa0XnFHCTpEMmQcCG0ygpVfkLn+lweEp0xpScZAQsTRnQppcMnT45PV73PR8vlOKxnXdtIuTpdLJdrrOhYz5hjTP3ohxhG5wefxhhKLci+YEFWyc7YWWt2JpNpY600grBcdJERIVKVdiRLvSI6XKyOF6en637weYjBheQzk9J1oxT+KDNt5KSxrTb2TNknpwbO+9bYrZ3Z1t6usvb45MQNvmvb8we75/Z2uq5DEpRKpcoXiGg1UrPXudy3Y/KxcuETZ38ZqblXllRa5DaGy/v7OpGadH/43b/6wquvHmnlfHxqb+fK3p5E9mrXdeDflCNo8IHrVMMCIRhsEpGGnjSHrAE0TyAOukyqfCbKZz/FVcBKnyTF2XrIiYwmCEI4YC0pjM+2jPb98JjojcXiolJ///rz17vZcQjfv3frKAbK4uWXPvStH736z7/77RemW5976eXswpPl6YLySwfn97Z2mkTdZLK6/7g/LV9nP46J0uHydB0SR4avIL/P2GuW28voik0C0YrbX200hAKl/YzZZysfrfrFnTvZqqpKxvoKJggdfLDwIAU3XpjMr863XnvyKKSQUxRKauCJZJJZ6TF4ZL0ooVVMibURcAHRJmjOgK0rgg/lhpZZVcy+YAmIlNKXP7n8DS45Yn8PJ+vmzHluMiotDRJMUkpeW40ulgQpXRpxJiWnQElLrbPJsTosZb1xGN8glJYheLZECSKDiXIdisGS55OHlUUnUZpsVq9rXgUmYYWYNLoTpFOWKXdAJDbIThYkZrrJSShKM9tQEmfjEJ0rB4KVj0a/SP4DOwcH7WTdr499OB6cMpYLHsZvZZHnk5mm3KXox97ztQLRdWBPDkvTJf8yovp4McJkA1LlUNcmN9diqjqKgD+swftoMXmYACItG24Z7shEDs6PKl/n+yNfvu9xLGLhLsUYwyTFJvrYTlrbrPu14sxRdJGjEP8vU2/2a1l23od9a9x7n32GO9etsauqu9lNspvzYNKU5IiKbEiyIztyHMVJHCAvAYIEeciD/4EgD0EejNgxYEeB5CAxnMBBrFiSRbY5U5RIieLUZHf1WF3jne89095r+NYK1vft2woJNLqqq849Z5+1vvE3PF2twrjNGG9sb5v37oeIlVUgysPFUq/JRcKH/WrXmLExLQkYrhWEzOLamXUJaB2FtpxpghhoVigcNEiArYJJfJyquaipSOlSOnNuS7tpM0reZZBz161c78mhNyAmCcro5EOIThothfIh1KMRxkCz/WGoq2gCjhmVUjEEq0xMQeeSdKVWLpBWqBASwdgqYNDKAoAVWo8MF/JUxDBVVWBJqdnYKvqgjCZbZpSmXIASSlgQNZdsl4WIiJ5wVYjJ52BBiKp+fHqxhrxSJrD7WMpgBjVJRSBPIu+zLSEqrTKWXIWlQizvI2I0JI2lhIopSqPIZIPVGwRLQLCDgNK6nEml2LoqlSemRk0jzuDh+cnZ8uLu9t4vfugT//QHf/Q7f/D//jd/9++99MlPP3jw9iJ6yFmsu7+0s3va9z/tOi3Vnh3ZnGsa9yDgoJhGUHwpRSjdllDG9ghrJL6tkHFQ0wIrS4HjEnYxCBBZSYy50opaVDLzoBNihpE6EIkXx8akGLOQ7Wh8tjjvXb87bT2Gede7Rv/OH313Y7L5Sx/6CDh3fWP34slDB1kr5Qj9KaiJINpYZmGzUgobZY1OMUYXyiEnGLBk2qlSq/X6wdOnP3n3vR+8+eDgbDHv1jHDZjuatY3zPtKEeehGSLeS5zxW0Txbiao0y5pdE1ZL/6Tza8SeGIrTZrS7Od0ZT6ZVZUoNoBYhzPv+6OT0ZLlUUmiARsrZqG6b0ayxtrKClLMIVZXX3fq0cwc+dShwGGxkrWRjjdH6dLE8Xq2ikHsbszv7V/Ymo91Z+8LdO1f2tpQWmAJHGEmE9b7viLTN8qCSuq/MB4ZkQkiix8fc9Vems5E0o+nsO/de/9+//e1DkOvo9yftzY2NioBHyhL/nwFuRjKxHqDUnpIlcnjucqnZJTJYIbpUbmakSQzS3of8X6OiMYRLuOp6SV/YgJtJ5ANGr7Cl1FMlX5uf6Zz/w5u3P7y9vVL5Rw8enCE655/Z3DlC/B9+/3c7ob5w98Wrm3sihKOzUwdwc3PXKHV0fFj73scwakcghAvBjkad93MM532fbRX7NTmZq2ykLCkLQyJyEMnfkyIysFVZOVRKp5hK7gA4Wy/JP1XCMNCTAnIMXgoIWAqLRmpbrgaRLZQuz0qXw5hKoRWAxGRADu69CpIh6qHKokFsuk5rfapl0hYGuiRNciFJbUprMbBmwJJ4Kkli0UgRM9lEl9SACErp8pfIQTnJFFMQUWulkqK2UJZ6gkaRQg/wUqD5P7XmMRhjSvtHKEURJSsGsnh4uhQm06RjSeqbkg2z2SXvfW6PgDQypeutAVohWyUM5EbL6WjkXOiwZBP0flzXWsDaBcxJV8YTISOr6sQtM8ibW7uaCD9HXd8xiZA9dlOJsZWxbTWqYrAiL0jvln0Zk8iX1oCsTyD/wpFEDv9BZVLVEQNv6JKQC4NCI/GHNZchPE9k34VBGJqVWAj/FBOZcYshzXJslvwWyLwwJn7G5SU7TOOYJiU95NG4Xa2Xw0qoBC6RpDxerVaYRzFdm220SvUxtoRqkdxakX7VSgoRk5BpZK0qH8F3yLBRIJlvFuUjLgcdmEwwQErBmXbTJQRIFpaHUM5wyEbLylSJFBsuunUkkWqGwZQYHVyWIkaIkI0xFQ9yc/l3GnrISOLQ0WNJwDUZgvA+SUjvPBCHfaCoxog5VXVVMiiipsBEGs+CoZzEsYsE/sjspsiKwImUqMvfhmyrCoRAydgDkn3Og6Uz6TSVYN1nFjFOWZtYEhIDbIXsHboEo5qOCpfP5CYISF0Akcpozsz2/7GEhQRMCs5AMoiZLAozacTlkNHIy9WRhBi8IN1pKgDzpB1VIB6fn50sF3t7V7/wsY//7o+/96V3XvvQd77xN3/5rz7/8se++yffUtp2ERsffu769Yv33ntrvZJKtU1jyREzsRcc00bYBZpG3T3B62zJbvQxGStSniMC9T1dxilNXJEKGaWHs8uvJFLi0UtpgjNmZXlLU9emwXqx6qVQ+7MZRuxSOpXiH335lXFdf+bW7WlV35xtvnZ+nBtNbtT8aAj2TTUQDYsy6UaDURYwISKRKZKU5f0E558+ffLeo4Ovfuf77/g0Bthoq0nbzkYjU3o31WhTGz0Zt6PGtk3Vtq3Ruta6bZqSPDDVxrCUEIAIMa37/mTdPTk6eXB0fHB2fnR8/NbDJ5ERGHQtNkd2f2/3g7dv3Nq/srMxnY2a2hgi+QZTGSHYplokEt+mSlqsO79crfvQ994HH1JKymgX09P54vHR+cHB4+/9+LVnr2zufPyli4vzybiebYxLj1F60xJzgis9Uum1SinG94EGj1JReZoVlFCbOrdrzGbdVFX12sHT3/na195Y9+cBd0b1ze2tivjJKcbRqEbSFgYSqOqDH3QohxuQB2UzQbgeFIwOYViABai1CjQcpUjNvA15ul7hJYKaFj2JGK8D70tre5pWLuGvbO/8wo2bINWf3n/r2PWZ2GX7167/0+98/Yfz0ztm9PPPvlBbk6J/enYqAe5uX00RhTWb21uPHz7uOhdzFMrMF6su40nfn0a/Ds4JkZWNCSOgZ/FsdovO1PSSKDjvywX7xhDNnrxdzABOJ6tdqtY5gZXqQZVSXiw6d7JY9VRymqoqRT+Q6QoMwlQ0EiToE10oo6Tp/XO2/o1f/RVjzf/1jVd+tFzKusqBTQupx6LkpzSdEHLf4GwMnCASefEInbnfouljQE8KMaXtzjnSNrJU+omxk0w6kqRgzjjZWOqQQfCnpJFhA62lRrxUiE8c24mSTllHSqlItm8Y1rIBfMRaibY8l2gBxlnMtJqNR75bo+PKh4UQoXMeSEANM9YEIu98f+7hzJW/eHd3N8aEQhws555JzWxISeOB0XRmtBw7RIwOczJs0/e+vBsboTGyTQz8CHaqYP+94U+wxRaT4cRgp0AAb800wAH6TEu4zCi7krxLPaoGgnASl97j+bKHI6HVFEusZkWuUgl4KYL3m9aeYhpPxkeHh5fTf4LCKbXo3akPM1XtVNX+dPL6/CI0jclJDc+aetacV4Ai5C1tGiXHkfBAWq0Jb6mY6EkjU0lzWknfllZs7Azs4oTDlhAIv6BrWfp9jShpSrz2TitlsxqZeu17NRp5Uo3pYogYFYm3ISRtTcJI8k8y5WSNcqQ4yOLMWqlAon1Ka4deK50hV3VFvTTUdV0iqTaUl4Hlh5SSkdX8WFL5smlPCbXVLnhGSIXe1SUkJZGlVYrnD5EIu6U0ozNKGbE0jxiDUpqQtsKtui/euIVafv3RfV03EUvXaIjvSCdeskBKTKikJlsLSTYPyHWbJqE4ZpLwd03gcZ44kxklJpWFVZrWACrnXGszMtVp6B8dHrx459kXbt741PVnvvrgnf/jW9945urVj3zs42+9/rOD81PQxnk3FdUv7F/7Nw8fvL2Y325Hu1pDTKpkT15tIwHpeHMvA4nbLKNrZBUH6ReSVBEKRPKQAsBISBcCcRgHFVJqj/i+s5lUOZldCKmyDPkPwbejZtW5dd/Xptrd3Hh0fIJGPw3xH3/5y9O/+evPTWbbk8me7x51a1VpUqUsAciXYk5RlZJYYj34IAxU2iIZEWqtmZnQ914rdePGjc98dPX5cfuZj748tabWQqXUL5eGPgBzdaQuzRAIqOpKa5NSZNAJI54Yxp5z3qz1tWb68vYMX7zjEy56f9aF8y7EHCXAZtPsTKpJVTXlLohI/BBQWRklZJVE1lplo2iPolhcLce0MTJyvCElGKtBqKqpp1ubVTvKWgeEs8Xqh6/eOzs8/PCzt/x6YawBMjNiNiIGEtpktxOSViC6YDaK2d7lsJWb5MIExJ6tLchD73/7619/ddUdB9yqq9tX9qqUrNHrbr05GZd7kfL71m6BpeUuaUi84WJsiiE6epICOcyTymwrNNKTgpJqdIq4du5i3Uk++YMB6wArIaNN/WC1XCf8+fH0r926raX+yeMHT9drMCauu2t7V7/x8N1/e//tLd386osf++CV61nC2vePjg8n0k6rer1abWxtOUzTnZ2u67v5ErTqUjxZLRc5r0VelYpMsZ5nCCmUKllhTKSxWr7QEEqqY8dorXWIQWnJwqBKKlCAsfyCEDAl9ZYrLAYNb5XB2HoBLhAMQYIiXUJIkVKgolVkRtIfkCmQn2vEq1n853/llz/88qdyt/je9773+mKBRDamv1UOJNnCUUNLFQxZm5NrITWFxO4TMSC5ykDyJLGnRSLYHcSSd0P0hhnhRFfiigrLO5GZNVUkw1UNy0zmmKmwp6Urrd6IJq1FglgKalI3yirTSCNLPYiqQjQpNdbUJA6oQG4oddU0EynQoUexjr0kFiWBVKRL5KMFRP2KwUqZrXrad0sMO7a+Nh67GBfJn67XQAKL7MJIHCpox2OZ0yyG6H1gga88+JQOIpSZt8VECpL5sshC0rBh2R42ZGBjDBjEJlk4islY3Fewi9JAaORRdmKLLnqFJHlHwJru7AmWJAwcA5pj048pTVv0/Q42MmBTNYbYQUT1Ii04qfrUH3t3ox5tZHFrY/vVs7OYUk2ORsxfJDmClEU5xypFBXoiNSUa1i4HoQStTNhFkQVD5HA4qUFn/zpJoFZNcytNDX2jRSuribFKqVgO9+CfRCDT0of2zlM/Wm6CRyRskvDUAStpGEWpjVaCOW0M+oJSBAypjVkYSZAhroRkKclJQvNLAnDSqCJRENGlzCd1oN57KXQlagVSCwUWvA+xvIIi2yy8hEUwjJ3IjUIE8hpJ77sWkJFUEqmK0VSNJCMGKcmzO6EEMLIUE5CAjS+YokrkTobUKRqmYJKxVLSlTS8JLJb7WX4E2aGDZZkU6lzZJMsqNalGF6G//+SREDDd2PjcCx/80dHRm33/D//17/53/8l/+rnP/qX/+/f+NVgBoGIf9irzy7du/sHDh2+t1rptryqDIbAzY+J6RIEkNxBJ1wYFrKhBI35egnJdS9HANlylXYyohdaXYoqktzrothghegJKBExaqsQGReXq62nbHp2f98kboXYm7dF8laX66XL9D37vD/7+3/jr+6PRjdnm0rnTgMoqKvgHqDaN6TLNoUuxQJ4E5f2UN2pkzKiyqttWGbPf1B9+4a5t6nJkSioNbr3ulXSrVXQ93VtNum2glA6DypFpyqUhsD8hkp1z/WoFOfddV6q0VAJS05gro0qS4AG7+hMYH0UC29SVsiml6cZ0vLEptGap1BQHaHQGKDWmjzRfTDF5MnytVKOTABdDOZ9K70ybX/xLH/XOXZyehElllYmYQix9Z4zZxxhIvpwwySXalBTDrQnFC8Tke6d7d3W2Na3GTpp/9vWvf/PJ4YFzE61v7+/ZnMejpu87I/WobjLRSxj2PyigXdowKBiIHczAIXUIybGVPRNbpSyAIxHAiBgIEHBysU68HxvE4ZMqEbxkL1VV73TdE9d9uhn9B89+4Mp4+rNH7z2YX6iqci5MJ7OzlP6f+29bVX3xmWc/d+1G+Tq0XPn+6OxkczwdV013fpHmctV7YaQj+511v16meObdXApHWl0lJmoFiAoMkNIrZqJW8ThdKfr3Eg1CeQGUg2A3a0KlBKiEJsNQFCLT3l36FGpQ1jY9xi6hplFdYvfS0nsp5q2R768RJBbM8oZh3b907eYLzz335Kc/+NLXXnn99LiejRyWjKskyXTw+FArKnBJPwFL8Z2hZC+S15WlJoiRFzKDjKQnAUuW82Sxz5ip40W2H+BVtBJqsAYq+YEF95KIQOU2DHYTcqDhyHKJs1SM5EIBWpafQK7mQlgQVqhGy7E2OUZIuVF6HPNLt27c2N557d23n8wXRKIt56RzLhuZUqTnoMqP1AKUzkKepdIpf+TKjZnSyxAOe7f0XtmaIQwEJCl1yXgygYDTFFfe+XI+M+mG/kXiIxeGgdp76XwQWbxbDTvaTH6ELMShWAoa2JohgWpsLbISlyKVVG/yuSWBH5qOIlm1s1YKz95JCJm2byyOdEkhJXqJqBA3qvrE6Gjr5XrlXE+u4IJJ1wlTpcydyWQE0Bn96pPHGWRtNfKYn2RctGLFb+7pYVZVrdYYox8wDGQGIVhDhRiqCWl+Q+1bZtvLRK4c5bEYkAZgrPQoiy1jWyUTxqxF7/sVhgXgWehdxBL9tfS53ChTWaBxEKZstUXMWI42o8SlIh0h0qJMZBwgBydFCkCWZJZddDGEylqyBgOieQg2umfh0zT4SeUSGkMq8TBTA0FfM6P1Lq0xCM1IRnHMNCCiXvnGQsm4uXzeHNgGy9jqzdOT189O9WT8/hdGHCLBkkaSEXr0BEtVyk6ZVDmTeAlp+vFmhzwfB7d/ViKlc6CIjq2HRRbUtkq961YXe1J+4bOfITec8P17r4fx+GenB+cHR3/tU5+ar5YPDw6yUX0MmNKGtRtt+2C5PHFubKuRkrS8HpZ8kkX06ScmzFoql/PS91JKRVKKCbIDeRhcBtjSBmOy2lhyzWN0B7Gby8eeIzqK5Vujeq9tU/DknFz+Y21tH8Pa9aVXlsoa3XmPRr63WJ+dn3/6uedGymgh5+uVBxF45pQFz5cIViiYgCd430nKD5nM7wQ51VR1VdWGwNCXngqy/P6obZpxQ8xhqTT7kQOtTUidjxoQIaCqbD0aTTc36o3JlWvXsoDdK7vteGwqY60dNU0JjjLXTWXJqtTUtp1MphsbYNTmlb3bL3wgaWkmE9OOt/Z2q8qSAzTFfrpZxL4x1hpb2clso2lbbTSRlWWO6Hvv3Np3nXe90VoJTQ4N5R+u64L3ZIxB8FnWTmF8H7MTMoSUYvCid/u6udqMq+n0X/7wh//iz//8oGRZePHqXqt1pXVV6cVyube9WdomcswsMURLbfQ7h8fHXW8ApkaXUJsYbql4/IgCXAhJ6BWpel6x1Y5kHVA5NtWkrteIp10PgwwgB0LJRrO6sk+D/9lq+SFjf/PZF17c3Xv36ZO3T09Aa0yghfRN8/sP3n0a/Ge39//jT392Cnn3+g3bNk8Pn/7B9751e2f/r37ssyLlZdetXL/s12vvUeaV907LsxSWKQVyACXkc4i0HiOB+niJeoSIg0wv41YkOycSqghDyJEwGtJQ15LI9kAOZJQMU101Wq9835X8Q5YSBGHjcS4S7pRE7ciya5gCSpVFq8y7Tx5+6Ztfe+bmtReeufGTpwe91kz+ZolUGoZLZOEMdcnaIiurSFBuIVnfpIQ7koccAEeM5+XhMHtqkb5kucLkMDfYxg+DNOqomWpsyGiB1ECjYu/UxE4NWbMvZiqVhyDENNmwpkbIsRCtMeRynyYg2pC2RiMp4d6j944W80zLCI8ICFYxyFFGyIGMU3uMLqXziPe61TKEL9x5/pmm7RB/fHbyaN0JZRieEwF88JWt9nb32xhv+W65Wq9BRACyJc6R/h3J9AnJtTlJZk4NlucaRM1mJtwlUz32PvtoeNgpq9pU7GQwoKrEYNUoL6lIpcMAiTBQxy4JP6yoR/uYwTM/a7Y6kUIjjkztKttZ02OaX1wYZhmybT4hCp7bmhnMup28/vjhIobaWPEXaqGEUWdyDpTDqoWcatWSSr4Xeaj1qAQm+mXSmmUuynuwetj5k0rLwA/TIFqAzQy7xm5Vdcp50XXKWlDmxPcuC2lNn4JL+azvQesE4EqYQaRptjEccIU2OmJQmnyOofzchFFpFjYup5a8qliCR5AxnBrUx4YND3vM8KMgzk/MkgTKgWBWCdFayyojSgpCT0gaBg8z8CG70H6aaHx6YEcmtrihpzFqsrbMCCy3iWaPvOlnqzAy6qeEQF90aYDKL1PKaGj2TlJ0ydDcjxJD4OiaSrpPldKGzMsND6zKc879+XkTw2c+9cmmaarK/vjevZUUK2VfffqgW6x//sMv3X/wYBG80MohQs5btpo1o/vLxYl3JMKpGAhIlrlwac5FWnfkq0bU1qylIXnm1Mt8FHwCmKlSuhnJwpN5wE2SnRdIeYHY0ehgWtlrsyliIG/MAVBotZmvVkiy4dZYY/Sqc8moeydnfdd97M6diorwlVsLoyOL1wpuC/KwjCmthiLceGQwuWSnJ6K+DYrZhFfA0jhGsjyN5Y9VuiJXgPKhtSRammZVcUHyF+zu7Z2rm6aZjF2IV2/cVJUqQeH61fHmdLa1ub2/Z0bNzbu3ZWOnWxt3XnxBN/V4a3u2tzeathHT9tZuynk9X67m8xSR50OXcMzEOHdtVcAYosdYOhyMKXjGtZZigMjHKXpHzJZUunDMpYGONF1k50XCzWo5sHU9YknQ634G8pnJtG7HX3n7rX/yjW8+IV+dD+ztzuoKXJhNx2dn57PpZDxuMeFgXEIrD2ntvccH573TABtGj4hTIJnQopi0LjEnlDBHlADPVE17ObseV6ap6uP5oo9I4hGC1T0Z9KKMOcT4+mLxjDH/0bMfeH46e3J6+vbRgbQVrZQh1PUfnxy8vl59YLL9a3ef3wJxOp+/9OEPg6l+8vqrX3vtxx+79dxzm/vz5XLedQjQk+aPMKZL6bhbnyOuMTnEIEpxzN4lMafI+vVa8ePiZedgB5SFUQMKVsX4QlXvVc3c9V6JiJGd0GgfW2JGrXWdklayS+gojJBqBDuSkPQ2TbfK0SHR70QklEzKCSfr9Wv33/n0Jz719/6L/3p1fPT1e687qwlPJDETw4/FARQl5EsNdgoRkpUeGVdDDptZU6EppeQqjPzChSFkOiEFqR7Ng7QfkLUw15aZVGZNCdOCJXYVDXJYb0gKYoJwuctVXS6/I1I2mGuAWWUqIbMPErJJ6SNXb/ziSx9bHB6e9f0i+EAQYin1OoQosqlsH6IH6Aguiko4UgI7xPjuajlR+hc/+ME24irjnx0ezlkUZQBL5ejddGO2NZluhrCxXpx1q55Epx2IQNyfWNIwdUKU1Nj6YKD8pmwhW0BIjEMRgyEw0arg/f0xgKptNUhLDcn5fUfCPCx9CVgSBlCAHPDjLK5BcZJ5oprsbspDoT7YSmkbOwdItro4O+NINGykhULvb0zaianaUfPo9OjhYmkrWynD4lpsG54GkJkAJUKK0fmJraa0XnXA3+swXGKXfmKYZVYAVgOruYRzlbORohJqmvNnrl69ZkyTRRB57hxIHbM8cf0yI4Kk4ig7olMYbTJpBDKbdkB4i0Fcm+01B89/xkuwtQANrZHmvVZboxRGJHvqwTaVxtH0GBBVuTts9FLebFVZwYZcknScpVS0RBiY0JRguUIarganAWTLuQH2knhaDgNKnKWw2FZMD5O9xKmBwdiKdwms2VnSG/XJJVpENsrOObF5AyQguIysrKHBoGDfMV0yn260Xp6doOteuHv35q0bldYHhwc/vf/Abu0ceff9R/c3pLyzf+3x06eZihsfghHi+mQybpo3Li7OQ5wQ6ozlDIcpJrANkkAmK0jetQzNYhTi1Pt16ZBsTqgkGAoadAglP9UoYJ5TT5OVidU3N2bI7ObLo057NXW+XAiSJCM+hlp1fZLq1YPDkRAv3bo1EsLHuPQOeTIkgWE+l5Ogy0kpmzbRWIK6Fx45gKHSkFTIBot6EnUkPnO5OWQEQhKJg6wJtzo0xkJEkVO37s7PL7TUJ0dHfr2GDOtunRCj9wzmKL+MSYDsunXXrzcm0+V8eXxwmJy/OD1ZXMzdahW9Z0QMEQxJUY4QGVLpiKS6zYUvzQx5oYSsHMK80pR8DI50/ClTZ2TNSXYGo3K53FVVuuEQYvKx9nhzOtsYTV47P/8fv/TKfe8zwJ3N2XY7ir2bjcfO9Snn/d1tZqKzcSyQkGoEeP3Bo0WIEmAitRZZkTr38Me4UFdylXCJaSbFM6NWRWRL22ld9zGerbpBbYJdfQhBJCt7mOPP5vNrWv/mcx94aWfvbHnx5pNHsrEYaTo8Gv1gMf/exdn1ycZf3r3+6Zt3Xr/3+vVnbj1793mR4JU//tarT977hQ99bNeOjk9Pe1re9hgSpJDTIoQj181jDBSvTIlm0lHxFyGRe6mKibhUlMBI7ZwBg6xFVaLDFoj/8rNf+OyNOz96cP9EJMVjwMEWXYqEVcp7TSuknGdMRPfP7HTH4EPqkAhIRFprlIMJREXMfqMD5A8+c9uuu3/+5Vcei+iVDKRYRnx2yZsM8b6Ma8mykg2r5bDr49pSkioADD6WQIT4wWcBQdDiTisiW1OMUoPpJScazJH7RDa6F0S4EZeaTjRb5XUlD+6oQJHSZKyV2FDGcGWbs8q56vwXP/LJX/rM53726o+frJaohNK2jxFlZoZuzLDGsM4YQAQhfHkfwkn5sOufuvXz043P3X0uOHccuh8cHUWt+VOyJUKKaXf3ykSqfQxpsVgGH6X0KfvSHwvS3yiPFQmOwBiqwWuFlrkVZA0k2SxYzUkMzri8RCSbCZSg2XYsS9IWuURKw+XsOvO8FAYKnWI+62CKNORwTKiIEImDQwOgkKsQdkuQ1fV4UtWV845EMQYfiJDg0Xx5q50a7+/uXvne4aGPcVQ618xOpVQmkGMWGbs5CSeQwa13U7NjR6t+Po8otabZFxia2Qqah5ssZEIj1KDrTbPzQVEo4kzra9NJt1yve2yMXZfqCxOQC1h0ZLMHKom6qnLKRqhsRA4YE65jb5SutSYCoumDizEmY8vJ0DqEaAg3ESMoUNZI4oihkgqldCGy335CJKRJCXaVtkCOCxiDIrh/ZtFdTCDJbkAyHI+1lCiRMvSfYJ4YaWPEZsnlYieaGqOW2hB3hUxdUWkSKSHZeozeaFsa35gYdTX49qRMisdInoOSvPZK3CfHciBQHkqQxlQ065DkEEyOS2Ho7FOO1ppZ264v3Lv33/7sJz8phLi9u1uFFALub199O+E//sH3/7OXP76xs3NwciyMzgCrvm+Uenk8dVeuvnLw5N3V8tnxrMq8OpLU6ZN6JumP4mD2lSMMLtjWiJGSZxFXZNJJ4js0daAaBSH7lPp0iX4A8DF4Ti1UurE1EyacjJqzVbXywUidQzBKzkbtyWodtfqt7353o61/9cMv73h/7hwCRgUhRmUtreRLIy+ViYTRYzY9DotqoKNghBI8w6P/Ix9nZJsjajDZ5l1LKwVbiMMA9RSSZINVxNKEZoTUu0Q2TWlQW06Gzj8Xg0prMlnCqqkvDk9SztZUJPCLQlvqipjpLUl4KrOcUIwhhlDSp9aMcWWi94BhJRNQAaIcdSruggsJyfuoVGyynF6qJACpiS9NWAwhxD6okK+Oxlvt9J3V+h9++ZW3qVm82Y52xm23Ws3G45Dz+cXFMzevYkrlotHzgEHPBnwqTTYHmkBWQhmiIW9F3kwANXaeQtC2MRYHhoQUYu1jDJjUsFBkSWtJe98jDD+bz3eU+veeufXcZHJ8cf7mk6fJmtK8Ieq2/cl69Z2zo8lo8tzm/s3Jxr2HD56cnv7Szl6JqH337tNHDcDE1Ou+8xmdkBic0hoxuBBX6KKm7j9ibatx3V703Tz0oNnwRCTAcvkyicsSqhIDUrYsD05pBc5t1aOrapS69YwVK0gSujzgiJVWFuRVrTeFeuI7h1GZShIjhObbNLUmrAaxnPQgccdjUbhkmtbNl77/3W989ztzbYIhxyRZiigq+4TUhiYatHsi3fWMkaWwCN2SLe0CKN2WFjthklqnHEt0kypAJNel8hWx+VcMiVJDYkJaJskE0ozL5GmIFF9oyU1m5Jk0h1N5GtSHIwJJmEnMI6WnWhk6eLEcb9OiePHa7vzd9/7l228vMSiruhBTdFmJvu+tKSVw8MHLvCo/SFG0DVrrefCnIcScntu/UidcKPXwbNGXlsNeat6V56mNqUcjHeKUtCii1AlEFGz3XVIKshwJuyuzB/igy1gaaU2KAIxzT4PIFY/bOcMyZBRlvhSsB6lo+8cAaf7+B8VpmQgScymzy/6DNBNSWQxfD+0aBMtRkPxptM431Ju27SgPLhdDK5i1eLharTMK3z+ztTOxlQs+DpgEyNx3XpqYstO+l/IE4Inr+xh2dL2TJCw7wb0v6ScZWSKNFjDWtlaqLp0m2d7RxJYUjtXxfPHe0cFFt6y0qct1jsGtDNmqksm5sdSwIJZiSCZQCSpiE5dmt8QknUEwSgVEielxkBoQ5PpIzXr0NDKQxKnFS/RyJHcRAvwNphmRuMpI2jTSKlXeekZrKiOZA0jMO1I6IV1qPQiQkc6TJnE+DcIaQzUmKCWsMpfZl6YVplTAKikjRKXIOZvUHvkNUEcvjdL0iYVV5DcPmW2jSuSL2UhpS2AYNlCkO5MSNdYc2ujB0iGR0LSjDPDO2/fDussg97a2NkaVDWhjvLJz9dDUv/OTHz7GaKzFmLQpyem861K3/vyVnV+6fm2O+MbioiNHz0H8Bd53vUQemA8cAR6L5DxWBgBWmKXU5FdBhpVSuBg9wHkMK2BpVuLUs8UhaBYjHKD+RBrd2pilXJqYWMIEtFU1rSuIuBDif/7Gt77y5pvT2ezGZDrKBO8iTt+lqedASWIqp48OE/bOeR9IOKpkquADQRfeF7NUmZ1SUGjCaJeCG0u9Rq5wZMFBWwFyAGMWeE6QYiniiQSpJXsDRwK1I206hhWplL0LJB8JtH3kmVfSIIj6xFKo5ICJoXN9RLKlJx7iAGEYftxlmofBnj+lHHxMEZk6MxTnNG+XZJzFVmsJBYasQtwEuTfdOo35t772tT89O48AW7Xd35z5dWetrW11vli2k3GlDYO+B90/0pijCT8EkikuhVqMvYA+JZ8iFdnM0ChhYRnLn9nUVjN/mDr4zvcRIoGSBIullkbdmqfR/XQ+35Lqbz1z5+WN7ZOLi9ceP0KySo8B1ai+H/tvHT0V2t7e3BuD7nz/aH6xsbVxc3dHJJgvTx+fH7XCNCkdXZwviaax9F2SGawKkDrSdqfdrQqYF24BGpqqGQyJTGmYKBKpgbRF+ViwzDFV2Smlxthm1DoJqxCI0FhSCiQkO3xoM3z+5u2Xrl+nKo5037MksAv7jtBCPrPWhzB6MDijOaYy2rK+3qKqDpq6syoOkksqU7tC+qWCHajZtDwnUGxjKYQRSgFNieRgFsb7yUwWHRSu4yARCKQikSPD56gXgFLBS/4FkFeboI2v0aXpESRXLAcIvJCD5iEINo0rnS6kVmudBCGhRcaQYpgYdatpX7p5q0/paLVgAw4EKD2I0gFRyNyOG8giZAgZyf1chpy6lBYYxsre3t0D7z3kh4t5GlyWGVdVnnwzaozWDeTK94E+eSQ+OqlO8sZXpqwSd7BicE1gqKBkr22qu8T7LmkDhp0GNWyzerl+B3awInPfNBj9D1r+VNqL0grS7hDYuZ9/1BCIYPDpTfwXCe+PgD7GBkBhGE9mw35GpkEKRpsT50673se00YxuTqcYAmHiJfcBBNQWgVg4ZPJYDkSf02nGY+/HGf6rj3/q79x+tumcwihjsAFF1ynn6pwsgM3ZClUp2jzzdJ2WqGRwY+a9T3IYJI/teNtOKmEii+9kaGw9QI5FrKVutGnrKscohQzBiwy11uNmVCtbWaO09cQN9cmXLIuojWZSeSKrISWUsYo6YPp5KVola21siZ2RRw4ePfnSEKeTsr2PKURUhME2UkMUiW53TiXjE+AHuDUJMSiVtRK5tNdaKUGJBvko55QUwxlStspcWs0NgAsYLCcEdcMltGmQVUnIJe8aOXj/ygRWyIwBEvECWBsPsza8kSB+sDL1aKKEfvDo4dnRiQB59cre3saswtgkoWPe3dp/ItQfvPfuudGi9JqehWZOVxdp3X1x/9ovXbu2TPjGatVplZVEkfB9h+c8LCTycBBKNScxT2ylQaxTeWekFDYo+qEQy3LHSD5HMGefdQiHcoGxHmSthwCiNdVs1AYiYCOkEN101EwqK3I+xvQ/feUr3334YGdzZ8uMbASjVGlKMbAjN+30S9Mah24QU8Ru1S3nq67rEGMKIYUYMWSyzGUkYmJdAgKkIGHwU2k2QgzexeDI0R4kYHRYKniRYmk2vfcOfab9dia+BM2cwFOjGlNmpBgRNwWpAArqU9EH57rOd92yW82X532/8sEjKR4RD0Xxzp+NiUt0INfYcjh8JsP93K9c3/Xlg6dAGv7oiOmEWG6SMqSC5zG6IDHXKPZnU6/Vb3/zm994/CQCjLS8vb2Jzgkh27rp+j5Gt7uzTYpyg48Z+46T9S24SzPCkoAJ7hso+BC9gYKPUl1Gn/NU6Vbq9P8DotJKvpRiKkMgOfdkzJPgf7xczqT8jTt3PrGze3Rx8dbhARI4KGJSjX2C4StPHkdp7+5dG2UZ+9Xcdx3Ga/tXZm0DAg+ODp+slrtb29v1yFZVhNz5Pml5ulrNu76X0Au58K5ETy2DwDPXr5wnjW3dR886dpyoaNSkaVYiB16DgkiWwPMYH68u/vTw6VGiFVVJR5oee0wYrZSNqWxlCUOnM4nGsnqrNLoyZFaqCSyCKWDklK9KP6xjOaWJtBJLp0sezUDthCeHFyrPIJH0uhp8dlI5VLzQSxlJJDJFj+UsB3ao8ySeSGq3SZakJGWiLzRi+UI0B5pyWZNLnqwWCAhA+ly02tIpASYMGKjayzEFYlewl3a2QoyVmlDvy3PslHOt1FSobVNH75IUZtwEMZiZGqtyKrmWjFUVCsl+KpLGhCBFh/EihD64a9PJ7niSEl4E97jrQWpgL5Gcmfo/Ho9NxInI6NaUgGkjSfmJ1go0n2P2FwxeF8NYOJVGTbEwo5DEF2G3QB4tcZ2UmdCnh20rZVlqeyW1BvlS5opLU1K/GuygL3VxCQFLNHFeRZHgN31aygFy4WObsOp9Y0eGtPVp1jSsgV2Cp4vFrZ22Bvn8zs6948M+Rk1ifswGLrGQJipGKPKayBJkVDBPeODw5PTk73zoozvSfPPte3vj0c3tXUFb93fP5+/0XtRVCVARecAuyRFwXUp+3NqcrRbz3vfBh5Cy0NyOerq6bO3EdlmqMjWt1VFitkqTLnTpFGujI6JWInILlKLSWksLOWnDOkjZYyw9qJU+RBICw/KryiTvamOoq0UJ0Nhq1TtG4aQIsjSrgk4jllZIyhAQmWJCzkhsyMuMYoI9KiD/OAVEAqbmRLFkcS6XkGBcxMOKVOYTBCslLAUAIRJFOdXlc6WYS31CcDqVsNKKoNcEwVACsHw1GYNPwhotuF1juBPhbjDGqqpsXZ13qzcevrd741atq53p+LXD42a6qV1fK7W7c/XR8eNvPX36i/vXrE/BB2s0Ih6eX+wj/JW9fZ3zHz558rPF/G7bjpQqD0QroAZJ0HGDARQv6Y2nVqpNrY5iJIVRQxwVKIlByQ6jV8JhGDSBSyBGFz2hIkmEPmXWridKdtwcT85Xa8Kpli4Ro98YNwnyOsTHPvyDL7/y9//Gr93Z3l0+feSCF6W6whCFUUKXp8XolfLsaYyaS/kFeblaOxfr2tSVzRGCiIY0OOQgVqdc8ImVZLJMKfbBlReKcLFcLBd9zmAbQ2hnURoja1mNPDlPdEnNc0sxmJ8JBGqGialV+mbXKeqMQwiQwQdvtDa2fO/WWkKTa16sJ4iktQtI7XQIGByZ9uTA1lrrdY8BB9GdLJFkDrWWOWYjibSZyRs7YvJBOn9ltt1ONv/ZH337D998owOopbizvZVjxoCbk4kQcLy8eObK3sDPFdIoU/o8Mbj3KKlCKrmTw08AWPggKptDrmUu9S2KoOCidwCwT7L7AyFEAMUKWsOz8UgGMPZ+cG+tVlek/Pfv3PngdHZ0cX7/9ASMpXlVqmp7KOCrT56sQN7Y2tusRv7ktJ5MEki/XN6+dl2aKgv54PhoCbC7sZNTPlsvXYYQYjbaEzhw4eM8+HWMwliPyUOpGBxiiqssyYuPFis8NiPZBMFOmyQTy81A0tbe71b//bdfWcWwUDC4v9DIU0qytgX5/YcP0IhVZt0xmmMpGaLgfVx5PZ3JRIvNRkkkl9yKEkGZSokT6GfTDioJODo9rpt6c7ZFhjaZ6CQqEf0jMZoUL9XHyEoBPX9TIvukLRkl0pC79BalBBOm3MQSOyJPlEuoE4FdUPMwrZTssi8zy+aSIq8krQ5h2UeCWgiVwEKeaGWzKCGRtO0AYyXkBPNuZZc5/5sf/llnBCpV3rDMSsoQ0dHMeRFx3btl9Dior5T77kBckLvI85tbtTC96A/Wi1XMqpLDEJkW9lLrUduMop+lvPIBuWuFYcKchzsHg1f+MHygTpasUFXJo4Nz4NDH8iafzTzZ9YYAJDoPmBcGasnLsZ+4nEtTfZbJ8Jj9TYFXGjkJyQJOEgZ1D94MRJlZ52mJcd/7kZCr0ahp24uL85KnBu/xcrwezefd3pXG9R/YufJV/WYfUmNAkCJEKv1YYnWsSNQF9oWFLJzI5xr+1Tv3LpbLv/7xT//ynedMSuNRLURErR9j+id//K03FnNBJhOC+MtsrMZzj52NndPzRQBRW6N8XnjnMc6a0dp3TBwuJRThblj/NJHFx2TUeELEVKp81ZriTh8DhmRYtSUnnsbxUo3IciCN0EKSMR3pnFJ3kjGWrlErdtpvbAUsOmoY9ypiDJreankpKO0F5BwovPKygT+XIg8AbrFApUQXRdIgPUDgzUBJwzFqQvHrPNDIyCudyjghDJBBYvlMxBwnVrQplchA8iVZlIw4yLgaSUU2obcuoRnck+ZxM6qb8Vm3+ulbb/7lT31eJnHnyvU/ufeOc/2Y1qIo5ebutftHj//k6OBze3uSoLfKKB/xaDm/Yc2/c+Omsvpf3X/w0+Xi2dF4Q5tEAB8SAyC1NwmXE5fytK0QV4w5irFLKSqlQyl6ShaQYhnR8bjeAJMJSxOKMauaWJUMQM2XxGqhldiYjA/PL4Q2pJOnU8SNUZOWnQd86Pw/+tKX/9tf+bXtjc3V2YGXggzVaLwboTQcovQQsVRdWmQRBSqtjbGY0rrvMWJWUFVVxEhbeZo5lm+m9MZEOvclU8YIWV2cz49OTmPMR2fzw7PTtfM9BmuqcmBodxQwROb4C1FXFXAHxEic92EeNG0p1QakWqrJqN7Z3Gibejqejif1dNoqKUvBRBodKSfNUAgSSiSEVY4xlqDnU9+7mJHdtQlRUgqGkv6pz+DfJ2RWLL0Vxk1d7W1v/94Pf/S7P/7JHErEvLkxq6XqV91s0kolj8/PRlU1m0yS9wDZjmqrVViT5wsMaDQfSbqdRTMAPMAyYkg4znosjFRimfIiogXYs9Zk6uAGN0UamLD5Jggw5l3fv7Ve70v5t+8++5GNjbPF4v7hobaVABHJyvdYiq89fXKYxf7W3k47i8vVtLbjqnIuXhmPX7x5m8PlGwePMsDWxuZR3y/QWVu3ul1H7wm7sYohlGNkuhA8ASS1tj2GHqMSRPJGD6SZzLt1ikYltshB1Ks0mjGjV+It9OWMZJUigiJMeOnjkjU1aPXIlSzvFIQYhDQ8dCQtFKTCsYQZ3maxfEMp9BWzinJKsZw9LUOMJPiqU8LpdKKsybz1lJrEPIKkGV6IUQlFUAeqhEivQzIgpaRHQyq13JQS1YkurA9BsybO4D1fevDyk0tTo8QlzEgMFOg84MYSda2QGHUCxPetBIwBRjQXNlSLV/RyGym/dO06+vhocXEa/coHVdUJVMwekQwSpFwHhyAdZE8ECvZPDYhLyKucLKgX9q9m59ZCvnd2TgganpOVGiakWNeV0abt3Sji01AaMsJoUH+f2P5g8OFlt4TLPDyoXBkmdGYuzXVmDejy9EmTbRggl8+rGtuIPFAAWDyUW1QihjIXieFrsuQfeg05+PqTKjKvFSmkachqIAQDK4NvKolVfWFMRFwu54IXBIL94sCHeH063YY8GrX3zk+PlovKKDvIlAl2PBTlEEoeKw1qWkQuWyv1YDU/PDi8Vjd3dnYtZNO2xtrNjc2fHjy6f34WyT1mYNEKYQTMlL5S1c9t7s7X65XrtLERRKlVyzORLqWV80KIymjmvxBaWSKvwgRoIWuhG6OMVCmWR6bLoWB97JzIGZ5xaOUoK0Ni6kkKWfoqKTxG71yljdVGMP6eqEG0ombhEdBKR+raS+jQ0tB+V7L38UBLJ55AAi2EtSZF1pZlST72SlVZgCXEP1dQarAVA2uMJOShoSaCJrFEtaNvX126oAgW/ysJWFSaCMLi0n1MibaqNYBVygiyJMlZCVlbSyLGBjAen5/KnL7w8icsqM777997HW1FC8rkMUljTTN+PL/A0F+dzkqdgmi09hmXfT9R5uZ0Oq6qexcXJ94bayqpBIsdCfU+4/D96lBmqIw6894BGMgVqe34BBcJV6RsWap2NVSsMsPV2XRc2USerLTsEIw/IlpNaupm7b3zQWtNimPle22qKsQgtTpc98fHR5944YUKoOt7qRQNkIa7dEmsF+QrRZedEO8pZ3IBB45ikdazKZG3fRIhlCOBIfngQsCcxPn54uJiTv2G1Nq27bSqR8I0AeR87VYurAP6JFwUDgGzWPVh0btF79d9dAh9yH2pMiCRLj1IY6tq3IzH44m1dXToer9crnwIXMTQW8mk1lziZozofUBMIQYfgiv/8wT3k+xaKYXydEd4PKaNLonexxBKyM7OjUHevn7zj+698b9++9uHpUAR1yfj7VHddW5U2aYyKPJ8tXr2xlU+zcbYtqlDjKR7NXAsrLEHy+Vbh8fvUzVAQCBv+UbKqTRCiAPfnSDuaXOrqkX5xCRIwDf2co2Hxr7j+je79VUpf/2ZZ16ebaydf+vooHxDBLCQ2iyt+erB0/s+7m1d3W03s+uz73eq0VZVzReLD+3t/cInPiGlcL7/F1/5w5PV8qO3P6AyLEIvQLSjZtGvg0hBii7lPqeoRJ9QkO04JggkgUPqmKUJxYRasVuWNEaRDpohoxbkS5ag5GLDHL/Bnp3XWKWOL1EjRWG0y8JB4kqIxMnprwtJZjCp0uTjSSGF82j55bBxS+zSA0jUDCqfjdaaJKA1uX4R44PondRNDkBBOawocyJhAKJ7q/LKpZZXyvCcrkRpxVLNlBoUaYZSvtWD5xKQkXwiFNDAd2BWPbm4kvotYclKkElpV+pda2lolyqpaqUgxTalu9Xo1vb2o/n5qXdRy44EEWm3pEKGPsakS+oNmexMlKQFdeoieszznE5dd6Ud/7vPv5g7dwLpzx4/cuxUyrSPDDH4zY3NSdteizheLY/JgwFBetJXQSEiNbqkX0/0fcHUCsnUKZOhhkE5k8RfWQ2LTUbYJRkG52WRSb84KSrJKJPLQYuDJsnsoURBnbieYpBPkpS9eRrNA0/+O4PlYSmrRXkF14dqAsqHcTtigzlRXl8xY2GF4el88ez2ZiXFc7u7bxw/CbEe1zYPvU6JQ0aJkdSYYhhsj9jxRricj5X+ej+/95M//fWzk1976eVZXYM1Z3336PQ0KU3VMF3zyKQ2EWSaux5zzDlgQkOkKt6p1sbUIfSK1EMx5RhLD8TIGTLYdz4ona0SKSAZilEQB6mprc7el0pVKB8DDREStWQqYkJI5fkSVotFCqlV6qUCxET2YuVcW2UcRtI9p/qFgnfkP5AgYpJK05A6q1ySqzKqdB7BZym1pITB3UPKKgY6dcpWttyZMBg6Q0bFA+yMRLZVZB8bo0jEd4CBKSlVzqiJDAbkCky6QqAMqwhlSSWcIhSYogxHoIPyqJtRq3R1//D44dOD52/d3hqNxsauABqjYkitkHMf6rpRV5/56dP31NnJxza3xLovXaBSa4z3T09v7u58fmdnXDf/51tv/Gy5vNs0e8bqyLtOeelESXG2xIrQ6Gp/1LyzWnchzkam5JIMbhD3Iuco0ktjW1OSGiVZBjYfJWxAZS2IHPteAuzNZu8dHkWauEWqLUpLN2nnq7VQ+o+fHmz90bd+8wtf2IjhzPVCisgqP4wOQxYVLF++ICMgJk4RNIf8tVy8HJQqBmgkDM71KWbaNZTDslitfB+AijbAJDHPrG21ytOx3NsmkGtmdWi23Bzw1cxHJoApgauRb6NWwmrFhq/oe5mE0EYIuZqv23bUeR9i4CKHqYoZWG4uhxSDj+gDQjbSZja3yzKkQCzB8oKs1RojOh/KCfJ9FeHO9RuvHR799re+fUBySVfH7faocc5rKSdtI4R4enC0f2W3NgZDEEK241YZSZ0wZAKClxsCpUXLw+p/WK+VDixDl5O0qkc896ECuFbVVtDcnPlhwyaNjorV73TrN/vulta/cffuc1Wz6N07RweYSwcdU9LGLo36ysHBO87vbO3O6rGMmKIfV1bRGEBAur5/xTR1jnh8dv7u8VGrSzJYuA5BrRFF30ld7nhP/XqAHKnf82QNESEQsJUEMimsm/LwheaPmFltlPiBSiIVlhpkUkRrTILNxUnNr/SuVkJdCjvRR+wTZsm+pSzDBINxOJXQ1PlLFm4jABOk9+WTpOI0SvNqikYE5pek9F++/Iy0QCNIQEbGtbO4BFLQyDnhQKGizEKGtZFYEjFF1tZQJV2kcqjKK5eUiiTuTKwNttWgRCfJeoDJmTKxvA/VHSTXFMNMqT2rS6gNUeZUaW0Aovc3Zls/9/FPvvrqTw4X517KgNJam5VceRd8kkZ7AV0JjIBKRJ9BZoehPAutfcQV1ZkfuHJ3JJUT+XC5Oo9R2CoNGqWihG7I03asYxwBhG7NPAbW3SPWDxBYSgzqj5JjEw2HRJIpa14cDLqTw8YJLtXdqFKgQTBlA5kuJYdKUawGXUsY4M8892a35WTIXy+x3pJg3cv3xwmDgg9KQBphh1LOiQVGnXGEwVRV07ak98g6GoMj7pOLi7WQOeAL27tTWa998IPkUNY0VTJZTJXYUKopJ45MNIEPR6kkOyneFfC/Pbj/z3/yo5OT0/mjx9/5/p+e9S5JFVJAjDQAkAP+U6qlC4v5UpNrUO+8FrLSOmFau17mNJF6ouxI6ZGtUiCckYC6rgSB4gJBmQNbaROtqDxyFDSCSmSYiqTsq6ypNNkCCJBGkX16qS5zKXslePSV0VapSpJsrlQmq4TBKFEpZbW2WjdNXW4gnc6AofwMdCW8C0OA27R0nUOnNYG7ICvyyC6nPfgP1tNPTncbHxGjRNCKrEDp6xICCQytFDn7QixtW017STXoX5SKWhGzSxMVIWMymFtppqra1M1UqknpQtQYYAowijgGqBKW3j/nqmrH7WyB4fX33hJCbtTN7myDQB4lCimMVUrQ+1rXOzee/3Ef/vz8VDS1yCrGBEpd+O7h2UkK8SPt+O8++/w1a9/ouoehR6OBkeaSQfeEbGdJ9pSu22osoAdYpxgQe0Q3wK3KnfKDAVo5k44VtAeYZykvvCsZpW1GElRCbCuzvTHJIajSN0tmROUYp6ORFUJr+aU33v79H/14c2uvFkYDreBL1AbnqVglLVKMWDq6S/eWnDAGDMhQdklAPXQYg3eknFByh4+BVD5yMxo1o5GnLSsogeXthxK2MaUQBZWGuZyHGPy677q+77zrQvCu77tu2felhy91nO81WZV4H4IPtTGTdjzbnGRIzsW6aWCAfIhBbzhpSMr76L3rut6tfYyRDP5K/qCLRHBMKbUxlxxwwPKxInXDWWO+vrXzeLn6rVe+8oC65P229JFGqt75yajWQs67Xlf2ymyaQsoIVptKa5E1rwKANCTzQCa+5Euwbo8cFmLEeMpzxHXOEyl2pZIR1eBzwts5Mog35nXKvre1/tu3b784ajHD20eH8xCilA4xK7M05t8eH7zTu+3Z3qSaZN/HvhO5fKG20tRYxGv7u6UAMPa9Rw+PE262k0lTg9R1UyPkLkTZ1AvvliE4TKzTQrpTggcGDHEuHeYgbJAvRc5BScu++6yeVsqmGAlyyoohsjSX5JSG6HNCk2Uty3X3ObAvL43KCHJdugDNwGFqT8thSTGqkg8wQhBQWro+dh4dE9CB9QayMOXq64AYcvTo+dCzDh2B+ErwJO+i8uGUUAM4ubxpHZHbXNLwkqUBMcrIJMpBFTwo5UvK+C6qhkNkCXze/JQiL5Y0r4FoR5ymqL8ZZ3GjHs90RUZtckSC3jLivm6++HNfvPHhj/Q56aoCoxDABedDMFJvNc3IWjCiwxRIPsRYRY+fRLQyRgJh1SA+tLMXY3AyPz4/7Rk9n4f/xRBLyK7sOKJBnHuHEiKRtpF8+NlKmWSYB2dHkS+lqejc8icZfo+aIsIUp8vpsmTLfcFoQlvV3HQN2O80CBTyUlmyM9UwspeRzE4lsy0HyQ5WuBp864aRJg2aWfltYnRWYm7rmHBxMSelRTmMsYVC19/c2poKNR41r58cH65XxuhKD/65OScr1Jaut6s6pdgTyEuBMGQunflAS5Er9eDkREWUQn319dfOlXRC4uCLrLkIqbXROVlMt9pJZW2PQSjDUnAJRNPYSqlRVfsYEAhAmNBYDaWDhQFmkIVmXenSDhqS9s2SBAKoB5KGiO8BURnJ/A1jNSlNl+rEGpOxNKZGwNhW7IOvpCntDgRMkZVlbPknbaeUIYGhRPWDlDRLpU1PySe961kHXxoFImulyc44p4j7tn55Z/fw7OxCD5Le1hhBVk6KvP/JJItkymnoVymjSBhkEDhLpOFOjbUEqMrpV7UUIxBTKTeE3tX6mq32tX1+Y/OD+1d2q6olWUfS+tAY3MX8zEj5+Q9/1Ob85uNHrz09qNoRJt6m60juELJqTDu5f3IUEPfaFsi0HJRYOecQp7ba0vrW1ubxYvFG33cJW1sZUsdkETCCo9FsDnOt1QrgIka6BnKFGNnN+jLQDNsZsgLcaZoYElUXNAij/qMdNUTgcRmyNXbZr0FpJgoowpdJENbqROy41x8/aax58eY133Wp3ExkqyRWONMkfUeCTaxgD0NFz2IFAy2K9cJzCNGFwMG6NNuZwpxRpqpLNMZkpamMoUseiZPGNEXJqmrEvVTWGG1M+YfSta2qupYKCJ8va23rqqqbRhlhtNRK102zsTVpp+NM8mckrKwdMaWc95l4SzEOk8ZEZ1iysAwJFUm+9gPxoiRR512JLy7sjidOmf/ly6/85PQsC9hqmqlR03F7fn62PZ01lQ0JTk5P71y/3pDFZqnPNqbsV9P7HganoPLEmqp5++jk4fkFDFKyHGTIi15A29RHq3WX0hVT3bQVENpxcMmigX9n5U/XywfOvVhVf+vunRvaJFDvHB2d+Z6MVbI2ZmX1N08O7q/d9sb+RjsVofQJWorK2CrnKxuboVvO9P9H1n89a3add2Lwyju98eTTGY3uBhFJURxREhWoPMqfvjvL5XA1vvGlq3ztP8bjKk+5ZLtm5FAzEmckEiQBCiIyGuhGp5Pjm3ZY6XGt59kHFDVdKJVAnD7nPXuv9cRfkH/0678+Kiou5H/4+799++DFvcnm7bVNjyrxKQFHt3TOc+E5yv0r6XDnFMg3SAiHUHZAqT5EYkYas5PVPFqbe9oEod1eQOwx02iHEkLA8RiLPmZcDXPDom9CaFG0ggnl0lvCelooxGdg+iczG+yDJWXAns/XRzCJxB7Ge8I1kKkbkAKpVIiZp94aub64rpYIG6FFGGrup0YMXRFRf7CnwCmlfAwoJyCI/IkOcohFRftw2v+SqCSBwyNciQulp5XyNEqsQxnhZlaMOSrzE2hUCHDeAHt1+9rpyfEP3n37wtlVCEtnjeAbZZVevTa7GxtHi8VF6uIYedc2MS66zuICNjJYhHDeddeK6ncfvMK8P4/uJ/svVqmekMgG4jGAc248nYwHw2vOV207q1eWC8e5Y8LiYIzScE/XElcwK5LKQGBZjnsFIDkTMuon5iElZKIw9dNojr7xjBIeEoWI09qz8hjrZbRSGkd0GpNXgGsS5uD9ZJXR0CPiMN+D0FhRWBC+rkd5zr2vqkpK6aNP3VqqB1K2XgLsLZe3pqYE/tL2zmcXp857wETnY9QoouaDN1JumyK45iKg9jJmCIiIe0gFDmsK83cHeyer2uaFjr4SInoXg+8VNvEhcCk9hJOufmPz5unsogZbmJxL4TjMnGutiyKlCR/T9UmdZaBKJZZKZRLn/sEJqZD27ni40l2KTBvtMHwCaiKigJFAIz8iiCK4nwuuwGgFIXbWl1pzJRZdG2X6FXRqI4GuJumBRudTzqX3rAUjtVFBspGRZwWXorat8EJrSTpy6QRp+eHJ/nx+2WiFoCpB75W8ZgWOmVgMXKAIO2GqvSdDMc6kREA7h2ggXSwj+EDrPLCx0tM8G0gzzcthnuVCDIt8vDY2VfH08PDp2eksHYmF4MaNx89e8M+fPj05P92dbt7dvVZ9+glEnnFh008LhgXXNoExMaiG1+99vP9lZLM3RiPWdqkDMNnxcul9uL2+dVPov3zla//2yZc/ml02YX63qsZcEtiNw1dGuql22Kry46Zt8G5YnG/ROOkr9xjCQHQ4gkYN9IgU3FS9WRQ+G5Rl27m6abUSa+PJ/tlpVVWruvVMZkVhu9YoUxoNka06+7/++N2yyt+4ttudn/WfBUkVIQTnQCrU2GOkVcD7rIWY1oAVEqOAB9HhjBeunE2JWo3gKTUZjdq2Wc6WLnguRZZnGsfAKpM0fko9OpDmUTosAoU8FfE+uSHjIJGuPbKQfMyGRTkosjxjve8kLl9wNo0SGFg9pNYtBWk0kkt3n6TVldIkMIAi7RJQnhciQbYgNO3GYMSK4l//h//43tEJCLZWlpVW46paLBdVWQ3yjClxcnK2uTYdZppmrNPJxCgkPaA2I9m8kqBhgFi3LVrLxF76liJd5C2ww7pZeJ8xtpHnghS8qIEJUWd6xvmH89mJD18vyz+9/dI1JQPwL89OzrqG5q5KmbnRbx8fPrNufbpdZRUPXvIo0Ow2kzpPPVznnXvl1s2NtTU0s1s9PH7OGZsOBgotn/GScMugC7hlxEbUopseMDSiR/nv6EnjC8e1KKQamZdcKi1I7VmB8t4xKZXSAY2MBAnqkYtRCiOpuNfAYwhtcJZxNFFlkoHSElCtDGlGzHnyUQguBJ1pHgX2mkB3RCKFESnRmF9Twx0EGq0ioUIgAhhQ1YDQKUwhkQLfTkStJwxraCcAjKlUlvkYaBaLXkkuEC2iV7JD2xNEhhJwSGJwUr38fUoX0mSGlPDJYDWgK1rG+G6ebWjj69qxyFS67hVj02LQLZah606b1YvVjBVlRERRkeV3X3rp4bNnB6v6bH/vwlmnlEWitPOxSy8jnTcnQAm5RNOLO1tbI61X1h617YW1siiwc8UCH9HXk2osI5swCPWqY6RwSAQkkiBBt0HUrKepRu/ZiJsAych3AmLvGkhag7g8QzsuEL2UIf01TMDk5h/JSRfFwzChR1KMID1AmkIzZrED73tgnPqQKG6ktTFC2xlJVOOTb60dhZCHAHmWl1ld19BreuC8U+pnlxe/MJkY7+9vbf79Q9E6bxUziuRuuOPQMq95kfmwIzMfmhaR4BJgHZ1A2s6KTAkuZgKedsuR0qoDGXwpU7D2/eo7pr5IqyDlwWrxJrCx1oiTDzKCZrJ1zTLEdD6AQwCtlPcWggch8kxb2wmhFLBUswUnjLGhN8AJLtUTrutw0EJusyTWk461t14qOSiz9HQQ+OC9M1LZGBVq2KJ4GdrxouaBLgyC5HhhMouLT49iqoBaOVzwLNNo4Z1ytuWxygtG58J7hWKK6cePBi9SB8O0uPLYwKIH9VTT60FQq6DlBYLbOWpo46AMQiaN5lByUQkx1tkkz8c63yjSJ8tEauhzaZy3q9n8ZD47WV6uGFuEWMfYgScQRpWV865+/PTpztbuza3NqTZnIQhghTHed5JBKcSqqwNEXQ6HO3c/OnzswsXraxNWt8x5rvRRs/Knh/e2d9Y8/MXNW9Oq/Nv9/c8Wi7tFuWOMoF9T9Lpt3oUBV1Ot952jcQ/KLfbTvl4KCydCnaMm9EqFB/GCSP/1golhVVhnI8RxkZ9r1TmXZbppOq2k0SaGYKSIRnmIjfP/+u9+8N/89q/fmU4vFnPkkqIZq0Ytbu854xrxB4qRMyipwRBuK10ztMZiuB4DmToeHjyT2oCzFIuct9qo6ea0Xi7bznadJ7VewVgQoMjjNhV/qSLWWpGIFur2oW42wu4IwT4ZjdbWp5KsNhAThMaNKUdjqRmUkCzAlYkFzcaIzC+VVoh/j2Rn6R39l/R0nQvRh9DZSTlQRfVXb7/9wyfPQfJpng1T9i1T+evj2nQoBTuZL1mI2+vrDCUstTFZnnMALdWyaxD9ibtzLKi8t421V3uwHu2JYrCprTnD3LwpxEQI7wNu07DRMPo4xs8Xi1mM3x6Ofnf3+ibClPbOz8+aFVOSbHXmRv3w5Oh5Z7c2dnKZg3MRfI6lgBA82K40mRKy8+Hu5iaCLNXxwemXJycVY4NUiKSTk5lMSFF33gXf4Vo1Iv8e69soFEpOBoYegJakU1GKWKbDmoo1jykvou0gNiqtDaiTLJWJONinsZeAdIBKrQBY62LQAjFxSGsUKJhMbQ85sDGhpHQIaUtJV0lPYiaIyGGh5/Lie3TAULU+5UEenEPcCWovpyCBPuGosuIheO9TPA8RFQKUw18EBFrAiJ7sSj4dKKyqAKMtY1fbTuoLr+xk0GxRxRids8iDpivKSYKaWzeWakNnKaIiktShM6y0/je+8Waw/oOHn86id1pbLFyiVBed+/7Hn7aCLSGsgrccbHBcqRB8eo4QeYrL0aEfcBsgZ/GVnWvRBSbki4t5x2RPR8HIEII3Whd5lnufeT9v6iCw9WKkv5HKVk8VVc9KugJPEIMrgr66173HL6mg9oI7RBxj4srSF3Dxr/iVNnQqWzgt2PscTRUZu2qmNdk28z6jI2paXDXgvFcDoR+ESOLIoI6xDG4cvGWmGgxXy5q0/unruZQnq+a46wqur2XljfHkk4vzLnrDMSqhbn1IBaosRayM9iG8sA1PxZsoAbbzlINmbb1q2ww3hKooRsB802kpMFNCi0p6TKf61zK4aNtmtbq+trY4PZQmY53LgBVCrngKxIqJgOpaNjKHMlU0sI/BZVxvjqads5e285EJxRRnngy8GscE10YqIR2Dznnee0ZzhVKNWLbynhjgU1e7Cr6SapyXjY+W2fSjpXZNB0Johd0wuj3SXkTjUCd4L2PPNUlRFIRRKvCYvmHECQ+2YyY1LGSJG6n3lShYxHGaHYLTQmihEQSMZngC2/MQZHC5EFOt14zeKsqpybPAZQxFnqfvIHXnuy6EVfRNdB2DS99deNtw8LhSxbV6baTKdT7rVp8+ffydb317d21zYzA4WK5AZxBYpnSAiAshWDS1C1FWg9HO7U+On7nzy6+Pp8y2SKc2F7b7dG/v5e2tkZR/sr27XeT/7smTR00NHG5mhfS+16JCq0bD/Waen3iyPOc96hl6600E8qSj2aTIRAZ1vYCz5sL7CCEyCZnRo+HgYjYXkW2vrT09OsmrMmrpnCsKgyM+n2UqchMinPnwP3/v+//tb393qyzP5pegJBNgU/wSmTGp3ELw8NX0Bd3jA6DaWGoCNMfdhNKxsxH1VAFQCxZBpenIRzwyTJRlrpSqWdO6qLTCf0SmM6mVwPdM5DqC3aF1PTeZcc4F50lPVGkc9HrkbmsZsPhVTDhOlXZEHjDXnAwQUwSIHEymlFQ+BRTBAl1n0FLYxva72hBt15bS6GLw/77307/55FGQbJjryqhC6UyI88vZ7ta24qlNXCyXL+3uKmwvhBCTyViwqLhAsUtPJjn90iulEeWvZG6/2v3iGIf7K63dNZ2VJPhGtA9j9p39bLlyAN9dm3x353rhUhH6/PzieLmUmU4nTevWyL8/Ptx3YWN920jDnCPWv4voEhalUsQ0jYazl7a3uU+V6fO9F5ddN2bMtQ16GmKzS0Qwka4hQvyiFFxx2XY2ogSzp94UNShobihTOBCE1UMDA47cJMa8iNFLLaJPaYmJKPpFXUqVGS4zbErazKZKMbWygQUfHOfoi0roJ5r6aC4iVynxo6gMpDZaqBSKogCBCpjBe6GoUkz5SSIZgkwEFPqaIIM6pW7kL3Nik0tUnQsEtCVQbwrvEa18RRBe4nDadxY99rSQOHFMdQU6LXAqGXHZgmmYFt/I7pe0z/Dgp1JdKzLbrJyLpsij4IGUcTrbNY1W5tK7GiIoLaRa2K4NgSu9ci5IXMUqlb4Lsk4iWaCQ2hRO45vAWu9v5dXLk2nXuTm4/fkcsLgJV6bsIYTJeGokn7gQWtuRlFz6eL0CTN/skpI70bHgZwrPMqVIiATPIgMBpMH2VJkrzv7V+E5QAsbkznpcM5DGdq+ehUoqV8lbImxNCfAhlTRS9G5F7ErGuwdNkF4X5xYXBh1nbduum/zMx8FgfCJOMccDeiUCF6yO/sVqeT0fDALc39795OLMpguOklggQLJl6M6bRaWyIWM3MhMZzNLt5a33LWu/tbV9b/eaberB+vp7z59/uVwOitJU+dx6w/gCSZ9W9M6MqWrX+mg5u3v//sZysXDBcLleaSuiY95yCQEMshS01E6ZwJhtWyGilloCd9YqIXIS7EAniMJoh15MHJU/g3DRB5MCIfoNS+5jqr4UY0pnWBhyj0x4FFZjQyWZcxD5OCsUWinPWhdTrQgIeODSGJLhVagrySIzWnYuQEzR0Kfb7FGglail+AezPFozKXyCfXrG45++WEAUISguTPqKYPADj5Vey4vNrNgZjfIYNcSyKARPvVFrrYNoJZsjN3reLBfetrxH+QcpnEdraqKBp/oraMYf7z2fLebjYXX/+vXPPv08ctFhXZ9JvfIe9RGDtXXqeopytHX7y+M9uJy9MRlKpFZKpc5tZw/3X7t2owrxlwajjQcP/vrJk8d10wZ/p6jKKIK3ok8bMMnMulTHOP0jr5/ehwgJxKQpg74+jIw6UvFOEnlCeh+LnEupRmXZtm3dtYNMbw4HZ/PlcFf640YAAIAASURBVDRYLOdtC8OyWDUNj5BrFbKUOA6t+6sf/fi/+M1fGxTlorOYPqDtOmR8mUBy0wilJoE5pF8EwSTaEOLQX6lSyWZVOxcINEAyn0pJDRr9D4IWfDQqd29sD0bDyWRSVqVQUhnDcY+GFnvRRRtQ6UVxJThDV38ACF1dX55fzC8vl/MlTRIdMMTMOycoe7D0MZHPKxVH9anAU9YfaK1TwWep7scwy4SzNnofHLoIWyuFzgbD73340f/1/gdesMKocVGI4MdleXZ+sTmZZlJEJY72D9YHg2GR4+wTppMpScsppb336J6HvRCWqMDBx1SQsp/96et6Ck0Q2ZDx9cwgG4YFIUDKR23zuG4MY3+4sf5ru9eqyH2unpydHK1WwpjgmTDZXPIfnByd+rC1sZNyf2s5eAQOQzrmAcaDUqH7EDi7MRhsbmyAS5Hs0aNHjLGCidly4RGYHHhchrYL6HAFZNCOjo1o5WQxiTHBQ/RCaozWXhlpvceulrlAkwTet16cLBDIDgzwHqeGkaP9SZZ6Su7Jw8ujVbaQDncAgqWeCzVdcEIAqV9RvHdWwKfKyOIJw3MKJAH3XFIozkQMrWKK+D9ITUI6f8QhM6LsiKNG4DtBG1zKnoiqwcQMMTDnO/Q04ab1N4RhEfYjWkNDUErEkLpvUkhEF3PhY8A6IPzMHxei4Kzw4e54nHNYpWoDvOt4jBnnsW3u3Hj51htf/zf/+/9ywsLMWs+VV6m1s6jx7jlzOK1E/8cY0znDI4o/M6CAUoxslQ6uf+X2nYkQM8ZeNKuLthF5HmkLBCKCY0wOxxPhw0aEtmubftdLCRV9F/p9a+zfYL+PlWT3S9Z1gGxixikTR+KJEkKFlGzjlXJlZCxVsJicgJy0ieInaNHUexF95UyYrntA1x18Jz2Qkl3RggmHK7GzFYS8xeW+8m4jL861DiZfLhfOO5FaAfJlQYhTiPenEx2iGlYf7e+1KcxJclDFzyYyqcZGD4UY6oxx0cToIu5cGVstFkOpX5qMv3nn7qSqnp4eNZENdLbOxNB5FJoTXEnvveIsV6rQEur63o3bY1PNLy+5wuUZ5845Aan+HZosZ6yUPENf6Qgxzwqe0issbGNRgU0qiWjH1PF0zppMIUA8GOBZ56ULQct0OVFChHBVqJVPvKNIIDQIUDG2VQ1ljFrJQhuh9NJ2EKNRWiqJem6peFMIugGM6d4H7EiASR5D1OjfL5XCSWEqzyWukCIgtja4QmVaoPoHxFQ9cKEgFJJPhJxGtsvkTZO/Ohy/Op7cH0/vrq9vDaqBlOvDEePM+TBr2jr4TvHDenFq2zmEFYeFdziZYT591AyPXNBKaikhhJPjo5EymsG9mzc3NrdXy8U/PPxM5blQunOudY6nrkxHnHvaDvVGlTbV4Gi5qFu7PRhIiM5HabSN/nKxGFbVgPMJ4/c2N9q2ebRqls5mmS6Uwj0HloNIoDpzFr6CE0J/gL9qpjjArbWRJsoeVsWR/HUEVHmp0QKSCem8gxCLLF+0TQQ2KMu6rrmURVZ0nTWZITqUh3hSt5fzxYNbNyUy2yKxdQCvjOBGkX4rwjFxeq9Q+UsKhPMhxEaltCm10Vlm0pcpWWa51Ir0kNc2prfu3Nq5tr27uzWdjvPccCW0MSbPcRGOHtgKSTdZJhF4LxA8H1iqYPIiG01Gk7XpZH2qleo6i2smcshBWB+HTGepdFOcRCwzY/IyV5gLepOVVAylz9+1tm4a9CsMwUaIUJXVe18+/b/fe6+JYLSYlAPh/PpkPJvPhmU5GlRciovF3Fl3Y2dDIc9Na725MUUMCkfcGSzrGrfXqrc1E1Jl2cd7B0vrrsSA4KtELHCycV3KG0XJg+dKNFo/rFdPm3bK2J9u7/zqzm7ROVNkzy7OU++rVaqyTHbB+d8fH54E2NzYzWTm0w8NaFIhEHatM6UKY3LyUrPta9evf+v115SWzWr+8OOP1oejk/NTBmJ7c1cBb1nsIqAWt7So8oBeFMqxUIdgA/AU3zjJZqdrK1F6ChcgIXrJZHrxXEAIaICSMmLvvofUSYF7k9TpgcxV1gXfeItSj8gnxi0C+cwS8lpJwUJqtTi6FLDIUJLW46AMK/4QFUdowtWFcMEiGYK0HZCygdNiwbnzDrU+0TwG1xmkQyCFDN6RQC1HNKTDqo6+SQz+roP/6ff/5EYx+MHeC5fiakzdP1KZSQAL95lIUAgQQwqeqO4SU/nX2QfD8Y1ycLqce9TsTGcuwNev39opxm/dflC77m8ffrT0biillOrCeydFB7ENwIQC3MYEGpSkBiqiZReQhWsqshmfuzYD9vuvvrklZM3hH04OXywbjiBHTFnRO6e12d7aqUK4Y7vZ/LJGapkFcJx5zh1SqlAIGnWVASH6tAKHyGPIONPQ21NBSo88XvnOkYIf9KZ9JHGdXqDMTdHDDK9gz9DLbPVEJkm4ceKHoStuqooJFIkLRNFnX4TXQ+86pciuHHnVyvuBNk2WWa1c9IvFQpHSBrXaUrRN+9JkPBCqGAxfnJ8dLBeZMekEYHPJyFqXQaV1cKGFeBn8MnqhVRS8E/K0Wc0Wq8VsVk1GB3W9t1w46+8Mh7/z5ls7pnIXF+C9gyiU0gwU4xrYKKtef+Vr8/1977zgvMpMdqU6kuGqthJqrRpybFm4FK1tQ0z3ysaAQDUBV1o9eM1wVAI+c+G/+8M/ujmdvv/0KVNSoy44CgcKNDP3qRhQWqRAwzT+ryOtRsacrJZLa1vrGecazXZwagMa3d6VSPEe4Y4BQtSpKKYszvsBRMRLgqxlHCqmEq2ljk0pw5hBjYMBT0l33fpbXNwtq5cHo1e3tl69cX2jqjYno521aWpeq7y1btHU89VyZrtVjOe2vQhuEd3Cu3no8HrgOAvt0RW2EBrDv8GC6nD/+fZ0+uD2bTtfvvLqaxzYex9/OE9xQgc0I8MbyVPRmlJgcM5GBlIZVQ7Ou3bZtOvDgWEAPjUQDsJ8uRgW5brJS+fvb60XQjyazY+6TkhZmQzFxdMhzE229L5O70lQN/Wz9qmP5XB7Y2qQtY5xgSyH020os0yjiYzJUvvoOpcqyNxczOdFWSgp66blgpd53rYrbRBHGJmDeDBfBts+uHkjpN9CEHWbEzmMcIrEWEPvfXTgF4S6QDg32agLje4bUmtjNOMyAGR5vrO7s7m9kec5w3UvkIIr8kJR2CH0ehJUMxOFu6eSBUyuZCsZmOA6z1IyHo2UVKHDNhddNAQp1eLdl0oWRZ5nORM4QEcwILkXKqGca5u2iw5ciuaBR15Wgw9f7P31Oz+Z+5BpNR6U3HUba2tN02qlN8ZDMlI/Pj27vr1RmnRAQog7mxuDPINeny521nWNZb1MOhplCsGU/Gj/sEYZuH/6R2AEU4zdq6opZ6DkTMhP5rNja68J8Wc3bn5rfbOMIDL95dnJyWolVAqGzGTHgn3/+GAm1PbmDcmFq1eCgcIGBFFgDFEXmoWQC6U4U237nQf37926KbV+/PCzoqru3v/aOz/9CWOwsballCK0s8VPjOgw1DaN0UFgQkZgnvUS/NgyovEcoovxqJLaESgpegp3+or0IpANCGtFidu3ICFdKIDocQQdcRaBKTekq4+sCMYkSZ7j8yTcnIjIEEJhY6RvI0kdPYgBm0OP8+0UKmQq/2RvI8Z6xCr2xCmFIziZTgdHXGGqHsgPHrtqFIPD+RPuoOONLL9Wjt59+uSxrUEq5y0g4RdjVO9XiEUuSjD23qqpS9SMXSuKzTybLRaLgJpe6FeoYtw15i//8C/2jo/+t7/79ycx3lxf/1d/+V8eXJw/PDmJUnnygGW4qaSngMIjAcBFGq0I8orpYpw37Z2q/IPX3ohNu4Dw/RfPW5zOY3BI5YJ1bjIZbwyHUx/X6tV5PW+lDMAc5xYVfjxLFQrxkSKZIvDeFDwV1ozlqRfuLah6oFO67DQV5lRzf5WRSRRaZllJBoW9wAHqccGVMz79HUbyh3RuGPfpdyY6BClaRtEr/DNqW/Fioxm+QK5LZFLwoihmjEGWzS4vGPl59ga3qVcbSHlrMs2BOcE/PDoUShn0oSXqMvkjhQheiAvn58SKldyF2HhvJV9weHx+/vnZ+YvlaiVF0Gq1mG0PRr/7zV/6xo07ZYjtfMZS/hNSykIa09kHL71Ujqfu4qLIDQRfoH4a+ub4cZGVSqNdZ8zyfNXWAWJhcoWzdk6+9CiVyUBIqTo0cjJSxa67u7bGGHzw4oVMVXV6r6TpgbJNGoObR/odhxiU1r6zk6xgXLQx6jyVHWSmJBhTqUuRhKdDVy/WWYtGwTxDTnEf2cnODJ0bWEznQKMPZ67UMCtKLQsuiwCTGHcCvFIMfunmnV95+f4bu9defe31nc11CWHnF76hhoPLk2Ndlmo0WHlbrE1eHO5FqbsYbSqS04chXViJLAcZYZBnAyR3ldqUUuWMG8bbZnV8vL8+GP3qL3zr4cNPv/76a1VZfPHkydPLeYe5jsTzXAy0iHLeRcQGAzBlMAdbe76YTYaDXAjunEE38sVinmfZMMuMdS9NJuOy2JvP97rOQyyyTAvBfZRITju3XSAkHJDnF/zTUead9UmGKhm0Y+mjC0CWaZ1yhKCgY22KeMSXuVzMhoMBA1i1jZIps3Xeoex9+g4eYP98Vhh9a2fbNR02IakvQHokQzwB2ptGXPOg0C5XwgePbbCiXbWSzGiDsg0pKw/Ho+2d7bwwpK2oUEJaSCKVGlISQYENiRplOLLE1Y9A+TpaCdNcTXJubWroSTopz3NtFLG0pFJGK1K2QfpSet6pkL9aLJGAl5LK29C2TXQhuOC6LnqfF4PHp2d//c5PThubGTUdlDLE6XDAWYw+bE/Xgut0lh2enA5Hg/XhQHMNMY6qajoZQewNlUAI1On0KEpAImJ4hIX4eO+g/bkp9M9099aFuF0UWqkj6z9dzBchvKzVX7x092tFmQupivzp6cnJaqmUSc1Znh9B+PvDg4UutzZ3FVfdaiFY1IJAVyy9ZbIqUdpILgJU2kwgfvdrD7Y2Nhmwjz94/+XX3pzu7r79d99rvRsPp+PhuPHOA9gQbaRSJgVlFzwXAmMj98GjgLMkyhlaBKb7653Dl47qSfgXOaXRVE6lf9fAMi6oezNcTsoC0UM0COZkMEjRun+GVwZ/CPJCUBOKxjvvURdckHUOju0C4goCClWi+VIIIqJPvmCoeguZ0lT60/IU64GYbgUGdxKtw7ORul6HMcc7x7GEkUIsnf3h8ycPuzZkygUXyJkft5yIEWMS+fWAwQRiJL9myfhYqokxdVMvIDqGpTljWggluL2cnx+dvLf/5HHs6sgynZ3MZ+8++mIpUhMe8Jt68LgLQOcefDI2IqidgUfWTGBsaX3ju+/efOnNja3Gu8eLyw9Oz8Co3heNC0Ctgu2dnREXOzGG2cXCuY6nF+oY6zg4VKnBf+ArAhLVv+TKYhjkGEwi7yVhEGsiYj8dRjJRLyXdC0ADYzIzOUGyBGU6fKGc1IN4vGL39n0taqakz2FZbzdxpcFH7nbUN6N2NKkbYghA0yXYyPSMK1+W9XLZWouyMKTxjBZ3wb+8vjn0Ph+N3t8/qJ0t0o1IGYUg12gDyVbgawDPmU8Fdip80AmVOQZLzs9CmIdggVkG5yHsn58tzk6ub9/4+r1Xvn79xoSL+WzunE/xrO0Gxtz9F78cjg9ynFkUfe6LaP4ltVFd13kf2piCMcZyblTqVTKlmI9SyYh6Jx6CDRaRfiJI9fHzp58dHrIio5lnBI+DHqSO4OvR5LuL3nbAmY+psroxGBohGtfxFGmVD14ygiKi8BCy/GPAtkylKCVxxorKXYIHTIoY5XOVUnvGhGaskCoHNohsg4tbQv/q7rU/eOvr33z19Wvbu50UR7PzmfNnZ+cvjg8aY54fHh8dHZ439cHl5d7l+ayumc4CY8PhSDJ2c2traziaFJVv7bgsDfBxnmecy8A0YwNjci5zzkdZcXp2cnBxMi3KP/qdf/kP//iT67s769vbx/v77z17xvOi8x6ETF/OZUpOSrXekbyZcy41ySYzxWDJxfHlRZXpSZFz5036VcXZ7FJKPhkMhXM38uL22vqsax/V9aXtcqlKY1IHg93JzPsAP4eiZVcrklvTaS4FKccBka8If97TaY0gP4PUJ6QAorWqu9b6MBkOQoxd58q8DPjtdSqneIDQRfjy6GScZze2tlzXUKuB/vGMtOi5RBdllPJOJTkZjJGQIO4XuORaaOyJ2Wg0GI6HiIvBgJVukSIMg6KlvviKzYk3o3eGZKh5+RWpiRgkvVccpOvlg/cka1SUhTZZn3SlYpKZFIk4DdADudLFECNoIYIPdV07623nnfMMosny/cXi/3z7x/vzOtNybTgQgW0MxxBC17r16RS8y01+uao7113fXDdCRVRh297Zyo2C1MhxYkev6saHKKkbYuRSLAPnn+wddCGy/+yPZuzlshia7Endfl4vPcA38uIv7ty9Y3KJVv6PT49OF0updSp48mw/+O8dHdpyuLW+EyNY7H1FT67smz4tU+lVZhlPlw5UjDta/+Yrr47W1+dnp3uHB69981uDcvDBB/94ML8sdL65tuk5IBo2pt4LxRodQyCZVFFwh8Ta9Piu5DHTvxK6HTeJovdvT7lX0b/gijciGt+jdz9EqIzWUi8dahNxiXSagKxiRp0LLp9TQmUhFWRAQCssZjz6FeJQGlvaSAJtPGVVlO4gNhDp9IUYog+YdiWBn4l0RkJP5I3fs11JbxvRQ7hFQGk2FFILEYJSnRCg0t/w0UVcP5LKE35tLx6BgEFsBRHvVXA1VMpZZ9MvwAJDNl1gKUrHuF2Nj9v6Sbc4B++k2m9W77940QgJWjjEcEUMoZEmz0x4BNp0IfhI0r3pMTsGC+dzYH/+xlvTyBaC/+jgxaHthFKkTZiae+uzLNvc3h10/pprLxfzDrk8NnXAwiHUNCLqNkCPao59jY+6MRAzDoqSMq5NY+8fSAh/fARfeTlE4gAzlPrXBYra9dNsHPXQ670SE8bxFvKDWe87LqTjqBdJ9m4U2yKJbjE63wKd8CVINHIAEeO6kF1errTyDOazGRIbeN95S1l33a3BaKpUWQ2Ol4tnl+dZnhn8qRqNd3CNIJBlwrVWLobW+1ScEYZdKDI0j5IBiNQWczaL8eOT48f7L1i3unvt1v3d23fX17XtmqYWjFVCXr9zO1OyObuQHFTqBqRysUi3lzAroJT2LpiscFh7oqt+6nQFzhNCBOs8IoyFUSZACOkcKK41KtRwrfCkp2fuOf51FlmGhoWo7oYrYc5ddIbzrbzs2rbt+wOQaDIWIfgYtDKay0KIPHW/yggDEUS6sRCC09hNk1MuGvqCjlAJNeRi4PwNkN9e3/79N9+6d/Om1ObDR5/94OOPPnjx7Ivz0y8PD07q5gLi+w8/f3x8dBLD0+Xyi4uLvdVy5pzIyuPl7LJeZnkGQhwcHgshyrywPjjnh3lRGKVTQ6ZI8VhyOS7KRy+eHCwub23t/O7v/MGH7/9UM7h170Ho2nc+/8KrLD3gELvgPLieWpfONGIoIAa0oBM6y8uBU9nebBbA7wwGPKTjxrWe1Ssf47gqdYCxFA821nLGv1wsDq0FzgqdmuVM67OubX8+9X6VgO+sr+GoA7FbJA+HGSzPMqON7NtKJqS0nUVyhZdan8/mVVFkygQfOtcWg6rtWmrKOO6rmgDPjs+2p+PtydRZi9BnQHg5ylmi6q+WmhHb7MoYFBBvRZ61DKVByeFS9JhBQJyzBOZ7pXiB8FnEaoVUIXhI+TUFIvJdROoloLdHSqQ8gEerxpD+eFr/IRqAShOga6XQRzlFLixqSTUgQOpcQohdZ8HHpuk6ayNEbcyl8//2h+98eb7ITMq+fe/LeVs3a5Mx6uabGOHk7Oz6znaltWQyQtjaWMcixksk2FAYq1cNwsjQfwzJKuTj+8n+4VUC5v+0A97Requovlwtn7TNkLHf29z6s9t3N1O1LKyAR8eHF3UjjUnXMM/3Qve9w6MwXt/a2rVd29VLDpBJTRxLTI6QGuUA6ZlDGGZFqkds++butV959Wu6yJ9+8cVgON66dYsrdXly9P7jL1iE9fVND9GhNjb1KUyIgNbSTAjrbApoSEhTQjjvCXIfPdZhKSwgShDbHLK3IYcDCIAq8bg5RVsrYLx1voPoUTw2xpBOhCBqBKANMLqU+EBS9WhyJNDVW6QPJxHHGkPKcpLUk3qeePBRcsAXj8vPEI3CnZ9AN03vWfrwEpVzpCCNPM6l0r2APR5BUr7sWQeATS1h+SGSATKSpLAHY0JqYnVI1icYQSPSgouhFDyCDdHx2HqPGl1YnQOMubo2Gh+59oVtndCOCc8Cl5qpK7Yt+e5yiX9REhuIXYmLQa8hJZvIVm396vrab91/FZr6OLq39/c7SaRlmtQz69rpdG08mkycmy5nF21jRSp6OhTfQB0cEYB5tH/rPRiI/5Z6sCiBF5IjLI0UfWltxCO7ImNgC9YbN/Tm/KgkoU3RKxYAdbU/O/M0qSZqNU1sSK4DYwpSyFDhkV1JZfW1PZpYoV4gw16NHBpAATeDasVizPP55YKobL0ItpDWhwFnt9Y2dGQm0x8e7kcuabOI6wp6qRIZq4LMJ0RvF09lFcrRMUR2cu5RMskzFrS+9PaTwxfPDw91iHd3d9+4d38dhL+ca+enRozuP4DVfDKomBADk43yfFKWhVLWWgeQYrJQnvT3Se8NFfiyIuNcEKwRz1Iqh/tniAYmqNmVUrOPXsWoGpths459sIykNoVyWsGlmBdDHAqxPRquVrVQWkimVZYaDhSgSUfU+kqpUkjnfMoegnvi6aN4RiYVuhL1fk0VFxvA7qnsl7dv/O7rb720s7t/ef6Dzz79Tw8ffnZ2cuy6WupFjLXk596etnYpYBH9irOWywZiK/gqhqPFYhWjV2LlulndpHZamaN6ebxaBSW6EDvOF9YurLVIUgbOGtt8/OXnS9f91je++eCtbx49f3J2cPD6g1eLLHv3s0+P61pkZe064CCNRg0BWTvrsEwNEZQU3nU+BJ1lWVGxvDxZtbO2GxUmR9dipc3lcjVv6tGgzAWTnX9pbe3acHBS11827dx5qVSllBLywtn/vIHijN1Zm5Za4kiP4T2ibiglQmM0F0wrVJ7CKtZ6R/MkD7Cqu7XRMEJsvfM+VGVVN41SimAvMYRViM8Pj7bW1zZGQ9u5/voj/IYBeOdwN5yihuxrL4mnC7sJIRWXeW5MZpTOJclP4PoqIvEPgTpYMQBBuxEpichM6zyLMVoHIXhn0wNMJVLqbVzqW0Pwlu6LRCVeCjsS7U1QOtEzyVGMBE0ffW8QJZjo2i666F1YrmrXdDQdWwX4f95579PDM6PEtKoMg0Gec8aa1Wprc4OHmEmltT68OB9W5dpwiEp8oSqLza11wUH25rKpOlk1XdM1Eje1EQe2WOZzz+CT/UMb//kLHEm5URTPl8sj524J8afXd7+ze6P0gXOoBX90fLTsnNI6tZ958cjZ/3R0LKbbmxu7TV03q2U6P1JJLnzwuGxIv2j66SGaVBwJI4XiInful2/eev3GTQbx808+uffggSoKYQwHeO+9d5quHY3Xsrx0kNKkRyHvgPnYodUBIoewJ0NOC4lTKTTLo70sTmVBK0W21gggEUpq5oPChTLaJaUT4bwL6ErvUb0ZdX1SnYIhN6V9rN1EjEGq9P0RiynJ6CUgAw1SU5r+E8IABaoCeaLq8j5/ChIT5RjNlVSArXA6Hb2cV0qhPgaCCGFjGaVUZEynpExHDUGpuAf1oh+DMtLpU1qRdZBA0gEq/wik5oDwfizEVGmFxrgRh5q4EoLovBJ8EOD2cHTRrp40zSzF/fQEaIeF2F8ecQkdhWiDTUFU4Mic9LsAkJUhpNAO2NJ7cO737z64PVyzMXw2O3//4jKFoKs5GWoVxms7uxXnmyGI+eU8eMe448yhn7/n3KMABgrFcxAIL8fEiO0tGM4yNGFE0hHeXGoBSIUDiwPGrrzusWWkmyazrOC0hCHOYq9235tJkeI75/8kivVID26xHUZwD/o3AL+yHsLb3sOycMqM3ydGWMt0y2RbDtq2aepaaU3lAMkquLZ5aWuzcn46Hn16enbe1plUWFghgh0X2mQxhNkXkS74mkOvAihJfRB/bvqOMQSOph6tlEfN6tnZ8dPDPeXimlS3N7cGQkXbldd3zGTAIZo8H0wnk2tbo42NnRvXqzJ3i9p1FiTvnGf9ti1FQ8/AR+rIWWcdOR3FCFlKqOksBqTrCRLo4RAX8//6N3/r1Zs3Pn38iGeGk5YTPjRA0QYUqFQ2uK282sqrVb1y5NaOUZPF1NTivCnatmUomIFGZiTqwDXN0iAaISouytq+nOe/snv9d1576/71m0+O9n/w8LMfv3j6zDZzKXye1YjpYMbUEFfgQWvHZZtq9HSqZGYcYw6gQ0OJwPkyBXJnlLJt+6JeNlo1LK4gnLf1yjsnmGXQOqekPFvMPnn22Ej+//vu723sXvfz+bvvvPPW628OR+Nnh/sf7u3FLE81uejnUSmtaBMB6AFGkc528K7tWpMVOq9MNVpGdnBxkRf5wEjuglS6Dm6xWhVFMcwy0dmtvLizsRG9fbZa7dnOxrA+KAWHSyxf/tmfO2vjkc6uNqSih0TgHFirVGApiUpWDKRWPrjOpQYzK4rL5VIJPqoGrbOt7chbt2nazGQsBq1SuEw5+Oh4Z3NjbVi2XYdQCkFwa/RCDMaYr8ZE+HNoYEjSQgr7I0VuYVh1ScT6kNwByF6XkQgKJLVPDCvM6CmCBFLSQm//kJpZEt5K+T+iuzPp/KJWMLp94EfjvQIPumbhljCFFNulsso7P18urXVE//RK/81PP/zHZ/tS8ElZVFqXeaaw993ZXpcxZtpwwWer2np3fWcrOqtTaI7b21tllqVsomX/NCI0dWudpwksXInjSq1a7z7dO3A/P8IopJgWxWFdL2N8My/+/PZLX6vGonPSyEUIXxwe1AGEVADMl8WnXfuD4+Ni+9ba+vZqsVotFrgLw1CVshETvZQQbSK54qhumx5onAb3a3fu3r524/Bw/3Bv7+V7DyAzKf2vr3/y0Yf7swuT5xtrW41tkZHCsfxJLwwxt1IbExlHeHDE6CWN1ARqJagOLewicb9pdY/e7BjcYo5f7zHmKqW51AE8otaRXITjlhCD1oowhrQuwVBAvxSipWLwMSV/SQ5/gWJsROtYoiqi1HOMvSoNuTrgvdRKh0DgFhxrk5YAZoOIOFY6XSz9V0VyD1RSkOJP6gdiqi898kfQBUaS0TOZBinErFQ+3pTqdl7wGNsYPGepdcDgnW4iMBPi7eF4ZzT5dH5x4G3HlSe4K47JETECVB3jhp2hbC6KtaKcJFkGBFwLNCE0zq8p/f9/403d2YUSP3z+5MRHLkXojQ8Auf7l9vbOpG03nZ3NL7HxRYONlIOZZ+lfPc458B+yyOvlJ3mEnEeNEnckK0kMpX7GxnoLGOBXqh2k74xHUBqT954jxF2itcFXHTH0+wbWY8V4z/JgvEtPjckrBCa/UtJh/VNCsCn+N4UBLkCcMsaz4kIprvhsPpe9CSNx1ljr/dag3DUmy/JZjI8OD4VRWvQZCq7Qg5KUzmKUtMa4UiRBbGkqrwxiQJHdDzT4zZRynM0EPL08f3F2djy/lEoOs2xtOhVVnt/YdeBNVZn1DTaZqGubem20vrExlhJau1quQggGLRlCSA2HNBkq+AYmGar0pU4iU0Zw0FIj9ZMrZIegiC4vA7y2sx2cf3S0zzMDaFbIqZLgTBmNRpW+9t533UvTtUrKWb0QSgVcz0iEYmXGKK3blHiJDM8UYaFZNFzJGI2PU4CbQn9rffu3H7x6f3v706dP3v7i83cP9/Zc1+WmwQcVYnQoeulRO81D7GKwPAqlfSp0Y+TMxdBaK3CnaFEprrHNxsba9vbml6endQi+cw7hK6gVx8jWzmj1eP/58/n5y1s7f/Y7fyABFMTvv/tOtb5+8+bdenb5o8eP2tTucKQXepOj05+UjbVECaSBDorNhrbpjDFVOdDlyJfV/sWFd2FSFRKCEMIzcb5YcCmG5ZB5lzt/azJZq8qzevW0s4u2HVRlCLH7+S6KM3Z7Oq5U5snLlpQWqeGTnJKHJsko1ZfZSOUKRKOfrerpcKSl6LxvbSo4BEvtFLDUVmZaO+eWPuydnNzc2RyVRXAOAoEfucSIifg7SVsXIkEJMndDlTrSwpWIupKyn0ZJ3NGStjUpFfbToBSGSB8fAppjyisFEolsH2QkogAcqdr14gmchojeOyzAPblnoiIwd8Eih194mxod78JsuWitDRF8BD0YfP/jz37w8LFSYpxno8wowfPMNIvVjZ1tFGqWqAbEzi/n2+tTxZnWEiJMRuPpZCSu1oARbSdCiMtlLTR2BshlQYxuagZXnf304Dj8/O5gkGeXTSsAfmM6+ZfXrt/QGYSoTXbRNU/OTiy1RIy5QfH+fPHu+cVw9850urlczuvlnJTuJZbsgOKGqQlDVQOjFAc2qiqFiSK07SvD8W/ff2VUDX740/dLqXe2tvRw4KPPynJxcf7BF5+FCBtrG0xKoLSBeiCeADVCBqKoRS+4pExJswpsQAMpavc9CvDgvCDNKeASYGCyEquuKJSDyFOXjFanlCjpCYJIxSr5pSKKW0uFgC/RS5/H0Ldb6aOQwgMp8AQppJIyeE+T8HR8U5gixVxGvTLCANM7wpG1xLotSjJ9wGUzzXWRwtY7UCGPCNt2hKRiHxiBNLAQxJcq23R4ad/mpxC/MZp8czweSXUR/bm3FjET5BqlgI2zfKSkilBHeNisGiEQ9BPRIaJvDQP+CJZuDUOBu3SnkNwEV1rJ6X6l2AXRtc0v3rj+7Zs3fdM8c+7dg32PQp6UudB/0G9ubpRVtdW1w9XivGsDBhkbwTLmkTDusf2NxFXH6XG/38fCoiTOLbsS3LhKw5FfwZ454eG+kpjpd+pSq6xXjecI8MBBFI63cDjWY6x6ry9CQpMQII7CSe1ewJXw2NUXsz69k/7LlRCK8SGvhpccWFEsFgvvHFeC3OEYEy6mwufudE2ByIrswxfPG+AaASgkLUIRCkn7GG4YcbxQIxyN4VgMCrc7GpcDxNPBt4YeWgBBqpVgFzEcXV5CDLlGxwMly5vXOsnEoBLrIzYZsjJnWV6W1fZ4VIJwq5rzSIN3j4/SI6QiQjDSAN0rIHkH7r2TXMqeiAqZUEbrj7588ujoSJYFGU5T9aBD4N6izlokQG6UvF2u7q2tTYpiVTfoTiJZpJmhbro2AAitcS7o0xH1XoZYcDYCdk3pN6dr37l15/76+sXl5btPn7x3fLDnrNWqix4fBcmkg1QqcKrpIlfSc95FpAoy4lSQu7aKDIV7EHKpjL6o69N6eWHdxmD4x7/xGyenZ4tmpYzxPkgtM9wPffLk0dK1v/fNf/ELb3zDL1eZzn7w8LMvDg+/++bXdYDvffbZLEJmMhJf6JxvfVi2rcNpV0CXcrILIYJis1oAg6wY5OWAV+ODuj5bzifVQHOSK5Nnq1XrurLMpVDM+e0se3l9XQj+dLE8aTtqF/5ZB3x9MhzkWQyBWOx9msVphtEGsx5SrlNKRkxeaiShaZ02eoGWhWvjkXOucaGztiwLpPmnX0BryZl03s+c3zs8vrOzWWZZZ7uA7qoEV3euiwj44kIovBkEu0itG87rlJJKGkH2emhyhVaHXDJkBCB1itwlODLBeuMw1OnpV1LYWaXgHlBplct02JRigPA+DBjeWcI/Ink9/ZKRRecdR1+5rkWyr4sX86VNf1LoM8PBjx4++psPPgHBRkZNy0IJUZh8OZvf2t1VqRBUNLleNo3Wssq1BNA6E4JvrK0VWcavULuYPsDZ0HYtATRxuBPIrk1IufTus8OTny+deOP8NaX+ZHfnO5PpBK3guRLHq8XTi0uP3zYK2ebZj85PP1o0a9fvDsbTy/Pzup73gwMUZCFpC4mBQvLeP8YIkWuNHyIUwH9hffM7917uOPzV2z+8Np7sTNeyqqQAOSzKH73zo/O2HgwHRVm13kfGLJo8M45zVAYeWIePTKSUGr33jJHRPbawJPyKIPlIJF4ArQT3sZBqIFM0XEXb4WsJDHy0ZCeCFUskiyQEETISUrjCKoNUZDUYBNmPCMECWvChdySLUXrP6kYDl7gH8UgoEsACGr32Fvo9OQ7NRkGQwiWhrpHkxnFoj74wKDlANeUVeg7dF2gzLvpTJ/pNZ6pg0w9wfiz418riF4eja1X5bDF/VK+WjFtacqLDkAEYSG0Yr0N80qxOorcMtFQe9TQQuI7hoj/m5A8YELGPkwSAgBKrSLNTFvjK+cy1f/r6mxvaWIj/eHr8cJnam14MGchQmd3Y2c0C7DoP84s5xMCFheBQfM2h+0LAJwoIvY5X9kdEP9MQS478hx4nRbbtjIzYYm+WRILP1ACLr8QspdZZLwHba2CRuirxg/p0q/pFcOgHzJSpOVhBGGms4q5suqlhxvcJ4uonC5b6YBZYleVB8sYULoTVYp7eEVlf4QDONs3NjfURsGlZPFksDhZLQ2tgIpARXxDISJJKDbj66AJNp4TCeSxxZgTK9IUQfXScKizUfWt9sDE4BqvlapznZabLe/fYdAMUyKpkpvCA8o8mUyYb63wqJXRd61Jf4HC5IrB5lQiigxCM0r33E95wmi4RNImjhKE0WqCesJJaQLrzJsK9IvvaeO3yctahLFHAQVQEECG8Mt00jJ/N5lJr8gx2wUdIzSvx7jVwI2TB2BpX14V5azL95u7O9cFosVp9ePD80fzioO0a3G32PZYQEd1XsCPjnrHWWieYBWhSj5M6UZRNBqEMhMAFCY5Gsv20IXQx1s4zZViAuq1P5rOQyk9J3udKyPPZxcP9ZwWD/+oP/mR9MI7WSeA/evLle18++vaN6zdvvPQPz58+OjtlSgWUJghMcCNd8FppEMJBek3Eb2Y9h5LVzaLt6qIYFuUor0aNMC8u50LEgcmi9yDErGvP61WRZcM8950tuXppPN4t8su2PUU94X+egMejSZGh9hseV4H++QRxkCQug8J52KUo3Ky7EJum4/h85qvVqBpWmWm6rnM+gq/KCuEasnOuMCbG6GK8dP747OLWznamtO06Ek9GtECqkjWeFkJWEAAHx6OK0/KNWCDEAExfFXiP2Lryde2RqHjaepEvVD6KhIGOqcdC3a0+xZDud2+4kf5/ku2lVpj86XBemAKpszbG4Fy4uJh1FjWoI2TDwftPn/67dz7wjA2NWh9URoiqKOeX82vb24Z6edx1BQwqQrBMyUyn/zIeDtZGo8gCqmGLFPMD88E7NP9HuqyIvT9Ealq0UjPrPj88gR6Kkv6vYuzbg+rPdq69NpqWQkGMVvD9xWx/MfOpLE4d2aVR3zs5+rJ1WzfvDYbTi7OztltiV51CnUo9qOxdDXEHRJZuaCMvwAeDfO0xh1+9c+e17d2f7j379198fmtz49Z4rLUWxoQQBsPR8+dPH58cMcbW1zedD6lxZeSkTRY3zHviFwn0CGZKpJyKAHXm8VHTO0HBcIavW0rGcqFKyXl0IPUKUcLek7UD8yHa6EIgTWaiQfbWR+l84mI4Uo0RyG6Fp/tFwheQYp8QXHt/N+o/2r01EPKsXgYhtNRaGZQpFwTk5r3bFcHhYy++1HNN8eSglpAkQ0+PcK0Y4Gq2QuKKtPnE/CKAVjDkHxeDDLCmzY282ORypPRpjD+9vFwK6dBQBJB7YhisqUylA8ouIZ744OhSooYW63FJBDjndGhwJs9Yb+kvSCATTzQLjDXB1529Mxz88YNXY+vOWPjhsyczKYBfTc0Zc50dj8ab6xvTtl3zdr6cdVI4CC6i+AaAAx5wIo20l96AgffWISAAcg6a9fIb1FUTKhKQpt8jo9gVHOtqnIzS51wanfVqVtDrYVHsk30aDn13B1cIaByFEBrEIcmJfJXFFbWJKEyC0baDpNLRnQpZTRXEUmenynAlZ7MLpCqKfrXMoXVumOV3BgPDhFX6s/19kCJLQQnnb4Ec4gTtm1Ml2z8KkEjCMUJisUmTWxx29bN6EiHHoQk++szkgoHrOsWlqxewWI0mU72+FoLjqCkjWGTBR9zej6tyIFV3uWidUyYLPhilpJQIQvZkLx1JqQzJnVi/Ms5FjlqUBPtEq5nIBRglNDC/WL65u/2v/of/MUR+9PkX3ojOeQ4pctVdAz5cHwxLIVrrHRqF9Nx5kqCNMJbZOMabOn9rbf31rZ1plp/O549OT/aWyxPbtlxGLTrvGUnYKMU5tyk2kM1cRMPmmGo6fH9ZXqAZIk4/sGwSWpGsDBmDAzCtibSaCoGD05NU4SMAjIotJcXe8cHe/PL1nRt//qvflS617e2qfufxo0+OD4Y6+/r91/Yvz3/yxUOrdWCIdUIjBAZsPBhFzpddi2+HJDivqBmSB2tXi3l6mEWliwFk1dGqrmMoMyNxjdmGeJa+gE8GlfCRWbue5/fXpgbYcdO4nwPSsuuj4bQoUXCRDjryEBHQl+4S9kdCctydKWJvME4+vN5ketV2grFRWWZKtc62zjMQRivnghIpaJZl5VJijuedPbvEHCy5s564j0jvFmSqgHggDFCCVuIipqetTJbRzowUEjD8sNTiRyrqrhz4WZ+hsf3FnAsI0EEiSSCRLMxtGtsRTH4odkmRHc00aW7kgiMbrrZtcDjMLi5mbec6NDU2g8Hnx8f/x9vvOWCV4hvDYcZ4meeXl/Otjekw19GjqS3SUgLwzqdHPh4MBGda68lwaDKiT6fcL4VwwSOYHP0naUoBV8SaVP7LpfNfHB5/tQLe5PyPd7Z/a/vajjYmNbHQcvbs8vxkVYNS6foZvc/Zfzw8OOP6xu1XTVacnhx2tu11anDETdNCwriIlH6QdoVP02hjOLWocYex377/ytb69r9598cfnJ6NhHptezfXmSyKGIM2Jnr/0ccfLVpbFlVeFC46qXHsjIhCMtpCeL8nC0KUqwvoyhCdc1qjyW4K2qA0uqfEqDkfIZ2AC1nH2EYIuFEIAffVOOSmhavgSqE/pjYae2JPJkUke0nmsYL3+B9KpByi4mLLxv/+F7/zh6++cbRcPrw4A412rqjA5bx36e9yJYVSkoSPgYFO/4PwziLiExXnY9S9YBmqa8YgUICP9F59iFIrtG9KrbkWogdaxPQfSyHXtZlIqSN4zl/U9aeLyzPGGlxIIdkl6hA2hVxjUJn8AuBZvegYqtXjbJkh2Zo8RhzufWPvIEQqI4D85hg5KW+mG2Jj7GKIbfMb9195Y7rROffJcvb+yTHojHy2kKKVKpvd3eu5Mte7VtfLS5TyT70vUPZNWdYhAxiAB9FvO5FTlD4A51DQNIn18OZ+0Utj5z4Bcuj9UWk9/P8x9V5PmiXXnVj6az5bvrq62s70zMCDAAkQdAuKpDbIBalgrFWEGKEHhf4F/TV6k54UDMWGYpcmlm5BOM4MB2Mwvn11l6/PXpeZJ1OR59wa8AHojp7uqq/uzTz2Z64H05xLrXs/YFJmFtc+wqzXlOwXwrT8TdEC+6RURTKJokhU75BvMBHRCI1MADryBsb6G4vczLlhUS4544NiVa1tZ2Wq42jTw4GLaO0r21sa2Hg0/Ozk+MpZg3YxaOBFtlZEqCV1M0KPREGEJipqeiUvwRBHjjUFgwBKSQJpCRa1wM00KqAw61cvj9lyPUapjdA26QuyCHXD2kal+BVzLjaKQejarrMo/C1wC+xRQw6ffIhoPwK0dhcMWSj8WqYIPxCZ7GY+3B8MvnVw8/jFsVbyd3/nt44++fj5bG7yXOMFRrlUBnX76t5+FvmqbtDiP91AzUUGYYvJ10fTB+PRjTyfqqxq6+dXVy+q9ZyFdYSA8hEhMqUV8vxSJdgF4Dp9blzbKwiRZ8aCV1obY0jIPQredhYlmWTobfxQl1owoSQKVCN6VkmlDer49LoARiotxCdPHtbO/ptvfefbr3/Ft61U4uTo+L1nz5/57nQ2//0vf3mS5f/wwfu10VilIkwR1X98jNb5yAkgSsZeaJzCe0ufENx6vYghpEIoK9V4Yw3xbLVSWhkE0gMXs7q21k1Ho8JkzEMR2a3x6OZktG6aqx6NlY7xYeqAC4bGzGj6hjVtb6AtjFFUVKR6D9erGFVFCNC2FnFIvKrrYTkodSaVXDettS5Thuo/KTSAK3LTdT4wdtV0y9Xy1sG+iNGDZ5KnXEirEEjRPNU0iK7CaV+/XVG4FuXXG4N0ewJJDQHRfAWaBmIyjr2gMI0J0UEloNZHZAE3eYicIU2AgJKvgKoXKDvpcQwAKT6mr21TRgRvw1XqfcE657wvBuXRcv3nP3pz7UPJMfsqUZbFxcXV9sZ0czBggWxrCR8UQar5YrG3tSkZy4wusmw8GmpB+yJivIB1XeTCduj71A/zJAlxxBCzQXlWNY9OzykmfK3I//TO3V8ZT8mJEhirQng2u5p3lmEygLx4aNsfn525cuPevS8rpS/OzjpXYzv9heJQoMWdFr09JKd9s0x5SEaWaZWj/t3XJ5vff/XBaVP9X2+/PZMs4+KbN++MuNB5zlQKQdvTybvvv3/RrCyw3e0dUoIU6FhAyL7Q01ME/ZqyG+phIX6I9/SNHskaaC6YC54FoZSpwdfgHbJ4CbSMKHkKe+i7L0icMGqpSdEWJ8/pOAmpECYXRG+kgw0o40qo2La/dXjn128c/sV7b//4+PmV9MVgOC1Ga9si1z30ntmCdqsorEn9K96a9CPaDllVmk4gHVTC89M4IVwT0EU/Jo6oMZlyjghhyOWWyYdKBICOsRnAjIUVYz4VfymBpWjStK9nxR/cf7WU8qiuH7frRiuSSUDNzoBKk5GRjSb2/UieSHfE8+jQeZZqKk9EacFdZJWDTcb+5Bu/UgB0gv/w+dGJ8xgzeptLb53JzM2Dm8baQ+i6xWKJewRqfB3GFh+jp+qQkfD3L1cjMQbNYh7RmJf3piG47u3rHxwo01A6khZYJFlomvJFkMYU/yLt9lsxlqqYfugfienWO7zx616Y9sLCsd6AvMd79Zm6z+/9CAiDn+ZowAAxT+GbV0YB48vFAjXl6d9LLmXXNXvj8VZmxkouvPvs/FLizO4Lz3/C2ZPdhGTM9IJA8YvNWa/cjssef627QwgVHIyQExwbKD1WphDp9mup7GrZnpzJzuaBhdWarSpZOzefu2VlAo/el6PR3sEtZv3l+bln0WMLLlGRiIWgUHVGo5sXDcMFPWyBPAEcGWZKKyaM92/s7t7b3fnFycsPP//s03ffebFYePK8S721JpGFFoLrmtsbm0MpnHVacOn9rjL3BqNXR+Pbg+FAqVVdna+b866dg2t57FBvKZWCSqV4Suo5kTfeMtWL4zgWHARBKiJcohl//0zoEBMQg4En8jdGAemdQyKA0grzAYDAhXcIwWDsWSyWnx0/n0j9v/zeH24PhpAKZ/7o6fP3X744l+Lx5dVXpxtfPbz91uNHT6t1kRXpe6U6w0slouCd97jeFOjBGK+HhdeCTuhUXNWLruvKwVBpzU3psvJsvbbgjVEKj2Ll7LJaKSnLPE/VlffbUr66uVlofVlVLYaOYZ7d2NqQ2AyhXCOOhcm5D2OQVqq/DpImxiI9eOSTdNYarVd1rYwulCYprKbrIIQsy9DdEq908LnJnLVR8POqaZv2zs0bKUZ6IHNyWrQBeJ2pdLFwYslwIEkAK6Uk/b5XiosCFeYZiaMHarbwNz2GLPR6lKI3Z0kNNHKDRSQPOOKMYglF/917RxZ/JFGOvClmOz+fL9vGtdZ1rsuHgyvr/vwffzZrbcbZ9mhQSD4cDc7Or7Y3p9ujMh0DLtAgSCBQK8xXS6XU5rBkEXJjyqIYlSUJQiEXhdvOoZVD8NYRVUP0Ehzpo2WDwdFs+eOPP+0ARoz9/u7un96+c9dkGv2KPY8XTf18Pl+nMlcELm2Rv7tevD2fT3Zv3zy4FzmfXZ63tkKzZGJEYvzD/RyiOEigO2hkTNAz04IP8lxAzCP7te2db927/w+ffvy3R894mbedvVkO729MhVEikxEgHwwuLs4+O3paA4xHo7IYoMg8Zi8MvoKkRrHOF5JbZ0lIOYCXSlmPlG6JmHZETmnGCtSD9JytwHqeSmS06+JC0RSXS6XIWJAUbWmJYFA0JpLbqA9I+yRfJmIl9Q9cRi4Dyzl///nDv7s4usylEzygqEQDnmwSYgiKltMQtOIsNd6KoQd85t1+iA8Gg7aqnRBBIISeoZOp7ClMjJBCgThVATtmJnFclnE21XqqjWbRArScrwBWwfvIfLwGZEfInf/6xvZ39g98tXrWdh9WyyuOeunUwWFJATEIKVOzC4BME8DalXsSeUTN5+tBJ0d2HW9DaJr21w4Pvndwy1n/oqt+cnTUaUMJkJKltW57e3djMJh27bht1uuVTUESEzBnnmF7QKbUiH8Gsv5DwBXqG4aCRdMHq17BmWqvnivc45kxLxPiv6cYEZaLpbhPX5KTqnZvo9cLgmMyRb4YmQRTmqW5IwqgIERb4CKDVsi8V+eIPQ5LkBg9uvynl8t5FuKmMRdSsqKcz69wMIX/HGfZHrwW4rWtqel8Ntn44Oh5h+YEikB0JFDQ757TiVMM9bhShSR6oTXkNQhCLmCZhKDBXmBNcKZThokqhonWE6W5hyLP6q5ZrFb11Uw03QCiPZ/B1YJVTawbAWg73LVqPDnYP9gyOdQteN91jcJISvc8k6KQspSyEIix7Um6Avns3OCUUyCy5nS9+uDly0qJWqnnq3UjhJKGxV7sTUmNDP3QeA91dXdjOhRKWNgfDm7mxeFgpGNcd/ZktVzHUMfU3XYAXGtki6MeAzIAbAwOIlMoU6J0umkS11QBOJpJUKjWUqVjjZLlhc7IWA3V2/Ec4CwU6Yg0b8CJKPLuUfAySsbLrDh6+eJZNf/m/uF//N0/gNT+6q6u33v85LPZvM6LR7OzKcT/4atffbFe/vTJ49RQYzJPd1AisYFxC1HqjCpAojdEwtH3upJBCtl2zWo1E0LkeSl1pkbTORdni4XmvFQ6xmAhXFVrVD0sleAy8AEXt8vi1mgCMVy17WlVN02zuzkd5CZ6T8pAPXWRNi/UAZNkXiqnSCWOA7rf4uBFVG0zHQ5YDFlmAmeNtYGxssiddUob50EIZrRONRBjp6uKQ7i1txusDR6UxpINYXsxQJ7nCPeSTPT2MiKKLM9kD4EWPeuX94NFjLlAjmg01KVeBA8/etiTkAN2IzihA4JaIVjXx8i9twF1jTj+EiA450OIXdWul5WzvrXWOlcMBg3nf/6Pbx4vK8PZzrAslRwVg8vZfDQaHm5uRhR2ZZwpmaJ3Z9vA2HyxPNjbkTGWWWaUHg0LrTjJm9DngQAsMpfaa0AVKkHUKamkLsqPXh7/3UefNt6/UeT/4d7t72/vjGmGG0MT4Gi5fLmuW6LOaLPS8icXZ5+33c3DB7t7t7qmvTw7aW2NM9iAXXVPC6FAKAQu9XFiSps0jmNNo7URUjgonf/dO3e3N6f/91s/O/JeK73ufBbgm3duZYKbzATGpTaF1m+/+17lLYt8c7pB6F8c8su++seRCVcC3WJ6T/wYfK+miXjv1JBIxSBqLowUEKGJvgNEJ+JGgtIMYV4QUZWuCrq5YLeNQDaJ2Gbv/XVnQj0WOtVR0yxSThVanbX1EdiQm9TMQar1am/pMqewFAjKmjobhVrWFPtjCHtd+79/93v/82//XlzNPrw4dSbVF712JjJZcduWqkNA2T+JRDp0jueFZCOpBxiQLYsNxCbGOqSAghbajosoPAyYOMzyV0bTdVP/+PT4g7ZeSB4F1hAYgVzwkYYHvZxF/z5R49iTmwrmA/wo9DpSVuKVcznAD77+jQMuOsZ/cnbyeLXiRmPFSqg7iDHevHlYANzxnV+tVs57EVP2ZcKyYHH47LkAXJMQByn2UAycNsVQ0lKf928KZxxoPns9he7tYAjzxWQghUqaSDMplc6JGYwfiZHyBvW5JKCInNVev4M6SXFNcVJMADbBqOyMm1lOlSeOvZGiymIgRQ4CRQsllHdTbRY6hzzrnK2qSiqiP+J4XMi6aVLjEvhkPHkxO3++XGqtjOjJczhjCQzQ1hTPmECBGMzi6S9pRJ0iUPQLjZBUU3pS11MkBRy1TKErj24gZUYIeR4t+MV8Aa3NhdKMxc77qu2Wq9B03WptL8+hrrZ2b9w/vH1jurkhuIJo6yaTMmMyl6xUJuLAUymphAJU6lBSZFIY6iaVRJI4AyEQx4XE9NT8qBgCToMjpDPACi6yKEqVjaW6PR7vlKXChcTFuj6tVusIC28dF10MloeILC8uJWB+hRhkloUoPI44r/l86WxqqYTUhPZNfz+Cj5Aem+/ZuVpr1JAVqP4gaGWOK3zcLuBm2GghEZpneGogQoyfPnu89N2/+97vfP3eA9tURuur0/MffvrJk7rmw8HJctE06+8/eENo8w8ff+Qz7RGTghpO0XlIZaAyTAhgTGqDjTiZRxG2hAkcqaXPCb5azb1z5WDIlTL5QJTT86ap2mpotE41MqucW9SVFHxQ5Cp1/bBtzKvT8a4xHfiny/WLi6uyKDZGE4WHCrDLJ+kBEvskQ9ZeupUHgaU1gOusVVm2WC3LvMAay+V5XjWNc6CUzPKs6yyuY9OtMcI47xjnx/OF4ezG3m5EMUg6wEopAscpbBBxYIOSLsGTwA2yTyJKnF6r/lKA5xRioL+P5MqOlnbokk6Xn+OuLV0U7z3qFwaerg6FtdQuOHDO2ZAesmqbbjFbOuc66zrvsrywUv/5j998fDnTnO2MypFU47KYV43i4v7uLvOW9tYoGyZaJAp3LmolN4YDEUWZmcyo4aAwWiM+DATCdTgOvZvOSjyFKAwpVJ5Xgf3404dvPXlexviH27v/9u69N0ZjgdacTvBZ1z2ZXV11FnC7pEz+UsQfnp3MZX733lfG482ubc/PT6yrI+/JmKgYhIVeyvFgFPlPCZ1OvaSIKLB60JwXWklv7xTl77322qW3//mjj2oMIcqYxXJ5a2vjdo76LlqFAJPpxrMnT45m5xD5/s4O+vUK1PBKMcdDsB5i5BY36EQAIzpsulc4FlT4g6sYMykUIu8Ah5wBLarSvfCOnNjw/qUfyTtP8w90jwjoriQgOMK+kyRW/8MGEk5gJLJIy8WAG0ogZUyUvGBU+fBUgSm0jCaxF2RASFqfhwB3tf6ffvW3p9ODxcnzfzo+qpXJpSZRpoiUOUIS9IQgPMo8BCPEUKqBFIbLEOXKdUtwTYguhkC+8qhqZCLfVOpAm7Eyp+vVo2b9krErBowr8gymTNePNntsErb8eB2c7SKaEPh++iRIP5MjKK/2oaqb18fjf/3lr0BVLVj4u2fPKtVvBZFtF7quHY8ne1vbA2dv2Xa+WFSMA2c2MMtpEM0c7p79FxRbovogrSaGmDFecrx9PQ+GkzllFPw65Yq+Cb5muvcj4n7An8Jd3tsw0Mqc0vb1/12zaXq6bo+y5teQCfxDT5TkfujM+jU0frtrf8PeRwxLrihD1ELpzKwEB5MtFnNalBIVlAtprRtKdWtzMwcn8uzd4+OQwlk/yUKyOR2UnjuIGx2pEImA8n4cDbEDcpU4kLKAoKEcJ2gi4sHTR5po/WDvBjSdzEznQ+O8Rxbsuq6ChQwNLaN1DELbdYu2eX5x/uz0uK7rG5vT1+4/uH9498HtOxMuys4J2yhElKpMB2QjcMYybXCQGyWLuSm8884DIiCE80EIRRIogAKBqbyAOIzshjEPNjd3snxSliIyDz7TJkBcNO3C2Ro3b8AExNgBeTtym/I2R/UFIY0KLNa2A0Q1SS7AuXQ5Wxu62mjlBWEKsLzi0Rid2m58XkpqD17iSUWIimIsCBzfIY0yaqk15xqfntG6VNlytfzk5dMtk/3ZH/zRVpYxcDzwF0cv3zo/ewnOMrbw7sV69qWNrVdv3f7b999ZRCa11hi5tNLCKOe9BedZlEoF5AAIqXD9E3qGeeS92T6erLau6mqpUxttpCnz8bSK8rKuGYMBjvBb7+dVZUNqxXJ8idr5/by8P51sSjmrmo/PL2ZVU44Go7wQuColYXzJpc6MoGMuGfWXpHERBG87R7G7snYyLMGCYCLL81VdW+cyo1OvAmT1k9KdVgrQ/vn4cp4rtT3dCM4FxMmi3joBBPAdkYoPskHAOsa4MjL28mqeC+K18YAkDMHUNbOBYxTmJDaEnUmqLAM4jLscJfEjMXzo35Ipade0pGithFwtlvPZIkJoOttaK5Vxyvznn775yem5ZmxnNBxIUeZ544Jrm9duHTJwOCaRSkrCYjRVnZXFalVtTac8QG4yLUWeZ8PBgHa7mDn6+WHXpmyNdRtWLUX5bLb4m3c/eDKb39fqP9279/2bhxsQGTKVOxZfrpbPZldNiEzKdFzz/MOu+cnFuZzs3Hvlq1kxWMxnZ+fH3rf9YI8oGYyEQFPZhAM6Qfsdo01wgdg76LabScaMEgX4b+3tvraz/ZNnz390fKqznFSaa3C2br62s19IZcrCBzBFXlfVB59/ZiNMBsPNwciRSR8irVCDL2UoC07pVIIjfj6Q6oxKb1WxACYyHfFNhdimww8k7cOuIe8SR35frBg4zmC0Qv4t4dgR2QkQXPCBRSMNiUcCgsXwbCCBkKTHQi8Agv8cPI5PlEBp3QikIslRSMSjO0XKrJCKwhbg/PQ0uO5vH372eV2prEShD0/nFsAha1DhsCFopLtlQgyFLIwKiCarwNcAHUOh7JT3UBmdcRPCrjK3hiMW4ty58+BPY1gAkJUZLZPjNQ4c3ddRcDAEIVXXuazrXp1OVilukuGj7P1IUhGfnkjlwbvuj7/85VeGw5axDy7PP7i6illGaIC+S/Zhf39/LOUu+GK9XDZNK4RLp45ZNAf2nLyPSAE5dUpwreKcrnkIRWoyab+L9gyR+L5fGLERooVdj0b4tVoV5UYsYrTOv3C16+fV19yhfil8bd2An6F3b+oFzXGi6yMnIQXcsP5SKov1o2rCsFMZGBVVZYFtG73gIgyH1Wptu45TtuylO1hru9f2dgpnxxtbn52eXVZVpo3qh4U4BUV/eh6pnOxNb0hwXCIInfdsFtpQxL6kuh7NQcQgz4UEGHGVadV5X1undUYnoMKJdNXWre2k0s46F8NxXT2uVi/a5vHl2YdPHh6dntXramcyfu3Gja89eHBn72CnHAjvfdNAY1kEnBoBBttULcp4vYLH5SItNlgMhnPhwoZUG1EcZuVXdvZe2dgZK93aZm1rx9ii6yCywWCAVmh+bZuQKrV+rYvLF+6JkkI9EBGW+vdFpGwhnf29b33rV7/zGydPnztI1QFa4UlJ3XNk/W4iXPs/4yiKh5juMETJ0bxWchmZQhq4SeEtlCZ79OLZi/XsN+6+8ie//dus6WSMrrPvfv74zbOTtVYhsjULF22l6ub73/jGh48efbSYDwZDhYEpM8aHFEQ65wTXqXtIJS3OV0xqntCkBEi5/nrhxJTkDrrVahEjy4uCKyOKgRyNL5t22bSZlga1ZtdNu1yvpZaT4SDjMoupuNnJs5uTiWbx2Wz22em5jXE6nRZGcZrcYltH7AnsfZEv29uu8aZ1re0Go+F8scyzLFMKAhhjpJDrtnUAWZZTDgjoz6xRFdw5D5ydXl6Vud6ZbqBEIeCDpOFk1PgVKNwoFMFCK7dIPTGZnKKsT7wefQUUeguU7SPxIhGBhd/XE+wBUKaRVGsIGEqyt+AcQx4n52w5Wy1mC3RqgK7tlDIhL/6/n775i5Mzxdl2UUwyk4okIVbL5Wu3b2usxzn5dHGmlKrrWum8TUVDHOSZFHw0LJVSZVEI/cUePTX0guMO2HrOouQ8HwyslD/79PF//+Cj4PxvTMb//sGDr43GBaIXPIsr655eXFxUVZAaFb9EneVvzy8/WFebN+/v799VysxmlxfnL2JwhFchg0ekSGglpXe2l+GLQfEUMyJA78NAJEl0jimUGFr/7Z2dfDz6f95+e6a0URqHxlwas1qtDyeTg7zMjOYpL3KTF++8+07tukxnB9t7OEPBGZISLhJfCJRMHwB9V1CSD6d7kjHhnI5hakwmpfNgPTAkvQAKkiFmLv0M0IOPgJMIc7ym9HCmsRCx3pJosxQqkAQUTVbwRgvJ6bCISLa+EodWwYMndAPhlwgZTso+UhI1lm59r3YESh0tr95+9Nkj161ldOAzYwB8gJ4lRd4CnDPNYsbEQMmB1Dyma9v5UEeoUjbsQRWprEQ1p4LxiVIbedl07XnXzGK89K5Fyk3svyBRARBDiq+V0ItCCG/tayb7P/79v9vY3vrJp59GEuQUKMOMlTIXoguwruvbw8EPvv6NrG1XUv7dk8czdJLlvZ8Us87lJrtxcHPQdYfWLRfzKqRg3UVuU8uL29XUqDBMwKjEeQ1HDsg50CzkaLVAG99e04eo+aSBhe1wFFh/ocn+FxBo+hici9QB06iZxLMQtExOh5TBv0BJ9FAJzr6weOstRQPjNvZb1t5jSfQmwVgfow8xEpxk7/8rBMBUiMZkjTKBheViIRERKtDzk3NZd3avyHaLMlfaMf/xyQnX2uAgkOYw8prrTamCE/8Cj41Cde9r0R/k6THhEajJJUeRtFQxhRCc90aqMhXCclXXUQmCN7MU9yNI7jmbt/Wq61yItbdX3p4HOOmaGY/Hnb2C7unVxcePPn9++nK+Xo9H4/3p9CuvvvrKweGdnb3tfFCGyNquCLGAUEI0MZrIDJeotQYa3JDFHWP2TXZnOLkzmr62tb1jMhVD0zbLtluAW3i/Rj13HwGVR1LrYExmferUPYtKm8hjhxahzvtI4yEhbMBkgDUQNkEpDxxubHz/D/5okpkPP/wAMoMgAjzcqForBOvdJrSMAIqlGIZQ0pR3NT5nAUylEMCN5EqIjHMX7MdPH1rv/sNv/NYbd19xda2kvLxavPn46S9ml95kFqCNofVwtZh9+/CODvGHL55yFDCRUli0v0fyrYpStt6xKAKLDkBqcpcW4bpgwgVP6ktDr8fC6mrZ1HXqa1LMzORos5XmcrUMLORa5SmQxbpp27Yps6xIrS03jA1DPBwO9iYD6/zjy9nR+bnUZjqZkIg3TrAUcXZjP8cTdK08hKruMqO9C7XtJqNBBHDeF3nGGW9sF1jMtUFoKeJhcUtCWkXA+fH5ZZ6Z3ekkgCPcIw2yvPMKB4hURFG7i+ZFiLiBXqsLiWOCWHukLYyiQ4zumwdPtHtE8KTgjuGLVlfo4YJgCNvZGLxC6Y/lbLmYLQJE53zdtFLpmBf/5WdvffDyxDA2zbPtwYDHQLDn2wd7o9yElNTR0xrdVyHExlptzGyxnE5GEWA0GBmjpZKjYZ5pzchfIQDaYYf03RnLikIPBg/PLv/b2+9+enJ2U4g/uXv3B3fv7yGvk0tmOX85nx9dXdWRWnYWi/I4hh+dnp5IffP267t7NyMXpy9fzi5PGIMeg4OPJp0kZZRS3np0j9BocRaQBpa6TyR7o5YFLsgGRo+EPND6e3duv3N+9sPnz7JywEMPTOFofNQ23Zc2N8Z5LtGYpCgHH374/mw1D4Htbu0oqQizHmLsvItIrYypqA6pbr8GuCoeByxuKjNUssBxxcr7SBBSKT1lR5oh4iCVgIrkDBhCUGgdT1BjgOi971LOogYHBR4Zw0GW8s4xgiYh1AsbSCzOsSVgkWFlRtbUVAgyUm9UXKBMGJlLI88zBK9VpbWVqQXH2ov1DHKMqChvEnLBx7ow+BWwmwhd8EGK2ttfOnOjuVbORc54LlihVO3chWsXMVQMgpJd6hkwpFPjSGvPFGckEek5ivzbtvuTX/vO1Oj/8y//YiHSXU01J8J9CLoYIra/tv79V1798vaN6P3jevmjFy+jyWgmi4gxbrt2b2d3PBxNu263ri7qykplY+onHWM9Aoto+L33/hfuapyoxjnjmaC6GOnXfetKLS8xFjgCWQiW3t/3HkPFyeI3SpPhxyLmNR53TmTi9FcliVwglZqo8rGnx/9SnjL9FTQoxgEaQQxir8chSF6dgKyMMiC6uDOmYzR5XjMWy2IxX5DgGWleCZbapti1D/b2ddtubWy+9/J4aTtDTiLkzhFYb6yI63iF6R+FKdEKm4BkeI4j5y49JRwmoMYXI+ldrETQfIZnhOaPzHLvnMtMTuApHF7LCqDyrupszWDu3EVTrwGcVClBhrBg7LRrXlxdvjg+fnr0dL1aRQc74/Ebt2596c69bz148Ore7r3Nrf1ydHM02Tb5htQ7mb4zGr8y3Xx9PP3SZOPuYDKOXLPYtu3Ku5nvzrpq5W3HWYvdn1CSSQ4uSMaNEuMsVyFyJVp/HYbxJ3YAPjolDalGhJ72HWkEoYx5fPTig5/86PzibBl8THdNcmQTceQs4gAWB/tYbQqGXa8QikuBAp9KcMVS32SEyKUUwEZ5fja7enh8tJ0V/9sP/qSUMroglX745PFPnz8/9t5JtXYdYKV21lSbLr5648YPH3/uJd4swZ1zuMBGSFEKQ8CV4kqicDwKF0ihjIYQwDscfCErHMcaiBlm3tn1YoaQqIJzacqBHG8uIa5Wy0KKQivBRG3dvF4Lzg02x4XWBedbQtwdjTaH5VXTfnp6cTGfZ2U+GU1Mv9VL9SVSuxEujHB+IWXTtrbrRsPhfLEq8wIBwKm/KfPceqjaLsaYG4OaoVEp6a0dFrkQErzzkZ+cXwrBdjY3vLXggPipqWmyDg0RFULxgKNPAEP+JRkj4hSp93hHEEpgqVxUEQRQ/xcQe8S+uBxBkApFoP8UO2ex8+YSzcdOjy+Ws2WIrG67zlqhjdfmL958572jl4azgdH7k3EANxyPz88vdjane5NR8A6ZO6lOQ0Kaalub51nbWRTjzARj08mYxZgpNUg/dervcQwrMM27KHg5Gl+19u/f+8WPP/zEdfa7Gxv/8f69b4+nI8BaWrB52zw5vzhb14COQFFJKIoP18ufXc351o2bh68PR1PnuhfPH9frOZfwBT8CKYcyNwWamFnbNSo1soGEd1HkQKKgQLodKUVLqZkY5plsqm/dOLi7s/H/vvf+JUIgI0tFRir+AITW89Uqs/7e7s5wUEatVW6ePX70/ORF69zmdLNQGYQYpejAoQeHoDmrdRY8UZxZtL6IcduY7SxXkbXOrr1vmHeh5/IJstBCRqiUEvW6sX3AgtoHwM0sopYRD6tQtDn9CCoFuizLkI0p0S3Gk1O0946QBPge0h3XiuShe/UQhAIyl0o3ck4K6b9j30xm7BxLWGLtoN+28LbzdC1Qf00AZFwMpMp5iqgOfMpeDB16pUQV6hS0wbtMyKGUJW5/wUODcGgrhOccUE/CB+LTXCN4qEVElVKaB/SDHCU/On75V++/v9aGKU6uDzTpJbCIjWHVNRvK/Ntv/kpug8uyf3z8+fO248qwwKkmBXCM8cODm0Mf9gPE+dUa9eFciC6yDvWfe91DNEEKpHPTLzjS5xEhloLJfgpwzf3FBA9feOtzdm2LREkRl8e/7GdTVpWZKf6FbvR1suW/RG9dD5P5FzNpTp0qqjZxFqVK1b7v3+m15z/WZP3qXPQ7YJyicBFBcAkxbCjppWjKge26qq4U1j4kGiIlWzXtjel4h4tBObz07tHZiVAq17j3Zf1cDj26CRdHZsyMFOZwO9YLdJFkAVHHcBQric0VWTBKSy6DB83YSGoBvHWeK4UwiggRSMkztYeMe4kpnLMa4KprHeOpwsWxho2hDaxh8dLZR1cXD0/PP3n+9PHLFy8vzhi4sdG3Nndv7+zfKEevbO/c3975ysHhVw9vPdg/PNzZmZaj8bA0OgV9jyJEddvWtm0ipAoe59c8NYWpPEzNYowFF5nghTa9Eh4ykQlFIaTmkgWPRCPsbgVXJJvqgxNG1wxmbRelgkAQj1Q7ykhdGgjGFKpfalL0xExO8CsVI7a8WoQgcUilGcuk/OTo6XG1/s0vfelff+83oW0k48H5H/385+9ezSopHYsWHxrjova+nl+9fufus/PLWVdnOs9MFnhMCRV9QB12MZEHz4LRGaoRe9pLoMuNB+gt2AKdQsJooAZcVS27qiry0mTpjufDSRxOLtvONvXA6ExJD2FRV4u2VkqXxmjOsqhKLvZMfmc8LIR4Npt/fna5tu1oNBgOhhjIALEl2EJxUnUW1kFV1XlZWO86a4eDYfCecCVFlldNS7wIpQRgTYlAFZ4ZRXr3UfCTyzkTbHd7ExUpHM50QwyxbZqAegKED0f7uUDw89CLVaVrjL+iKlYUOM3xhFIhgQCIBCbo63XS0kx/yVmiG/Ao5ovVyfFpu6odQIdik8oYK8V/ffOdXxwda8ELIW5tbgZvx4NytVobo2/vbEUHJO7flydEPfJOKb1eN+PxuGva6XA4LDItRaZ0pjWnUMV6t5I8L1rG33n47K/f/vmL+eKe0j84uPFvbt4+NLlyoKX0Ip4uFk8uL1bWB5l6RJFlZ5z/8PL0iWdbN1/d2r9dDMbr1fzo6LG1DRopxt4RPTKtsjwfIsID2qYiRW3mo1akPaZoCRoCaK3JpbHIDAM7jfCbr9x9tJj/t08+0eMNUrNHsZL+WgUpl019dzy6s70ZpJaD4uL85OPPPwlSDQfD7emWc956F1gUaI2FryhISeTMVIoNudzOslyw1vnK2S7GNgabsommUHPNHgmcsM24dkFL3EAEERLISNeTzKzRpB0hZb2UMCqiIhFI9vibVL1wyUPK6EiK7t3gU4WJFRR+zqi4UlJpQbhRkL1TCgEjUu4MwZK+NIKoBC5xmWapnR1oNUQejQ3QRG8Z2TCklwIRouh96nIhSqUV4z7EDpxnrCYPBmKDSXKb4B6ddb9YmeJBT0kGyVI9/MpH6CLwPMeVJ+/Z1ZgMUq/PZO1D19XfvX3v12/dZV175NzfP37ktbnGJKdoZjs/HU03NjY3m+aGt+eLhWXMovuv5REXwKjwl2IXD5wBGeHGa3okQMZ4TrKiNCkTNGRGz9B+ViwQw0Lkhevh8xdoKdZDBa9R0NfSfCz2kpQp67PeXoiM9gV5IfRJ/Jrk3o+kecf7A8F7kjEOwyhAIm+MoGHo1U81YRjFyItyLqQwej6fXTPUESwgeAcxD/Dq1o4IYTQavP/8aJUqa63xCyEmQ/EvRIFSviHfAt1rrPJe90r2qn2MHM57rwhSyUCHrBTWfbg13dwri6vV0jFmnY9IWkAeLUvVfaZWXR0ic8FHmQ5h6GuvkGcZS0mQMSkY2gdFIRoAz8Ls8moxm12enS/PL1ar5eXlJThom7par2zbtat1VzeSsyIbDItid2Pr7o2bh5vb96ZbtzZ3xibPGVcAwVoRY1HkPUeesSwV71xGliuFYFdcGkh81FI674BGtyk+CVyhgkxRifzfNdemLxpjFAHtB9IlkTF6sDZPHbTQqdmVPAILIBnLUUxPxiBZFAEMlyZVALp27fuPH7EA/+m3/tUrd+/7utJSLZv2r99571HbOgJSpQ+JVWeMVdOUJs8kO65WgDv6LCts8B0EYUzjOjRoY7zHX0TiCaQTB0FnBjeV2PNHoZUKBHfCJYMU3Hm7XM67bp3luc4ybop8Y7tW6rKqZAgDo5gQjfPzump8CsG5lJozDaGI7HAyuTMdixCen199/PJ0ae1oPBwPBxz7AxKBDyS8z1lrLQiujV6uV2VZoDZ5KgG1FCYzddMwIR14owwJTUghvbN5ZlKAEKmsPr1cWOf2trc4zp/xbUkfUmpvmi544KJHXxC1AlC+ivcteURqsu+lUYQgs1/S38dbLQF64w2P8ZD1Qsx8vlgcvTi5vLxyDjy55QUmtF5C+Ms3f/7R8amRPOPs9u5udG5YFB6gretXbx3IQObBknB5Bt1ebWe10V3XSqmk4Lbt9na2NGfpSOeZMcoBcJlOoFKGqeyj04u//Kd//uDo5TSE729u/vGde18bTScpcQql9dzWj8/Pj5dL16sMyNqYD5v1W7O5n+4f3PlyOZpyIefz85dHT1j06QKHfinHhcizcjAYCyxcOtvEAJnJAUVVRZ9LuBLc4OwdHx3uobUW1t3W6tt37vz1w0cvW2tMxnFuBygTZ5QJWIeBj+O6+fK9OybPuNGLq4t3P/jACcGF2t3YcAC4JhRd6qNS2RMBZTR41JGVjG/kuYrRp4KLecG84B59cT0qVgCiT1EXUqQjHqPRxnnrPFhwgjOjVPRAVPB03oAo3OR1n3pTSYLYODtJZZyWHoAEVgOOWHAeLaRUIabDjwqUlkchFQrlpe8JqK5DK2LquyI5+aO5OVrMBy8kS7cp8kmqYiKpqVpwHYQOYWI0ZUWx5cAg6BRMpBYKQqyda1G+i0kFWA+SDouQAmJ0uAc3aEaGanG9YAX9kDQkYwSKwGdFwGdawwC+XymkDWFtuzKyP/3aNzeFDpL/9Oj5J6s18jAp0WFn5eHg4EYh1YH3+XJ+4brAZIr8vN/+AheeowoHi0AbzV5RDxu5EEseFTkR9pLUqDWDPSm5RJAdRO+KdI0eJZWo6642Jdt+4E5EJY57lIAiKCLF39APo1nv8od7QHJR5SFwZEuiEr0SilDmCK/oZ599Yd4L3qS2mXPg3KcrGhRnKcwBjNo2DAblYFDVtUEzEPIElUY/vJwf37I3QdwZjd64cfMfnz9utTDacJzIBfQaQtM3tPPC3t8FLxgjJQd0DcRFBqH1ZToKPriedIXtlEUPS6vN6Xo1HU+28qJjvBIglKospMMYQGUl2fNpZFtlPowxueUiepASAo8800pzVqT2JeOBlaUqtTTFUDNeGgNSLdrGQji57LRR1rsGdeaCh+BsWZQCP+14NM6k2hwOd0ejW9NpVpTrtr1arV7ML+br5qpbCR1VrtPtg2Ck5hD2y0ET43nTVJHKRKZSjob04oAhDghlyKRAq7kUxoN1mUndM64JU+kgQmpzI4QUoQIokepMLtFgmOGYxXkRU/wSERQXhdYSwHD2bLlY+u7ucPiN+w8YqmhFJc5n88fzhUNxPdRdAipVCpN3OTy8vLxRmlS5m6x1Pt1crHShs1mW165DkfpeYjzLcmdb7x1HbdM8H7R1jYEHwHMpFGrUXRcT6ZT75eykqdY3Dm6Pt/ZcNHr3jpzuPjl+dlld3czkKCUnd1avV3W9NxnvjgZ5pifR5NaWPDu8c/f1reZHR88+ffbi8cnpG3cOv3zrcJLnwTnvU02mlRkUYjgsVus2L1MHb60dZCb4HsY8KYvOjS4WS5llEEKe5cvVssi1VjmA3Z6ML+bLwCMo9otnx3Vnv/PGawOp2taBj+nhaW1t0zStmslBmQ+Gg6JI+S69EckcgIwMBEYQiCJVu9KTekqMhO2nghICpF43EBwjrut6uVgt5utVXWGFjZMzHHEKk5+37V+99fNns4VRXAO/fWOHe5tlWmu9WC5fuXmQRWrHRC+LQM5+ePsEcpfLIruYLbcnY61kT1/GISqxhEVRPDy7+PEHH396ejpg7DuD4W/eOPjqcDSJsTBZZGwF7nw+P55dNiREwrnX+sj5Dy4uFlm58eDrRbmR5XnbVi+eP63Wc9wX9UYWMTCtTVGWKFQDSKtxbdflOrfWk1EL+avShstjSYRmZYCazK4M/sGtW89mFx+8fJGPN3kqZkQQPZiCVkBY4fqo0DMkgAxxOh5LrSCEpmuE4Bohvh684akCPszzcTF4djmvpNBacACs4xhTGpzzPHrqTwNhYtBGlnHnHdHSGKQQb6SGdBOR5AKpl8VLTdVsSH0tKoaj3rMj0BRHinm0Fv0FyKgcsHFKn5yhqwcLmM0CEOgyJQ2Pk100bjKyJ9vwkCoQLoRWMvhelkczbnzcNAUX0sW48h5xJ4DCRMJHkDhliQAcQqaUZfTgAlUSmE4Vag/6SHMLlG4GJFmJ9G97d0OuJNBWNGUo6nVR71MLIbW1zqejLtGeAuGjARVzJbdoZ/ra3s37001ouisRPj09YUr1C1qECjvrykExLIth2w3ALZsKuETKb8oYPuWRiHw2EWKfO3q7PYo06UFyg1UBalCiMRW5i+OggvXyVTg5pPF/7EWTGS17icuL81UVkCxIwzw8EqGfArNe16NvqCMQzZjMMXjPCSERxsgiGGSdkuosyXzQuIzm2YFLkrH2LEjGFCbLFWOjptkWcRWLra2tqqrRT4XQY+l9zyJ8dH556+BGbO23793/+dFT60JQTDHB0vUW4EFJUghL0cZisa8QEi6wKOxJcIQERZk+kluDYEuDfNP0OPUK3JPGOWd/5cYtBuHZ7LL24DhfN/VGZpTR1XotcDbovTeMFanSFsAFRMhQSUdBHBhDXYVSolAKvC/yomvqyrNVKhAjz4qreuWtbIAtvZ3bWgmZSSlty3FcmXVrEbjwfmr0ROut4WRvtHG4s3tv78A6f7ZanFyeXa3mbV3rPGMp5rIihEJpMxi8rCrOIgjZsdBhT9BYJ9FAipy7A/hU+SK0N0QAB4T2ddYqIYOFQsosGxgkiwIL3rsMSfS4fQHFWSbQpc+DtJ2R0mh9fHEOjL1x5+72zg40SJ4M8Oz09MJ5kRfeg9DcOc8Q+iEEz4py1rSGgySrNc6WbS21lNKgbQyg50lqqBhXDiwnNyuGfrRIqs6y3NpOSemc14rneWZTWwGStNpTHNEx2KNnn0/r9f7+ncgzK3N9+/X14vTj48f7wR+UufHOQjxaLBf1en802h6N8sxIB6K1X1Jy9979D6vVm8fH//TZk0+fvvjaK3dfvbE/Lgdg2wBBcjEsyrZxIsRBWbrOqrIAEXBxwsH7rdHQWrfuUsvrunaQ511nUz+Ilvpb48nFYsGij0Y+PL2s2/e/++U3Noq8tRbx0q2UMqSf3bedXa9bqYQxelDmRZlrZTKjce6TOhdSCqNHpIVAhrHqUSI82tY655frarVa1VVjLSpfYGXeWSsYTxVjmX328vjv3/3worNGsiywuzd2UraIcVgWJ+fnB1sb48J451OSYEymJI8GEainJhW+hdRoMg9+iglYsNTEsBikyrJycHRx9dO333//yXPG2OtZ9r2dvW+PJjeK3IRYFJmP7HJdvZhdzrvW4Z0PJpsx9vFs+YRxvX/v5vZNZbQUcrGYvXj+yLtWo0InWe0ppcqs0FoR3JJEAtq6SedHiuhACJEpFQCMlnSSsSXw2BekaOyC35T8cHfvr999t4piU2rvu1Sy95qRFPpTlvLO7m5tD8tB6litLYtCZznr2kW9fnx6fLC7r3GRGVkspH5jZ3dYls2qMdg/2YA4KEQRRknLLZQODV4pk+I8OdhxAhxAiCFLh0UyJjIpY/r25BrsSfkH2yRAijOTyjRta71TWPrEkP7ce2xbU9pCXp+S0YfgfQcgpEYbU66l9uhejwbAAhyk0C2iEMw6i8AaifxjZkRKTSL4YeQ3i9FGUTxeLhbWMUUASewaU5UcO9cV6ZDq6MGhUZINwVOUlaIsC7DQenCojOu8V1yRkgDy6ERgMaT/E9a51rtBXkLwiCtCORX86QLZZ6FMOsV9IdPHCGir2FiXMfbdV15VDqJWH528PLNWlgMS64oMZRh82JxuSsZ2PPC2WaavxX2MLjJcYPdfCkV8eei9DXtmLaDLtuldU2k/2Jtzo4wAbo3QJ5++H22FeQ9XwpIIN0rkccdYiuE9kKr360epLBw9R8+5jIFodSR6Fq+ZyJHk3LmiAbyAmInQpl9R/YXs//rZd2pREcwNgEB87Li4Rx/Ctl6PBpnp3GQ4ynPTtU4o028zGAOlPj0//c7e7iSyB+Px61s7b5+flkYPteYeu7rQM5Vd9CQBAlwaKTlmW5xwpC4BwFNlQk2gQKsfGx2EKJlsY7TMeSWd7eTF2c2yLI3xaIOqWDTp9YP1neBZ+lGsH5lcgh1oExl3bTMuchnDuCx4CBXj3oiqbduuDZItrPUhCN+iZGyqBBfB161rIHYcrGCKRU1nKF1GnHlgraAcaN9m1Xrz6mLv5dP7xeRwa/vmrZu3tjertjk+O1lWq6ppVCZVzGgms2uymfMNri48DiNRxCJKyXEUiXgfSG9NSREAFOupvVKoHBdXRnLtOhW4yjInuKYFG5MBfKYxAIPjgCJHWikpXs5nZ8tFwdivfuWrkdRRUAbiyemJVdIIGVLkkcQLkalSl1xwy+GqA1y0W6mURH/TKEPgPBXCKb/HFABF+glQoNFkQrW2Q6/4IJXKsqLrmqLMm7oWSpblwFlruyagSDiNd4Ti88vjej3fv3l/MNr0QaiNXTacHp8eLWcnB5Jv5UZ4V3n/9Gq2aOrd8WScl3lQMnWZcTrZeH0weGcxe/v07B8++uzdx8++fufWg4O9UZG7rsu0LnPtXCiNOV+tQ+Q61ROQGj5k0+1tjv3FLFqXGdU5N8hz55w02lmfmWxnMrpYrWrvomLPF+vlP7/31dsHd/Z2C22ixxKu7RUYUONXNk27XK6lEForpVSmUStNIWIRUSWhP0CkBUgrKuics9Z7b+kehoA+6qjxK5SMSi0cvP+LT9/6/FGHZkGFVPd3t5lzwfvxdHJ1NZuUg53p1Lu2x98KrjkZNgrrHSfdn+Ckzq/my8loOChywdI7LsoiH5Yni+qt9//5nYdPKoCbQvz67t63xtNbOpvqXEvONFu03fF8fl5VXbqfQmhTCfHpcvGJ83L79v7+YYjClIVtm+PTZ7PZGWeglYDAQqroZDYoclNwxtHyjyGnnDXNGoIv8tx2Xa4yNP+PRIRNv/deI0vHg1VCQYS27e7cPOis++fzy8FoiiqLEpUYe1mrGNEvC8kLW+OJ0MrHyJ3PlJE6c00ThHjvycOnZye39/Zv7O8ox4oozq4WT08vQESJLTNqV3nBuA++X42hErFBtawQQaJ3eOrW098EFKpMrY0HJ9LVkZwFz0GSuh8KRvKYevX0BiD9vAp3/CIi5Yn31BVScXHp2qQ+27rgI2gWtDQhsnTRpHIIdKFBZ4AohfKui94zoTkPyDbEq+thS6qbUm/q7GW9boP3zDsQlDijB0WiDKhZDChxB94CR9EhzCxCqKbrUu/LZCTQFyGtPCI6Uo6ISFRP4cI5H9InD5L3lncEuw6YWBCGmTp0QV5vNOjhwobgnPvKdPNLmzu29Z1mHxwf+cxoLKhS9pLROptl2WQ8URY2QmxW65ZzH+hzkh8rAyTWpqYWZ+RYroTeIQbV1w0Sp+nBIcYxXlsRIUaS8Fixp/Gza0fMa48MxGdgwk0vHHnAvc1TL40e/4WBDAm2EXkXD6Tk13Sf0PuZ0h8KHJf7SDhVSZ7/X6hHKmRSo7YQegcyLtHoQgAMdB6FqE3KZ9fS0DhgZlxK2db1pBjcGU8yZ6Es3n/5IjCWaVLNxFeIHpkIFqSuPn0XhVqOEnsrrG9IYJ8jUd0TmzkiJssFcDS85TIIfdbU69ZujyfbeXFjOBwrPcZloZEml7pUciTNKC/QdSMaqQc6lywChDbEdbCrGC+cu4rhzNkzaBe+u+oakHKQD7QpTlbz07ZulVyB67CJCYJXrgNUBAXmkdCVSjsXUzgHwZ1gS981ECNANbvqlivN4/bm1nQ41jLVp84CC6AYm2RFrjRadUbnvFBSSUG9iErVrqQX5wOSkjCsSIRe5zjzKpU2Hr5yeOP1+/fOT05oqxohEuZVM5ZxlSmZa+05f3R5/rNHn39yclQH2FHmz/7wB0NjoncsxKqx//Wf3jp2MeUyQQgEKZT0kTXOCykGRdk420Dn0VpfCGl01gu5SZn+h9ujmKpPImAwdi08S3WZMppz3nVtURRN1TjvBoOhNiZec9tpKS55qsqXi5lzdjgaca5ClPnGhhuMj6r1slqOTF4oLRlvrFvUTe1sajfz9CfCx6HUh6Ph/fF4JORVU//i7OLx8TEwNh2OiixPH8A6pVTddVzqQkmSeEbJtahxsVa37fWxRDg0Vg9t1xmthkURAms6xySrPZzN5rN1hQodsigHKKyPKEZSlusloVOibVvXWtu2bVVXdd3WTVdXbd20Xdc1tV1Xddu2Td22XecQLxsIQJ1iYhBaRimCkHPr3n92/PcffPTRyZnHMmeryO/v7WAcCqOitCl5u7s3dgXZY6BQF54thkLjqulsiEFypdAGdlGtbu5sDXReFEU2KNYQf/r5k//yk7c+O7/cZPxfbW3+4Y3Drw/GN7JsnOVSaRvhZL18cjW7qCvLGdfGS/3Qdj9bVcfldOP+17b2b2ldFINBV62fPP5kubhM9YYg8xlZZEVRDrUyHEUSqBKJLHSuratVjqhSqjOQgwMmXQUZUPdRIsifsxSsBY+TGL99784nL57+/Go+LMboAEu++ilkZlnGcWIPzo9Z/KOvfm1vNOq8U+n4dX/z7jtXHRpL+FQBXq0X51czcD7XGU1oXXCEV6P1MMo1SMQFK/y9EFEopSLKjBPqNYR044zSKRGCQ1c3FK8EB63NlEbajTAmR9pwlFowYJKM8VNnFdO9l73nnVYkM8wgNZ2uCy4wZrjOVHZtH8h0eiCpKKfEIRBIrZHLqaKQjBWSlcDuZsWrRfnbD17PiuKfjp/VnHfoCehQbkCIlKd1r0kQHICN3gfmsP0l70ePRSHniqHLdUr2OCtFHVZBtSaGaREZN0anNjpitMJdNPLjFVwjvAgRiXQNNC5Hp8vKuui7P/rKN18djAMTv5hfvP3yBc9zHCAjOicG19md7e3t0Win60ZNM1svW8FdjJZHxwQ2wakbJuxVn/yvNTUwDHvDWIkGJJSNod8OoxgGflQEZJFbYj9IJuut2PvyMJpaE09XKgQd8Gt/BtqXEAJEXPvx92A1yuW9rwk1zai01XOBiPCDlBhJAxWS0e0nDCTySxb+CCaiwoCbELa0vtCKF+V8Pieod+9pyBkI3nbdV/Z2VOfHm5tPLs5P1msjtSErvF6vLGIvL8l4lRRNcQSNllgc0RCBBvNRoEMwiaCSViVAMFqxyFoAkMJytmqbFMB8GA7KALFpXeDM4cEalQPvfc3iadOuvfdKzNp6xcKZdy+a5hT8i2q9ZmwVQ+0d0zq9Myka5zMhXt/dffXe3YfHJx6J8LioS8ERJSmikBrxUoCKcioQRJNzCFxpledZgNAFOL68vFyuq7bZ392dZEOdyupOCV3mmYhgGB9mBl11eboBWJ9JIfI8w8PcC0Dneca8Nzymiy6VBJZLkXv4nd/9/tf+1z9bPX2yev6EqUzyVAbLAEW6DnrWdR8cv/z588efnx1XHqKQLfg39g7++Nd/A8VNvIz8dD77m/fem3MZlGK4Ymcp+waHXTigi5kDh4gPTRaenoU2AIrGMy5TqiANP8QP+762pAyE5l8RH4j3DgDKwaCua9t1o/EkL4fpXHCVmkjU3ZOo/FOt19VqKSQvisIHJrIim27NgzharGroBkYX2gCLq87O6roFyLIsU5IDUwATqW6PxnfGo6mUs6r+5Pzy0clpCzAaDtMDx61K0zTjQdl/RDzwMbLcaCFEm3Jw+kkgRi2kddbkxjorOC/ygguRMhljjourpnl6fvXk/PyqqlKjKlmWkTM/EvwiRzcHhC2QDh7RNkgIlyuiSgsU8kW+pkT7c49hSrkYvWDLzj08u3z3ydGbnz78+OSsdo4xljF2OB3f3tmyTcsCFHkeWKiq+vaN/aHRjNFNkXhBArXgzrm2tUr1Tj11Vyupb+3vFUVRxfjW46d/9fa7v3hxPAjhu5PpH+wffHu8cUubDWOGeeYiu2rrJ1dXL+aLBlJ9F03+PPifzeePmB7d+9L2rQfSlAiWhNPjZ8+fPbKuRduMFECMybNykGVFyg7hGmnCicYGy8VMSqW16jqb5zmGOfTswlKPY+mmpYqRQerDGIA7UGp/b/e/f/wJFIURimRPUKcgcqkRig+p33Ldq8Pyf/z610skdgoIXdP+7Yfvv2zqSZZ9ae8GB9/YtvNuvlqdz2eM8xJxaMSBAoItBFBaRx6dB4G+YgivwA0gZyY97ag4Zj7BIYJ1EBDAHL17pSh/597dxcV5I6VQ2oPrkYdMai69t0g9TjFTqtToI674/6fqv5otu657MXzmFXY6OfQ5jUYjNBpANwiAAEXqSpQoUqRI3b/0l64oUZKvgn1vufzgV38GfwDbdV/sRz84XLvKQSrJkhgkMYoAiNgAuk+nk8/Zea+1ZnbNMdZu0pIK1Q3hhL3CHOM3xi+0rg3AtSOcSXDdoZnMkDUOIg9Ip4AIYR9DJmX0juPRHUMmBA8+0/q5rHxlY1MRMgvh/fPTU2+btoMAQ3g0Kw7M0eAJsejUwFgrhw1EUBFJNOl35iYBJnxHIkdT6FRBMRMULEC8ax3nQ3DAreKoi6dt1p0Dh5HUnKCPDSaIR6q9nzf1M2X3tz/zOl00Vom/vffxpfc0YTCUVBHnAyNk78pex8enbVNNZxPvLWT9WkItEKEtKFkDMLDCkgKGXCrwcw0lZQpmqeiN1aY+AoKnbcPMWh0zpa09CrjYtW6PcRmGhAZNSmVtNsTScAOhdGx3xkjnaqP1MX+01YMvsxaWguDIOLWA2wDstlEeAKnbiAcOs2yKuZWpZMLD7uyqUHMpXJ7Z4GfzGfiz4nGWMMGsqrY75W5voNIZwN86OqKc5ULx1o+Ut51D+0uBrUgbSdiuxCF3FVwwoWzHACKKiMwwyigvAFRF0NsZ4ptIpt5e6Gpc102Itfcj3VSMDHU9Nc2chvuz6WX0l645ratx9BfBXRgzDXEWnOXcAOeMAMHQR1pZUwcbIzHGRinP5nMH6zTfRrmhh1g6LrkA/7ulbBrvFYcUihCDo/GiqabEVzQezyaPLs60tZtra+j8QAhRKuHoIlMdJXgk3qRTRklFEtaHw8gHNLhTgAcVQzkZEakvpjmh7nK4/9z15998/fgnP13UupQqlypwdjibvvvw4J2Hdx/OJhNrIiHrIlvpdM+b6sWdK19+5dXU70YnCT26uPjeRx8teOYiwzQ8S4E+AFYDEcTKXAjwQQSWGO5wmLDWE8act2jmGuPSCBeezBggoylSDHwKMaos11pTRru9Xt3U88WccV4UHZUVUsrQEpYjRnn7oGfTSdPUZV5KmbnAVG9VrW6ca300GdfBqTzPVe6cmzd2WtU2hCyTuVIikiz4Fcb3u53r6xs9zkfzxScXw/vHxzrEvCgG/Z7RjWgHDLGN/EhgmOZZ7r2HmVs6HK1zqflzlgm+qLSzVqW+SgXndTrv0zNrfLiYLe6fnh+en11OF3NjA1Dr0aG3DY7AQFZgQGL2N466kNmOQhZPYmVdHUjlwsl0eufw5N2Hj9/69OC9xyen03mN62BCSkqf3lzf6JbNbMEIKXIVSKzranttfWPQddaC4ohJKZHYyHEoZWxCk6JNRNFNc+3qVdkp33nw+O/e/tkHR6fC+de6/S9tb39hsHpdqO2iHBSFUNlINw9Ho4eXw5FuAhchz04Y+clo9G5lxVPP7b7wGZH1GJWdvGjq+aeffjAcnnLuW5M+RrO8W5YdWH9SwLQMLY1AREtm80nwvtMp66bJ85ykN4gJzpSU6TR0TgDeMtYmDAk7PmfNyxvrM2PfOjtfGazE2OZgYmMjIBMcJRy+qn7j6ad+9cVbzmjqHfVkOl/848Enn87HL2zu/lff+re/8tqb/aK8PD02WscYJrPpbD5VUuVZhud+qhOwMY0Bzj0wZwcxbeSgzV0eXxFdQ0mMFrSq6cStqq+++uZf/Nl/6obDtx/ej1J5a6FEUUg8d0CsgVRLnBdhEj6c9a3HKm2D6QSoMNN772MbrxciRIGDT3BEi8PIYuQxSkoKH57NO5+/cjVa83g2ef/y4sjqmlKXGhFujKUQ1gtj22hJMNZjwJUPkXDiQbpLKf3FFtw4B+hcggQ6gbuEOlrJRUQuGwSfMI/LUcrhbSY+YuhyG3YLefDt0sVTunDWWv3bN196aWXDBnJ3Pvynx4ckyyHgAmhOzGutV1dWt9fWe9psNdXlbFqB15UGXoAlAUTJ6dRwhLhlhEK7BIYBqiSxw5/8+zb4KC6Ja3Qp723VVLQ11IvLaIUnzO3WHYNSLsEvqeVFx19w2WitJDE9aQl4W/7VMrYBY1SXImEI9CWudfRr/we/CciTUMnQmj4LqO/IueOElZmaM0o6xSSB4GU+N4DxhEG1vrl7JWuazsrKpxcX42oB7uqYE4DfkgjG8HZ4CCfBzAzsznDDzTFfAKx5QD3m26wB+DA8vR4eUtUil7IOdubNwoeaxpmzmtGLpho6Mw/x3OljXVWM1TRWJE6M1ZRZRg1xIaQu2zmbvgmcXjoEExyVzDByZu3d87MI9sIuOM64EhJzSVHhgn658NozyO72KJwmnJjUqcWa+HkII2cmJF7qZub0ZDEjkRRSKKESoAGhtFs0Ham6ZY7uc0JKJaRrNJYJAWrCXEqJ7FDIQ5WU5pS62cwdH3erano6dIHUkd47Pf6Xg3sfnh2dV3MdoyLkha2d33ntC//ln/x5nud/9/EHK0L+5mdeT72RNSLSypgff/zpmMnAmEb4C0Mi0H5xD20vcCi8DYYLahNM50JA9ieYPoF0n7cZvT6Q1gqpdfj1rhWa+xDzLK/rBaW01+9Z46rFnEsulSKE5XkuhfQ+pu8PT63grK7ms9mMMNbt9uCoY8X6pu8OjuaLx6NhE7zK80xI6/2kqapGg9Ui44wIznJCVwl7qij3+v3VTjFeVPdG40cnZyYCGi6LjIvoHRNtbCAEmMYsz6pGt8GCKO6IyDiVjTEAi1xZZEWuogOHXsyPp6lwns0XDy8uHxyfHZ6dnY4mZ5PpxXwxrZtZoyfG1c7NtKlcqH2YWTvVeqLNxXRxNp2ejKcPLy7vPD766OHhu/cfvvfo8N7l6GJeVbgOxaxvQtbz/NmdjZyx+WyhpCjy3AdvrCmE2t/aDNbCTROpPIADsWAiHZqRaG2kSAdmepy45EV5WZtvv/Puu48OiXUvF/lv7u796srqjazYLTtr3b4Az6PH4/H94fCiqhpOQ5GPGXtnPHp7vtBbV3dvvtrtb+LkiwR/cXH84OFdY+v0tAKsL/KOynLGJSarJcjrHANOEx7ijV5U1bzX65tGSy6lStczoYYYYNASJIakkYRqUQgTSRAx7K+tfXT8aCakpAIRFU09YiyyUmCWOaAZWi/+6PYr11fXXWN5Jn52995Hjx59upjcm453i/5r61vrRfczt1/5pVdf7eTZ+cmJaRaSsul4VFXTsiiKvMDJU+q5AeBwyCjzwFoHO6p0jjkQC3FI+XCQ6wzGXgnIrsjis8+/+PD+vXeOHgWGGTQBdb8u+ExJDFNhgjnnJQSktnb8HqxlUWAPU1QodR58wSLAUNjgUioTYABk6oKgNKNMWXtVyK88/+KayD8dnp8TchFsxXjlrLHOw0g2xmgD8ek+gWTJo/chZD+gP0FqgKJx3nofSRuV4dItQAthlA9A3j7uO9BuIQQPbuyMYnQXKKxgMIBKIIrsJ5ywUmpinDd6vyh/7zOv55VplPzOwafHRhMmKHo+0OhCoD7s7e/3Kd21xk+nE2sMIzYSQ6jBGOCEyFO1dkiIi5h8AOwisGXKkQqErrCYCNzaZbQREQQIRpiJgmluofV+pq1vVLvfbYN9RQD3waXRZOt1tTTdbdML4zLMn6EPR1vBWx+q+dc8hAAAgABJREFUQJfQmwRFmYngdp4ujCDLLVYbhALOqwGmEx5aDBGoZmxs9VO6KbloBv1+bzAajcSSHJYOLyUOpvNPL89eH6yvEf6vrl79X342qq0rRM5hERzRgAvovkgg8zHdLsGAGh5gAhA8E5wg+Z6lmwG0fu7AX1GHYG1goLUgkdpUHSmJskb3ad/kIGYLVCwgdUgT5qxJ7zkD4wO4/qAoZzadwhISpCkgm8CE9JE2Pv13MisCshtBF2GMlkqlFy+1hAIInio9LzQILqwNEfRzDXGWps5bcmm9Nak1JpJz7czUu5l3OyrbW1kz1vqqzop80Ola7zqCDjJ5oc3pfGHgpSKU5pxDPGKCaEoor9MFUJQqyrw3QcjLg8fh+Hyom7cOH306nY6McSQ44kvK3nj2+a+/+bnP3nypyzKSlXc6PUrIu+enf/fOT3/3jc+T2UJHt9tbubq6/v7JOck6LgRGBKZ4aJ++CZwanDIeYGoUoDHzxDvTRMyEiRHi0AL47TkIRGJoxobbM5kp71wE5zznfVGWdVUJITbWt6az8fjy3Fk/WFlLZ25eMlVIbbxrTFP74CXj0euL44f1fLK+uZNlHe+jyLtbz9+eT0YfnT2+e3l5Tcrr/V7O5Ky29eWom8nVTrlSFoqnhkp48mIh9vPsdr/7SVO/c3L+8eOTx8fn17Y3r+9s9TpdSoJpKhKCFNy5ICld7/XOxmMbgYEGETsOjAQ7RV5pQ6G7zznL+t3auIUx2lmUOiMrZOrcdOYezqo2zI4QSQks5qEwwJAg+IBGRs7Djj8SdKZ7Um5/HiBOiGK0nxcDJTcGfaPreW0F42Unr2udWsAYn766Q4B/LkUWCJoRQYKNSLWhXjQhOCUzlecmkqPR5O7J+eF4Igh5Mc/fXF9/udvdpKqX5Z1OIYSYN83lbH48nYy0Noy5PJ8G9/FoeKCtWN/c2rrWHay7EL0LlNPxdHhxelQ1M+iQwfNB5qmlkllAS06A/pKDayroCm1Mrel8NumWHWetDz7PygAsoPSoRWadhoBn2sbKAnvD+WiM3ijzh9XssJp3Vzes8akXFsqE1LKBoYHANKlozFP9wQtX9n3dUMk/vLz4n/7lR4NO1zBRE5La8dmw5DQr85V+73e/8a9/+c0v/NM//+PbP337cjbWMRzdP+gOBqsbW1Ip0LBQQwKjHPwDcVZJLU6AuXSp0DgKHHeSQDPXxtA8u3N48N/99//tw+ElBdwhGG+84ZwJqkR6ixiX6ehPzzOkTbsA+T2gAmYhPSFKKspIQHsMBm9VQpBgcCs5iIGcICLGmAkmCM8JWefkyy+8fGNj+91P74yDHvu48LGK2qcfJ4zzYBsJo/w2LJ9zAZl1BANmQHtNqQk4l8EHEtB/KodOSZEKKswjQaHqIZEWloMwB0AXyxAc4TTA/6IxLVphpgICrEDPWGMd9eZXr724KnOvF8fz8SejCctkGx8GxtLO2pXeoNvpFbP5QDfHTWPBg6+VsJJo0z8D2Oy3wfexnQozVO3xGBUoxJc+y4jzcBTVOlzhzhjZ9gGmwC0vtM00WvpgteYUjCuZtyw4svzSFgYjDZAhdIYhBjYtlD4p0Bg7iH0AgGBg56WeAsxbcOyNOeH0SdAhDK3j0qISOCbedwmjRaeilOX5cDRirEXvGCjgSLBNfXPvqqybtZWVDy+Go6ZWQkiOHwPEJxG1CKnk4lEHo6SEoaBjTI+pFAJdaqBzgJA+GnjCncF4Gyn3xMNgw3PGCaPp8HYm8AieciymVs6kh4ZB0DWAtkBbdTW4zuEdT61AOmeBmopJHc7D+Ak+lLaWAoMlRorHCoN8d2MNZIKly+ts6v3ROQ59jXwIlkKKHGBKYDt7Cx54znljTKcorXNzrbNM9vKCGEuczyEljPiolGQxCkJyJUV62xlNVZnI5SA6E6KQ+UTbHx4//M69j8/refqViVsh4ksvvvxf/N43/+QrX7u+tccbbas6avPhwb3v3LtzGcPl8elz61tXr1wxk2me547SHx08tEAxS8U7JOQFvzC0lhGNudLFMN7YEHDq7gOVUnkgqvh0QkYuBJYY8H+IbY4X9OnGWLBRSe2UzNR8XmVZXnS6gonFYh6CL/NOuv4hCiGyLIc2HFLoQSjfNNV0PIzB50VJCWkamxfd7uqmHKwfaX1/dGmC6ee5YEKbMKvqWjcR8+YIUZEWTHQi3VHyqU53XanGmvuj8f3T88rZIs+KopBCAgcytXSZUiQybbRHrT4JkjNgO/kiz7XWkCgYvUugpFSqI2ShRAZuy3z5wj4ppXDqEBNi40PjQ+18bV3jvU5/jRaSLvFS0yWTkoFhWc7FSp5t97vrZb6WZ2v93my+0NZyylb7vaqp07fV9pm93Rz8pdpVCIhnWbo1XHBmnGuMLvKSSXk8W/z04OFHj49No5/Jsq+ub31jb/+1lbVNJleLTqdbeuLP5/P7F8PT6XwSXCP4iLG355MfTyaTztrOsy9vX3mGy9w7tPcLZ2ePT08fW2cgHjk1WyrPhSjAaQF4K+mVbIPwUIgBFnV+NhlzxlSWLRbzstMFlx2ABwEpnyCfxYkvepOkBjcGH/pFdjGvApeiHYdGzlIDnasC4kEj+iyH2eTrL9/81edvuEZf0vDf/O3fvHcxlDI79fbhYuqM2aTZCxtbWaGo5FabQX/l5iuv3nz2OaL15PIyWGtNY5qmzJRSOeLW1lCCEXT54CDwE7i+aN2LkEkGVjPEO84eTidTGiNHX0bCCMYZkQSGnQObKeqtixjHlOCHlEAuAW8kiDAiTBAG9AtOICsuUwp42Z4ySBGGSqJAI5gZ+4X9a7/xyhs20g9PHt0Zj0bR1zFqsMIBq4qAuS/Ib00QmOIGnQdwa8dYdlgW46IXkp0RKRGuVMYBnuJcGmN28DNHShwJbZpfaywM1iOAeh14hZBIOBzIMTU0pDJ6XWTfeu0NURtTqO8d3H2oayYE9PIByFrBWX/16l5fyE1j1WQ8NI1h3MZg4eMYShylDqo1sKARcyLzmIL4KOSMFFhZ0XlnOSh+An+BQ5buLroeYe1fmj+jlezSW6SdNNNUgNt6Hp9U1Sc86NY3i6OJGWblINoFairMdlEtF5dWlunltbDBS9eXLr2jCSVPsHWEYIj0uCdYw+EbuxBXpWwicb1eU9V1U3Eulog9MsEnVbXV7V4tC8mlkfzO0WHkLBNYWbGFaFl8wN4NqHCHASZFWgHjXAMfgVLuQ1zGt0FQPdRI1LgDmSt907A0nBZCoUJLRtpLxZxqXHgEi6JxXLQ7byME7YFlWwTuqwBVQCsVSQgYskQgKZmnztd7GxxjgpAAGnmIiXWpPXQutREyE0jTTo+uFMDoZjT1CFEpRcEp2bN0KKdq52wuFWdyMptTEjcGKzwhLJpLqYSAsa8WjEJAq8tSA5K+kaQJLORSMs4/ODn68cHHZ4upVJI5t5qpX/vMZ//d7//h73zxS7u9gZvO9GxBQrQ+/Me/+uuHJ8eHzj40NYlsMZn1pdzslCL43mDlvYODY10HKdFKDJhAYPApIiriOaewEyUuXR8Bfv2hjT1JJ5RPvTSKKQix6PkS2kELhhnDfB6EOkAjm83GWSazvFR5XlW1s7YA9mObyS6EVJmUKlLiQadBiF8spovFLBJS5h3CmbGeCbWyvcu6g+NF82A2aWIsMqk4t95VVbNoTDr7pGSRiEiKwHqe7nc6NzbXt7JMN83j8fTeyflwUXGpemWpJMTCWJupjFBmnCHonACuxCEQY3zZKbVujA3gw0qcNRIMqwuRfm6hRFfJbpaqcs6ZSI9aOjcx4YfhSb1cEjFAGzL9E5z/OOtJ2c/URqfTz8WgUBu9Ti6ktzrP83lVATWEDnq9qqlM8Eabq9uba70u8y2rQ6XKxOH5R6OlSImwlD+aLn5678EHjw5do1+Q6stbm9+49swba5tbhHUYLfKScjGqFg8vho8uRzPnGi5OOXlrPnlrOp0Vve3nbm3vXWc8i5EAOdzO5rPz88PJZAiZH+lgyFQOaYISTw+VjoIopBCEBoiCJy5gftR8Pm90PRj0J5NxUXSlzHxoHwwIHgUqRWjNhCRw6WFMZULwc61ra8uym+pW9EpJ6JJJWXRgKykwTbJjzZ/+0uf3en1L4v/61o//4d4Bz4qsyO5Nx1Pnt7Li1c2dp1dWet2+yjNC0x331g421m599o1r+/t2NqtGI+fsbDazje50SyGVtQHbR0bSDRVgXtGmHQXvgL3tIGEFCKRRCEm5XJrrpkoG0b8xeMdai4UA0D2irbRkAiEXFxJ5jww8OJElk1AyAbt4cELlYBYM6kQnYurI80j2efbFG7c3u4NH52c/eXj3IrqaksbBZgUlbz79UHgBE4ABo9+2W3SRWLACgSE0cy0bCC0IBfBjueI8tFxCj7kRwTkghhOg71M0MEgfzXssPrRlMBHGUQgLG3ImKhdcM//K8y98dmsvaH1f1999cM9CEAhB8QCJkCBe7m1tD5pmy9rJdLwAyItjZ0OiIREXwKl7QOoQRR8NdCN2jJKSURnRv6adMEX6C9ELIApeksXgNhHfbo/Jk5xBrNNLDMsgD5gStpxLY94C/r9pG9iC340tmczt+BohLTxDsRXjYtyw4MSnFoYiFaVtDOiST4PwnLRxYPh/FBYAqzGIIp8ILgt1ORxCiCdGCkJaPiGuWty8ciXzfqXf/fDkdGy0ZCwDGn1b7aCNbd1vCEXNL/h0o9kLNd6G1DmhnzAhSO0hUYCezEMaJVrvouVYiBF3SJAnSHMutlcGLoSpsQ72KuCoTB2m9IArEBc8fZ82OT3SVjPOpeBA4qWSCwG5myDGB0Iro5KxYF06leHVQoIjzOFCOkTa4HLO0kPBGSxwMI8RDChopNQEr8EDqVumVtubhDzLopPOuFr3ypJYC9GnAmLRaMJYsH6RhHY7ZeXN9z947+HFaZYXwpoixF9+4/N/+ad/9pUv/vpGp2tm89AYGiENQqpv/+gH90ejze3tC9vcmwzr4Pv9waMHj1a7vWvbOzJBW/ujw0Odjoz0dvvUJ3vGhW8NXgiEVnHvHaizuQ2O4jVZNohIT0MbNZygYB4ZtL5MgrMreKVQH8GSXsrFoirKrhB5WZYejlIOpFP0YvU+nWIqzzkX4I/sabrkuprPnLOCi6IoIqTQiqxc2b7CeqsnTX00nlQx8DxTUnrvamOqRjvvMyl7ZdHLVR58Yex+Wd7c27nS61utTyazB+eXp+OJ56w36BdK8hiVkNa7BojHYHAfIHlB1E3TKTtSclNrQkmW5wys9WLwNMbonKQ8S/VYZFx0sqyb5Z0sKzPVzVU/y3uZ6mSiK0WvyNKflepIPiiLflF2cpkL3lOZZFTR2C3L4HxdL7KimC8qAdnyq72edbbR1nm3ubJ6ZX3NWwPxPDBNFEBjgCFYXpaGi49Pz9+59+DTo5Oo9UtF8bW9/a8/9fTrK+v7TJaEFlnGlZo5ezgeHV6OLq2ecn7C6DuT0U+Gw1HR33n2lZ29Z1TWi6E9qCezyXw+m02HTb1I7TjUFyEUZfzJOEuoDBtrQoHgjU79gGJ1unvDwWDQNE0ktNPpkxCgf14GkUAXDku2uLRqlc5aF6yNYdYs0sXnUhvNhORKNkZneWrxBRMcVifeNDfWVv/4858vOP3+gwf/w3e/Y7OSEdpEd7SYGWtvb2x/fv9qJ8R+r5t3OjZ6CbbKYH8dNnZ2br/xxvbm9vDsrJqMjdbzunbGF3kmFXip0tbJCGxIUkEDEbCHYyT17Qq8RCRlzllQNIC1TvBd59cIMwl/MAgzDJwJwWS6VglORGxQ2gCDBIBTFysZWPSnNjaAiXJQkAqKx7hARgijpYtf2Nl789ZnKaPvH9x5f3R56U0D5DcLnQEocRlknlLseDA3JaJKiMPelRIO4SLghCR88LmSksv0gAE0x0kGZGBH9kT6Co0CB0IPCLiBxgWjAhAsIU0NgiAgp80SutBmi/NvvfrZzHgr6Xcf3P20rlPnQZF8nk5i79zeld1BVuwYnc9mF01toaag7sgQTP8lHtc3rI3NxrMK+KJeJvgLv8jPQ/VR5LWsrG30AQnLULKlVxWB3U77VZg09QTtcpXlaK/1C+lG/x/f6Dbnf2mtjLHR0H1EJFktI55AQQe/PKHMgotlutBPyjb8iS9DgrGuItGVUdjqONfrlHUMpNtdVFXdNBxmCICxA+d8uqg2B/2nyk4hxIKxj4+PCGc5pIEseeo4iicYMR3aKHDqgBtgPA5nogOCrHf+yZAvFSGpcikXzoJ1rQyYMQ3DKinYMmcqWOdnRjfgmR4ZAc8PdBlLKE9KQTD6lzN8+oXkoNhL7YbkEnOiAlABOegUGUvgTxB6Jc92uFjPckWJIUFQkSCb5AzSryScK0IICAB28MSTLJPQMoIYHeh8TYzpeHEuoa4YnbYx+kyqMoGhPFOZAGNlwMFUkFhykWfZ48vzH3z4XuV9jyui61vP3viLf/vnX/3aNwZlqaezoDXH39oFQdk7P3vv07Pzs7qy3sdM3b28mJKgtV1fWT89v3xmd3eNi0G//6P790bOGVzAIy9eCGzt00eObbAteDACRcIHxrlv1eqMcREJvrqoSkgdB5BUKVp+ADfSh1ZwZaRSJJJqsZAqY1RIsElJxwA0M7hLhjsCktYsSxff+QACO6PreTX3ISYEJjMKvn1C5t3VLbq6cdqYw8lo2jQs3Y+MReKM0boJwVEWcpX1slJ4n1m7K+RLW5vP7mxFZ4/H0wfD8dnw0kVSdjtFkU7RqmmsdTEhHmGtgbOUatPkUpZZFkOEiXQCCSBIpTAGaAOAwRIodd4C3HMEpRlPx20meJmgYeSQcl9mqaMkzrMYJBzEZZ4LIeeLeSQkz/PZbNbtdE3T9IoOY2xRN5TxbpY9tb0NFH6OquWEyUhITWfZiSq7d3b5g48+uXt4Qox9sSi/un/lG3v7rxSdHSpLsDyWmbSMn0wmj4ejs6aZKnFI/NvT0Q+Hw7O8s/Xsrb39Gyrr+ADrTxpN00wmI2O1ritrmlRa0qtEYDGTznTR2ranQ9E5h2ZD4UneKiUh2PHorMhLzulisVhZWYcMeS6gDyatBIPAigbN8AkEbHlrTWSksToS1i266TFIP11qYOf2yg6NVAnQ8hHCTfVrN5794vM3hovZf/iHvzuoaimVDWHmzNg2eSCf3bmybvxAyrW11byXPiAmwCHJyTnnItl+6unbL7/cKzqnR8eTydg0VQDBcWrBGIMsvbDc8bfaHgqJUhJqKV9m3IEDWnoDpPO/fPXpl1fWjsfDhkQqeKYyCoJcKWQMXkiBWYQEnmrkyfvoBJyNWPjSU5QuMuzaATcXIh1JHS52ZP6vnrmxubl7MRn99ODOQbNoYBDlojcuvb8YNGuBhC2FFJwJyuOSPcsogfcXditwigaYMjKcRlAKyf2tR6EPjnMumYDCQlFdhh6FqFIhbZXB0xwpPgHSQFhgpPbRNIsvPff8L+3sWuseuuY7B3cNSHvaPBJCvHNZnl+9cqVn7Lb1i9FwDpNnQwH70mjBdSo1PBCdEZ7oWwHbQOi2LynNwCoEjKTafC2CvlKkTblIrQddWleC2Sl7Uk7pMo6Q/sJ+iEAe8M/JXC2xC1skKJSo3H0SigSWYO2KGEWPiH7RnKMVOCHvHBsBBv6VpA0Da/nVIFgDojxvPTKiYNQH2iM0l2IsFc/UaDhmjC8vQupeTSC20S/vbHPjVweDO0ePx94JxlQCiZy1mRNk6YhNMCgEzBzA5AFn9ywsL1/7KUBu7HsqzwQfmQaH5z6YVCvBp1UJzOZKH7MGC3NPPHL8cK1EU6OXzkhM/GZcoPNTpIQJSXyqkUhDQ6ttB+HkHL3IOYy+jX91ff0/+93ff/2lW6eHjw5nE5nnsM4hSLSHMTyH7pKgBANlA1AYQT3MmAdtaKBUgy1cJoVizFvX6fSCNoOEjFM7QPGiMd4tirwsPnhw8C/3Pga/eb1RdP+TP/jmN7/5xxvr63Yy8U2NNHUWvbNaRDo6v3z7zkej4EeNdlIOq2bB6Vk9r52RlDUuHD9++Npzz6z3+5PF/J2HD22eoQ8aIczF1g4uQIX11lGMQsSnEqRKLV+B0tZ3JvUuyDvg0NmICKtYjGmDCMWWbGSdy4s8xtBUVZaXsNfDzUmABVv7UrN2TEM4E1KpNpIDiJVVPatgfywztTRwTfCrv7qtBpvDGO9PxpNqIbjIQQGsralr430oCtXvFDlPNb8IYVfJl9bXnlobCErPx9OD0fT++UVtTbcoV/oDoy1wEDznwlhHWcyzTOuGEqJUari0MTTEPFNwLqPuIn1IIQRbxpVAf0mcw9EcJxBJyjiXMGyIJGZcFFkGrPjMuzCZzGSmMiXn80VZFN67TlEyRudVzURqT57Z3yXBAN0ZhrYs/eu8KIhQ9y9HP7hz9937j0JjbpTlb2ztfGVr57X+YJPLnswLpXh6/cSkrh9dDg+rasjIcfQ/Hl9+fzQ8VeXG/o1r129lZRfIYekBsNpMJsOmWRhbwwxYUxQTwqRHEIlDHVwKxla+QSGoEbZuUBcZjdPJJSW07A7Gw8vBYEAIBzomBlHAMBYWP4rLNo4r1bJgrPU0FRJtTJEVigtrHGSI0aqu+t2+EoqicxaE3ZaLyb958/Vn9q/8j9/5zt/f+Vh2u4SS2ruo2OVisZsXb2zubst8pZAb25sqLwByROTNggQ8HTTeNFyqp27cfPHGi4M8Gw3PZpNJVS281VLwhAqZpOCGwVq9BmdwhoEtBifL0Ak80GKMZeRrlHcYFVl2UTcO7ld7SqeD1BPwSMPdHPA9qYB4f05wSYfmIFGAubTiQnAqYsIhGRdlINe7vTdf+kym8juPH/zk8cGMRgfQ0MWEXtDSAXdkS/1pOtosUNNBgwSMMNijRWgrwAYPJ6IUWue4ZCG1qWaIbOH0DsBNoh7UMVDPnoxlOTJqoWKkJ8NGsmjMLmd/+MabhfEkU393//7dquLgTgoPTnrujLFXdnf7eXml0dl8cVlXljFDqA0R0heAfhWZp9SjPzcmPsK7ll7D4ESMJTrBpF+IxzZ/K/0SPrZUJkCcFIEfeD3TNo8Q/m2LkxEqsnbRGyFsrWgFR+mgRF3vcnWLyROA3li7JU6PE22304EttUrgcsme8Ltw32tIG6Pa7psZDsqBQRAhhfqJTUhL+aa5sYO8MyJc9LuLxVw3DXrco6IJVn3znbWVnU7ZY7Th7P2TE8aFAjpfaEngHGA6h94Kc/AoGo+AF6YHhpTwweGtNcGBvTSVgs9MsyCBpFfIYcMgGZOMSsYTMI4BqziDPFEOyFUHxxlRQF/AZOYAgQ3W+YjRtUBkwWu/dOsmgqV3yVjnMMcDaIna2sOL8/cP7t0dXhpYjKeKC7c3y2VI3bTlqfqCet+nBhkrCjBlGG77Q4yW+MCY1oZzmckseMcC4Yx6q3OZFYXKZNbv94WQR+dn//TRuwenRxTcTb/4+hf+/V/+uxs3X3KzqV1UqRf0kXgXraEuEB+E4IeHjyd1ZSIRZe+oqk7qSnW64/msDqFxbqXbm1Y1I/SVa9eu9PpvPXp0akxkggAt08K4HugnuFoJMNgAy/uIunXkNcBCK0QpJcQlhrYBxlFJJBb4dAQddoAsjW52zvlOUYZIag1KUILJomCCCrNtGllgcIZ7NLcgkkslMkgsZYJLEkNdzZt64b1LPwvY7Kga6q9udNZ3pkzenYyOq1lUoptllNCqMdNFbaxVknU7CX9S7WTjd1T5fLd7Y229m/HzSh+MZ3dPz22IeZFnSjBKGt0wzo2zjMVuXmhrvU9YDcjwCatBUjUxmJ3OePDolIejHQoeOgl2hDZQNkTvYgubUifjQefWaF83TadTBue0Nmv9vrOukxeCs+l8kWXK1s3Te9sSlYNQe4VIrQkR8vF49k8ffvKzB4983dwsii9vbv/axvYr3e7VsltSWRRFnisUHJ9MJsfz2aV3D4n7x/Hldy/OzkW+de2FvWs3et1N51OrCs9tGE+H8/ko+qB1VTeL9HBiXBQHCUAAhz3s5UH6DJNwDIsNqcMQysM2yei6rhb9lZX5dAphDB0MW4RINFiSI3qmCVgRGoFqwKCl8YQx7XSMschKTHQQUlZNwyhb6a/QBAZgSgqTlZfK/M9+/dffOrj7H77997YoBOXaOkdDQ8K0mj+/unmNi71Od6tTbu/sRhgbtKWCteQ5IBvHGJzXutvpP33zpdsvvpwzMb44Px+OGt3AiykymbGlGUP0EXf8PP3+MKYFFAvLXB/h2D6fT6chTqNfeEc492BxB2lBQFZiArKViExdPmYWBA41HHwmIEOJEElSzys5wW5eUa4o6xL22v7Tz11/YXI5/O4Hb92vpk2koG1pXa/CckcEdgUwMgdZoOAiwB4vYAgtvH8B+TfpvV/W3dYvNcL6b5kp0C4NCZcM6HVQdqkgEHbmgeiP7BBExPBXoX00uvrqzRff3Nxx1j82zd/fu6vTi0naH0KjcS7Psqf290sbrjbNfHQ5ocBkjMFSyB8krGVdMRooUn/I0hsSkiK9KyhRy6Y8tkJeqCWRx2UoYGj9TVrKZGuhBeLy9q9wK1vREFQKRiIXgIBb7h3ua5coF2P1l6tfqMK0hXFt1BF4YWJ4GIUtS1vzWeqtLAQ/Y5f0c3tLZIWhsqRNc0AmAgagh5yJnPOFFFSp4WiYOkqKc0dosqJvtH5lb5dVZnVz8+PDw5HRsK5Kjzl2UgJITx68eTmEgLb+IbE9khlI4wkTEczMPIiJizy/rBd18OCFDbnChPgYJBVAsgLBXHqTHQBcar0PPjpQLKBfKOR2MWB5pRMzAkh1DklYqTkRktvgUr8LHYEQ4JPuvOCCcrpw7sH56eF0VNHoUslkQsiYTi4WaJCAb/Isg8Y8vQjpfObgcOYjlxyJnbC3aymULoQG3B4445LTPFPe+0zIXq/fePuPH779wzsfVHXVpfy5q0//8R/80dd/8+sF4XoyptbhGDOhU+uiaRhSCRi9GI0PL0cz6y+dfdTUC5L6Bq7kRT214JdXdvtHRyd7/f7zV3aG89m7jx/5ogMrAGTwRuCVSMiJA0thlroRbU1ERzvMyKQ4LvZCqnYXyDHeGRVzGNnN21gvEE+z1rfSF0VprLFWM0K4lFIqMEQLbZI1BnfGAB5kJHW3LeDj4OEHPi0xNk2lm9qaxjuX7qXg3kXCRXdlo1zfmRFx93J4fz7RguVlIRitqno6n1sflJLdTpErxa0T3g+kuL628fLW5k6ZLRp9bzw5Gk0aH1WWg5RIpB4MPnOZFWBCSpx1QFkT1ib4UOTprgWHyjGG7ncJYgDN3jtLKVVQsxPCFYoQn6mcEu6c18aSGAeDrjUm+rA2GHjnZXoaxHS+KMqiqeuru9ulkjQCD4iSsiiikA8n0+/fufvTB498o2/nxdd2d7+8u/dyb7DLxUanm3OeKUWFmDbVyWg0XMwXMT4S9Luji++cnZ/zcvv67atP3yyLPsQKETBpcE01n85G1tTBG2e1NZqBXShshVKrQTCrC6ejQjpE/7GFRCq1Y9Jai4T68WjY7w+MtcaalcGq0UZJFSzmNzNnLXbsmOcIapkEbJx18FJ7bTWTIpcS3GyZJ3FeTTdW1hUX0RMpZGufoOvfvvXis3s7//V//N9OrWMyc5QsFg3P1MLUzMfnB+vbXNzc3V3NssHKCvq3AcbjbfoyxdEXQSf2YH0wTVl2n7318ku3bivG52en0/HIGk0hgEGAB1HwFm5ljJjRIhNMp5DpC9qXyEB/NDNmZrVPmIkG51BqHrDNjeDIDNsE5GpxipvUANZaIcFriNjMOEZtJbjJ0195P4TX9q9v7V45eHzw3uH9KfExfYU3zjEhQltAKcgKHJRJGqLjcLpq0G5AIJITQFZB61sm8AYHjElNfWSAQz+gezBvm0j0HQLcyVhrA4dOK6AiBmUpiHrT6RFZpfV+pr75uV/Kqjpm6v958OBgMYe41TYFP10Ga3e2t1aL7rbRRVVNFrOaMxOCJhi9kMCWSe08hH4nMBDasodqZhgbdBgmr8UnHCjIXGB+iVORMU/i0hum5VDF+PNMIzS2XKoD24k0jKCXq168rviWt35VZEljhprJ2kUxZUv+dVjyqQkGHT8psVjpHJDHGXvyE1tREkYmskiWX5jKuUgomnHnt1Q25Ix3u4vFotENF/wJeZsJMZ3N9lZ6W51uSVmU4mdHR4SrnEFZA9ortHgQfcslGqQybLxasRYkNQASt0BIxrV/iLEKPnV5wOsDrEWQX5iKn2BIxgOki6HThAsICxLMeAvLLdz7BAuC+lZHHX9+jdJTCHcHU1YASQfkp7W0NsGpgrR7sDiDtTLDHlIwSWCXDHcotl0+0Dt5pCG9UURK3nrZxJAp5YLTVgvG0wnrXCdX/bLjGHn/6MH//c/ffnB6TEnc7a1/46tf/4M//NaV3SvNeBy1AUlBwJ2i05oGR6Dp5pQHZz95+Ohkspgx/sFkfOasIcQYW3RL7d1U1w5841yIw9n0s89c3yjytx/cPwGRgQNrMMifTf04E5xCdKgBXhKhQGRLfVJo9yZIrYP5AdZczOyCmX3qdQhfLkEQOy09gHzwZVEYY6Tk1jroeyTHJgpyflrZPCUERWGoh8OFDOMcQ+eBVZ/qhG7qZu6sF4ypTMGiWvVWNgc7e1MqH44mD4bDKfW811GZ0lU9mcwqY4RS3X43leFIeG16zl3vD165cuVKmdfaPJrNz6ezhTZMyASIBSchulaBxnMhrXXWeY6LD0I6RS44M9pAhjryW6IAbo6SSgmsYqk79OnUS1cVXD3SI1eWuW7qTKpup3TGZHlGGVss6v6gN5tM97a3+52CpBaQS6Xysnsyn//g7v137j9qtL5VlF/b3//y1asvyHw7irUs73fK9LQTMq2b09FwOJsuIrlU4vuT8V89enQ/irXrL+09fbPbXdXw85WSPnij68VsbI32zhjdBG+ttThhFkIBbAUdB6z5SWsxRFsPABh+KZVF75xzEKhM55OxVJmQYjqdrK6sG5PKVWxVfi2Dsg39xV0GvnWpkfE+BBedC76QOTJLueTT+TTPi0FnAKwV3ibiObce3De+8Lm/+fEP//HBQ5X6CTL3tnG2zIvL6WRTZc+tbaxEultkVzc3O90+RqO3Vk2EnR48yqRQZZkAKNjfwsMGB4gxnU7/5q1Xbt+6xTm/PDmaD8dWW86pklIB+dwHwKwYlECJT00YOghFJWEiAuHAhFDFBeo+n/AFZPscp2McXAcCGmMhmZQTokACBERVMO4NRFJaCimDv5L3PvfCK5kQb33ywaPZsEqNvXMovAULsdQ9E4y1ociroBEmHKEl0HPEYEiZQbpr28EzXFTjJBW5ZxB6jxGkkQkGARLocRZA/B1gfLJ0gaIYOU8I57XzWi9+5+ZLr21sGeseN/O/OTiwCU+2W+RIGATJyP39q4V113Uzm0ymMVhCQMYCdleYQphKL4XMcnQzRvtH4oEVWzBWpA/m4YNQLMMQINkC1fRzlqO7NquXtORPdNd4kqdEWn4w7EAjA/97pTAxoeV8sZYN3ZKr2qqJUf0EO/Dl7hfoUbEN/UV2F/t5IU8g0kVqIZAIFW7tpYltHgPDFHn4Eo4PCiPM+ZxykquacZrJ8WgIKp122E0Zc8E3unlxbz+vmo2tjY+PT4b1IpNcYY6QACN1aIBw7YqkDUDS6LgCoiBQBra0DvBmC2CWBg8xBQUne3IlCBak9OhTCE9PABr27QlIBTjvcHcWfARiDypqOIpDIIgMyNUQkS05R34XjbCONQ1tmvQ+JMwLkQNo9xMpEKc9B7tm9ISCmU66vEoIQah3nkYiMIOMseg9izFjMWeC+MADzSBcJRgwlVTZxWz8Dz/55x9++LO50fv99d/4lV/7g2/96XO3bgej7Xwh4PyIIagiG5+fHx/cH5QFwckSHOdN3bz14cdzSh9U1cfzmeci0JhqsPVCyElTNd4SGotO93I8FS588eWXRrP5O0fHPhOeRJPeW9QFMUj+TBDUOAMiU4lM+IDXGUZM2KpjwwIQTcBIg7YxtMC0wdwsMIOF/jr9wfkIOf/pXBbaGu+cVBLHmbgi5QJUnm3rw8CeFl4tiKN1zgPZDRxAg2eMGNPUdVXrhtCowLWURtEdrA0296qsvD+Z3j0/m2jDi5xl+aJpRuPJbFFFzlSR97odxXg0rmzM01l5a3d3vSwuF/OhsZO6ntdNnmX9soTyASdYDGWe5zLTusbnz2jNKc2yzHnfGMOFEFJIJdrEFggPiIRoowmIRIAsnz5RR5XWGcVkpyi1rnu9bq2bRd2srgzGo+He9s5KmXtjuZQiz+c+/OzB4x99cjCvmxdU9q+vXvutvf0XVL7m4yCV3l6eZZbGi8X8ZDg6n80bwWd58UE1/z/uHfy0ceVTzz/97O2yu0aocN4pKQkjs/mkWsybRR3B7MnoxjkNg6J0jnAucM6YHod2NMp8Oh4hioTR9IyziKI756x1TinZNLX3ttftjEajfn+AzolUMB+cEBIObVCWt+5jMJtiwqavNgQi/I2zLJI8y0kgXHDjtLZ2Z3ULXEQ5sKIgmEg3r1/Z5kr97z/8YSw7PkHneDEdy1x5H6qqfmZlZb+7oox9eWtrb3tHSJWwPuBfSoJdVOOjEz2fskiKvKBc+gh5f5TDkit1S966ot+/efuVF59/3hpzenxcTSfeahaJUhLlSXjixnTmOMFgWMYZvvgciEsyvSZgm8WId6mCZEKJ9jAUlBCjdRuHDDOiDDJqJGPEQny7hNEd5YrRnLKS0v3uyq1rN+pF9c79jy9sHTgzzkPAWvpwxjtYCwB3g6BDOwgFKZOCE2gLGI2l0depuN7tz2dTKxl6E0kpIG4xIvMHxhKYcOCpwOA/iFEi0QUXW+F7WMofcMVIEvpgvAlh0dRPl70/eP31bFHbIvvbe588qBsmFXgNt+Nia8zu3pXVslx3tj+dDhfzmnEXo6HAfA4RLCdb1lOgIdBlLYQNZfBe0NBhVEbilsPnpfPG0m8SKW1t3n5sUXsryl2G7ZPW1RGrH1naWFIaEgKObdg+aphgBEuf2G3RJ87RuHunTzADpUtvBITKkeKXtsYgRIK02UScWSMKJa21ddsFBYZFFf06ItB5wcB5PZNzQki/N5/NG6MlUFHwQxIhh7PZXq/c7XQKID2+e3joBc/AxBz5ZKmN4uAK2HbDuLMHhBqix1cUotPQqkNhYhW0luCWzMASnTnifPSCkI6QGYcng4D/C/CaI2BpgGxAj4KFHEMONAX7vpZAAIOV5TQBXwMSgyKk793tnSvf+s2v1Yv6bDLiSlKIIZOcF0rm8FtRYBgymtphDqc/aLdStSAQvMEZQTwkKMsZl5Fk6T0lMhVjLkH/FZz98O7H33v3J8eL6W65+pVf+Y2v/f9//6U3P6ek1PN5NBZSYghqBD/86KN33nq7Q/mg201vC4SQiEzVxrx//8FlJPdmsyE0Nc4HS6MNLn1hJmdNpZ1RUCA+evTo2Y3VW09f+8mHH16kV5zjZUfCQLv34amdSn2JVEhWoEibh/IMMvvUImM3iARdbOPQrZy32402bghIEg63XFJKITNCea4yZ6wzBi5P+/1hmZVwOUgXU2uJZBn4fhHWzYAooVtHa3kgTlmr67qp0l0WTIjUMXYGK6sbuzHrP6qrj4eXQ73IylyofKbt+Xg6qxaU0W63U2aKpS6TdAN9tuzc3t1WQj6ejOsYR1XNKS0yZbUucsk4A5uRUGSZBwiQqyyBD+fKohBSamOC85QJDPMghJqEd8HHQ2ZFUYDNQhz0erBJI92ybJp60O9NZ7PG2LW1tcvLiyvbm2vdrof1Ac3UnePzH3x6cDyZPiXk7z117XeuXL3d7fcJ68lsrd8vi0LHcDweHY9GZ9NFw4Qpi7tG/1+PH3x3PCe7T197/tWVjW1QpECvz6ht9GI+q+qZdzY9fM46oxP4hPGp5IyLjACT1S9LZgjB6gYOEY4HGwNyQzqD4VwrsjwEP5/Per3ubDblQsis9N7mhfKwnQStmofAFTQ9aGexYPtGnLd4pjvjlMzQ0pLSOJlPB73VTtGjS8wtpYjB9xjdHfT/5c6dIZr6Mjo1dd3olf7qZDFXlF3t9vJIyaL+4s0X1tbW0pPsghCMU3b64NHZg4dZll+Mx+cnJ+ePD9c3t1Re+uDBXZECEZ5RQax3wfv+xubLr792/dq1ajI5OT5MnYq2mUydk0w9NLAsKQeM7wVoSRQYnuMhBpmHEYTFqesXWNwSsEytC7T+kMBPowDVMGhjPZzyBEOuFOOlSG9jn8s1IZ7fuVJPp+8fHlzahiZ4TLQNBiL9A0bv0hZTGQchaDC/zCUmDUfZ6DfK7n/+K1/8/91+hTSL90fDdL7E9NnBzy5KJQk2+y2LMrUa0C8BpTQ4wEEYTI/mE+lU5yhOJMRTUjkXTfP7t26/MNigId6tJn978CBk+XJqTcDLyOYq29t/qqj1vtGzyXgegqbExqgJAF/KwHyDBXCmCO1YuK1q4HEdckpzGpceSqASTpUqoQiPsmQYQrQrY/jpsHily83tz0ONyDJBGOsxjkO5UCV5koPUhprT5SnXgmX6c24VYy3bOfKWLRHbwXhcqpYYFnskzTAH3EVMI2k/BH0S9BDJ0i4acHTgSHf1fhCpz/NaCKHUaDRCMylE4wy8HfSiunn1KTGf72ys3Rlens7mEsZ3xEeQrXCKLja07TyQxuzRhQkIUR5pkrCDQLdeAbmpEraowTuXYKUQVPBAe5z3uLSohuDtegEzlqHoJthtrQFWEU2vYGz9UqCjB7gPdsQ4uaAkSsbzpv43X/rat/7kL+v54ic/e2sWLLqxQowg55RIqZBVAU1+QqLQqzLc+Auw48u5BAMdCjZpTILVMyNEElII0VM5D+Hy7PTTg4PDycluufLFL3zxt37/my98/vNFXpjZPKSzHjasMVWUEMMPvv/9Dz65Z4y7sr6ujdGNLgGfKZUdHB2+e3BwQdi9+bSBRtXjhJoEMKRVPoSFNda5ftExlDx8fPilV14pYvjBoyMnWEtOhdmDR5DDuGLcOksEPLghSsnBhAnzfsgvMllCm9QVcYkLAV3gZ0l821xCRhjumUL6fUS6Ti6oXKWaC2LfSIkgAogkIbZzfhwcxda7B/iEAWQuqSdmHOgkkG2OHgjBNU3lTEPxi2EhW/ZWepvbNOsczhYfXZyfO6uKLJOiqs3xaDqrF1KwTqEKKVON8mHA5Ssr61e6vUfz2dQ5bd1GQsp5o40LsdspOOVNo4VgUiT8IZVkjC7qmnOWZxLW5FymaxLQOqpT5h3w/bfGCcGFFOPJxDpX5FnwrjfoXg5HMbLNjdXRaLS1tr7W7zrrhFRWyp/cffDR8WkM4bc2Nv78xktvrG6uRFYQ3usUWZ7Vzp1MJg8vhpfVoiYklMWBN399cvQPFxdmbe+pF15d27oamXQQUpMpWTfVZHQ5n098cBRs/a01zhnvIZ4DgQEMmwmhQAWAUIFUhxy65gBYg6hoPKET1INNKqOz2URmMjhnrO73V2utc5W3LnwwroT5dUAPLGBdpSNIKWmchi1Tglbee9RbU84W9ZxQvrG6JVO/zTFyglNCm2agxPl8djybESlJTKft6WTYLTtSiOlitlF2nhoMmPF7K4Mvv3qLMuZskJlaaP3ehx9OxtP+ysrlYv7p0elYN9Vs5ieT/mAl6w/AoJFBWhEYK9L0wnuro7Xru/ufee31jdX1+cXF+dmp0bWMXhEeCAQ5u/R2KPBS51Dw0nUK0cPcrl3kMaLSM9ZmMIh0OjmRzmrKUwELAtiMOG4ES4BUvyXhIsaC8x5j61ztdgbXtnYn09HD2WhBggmhsjpAfhN4eKHDIAkwcGaCAnmQp67FexT1v5Ln//7L33ju5dfDovr06P4748ugMkxWIQAPuHNhPifQejO0uwbOR5u8ifNbaL/B6JdCywsG2DDDbEKomub5wcofvfoqn2tTln99570HxjAhl2Ph9LwY2+xdudIvuxvars8mF1VtGDchNiS6iNlHzBGoUCACDq1f5JOxsmcxlEADjsvBdOvKTNt0vfbHQVo6qqpapnMrtKWtlBidGTEnqN1SQHgkoVyAFSUHyna7MsZpcot7Ww1Mu0YGEnhLfKZPRDwYOwOGnoBHlovndoBiY2vK0bpwLOnZtD1jwbkLWX+wZmc0Ruf6WdFEQnq9+XzRQOAMik/gLZWjRb3ZKa92S0lF1um8/+iBYUxxiM+jqB4CP2FgdnCBe6Z0cIMajZLlZJhxWPjD1gYEHYEEoE9zeIBDFIT2pCy86zKawb3wIVi0mASaMyr/0DQuUFhjuCABeVprlZKtqTqlQjBkmnAYTzNKrK7f+eEP/+p73x16QyGPjNEouaA0WONgn+MyaAhIJAJm1xzawdS3Og8EisgjyYWgIRSAd0WMitCCS2l9Nbo8fvRwfHnSVfmbn/vlb/zeN2+8+UaWK1PNgm74kupHIhVSTCeT733ne66pu1tbJxeXWyv9e+cXl5fDp3Z3oB9jnxwd3j05HWXqcV1DCubS0iREC2OiTMlKNyYE59xav380mdaTya+9/sZH9+4f6yoKQVudTHvzIYSQGmetdUqq6FFLxyzMhEFLna4oGOlInPrA4gJNzgkmkWHyASQZMoh/9rTVHSNyRiMuRlrr5HSngJjGcFTEwBCmZcrwNtgDHYXwe4BRWnswhBCBm0ycNU210E1NGc2yDGjbpCz7/fWtmJWH0+mnw4tRCHm3Uyoxn1dHw9G0bjq9TpHnilERSaibK93Oer//9ulpHUMvk4JGKRWnYTZfEMa73dLqxkLqsDU6BtrtdJ3VxpgsyxPaignoF0UmuGhqbWy6CWBJyCeTSacsBr0BJ6Qsy/OLS8nFxvrqeDTaWl1ZHwycdVyIINWP7tx9NByvUvrHe1d/55kbG5Fw43Ipy25pCHl4eXn//OKyqiylPs8eBP/ts9N/vhzO+pu7N17Z3L1OqEzoKoFO6hBkTMfeOQ47d+u1NnqZ/BMluH2B0SRYCOO6xgcoz2ABC4RoJmREN03gMEeQ8yghTVM7qzMlp7Npv9fXxkilUvmGcCdwYoI5IhxyuBQnnuRFQRmpqkU74w9OAL2RgrVFrevNta1M5GDuEIWAIZqzpRCckovF3HOOQppRs1hos7ayumgW3vmdTm8gFGuqW1d2b1+75o0XXI2s/T//+Z88E6rf+87R0Q8PD3d2d1ytCUR3T87OO0XR6a8E1ibYIAp/kneX/svo965ff/n2q92ymF2ejS8uFlVltRGM9jqdVDJh2QQADLAhUJoZg6uKEhnGonNAawX6BM7ggmMJK1OFVzlEAfg3Uxn48tuM0ZLx9SxfpXynt7KxuuGCPRienumq9kHDYIkxDilFxIJTLM6BFMQ7orIGjDKZcP7W5uZ+b/Duh+/+z2//+G8fP5gpDho0ePU4y6r6RR//4nOfW83VhxfnEY5KdG0AEQ6uf1u5BxzgAee2jPLICBDvA7f69175zPPFKqXhveno2w8ekDxvOcBQCK01eVZc3d/rNfWOs83ochq8JlSn0ksdxR1wdASSJCgJS4Ei/gNW6bEgJKcoY4WhMcwnCVkyeVq7DBAAhTZBcGl71bpeYyGNOFdrN8sU+dL4y3IhVFtsY5tJ+IR1RVr3yGUcEhputCTquAwObjnOIGFrDZyXqUvw1YwZ9EWBUxABM8YQLf8Ew2cK2hIaOMjgXAxrkYg8nyrJpBiPRqBRpEtFE7WM1NPJzf090Zid1cH96eTRdC65KDhfmsXS1gkbJBqc8tZaBYE/mJlBHWxXaOBLDgKf4DDpjLQs2ZAz1hdyhYuNLIsxNBDGQdCrDPa5IL2P6bRg6IqdzowIgJ4BHobmOi4p3wwJYYSL0XR0Pp+4IguSIbnAgx8F0BmJQiMOWHxC7hMRlHAQBmYcqeOMOs9JVMAy4tELEjP6/zL1ns+6ZeWd2Mo7vPHEe++5oW9nmqa7ASGNEGKwQAghjUZge8oul6o8rrJd/uCv/mB/9B/ksiXVDEKj0SABQuomNNDhdrr55DfvuKJrPc96T9N0PNz7nn32XvuJv8DHMgtte/rgweX5Y6L959/4rT/57n/96m/9jhSir2tiHXNOEArWmt4RIrN8uV79p+//bSEFG43+6f4DJ/izOzvHi+VkONotyviTCfXLp48fzJdPtb4A63hwC/A+eAt9PYxHeJ7ldde0ILs4me7ce/Do+s7u60dHP75/X0uJ40SoD7F2Dw4eljFacDA/tp6DrBU0Mg5FPaHiTkrKeG5BOtQj2BvQiAx8qIngQkhhDSq5MriTFKxVHBMCoNAkUxloTHkhlFDcO2etBUoxwy07kkBAvyU2cOgTnjgEgAdMai+xgTNNs9a2z4QaDIaYxCfT3enutU6ok/Xm8fyiZ2y0M82UXK43x5ezXttxWYxjMOUZCdOyPKs395t2kGVHe7u6bSihw+GQ+LCpqsFwUBQF9aHIskBo3/eZUkwwo40HmSESaNu2uusIpcPBIMuyXpu2bafjkcyksUZl+Xy+GJTFwd7uer3cm0x2xkNje8aYKIpfPnj8yeVsh5L//pnn/vW1m0PrMsoHowFR8my9/uj0/HxTaUq6Mn/ozA8vTn9yfrkY7e2/9Ma1o+e5KK0jCq7HObucXVTV2ugOsOQAhXTWGO2CY4CbQ6QrwYVTfK7WGgOzVRu2wQzHs5zFHp5vqx+a3ilft1UGQiKDwchoK0UGHGZY28OOkqCkAOx4kI+blaXKsqbZOGdA2THW5QCfiO1jVW+Gg9F0vEewBIcpHfeEO5txtu663lvCmQ2+9/5isxgPRlmWres65/KgGGSeDnX/7S998dp4h7iwCe77b735dLkeTqdvnZ1876MPH/XtyWJWjiZZnjvd+76fHR+PxqPh3i6mFPRzxYWU4LC3dc7oPlfq7mc+++rnPs8YX5yd2C4+Ymv1QKlMCAciRzw1MVSmbRhAX0E4SMRWhPO0eXPI8eQUSbUxqEmGrqwx6mScF1LklA4pH3I1dP7OjRuHRzdPj58+WswWujcgKGGsdbCl7631ILHgfVKqw+kx8T6DnDnK8k1d/fyTj/7p4Scfu25Z5BZND2PTz3jX/t5k8n/8z//7b/+rL598/P6PT46DkonSihQgRO4AI83Dmg0NCXzS5SGdD1Xbvbq3/91XXw9t3yn5H95756klLJZ39MoYRxt9++atcTG41vXjujqtKs2YidGbGMi+mIDBRR8QEyx5CW6txy0LpORU+k+7X9QUIlvEUxLCSi58DuG0KMoBhX24Es8AcH8CYiEgGEINC4FwoXKwwAxku4yln6puID55K26ZQMtbr8BkFZ621leJO6Q0s0U+w/tjcPKE3CV6JRayhVal9I4xFlthKqwZFmUbYkBqmqbrYhNMtoWD4GzddOOyfH405M6Vk51f33+gOc2x94Se34B3FULMYI0HRW7sJ3m8vyD5CMideD2Sw+gTZtU0rYpxKhDDfyHlmLG75Yh72xKv4RMNoKax6oCFLJD3CYuH1cfAESMEtFIUZG8RXR6TQSJWBc4FU5lP9qBUKMVBUISj/4X3mYyZVRCK8yIlmGBcBsYDSFRaKyjLYs3reAilkCOVU2PnxycnDx+Yvnnl+Ve+9W+/+4Uv/16Wl7ppiLUcCcvOJhJ8sEpmy83mr//Df8wGIzIa/PCjT359OculfGk6Xfedd/bO4fVSFp21P/r43tyH47ZfAe04PlbnHI3h0znQ3w5UxNtPWt232hZSyMHgo4/uf/X11xZ1/Xgxt5LjyQOWNkQFQqTgxlrrrZQSASdZnmVF7n0AEhciD9CKHojECG1DmQ7GbNppkKt5EKEMpIUC2fpSg54u8rQR6iwZIMu899iW9brHjQnS+Fis65Fo4XAZibbFII3CkaYCg25LGXHGNE3V655zlhclGCCy6XRvMt3fBPpwtTpZLoSSu9Mdb8lsueq03hsOhdOFlN5YQv1Hq/Wi6w/H43GWMcr6puGU5UWxXG503+dZ5gCBb6wz1jDKMiFRBSB4nylZllmZxR6ubTvn/d7eHqGhrirOeN82O5PxdDLcLJc7051hmYMGJ5N5/nSxeuv+owEh/+2tO78/PRgLkUlZ5Jnl7IOTp/fPLypKTVkee/PD0+N/Xq2Xo/3rL3/+8OZzSg3iWZWKc2qNXsxnq/nM2h4JuwGBuDAbd9alAV5IUBoYADn8AxDrfguQRf4jFVJCoEvbKTD/YVKKuq6EYE3bZpnCo6vyAj6fgYi4S4wDsJFmMGgpykFWlFp3uqsdsGhA4JByqbjgfdeSQHd3rzHPBJcSvpFiPFidCar7vrKagDcDYXxZb3pr9kY7ne6ddTtZuatkKeXzk+HXXnxZciHK8ns/fevB5Ww4njysqr9//MDnmczyjacPZrPZejWejMvBoOB8fXoiOBsf7FswM2A+wWl8osqhJ6k1vS4Goxdef+2Vl18O1p2enPR15Y0hlmRSZpmEojfk8cIFAS1mwalgVMWz7iQjnDPvYoUsGDjLE/QL9ELwYGPCziRXjDFtdvJ8LFVBWBbIbp7fPLyRD0Z1s3m8mq16qynRICpkYNOunSWBonQ5HkEF2GxMGLkQ4yJviFty2pV5F2OY50KCi5GLT83Y/+UP/uDZV9743ve////85IebcuDIlncE5wdBZ5xBoEByBMyiYhfKiCW0tT5z+r/54peeVQXl5Ofz2Y8ePSFljkICia1qTFGWz9y8UTb9Deeay8u5B+CVJ4Z4TYgGOQsTyxMQ36BXtF00sQzO2ZyQgiX0EDBXoIODUsdvIWhbC4IEVfefzs/pNrsxhDYnvWb4HNyfo9IHl6pALCLdWgVf/UG3gpgwIUnuDLiCwz3ylWhlUrek6VvBMBqlQMB6j7I+aWEBwYekBp4i0hinRiQpb0GpTDnIZA8JKaRaCMmzbDGfkbT5T59qOKnX61ePbijnrw1G87a9d3nJhChiqsMBl08TegDTOPhP6HdhrIGoV6CisUBADz3hQRCrJvBi4bWw1knn75TF3em07btZrI5Bmw3mzzFPcA76WfhUkvK7oMkFFmuXbau81eBEIBWiTkhyeEENb+ZhUwKYBEEDuHUS6rwAH2XmPCNBgKcFDyQTTBFaciFC2FzOH3380Wp9cfPg6I++/adf+ca3xnt7pmmC0QwH2QDs8UlTyMu8WK/Wf/N3f6eZOG67//Lg4akxPpO581965u5Gd9Vq/cpzLyjKK93940cfLDh72nYtTPm3+woCO10cCMe2Q8WEQVrb1307Hgwdocfnsy+/9OK9x49rLmFSAxxNvDk+HXutOyFip2QByillJmVOCLXeEhg1AwodB5NbQB9A/uFuE0HFleCpAO1++F0Jegezuvj+cB47NAcQawjHznib5zmlpNOagBUMvCqcAwaIgaAPlAp4BTBDZUmmCTgJOHBxfVf3XRMIKYohcN+5zAeTyc5gMp13/Qezi0rrazvTQsjFckOdvXPtmsItZaA1ox+sVsMiGynprR2Ug16bvut2pmPCeV3VBHZ7eaawOIexDWOE5SrLJAccm++05lIMB0XTtnXVDPJyKNX+dJoXsq7r6WhU5Ao8ZLhgXAvxk3sftcb+8cHBN2/cHFMxyvMsV+u+f+/pk6dV5ctyycMPz09+OJtX04Nbz79x685nZFZQJuFn497Zar1azM77rhGgAInDQ2M63fdgGenTPi2GA5C2xqQb/2l8qm4dRdo6mtnhrAjCLqiRCphXx8cEIlYaAI7UOqeKHGV2QJ/EYaTb2ojH6FiUoywfBOv7tjG2600PdBhY8TLhg2uaem/3Wq4GMD4FVT5Oqbci5nJX9a3fSvh2rp83m0E2yFXW9YZ7v5sPx1yYavPFoxu/c/s2EfLND9//2Uf3h9Npy9g/Pn7YCR4rPEMAdsDWwT9eb9ZNPR2PdieT5vJSST463PcudUnYQQJMLxbgIAongM+oB7u7L73xheeff45rfXZ8MlvOAnESpK8EFwqsfx3Q5GiSKUUDCuaC5fAPkpSVIDv4IAGhmcUbGYrAxlzulvmACddrTqnw7mCym2flw9PHT6rFxpvOOeM8eFVyC077IEUXG4/4IKQgNAhsESkFIyQngeBOwPzGoRR1QifFUnh2evb3f//979/71WmRG4A0I34YpJRCAHvbAJSfpB8QQlKkoKzxoenaL984+vZLnwmt7iX/y3vvnxOKNrI07Y6IMebO7VtDlR21jarr83pjONM+GBI0oRb4uzZ4C7cnMNzNptbW0+CAPjtgQYIhFXouYXpHbCjBKI5W7RTbdOiYcPFL01YBZ8iBXjn3x+/kIdynlTCAsLItIzcJnm3ZueTTqTjbsoDZVeuKcKiUtfmnZg8gfc6we0aNb4r2BtajwiCsS0HVg23FERCQhawB/ASEQ0utdwblmhA2Kpqua5seLGHSkeWcb+q6zLKX9vZp3UxvXP/1wwcb63IwE4bNLlpvQBkD3S2PvaWDnTeD6MqMjS+aENyCIwqyD5GIjVmKc2ahvBaMjAT//OGN3Tw/Xa+MVBrChBBptIPAdBRzgE6WwMYkNq8g+4V7X4YNHOdbTxvQcQuwvEFrCqAfxDIMJs8eYVnMx0eN9D6wuxEKqM8yvkusZNLW1eMHnxxfPh4K9bWvfOOP/+w71+7cNV1ngYSA+jqx+0ELTXhcMlfruvr5T39WEfqr+fzN84tVCDLL+uBVb187PGjaencwOBxOFBVP57OfHh8/MvbCaC94fLFYkmZFHa7OaRx8BBLyvLDONFY3fTud7sxXq52sLIeTh+fnLM8I1BhAnEDiJgGQlHYkKLA7jWcHrgTvk9EGbq1PviAgQ4liMAFwAyEVfmCBBeSvmA88SMUzIoUEKjJS3mDWx5m1BuQ4BLD7aFEMoKQIFnXtKQ3QPmC9F9tfkRALMNGJvXO8j5ijka4buxDbNrXuu7zIlMohbctyMB7v7DvvH84vZn1ztH9YhnA2X0zLfH9Q2k4zkGN7f7GorLm1txdcqJomUzJX2aqqhBCDsggu9NpwTjIhcyVhQQmicoA6kwwaOB6vSPea+HBtdzodDcs8FyD5meeZgGGMhGOpivKTy/kHJ+c3hfj2zVt3VMEJ8dwvTHfv5Oyyb/lk/Mu6+t6TR/Nscvulz9+883I+GOMOK8+UMWY5P1/OY+ql1KvYc4H5Lqd91+i+x0rPB/DXY7CJhbsaAhB5fbI4gwIcyHuEZDKTQsLd5RT0KKSSgNjyINbde2+t0VxlxpiszAMlknBg49st1yEk69ZAy2JQDifQCpqmrbVpda8F9HscZFVgjj2cjHappyA4jxgCwpzJGGv7vo/hitngqGCLemO8mxQT43Sv+xzUSEQIu4F84zOv3N7defv+Jz+69z5XBcnyn548fdK3QKsDGxjkiUlBOb9ou4+Wsza4o+k073qibTmZEsF8sDE+WQ/SGR48s7eSRoQ4a7w1OzeOPvPGF47u3O5Xi5MnT5eb2NNnMLJEvgaKy4pAlESpufhuAJQzQOkeOCUStikQZMDa1pMbRXl3Z5c61+t+qMpcCu5IkeV1vXk0OzuuVz1YU0qlTPCt7S0NcMqCiMWRcHDfvPMoYa24QBa2kLGK1Ug2YBwaFcMEgh/Jk6Y5ttoMhz0lBsxhwR4+EEZ8SPbuDiQAt7JQWF9xQ2il9TiQv/jdrxw6GrL8J+cn//L0acgLzLsQS2L7OxoOnjm6mbf6SNv17GxNiQXCpKHMEG9h6Wtg+oBFeupOEfQUz5TPKCkA4+a3reYVKwi8ihkWNY6ivRt0AigNDGkZt6BJrnK7LE4sX3q17AUVB66KRN69ohZt//PKzSHNmZOYBWzKE8kJoKQs6celjighoLfWg8TjLzbQ7FPQeNt+YoJPk+T2H0CtJRGMEVyTMzqScsEFL4rFbE7R04QmqLXjYr5cvnp0rQh8IJQj7J3T0wAODQI9D7FHimVZgGlkjLYc7Bs4bJi01g7mnAxbJVBxl1ISEC8ljDkLuz8JfmGWjAn57I3ruu3P6lrHxplrh7sJAiJU1FgDm+U0SoidVrphXnEB8+dYuGCRJYFhHiM16FmCSCcRlCvBqHOFBFaSj/+XIPF8c+fjm8NjLCHecR9GUrmuvnzy+OLpI279Fz7/29/57r/7zOtvMOt00yD3ACrWgEUlAg6DD1LJ04uLn/7i7RPnfvL0+KOqMllGGHo/sCL4F0cDo/XeZFISMRlNPpqf/3px8cj0qyQlh1wy0EqlIHIQ0JNKetC/L/Ki011tTdt3Ozu7Ty7m10ejVrdLFziToAbOMXnDqxazsIX6QICSNry8jEsFTRGPnWpwNOmopn4U6zePiwaossCN09Fk0IXenODiLQSuzUBb00opsBbkyXUVNdKYlIpRao01RlMBggKBORAaAzMWAWsqn94kGHt755Etg3tqRkPb1k29RvY26tZyqnZ3D6wPx/Pzi3p1tL/PrV8vZ3euXysBF+28+6RtnzbNZFBKSqXkddc2xuQx9VqtTaaKosiw2uUiRlvJOUqqFXkObhPWGccpHeT57ng0zDOMZmD5x6TgnFDFJYPRhRXyzQ8+arT5/eH4lcFwJFU5HpxtVh8+PbGC6sHwR/PLfzg/2b37uedeer0cTGMkZxx9slfL2Xx21jU1IV6qRAyjjDhn2mptjOZpT+Q5Yy54bXtvjfU29XogBs5o/CFwZhyPPCOSK1jZC2ytYIjiOBOMUmNaxkLb1HmRd30vYQwQQP8cvT4ZdHtJBz7QcjAaTafG2GBt21XG9Fp3IYRM5pAbJAyfycHeNeQ7qVggc8Uos1oQ1/ZdE19OCuKXouqbdd8UMstVBhZoYZoXY5kRYz47Gn7r9dcao7/3s5+TLFfF4IPl6r3lgirJUjnt6ZVJjI+HsKfk0Wx27/RU5PmEBVE3ajBiQgao+by1MJNHmh6I7gEqjXpv2yZoc3Dz5utf+tL1a9eXs4vF6fmmqpwzuRCFlMQHgQhC0JrnLEV81ByCmpKjyiYFUMuuULeK4a3xxFu7rhtCGNZ1gtJCys70C92d913lYtzsrQW6FAEpUKdUJpjojMYdPiAfg7Y23kJnLPHGIRMntjcaJiGgwAMLI0sc41YIg06xmEY4zjw4vAoeNbCQt2zTjpB6ShvnOt1+64UXvnr3Bdt2a+b+3/ffW4NLdKrAUNnDujvP3BkLeb1tabWeN3XPmfHBBKoJ1YFaSkxM+eB9hMjnQK8kMV2Mk8D99VA7QqEPCy2gKmFjmiSdaIKnoMg/2YKKE0yL/Mag+EoPa4ujxg1ZLM5UQdG7C2Xg2Ke2UAnbhpPpsO12tgtbtnUKT1LaW5MlBIpd7YbhHMZjZEBpITkfUfobl5gMLxALjRLYyVCf0qDNYV6uGCdl3pmuaWpkl+PUgklRdw2x5pVbt/imObh+eO/0bNbUuYqFoLMWhMwDNAo4yvAA2CHojg+ZVVhrnbW5VBCmcDIPcKrU54ARO+pncuGtOcqKl28cnSxml73pHeDiUaEK3GNAv4bBrBv/zonzmCvAYy6NqHHsAvqjIIULExAJGgqSMkVCLiSCujMwoGWgDVkKAZNnn1FaCB50vzg9uXj4IHTtZ15+5U++893f/v2vZZnqq5rFLLV1LgdEH+A7CUhReamyi8Xy7/75J0+1+cmTpw/7LmQ5mkThgSqD/ey1A0ro5Wx+8/D6cFC+/eThvfXy2JqGokxI4ne54PHtorH4sASgFgivy7Os6drOmU73ajgIfXftYP9ssfSQmaARIrAsT3bcMYs4K4TCjGysVVkOTG8OYpCWXOmqIJ6QovZR2Eq60wSuBlUsIQXq6SNIE0AAaCMaf7sE/RmS+JTOGk1j6mckMJUplNlDDyVYmsaX1RiD6NkYlFiamoEVNOrugww5TJ+DtZtq1bdtXhSwGSCEyul4WjXV5WbWaffC3k5fN6WUh6Oh6zvJ5bFz765Ww7LYGw68MSLLmJR12zLG8zwzug/OCS7yTKEZGeexSiuLMmYh6zi4Ae6OBtNxmYORLQIdeez4mAQqDsAdqVLqZF2/8+h4SskfXbtxXeaxLlHsk/PLoIQbDH94dvrj+ez2i1+4deslSpVUSqrMB7ecXyzn53W9Dt5KJiTwUPFF1rpr6jVO4KxzwVvwN7EaINBbJYEtziSxDj1NC32KMrKgoAxCSAILHYjXRhMWmrpSmbLWKqDgx4yLRhRYCSYtHeJcKIfj6XTXwuBT617r1pjW6F5JJYRkIpbgTdtcOzxSqkAVz9jMsRgsuDd9r2tjoJUBQ9LgVvWakDApRyj5xAnZH46kp6X1X7l1dHN35+9++fYq3vziWJufnh0bJWngCcIJjHYsV7FeDYEyma1ouPf06ayuiPWltaM8F3lhwZrQA6YCGQIwuosVHjqTUBds23ofjp599rd/+3fHo/Hl6Uk1vwCJMMsFy6QCsroDLJS7ehnioSWEAeQqD2zgyTPD4Wf2Dm6OpsG6um9d8BKU7bXzxJobu7vny+Vl321oWMAEX8dahI6KQoCmtY31CemNgWIrJlecXYbgB0WuhOp8fPQs9gsBbP6Jg3Ng4yvMAECNWQ+p/BQVowxIa8UXChyCQ+ImefRu74Oven1Nqf/xd786bLXP8394/ODty0uWZ1vXNGATGTOZjG9dP8qb7lbfzlbzKlAbgo7Zl0ATHBD8HK+KEZcg3EnkEVjILqO0ZCgZD7tU6Mrwp0BiZEDOUnIwCiRJU6E4FkXiOgVYcsqXW9ufLSsJxbIp9hh5CmZk6+1LrjAtW0mPKwMl1Hajn26J2bbZ42TLomK/4baUtC3JdqMOU92twU34TRDWVmMaLhy5SUkBgQcyyNSGEjEYLeeLkK5iq3kpxNlqdXd350ApSWL0/NXTY0dpJpjcKqHHAjBWfqCXlk4MjT0K4ItjhILRVCw/WTJPvFIZkYIhg4ISor01zpWUvbC7P83yB4t5LOVAzxLgmqDSAjKSiiuO6M1AEqmXI8fFoxYZB9AzyFd53OjweFTBwogyTkghZTAGl/dd11tjJKEDIQZCxvbX2Go2O3/4UFfrl5974dvf+e7vfv2bo51dXdfBAaYXlouxoHBAlE9nHjwVVPbk8uInv37nqQs/evpkEQjNMmONCwTMAUNMeUa/tH8Ixgb6xnR3MCjefHD/V8vVubMOjGvgeKV1CGHceBsSNw5kvwCYwBi33vVGty6eealySWK1vugbNEJGaW5oeuIDteBEDrQfgRhz3esMMge47gvdmxS4EfMAkwV4gsnzEYUCkpQhzIsBLUJ9kkQB5CFLWyUO9so+zXED5xLQs8I5n+WSU25i99QDw8sDit73fZ9JBdhsh51Kou0TSgUUCpwnp20wVq+qjXNOKcEot56OxuPlajFvFlMhd7KimV8eTiZFlm2qehnCe/NZ5/3+IAeGMe3bHjqYICgplWIsJkMOOTV26oxqY/reWOcUE8Oi2BkPBirjjIINVCyJRTziVElQkUZ5PEJ4lr33+OnFqnptOPjicDTiimby/sX5ZdXm49G/LBc/uDzfP3rh5q2XGFP49rfN+uL8dLNaWN0JiTQ+hs7vJISm3ljd+yQcaJyzwAyyoPtGYJuUoCmIa6VogQabAgGyXigCTyiz3mUyAzY7BY0O473v2k7Gh2KUVATYMADzirU1cMpTy2htyMvRdHcPfMp8/ERn2majdeuDL4oCvi+r6vXuzn5RjmD+pJRQMeZ7Q22vra517zD0A+RnXi17bwuRlyoHC2k3FNkoK5ixt/Lsd196+elyce/iclAOK8Z+8uTJMl62vBJgQCNUWIugy1EAulTMiCHP76/WH5+eSeJz6wZC5sOBg5VGX9VB90Sb4OIrwzi3gHtKc0NvXdcHwp956eUvfum3RmV5dnK8mF1o3UMi4RKn/ph6KVUg05ozVlK2q9StwfBWWd6dTCdCGtO3sTg2cHOII7Rru+uT6XQwWPTtpekvutpQ2mobwIm5FGKoVC4lYUw7Q7esP1irA4AcGB+Css5qqDy8yqSIbXF8yRApxxgRIi3BhBRQgntKqGMx+ID1DBPI9gxg/QC/1lFWW6dt/53Pvv6Fw5u+0yfe/OW9e/HlRAIGAKaB/+yfuXt3RNi1XrPVatY2HaMGWL+WkJ4SywI49VFHAEkKGYdsvQXjxXg/5EQCYg2VBiDdJshLuHIcQpcjn8CCfusFSK+MBelVvwsEJlQIob/Z34JepFAFzhNh+ru9pCttDqSpoXLzFtyFEh5btjFDb2DstLcsqYTq+vSLAN6ylBn4fEBCAV2P063Bw1Uix5y+RZ7F2tRcE6xl0g6G1tn1ZiOgwE+baso6Z/u6+dzdZ/lmc2P/4OP16vFyrrjMBJB5QV8LZqto9+JByhGcqyHVYYkCyunMAkyAocNQcmKMsUUkpzzaA4yEd/3rRzd73V82dR+4dpYzKvmWZgUCVYzy4CwjVHAavBUEbDNpMgnHSi/mac5lTBzxB5eMKUqgAyaSxmQCSHxQEHBhZzgohfBtuzg/O33ypF4tnr/zzJ/8+Xd+/4/+eHJ43Zje6o6hWiqIqAX4k3lKwaEEkMeESXHvyfHfvPXWI2/fPDmpKONCOUfAsAhUvQTobhmzn5XLxWJYFHuZGo2G//jJx+901QbMPHFbnRD/sekJ1ntAS8XcJgVHPSTiiJKyN10IpDY6ECoBYtjZGKTRGIptUfYJCwrtNOBhwXrBxl4qyws4YzFcW2sICRymw9gkwSiBhSSM7WkirMdmIoBSN93WuDwtZ6AAdY5yoRRgeaChxIqBA4IaeelobGGtsVoTQqRSztped1wk0RLvPWJWAUdCwC6Lo1Im0kCcNV1Tad2XwxFlXGUZCW65uDTO3hkNSFWVRXG0sxsLLBo+XC3PtLm2MyUk6FYrKQGDRHIpOQheC849IX0fG7XeOOecYGxYljvDclTmPAnt4suEOrtUgK9vSKo0QSipCfv5vY8K67+xv3+k1CjPnVL3Ly/lcHQS3N88ecTK/eef+5xSQ8iRYbm4nJ2feKORbCpQdhhSsO77ql45q4HVhRadFp5Lgq7DhYATLW6XoPuNB1QIBGOy5KEBfzEmVQYDOYbjEJDhbENsVDjsCDHUOus0dFw0IZhiiCBKFZOdfej0vDWGM9p2m163WndC5QIS7WazyovB3v4htJcM7ioNVhPTG91VfU8E4mg8l3zdVbXuGKHj4YSm0VHYLYaSkCFjr+zvN037aDZjKvNS/svxyZkxVCqA+jKkWnk8E1vyB+oXAhUe5rFSVpS+c3qxvFwUXTcQcjiZUMECpe1qTXsTOlM3FQk+VyVEi602EmXBGds3WVE+88qrn3np5UKw0+Pj2WJlrBaCSi6pCxklJRclFwWlYyluleM7ef7C3t44V13bNp22NHTGaIsCzrGoKZSaDgbrarPsu5XtG2O5zHBEqySQLwgdFLm1GgFTIPsFCRXaLiGUtha08CTYLQTQl3VgJOzBjwHrairALSoZHIMLiAG4FiGOOmeqDYv3R2z9FFjjbNW3z46n//53vkzXrR1m/+nj995db3imPPpcQnfYG72/u3d0eG2wqY665my1bED3Ciz3Uw52hFvw/QOZ/yTiiFIXMfZYnzFSpok2S+0soo9pcjW6ckNIGgrQtodtTkTM9JYGtHUfTEC4cNWXhm0WBhoSpVcTZhTDQsVs3KlsZSq3Bz4g+ZJcsT8S/oxddcDhU/FtmJszNFOCsGo9Ilmvtutb70UAn8PvcglUHbYwpeCVD0VR1t6J0Wi9WjvveJJWgNQu+MW62htkz07GxNHRZPyrBw8bQpTiEhyscLwem0yKpM54SYidDzTEo7Wlm8LlMpBb884bjhppOJoguMl2NXiq3CiL128/u1ytl11niedQ5TLCFAx8CKUKRk6AZSYyHtRAPfCOKBOESbgSFuuD+APyQDKYxElKJTSYApStYPTkFGeF4ML65dnFyfHjrl48d/3mN7717W98+9/s3rxl+tb3PXAZURKUeGfQC5c5163WxFMpc7C8Z798/PgH7777wNu3Tk5aLmLvCLJTHiy6GtvjFlbQMC2LnaKo22akRJYXPzp++mHb9rHA5zhdixUnpS5Q6y2o/zsMfwhURh1j2NSyvu8IJZXulJS5lNS5PjgEDTpoeVGslHJqrQVDBZscaWJnY2LLl+XOBxkrL6Hjr3FpDx0SYg9tcwCUDNMI2IU5ZPeDGUtAO+hUVcF0C+oOjmoxJNGI0+wQwHLOWGedlNJb57yhULxDSojJVynpXOJzXgETg9uapMaWOHYjztm+bQIh5WBkbRiU5Xq92rSbO2U+YaLv+6FCVSRyv+0+aJthlkkaC0Q45FxJ7oLjXMLixoHUc/ximatxWYyHxbAYKEHj7WRIrEsvNgCTMdEBtwVGf1zKJ4v1vSenLxf51/b3y0Cl5Kd1dbbZ8LL84eziadfffvaz450bQChyTb2YX5zydECCFBLksuOr3DdNVS2t7wnsIKhPzWjC80NlDKM4SEkcCQFALADzXU4FI8yaWPXBE6I+0KwsaQApFaBpOGvRQSGEoLhwxvLYTlmQY4m1GrlyiuFy7+C64Ap2iIYEr03XtBttOu9CUQyEEnW1YVweHN6gQSqeJWdVF4Qz3vXLug4iVnIoztXobt1UhJBRPspiEooXMxBqUgyodTtKHeZZ02vKBRkUPz05+aTeiKwArhpPBk5XVuhojuQSJQOOWrDOgYoA94yftP2ia4bBj7QphmMxGIhMLc/PWQjtajN/8iRoLfJcKIUn+6qtcUbbphuNps+/+vrzz9zNrLk8O13VmxBcwcU0y/ezYi8rdhh/Zjq9OR4Plew6s6wbE4IDHzOHXQjjwQVO2bAoCA3zzcYI2YTQm9i+C0qGeYYtg+d0XdeAPpSgwIXAFwY2n8F7yxiX4NNNABuhkUHAhY+fj7ZxyeuMcqYRKp+mh7BEMvoZSr/7+muk62Z1G7gIjGhC1sZwZ//it37nxeE0WPNRV33vww9cpgJSceElB0s0+vyzd0vrD42hi/nM9MD9xe0vMTThkMCWjSZ1jwRVprg94SSUjAqgZge0OUpzTBqurI4oamGAuBPkVJx7IvfVh+0GeDviJb/h3n/VniILKSZgqMqTYe3W/ggVN9KWN/nvI5+HoZlw8h8MIG+LjXOiKtErtefkksgSzQQQSTBGd1BBQGLCvJtcOyj6sgNoS0CbCK4/8S9j7T5jVPCmyAXjy+UKsim9aucd46vl/MXbtwprDwaDk7b7eH4pOC0AcAXquAgLINC1sODByyitkIBT7tGDkzrrYuMRPHwLApJDBKWsEPUN109N3d4ejErK6r5yMqb2GBEATJHLTMRUZCUoSwdjA/GoDQ1AxCBjYxYTvwiUeZdxrjhVML0qJJeg7gpOYYw6V3JeMGrravb0qWk2d65d/8Nvfvub3/rTo7vPur43XYOcngCTcNj2OgWprNps7r37QbepDw8O265dNPUvj5/+/fvvXUjx64uzTiioBOID0M6E+LbEhCKYlErortvJy4EUjx8/+fxLL9XW/MdPPj7zgQjFOahZofvK1h7Kg/kj6HKAM6hU6M0cf4cQzlrnDKF00zWZUMM8197brVkUnGAYmbmtAB3wwaSSiI7q+k4ImRUZ7ORRfQxFQRN5K5EIvEcKA75TflsYO2vQXpejSwEaElLIz94WWQ5dLFqeufhGKMkAUeG9033nvctzhWpOAHkmtjdSia7vY0fu4o8GTEiOhog0EcwAig2H3FrTN+1gMJIyk2AKOV+c7HN5mJW6ran3Ssbu4NL799erLMuOJuPVep0VuXO2a/uyKGGCbQd5XuaqyFShFMCkpYxHBugf8Shhf8UJAtkAt08oQx11nMxnefGrR0/W6+qr168/q1TGOVHy4eVcc75h7MfnZ2K4f/P285xnXNC+bS7PjqUAGrTznAqc/QfvNqtF3WyAAubDluEYHyXk6rSPJxzrbspiVQrCMwKqHAk6Bw6rXCBUsRBYvBwRGxqI9QQW8523FsW4nTUExpgoHpzKL2g8AhX7164xJox2OGkjIbTtxvRd13cqK/O86NtWW3t4eEvxAjUcA7iAM2cEC6t6AzMgyEOMdlav6nUgQXE5LEcB7Mm8tbuDQcal9O7WcDKK1RWhZfH+bP7+YsGzIhCUDYF9Z0CM95ULOsNMAQtdRjjzqCDooHxT8rKtz5crU23Ktp0OxyzPisnw8vSEarfaVPPZjBntmqYYjLnKvbGoAQcIV2e7zlX17u7uy6997vbRTVPV69lF01Q+0EKynaKc5qUCLfFFXa36vnVaZFJb44InjHdGcyH7WEAHa92mbZ3glbWLtrIEVz8AgiFBW2eDM86i3zzwj4OSmTXWOJNJRdG8BFz9M6mMd7BdVoQm043443POYvEF4E1HUDbJOQ+cS8a67v/8i7/43/6v//vZ0eTH//ifN1w4zlZ935v+jf3r/93nvtBvmjYT33vvncfGgpkH7tWAeqT19cODveneTlXvtd35etUzqiH7GkJ0jI/EUWYRe0U+1bPCAawHm6echiK1mFAqoQZM4GkyjBmb0S38+MrNPhGYryBYCVG9Vf+Hi2RboNeWIgwJlnNZbIFdW/wz9rAJF0ETQhuACVufiKvx75V/GEEF+0+dB0lC1qRhuE+XzzgzHsizjF5pWrIkiQ+muUjIp2nIhLocnoZM6+lgUHkvppNNVemuB7vc5AzBOVvWXSb5K9cPaG929w/eefBg5VwmZc4F955wlqoZiAlodUeCpz7J0aBhMDRHqFAJLuhWA5BKyEQWQow57Ywx3g8Yf/XwQFAyq2oLVtSCU4lMTRhlExckF4TGXhb5eZwQAR4JnBIR33AmGc1AJUhSHEFzSRiaKGSESmd8XVUn53o1v7578Iff+Oaf/um/vXnnWW9jbIYaGs41dAnBeSUUZ+Hscv72u+///Be/2C2Ht2/c6Kz71UcfPu27H93/ZMbZO+dnFSFSZsDfdWjzAv1iTKVcME9j7JyqTOl+f7JTCPHB2dkvVtUqFvUiJKDA9vlARQ/JEzHysT2EfWjsJpmI0V9ksdVDmeaqbwdFWUjVaU0SWouBD5BPyDW40dbZ2CcBMg8gUSbPCgpqSgAsglk0Jm90FE1qdiA3jR7+NP7eENtHBkRZh2hCRFIkSjxANDOVg95sYDQYo0HjmTrw1SAgWOh87IMtbDizPAf5Jig4wDWB0tBrDfGDwy4D9IgY2v4TcImgvW6FlIPh2HkqhVzMTpnpjsYT2nUAXS6ccybPP5wvVn1/Y293Mh5WVR075vHIWtcbI6XKmFBSZDFd862lGdLpOIzlyXZyTyD7JhO0xEWg8RhrEn5x/2Gp7Veu3ZiEkKusCeR4viCD8sP16pO+O3ru1b2dGwCucqvlrGsrNMC8UsLzwa/Wc921QIAETnJI67DtZA35ijj+gIPAEEQt01IqEG8tSlwBTUDAI2d5UWJegbm1s9Zo0wPSACwGwJybBp9cXeK/gPoNZXv716XI0NkZorF3tm/add+13pPhYByC32zWB3s3RoOJc0kRRICYk6R2tVkb75gS4OTte6eX9RrRN+PBOL6aPljjCil2igGJBTG9NRgqznwmP16vf312FlQG2deb4NGHDrUEYKWTjFyxPcERAUQajw5cCa/AxbzrV12nvC+0Hua5Gg6G053FYhGc7bRdr+t2sew3lfBB5RJkmSGfwbaLhmB0b7U+OLz++quvHR1eq1ary/OzxWYRa2tGLGDW+uAtSf2GRyNsIax3jdYWAmLvbBCsMroxxnHWGBt4MNYY5yQT3JNxOYTSMkYACyXUVaIiMBOCmsoq2MF4lJkiZCuZFeCgJk86h9kDCCQ6OAMpJgvh84eHbrX62x/+8N7JcZOJ2rtK2yz4f/+Vr96kylHys8X5Pzy8H4oCjcKBEkSctSpXzz1zN+vNLWP1/GJurWG0Bw0oS2MbbQk1se5H6hGKQ7JklB/rK2h/ISx7/BMteRPmGanMgV3ZwNLkbLBlEKEEG8YY7CjDFg7CrtbGSWI1hC1PiHCRbSU0P1WjSixgliSlsbNNXsRhqwWdIFmfeuzzLRQVNx+fIrdCKjJS8gN1aBSlY1fr6KshXtKgpsnOCafQ0Ar6MWhLrUQmsmy+nG8FfpPCZhBysZy/cO16ScQ0y3pK3js9DkzkIvbWabYeAgBZCd1W0RyCBOopoGh2zEDBxRAci+6gpCIh7fbQzkHG0+9bZ601oxBevH5UL9eN0VJJBfCh+HfAikAh4wWlnAYRaMZ4TslI5hyQz8x7FkIuYitKY+VBCk5lIJmnSrA8hNA0m5PTejU7mO5+/evf/Oaf/dntZ5+3xtqu3e7WYfznLAtBylh3Pjk9+8G/vPmLe/c+uv/w+Tt3PvvcM0Gon77/3krIf7p/vyqL9y8vV84xMDxHPg2NhSR1gEI0JEZGKaWkYkD5YS4JCZaSM9O/VzcteCwDfAnh4sh08UhdNGC2StFpxafZFCC0OKMCXEQNcv4a3Y+zMhatAMRC9yri/dVAhHEK0kUa+EIQ/YPX1hTFkAu+PSfg6oDkYDQtBCJvkquhSd4Zd6L4VQer9ACmh1v4RTxX6J0lAEwSXxEHukoxqwsuheDSxghlheC219Y6mSljtExiuwQIM+DXS71MTvIwlnZY07H4RWu07oejCSgdUa3rzXp+Y1gOYq3Ac8UZE47yx5v1sdbXp5Ou3QDElG7qiiu5bltGWKbiUVVMgBA5cFrBZotC+GOAPw+4ZENJCqxg4A/OWZZls7r79cMnN4V6YzQu4FCf1dW67XSR/3S57OTw1t3PsNgj0rap5vNzySHKp5k2dc6s1wvnNOoQoxrtVsku6VmB9RAXSgKJiKGjM5DGKU4jCRgvIM8EFUtc8HlR0pikBRRSzlvXdZ1QAqWBEWjjkm4FxDbi4/UEMt3ZK8qR6x0H7LRzJnhX1cu+b7XWo9FQCLFcLEfj6Xi8TygHuxO04wic2LpeN31PhfTeUUaMNatq7WHDMirHmcwxsHpj9wZlDmvMsVDXiwHL1Eer1S9PT0OsG0ARPXgqmEV7XXCzxgOJyzZQ3ws4EiAEbW6RtJKg3FypjbNPVmvbtarrB0JkeTHa3TNt3XfNbFM11gan58dPyrzwxgrwCQVUlk+bOO+t1sH7g+tHn3vl1RvXrlXV5vT8dFWvDQkcFiKKsQG4lAiuLIwgAqWt1gwNswk3jDRGE84dlqqcemcBKccmqgQzas9BrZ0QJpU0puNCUkY63VNCcmBdxhDqg3FWSgFrJuuBiwLsfShoXGwIjbccaCKBsT7WCPH2vP/eOz/4xx/87PHDTTHoKV2ZWIf9wXMvfuu5l3XVrYX/y3d/PWM4NdnikH2sEm7dvDXNi8O6HbTtrNp0nHU+aHDk60OwMQ1TEG0JW1vf1EZSQkEP1UP7m3QiEbGfJs+UbsVwcY/PkjQku/L+Y5/ClUHkgtIrsBZDFehPtSKvDIHR3Vxm2Vb4LZDtGhH7YIx8qOsM9sEM8dLIN8CpH0u5G6vkLTEA978B37AAsgssrXUBKadDcl+CIggkM7ZgqOQ+jLBshMmSIGB3xzu9m5cbH+h42PW6rjdcCrJdBDHBm950vf7czRuuaq4fHX18enJaVVKIUimaFBwoGGZBOqbACQYDPopOuCGpF6IIOIBrYie3leAm4NTDAFXKORWB0qbvD6R66fB6r7umbzgTzlopYs6nFui2nIFWhlCUZpRNZbZbltYY5HIo4FRJxgRhGWU5oUMpSyG6zeLy0YNqcXk03f/GN/7wa//mz269+BL1XncNzMZRiNERa5mjSgrC+ePT0x/94u2/+ec3Pzy/LFT2+t3brz931zj/yelZrdSbjx42ZfHBxfks5o8M9TFRyMkHgnZGSbeTcNB8D6WUB4PieDYf7+09XC7ud52NwYtvvS5h8sOwfw3aWU+3JzUGBQBXcA7DZVQC5cZobFKtd9roYTGwsamBmhAFWSmwUJLhInPG+uBVLhGR4OIbGmKkJpz4WEhxqXCOjCM+nGQQbwIeOyAzXO1cIAAITNlgzBVQSoTHZtpyTqQUMABQUK27VMaSUOQZJazvOkJJmRex1XBmNB7ovsf9F8iAEc6Z6bpAAs8UpYChA5wwUs8pIV1bZ8Uwy4fIqD27PJ2ycCCltzYHHR/B2dLZe3U9LtSt6zfOz87zIofxaa/yvOu7Mo9pTQEVCpD1V4OIZD+BZhIM3xvQfrma5zhvpVSPZsuPz2cvlMXzUg1UzpV4PJs7zpeE/Gy12jl6Yf/gCDAaYXl5broaniDI0VDW265aL50zCKZCAY3kugZ2XJRQqSQi0GJZETNr7NEEOuSCHARMHAKum7BE986rvJSZihkQFtXG6RjN0R8V3myP5u0ewjiqw9JgfRhP9oeDsdUegXhgdea0btu2MlrneSFVtl4timI03b9GefJ4ji9yCIqStt2smgqm9/GW9Uav6pR9B8Uwz8sAnFTdd6WUO1mJVMDDcniws3NvfvmriwsbXyU0KwTQDkdaTTJAjS8LR52hxATxW18v6P8Z6n+lkBpDD2+Ce1o3bV0NjC18GA7H4/0Dbk2ZyZUxx8sFkWK9WK3OLuv5HDYRuVASUbYwaICdS98LIQ9uP/PaZ1+/sb+3Wi0fn52umsYaXebloCwg5fjgQ2sNAVszA0hPT3hjdeN0H1+A+AoEFxjhkjJBfS5Vp1uoTgOw9g3qelMWGxJwdA6cgYt5AOlt0FFHryEGvwYdz+ALoCbtLAUVETgbxBNHOdOZ2gjlcmUo21i36frDLPufvvYHg6oNWfafH99/++KcFTm+dHA4qTZmNBjdObqVNd0tqzfzywWhhnhDvA7EQgthCEO5cJg5w9EF5hQOP52zjPgBYyJciTaj2i7CQxhJcobQCrMt8zGNNBiiWLZT6C2MOelzpKkr6mHB/z71CKYgjJrjBgfDDWhhbl0YcXSPNzmkDE+v8Fs06W145ElD55GkrOKj49BuAzkksCs1fUjG8RuZgLJCOMlEMAC9UhBBpUJgTqRvA6KAPiNkIsWCcTkYrpZL+HwWKE8dvlQXi/nN6fhgMCpcGE8mP3/0WBMyAHV/0HlIIB0GvCmBtq8+WPRIYQKkmuGEeSc5jM4IhNL47nPBUTHdM+hoTXCNs63ud4vBYTkIzoOyKDVOe+th+EYzKagnPNCB4GWsoIMzRgkuYXYM4GdKrCkYn6gsI6RdL8+ePFnMz44mu1/96tf+q2/98c0XXmLemaoBF1iQLQALThE4g3L65HL29z9/+29/9ot3z89nWo9E/srOzovXrk33D975+ONQ5m/df7ig5KztnrYtzzIH9HbrwG9PUKD+IB4QBiaI4wUZlCEl686o4ejxcnHiPZeKUgF3B+IFkEKAyxyrexDERx80gpa+TCqPY0tKJReewBwYBoAad0V5btGdDTmqScIN2mYocpFNyDl3NjZP1sW7KuN9guFIrJ+Fs7FWAsUe1MJMsl+UXUnTgQYqSLDBzptuoR/EkyAY+DdoiwQ4B4AyIWLjC7V7fKqoZGT6nsdrVuBNRIbDodV927RFUaAcASGh15oLJrkCDjkMhblAoEbfdozL0XgKTgFisZqxvjoqBtz6ocooJ4IzzcV7i4X2bmdY7ExG5xczGFGptutUpjgligrGY4xDIW/YMW+p6zB/hVsPrlk0abpx0CphjIm8fO/4bLFavzGZ3pZSSNEFf1k1JC8/aTaPNLn7whtKDWMq6prZ2THM6pIFvCd+XS29AznlhNVIhT4MiGNbKVnslLBxB6sNi/L04NwsgoPXdLuh38rJU6mycjBKNi4B5rLBxw43xI4v+KTlZ51Jzs/BMcKcD+VwOpnsg1+hR8XQEFO8rTYrZzWP5Zlar1d5Mbp+/RkwyUXUihUkvpXetIvNMhESBNfWbKoVCh9l2WBYDGEeTuM1GH1tMFbA1R9zcePw8JPZ5a9nFy6T4GSKaQBKsZhIfDq+2A4FRFWnlIsmQjYZY2MEj/8umCCI0OSip/5JVevgRdOqviuKYjzdtW07UOKkrn55emy4WDfNqm3q5TLUa+GcykrIZy45z3IASFrDuNi/c/fV196YjMeri9Onpyertm6M9sGBZ7dyBEQ2oNsywfbBMCE8DE/XunfOKy4oiQFDSWG9cc4OszLjGbAVYg0Va3dnmCeS8ExI673WmhCWZSr4oL3vjEbRdShQINzDIil1n9t5ABQiAC+KVQz3nhhCV9pq2/0PX/pXX9y7plv9tG/+v/ff1Xme8hcIOcSCwPq7z9wdUna9a3lVzZqmF1Q711NAPvtgAnOx/UVoFUXSxNWu1sL2t6AsYzhUw67YIzIz0Zy2ri8+2QgmeeGwVbOgmK5TFEsYK8AjbMVyKeacJBp05R/MM1VsVexxcJWYGuxTLlH6AHrVbF6JbyQW5NbfNxGXfsOVAWVyyJXQSBLDoYxYDOLpe4awnWIl3QSKAoPpmsDvlgbOfd/uCVUL7rPMU7JebZiQdAswI/GFobPl6jO3buWdub6/v2iqjy/PieCllMS7eNYpmv6yrXB3/M0ZDIR5jGgozMLRvglPh4KWVsBSkdEAlpwJ0Gm97zxZbta7w8Gtnb1qtTYxFtNMZrD65dR55kPJxVByHiMaaGaR2BmLQLjzAyEnSuaBdlV1dvJkvjjbLwdf//2vf/OP//TuCy8G53VTEw/xPSmCx9oUpF/D8XLxV2+++ddv/ezj2azN5LLXtDdfffHFW6NBWZZPLi8qb3700f0VDTNnH65XJMu3AmnE4Uo8zXGwO4l3PF4XeOJngt0ejS6XKzkYzPvuwjrCt3rLDLVNaWzdAU/oAGf16Xgkls5eUA7OMxxVGISQSCABawGiraaUCCmT9F7a3eI+Bfll8en0bRdbcia9i11mr7UEhRIHU6yAsmVQj2+tdriLzXygDAC4IZ1J9FGAPm3r4QWFgrE29upC+fgDJllY+CKYQXOi+z54XxYDH4LutSdeZMr0xlmXDwbGmr7X5XBojI3lpXNWGyqSIi/2n9D2gyeTD9OdPZQn1LrarGbXyrIIIWdMSeWttVI8qKrah0ywYMxwPF5uNsYHKljbtmVZoNCdYCiwhr5biKLgybM0aV9T1F5F1RsPYBkv+M8//kT25vO7e7tgnTlv6taarsjfvrx0k/0bt59HrZLV8rJpVhnqgrkYrLuuMV3L0uaDghsewwU0gGqEZMIhvSZhoUFonXNvHCUMiloKbGRELHikJHlCiuEEYHrQ38bQFwu8vtfocSskp+C0jbv2ZBPrQ6YGO7uHLrbYBpeLiJtuq01whhIqhFivVirPDw6OwD0LWJTeKygQjG7n64WBZoNy1ulutVmhy3qmilE5SgoL8TF1oywfqhx0Dlw5GJw31YezuZMoNklBVZ7R5PLncS3qt3Qjsl3Ag/8SKD0hbh5V9iAiJWF4iLOx42TccfF4sWyo596wtpoOhkqqbr2+c+16a82bT5744bBu27Pl6ni26Hrtqw2PHX8Ze3uY2yERL2YXozmlR88+/9lXXxsOR+enJycXZ4umaUGySseyhfTe9c513nouOmuZFNoFbQ2OrDPOM5EB5CJkTGZStqbtjeGwn6HOF1wUgoNEOOt0zPpgEBTbFAMVM0iscA9BLJEUGLfWAkpfBlBJQ89WShxaNXrON96tm+pL12/+u9/6V2G+7Ivsr95791HXMCmxM4VJFjWm39/bu76/X3T9Hd3Ol6sm9rtBB2rBUMBRogm6v1NHmSMJnJwWox7bXzpgRKCpIKRVbG2hAUzKP6gh5bc50P/mNjYlr6SI7dnWZ2hLHUYWEr41iQ+ctLAIV6qgWHcmeWbyqUgkjqP9VbmyzbYkIaO2enzJWWvr8JsclbYra2zc2VYcAdwAYUhoYOoPuOCtC0bq5aFRTozheKHY18R45gP3flIU60D5eLxeLY01SVoLGnTOxKypR4I/f+1aqJtb1w7feXq86PpM8EIK7il4VoFWcyASHNoD8cqHZ4aj61Jp6wPqNqBbEdCfQUsy/l1SllEhGZOMlVIildEGrylZN9UkK/bKkkELjWNGyVgheE5ZBt5zUohY4sJWjLtQcD6QgjvfVfX50yfz1dlU5l//vT/48z/787vPveCcN23LUfsf9OgpODRJyoUUZ5vVf3n77b9+661fHB/XlNOiuFwuR3n+ys7u5w72nr1z98MH932e/9O9D86t3XB2f7GI2deHLX4PgH9wFJAhHrYkMlgNMyGlcu65ybhualYOzut2nQDPwae6leLuNkGogIaE9X4SVYNCUUiJDShClpXK+r4DcdqYgzujheCZysBnZfteIDENAKVccDBoMypTHsdG3mltsgKFWuMDIhRErziPFQDkNheTMZCOyJUMK+DxUV8JJi9+OzVCYzwhlZAq/nAe3KPhqwFCq5TcGqv7XkhJGW26jgJsqqoqY/xkd1ptNpmMB6ptOvh+8IEi42C4xPBF4DwE33fdaDxmIlZfJJiL2fFUyX24g6DSHHiRX7Tdg7o+OjjoukZbX5SlNjHZu0A4jw0midWbANU2kgBS8HYAaB/ZgoRhvYhaOyApJ6Vatd3bHz044vy13d0Mpp/LTjtCFoz8erWeXr873j20xnnbXZw/JQBe8yTV5G1b+eAAyUjSLgdG3lIgICjmeIgbaSUPfG8gRELH7HHk73zSh4KRng9hMBzneQk6pjid9h7WE0hVjI/VB2M0SR+b8rqU5f7hEQksQCXHY3FmCQlGdxocmrmk69VSqfLg8IhzGX8l4KEUlzz2wP1yfamBJ0M506bfVCtc2UmRjUfTkEjUgIp3fq8cSjhDntHLpr6om6AyBLaCCGLydoV2AgAlUMU7lDRESYCYhWIBjZEKhcPTUccQH9BoJJWiknOv1GXbnDdVvalNVe1Px9PRoF2u9vb288n0B2+/7cYTkucbay82m9PZrGlqanQR46uTeUYApQUuhLCsao2S8vZzL3zu5Vcl52fHp6eX56u2ba23aUQKUCnKa6Nr3WvnMymC9Yqh17wrpRSceVg0aW9gUxOPXy7EKMsFY8bazloP4DKUZqeMaWNtAOIR4+ikkrQpUG8/EN/rAFU4oLA9iDHEN7MjZN31ZaD/69f+9Z5lgdOfn5/+3YMHtChgjE0AyEVAgIE/e/fZ0tqb2vjlYqHRdd+bQE0IlgUN1CNLiEW5DDiciQREYHDiXE5pzpJWW+IPAcLgN2BWhG4xdMiy87ElTCviRAmmW6LRloaLWRd/opDEl6H93va7JBAuZfEbupXJ2xcXwh5HguxTL+AEiAxXn38F2IonkG77W5J84CgWCgAmQ7gsXh4aDhJEhKOWUbhCTSdcNFwETQr7aLoDDlUxzk4pt0J1ijPFV4sVBZWMZA0ATu6X89lzN27sEjbKCppl7z5+ZDgrhBQAO1dQpGWZirU5PE3h3K3x5PZkuu6NCcTEcIIuCKKUSsSgHgTlGWeKCWqdEkzhyh36Y+9db70xRgR/OJ3EQrfXBWdDJRS4BCpKM8YV5cz5nJJCCMWZ6021Wl4cP5mtL6cq+8Pf+b0//5M/f+G5F60xpmvReiGgij0A7RmlUhWLtvvBz976qx/++FcXszNjqVI7k3FVtZKL3eC//Owz++Xg6cW5VvKth4/PHDG5/GS+tEIBv5ng4ja+F5DXQaKXWh8jmcMFLfE2Vh5srOQeKM+ZIn+4WhkpGdisI/AJ5ago0Gwg1RIXrE+RMnWd1jnGGOiTbMVaKUvdKgPaLqW91pzHUhoyAiLhEYdTDmA+AACAAElEQVSFlsyxOTXGeGezTDnrMZMF54qydC4k031E2lIOXEASgESUpNMF7okCVD4UjZsTBQ+S5f9P1Xv9Wppdd2I7f+GkGyt3VXWo6kQ22c1uBmVKI0ryYF4cAL/4YWyMX8YP/p8MGA7SDObBlmAYmPEYM5JGTBJJkc0O7KqudNOJX9rZ2Gvt71RbAopkhXvvOWd/e63fWr8A8ZPReSvTpwQmKmAZGEeLPDBQAjI2CUKIGKLTjnFaFKrvOxLJYj5rml1ZFdAgeZAjUWONElmGBIlY6Y0Zhl4WqqxmQFcOl1cvpLN3qpo5X8FpZJz1wX/cNHVZHC8Wl6t1WZZFIY1Nn1c/9NNJJeBxUmAgRUfz9uxiyDm6qBJUvSPtMgQueVGVT5arXz8/e3c6fTCpo0+ldqcNk8XjYfjCuJObrxfFjDG2XV80uyu8MVOJYiRGb4ch5CcX5A6AvjnMDD2qdGCxLjjC/fRkCAZeJTFkUQTmbYNMK6aeLZbVpK6nIWFfSOqNgXMGSUrp2HDBnTUeEoVxOgKdRKRcnJxcZ1ymni8EJM+lqup033eRpr+22qzLenJyAkU6ZOjJCBHpkbWb7dXgDSScUK2HXZurLxdiNptHMgbPEOKsPqgmUy4ZZPR0zg0hXZk53IYzsLyMSHJGQjCOc1DczCB+GGdFgnKwsRdgLOwJBOMDf5i93Iyj3mcPWrg473Qbo7Gm267rsiiEfPrlEzcMN+/f+9Fnny+d0ZxEJXfOX3Xdi8vzoR/80AejJ6rgsmRSBrD1SoXAmND3ihevvf7g3TceMEJeXJxvtutW696ZmC320wnyzkvGSi7KVHID+tWzEBSXAfRCPOFXkJCR9L5L8OjdtYOHB0aCwWfBFaVscBZom9FZC/ADzSzSh8sGc53SbxxfY9bsrA2cpxpMMHOQr6zTXfvPvvHe7929pzfbK07/9d//ZA3zFiBYYq0Lxug7N28dzeYHvT5tmxfNVkP1NYTaBHyjidGTaAnufdlLa6pRquiDlyRO2Jg7ixv90Vp6H7+PmX2j/SR7GcYWcX86qo7yYDqTs9D/keSk5mx2iRTC/ORSynlRklEsRPfmHbkTwCIdaf5Jcpo9y0yx/I33pGi2Xzujr2Seg5GX5Gk2ukjiGD5SA30k5bnYEpaB0MuUpHFTzEh+5AnYhs6qaoieTqddr/u+F0xkvE+pYHxn/NDu3r37ShzM3dOTR+urL9YrzvhMCUGC4hwRGGj5sRLxpuuXXd8H62FwiBBYMFoA71YyrjiXsMYRCQFT6sHpjYsC4lQ4rMt6rSsmjlR5oNSE0wnn0seCRR5imWq5BKsN5ob+4uL5i7Nnu257u5z+yUff+7N/8oM333qXRaK7jmAMM43eueAcAzKRLMtG67/56U//zx/+3Y+fn126UEynBoDRbhiKQsxD/N6rr9+cTr58cRaq4v/5+FeXnHaUfb7eWsghQaMr2MHSEGgqtDE4qLuBRAc6Iihv6eIolDqQ6lZVCU5faP3MDDGBBzxJMdNM4BP18CkFEqzz+4wPjBhjkTnnVVkgQx5oBlFKBfdwXhgTQrUZhEiPJ2ghGNlnwdI8j2GcaW1gJAyKfsG8tSGGqp7EzOmAdA0oeOnVoMQUz1PAg5dXvlg/XsJfsk+yTiAenZNhnghTXcjSIoEm6CkFOH4EVZaRxK7ZcsGKQu62GyFFURZ9P9STyhiDDEISU2ddlAqhDn5HawYa2WR6iDVq26x1t7tZ1SrGiSqUEMGaKPg/rjdU8EVdUkp2u846xwR33oXUO7JZqXKkRw5eJDSM4WQRb6jc6eLom4PkL0rxy8dPLza7Dw8OboIBi/audTZK9etme8nU7VdeY6KgNC5XL4zuuIA9OJqcUGLSVZ8+0PSgZeRNogeeDgkMpMLxpZIicppgT4BYbQ5Prw+pJwhgzehgbTlfHEXCvc9Owunm9cZaJ6WklDqvvdeZtENz4Hag7OD4WlFUFlKX0UXNJ+QU9TDE4AmLu92urKYHx9clPKYkApLO+7qw3a1706VKyLg2ugGrZ9jLyfnkAJ1Y8NVpawpCD8oayakaNpoYHIuzZThQCMYiTAsCajWzwgpWbMhBBKRNJRcsK+DS04MjI9zz4Swa/BrJ6ORAOWNSqpWzffBBiNVyfTib3D46vlyuS0bu3731i+fPr6zuEuYMqiqaEJ43zWa3s21LdU+sNVqXqkytWMKXUC+9dX0/qWcP33r7nVdfpda+OHux7YbW6MGYGGNZFJUQUyF58CXMcKZFWXApKJGi1MYAk5nCtCtWZakorZjwcG5j9EqIWiiWDgo3FkzroJ1RUnIWBSSgBRKcdXe5+h+//8f/xbe/t7q6/GR54WQB5vmpn9n6uOn1mweL/+573/PrNpbqrz751U/XW1EUKDTEK0hbM6nLu7fvTLS+5f2wutx6rxk1hGhCEvylxBHqgKXkCRv14/uoIciyjL5irBo/FFj0ctiCB9z4gsgXlmgYg4bFdW+yQfaZgS/j8rM6OM8zeBhDBYGswBDIjkyqhIDLbM0x0qlR1pCjBgEvjHSW0eByTJ3Dk7oXEYXRQTmvbDN/a28Cgp7ie9ctIjj1MVqwFc6G3EDaYNDGZn43Rev27LfAYIxjg1/EIItqLXg5qdarNVRnRsZ4JS7FxWazmE5eP5hz605PT3/+xW+aECupJpyBg1N6N2mkIW+uo08drg0sPWYoRY4B4uvhdoeghqAIlRAOmDpEDEYFfngBdFgcpDtnC85vzmezGApHjibTaEM6qZBoOnTNs4sXzy6eez28Np3/0Xsf/eCPf/Dg7a+VjA9NG70XKEr2IXrMweWqLLUPP/r08z//6//4t7/5zY4Qw1lgrBv0ZDJ1NNXOaSTfvHH9wenpetfGuvrhk2dPjW0Y+3S1NoyCyiJiggJMCwNwmD207UD95vQrZmk5sIo4e1IoVZZftM2V91wqTPTM2jYg2+J5xBYpXSjeZiNcOHKQ3uSh78fksgj2nFFIZZwG5VH2Tko1OBW5woMPJUUr2/QTRkEQg1Ldp7+DDvWUEQvQmUsF3gzIPooJCHOZ/qXLXmkwdqLOo1dMQhnQX3qWJUo5ZCxBe49YWjnvYUSPGUfpiKbCj+IFmFqqQiUY3HeAvli7282ns5g6kXRj6sHQdOuk5tp5D0N4DPeiMbrg/GJxiBlnRre73dVRAp60ILRQQGmT8tPddufsrdOTbrM7mM82bWuD51xa6yvKCyUZPDKSoyI6j6TAdWxcEMF+HlsLwaUnoTH6F1884cZ+cLBYwKx0N+jBx06KX25WcX547eb9EGnX75ZXL2B7IlDuiSDaWQOJIoxmwiP41qa6ixSzAPt7us99iSR6XI9G5qFr54Rn2ViIZTFdHJz6EEGfCgHVICa3WqNKwjljnUZnFgyTZal3JPOD08X8yBvvgy+UymACgjatNy74rt1W9eT45Hp6nqH2oVwYOlrfNpuu2xFIJDTaNN1mVD+y+exQQp430sbSz+P8QVUJWAR6QgYgHaQfFACfwww0WPRzKgg0rxiNhQt40BdEMBtPn70Ei6xCiEKKEImNwceXDoOEZVYj6C88WokKjtsnuh70EEkQ4umzS23NyXxqhs603fXp5GnbGMEbbXxgBURwNFZfde1ls2vbpr28Cu22UAUXMrWVDqJjOAvOxkHPJvO3Hr71xp1XuDEXV5ervuudafoOmsgwLYqJlCyC1DhQT9N7zimRUCSU5IoJ5lyZwC6bVoVg3FtXKMUY6402qR/3aFvrsNsOuLOkkXoe6P3p9Fiqf/vTn/zti6cbqJTodNORsNK2MOaf/97v35eFtfZnbftXv/ylryvgt+W6A+nS/v7de7Usbmtdb9bPm86CbRaIjogl0YIS36cajHTeGNiemQTmht4XhE6Ajz6GFPGQzVHpPmQWFRqZqkxHFAyfXMhBv3jw0egfQ41gC5MxcciLYJYVwPCfmcyYdcB782gMf6CE7h374A9YpmHR0UwZt8gMh4q5Vuc2Ar8QrAb37Jq9e2b+R+PXJ5RZGJPnJTEyOuPI12JjQCFaKFNkkgHWNm5WlI5EV1aR0Ga7YwLxdc6fcIytlss3b90qfbxW11bwXzx/TgSrRQKyEsYpcJ+iKl+CcZMIIFMnqFkcV+VKSBaCStcrL8DIR6ZKTAXM/QRjSohsLckoMEp86IdDWZzMDmgMjR6uuubLq4snly/W60tl9RuT+e+//+0//Sd/+sZbbyvOdN8FZznJg69onXeOgB63jf4/fPbZv/nhj/76s8/P+3Z6fNIba3yYzQ4G0wdG2q6XNrw5n7x14+b5xWV97eivP//8ST/0VfFotTFMUMXBxTZ4RlNZRyksBOFnxh8amcGuB4fGQnLnXMnkQVVunXu8a7SQALQgv8iDdoLlaTP6wgB5xvngMB+JkggmxIAsg5eiYKNeDXKQSCEKoyHnAAwsCYnGasaZ4oXzHpcwQEHnWOIBPEWjdVWVJNPtSTf06YGXmPwDHJjs0CVgqewpUndIlmmiPJflUQw6yACRCMaAmJTnfQDKPIDiGCijqXlHPj5YRoMOhyhegPmOVUoSQoZ+qOqq7/uirBxkXuF7Yp1HHyjkUVJGjDFlVZWqhpwRu7p6UXF6ypUMoSoUJHnwp84+afubR4tK8K4fjo4Odk1PlezbjnOulCik9Omup5g2kVsLxiMLIAXhmewJ0ZYuBq31VTd8/OWzm4V6ZzavA3WMrYfec7Hk9Jfb7eLandnieiCx77bNdiXA+wK4seljs8ZYZ8AlX6SiCMyPQCnHXM/gCUSroogI+XMg2KPeOiEEiNU9eMw5Slk9OZgfHENDQ3O0DEt10ugeJ2/aah9sTn+OWYrpQ6ymB/PZodWDtUYVBWR6Yt5ftM5EH+D3y7qegbyQg+0UL6UEBrXvu23X7ignnHM96Lbfjgs+mqqvUiB1wqQY6o2phaxkQRg3JHbGRpYqsQ0eEkiNd+ml8azuxXuSo5QDdzRcCNjNhBCcTAVQKMprqZy3znlKmQHufsDgZCaAn8ECTgDHSA8QqQcm5FqbjdZVXVrdPz+/vH/rtnCm4vzG4eGzy5WV0kS/7bWn5GC+YJRtmm65awbi122326zNZjuRBezNuA9YgdKbRow/Whx97eGbr966Q43erbed0Y6Etu93fe98KMtCEFZiwoP1heClBE8/54AkG0AnCo7fIRjvCGfeWQbrM7DvTa1GCNG6wJkAoQQIFwPZDeZHjz7/tNlsoWriTssSunSuGfofPHz4Tx+82a63XcH/1c/+4Rlw03KSLlREY/Tx4dHN09PDfjixZrW8ahk1NOpILKHg/5yefxdTX52dn+m4nGUYN+VoiDVjCr9m6plYyHM6Sliu2WMlwsRURCn4lVgcvSP3m2JGs8MAJl/lYh9Z1unuORpxjODFQH5gfrIx/mgfhTB6dcS9chg7M+BlMZKjEfc0aLKfeyM3KxtpoTkSqjFHo/zshkIIkfDCDDarYOhDsmfvWLLzFCeP0jk09gzSHIvg5kWxCrQ6mO2aHUCiMRQCLPi2XW+tf+/2TdK2d++88uj8xePtTnA5V4qnL0Apj+BmkDXdeJZ8CIKL6HxCuqn0MsWopGBfBdtGSVhFuOK8YKn1lVwAIT4KHiSYF8/KSaWU8fb5bvOLF08+OXvyYnnhh3bu/b3Fye9++O0/++M/efXNNwVjfd+nb0QwSCg4DAQFb8JBiB8/f/6//4f/+P/+6pPnzvVSGBeEUMhrCIAOXAg15e8cHHznjQeryysxn/3tZ5+dOd8p9enySguIeAJuJ+QhpTcemAjEQOoRQYIF2LCRMekWSMWUcVGpMhrXEnKh+yjl6BWVE9RhG8eRNJizCxLQtAH4JDkZBMFQJEKAbHpc7wO5iqui6PUAFxYKdok1Ghi1YhR8ZnNFHOnI9Pvee8cV/IVUwNKdW1e1YDL6XC/R6k8WwmoNgjKC5NusHWAvhaQxe6bH0S+ORdhggo0yUIciJM7GPZ8RQ3IS4jLWUsqkFFoPUiWgb6ytqloPQ1WVzuIjTwRjwYdUDNJlaiHCyAkpqmrqQxSCLa/Oo+lfmUyEj0VRoFfFLvpPm3ZeldcPZm0/eGuPT04vlyshlXOGMLqYzIj30GIDtuNZKQFy5BwMhVYzkbF+0Mb5p+vdk/XmnbJ+sFgw53pn19owJR8b87jXN+88KMqpD77ZLId2J6RAOS9uwQatGdLbsMtnyKFKnbQnPnN4sxdQunoc2PAH43DllLpJVFtGUk/m8/nRqMHMdj1wAp336d8ZN4TRmY1hDwR9eFlODw9Ogkv/XxRFepkOzN+cxhvSOaOKqihKa52kMngPJio8Bk+Jb9tV2zUgBRfWDF2/IyNwmU0WhSpDRgGY4OcoIXVRhEgGn+oK6iiNtbyQxhurXVGWwDYLQshx6csogGC8jH1w+2B9VPxL5Nyi5xslJnXDgY7YCcMb0Ac7kHEfGSmDHSrhvIOwpsODw+uHJ+v1iis5L4sbqphX9ePlVSgUZbL3ttWDDX4ymVIh1npY9uZ823RmODs/G/p2VhSlkKlXiPnzhMwScnJ8/P5b796/cV1vt9vVyoZgKe3MsN6uW2MCp0oVhWIyhoIy4gInpJCKcZD2xUCcL4WUUg42Vd/Duk59G/jZpcYEpgJcCJ8NCNP1rynRSjoloN9NbzpT6tLoZd+/Vlf/4vvfL7bbWJb/96PP/tPz57SqI+JfgveM44y9du9eFcldY+zy8spqCz2NpsRBzj/UXebBiGOv2qB5hUkB/fqSkBoW9RjeBrSniNlGgSJnITKS7Tiwhu3zBAPNLCq2L35YM6GBy5mFGEiY15z7mKQsIMFnhnNZwXxszw3Dk5BdsbLX4whesWqDGjUj4rjPl8HiDLxA/FtfyS3Mi1/YwOGKDNOYEw5PTRlifjoKuzNFZrT0yE5b6aXwfWXmNBozlYpS1ish62q9WlFYgI3kFEqVOru6vL6YXZtOa+dvXDv96ReP2hgnSlYoOmSg5wefEOTqcM4KCCAUNMfjl1wKEkslCooEgNTyl0LWnAtCFRO4ducklpyXwHMejH6xWn787IuPL55uul0Z4qlQbx5f/6NvffcP/uD79x8+jEyaviPWcgrmJt4H74IFa3ghXVX+/OLsL/7mb/7yZz9bMa5m8ybY3vp6vtj1LaLsyPl2GGrG79XVh3fvLC+vpicnf//kyxfOD1J8sd210INDFYEqCyw1KAswB6TExwA+GEj6ixjihxFgQiguOI2UU9oTsoP5dY6jR2PeEEHnmyV9LFONqPPep8sLZixAg8z0PIgTgN0gegXTwGLqZCi1zjBgVyLryloDSfYixnG5S7KGLsQgpNDGOOeyTTS08yG4qqyAKsDyuJoLzEozxsToWLapyPI5n0V4lOY8bYhVzDOXyICEEsDvDAYh6WZMAGuf0cSITojQ0fRGCcDuVkgFViZBKDRhFtZZNkatJNgE+XugAU34eDJdQP4W2zWroW9eqSqVzo9QPEFJS8hn211k7N7paT8M3ocIPO3VdntyeDB0w6QswIwFhEYwHkCdFSqTRi5H+mQ6q7u+J1w8urjY9cO35otrUnFGO2ebwbKi+NV2uxX19duvEsadM+vleYAsuZySC9sQbQ1Gp4/Z49DNI+mIU4eICmVCsNjngrnUoBAhhQN/F5760jBbHM5mR+jaiNiQ5HFc1GZghGg9xFEcB0w/6AtTp1IdHp8SiDUryopTgWwBD30kpBx6ISXnMJXnqfqidXt6sqLt2m3b7iCrT2rddxn7pvtlUi+qegIsbDIu0lPtL0DCbkPU4FbtoGxKpay3LnVaE+99qhxZdckwCQs8ApA0Cv8lZ8eRQkhJGFwODDRY6ZjaGCwwpWEWguOYQFAr7HFJyfBShJoeZFEMgb7YrFgMx4vF8+fPOaUTJcv0BIllbynOxplYd50GZ7TIuQmkj+Gy7zfGrLabvmubtimlrIoKHHkDhbliAFbV6enJB2+9fefa6dA0u9Uq/TxSds5d7babZjdoXQIRrBJKMqpgg8Mpiz4WCtjwlHnrBYmVSJ/UAExPZOoJIXK/gz2Z9+l3vMcwvIRhOLuy9txobsy/+N3fezCbD8Y86rs//8d/HGBGG/fzVUKMMbdu3TqeTI+1nXbderPqmLDBGwqhCwkEJ4DnkPy8T63PWJKBOssxEieUqtFKOeBeJWZY4rMvMQ3A50a4kjNbRoPIfS19maSQBb37pxBXwnEkV42LY0pGm1gM5H+ZoB++wrvGjZIHzAlUizhuk5EgRcaXlL/FuIXO1ZoB5wXhOUP9E8vvP7KkR5kvmGFYNFcHk9t0LXK0ohz9u+ioncOnMNVf4ikV1t2syqsQ5GzmnN81jQRvrDH/mFpCnl8t37l7rzLudLGIlPzD06eB8YOyKIApiotb8BunaLsFWZRBIiUxkFKmW7agREC7yCmtpOKUiEh5iAIc9yVnUqoQ42q3fbo8++Li2UW3ocEfi+JBOf/g1iu/8+G3P/j937v1xutEcNN1RFuJag3vSPTR2ug8ZzII9fHlxb/+yY/+/Gc/e+6DrKaMsq0ZdAjaBwLJoJCaEDqr9dC/UtXfunnTG+0l++XZ+bkNg+CfbzYb43gqUTFm/zFw0QUScoipM/covqPj8wA9YCQM3P5IUdboGMeF6GMYIgqXeADXASAjZKZzPpHZ8ZEAYgyRZZdUGJNyDBVngnEpKcz1A41IkS1U6Z0DOjSL4K5MKLFWU0olYG4oWxgySMBOiUkuBmtjCFVZgqaIOesoo5PJJEOJ6FjO+eKcMWd1ZlaTmFPeI2Fchogmw9ii4rOGa1r439BuS6FQyBQwex+sLpy1PgYghCUgLqWKLl2qVVmhFplEopRCQizQcFAK7JFyFqOzzkzrA8akkFIPXbO7uqXkhHMWQpH+YWRSfLZr1lrfvX5SSWGMCZFUpUofXaTzaWX6flJPfLCcsUIVMOnIsSXIVkzNtGDauk3bprdFys+enQXnvnN4NAWB5tbo3kdfqF9stnF6fHLtDhB63Wp9QagHNQinAAyMtdYbvBN4HmkBkYYiaGTpAAPJPATnvOfgu0lDUFXprIveU8GMsdP54Wx+BNdKttzB+4fQYJ321vr0SXmGWsq8CcJyXh0cHzNWOB+4koRxD9YR6Q5lEbyaYZglZAhEMgmGw4SBDY4xfbvbDH3LGDZkuk/YF5cetKoXdT0FJhminwAnO8DiVfmERiMXRJveR1KWtQ2ma7tJPcnSr1FAj666CLFsdDHLL2G1AbW8hAJMsz0N0ekIRa4UxLywkSeN+Z6URwYDJRZBMI7PGePCA8tAM3betpLSV44Pu7bXRk+VPJnPGz3sArEeBvtCGUZ2Luy0SfAzvTfKhHjZ920Iy932/PzM931ZlVVVUspwVs849dZRym7cuvnRu+++fu2a7vrzy8vofeo8CNn0w9l2t+l2qpSTUhWyEGOsXCRRAGMRNnRCAEhN/T1UHJyIOOfSJZAKdurVMH0BEqrTLz3jT4Zh2zZ/+vbDf/beB93FVVcVf/4Pf/9IayohCgXXl5QaY+fT6Ss3b9fW3RuG9epyE4Ml0QSaQHAqwBDRBqXLRzpqeccgP0pccMT7isUKMwBo5paiA0WEaOTMxCM0MJRrxtFvMvuzsQisrlHuS8jeApyMGnKax9k0u2HhFwjZmSNLzbkosrFIoGNRHenMo1hqHwn8FdYo3TOwRmfpPf8r7r20YPIdMHgwBDrOq6GlwGgq3FXz9MZFiDrhdGwPAEmzzHrDmziMg/JxOkm8rwmbFuXOhfLoYL1aOzRVQXuwBPDFuh+YNe/cuxdW6wd3bn+2uvpyvVZCzJUkaAo/ygw5bHaph58/pq8iKJGUKkYVEKELIRSk8YlACsILYMEEFi/a7ZP11afnL852K2fNiVB3WfFaPfvg1Qcfffvb73744ekrr6TX2La+1zzCkYNETbAE8+nLqPJZ2/7Vpx//zz/+8a82m1iXPrLBOkO8i5HzdAR9CDZGHUhvLY/kbln+3oMHwrnZbPrJbvPJ5SWfzX6zXl/2mquCkIgSI2zssNUGXoRP3TfwhCPucfPnzAEReoJUIwKmPNGb4OA6kzG3e9ioZKbJyMtDN8J0y0FOgcMUNucMoUQIibpezNyFVpKP6+dYqtKDiNODNxpylZyzMdJCKowVhCODM9D0PZQULkFbAubvEJZlHahKRNx7zYOrA0fVkAVFX8wNSXZx2weF5AEgHl+fGfwcnEQI+p9QsBDHfWVg4JgG/CzgteEFmdoOVpXV0A3eOUwEDt7jNggFEDiOl5RY56rJoixreEFufflswflhUVJnyoSB01v3dBieG3NtPj+uKxK8tc4Hp6rq2cXVYjKpC4XwFMG8guRUkIRhLEseSm3b1voghdCEffLi7Iiybx4eVGD6veoHy2hDwydNM71xfzo7oIQ0u+VuvQL2sxLwYSEPi6KdU8zWTiE6nDPxscGGuCQfHZGqgGPqRFk6bRIwFcJaP18cLRbHzuJFGhD2IXwPweqhjdbi4Bex8ej5HBkvjo5OS1U7l8oAoxzjDaEFyI7uaEoC/DvunIs+vd2CMtO3zXbpjMadQupY+12epAVa1/OqnIDeMGd5sD2ehagAjHnRfR9CrOqJdW4Yuqqu0KoWxib7eSSIhoHAJcBeLyCm8kEJPlOlokwhTxP8UjxGEDDWe2ORcjVq95AtT7N7efQhED4KQxiDGsY1iU82GynEa4dzSTAT1DEan223NkfD0kCZCRGeX7Luey7lwaSeSNUb96Jt18btus4Onev7yWwuZYHXUdbKO0ddPLlx4/2Hb7567Rpz5uJi2QyDKCUTfGfss9Xq6WbTBquqohRCKeV8GLQbggWUlr3J0BkT2vwsIXOROhcYJyKz2KgnQTtjiXg26LO+uzed/w/f/yO63nmp/v3j3/zbJ09oWeVuH25qDAC9f/f+jLPrJsjV1bJrBy5siJYRA+w2B5Z4YEqYoCPuOZDqTjBx3HkRyYQxQVAbQXJ5RzvHrAKD1BCaJzLZfXeMKRpNtOh4mpAGOV4rDIXQYECZw40wmzJiVva4OEcnfllQnD6zUUKc7TVGxRAmx4Ah/sgToln/RMO4MI54dvd5DWORzPrcvTl1HmQHOv7Ao/EXIXbsIsa5OR2TEDEFMWfdMkSqMc+5vXXXhRi4GJQsSrVcLhkXmSQGIFpI9Wy5PJ1P7symwsfb12/89NGjpda14jU4IDKIqUNDS/TTTW1aiIJGJVJfymOopBKRCnDPUIRWSgkprnT/yfLy15dnX2yWre5nlN7j9Rtq8vDw5P033/rt73zvG1//+tHhkTdGd20wlicMkbAoqAXReCpBgJUe/t3jR//rT378k7PzlnMxmWXqpw+qrDpnPCF1XYcQe6c1HMXD6L55+3Zomvl8+rTpf/HkaXF0/OV2+6xtgxSZLDBGYoAZKIU5fx6QOQhSiXRMjgwoHgoWaMxSKMkV/BOY9IEaNsB+hDPhrUfdEWyBwYAXblK00vAgbsLMUkqitZoLQcbppZAKRZYUlxXAJZBSDKanlOf4BJjweGed8ww1uDnzLsDQKx0oKeUw9MAMVeibOQyD5FypEgfRSirUOMlCWmO9M4xnI3NQGVFUjBDi8xHMflkMTHkE7miC95xRJSQk7RBMPRNCgIAhQPgr88ELLvPMnDChMFs6MslithYJJHpw+OQECEvOeSHLyXQBfv1xdfFc0nCjqphB1/tU/69ifNR1s6K8dTCTOJa0nsKG/sVqczifi9S2CkxwkhxcifJOhwLfljRt1+mBCymluOqHL86vXp9NH1QTGuIQEzbyUr6w7sngTu68KkXFGNmsL8zQYQBGJssQonUfg88p3qiXyJFrVDDmSYCBs/EhFkURibdGK1V6Z0KMQirr4uHJ9el0ERwBI6SIWlgQOIUI3lXa6JD5+DCtiWOoJONHR9eFVMOghSyELGy6vyOOKHJ9wtQyeCN8wlxeSB6j321XzXYdvUP/LWOGfmjH6R+v6llZoYYt7sOe0DEmV0HoMPu2oZRV9dRar4eurmoplUdAkGo6x7ESPm5A0AtoSAniKyopm1e14nwiylQ4jdFWuxC4UCQmXNg7y7jk4A7NoGyP1sgUhdEETq0fr3wpJSPE+cDL4my722n9xo0bLPoXF5eHh4eMxLNes6oy1kFakYNtlfSUbvtu2/WW8qqs5pNJ07WrYdgY3RndXC6DNdPDI64U7INDeiEkeOcpIddPr33jrXce3runYlwtV5uuZ4USZTEEf97unlwtz7reClEUUlAuuBi6QTDwCyCQ4sA5Ej/hyaJolikhQsQHj9YWnrCL4J50nXLmv//9P7hfTXXffTr0f/Gznw1lkY08x3Jgjbl5/frJ4eG872+1zflm1WXCM4W8I+KgrDnIPvIwdI2juwZWxAR/Y5hQUbE80M29HhQm4M5nITtB445R1TEm8KJqjmF87Th1/sq+FZYzIbK4jyEjmMJH6EglGSEk3P9cVZjwiyJJlLDl+XN2v4qjbRejLyssBQg+JhyO2hS6n0PDam1/vtPXjWFUeI7ZZXS/i4mSixCYz3mLEIGfdf90tCeMUCfRTJPlMwlRDtK5g6reWccPD6zVTQsm8mMrQxmzlF5cXDy8+0ph3M35IhbFzx4/dpQtypKCpDJPueGGhgUNFQxyGiB/SQSqIqk4r6RUhdIkvmi2n16e/Xp5dqW7GNw1Kl4Tk4f14r0bt3/rvfd+56MP3379jVLKoWtt3zMfJHYg3qH8Hq3lOaFt9H/35Mmf//DH//7Ro0vGaJGqrA/eQPI/pKxzB2EJgzWEsshYp4cJZb/z8AHdNcdHx2dN8+vlUswXz7r28XYXlYLZAbJDCXJNIQAcKfio+YDVnXfImoMVGs5hovc5l54JtddVQ3JLxCgK713uKHlut8AOiKXXBEM3AkZUGemmO9F575UqYa8VuSgSug77QSTSfjmXou9ans35MvUPEmEdzA75+BigswxjlEslh0FTygTIRmOC+FEVBayWgQnNMb+WS6WcteiMhbGYMGaMozExCE3RvoLkU8woOGLj3+QixJzjga7roJxGG7FUVGIO68QNMRWSp+qCMy+QsYLIDuM+wr7SlJMZY6KQar2+NLq5XU0kLFOr9HrFIPinmw2l8ZWTExJcIaVObYSfVtXgw3KzPlwsGEQfUmgRJPiTIPcqkGi833UNZQKTt79crc+3zTfmixtSeef6GLeDJqr4fOi3TF2//Vq6MqxbLc9h0ATtOmOwhA3GDAHmG0g1YuOzyyDSFVbmNiFdJUmMgx6UkvhuKymN88cn1+tqBjtW9EIh4ImBTZXb7dbW9GCblFO50R8Bu9ODoxMpK2OsKksB6ZnAmPFjUBvDN59AqoZzhsYowb5js77oug18+OkXa3Wv271j4KSeluUEEcyYpgaU3px3gx+1b9tGqqKqpukdG9q6riVXDjMGqBwFleOlS9PjgVQdoATTUqiDeioIE4T56LUzXIr0fFFmnfUkGPDxomBwiG84eIuNjlE0xznEvGzPLgmYREkp84JfDf3zq9WkLhezebNp5vU0SL4aBk2IC16pAoejAYYETBVX7e5yszUhHh8eHUwnxth1259t1o3VF1dXMfjFbCKLAgieEWN0vPXR++Ojo/feeufdNx7WTK4vL7bbnaeM11Mn+GYYnl+tnq+Wvfe8KsqiLAUX6R0gATmQlEL+bCYmSHihoEChIURHaMfoo67f6N2fvf21f/rW19rVpiuL/+2nP3wEQcVxNJqijBpr6qq6f/deNQy3vDdXFyvvNGc2JPCWXnUqvdFD9XVgCTlGBmZSsIdDVkQyxRsGx2p5g8pDNgdMfWwAUkMOLIVasq+y4eU0GLVGI3cK1CUUFMRjUOCYy5CHVRhFSPdhDpCGpMrMXGYjbCQjwYruPbPCiJHHIKWRn40Ok9lObXSB3oOJLFoeiVF5yo59NFqKZNMJyoEohqwEgiA3jhPoEWWTl0vmMEZTpP8z3h+RWBTlOpLJ4WK93njvQQaT/zbnfD1oZ917r9zW690rN0+frddfrHZMiqkU0Tkwj2Ucd9XwLErI+uLRF1zUUjDOIuObofvi6vzzq4unzaZ3ZkrZbSrfrOcfXb/9Ww/e+sP33//wva/fvHGDOG+aXdTgXQBBrcgUSdUPNp2cq975R5vVv/vlx3/5q19/SZkvFENjeABYxnsTvCiVtiaAlpwq2Qw9Kwpq3d1pfa2sbp1c29jhk6tlKMoXWn+6Wmk+mswKcMID7W+IZNRagkUyfMqQnA/DRJ/uUMKIdT41y6nzdUqVgkvCGOQ5YYoncq9C6t8lQ38fip0E/CcsIRk4LEaLa10YhWYPjVQPxahiZzx7CqcODtr/kCowZ13XAlXS59AaaHyds/AJSmS2ZCcbAFKFKLq+997BwjgddmsNEkrR+xdLHRdSwCYVBRJoro7RcEjuAm1xyOapqOGB4El0l/Bgt4SzbhzMhjHgyFpLxsYl3ZXQNGDcTerfOAUH3XFWGnL0KDhO2KqaCVFyTttut2nWd8pyAl+r4OhYz7/crrc+3D0+VPD2C8Gtddr6+aTedq0PsZYKdmrQMOHoBlpIS8Jm1yDdHJpn9un5pdf6W4vFFOj2jTG9c1GqXzVbtjidH14PJOq+3awvgFbGpBA5/sTaEF1uwaHTSmA4B3xHIZg1JvWsEjL/reOcWYg84VJGyo+PrwtZpsOfMLqwwUGvginitm03eujAfhvImOCmhVb3lPDZ/FAVlfNkUk1UUUbvhWDQ5qXC64IHE2pM3cUNUojB7rarzebCO4O5UJRSZ/Vgur0172SyKIppHP1J4a/lAQvyYQUX3pu2baqqUqoMzndtW09qxoQLOOfLHjE+BIjpwzFrnhEI0LRNpJyXE0G4Kgt4w4gslEtPliKMWlQZpuMaKOxNcpg1DLEhagK0wwwXwCiyxpVgZGATC6m7jgi5ifRsvZOgZBna9qAqzja7JgQqhTM+dd1MaGOqsiLeSSVbH5roV7sNI1SpgovScbbtu/Vm+/z8+dnFBZeiLMuqmlAYF8NRJE7bYOzhZPLua69+8OZbh9PF0OvVcmkHXda1LCvD2HJony6v1l0TBVWq5FwUUjDI1YjgVTCO5bIIx4MmWVPySA9n7e6tg6P/9g++Hzc7VpX/128+/ZtnT3lZoTojZvwfgg+v33+14uLGYCbb7Xnbas5tBMcrzF2I0TOO5hu4gI65w8qMKeccc27GeDFmn+YoRzh3e0cL1L7G7MOYHanCKLKP/7+9LKEvYTTdm0MSmoXCeyrWiEtHLVL+A8p5+vD4nreFti+jxxXJqSfoP4l9wN7HkuxTl+DH5ftucNxCp+/Gc5Vk490/hh+R0emD5rc4cgBuNntw7bmco8wZvaCBKYOq6BzGAlg7aH1S14HEviiUkqvlCtvtfQNCpTq/urh5eHhnNhd9d/vOnZ9+8cXF0ElKa7CyKoWEjUHgnImEHahkvFAF57K1w5P18rPl5ePtapNunHBEyF1RfL0+/INXH/zJtz769gffevPBG9OqDIN2TUeM5bnnAMgGqbkEctUZZS6Sq83mbz/59C8//vSTfhiEIkyC2D9a7wlnHkZRHloxKriNoYM1aR991zUPjk9uKcVcumM+Pb/sBd+G+Mlq2cBMMICCB3MGcT8L8t/Ub3oKroGQq+pTPU5oBsxUU+m02oAgi2qjpSwYEYTj+xFzouTY7gE7nGLKDolRcDqejkyrC+BAQdnIWUwfzgC8pARwcWGHwVzZmAbWb0Iowekw9Kn2QyrE+MckdSMhwMcC6xA2ZhxxIQvprA7eF0UZAHCG4DD7mWI+HYsCsoNkUVg9+OgwFZxk7Szu3FgOCcsWM0gB8jBz5wSTbnCNToILjlIqhczWNOO8CLOBUYicbhzn0NXOOy9yCB48lfDzB+9FUU6mU0K4dXazfnGqigPBowucsYILzsgzrZ8bc/NwflAV1loF7v/aWhLjpJ40TTurayU4GhqWKnWMAbqPthsGYyGpM1AhLGW/evJsTtk3F3MArWRnjKPUMP6PzW5x/W5ZzhinXbPu+q3Mnu55DwasdpdqCpLUMl8iHTHJhTNDDJEJjp6zQF3DrVECXMcnNyQk1cOHAMANfC1TgYlmaNtBd0g73R+E1G+FdFrr6ayqE0Qri1IWpQdMBomxYKUCcjSYtThKUh/gnOua9Wp9oXWH4ZeASaM1Rpt+JJaSerKoyykMlkYua3YLxyEh5YJr0/ddX1fToiycMbt2V9WV4AoOZOBcjNdSBDctADEMcxcICZ4Fsqink0JKwQdjKAfhJNDpjdGYnQk9cTp4LmsfmY+BcnSFeclNpeOJAs0BUm3Bjc47CK5m4J4pesK+3Gx09EeTuuZsOp1v+g4iBLkDv0w0rUBTI0ZIXRY2xJWzz3c7410teaUKpoo+hMume/bseQNEFpYg7kQIhUQqkCxHZ9xElQ/vvvrdd955/eYNEsL5crnrWkpIURVUyMa759vt8/WqMb2QQkFnLaBxk1ziK5QidXipnvLizOrPmm3N2b/8oz+7TbgP9JN286/+4ae2nIwJfVgQo9b6+un1m6fHddtfN7ZZXuwoNYSaGCwwn12knlKXfgc9dZC1sI+lhybAh5qRimPwS8TqkXMXsrlUnnWjFhY1nED8ZaMnDH3p0JG3rnsC9DhWHiVHNHtEj1FF9OU2lmZXdcqFqrL3xkhIiSNKyFCZkT3bZqzLL324GMIIsv+r7GUJzoSWzD3LYzhwx0GffDxE+zeKwzTSZicMyjNXMptk0VG6PEoH8TvhqJM4wipjjuvqysViMRsG3SY4xfM6O31lZgl7drn85r3b0vqTelJN6h998VizeFRUJSdw91HUPgrOpBQ2xrNm98Xy4ovVamOGEHxFyB0m35HT7167+cdfe+8Pv/vd97/+9eun17j1Ztf4wdB0W+WPkuzzGWOqviFBTHGx3v7y+bP/9Ozp311cXdkYy6L1vrOWq/SgQk51ejh9gsLptrWEmBB6H7X3zocTKT+6eeugKHSkT9tmHXwTyWcJKjmmBCxKBIqsI6U+glsuTE5BDxdD9kkgmWLOmQPSVFkUg9M+hHTpWC8lpL0LyQXHoLWAEQ1Ix4dT6lOzxMfwhJxTw8E9A0ynbUS3OjB+jfBtVFnATpkJIRHHZov2Ue5elqV3wWhDgdoKASkYIAbUCW/Tp8N4Pk3QQ1BKlRIwQR+FcJlSE61xHCwuYQZM66KSqjDagpNGJDk2kUESCYqw4DBnX1+PPxx4D4sQfGY1IrIPgYKJC2bZjY6MCQRBwjXoGGCWBVQsCw0Qg8AiD3GSGMfGVFFBTDq5On8ypeS4rL21jMdKiIqLVfRf9P2iLK8tptE5GI5wUOwYyQQ+skpyDO8rCgWpf6w3tusGaCkJ2h5ttPn07PJ+WT6czGJwQ4zbYQhcLp390prDG/e4LIK1y6uz4G26LSkfVYIJwYfoYDHGYO8aMqsvgWOdSk/6kQIlzKZPh6KvpFLT4+PrQDVn2fUWPPA5dHDem6bZDkMzTtHSr54gO8al6jtfTGeLEGJZzaSE7GrwVIkQWYv+yhzfUEac07vdZrM8112T+YFjCJzVxtphX30n06O6nkePfgV5YIcjSjzVXJBBD3oYynpaFIW2Qzd0dVlzoZCiiLuq1M9haCtH0jREacO4oYj8cDKf1ROS3hA/mU6FVIIXg+29dxEKLaTlZLwcGUOeUkAedXqQMsEx5iYzoroJ1iTACxy5g5iyld6V6Fmh1kafD31dTa6Vhbbm0lpDgk5Im4ymM5BZAuQxbNSUko3VG2M3xjDBK1WREHQMF03z5dmLJ8+eGt0TyCSWVcmYDNYDl8o5bQrCb53e+Ojtd9577dWFLNbbzcVy7UIsVFEpGSnbDsPT7fZF02zhsS0EraWkPubJlPGEsisSftU2O9P9Nx9+77fv3G83O1OI/+nHf/fCei5FTvpDZon3VVG+du8+N+ae1mG9vDLGMKpjNIE6DP3FEXSEs5TABh1rZGSRpaPjnSRkijO30XwDRRnYrudVM5ygsFfzwU4GGLNhHzcUR25N/u9s7wY5pmxmT+dMf6Zfgbzx5RgZKISyqLJhcy7BI5F6b8sRx5gl3EqM/lB7O6EsDSZfiVCio6l+BtXojpNFWHQkMaMCZA9uAwimSSQW6j0KgwKsMwPyOlE2DPvHEeCDdSUUeutszXgt+JrSajbfrDc4/ButtyPjctv3bd+9ffuuX2/u3Li96bpfnr+QUs1UKXwQlAFLim2dfrRaPl4vL/tGp4+NHjJ+J4ZvltPfvfvaDz768Hc++vZbbzycVIXt9dB1LHjmAouBeuBYRfSpA/m+ddQ6Z21n3LO2++nZ8090//PNbh2Jms2X3dBCel0MPjJqARgZ73tnYVeUWu4hRB+J877y/luv3Dsqis1gznq9cb4T4tF2s9KaCQn7OYGjZnRSdMEjcdhDow1WzQw/5RAT0ADJAtNGq6JglGkzlAoMnrwtq4IRKWXJpbDGjiyGCFnmaGzE8nkAQwxc6hLJY46RsQkEUzKaNJHeDBwyljC1G1YU456CUQGY2kdSlJUxxjnD8k+K9jGZdmitTTcIkOwC6iQhSQfc9i10DdwTTwJJgJgEn74OOhV674IUQhVF3zUo6sVzFdJ7w3GoFODLIcKHi4L6YKHz4CRnHEROVYzEOwe0KuGdG3VYqbooKWJwNrpMGsT4qQRZsjNGJhwkTBLKegJqW75cvqBW35jOBDBfSsYLxnvKvmh2lLHbhwsg5KQfVqTXzrx3gnHjbFkWpeCwuE93n3au7bqYY8Yp+Fqqp9vmYr19ezG/Bdyf3rlWG1pWj9tmzcTRtVcEL5zTq+VZKr4wP+fwXbAiIqEa9iejIR3j1vaR0kJKZ71g0lqd6ggU6Mns6PD4BhUKkr+Zc1bA0APePW9Nv92utB4YJm8AyvPRe2PAooLMDg7r6dQHWk8WhSysMz7bVERcniM3gFFi3dA1q6vlebvbEuIZz9020sO1Hpwz++o7nR5NqykMkjCljaB/5uhCmK4bbXqt9XQ24wIES11bV7WQQL2GDa3kAmiGnhAmmACqoEfwzCKppTicTiWXvTU2eO1jWVXRk2HQnWmhJWZcKuOsAQ2xth5OMsVFZc6KIyGL6OHeo2jUBirQrNmFHyZ9OijmodkUNjKx8+Z81zbGHB4db4cB7o30GSqhlBCBRO3DAOmEYHVAFRdtPxR1PTh31ey22njKZvOp4jIS2lmz2rVfPn+x3aycNqVQqih5UQLXAgwuvA3Onk4Pvv7wrW+9/e7d01Pft+v1sukHJkRRKC6ljmHVtS822/Ou1SQKxSsFnMxAWiF/2TVPmtVv3773X3/7t8zViizq/+NXP//hizNeVTnUMqfDx+Dc/bv356o46YdZ3yw3m45zEwkQr6gh3hHuKLMx2kgCw7yhmP1okA3jkXtFKjJ6rKFDVhwT+nJAQa6EYIy0t6VC6sg+K4iMS1oa6cvfHu04WLa9y0odvHPD6Nk8gtOMtgnnsmSjvImOM2c6Ruzit45oYg+zcUbiPooB/wgrKOxRxklVtp8kaDKFDUB8mXI4bov3uuQ4Sn1JhASO1M4EMFrOWmM2vmLwqx4nelEgYIF2PTBGtLlRVD3joS6ZlMvViglB8wviqQYL8XS5ujaf3j068m3z6p3b//js2fNdMynVQVn03p/33Zeb1Ze7zdpZG2NN2TUSX6Psw5Prf/rN9/+z73zvex+8f+vazUjZ0Pd+MCKAp6dzFIY8cEsE4oMEC9po/dC0bdutbfjZxfkvVsuPB/33FxebVIXkTpudHoq6QhdF41JX6AMxqb5xaz1VRW8tFGMquLgxmx4V5dlqtQuxoWRt7fO2WVpD4DEO+zQ/muepKCKMwHDx4C0F4y+ffkDUWgK+MzbdU1VZaqsjpWVR9rpHuwOP5AdOPUS+eDD8ISzfcZnbB0WFs9F5A8cpYJIAofTIFuaEUWuGqigJrGZhhEsD0ogwITE3SnQyqYwZfHAMI94YG+1XcRxtg4+QSA+JszkfFm2qA+TCMuxsi6rknAUXheCBEAsuIbKolFJ936ELIrK198I2FLbiYjH/VPBdQrqtJM3qd3jgBMUVOz6EjO1l8RGQMYPsbxDIAmyl6MEbX5qih+iVKpkoCsGHdtP2ze1JPQG2sxK8FoIq+Xi73djh3rUTTvItzcB+i2IglPOSi7oqYgRKHefDoL33ALsD8BADFfyTF+eu1+8fH83hhHSppvmg1KdN6+vF0entGONut+zbrZQCxxIY9h2id16HfS+PrhCUGTMwzpSSxjgllbaDEBS5R/PFycHxNTZ2CYR4IQXCTKDED7vt0lvDJK6nSYLX3jmnMXxtMlssFieUcFmWIj0Cho1+Q/D0+xgdAEO721wul2dts40Qm4jRiwz4mTHGwegQ7P6ym82Oy3oWA1oOEJYaQQk/HowZvWeUDLq31k4nc8o44OC+rsG1liLFPeDuJY4rMSAVegpyeUHCQVkvJnPOpY1BlDVTigvhfWz7NoB0DR0rwYsxx66iH04AeR4yRjnxJWMCJBiUZYIk6u9CyPHsEX11aI79h5UCI5SH4KVUlvPlYDZ9H6AygdiW+eCAbxFgrcyMc2CpzmL006oOoAsnsoxcNNacrVaGxKKcpKac890wLJvd88uL3zz7ctv1lVLzeiJUCbn02GA5Z/RclQ/u3v+tb7z/8NX7MyXb5dVuszHOpYa3rIkUOoTLdnex2+ysMZSSsv6ka3693ZxWk3/5Rz+oekuV/Ifl+b/5xc9jug/xcsrJp9bqG6en109Pyq6/a7rN1bIJxFFqQoTchVRHbULAcDgYytfJOOZLlyHsNXwB8Bd20tn40ed4BupZjhmMY1ZQ3CPDDJHJmLVP92sCuF1Hj42RRx0JfWm2Mf5KRlrd3uB5v7rlUlZZFbT/d2Ss/MhIHHfLuAsYbSnZS5tL3OTG8QcZCW8k98sZtFNs/7N3FtsDWDo6ZOH3wO2pI+gVidfhGOlPMLRhRBwxv1yG7BOgTnPnj+ty472Yz4eh79peCE7jKJlmNHL27OL8zVdeWQRSMXV4fPjjR79pvG+G/tHm6mzohxAEIQvKbxH2sKx//879//I73/3T7373a288mNQTo53pNQuBRU9DEMDSieA8AJG9UQKbtm2avmkGbVsfX1jz47OzLyn7fBg+2Wx2hMiyMj7uzAABEjDTjIxDYoENPhBmQ/ScWUpaq6Gp4ZSQWipCyRCpJmRjzSb4q75lmHfNRgllTqNKZy6Vc+BDBljKgYQLk+GzKpaQbEEwDENVptLYaV1VNQFWkSpKIYTzjoGLAKbo42cfAAETtrfwZHmYGDDrmMOmOTpvcxR0JEzQdNMGp1QJizzGBMMZMovZAQHtXimhVVkNQ+994OjSDJnI+3TO1O84B/wXnIGjnhqMNr1PvQ0kAoKemeOcR6kSvLEwTElwyXU/4BRwdB/MNooZcKCNEaqeOIvBE1jPQ0PpmcCsDu+c58C1RkELipQA1TF0rgPSCfCzYOqFlqPIw4JnRlTllPEEKNfb5Q1VHDLughOU1VIoIS767omxNw8Pi4LDmJ1hKK4U4LsBX1RAtADs3V2IGVRlS1vCHGMfP3mx8PEbi4WEsczW2Ehpz8ivm3Z6ensyWZDoV1dnIViYgnoOKmcGgg2gHGevYxR6Gz1IyRnn3rhCltpoyLjlxpKTkxsHh6cuHS+KpqFgVZiqgPema7dtsw1AnsKJlPfGWuNAjkIoU9VkfnAiZSGE8s6CsXfeYTFKnB2GoXWm77rtanWOYwwOnuT72wnfk2HoU53OFxmbL47LaoLZRCQSIdVkOm3aXXCe8dQmMkEHMyR4VE8ZE/0wWKMnkxmcY5UTzRlO4H1uv9KrgsW39wXnJ4uDqpz4KHrnZT3xEdPouXa6MwNhVKKPMThNQpvHgeqRWjtkRKSCGHxdFBgaipHV0BGGcc8IIx8YOKbeawxsgFgN7owFQ7QEfjyhffAWvME1kLarqrTOOudYZFVZuhBaY23w0PvSXdulm8cF56yhwTBqmLxsd+u2oVxAJ6EcIZrR5y/OHj99fLFepvewLAuhGDBXIhxLbxzx7s7J8Qdvv/2dr7938/o1a8x6ue6ahjJSFmVZlJ6ztbFnbfd46L80xtnhn//O999ZHJteXwr6v/zd36yyZd0YW06pt3ZSVa/ef1X2/R0f4vJyqfXAuY1RU2IpCn9h+EypB+pyIDm/L7duMfWqPMYJJ4Kgyo3kr793yKJkZMXTMJZMFAOHfexQXrft/1Xe6uKWGHe6IWdJ7p31RqiMHk8j9kW1LY6vuVAlToPDyN4i+9iFmFdi+S2BvSGwBcZBNd1DWTS7xO/8VQNJsNpArMTzvyA5zIHDFwyYMwhD+Gxhy1HyBe8QxqvFUTEzEsDRcJhnScrYK1IQRRwRwmTRUlIdzFerpY8eM3SQQc453xi32y6/+dobpB3uHB4OjP74yeMOBh5ljIeE3uPFt6aLP3vjwX/13e/94Qcf3bl1iwai254YC3UsMFhkM++D1hQmdYxEzmn0drfe7bpu2zSsqFbGftJsf77b/XroPmubx7vWCIFoTAdHuEC3puiJo5FwESgZnNdg7DJ4bwkMkSkTkpMQOPZPUm612Rp72TUBkjrBzAWfbYouujFSH4IJDvLzaSqdLD0qkMQQ0HYt5nheprg0uqecVfVk0IZRVleTtt0pVQgmYJ4ciqIqqgoymsI+twvsu+FkjYIzqDHo+8jBBNgiwQVj+hljvR4geJDTkNBq/Eo7tl9YeB+EkEqVuu9Hc/+ILh9kz4EmwTpDYTCAzlx71jROjhLwojRnTgJnW0ouOQfkaIuikKoYdJcqKyV7sv9esU9fHrfR5SYBeQLUeqTvM8EYqEoI+0q2Yfb1xNwxmB4xlGBgTiLWBIbZKpDVWFSMF4yS1fLFgrMbqgo+naWSiwljuxg/7rujujqaT6Pz+0YH98GpCvrIOHwKSPJgY1o46GS5UJvefHp28Wo9eVhXNFIdyG7QTMpl9J/1/cm1u0UxcXpYr87xQYdWL9NRnDc5qDYrc4I2WipJKfPOSVm4gI78zHp6cnJ9ujgOmfMQ4WCIHOdP/W63HtomvVcCWhLvjBmsswTwX4hRqOrajdsMMlFc9JDUBTY3JBrTd/223S2Hftc0m65NVTyhRjr6ECG1GoaiRg94vKFqioPFqSprmH5xKZUo1GQy3TUbawaUlXHGBt3HECf1lDDadjvn3HQyYUwJJkdh5chlCkgMQOfcSCmfFfW1wyMhqyAU4UXAykq8i6mcYVcIqh5PwBMbbMK8g3CUhK7zI5MqtIDwhgB+O4SQShU0egH6cTAXIpAnyMEkkeKdF9N7lZ0YBGc+ekZ4Nj9Jp4VD6xMEw0hrbmEVUxaVp2Swel5ONYQqQyWOOO4CfXbsvGti3BjXO8eEULKklLtINIlP18tnz59dPn8Woy9n81KVUkoMgmQ8lbpgXV1Wr9+999vvvfe1116bTSbrzXa5XGunlZRFWTslnml3pds/eedr//k7X2/XWzqb/MVPfvjz9UYWyuexUxy1iPHBq6+WXJw6d7TdnO12neAmBk2oITRdlTQYin6T1EFgBvr2kcwCJd756EPNac3GYFACKBngwpgtiCUWPR8hMm5vnoci4SzLGi2lMykqawPyFBetXAhFOvI+6yrrgUdYG8noV4kGU1yVDD0JR6Cc5UovfSf3v+RCnBfYeY+MKYSjA2YcI/1ztAHNrTj+gPmWQNkcydIiwr5KukYSpmDUwbwJw2qw+jM6Mk9hOslesqjzLBFci6ix9lqhXAhDNVWlWl2t4O6m2ficEinks9VaSPG1G9fNtn3t9itfXlw++f+4erOfy7LrPmzvtadzzr33G6uqx+puDk1SomjLNgWLgR1BkaAEtvMUJK9+EGAkiIEAARLkf8iT3/IQAxkeIgjxWxBbAgLYMQRbpGhrotgi2c0eqqpr+KY7nrOntYO91j73K6UaaIld33DvuXuv8TfsNg+7/pe6xd999Nbf/9Yv/oPv/q2//YvffnhyWkItu0tOhlz6RM416KSafQnIA2RkJPzoN3ebMUxFyFjEGtRf3N19Mo6fR//JND4Z/U2KxdFQl5R7EY5SoiLXb8mRDYt4oiJpBkrsflIFlAbK6WIBNdhhUvLK7zz99sy5h+hGhUxJC6GdeXdO6wAgjhdQK1wjCGlHEAAOJRipweSSp3BYditJFuXLYUlNTNTGcMupavBy2lqlbGYVy7azYsEebjdpACyO4kj18scU2B6fAN1K1njqe9dR+aUIU1rfXcNQMaKYJsbGdtZ1h3HPDdBRjVI0LxBJcJ5YhCDtCmiC5PMAJ5Gc2dEmiPhdbTpE6hmojQGlwjTVvAisQccS5wxPkAQfgtZa1YICMKdSsjEWlAaqdZSGo+mmUA08LJis0v6pIZJOMQ1/chTQiIVCQsxRO2vdQml9d3s15PDOotf15RQLamFskPCT7UZpePP8AmvcTvSoVJOTIANk0vdo838gBeR60bQiWRD9bL15ud7+tZOzt5TORRxSPoQorXk2jldZPnj0vtJ2u7877O/I6FcxQqVtqJDNwwUPGmKYrLFCQfSeLA6zmHdC5w/eWJ6cNZ0eYBXZtukP8bC5u4l+1LQHzjnFMPk45Vr6kENwKtYNj958R4OjvFJ44SIFpjiFaT+N22ncHfZbHz0266RmiTjnnvpdMXpWXuOzoZQ+PX/DdYMoUttuuTrtul4IPOy302HHAjKgxOSnnPJyeVqg7Hc7KcUwLIjFpoWSmhWAmPwtEIrK9dMtmjqU02F5dvGwKBsKSctB0cZopXJK0YeUk3EdTQ5qk1t7eoEJsZZOynA8zLJoqTvrgOS8sshQ37pjtl3GbMgjN6eotJpNYIE3w8j6+bMgvyY2Pbt6E/SaPgJVL1dttUsGgivS9cdScDBdLGlK0RlnjJpK4vrQWB1pvGSUzlJej+PT7faVHz2pel2cnCpQU0rbmL68vfv5Z58eDlsNcnV62uj4pKKCmDB4EfGNi8tf/sa3vvdL33nn4WXO6frm7oB4BfL54fCL5xf/6D/8dbkZ9dD9y6ef/f5HH6nFQGcPGKEslQhTePettx9cnC+2+zdjurl+eRDCowhCTEKG2ujXqJ5LzQaRWr374TGvcgvWMleKE4qCTZiCAeukZJDLvSBg2+nyjnU2X5qRxces2YDTLUu2XrD5sx0VP5rp/gzHwjZuLK/Bq5p7kTKuI89fcW+rNKNejj3sTCOepx5HHb9jly2OYpRFvj7FnjO25OK93NOh5HEsLduSWxbmh85vWkqaxzL8pZGSm68/TaObveTMf4GjEaEQXUzni2Ebgzk7CynudlsWJT6GaGm6p89fvHXx4O3Fwnj/+L3HP/rs01fj4e/97V/9R7/1n3z7waNT7fxhn3yAUkCUWq0mLBFFShrkOI3b9bYW5NP45MXL0YeYMyp1yOIG8Y+fPf3x5u6n4/6zGD/eHT7frrc5SyITh5BA1TRcivApcRrmfJzrkap9P9mkCK1VTNlqQ6s4dMYMpsOMXpZX435MSYDOpW0t55kzoXp5aalVLpjoaBnSuEkltRYNGyycgx0XjN4Ho7RzLoaYC3bDcNjtKavWUJ5yBK3pgKpuWFDvJWZ/69Lchmr4Z5X8xmUhgmwSJcHR+sOoEGOh9WcuZEeg6aCjpG9sx5YYmcj8hf24b3VTQ/4DTXR5UEQBPUfJubyUWSCOR6CRjxGyJDZ9gzWW2P31Wupa2rvJT5Jc4luylky5hyaOTwthBce1VMmINTI3wVVSl2lYbqFJv5dMmdS8LSw8NGarD0F8Fcb+sxRc7XWGE2PsdLhLh807q6VNKIXUUnb12JnP9/ttSo8fXhqmhJXGSQCaexNeR5CpDmjQvFmo2ZFEuwXonz1/IX346xfnS/rqXfC1rnX24806Davzh+8IKe9uX2KayDewMAcZoPa4ZCHBcO4SvXfGSoAQAtvXNFSwhPPLN5fLE8y1EWfiJn3U9ZEGv1/fXTMGjdyuwuQPERPHAEr2NftePnpbKxcJZJsxAoH4ptr13k77w37chOBFAwBDu+azgDcAlBw9kRTargyFMd3Z+SOtXRGqH1aLxSrnfBh3vv64jVaAuSirp+mQc1mdnGVMu90GAYZ+EATTJyQ9kKQE8okoDaNcn7jV9vTk/OT0wmcRSFWnAFjrYgijn/i9+eDZcV8IEVJMpMkVc1DAlmmJ0xU5NikFEH00xgoJtc6Q0nSuyBJTNMr0zmFOOUWrFVBdC6DItbNWjjT0EmQdQf7ZxuSYu86BkD4lCfXGaWtyzkARwxMGgLjUyYBOKR3ihEUaa8jji2BDNK9fLpZCqpDRZ5xKut0fNiEKpc+XS6tUlupu3L+6vXry/Pnz6+sYw9nJCXk+AVXk9YHFOIXDoRPwjccffPcbv/irf/O7N4C//5OfXFrzX/3mf/wmwaY+9ePv/OAH+84y0HYWeYTow+nJ6oP3HuuDfzvncPXiJuQI0sviyXAwCJFoXZ5JACu3hCJnthCZUqekSl4q6diJerZEICVCyb6nsxEks7zE7KLLOoJsR8SLwpkTW1qnyPgmKGoeZB+9Y45DtOM0eWbdNljq3DaSAXknG7O++RnN0+WjFYI8inPN+GUx84GObTM7lwgGXpGugWi+Rzx+Lg0Z9LoedBv3sVqWYIEsPuf1a3SNwjUnzWBJMZsZN+ezWTPkqErd0FgAEGM+kXJpzA3K1cXZerMOIfJGcHZvqj/56atXf+2r77uEF8YtTld/9PmnT66v/sY7jx9JHbcHq4RWlHdDkDlbMEmk693u05dXP/vyyWdffO5j2o9T/dzIM+TK+082m7/cbZ5b+1lMP9usP99t7zBhTb21y8zIUroy0xxEGetpxhwiRnI3nxIG+oJU5uBH4gS1hCZZJVTibprufL2iRTb+JJMpS4HUCFy09yWnEsEiykgdcE78t+TVk1h2gGBf2RqNKHyYuq5TAKMfu67ToPfj3jlHARGNsabrS5HKuCKl63rXuYxYqwhqFGfzdHafV81Zg8QJ2TqaKMVgNIzTJIHsBQvhs8r9zkXM4BNBUPLODQDSj6OibSIltUKkW43zRJd2woFoJIYwUeysJUjlP9bQpIDM8UvrXAmQpmQDNBlraW5ZmODUvC9lS7cUjGqJgk0OruaYmCKL7TNNkW9JeY1wII4SNrQiQELqYRFGG0Emh7wwJ9kK7OuT7GMIm+31m/3yRELOSZZilbLD8MpPTw6Hty/OB6PwGJx44ddqc6pGmqsQ74s41shQxI+/ePaGUr9weqZTRik33gsJOw0/3e26szdOLx6GMN1dv2DebBPCZQECEkrjXW2YJmdtLfJiNtRuKnLOVspdXD5ydkAkBUd+UJiJzZV3m7vt9k7V8wYxTeM45hTbFqqQ9n9NcfbRG+8osLGmExGTF5gjpe397i6GMcZIs5x7ZAsr9DStUylSSjGGNsKjaVvXn5ydXBBG2y2WZ67rM+bDYZvSuNttlCK/UWtY5Hm1OkVM+8POaOOckwKs6WVD25DqVpnpQAQYFCj6fnlx8cj1w1iPV9HkyleLnpwO0+g6J8jUnSTKfcoxZepKi7DWsQdU7U21Lij6rq/VDAuzt6lD/cc4KxCNMUiArFo4WgtYVCmGVHESgTAAFNKULJdCd19myiogJdbfWmNISEkza4DWUvvDaF0npPQpSFBW6xjDYrEEpXyKneuDT4u+k0L54EnYCwG0NSZLidbc7PfbMO2mKQKAc4uupyulru5uf/b5Z188f55FWS5Xi8VSFu4EaJqCeNgdnNE3Sv6Tf/F7X+43//BX/4NffefdcbMLvf3ff/CHn08erEFu6TmC5ayk/PDrX9VY3gnBbdbX223U2osSCAQTRUkSGvtI8GioJRO+/lLUnqRgHmTp+UpAg1kxgqzM+XWON82q/LiJJR1KaF8BvCyY7zccGbFNaVmyT7CYbRJm3SmeCEKZt1qNRXsPPlbaOmgKjLME9LGx/P8n87nfFCwR0nLxcd1bxNGJUMw/Z94dk53+UZpLzlZtbcbezPmP2iLtR9bCsJ4t6kKkmgH54l68k4deIOfXzWDCkkGhnx64LmEZjXbL1c31dSNAHcsSo+7Gw3q7/etf/Tqs948fPphS/P6XT768vv7Vb37rPOeSUklJ1UbC7GN8cnv7o6effvzy1cdfvjCuOzk5pbWmSSCvYnyF4ke3159E/6Prm892uy95eEp65D6EWkzLWopKZWJtXlUS9QrFVALW7thjDhQiA5GIClEqe2PZoZKUzaVzdhfDzTRlIFBmg7cBiSPyTp2gldAEZ1LKBOXRPC1AzEZrVjqt6UiyjyzQYBCN0ftpBFB918UQsJTVahVjzCnR7A5KKbYfumFgfJZSSmpDTUatVblzJckjxeBiaiFoXJOxNqNcSrJ1QSne8yCa572qHWDWr+ZQiqJGeSzO9VKIw7RXzWuk1Ye0O8xHpEMmKx6gfkKI+8qwdnK0MiSgdSY9fIGpOOP40JBGk0kxpphAzhZPTcKuWTeQXubM8JOsspdrn2rqr2M/FSKuk1TsEc6lIOesZtMErptBqxpuyQRAkb5aPYmuF6Lc3rw8AfmmNTnVYkZLIoqk+LNxvFj250NNJITeIm0HaoAQ2FNGKEV+ZTQ3I4KKVFpf7w+f3dx9c7n4oF+UXGLO+xBAm5fJf+795cPH3bDarm92uztWEdHKKKmZ6FPYXLmUEILrHAXTbLShHQFkFNb2p6eXtLVlaxUS4CN/MV8z6E0O3iiJJfvxUFtYxhNRWc/DeanMm2++wz5cZMAc97uas3fbTUqjPOowyEbPZMgCo1RoAICBrPuZqUOfgl6tzparMwmu65eL1Yk2tYXdbtZS5P12LQElSmX0OB5AitXqJOe83Wyttc725HBlyf2fg0mtl4G9KpkXDnq5PD89e4ACAnlWUhiTxthxPAQfFos+Z1JZUSABU6jlNEAxama1FgJ+kH6HBKm1lUVEsgE3ziXWPGG9Gqh1aj1VVicUtWTPqXd9vRkxdMbyikfwFrkt8WoEyAUVoQzq/ybmsdEmp5RpdNg5l2OuKZnC9cFPDGYc/XRMMIl4htZ2sZQxhJAyYxMLsRqV67eYX+x3d4d9SLEeQqW0tXZY3Ox3Xzx/9rNPPvny1ZXrh5PliZYGY0kYAcxutfwffuf/+H+++OQ//fo3/rPvfne8ulark3/+0V/8wbNnsFgUlqssnMNKDOEr779/PixPD9ODcby9vtpplUoJRXh2XCCtIWb95sJQE2JXU4DXUqZag0QjcUGyA+Q2xBirGlqYscPz4dm9XCIc+eFiluBoy9nZiJNNOO5hyqxNNC+sOffCzB++F8oq98bP7cc0UUtJKOh7+6N76BYPoJv4Bc+Km+ZaqxfguHOb+9AmoDVPbAQJaoqjpTFz8rmtEG3d1pQime80q23OL52IRRKYFkzy+U2ut3lFHY2CgRpE0nmXMItf1mI7xHe6/jZntVyiKOv1HWgj74VJBFj75Oauk/iL7z3Gu8233n3n05vb7z9/4kf/3a98rSe4w8tx9yeff/Znz1/8u6dPf36zRq17a5ZdFxBH0HdF/On1yz/fbv5sffPRfv/ET3e107HYqGiiFo+lGSzXS2c0kh0XAPmBKBnIzyUQvUbRzrW0jWM2WhnQpNCZtFFBlKvdLlPQRiQvT6rPEhXQKLJkO1vEmFOT/CZsXQEZY6AMpOiDyZJurzW2UCKBWbc0TL4mFW2Cj303ONcfDnsgnf+UkgTouiUiCQ3yjEaqfjFYazBnuo2CZJBfg7fXnIspRppMU/ODRauahEKKy2HAXKSqkZ/cYXm5wkdYKWKBlyKs60FAiF4qRhA2kxAADSw7wu0z1l8kQOj6KQMPLUlyNtccrEl9g5DV0Kw3aqEtpNS6tj+Ykcj9LIPMUDIoM6eesIGkwclzUClLJplGloRoXT/xMtmim2CW9G8aEEIDPNTjrwlSm5KSmgGoruuM0XfrO0j+8TCQxV1RQgzaZQU/2W60hrcvLjDl2RibmfGzfCOv4+stoP1ZLcWEcvbTF9c3h8Mvn54+pDsxpjjlesY+mw5XWT566wPt7PrmOoZRE54YWaYKyTRLAaYUkreuRySpbW1YiD1nOSxWJydntHo0BPym3ToNH8f9dru+43s4+YOfxkyOF/N2SfJGvgh48MbbtYDLOeV42K3Xd1fjuC05tRK7wVJp6j5vxphbp4heHEKgbTfJ7WfU2p2cXXTdQoJdnl44UnsuKW92t0X4zd0NGWnWs3E4jEbr5fI0BL/brk1tQ7taDBlDDxIzQ8vaph5IdUv33XJxej6cnJKwSmIFPkUVbg5JSNF3QxEipqnUgjNM0TfRY6kKHJ1nJAlCyYxCG1uokqvBkArEeke0UkYTfDKRzhd5GNAnnVgggTCNTmnFqE/atdCho62/UkWiJ9VJJVUKQUkqOEKIpcYEVxuAaKwTRezTqJQuEsYUM9bbNIUoNESRIy0gQkqusznXDkArSDF1tifUOmhtENQG08vDYZPi3seUsXNdkurWp09evfrp0ydfPHuGoiwWq8XiDE5P/8ff+7//1z/+w+88ePiPf/03xGav++6PX7343R/9RVoMfM2PsCMfwsOLy3ffeqsf/VeSv7u+2qQcQXhKwEmS4aCERBBKlJBFwVl1sokoUw0hEZcSLKFUkRLRLPtcGGZV7rtRVRrZVzSHpOZdPC9R5+/EuUMsM6T5CAxug+Zy/C9l3jM1CeW2CD46E0l2SLeOcjowl0PCPVxavrb8Pc4Jxf22GMSRXTw7Q7Rf2xBibGI0O3UXOP5lmZ+TbMAubEsl3uaKmXvMWsHYGqi2meO+uiUNngUgJ13RnOsaYznl5IQ479xdTMPFg8PhcBhHXY8ttNeIRVn78ZfP33548f5ysLF8+N7jP/ns0+9/+YXqu6XS/++PfvzDVy8/uroaCfd6vlyeLhYJ5Be7/cfj4d/f3P5ov/l4t30yTXdFZKsiCpbABOIDFCETya/TvanVKKm8KhQlZxGIxJdynnKs6UHRUxAEVsJiaDNEuGOsQU7rzTQeMDXD0DZeFrmWgGQtQntT8k1gWAH03WCNJn/v2NylUNQmpggqqxObwkVKQlLUWoF9AId+mWgH2PULkXEcD85ZbpS1IzsoMvY3zhpto4/amG5YGNslH2OIwHwILrNAaV17xBgDGZ+0T95YQ4NfYbRlfwXJEld8AEiWuxyPcpH9UONpCFOhhaucT6UCYBbELCNTcoo5ZcJYacYTEU0o55Q0ectgirMIsJSqFgS0hFO1rQcdvK+lABOQWAOW0PWyiMwrQDbt5iIzF+LdGgWazNZE4k0kEe4KlxSNkMRdNYluNYP6lDGDJmdiqbthGP0hjpu3+17zKFKgU7oz7pPddpviuw8faoLSNOUwyZ537NukcDayL+0JlyjkT5+90Cl/5+xskXMUYvQhCvBK/my3Dd3y0aPHMYWbm5dSJLZB5YtEYD7ad+SkjCWLBAStafGqMorFcLJYrFCQ2jWoVMsLoFG1325u/bhVSuQc/DgSUv0YF4H4V/VhoxAPHr3d1/Juu9+u1+srP+0xZ+oMZ1XdVo7NQZALbQITxOBTCqTjQ6bEQlK7dSbBGDssVxfO9RIUxjRNOynj9vaGy1oA8N7r+kWLwzgd9tthsagdCLsHo5xrNgllJn2itK4/PXtwenophCJEbW4aMTVXmuhDLtkok3KMMaQUcgoxk6o91ExF5XQ9atY4IOlQss5kJi75GRe6BaVIxS0YNRv1WBrb9QIx5MjCMDRh0Gz4EWMUudj200XGRCz/xP6MJCRXO3rK68UYbnllSEmQ5H5mmQnilpVc62Z2DiWBHjqR2taOnC5YvXA0FqjtUM5NQFOpmNA457FsY7z1YZeJfK1NUurqMD7fbT9+8eLPf/LTl/vdv/j043/yL39vodR/+5u/9YZxOYXnQvxv3//+NWhJM6Sm7illjNEZ842vf+i8fzslvL27HneTlglFIL5vFCJLCAWDwCwgEymsNN9DTnakyIvYKzmwTlADRJdMnkN0vRo1hylwmSmUbMshSPCJdCNah4nyuCid/5T7kW0T35gtfTi/AZMlpHxtU8tJuIkyz/tdpV3PGltHRt1sx3C0ZWi74XuY2PEL6YqwkybKchSolPPausEiZg2dwpPJYxst21yvqTpz6mWp/aaGXctyVZvgGrxnQ2uea2MRx82QbICMUuZSU7DzWfDhAVnm7yQuzk5vb29JVRiOCDEBIgE8efbsF95/fxXTWddfPLj84ac///HVq6d3t7eHqWitbL0eoFWw5pP15ke3t58cdk8nfxXjDhGNS9QLcCIkRQHwMaFU2phUMBE7kyXEUNC2hkeW2iSyN8g0u6ulqiFJLESeXmdiYoJRYM163B9yKFQpM7E3l1kVAGggy7gMqL+U18bsS1pTaUwaDOnHSiYSGWVQYMqB6ByShlS1UdfWTeNorXY1QQYg8aqJdIus6zCL2ot3nQ/JWKelPhy207RnppS1/dCvfPBIKGvRfBcUfU6YSbGZCDOtWITmvmCV0qQRrVsBR4+xKeHOG5ickQehpf5whSnTeLv2/UR5guZrLJmWlWOoWVYb29jJdFdySkzICMFLUYx1nCepjawXkjA4YvIjCayyIRccDTdhLhLbRJQmoTkhwQtEPWVcYhLii9R9iRCcW4fKU+rSanHIAqcUDZFqS8HasWFer68urLkANoYrRsq+d1+G8GIc37g8W1pNGALurWXjYSMPyZG0oJFm16CV2fr4ky+fv9t131iudM4J5M7HouBOyZ/tD/3Zw7PLR4fddru5pW6KDKBmggPmLDKqlg9qlUNq2PXeLZcnrutTLprKDsylvgMppnG7Xt8ygnD0+xAmgQgKeJAH87V1ritCLAlMe/PqxW535+Mo56meaLg1hpaWthKExl7ksVAtwjBTq1dvmjbu5PTMdoMo+vTs4en5o0J7B4ASo49xv7m7qQ09aCnAj952fefsbreJfhqWS7KzVIQ1bkLWoJTAZp8ByixOzlfnl8Z0kdDD1tl6Q0t9IxrgsN25zirCpiHxnlOOWhmuFoxxWET9XNrSoZZrxriu6wEgxKiUkgoIllisNawuGVM2Rtc+1XVSQq4RoH6kLBQvSCOWlCXQgLW1WM+9MRoI6MBuInRAKSPUbpiXfJHEeEKKtu9I205po0KKStXfBRqKyFhrh9i7AUvOGLVm+XHfWacU9F03jZPVVksZqRNI9TJqWdNhmRC9FOtp2sQ01rdtgpRewk2M//bLL/7PP//jsaR/+L2/8723Hh/Wu7Dsf+ePfvDj3QjOzpAIlqnHHNM3P/z6yrmzyV/uti/W60kx5EpGAUES9qrWjBlZ8Z7FjVlItm1Za9BTora/5giLJqNOkiyDcqTrNG8ikeWR8AOFR8OzOHz9biQqLNxTLYj4xlKWII7si1kRf5Z7vscbMyWpOaC2k85kIVBGd1RKsgUntH3LjHyW8h7vJO9B0LyELTPAq5GrGjiR3fCwNeE0f1UwZ++GzW6PqvUGTQFVlNknojT0FqGySFmIBw60uGwSmIxtPepg0zOe03/T/aP3kL1/5PqAGPphWHTXV9dcNc5y2UIpvZnC3Xr9K9/4MG+3711eBBA/ePL5VqrzszNba3zYgPzk9vazzfrpNF3lFKzxEoqqRSYhiYBkn1BbG6jnzUJmbK6/oFTMqdYSRCGE2gHIJGtyRZoP0KCyvl6jiNSkrSaPGNCKCEVin8OIiWRwCWIjkCUseAyCmMpcGYHWpUhrLYoSU31RNK9LuRRtDCs0sLCtNibWptA4U8teTlPWGglyHKdh6Gtyy9F1vbZqv9/3tfcFzNgNgzKO3D2TUqYf+pBj7QKVEaCWq5Oc0zSNsmUurpU1+dIEdkOq3RvZztRuhizGSiYVZU2k2XoIMx8+nPcrTKAahiX7wGhbm3X+sFkwjgbA4n5gQzoPWNDU1m2GURMJGEAa6vURhVaqNjtqph+J4pwzuvbBLW/L2j23lvZeHR3KkZZPSSqlCPWRWp4yQ2myOXKGVdMGlBhQJbO8piJqiqiR1xLhxHa2u7t7ZUC8aSzh9GpD2Dt3KPjzw2G16B+uFpHQswziFA2nPTsjstMD7XLA6Ke3t1+ud98ZFu8OQ8nZIx5SlFY/y+npNF0+fM92y7ubl34aqftreD1BmGrEXBvCtlSu1R0jr4flCU8stDaEooL6ZRh327vpsJECvZ/G6VCfGP3tjJdqoGlacCK5QYnN+jZjqM1c+9VtACnmf1EN3ToOahfrUYlxElIYct4VUi+Wp8vVaX3eRZ1fvHl2/iCTEQim5P0uhf3Nzasyl2gxpq7vrbWb7QYRl4ulIO1NqXSzUwfeciHbaqpuuLh41A+rZoJJrCrSg1SLfsgpTYcDWVYrljstiDEG65xWji1jWRtVG8d3U2mFyNRxmXHeBpKseis+FMQU23KPpjXeByCUdM39xrHdSM3EQiriREglDLlTGKOJrwhsncSyawnJEEkbH4Imz+iYEBuWtVY0RlsCXdfkbI1VohbwKQeSZKmNcsLSuQ5E8TFQHY3WGCShAvpoMabIiLCMKIyeSpmKGENMoPYxjoh7rf50e/tk3Pz9D7/1n/+N7043G3u6/L8++uhfffoZLJbMRjtSZbz377/37hsPHy3W27djvLt6uS05CYgoghShlCRrGmbxDfbcRZgBFqWwvmnIUdbsK3tuhYHTCBR20qQdFvNfSWdjHhbPO1xsSa22lSjmNCcbr7aUo98940VAHtewx1R0FDV4XQZL3gsMUO7irUxWyrgZRtVOO8/9ypE2fNwKH1mW4mgFcf/XzVBpdj1qdoe8+SQKcMv+BeG+ty6ze8T8WuX9DnB+X/V/GBrlEYFd8OKv6VdDaeg3RlWzAq7gCMhDaxlKscFfLhabGM3ZeSq43qxNLe7kbLpUwLkXdzdawy+9+068vvvaBx98efXqo6uX+1jA2Ce3N8/Gw1bISQokFaQQI7XvIhfhU+TZEc8eiySLIWVQlpACgAZZM27Epj+CdNNqZ0xqzDVHas12WwqkNTZltrQjlRkFoaDPMbBpQWnCj/z82XObh8Pkb58Zk8WUpJrP6KEaaxnikHMkh3aTaiVuOe0rgJijsUYWjDkPi0UMoWDuhiGGqIwlY9dQG7LeQpE5l540g6xxrhtQoCHcUIxRkULkYljGFGP0DL+kVWp90SlHjDGL2ee5Vgs6xNqMOutqFaHZNL8GNPpRLDdfLwKtlmtT1PUDCumn0RqTM5KWsixEiiKrBnmPv4La48dYu3xNZvg0QakPrb4XY1NKIYXZjJW0LKDJ3FvX+drTRK1maCHdKhTkKNXku5rTICeQSBb01roGsqeYXPhVFZpWKMlWVY1OJyVNsJMiifyCtWzaj7sw7t8dek3vXAs52E6A/GS7yUq9dX5CtjZyJgXMy2+aLGXMLenlgkb95MmzHNJ3T05PSK5oitHnUoz9eH9YF3X58N1S5N3t81lBr1W+rA/a6AwE8wbmcUm9XK6UslATgiWbqHqyfRx3mzvMU4hTTUg5KQbi3fcFzSmZvHhI95hKKAbesXoQV/Ct2CoNV8nzXzIF0STcccg5sdUFNaD98uTcuYE8qvTDR+8uVisfQvQepKjvNfnbm1e0pFCyQIqpHzpl1Ha7Bm36fqiHQhve6yutiMQhFahEs9+TswdnF4+07mLMRNCqj4mMSxJT8/e7LRbsF8tMGOZxGhsulZditNcoKOrBJg8l13W5oK6dKkGlyONynmHVN62NDdHzsIEbGZ48Mdkrx8yOwQzfk7VtzTxmrLV+zjkmJURnXaYRl2jwRqm1y1hPu1IqhCAU1FuGGbTyKcecjda0lqLZBRKVQGlS7Ui5CGkUpqCUTqSVK5UhZ4wS6XUba7VW1EhAZ13MycdUKywDPItPzvzk+tXP1q/+5sXD//LXfgNu1nq5+OHLp//sz/40LlbyOHqmM+j9dHF+9tX339e7/bs556uXr2JMhMOl9ldkWUKRpCYkslRZSGTT6tmeh3ro+nI6KZasizbPnnBGLbPHfpnXxkxjKLPYUzlKJs/SjnOumgWYW7IRs81BU7NtnN1Zf2tWfzwm5XvEVJsQl9ZvKuN6YDtOWV7Tiz7m3Nm696+m31oMzpAqbsfbHzxeZylbKoemrzGraGjZJP1Eg0MDY3lbVGk8jtIYmTyUpDzBmDfmX7aiZRZXYPmbNkdv8iRN5FCC8LmcFXGm7RWK4eJsv9+N06QNg78YMlOKc59++eXji9N3zi7MfvzWh1//sy+++Hx7d8ho+q6+HlBZ1OumjEbRXI5pkcPCT6UmezKhQxJiFIrlMWWqAViyS209xNZEzJnLKymoYSYtunr/NXtxTClNGFMRE5Ywi7WzHRwxlASJD8wDGIqVRmmqCRRLK847VKmlqQ16ijUOKZsFGQKypwUbytSIadjIlut8rfR+vxuGQYEJITjXaaMPh4PWWisdQuiGpdE9eZMXkpJGxVZBohhlioB+sQAhxnHS7HFIqyYJkuxjxezuLClAKE8/WWqdM2prea1BKvl4v4mg1QWTucnz24x+tGQCz/Mgms0W7nVkUXyM2Me2ZlwsqrbCLCsoMaWYszaK9Y6Vqe27BM3GsuzH3w+LnGL0QfK2VTKqi2vZLNmEqBHt2hIFYyKPWA3QLCjJURi55G2ZUtJYtpDwkBCJ1tVaGhRFOx1TOhw2b7luICsmWUSvVG/sz7fbOz+99+iBFix+x5zn+VQ0jRqeBUhr9C7jT588Pxfwy2dnpqY7ufE+CumV/tl2k7vVgwdvTuNhv70lq0bRxDGphJMgZ26DYqNare1yeSKVnvkRRRstBe73m/1hG6P34xj8xHVAm801uQBSYGqCkfeqPrPTbZPMbHI81MI3+zJ6ONoaocCHKYaRFC00aZrq5fK0H1ZCqhzR2v7Bo7f6xYq7hhxDrYTQX189BymNsvUjLqnra794OGyd7fq+J8kQNeOruTNiGUHZ9avzB28uFqelSAblKQr0MQQhpXMdoyJs57SxpJ0jpzihyLRroICANQp2VrM2X0iRN7JkKa1466hrvypDqoWvUjqQnxLb+UvSP6h/qLPUzpDCUD1vqfBGvhijImH+pVTUbSoUqAoUTCBQG4O52dloZXNiYRYy1yC9PF4MoRKJBOkoTpdQcizFk48mjcdrJadqTYw1qSpF8AbwyRvSgp5SyHRDSykRMRVhlEqlRFG/K6UMnXuyvf3o9uWbi+G/+82/d+mxaPVZ2P/P3/+3a2OIQ8XKVOTknUJn7Te/8XUT4zvB2832arv1SgYhiHdUgqhZPxLMO9NGEmW7RMg+ZkLwc7NFnCrQWFgmk7MlUYzahLnMSZSPJM6Jds5ycp7OtjVuYxrKmRHEoZ/0uCkZHVUiS8u9snHKmnHwcVgsZteNWSKAHDBNd4+4kq9pZc3cujYvhzKroh8zcVu4QtN+o+ZXHkWgy7zcxVnDvvGFuA8W81cDJ8ryugaXnHvc+4xaO1ZQvnADSWJSci5W5k1o4ZH8zAmWNPUnfWHI3p9ZqwXuFQynp+vbWxrPKi4xaJAPSYhPXrz89gePl4hLZb/29pvf/+SnG7Iu6bRNKSuQ3OQlchophdiVSoSc+CIzsEEpLdT8WoxClKmmFiOVJvWWjBIylhAj707rNzJJ15DTuCQZxSIjaRAT7S8iobFqigaSrCsJuT+o/0ELFBkzCuqB6sPRjXRIYpSBZr+1AJfKaINItj/UJRvjFCEv59GWiCkCcZZKxtXqJMZAGEiDxEgZ+h7rfSuG7YYydl1Hpvfauh5z7YO1MaKA7VyKaZpGBc2xg5tOoljMVF3KrEWIaZq6zmEts1hlKDdv3bYybneDQxii6Lq+Mz2JwpJ7I9JyrsYoabuexOuTlPfUc3pd1LtoBS0X1mdQPykQcUqiCK0sCYchjQprwee6rtSPaarPlKyjFHsRk7UWUSYU7zs0oSh5oJhCrF2bsbTczbUiErWnyCnnuTTOhWIrjVULCmVsKcLSLGq3vVkoeWl7mWvd4AQse/ci+qfePzo7Pe1cTk3FlmVAeQpG6h+04xeic92z9ebzm7tvnZ58ZegBhScT/uLMjSifH/aLs0fL5end7VWKEwHTpNSanhT/5FatAzszgFkMK6gZVyi6eap2RXHy+2k6xOkwTXtRsiTBw6bMLelM0XCCLYDlXIK0nDcbvTYvfYHqvj0A0g219Txgmg57TIHGE0oU6YbF8uRMk/dXyWJYnF0+fMvZPqaUU5zGA4kM5rvrl0IkMJrcnIRxdgxTjKHrB2s6gZJkv7iCr9c213oZTDecPXhjsTwBZRJPdICNssh70Gpn7HjYez8aY2viScXHKabJgO6sE8poDd6PHN1ivdGUwpXUhLG2zmFJMcYQR5ZgYJ9NpYw1jiJAYRltUIo0tbTRuubCev907dTJXxMKxFQPM7s7IAnVEYQCrQQtlasXtsX3WiOrNigxxhSS5JxiQGCLvQK1bcjO9dQaCm1VTknVvKAt4TNCzNb2hdESAqUxVEfWXllKhSnr2h/nKHLImSW6fPTSmBuMf3n1TJX83//ab3xzOPHTtB3MP/03f/DF5E3XcT7ksF+fP+LXv/61lTVnB//I+9vrl5va+wqPNfXWDrjIJGQkwQ0UgEStnGWtWL1S5JxBiKWEoYY78u+mPI1NOELO/CJJBsBybhhnecn7OdAsfnwvrsx3ixh3jXA/82vF8V8tV9EeYGYIlZlZP/N3mArOE7ea0rTroE2M5ZF4V+6xi3NxMP+Cxi4W8q+0yuIImT6aH5WjgNe90uTMs56JKrNFv2AO5b3ZDLRSgl3jWrmvaSYWaRZLvY5gFsaMLYdZFYHRRvPCkQZaSULx45vW7YrIgzPO3d7eAVmlwzwQV9psYry+ufn2V74m1uu3Ly9Xq9M//vnH29oEaG7cVQ2aCYkDiiXHlKyzUvLGt+bTmLFIctdPGFKO7Pypa9sTMUlFXTKP/4nlnzBYUFaZlGsCzFjrzYBhCjFTT5GZIFcvrJHMUqTzpJVuU1+sFQCQSoCxndGaYFoypiQJs4G0IiKwqik0MnOdpckwOWPOLSYLU5SMQPNlwotq57rD/mCtM9rGkDKm5WIViTtEwHdGECu2t07Be8+KgPUtGtfF2momAnRDIVROjCEnIqqW2logAaFTxJhix1RIAotR5GsK5qV2/PqIzjtqSRprD6Onr5IpZWe7+kxC6PpeKpUT1pqMxvKC8dEpkk0Qa1NCoXAoUGij6HVGCcIao0DTp5MATNd1EupzLpiof2nni6Wvmkl2YaB72xUlxHpCyCqAHxA74WDtm+e5lyj8BeRXmbV2JKxdX9n+sC05vtX1OmOpbVpZODcB/Hy/E1K+dX4msNkPz9UyAsynnQBTqNSPnzzzU/jl09MHpvZhGx+nlITRT6N/4eP5g7elhM3mRojawIFSrP9HMvWN8MxvTWs99EvJ+0+isKLAlKZpvzvsttO0T8nPjimSEUw0QzUkFsaNZWGbtKPIHd/tXGvW1nI000naZytt+q5XSh0O+2ncFcmPEaSyw2I1LFYEPihKueXq/PLBm7LegtBseXIwCq5efplzUMoUEsrWSnnvlYTODVoZtkPitre2rViLB2OHy4dvnp5dkpZyfV2ZyjWtdYypNpogc0rjYS8wLxZLJWWOhPoomRYcJhXUAClGzIlYddooU2v6FAkejz56JN0r0lLLAKCIHUAIdrIGlQyWUMxNrSmWZEF98Exmy8xkzxmMDoGE0LWmKWK9gDQbN7ZW84IwhrVjcUallAjGr0iSVSut6yshqVcJKqZMupUQmTabowY7d1nK5+zJEVqqmvIDoeKNdWOcChZyTAnaGKJRQNd3Y5hqo4wiiXIA/Ojl0ylOv/0r3/u7731tf3OH5ye/++9/8MOXr+xiKcghOzeJRowxvP/43Ufn5912/Ir366vru4xBUvYlYw12Hozs9VuaQUK+hwtzFs8FcQCxUGQeJmej35ZJZRs7l6aVga+Pdmu1iXOeLE3K5t7zdxZ6nsczlLYVK7+8NrO5t7c5CnIcQctl7qsbVbaBqVgLml+fnFtIMYsR3af3Bl0uR5T0vd5Gwzo3C2/RZnJl5uqKo3LWzBKekzTXwg3/3OqO14fn4oiKnj2HSzEKchFpFoRu9Q//XrhXGJFFHicKzSNCC8zFpvyg79c56dMzLHmz2bB1ebMTKkIb8+xuLTD90vsf+Ju7bzx+7Iv406efeRSDdfWO5XpkuX4nQ1jICbWxudQsmMgGJVOFoI0jIgJMOTIPGmrhTJ99FloZ53qSwpiH7UY3SCSAT6EA2//N2DbmYFDFyPtRRdqBmGuhQz1B6boetGJ7tdS0IhGUAdo+EnxSSxCJ6PO0lKs1gWBIpyLhPVo9SiGddUpbP/qhX7KOvOs6pdQ0jbXgUJpYFoa3v9goBDVMu8EyYI/97IdhCD4SdAUyKYGAUDEEKV7z2xSgja75XrWBqqOO8LiQUMT/ZVbQbJdArYvSi8XS+1RokDuOozNWG7Pf753ra0fecBmUhmnBgSRdKVBQ3UDkmZTJyk2TR0AkQLfLubBoCdLEW2mbU071c+RasAmd/1Xt1tKMq+l6kelf0o0wTaPnGQJN8CVBCbgmvxhIrEMpNlNKKe2m3SNnB3KBlAV766TWn2/X65BPhlpgKU0ngSYVDRhC1SgQ/fdqv//xk+cXAH/zdNWRq9h6HJMoRdufbrceurPLN2KI+91GNc8JdlZrgu2F9R7p/wz9wLhbZFEwiQnDfnM77rdTGGvuV0zzIhMsUpOWrE3d7M6xKcGTmgUFOST9fzyy8Vv0qtdbu67v+z6GabtZ5+RJ60mhUF23GBYn2hoyeRTWDQ8fvtUNJzTBzE09XsN42Fy9fIE5gq49iAHN/FoAqB1qQ0WRgCt16lRG2pPzBxeXj0w35FzbU64ZqPyCNuan2m30o1HKOlfPC+lM1WuV0GqThRj9nnz2CJVWExI/zHpVudTAjMbaGAIRfU0KibWIFGiWoiGNDs3CZgzLYl0Oxnwoo2uCyZmhnbZzfImUNs3pgbKsAIjBE+ZRiZw0QF9DU2KF6FCrhghaCTBkxETzM1r3FlAEIWwKske4gzKOPy1yVMzkkE2yA0LmGNmRLuSIQkyE5S5CppInEB9fP7/z+3/w4bf+i+9893C7Vhcnv//Tv/znP/lILpesNcxW3FIIP4UHl5fvPX5sd/sPfEy3N1fTOGmVCk6ypl7SQC9EOpKZEgHJxBz5auTbXWrHa4VYKpIPbVI6JNQ698mZU6x8TfTi2PDNhteztCBbFlFaANE4uvPSt6GSjxNjlnQss0gVL3xnZWhxZPRykmJIBDT+MFW1tptN+ssRQ932vOIeC8UVREvbxzwrZ8DWTDOaZb3mzRjtb49GwLOxIe9smyTu/XJZHn9V4wzOTwlmM8bG/iB5Ov5p0LCER/W/ucgWTaOPN5CCyL/Kx3RScu+6dU7D5cV+v5+mqdbFTPKndKec/ezF8+Vy8dXLB2G9+fC9915u7j6+fpUL2M7mmLip9jGoWrHqUBI73xbATP7yRpvMKgxK17a9lp9SGyWFSvUeOtlMc+tDJBKLFkrGRFLDpYSca9DSxC1Tmrm9xuhMlp+qVrtZO+dsTeeYhXHWErMeySkeAMiJUzPzgbz1khAyY729tbtVtSuqxYIoRqsYa81vSEQ+iay1JkohsOkNIg7LxX46KCY4SXmYRtM5siBFraAfego90mqr64ssw2KlBEvYK1GTCkyTR5ZVKYKUijNiZHQwUTmZ6g+Hw77reql0O00Ej2ALjDkBSOZYC957UGcwDIuE2U9j33fejwVgsVwd9nurjXNWSEU/U7asQNe2vlNSkuKOjSJv0oSBpRl5NtZRsK4XD5Gd/DspIKTIREMxu5YRtZXhvqzJ3YoERSaGgWQ4DemrsMshw07YQoGTMdk1oVaGjCV0EXgY9ysQZ7ajU1UsQG/N1Tg9DX7onBKo6xnTBXON2KX9bkmd5z7EL67uXu4OH3TdLywWRogtpm0IQukR1Ee7rV6dn67O9vttIqQ6KC2VLHneiFIby++q6wdicZvjZjf4/W59M407LGW2ByBYFKjGKG1o1jn2QIOOkj9kbY1SyZJxF+RPxlW0BOhcv1gsEctuezeOOyFQmx5qE6kXy5NFf0JjP6XALpan55dvgHE1qRGFXYFRUG5uXt7dvKpZg0yreKAuQGprWkFI+ybqyGuvrXW3Oj0/vXhjcXKaCiYfS0HjTG15pSAGLXJZ470vuXS9U0oHX5NiTpEx2xgTKB2SJ+FU1HQ3acyTqBaBAiLFaIztXE+M3Fq7EY8uheSV0YynSaQoTX+N3FjVv6I+zBqnwWBGdnqoiaQeSCNqJZ3JghWVURI0pxAgebYYAkM7CW6QGiGYql4JBgUxxAhyRaeWZBhqYNA8CCHQpOZIqrWlYhpVLVfUIUxKWasNrxoO3jOpkmDS9QAko77Y3L7Y3f7KG2/+9vf+Lmz2Zjn84NXz3/3hH8XlQgBPKXmtWaPf0Pcffu0rzqe3QhrWt18etpOGKJDtfpMUUZYgSxRNQjKTgx770LLpPhINQRZcAnQg2iXj3NNWWJLr/dJ6yLaxbba+IGfTemAQK+u9MtFRSCBtdzyiGIpUf0WH4564K18jYhw7c94FILTBMshZ2Y1TuDLmaMbw+kR5ruxnxeYjVOMIs26amGX2PixH54bC3Son2HJPa5q76/Z4uLqbNb2auivndZiH1tzOMm+38Bye5fsjz/KJ39Wccnj/XFojfixQmisTSSMLKXwMD2kKuQZYnZ6s79aIXO0yFKwG+qTtJ0+evvfo0RuLpdxtP/zqhz979vTz7W0qcnDkgplLTTYkgJwyxhwpkCna7BhBRKNI4KlpCloZYnewjgEDMlS9vBhqsK85VzKHxKeYyMWdhOfIhNtoScgmIWXKkYxgDIvy07CPxbGhZAIz+3oHYk1vTTJCay2LTAlJQL9oMCRbSHAkWbQ0rJOoGMSELE9ZO2V6XbnrXAhBW+O6jnX2QWlfb2BtSkiKWJXMADqZyAOV1jkix8jDwxqJWPkoZUOzMkHT+9p3cizmZ84sOSJyGGvIKcFSo1+O+07q9xBIThCa0Cp7/0HXD0rradwbazMNyhfD4rDf1ZTkukyuvUqb1eKEKMVZ8ANOgYeBQM1uDgEFKquRVAYpwciMs0iCEMY5BfVvc06SKJt8ttkRQYmZl1+OdHkC91I5LjVooWY9d5LFZuGLjChzfYUamKAlhIh+zH56Y7nUudb6IMTSuR3mz6dJSnk2OO+9Jd4orTdYG6SA0T7m693uyc0mxvids7M3lSoS7oKfYpKufx6mJ94vTi+NdrvdHYpEMOBZuob0ClggD6RenJC/TYN4F4G436y3m1tqTGXbYDW9Ud3sJeS8QWaPtOYROi/cU8wU2OftFR1epZzpusXK6u6w22y3t7V/Bc10YWO7xerMGEvLGViuzlZnl91iIUr9EJ21JHIitZZ31y/Xd68szR7pMVKFA7O2QWmiZpmevtbu5OTi/PKNYXnKxp1yhqRyPjPOtpYHcwhjSqH211LXTjInbWonD1KmFEo9NQFlccrRtJv0POgegVL90CNB7umBJO+9IvCVIC2OnJGnCyHxZEXYeuYJrkjIlUSuC41yycYbKGJOXHsZ4wA0Ee3qfTE1UEhk/wdV7whhbSES/8ZpOiw100rtzKwTDAljzfHaglCZsHxaaYqzNdsCqE1oavYAAIAASURBVEShBAliogFirC+VXbzrjUseVf2l1minai4/iPzldvPF+vkHw+If/0e/deGz6d3P0/6f/sEfbIgw3pShKDEiJiXhG1/7agfwYPJn+93Lu9uJnfYRPcGvIkk9R1FLRCwKaaIzC1EUBlrGHGUuS6UWij5jykWsrIkzORebKnMN0UW1GQjrdZbajlOTXxqmi2vEgo2VDrIhk2YzYHncpB4lyvn0H82BWCmywRHFa5tXeN2Mn8eZzrEv+Wy9Vub5cmky/0cQs7zHSM+vBcU96pneJpGd+U00ANkM0KI+nudR9dUqVsBqzStbC3Je55qGNQ3kcTgu7j2ghAPItQ9mq6TXhuaNnMQTMH5wPOKmWYkUXLqUEB4uFinn1A3d0N/c3sxNdntnEmBC8cnz5998962hqEUW3/zggz/99LNX447aKsczVSJl8jbHNJSdUhFTZJcDUJnKSYrvop5sIUkIukZ4AW3aQROnklF4cu9hYTkqJmpmYAkI2uMUbQxITZmeuuqC0zixDn/BElLAkgm30YSoOAgiHQvgYgibX6y1DgRgiTUAGsruRMaXEqYpdE4Dm//p+puCj0O/KKLWLsa6zvWHcbTWKfK8C6m217p+qS412WeivLPDkQSGjRktpQg+IJG1aeQAwQeadGVJrQYIaYwJYdI8Qiho63MmGD0oVnYhULHgQENTuyYZWUrpus4Yt9tuGX8SfaDptI8pdf2QYoo+KKWH1YmzjqAunBxzykEIabQSSmJMmFAqRXrRAUlUiJGrrCDCopWl5BxrDhbN+Z89rZlqLNkflCyaGXVYYkwYE0mvqHmAV+ZxUCG6FKlNMRC+vp2884dL407IX6gUXFgrnP18u1nH+OB0JRP6MLmu16rVx6BkFuL6brsP+cnt+ryUv3Z6spQQC97uRwSJnfvpbrdFcXLyMMY0TjveOh/Zt4xAgVJP3fLs3BqbEw97Spz8dnM7TlsaQ83SmzXFkeibVLUroVvapKuQVdCo6yBRQHY1aysrss9SoJXt+n5p+yGGw93tdQg7IaR1gyZToG4YumFJVDRh3bA6PesXJ9o4Lp1IbzWyJOjt1fPt9oZEsIsgxNMsXHAfVXlLorRdnT44e/BGP6ykVCEndo3BlBlQStAKlXKcJu+Tx5Tp+KoiakZLOZJEGeaSAxkOAvCJVkpbnsPhfBKUVT6Qx4qsHyILtRLoioRghSB6FXKtzIe8Ho9UywHSVKkhpHM9UqXIVyaXRAt72WyGkezcuz7EiWwAufojUq8lQwWS3gMSuiE3pCZQyy5qAErkYo1pDrL1rtY0TPqUiEIa1RGPmNQLKM5KLIPr2Ux+DBNy30I+HLXu1+rFfvtsc70C8d/8+m9+rVthERsn/6d//a+fBq+tbQuuuZ9LKX31/Q/OFsvlfnrkw+bqxbbUTtcX4ev/AzUBl5JKLfJzERlJqW2m0vKDplYBHZQTklNpNkyyqfASrQ7yvOV4Tb0Z5ZzomqxNG6LeN8ZzhmfigWwtaYGZ13sc4B4BUKINdrkzaHNpuOf/HNUi5wKC9g6ma2lKHgVQy2uiW7PT4GtOBmXuWbkyaFmR0WHHvlPMM+e2zZWv6YRA64Xn7KuaDUVpa13WCWPp4CJe3++24TQdl9S0tykMNi+Yed7AL7fcy2LC0TYYREJhY3jY95uY1MlSgFpv1sT2OwpRozR6Pfmn11ff/uB9N4VT27336NGffPH5OtaL1PV9zo22G1NUxrAhCdjatFht2W00pkj9pI2ptmUamCbDYhr1k55CIB/QkkhZg5SBE1cVhK+uuVrTmIi8+TRTeKn8lD6MTbWuFnElYwRQBP1ArSBENMY2oCk9GVoPl77vnXMhTBmTAh2R9Cg0tLqIkhntLKF2ISQ3TxJBlIwlpJyVJQGvELVxILWx1oeJhnr1IzDaEAosjeNYqwFjG95OAopMZ7bWm1rpVLNiVOR6PCu+Fa2MnyZdi2UgeiGwsz1mAdoqZ1nEg5En3Ei1l1zfhe66fjyQzbuGyXtL7oqY02KxEAJ2+33G1LleaVcjFA2fazxNkSCv9ZPCUmJtNAtvCrB+HIIQvVpKRRYRyjknJW3OkA16abosGjet3RrWnlDctdePmCjQuQZS0VoMysWFZBlSFoXnvbQYx8M0OiEeOUfhHi2ooeteHfYvUu6NXg19DDGlVPtgEmAQoG7uNlPG2zHc7A8f9N03+95ItYlpG4M2ZifkX263YIeuXyGGnPy8fm3UaSJRFm2704tLoK0/uU3Hw36z264zRkVqOgRgA0kcu6MtaUNtlFlTvF48ZGuzjPOsfuYmaW2t6W3Xd8OQU9reXR92t6UkY4e+70kzSy2WJ9p0JRejHI2gV7YbcmYxrDBN3hhjlMrBr9fXub6dUOi+1HxJDUAhT2AhSn20AoztTk4vTs4uh8WJ0S7TZy5EMfWqZpwnGWSDeMg5sjyi0RoF0fRrm1X7X4LUpVSfHuaYrOsym2rUYykWqyXBNLVQ9cxOhwNVYsUYhzXV6Rg9sWxlitl1vRIqY5YSc8zWObJWJCGNWoiXoV/U15YjGYeAzxEFGu0MGFKRry+574cpTIT1JA465hCjJqmsVNisQZmuj5mJZupIqiGNWKNVvWWJ3z4dpEw2nXSpBKv4aW34fPCWQyo1hSAEJizMXQaS3StK3iX/YnMt4/hf/51f+1uPHuf9GM4W/8sf/ps/v762/TArUrUcEfz0zltvvfnwIRzG90PwVy/XOUWQU8kMew5FJCGTLJEIlyT4jKUtCwuX7Jm4VUqUpQLbUNpNC0cw95eFrtroiYxYCJPR9BhJHIk4lPLYUzbwckud5bX8x7sTec/RlUeZjdLEmI9oLClfY/JQIoJm430EPfAfBWTGQFFsRmjK+7m2PHKM5z3xPZ656U021mCrMOYeHMtcM3CdgPNvn8n2RczfPs/MZRPhZNpKsxCWsgAWeURWUflMMn9CAQQaAqv7xTQr2rQgwGUJHGUGGGEGNYjGEBdCXLjuJubFxXkIYbfbKxKOaCm/1Gz65Xa73e1+6atflXebDy4fXF6c/7uf/3SDWJs6qq1JMQOZNZR57UQUTwJ+8kttdYuPCUVRSpE8Tc3WIXpSDyZyEU19yTNA0SgbnK0Xcq7cjaG2W7CGDitrswYyPVlDRF51lAbj2VaN5pl9Z0heGskZScQQWIeFVZdDbQ0ViWEVY6wxyhjt/ZQxc4FmrE412VB9kDELsVyuko9CiM4NrahVMkyjEIK20ZKwYYzkpGoj186ee4uaS4m3ZI2JwbeqqC0P6qsu9RVOfb8Ms3Iksg4rxXXi7Kpm+wuz/gkKMocp5FezDClOh0PXdzFGZ3UpZZq865xz3f6wQ8ShXwAZoev6kHVG8u2OMWMifyMdUoghUUrWjKLi+0ugb40ojHXWsW5omw2SqgpfYzpo4ogBFDMmjRwYUqa3Qu6MPCBh938G0SvDM49c257Dg0Xvanysv/6k7z3iz8dRID44WUpRQsqT94IUuG7X24MfpbFf3NyGlL+9OnnX2oTixvtYUBnzPITP/DQszjrX+WmiSW9bejG+TZDpxcnpGYqSyBc2+HG/uw1hbKIcLKnCg91Zza8pfc5XHRv4g3wJed1amq4fnXEaoNiBAH1yu7nd3l3n7JW2w7DUyqRcLC2DSYkXumG5Wp0tlqe0NagvsmZNiURFyxj9NO6EzD5MmBLvRxvPgjV5UJQsbDesTh+sTi8Xi1NtXH2uIfL0v8EmGJdNpl3eH2KceFtPonvkMJ/q0eUAXavGRHIZtShztTFVrHCHTT0bjFQyhGkad1ppQlRka5xzDsm696joUJpKswFg7UwFoGIK3EjnmKh4ydQJk6mRMW2gIIs2hj23kNwtZRGW3JpZCcs6S7bTyrgukWxFooa7SBFjsuz4wmyYgsDwLq6hABLdehKuF0Wi0sAMUSwii5SRnh4n8Br6srXEyJLSQ3l6exXH9W//yvd+62vfCuuNenj+z/7kh//q55+axYoX6oyIBymjjxenp4/ff7dmXx/F7c3NYTdp5bFMWDuJKErAElv2JZ8ZthEUMwJJkt95LRPFEmQvGyKZmqfaTOA8NWXtG16Z4GwATFQ4mtQcc1QzS2ngJUZ4KXIInlOsxCYRxbPkcjS6n4fNs6xWOSbO0lQOG//uKLl6hFdLpZoi7gxZZnP/o9jzfQ4+gqnF6xjj+R+eHt+jnI8TtnvTYLgvmQklzmpI5Si4fvQzlEflLjLDp55phptJ0kcnpTUNJKpTeB3YGn8QR7vQMnvyHH9yk74CgsFE789BOq23uSwePNhstj56wuvPRUMpypon1zei4C88ftevt19946Gy7i+efBaK6LteK80ab7W+JIZGJghG0+4n7i+lZ4VCaGtTIvA9EuuNOhttSVSPlhCKpORCylCzjKl1dC3xMmM3eYCZYqJOWLE4DvcWhLaot8k622otpZVWPkw5p77vJYnoZixam5wjmawRr6o+De2clUz8pbJDgUw5GxpbCams0iFE2t5aFFxlk0ma68I0EQ+5RpDavNWv9JGAITVPEdeeFxGp9pGYcqpvJGfGWdKKUXg/KqYJANAMhYBIuUwxdkNPL9UwJkAAawbUD9/ZDqkS4RpOadUAnMTYGoYFljKNh653OeaSUWk5jZPSZrlcTdOIOTvr2JbcmI66YYW55OzJOK8YWj97P4YUaiFD4LLSRgGgrSGBTXCufmOKmYUk5iKaz6rkiMPZV844KULYZmLSIW94ZG3VgKxLUWqlwBSRZMG9H1dWn2tL5jvC1Weqnu33m5TOln2nDStOjyHspzGEoI09xPzk+u4M5HfOz5dCHDDfhrEeP9d9vF5vihyWZwr05CcsVK7NrhkF5XJ5OiybrlPBdNhvx8Oa+mC+qDMJooEr4IitmPVJEJvbC1WfTPSnjayUYK1zrteuU8pqgPH/Y+zNfnbLzvygNa+93+EbzlhVrsE+VWW324QkiABJGncSO2kaFAku4AIhIQEioROCIv6XTkgEEkjhgkuIACmxu+mEKdCk6XQnbZdnV7nq1Dnf8E57WCNav2et/X7mIsqxL06d85132HvtZ/wN02l3f+OmQSrV9WtjV9GXR2O12WrdxVQu7Obyke03MH5mKQfOc/ABYpCB4eY6N+QcpmkM3inIYpdDCtoijLel0f3F1ZOr6yfdalMKZdDDQiiVh/MOw6hqjM9LzTF7cIVL15vIaypBJbuU0bObSeHRu1EpAat5T4HZO0f6dAw+KOX8AM4phdTaEBeOA/oYU5ynSQHuzqpjJTHuSANTokgtJzrGYKyB0nI5MD54o40SChwnobR0mGpQUdhZU9rrvkuZKmYVnCfEBoVmba3UhnHaiNUGFIjUGcQknTIMCjP31Rq8grnAICjfG7hxKLSDU8cqwoRhJcykkmMOL+/vDsfX/+ZXv/bv/OE/6nZH/fjy73zvO3/79/6x2G5JG66+sxA+uN52H3z4oXTzc+e3+/2r/f1JKZ+yZxyU3zyT6ULmoWRfFgmBReVt9S1lPkaeUs/YWpDBb20sU5WwrXvfqgrGJNn9VmwdpcoG4a2Ky7ml4qqgUSnr7cGmVi6dlZ7Z0qnm8hnrOralR17lVZsfAtEUK+eX5L/gyWn684KXPxCvrO5I54+1jLub80QFgeVGhW56lwiWfEFTi4cWwXxxhOJ58Q4WrazJy0K7jheJ+iwpUzcQNVyEcVWUlA7IYZxxCiV0t6sZbfUNRoBom/BKe02cz256U9nIxKjk9vry9uaWvGMXA9KS1Y3+4ac/22w2H7zxfNrtvvb2Oz6l3//0J7HqD5djEVJYhESITwz/VLy15MhkQinJM1SIK+M+BR+q5hPXaKY1moZEFIZS8FK5ICXKW+lD4FpUtQrJQ5wxWqdPC1cyLrEUyeXgRhBwS9wJk5tgbl/ymQSVIlIbmgGo1ipnx3kWSoFxESGNZZSQgJHnpiwoSe4xNyE9Y4wPsYMuleQqsayUnMeBlbrYAh4ic2IxedBXAq/yhSJBhCvmZKwphUhd5kkqo6CDa7yftC4tk2DCaovWP4H3JSEvz7rVSimZSlGT4HJAyHpUM1Cs1Ervd3dcSW20myalSoCLmXV9P5wOImXb2Up3lUKXFFG+CML05JyD3Fjpcd00scStNUqgN2VUCUgEI2Zsp63l2CpTg0jmE6xJpdb5roBZCcjNmVJEpk9LVXQpskp45aLrOjJPm9zEYnirX2ORl7Xgq76/n+eXIVgpHm23kFyugFIphVD6s/v9/TS/MPbDyy1j7H6ehxiNMnshvnvYJ2NX68uUMkyKCFUOTTQut9tLba2DkRQa331wA/oGcrxtWDlagEl6NDEsl7mG1ibATuJW1SSUS6O7rlsbY4U0UnLv3W53O44Hznm/Xnd2naPIKVnb9/0Km0h9cXW9guUDmhfw9EqNwucwl8MSfPQuJef8NI9jwnoK2s2CLndOTMO/6OLRc7vqAZkEHaJk8phzJC30JmJbKiDYJp5i8AASgkckhFYS1Ngwh9kD/R6iZyKHUiIDK+cdF6Ws5NjBBx9jDjl5LTvAqXTi2YdZcK6NKi0yqS4y0aCpgtZeuGT4cCkQEyWlpiUIgi+5X7t5JsgAHE24EuU1BeOlrlXQkymfP0AuAIpBRuYcIfhFLPwMqwbw4ThYs5x3qzVjfK7FBNWCqlrDksZjhhApAIkYRCkytNIKqub4fRTi1Xj/+u7Tb7z7zn/wS7+UhqG/vPjfP/vkb/2DfxDX2zbBRZ0mSifAWP7yhx92Qjwa5+en4dX97SC4Z6zCnlmC5rOIWUT0vomgQhz/UYG2JaimEAxnF1yopnuR6yMHq8FyblIVdmqCzo2hK8rf1bqy7kdoDkQmFrw1spkovy2RNOXiZSucF/GofJbzaCm37W3P6h5tQ7Nwf+DAY7tFS6slyWZouBCJz3IbvJnL8NwIB1Vi7/w+NZE3a/3M+XlEvahj1qVRpk0wTQ+yOA/XG+mkfLMoFspT1cusPk9CcC2Yh4E4qb031tOC2Vq+dfsabcZOrNro/JvWBh/CerO+WL9+fcObeSmN2gTnUamPPv7p22+8+e7V1Xy3+4UXL3b3++++fsmkQh+sU6KDWyoCLlUuOaw0iUhaCA4Nn0KRPUNdFy2NctFnFjfrSyV1jIFLprTimTs/s8V0A1M9yN8IeH0kiF0krGJn8kGXSjPsQbG+KQ26YJKOkpZaKY29QGIk0lHq9QDtyZK5lVAlydXZfYmc8zwJSMqlByUcjcJSikpbzpjSBlb2pd4ul19JjEuj99M0jboU82IOs1SlGYBRbsnuAXRVJulFJRQ/RugkMZC5OOkPaylPw9CtVkIoX/oIriThPOnAlE5ts9pypWfvGPwdBZ1W4AdCKDHddP1xf59TydZQCZayFC5BGzNNA2dcVTdATtBHZU1nehh4Jz+PDhoIcLNw8LVlstQEGtcgxpwhGFQa/dJDc+V9BKkBgqngSvAzTFLyGtUQ+QVp4kRKVgmiCiwln8u1LcEAYBw3jY/7zkJmhGe2tjay9JNxdCFcb7fI4llJFEbQcfv49V1M6WsXF28qNcd0O46ZcWPMz6bxEzf33cZ2fUSJUbIVVwwA+83mEuKF5VDNw3Eeh5xCXWQIXnEZVRePKAYMIl81IEQApRK1Y41PLJXQprNmpZSWUiWeY/DDcV9KH8Zt161XGyF1BP9NWSOVUcp2drO5uOpW65xAgcOMMSbHpSj1pJ+neWApeD8fT4eYglSKYx7DCC2MKf764mp7/cT2KzgLeQo7CRraMKEsxR6MdD0Md9M8nVJwJclWNZvyfBhjUqpAEj87q3VK5RZYY9AcagzvlZIaghCMaLJEqYoxMom/FEqStE4srTc2ZaUts4BAYtOsWMmgc0rJaFuyGWB/ShutSzSgZxPipphCm54k4UGlBkAKqQjPqMLINUao/dCR1sqAm17KaOcDaMZcaTW5OaZolPbwQDNaK6Fy+dzlCkagFiTH+lqwCH82rDMlb3Zgk5sxck1B8pvj/eevP/uXnj39T/7sv6aHWfbdR6fjf/n3/v7eWgXt2NyiP8Qww4svfWm7Wm2Pxzec293c7FN0TIRMsGfmSjdQHsfIWCDuEIk0Nb4qfaMYgsppI3gHtGmu6Cj6+Qr2oSE/gbrzeXmKYfECac40qeLNkCFXaHU5T6pqVBC5oTLuBT/rMlc83KILzXljWFXwc2tbf85TsKpa0CJAqtJkAJmY+dnyd/myZzpQzYG8KWcsf/igfT6P0wnFv7TdOTcsNX/on3B24CdEG+5uxWVyUTWHzpwpSD0CZZqqXWfKgKjymGvCFYIv37gCt7JYtO94tUgmyHgWXPmcpJser9ej9+LyShp1d3snUffXqwGyjef8ez/5yVfee+eRtexw/Or7Lz75/NXH97soJCE1YoStrCwNLuScyhObSIUP7AuEeUniVonnFCJXKiQP/zhju1XKeXaTOkuu574jRGgpUTWhmeDFUEVihfLzTL6DnCst1TxPHJDs0pt6Bz3ZbEpmLbcACnMChkCxvBp0pyH5FEs5qKR3MTPedx3Uc2ICeQOc5qpHnyBkR1CMRFEgR9t1NFfRUkuoB0jBo5/HaZRAcrEknHecMR+CpkDGaYRZellMqkX55AiNoHDwKijK2DiNPebJsFOE/iiWF8DOZOf8Zr0xpvPeV44cHfyU0RlEY7r1+uJ0OPgw9/26tAjBA2KdtTHzOIRSTGgqU6FGJOnbWdvRaM475/1Epguzm5ybc46qZNxyVSNgtPCcEKbrStAkka8FKkJ0BDz/qYnQClKooCBJaydiZPFyjJRQUmkKHZMbJefPbF9aN856IXqtfzaU5LMy+nJlwfws5Z3Uaj/Nn93vHwnxtcvLrVAn53eAs0Upvn88HDPfrC+lNLTqJpkUrexmc8k4g+r1MJz23s8UYTgZAGLjS4op6MNaMKAlWBUH5YApJaC+y13SymptlTRVACG5cTidhkNmzNredr2WOgODJrH2Nv16e/Foc3FlbM+5JqY1dSRIXjGG+TTsWWn44jDspnFUSkpMaKqZVcpK2fXF9fX1U9tvMXCu/GgJpckEOGEp4XL2SL2Mp3k8jMeDn6cUAtZXiLGpxMQYnXcjzBci7nKVECVSQ8kj3hMYF8aaMkamlNms1gA3iRSSc85H57xjGAvL0vxlbazW8CYyOsUwTQNY1DVpGF2+e/AJmIxQDrDtykNcKm8lpQREK5OWSN2LK5lhBIxVDi/RMDNtLBTay6kQcDBDHVkaWtifTMNw3Ky3Ce00IYJ89HApBi2+3BcFxlhtWAmyswBcUwQYjWWuxP1wuLl7+QsXm7/yK//GhS/H8VWOf/23fusllm4VClSVj7P3/ovvvvf8+srsj2/FPL16dRed58KlPGcG+8IE0wUeMw9QvIqiOsWxKoVcWtLgo0hhI0UvgTbKGG9mkqgsHXPkZKVHIk00iK4WYjhWgjW4Fn21hbjLRSUI02UhdVWe+EO/+yqGAaJDswzO585zeTXiNKUH3FzGHghRN06xVJ2oHSVPhH5eRs31slcD/EbJPLv0L9pc7EyuXiwPc25Gv/UbLgihvJgzMNrZUqudBH9QMpz75OVFc0N+wwo0i6pXmbUsLSMcDkpT8gB6fUavseXz0uiMtTm64j54E+KjfrXzvru+ipnt7nckcdCsoUo9u/f+h598/Ec+eHHBmInxFz948d2Pf/r54ZDKwQXbR5RMs1BmMk+kwCCV5lJC2N8zLlNOPrrEmHeB8MA5caWM0hpoXBTLUoPnR4Zm2BOnrI2OKbDEtFZAbCXIIOLpUgqTXkrGLAWqgqU1NqYQY9JSsjb1SrFt4CFhKFV5j9m7nCqKVzarKJYX1wAWU5ZakcFGvRlQrXLBa21Xq40PETRo6d2I4jiVbAcEOCVXo7u6tsh5EUQtacBYJaRzEy2KaFIkmJBAabHMur5DPUCHF2s+sDY4Z+M0W2vX6w1phrCq7V9BmyF6zuXF9mqep3EcNtsLzsQwnAjnKbWcpkkIpcvVI1n5RE4MHPNnjaYkx4zbgi0gT8G7aZqCD6JkmhJvHaxiBfho1nQpJ0hklOvawFuCikAAMhAwZEVH8Eb7z4Rbwu+17YDdzT6EeR7fXK0ABE868W3X7VL8fHYs50cXW1iS4zE29ievXg/Ov+j697cbxuL9OLqYlVF3PP/gdOLGGtMlLgCwKi2N0nq13nAmvB+n8TBOp5wiUCeZPwCA1O1XxURis0aeqZAi19YabeiEgAir4LCLrFh+zE9uABiYdZ0l9LgU5RQFDERXq+3loyfbi8cCFZ6QIvhQCu0YaD3tptFNgyjRMp5Oh8P+ngtmLab0Z8tH3Xeb68fP+/Vl6XVwL+pTg+GZkiJGV9rpeQxhhlzNPA2neRoYaQaL2mNJ0PGBPQ682bkBJp1Ibi9W8AaBODyrPpUslHY04DGJcAZz1PVpY9b9ulqyAgdLfiAQO6nwacKsSijhgG6rMovTNGhjIMIKwCUTobxdhgeaN1anWGVZe9uXCoAFI7WQKmdBNVybrpZnCkp54JRLvt/drfpeSAV2oqQLjuUPHP4UJzw/fcWKeadMwGs7QRAuZdR+PLy6ffmGZv/5r/zq27ZPIRw6+zd+67e+Nwyq71mszDTquNw8vvHGG1944w15GN72Id/d3E2jl3KOybE8w+8o8HLDsPotHTCNoBk7E24Z4zFEnmIn2AZm+2TOSaJL1emosvEp20pEfLJFIuFIkVjzV6CZWWq+fZwEJ/lZhrkKRIuHupKi4pM4X1IvSRk2FHRe0tbD5S6nR2j5wBVzJZXp28x72eTWfW599vgZV834uSc+A7Sq2yBjD+a8eENRyVSMiyak9WBiztteQVQsFnkMY4SVCJ1J4Jyzvgg1EKJ6FvNF5Cur8khnV9f84kFx0JYGvFo6puZSQdeqlPeQsFhlttVmF+Pq8aPJzcfDUStdRxL4NlKbm2F69eqzP/wLH5rZb4T44ttf+P0f/fDezQJK683sRqZYymSUsczDgQSMPUDeS+sb8GwkOPETM4lJZQn7Fvxc0nlEFtSq9HY4ZD4EEiQinTyw/QI16UgzXGsV4iylLhU5+KawSSg3EULtvOssjC9Q2IJLT2RWY7TIPMzRmNKy+NnTd4avS4wpaMjR0bgU+gYCVsxSayOg6BhDFEJ1qzXPIgYXvMu4IymmcR5MZ2D2kCSEoLXSkMMMJC1JOsYGYgtTuZI0YZGl6iy5WY+ngWE4jI6nVEQldoOPAHF55ktLF9fbLRfSO091az24yIUs59Vmm1I+7g/9urNGj8cTE0yT2P3kMkvWqgTyeTP7ZMQ1xKbbaG1ArBRumn1wCbO3uSTimbFy5bUiC7lyyLu+41wEN5PSZN37CbHIxqfqmVItTKimYe0/SOYajUjIPM9+XguxNTZDoWmFY/azYTj6sF2tOq14TkrIg48/eX2jM/tD6/6psS7Eu3HiUmprfjROr7xXxmrTAyIQWMzGmPX2krM8j8M0HEtwbxqyBLcQeM6wX2e0F6sot1QTSKc7Y7vMyE8iASBOYjj41ix6Nw7jmHKy5QJawWDnIEXKycVkTXd9/fTqyTNtO+d9mL2UwgUy3csABrvjYZeTE6K0d/v72xCc7TsY5rdwyUXfXTy6fr5aXyRavQCJjQTpY/JuPCHRjuNwnMaTm6YYQka/790sAX6mmceiS50JSZBpqQKBUmhQQEAtwV0/sjpVpVwNoRUoUFKgAcoaXSwR5vC/gJ+0Srh5IpTWPE29XZUq08/QndZ+9hJUwnE8lb7C6JKYmdDWMuRdYjBqLdERlMua4KfrQ7DlfKrSAxvtnTfGcMZiSBHWvYS4N9YMw8HNbr3aUI0yuclYSz03nKplSllrBT4KgJkSwz1oiCpBxLkUcxBa7o67V3efXyT/l7/5zX/u+tF0GsPF5r/53/7X3769U+s1VAVZmxxnN89PHj169523xen09pzsbnd/3E9aIfvyuTzUzIkcWGl8AxnKsSqeTtmD+NYxh5SCEWmrhA6QgCb+a82+qA9EA+JX4E9TSGw72tS6uwa+IjV8IpeQWhZrQPUmuVUHAA95zLQEJTefhpliC+/hwTZ2+eNlEfpgDyx1uXNNAxaXvSpinLtPxn9OMZJmAXwhE58BYbQNXhr6RsPKLXXX4mBRlVwAUrk5MzCYwS7foP3k8rfUjgt21qquoK9MJz4HYhaTDABpEbGqEFBNGwg1z6pMBwleRindPF1JaWx3SunyyePjEZaFSlbPJbyU6ewnu8Pd/d2/8OWvpMPp2Xr15rPnv/u9jw4hwYDIAPJQ4kykbgH5kuBhIcKoTskZOFsI9ZSv0lkbQRroVmso0EK6RkrOZK6gecgkSZlT6o0lYhtHK6UN8WKjyAKJjRaoUknhnQMaC/L6gHKQO2/0SUIeKyduleGsPNiMSAWQ9i29kRIhebj0yMpxzPRYYp9dHvtMFClqRk3XAa3FJaCeKYKUU0Ibi95DVUpLgMU89TcllMVKAeFg2jNuTRe8z/Cr52cereCSuWnqu5VWJoZAmGKyNAoxaa2VUbPzMcb1etN1fSS7ipSheFPiTCzvlVarjRR8t7uRSq/X6+l0gpuylFoOwynnbFd9I6+QOjgJlglSBzOlz75Yrdac52k4Oj9TCRmmKThHvYWoSj8S3lDW+QBGMqQQkwCcjYpJxbCOF3UPBOkKiv3QNOAAZ4fkeM7euZjjs77XwOloztfW/GwYdylJzp5s16XbNubl3f39MF1y8c9fX6652Dt/QraIin/vcBwZW/UbpTsWE7ScdLdaee/GwyG4GbjQ3NxLsaoGy5CXay8W4AlNQ5TUne27flUOlfMJeC4INpX+l8tyc+d5mErqLSWdUQZrIfgKMx4Ss7a/un6yWl+uNhcltvtERnyJlcuthHDOj8PhdNqXbz+Pd7tX03QqVY61DTdVOp9+tbm8frLaXnOhOAxItIKyp/feDYfD/TjsnRuTdzE6SDgkEvmN0ftSs1KEbarzmFq1tSBtWkvORQskYPbeOpPMFDRrYvaZ0nBOAKaVGx9TUEhgROuMDCLcwA5wlqdpINRhxvIeu57Sj5U7FYJUWmACQSIbujyerJwi6qYEl1ylGAFKiNgNwemUZRc8jN0ydl6ZWvbIkiAcJSacnS3l9f39/cV2A1MwuTvc0UgspwDnsYp6URJ8p5zIQxTOb1FJRXR9EqMepuPr289VmP7CL/+pX377i8PuKK8v/9v/+//6zY8/0ZsNqTzXWShMSDer/sMXL5T3b/r8aL97vd9PUnrsfQnwPPOE7Cs8uJykIVz9fDivyFrskHVOWyk16q8q6l0ZRxxjZd4s86uFfuJ1K5x5MzCipCKqOxKwKAJiE4zkqERFOdU1bWPzVGlm1GZp2dPmmghTTY2U8nLNyK1PbP5JDea8yCxLZTrsKMtbRzCVq2YHO+Ouzu3nMsfm7MxBymzRVV8Gy3V81UoNwR9gsMgkuNoxtcVy1fEDfZC1fR5h2fJ5tl7R4kIRTCuxRYqewQ+NzwDgSxLrYcsHXByh+DItrwt9kt1CLzZN8xtaZ6lnKS4fXd/e3oZYmaysec+ovvvh5zencfhjH77w94d3Ly6ePH30Oz/4/gi5R1BxokDrTFB4cBap50kBXJbS0RMdALQ/+lRa2fX6inERPJoqpetyl3BTgB8LIXwKUE7OyZNGenldOHjCKlxZclAJPhLTXgpVIjjQJRF6A5KUdMp5SJCbhqw249poQe9GGY5LzTVRmZ1zUgmpNWO11SHNM3LLyRD6ofEaiRtDdcfBZQ50Uj+FEDQww6RNz2jVwpIU9EBTBcf7rvfeQXSjLmtqY4XW03Q2sRKqRJYeFwH4ZdWv1qj3hZucVHK16lNiMcam1RyrI0fKtmSO/rDbpRg32wsfonOzgVDvMAyccdvZhaDJaXBDzyDP8D7OQirbr7p+yzMfp9NUOpVyGX0AH2ZyJBSF+TZUNTLzPkja79Yilnphvjyf8BluSqq4rjln0Cs5jTrGeX7e2TXPsEfiF7Y7svTpNIcQHm3XWsk5sY8/v/EpvbdavVivBM93wxjhtPI6+p+OU9a261aMS4/7oo2Z52kcjqkEPb5YcC/OKaC9Eh0Dq3FgWpTUtl/13YoLEYOb54nlSPxgCT/rzNI8DQ7W9MZYawzBkiWnC8i40NfXz54+fdt2PdnT+OirvAOe5tLo7l6P8wkk+fF03M3jIKTsbU/LOTJhNabfXj6+vH5ibZci/DYEoA1uPu7vxtN+nk8xeFnB2LLKpBDCBHQ4zgk1xkjWl8DtiW5RJgawKLkthYqeBcu7FKbl9DaWdy7XVYKBx0i3kOUQHNFLMtpfow3npaMN2LAYrEXBMzR4EpmUGtJ8jpBfsKxkSpvywAYfS3GcI02/OAuB/A+y8zNEkTMOSdTKaIi0SS6890QrF1yqzpb6VNH8ie8OtzGGC2DuTuNpmIbLi8tcveUkh8QNunaYlSeeOHkScyE0JmA5xsglP552d7evUxz//T/2L//5L3/tdLvrHl/+d7/7//5PH31XbbZANdbmh3MRojNKffmDDy1jTyf35unw8u524Nml5LKYOC8JOKXAWUgiMRFFqktczqsaN0YuOecQvUhpK2TPaQXSHBSA2Mrk0FANQ3OWhHWstr7p/DAzqMjU7pw3HYtmpFd7xJZra9lVbYSW/W8lz7aus1ZxmYSMOG0zagZsvaIgdBdgwrkpeXEuNeAk5zSZSWCD5web5NqDUxFA+DHBmuvSGZqVl6zbtDGp6RV1jC34Q0g1GsQ6OyDprsbzojcTNeFWOOYZBMDZ/w/yVXv1nEEg4iQTjada5GpQys979uX7VAnuvEgBZZbDOD6zfUjJGXtxtb25vctoYXNbVbPMle1++OlLn9Mf+eK70939e0+eX203//DH3xtTlNoqbfC0CmoD4aUmgHOJZJUfEgFvIamTSoOolJHGaLvKjI/zCA0fWKbE4EPQnYVwo8czGY1UOZYnEMExx5SaR5MS+Co+OmooCTLNuSSX+LolFRxzpMi5MNIwUdr6EKKQ1Cky0gbC01iaSQ0n4JJfMQogzQFNfuKSCaGpKyXf/RCC0SZEDxgtrQnLZY3w7tba0AKbVFJUeccQU4KsgSCWMBcccGU4IDFRK1spIJMR+9WGCU2ae0opLrEcLF1E1lZzLufZsdJjdbrvoo9VEI5XvysfgiqFznoYjtM8r7abnNg8jgKCfsfjMQTfdX1i1fEBps8JFYCk4wGuK9dCdV1vVivB1TieAKhOmNinyc3Ozz5M5bJk3nedgPp07Y6r1B1g64KTSEBpesQD5TsO0RIgzCPskKZ53jB2pW25oCFpIbXRnx2OR0CIr7ebm+PwyW7fMfbVzfaZtafJHZwrlZBSH3v32ntjeqU7nN5QroP3KXjOGuKjqciVQ4n7KqpQKuSkBFlRdMZ2EPf2rjTlqY7SAG1iLE7j6XQ8QJvFGrSqmUR7VelWU2LrzdXTZ29bu0kx+xg0/DcZuGrzPM/j8XS4G6YDRB8jLWghOtYroajug1lZt94+unr0dNVfQMo4EbnouLsbjvfTeHLBcWrmeO1vKx2ZloVtvIGOF6MqLuvcrtrE8cbLIB1DaDzFTKBB6M6jlc+RtJQIM4h2kcF2k/hQitSqSU6cESWxPJK9UpZgtlLI2XttDDQcM50OxHvgGY3ivNwmIbnVFqAQvCD06KZ54GSjBH0uYzsEXxEwegoxGK1SiJLrWueGCKsVv9vdbC8uBdeMp5evfrbZXCpl3ewC6Z2mKLG9QkEo4ZkmARmJCbsnbLL5abi/u//chenf/UN/9N/+I//i+OrGPLr6Hz76g//+d/8R316lpvFUZZVj4Jl9+P77vbZPT+Ob03Tz+tWRJcfEmNMkmMtpTswzHiMmz+Vp5lVC8uy6y8geNKe04WIDlTKY7WfSgMhZkrsWqThjtSMX3S24UGRCPKZl4pyaaEzzC0y5mQDXp6IqRqXzRJnIdoTmFYsbE689MH+ISV74RFTmNdGsmiUb7o7E9U1PklnVvYhAUnVQzJfXZA8Gw+cx97lPZu0t2KLZ8QAhvWhYku7MWc6rvkBqbX+DVeSGG2vMqoWau5g8CbKYwGdIdWCds5Eyce4RKcuxRrVBAp2VTsHFgjFrqppLdy9CzsLNz/r1GCPbbvtNf/P6lpOISD5fC97Z7/70487or779rr+9ff+NL1xs1v/wRz9wgF0IyERT5oZyJEYloP9CEkhD9CJVrTRw9qU26/UVMBQlX2HRUmNcBmDWwOCd4VGBpQG0k1iqi2HSp0T7q7B+JtVAVQrwks6VlggQGiD0TKC0Uk2DS0oT/jZKyMFFAYGNFCuVrSRuqE+TNw74DwritOXcSjQMggulNJlapuATBODqGgyW+IKCu6QhW3ZuJiAVMaZJnEtCyZq4yJSuiDepjXLeGRgUJ3CaBc2Hyz2PHiNozllXOhIxzZPgctX1jDFYWmTgqxPIM5lLub24dm4eTodN3wmtoSfF+tXKDUOIvt+seGYJKrgLIhh4sURFCRZ+pZ+ytu9XK87ZNJzgBp+NlqXpBlYOpu6zEkIozVJeqJZECligbClX4htvaFEqOgycVtH3RBbc09VaQApfCnFh7F3wNz7Mzl1fXHx2uzs5dy3EL663lvHdOEaA8SYhv3c6TlkY0xtT8jcWBEAYCV5VAc/7XSFJMZwRLkIIqSFd1UljlJAByOCMj4SPAYu6nMbpdDruYvBd31u7gnIdQriQibOYstXrp0/e3K6vMsQcEtzrSkgtuccNh+Nhfz8Mh5Q9Z2yaxmk4csE621cTaMFoSrDaXj154wvrzQXMlZL3sytt/P007p2bgChPUOIQbVKI0Ivx/gI1zhxK5UDcccxYaA0mz7M9hF2WyETkrPUrcrOIJQe4JKVOZOyRojI6L8QsUYNEKeJiOewY0ljvPAdbCVtkZHqgQqyx2nSCS+/nlKOQqmLkiQ1Qpwvk4URYfVH+SPCFCBch0MWhSEMMMYqasP0KGZiK/eE+pbRab7gQNzcvvRufPHkTHT4pd7KAVyBh5xwTQ7AhY50ICWuppJtPt7cvnZ/+ra9+7d/7Y3883NzKR5e/9ZMf/63/57fT+iKy5VhnwvdEH1586cX15uLqOLwb3f7zl3fROy4mlmf4+wZorASWAs+BjBZI9KouBmoCCdhmr7jclpq7llGUMREEwSsiwFdFDtUFcCYETS0Iah8l2HlF27IYIQqQuRcf/ro6JeGRxKsQDUTe+aLXVPVFCLZEkhbnVjSfe0b+wMSb8hdhsaW2toGSzn+fF8mLWhbU3rSxaFtXXn/D+NJF8p/PrGxx860T+/bvl5+rAzD6kKJdK14hyMuMPbe/rNXFIu7FmkNT/Z65RKgSshD6STuprcLpHtBnaANpsruoNs3lpLqYlHNPu/7ogr7YKKNub+9w4BuQhthexv7jn/7karN+/4033e3dL77zrulXv/Oj780hweRLABfKeWlaEuk4+YqGKDc7gGoJ5zIvhCq1/uqC9oUxeIJ+QOAlccaUsUrpEFx5zkkjjckZq0cJBS4YjoZqFA+d4c4Yyjo+ODAxoja2xU0Zfew6i+yVgndKKUBP8b6hvCac+bOEylUIgWR3OAxsMngIBDNOKQPFTbFcKG2Q+Dn58EMqmZHLjuDMe68UUTZLcNPg4CZoxAuS1sENBONCheDbtqaGRSnENE2Y3Sk6Q6XsgFAz1twyhdIna6v6fh3gUmyslVo7H0m5sw5YwUvZbi9ySqfjXhujjQ7O5RDXm83k5mkc+1XPgWFus6omYctYxC4WIkGEU8wlDXd95mwchmk8cc4AZCUwYa7yC7m6n1aKUgvm+LMk+WIGStsQnkPW1tL7MZZHNz02/UZw4HFTr3SS6uNhcDnvT8fD5FLObxnzwWbtgz/OM0cZehPCx/PEtDVQ7Mpwy0TOaGSIZeklBC3pIXXPUef0tFIh9k30HtPX0umB1MxSCuM0nI77GGYFGLxWGtZNJOvEIyR5r66ePH7yhtQWMPYE+6ksOfNuOh13+/3dPJ0ET0Iy7+dhHARLXdeDPlC9CkshJOz142eX10+UwkQB8/Pj/t5PQ46hdGiyBEIouZAoV2JVA7biS0i+TZzF99v+C/+gCoI27kl5KUx6q38gURurnAOea8bJrQvcdizzhdTGglhMkwRhySE0RaVMBhs4xlIyKChd4MLz2U0VGl0JgQH1ofDOl4RKyAxeogME2gBvkxK8OwdmE1eo7ULwtjO4wtxA6kcqxYQIsBqF7ks47ncXl9dG2RDnzz7/+NH1M2u6GBJQICBA044DGzJZ6q1Q50eiGty4eXh9+5mbT3/+y7/4H/8rfzLc3uvLy99+9fK//j/+z6lblTORH1i9M+Zn9867777x+PH6OHwpuPHV57feOyZnlvB/5hP0NxgLLFP7SzJXqRRNqbaiguw6g2b5UmGPVfN0dSFJjTZDdWvt0MD3JhMO6gAbk27pStkyg86CndWXF4SxWCShOfHwlnx91nZkzba3aUjlBwvahf1Tc2RbYvIF8tx2wD1b5KhaN5gXc+Cqirk0t1VS++eHwCw/aITZmeDcPBcB71rQWdUp5axIXe9cS6z1mTnjnBuOu/kd1sIUCjgi1eObmwxXybHlABH+FYGbPdDievi+fIH7NDtlEFClD76L8Xln771fXT9iSu7u76s9bLu4Jbpq9fs//smzR4/ef/p0ut997e13opS/8/H3S9VvO2AlPAbRMcdyvKqPSVuyUt0UcsiJ29XadhuubCY+A6EqSvr0FZpRFzBCCl0hBSUXRFwHAVhT0KV/lBngCxBaeaogTwC1qMsFrjs1lCbMUuDiGTzJHCmpAbWgi5fwvqk6epSrnZUgkj6EbXgjTEuS9quKOdXcnib8xAdnaFUD+TaKnJmWBqqcsYmnyrq84UxpU2d6+NBEYawyOin161WmER8yMXxXlVKGKsrSX2WUNFzECCtfYzkTwQeC+NWaOHNtO2XM6XBILNvO5BCnEFbrtXduGobVaq2EIhQmr9MZULQZSWBykiwiDgnn5dX6bhVTHKfT7MbEM1xpMdpM9bylqjfbDHzrCIw0vHhzDs/k8VJ6G2NTCY7sNI8bIZ5oi9vEBROrVXdzOh1zdrEUdYqxDzbbp9ac5nkG5zVa8+NpvAlB605ZS7ozKZHYAs2aYGgJPjwZlwhITOjSkFnYwZabjC0BvCPLz5TfuHmcp9MwHiOmlP1qY21HMIzqdopQ3vWbx8/e6lYXIZQHQJSYPofohmE4HXan/b1zk4QYV4huGk+tF7QcAnM0FcygKj1//vbm8roUi86Np/1xV9I2sF/gzMRUGYf1pFW8B543DgVJanSJkFKOsqIBMmNLS1B7hcSqTDqJsqGyQ8GhaEBUjhVBZs+cdZFzKV8IwyO40MryyoQp54P8mbCGEHTaOYOWNUtMlWNsjKGQQroZIbgQgzUG8rFAAJc6u3x2JUv1SQKRrYXKgWy7yNsaepaxutoIUlPs++542MXg15tLyfmnLz9mOT198hY5EKPeSJicC9qU8oo3g+KKlClHLaXz483tp9N0/JX3v/xrf/zrabfX6/U/Otz9V3//7520ESBLncWOOZ+n6QtvvvWFN9+w4/C+d/7m9vVpGIRwOc2ZTZz5zF2m7MtiIpVmASi7IDl1VodCpcTSKW817BZSys1cPjGZW85IwFgkVhUGMnYordJqPgyLjRAhcGhmuqgO8CXtNfYRqvXMRfXWrNmWlqFpaT7b/nNBW9Vxa0tdgj2cE5/zZmNVSr2SLC0Y6cpAYLUfbQk0NykqdkYjM9Is402EK7Yuut6DKhDNqnZsrW9qU/xAgn/xYlpA51V4nwGF38qMprDJ2QMOtKCBea66XE0/E1wc4TGlxcspoDdqjm5zxcUH4iw/Tczf0q16t2b8UpmjD5unT0MIh91BaHleuOcS5gOXv/+jHz5//uzdy4t5d/zae+/5FH/3Zz8up1YZARVoEIEAs6tGvgyWR+VpzQKIqpRW6yvTra21gCD6cTxOgD5ZJTmmf4z085iETrsXgk9uqkhdQDRhBFquX6d7IRh0NBTnrOtWrGVoOiohuhJeIebGYCunpYFPP6gL0cNTRgqmHEAfMAaVjMnqnCoJ6asJTkD7UkBdBM2v4GUECT0UDZgDlqKVJO+BdVqBTOUxXYcKJQJH4qmmBC6s7YObQ3JgTgN3kJhUIoRglC3FeyxhbznNWuvS5KHU9W6mrXAIMUISy3Y9Wnw6JYJki3POVlvbr4bTMXrfr9c5s+Dcer0KwU3joetp0F0HRuUI1TWhIDYkji8QPLlUMULKruuM7kLwbjzO85QYnBbRlkWwayTGMiRRmZeCuklXioaTpPlM3/Vk6RdjEH5+3K/qIoOJtdKB508wPGeMXXL2tavrLuf9PDHOtRCTlN8/nTzjSlulLVkyQxAUyq6M9iqSHh6YXECOsxwenjJWHfCEjgTJKefLTeMwj6cASUjGeddvVqutkmZpLjLUi4TUV5dPHz99SypbHmEBemxw0+m0v7+dphPqMA7mq5+mE7TJtNUW2w2KihwaMqsnT59dP3kmpT4eD4fD3XS4H8Z9FqTN0KzjqrMqi9SIkA8ESyj66XyV/MRJqp9Uh0gjQXDeHNsZeaMrUQ0CAQJWuF1VoUNC25AYZSTOyjh9C7IDIjCaUrKcauwptdYSpxcz1dzblSmFomYwKbTWaqmtXZFEnFBsnE7IdtroDp7TDDi+TEguLuGIxpSPQZWiHHKMiaCU8G9IJIeNRIzNDn35EKfd7n6zuVBan4bDzetPnzx+vu63s3OAT3KlBC2mqEeLIWIvDemMECQ4+je3n47j8c9+8cVf+BNf57ujWq+/68a/8Ru/eSuUUN0ytKRfbp6fPnr83nvvdcfhS7NT93evDrtBijmnKeeZcwekjmc5ZBZEJZ9C/aoqqnFWsaIxRJ7zRvK+zkt5FFTckKFc063AKHiRnkqVhpTbTHWB/dAYLJ2dCXgz3UNHQcSkuo99YOzdKMO1TVscBh70zbU7JfRitc5nebmqbYXMz6+J6CW16QA2I0jI4pbA6iq2jX6r20IbOC+y1XVPW3fX1VOCNksQGzn7nuK7iYZDbj10m6wvDb5YdLLysoFuD5aoCRxx42wZRTsM0ebV9EBCLI45GKLRopQ2Qlwsu2vxgHDFKlAHelzleRFiHucrwdZKH51fP386++lwOEkoLHLWvrqUjvM/+PEP3n7zrbe2F/52/4fefzHO8+999klIWUstyXkbRTX4wcC41AV/9YuJKWq77vpVzCXHuDDN86yE1EpO85wz67peSBlcsEblCifJNGoDZ1MqpWOIOTENiSAKoFpbhBkPFVlBbvZSkdASBzGpHLhUQqSos0gQGCin5hzg9iRKuCwtOJXHTCjVDpqAoKYK2Gkp0FDgzy9gbOxT9DxV/RlRhz9YcPPSf2NOy7B4BLg0k6IJj7lqNQopXHCs+l8l3lTRhnk01hKcm3rIGEJOsaQPZXLMXWdh/5CpOhmniXO52mxBrGS+5DBC2gvUyHK9Xs9+Ll3vesWFGIbTZr0NPh6Ph261VkpFgmMC4qhQCaEtrA0rWezTGUpwyuq6Xkpd0vB8mqeR9tMCst0IBYIeTXw81o538wVMVcglxqSgAZ7hmn6ax0trV9iwcsYstumfjYNDFHin6170/TRNE7FZlPrcuR9PE1aEvdGlnUo5kEs7rxQ8QZLDpfLSpdtWJVtEENexxqalY6lJpmk8zcOp1EyQT+rsGnvNjlfKTt3LpJRXm8tnz99eby5SYtHP3o9+mva729Phfh6HzKKEIUNOYZoG8pDobIcWs3pX81w6odX68snjN7S2h/1uf393OuxoRQofSllLF5S0kisIg0QBfZOEBWqt9gWh+aiiSThumGO1uEh2NzTwlJj9hPLFSbiuhGXInsuWpEum7WwPvzKmYKQNuKSF5KeFg2GnjU4pIluWJ9QoTUqn8zSEOIcwT9NhHk/zdDidduNwOO5vDse7w+7msLs7He9Op/1wupdab9eXMUUYu4uUmDEaZVBEzEoK3TNjDAbgZAUmtTIlg8aolAqwqTfWHo/7FNLFxRXj6dXnH2fGHz16TrjwTGjDSunJoCTh4YYheAqlmPZ+vLv/fBj333zvxV/8pT9j9oPq7Q+j/xu/8e3PsB3LbBkDlxPs5/nq4uLFiy/14/jOPK/29y93u5HzKWfHWOUd5ew5C1wEzJBTczpKFapEiQqC1TFuhFjTsL9NZev7lXxZ5dTxoQXJPpdrnYi/BKQ4rw09LVzqBl9AjY49MMVtiQ+nQ+QHo11+hm+0KevPTYqrUscCvsrV52ExKD2LMi7ZfJm9SG1XNI0VdUtM7Xb1kRB17ruky/NHWpJ/zdG5Sko2cZCKyF62yXX7vWTqNnCve+6qO7NgrBbSFIDbIp/Xv4wUkhdecyKBLHqN+mXxP4gOwiqTpgJiWTtDN5+TqjVd9Pzg61WprMx5mMZHQvZKHVO6ePZ0mtzpeBKqSicQF0xKOWT2T370oy+9+/aTvuP70x/+yi/sT8fvfP4z8rEW1d1MUsSXkkRKY8XUAnMkhOn6jVQaunGln/XzVC22pGSkwM4hylNCmFHA1no/w3pI0cQsNsBX123KMwr7bll6W01kKi5hnkhaJZlsTUTVOatr8pRIow0aiTDkL1ctBFd9ingVg+S8ZKKIwFW7+YQ1AyadAh1ACp7V0WX1igYHg7nZaaWlMsFH8KMilwRAwkNFd6eEA106AB/QbxF2iaw9Ugih6zoSmcJakVODq6TmYIAopaZpij5stlvbdcF7NztlbLdaM+iBLLUpnffN5iLnfNjtSgUj5DiO6/WaZXY87GxvpNA5Jlb3gBkSm31iSPzYYTPaP2Vi+bMUSze1IrJsCN6P0zzF4AkpWEs/1gjPguDIeJhTGwwB6cY4t3YFm1R+mgfL+LOu89BNVKy0UDvv7kMQjH1lvX1D65NzBAWZtf7+Yb8r18Hari+nLUaCWtJzBhQ2F1waY0vfJ4iCEinFIrKnmPw0n8bTybsRuCFWUnW36vo1mSXnJMh6QZAitDSPnzy7vHjEmHBudNOwu785HXfj6Rj8RKwHWVrM6MbROS+FLqlXqdrHNB23LPhqve379TAOu/1uHk+Q42BN/Z1XgQRRIeWpetBxFglYJVgT1qAzUw3YWbO7fgAOpcCN2r7KlsFDggRrygNLyxyltCydolJaVyHV8l14zKF8fngwsByin0hWbBpPp9P98Xh/PNzf39+U5Lq/3d+/Puxvjvub8bSbxsM4HObpOI0HNw/ejcHPQET7GErVMk/jarWhvk1QrUGLasA2Q/Q+eIDUMugDZJJNVTEXXHkfSDM1eL/f319sL7Sxh8P93d2rx0/eWPVbAMgZa31LIh8NzOqqUBJjSsmU/N3dq2G4/zNvv/trf/rP9cdJdOYTFv7mb/7mx97Jvs/VOaoqFvnZrVfrL3/4Ye/9m+N4eTy+ur89CT5lMaY8sVR6X4bel3Gfy7FJggcMTqppkqCBE4sxphh7ybcKHMoF4QxAFPbdtERYAI4VQBdZpUlm8mpt/V2u02jQcurolS1rTwgq1BUn6tS2d83VF6nmBGIoVTRAaqvMKhQtqksha9PaBxmX1hKN2kPaL+T3akXbjNZlHPrUfB7v5QXVzPjPwax44/WyBU6WG6WwUitE06NkC7St7syzaHjkB2gu1jQ8RSsqqJlv4gwPZu2U/eOyoqOAKliVMyQFaiOEh0YcgDPy/OkfcKErOwqMeJ7PIwDIJ0g/DldKqswHJi6fPhnHYTidIHuMb4qDIJQ6hfhPfvTDD99791G/YvvDH/3ww7vj8buvfpaFUqWNVAsqO8Zm5Qu0FPrYUi8r3ff9hoS/YvAuTJBbh3c9QqMxBn6CESQ35f1E1i7VkDgl76kdEsB9VFi9gCp8jKlf9fBscSkkjeRGMzT6JIQsFCjtIYKTG/gCU+sQ4Y3YTCQRu0kYK6eE8S8BkstVU1rToMP7ALXg1CAtARvYBHtEpqwpdbqPFQ+D1t4HJ+FZz0RpizV6i9nNvOnUsJxsaXMTvRHkTeRSPcYQFTyUGMqRGH3wKSUY1xsdQxJSGNNZ08cYg3OkionFMLN93+vVcDoqGCiNw2CskZIfdruusxoeCaIqXJYS4eLyarPe5pRcgD0T7ly1IGyYDim1sZ1SBndnnufRwxYa9Fki3lWicyloKt6rypzDMSCvuj7CBnZycwr+ed8pzF+VlFqrMYRPnVsx/tXLyy6zY6l4shLqVYo/GIfEhFZWKwMSM8DAqAgBBRMa1FGK3YmE2eIMf4jk3QR61SkGx0o9pEFE6o1daW1y9YhB5CMrIsY3m83F5TVj/HQ87O9vT4e7cTgG76gZIbJvZuVbBDczLjuzUuVGVzJjI2Jmo63qLGN5nsYQHEsBIz/RIlFVPco8hVj5y9UVKldJPqoByemDdDKwiuGCwYECCBHOsioZtR1lXAjGE9zEqONIIYdSGrLkwxyCc/M0z+M0HY+lbd0fT3fH/d3psN/vb/a718fD/f7+9bHk19vT8W4c9vN0dPMQ/BjjFJNLyeF5VFxoIa1SvTErY7ddf9mtry8unl9cPrt+9Mbjp1+w3fZ0PKQ4D+NwcfkIHunJdpbgZrgSyTm36joAGEV5ClI1JoJKe7kG3k8hRGHUcNrFGLbbSx/8y5efSCGePH6+bMkhiofTKJnMhHcjMc4sZCm77+5eT8Pt19959z/7xp/rjhM36lMR/vq3f+MH46jXaxZDo7CWjBK876z5yocf2pyfHo6Ph+n17e2OiymX9ncC3sqzkm59ZlSbp8xDVUJvMFq0Awh4wXB+oVDLN1pYrbcqt4fOYKPWNANgknRlVahDVMM9VpEzzbavLX3J9K51eFg3sCVNVmdB3mSNmz3/A4+EczrhlexbRdJy9TpoS+DF4bchqaA+k1TdY/E22Y41GSP9YOBVh2TLAnbRla6j7kX3mVUIeNPNId4cQGuYR/NmEJUIp9am+mC5ENAfWrPExSNEJmgDTFKRVTt0oAXYGRIdS/layT6JVZNhFDlJMHGp1D4mD1gQmeDW1RGl98RCW9OLciyqJILI2WHCkaXgd7dPrrjn/KXI737xXf/9Hw6nk7EmkbFG+VZJdeblOP4Xv/G//OVvfvM924n746/90i9nlr/1/Y94f2ENt8Y28gkV2hK2gZnE/UAbjfM8MS600kzqfrWNfnJultpwkf08O+dKjtDG+zkwp43x3sccNATzyIqNsSCFmf0oSvNkJbR/c2l8c1XIQ2vlg9fW1OCH+w1qiqqXWVZqNzmf05A7owFKKWtr6DsodAGu5GUECZ644kAt5ur2QUrpkaXyM1HSYkImFlNM83g6Xl0/CaUvxBQaUBZCbHLg3UBoSbrr1vxyOu4Zj8Cj8sAiV5CvklyrLpYOWFYrLSGCjzkyTjs2rRKLwzjmzLpV13WmFMghGbO6ulZ+tdnvb4Kb8CSmHJnuVo+fvnV//yp6Z7vVcTj0Xd+v1rc3rx49eiq19cFL6CmG6Pb7u83F5bMvvD3PfhhKXI4ukIpjFVFP1OryvlsZ27l5nqYh+Gk8jhOaPzA4OU+As5Z7pOkZANukNJg5x3maGNjtxnSnYb/3/hrksRCCDlHj+buQYi00fI6TUIJrc3vazXhaldW5NgS5CZfBhQMy45ns/UJA/RPLuSr/5ap0rmAKMg5KWkLJ5izIhpkvgBt6TZ5DCLvbG08CYVS7ghxOoaxEmlIMBSGl6jouNa+RsrYggtCSqhQ/PiUOGHObwDFC3iBIJs+ZJMt1CqLkvg1BF5DuSP+mmeNkhA7sSmMKmZVnDhjDQFDYBC8hLMvgT589dYKpYqAXwss/46+F56kk1N37bt13F6brjO1FCT7Kmg6MPiGlsLZv8UZG8HedC8ZIa/uf/PB3/TyMx/16ew23UQhrSO7CPIdZCek9UpTuy0OYQT4mmFwMITtBwmOZz7PbrDdCyuPu1rvT4+s3yiNAiVPQ/KA01orJLJnENsqnbK2a3bS/ez2ebr/+zjt/9Ru/YkeXjXop89/81re/Pw16tYoh1J0JyjHvglLygw9e2ByvjtOzab59/XonxJzZlOOUk0PShdUgJ3/fcpyaH0kmNilyVrlbISiWtxJWg6Xeq9GfRk0kzF09TVh1MagvQj8rBGZ4fBFXrvgPJh6oLNeZG20klhFopfy0hWvFeTXdHL6kRyK3ZiKUVt1kVrElrMlEiVYtsFYTtDyaq+uMOo/Am78gcJIV3lq3O1VhsxKb8A9SY/0kVmWlU0VS5wolo5xW6Rb0brXSxRoK962NjFmbEZSkLZIgh+taGCUOeEVewN00KSIwM4iz5d/w2g5nlUUlB4C7p5ncCrHzHjc+aS1zU7KBsDTE3HgbbaDmoI0d8bw5F0ch2f3dU8aSUq+4fP9LX/zoo4+m2WmjKcAkDi2IvvtknH7923/3L33jm+91mu8Of+lP/rJM+e/88Psow4TVHYmyE4eXt4VEFf4tnykSztZoW3qFyLp+U4Kv5GZlYUEaQgqCCaNMEtHYCN/WTGVsKRYJdJ2iFDzBNpgQ2FZrH6E0K3VOURsTStjlkjOltNbKeceEgFl84hn2tDmFUPohRT18+WCRNGmVNqy08ikwD09DgSBe8m8p0llMnBshO2sGPxGqUXIdcyB9WehIJjcPx8Nuvd6O05x5IMIYUKblopKgD4PaQN+tecyn0w6lGupMAGXi7DvVS2S8CDtVyVgSOQTW25VSprTgQmwurHduHGdTaqCIKUKQWht9KbQcdvcDjHoEhxgI548ePzvs76Zp7Pu1d7OGcOPd3euLy2ttV7R4A3wgHY9HlqXtV4+evvno8fPTfnc6HqZpSNFj3stEhmM09DS06WVpRp2bJu/naRxCCAagX6J4GkN5TjQNjJKYoKtgs1Cd7nZsv0vxcWnlvc/JUrfG2KOSedIpBWol71h8OY5ApoNHlOkZlSTpDCOK0mF4zPYzy/DvKk0e1YKQRetglalIDgXajDS+IoYIZ1W5sEYCzpkbJkZz4NrMShoPSxRkAS6cWmuhtGAlizdfuNKwZcG0MlKrkGI5h4DlV46lFJrxgBhXfUgZsRmzoGzKmMsp5phSdulE80iIQWOQjiIm46lIZ/oD+/mc+s+SX5c+TwNHocrlkYYLoUwHSlI5JgqOF0Zb03VKG3jaa8FkzpGUsWLOhssAnxIJZ34XIpd8bVfuNO1PR6604Pbtt7/y8tOfztPd4Xi7uXwEJFcpFZhPzs+wuDan41FIzkz2PuTEVCfKqSPJSp5h280PpzvG2GZ14cO8v78Rwph+HVBC+clra/FgC3T6MNuWNIJSbp7295+fTrdff+utv/pnf7UbPVfiM8Z+/dvf+s5psP0qLfqMiOKlMOX8yx+8vxHq4ji8N7nXt7e32PXOOU4sz1gA+5xD5h6Yw1Q6n7ooWKpVmCim5IPMeaOlIX4laNHUi4az5XxjM7DKwg21jUXeSZxkQ1Izxs2t56tZkhKiqAZBqQlINh1JdmauZrGY8i6gqvqjix0+eO95EZrkaBFLGkI7WXVtcsOENQg1fmGfmWUlwxJBgRCGVZOjiQnVrpQtU+bcBgbsLGidl6tDNEiKLJKcn3iuxpB1y9qY64uyea5PL1JzUw5pzXTVys3VeL2N/BPW5bEmUTSkkUrjXOUCUkpG8LUSh5BSEj4lJWTrf+tonIGTU1IHy6EWz2ypPqodxe7+uSqN4KuVfvGl9z766AfOe6lkq13KmbKr/uPh9Ne+/Xd/7U9/4z1j2P3+L379Txkl/uePvge4kSCkBsm40x48RUCTeHJ+lLPdbPqcRSz1YkYVbWfnQgjNNYVpoQlpEgn8DDI7hcYoGAtJVsS3HN3Y9xujjXculr7IkLEPkXphwSuY5Lr0tcz2JbV4eMIzzkJMiiuuyq3Afhe+yLGiDVJMNFmRTObEffQMU4rgafuLwXjKHDtjmJqlyntmIqXA6q4vDaddzsl0PWcqw3aGMSzyYiXqlIopJc+D6jsd5ugnYuKSzFJOcZpOtlt5NxtLzhOlwjFCpRgn74VSRnc5Rq6sUmqaXSJlKyT7aXZWr8SlUMYOp1PwM4dlVPBpe/VIDafD4c6abvYz49x2q/3ufnvBre1L7U9SSyFCW587H43pTb/ZXl7NszvudyWpBxfLlalWoOisuNa9Vp0PjsUQaOEPmUeWsnMux1IfSC1h4qIgtZIruwXz09fT9CXTSVoFAmOYGbs0pvT1lSsgPh2GA54riCWV7MQrWF1ynqNzM6YEQAXGlHz5MKwyIoztcH0UaTKSkjAXpLIL75AsqXYk+ACJnVGtz7Ms9VlKkizfeHnWhnGGCa3CTUmoBlO5w1hjl5gvcNBQ/aRSQgky3AF+MJS0Gj2hJcBhJkOTnMDBKwEuxbaK+6f/IgAcURcJJqxItJuXysASmBnDJ4mKU2P5izyrNRYFUqvyCxFYdnDhBDCiHHWIXknOgOIGZqoEB4x0UswhxOSDMdoIGSFUV95CylCOjRFCzNMYYO+5Vga0MnF1/ezlp3fTdAxhTiFN0xiCjzGt1pte9WA/wPqxFO9MWwNMSelztBKQySs1ihuH9WrDGLu7vXVu2m6uUQrzCUqk2tpAMrC0wkK0VUpP87C/ez0NN19/8wt/5Vf+dTvOXKiXLP/6t//Od48nvV5VKxfImwvBgi+Z9MMPPthqu93vvhjC3d3NXQyT4C4lSr2BJs9oZFMWgVOjmlIFBRHppZyMkEv2XQthU5UIzUxWGiNvLEqxiGLQFC9BkRIT1zpszjSaFjQBSW3IzevypHa1VCQ2mi/lQMxqxeLDUCUAqkYkyQwtklZ1ApwXlHIC46QuxGnHJHkFKhCKsxr8t+zDVFVybpB+EsCo0M722rTMrlvs5ivB2iw1050nPau2wa+suybJQh0vuYgmhO5ESLW23q4r4yoLlMlHMS/qH3UzUy9uy7OLBgdtY3NdFrOYz+gLcplNfQkd+QD5RyFh9VOnAjzTFow6cZKWY8QU4M3cLgkpDinL29fPxbOU882m+/CDF9/53g+iD1Kr9tlg2NCvfzqc/tpvfOvXvvHNd3srd7v/6E9+XQr5P37nOx7PvVQ2kdkpfOPJuilizRuCm/1sZVf6IdsHxmY30ys7P2tlQoydtiyxOTmwjyQubADANisuXcnckQsNsb3EYXcoO1H63ZBgqURuUUwClgtHXqichwgzWulTlFi7MEhoMWhBkxQlmA8ZrhBRI4IwxkvOhn4ITnkVH2Kce5/g7KcJgNMgM1XTrrHP8jAejNJMKSoIElWlLEnI02dGcg7l220vr4+7ezcNogmplA4ozMKVrOPcVDpILiI0yBIPxhopRPRBKZNz8CEabXKKw2ns+g5JlHGhMlfr7ZU2q9NxN07HUtJJ4X20ZiWv5OFwUNKGVDL3erMZxyPPzJguYg3MWHbzoEx5Kyyu0hxKML64fLy9uJym4XjceT9z1C8ZuSLA30YpE7kwopmDi2oTFAXz5ZN6iDyABc1F9HM5xUoLqY7BJZZXSmdk3DHFNWOPjE4gg5YzpdTd4UB6tsYYIj3RxM2XCiYguyUuGHKvIziJMZ3SHW3TYcZH8MAqRs7rbouIrrLtoVDDcRSgEiR13EFJNMtU8mxIUQptlMgQna3AL9KhIu9ThP/gfcktKSAHp5J3SWAqh39qchVMKMY1YA7lwBttyYUMta7EaKf0oEopDfA/ClahtVGafLfLzyllS7ABP52LUnoCzKwzvEMypw+d4XLAyEkMS0dw3lLwoVwV72IKs9ZGcDE5B/0UMbhRcwksUcopnYZYEkqKXJBlC7O2U9rC1ksJ0fW855lPblBCdv2apBx3N5+XeiV5OAxyodDNc2XNijhYUiuwXGXMsSR78vuJbBhPKcbNajPPp+NxZ42xnYXvdTwd933XS8FjqjIKiLCJS+39uLt/NQ+3/+qbb/2nv/qrq2kWUr5i+de/9a0/OJ7UapVCJKlrGpx6H1hMX3n//evVers7vB3S/ub2xs0OLNApM5eFw+TZcxaIG02iw82Lt05xkUADzP97KVYcBlJtv8lZk4qgUWtuizOMeGPNAJQ0m6NRmxeDNUAYAuI9i0VUB2ZK2HRU2DN1kmJphHlFGcpzM8gbhaXa4jZQND5Fk0lL+Jeprl84iVOwhrQSlROEK6hYbb2b3DNxAc675abB2HJpG8i0BrX2rW2U0EBSlOppcZ156zUzP8t7UZuaq6MA/WPRvuR5Ar0oYT4Q+GpEghzB8IWdaiQ6AXgF9RJXWW7K0DH3UiSejimXbKSV4HVrWnlomGBTP05QYdhjCo7gSWoLdymL16/efP5mOE58u3r/xZe+/70fAPSv28igfCez3vxkKjn4L/3pP/NO18u73X/4x/9Ep+3f/r3fmxmzMNx1wMtgDQO6Yk7Red4n56YSVQiICSefLLgWtvR53pdkG5Mp71cq9Bg9NmACqK6opAylT6WknjKtCqXXxgh4NkhooM7zbI012vqQFDzkkkjRR6jzca11iBFWjHzyYw7QaqYmGPjtSHbcuXS1HDQXUKmgaUwsACbL3Vdko6xTmHMbKFZyXp1/pNL9lD54328uSqqOWWoVYyyh13t4RgkIXpZkG0RcrbcMq0ouFVViOeUYQtf1U2njOsnF9P8x96bBtqVnedg3r7X2cM65Q9++PXff25NaAxIGMQgkZozAVhC2y9gpbAcIgQTHuCqJXcHxj1SRH66YwjYB27GhjBNCTMqJy7EBIQmEMQIkEFKDBd231d3q7ntv3zPus/dea31j6nve71v7yP6Tn5bb6Harzz57r73W977P+z6DGzkLQkjnpJQGlN7c6DRNRmBCiuVy6fJr2KZpBztolasyGEZN2882Z6cW/kQgV5vLl+47X61ivjgs+NC27WbYhJi6dpY7SDzltt9q2eQKaYy1lgvucpsiFnuXm242Dtv16ixjO0parXd7Sso5D3kc88w76LVgLSJYTM65GEYoTpX0Y8SSlsO14I5z+4qCmcPKu5mWqTOrwfcqcqk2LK4RGNCYBgKqQK21DwjGJOCLRMDcseWq1JqM/zQQZ8BgRoCOVPRyGUNw0uVIMpJDLjLlTpOzFrorll8wNw/BQ6+e+xNdbsSQPKKxykoVP5c7vogY3UjWRhcrK5hKSgmTq6nSyG5WRmuhDJdCCW1MqxvDsDVu9AziAgnxKBnFQbPOIY8PXKGjAkmJRUgjsfTB3DpGY+jZDUqwGCzPnaUahj7CbBJq6GQRDyylHnM/l3924523jtgjUqoUXMTTBp29J0KrtVZx+GPkD2Ow2kd6IUgQKbr1WirVXb58TZgO46WIxZBomk4KRcXH+16rlkkVU26mtTRCin4cDDIgxtFK5RvyuZRM8NzFZHTB/TisZ92CCX62Ok08GNMlxrWS237tg9PNAQJsRAioFphqDON6dXbktidf+/gTP/i132D6gSt1h6W//8sf/ux6beaL4N1ElBVwiGQxPX3z5pXl3uzs/KHg+6OjN61zXIy5+hbOs8UaIODuLRxm3M1pp04lR9mQop9LPievV1Fi4DGXTuTKEgkql9RwkpdUnAoAGkUpUhW1pkpTToS2S1w4YxVglmFwIvZF5CXLvxhJfYHop4Y31GI6WVtVvlK1VmdwQ5roVjXnhFXaYCoGG/krKCVwN0MGxyNJlORIxaz+rsqsxl6nZKfydGGazKnA08Q5opeoV7msbqdwIwRFYZVUvGouSLljqcO1ZajOzUWmLVOB16ki9Rqdj4UBPXdF2MDIRSmDdBnjUoggYh+ic95oZFaDlcGpNSOhJhIwPDVlEOsTr5rCUw5jjId3Hr56/8vnPdtrH7/x+K2XPpdveimr0Q5nKTbd/JV+++Mf/cgPfM3XPrGY+dX5d7/73Y1RP/87n+pDaLuFkDy4QA5EUP6k4J3tbdPpUTgjmhCSy6dD631wPuBTi3Y2I3usFJk2iChBF5eI3wlKI/dMtzSJSD7GjjMyoU0wlSfdVGLMYqydPynO6xK8z6ljE2W7gw5Eck1KsFhMDDnCqJgLDvoVkXIpjloYWKhjCKnQE0SsIUEHwWqaSbSfgvxTMsqJQNU2t+SzfaEk2ggRkggskPWVEqi1skgQ5nsH/XY9DluwFKJkPETf21EpLRKLgYypkUoL/mqjm8SD0KJMhao/nNLG5xYbsYYRCXPMNO1MCjX2m832jNGMO8b5cqGs6LfnSNHhujHbYcN4alr4D2TA5Dbrky45wRYKkrApW1SpJjXi6v3z7XrVr9foXfL7izwIoXk+APNdI4KBxWPGfrmt5B6IM6Ml771FvFTE18QY+8z5StJEFV5RRvDfPjwm+zHOxTaGHg+j86Pf+HKElI4+pKpzJNU7i8w7512oDjaMWshIzgC19abutp43kRW1Jt0kgaDQ1PFTASzm9nFKX/0P96wcM3JpTKdb07ULYxplGqVnXdNKqbkS+f9yRXBAJpV764yLck2UyA4p7vpcBWdZgLl0DDwCzXKZDxhBSgkutErg9CmVC1uuxfgqasZGvrbe22HoJebMHsHSSsPhVTI7jikFwRTQp0/YLkMqXaaiFIQEEb+TOCtiDDqXN2edi/lZkwZlleYaAtExMQZnt+v16f6BVEbGkE+gFJN1Yyz7eBjAVTItniaZH38s3QoqiyxG7BQ8o7tLCrG1YwhhvliO1vVj33VdgjQusdhvt23Xca3oDKdVndJyGDenx2/a8fz9N5/+wfd9Ld9uhdZvxPCTH/7IZ7ebZjH3aLXQw4M3mjuY8PTNG9f2981q/aj3q8N795z1glufRg7WVeKWJSI8e16C8VMk4yo+WdHwxF1+1HzL+ULm5qgw/RgxsCRNMyMvprfF7DoXDVF4T3RD4gAuCLPkfCYKIitb5qKdKTckLUiJSEtoqCR4FIExr8pg7GBjvVqVDx1L9jD6N6DksniuEiZM2CdiJU76QnWua1yeeDM7kKJOgeFUVBkHZWHLi39eGRiz6p0sKEG4jpw5YXk2MbBK/hGv1R4517KqndkUNwgmJe3Cqg4p1utEJbuImUs6Bt/lRSVeyLZMxHqZWHWzwm/HFQ/F9hUDeyfEmQtDyq2pkfJCYgRiuQCIJTLUJEuaMc14/r8itoxrrhRLJrJrpju4fOllY9bL7mTob926JZiC2xUZbWECroTfjg9J+f1f975njB57Ky4tf/5Tn/rfP/mp0Cyarm2UccE77+BU54Tq9vavcqUbMxPKRB+EiG4cAjZhRhvnXEZRKWmp4BQtGqVOV0eb7UqQOlrJYdym4LpuAePf/Lnn82VrOp9CTJ5WtjGFpjHO+wy00VpUNUJ+99ZaiUhh50fKGcRSCixzgkcMKSlSc60YE0BuTCpJtxMSjbAPw2TL+9EOm5iPjIh7JVAzFnNnlI8zcogLIWo9my/3E3zg6S0l6lmRgUB5ZCkmrRTnabs6G+2QwLWAg4zo5vPcdCrdNA2tBoWSua0V3CiTTyY6xBDtSJ4DPjjORPS2H/IJld9tdLQq3W7Ot+fnIVj0fFHBqGu7XQ3jRhstmPTeN01jlCYrL+ihRTtftIs9BpfNwvIHwIWgVHo7np4eonWgJpT7lEAu5liZ4PBNSA4WFKDuUgjWB2NaxtL6/Mznb8Sx9P9n5fkfw39oZE3R7xnISqW1aY1u4b3RGtOapkG9UByjXqD13LohByBXb5K281z5Anz7MQMHQMKLks9UzAgZGb0EMVDnJIjlpPBPtEEPIcNUOrJy4cfYf71eHR3ehe2ipug2zMhFLoFEwS3jnXyfY6IQcdBiiZm/u8DRqDGYvsG7xGNf6zBDpkwt3Pow1SY9sWzapp0Z3RGkXCz2rly97n2uHS4479ydNz77+iufYYzP969IYXBWxkbPzHyhhIrRYzikUIZ0Y3SILrcKIj9xIYaz1XGrzaVLV++9eacf1k3TOOf39y8NQ786P9u7dEnlJl0QmUNI7obN6embo91++7Nv/d4v/2pxvlZt82ocoTga1HyGyGCRKKsX0Ukxxqdu3Lj/YL9ZbR8b8s/fXa9HyceUhpDriGV8jNxxilvIDx7GHRzFlVwminY05CvmTYoH8BPHOltQJpXPR7ugLiHygguKwyQWlsVsvUx+xS7RKNFOmdfIwUik5IljlcjgrVLXLxgVE1NrAtZswiV1IysLwGQ7uTnI3EVbXizaOEbkBb9RmEuqNht1ppvPFk7uCEhgnuK4WGkKJg/ymnBULlsxgqLBdw08YiXuqVh0loSDkuOJx2CiV+W/DSUlIp+jUtB2eko9orUuuprq+1TeNS1rJy/OOnDgNTOR5ApVzooARgGkEzmpddK+Vsm5MSUXGTQ8dF7AKbHMz+s6oRiLoGFD9kv+ziQ/tCM7Pnn04ODVEOP+4uYTT9x66WUWEMOANxGAqPVs9kbf/y8f+ZXv/ZqvfvtiMRwd/6l3vlNK8U9/65MDC6yJoBMXx/MAOokbRy0bY1Qysu/PnB9b06J8EvGBKWkoRts7Z4MHOCzcgVxElSQxCcxdcx2yzmpjgvdaG1LXQdcLAwEwWpTRuW2lkKKQtNLOWamEktpG66PTynhPrl+csD5Rz2nWIIVwIUq40VZFPAYVUSN3U/LcwHisnWUKlLo6RUSnksoqpbPbzTp1s6WSKjAvhaxelpia+qCNcdE677TWppv7GEK0Ajk2NgY3jE0zA1Envy1EGWk6PoXIv1dq6bwHQJDJeroLo3eM867r+m2vtGwaTQSvbraUUvWbjR02lK6amNg/uF/3q7OzQ6OSkNyOQ4xJNSYxoYT0kW3X5z6Etul4w2Tu05BPqhFcz6xS+uDKtc36pF+f59M55etJXiygKgMLF99HJoXOd3BjhM43x/0PPJLrjx2dtT644L1zQwwp+nx9EiNTF1r64HViLNBT1HiWVBtvwrkiP/jkH5yfMhgogjSAEIV8aQIp5SPhlkSBQqBMKHztUitJS1yB9XbEgj/j1ojQSSV1whICTqYaSVmJ9q5RSCwa8pkeLOTamC6QQoPuEI4UECThC55k5Ll4kn+IxyhXg/dAgzMhRSRJKLq04rpDJhGxJivgSgTnaVsvsPgjJ3KBZbZPQ4IAgGQfdMliInm94MwnsJdjCBmIgxoWy+oMgcPYfZNxDaEKjOElltH5kgVGrnf588Zh2J6fd918ubzCeFqvT4WUB5eueZcvS2ua4AP52yhevO4B7LWsVqWC8eCcwGTewxgAH84pIZzbshi6+WK0w3p7Pl+0Q+9m3YIxtu3Pm9bkr2/yaGJpu12dnx0F13/n29/5n777q+Lxie7al/z4kx/5yKujk7NZWXvzWPYg0Iw//eTNa5cuzU5Wjw52e3py2G+dFDYFB7ae5bB65mg7QMsMJO4i8LibKfL8IDtneNrTSqGFicVgEtW6xEBVOMyLBX0qY9VUiwyPlQo8UZXqALoOgSivd8LdRQpcLTZKcPBUdXmNdppCsiYbrBrnOwU7kL0lsEwpVZE4FJN6iRY35FZNCqbiusPbxT4G59UYBB14fjCIKSPYVPcZq/xjvCxY4IGIhYUHzaojcwlbKGOGHX+MFbUWjbGnsspK+BOFzEwyplTMwOrSsK7SE+miGI52UUfcxUMlv3QUZSHOkTeGJqp6YlP0m2P8LESLlD2NBRilcaSidsjwV4IOrQRTkRmeGi41Z4oxw7kRog3pmjbzS5c/L9X6yv5pv37pc5/L561SsViBRsFym+5He1/y3/ve97xj/8CuzuTVq//i+d//6d/4DatnpjGgrOf+34e02LssZds2M6lNZCl4G7zlkcmmwaosIeaFKWUwAQtSMjtu+/VZGVSAzrPZrJRsVAYcMgYvhJ7NF4gsT6B2Mus88SdRoWnTQHmr+Qs0gIbeeaVNYsGOo4KbZt1TkNWflFrjlNRksJIBhFJ04hOvh9KEtFLejnZ7zqDui6w4pYrqSupw0JM9cQixaRaz+TKm5EMkH5/c8OR3DcISTtbgQ0o+sbQ9PyOaA9mPmKYV0mTERdlNcMBuVSd1BvFSarorc2EoSXWwLYCLYS4AkC3HGLuuG8a+bUxK6Xx12m9WuSrlk5M1TRvjeOfO661WFF4Osw7VmplUxiPbNQMzbdp2ni9IvlJKCVxSHxHyE5RIZ2en2+2G8loIIeNPJa6UVBeMNOiMjcOg28UDDz3q/XTgsNwJkXtJGdflD0MkYUFovzr2F4Ji6ZQFaJqo8fnFRVUVMjh30kHGkY9OBCkMLvCAI5wuozcU3ARzKEmirDLLTfBlSvA7xycKyYPuVwispHrK95tHreICCfMMsxqBAFqsgmDalYiiSFS7ul6r6skCbWhiDoN+skgjchCaDhrH0aSSU+qRIMuAVAKCXNHsFttglsurB2Uq97XBx5hLDWkkc4cZpc73ulKaS1koahTeIiDhQcOhAGKQ0MCxTAFbPDKo23mALxpmovnmPD5+s50t9w/uC/Bxvv+Bh4xeWDfyGG794W8fHb0sldnfv0J6zcTl3t7l0kpRUChaooxlJfR/AWYAwa/XZ7mcX758dO/uMPSmUcPgDi5ddcN2vV4t9ve50IoruPSw1ep0fX7Cw/Cd7/qSP/+ur3CHx2q5uNWv/sGvfvg1n1TbFd5AeWQYLk946qkb91+6PD9dPerseHR8Z7vtBR9THGO0kVvGRp5GJPt7NDkRf2B8Mm9M5AUbYnLemZSWijcAdHGX4c08utGSuFztnRk2EbGoaeoule9WI1iiFkFdPdaTKH6NhTucwAbgU4Zu9WpO0164ioKrHqmYUcYLTk4s7TYzZMCT6wavMbKs2iZjU1VFvcVsp0aSCqmaGc3Aiwszr2+Ls2riURN5SVdckWGlQwu+Wy/zLxixl/dcqMqpGJJMH6DE85DzLdlL08qY2HEXkhFLVEOow+fqelkdwNi0xyYgLophMueTaTMZrZUvITEJR3yHfFcAjpJPJthOoU1qi0miXVcPxGnLfxxD0ON4X9et7aiWi9ly//T0yEcvlKoe0/m7llquQ3z+pc9du3Lp4atXx6OTtz7yyHy++P1Xbg3RA35AkxB8O5sLqaGsLb5ywQepVABCBd2aPJsDZQhqBcNh5BJW38+MpJ0ftWrKKjcmKVUGwQAZGYjg1PA+EEr2uZAranIR4EN8B0bEFjKeBGIgexqigPIiVgERQ5qS85RRNVYRIJdyJXWIQQmQNWC9GYGaRfliqGGKokZuCcFdBHaXClPA4iqVj0HJA3x/oKklQ0IOtnYArzKhGOQvBVls2ugGBh1YbscoYDONXPGCBpF2jGgaLp23GEFLBDKWuzh4D9OIjkvpRpdSUrmhiUrqveX++fkqpqC18s5iXJmrl9EGphnJOWfd4J2N5faNlKBO92gMqe1mWiHGNTgUHbzT/AHl5E1OIXgpRiPlOPbjODZNC8fv6JyjhVCg9QAUadB3UqqNjAH6Wkg7QsRZI3SkjIKUYHIpQog+3yuk/c711bnoAiJky+sygGsWMG2gSZ7PP5Xfnw/BWU82185566x1AyaxGSbmG9T1MfhonR1H64Zhu/Heep//OA69HXuyBrPj6FxvxyH/Ezu40eJ7CTF6lpsz8L+QiEVfer616p+gHeKS5O1KKzj4K61ABpeVZc0wEGVE9M/tYH6zw2hHKKG9HQbrnHcuYGuD0D+htW4wJV7Ml/PF3ny5XCz3l8tLy/3L8+VBN190s/3F4qDr5m23MKaT2uROXqJLB0llR06Nk/UgdnapaKBjClLzzeasa+YYsEet27adBe+c7e/cvuVdL4VBkhXVdNWYViowqGEawhjXWmEaL6K3tLzH53LLvX3v/enJ4Xw+327GtmmUlqvVadM0UrXwSMn35fnqZHN+bOL4F77sy//cO95t7xypg+UfrI///q98+HZKuu1SDMWsEtg33yYhPHPzieuXL3Unq8ed98dHb/TbUUqbko3JMj4ybjmzYOUFxF1H0HxiYddUXY8UMebPKhnbk7KtqDFWS+EAHm2JPsGDAFqCjMWiik1pAdURmiYnNZC3nMCcFOxil6475QuJKZKgZhqRsqnU7lrP2AXuSI0RKBvjyQyyQr9CN57K0a5WT1jzC/9Bksq0kvLYp1Cgkq4wFcriEUaSKz5ByVS8NUQqRXIialVpE8Uq4Z2LKmzehRde9LKc4o9T2mUQFs00uVISYaCY6FY/MbiYVfxcHY1FzTYsI3NeAlCqAxnm0SkpmZ9qG1gJai3UMfIfE6UNIpdhPn3e6auJ5Hs3xqjteJ82axfkYt4t52ers/xIUAZiWZ9nnD1w/nsvvby/v/fU9evj0elbHrp++dLVP/jcy2vvuJBaKWct3ICafChzruHIKIXCpQv52AF/Q7Lkkud1twETrUDtPKEKztkwDNpIQvsQOUujG1otBFhY+IhEBK6ENghN4tF7thvocKEqYyVx5y1nxYSS+m8FaUukcAtJ7mawswPOlYi89SERGyrQ4C56TOQ4up9EbHtY3wGfwMqEFOh+HGMKxjRQyVKbFcsIBVpHwYvSJRdgWCCJigvyDW0Ui7mEpwzjZIKpkpQ6Y1GWYVYuzPXuKVZunNgdsLekCTyYMnZ0IcS2bY2ZIXmGU26EUHK+XI79OrjQNK21IwS1USCNleJyKIbSO5hQQ8TJUxQsutxygZkh5Xy2lEKDDhzgGS6qq3rplcmvJWAUudmuU3SNaRIqE9LOaQoaYUQcGfYnlQeZMooVcACCeTVLAYsqX12R6RSIKXma6+JKhx1WiIUUjThKBF+GjH1gUmSBFXPv510+7oPLJdZ7lDE7euQV5lI3DtYO8DrepuBdGIO3kDm5FHFLkJkr2mSUUVnKLFnJFi4K7pFynOwMdovfxiSrz9U1+pBbiNF5h7/33uF/QzdR7A04JVR23aJrZ7N21s6Xi+XBfHEwWx7MFnvzxUE3W7TzvflsvzUzZVqhjZImt5vkJg0YSPat0BflKxZiCiF/IrpbM5SjL6KuEwuAK9oMeNjkdlBJJZ0dQatoFvO9ppsxzt2wvv3GrRSdUrpp55JJTjkS2JdRhDbpTXg+FJAfWquRHQel9Ww2Pz0+hpxPWu8W8yXsX1w3m6fIGm0EZ6uz49XquEvuv3jv13/wuS9aHx7PLu3/zvG9n/zVjx4JoZsGIqXJxEmE3G75p288cf3goFttb1hrj4/e2PaDwN43pox9Ex95hAyLh+J4hTaKVnu0TQR6gjmrFzDc6ASTMcXqyZ+Q8lL5UCUtgaoImVkU44jCgOLkBZNI60aJDjUPKNXY2t34GO1whaPT8pTvuE/1H+9GplOSwU6UA61H2WInVqRNX1iky9y7WAdVVsTOmRl6XwZWD2T1uEWFgBdlrAlLJeO4zpdF7qdFfV9leR3p0nJSZFW8TiQ2Ua3cOKvGHhPAD7QJp6E10WwmeWiqXs80ZiskslRe/UKDwRHUR0x6EHQx3RGFpIWtEL5DYof5EpMRQVlOreBRi5ULNjIFVQaY2whoxfur9peCtrpw14R+MYnCf+TsnreXTo+fOLjyynoj9hbyxs0XX7zlgkP1Kt9b/mBa9Zz/o1//+Pbd7ltv3ljfO/n6hx4++OZv+omPfeTV7Rnj0RiTMYixUuXiCe5VLuQZ5mI9zAE3U/JaaN5KEUXESUyZUChgsIgCj9N7r42m1ib64O3AgVnJi0orGeCkL3nSyjhvpdGSSaJ0egTxgj8UlVRQPznkGzKtVMZNKRAs5sgBhRBcUb6q4OWrz8VWsuCTVLox7Rh9LHTr+uykSNTmjK0xoBZUjgUbx15K083m3nqY1AgllEPAsCBjGgiqKWkCop0MySiqE94+wgcnhcrdANmDh+CJ5g2GDhaF+aONwSJyDjwvyIKHfguZOH5OudFanljbdUrLsR+Gvk8un4BSivsffPzevde32818PstYMIb8L8MliWTtoqS75Aowbt3ItwjUkLppmiajkKhE0y1M02z783Eco3e8EjLzu8LMQOa7Obdbbav7zcputxyVgDKXRd20FKdXRpH/MiWP54kXPTcvAQ9Em6TgV8pESuRbIygYnuaCBo++9NxlHC3JfRlUDZGfCsmVC8VNBSNoXuSL5AcogENpkMx5sawDjJWpnub58ZNlaCNJvhDzk5VPAdj2xItaknzrICaL2PO0QAiMrG1hhUGnnCS9r9S01ZbQztHlwZuSkQVOXayQLNA8JmNmWBUGeBfx3GQkJmKyKYN8IUruXYlDFhQGD9O4lB8BDdE854EyO+H0lh8BxVV+KVE8bjGulvkLzQ1sQRjeeyWbzXDGi/Qe1GrvN9t1gDsKmsb82IeUNPbpjvoq4H/K3+SFsRisdwmB2bPFnvNu058vD/b79doYnUTc9lvddEkoKWRIbn12en5+fFXJ//Lrv/WrH755fu94fuXyx15/5ad/7dfWxiijA82+EqVd57cag3/6Jqrvenh6dJuT09ubzaiUjWFkaWTMCuZScon5qseNLPl8y5A5aU1lpxhj+GwvlJyjbQ9UD2Ju42kdk3hVw5RpJNGBJBFMUGRDMTNiiiZGEbtUUfwFi8tk2SFciP+pRGJW3SvqmLUod0CSrKBw54uVqq4JUW2p8I4nEXDdj04mHFPFTqK6T1XFEK1a4BcntekIVqIsEUOw6Isqai3R+EDsJfE6iYoKp8l0CauYMgFp5bwLPZi6jcoWY9NoetJTTXvmi9i1/g6+UzPwaUJNb1DEQtiuOJxP0/YLC3fGytaG2iicNw0abusjIiLBsKQmQaRd+n69lNicp/o5SpIiEzyjImevGzOGyGaz2WJ+dnZC9pC8uJugjEselPr9l1+NSr790cfc8emDB/vPPX7jlTuvv3F+qlULgxsJJ3QRoeuVUqQQHdzjkMWioreRRV0XmYRRrLPQ/Cjcl7nfH0fbmAYiTjTpghJdYPhF8QOJad0oNMiJsa6dsZgrtIAFAXlvYfcTYfQBbRcrPEQF4zAMgqWSigydpOJKqAApBTjgwrmMkzKsYhn/wM+E1xQ/OqyJhT0x+RhFoQvBPQS1mDfmD4WRaIJOKZWYdHquAsld0KoL6hq41DJkvBUb3XCIU6HpVFIoF0fJy5fsfURMhYspdz8pJeusUU3bNBnLkbwbl30Yey5413XFeiJ/4xleLfeW3oex79uuIZGc9TZD83zKCfh6QXmF4xZ0pwwkYezfD2Nv/ZCgs0IkkcHEADUDTzGyblhJbkArr6Qi6oYQqKlU1/I9Q5Y0qf6VwTctXYGXPMbw+QDN374dffTO+wiHNejPM04NGCNnKDuOzg7W9j5jpiHDXDt6BwJ2JE2cDdHBQQimGTGKoteIiJcmNmZ5aOuSh3Zv+d1MAgsMFZG4jtmvKM5cgdhMHuUkv3sMxRmFNCXyZVFc6abpmm7Rdl3TdVo1bTdTxhjTCAXHKrRZxded3DBiImuqjOVjpGhkcoH1MAJhLDpnPeY9APoOQ5QEIkVJdlAqt6aKApMImscSACDIx4OGhXDuQJ4YGB4Yb+DRC9QRUAo2HSzBWiDdmWnmEo/k2ent0+PX4dQxV1oTWZVcQ9CxiAyCpdTgOmCbELAEinYclW66+eLo+B5nodF66PtuPh/zN+hniyUc1cJ6dbpZHz/etX/1j3/rux94dHt41F699Eufe/Gf/Pq/GbtWQqFUR54ganjPWHzm5o379g7mq81NZ7cnJ7c3616KMYURufq5BnOesS8RjBEFCEYjnR01NgtgLX+hMcylWFAaDJVmMBAooaFoWgQr91LNvYmlHUrVSIr8IWQtbyVyr+xvC8OBTnER2WTQUaLjp+0m5xf+zVpAUnV75NWPMk04vGLyqUZcSEmaVrcJLqvF4qPa49cCVmKNuNSmSdUCizrgKeSwkPrrCSmm8NJdJhL/wmLKGLsQ/sSrjWaq8fdldl1ETXVTcnFSXsZjU1x+1RfX8TXxonmdW08vygjQ03yiDK8EZfvT76HQt9ITlVBk2IEzDQKwJ4ofno4praHu33fgGzWJlYDE8oXlB8wFr4b+vnYWUmTz2WK5PD1beZ9r2rTCh3eVSMY8//KrY3BvvfkkX50fCP2up95y7/j4peO7Hv7VRjcR9niTXRmsCktSOGly0P4lpH9ncOzdWOItaXUvxTD0TWNoiZtiPghAhGeBoHzIp1hEsA/PaEGjAZEkbVdSw+PGUbcnVe7lQU+MwZdFPDLluRTFkZvLgiNh8Q/yGxCcQmFTiIvIx9kUBUep2mmyOBf0sIQLVFJrrTaGMxT7RO04rr+PoP4W/5h8cShNgRyYwE9RTRNBoOEwxsccpQR4c4zpQFUHZQk6K7o4nInWNOMwViuSDKooiCv4GFyuqF03K6PImNwYFvOlNs3p6amQTBkV4WjGi3UkmwJEOSVOSEV9Y8aoLHobvBu3/dba0bmR1B2pRAtziu+jJGayWktTghjVKyHKFJ0YiiUCgmZ4MlHYFjkWiuoHkVssLYSAjYOGOkgaYzRhRyG1yV2flkpIUeAkXgK1RrKUKBwXU2tJicuyMkMy4EShK98EtMsu13rnvEXRd7nGuzH/t8vV3nvrncuNmqd/7pwfnXXBe9pQl3AVgbW+bnTTdfPlbD7v2kVrOtoQESeBrJ6J9swYMajrWI2Ru7uk6LxyOvLi44IcuiDh+iUll5Jr0gpzBl2h8yl3JOdnJ6enh8cn987OTrbbVXAj53HS6JL6n9dzi2SrxRg7TfTsIGVl3ZaSAh188FxInVuIhWpawdjRvc+frw7zzTabC6QshBiNaRQJ8MHGkEqlIIqDFS96hxTjbD5HitHRcm8x9JuUuDJ6c75uu4XSOvpxdX7Wb46fO7j81/7Ef/LM4tJwulL3Xf4Xz3/6Z3/rN8NizqoLXrlugjvkXb7lqSev7u/tnW8f8n44PLy77Yep+iY+pmQF85GRxsvDYD+Uqlj8mSIJH3JrFfL75GkGnJGIQFyxV2B1/FGOd/KjIgZzPryKC1aGsILc/CdNz86tihfic52V1vyhaVNbeWBFsUv+imSDVXVA7AL7eLcY5VOSYYlPZBe9Ouo/jZX2OKUm1VKRarxgoaFLaWYwmpt+Xuxm2LwGRFSOlSDP7PLGxAWKFLuAP3c1lXayVIPlbtXNp7daY6L4LiEiifK9FaRJZMbJJ7PkLk1+JNQ3FQEwS4UfvWsExO7Tl4AJRrmo0y6Jp6RVxtAehEuBKVVJWpu8vwtgLtdnoqnXaX5+bRuD7IerzcyHkOaz2f7e6vTMeZdxW3k/taVqzO+//sb59vy5G0+K3s1D+GPPPne+2bxw742YuNEmn/uCTJEi8QfyoSA4wYF8IMIGEm8tN+sOPKxQSYRSSe9GxphRJlG+vWBIgpIk+U1kgK0p/kg0piWKrC9aO4YcoaRkPmAgFkyku9C6kVozUbwlYZKRpDblbiHRJlTZcIxvc0mWVRuDTHhMymXtMRml1GF9EStFgeMN53/unVeNpuVoYdrHyGRZp9HsMfIE3g3FX1E6b0YpGdRGmhwYOE5YH7xgAue9C86BpBr4jlgB19IMuaxSCgLgfLSNzhqtobfKN6P13rRta1omOMSfQSo9ny9X6zPmU9e2cERCUro2qYZ64RaRHvwlUsXkFyS6guQpOlCxPfQahVXIaDVUJFVQwZWBPSdLseodwEoISXHtoxF0IZPVsWoUhXFSIoawXSZhUf7IrFrCUuAyrRiokEdafRcOUSIlDZQj+T/jOFoQqDKgH4e+70dr7TiOQw9y0xi9cxHSnVQmMbTsRhoTjCOEMkIxQUm0XKtGSaWb3BLoplGyUboxTWOarmnnTTtXmqCtzC0RyPBks35Z2QAAgABJREFUiRBBBxOkyYQqiHJNAFAhT6czC7wBBtUctOUwRRt7BzqYHbZ2HIZt7+zgw3h6eu/27ZdPD++szg4VW13e05f39P5cuOHkzcM3T0/uHp8ceW9zjyZAUMSoPEUPamG+wBDFoQBEL2D9yAsXjxfbAcaGceBSdt1S61brLiV/+/VbY7/inLfdXJDoX4i27SBVQL4n3MHIH1RKDvNQP46DVrqbzU9PDlnuffVmfd7NFyPazdl86f242ZyN29OvfODB/+7bvv0hJobNNl3Z/7lP/NY/f/55vrckX+FUya9CCGedVvItTz99eTZbnG8e9ra/9+adYRwEsymOEWJfhMjB7op7Yj6j8vliZliFuxj6YujiW86XCvazFG0EjBQSRbvjdOLFdZlYccTajKjiNI9O09YW3hIlZYjVCCFegoHq010hL2Ew2pHtgo34NFats2aiaVBrVaBmCagvPyJrASO0J6oZTXFyLrveSmIoDP5aGnnacZ1VcZWrLTQW7xJz9CgmuS0NxUqoEdE42FTt8KoUuEDj80jJiozsTsrulpNVPGUE5vcX0CKWWHRyYK/myyUCmbigk9DkC/Au6chqdiPuGwxJU3HwSnJKpyqEMvIKKjqnWAIYsTlOUSa2kJKluI250giuCTuWRqZmNpG0BsbeyaVKc441/5mLe9HHN28/fN/1lHq2aJ966uaLL708IlGH+vO6HGfN3t4vfe7V1Xb87q98z97g27PV93/lV19eLP7Z733y7CweiGutmbMYtNERI6ZAZy5qlXOjSLkkg5ScOFdki0JZQYmJEJnSerS2bTIEDyzY4IUPjdF1FxNEShIQqXRU+eYOSnNvk2SgPefXdxyTT59vyvx4G9X45FwAeZsD7GLxBXiRFJoGF7FqV/RIMa5kCE4pw8UQKaOKMV+WgUWwlWp8IXyYBMaSHtN416/Puvm+UJpqTsY02ANLYFBJgRb5y1dJQ58WPOyFR/C0Jc0S850rOQsYyPoBh1jq0Rs5JGSEKLRqcn11FrNx6KCUyReqDrrzXa5EiML7oKVs204o3W/XKVipZ48+/Mzh4Rur9WqxmAcfoOdW2jShNBYJSIVuAlEUprDokUlETsu8kutMDyeyloNLgQoFY7BZpVtc0ByypKckQRGeNCoTpAKTu44dxt9QPkTSLGCeycOk9qsu8bTuK4Z9OAdCpPz//F6ZL7qOWDY8uYwqgnmcCy0gxUCOhMDdBOP/YqhSHaOoYSACH9KBUvQQnSUhBfh0IUN0L6RqGtmK1nDqRrWOJGTLRTO5ZMuZVFaKu3UGRt64PgBPOOBkGUIgk8gz68Yx5TZsAK0sIIdFJmRXoTbzEMd7b95NzD/x4N43f8M3fN1733XtcnP9+rW95SL6+OKLrzz/By/9+m/90cd/9zMvv3FndXKnXSz3FlfzRagDQtx9KJMB+Wd0gMuM1FXBv2gHBCs5GUwUtz+WrB1qQ6h4xEwJ3xuJvtBG55cPkCYqHGqjdTwy3TSjG9ebzcH+crvZ5iuXkrNuvljYcbM5P2Gu/45nn/ue935Nu+19iG5/9o9/7aMfe+U1s7cfWUkRYEWgmtzoG2OeefLmQdMuN8PDw3h2eO/NEV5XMdqYbEqj4CMPjnMfuGfJE/OZVSBabCsLB8v5/AR2gi8V0lp2Aez5nAi1pKYanB+pDuDjg+MvQCQgwiT5W02RuKlE9wpRNFNAauKCNJahJogK4nab0MpIjiUdN03c6CooLuJJRhnKbBqr4LDiJSeoWmlMdpXTXDdO8+3C/eQ7N0gJLwhZAnVYrfXEcEgXBse1IBY6Aq1GC2Kmjh2sE1oeV4wryhMO8jH/D5IPy+9h5RMVh6+EkYOqW3sB5msZAlPse5Fz4FlJBR/zyqUWhcW1o1LXjKXqicJqDGJhvuM1JXBwiNExpB8WCjyv3OwLluCThbRkU9QiPTyc89wJDsNDpg0+Ba2XVy5v1uth6GHMVFErvnVjuldPjm/deeOZG49faRp3uvrimzcvLZaffuWlVT9AmcJhGpCofScBLuMRBrMSyynYF0iMZb1L5X7I34CUchi2xjQG8DSEYFSunyF6sktEiijJVlQxsOU8/0+QYeQ/w6nDequ1aaQJzoXgQCsNAqwoTDZJV4pbjwmE/2TEqYSM2OjRFROUZcpYcJbEfrS32dm3cIqyxyKeYssFhdbBi8M7maE8MXpYxnOVNRnQnWEkEmXNEgg+SF3SwcgQXdIclbHRO9rqYa0cQvQY+saqyMeeFb9HMOn8yLlsMEUX0tA+Umnt7EgHRX5jsEwKISrd7O8fOB9W56edaYXk4wBjB6NSVdQLNJSROIG4LDWb1EP0K/BE8ZgC5aFwsgDFUwY6c6Bje3IwYYlCBgUrM2mVK3hxkyBiliQasSTuKCOXNjIJYGQtSJiCBIyocGDTpeLLyhBziXRCZANrY0yjlQalQGFWVFhRCZYK1vZuzJjYu3HIkHi77Td9v7X4cz9sx7631gFC21DynnBw5l+klGqk1pgz7zfNLGNfaRjZcBDjm7J6MeWWJF4ERicjnkB3EnoAWrTSox6DC9461/txO27X/XbtxsH6MWN9DCKkJOMuxUXabI5PTu696+b9P/yXP/A//Y3v+/Pf+f63vudLH3/6qatXr3Vtp5v2xo0n3v2lb/+Kdz7+/ve+/S2PX042fu7V26vzc6MULVBpw43nBfaluiEbHyTmFzEYGbyEFO3YN7ozzazt5siN7u+8/kcxWPQgM15cRRTKeYlOEJCB5f5HitxR5I7PKtO23Xxzfkp3ab9ZtbPZOHocHuH89NiE8T9/91d8z3vey09XUstjyf7uRz/68dt3m1x9wwW7UAx+Rtu17VuefmpPm/3N8Ni2Pzo6fHMY4HUVR4h0LWOW5VbIRe4zpGJRiFAOSF5Wd7RxZQyT59Bxvm+UTAV5VtoCqi9wac2eI/oyRXawWLj7ZfK6m+LXOMDpRC/2WGJHcy7bzlTVO6LaRJNrxmRexaqFCpug7lSfizi/TnungMLCiJ68PUTZrIqyfcJtCg4HnQDTFpbXbRFlGewymiqXKp+qtC/diYKnX4oKSEc9GMOFd8bJuQoB++SvRVLEIo4i7CXLD9GVJVM3GlKXAH08LqImfVdl8M6sKk3O02IywkkTX638YlkOqYg1MIGK0toXz8WiD4NNdHm93CDtqfx89Pkwgeshrl1diVMQaqF1Te5C5Z0RLsAXfeptevPO/VevShZud+3jTzzx2mufPzk7M9rQTDvSFUzBLBd/eL7627/8oe973/uevXKwPTz6liefvjpf/L0P//LR6V3b7jk3my8vId2I8+hwJgoPZR3u7EiyIgL2klYECYRSjPmsta3pqItz0ZrYFD8j3NK5bMCy38WAoFYOKZTQ8KdH4HYuz6NzwhilVWC5XBlleGF35wPBBq+MIX1OKpZqgRVPOC6ltM4qmvvlAiMQGFwkdoBFIZWpEVk0lj1nnOAS4yG6zfnZYu8g43VEy4fgczMRAqoP3JFCIEytzUzpYvaUzzcoi5B1EBTUouPoWJUVplKD7Wi3SpjZfCmMgRo02QAaqkgOVmIpJu8tpt+hbRvnfGKyadoQozLGjiPSmuOVK/crI8+Oj4yWSsl+cx5DnHVzQsEBjkUCQcuSTwYVJCFJPnrk70JpVWwwykUAV1fAtbtmhrMy6aE6hHaHTBkz+kWmUESkT+69kL/JWYClosBABaNRbJFrq8+FzC+TCyELUQkOB6hc70bS8QRPHVUiZW0xZIfDOCejLEU2x6QI5FJLCcJvtRSQUhZCCfh1CQQdiXYPKVtKKaObVkihVAPyMGc+DHEUqejgwOFnUiBFoLCocTIK7qMjPRWiSemxBAEMvLe+3zg7kCoCVrcsHxFE2Y+Fm5p7I789Pjlq2fiDf/Y93/1d73/26Sebg4M7d+598hd/84UXbx0eHoXkr99/lbO0v9x7x9OP3XjkPpOeftuTD733U0/91P/1sVu3b8/cQdftZUSbCLWHcRxijEhmIlZHrBkx+ZvywQYfhFLgBYgU4zhskERCj48AZ5Fa8ILfitVIjBQJLzkf7CiEbLouBN9v+q5r+2ErlebwVFFKnp8dH7DwV77hm77hqbcM9w71cv7CdvMTH/nwrX40+3spBB6LBQXtBYdhWM5nzzz11JyLS+ebB8bh7r3DI2cHREzajHQh9mXMJuYRYwMKTf5GUxXiTvgqt3o2d2ctZ3tK6cA8SeUKj5TqZZwe+VjO+zKyDaky+DGniyU3nrGdS1OpDFTxC8mZKiDnU9Bt/dfSVGJ5+ffpddKEsSrATNOGOE2cpMRrZD+fbKXK1DsREBY1C7HMhkiyUKN7i6lKCWdIXGrT8ZLDJyo/jDTKonYwbOJvVSyfBEUcFTIWn/x0BNAsL0osumNq8FJpGag7wSAx8SkNkp7i4vXP6jCNTcZhvDp7VX17Idexugmoe7wdygWbpai4qLup7lz1AhMQ4bUXI9MQIwQUM/Crm6gudYde3h0vNl+1SWKTJzaWqsKnFPv+ijaScSvE8urVEMJmvS5SmapDZSnKpjm17vdefPHatas3778ejg9vXLnytptPvvD5l+6uz4n72nULOlIZ0ZTw1ok1Qxfe7yZplTiPYa4bXdN1RYyckpKaRgkJzvwSkVAIX2uIEUqLWkSFgwidT0SN49rTZoM4ZQreYehciDDFA01KUXHhUy2lkqTtKY7qSCISnHk3FoNEAC5eFI2VhUhGbdQ5SllSrYSM0cfkJbB7XcSTvgM9LucuBs6EltrjNXM9TrQ9B1SNUWuk01dhMmUPF06lwDngbD/2+e0VkwdFJCZQQBNI6VogpJasQjyi/ZpcMBRcNYKCn0nXdN1stu2H6IMx2jnLOVPapDKEQVCI4DA05KAZJYrHqKTukulZjOLomyvLUyER0YzcEFEWZBxyYU6qj0ifmmKPqefmhYVIzP+0yxUj7/jEApHB7DgO/ThsxzGD1WHobRgc1L7oLeHCDOPDxrRNM2vaWTeb57+6/IfZfJn/sFi07azD/2R0o00DuGy0Mko3iKmQCkkdoHXRqSIy1GvnTTNrm7lEalCKPBfIjFtdrLeaKCxMDOfKORQlxtzEMpiM6MmBP3g7DJt+s+o3a+cpTSGx4m2JWzd3rLhLGROSB7s9PLpzdaF+6C993ff82a9/5OHrr9zd/vhP/rMf/bF/6AZ3cnT2Kx/5jf/qv/7LH/wz37G/WPzBpz/98z//L5//d68++vCDBzMl0vDoQ9dOTs8/f/uIANro8lWFxbRC0LZTQtPxKaC8ouW6tX0Ifj7fV7qlGcP56t7xm6+QXq5rFwSdlII/D6YR8COD9zWSPaPzzlupGqn0tj+3dmy02q7XjWl9sIKz89Xxjc789fd/69c98kR/dNzcd/kT9978ux/60Cshqdk8kZCMT3M9Zsf+6qVLzz711Dyma9vxvr4/unfnyAdU32AZd/lxSwgZZC6Re2qG9QHMkkhMZwqgxNnovU0pNIwdKK3JJ7WOflB0RTWxKjHzVG0JYgFqiB2S5cWroSbFl/Enqz9QlTOM9jWxYqSSXcAqeZb/e1ocXkODarkSaSfa2WUc1OF0dYouOLAqe1NpPgt+r5vmHfTdLaWLK1SSWrc7snFlJiWA0lInaKNdygvxR1KJKON8IozRQVYtRssKesKwPO1slWuR3XUxfGKZxcLumsJ5WbkUtL2Nkz8X50WuRP9PFCvoOofmnDbNvASK8523Zf0tRCcURQVVjWgxaFBahIAFFbG/hSg0a1ZXl/Uql+NsCptCoi10hzz3hpv1FRCEtikuLl3mnJ+dnZHvYoF3GEgpZTacferFF9q2eeaRR/zq7D6t/9hb3np4dvz5w7sW7lONaSOv9uXwU4yB1oTgrQvm3BiCn1YvmKZKOw5NY6hexpALJ9kHxsgoOkJIGX2Znzgfch+dS0XKEE1JXIyM1FzI8MLnuuWRABRI10SSGx+JP5FPB/CKBRnTCCWij5psrSSwbyKklqBUwhKSFFHFvhzhbiXzjjSl5cYHbnMQKMNCj3RQRWvHQ/AwQ8pXA1CYCSGQDZdf3jufQRUUw1yKxhhrB2Tz5ROghFaGQJ53EAn1bhxpsotizOGYKMhzymhjbX5l3ai+79F5MG+91kZoGSk5iIvLl66Mzm3IB9/6EJM2mlVHocQCjUfhmSfS1KAWz3daN1DPJwBOhfd2Mnal0Ees6uq9iyNNlZBAzGOljMFBwZ6cd1xA7ZO7j2jBPfYWMrHgiJWasVTGoNpoM5/PTdO2bde0s7ZdtG2upsZ0pmmlapQyShqpjCAmFa5yyRb1Hlz4ONrBusEH2w+9I6aztc5bGITl/3LORmzZYSY1a9o547l1oyMVE+eQ20pRvNnQhCGPRhTgT5kJKVZFVmGGxBSic3Y7rMftxvV9igGcFk6DNgRrlrONznpirHvfnxwfXpmr7/9z7/nydz62v3/lH//sh/763/wJ7/sf+ivff3Z03Dt3crz5/OduffM3fukDD115YD/3IC/ceuMf/cwvMKUfefjB06N79189ODtdv350Knh+OkLM/UsKIfe9+FVcSTosJKxqQ7TjMHDOZ/MDDh600ur48PXV6Z1cgLUxzWw6MLUhLx1udJO/ayQfxRhs30utpDExhNXqxBjdDz1nAcOncdycful99/33f/ID71jsb8/O1bUrH3rxhX/4sY/d041uGzAfBWl76PAfh/7afVefuXFj5sN92/HyZnN47+5hTBYk05ER6uWWMYe/AgRYvuDUyWRqcjIkEWBoON8vwaWFThEKqJGhJMZzSkWsa2Aeq3apRAbwiQxbKLacRv3F0KJaYJHHJUYtoXoY1r0q5oJVFyTKdaV1cgF3pU6WAjR5YcVJl4MaJ2hYfkEJtFMxCS6qC2IdUbOdmrcKkXdlXMpcgGneK+rOU7IkpnkEpdOVGU1B3IT2SepMgUtlFVwJZReyBUsuFBellLLiDsmL3UcRHRVrbkmuAiTfL8JdchlJNT+/UuQnoa/Y+ZIVy7Gy902s+nnSNVIlhqPE/XK+m/XXGwZ/VIlrKR0rinIhJgFT+R1sWkSnHcqmuQDdJfQNOSHG7foSl50w6+AXVw6kNmdnp4XLuvO6zGgvSP17r7zSu/EdNx/ng5s59+Vve2tg6fnPv7QZB8HEYr6E8NJPLsZQB2HzgpEx6hB1eKApSWG9ZUm0zSzRhi5FA8IzEs24zMCkLd4mIVwYqXAKLKXoex88abtYCNZZMgUER0dICfZneUQYmTKqfDSXtCoKrueokQnmjvkjBEfeoJRtUyK06RiHrJcQsiyZVpRDGaWQ+ATJNB1eU1DcDfZoiWSSsJTKNxAiUUtMCqkwSUlcgq8586OTRARK5BZD/C44dyoRo7f91mU0zKDTKzaCMK2BSlIkqTh8qYjLlNsPCjD2oBCnyJq265pms11LKQP8H5tGc7IAyG8epij5Y2KqEMt9VRV+FH4QSUlcXOdJM5mL0URNjOQVk0IgHmNEAksh6KdknSM7TCLWFdM3xOgqBYSaT/lO6abRrcZyFwxboblCaF6+rtDyUgxcDPn2ixYV1XnbD1tn+wyZ7RZE4t7b0eXyPpbI1+JsxQTy7pXSSuqmgVh+ud+2y1xOuARdr4yOQTiLhQcnSAZG5UtUwRUH+Kv/LnapcFtxYGKvh+0qOJshmSSKx2SvW5blqUxQWEgeEdf29PRoJsN3feBL3vXs/d1y/0d+7J//wq/+7p/+4Ff96N/+G9cfeODv/L2f7ubdpYNLvl8/c+P+12698Jnf/fTh7dcfun/x8KMP/IOf+egLL7/53DOPbtenl/aXL79+cr7t27aR0tCtK6A4MO2MiAjEDoLQrg/Oc6nads6VakwnJL939+Xt+jSfQqZp2pnPnWJuuKVU9LMKvGiaXng/5h5XG2O0tdb2W6H4MPRKiX7Y2HHzbU89+9e++Vuuh+SDF1cv/W+f+MTP/OYnhsUcBgNk/Vhcl2KMztqHHrx+49FHmtFdH+zeavXm0b0TzjBtLjaTLrER4SqB1b9oq118pypKxH/nFipELfh+LjMUZEj6iaKOiWUFy+tSUdDmoWbwVVSIiI5pAVspwaxwGnhlbu1mtTs+M+OT3cTEMirEqymEk08SHFqolgxCxncWHXXqfEFmW6fCRPcV1c9j98NlY0lDrTpCJoQO4RyR9UxLAum6AK6vIy42MoWanZ9IzGVJprhzvBAilrpdtTZR8JKBLBmPYif2pY1tPs5lmnyTdhTvi01D4aSxIpqeTKXZZKjCRX2/lVpSOyVqKDhxfYpzJb3torouOm5egHcsrUKBHZIxLbjHniVOowkqmmJ3ketCOE1bi8Troh//KHAxbId9zi81zdr79tKBaczpyUnRBsXJURJgrW0++8brr52cvP3GE3Muw9nZu5968oH9y8+/+srJ5twHr5tGKMV4kiW3NUjMBvP96JOD2zMopmlaWo/j0HQNSdM4S8Y0Ht4LibHGdFwoIVVMQJBSMwRTMSF1PimilprGmk3ToeAVx1DcN6pkracE10xygBNKa7wBymfKKDxEF1JSQsHQIP+a6GzxxomxlJYpe5YV+i4r2Z+s6F8hOuYwnvTBG91EjyFFDFgCg69ROF/k+1286qGWVmQIzDjXWsYQm6aJKXpnMb8NE8OQQn8KS1GwkIIfR4qG1UopqVmK4zgqJQKyewWXyLxGX5cRslAZ4kRylkoptd3M6GYc0LWgLdMKvGjBYY0dKQkjVHvIXaZZDQMnI/k4Kd4Yh5SLqEihsAkkbdpAhpaKSUxoYBoFWzQSUHGlFKIhlJTwjJJGislliFzVAqhD+fZw1lo/+nEYxq31Yz7ch+1o++iddzYlD68iWLdkzGy0UbmKt53UWivTmAbR8UpwpaRRSrVNa0w7m+/NZstutjC6FcoEFqlpoCZWQtON2yffYKJa4+YyDKAKWi8JqXmCOo5sP5Clvd32aztsWQqwMiRyZZTo8ljiUkkJ/kBiafSDs/1gh3HYxmTHceut/aZ3P/Zlb314uX/lx3/6l15+7e77v+6LPvjB9z/59ne2y0vf8Wc+8MaLf/TEY/fvX7nvn/zT//vWK59/4saj3/KNX/Xk49duPnz5i9/22L/8yKf+6JV7T9940I3btlEvvXHqvTemoRvKYX/RmBYsOVa3DL7fbDlPRrdNN5NCK9WwFO/cedH2a8Z423TatCJJckgt5jPkeVeUIhnscyWF0pyJzflp5PnLSyEM41b48fu+5N3f95Xv1WcbZcxm3v7Yr3zkX332j/j+XtXLTnJR+IGH8Phjjzz64IPtZnjM+dnp6Z3ToxVnjoN1lZhl3OUynHxiHiQhku163PGxeF1PoUHcB5ebAyEOhG44ckZJmoWCEWFamC4AKTLXIO/CCAVFnU6KolqZ0BINyAS/AJqK/ZMoWR1UYlIJIyAdZNWvMjYF19LyUyR2AU5VNCtSbYhpBs4ulMMK2qZooZrGK9iU18CnYS5pmSKrMYpsl7fApDZtYcOImo3CptnuRcOpCxi35BuI8omIwVTQZWWGFVhYdsGiukzCp6l4L1R5La/hviVPamIq1wJHIDoRq7HitNo0XPhWLthslX24SOICpQ2fGiY20yUsxZ80UjTFrkpuwVIjc5GwqajiRPWdALGcswt9U50pTHEaRVBFwKXv+y6Fy03XO6uWe92sOzs7g2mdYJOnFt6PbGevHB7/4WtvPPHIww8uFpu799762ONvf/zxz776udfPjrz3rW60apwPON0EhpVQ1wQHU6ei+acdoZLC2jEft6YloSJmkxnTOO/m8z0lTS4zFJOVmNZKIqdB4GkH4AkSzkJYrHoXPNBySDQHDrmig62T8TSNwMkLiTyGEk+NaYyQ1g7gacSYkJpe0CkFR3Gqfqjigb47PHHFla5q6EqrAz1x0k0+8lN5N7n0JQQEpWIjTO1IhgsU5ggiEkKIMYsVglNagGBVRoCnVdJvB0WLjLW9tdZZ7x2PUcGkErM0tKKcDeMg4XrIGdemsc6hJmmBNL1c/qVuug4k3gDb5yS1JnmuQKgRMW/pmxE1BY2CKKDDEIQGMGyINExK6Gx4PrO10BLLxfy39IDIyac10YcgohSNcRC5kGDpPNrBDt5ZOwwIOhxGN4zjUMYqWI3ie8/grWkanf+/aZpOIANPKi1J58FgFZ1PW5AFsBqHcalA0W9027bdrOsWKoNsw4Qiiw0uItA/TKEkJ+tKOsSVoLR8JlG4MNtIAjkEscSr55OE3Fr6fjNmID7AGKSewUKSZwFH2rmL1rt+6Lfj2A+2H8fBw5WaDCv7zfbGteU3feXNg8XsX33ss7/z/It/8U+/9/adux/84AdapUQ7u3339Kf+15/7+G/9zrUH7v9L3/ufffd3f9dzX/zWLm7d9uTe7dc1C+94241f/Oinj063168ujNb3TrZnmyG3C7mNgFGwUN1sxsnrBgQq1/cJ4R+6mUnVSWWkNpylNz7/QgDtoGlarVryoDFK0dFG+Enlaq2sdz4EpRsllbVjvz2PzLuxH8bNdS1++Bu/5QPPfZE9Ol1cOngxjH/rF//1b75+xxzspTTpIctpmcFx4k/eeOLa5cuL9eZx58TJye2zky3nIyyusOtNljHLE5J9cyWOnPvC4f/3nQex9wVhk8VLSiLmiPggcLkiIioRHYpCdrfbj+WN1aVCHSwXAMsme4xiNlkOzinNr5gvg2ZXxpx1xS12dCHya0qlQtdgmGJCvnNzTmxa2dZdcQ3nE/XcTuwLh8s1tbPSoKbSQJBoGlnTR0EYQ7GkQp5X2ViTSS/j9e+p4yrVNzJKPysvXSKvWdU5TKGFU+nm1c+SRvbFcb76E1C5L9yQEt8wFdKSQFXx+ySM4hc82XkNuZiyqWqNLX8zXUyyWIplSJv41Irkr2uKmSjjcZmSYkxJZGYVZxMuymSbs+p0Tbqu9AVRlPVtkdQp31V87HsT/H2z+ei8XOwt95fr85WzNje2k1AaP6fa7k6/ff6lF65cuXLjwYfsvcOH9va++LnnXrt75+Wj24PNJ3nbdBTdRBNR4vw5a2MKQgpYzgoWGdzbQ4qsBV8X5oHMSAU3KNvNZlIpHO4yljUHL9Q0wZ13jCXdNJFy0jml3ZUvQcIVzzuPYTDZK3BlDGbCkUQvUsoQAo8sBEfuESE6pRW5KADpBNgCl3juSmWgdCRRlw04tYgFmei0FnDKzKAKrhCw9igO4oK4/yEEWDmmMlpInK5JxFnARTGSdsNQQX29pco4vIhhIeqBRDW4cey9H4tVJiln88morbPEe0JKQQaFLjrBZAixMcZ7z6Saz5YBu0ki12itEplrknQGApiqYSfRMJOyhK6hhpJRF7lzUhMFzVU9XKRUdfRHc19Jd0UiXQY46nYc4TAF+8g6nAcg5hnE5kapNaZp2rYxbaNbrQwkbiVSyiLgwCKhwuM/hYWfInoIKaVu2/msnXXtvFss9/YuL+Z7xnRNO8vvJ4lEUCZhhk4eAKWNprw5cuegyOZc3E1jpNKBUhpxjyDNmsNaZHRu2283w7CNznIeuGR0TRJBEQja8K1tN9vz7XZt7RCCS2TZgUgGkBC5tTaG8L53Pnbj+sHLb27/31/+5B9/39sePOiOe/Gt7//6yHy7f/lv/cj//H/83C/90H/zA3/1f/hvr1/d/8PPvvKZ33n+U8+/eOfOmfPC2mFcr/cP9n/l4/9u/9KleStDZK++uWJMGNOiWWdSmdl8SVUFMaB+u9lQA9+2C9W0udExxo79nTduMTyN7WyB6ExWnJ8h/y5u6SK3Jna0CnMB3ah+vRqGdW97N27ecfny3/y2b/+yKw8Mxyft9fv+ze3XfvQX/vWtfmiWe4iLZJSeS6elc7aR+uknb15aLg/Ot4+F6A7v3T093XIxJDamZFNyLDkmHGOec8d4gbwMiiPaE8XduJgx5uC70gh2oFUDQgNRXyOd55IF8q2rhg/F4pi8b4uhWSkNIU3i9N2SNk2VplTryrYk1lX1ShIXI/rKKSMuLDKplWU1gnY3D6BqVqDgRF0qz9duvV1OfNxrlH9YJqucwhlSIe0Wh2ZeE4cKs5T84hSr92sJSi6a+YtDwfLKsfhsFooV6YZr/DTRzCKF0REfgqIcCFjEaehb+o/EYIxOdVMQfRdjzKlOU1BhoRuXH481LCkR5bsA4XJhK6erVlGs7JJMxYoFtJ8kU9lpx1TNtFgldpQhBUVGRNK1SMaWSiYfiAzFtcLbL2g7FqNrXnAxDNjKbVHeDjKmGWdKHm62V8Ltx++7/7X1Oe/MUzdufu7VV8/XG9PoaSCUOA8umLa5G9zf+eivvvHF7/wTb3nOrtYPCf7D3/Ynf+rj//b/+cynTn3PWDw4uJKERAS3lIJ5z4xR4+jJIYHcXFNMSpt+2ztvK+vHpdRQyzUOvTKdFBpKrQjtLAsxNUq74PDQc5B7pVZydFZpzXm0gyfEGgNrjPIhmG4W4AOQD0EpYa3rOGManGnrB4Xj1kMg4kfXmCYKH6IvWmdUSSkQNCRpBkkBHZNDZP6eMygrjMcghRyHcyESeNFMSRXAtEpFIRuRhRxgIxW441LpyBh8vrhpmoRoHqVa1bR22NK9UcYbQKNCwUG7SBN4Bsqofs4P9twq2zbtXAoVRWpNruSjHTAA8EqawQ7G6MTZbLZ0btDGABny/YOrSjUDeKqcGZqLgpsTfaLJIk4qLLMT2Gq0/I34VoRkUgnEnXBcVwb+EeoM/L4xmFVlOZJv+FDz+CUszJRWGcBXS0tW+dWMMU3sPoqkFBGQKPLAiliOvKVomau1zNVEEPu47GKVVEo3iM8yJYZYwlsbftrJ53tRQlYe8gcpWzWYdpCDaf6JxmQ0T26/+aWMCuRoHWLRjPlAquMeQNZ7S5JYrTTRD1NVvrng+mHrrS0O5DDWIemckpTQLAOcQDM4tvbKsrn/cusT/7VPvPDYI1cfudqcb/p7h3a9Ob3c7G1PTv/tr33ymWce+It/4U/9xi9/6Ef+xx/71O++6JyLGW+yh67On332+juefeRgqZ998v4/fOn2lzz34JW9Zm9mVts+zeakIYRcGXM03GzDMPgUTP6+GKX4kKvrOGxT8OBFEUsglZKLlS12/REZwHIY+4yftJZSbM9XZ2dHo93yaD/w7HM/8J6vvWK93WzE9Wv/5+998mc/8dt9N28anTBkqBpyVEpr5/P50088MVPiYL152PntvXtvbrej1gMoVwPLkNeT23NMPlcsiaVvCix3sqkSCyEXgd9s8CkmwxhYV9BmlAkzebflQz7SyZnSLtq2cIZi2aqAVxsS38XdUgRRNYIsU+sd8kSFStURkZLoBau8gkJ0rrW74ETMUsROoJsmj8g0sapK0ScaUhEoTcP7IsdMpSxxXuXNaVqk7hjbrOQ37EodWLDKdKSaFBPGTZKgMHhFsbYTcJMUk5S3LhlpJlYkWbGO0kXauf0WkhZWBqJObBMGgiUZihUUXBbnEto+WniVF6w8Zl6X6WT3TpyjsrLmlfY+Gfwjupnaazppih1ZaZnEjqxFsitqscREzi4fTXHeKBFSdFhuwo+dlbkoHJaqtItg8c56tK75WaX2icF71q8fbExIwgu+f+WKDeP6fCOUENXWk+4FpZRvzKdffeXe2dlzjz8+57IZhq949rlLe3u//9ILp5uV86FtmrYhilBIPFlvgdh4OdRwm0ptRtsrIZum8xkvWuxhVfDOhzifH7AMj1yZwwiuuIgpuODLoA+y6TG4OsjItYusPBgLSutiM1kSsqEpyQcHhmbwLQoJ8X88OhcgwEDqSyISMoaYgJIYT1HfQicVJ78mgsOsbApZDVyKRPzG0lPTt45ZApLiIInOZQsh89QGaaVozFK25jjhpDbDsEWvxSgUCG1bTFXrACuvelAAW4MNjuxbUKN56RiiVEpySqqtrKzci4SmMTzfMRn0m27WNF0Io7VWSVyoVIKEIpXWOq0iQyvqg8l3nJbTKL259sGVD6tEXszFKLKhTp1jhlmASiXBk57vWDaIlGEfEFAfiGIFT1P6A80GNfAxvlCjm5YSI5qmaUxDw2St818cCVA8SckVlyqUlUFJZ6JZInIWiSFfsgjyV4BUaZmhqDJYJJdAV9hWI+Eneu9kLv/BuXEc1v12s1mf2nFL1Tv/QiarO8f/R9abxlqWXedhezzDHd5c89BdQw8im6RNWjQlURIly5JlUpMt5E8SxD+cxH8SQAmSKIYExIaRSYlsAbERZDCcH3IEJEECx5ZISTTlUKIkSqQ4dzd7YHfX8KrqVb3pDuecPQZ7rbX3uUwIgWJXV7269wx7rfWtb0g3v/ddt16tu6VzJlu6wuGmZa1rDfwyG9zQ931vOJQ9a4cXb+zeub7/7Gz1jdcOX3np2rULM8blN946+tSPfeTibnt4ePLf/w+/0bbTxbOH/8F/+F/s7F3+e3/73/nEx168eXG6tzu/d3T8R68++dJr97QS125ef/XbDy/uTiqtTlfDyaIHxnga4rlU7XQmmJCSGzusuxUwY3gIsW6nQmpw3tSLs+PTZw/QuWwymeIiEsZdETKaqXUlmBj6QanU93Tr1fHTR/2w2Iru3/uhH/l3P/ZDk0XHlVpPm3/4+c/971//WphvidT9BCZiCZwLMVhrdnf3Xrp9a8LYvvE3u/70yeOjYd1LNcQw8DDwaBmzPJVe/B8ekv8iKY7AGHK0r0oHj3eOeddyvqPAuw6TfGkiS3c80MlNEX9QuiTGnIPGNwtrgNiPMGvewuQIIITh8zSa5TQxZwhhmRACPx6Os1hDWJlrBcG2SKrno1MHH09ukVVFI22ZZxSOuEeCFQErgriRXGAChSbyuFGtWeF+ZdFRhAivpsoMqEzZiqSb2ogxZtBIRghBJBAcOwxcadDfEoUoKQbQYuT8e6yQwPdPlyWggresIZAKz4vYNpKRKn73kDkDBMKFzKMq9570WCRcjpBmKsg1l6GAH8or6oOQihULPZKN6DLYi+RWIv+v9DUlzHM+RhtRsiFyKAWn8DQh8lUmUXsWJdIaAUkBAtj8bt1d02mU7iLbvrDPOD87W6RjVXJkwxYDP1Y1bz599s17929fu3Rla8sdn3745s3337z5xuGDw7On1ngUPICrhmeROeMYuZFGTHxsILDBWTedTiMGr3Nepd40GG8nkxlYB/OqqdLvD8gxTQVDQ51G4T9nXAsthBxMl2ZZ5zHEyzgLrOb0MSDyTUD2TnrWQ6rU4GSpFPGtBBUojAmIwIsGjFNgSig8bT73kgJdUzYpAWC8xAHIIF4EBuRUuqJcHgYzMfKocY8YWRp3nLHBasxqZ8FC1oJSFaiwnLN90b1nHQPJ22hhxRhNwyBQTqU24mUw3likIQXneADKNJQza1yMHj5hAAdTB8eTr3SD9gvOeaA1ACIDSQ0CwgNStWBytFVPLQNdHFEM7jjCzpBUGEulI5Yi7Nly6xpEFmrCZi46MJQGIDZEtISG6uVgAZdqoRRgiKHrVBCqqqrr9BzoKv0fRw81HBq4ZCo9LxIluMjICxAEpYH9nn5WDJG6EgLeMuaIhyvHEDIhyTKSa1Vh0K531kMX6M3g+n69Ph+GdXCpBChZcXBQ5Z575gDPDGboV8tz8IqQTTupmgo2Jh45k8H5YVgN/eABcJZC1lVbtTVj0Q39B1+4ujdr3ry/8sPy2sXZpYMdrZsvfOXtv/Tx913aUaeL7jf+z882E/k9L98+PVt8+637IVbPXd15+cbuc1fmd5671Aqn6tkf/Nm7QtXerGqt60avhvjo2UIIIbX2LFa6nrYzjKUb+s6bAUdRKdR0tg3kLK6VPH52uDx/CnbuVTvdTu1FOmskLh/AaSS98T44wXgldbc6Pzl+PJjzl7a3/rO/8jOffOH95ui4mc/esv1//pnf+sL9e9XWLhK3SEGJ3iXAWrt86dKtm9cbFy4N9upy9fjx42NjjFB9dAMLjrGBccO4Dag44pAYGAP+N2bv0rsJbWtgSOKrOdsBCxgPHnVBUHg6fgpPDChcOtDsinUSWZwMNAFAYyHta8jBRKkvlMj8jVHQ5hbtJ3ByKoxlRiEA+Ls4GSiSbhT/xvJm5+Q9nj8KTpb5DI+jZSPiycTqjTljOJbZlzZAIucwcQoLiVSLiK5VJErQMUulm431NPYFIttIR8w8y8RhsUFcGrW4WNygXtNAXMic2PrAbxJknVnsK0i5W8hp2SmP7BUIIgMaIdrQlwQmjjPTaJGVv10s/3vcPMMjLzAIBwdpkfW7eeWeu4Es58XAzYh3ObuPcBVFpZiL0XokBUjSsGamAHZtBIugG3hJmhg1xBEzD8x6fSDlTKm1t5P9/bqpz89OIbpA4vXJkriomvZZ133prbea6fSFq1fcs9Or2zsfe9/7zxerNx4/WJkuBKurttFNMDbNsngTSTmTXg0heNd3NeyZYuDeM3BpYMYZqVRVN1JWLDLYZQotK4AQheJigN0tC6yuas8ACnSADYJmSSoZI1NVlVfzHEqdkxLi4NOf0gHoJN6HwINWEnbGAlmvkNLklZRgLOHBfzEd2mBVASVWkFEigJyYuopvITmFgsO+8M5Z76qmAXlUGrM8JVigfgasusHFUFc1WnyjN6fWGrKbohk6iA8v6w4hBaHZaDeWWdUMzc9hpxHwpXbODKZLlz16WVW6ro0xqAfzzrdNRa7HUbR1RVbGIdZNA1vbNHWmclel+p3mJPAr9WjihmYlgKmmQS57O/NxNUXrJLTygDx+IbkMEZ8imMHhdYCFPSzKYfYHGRPQk9LYnv6v1pVSdVW3lWqqCkdfjUm3cIgIdJ/3IaD8NzVtPnApIedRYiYPY9DYwcXWleZSYfY+Q3kU0e7SOwi5Uh7tRzBQUaQpOz08djDG9rAS8V236lbnq9V5ukHkx8Ck0FDDIV7RW2NscK7rOucHrdVksqWVNqZbrVfO9PBbnLMYrS3ruqEdt26FlE3TmKFv+PDK7UtaylffeXppf2vext3tuXXs97742su3d3ebULdb//x3v3i+GP67f/BLP/fX/vKlCzu/+S9+8x//xu8/eXZ6sNv2i9OD/T3j49Hp+bffO1quzNZ8ujOt1r178PQ8dYdVzYNo2raq0gvonev7pYdVFYP07sl0W0rNIteVfnr0oFudMCZUVbftDNRlHJESpRR618cYNMSLnZ8fn5weRbf6K7du//JP/uxLs+318Um9t/N7D+//ym9/+q31qp5vBYJ4876Bi+Bd9OHWjRvXr1xuenvd2J3l6vGTJ+fOWSk6FocYTIxD5BbIVunJZsJx9O5GQyoc8bJgBQ58l2ZfX/O4rSsNevNIeA5Qrhh5eIWs4M1SJRmz9xTMVzK9mlntW2yUyR9iw5iGiU2aFK5PBQX6bVCPcoxQ4ARc55mJF4kSQcLUTxRJKi9/Y7YZHgnHhVxFBlabbIa8Z85T50j8YoXRlW0kODlhoeszIzyYjDQIAM9GknlmxvJFhhh5Po5ke8ULuwt93nC7znNjEDPHGQVMSKkhhptAr1ryMiRfk5hLKS4FyliZI9lioaGPVl/58oYc5w2zaYlppPMr0KqcGgFY09I1xQ1EzpWiZh//YgW4XAjM5aUFL6rzzG0fY6voZsGmIaOmlETJhedsWC5mjO/oygy22t6ezKaL83PjrIJdZqTdfxqFhdZrLr78xhtLY166facdhpkJH/vAB+Zt/fo73zldrUMMlVYc3CpQ01IuABJAwCuRN03rrPXBAvlTWGu4EPVk7qC2Mkj39fDOU3QFPGE2zakC81i1rtHaFEl6QkjMSkIUhMh0qP9LNddXWg7GsJybCZmAaSiU6ViRPqDJFDrtge1c8AwXl9RQ4q1GuSv1dZAonqoxmkULxV2q8FGrivIAKKIYU1phchWi0hU++el3QjaGtTYVv6b1MYDWCLYtkuSMYC/FiTDKR3IBOU8xGPgC4N4QjwGZQlwp5Z2XEBsL3wXgYuAHSihXqVeoawiMVxLMoQCS51A4weEkv1+SkwkMHgkKDcGRGgbrNnwbMvKSI0IxGYGTNSkEKmvBOcYhp79UykppIXWtG3D0VtiIQM0WWalIwlDqUgWNDVJJ5JOH4DKIiEsC6H2Uho0tGPdCoG/fp1IKOVTGWgOWW845AzbTwvmgJCARAnJQ1svVcuG8lZGZYb1anQ3dylvDGDL1GJm1QaquAduZgLwQH9KPSN+SDcPQrVfeu/S9pKqrqm6aqgb/at1yKTAu23kkjvH1ajWr460rW4zxtx883plXs1rs78x11X7xG+/p2F/eTSX7C3/61h9/88HzV9of/N73vfLizZ/44Q+fnzz+nc+/GiK/tD93Lj49W75778nVS/tay2Ddxd1ZP9gHR+eR8bpqIhdtMxNScy4G06UxnWe9ppRtu4XSbCHZ0eP7pj9n6U9N2rpFxR9kYlHMLR6rzg6nZ0fLxck8DP/2x77/3//RH99ZroN3w/7WP/3yl/6nL3z+RKeePCcb5a0v5y4dL/Lu7TsXdvfb9fqacfXp2eOjJysRneB9DH0MVggDPs+Yru8ZdzD+BjKD5BSLgOMfhHp4n/rzhsXtNPviG4crWFjiC6Q9E3+9mEHiERcIHOHIzS1LW1FIyKE819n1nxetKWb/UdYF7WxZ0QIjbQlmRFAy0oEYCzNLfJd5Ii8anJJ1W3J048j6yrbVNB1seE3EPEnGIhge7Tryb2YZ2oJ/JZWuI+lnEc0ara3ZyPgK5YcUYlhpFhD9L/JFtJfKhVnEnOhEil/BsxNq2VCP6iH0BALHD4rcpa0vHwOQRS7yeOQISjHmtL7OvCr6S3lhidH35Qhy5oYmboAWGU3gkSJYSXNI8iqgACjOtUpntEX5Jjk4xvzX5XQrTPMou0NeCO+EBjGepr9htWqN3akb7wKvm+ne9qpbdutewDqTiOUIqAgemubVhw/eOnzw/HM399upOD75wI3r77979+GTJw+Pj3prOSa65+e8MMXRD9sY0zYTlO1wng5jsLePTTORUsUQK62BfCtR6gPh5SJVqaoOwHdMJUNqa62u0pTsnYVhizvjkCcCuaqphOP7FcDEUqYRSTKfak96PZ3XEkF2HHyZgnWgAFcNTsHbDFEIH3ArCD7JIpVVAZYStF6BtgkeCYGJxQJpwkKiPwcm2AvwFkXnZzDQTZ8ZwZU0qiqpdeWcCcZITkM3KVNJ9c/BNUww6jJiFr9FcPXKD1D0aYCDwlBBoKyuKiEE9B/p0g3DIJRumtajFxhEHAKpgCuIka+bmlFiDNq1kuYaV/oYz0ajTMh+kySlQJsOlKgEvIBo44zpwnjHsZkLDvUgRRsALqEwIsPYGVgIQFkCG3kls6BulGt75zD2T0JMkmDMeot0aMj772O6EG4YOohfgmYNEi/SE+ItahSFwMqbPpLp1/3QOdOn09zZ1fLcDKvgrRAxm9Ay0NmlW2wdrBoQzQaqa6W1jxG3IUoJ3TRNM6l0pZWWuhJcRoqqpFuHuTGV0lyy5WqxPVHPX92KTN57fHrhYJeH/vLBgXPhwdPu3v2jV15+bujO133/tVcfvv3WO3/0h1/+/Gc/I1i4erDjGfvCF9+4evlACLZYdY+Pli/fufb85Z3lYi0F81E+Pjl3IarU6Mj5dFupyjlr+s4FS0JzUKk17VZkrNK1EvHJ4Xec7Rjnk2Ze1xMcGZFZBu+s4jwuz8/W67N+dfLitP3bP/tzP/fi+8PRMzadHIr4Dz/7O//362/6rblSAs0AYlmPxmiNmU9nL9y9u1VX01V3xXp+dHR0erzW0jHWxzgwPvBoYnQMoD5IXIC9L0N6bRSY+pPBV2RjQfDzhMttDeYyhB1FFApntQ+xU1nxXs6yg8BY1vgGvEt53OPZpJiN6QXoT8OQy0ETNpGScw4+y/Wx1L4YyQCLj8tcEsUykblcNObhDjO/U2ycefl3zbJkvxRLwmwkRVU2WC05umVlFMdUBTZGD4ETVhkMOaVICGoNkP0veIlW5IiqE15MLtecPBI55DnSBWPC88wSy2bQeUaHEFQ2RrGworHK8Fp2yIo0oUYMxqDfEbDrJjlyNu9ALlb5ZkTiohvJSOqKFpWx/NusL+P0t4pMZMO+HsncMecdQ5VXMVapBqcOESl7gi7KuEuPWagW0XiOlXR//PwEnUepemtE312oa86EkWznYN/5sFwueW4J8wOf/r9u23vLxRffevNgZ+eFG1fd8enN6eSHPvRKN9hv33/XpIk2zTkMe1L43hAYFKVWXd81upJaW++jD+lsEtLaYdpOm6r1IBXQQiFrJxVHjqwsAQdlNmrBPSjluDh0swrRo2WSTvNfRvw4hraC+YYAnlfwAmfc4kscGAcLyIDZRi5opYWg7HzkdmWiP1B/s2pAZOiDsFG4XS5YFrgC/i24VnlqsCJGdQbnvZQCeEMc9UIyDXO+bieM+XW/hjxXiSUfbA59RF9MJLPjE0juMZh9EnPcV/QQJeGdCdEPfe+91UpDqAkItWEaZjFopYJ36VMonaq1czJVAulCwD1rrRvJRWrIgI1EjT8aeYBvCbAgoqRlmMjupOCtjBqVLBfNx1Z2TibgCl9btI0ka8aIYjXIKsYjwwcKiAkhXTdgMsFvCh5ibsFtJRVF6+wA/8LB9Os4ibvJIjAC1IyAmwQ1OSD8Ev0j3TAMw9q6Dmp3MKa3Q8eCJd8cfG89pnF6UJF78KUAvi0a8TGJXBut6rZqhKqUUBnKgly8gG4xgOpDjp+ClgugBb9er2cVu3V5T0r9+rtHTKpHj44n063FYtHOZ1/61sPnru6J4eTKpYtXL1987fXv7O9evH7zxj/6x//CmH7oVlyl2nntwmSx7o6Ou+evX1yvzs+X/XzWDtY/Olm4wKu6aatpM5ml6hWdswOPHrtyMIcRzXSGiVPemceH74ZgmJDtZAI0pgDKc/ieWlnrzs+Pzerc92c/dufO3/nUz31oa6c/Pav3dr549PBXPvOZPzs+rbfnmXKal3DgaeOMuXBwcPf2rZaxna6/MZjh6Mnjbt1p5VgcQuw5GyBcwQDfysZUej0TOAEjvy8gjknkVO5jdN5zH1rJt7TQkULucY8J57xAFCVk7AYBRcRPo+ChLGTJEZqDFJ9KFdJgiI0hqIjxnF6KpSMQTDvaKefweswby4tFEdhGylFBXsexOrfVfBx2s/ZWlImTPg3b2MSKGMZoeZa9pLkcebgsi3VY7qeZKNwSqaqWYfJY9vPiooQ2lUkyy4NFJl5RsSmlh3a5uGdGS3jkRWVHeS5yBSVKJy+Cy5F/li9czEGmpEDGujkaicGPKshgtsnaMOUoXgQhF9vMIEfMTxDEIXM3xrKtSsi6cJREUTANxrWivgu7p1qmc9DjVAIRPlGQ/BqPhpgvKa5ecghxuaAZ1xfC+GBWy4tSzFSzDny+v6+0PD87B46GyBsJ2m3LSq9j+MM331w584E7t9VgtTXf//JLl/f23nx4/+ninEtJeWzBlzFYVwoiVmLdNB50nGCQxJxz6cTXFRdCC+UCFuJUidGxU0gI4YHoV/gCsOpTEoOleO6xJaxyOVBvrLVIAzBmAOsHFzAnEzFumKwjbImkwGQFQNpDKk4Ye0BM+oy+whdBdgBSrkn5GkmaBqFH8G/TNwuQmkAQGVNCOpjIGQuVUAxmVilEXWlcPYAVhqjbaQhh6HtkTkUWrTcSfYuAnxwgiIJCsUUR1HOiDZNJLdk7p6kgODv0wXutm0kzwagGH7y1hgle6cpao5SSVRUZr3WjpDTOocOGamspdAjRphoZYZMrvPeQG8Qw7hNuK4XPlr4V9gjp26FqCIorDCqCA9qfld7gncHA5iSNs0gO30DZXESdCA/O0kV2LmDmIDRHHCZaMDSB1yWA8Wnqrhz6TgUk38FnUxDZI0rnDp/BeROiA8cJEKS4MPRr5ywvFnMwx0NYlXMBLR/AG4nJEmgO3z+IIKVUlOyEK/oQ6XmLaBgja6BvN/WkridtM5GcOz9wxvpu1Sp2+WDmY/jO4el7h2c+iodHp+drc+Xy/pOT1VvfefzRD75g+8WLz1/8qz/8yl/88Iu/+buvPjhaffiVm9987VE9nzqzvnFhe7Uejk4Wu7uzruvOVt3WrFkO7vDpMghZ6XoymVdNA2iqH/q1Z14ibS1EratJO4PsLtl1y2dP7gM7WkwnW6mTZhLI4koqPXTr1fJ4vTjeYe5vfd8P/MIn/tK2c95YN5/++tf+7B99/vefQi0PHkcQygUC/MMFF25cv37rxnVt/eVuuLzqjp8ePTOdkwpGXtZH3jPU+3Kw4MWAo9Qee8yLxLVniIXC49Po65mPM8m3pFAYVCSIkxsQuEG3HeDNBgyQT/dNUpgsnu5FRpFuqAh5Sg0+j584D44rWKKZBnR/ZDknqehm6T+jKwjDnLWsp6VAQWyiWaZ30KJ0I1qhcJbz6Ed/e7GAKlyMPCmyYuWUj2s+8sQ3dswM0fZ0YSVspDaNo0uSbgYGOCsvOfHScop3/snEbSeKFh8BX+ocBM3MPH43CB/ZhkiHbYisaNLKpx0RuQKRcMRYyHF9LUSGneNo/zFGAhegmxYvREPf6HMKDQ0Z5DkJIIMUnI+Ddgb9UzEDkptFa2CK0cMUVp4dqrnI3zFDL9lgJCPu6AjvWViv19uc7+tqNTi9NZ/MpovFwlqP+lRe+G+w44xV/fX33nnz0aNbd25dmUyG45OXrl393pdePDs5eePxYSQCcPrhQImieM2+W9d1wyBcgUumpPbprI1NOw1M+OC0UMCxcjk5jldKhcCU0t5YCeQccPYHhw1O7hx1VaUj3qb/gAlUeqqdtamBAE+TGIP1VikN6lGwuQoRfnIAJBZCfMGUEOIWNNpNO3gF6TgljS4CmoBnwkSFKCs5ucHtAFtg7JpSS2G9jSxIJUHlCgb/3kUuIGyfgr2ttW091aoGClCHRiQAFTqp8lqUw1gIOCrimSRV4IU9QFRFGKPBQgtGOm+HAEC3UpWxFowm5HJx7rybTGZSatpWgac0LV+hajTtJDV8Ll0W9JIkeyxoPnzwmOUOxxugu+SkCSlDcMN9QEczdI/BZg7xIHAAzrkxoCVjyH1jQKpiiBhCvwX0t6Czq4lAuTYk56ZWRoHjhwJxPJEu0sdXArRXWdqP7jtw34NkEilvwXtnrTfWWOu8QXYtkq0Ek4FiItBmV6CZCr6xKPiG2NGcD04esuk/qPwhvlXVVlXTTlqtIdUasqSA3Jam98ji0A88mCsXd5uqOlsOx4t+cHGxtsfn3fHx+Wx79u7hyemye+nuc8/OFn/yzXu/9j//1sPDZ//Wv/aDQvBX33yoKhX8cOXCznJtnp2cbe1uLRcr68J82q6G+ODZknPe1NPZbFtIzUMcupUDgzY8kzy8Su1kFpnQVbVenp8dPwC0R04mUwne9Qw6m369WK/Oh9XxRy/s//JP/8ynXv4ed3xcte17LPyD3/3cP/vWa3E+F+mF8ow8mencSa+kkLeff+7Swb7qhueGYWu1ePz06My5QYoh+sH7AWIVaPYFnw0XmU/FUvjMJA4ldAceFTR5FixOpNhCdgMrqy/hBS+ReOh4hSWiSH4DcYMIjvVUEQQjPakgKg7LDlAx21WVIH0CSuXGCpHWiFHkn5tPW4HWDnmkpDKVE4Sx26fE/aK5yChm8XrOfwGBSyg/JoHNBreLknr4CL2WQXHDeyYHG6Tmqmo46gmpCpcnOYxuViWHP1I5Ilf3LFfCDkCw4kmFdoBlb4RekmUxK7JddeYklZXsuPTO1yeLmzHxqGThx3ElXfa3dPHi+KUjL0rq7OHMNxLavqsrQbBSFKMwXghuIZfygEIRAlrSza/AKx6CxWE0Ix1oyfOnoZt2C9kPJdBgTzEk+Dg4wbv1svHh4qS1zorJZOtgv1uvVus1QpG5rxH4bIh28uDs/EuvvVZvzV64eV0slztc/OCH/9y8ql59661zayTQJvE7x9Rry77vwaq3hiwgsE1gaUKdTGbZpV9gGYNTFFbdEE2anx3mwASDRQryc+kINXj9FKiJGE/VnRBXtFr2FtaoEH/rwaSQ9uwYOc9DcODzzGFGhEB4HnCnWCziJAod4HZJsjDGpxjyclDgj8OZwM1xlFJYH3h+NcCnAvmz6d8aazhjqqqwisQY4Miu0KSQcaarpu/7EE1V1RB0nW8hrZ6QA0XZDiBx5yMNvwQsRlDI9J0xfQhRCdVUFTRsQoFxB+LoYN0YQBsWcWePbTm6U2G2O63dsltWli4SpZ+P6oYYcwBGtvlMz63C9KuY3cSIwwpAN7wOFPGLAgzUq0jsJ8KIaQMZjBGv1OPCHq8/2IsyYAAEgSgHQysVCkMMPtuuwEDmnTfOUiVkIYu8SEoCkmSHikIyQqBmGtYPgVoBfB2USONvun26AmF8K5VWQgYMTCpPCwxmElOVBAdPMCSx2yv7W1ttFRl/9PRsq1VX9qYyxien3cnJUrX1vUenf/at73zx6+/+0TcfP3919+d/6vvDevXaG+/MWil0G4K/crB1ulgtl+u9vYNHj59MJ5Oq1sfL/uh0zbmYTrebZibBjXXo1yUrRrA4GFNVVTuZp2dTyvOTo9XyKXy1ajqdA6wgfQjr5dlqcdoMy3/jwx/5T3/6Z+/q2i2WYm/3c/fu/eqnf/OrZ+d6a4daM4Se8s5+sGY+nb7wwp2d6XTWDzddUCenj549WXBuuLDRG9QaxWgDNyxCqJGwoDkJkWicCCOjDghzLNLdC16GOJdyKgVYpOLRG/Ch81lwTLJW5OvRiIr5GQRoYZbGJtcW2NIxz6pZPkLEXVLxUp4+EyWDKJsCj8JW/IEikj9HkYxmkhaNakVKWwp7mZsjGyP0cxxh5mHFEiREb6XYcF4mEi8v2XwhrxALOzeTxdLho9tCjy6bWFQy0euQT5Ws/90cHiMbN7w07ZYOJecoxDyDUgdRvklpD7LBSZEYRxKLId023x/KO2LjgpqBXTDpNTPARQMwldGNlCzBs+VyKaIiq4zywVcURfAPsXw6Xih0NF7T5jhGzdM77gJiP1FIPl4cdMVn5RmhURhsFNJDTvbkpBlnnquu73TfHTRNqnVcbO/v+xAWy6Ug1zE+XrzIdF0vIv/jN759vDh/4fbtmVRycf6R23deeP72g0cPHp4cBYFbt/S5VTocU91tm9b76JxHTgdkPLQlaheS9RRSoiJnWmvsQTj6WkAki8TRz6fSwnkAw6z03mlgGg9D74MjI8k09ni0TUulX0vIohdccu+dEgoGAmK5B+ekInEOmulnAa7H8gIDbNQSZTBQSuW4+8FSwRDcwbhfILFzLtK8mAZwjcbFaJXFeRqUanTJjiieqaOLfbdG5o+qKmesMUPd1GDOAQ6KpIIQ5TXH0RybFgRCMpvT87wKTcOeGSLkKAgkIFUa1qsOiSW6qrxPVz6SaArSkgF/BgMygc6geDfRSITCOdFQJveYmZPBY7kaUEUpVQy+A7r74QugwcMSqe9YlxFTB7g7Bh9YOmA9jTHpMkWwP+QeDY4QZeHZADdi4htH4A6SqnEBFiWX0UFmEeyOjTcR9KhIocCGOoA1VUxNoUetQrrRzCOphpFbOIOiyrRWVVXXVdtUTV03YKmpQGYWEFqXGJkMcItSCqOXQSnnGUA4uLo2dpi31eXdmXWGsbA3bz7x0Q9cOZjdvHohRrdcdSLEzsbppP3ER1/+6PtvPHzvO09PFkHWBxcvvPr6e/t7O/tbzdHx0gfXTueHT04uH2yxyO4/W5yvjBR6e+uCVlWIYQAvzLzlSrdy3fd1PWmnW9hhnp486rtzHOIn0y3GhTHDanFqVs9emLb/0Sc/+Tc+8r3V2XmQ4rxt/5cvfOF//MMvPFW6aifQ52XdJjj8BR+c9Rcv7t+59fyU8z3rLpvgHz16vDhfSukYNyFgsKAFS+c0+4pUfT2Kxohay0Ne0dFxKhj4fTvB4pZSMw6iAixjAg2PaLwJEFCIOxqCGKEcZFwZcDG4DmFcc4LiNIyJCRAAME6zPCOfkbIGRJmhSU46UopyOWCRF23tCM+OBZGifYreV9BGNOfis7LBph4UYdm82GWsMKZzUj2i0BsrZXLWycWA7EPy/CiVrmm+ycLdWJbgBSWIo6opUs4B7O1A58/FBvTO42iazQoIjTQQnrfMsRhfijzPZYPl9LXlGLKABkWcERsQ9+8Sq6WgkTkTnvJwmIt1aYNG6L14iGS7TDIIpdk9h4qSTxblR9IfIAieLCAIt2CMycg0ZLW7EF22UaRpA1x8eeZ95+JOIAsYp4lQfh1vluBLY+NqeVlXNVd9ZHsHB1VTn52fO+cgfjUQpRwJw1LKunn18ZOvvP3WpQsHNy9csqeL52fTH/zQBxkXr7/z9tL0SmISeGoOuq5v2oZzCb5UUmsFrhpsNtvBTA+G8Aba33MOk0RUSgswv+dCeGd98Jg+5u2ghax1bb11wKSiRtMHwZnzngs6pDETEPUznCuQWrGsECWwBpQ82PtIkTPXBMtCfnRPBqskZOzCNon0qfiqSzSEAtMPSDCEWpW+VQA+EQs8SIhS8MaBLUf6ey1UQQlEGCE1CGc61G5opYxZm2GomxabeVToi8zeyOw66iR5eY4ifjyOtl5Rpsc4zVvDKqRSKiBgOOga3bO9lhqp2iRfBqAeKlrgUnClqmbCGHPeCpQoxQySCWoBSKmPJp5AOyYNkSCZAKboyqxZwMOJLL4zaEVxxUDyQoGHyIGgOD9IXAqQyVyEcP2Ma0kRy1IJKO5lIANfGQgD8dEFx6LnJIXE2QpOOIzRx0MuBkn+o+mfdToSwLhM6Uo306atm6Zu2kpVSks6J2FXUSxFIw1dEYMqeab0ROztpIBuzjLOhqETMV69MJ81etWtz9fpQb64U/Owvnl598bFrYu707s39l+5cyH0y3v3HquqvXjl0tv3T7711uEw9Leu79Za3n98Npm058tViPzCznRw7p3DRW99XU+2dw44WMY6OwgeXaAYCc5Z3/VtO5m0WzDssqdHD51ZM8bqqql0u1qcL86farf++Q984O/81M98dHffLpbV9vyrJ8e/8plPf/qdd9l8SyrlPTl7F0sCIGHw559//uaVS40xl3w8WK4WDx88HoZeShMDGF1xg7MvUq7AtMdH7nJCWwD+Ugw5FwHS2yBiwevItrSaApRPPSachkgzB+txNLWiBRtissDopkxaWrvgYUmVUWSXCSKOsVysyOGQRiuRgRJ6fGhTmEMC+OiCRU4ZMYchxXGdSq8skYey+cMm1znPxZtB/FQyQ14SF0oFjdYslzM2Gj9hgiAXvOyNx/IIvyJl1WYzixHjZf+f8sXiuFtm1MMR1zkH8aHxNLw23FMFpBuH7GNsRrDECZFNOKjEZ2k0OfCTgwniAxnTJxZH3gADCJjdrwQpUDN+PfLiCJxjhVmXuWrkdok+9yA5Jt1xzkaGJ4LnJDise2Lkg1NVFeh3LYXQnDuQGAJWIyhpPo+8kR4sesoCst1zdh7SDAm4SC8JW6/WeyzuS7l2odne3drd7tJ/ekndAvZc9D903Tzrhj96442Fc++/eaOyXq7673/xxfddv/HOs6MHp0dlljLOQJyPBjZyqOsGxpTQTufQb4CIJx1P4O+vKK4nDZ6g3kGcQlWV4ALj4pwzEWcTTmm+YGNsBfnhC1wCitKIChmA2spg+5h+GqhynfO6qjJswHxwCvJ/0IESXUWUTKMjRJUxKSk9iLBlzsYwK9Bqgx7HwousKqmKhh9DcaP33loSucg0HIcQrbeTybyum9X6PAZy0Gyaxlhjh6FpGgDMg4KfFphngpopTkyFTNTI9PxIufrgpwYHjBTcWjP0gzGdECzVFKFimss9ZjVySgcSaNXrYB8PTGmhdMUCN97yGEa9ecTrgDxKcquA6Cfch6RKU+hr2GQHShEGWiAEQxXvNPgTIlIWJHG8At9wTVdKYPx+6dWox6cHWWJwHmx5OZpkUmavhxwE56PF5sHD+ynhk3vUHOcMZEEWg0wwqWXVNE1V12070bpumgquugC772CMFfjHY856gNwdEKkLil2HzxmwK4qYzKg544NdcyGMsXYw+/P28v58vbaWqfsPn+1uzSaNPnp6suwGA9GM54ulEuzOrWtbe3v/z5++/eXXHz5bDjev7Ny5fmCse+/J0d7eweHDJ9evXRAsnHTu7YenkYnZfGcy20IvtgipJuCOgswQP/TdbL5b1S0g5Obp0XvRI1dOrPvlMCzuzOe//BOf/Jvf+/2zwbLoh9nk17/6tV/77Ofe7oZ6Pg9kH5VRQviuxrjZZPLiC3f2d7aawdy2rj0+eXj05Cx4qwRWXAj3ZQNgWoFRnD7sfQXGrQTasYjARykcqBu8ZnFbyUZA7innqBVFcXDI0fp5eUmoa16QoABM5GVpKOUwZuFuVv+zDbMMOojxMA/jYJmFSbFIcWki2qAxU81mfORVsXHHyMvOU5SPUrrpTMEaOY4Z6IWYnpAbAJYVpjHXOvySmc1EP6/M+YHxghdHtDxrBI2kArlpIksReF5nlR0pGXSQDSQBuKMrSdE4RaReZkLwBkub6ix6amZ3jZin25jHZYT5M5Usc5Zy4jFdC6J3gbAHw/4pmCl/ABwTsyQjc6qpgxBs1DrTQhFvBc9SJtLRBWJJlx6Ii9F7NN/OGKPirAb2uQWqKDqgoe0lIs20HihNJSOBEVoPh1HGlua1wPhyvaqcu6Qktz5Wzc6FAx/t+fkSQOCypYAjMjBRVV7pb7z73tfffe/g4v7zBwf26Nnz+/s/+uc/Er198/79pXNw7jDvQ9XUWAW11hHIIHXdqKoOkQFfl4PXVSrHWmgGOew6DcFsAJunpq55ajUs+CpYqUQAUwRYAwcFMLJPJ7uAOPFAVmxwnwMY3cAIUswjInJqYEaXeNG1qlBYC7F0ABDTWiB4HxQSkiUADoxhyi8kxiA8TNIcfEJDthNixBOGtTHUYJAvozRJp9nMe6E0BuR3q1VMRTF9kbpqrDXrblXXFfhKBtqzhexGTvKIbKuJr0jAVpJn0zoMiiQdTQi+79Zm6HDrCZol8BgBUzCpFQIo3lk7DM4MIN+RVd1IrbzxLASa69J7hO59nuHuNVD4YMwsdXLWpqhDZBgKQHczlhSzUAczFngmbYCdHuYmpUlUKtzEw94u3SyAOvAJTNdEaRUg6QL/1jQwpTvkrDXg3R9Ju5yPXwkIBNpCpXIZ8C2USmqtq7adTttp27QaLanB5ARzCZ13yChAjL+uawfujOgsxnKH7ILzwIkD8y9wnlIip1sy6sAY603PYryw0+7MJ4ePn9aT2TfeONzZ2bp+5aBNMzbfmU9uXr24f3Bw/3j455/76sOjs3qihWA7s/b5m1ffevu9tp0cny13d7fmjfSRf/v+2elqkKra2d6v6iaGkFopmPvhPEG7btebYT7fqaoJ5yr44eTpfdwmeu9EcD//vlf+7qf+2vdevupOTqv57Jvd+r/+7d/5v772taGdyrpBpJ0Vpz0Ah52xlw4uvHj37kSpnW64MQzD02eHJ6c9l0akedewMIDe14BVpGXCcg5Ok6kTQ6NmXOTGTAhG5qsHYkfD2baWDQdHLjhpUWkeycWVPCFiPosRtoyw9IhZHsQAnM6O0LSXpKCFYhlYTn5ObNZ0v/IYhmg4Ycc8ljSBvOjLf1PMbPhC42ElTg//LC9spHHwxLqc97Xxu3nCBJ9zNMqls7/ArDSU4w/gBaQue9vy6AmqptCwNiIbRKPClvMSnxjJ4Aunay4zpzm7uYqAXPACQ+E3zENPmblJvMVEdhGheyTyqjdk7/tCdaR4QTYan7DiSYIZObmE8eJ/AfNx9Hjb2OjsWRbS+CFiTrWC+y3wQWZlqswuIgxDYjPrZsNgI7PDclEnhpsPiqNEh3yJQRMiM01cRAK9ibHGwsgyAKcYosoHisRLZbjrB951B6pqfDQszi4cNHVzfn6WCqSgBLq8/QFH6qZ9sFr96euvDpzdee7W3Dt1vvjI3Rdfee7Ww8cP3jt5ymTFIKVcSmWtBTt84a2VUjXTOZQxDIWDxL38tAbGYHPG6rYB3owTwJBMb6ID6Wc6WKXWChguEthbzkE7jx/OQxghTKtSQ364QM99IdJxw4ExxjjuRCvwjjfWKi0B2MZhy6FFRrq81qE6HHBOGgNiCNgeYt6wkpIKO/whj+AkRMwCFzddAm9TDwEhtbgmEt65umk0mEsP/ZI2qSzWdRtjWK8WVVXnjCbylKHUFXpCsVRB6c1uGplEHSkrojiswEHXd+u+71j0WoIyiqjElAqspJaQrAz5P55L3kBoYOTMWMs8rqciWFcSXgQPVci+vxGLOlEo08/E7B3JyMk+8/bB/wapcdTpC4GgsJICvTwZmW/HyLxgEhVr+OtA15XWWh8Mg6cFibIsB1TBRBXRbizb0NElAsgFfdW0ltVsOmubttJaQuK1cRa9xAk5gtY+hNT64W9Ihw9gIUARcOm2BhyFI+7EIy5dIw7luBgGa3fvrXFSKWOG5bqbNHprWm1N2odPnm3t7b361nvrftjd3ZnPZlI3j06Wf/z1d7/4jXd35s1f+ODtRjEZ/dmqv/fgWV3rbvCMxeuX94ehP12Hb73zhElV19O9vYuMcXDDdODAHYqTrvNmGPqtrQuqapuq6tZnZ6dHmLR2ezb/xb/8V//mX/z4fmeDt8Pu1v/2ta//6m9/5pvnC7W9E4tXYAYeYDw1gstbN5+7fuNqO5jL3bC/Wp09evx0veqVsjHa4HsYfEH1G1zkXjAXU/X1jDkidoLkjo5Anl0NUpvNop9wvgMBR5iWEjKLFdPefRR5jEknVyhWj8S3LKn7xPErow9wFMa0IJq9Y3Y+pM/AQ4675XneK1QpMvxFfizNZhQVW3g7GczeGHNZXuOUcKg8aPKiBsqVKBs5cIKQ8h6SI/qKfnSEgZWLx7N/RhmW6BNh/QVuM4cdcIa08+gtRgv8/Gky/ylLmIu+h+VFLDrIIw+LQItIWnry8+PZjAxOSfyIoRDkSsYjG7VIFFRPlhuMkhbEuOLOBxuOlrTjjmhdhxCaHBfleJdFRjgKjMuph6DDKAMI4NwBhsS8dFmRjXrPMplTai2WY8FCDUe/93iKIl1TIKKHVO6yJ2MCORPYBAQ0NCqgXjp3tOhCGBbnW4xt6cYaW83ns53dbujWqzV6+kLIFJIc0tOrKt2r+svvvPPq/XcvXb5y+eBCPHl2Zz7/+CsfUlK+9eC9lR0c0FuEVCxyrRSih5NmCnJfFX3QshKSW2tijFor9Pv1UB05g+WulCH4SqVy3ncrIE9FOxhMwAwhHW54yZD0i/MgzseVqp33qDUyxsTItZaw9+XeOWQAZehVQiSO994LSEOlRR/so70LaHYcPQhNwbEikpG7cN5DRhDQRAT8ppzLGZzX4LzoU2efJnkFC0YltHMOSU/pMnaddyZ9KgixaOpGMLFYnmldKaUj5WtklkMO8Mm+Lhhpj8MENFggnUotC+I/HqBzgcBTHMzQ9+vgPMTUKvhRDJhi8DzCEGfNMHTrGCCQQDda1yHdCwffV6Jki0UE5NODJTIphOgC+RVEKwxsEVGrAOvb9IKoSgNQ7IuHT8CykdErkcp5JM5E8BD0S75xKHoRSgFMgYtkGTF0EOAHhZTJVP45RhHHyCtVQc5D3cJOt2laKdMDBDdCpoIegdgIaU0heCGFsSYEryvtjAehnTBmSM8qqvyBcoU9Ioil0ud21pJKA957heiBTKUR8YHB9IvlsDObzKdVUzWHh08uXLr44Gj56luHDx4/e/2dx28/PKmk/NCLV+/e2JXBz6ZNXVUnZ6sBpmjF5QvPXV4uTnk1+9K37nXWC1Vtb+03kAPtg0PPqGxull5WY3rnwt7B5UrrZ0eHTx6/E/wgY/zUi9/z937qr//A/kV3upA722+67u//9mf+1698Zdmk/yACkcPdoAfkwZphe2vrxbt3D3bm03V3bfDNyfHxk8cnPhgpTPRg6cwG+G8TGeaEeMj3DSD5hc6o8GTpv8Bm0qdLFMJUpuoLNzs7nORcfQZshgAlGXpHiV8SuBcc/QDxH9GCB01aRpupHOZKpFva6TKRZUIR+QY0MRJbZ5xVY0ZkS60jtm0ZWDnLTorFUrHIbsToFblZfguPakStYxmyGQV549wHcykf9TV57iy/OO58aUJFHjVFKYIMCQ79PPUWCm9hmGE8AaFZ1NwzDEQTZc6FNbiPUbLMBo+4Xd24qTkGgUZ7kSVWgqyPI/p6RyKSccTMJQmPYslriHlADyKHIPHCP5csmwbzjUAiNmYwR16MOFm5TcVbJeaFBAFlWd5GIRjlLmbxFEetLbZsmUQeKimZEA5mNx9Ddk4IPEva6GLAvfD4UNIVynqCWLbrbBD8fOjrbnVJ6XRs6mr34IBLdrY4DyFKJXjhLxC2z2TT3l+t/tWr3+rd8L7bt+sQ277/+O3bH7h99+j89N3jI2OcVpWSSkidCqb1qqp4OvEhbAicH3BccM5D5DDsJrmAiL1GxHT0w/Aa+6HHR3kwHRo2QeBPQPay4EVEBb0OCE9AnZyKX6rc8AIDpctp0KQWi//o0XIL7aRE8B49PcBHmlhZCtaOLB3rVVYgRARFBb0QnChcIQiYtDFyDxa0DMwZjQ8Gw5GUquDjKQ7SzK7rI8zTyN+BZbE+X5wxHuuqhgmPthXA5ghEnCfiPVLwsMZGycmairb4KOogBkDqEIK3/bDqupU3BmNucU6Fh0golfogxmKa2qwBY0IwWWoqFlj6Fby84GYFTt0U95WNWgsoJvDCoeEJSqsRnI/ZryaHafGQmiFIsmIC9KiZXcowrxkgEAxcz0ZHEhoR+L1knUhJPlxoWPkLqaRMX0YIUVep7kLfGBQQ7K1zqJGLxf4BWFrwHHjOBGiYfLEcwooAEfcB4BzEV+jjoAmWhk8ElDiEjFLVsOnRVc654JzW0nrfDcNiOWxNm+2Zns2n9x4e721P6qZ5erY+2Jm8cvvScxdmleDrzh6dnD14tDTe3rh2SQQzbdqXn99frZbNbPcrr997eLJWVV2pye7uBcGVMSYEh3KuACQ4XIz3fceFmMznTx69e/zsQQjDzensF3/8J3/hYz+403sXgtmZ/rNXv/5ffubTXwcIWqZ+Ec8GGj5iiNibXr1y9YVbz8053+qGG31vjx4fnp0uBLeC2xg7CNUfYrTgaWUZcwLEvukfGSYfBACHQj4s0ZIVUQwZ41TK7xL74hFJvBu0nERSD88odGEWR3LezcZYnJjAaPYksvVzpjCKsnrNRNooUCqSF8q5kBK9Gmn7omhtS6UMLDMXiFsraYELcBHDQSiKcc6OG0viAv1l0wk2rkPHwojDLN/Yv5IHZo7g4XwjvgwzJchJWuTZnUtdrCjJs2oUNecBPI5ML1E220U3nPWp2ECRSWAcF0kjKxt/EWlsbLPqcVZsOaHJpg125nzR3nmcyVO3JXimHeBozwsnmpVdPB/tzGjARaxcsCIIzyYkRIYW+YaJKDCPJp37haAOe+2QA5fLYxOyaJv+NrjUEI4gkBuMi0nwzs0AAIlGWGaZE587gvVMYJT0HPJfEzhbOWfW3VUh5yz2nk339qfT6Wq17ruekyoGPR6pfEupnJRffufdr927f/XKpdv7e+5seWM++7FXXtltp28/fvhsdcY411JD1Lyrm7auWqAQSwjxjVFyydKJ1tsezsM0oWIl1jKN0OB6L9GFVIB5WKUrzhUyogJIPtGsCqEFxBJxb6SqWoJllYKZG0Wx2C2nJ0XiNAnDHDjwg7+/QwAGNbUBc3/hLwshwlQtqwpMQrJgB57FQNglTFaBcAmGk5aClQEW+KZupdTWGAc46qSdMha7fkl7fMHT8ClVVdf9euX80NYN3fk0ysLDKDbeRpatZ0JZSoNvVyT7HmSEcaFgS8Gxx2HRG2e6fuVMGumUSiMxAsPQHmgpVYxx6DsLNlXoOwHRQwFTfiFPG9EgBKsEOHGmKyKZgFxIcADI0uZM20TLf6Sp5/Y3srF9QoEQLM5zWyA3JO/pPJVoapS6gHR5ERjEZ1hCtyGUUEpWqgLUJ6TnK8ZhMCxGC57CAHlG6ksY8TGdscCcQmY0S98XzFbT4M6jsx4WKQraPgt1LkiBBqrZOQg1sqmI4w4Och9VeidR6S6VdM6uhuFsNczbamuiD3an54v1YIb5dKZEXPf98WJ1surPV4MLYTKphKhXy+WlvdmNSzNjrJrM/+y1e28/OtNVJUU1nx9MZ1uAw3vjB5x4SoKQENwMnffD4vRZ353WLPz193/w7/7kz/zAxavubKGm02/b1X/zL3/31//0S31V6TT4ZqZPNncO4O3cVPru7VtXL19ujb02uItn50+fPH7SrYBvJUwMPcTpQ7ZgNEBa9oxb0BW6HOMWiAmcqUSAN6Q313kNcqMtgZrM4qGLgy8mkwFTnSImAxo04XImjEYLLO/b4ub+LtNPyxiE9IKCqnIUHWxMyrwwjco8Wsw9WA66pCaSeYGjIymZAkGnnOddJN+YcjcA37LrzIbpo4XT+E+hiIQRXiPaUihZSWKzisYCr1JZJPU/BxlSu/FpWB4xx38qYHiWtBYecYGM6TvxEdaP419LeEE6lZEflSloWTzNi2s1L346ma5edL3ZciR7gFMgEkXD5JAKcr0oUzJkQGcz6owsBNJcjOmBrPh0R1bMPaKImK5I7kvwi6o4HyAxBS8Leb2MJiDUIVWcVZAo4PJGO9sYE8ZPBCRWbA5YhklZ1m+zQrKLUM6Xq+UkxgMhmfVxMtk52OciLBfLdPjKLK6KpCdJB8ykfbxc/cFrrx07+9Lt53ZCjOfLv3Dnzve99KLvujcPH66sqWrNIlOqns7mxjKtFAsefppwLp1oUmrM+gWLQQ3BYtGm4sqtMbWWdjCBhbZpwb0ogOwn/VlwYPBCKAY0WHBZCshE06lDodoZgZFV1WmmVBAR6H2QYJaZKmtIE7NPsxHESEjhQyCVJ7aywSPaySHTDTkj8HeJABnHKk3cMEnxdMwLLhtVlVWnAvGoscYHQIWB21XrCpcNaWB3A2irIIMSbnhTVf0wDIOpKg2EGh6Yz3E9VOCRTQ9L8QxtwTIVqdMhOABO4OhAZUz64o6ThySSpXszrL0fkEQmtIJIuKDrBi6vM6ZHUZPWla6b1PhZx3hIo7PHt0sELKg4lkP3gZMgamSReoxumiD+hkAGZBEzNNoWEIpH7wiQ2KNnQQJXKqYboWjxB5wXIckwE3TnHo1dIDZKpXkaDDDRMTREsCmFig5gmoTgBAh1Z0JL5YFDEKDqe2dxJeGDR/Kg8w4SpiWYc3kuiS2puGapP5PQkAQhhXMe+PYcNeBSCdQp4InigjfOKp4aTevMejDPzjolxUTLg72t7UkFD4C1QAiGuynS68DM9rS5dmlnC4KHl0H+ybfee+/JQmmlVVPX8529fal0+tGp+tJhlclwzBkz9GvjbfDDXzi4+Es//pN/4yN/cbsbuA/rnclvvPbNX/3Mb37r2VO9tYu67ZgFGVhjHHyiyxf27965vdU0O113fbDx6bPDZ0/OYnr0h8iHGCyLhoO/FdRgB06TnnGfHlbm0dAFlTjZ2Bg1Z866GHzFwraWrcBnhTytckBOxNEZSdh5nydwKAWdAqdEkZzbH3PViKQ1J+8HIgMBlyuOros8t005j66QYMlif4SMczIt3VBBcRsbfCqaHDPTB2MLRou7jCgwHE43TJ2ysoGKy4Zn9Ahksw1GdS7eAifnMUwnEhGal8gkQtSlrGpiF4lRJTN2IBvZSCxTorIKNcsgeMnMj5nRjSWDApv4yHEa4fRIxT3jAjRBZiZ3yCN+VgkX5yqR7b5z2Rc8V634Xfh5lpIRWI+zQe4aiMeFX3BTNFysjpBMQLeJNt7ZS0uQdTSF8ZNsmxcOXix9khKskulschj2AVs0RhW9rC34aD/GMv2GovCI00/Nr+ROiHW3Fn1/oaomMF5P9w7a6XS5WhozYHZ3EZRgR6F01Uv91Xe/85W33pweXLh95Wq1WO4z9iN//sMvX7/+8NGD954+jmAMKaSqIYAdWcmVrHQNblnpWPdCSiRQpNnap7es0toZ452F8QJYV/BqMRQ0ceaczZcUpg50bA64xGVSKO/StCorJbjwEb1BpI+ODOQ8ZmEEZw3QwjAlkCkg3UBlCZiAB50NHNbOCTSXABNH8lPBK0xO56iGcUqqzJLHnNRgrRUitpOpNRZLpgBTwK5bp9EZoHkOjo4hsKZpfHTrbqV1JYjBDkAokbHoWFK4x0WDBDn60tD9TNULMJKAmgSJLGt8/YUQwRszDM4OYNYI+1TwSQEjzlR8Qgg2tQ7pZ+hKIw8uFlNXWeQFvCBXPM+EZC2LVyZgoAbovwmaEQqcMiMRNliOaMzSyiiIs4kQEZCiIbSf06Wg94Cc6PGh8nkERwAPWVSoNQtkIR/JvF8gyRxwjkhupT4YkRoOTS7rMVvmwDUEEoNEv1oAqwMnt8II3QA0FKRBR/lxlEqlTjHdOKGVds4Mzj0+Wa2N4zy2jd7bai7s7+5ttztb053ZZGc+3dub7e/MJ5Wwnp334a3D06++fv9kZbnWdTURTG3vHjTTKXZIqAjPM06a+Pthve5Wxiye09Xf+vgP/8c/8an31VO+WMed+Ze78//207/1f3ztq6umqZop+snQ4R8J0rDWaMlvP3/z+rVrE+cv9+biYFaHD4/PTpdaWMF6HwceMNTIMg7gc3BMuPSKgegofSaJdGUKoKFzG26Q9TH4hsetqqrxlxiG3MJxKTka+UXs8TMLAi0NCsMlIBSCvjVELdzYhRK7BzkKOMIKtN0va8qc5ATPIslSNywmRoS2LFsLNSe7R/PRH5oE6mgzvMnp5SIrd8SouWE54mRkXo3+UgQBZIdqkWPys/aHl0UyIWCZ/0ypQnQIUZ2Uqmo5ZfsWfJ2agbxlJoQqF+eQCWpFg5W9jHhuPLJPyCZoHrNldSxDdhkEKUW/ZGeRuQa1GiIfWYXUzAoDHWdHoqWhfSKjEIuCG2D/lT1OMhSScakyV6P8lwKJy36XsdEoZXT3E7zYV/Fskpt/bIHPoUyDRLYGPzwHPoyEwghRYALAk2QJecYofrQ/DDGWcP6Cp0cpu+jt4mw3xi1ZBWNVW2/v7/qYRmEokJJ9V2QHk5ypyeRRbz7/6jefnJ89d/PmzmQiTk5e3t/5gQ9+sNX63XvvHi+XnbE8ei0VVxr3tUJI5x3MPaniKlB5Omudd42uGMQRWucg6Ygjhu+dl0KB95BPBRhULoVF4YOX6eVPnYZSFSqPIdcvHa4C4ok880qr6CFnPtVUj054ASFKuM+QNgg2SXSDApowwMAcdVXD5A09pgLclVzVmfeBo3kip5NRS423WQoOECavm9p7H1msqxrI0cJ0AyejeZzg00CTDijGl8uFUgqQ4fICidLFIu0ZZakYXsCyiQ5FW2RwGk8xQSaL6AEMEDw4RTtv+7531kCCIRIFo4YLiOtnAeS4CDzz4MkqmcF+NB9nAvXAAjytILB/PM04BAWhCwb2iBGsquBfCaRleYgXBAm4zFSzVA8EV9gjohMLK3HOsA32QAdQWoNRpcOkKZaT58iIIURScgXUXaQTDp8BdHCJqBdPJVrUunbOZ6uQgK+t9wGFVaCL09ZaPHKC8zo1lxGyOlM/lP83bSgk7S8cjsVAr0tP6bIzj49XZ4u+t+nfY2gEgCV+MO5s1R+erL/z8OTV954+Ol25wKWsmmoSo5jMdra2d3lg1hpjDWzXA2Tps8G6oevM8mzHm5955UP/yU//9CdvPK/Pll7rp031T7/0xV/77O+8tuybrblEIjst8clzAKLG7MH+/kt37+y17aTrr7owOz59evjo1NlBKxOZCbFnwTCO+iITGVRfBrMv5GiQj6LIgC0dueA05711goWpEjOtKmBOAJKGOiL4DFh0OOXOlBkWYw3i5glGWuKypszbmQjZOjhQZZ/QjC4XLJieDpZ9bcqSjwg6rDg+xXEmzaN2XuAWZD3DyzHysvejgs3jSHHOUxj+o9gs83wDHC64+oZ9Jc9y1PFjlaGtANK8oOZEk+JMat1s+ExmZhAv10zy8dNzxrNRWP4zsawwiWzGciFCU47Is2VezIkRqdOhFVVxocukZ0FtkiBsH78PJp3mLS+T1BUU/zCOKYT55xSaFvX4gZO5VkCtST6PYvb8EizLjjkrcmrqOCB4FZwUaNGPjgd+c9bGKYDgdYIkxLh+B9lfDTijg/EEjmSenTqQrEafCkO0YiwbmfS2FPl5LE8auLkuu64eukuQF2gj39rbaSfT5XJljMEoIT52b8BP0ypW1dcePf6D115TTfXCjWsysMlgPvHiS3/uzp3zdffu4f3l8nwYBiFF207SKOlht6o0IEHp9PXg54TPHexE4W+C0LhKVc5YqaEAQIyKdT6j6iGbuCI3nXu4FKmESI7MMwkMngBQL9WwVLBdxF8jr+kIG1dJ9x7z6yFzRUhVqSqkeu0ZHt8B/CCZhEk4T35Ap+aBYYlF6wmlVMwnRj90VdUoXeOMziHQJjDmjVGAo6avhkpODzGuSixWS85jk6p13jxntyw8B1AQhFQ1UsgRdYSJ7DNArroRETshIV8ZlvsCnV3Qn2To19YM3ltBlmEC1jtRaeROR1DzKHDqREMF6KLJH4oo2GhDxrPgPuTNGgoW6DimIxdeGImZJ0JyBVtznj3x0kd1IbVc9EbknGEpUplzkRBmKKUS3B+jALpUiD5N8YBdg3dS6vwoHjH1H5KsuUpCO1wpJTSEaJGlqEAAE8KdAhE7IhisWjgoyDswpLYPpErwWaBRFC46pNtyBQQjuPrp6sGiHdD40Bn/7Lw7fLZ8ctY/OekeH6/uP12+d7R49/Dk8Hh93lkPDHCpdFW3LPKqavf3L0mlWIxD19GKUHDTD6bvhm4Ru9OP37z+S5/6qX/zI39u36WXIMxmn7v3zn/1u5/+zNvfCW1b1zXDmGiea1lkIURje63l7Vu3bl272ni/O7hrg/WPHj0+PVsIboToYhhi7FkcInM8mgAuV+AX4+AQ83QCIgjM2OhblG6dDT44L1mcSrktUjtJXFYhUHgA0iNCU4IoMxHRqnLKLy/mMxmlFGJMR6RVOBpdRQJT8BPhOE38xJhTD1mkX+Gl5I0FL0rAneECxyIAplJJTGGatHEej2jwxVh+TGkLmGt9bhZ4QYKzJQdZV8TRwoMXZhQRcGOeGePmbnaEoDd6XZF3j2lY0g259hKrKa9KR5lWbj6Qf40GVZHscUThesGKZJMKxbM+I6+qi4k8qYVxVxQK0Tp/SLK9hwoocHCBDZ4grRcXxKzK8RkAVOFPJz/5De1xIUzyzFAd4yqyVJwg/nxHCK4nM9GYR/Kcy7sBk+RTPaAT8HhvsCYHTqtzONZqIQWkcAMTJ/CYUeIoUGENkh1cTIjAijeWCDnuOfMOWPYBk2vruq7bj3G/akzgej7f298xzi6WS7SIGrtBgRI7UbXtIrg/fOPNrzx4ePXCwXP7+/F8dbWd/PgHXrl78eDhs6fvnjxddZ0dOkBQVaVrWL4CLwOgQqU1ZG8DryeNoWHAGPZgfXDgbJXOvKqqvTdje8XyfpwsmtOtaOpapILmdVXBaWTBGUNyxp211jqlFE4w/TBAEYNkPRh20bAJOgMQ4TDv0wumJJo2A22HB+khwhaTTMHbOE3zzltJtYcJLp1Dc8Q0nIfghsHoSislB2NcsFrXlW77YY3xeaGoE4CPp7Su6qrv1977uq7w7iI1Cy04kQCILDBsuaGrlDC90TkmiI0MiieMlUiDmkqFTeERIoAFTcsW77zpjXMWt64iDXapV/E4/MLjkeP6BXIk88MKj6Qkhw0wt5KjlAOjM1M14rpSSihYCnukyAIzLjoIIpRcQtwliN0l1tgoVfrA6IABe3wH87lUaLkBfQB+Ux+sktI55wN8hdSSgZolWIh3QkfJwCTeOa5h/y2VjsHbweCyBjI0pbMWNrua8ygBe8FoUKkUTgcSMQIQX+GdCyBMFxFxqKDSb1XW2XzeQhlWtZYYG5yql3W+M2412M44k8ouh7TKVEmUbqqqSpdS6t29Cw0Gjjk7wA+0xnR9N/Qrszq7O2t/4Ud+9Bd+7EdvNY1frKrp5NXF4u//q9/7J3/yxaPoq9mMbyjbQsaNIGLbXDw4+J67L+zPJ2033DB+5+zsyZMnT/t+UGpgaertYzSMGTLWYC4NvtyjlXYafCUZw+YtXE7N4RHvl/OasR0tpxg2xYml6nFCBm6Dp+gp1KRQGHpxRsxmE8i9CGUDG2gFS4pxsIokghDWnEIEYpD/z3gGhrO3HS862A1rjBJLk5W6CEsigxb9aAjBRu9ksKPLkpgR1I18Q7TE+f8P4+bjDCxKPc7ERf5dczCV9mw/UcrxODIXKhK22emZVFWLTBY++niJvG7e+HOUvEItAtlQZQQg781FpI1+qURyc77NtTmQ+xfy3jPiTelqMWuEGct1BogjMXP1sk9VJOEDpk/imhsJTR5fmywFZ9nVZWTDlHUBzZXEey/8seyvG9mGegx1zUT/gq9AEF6IxbGzFDyRmVXZ+gT095rLSosYnCMGTM5xpJZU5DSISEN/GaAQzwwk8GIlqFYKG8NqvRLDcEHqysdBqq393aZpVt1q6AYy6N/0ioDTSrTte2env//qtw679fXr1y5qxc6WL12++olXPrDXNvcODw/Pj9f9KhijZSqC4MwM6YRgx57uk0qTqLegVvCm0io4G9KZqRmLgzVaaXAuShePQnkF0pRAwSYwboDD0QnfJgYs3g5oQEopH4J1DswaGcDULjLU5IvMixclQgeRNaUFmhsz2AhCWrAThWjOmPdWpf4+vZCKC4feI6DwQduKAE4jztpJO6t1a6wTCkjfUllrQEkOQzdK1CSLPggm2rbtunXfr6u6EkLnSuaR7AML0cBzM0rvYAhcKsEEDHM8x0wVq1lcHEfJpUSRdPYTgtj8dA2dt3YY0qeCdbJUqeEybnDA0vHgewzGnEGBL2MIno/bE56tr8j7LsKOFy4OKqfgrmG/hEo7ikeJiguIrwhaaVgQpA4AjETgqHCelgJcKFnhUSol4s+kTEjNBGfWWykUmNVE2A57rSoQVgoIqHdINEmvSwyyUqBBd2k4RkYAjIZcwgX0XqOPt00PXVWp6INzhufKHzl33oOtGmQVRyRcB3CjHAbTgxUXHV4wlIMFqKpV1dS6VVVdVU2laqVqEIIrXEo3zVRCYAlncmu+O59vY96XB7R5vV4Y0w3r8wMW/vU//6Ff/ORPfd/Nm/H0VEn1RIh/8qU//bXP/suvPzuWW1tSVdGTzTvt8OHrGWMrLe/euvXc9Wu1j/tdf8WE/tmzh8fHCxaNlCaNvNFwhpizi9FBnL6DRH0H0Y8BZficbNCK+AdeQe+cZT7Wgu0qOQFhNzh3pjOfLG4E9wTR0YovhxKI0YE658xD2Q4bCX4kaok53jafdOS/y+n3cJAzlT1hMQssVYujxgN/nKCfEbJ0lueRNrf5m/EFdOjjn+Y8K+RZsSYulSKOGqQS7peXzJtY+kboUuSjr/LG6FxiCUoZ54U9FbOPR3ovqlpk8dBYcEtAcCxDKbz0gjJf8qwY8mfZ1BwL4lIEpKONyIAgvSRF9UWeHaPRPAS3+KhmLsn2ZGCVbxgv3zpD+1kfFTMFjNEoP+7My0fbRBZyc/LdbiL5uuPXyvP9Bs4PXwtSOnL9ZLF8kgJSRDL8Kzqw8jgFxXitFGPBQQUlWiyaiwjBNh6cDNqg5jp1cXjt8Un2LBYWvxeiHwa/WO1IMZfKe1/N5zt7B9671Wodabc4eodjfVJ102v19XsP/vj1V62un3vu5sy5aT98+Nbtj77vZd4P9w4Pj9eLdb/2zlRVVekqDUMBgmZTYQHJisTsQjaYvtY6Fqs1gDOFFKiWgUUmOB8F3FOibUW0zkPgPPPWSamd9ejIiNShSlcSrr+SCoSnAS5k9j0GoXDMClQMaBKC12ny9jALMq01BkjivxJgweADuVFiYAPogynaN3gHblkiWAdZuRUEG0QlZdO2QkjrDBpgRu+RjAes4fRl26bxwa/WKw0uTgilkmCHF9iZ5k7cuIRMuwfxDZHXIjmbwbWFYJ+AqRs4OlBSNgPPZ2LreWuMMc459OKtYByECXvDHQgYvNhVChwrUEMAsDCx5AD7gTGVAQMuzdcRF6bgnwlXKRDMCM+6qmq0JUntjnfe2zR8ai2F5vS9QQflA54ezOO+WaIaQQIz0kNkMvlqSV7pmlpiwIo0ZmT9v1z9SbBl13UmBu/2nNu8JjNfNkACIpEgADYgCLDRXypJJalEsqi/JJm2SmFFyJ564AgPPHE4qmrgged2lCsqXOHwwA574ElFOcqNJFOkKMqUKLNMigQJgATYASSRfb6X79177jl777UcezX7XAilYBQSL9+999xz9lrfWl9TgMYVoXZmFMxUMhhHFtnUvRnjUqm3E9+o9FUy7OKVM7B/IEEhVI9xSOM0TWOzUmFPTatdKzCdhSYG7IjCTOzdbrDWrlaHRDup99FqdXh0dJmJbBcXZ2enD3a73TgO/Xjx2Wff/4//nX/333/llcPtFtO0O1j/yQ9+9F/98R9/4Uc/2q3W3WJZnwlEO3fs9Z/aRZV87eTyCy88f3JwcLjdPTWV1Xb38N13712c70JIFhOQxtdgsnZCkyzmApSsYDOxgsFytL5h528DihTojKkXqWSL5sC548531BIDOzbRQp8nH3wnA7t+CACzwN0kG26g+EzJDS/sCsvhxFa875s3FlqhruJeKeNML40SmylbIqokEZ0gH9v4zdyC84yaY0Ek+xCxWVExDdCJ+b7gfxDsb/fKtZ1nx/tkr9nusEmD+FfoUnR/V6yxKLbZVqhTpM6GeSHU/or3YanrTKZ2uD3kra83r8BBRdZiCz0DcRbEmjYkE9Vwa+b5p8WUXyqlV2MSp7RzKfOkKX2vX7Yuy/UyC3cK1biqMcHQtvgngYpWswzBCAtGezOHbaLAicGzO6ngbDNHKTr165q10qibbBl1CO4X3w37Xrl0G+RbxK6CFUesGXJ4cCR4FZN9W3RPRzeHr52Ma8VdDlSkGaxwydCiD5M1w+bxcre71PWMcY5Prh0crjfbzTAMpEOWsFArhgy1Lsbl8kExf/nmW9/9yY8PL1+6ce2G32yvlvxrL37kxeeeGzaPf3r3p6eb8904lTR551wFqTpiL5BT9p3jnX0IPk0ZoIRI6X/1p01KI1OQ9m5jMWvjW6L+vPeGEzqYC0unOZtzoLxlmErKieyNPEldyE6Ckmcp7EhCnGRUSmkToCMhWv5V8Mc3AHteJmKMsyO0zTlJFDJA8D7l7K2f8pggHR0eGVo5GudWq2XJtdh5kilz6TWcQkItYhd7H8LFxbk12Pc9mUx5NqlxhPkogtLJo8nIjPrh2hA4nghYdsAw6qVlRQ1p2MjTeibHsQVzPXYIndJSpx6nUy0HuXDuRaF/rEQegVrA1quBUAwZiTmWWWtEcOFlivVUcS3ZT2bJGqIqZVnHyj/t2WzHVuiZc6zfo+FWWlncmRE2YOGvTgfRNuXSdbTvLMVofLgjh5FaFYhHDcgKIkcce56veELqOaXJE2GKbTJj1yEA3XhkGU2VmH1BQ4h059gQfSFwnzLhQ4M5jSXV2r/nx884TK3peSUEqBRRzONumsYYu+ViLQvRjN3y4PjS5djFcdydPnxhKOkNAACAAElEQVRwfv5oGC7cdP7Ja1f/09/5h//Jr//G+6xLm820Xnz7wYN/+adf+p+/+c13XejWazO7dLbyW185jdOy6z/w7LPPPP3UKufLu3Q9lXLn7s/v3znDMoV6dFCEPpLG1yTE+n8Ws/WFgGGxrpB/MraeWyLdkPENCbrAWTiO4SgGT81stjOjCSw/fpwvxCXFqEGhM2L7rPQU9S3g9VvLiVGYRsjWqd8gO8PIv1qldMmxZBsTS72UrOBWhTOO/0VJjxxhp7tc2ENaWj+Mbh1lXLzn96GxQqiao72TuvGfmkxF9q3Y5KsO31OW28Tavmdf3Rhkxu3V9vo7fFgsqSaBAEflQdELeDXgNHa2i2hwkfMOFIS3K876G2OB7d/1fRsUZwts6iWl0CmnWfwmSSCgewDpt+Zv0wrQFZDs1a3CcvYDsquUIGDPVV8iHlE8zkiO3GTGTWyMgoJdy1+0LUOg5VOIASHTEYgdo4FchqlDFkSCZRWfWgbDfh+5o7Gdcx1Nz5JAKo2ZkdaRunc7y82U7GDnyBGFyBqhjsW5bZrw/PEVzAehG7Pxi3Dp6lXr3MX5Oc087bx7ps8BFHEfFsufPL740huvv/PwwVNPXL9+6ZLZ7J5dLD790ZeefeLmg8dn7zz4+cXmbEwTAHRddN7nomadJOj0LpbatCfLzB+W1VfYkvnsprUMWLZPY60Re2hUbGS6rs8FYojMvTHExgohUHod04AzliLJS2LxiCKDr6A5iDu9hZQmcuSvF8c7y2HA7ATinc+AJCj1HDpEoI4YXmRcTMtIU/ET9YclJW9DiN2UJ97sxtiXggg5uMDpxVTMLHsVINYaHLt+uzkf07hY9TJHlgcXiAYljWmBWrFUo+Xrp2PSPDiKjhfTYL01geb5zO3yjnzBasPgMNQWjfY95FXma2NE9yZNSdgSGYR7wbPFAiIhEUtytjShhV99XQs2A8sLKVSRBxJGhJ9sFo6UIuWDNwCkT7MVO9F/iqEjz2t0jNCNyybzuELcuTgeCYkIgaQOdsFLALfz5P1hLJIFsSMCZAVVtd+iNCZaBAi5h/xgXEqZUKpn3TnZ/debwpNNINMpmLziaZ2BtljAKY+FAhdRfJNIM+1QD2zPRA0vlJT69Q3bLVCidgw9YeV6hdYHly5dvuyMP3v86PTRg83jhzldPHfpyn/893/jP/vMb37y+HI5Py8+/Hi7+Z/++mv/7V/+1XfON259QAJfjlQA1EPBoMk5lVKeuH79g88+e2W1XE7pZsaj07NHd2/f3m4Hb7OzE2XpM8M5GUMzZyyi9633EK1+nbg/cjiN+g2yUiTnggWiM5dCXDtDUx4eU7O3uYN5AtgyIq34LDNCsgpemHcjiQdEkgSVdEgpkLUuNP9l9hmUNDkimM+eGm0Q20aaeyxppFaJPgrzrtoImcMgsMl1rCKiZtYuqE/TF7B5MgsUbipjO7ca86RXEhNk7mk0rMHa2UED98axxopJY5FxrOQoqsZK7DW8j93CzCQs9ZU0LTiXEKWzTaujx4dySeYKP3O/tMvY6xWMinfE7ajh/XYJ2cGz7VNpwslGjzqKkOmCmy+U2FC2PkfI6TyzBlEmWXVXIltRa2dKmpvH2c0KRGzN7B7Abaw4jpkQr3LySFP/71YoUVowI/m57bqoVYgMR4gdDr01naOnhQyS5G2I6JjHJE753OxBB7qV5hGvLq0Im/C/oLPJ2s126MfxaRKIJBOPTi4dHq62wzAMk+zbG3Gf7tt6lsUOYvz+7TtffO2799N066knL8XOnm8/cu3aZ1988f2Xr7179vDnp/d22804Dta4ru9r1UyJ0K5Lecol1ZJWiuP0ezbOR0e9NWYKDOBNCyBP9CwDq0JGDeTvDmCp1gKQS6UhHlCBLP/K92KG4shYWOW9pnHoWFkKCEQTo+qoE2/IteYJ7ZZsiXPOJCxhVRHI/Ra7QumB3tlUUhqnGPoYY+c7GkrHrltM45jy2Pd91y8iRQCxwxVLfJxxi+Uil2mzOe9iF0NfkIhjht2qaUZHbVABqK9jXClFjgO+NDp1KWzNLloCCp+otQvIdZFSM2QgbYlyjBqCKPiCjZf5jvHOibMMp6kaSXNMtanK/AHEsROQgTlTBJmvrsm/NlGwYAwxEiecZjT1DVMpJAU2ZnW4NBTIwWMAE4J0pRkK7fi9IWVz/XAZCGci25KQ8yT44G0QNwfiS/NENHOIYT3NAsfx0Cad9ugFkpDoqRsukLmVobcX2JqD7p8pkdEY70G8ExEVR1mEerdQggU2p9v6Qabd4L1bLJfyJaLx3l++fG11eGkYtqcP750/fpim82eODv+jX/rlf/LZz/3GzafDsLPGPoTyv3z3W//sy3/+1z+/m5eLsFiA6BukzrBHEiKkKa+Xi+dv3fqFJ59cFbie0lPbYXfv7s8ePXgMJXs3WjKVrKVXVEaULQjZumwsDeIdxQvKOpXPEbNHVCo0SzCAC2+vxG7pqLNzTLDiWJx6doFAIqN+k26OxWEI08ScxBJtS1InRyTNu3lG58QCWOSUTv0hyG8JjBJaJTG0wbg21uVZJIilrNOcHJmwztRCLq2cQecE62oOIIrVZis3du81FLLyLc+9hZvpV8Y2+GoaODVKZMI54KA5Is783Pkl1FREiEtSZ7zzPYcta8sgElxr9ni3Rj8a0VvbW56tlvnQaJQv3kIzPUamBI4Z5ZyQZqR1AN2e1uohezKxSrUSciVaXwHg9OPe7LVJ/DElB5nNNxpVzerKbJ7sCzLjbqghbv6MTnMfjNwMtv0UcwNwznyVkEtU7TTLY4zdH96LBqE1cEY+sBLdxQXO9L4eILniSMYALM9qvAONYpqDrjj8CKH1zYzujcS51W7UuzFN4+biAMoJ0XBw0V8+uRJj2G62U86zyZhRMwqS/Pl+ubXuWz/5yVe//71tjO9/8vohFPN48/L73v/pl165sV7efnD/9vnpxfZ8Nw4WYb1aWudyyqWUGENOk1eTIdIUUfGkU1j6IBA/tkDQmfSfvNNlro9zzpPnM5IdtOG8ekDwMdRyWgpAcjKTENDJN5uPrMTFQKYiKY9d1/PPMMuIuyUinTsjwWlicVYLMwEvtkTuQmcp+cf7aK3ZjlsiG3tjXOIQHuem3RZLIv/F0Pf1IgBwwLAj01y7WCwN4sVmYxzWdyImywoMSKeL4smCYIH9sR35b0urSneLJ8UuJ0rxyYO8nqVIK1AqC1+SWpuduuGXwnTHQiGAVoibrkhjRM8iHaZcy/nuciEAJTp4HveQfLmWVmdLAeaokwekIUdloNlvFkIW5AzZWNJEqYTPk61VzolEF4HMvbkHI6ozXYr6m12QvUZOCbINpA6zAmjUQZMY2o5Mu2PkNUouKcZYUgmSh2EiLYn5OAgh1IPXO5LhEHucOkXTeAMsyZJACUvlv0wpARYC1fXm2m6HPI3L5Sp2HXk605UM8ejgyHl3+vDBw0f3p/HsqdXiP/zFX/wnv/Xbv/WBD64uth7LefD/2w/e+m++9Gdf+MFbm653yzWdJkXYwcJlMgRJk7fmqZtPPPvsreNucWUzPD0O7vTszp3b93ebKQTKEyxjbWRtQs7Sx8kK5QrqXSeh98CjPEcppWZWuaKlhM9abc1RcIfRB6ECqpmGQDMiEAsgd5L0Ss9JEXMjFD9XBcdCg0KVTrJoRwCTabNrI4t2cYgSIKph+ftKnb15qkIlNvVwMmvFpuRtCFYnjnP5w+ZLKZtnq9htf0CsK9Xm7NT4Vsqqwj2I1t6o8NVbgP48+J77gVatBCE6yaVoHlYGvO+WzE7VM57+mkZLqQ1We1Oowl+7twZv70+3lkLEdvv9g+iGWQjZuN+6QlY3Un4exB5NUg+MOpXMn5AzD/c4c3KBxYTHYZvLy9TFisml+kSrCwYPl5yxajmt1Qj3iG/KBGOEQ9hXby3F13JpsLlcgrwVDSA0Tpux9tNW7ieHGL3vyO6gGE4EM37OsEOB1aIt5s8hvJm2bABlbkvAMDkQJ4PjdmN2wxXv1vT99MeXD68cY0nDdlsK0l647eix7eH9Yvkgla+/+b1v/eTH4ej4fU8+td7tDrbjJ5+59euvvHK5i3fu3L23PR3G3TAOWKCLMcT6lU15MrRfEhkVQowRSgYJZpCBKl8S0ioYjmo19JP8+uzfFHwkFwvDSidaNNZPnupFAjqR2d8NxCmCqwskwjm0VUWyt6RsJpqNRsoRz3ThAh84mYOEpTM1TPahrM1a+GoBMCXnlKbEb4MIWaHvO+fDbjsQYTobYwnpBmKc8fdca0aMfd/3m81Fgbxkq0jFt2pNK0Jwz6N4ro5CbqAlqphqEZ8Z1cc4uPqWsvg4iuslBVCIHIACiwi24DwQYyMrJYUCL3StWHapG4OxkqZEYmkg8Fo7D7Lp8D6XslgsQ+w5bbDe6ex+RWsCUhYlEhyCt0EaXqoDMfhpSsB5TY6HvfU+qW+S4n7JzKpQwatgPYYupyQVETMQp905G2KHgARDmXpBVlogTztFeDBf03k1PUNa+tJTATlPhdzZJNGZo6bJO6x2YMFxieKE3VA7JNxuN8aa9XptyTqNNta26+vNtNluH549GodH14P7Dz71d/7x737+8899+Opm58Y0rJZf/Nnb/+wLX/hXf/M371rr14dSuAT1gpCc0HKu9pXLxx949tbNk6uXpvTkuLu8HR7fvnPv9OGFNSn4CXFC2BH8n4h4laxlspVsfI1jb2doXlRtyFXxfP30mZiJHZpLMa6Dp2wHnqKZBhOJL92O7KYYVgoz1ScQByKximonnJU9n4a5isCoiWzs7LWkdazYJg6VY3wP1fLAUJcwQqJ17bVmKLq3gjUNqsrvdcqB1lfRLaZsVfjBN+pMhXNxUCY1thhhJYe1kiDLT610QnY1MvU2Zm+aPV8Thn9yFbzvukUbv/LXZef2QFeFirsb37eVwT2grcbVKEBRmxDUgYOmFDVM29qIGeTLjpV1v0IdbbH7ZgaXWvcaAWz+Wm2z+TLz+oCdIGQUL8kdaqG3xxEz6ljKdRjaCEBBuCQezWo9xsi6rRDfAGxSbVYjW423pD8EbTF1vM1+TMZ0kVSoVIbVDsQqR4Bkr/xEyBsWebu6lrGimi83h8JSKLp3U8F08Xid0nHofK1b4fDk0vrocNjuhu2gE3ec5wl01YOzfrV6Z7v7i9dff+v2z45Prt64/qTfbE926RefufVrL3/i6sHB6f17d07vbLdboNCFwP0pez5AAShW3CZIS6oxzozVENjS2fO3DNmyayA5P3vvI7N2UXzGKrolCwjOfgcGQ7Q1R6Yxc2SscoNqsQSKOQ0xkjQFvY+eUmDJDVGnFsIOE8pgyeRiXYizE3yaElrsYuSNZfDs1wf0ZqJzfjcOkUMCrCTbM4HI8V6Z9s19v5zGYRiGru+CD8xUIRqX9Oskl5KdtuWQGdZQFfA0NOIqRKoFUuLmIkcUzQd4WoAS5k3dJjGYvERYOepLaBdlJZirifCIh0Z2XY4Z2PXTxRg4p4mWu4YoTlFSrKm6W6bAAZXSnNMELDOmnCLpMkuBlCf6KLXCeZq3M32a/vFsLOr0f/n8R6KteR9KLuQv5jIlBtJd6Vfro65fpjTV/+rrtwNYuhBzLjEG3qaEirZZbWXYL5rukHo3ppxAPLDpZqHhCufV8lUrObGDWK1ZwU3TuBk2Xd+tFgeUHGrphZyn9KTtsB13509G//uf+NQ//ff+0e8998IT253Z7caD9Tcf3vvnX/zT//Fr/88Pcu6Ojsk0mxfymmggzlYljdNitbh1633P3HzqknEn43htN5p7d+/evfsoF6U6mx2QuRXvfS0FGVENz8QaoIgFMUEFNa636kuAxmSSZhmApTWX+7jkyRKTWJQLjGzJgJq4QB1KwVkii+/FjaqwZBW+hPFBO0XasWvbFrLta5X3pDkD2AJ0VZ0zi3wE/poZfQje0X+3bh8a2r3SKQPwVq3QvGcorGe3KGk4/9zMI9z5HbcewTYs2w5vPtnnAIm5EdgT3XDPpaRkBXXsBhD6haRL7o/TjWkDbxmGSXig2R/OzxbPpgFknOsfT5UFS7pm56F3vOzv5EWY1qRtiOO4BfGq1QUuz/c4Ul83vyBibWvbKtbijFqpOeaFlthRykyZGm2ZSmjPwOQA4n1ITJNw/owYEWj7xBNNoVfJVte5vXKI81pDLg408RV/PLa7l3wx/oJMMKan7LSMHHsN7HZE3YPablIlB3kPFvaSrvkuVOtz8aZnJJWd2+x29uLiGpS171Kxse+uXr/eL7rNdrMbR8skaUnwEoTEMh6M3ZunZ194/Y2fPnr45PWr166c2F25CvBr73/6Vz/8kZPjy/dPH7778PbFxQU5W1UkCFiwkO8/qT85OEEXQixm4GBn3jlRkgFzpkRoHVijyfQfCoGgXR8dnxalahpVK3AAMMlavBGrcMOcTFJMefJKKjRwIGfNpg+jkxdMKRzW65irTEvxioNNjJ208s5CyWlKwYVAoZDW2b7vrbV5Gjmpj/GixkPxjkZep18sjTMXF49JW9oBaiCZMAU1hFNkl8pUFL4EdQZAdlHIbuE2hGBZ1uUtlFSwFCPOVvJoS7Q/uQhyXIkxxNDilR5EF4DDLznzWpo4G2LgJSvdci44z8BNLCzJnCuNI3sc5JLoI0I2hRxKCg2xgOTf4J0pJZFLtEeSgUl8o6GZM0NV0oZTuHCJZJxNK9Hax3Btri2RDc7HbrUij8kMpLqq15lzKxAz6ZtpitD0Lcgy6Bg7Lr3kjUVxFKY5fwGq/oGWPplORKGObrebXPJyvQ6h3gP1HgTwtHXebDbTcH7J+t//5Kf+6ed++w8/9LFr44hjssvF9y5O/+XXvvrPv/rV7zx+bNfr+izQk6zITxBwAcjT5L1/+umnnnv2fVf6xXqYnpjGo0ePHt65fXfYXjiXHU5odgZGxJGYVhlgsmSygYYdNgqN/YoRDpTRr1GXh7RXJk/saHAd/aUQIrdO6kwEDdfyjtRZUEoSkG8JH26gcJA6CBqvSECfbSxcRcS2pRAoSEWrvv+NrkqbZimtUjJcwyjiRcGD7bZZtW0saVu1croLbWqWGR7OgJMn/hxYzOwrekjY0W1WZmkhb6FDjXrbWFFtGWybSTMqUG12XWbmazU2EUrkEOomVi6G94FTX3gy5iVpys4NjTN2/lSo3pNqzcxsC/6+jDCfTCMk7Vk48y/Yi4ySOZ3Ie5RkNM+0UfLU+C96qary69s+WHA3a6slFEMWz8J+p6vsxH6OG5+WJ8GXkWaZOMc9606Cx/ZGQznUWR5kH67uHHN+BNNouWMAHqewoFAg8ryM0WaI/yuCprsbB7jwvieOceEATtKC6MaBarlz856DSjkwO9E4aCpCQN0yGyFqOTsBbMex3+1uWNcbvzPu4PDo5OoV58xmu51yljB3Jck5VcSHvocQXrv98z99/bW3N49v3rh+8/gyDMMB4K8+8/7feumlJ48u3T598LNHd7fDMNWTjsx7A1sFGdaJpmlECaFg0akjzqu3shpwFFeTOx+90vuYm+a87Si40DgbfJjyCCWhuMEI3YYgFdGGPWtcjXCifEU/PgR6oqECpr5n6CaCNnKDC7QxZQkFMBuZjqla0knWwoTkPI0IsD445vdLKf5xTGNKmTsj4hnVQ7x+fbnIlotrcLeIodtszwukfrGgeGNgV0Vu/6FRBrQ15fiKIq2cxoJSwgJp7IFjufmIlNggNoekvxicB0UStMGmTCqe+QPmnCRxjH8nfSNky+E4W5fHRTmX2rtAPcdpblqhJCM58kejBpeH4GgKEaCc5EmIcr/WY5EaE9XOtEAIPdlQBNyp/nb05Mgsg3G0h0eXV5cux36Rdrs0bEtJi77zzpVcjNCbyQtMuGYOsOScyAezfp1pmobxgi4XjxxAzhF6tp3K/rEgERbpKwDc7QZv/Xp95F2oQD7T9+vMOGyH7eNDY37/5Vf+y9/+3T988aUbaGAzhNXyze3mv/u3X/+vv/KVr9++A8tV7BfYzBgM4sy3xYlSwq5dPXnh2Vs3Lh2vEt4Yxqvn5xd37rx7dvYYYfJuJHuNHQITm5M1o4GKhmsridlAIZImWDa6AvWbcuyZx7cDWZbVZ2hh7XH0a8rbAtb2SfK6GBGyrx4tO/ho9fvFA6yOZ4x4C+tMd38/N+MxNSLcG5XqTBAlXE79MK0WF9Tp8YwEm/kxV4/mXjgXOZyT7e2eBWTb5ypdtT4oXnem/FB6Kdjs+oV7mhudBu+j0bnqk5+lDBgMO3I6nDEXzGDU4J6fhuL6NkrWYupD6OnscsIH2N/aSpg5thZDu6o2YbU6Dxbj5BlG27/1zpmD1cS9uKcRFlmxbRPsFnO8J8nanzM7LeatuxHXVFsL9RzkQKmvnK0rvYeoup3MaHQJLflK/C+23TJOGVhKHHaKR5r7taiQjfRS1jWLVNd+mvG6aclPukExs+SYI+3kigIEY5Y0/SvAcyHQAaHRL5IDmijl1Lb1ubwTcU537IAjIiVqusiyI0274WJdyhPGhQLZhsOTk8uXDnJOF5utkeIkcxYlBNX/jf1i9O7Vn77z5ddfe/Px2erq5ZuXj7rNdjFOf+eDz3/ulZffd3j48NH9nz98cLEbwGQuYDF2/LVMaWfY/azpiBAka4xMmlBtVKgzrLXIB1/PH2p8aQtLXB71saWQQRqQhlhKFohdC3Youq9h9VdJiRjDDnKh4SdRvXItF4tuQcPSkRqmWq5DhWvOh9qM5pwqIrQYnA/U9xB0SaHvuhinKYFBH+K4G0qZAk2oESr2CjEg5TozYameE8QzWiwX22E7DBehC4QLM4++aOHKXKH6iQKrFnisw67R1K94nA3unPCGkaU1INbmiCWjESdfsk9wHPzDRs9e7XzF3xctG2uH+rsp15hUYUCiL3JHFpc27ykMG4CQindCWjT0mW0Rx3dbSyM5ULLvIx/MztgYPAu1CxQigzsyfyZjZySYG9jRovAtAcYt1kdHh5crxM9ltxtod2sqok3ZejtOO8rzCM55GlMbmjknzlSgubvdDdsxjeyyouRLq5hMfDfZCYdMv+vvoOV66ruuW/TGujRNKe887Ug229PL3v7eyy//F7/7+T985ZNXp2yHDSy776Xd//DNb/yLP//yV3/603G5jIslnQ1FfZgK9/7osJQEqVw+PvrAM888eeOJgwJXh+GJ7a48fHjn/v3H0zh6n5wdEYjebHjsnI2dDGSDxTqK0K9FF4wXJwjHjZjTCDrDPP9Mpdcbs3L2OPgFJT3Xe8DL0QPWAwfXgypx92yR+ZRDNaKXIEI19t8L1bJKiZajWi6vTBAVoirJFtDOGHEuFO1lFfrJUm9v6ToPXNt0WIuDWFJ6OyMoHYQ2wrLF/ToiVd6h0PXZg6HNct28i8X5T5UG3SbMFiWOb34vbRXe9qbNG14z0PYI0vU5CN1qvgR7l95qwC/oQhyVvKwyW9tWzNpcaP6Dnb07eNTTPrDTl2HXCStIUjCoBiJyA9DW+E4Gry3sQecLxCs3bh79qjuninztvAPGNj9GY/e/KNyzF7W8WrdG7hzmOmmuN3cpVP04qEi6bqYi0Edp3Qd/AlQDch05tBgm7u7QNJqbvAXPErf6uHTR07lcihJGJPsNhULX9FxEarUa4Ug7VxYpcc/vhD7LQSiZjOXGYcDN+aE1x96bKdnQX752Y71eTrtxu93ifAcb7V4koyou1xfev/qzd7787W/96PTR0RNP3Lh2rbs4vzSlTzz73Gc/9alnr10Zzh7defBgU4EDAE/2iJgKHKIurp7cnIrnAclAa70U/yY5GeWZ5r36RH6BXYj1qwdOt2MBULHOA4hOEYisy8dRwcKSEqCi6JzNKVPeopAzaaVKXl0VnFWEDaXUCs2jSDQZStd1LBnibMHdNJRckToH0zobQhem3YaGc7akQr4c7APtEWd3Be5gl/3SGLy4uAjBhS4ANLKj6M6Jm4b7TTy0cRbPBXiO01TCkusruLm2MuyDVYQFK4Q1eqBIXYw2UOwBTf6tFRkO39wFMrHWcjO+cfLm5Xl2PN+mFAJJakeZaXDajG6qHLBHLLKMEZViZsUWQTLbSf3jpHGOPqJ1/WJ1cHiUS5mmqeQpp8lZt1isfOhZMha7DogFRt0AsJfWOA60BCGlbymb7UWG7Mhzm43/UTUIpjmz0qMUyFSV+rQJABaLRW31sEzjxHZUZbx40uAffOJT//nnP/8HH3vl6TG7zYU5XL+R8n//ta/9iy/96V/87GcXfd8tV8S/LPNCTsnVpUBO6WC1fOb973/m6fcde3+yGa6PYzg7f3zn9sPNxeA9+UqaHZSEjsRFtOutZRgy9eIFXSYGPLDy2wnlStGAsgixvmVrTGfgMPiDGLwEXlrWl2E7jegI5eQDscqaAQytL4zRtGBheDGTGXGGhhprM5dKCnJVM0c9qYDr9Bw9a9SvSKUfaOcEISmyWq3djEzbAS9lTZbd7fOjglE1zLQNMIFye+ZUIzbAYG5DU+u0gigKWpxfWL28aKIqwnjb5qd72103u36g3YNbZn8tXF+xW17WJD1JfJBmEfc3wvs7cX7KTSM+w9z8ICWQtB4dm2NIm7C3yXiLyOBAetvGzY30JZow7i/I6oifHSvLFHQSNi4eS8IupncGvMyANkggPyHT4iqLmJgp42DWF8H+6ly/bL7Sbg6NRFG66eDcWq1TYFTnaxhzOrb+VHoBtU3ce8iInfM+2DWb0l3ECptVfG5yZii4IyVpbdVj8HzxEHRtgo1C79hWicZlEU2kl/HOhGI6Mjfy1kVTAVa03iOscz5eLNaXr20PDs6c3/Z+cO7eo4fvvnt72O0cBSG0ZE8CiHoXOpMBp+32xNlPP/fc7/3iJz9240Ycdjbt/OH6Uei//KMf/+u//Kuv/+iHDwvY5UHfLaIX/3b++KwhIYdpafNchWeOBZkxMDqyCKw58eM0eueZN0uH4pTyxDReygZwOYOLwTrABHzXaLKAnIfRh+Aj93LB0RFGE9XQhTRNZFNZUQYVLvDWozMqsvV930vGLd2bpZTV6mC5PPSxp9lDmYaLs9P7gdaWwQUwwgMnIyq6X2h76thexbkE6eLizPtwsD6kJEbi3JLbotVIc+rHnGHUSNQh3nXo2AD4DK51lCIIOZeKvmQHkBkX0b5cnyNyXGMUC+TQQE6ixFmzXFORi5m42SCyp6bnSbisigozsxPtvOnGcOpfQ3G/3joT6FkA751o151DKuzBexAhpMZ6UglOJS2Wh0eHlwBhHEdjcBzH6IN1NuW0XK2x1ENlzLuu7zAXi3kaRznxsGyHjTWuC71xdkpT7W+iF/PL2oGAc4H5elpCaC0jXL9aIMkSi0YR0u1Nedj2Jj9/5eRzr3zyt1/52HOL3p9vM5ayWv/w9OyPvvWt/+P1199JJS6XoT5MhftKZLNQoWRgKVhyWi6WN5984sbJlYXB9S4d5bI4v3j88P7pbtwFC94nLBl42gwJyFiDSc62NpGArpCmCwzSxldOY5aug6bWFHa3QnBQVi6sgl/QMoZsNup1BoVp1BkBL62MmwEuhT8ji2cUE8vuWn6uzYUBlQKj6M7O1WKuGXyHgp/FFn+LyyWZznTNZlJu4xy3emB0+klxV1JgBRo2mahMQjnMhzZR4ovLdpz1lNUYPK6TKJmJZEgg4Z/7EfHWqKy5aYhVrCxENeWgce7evHmeyd7KFzN6BYxcvvoY96tjIR817C2ZRTqdNWob22bILRxfR8AKd2ViAIILUSaj0qCwzl3cdIy4g7YZ897XaTgBSeGpMlbkbzvtxOTvgeBhIS8DO1YDK3coq0zmA8AZCQXtvBuznJOqeiIdw9CdI32deU8nAULBk+g27SusrkPoj0A0X4ZvZUvzKEqVM/Pc3hrwnKNL1DL2WmOFCq9mXFu1OD8Uc5YShdeT35ELTuKShI6mOxWyoakndA50TrPFZTQmGBvIvSJSr9Bb1xGEiWAWgCeLbn355PHB4T1vU99tS7n78P6dO/d2aRRTSdGyNzNjwkbOlZSn3fbA+c8898wffPzjH3/qKT+lMk3dsj+37q9/+tN//e3vfOn1N+6N29gt+35Vn+MQKJa1EEOWbxbLKywhlLESatH7EJD8iZzzKaUKbqgYjGnKmCCnUhLpR13FbZyvxcM1H4BTww1AJler6E0pzsW+X6QpGWsjo0CgIkR4DhFyyexlyJ0Lr2PTlLquD7Eb00ShuXKCOx+PL11J9UBw0buzR/fH4Zy0K5bdu4yvv59MpjKwvSIq5ZEUxNvtRRrH9fLAd30tewVsCIFur0I7a4eO6GEEF3PxlmyvgMaJ9dkMFf0D+mALYqYqzoN0mRE58W4Gy7tSH1ykh4Nnj+g8iZeovS2sJHfWkNCLOgLHXGVBTWBM9LXdIcCbS3GAlORo5diD4oTZFmQ1SNNk2icw9xippjhQA85M/UroVv16yaR/irscKBPCrPqVsXYqhSYRmXyrQtdHej7ysDk3BnbTLqdpsVz13QJKOb94PKYdabU9jxOAFNRWZu3EgaEvoTZ23heoX3qpLRf5qEEpKY/TxdrYTz1z6/Of/Pjff/a5X1gs02ZT79cQv3/v3r959dU/fvMHd3ZjWC1D6ID+aRsljssiQJlLKl3sb1w9efLa9cMudmm6lMvx+cXmwcP7u+2FE9lPxbsEbQtZS2Y09X/ZObv2l1gErToQwkjbJGIjCZaSU0mmoLfmILhDHz0Qd88YSpYkNzICpwWlKhXLTRz9TiPsTlCujABiYapagDYHptIhrtk8mMO9eGCxtpLYbPI216f7PbV0rmd7FCMj+0kx62GxvhczL2XKSI2oP+jpTYMK7O38n+t570XHCtbWp1GM9cUmCSylsKuWpNCPS70FPkh1Qc4eF82D3aqpgTRZMjAHYfOq8s/wapQZHkIw5olIM3zgAtwqaUNldm9ByZlF2ua0kgmc3c2jDEAdinLJEpUt83/5vLFyRSt+oKkaFWGSTHnpHfQ36wTAWdFoWZ3SycdAmfnWnh64eKLuVtmgttDWk9ySlPeMxNe39a7zsvhAtnn1qAy6xhqzhJ+NWlOpfq31TzJC13BpiRHcY79Jm8Pl2lmr3i36DZIqUAdv9WSg12bneFoIm7Ys57flkjHnOQ/IGQccpSr/8ASP+xNK260HOOdGOuMi/UKPNtC2P1jT0SWI1AdF4zpjAsDS+6urg/7o+NFydb/rUx+HtH333t279x+Q6iOQNFYG+rqdYbZuLWB5e3Fo/S/duvWPPvnyL998cllgN0yu71P0r9178K++9e3/6/U33rk4tS7GxTJywLDn4ZQhr2akP6uPGze1lG0XyVHQO9540mGdSqZaUybi4taiibyotjwEJpzKMaIWbbGzVVa9YSsKDhFKPcqtQ+8oi9DW7mRKBRm00RaRDXdAukPG556lPsH6CVLJpV+sF6tDdrSxAI8e3nEms0dqxuKotEt+uFHBKcGMenTUz+hSmobNNsa4XK5TKUYUezwGqWXV87FIPo4oHEKsOIiGJhSTL9oCmuXG+p6xkFs2nTGqWKwAv2LCDgsNZqWPQigQCPcxiwIo8lrsdjjFnmP2qUmhUa3le5A/kJgEW5pvqBzdO1+Y2EGjICdIwKktIGYiyTvvlouDfr0OkfMzkFIlNt7Ho6NLeZyGzRBC6Bb9drehTN9Ae/BiKGc6pXG7vTDGdF3fdTFP08XmrEAJXUdTaS4c9WrQN0K5lxJEw9kWpEnDRI1IKDntaJd/xcVff+GFP/jUJ37pmWeOnSvD6LzdGvv1d3/2v7766lff+uGDlMJy7WKkhC4pI6LOoge5IKacYvTXT05uXnti3ffLNF0dp+Pdbnd2dvv8fAO5eD9xcUUUZVFFwEhOADZbpTrT8U4kQFdLpuOpDu8f9FAnx9dSbx5cWn/obe/JNQNrkyuLWxB3KNlM1dvb02CbjyJZzhXO1Uc5SjhRpVVI/ahUrHl46FpOgHLNrMxShQfKRc7ivBnElu5mdeQqeg1r96ywUNiviMXL18e3F2iWCENCsPJxNJgAeDDvNM1VBrINQaktJv13L1a+9OG8TKo5sp7TLFrmADqrAhbJuTVaKIUJxdGLbWpv5v5CK7PWay4+VNq65RGtNNWtG5sGrI2qJXVYtsSCsFES1vWq6zfgRRgi3cjMgBZDXNrrI2+BJdMbNRQBrdr6INuoz98Ky4hd86PkJRl75lmZSksit3p6IWcUSEaRiHoJt7QBfP2aiq29P7+aLGyMBP7ybW72/4w/AOMwjvsm515kp3A/M8NQpFfUeDjT3M0sRyA4eTWijlv2m+ULzTXbcuCSUkwrDnLOgbXbki6SyXSMMLFIM45FrKcxGfXJIkN9DMxqokbD1bKDkVy7vLUdSQGDM9H5CNgBrn08PjyMB0dni/5+3++6sN1t79y78+Dhw5Qgdp1l+6KZIME8COqLCqTtxSGUjz391OdeeunXn7n1ZPTl/AJCnw4Ofnh6+qXvvf4n33nt23fu7QyEfhlp+cZstRiD8zZNZNFFFEUouFyvows5F4M2dmLTkXKCUrxnvsxUSoWgXfRpSuQaQZWJLP7JQCo7kecW1d+7ZbdMKVvn+y5i/YU5BG8RJDyRuUi19BamjFHtqnfsoltMKfku8MFpvJtSPjg4Wq4OmSKcd9the+bJo9loc8FegyTaKZwJQqcanaq0DvCuQmEAXKxWotllgQ4NpYsSYsSSzwI3I/zbiZlXPzPpdnyFcNn4IAkuaE10gZbiHKJYiKMdPK3Yc8WHSOQyzp8GctU2rPgyahzKDiFEtue2lubS6FKZorelIKm0ASB5F1j3Zbzx1mOp/4+8nelUdCzAoAse++XqwDjfBV9KGYadc+Hg6AgBd8PGh9h33bDZ0EtE7/2UdrVIp8yZHzsyx7jYPEbA5cEaAdI4bbbnzrkuhqLpPHqUF9mj646ziwtnzZQnkiqZUvKw3RqTnzs4+q2XXvyHL7/80s1fWI0TbDb9sn9ozF+8/c6/+eY3v/GTn5yiIRtnb8isjc83aDRnugo5peDdydWTm0/eOOyXizFfGacreRofnz84fbRNaRdcsjZTYH5GKIjZukwQLCFmslqspbd+CQ6otS6cbovqxyN4gGXZUEjf7I09tO4gRA4Z5CYKdSFPeYLi/YFNDiW7UJt1Ly7/SW8eXsGArIAF2GHhfPN5lakyXMHRHIInmEIgWQEZIM9U4Dai1QSdhv300xkz2y+LlKlgYyuhd+ypYMTYCY36LbDwE2X3Is70+pLNCKvRr6QWYmsIXG2B0Et8lNsbjM5AdO4RZpMMalFNIzDJ5WQTHURdZevmk3rmfnWEIgIx8zZfeZLGzqQtnK8LtpFvWwqy3lRB6Hv+lG8AnueitifQYgCFUSceKkD1CcW2S5pvmYa4xoPWJGbtE/bn8lYcN3RBTP1X47hVwOuoHMqYhGmnbGePrjadzN4EDkfzCmO9hgyg3jTsCGnlu6c/LHSPOausFR48o0NwyuljMrafV8AosFgFfA5AqWhs0uiI5+i8Mt5Gay9yGsjROJAvoLIfQJsfsUK15KTNgZCe6pqvl7d2D9HWUzPwn0tJrpCwQ+hTOYrdwZWr5mB9GsOjrtt1/mK3vXvn7qPT05whxOBdQM3VhFmIx56mZtru+t3w4ZMr/+BjH/30hz58a33oLs5qqVsd3nPmL3/41he/+92/evMHPxt3xsc+dqRCdoECZUXTRdLePsRFXLHC1NP+hn7SjEOyzuQyEX82l1zYcgIZtFJn5iUdQQzVxKpd01ViV3sPmjEHaqnJq9/V2kCUTZAziN5GISdkHzsKl6jlh0yaiUpNZl3rg6PYLUoxMfrzxw+ncTAkYkYygaKWTdIjs2FBDsd4ORrnEmPX+2mattuL1WLpYmT1M0/IxYRIct3ajIY9BMlV0zhWUxBLnpZZtTermJYQrCukd5IxKScf2IA66CLGsk3FMEAPjvw0KBCJsx8owJHk194XyIYNk+gp8kRvlY4T2GsFahPkgBd6bDrJZEsoSEZXcbFa9d2iZJzylPMYeNtPICb2PULZbrbOuX7RI6RM3p8lla4LJU9TmmiZWYbdFq3piHK8GzbjsOtIngRkjEn3vng7S74RNRG+o0akQCmpoBnTBNN2bczHn376///yJz738su3lsvw+BxLNov1z3P+0vde+6NvfONbt+9dLPq4WternQvqpgQ1pIDIa7X0emevnlx58sYTR8vVchovpXSUwV5szh4+OB1rl5GdTwYy2oyZynB9aDPZO2dazWZbvygymmWqHeUJWhDZKpdHJ7bwpXCKQukMHHRxacRQuyjjjO56UitxSIywWQTkgrVtvFp4GiXncpPcW4l21rrADE8rOnwePnrdb0ITH3ObwMHsewCN9ZOgX8qcMW1nWr6EvLU/fe9StekYiZjPmg8ZArPlA7N40KOCXjqVBZqgmPxSB8x8HbvXQzSWngeXK/ABEchY9dR0reQ4ZQLxnTaDd+lAlK2EOGuBlQxMs0/gX7RYH7dOQfS94uDAbBkjMcA8z2L4b5T2hmYP6Tq1EgXl9GpvI/tSKyt0/UumzettmzU71M0GS4VA+VzQZLza22oFM6ot4jk7zkQtJYVr78DIs1hdW5MfEts7yFfhaLyCknvcpq2g/GrNhXPS6ynSZ+eL+VLzmsRq6AyPA52MxIxToCw51OyAZCSM32tgEh1byPQYSYAT3YjL1mxz3hQo6NBhoMGqpAMZWQ3L2+Y9pDangcbRgTj7NIJG2Q0TUA4Ga2E2NqBbYL4SwvLyyXR06aE3W++nPj4ex7t37zx8+CgRAdjLNKGRsdl42fCfT1PC3ebWcvmZD37wsx/76PMnN/ppwt0mLvptt/zu4/M/evXbf/adb7/14N5ggutXwfvobSCNELdzUKALyxCjpzOaY0kJrbppmjJMhQyOKsDNmS0tBYmQOVQB7sV8KfVwq/WskPtesM766PtMxOboY07kG0XUEx4TI6e1V6RIxFo2U/DUXqHxMdTeOxUXHLlhmn656voV2fTnzflpgZHcLgl0Shxp/SeRSBrqNQ+mHubZ6h6fR2TbzXlBe7BaO+bU1JKFtMmtJZk2aQ5QPyxP4+qfFMfqaWB2iWNGi7NsNsHESlkXcTi0d2zGaUNwlPFgCzbHPWKtApLpciwlEYrlXSGZgEqwKAvulY9Nf8eFUE9QzLx9JGY0rWHrR459vzw4vGycLWkcx92U02qx8l2oiGPKQO4nZUoAEPuYclr1iwIpTWW9XOW0O338wJGsaxyH2EcKBobtZpjStCBTFE5wLDSNcNj8kpgNwh4r9b3sxjFPo8f89PrwV1748O984uO/9PRT18Cki8fofFmt3j49/+J3vv1/vvrqa4/P0mK5WqwMg15Q6ooSMHhCMKXsvD25fOXmEzeOl8tlmlapXCoQzk43j85Ox93W2eJcxbiAI6VOcXI+GEsb39qgcXh+oW4HrBRgi80Pkj+JnGi16yRb6t6YpXNrGkoUoVlZ3PPAL5ogzqWsiJeZzAdlGYm1QgsDl3HwTEIVT2/hB8ieF9HJIr8NlwUQCWB0oPofs+eApaJhaDNcKYTtcN8jGe2jPcXawo8CAbIyckbmpYF4PqNkEzB6dy1ywAgFqYXvWX3pxhsTDAmsKZWdNs6bw79NImv/4Cw4FSZuI27rZHYmcoFcZ0S7WF+yRhJUxJqAPZA4OJ/HaLyElBQ/yWo1nElsVbor9dbhbLM4G2kw/CaMSY2X4abdiDht31xb1sdsAc6pMcicE+mfZCYigzlhRtNtSh+UTbv5/cmy3dEEkA5K70xRpEyWLgge6ExjmY/4oljxi5OpMzRlNfPkBB0hI2ixoJb5v9wiXOs5ygYbd535ypryheJ/Ygiy0e2tUXUMW5GEW80gkz+nWIJgsAlwm3Fkbm4tIEGsg0U7BRKcaNjfxrB9lidzEkoYt95AJK5WpCWeNyYSLozWVExcTGfslb4/PDocD47vd93G2xzD+TjcvX//wcNHacoVgxOQ1C7INKUdF7ScUhqGS9H9+q1nP/+xlz7+1C8cGGvG0QC61eLtYfzy2z/+o1e/840fv/0gbdG4uFh2IVhbC6Ot5Twsl7Ww5QJ9Fxj4cfY7tUuYppSnCZ0khXOsAoK6q8g+i3GYuFz54EtBulzB+XrlmIpeIFM0D599ZOcPxFbw9Vgkzlnkz0hUOF9SMtHXQkVgNC5W3WrprStp2mzO6LYlp17gpBKLkGQGRMCyMKFVuiYy0vfeeNwNQ95Ni+Uq+FAKFovkWgWlHtr0bVUoKfQbIGwjO2/HsQLGSaCfLUyOqT1Y8b7eHilDcJ4+nAMH0XrnPdCilhCzJV6bLZSvGmm/kSmyiWilhWnexdYeRvzp6NtH5NRIE3wg0lb2LhSbM2QHNFFerrtuyT3sNO68df2yh9rtBWdqRUx5IqZ6R8R4jDFcbC662NWuKWVrzDBcjNNACl9KL/Q2pd1mc2GNXyyXtRpRPDMZeVPmRyNhUvePaHKa0jQippX1Lz7x1O98/JXPvPChj1y+7IehpAmCH71//fbtP3rtO3/yvTffvtj45bJbLiQJ0qIO8AiYUlIGAORc39vlWnqvXz5YxymvU76SU3d+cX726HS32xmTKZo3GUhoE12pUmGZLfVPkAXshURHrOcGtUpiTrXsutgpme75nDN1GNgHe8RxOsCzYVQLaKcxZ4ZTL+bQUv5tajIEfOSh/rltS18Qz0IkPgQCW8mxVIaNTYxprB/URqExCawsNMU/AlsU4b7xFM7lSwqhpAQw/pGpuZOFF1sIyCnPI2lo4hsiwRSxXESU9ye5Nc3JqA3eRc+CLIyjhRChMSv6eRllsxNG0eqqJ5zaSbU+DJWZpR/ICh3Y8iyjaeKZlawTAzB2sToWishsekxUQWzjev5F2Kw6lEnBo2K56CoWdlZvgibiaHm+3HVJq6JOUrNHNhZpqHUNLnFaHOEsYQdN04sab8DGuUKDc3y55u6DcyXoPmMzTgtKqJOvkTTiPA9hPQXR3K03Mrq23LDQOKh44/lmZx9FdlVUwyxrCmFp8twTNZeGRtFJC2zoSX470juyJMsSl4VpA05dqsmagSdGtP51TC+Um5VOovqiA+Cm4ET9qXM+MDfHCZTx6kvDKSatnHtrA5dhiwENU6aDrWdzJBwXjYuOp9amN+Zyt7h0fFjW67txedp1JbrtONy7f/fegwfDlGLktDonoZJsxiSLywrdM+R8sVkY8+KTT37uIx/6zVvvf/7gyCcYE2AfBmdeu//oi99/88/eevM77/58wGR9jH0fQxdtiF3Xh57qBC8owJJcuH6vGXOZSiklT8ZhLiawBz+wBoFCCXjej6BSbUO5wpT3S99CFyMlN/C4TEdh5NOa8kRsbf4OGEaKm3X9jMEz7nPGpVQw2PXhcdcvsZTt9jzVs7dQc+Y5iReU5MnGGHwwcLKElxvQOkAXK+zmMeyyXxZICCRQNrlwkgH7KdK1lWw3+siUH2EqaqaKS29bnXIL4R2vfBQUjxXPqx6qzbZW9sJuDTzDkVENHSO2iT+bfR8xyFFWii46X6Bob0oSaoQQu/XB0Xp9mFO+uDgHwK7vvasN0Gq9yiXvNltrinGui3EakyWhHQ3w63OdpnGahkTOVmkcqa/yntTYY5mmYeNdCKET6EbR0zKPYvInYcJasdJU8miMeXq1/o3nXvjtj3z07z7z7HGIZpywjG7Z3R/TV995539/9Tv/9u2fnKbJr5ahWxSxrawXuFhgwzluyguWkpLz7srlKzevXTtar3zJh1O6OuXFdnv/9PRsGLKB7AOVWJMtpnrbuWRMcZiBzJxpVgwGM5lKMlcOxB4AW9QBn1ecLpkhUR+GwdhD51ckp6uf0cn3yuQiYh568p82BEaZJ6xZlRRmhTrQZVAE4m5oiZzFjpNWfgYFlTbfyoZFJWif981m38rDzlXVNO0SH5PiHCU+E0a2V22W6gQk0mEp1VPX0QKIuTwGfo4YCPMoviUA4RzCZBsTSRJ+NPiVYZo6fgk85aQqJ8NaOpXZLkxi5Wk0ocmKAnB5RKwukTgLWUXwhDIBB30WXRuj1AKsoUJseKEJb3KrwWy1AeJEIS0NmHbGMoeL/oAZ1+xA22hie/Ke9yiK6fuvZx8PxlHp0zrpkEPJglwu2eTIPo+lFK2v4ZWt1ah2a3VOjka7Fy9e1WQxjyD+AKxzAsalhTno2GRmsxkJdwbUZYhqW83D0MyxzyKVc02l9p7Af2wTcvatZn8tyw55Vu3cHM01eUTAvhqSlEY6CXQ0QuBAATJSAGs2KW9o3FR/MHjPrghoxd1abmmdsNBB7XjDx/ysWn2tpz17tBjBBopbjcSJigZjzktjD9YHx4dHZrl6FLsHXZ97N0y72/fu3Lv/aJdGH2KkSbibpfSz1Mu7kCHlYXDbzc314f/v2Q/8g5c+9os3n7haSh6mZAMeHtyZdm/cefeLr3/3//7BD988PU0Gu67nX7voe+eDj30IHgpF+caACUqZfHDb4QLY6InMpwpJhYmyWw9t71Q2QReRNrnGe18xIpQuLniPHlxXyMiwCwFthW+AJQSfc/b1oINCZteYyeiDUvygwk3C5amwsGa1PPC+R8i74bxAMowy6Kl13kGthB41AwBFSuAy2ToKUdvKEnc3bAuUvl84yjbw3hXxdXM5J+lzxHyhFKjInjo7z/m+1IUVZwLZThlu1QNdHLTiQEB9r3EugCuejjofmBZO3togS30HJtscXazdrSN7k3r9XCnAfimUoigJWPVC1wZqcXBw5GPF7uNunHaj8X65Wi18x6T9nNMwDkyQ6brYd4uc8zSNXeydhe1Qq3WeJsDsrB3HqZRpvVqjtYWy9KfdsOjqFwe8aTC8FeWTmoouJswlpWQwn3T9J5586nMvvvSrz37g1qUrbrd10xS6eO7Da2eP/vT117/6ve//8MH9se/9cs1RITQOl27CNMd2a0rOJecY/bUrl65fv3HQL/oMh9N4aUp2tzt//HhzsR2Nyc4ka2vdNfU3FWMnLJl1vYZDFOr7TPrQA5VJrvTMkjdKw1E6DeW0QLEGF86sQlgKF094rTJFpZZOrDNUgQK0mBBJLi/x6IlAERLXs7sIiFHTKJA6qYS22R5CSLg4Cy+br0RzUTAiUBbrcUtnFh84s13uvihJfxmynWYLvmmkoiZPUc8Ys+fFJeZDjJPbL7QiTgZUanIzdVaWtHKcqYmUbpIvd1vZ8F8oDr3+Yi8NtDK+98lR+4tP/Xho5gLcxuDipGkXB8ck8EJWSoMOdVH9GQsXOSsDEL0iItVlVwk351EoTUqI6qbZbzICVXTcJFVmlhDrfr5+QqcNEhan9F6F/Wr77WzRDL3Z7UrJakQ+cOS/oha7LGSsWNTJLMayFki8wIHPFjKOZr4hI3yjFHB1rQI+T/nJkFqOptlpAkevm8aHN3bf2oNuA8bOnqSKcpFYXycmSBLPz8bGmmJghVNhJcxWeNWcoO3daMwFSXPQBXILJMqzUtHVqQU5GdfR00f+lsDLBh5B+9oQmY7MgQNCrcGG88xdRBsAVqUcr9brS1dgvT7z9ryLu8ViM0137r17796DKWdKs/FszGSaGt1qjna9T/xUEgzjuuSXrl//7Esf+7UPfvjWwWG3uTDTaGI3rNbvjMNf/eDNr7z26l//8Ifv5lR8H7uuC7GLi0XXhxDFjiwliu63u2kcp5GCK5DNkihuyEhwoXjuiG0TYKkoimcXNOCIXUdtgwsx5GmkMuNJ4VTIrCqTMNAJxRdQUpjoutYCTHJuwuUZjekW675flJx2w5asKcT2gP4WHweFMxNKIlBB+BPJRcG2lo+qJZac0tTF3jibKJ7P0GwG1SSVj2AfHBkJOC7nBFmLI/t+R6DR+UDDe163UC5Ckbh5Pc6Q3CQMGWqS3pQ3fTo9FHIBSFfrCIxzqAbIMrBeeB8Wq9Whj14O4Ypik3Wmi731oZQMOcW4MAhTGusX4TvvApbiokdTpmGbU7YGxzSiQUbVu91g0C6Wi1pwLA67XU5pteixthq1X8mAYiJWUWbOBdI4GZyODb5448m/95GP/tqHP/LiE08cX4xx2hlrdov+pzn/1Q9/9OXvvvqNt39yHwEW677jUEUGd2wkIAEA7Ada33zJfb+4fu3k2pUr69j3OR2kfJSz3Q7D6en59mJjDbhYaMtLyUW1AAMVYFIWYSZMXei4LFibH6A7E9gIgqZ6KKegaaSGTK9t0XQGD0NY8M1NwrCiJFWeLvIxz2tEZFGLjtLAiqEgzsihUKl12Mg4VjjQ9cbhX6COzVyvlMi4x0Od4ZTqSxQXEgwDNe5n9QRzpGVOzVCSLXbBNpum5hqKGhaHrY93gh3NzAy2yod1fC4SU5/OTC9vrA0i5/cnlhl7CqQszQcKD5jjwwQnq9WIvh+R1aq/8AxMjRL+AJSnrGPi987c+cdtf3BsdL3NZZXZ36BqI/lmZ7NM3ZEro4i3DEpYcnv7YNXvShVuNZfbNSXImT2LRmNEIt6W+aa07fDehZC9cxGWs1RYrmpGfTy5mXB7N4XSm1BZV5Y8Wti2yrJBEFCaMDdYTllwbB8+t2rEahYXrNoHgDh+sm5NynLrYbUldK05lCurgcmzYaZt2195Emgs7gSASxmx4OU98VPjrJoNFYMDwDYT8nKOCE3ONpqYchRM/dTO8cQT0Muy2QV6GBxxpz0xtogdjcGGUP8QacnsY4YVpCuLxery1XxweObspgtT57cZ7j56eO/+vWEYKQI2ODoo6KW9qPX4+SCoBmiG3WiG4f2r5d977rnPvPjiSzefOvG9uTiDaYjL9Zlz3x82f/79N7/y2htv3Pnpo1qJl6Hv+9j1seeoohCcRZtKGlMt687x/V6LGel5kRlQ0KoEcPIAXwkJgqV4wBj6QI5ambSkATOQgCdwWRUWKF1M4RYZ8D5ARuetD7WTIWevenfFru9iR5YOOw60EtvMgsxn4joMtLSm4OFAHtKAupriBoYyBQAyiNkoTUCEZkXsE3G2ophF8rgWgxbOGEpI/HAU98d69JMuCOsPE52g8MCgBBuQhgcI6rRFImkoIL7TiIlMnrGAd5FOCFugVByMJuUcQ7dYrPrFsovLaRoA8m6aEGzf9f2ij6GbxnGzPSeXbIMZFoslO4BiyYVylC/OHxMFOFNsM8SuS1O6OD9fLPsYIhhXyjSOW+9DrB0Y9RCG2n+o72QiuoEtaW3sB65d/7vPffDTH33xY9duPOG9HYZCMq+HkL93590vv/b6V9760Vvnj1MMcdF7zwZEhUMMjOQGiul+/YZKRsDVanXj2sn1y5eXPvTTdFDsuhR7cbZ7dHq6GwbjszNQL5jNWL/UCU1m2h8xmekPqRKbAiLvr2dB4QxBXnYJZkPxEDAkp6MhszcV9a69jTzNoNUUUJcvXBjNRgN1pWIFcFv1sVynNMkPDYXYNshJyKZo5m0LB9dNlp7tMhUVpWNDoczVtwK6UCNUueiTXpSXbkZ/KShpWWhEYiWhxNZGv9IBgMg/cU4rBOE4669ieMhdNVs2ibeIVP/53AWldkuILMp0WqiqfDyRFy4PWlVa5eaBKBdCEN8p2wCloFfVJQloE8qv2lFw2yDzUrtYX9KS5LTkqyMoSEAd2W2AFI3mT2LFEXMWVdXX8CgxczIEUDaxbGONSKPwPaon07oHKSxunhTIJFeESTLpZVMuogWYef3LAvEZ8eHsCMLLYzbEMEXRPR1fTjR25AYr/Yln2OlY20VLWjdP5EXphbY4yRaurYCfp+yyhOXxdjOotKxYFhNRxDapodcz2ndx0jgxDiRc2Kkvt/gCUwF20uEw0RQ50IapExPYTckDH9Qk/OTAcxkTcF8iexBoaV6UwljfSaAO0lmqx8YGS/YHzoR6TFv6cxtN7VMWaE+6cHR0mNdHp32/8T71YQPl4ePNvXv3zzePAUsMHfN01L9TFzDqjVz78JTG3dgb89Hr1z/7wvOffuH5W5cu9dlgShZLWC8eQvnm3bt/8eMff+WN73//7p1tSmBiWC5rnSOnrnq+58S9D+mGySBavMsdx/gY78SZkjzYc6F9DumGS6pQbLFYIJoMyYo7nj6GtCvAJmbhGbuBwi6GtC7gfF9nXeGiXrufEKKbxh3XS1uLWeY5EYvXOOKU1eCESiv8ygjesppWcgNpYW+A9tYxduTWVW/0TKJeWn1SGWMPT/q9LAOlMQBlDCAlb8q8m+9pBIvRRSHTqL+SNx6xUH/hjQNKuSjOOwvsEQ3B+8JI13tVsnhDmcd9tzDOp2k3pjE4H3yHaBbLJVpTplpinTOJEngr1nSkXSGYfrF5nMeRnUkl0ojE0MM0YDExEE3MmDRNU5pC8H3XZZb61mehTGmidXteGve+y1d+5UMv/MbzH/47N2/+wmqJu7GAgeB31r5zevbnb77xpbfe+pt3f34O6GK36HqibcwNscrUBNeVUoimbg4PDm9cO7l6fLwOod+ldS7HaQwXm9Ozs4fTuCPyaTKYiAaWwSRS9BZXW5NCNmSANluyByIozOcv/yuqEJU9WtVMiTjwmUTC6BY+HAS3MGTIwooPMYm0CBrCb6kZgVqagEGFKoOYmIpCb549IqDNAffQobQealOvZs/sWmnEeactUwVitoqLLLwlqj2wbzlNd2xt7eoLeH74lUDFulykuEUrY2ezlyDcONHSFFhWGBlxA+P/MMt+FEUzgJMtIejH0nkmOxehNAq0EOcBhPxKFdSCSI+IpIOz05TukWXJiOKhof6ZbXWA7yFMK2QHZv1IQ7RYHcuuUFjvRvVZ9HVi0UG7k8GMmxWrbLPLki8pjLOtibNt6y73gZqRzTYd2hKpyWUrxMoKB04ZRG22VG7KL8h4TqwLhVYio3Ae96vjtPYrPIxwIraybI7DnG66goHYD0UZ4AZccWQrznZsnNJB74pt24pHp04y/I7FllVeVmqsCts4LNPZ5immu4RaGDyoVlG9sm1z9ORvg2MMiV4UGv0BeIIjYxBHILNeeme3UDYZsxjOc76A06mNdFsqliNusBUTJjp9lahFP+ldPY+jMYHO6GAwOvbYMqHkzrij2J8crPxyddov7vfLYRGzxccXZ3fvPTg9O0ulhOC99zo+sc2LFVFJBnT+5mEHu+nycvHJ973vMx96/peffvrWwYFNacpguojBXRj49p27X/7+D7724x+/dvvO42myzsUYQ+xC6EIM3nrS8nImTKF0IG7xTam3CTCNgrAvbTopUYejD6MP3ne02uROAZ0LuSRa+rDHsmW3Y0qTlhyywqbczlFZoth5crekbFneJpI5VUuhpQBgwSFEfC8l8ZHG0qmCGaXrpkERnc8EbeUpAErT5eUVD0WyEFyZMypR466+79o/AZVxGrLVO5Zd0VWcQXW6tlhWOn5f32ugbD5rPTffjnzVfUXbxegiydceI/b9quv7gnkcdvVmJHPoCob7xebxmSMtZf1bZKUCwNz4+rZzTjkNaZzYvkLCCkv9cgDNOAxgoO+W1pkCMO4GgybEzjtHzpElT1OZEpipN/6569f/7q1nfvNDH/zU0++7vui7ArCbahWP7icXm7/+2c++8PobX3/77QfDFmMMfe8os1mkEo1cBOwXX3FbyaaUHLy/dHz8xNUrR4dHC2tXY7o65qNxmIbN/bPH5ymNBsD5QvH4I6UmAK2oE43IKDeQVEA0jiyOYzRYMWMLUQqYMsMtlgxWkU2bM1mTmuDdofcrotVRnwQ4ayxFoAI6XASlERiVchjlrUI7iGnVVphzRe7ujcHa/q5AHrk0MtlWRQGTFUWYolNRToEDJtBQ6XUKwYxyL9gbhENOgO3+eGLpgf2YmsRTUJg4awi5jC3tmPEsboiONKXAM2yR7lgdn+oJ7GgpDrTCE370HEeEpmmcVfpEhZTAnIBOg80AEmUnIz1Mq7htrG2b2pcFPnZmwzDBC1VdrVPj5cERh5EbudYMoqSzQcG/hq1sDMtUWeduKE1FzTnRaA45M/EosIxGu+DgPXFTcoNJQXamEZqQ1wEoyzoKiOXptfCQsVG1G6FduIM0q7VM3rQ6X6d67CyrpGmCTYcyeqvDGdni0snjZMboZVJQi1UWzfocxIiygzDqk8ljSdCfYKaxKgCs3eMCYtsoWU2EQTMrtV0jk+kF4faMprZFoBeL2pi4qm5Z/GR5aWQ4/oYmXM5la8eMWywjrXu9ZcnQPpcQidxXz4Mg+max7/L0EQNR80izVMFx9DbQjDo4400tz/R/LkImK4DF4eqgW652XXzQxc1imbq42Q0P7t19ePpoN+ZatqJnQ1prGicPm7qRvB5tzqUM2z5PTx0cvvLsM7/6wQ9+6uZTT0cfKgbK0C3KcvkojW/dv/v1H/34az/80et3793eDMUaH7tY8bAPvuKmJsqgoLrSRK6MES3Hj5P8IHYdGCwpx7iIIaZp8iHWmp3ZG5IBX6YaGVIC9h8jP2HJiiKyNCmVaLxOx3dAel1mumViUUGp7Z0P9bcBe8DR3eotW1fQopFSjWXQSFiCnHhLLc+lWDTB+1Rxb3HclJGloryNQnOpUP9/jvTOjAmI7SxCJuetWLMbFIMOPg+oBfQxlJIpGZj8TEIomJ1Mt23J2TobwsLXjidY51LKJM+pwIydvLyNFAW42Y0bAFws19GHVDI1qoWj/UrJu91gKPQCakeRg488N5zSOI5T6GMMwRY7pTGXiUj/ATNMZUzTaEy+ErsPn5z88vMv/MrzL3z45s1r61XY7tw0BudyDO9O6Rvv3v7Sa2/8vz/50dsPH44h2NUqxEgLs6IMWaYltNlQ/QZySQBl2fXXrpxcPTk5WK5iKYfT7iSVxZSH84vH56ebPI0VyPrJ1/arFEjWZjSJxUUVtEIx0nPRPrg+zZRFRq06zdxAuLFMsJ2TZDjlCUxxxqx8WAXfk680sCUwYzBgPoVMeLkGNwgrTlSuYY/a1aDsv+hOVSIylROVCCh4rb/A69UB1p3a1jwSZmCTbUJozbhKpOY8qaO6CWxPwfNBJ4WM6dqWbzm2eC4iynWiKZelsOwyQUgwQsVha31gAxBriuhTeDAL2NyjvDghUiorGDWOeK8Q17bRh9KMZVaL6mlkJQEFZ99fs+/lpXJfTY4Q5+QGgd+z71Xfrj09lLWL9ZFhwyWcbQwJ5snQUJIjhNulIijbJNF2rmVN7qsk35YQb5lg9v9x9SbcklxHetiNuLlU1du6gQaIBgiAy5CiNaPxjOQzOtbx37csy9bxeOZwNu4kdvTy1loy743QyYgvblaTGpFA91uqsjJvRHzxLdrCGGtjq0PHfSaxcu+nGn6jFBs0Cl9swfbULE6aM1nUZWp9n57LkFqsgkLma5ZXDlYEsOwIDfg16GAI1iXsSOE78ZTNikQi+5dBaUztQgFu4TM/T4oOLZIW3YjXUWtZY+Z9JYx341E34lh8s5zp2j0RaLxrqdjvZ5vUTkkfy3QSsku6jCBddlFSo7Qpi7Y4E3a7Bpcsq8XnGu7DahOwQdOd7T16ExCz1bqlHouOpV5mury46i5vymZ47PLDOE7jeBB5c/vm9atXd4+PZpbUd11Oa5cSzQd04TZQEs3zXI+nC5l/cn31H3/8k7/72U//w8c//HjcDMcnnovkfNrsHof+N2/f/o/f/Oa//+ZX//D7P3192B+WKT3nZVyyBEKEGSSPUZNSlkIo0prC1NKZbCXJy/tz4jTVKl3HS/HGeEBd33myv4RHultz+vFtm4wMRiKbDtj3Idbem/7IzqZUzRXEfTTY+SPi3TVEfR61uFyhyimACzaTZzajqSohb1AwAJwOkKUuc1G1IAebY9XEuhazT1KXozjD6M3hN7cSihBRDqaNn9Js4mn7THI39F3nMVWdWGpC1eqi83Ecum70manMVVLNSxcyV02bfmsD7jI/Hw9PZZ582DSaOiG10N6RSp2mZSDuxk3mPE+nanYTNdV5mlOd+lQ/yv3f/vRHf/eTv/hPP/2Lv3r58kZkczxxnYVp3l58PZe//9Mf/9u//eq//+rXv3r79r7LvNmM/YiwHXHLgOSDbo0gPU+2LHXKiS4vdi/ef/Hi/fe2udtO03WpF6V2x9Pp/vbx4fGx1lOmmrnYDDHXNHtSryco2KFeTU9prhouw3WCx/ItPssY+uLbInx03rmbG7ao1iw0ZtrmPFiYohcBrITjrCDimvz2YtOWStOaJGQUgjwnsepze2aJ5aRbkhO4dVF4KMygKQA7qEgSndGe3Ys/1rcaEV3oBFi55QIpRl37OwqCrN9z5AR7oyO41wfUvjny/Q3+WcnSJuWXJjOLjT3BZdntm3CEneGgnsfUKjC0qD602naF8V4kUG3Ty9i8J6ATc8ugSY2zra0EN8lLG6isVYGBvY1NIBQEmAoHTtMBQ2K+fBmgq3MzTk41NgXNY/pMcbym9cP8OLVPe20N0sqFij144sa8AnYvkZGU0EFBE02A4FPkA68LcQlkv22hw1MsWE+N0ETUNsjBX7LdCBVZLUea0XTSlQGAF52XuwpGbY2iHUBEaJLTuQUtlknOp4YdCkp7hD65jSA5kc3fhnC4f4ZUyYKzERUk+OhQXKGAolC5cUAj0Bp5CGdmYTqJ7Gs9VVEbbtiosdFa+rlk7Sco3MKxKHAHLvOqWE7xpdBafHkW7Sl19lz2RC18KVPqi1yoPtsM4/XNtLt66vunjqdxPDI9HY/ffv/d27e30zRTTn3ukjdCwV0P0RTgCW9E5nmajtMF6Y8udv/bZ5/+l5//7C8/+fSD7WaYpnQ8dDnnze4tpS/n+Z+++eb/+dVv//4Pv/3dd9/dlmlOfR5G7u3dpux9m4ln7QYVNO9iqPTyfOeuH0fCLbOMc7UUABURxsGmt64WM8sGOaptLzh3Vpdjz2oFustGbK/KvWmXvfr5baaWmmAWmw4d+0rVl7W2wlomKUkWVr8MU2LKKYNsaqVsJmm2N9blKa1+CubE3HViNNZAqkm0uM8OjoZqUxlzqtR1joG7dWVe5p/l+ix1kbmXWnM3cO5zx/24Ma9KPh2nUmbO3HeDJO27IXdLESzzxMuYvty4w9CVMiXX1S9zXVmGS696AicvqUvlMw2Y7k9P03zadAN3uRSd5nmaj6meOOl7nD/74MO//uFn/+UXP//bTz79bDs8o0SHqUxFNsPUDd+f9v/89Vf/57/+2//9+z/86v7hPlEelsLro/kaxa9NhYPVXTUnZREZ+/7Z9fWHH35wvdtuko5TvVC9nMvwtD+8fXt7PD6m5Yp7IZyqFlranMkMnKtlZjjDuRhIVihVAL7w1HGJjMQZFUMRwLQq5ikplbT2Oe1yv8uZzfOy6XgcXrQnxAwSlMOuEosEuDmqL82cd6+yrrvgjSVBBYGoook7aa0nQfz1vNamPWGbesXD/tIZDptS/Djbc1u76ZowjnrQUpWUI+JOm+Vfw/2aYhdqzuxnPDTqS3+O9bOkdWmJDtqVRlbu3F4LSdFuj9a0qhAUB6+b2gSsKRyE4ZMV5k6U/mz8bcNVRBK3yIW0rmHP1r9nAmnXYfkz4fuGcXdDKShtZhEP3yRPbV2KolFamCLaVmNv2eZoX1dD2xNxzW766CXL52/jvToHBSXKGdF+yGuTh3ltyu4QyS0XPnjbCYrGZKQVPlNRO7mu6kolRFPoa1ln32CZ3xyizEZBcswmTprCZFhJslnUinqqTNwby820XBlBCod3K5XDG5MZOdFeU5Pvbt0GxUO0pGEfyTeUbXdAoLaJKzT9AmffiBiGzmQLJQ+nSAj9YURfWxABYfb2DTr7TWVxNXuVY9FJ/APNFuaQXXiP1iDYjeyogUJ5RV54xCw7ViMtr8HAw7OlSuTlT1KXtBcaU7rO+Wa3S5eX97uL+9xPfS59fqrz67e3r9+8fnram5RWmQcEELlxsLbNf6RDWqBsmct8Og0pfXZz9Z8//+H/8ZPP/+blJx9sdoM54yWyFKBufFXKL9+8+R9ffPXffv2bf/7qq++f7va12Kq264aNvW3u2MlVFkUuzVOUhnGZ5IybTF3fL5XGANBSZvBY2KMNLIcg2zzsAVvm3CuyTNjLJz1X7rI1mJ0/VgqXONjxmaOcJ9PQ8lETBQ2nmqaeIRu3FZqEPsT4WujlHLk0FjTNtbjuTWu4otnvE02dQe7LJO07w0xVa06GU6fU2d7a+JPLcFwtd4eUl4l3GMl0Vpy7UuakqRgRevmjbui6wQZ/KaWIzPNcmHnsB6sN3k/UvsvHw9N0OpU6933nJ5c7ppdSuszzXKd5qnWy9oHKNEk5ppTGlD68uPrrzz/733/2s7/96OVfvXjx0Wakuco0z0Kpp0Lp9f7w919+8V9/9/v/+sc//fbubi/aD303jil3nqjYTJvRfwdmt7yGZbSeifJ2t3vx3vMPn99cDn1XpC/1SvTqeKKHh/vHp9vpdIpInFnJqqxNvcs/LD9udiPJ5V5dzv5iFbeGzscZrV4wpSUCtcK1HIXVhu/lYe+ILrq849wR2gZaC7UhLgrqZDF2ntmTgVqgK6xmEjcsbOOv4F2V+XxH6QxqpxZ2MUIi/JvebRQYFsY2M7eFYqTiLI+CuwlSCGORzgVnZwTfSAylBK6OUbtIWHXVHsXgDostjlQFNJO4diGXbeinBlEShlzIzknNeGFNXpcQ6kK8lWA2AWg/Iu0U0asWsrMaanpzwmveAqgzMfY5qgl+hQ+ERZvsN95A8NcybS5vqLKgRaPYzFEjL9sxYMle9gYJ6a2CLNpQDQXcv26czX9LPNEHMLazjPElOaKPQmDNNSEmkEMCHQNsC0uiJokKWVdLhAhxF9hstrVuIISnUrnlBaA9zW0NG7CBDRIaZpfBF4L5vPcw4euRYmGiTkBQqYEz4u0BatD1BaKXFNDL8GLRYAUFDdI00sqczt6XO0M7wd41UG7WQdZwOsdbwi8Tx4xb2Th65UH97vHxWOtBUvGdQzY3xka5xgfpj4j7hhuIRNXal+xkPFeNd86aNkorkXaJbWcslu7AnZJ5bKUupZHzs832crctm83tsLkbhzoOk8rD/un129u3d68Pxykpd31n0QQrjtLU1kFfZM3MmsrpWE7HXtKHNxf/66c//LvPPv+PLz/62fNnz/re3Dkqdblwt0/1+/3+X7779u+/+PIfv/r2X7759qu7u71OaXnxA/cdL1Vkqfi+47S2JNuqerS7TFyqZF4CybBfyR0nMxlyy+WwJrd+cJkAZGknKPus7T5Z4geXRpacM46DEZeNpg0B4PLeq5hoWAQIW8Iqzs5xr7uGbTHakjU/TqztryZdWequJSZ4e+u2RpZI6ZoT42dEnpx75nHKRTQP/WbY5q6335Yyd3M5uWSFch6Hse8Hj9upgmiCnKlWWUZkkax6nA/L35Tqba+bS3PmaZrsYRBDW6XWeZ7nWjwZaHl9L/rNLz55+bcffvSff/Sjv/7khx9fXW6ZuVSZZ8uv7B+k/Obu7h+++/b/+u3v/v8vv/rm4f4oKW1GHselJ60VTKa2AozlnMI9MkkpqnW72T5/fvPB8+cXu+2QaCz1YjrdlDkfjo/3+9vD4VTn5Wu5m8k9lhP8NOxEq9aTFrGp1123hG3L62ZGSchZbhaFeDakukOPc11LWa5fsm51Y0yr0XxGrcfyNZlbVZlHtOHmVq1sBeoZCcG3QuJI5N+Z8R9yeIy3RbA7jbNBkWoQBOM4TdtyHD8Xt2uCpbIBAE6HxrkDA/wS+cTerzuA5zMtRlMHLHmdCe1k8THVTUL8MrmXB/ty3j0LJFRRS4svYQAJoV5Lw3MiLPHZ3OnzHbuEPeQ6LCGu0XCgWiGCJtapEPsY0I0UPoWw1xT0gKz9lOIzgUfAwWFoluJM1gZbh2fTcoU2F9cM+gWWyGwgqLjs6wzg5hRjW/PIdhJITPEAMc7GFniMeage5l5tCUY+AVttZuRTRGZFG+Md94gpuG28A3lOIW6Fis5VYa0eBwgUXuSh+rLnxVIB3YoyoHRDT6wqog1URIIkCgu2iA72j8yHSwmKXNQMX2i0iZ/RsYUPGK2ObfqOD0nsfZuAmvBRS4A8CQoZhUrLvlhy08ol2H4wekqnisMFWitIF8R5SrIvcghGBhN1uQtCO9w+4WOjDgqLLzH955NYPK4ZlLLFr9vwnUytpGaqZWEPcLhMnWivOlC63Gyvdpd5HI/9cD8OD8NYh/5QD3f392/e3D08Pk3zibl3CTOlVZyPxwq+rva7O3JLLD0ccpnf22x+9P6Lv/z80//0o8//8sMPP970V6I6l1J5zjnvNk9avnt8/MPrN7/88ov/7w+//9fvXn3x8HhXZ0usyEPXm1uy8+Ny342WCrH8Z56mzP1yqJViTsR5KR+knSG9pVQPl/V7uFZjHFu9JABC1u6x7/JsDl4Oiy4c1PDJW/BgdoqanzgeI2jDoqS8TLEWHSi1Ot262pxq4cRllirL60l+HulS4apwn00BYhYiy4vJVs7cBpHDeytZlrHxUbu+X0qvkcUsi6GKdEylzn6C9ib70qqn6Zgzz7UOw5BzV5WGrp/LqVilnE+HOk+Ny1mqSartNRmRt8611HlKSTeUP7jY/PT6+q9/9NnffPr5zz/4wcvry2f9pjvNPE89EQ3dPtE38/xPr179v7//wz9+8cXvv3v1ar+f+5y227xM1T4wznGzK2BbDJtwirL0gtr33c3l1Yv3nz2/ut72fXecd6Vcz/Ng3loPD4+H42GSWjhXpqq1aEOYjcls063xqpKtYFPxtsvWmNUNMPyxT4bwe+FPEjYBVk8svtdes7DKyLzr88Z2+IZEaIqVmaB95+Xeg0liWieEOPUTNclmODu2ELBIS0QxxpeagbhQ7P1bUQjTySYC9b2o+eU3okasmtlPogQ5TGpeTIQkJa8aWr2r9BRXHHUONHLoOwiQLtDZ7HbOWD56CETCXAulGhSxzl1EBkyITsNdA2kFHKB522aHL7WG6a9b9kS8hL3BjHYgrf6jcPcgRAW/MzZFBAOAY/wFWF0g7wZYGuYSdsKPu5vIiAIyRhoHr1cTBWOAo3JHTlWc0Qh2WFnZsWuHWWUM614fz9zV1moeBkFemtfMpUAdGgyN1guzuYDchwb/LL8oEICWIyIRrajBoksOcnJWV1ZQuEpGgxJhWH4r5yB2BYUh4bPwHiJlz71OKLEa6ikYegdFPd4ygSwd7TFoVJlCeexXV5EZQRIVOgFbgITYPzB7s4j9xzbEXBnFFb1uWRzqGfP6cqynEO1L3YsUe5i65TB3KBQy5UZd83RhSsVy1dlIW9VPCnNO8oDhpdp0hk731jdm4t6wTbPlWg6kXmRbdcfd7uJiuLySYdjntB+Gw2Yz5X4/n97eLv/vaf8012JRCR3E96AvpvXVMfQBTF0lKlKn6UTT6ULrx7vdLz755G8+/9FfffrZX7z/4fs9j4d9VyYiqrkrw/Y4DN8cD7/69ut/+uKLX371xb99+eWXb+7utEzJQPRsjsPMvWck0VKZLEnZh1h2jpUPvsuoR2Bxeb9lMKDdRJZJLM7vPju9TM9p9DZ8wsZ3Y7J5CKcayICmA3QGhnPiaioWVxCkGs4+Zdr6GZEMLn0Qxy0rwy/NHgHOxtJCKLuJoMzDsst91/UGuZt81OoZ5wwXKCMN2NK0YndoC6auH8ehr1LnWrNF5B9Oe4t1T1LLXKZatGqZl9JbUjGgNdWLRJ9cXf/4Bx/+4uUn//7TT3/28cc/vLy8ljLOc1+XRkG6fu7H11V/9fr1L7/88h//8Id//vKrLx/v7yjVYeyGsc+dyVuk5SIjvMCY20AGlze/TNm2b+GL7ea995+/d/P8YrvtS9lNx6t53lRKx9Ph8WH/+PhUyom5ZvY8pbpcassNTKblWwZgNmWrIcDm+26KW45cP2grKjBeQgiOphb2XY0iYER3yklH1l3XD5Zq6WTsZtoMMau1SYJYOkG4r0BT5Dbf5mNgevQ4XCKSwpBNH5FAooU/hUan7rXBOSgxYbjAMQYvO+mdJhdKHWcKealylT00FRoxgB7W2QSmGJOQ+gAXi5Y67BYaKFfuK0OePCDOK/QoBBQVSavgJPaS3rEyr5FP2hBhkMN0hdFTZDG6aZTX9GDcuFTVyr1RNVqetxGrqe2y4evXBLPg+Bhs1cjn8Ve+VnKYO3hKKnDrtx2wxoXRMx5RE2Kn0LJaP8SIl5V2WSMcAUO0PwxRMlI0D2g/VhQcmiDYMQf+kdhvNDvR/KBp1PEmwKJYx6qegbQgbIElsKqqz4hZ5GZ9vnj2CVcIbiMSrZ8nnHqirrb9cyyVXQ+NBgyOL/YbWVNRyis5wehUAuCbY8ZtLrzW0SK9SFdqWg4iwArWiDul+SVwYMQi1LXJ1yKOCXY0frUYzDdxBjXB5tCfSF8emBUW6THp01yOGkbUS8VeioPdvctjUKvTYZPXg+Q8Li1OzjY3Es5wX1pu4842wb4k7oitJKubSzvM2yUaq+ySXHbDZreTy+tTP+77fOxz6YcjpcM03z7cvrl7u3/cz8uI2ZmMmJpksWEf5HpuO15cAL2MO6WeTlMu9b0uf35z+dcff/y3n//433300Q9urq/7figlnY4s0g2DjP2DptelfPn09G/ffPuvX371m++++fr27fe3t29s/6ep42GgnDvKfc4m8rXibH1Ox725bSXX2PgqRbXORhpADvxyvbK7DFSzW1OODtSKZO+5piKZ3JLHpjfjitnNWq1qVhXxyH3LMHafyGQZguzxMw53uiczZUv4cic1LUzZrSWrAUCW7VjFMqeYl7E3585xITPkqvaosJHAPShruSm7bM7/tS6fhqHxpqaep3I6lVMtlnywVJdatMgsUuaUypDSReIX19cvb57/+MMPf/7Dj//dRy8/u7r8YBieM2+qlHlS7tI4zH13e5y/uXv7q2+//fvf/+GXX3/z29u7V2ay1Y9D33XOlWirXQnWr6a2x/KBQ+ZaZBLueLvZPL+5fv/5exfjsKE0znUjuqk6Tie6v90/PT3M84PobPo3IZkt1WL2tN1knlbqCxjxBWExyaqQX2xMZtVcgCIOB1vGRO3l+VFTzaN7+YaB89YA585zH8P3SRMXCm5ICqaRJ/045iwR/wxykLubITZPUEcbBRa0UoCVghVvPDcxcQWpKNxVl78vhEClMLgSSeGMHGUgIglUvES76hZ1MlioxDkV4whxJN64xMQSI8DfZUYjiggEBzNTY4YmLHlSBN01b6wGcFLjcDHp2ZENHSlrhhskNQ7zO4n3os1P0rUJHjEryE8WM+9IYNXG0YMaqPG9qZGsjUDt7vtOv2ueJi3o1++R8eIaIhpyYxqsqQXv118/QvqSeRekxsT1F9zcSzyqxdtBL8YC8zBHieFQ4T2h6zecAs8rjTmBm9p8NDkQAK/l0vYcIAFHmkZQtFr0BHyhdbXawv9Qm13jtVAwHSjqKbkTaRz2ejbEBIaxwu7B1zfea9NYq29NRNgyfSP+maix7wDwE+BpOvMSDQMytPYpKCRwGiOYf/jKP9Hq0upwt/pAxoJ+j5sRXILVqEPuHI2hUDqo7JfxyszzYNzRZQp/bmOCLf2/ItCYwys4uhDpAOgs7QKn1PnPz8yJuiSWgSjd0mMs9bs3yNrkxbqjdNMP24udXFzsh91j1x86rv1yGD0cjm/u7m/v7p6e9uZ0QRa6mNMaihXtMA4WP5uSB0IsY9gsdS4s8nwcfvz+87/66IP/8PLlv//oo09vri+6sTcHNNI5WaiA5H7P8t3p9Mf7x9+8uf3X71/92zdf/en1229u3x5Op5rUeL05d132IMacmRwnNsS67631Ehv32bL8KhmqUEU8Lj4e32wsmKVSW2sD0ooZSlcKCZnPmtbbLBfccgdskS+OITu2yGJ+VZbpu1TBnA07s1GIvOeEuGkZ5oiWibfrlsvf94NI6pimpViSy5rrMrh3g/tmLAVYTZtamNM8T2azvBTaUqfT8ViXwms8JHcmNmn4puvf31z98MX7f/Hyw//lo49/9sF7P7q+ebm7fNZ1XIqUYmEgWXIuIo+n6auH+3/69pt/+Orrf/z6m1+/fvN6Lpqocy+xrvMVsrRDTFNDz+zRKc0gaS6z1uVh2I3b58+evXdzdXWx2STqZ+mlbku9mue8P+yfHm73p8dUCnkUGltZ1ZJQbo0eQe5jVUgtptesl4mrRUP5eVIxDsDNqnq9AkvI6c/LYWpireWTIaoDdRddHj2CRnDqhX+j/fAEsEsEXAFpBB+b2OwBtl576QNqHG14RusKszAWawlZgz4QKoccJsgLulJWFZCdmhcqFmuhosVlD70s0vHOhrUUDGKbg9IZ3ZygNYAWz1xPUN2X2y0x9rhtGafI8ES8k5WcppaJbSReQmhLPI0fdKQwBKaIqG/FQFZOUEL2krcOsWJl4OIBA4TshlocM507XuHSUCT/Ba9L1ygEt7IAMmG2K0th95TBzcWNG9jZz5bciFLUcqdAerbzVrK9eLfxdIKWNBkwlpJGdw7GW1zUbJBCE0pH0lWjhq3hDO/UIcMCCKoyW6zBJNXvbfalvTanZuiJzqlga2pjgiYAAFUjNWNe19ikJji4hMOUPYpOck0Rw3UmtTbCmpOiw/8lYIm4yQModlKETabc7DAaBE0RohZGbMwpdE8USQL2YnOMguG2CFPTMNGTRhdHVC+0WpVTc05RpxZbi7yMp2qy9kl1X+pRXCYtxLm3aAcJ/n4+c4BBnDfDDwRiaE/gS9IJnJg5IW2ps4fcSFvOnebOOuKcNEvqEm/7fDOOV5tNGofHcXPbbQ9jP3d8SvXx6fH29u7t3cPhuLctLTGblJhaHjXR2vl6TpnTF7P15SKlzNOcpjmTXI2blzfPfv6DD//qo5c///DFT59df7K92BnhQ6pZFPVZczeLHrXe1/LV/cPv7m5//d3r37169ae7t9/c3r9+etpPpwkkG15Kce4SsOu8XLfMUHiaXpGXxiPM2w0pcGNMEHRVOLP7WTgpTDBy2LDhEWCeM+R/yG5wrdli9z0SGqdu1bg3zSpNCgVjq1vG+Jz70cXRRtJFK66WEWWAI1exjac7EZdi+bN1+UeZ6jRZPZk1jnpK6YKHF5cXHz27+fT65sfvv/jJBx/89P33Pn32/L3dZpv7kZikaClgsTCfVL49PP367f2/fv/qH7/4+pfffPP1/d3D8TirUpe7zUjd4LQatKrSWEJw4tV4bJWX0mayrJKJNtvds5vLZ9fX19vLIeehyqbMN9N0M808H+/3+7f7477Ms23Xi7UpZfkByYVD1SlQzrGSVBDNCzMNjcdVgyvpwb0CdpE2A+BmVutEM1v40EBp06UN5c6vbMMWEwZTAf/H4yBQaBprz7luSOZL1RL7m7WwcbOAQ0Zvrbly0JpT2J5FMIyECtIbfNa2zwS4YFNRMO/FaSchXknVlh0pyoxp18i2UiaSMl8EljOArnkpx9TppZNqpDB47Do2aTEiLtXaxXwBtKak70w4oFURhEZ0lo0XM32k2KWmh4VQpQX0KDgy3ucRDBEwaKpLqYNNllba7+r6uOYEnOlu7U9qoNBNZuUF25Znts2hwXbAyMMLYW2KI1tCqyac1lyBKGHN6slRWca9IutQlFqvyiuRqnVLbdMqEgRlFMxWTRLW2ilMi80hTDWERiABrPyAtOZPREcWQcKIOsDF85xj+8kuxhe3BdV4gRjvjaXqzm1+KHBAHQRuNgH+9xYjJmZLDDToJR4TwlniSauxjAiVGTr71jlq20kTGgugbr6LD3P1BO9KPksYcVNs67gRRM3wYYF+Lzf6F0ERyKEQVKbC6VT1KDL5fW24ejbBUgoxrNdxMPud9M8YxH0j5TCVZ3ZnVY8/6Gwz7UkP2T22OFnMwzJB5pR6rb3U5agaNhfbi+04cj/s+/wwbB6HcRqHo9T9/v72/vb+7u5wnC2lwAuxOTAydG+yRqhQmOH5aqdzDv8y5U+zHo9dLdsuv3d5+cnz9378wQe/ePnyFx999MnV7r2cr+31SE2zSW3LONaun1ifynx/PL09PH37ePenN2+/fP32j6/ffP9w/+rpeHuc9nU+GdMIbVDX90u9zZbBwG7waTFX1lYuEzRQmMzZWVqm+DMilfmXdTn7wFLq3FtMoa85VyNYTwTxIVhje2+TtaoUsVuzGnaVKYfOeLlpq+uPaF4K6vI1SzGy7qzWYkF+vgarTjzYEl+N/fPN8GKz/ejZ1Sfvvfjk/fc/vrn5wdWzFxeXz7bbi3EcE+cyd/OcjejPlOekj6qv6/Tl0/FX3333L998+9vvvv/i9evv7x8ey1S6joYtdT3nCMyCpYnzs40stHq7+jRhyLxRsJNWZt7tdtfXVzfXVxe7y5FzP5fdfHo267bMOs+Hw+GwfzxMp5PInLmY3MJxdklpFqmcKgQbZFRnNcCZSuBbIstUoaDFarOf9wNbgpyD1C9EGznRainTA/NFzltLwrSDZmVOifvyB6EWAlxzp5Mgh2IQgI1eBETYieuFRRljnYBADPG3MQ20nQqpbfqoCXgawwO/pXELouZ5J5c9FsgtDKIJ4dQMPZDemxB0505rCf8KOuyKmjJ7j0xAe520VQHXctSNcPgNs2V48a5dAiaoACvb6OXHt6zkzfgnbRYzbYPtRtKQSpFgRc3tIsF3DDRWeYcQunpPpndEUSvtCImHsZtuJTu7r+Pys7bbG0N5A1LVlczGkbSvZ2UUe2pqK2NdrScQWITESCSeNunNn+HMIXC2f68hY6OGabR2Jpw3oiZGOjNFZQsFVKyCmu6noSy4UgKCsEqMsG5+HT5Z2GLH6s5tn43J6q2MoikCzk9rsH/rfBjyoHjhmlb2gksH/N8YyQygAZrJxzrGBYXZuw1XiTLFO8QASprBBvQgB7wFD2ww8kLiWOhz60gjYR32NGHKEm0jXDDsGaFJ9Fjq0Vz/nZyVDVKGHstuR8ZDHCJ2G3bJsvdstl7uk86jIxJnlc7AFGLqkzt5heO0wcrZ+oilbAkNtW6TbnO3ubzMuwsdh5J5yt1x3OyH4cj6eHi6vXu4vb3b7/elFPJqhgV3BFmnZiUOLQFaZzQfbIeXzKXMp4mqbLReZ/rw8vLz99776Ycffv7ixafvf/Dxzc2LzXajMtbayeQKQWGuXZ67fs55yt2h1Nf74/dPD6/u776/vfvu7u77h7tX93dvHvb3h9PDYf84T8eUip/ycXSYNUhOvEzO/glm7mAYzfACIV/UkzYjGs+OiWkLIrXVdQMeWrijK1gEoqKziuXa2VhU3SdRGleTDT3OKe0SXQ+by8347GL3/s31i6vrl9fPXlxfvbi6/ujZ8+eX2+ebYWTa1NSr9qV0krK5PdfEc5+nrnuq8t3h+OXt7Z/evPrT969++/23f3z16tvHp/tSD9xJ3+W+77quYxgALC9JPAFew9nfMXnDWiXYLh7uaFTqruuuri5uri+vL28uLra9ps08bedyUamvVY8HfXo6HJ72x+lI6cQklG20taHU4OJixKXZbotqF6jYnFJdPw0rxoBxly+GNa6E+nR9EHwfYLOrsb2rA6QD0a7LWLC74b+mykDZKtQ9zsaJvslQNIUZlT3M5G5+pm+i5h6z3L0Fp3PoM9i2iD61qWRQNBtWiuWrYq/rnGycXtiPNtIPCLl+fjfcHxEBIH8GW0uSZNdgJmSbk6IsIngmtD7iEfAJChMO8DFYy5jPkda7biIBe4YlP7XVOl5q4NKSQrsRLkbBEUixsAxGsAIVP5uX+WxxTPBIDMPtRly2T4XTuz3hOm9Tq1LN7bFGu9DWEqmZS9L24sZKIRlIhV1E5EmlM9Or0Eqboz14x3Arax1Gc+RyzFRIzy5BYwDbnOlJSgoqHEL/oXtDjKVpuIxqXuCD4f2E28aDat3ul1YKgwN9/g/U3LoTkhrDJbLhQAQrZE/9q6Bbu8taux8RItQI15haY4FsH4tRrzCPQnkHNGbt2gTf3uTOZ/5bsWZIobGzZ9YAbORIoK+JSDOkJbkkLphewMwRu+1+E6TRQxh5CiMvvhpUAnOfhrYsM1dKR9HjXCfVefnsOyKLYo/FfIS2+QLKBzhbT2A4F9h6nKUt5eQ62WTTqIPkxp0mzcpeA7L9Jm9esshO5arni3Hsdxfz9nIat6fMxz6f+v6Q9DiX+4eHu/vbu6en0+Egqp3pggjJfzEWhqmrNKohkAqnjjiTi6TKXGWeZqnToPos5/c3m5fLiPz8J++///kHLz64vnxvd3Gz2+04D0RcZipzKmWp/l3mrlfiktNE+VHSk5anuT6U6f5wun06vNk/vnl4vH16ut8f7w/7/fHwdDrtp+NpnqapnJa5s05Sq4nYTdPaYCzML8FthLva2nCnZhuPT8Z9TLPj/yn3TEvNy3no++0wbPtxOw4X43C93V7udlfbi+eXu/cur55fXTwbx5thuOqHiy5vE+2YBym5Vq4eCl+MaDdQ7pcWJPHjVO+O+zeP+6/f3v7x7fe/++7VF2/ffvn0+Oo03Us9LXdN7vvBZF7OyJYaLEarG5Wa+DQ1cSXEozbsqgl3auY0jJvLi4tnNzc3l5fbLg+kQ5Gx6iAyznN32JeHp9PxeD+fTkqzC9jttveMhApbhKVmzkuPStUtsaydrPBDJFHEDbmEntxqA4zJZjvwZzibmJ9VdYXBSEazotSrixmRtO+grqtdvAD73KtRBSSkJ/ZLMvilJoVqKKy9WJe5aYghUgQSCQwZzzRFEQ2HNE09I+9G/KmuDJro89sT0oYy6B5T07XW5BajFOztKG0MAwY76sjEVXCSCN1G6FCwpMa+jomqQ6++IQ3erjs/LQUiw18Tlh2N/YROKJipFPomDQP4mPbtGZdVNavUuFztXXohoNgGsrcb/m5Ym2fX2cN3thEGdOrAbnhmcGq1meHlDRLW5Y0XFYFRqrQ5AeHzcCXCAOipC3Yjsu+BGHS5hIhV7KCbUUZC/tnyjRwTOXs0RIjLctMs41NXh1mpAR7hlu2Ft7aMwwSnPQ3YW+N0DU/w1RaMQpidgg5uGQa+clj67ZwjqnBd8wosplKkMCU6u94uGFsevmyeCwDaK1FYSgWG4CYMMDuPj9JZ/WuDRI1V1tYIFBunRI1jiASuWMaKWy20GR4uHOhB0RIxHl7JYbPhhE2Ke5Ndud+wdYvw9F2lqE6a9iIT7DvcLcNQw2h+1oSjaM0MoZDVFQS7DeNI2+eZUZUpWyozu5GWfUBLzeDUGXXSUwQ9tnkgvmJ63g/b3a5eXD6N26d+OC2TKM2sT7U+HI73t/cPD/eH03Gaq1ZZXmrOBLdnb85tDLBlgsQ9RtwI7O6uxr6XsLVsqcX8G7R2lK667sVu9/L64rPr68+e3Xz+/Pln7z/7wcXl5bAZu955WTkcamxlVt1CjtxOzAjJxQLAS0onlX2t+1IOpRzmaT/N+1qPpTweT09lmk7TcZ4PczlM09IW1OIiJKluLUk+UGSjT3UddZz7rt90/ZDzduy3Q7/t+sux3+ZhO/QXwzDav+76ftd1I9NgQYbLZajL7ObeSNUtDo3b7lCQ+xtb8IDOpTycTt893v/x7d0f377949v7P97e/+nh4fvD8bGUasE3OVPXZSPyde021ZCQkFa0wKnFERi9AywHBxCLlOpy+j73m+325ury5uriYre97Pqu1D6lscqm1M104qWTOTweDk/zPNlm0d9AMYS9Wt0N5S65ileamsi5kylbZo7vEtmjDpUjzcNWT+6YbQOpF0inPqohzcvca2NfGnLesAPOaWkaBEZFCq8Jd17uhJreCARoiRogUBjBq8IdtcRzDBSBLEiYaYJjIMjaKKzazt9Gcm5gtItlKNJ23LIWkYbAJrXtbvFzkEkQbNeEUt/GBZ+ZQIm0/C8Qp4AMUDCd/HJisyrLjGA0M3GBrwUckeXALyXM4Eq8tsClE+wjmsJ5HRZDEM3akOcIe1lbDkqr/YKeEb9TMzbB4c9tq2zb96Aw47tlXVXi15/VmYS4yEZHezeENyIASGlzcYN5E74n0uzKUtiFmbZjaVMjVLbJh9BOhY1WHGFRebStLdZOndaWIfq5IAi05WorlI1UEwi3R6sC9nGfsyjCDe7nENzGH0KAzQ3HYxENtZ47clHkoeIGkwjLDfdMx3jXLAsPbqwwHnc8uHrvqchhWkfwszeSov+Q2CLZc0206qrOzNsoGhIsqm2WdYDYX4xGBFdud1rYmuL90VnOEpai633mgjFuHYU9N6YskgjAMhdMN1XlfNT6VORkpBXCn5nAF95y7kAOhXtI2n1R7w0BKAA5dILOFc52a7lxe6ee7UecpPevtH7Boogpq2aRrNJxt+nH66G/3Ax9P87j8DiMD8O4z31ZBnc51vn+8fHu8WH/dNjvD3We7HFw882ENuUdqMSRr/N0NkAT1oiwMAznYABVSipzEu0y77r+ejM83118cHX9g6vrl8+uXl5dvtjtXuy2L7a762G86LstUwfgSal6YV/avaUWSYMtbA5gtkPJKea2ZBfE0Ai8sCoowXx2cBgP21cVHJlnIOh5Q1RNReZIlsvdw01/DV2wPOM56SRyX8rd8fTmcHj1tH/9uP/6/v7r+7tvHx5fPezfHPZPp8NR5moGvcRd6vul/uf1VnKhVJjTafICBh6q0nocgn1jYXtVanLrsS7n7Wa8vLq8vLi4utht+3Eg6lW2U7ms9bKUbjrNx+n26enpdDyZo6NhBlTZvTKMmWUXzWLwTVllLP6atBivyiOJ1CPQUfcJ4LM2TAkcJr9jpBFSzefTsPOqtZpshTfUbZgHWPytckhfmPnhJVh8NXtn8+n3g6AxoWy966Z1duZpBNNiqFPgtvDYNVa8rrpdJ2YzSMLSdDrnh65jKOI50LyaMlBTE1j+pJHDiBrd10sQhws1u/qjaYZ8oepSmBDLMKqFtVVZGn0kCawNrQBTVQrTSw1vxXQ2e5xpeFJDHZp/As5v56wZyHmmWDzfRnoIld+mGr7NYEOLo58aWKwrDWX1hXjnP7BBBLQdZpRR4QkT5hm7Lc6Z7IbEeL3jxTOfqZtJd3uXEeojJhWxLSWeVWuUU2i07FIzR2BC8HFc+sDcBl2KfMSg/qbgWeOmSee0L9h7pUaUzrDqDLjZLx6Ru1a121fpbCW+mmQG3895DoRNcITaA5dd+i9tPiZBXW+G5M7mecevqyG75o7iHpnSXLqD5K9nZ01buK6oeIrkY/wxt4EYfljB6A6h9rouAfWdgqLhbWNKbR0QpX11cG2/3LZdZh4J6xqNSdZ9hp2GSi5hUlEGhssl6VOpRzHUzlj1JsUhb2bOt8MucvcRP1gPfhdBfZ8TXEHY0sU8zmEpkcrmuiVGmRbLJDaXD3diTp74lHqpg+rYdZvNdjNuNsOG+37q8qHrH4fx0Jv1tJTj6bQ/PN4/PD0+PZ6Ocymz053MDDuvzXFgLGnlU1N7LBrd0WOEXEpdtKLzKJMUUUuq5Zq6JAPzbugvxs3lZnO93d5sNze73bML+79x+97F7mq7uRy7y245tTfUjcy98dyWt+ltkPdS2gxcGme+6T9yinUYTi0GATfMwZeLXShJ5qQ8aZ0Tn7Qe5vlY5ZTS02m6OxzuTqc3T09vHh5v90+3+8PjYf9wmh+naX84PE2n4zzNFseaOKe+S7mjDvorYEOSKgTiZ+sgeBkrcmvaIgrnOFwNLM3PpBSaui5vhmG7210tk+5uO2z6nEfRzTxdznUjZSiq0yzXC3QAAEhZSURBVHQ4Ho6n4+l4PEmZDG2quXOBcl3KLZldhvi8K8zVHCyKk00UFs3VGc7BzgAMS9meX2wUg8LiCC1TmBkujYyWpVnwz0DT1sKL+pTZGytcgHYcLd9ffSdgrrXW1nEFoQakFFp1G6A8kcdXQQqR4lAPQwSOCiXSRJZN8KDUZAqtAIWU0zivwmtycICiAWNHHxBWUH6JcgNElzl1OfWyeA5NUKR8Hsyw2WjzoK53RIg5pak+dU3mcetnmAgnJKe7k6ZfAiM68Mp84nWAVTlTgp/Bw2fjTmz4iNIalZiSu2mdsXrbpUCpCrpZ01ZD9AVpzfrj0/lWLnkQ0sqVfhewjgs8XDwDf5xTO35wmId0R9p7cZg+TDKzx+ek2BgDQnd8vtF71GnOTgZAI4Btc2srOChkVh79EyE0VujpztKP89luRqO0pTZu6ipJwf0XO1iKU1S9ADdqtNMIwSRcRb3c+kIjeLMnB1MKmrxmjLyQ/Nq2g9T+uJG+o5c+Y3hLBDQJuEGwmgn3aVubCFYS8f2mG7NQ7whlAla6nnQI98iYqNotpigZ2lTwTjMQp2B6ogS3pgbiJbUsZ0YaqPcarjkz5tWc0lT1MNeT1XwTti5lmDvy+wMMBcjgMBflkJVw7LAtVlqYtAMEZyHE9p6yj1cmu0pJO+G21MxmqJlxZmgW3YhuNW06HsZdv7vkcaN9P2eamE59t+/6Q98V1dM8Pe33T0+PT0+P+8O+zoK4UCZzouRYIzTOPvbmdPZgr60uQD6G544/H67+sBGpmv+CFjPyFGWtvcU4dpT7lMactl3e9nk3bHfDuBuHsR8u+nEzdGO//GfM3dj1xljizkIgOuN8Ox3OrRgsU8ESEm1Dayyjeqoy13kq5TDNx3k6zPNpKvvT8Wma9vO0PxwP03SS5cuOZmg8eelirmT3FXvq1fKM+zqdsIISlKaIrAtEcd1qgUcl4aYXXXkE9Lh/h/po1fdL87Tb7S62u93Fbhj6IdGmyraWbZVRqKuFp1JO+9PT/nQ4TTIdkxbLulamYmuCouayZYfrnMQtMtwksppMSLBNkqpcA5ATDxAXX0Eny6zy3SQi9FcINgQZxrGyvF57lHrSkXnb9R2gMvXwXWQPiGZ3kYRpPHgswaMGA0jCJwO9tT2igsZKY3JAAWikaD+UTGXsza2Ajrpiz+E2oBjhwuaIHPBUrgotXBu0CEXRcBYk2CMMwbdYAh9FxiwcO2M7GbKzvJjsGigSZj0laenfDWX2EusTswfJuNkDInZYAXo3plszKHR2dosya0V2LbHu23lGuSWNnR4MQcNavkoMGqHeCndlAiZDscOOxNTz6tmovj7voJlplOQYjgHN1qBUt0lwxSdps3tmTH8FJB5sKMWwXIVi4QFHFNv4MkKTU2MCOy+Ked0iq69MwLhbd/tJKb+DhKgE2bndMQ07BjsG1817aXYTnDPEHb4VnFTf7TTALrLuFks+ag7iDi5nikgZX5XCsyAQ2xD2KqA8Cr5iNsNBfKT2imvMIghTXOUJ8QLPwlBWvgO1nU0K92Z0V0F2MDv2dE4za7BQ81hzFD+5KAJPBjc7TkUKH0JpWxxVaPvI3Kk8f9szTCz6qEKiptr5driGZza7QwrNRCfV43Lih0e5peVkX5FxtA7UbDSdc+aKLXfR0gCVAA1ZCLEYW5+cLd7Z59V5zrGha2By2Tbd7EJA3aLl1Eu9yAXRLnfDOHabrWx20zCehr4mPeVUOpacj5pOVQ+n49Nh//C0lKR5Opng1cfP7HIgWldMK64SYBfsD8+M2MF8B3nTU7vI3WMzWqHoJpO5c6grD43cC1tFr9p+WcQVSojvYmeQou3PCTJG2AuF/UKqMUPI2nyxeZ+nzjVR5rmWCR7hxLESwyMaSNM5O3eli/qWEMeIxfK0YhH3shuE2BdXq4NanP+SOs7DMGw324vL3aWPuUwDpV60E1m6E0ljLf104uOx7E+H436Z1ymdXGzamToZ2tg0h1ezsaiWd2nRvMs8rja1A2TGma5Fo+s2l2EnuMJJHo+7r1YlShzoe+5lbSO7MKWeum3HI+XO6AtF49qxf5apWXI05aM2O0Ar1vAoQt8bUwM4ZxQbMuxpQpRBoYsJKayGuSK1/9Eg8ram0e4Aa7MIiB6EOm2IjiHSHZe8vAriA6lieYClmmRaAwHbbhd7BXJqhSgiG/wzFw5FSzN7RF6R+kY7Ky78cqFNXpXc8THeNjcPSm3QIa2T8JqO2J5SWvd+baX051tQPQMoWJYjRP58hF43vvb8eapKWtsckPVb44kbxtm3sTg6q6uxRoZ0JdkOWNr+HQ5VQUvPaemScN39amagEhIRTVkAnEvUEWhpNYwhmJAAAlSllbczuW5bMJyB7A4+oPOKSTC5t6Nm9V7aiUDO6WhuKrFaptY5piYuSuE77mwEraHGBZbHq5sShT5aW9yCw41WtfLSR6nHsSfRnM20NLjGfgl8g4zkSMLLgq4Kc0NqFjPRa7tJuecyxz2GQkoQHdPKw3MJHzKVSCMORBGwFzH7AVAgthP+JE27B3cVili+kEewr4irm8XJ2nD4hGpImo0OaVrKsB7Vo+6te2bE2jdZluc6A5UCco4YUViz229mbGNSTO1GkE7MgaJns9NiI4ebB5Kth81xLNtt0JEnAy0/uE+0YbrI/UXXj5tex+00jse+P+Q8cS95OWBmppPU4zTvT8f98bQ/Hg+H0zQdLVVIYwDImXL036G/sNdoV00o4kRaoxdE3mQLWEanrnhgtGFTjOugq9ZM4jc03CZpu3XDWqhBW46ex+GZmpm+cuIGpdHZj/Ezvr2c3OTDHMJUXckDcZ+m1TWH0plksB13mGxdKwTeasrM47bbbi6WMXcct/0w9t2Gs6nDUyepr3Vjjhn5dErTNJ2Oh9PpcZ4PooXATHZnTalarGcsLla2x60g3YLEp0HTwFX3bSQ3FPGncqm4Z0gRoGnflGqDQ108h0HN85YtLVpmZz5tOG9yHpMFblCoFcNXFJ+GeEZLTLFrLYUjhiVKLiNBZA7CgkqdRQXFEfxqPecWrjzmFCGtHEu40waDKK3+wWcjm917demnMc4KeRnld+mchK23j8q+DM/N8hcMTQWXN7B7LAxdYFO9VNMKfLvIC8pAi5VbhuUwK+RwetTwH6zuLIvz2Toon0Xa5JgaHMCtRqD4ovlDnIE0OhY1Yk24QpwRvM9WpysCKC3FMGjXOT7DUDPD6MGqota02lWleBhD+mVHImMUrOcItIUx2HsVnz9CZo7UQ5LIyrM+wSi0y33MMDq25sUpRxX4dUOrA86QNUmQmxD6rB6tL6YtfFe1GzD25uHZGrbVmM7HkfRO8W6S62iEaPUgN4q4t+jZcl/pXFmP2SZMvDkcfZWcpmJHsoe3Wl4w3NW0WzcB0JMbqi3Oocnx0s82igEOR/YRTNzsV5nuCD0uIrP8PvQDJa8nPcVSImSiZCmEzgx3VVJ8MMFx9z8WT0djjzjEyiV2DpBJEYO/6Ue+ZN8N2DXPa7MYKrLEc9KjzMcCZbfrARgi1yjdDm+hd7VllNMIgvYfEho8MzktV5liK8Rh4sEEflYOXKtzg2vlwd0sbGo0A6plTMk15aRd7rf9sB36Xdf3OXPfz10+9sO+6/eZT7mbM82qs8ipzMfT6Xg8nqbT4XicplpLMZssNfwXqUxOO2lJV23VdK7Oj1bb5BlIJm9/FbGSpn1rLvbNXzPOiXNjVWx8A0x1QZ2eZc3idBMwbMBDbejZ6hrUiCgB8zQ5I1JPHG2x7itbr1bdVt/UjQ58+5LJ60zOeezHfuy2g63lx+FiM459l6lnok50qHVb60Wdx7l2c0llnuZ5fzw+lekwl0mquGejp9+bcnr5V3EYKxVC6TWfSHV/jIpcZVvxOm/WDT08dTTWd56cUpuVEeHqBtUZtEGg68kwfQVPKXPdUbfJNNiKwtAKF4SAsUVIXcLh4FnLbjohHKJe755a6jgDI9PYIon3Rr4Es8K19uHhv3TGoITC3T9MORt8m9skm/OHHdH5rF9C1xS2DT5gRMcO9wKDe2Mmy174qdWwBN98cMGcqSApFoNud24uvE1aSQgcPLtPbftXSSzqn+BUzWHy47wfTG+BM3GojdcVX+QprdsCDQGS74Uk5EntZzUJX1CYfakO+AONMzntKbLlEMRon4J4wE0IgLMpmyIZUELr04BrDEnoZIOuZofjePGMKpCSiH+MgBZj9AStW4I55tngwm20DPpKLGLBCELTEgwnCnAr2AANVXBZELzF44ORBvwJInOrNmWYvaqggAbZj9dHIa0mbSuYgM8kNRFUgsQWQV0NmG8vokEW1HgI7prhiYOhk/dvyW0J5jX3LFAk/pbOxcnrMn9NctJWpf2sZoO1hc9x7IRQ5DMIHuxMczykxp0HoU0TzDHYGbQSCw1xH0pHFNYGJ7AdQqWwxBx3ZGVf8Khrr2jdt+N7WSzYzvbUc00HkZP5GvvzZwaNsMkIGXqYhlGLSUEX5p+0+cc7fgqE36Oa3Jne5EkYoM17OXUCXYSbbVmX4HfPcvz78rITYYtFy5p6TkM3jsMw9Hkctl3fc87CdOK0z92e+2PXHbtcMxVx4vN8mg5Wj0+nw2mepmKwZFFF6pqvx93y6gyOcBGaj0kUdizegEjAh4FSGrl+eQfo5vzQkT8LUmtO/I0v5giqIlykbSxSk23EgBO/yCkUbkCUYnHUpAOrzs+Jo7YyNY8KoK2SaWlguo43wziOw2YzjsNyLUcLduxRbstWZVPKRrSTwmY1Xuf5eDocTsc6L/9vrrJMurZ+LoE/mSuk64KyGVfZrGEYsl8XV0aJuIVfqhaU7NyURFwVOZq2ecXJX52DHMSYsB2iEJ1ioeZ5EuriwsQboo25oufEuZhm2Nlt9pzWdCbqhFcUEhoaJ9Nixtsn7FvJ3LqdSs3oyS6uSwqRaYhxiD2zAdCqg6CxpF4PrABlIvyvOojha8PGfUtnlUvPJpZG1MJRXDStYwOFrjd4vRDOpPBcSlBz+clJLQuOTSMclNLmj9BQtGBL48Nqnk2N7+ijJMTCMVL7D+A2mwfz6CyN9nxYS5hqYenJHqUXK3KfAOIZStila+O3trFQYciLbu3MEg0JvTD8j4sWtDjgFVHsBRscZ5hsLp/Fglaj4vpAvDL4Ust7MtcoMfO8rMjsx4yOYVfgxuYkJW2qWm5hSO4FE6BWxIy7x39zMkHhbO9vNdlyhkCT3LizhsbK2L+JYUAPoxB7HZKylbSYNfFRtGSj1HyjYnXvAE0Q4f3n5YBy4b+CjqJtXVH9LEMQ+cHCvE6oCUzjNhP9uWtX44ZDCgQvPHiG4ZyQ1snwuqZoO0DPAbYIJJgiUYKbOIqvwmQYwCUvDYLjJIBe7ANweMu8OHWlJcGSL0UDHI0YRWn0o4ATF06z6lHqVKTY5sf3kZGeGzXfG5azwGSKWQTOXCvjCdfdpfodKN7eDZh+yRdO7hDu3ltWZzonV9vh1oHHydmb26UwaJ/qoGnQpaT0Q583Iw9j6jep6yR3ywGqslSIrj8xnzqeiCdaBuVTKfM0HU6HMi//OU3Lf4sFrYs4MQipq07vQEqEk8Ap8BZvKVLz+64tnyS5QB/Tf4IVclKI71fnG/S76DqxYVhZfESr1WiQG8hDdfzrLYID6hoUJ0W5cuvMnLuh65aL0/fDMGz6YTtuhmH5w84w7L7qRrUvc1dlqK7oE66SlgtyrNNcTvv5OJWqp0QTSSFarq3dgaIeAZJKNX2OPW74c7McENOJekiMh0WZCbP7ZGKV5fXK4oI4VmFku3S4K2tqBA4KpCpMiUxTBARdlsreEw05jzmPLWnbkNSKywzTdolTDMJYz8vWNqy6TEzB7/GJKYArOatmYfmz3L4YZqOcxQftxxlj3Gw3QYpdLZYT8GAIfWfjw64mkqnda3iCtWUBKhym2RxK2Nn1Oa0AcJBSceo41cS30igZMI5WGBkZHYYg9wLWGHJOFy8SRL02atnfRocBxrIrSINx1Ay3Woltvvdn5CZt031UBQrRp0/ssszn7mAhtKZREQGPE7C5YwsDoqs7gGIec6kzR2eVPP+VESMfu1aq/h4RQ6ux9jOqKm0ubxysPLNJSS6r8c8QtxZhpgd2uTxy4j2Lr3bZlOyNOMiYFsPPNfavzaOSAk7z6J20QnapmWqRrlP52XDc8jej9wgpFwpbOkcVmuGFhhfk6rwYDHNQH1YxceAbbdHX8G1qrgKUTWHIKTWutK6jA5aC0P5EK4SG1dhFVUONhjJM6HqUw2W68SxIV/fwNeJTmxIbyYp6dp/ZdcGeHpOtej42hUdVe80UGgtwSJK0+ZqjI2Tc9CHJskMrOzgTSFi4pIetlDuAM81JJkmTyKkWC7rr7JVnKG3SGqeQWki2oHcygH+55b1f4Go9XOaAX9TET1azLdfIacgMfTM7yOc7dVsb6zLHuArWAOTeW1mG12nTLncqI/GWeGQeujz0Aw+j9kPphtLlOVtwLHNNNPPyK6uZd86WZlFFplLnWk/zXOo0n8pxmuZq8qeqy8xsOLZoNR2MYXAh1HG3fWlhrbG/dW+apUU1FoZ/iEphl0Yr9E1ueUFEoVVa/+tsNsAj6OIP9i0Be75T3/Vd1+WO+64f+2Hou77v+5wHom75P82asiyXKBcxP9GUq3RVulJ4nniapMz1dDqVMolMtR5JZs4OtstytIf01lHl5Kjy8qKNugyRqHfLCicNbw1880R27ZbSK1gHtrqaHcwMOyCubd1jb7bGsA+1jhlu+5AvIt6h95zG3A9Mvcbmqi2AMEEg+b6Ge6w48shZhNqlDgcGLH+aSkcT0FoYCtgnW6M9kNSOhaDlJNGVqxmZMGctmgbfS+JSyBmBLK1TAk4bPTNr1DM1aNuC23NQKbg7rI1bHMIJXRkxnLJ7mclqKGHfbk+fpf5YlDTWcRyCcCQzqZ6N4NjhgiPma+/YRJ6d221OARqOoGM8JwFgkwf8Y5iLHyoKLuNy3+Xk7qCppTa3VSThXUbXG+QLCVexc+kNreIlWktXw7tBtF6X2OD0LP+wubgJ14uIigySBbh1jPBJ1TPxTAKDvK4Xpo1DwcILqXN7I7aFkTNNSorggIYx+AHI1mjmIGO2ZEBaIRHrht2uKFKeAkHwgICWJuKbeKix3N/SwnTZAU7lZtRztqENXrrzH5zJ6g5lGSYyy3NQ7URkcWtlG07EF294g+29c8uM9FfLy0HDzbqrEQbc/Sald1YIcFUKcvkqU42lPXuCf+xUw6vbD2GJzNxGJ4qdkX20dAbiuNuzrvIoON8ALU0S3Hv0sfaEoee3FKwUrP0ggJq9LyEjKR21TsY9niyCxsDi7EaQmVouGJKi/SK6AZ1BinDN84yHCPhCh2Z9OKPWwqvF1cZk5dYdP3BzdIlZq++aOLkIyyKTnHftd3Mozh3byQi0oR3nHfOmo567vuup66XvizlCl66fmE7EhbnmJJy9QjgPsqoWlSJUDOGsVUqpxRjP0zyrmHl/qTY727Pg0bzmxUWai3oAPEuqgUmFCwcaQ46jicFuJo+iyuYkQuaTqcRdx8v/z33fEfce3sQ5W+SyU6Pd8wRXxgQ2rMt934sMVfpSB13eRi4zl1JPs9ZS6nwqdS/1JFLUsh3IcFfHUghMb08ccji9Ousel8gdMMxsK9pyJ3smswzTjCnUp2GlVsHC4D2McQW6fbdZXteCqZ0Bzqc0nw5Lh5Qk1dRuacu55zQQZzvbnJGIp0zW1t0EVozfpkbJACM0nREKPcpHA39w7sOadht0NheSWaSuSwg9cpySr73DLubddDpK4VOB+dHtbyUhS3UtVTHDUaAjDhratargD6RVbkXrijm8uZfLaTZ/BNKaAW8C4n3oKvyMogBdm+BG0LuYeUQTcaYYfV2DacCiF+XOUzmROQO3aWfPsW0Tkuev6TnjJ0p4YNMKtmlSYLdxLcIlGAF48dGETbAvDHyCzn5LGoTOui6ItI3DMfNaX+y6VqiS6pk7+GqO7SSbVra83tFmd9PQf99bZFRTGLBEbQ5vNA6kDHa/Cavz84UB6lfzyOJ3O0LcT6DzsIfq+K7cqy+neL7ggUyNjaaomWjzU8QwtkZgRdiDEhiEO29+k5t0uoZuZc7FQF4bJNOowo0qlg0lifuVGtgPppMC8EFTJtWM/h0kTxFWIDEjgqZMAfmjdgRtNiYxX2wBvY32F8HzaO3cNY/wKoTX/Z8j6Q5ZMYe5SdgMeB8T4AN2GvgG7yl5qV6++IiNozQtlo25oLR52fcju0EV3DbWrtr2l8jL7z+JHCVNVWdaST+u8HMPZwqRmDeaCHYwhfVZL4+Nko8pHFpvf2LYz0B4hJlo2zr6jNAPi4TyQZmqjT4eH9gCHJN/DYWGIDv3TWoffQy74CpzTzRQN3S57zy3n3NemgtlLpxrzjNTIZ6ZTvbPHm8nTDVzxTxFjWEjzewb4E+jTSZP2VE4WmErFUTztrsRdn8R2zBy6my09WCR6hM2syvNNNsWmlmyLCW2q9Kn2hme3EvtNHEpZFSkWmupyxR/mudZZDIDDac7s4cZOJjsuTnIA0A+q4Akxe5X5QNlAYnMyLHOWLbPvPpmFAAHaNqSkPrXFhXiJ35syZyo2jCbGi6BbZutcUNV4MwGNVs2V09pl2k0gZYGJTmZWQNkD7oqKSHLpAgwtQ+lmRuhKcZ9CW5zgujIJ/uwgVVfS+Nb/CkEZVtCUJTC1tfuJg/cB0Lo2oozs1uFh2Wbes47jkYgWffAcL44Q2mdchAZM5W1a8ixwtg3+cDR4PFwqoRLka+HyBoaI8fBjMBJTSa+ZU01B40otABI5xXb8UGzxZpW9NwXnGGN3LZudAZNtreqYakD4yskRag2hi+tCut2DfET3KnMoTQjGGhzEmrkL43QOsYl9eRQzHGZuPqakMPdUBsfCkYMKaxz3AlLwgkqlC4cnUQALCs4mxqUFcFRwQ3JPgAqr70IrUtzXUtzDKpOXcaNwi15hKOMNrlMgj1pCtOL1NILYcRFwLyD4heNnLaBU98lUbevCFDbeA6ZU5EUQdSRVe+NHvpgsFeau2hAIeaiJQlpuUJNJrTyuBIa9NTwjHiSDAoxCZzfrrHwb4zy9cckIPnNDgfHDdjJePuARHBECby1CT+CQ5CGtbA7NnOw33NcH4YL6/J2MxraRCzraL70icufguQROTHBGvT2JnryCF5Musy9S/kRnaqcRA7VoRTobhnZSxQqfHt+eO3/CTw1v+yQqKH3UUSvcYz2jMvkSDUzBMeOz6cM+0nnOmTfE0O3AfdSisl4mQ4zPlY8XEa7ErIkXTfnckjWTvacl0mz62zGXP4pZ9+Ae4C/GTMZNcFbTMoVmlxyA0ABQ8eBdZaErigATPTE3rT6Diwkwexvn8UyAf0AFPUXn13VoqGaWiZyg2BLKUXMNaRILeboITLbvG7joiB9L9lLZbNXRBtZQ2RgOfauZ/bjg22PG6OArceqTVDLaG+NVUXjgRWvjyCVWgq9RlZ3AvEnDPw11h7eWZ5tKEHP1IDOgHZrEcF5k5P2KW0yD7x8rBF/RgGASYQgUkMwHaFzPrNSDYlAgotkFERUC09ZOKv6TQdQVRrhGkHyMKeJUiraiCJ4P5wamUMb0qnhFGQVsAKODyfe5eatGIRiPIi4gRRLADR5jdGEtR96bAYN0lfFPptYG74amwX5YCX+aVB+4UdNkBSjUmRKRcOm0hAdcJhDBwFoGlAeEoIDhRYYqrdIKByxaJA0jBtaAWjQaRhwNbZqiEHPPPt1HaZTQwbDOTGtvk4w2W9kY80u0xe4LwCjZn+5oKF55EBUUXCFqUst98hqQNNFaUskoNDUJlkFqARgmGIej1cX/KU4FhEIh+cHETwSGvEGjKTqTsB+jEtIstaFJnp9pA809RIhDZLO9EbJXUwdSW2aJp/Ig/h2puoA986DFMzpTFa5auxxvWnG7KQRr5Wa9iOy6GHiweAUyXnRX/cd5l7gkI3YmQ4woEmCwaRolG7sO6LjihMLOz+H1FvgMiVsjRKYtw4ReQcH/zltqxysuCQ1JjmSRoyOCysJdmhdOFv9VgRxIBwe4AthSI6eioADZQ5TP4ledmmGq/ZEPdGm73edHEVOpZaaauKSajVXLbOLIGe+rI1VPHfmFaIV2Iz1AnHT0Bld070ibVdALN6EMxgicRhw4m5tVKvbVucYFwDG2tiTkc66dCc2N0t7px6FGBO9/Y5lspv4VL0qd3ZpenULK2NKswf1myKOHC3uHf9l4jDmCoUeZN3cRPs4kIFcCCGrxBMJxbVoltWf3ENiNstky1uoxvWqBnNXG7vNu9FDVng5+4pR95e+JzsjpFlGkNMNBPaOlvCnoOdVwShoFGXHrlSz1iBT2MY3trnA2pHFLW1fTSH/tD5f4n5PWKDSui6CflXf0WHFf4sTnSyoyPHqrDowjZyH3HVk2cgCBq8ksNJMcWE2ECCl455zFBC7HnvkgqdBHvCn61Qp4h6BVsrVqXYe4S9hvgGoBk4gsvKa432hx4JcMOT8lFa+CaKFCVbIsKugICWF4yAeyrZejeohMaAllDiQU9eBsrlAUbQicRfi+1MbtVKCn1/i6ButKY5+IQ4ur17sHXMITKWp7jhF592Y0EnOhr/Vo5tg7YD4VY6himJhtobhqnsHUuORhU2694j+WkCugdEDpXfYFykMkx3pgewMXF6O6swca2ltqUjegvo3cCto7frS5uKZ13oXfIhYj289gQijhoMUpW2csC9uPhcakDW29uDsKp/telsTK61roWCXCe6Ute2Q8N+Uc6q3n7H6Z2vvJh/wHg7ggLcUKYXIh+OWbyYyK6d+pTrhHmPfUmXvE1sKc3XiDvniPj6sFBaPuLHcvsNCiiidUQg0aOzRjIT7SxMonPGog42mALZDJx9cghQr+WYqsvw6BF1JdBUNI7dLyX6PIWqLUpAh0upYB1GMDXaNWIa+wMgWPl9KUHjtoXd5AZxD3HYHwEZsf+XM7xsGWRhQIxF6OehrolnSrDLJUiDm5Rjk4Go5xMow8YbEwRdEuKLBRBeYVJlcGGsYuFs3E5IEp5HIFHfJl/eujFQXQ5ht8cU+8NqbZIVS239L5weBPf8c7rYWnhLXDdtZ5fg4Yw2GqrEcA3VFoFwvGXdqQPoGZ0Kf0j5VivHX74FmKUhOnDbCsG9TYDWDx1IJ7qMChNiBdqtRdhRVIRx7mgqBmiHgQLlnK9uMqPB9i8pTCVk8CTtgeBIIWwHWoKH6MBM2B9W3o7is/pMb/5ARKZvQDGrsZTWKH8gx7ci0l2OoudVA8V+og1ltb5h7MqDZ3rwwNRRXo/qABRgKn5iGwrwNgzmMxsI3Cg+GF0vHAJKPoL5r4+A2mlFs/EZAYBiMVvfWiJ/BljwpGjrsdBvlrjp4SOFHsTKB8F6obdNcLxvWO/jo3HbPZhtxspWLcloeok9t9lfi3+sIpEtZz74sxSIwheFTk0sq0u5WiUs4AFUQQB1YtOeFYx0YraUf+mQ2Xg6Qg20YWPz6H2iCo1yhcDcvY7DP1mimQKxjeR1jPdA1ydi4ReHFT1xXHdzC3wl+V2fU7DahN/11alHFsXdWpdF2wO2ZaceWtU3ZjN6gx8H+u4kXQ7WFJUbwbhwySjih8LKaTit8MnHF7HoIAf4kFzs514TWExuX1E0/0PXGkpHSO/ysdUNijAczK0G7aV+Wz1ejqmkV4p51c3TW+qkn0JAzEMJ1JgHuQOiHhvQ5eUUQ+B47ts9tiI70puW+L+7mpc7HleqMqISlnmPw6XzOXoc673Ta6gJdn7ilj++gohIIlrsxN4QDkwbdyYzA2em0ZEEycFdkQgdLoC8map/H8hAaA1papyeNdE9r2qfjz34TCsPQx64SnjZpHX12C3z2/tkUPqJLPRaJZZs7evhFJgrnMv8fJ7vmuMK8Nj7egYIpxmv1AljF7j7lG2V/kSl0dSZUcBmAs5pYwax0A5NG0fL5p4lvGZsoyQRpmxlq2+fDgo2ZIoyIY3xD+laC4QkOW11Pl/W0xv3HLfIVrY//Xorno0k+scrDOBot7VpvmodVCq9UFaP4xs3tLGXH98UPCbjfY+nrP6UmZOf78BF+sSwh/JbQRfpxZi8gOy7qj4mEPsdPZAVcFizNhJwyd15ms8EJqFYd6YVPgMDuNDOPxCOngTNHf+4PROVIlXXgXtztyC+UQGkEtHJVUfpDlfRMKe3YSCAoCKgBNwWOVtJSA1CvOTjg9nzWFKQgRaRpuBAYD4hjKmAJ4wiFmgY+CTHjhGRC6Uz36rY56ezjznQmx4z7K6i2TOtJCNWLoe2qzV03zNrhnmvfme1WkUCBKELSU8uWEmoxAX418Rqho8pq2y0Hx0POqG0JFqMtDKBwxnCUNIyXgirvkkxz3VqukJ2XvvEMrNS20e/458Acwtk+Na31pRnUSYx0Ds1wWgNq4xxGXEXcGZpCzJqaVygjxm/5os4KRo71CsckB/SDtWm/3DvD0wpRAn1gAB3Bc5dTC+lwmgiH9oZxNuhq4EHoD6B+ggJDG4WCI+U3hZQVGEcsZgQSXcRSxMAWrmNesIF4ND5Va3Ki5uqqAkpn7WFKbUD3OmRPp5ylZQQVHYvbbDoGZPUujZutdSMXNjBwFDCn2AMxwMrAoQSniK3tDEo9tWVw3EGRptXawFDH+ZnnXa/LJSFFZei3QlMAQpjXp2yGw10I3rSSlzTs0KudAIFHcTWnSufnESh4zeWtQQawtCc41QGLi+WXYvvkxtkxgXvzMpCOnGpmEZ6MVXvyzFWoP9hneFsqpZWn6Js8C8iKz9tJaRhWaorFnQHYSXwyA5RrK3zB3yqBN4aX6q2FwFPfLP25TXsWV8wUF1+rO2qabt5F85rj3GQMD/baxN02oWxOkXzq5caJB2KtuPmuobiSPwoJpFfWVbXmJoZ2tglJw1KiPCv8pIAS4fRzkAcPUhU1OlrI10AvDATYz0aLvwsDCr/qgAdl3ZJ4DSMPt3FzvwgTQ5PgNyKQTPENMQK5qjsjeW3D+BTshgRCkKDoAmZOUo0QthxqveHMPaWOO3cxWT7rMH4M3QNr4FC+E2+QfnA6AxTz92rOpyC/sYs+qDThCnuBSkB+QtTtr5Mwt7o9lFNggWFiHuJIkEzN96oxN0J0ghUrt0N/5ZpCrRB2d3FfWlzqUntqCPbBIgiSCYVLSQiI2jyoHCXYyj7MJALbqumMdZsxILYFgfPKsBejddyheM2tNlvbGfJW4MVncFkA3Wic25ukMNXUaM6X6sNroxrt8DrnpncmMWm8a14H31h1WPMZlOe0rgdbzUr0rqwPg6fFqGo0ZXo22MKMAuroGEqWG2CzuyGQ+JePpnOqa0T4N2FQWj9ubRwIJl6ZzUYwYtiutmuzBvMBGGmArFYKpZIDsqrNPxx0ZZW0egy0ReqfMxHaK9BWOtuvszcpGHydpAnVqOqfm0dTq2KEW91H3GAhtl/jyBioiiA9hlfWiq4TriTFRKEtAgqi0yThlOSVqjGItcHxdG6ZrimG0LYrBouDGu4Sm420zhDKK3mrqc0D+wV658w3dupJmPUoqMQN9EJmB3TTnhGA+OFVXa3rx5DatiH8LxOmCbhe4SI7SlFRFF2/Ke1o8dfKJWkRmatOqlOMGeRwth2dDlTbiwyZYkuhDYmOQk4cHZ9fMBbnLELLEksrQoi0cvtAl9YY9iDEYehjZ2/KlEPBfUYlwTrKfol/eN4ZxS2j5qcd/XJzrvUHwl7l0vVl1QZdNVdWaoahaZ2YhFbKnt0c1SFKuOJgeNMA7DVen29HnEvloGlqG9kQjKPxljb4NOu+gKB9KBfwXtXpRI7ypnUx6cXC6fxeOSHNrKnZ/7TuF3rCyKZJBDR8qbcqqME2F+igqUt5zNwzZ69ojYPFIZTAe4ptoN17sj75DJ9sazLdQUrhHkoxEeK1+3WqEkcgjl5vo2JIoUYsxuRbG9eqWe0iAwe4KZiTIBMQRq4w2U/xqNH6t20jnM5g2NhKuq2joz+xkgsWm3jrClpnvAKy+Ud8Y+F4Upv9dR3zcoqd94rnkqTgxboOObkOxi9ejqLgRiRNwA73A1+OM4wqOBB5bceP43/McepFp9fMRDNUkKytl40DObmvEaczLIZWF6FWPuKQ54iobOe+RMhgfMdKoY18XtdHrvjuCvtqjMVNQoOfKx2mYeAsCD2I3SXM2jFSRFEIihc3J2eoB5qjMjgobhZrx/u6BvRHmNsGCzOotIQr0Ieh5XLzLdWV/NVE9805LD5C2Ac31bbPBI2y5+5PYXJBLe6ztUpwX0SfDSPQFUGmtHYUEpYjEOmnFYJud+nqmkbn62s8dzWtjYojRsuYWFMTp8e0C1Wzf7uNCcF4NovLtuJH/VtaDIuJDb5HWnUKuPUp5BC+1vcMEolbyhoWJ6wxUNBmQZOphaqDjBZHmRWwVfDheicoLpwmUkMaboQdQ3ehrKsW1p/tXK0w9/H2yflwsrQGXaKO06ZnJT6JnKpJaaVWTcXtiqlyyoYpnyHN67GfAIU7LXylEVSSRtDQePhSakavMQImhH+2WywYP0s/lQWbmaW/c6ohTkrwLGV5df6IBnzjXMpY3YICGsQ4XyproLkwjJGEkAEvkggXaD424ghNsO78rmjuQYkrN47j/yTrW7QsOW4jAVSPKNJ7lt7//1JruhJ7LuKBbFrHokcznO7bVZl4BAIRTUkeL7vMtTypDAcW4eelvMCQTii4iLvRdCebd0qyX2tZg5SlyP6W/hvu1SscipC4ym3kA05LKMDZniQgXHw+129VkePC9BXxFfHrya/n61fVF3b1R5GPoHqpXhe+avn4ORhv1yOctmSznNbGosAb+MNo1AWMvgdNG4JIiaJRabPbsn9RJpQ1eQb5lrmgmmSipaTSDHapMUupgRSHDbpn/nOjiuqptbok/glgtvMPOxUDgZiPYRQNBc1sMrNBgYRNmsKMCr9wDdrLMG11dMCyj7aLX5FZdhYMusjUv5OrDnig50YNlAOFDZgTLMmuvpoWqwhK7JU/owhuPAdyv8KLOxG3DKdKSjkvEbnuLbj5L1L+L3rPhZ4/Bm7MlCInsOxR9kVJ98df/5drWlwXps4s/5UUOrXv3bNSt3othVkYSLEmL62oNtUYWs6EgpZYGfkUaB3sFb6iCdtILljuUb4l3MiGvi7XczcTmRQgDef5Y9hrYEQ6KJe0iSl9oom76A5HL35K05NatOscNavjOC97RoETVaxDVeJy6xyE3rwI0liBmg3XGJRLmTF3POM6j/UxCn8ILRyqmubF6mC1ivXEHFV1T86lTqmOPDUsFlFBqV1aS23xAPZ28MlS5yBgLdLEiDG8exX2cSYPF38IckyDGGEnvUFTmGlEvevRDHuCu2xkxXNeMu/mu/M/5/399m9q37NIQq9UrC6Uj8V759Nj8a+vzCqefPFn3i/M0kKVOFdkeBPZQo3LKzqs4xBVqXmshPZ9oUrlt+CskKPLYYzD4IsKJ0TnU2yv0BJnXowRsttaho7IoQn1KbGGNf9SW+hBFPe6WwRQbpaVRjwjw86GoITSDhPhtC8Lp4/zo1k41cTg5MiXsZi3YkrJTQKhnL2AOA3HEUfOJ4ifT8L8yvqq+lUxRPqCasoBydDKuiGrH64tcGIwy/76wa0ikMD1AZjJM4a7XVAubNoCED1rguzyDKFo0MR+0NmyaijhrVEqxJmUwarN7e69iG5DPV7kIj32A4+rtIXk7vZBEQVlWKdHpM9wgQ83lG88jdOf2fwSQpmWVijoG5Zd7oJMMSwdYKjLJTM0YJ8z8aSRmLb1PkfSc3G/6OvU9u+EnWR6i1UcmB/ry9ujavJPfU/uJrBN2jmvaw+WjOChHFLVW7I7nxNuQUXFEbS7R9xmSxTGDkPaTyrCM3fJLLMGURBXnrwa5DFj+OtvvhEAXrN+ftzV5/3jjgWrHWTRrr4w8NqowtzM4+AHrJlIiAPCSgzzjJerCaVuUD+qxwiuRdpMGT6s0sOaKTofSIndM4mFfsneVnJJLUjDP6pqkFFKcW0JOl1dSMJYnHBuQkBP8s2Q7Swx+xjRkhN+ljm8d+Y6tAs5vWELHWnwhS/anBQzkJVSC77o249U5lIU58PJiqBegApmBRQH5nxyeQSJHBknqJWiWOyn20GtflJeYM1VN2WzFPgKQEhiTUD0GRWoLGYhrdiyi1KmTbYPMPZw7U4yM6V8AyOu83b+T/d/zvn9vs1vDtIL7IJpSVzaju6zyqgaAkhGRbKA4k5qgkfuaF963mWoVLKnXBXPm6dH7U8wE/0+o3es2V5Yn8/zisBUqf2DHxc/JHPHUM0XHmYCIZjBTcWc4nRa/DTj5zgOB8mDneTtsi/NXuRGXm6x27W5RGhCV8dCmjvs49qgtAewJQA12ZyaWHrUyc0pwE9NQBPyEyP6+nz9K/OPqq/oL+mvpplVrf05/IjQJAJBERNCFu4wCkSluQmx7dEL1TtM+oagwBUGrPY2huvc6oQO3du2rbJYobCjXnQ4JLx7dzDk+VACj3OOpGRYPdAqkryegbhePXBDfL0ymNPNHDZi2O6tzm8FsUsjvGnk3vR1hhZ8CTW56akWzFrRK2XZBqtC8vXicBv0xwGbfFyUYNKYFvm/OP867N3LYIh0mP5heHe03QpTKtS6x+v/+EzDFfyEtBIorzGCLlAXmcRrDqXbDbF0BaEQLHlMsYofYzd9yQgH09h8u4VnXj10dP7682/Is+eY2Mj9DzEKay2bANpCqO7Ytx9mjbOsaz34Wa/VDqr2OCHNdfbEePojzzk1kDtp4E9SODO941v98ZGRlIaIHoJKW6WwnUHdpOCwihVl8pFHSAttljJUhTwZ3wTPtZcb2gJJk7v3RnEeyDWiaHKSgxBr6nZ6jzq07g0uBFTMz6aAgJYtozCUVUMWNhMdX667yWCJmfegxMHrKI7t8HAAOl4FNQsTV0Cq1KQBg/C1BHVR4h5gbiC8OQjMaJbe3tSYI8mzDpyMiDS1Zt2lqKhlwF35ix3psNarCysBLwa7Gb/f87v7f/p8T/PEoELnCZoycWJxwsqePK+HLIfkjYyk+auKBoocdj7dh8vNlZT4NSbFr6H4J2IoUckZXXME/1BVxp0HX5vy/eNL5sYsJZ6VMNfkjHCcczu9yWhsqa/hqtg4dBgTKyMWCm9ZG0Sx9Jk+HzH+KBKRqSB8lKa4rQ8U8lHufoWT81Mc/YIe0xw0w9rwkzbE8P8adt9X5shQx1c+oLlQh4HIHkwACWPNT/TOAa0D2Wesi3vtX2IUopeK0MiaFxhCUVpqZI2mpxXBBsw1Ah5F4az0ckzlZgcsH1dodEtWrBFN5x8xd1mFfcLlSw27KR2Sohv2CnTNJOmqC0JGRBnHN+JSeBog/YICWPLHMboy0pmMyTDVn/LigVRHsA48l8qUqrdzx+HYX2mWne0tz6B8U5sftL1qbzkZntw50BuM3QKUAEWI3twyKSZuJ7XvMUw4HD+6V7m7NNK4tdGIICvNlSJj0jFtf1peqc5rz6rZDI/1VpX0IoG0p0FkfZH81ycBt7ZSPw/pOQwzD9ETCa5qyO/RjUwDa7fBLk6U9CTEr79AE5Pfh4gqyjX8yNOAwnRstWAMJ+jEK+BQOuNQOsTw4as60zS2Kq7/LEWLdID0IdxDVTt8QlEnRUmNRHPHU0BdnhQFw7zk3VZTzx19/6NiT5KrSMuxmnWAblc/ZAibQGl4HgG/0sxrEjRtvRi9Ii/eRLo2BfEfypYLbQnJZbmJ4fulrd1+SGxszIruq48PMBVlZQl00EuhhGBLjMDDpfZgCrGl9L1LNHhZaZ0aaWAKjmXbhr5S0tuFixTf53xH/x5V5d8TUL8VBejpfEbxg0u7pStFMlteLwIIJgqWfFsv+diP7XPRDhq7h5h+mNC3RMJ0wcgqKDy4wLki8zHN299SGPWnUGmzUxirLOUABgtLizZyxxxz8/jBCtdr5vYBFybVUSozdUtafh1qNVAfw6guFYTtx0N4RFf8+PdRGImXw1LjjPpY/Yr+yvz11Bhe4cvOqOIV61AVJbshrPoE2VKoRlG/BnM/zWAMHfROYo+iC+v05gbIaWlfaf2e+4DzQXjgMJAW/UFwpLjTUinQDk2bkYETry3+kPlGCOFl2qkTY9WRzmLY4j9TFD6HMtsz8r+So8pAmuS9AqUuLx511EPnkKBvr5KM77dHxuGAZvJebFpqd0oi9F/ySKn8wkpwx7btlLZEUn+/DC8TtuN+aEH1J6mpLlDhykHcTwPC/ow9sSYvBwtGFpNieQXcKsXgD+7qBye9wgTKKUabiCTWtlhCLUf0HzVJqIjAh36+fv27CM6RL0I9TxXO6gXnvFEFe6f40fmje13IOjxA19KUNwAk+KKSk3+JsVpagni6pW1LEoisghA6GFzW4De9Rqfs92MjnBbQtG8wuSrrkcfRBeYUTwgx3kujP2If0CM5D1Z6TPYlHCLltZ4eDLiI0rICiuOCsPIWyXGNPSVxm7xTkFHq2zGdMqzielaKgZNyU4S6G20l1foxHmbYwIg9DLu03Bkpu+Ol/DhtZmmYiGAQTaWHom6ihRIo/2PSp3mgagE0gDlly9UQwy2tPsgslGI0oVf3pLVBxe0Rysgn8s9nHI2er39XfXopanbD23Y2BTljxH06+j5aKof4FPU/STfutHFNHcK1aAeT44hrdLVzhGF7rpo/CYj4sqWNtjorMwS15JTXHn8Txc780ZD7j/+UPR3+KOeAHwW26eK+8H1fAOVjH8ShW4HkVXImKbY8RKw+cdwnVFvDvMPn/IibjLTmogfM/kaXa/7xPTKXaN+f7q+OPzL//Hr+ep7/83z9+fX88VX/CnhgBOSkcI3QvDWlI0FWrVZRKRPNYuupF3hIsisvIjVX6EATLAqWk9l2PE5lCGn6O7PtaAkr8dimRVc4NBIMmWDoZ7hn9YWrlQzSDqKmitTAoVMYbiEwSkEjoS64eXCEE3UuKNQPB0WhoZVeDogHDCOxEn0sBkE7KzYo5car8/LFESPYyCQTW/EwB0GzxahSler8HOx9HH+UO4hmpUGSOy8Ljou4vFL0tCmz1/njR2ENkelY4bRgXhPDvgASRXdcekYAAxUao5QKrvQ4GBsTmkpVuGH1J3Ry1C8+HfAjD7aLV4xnW3rCbHOuv3h1Rb2VRzsNbsnvUlicPf0PR1M9jBavjLKXao31I2gwsR9TA5FuL+iIbb/IcggnyK3rtwO3cCbkst6z9YEEjWP1RSmEYj0lZQwxw7dWFAzbm3JvzPxeghdkzG0jrmfoGnG70FL7KTSHVqQY9Z8bYPCvNTUIAoOixIGDCR3Pw1HwtfxMowUq8GG3DPD+EeSVp6hOQKJo78QBfh9t7+2BVyt9jwbQzGs0RrbpWNFRgzpCtlZp+8qgVge/UFXYQWlrUQznO7wvlV7wwsRneoqJSvV71l7Hp+hFRH9BGhnVjRmiZda4CR3R9Xj4B9dCm9N6YpEewLDNKCgxLdJmACcO2ZUX6S+L1EWRrjOvfmBJhUNybg+Zja9Yz88MAG47pjtWv+DW1V06hQJXWq8qr2BA5nXflget6pFLB/MhYCJENOYldvbJuqU5D4W1o7+e/MrnGfONL3+0+cXbMj9VLH0p41ECTkdYmCVCveOsgA816OGxzNqorL9FLzzppTJftah5YzLlJ/QTYbWgOlve1CBVB/jINyE3dlKfBGuCIKgLp+4hJJ7tlY9QhekvnjlFUo1vK1qMHVBTgBKlA/7iwz7ucIukaE3GSKw+02HsnBWE+2fPqC4nFs7Oi/Mg7MCHUVdYryT+mUGWQuAlP+8aO2OwwU3Dw9tH9Y8GL6Uv2bvWI7xmeZVunqWarmi7A+LIBf9JDW6OIR3YCUkmnJx49lI9d1yMKn1LBBgVLN37eJw6exnNn4/87//67wv54BHRFcsLKXUzEju01a2HpXpGHQoT3jfXTR9Lh5SIk9A2vh8q4WhrabcMw9R7eVV+4mSF17KE8vRh91w3Zh9tlfX5WR5hw9wpL7WwQtqZoYkugxNUixBLq1wVnKwVyMCk9xamT70NnCYSktLQLZfKh/4L6Y5zYdmEvpzHZ8YFRSjpzaZEcVbmgnUcfBfxnHYVUOBDZudFA9oSHpjKOaN4oTUrHS7ScY4bc8Ylla9kgw+iGCFZ8BI4SYoO1j5EmUcTe80qWjvdxEWK0mohZLxdroPHEzRLO/epE9yhaqcyXzxZCI+TUwdz2bf7d+f36e8ZW0orQdt8NY5K07U908jKe30UoeN51fS0gexYpKfF23/IOTRLqRduUtS/SfC7LJIi4RCqlinJVQIbKkRB2dQeFGaYfvnYxmD161zfN51EU7sKL7CF83Zb2gYmuQM6jEAHRl0YaRwKj6LNLXgdPr+GRTUq4dFUYnbW1yqlCGwITAvfhapJaiq9Tce6hlgnhyyft5mW6UM6NmTWCec1nIwDvwFry7Xr5wPjGwuHpPkcLY1ckQW34RHoj4VGNQtKzxQCS2mHzs/4kC6v26BlDMZoky0tPJUsBcrCGL1wLvWLyOolnIa3f8QK5Bc/bWhuvdKT+x9Jsk3u2Wr3kIqZOkt5FmZPp5/8Z4aKq2fbI3YU165iwX9dWsOrx+t/RZ+V4IFCWdtMFiyOw5jUFOMNK4u1sm3vxO3iKnf63N/3IlA9kTNWUq4CePGpAb4hTBTcGZWCYalVjE2F+e//+n+H0wOwVFazWxc+DQL6gLn7je32SiH8XImWEGssvKhfzMOCDXVp1AxkjI1B192Q50YhJ3QoDHxzanU0bYutg8iFm56Bs5GWzEAXdN4y1926XTmNQVB7aBFa87mbfomUcSpukmiqKq6UhdN2Rt6VztK/RBPdMIij/Qim76W9Ig3SRXrIpp+f4pNSUCJIoDXqCpRPYvgmZrwCeAy9A1MibGtznWN6UK7qk+Ti9p9KeVPunE8m6jWalLbyUc+H/nvsnUcRpe7Cu0Uimwghr0z7M/bNyBD3lsfQUtVU3mCiimq3kHRJFdwxG1xV5KY0wZBsz2jooHN0Qk9/GuXvyN/f57v7+9MhHTHgJfUjDYJPZtHvlX43pbC6+KCCBZtQShon9CAeOOMCKh03OGhBv3Obj9WA47qAO6Y26CcMmkT4A5rvq3mDPkQsbZd/8WDp2npq0oUL0cvaDUrvf3kya9b1sQ0whs2zD139Sbf9fFV8PYQ6GDqPhiUXLtRU5YcArvbv8YqK3bwQrNNiP4g0t3eQVJuT9s3d0ZzK3pMXKRulNhymsXHT8gKLH0ZG4VUOlojAkW54cJshXgJxf4CRnjZuVvGjz2SEIRiot03MLfMnw1lAFV/3p1A+2mgQoyVjN4b3g7W1fDQO3pBOXwMkbbyqId/RwvY1F0A0+0sfd/UZLpKBIYKtX5TO92s4G7kJpb1aHd/gKzYzeBQZ9xMPtaYRd6AWB4YztXUmYgg8+/E5MKHJ0pE3K99PcTqpqC+3i+vVRfyAp/WLl8du4SrF4QCC2PnHX/9tGOFhLCYy0g5sV/0r77/b6ze98uTFspuPlR6TRi8s23lzqoKrqGztOcgn/m48oEf2bEw0uXNNH2mNNkXRbIFIGWu+V9cMrT4R4Ak7b+68escceyruxSVz6SpkUH+HNQFf3m4wgtg/S5CfCIYBoqVB9I8/9/25wFWvoVFRpqXd3MJvL/D8EstyGXXCDYe6JzcgTB8Kk7G46MYAWYf2vZeIIoDiBSlBG1malBVF27Tl0lB8/vrxPqTXEsVR4ncGB7NSrZk2mPvGbMBM/lSob5QFCrS+26gWNgK2N3zSTs9jinia8qLjGfDp8H6PCMM7kf+d8SsefF82eOyFszasoChKOX0ZOWaXqZdLzX1biOXFruigGMc5MgH3AO86wbguKG/eiN2mS3i+YV/xLDR9gjYbthTCIhrWmEbzcihWcUnwMQp8nuIzJcKToz9V+QQ2sOlXWp+66xvZRtw18lSEA8/1lZIp5fSIhrROZDkzGXKSBSGZuGzEWzxxnEmmOUkr6PAqjz4BkYEo/RFAG+ynG2mNzSGznjcyfavq2CTI7BIUK1EMtiT9AfVQy/0dg7c3eJFiom/sWDiFrcD4VVx9D5A8k4vIU+vWdj4LEPXwNnlLcUrJUfOcjFvpLUGuXuptSzhhP/G1sNTmR0XezWP25qwtGP3tt17xM3TgxxztgC//+CnddXwzHbi4mbWu3h6R57p0SQwCXksYSRSOFSjnGPfnVTdyF00So4kfDX9azeOZkYC464pj8Eb5pPp//fm3KHw7boXIQ1gBtpbXyKd7aKh/+ItbPTtkgSgY2xNq5urjPhbDvxMWK+hdd9G7TRo78yNW5jfJlAl/m9MeUoiefn7kA9WKmw/JC8PKyXzKwxlPXAtOnmrYNLt9DTV4D8/M7rMGRQQJZHAz149PDZGQb9fM4XlGOiC3jR/JeZoCTU1ObKXhIclCMCVGyE69PQJQJ0b4LaQ8K61C4BeI53UXqp+XPqXsZCfqxy4K1uauZdyeXHuQPQLJtgOglCgOhq88ppISKw3YKYBz2oTeQ37UfOnnlNy7G3uVsskgzr9nRCUVHGLOqmyyjFO3OeOEMGDPEHKwW34+J/PN94wm4nf3e2wEuOPpYQe/oyoVRlQec9lsUJMaqN/3O2PVBxzqrrINFF0s4CT7aVtD15ia4EPwShxyeo0IDQJ/2tbcZDXnbK5rNo9z/syNA3n8C78eBOXZ/fpJW4fxqis51U8psZJs7xoTRMLjUTRFhI7OOvbxczRwpOeK+31AjeCGnyadOM66862MrK3WR7tiNp1QoTOLsGh1m0Ju0pdQhgdQdradpJiJlL6SqwTUJlCbRGtzykslduxcNe/NoYAUb57o/Nesk0sRLBDCWyYq/OGm7PIo7Nsk42fE5T00od0mr6Cpt5YriJsYaahE3rkktx3UmMAsNy/UulMXXsvpWu48GDUFpcCmLVgQQNwkzUFVm2BpHjLenAWeURzCesQT/UoX9jSEgeJKoFpbiA2/Cr6aaG4K8tgmguLDQXPk5swV+M4rehG/nNi+SyjoXjgUMfCPv/728kas8+J8jTcd2x1I4wdqFKovRpqCh1/kjgG0hHorPLvXISPeIJyaKonyXA78hBiAjIA2pSb08zvfTcTdpZxxuNoBGYbL4d1w0k1dGeojLO5TQh/aL+bkPQFLMyQWcb3OIkvx49zfV4m5MfYHCrcMgOua+4fAOsJ7kyJim8+L2rDYtfXkQke6r4Y+7EZdpiWkm2QZj3idJgyiqmD15CUuDCDD58u1z1aQseNb19BhaDJpkSL3wOvJ8P1sQw8DjYFX0W8/zUWFeWIHK7t6F5i2jvLcxNFy5Iu2fZTrqNqbS9nEzJ2g51ZOQeS+zjtCMJgewHjgjEDr+fzfe4RgHeVZKFwWNK/QEpHHl9qlYzd4l+ASu4665j13u+AT5VsFGUdVBH20XpBCbZfJMOppoz32gEk8DlSUacMuNcqrPC0oEvuuLny16alkJoEkXXC0DbloemkpQ/yx076UbY5YGlPyqAfIYtJjSycre+N1cqvCJHwy2PlUXVCl/AQJt5wltoW1ydYPsH+ST51Qed/NMSlNp/yO+KnOdZ9+RFIed6r1iqmShJY13dBRIEy8G/NcXRepBI3r4SbGy4j0v5B/Dnwu8g43qi/jt3sGr2dtDmZcFeGYyTzai3RXZnj9x7NQt+LuQKgxvr2kmq05sgHjhhJvoCBuEIvHANX70ZLIgQucdZB+xtq6fv3jTzQceKjNUq5VuNaYmOmx+9wlDrWgsTMD/L/P2/sqUa/wbUZ3pdT+iVOjqyOomyFQcSiHiNehmgR3sWHgx3RskjmHn58CG4n2qWpt7gXJEpQks/p4aqUbvcnoPpMmg32OkqzgEC6LizFCQnB7ZY4DG9nKYVpWislf02q/KbHW7suO6VN8PxrpHDoPX5s4xMDUqrUqcZ+ZxztMsSubvG3C/xDgKEFLLfRP2TrA3RPa8+a4wjnpqnYHqMkb5I6493nuW9ZUY7Mg7aEkrshiRW/QIKO2WAUmfIL6hdIjDYSgpu76TpqTuYMbhU4FEdAZFCIF2wzy83mDsH9EOnvYytfjZYGRzwkKBCBYP4fVdLUED6YKxPLJBMa3Mx/IVoL1MtOI6lH2TRHEUMyirsUgVRsuz24a4Shmv6O1k+fU8yQknArHFcRbVDm/RtKKxoFzdPN3hHefQNiY89avpMigIpr5gpd6NEdJrDBxSjvqP0QQx9IEF2h+2ySKfL4eVROIBk+Q0w1WWTFsBGSKHsQYDAkmeR/20aAKwT0Sua2GD/7SQ1TKagJKEzhoQ9Q9NbYdT17uMeECHVEXKPdT3ps9deZVPVQBSWpdkxrg68flNLCQWCEkGcaKD4NbKN3QPHs6bMlsct4JrTRrjZ1NRV5guIZMWq1TpJP2m2aGsvZP+OOBUY8681TWVtpKLVzG+bRx03VgAl/4SweWGlXxjgJB6PtQGICjNGPdFEeDeJzbL1Kh1fSia/5kz0/8x3NKTbFZbyOHUYC0Krwn3nIuZVnMiA3penzxZkEf7gEL7e6uy86JYULghOmlngabburPjO8Qij/CANOSPvyEQVqoBRNs8IhgxbiXC7iPChcwy0GnoMEmII5kvXB5aIRv4uDBgtYZNjpBkEKO+7Sg7+eJPhJo0Erg0HbOef9/AAAA//9mhXpKk3QwNgAAAABJRU5ErkJggg==" alt="Yuji Itadori">
+      <picture>
+        <source srcset="{asset_url('yuji.avif')}" type="image/avif">
+        <img class="yuji-img" src="{asset_url('yuji.webp')}" width="160" height="160" alt="Yuji Itadori">
+      </picture>
     </div>
   </div>
 </div>
-
-<script>
-  // This script adds a mousemove listener to track cursor and tilt Yuji's face
-  function initYujiTracking() {
-    const container = document.getElementById('yuji-3d-container');
-    if (!container) return;
-    
-    function updateTilt(e) {
-      // Normalize cursor position between -0.5 and 0.5
-      const x = e.clientX / window.innerWidth - 0.5;
-      const y = e.clientY / window.innerHeight - 0.5;
-      
-      // Calculate rotation in degrees (max 25 deg tilt)
-      const rotateY = x * 50; 
-      const rotateX = -y * 50; 
-      
-      container.style.setProperty('--rx', rotateX + 'deg');
-      container.style.setProperty('--ry', rotateY + 'deg');
-    }
-
-    // Try listening to the parent document if embedded via iframe in Streamlit
-    try {
-      if (window.parent && window.parent.document) {
-        window.parent.document.addEventListener('mousemove', updateTilt);
-      }
-    } catch(err) {
-      console.log('Cross-origin restriction prevents window.parent tracking');
-    }
-
-    // Also listen locally
-    document.addEventListener('mousemove', updateTilt);
-  }
-
-  // Small delay to ensure element is mounted
-  setTimeout(initYujiTracking, 500);
-</script>
 """